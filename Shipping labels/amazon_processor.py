@@ -1,304 +1,70 @@
-import PyPDF2
-import re
-from collections import Counter
-import io
-import base64
-import tempfile
-from reportlab.pdfgen import canvas
-from reportlab.lib.utils import ImageReader
+from label_engine import run_job
+from job_cache import JobCache
+from ledger import OrderLedger
+from match_report import format_report
+from memory_trace import format_memory, memory_tracking
+from profiling import profiled_run
 
 
-CAUTION_IMAGE_AMZ_BASE64 ="""
-iVBORw0KGgoAAAANSUhEUgAAAt0AAAD6CAYAAAB9AftVAAAABHNCSVQICAgIfAhkiAAAABl0RVh0U29mdHdhcmUAZ25vbWUtc2NyZWVuc2hvdO8Dvz4AAAAtdEVYdENyZWF0aW9uIFRpbWUAU2F0IDE3IEZlYiAyMDI0IDAxOjEyOjE1IEFNICswOILTG2UAACAASURBVHic7J13fBRF/8ffs3t3aZQEAqIiUpRiAQWkF2lSRHywAaIiioIgoD+KIE2w0VQMCCpCFFGKgIiAUqVXKSK9F4EQWgIk5JK7nd8fl1vu0sslJDDv58Vj7m53bnZ3bvcz3/kWYRiGRKFQKBQKhUKhUPgUKSVCCAC0m9wXhUKhUCgUCoXilkeJboVCoVAoFAqFIodRoluhUCgUCoVCochhlOhWKBQKhUKhUChyGCW6FQqFQqFQKBSKHEaJboVCoVAoFAqFIodRoluhUCgUCoVCochhlOhWKBQKhUKhUChyGCW6FQqFQqFQKBSKHEaJboVCoVAoFAqFIodRoluhUCgUCoVCochhlOhWKBQKhUKhUChyGCW6FQqFQqFQKBSKHEaJboVCoVAoFAqFIodRoluhUCgUCoVCochhlOhWKBQKhUKhUChyGCW6FQqFQqFQKBSKHEaJboVCoVAoFAqFIodRoluhUCgUCoVCochhlOhWKBQKhUKhUChyGEtGNxRC5GQ/8jSGYXi9djqdCCHQNR2JRAhxW5+f1HA6nWiahhACKSUOhwNd1wHXeEr6ufufxWIxt5VSAq5rYLFYzGuhabfHfNF9/AqFQqFQKPI3t4dyySZu4WO323E4HGiahjQkhjSU4E4DT8EohEAgzPeFEGiahmEYSCkxDMMU5O733Pt5vjYMQ51vhUKhUCgU+Q4lutPALQbdWK1W8z1N09CEdpsKQCPJv5TRNM1beGs3BLSUEk24hp/T4Uwm0CG5aFdWX4VCoVAoFPmVDLuX3G4YhmG6P7j/6xaRbpcIoflecEsgu60aTpcQTql/bktxVi30Epnh/mmahiPBYbqCuK3Wnv+16Bacwmm+57Z+e26PBE2/0YbI9hlSKBQKhUKhyF2U6E4Ft/BzOBymL7E0pCm+c8rCbSSKWg0wEDhwCV2bE4QTDAyc8QlgODl09BAnThxH4vKfvnThIrFXY9h/9HCienf18Z7QYtidDiKjLlMiNJRioaEUKlSIwKBAdKuVgMAg6lSvAVYLFquOptlACJwaGMLVF5f3usuurWfmgIS3O4mU0tU3CYY0kCLRei0x/ePd/tvg2tf9vjSk2aZCoVAoFApFfkKJ7hRwuz+4xZ80pOneoGt6DrqUSDSngQDsMdc4dOQQR44e4cChAxw7dIQjR05y4fJF/t2zF8MwMHzobqElWr7LlytDybvvoUSJO6hSpQplypahfPnylCtbjoCAIHRNA13gUs7pY7FYvAImdV3H6XQCoGsu+e4+v4bTwCmdWCwWhBA4HA6XYPfwBXdbvBUKhUKhUCjyE8IwjAypp9vBd9npdLoC+jQdp+E0hbb7v24xmDUSLbYkWnoRICRSGsTFXSfi5Ck2bN7ImrXrOXzwCHv37efchQt5wo9ZCEHxokWpcH85yle8n4b1G1GzVlVK3lsOf5sfTouGAHQ0JBoS72ABh8MBkCxzifvY3OfYbQ13n+OEhAQEHm48iW4mt8NYdJMXrr9CoVAoFIqs4dY4oES3iWEYJCQkmGnqdF03M5RommYKxqwjMXC1R0ICu3f+y+q1q1m9aiVbtu3kTEQE+U1f3REaSo1qj1K/cUMeb9CAR6tWQbf6gbAkWqdd0tswDDOAUtdvrBSkNqbcgtzzc7e1W2i3V7YYJboVCoVCoci/KNGdAm6Xh/j4eFMYui2vmckJLTFcAlEKpACBgTQMrkRFs+iP3/hz8RLWrdvIif9OJ8v/nZ/RhKDk3XfSuEEDGjZuSOunWhNa7A4QFgwJhgQMiWE4kdLltuNp1Xa78yQV5rc7SnQrFAqFQpF/UaLbA7fwlYZEaIL4+HiklNhsthupATMROClxIBAYUuPipQjmz/iZhYuXsnbDZi5HR+fkoeQpAvz9aVy/Fs+0fYYWbf5HwbvvxibBkiishdBM3/mUXEsULpToVigUCoUi/3Lbi27PwD63K4Pbmu1OZWdmKkkjcC95ej/JhUsX2LBmNV9/NYm/1q0nLs6ek4eSLwgMCKB1yyd49rn/0ahZU4qE3IEQ+m1TVTKzeFbdVKJboVAoFIr8y20vut1VJQHTmu0pvD2tryniTnmnuV4kGJKj+/cQPnUKP/44g4jIyFw5jvxIaNEivNT+ebq+0ZWKDz2K1BMnLr5IUH6L4HQ6XS5KiefjVvrtKRQKhUJxO3Fbi24pJU6HE0O6yo57WhXTKhrjqQll4v9di7rC0qV/8u3XX7Ns9SpllcwEQgga1q3PW13fosVTrShUsJCqj5qIO6jXnS3nVvntKRQKhUJxu3Hbi27DabhSApKYElC7kU0jaRCfuyCMBKQE3TCIjrrAzz/NYtI3X7N33z4ltrOBAO4rV4633+rOix2fJ6RYcZy6FYnAgshcIZ5bBKfDidNwBfZmL02lQqFQKBSKm8ltLbrdWUrcpdIRLsui1Wo1l/STim4HoBuSS+cimDRxAhO+/pbICxdyv/O3OEWCC/PWG53o+c7/UaTYXRhWHRvabeV1IqU085prQgOB8n1XKBQKhSKfcluLbsNpIJFmAKU7L7e77Di4jlUCTukqyh537RqTJ05k/MRJHD954uZ1/jbh7hJ38vZb3Xitx5uEhpQADZxIrGZRoZvdw5xDSnljYmi4XKCU6FYoFAqFIn9yW4tuzxLvmqa5/ptoUfQs2uI0DGLjLvPz9z8xduyXHD529Cb3/PajWGgxhg0cwBtvdQV/PywShLi1c3i7XZXcwlulUVQoFAqFIv9yW4tuuCFsPH2xbwRJCqTTyfJly/jo4xGs37CJvOSxLXCVU7+jeDEsFisPlK9AybvuQlgFIAgIDKB+rdqAQEqQaLi90oWAsxER7N67H6REOpxEXY1m9569XL12lXPnL+DwKM+eV6hRtSrDBg+m8VOt0HQbNvcHt9CYTIp7cgi31m9PoVAoFIrbidtedHviFjYODAziOXbgIIPeG8avvy+46eLToutUr1KZQkVCqFG9KqXvLcOjlSsTVCiA++8vj2bxxxAutxghPPuagWtlHpsEmYA04jl89Bixl69w7Ohx/t23jw2bt3LhXCT/7ttHfEKCz48vMwgh6PD8C4wYMYQy5cogdT80oZnl4W9VbvYYVCgUCoVCkXWU6E6By1ei+W7ClwwZ/jH2+Phc/34BFAsNpXXLFtSuVo2yFctTu97j+NlsSF3DqYGBxCZBkzcSGEqh4ao3nw1xJpwgDUDHEBp2wE860QzA4STBHs+WHZvYveNvtu/aw5G9h9iw4x/i4nO/8I/VamFI/3683bcfIYWDPQ/ilvT1VqJboVAoFIr8ixLdeBh6DSc7tm3hre492bJtW672waLr1Kv1GM2aNKFeowY89HAVCocURWiujB0isaNSSGTiO5r0zBYufORikZjJJfE7nEg0t1ONBJn4t0j8S3MabNq8kTUrV7JsxUpWr99EQmLGjdzi4Qcq8cXno2nc6AmkbgEhEOJWHKdKdCsUCoVCkV+57UW3BBIAIzqWIUMG8MVXX+E0jPR28wmFChTgiWZN6PB8e+rUq0HoXSUAHYnmChLUXDVikp5tA5H4P4+D8CRblyfz5SAlEgcOJE7iL8ew6q81/PjzNJYt/4vL0dHZ6UyG0TSNXl278NHw0VhDC6EL0G8xc7cS3QqFQqFQ5F9ua9EtJdiRHNm1mzfffJMNWzbl+Hf6+/tTp8ZjdHn9NRo3bsIdd9+VmB8cEBqOxBKXuuvlDSs3JP4lXaI8xQPy2CwXkYATEFK63F00kE6DqIhz/PHnYqZN/5m1mzZxPS4uR/shgAr3V2Bq+GSq1a6HJgQW9we3AEp0KxQKhUKRf7ltRbeUQEIC06d9x1u9+xITG5uj31eq5N282L4dXXv24J6SpRBCuNITuv2xka68IonCSkMghEwiuF2i21NFSo93xE0S3akhpRMpDTCcREScZXxYGLNmz+X4iVM5mgXG38+PMaM+4fVu3Qnw88/Bb8pdlOhWKBQKhSL/chuKbgkSrly6zIAB7/H1d9/lmADUdZ1aj1Xn/3r1oEXrJwkMCMEQAg1cwjhJnROXgE70mZYpuWinfN5NrZ15z5CcRSZOCExTuEFsfDSbVq1j1OdfsmLVKjMHdU7w/FP/Y/yEr7jjnru8P8hL5ygTKNGtUCgUCkX+5bYT3VImsOufHbzcsTP/7t2bI98hhKBl8ya817cvDRo2BqmBpoMAqclEB5HbtLJg4ggzHE7WrlvOhPHj+X3xMuz2nMkSU/6++5ka/jW16zRAS0ypqES3QqFQKBSK3Oa2EN1OEgMSpWTO7Jm80bUbUdFXfP49/v7+PNe2DV17dqN21boI3YpDN9Ckhp6YUUMm/i9JKORtgdsVxkj8ry4BGc+2HZv55suvmTHnV2KvX/f59xYICmLCl1/S6dXOSC3xrOezMQxKdCsUCoVCkZ+5LUR3AhKZkMBHgwfz6Wdf4HD6NqWdEIK2Tz5J///rx2P1ayF1HV26fLAN8CgrLz1S7t1+ottN8tI9EgzJtr+3MuLD4Sxc9CeGjwWmrmm8+fprfPbFF/gFBCKEyHfjWIluhUKhUCjyL7e+6JYQfeEib77VlV/mzfOpcBFAvTq1GDZoGI8/0Qypa1hcaTwSHZldgZISVyYSw7T13t6iO0UkSGFgl3FsWvIXw0Z8zNpNm3x+vVq1aMGU8HCKFS+emMub1LPB5DGU6FYoFAqFIv9yS4puU9oaksjTJ3i+XQfWbfRtOsCQ4GDGfPgpL77xEjZbYKK7gkCTLteRfKHi8iBOJJoBcXGxLJq/kLd79+TchfM+/Y5aj1VjxrQp3FO+ImgWV6aYfOBjr0S3QqFQKBT5l1tSdCNdBW9OHTvGU0+2ZO/+Az5r2mq18MpLL/Hx8A8pdscdCI3EKojgVtreubUVWcGQoDklly9H8n99/o9Zs+dy3e67UvPlytzLwsW/U6ZCRfzQXEsRefyqKdGtUCgUCkX+5ZYS3YaUGFIikBzZ+w9tnmnPgUOHfNZ+6Xvu5ZuJE2nYohk6FoQmMTTQTPcEt+sIynUkmzgAiwQpQEgna1ev4Z3e/8f2XTt99h1333knv8/9hUceq47DomGVeVt8K9GtUCgUCkX+xVN05/319XQwcFlH/1m/hfqNmvtMcAcFBvJu77fZvnM7TZ9oiY5A06Sr4qH0lNcyyT9FVnFXknQtIOjUbdiIv9as4v2B/Qj0903Bm9Nnz/Jk22dZt/ov7DIeB04lbBUKhUKhUOQ4+dbS7YpdNHBKg50bN9O0ZSuuXPVNSsDSJe9h8tcTaNS8tSvPtkgMj/Q8B+bfNyzdJPlLkT2kO9egIVm/biWvv9GNg0cO+6Tt0CJFmDfjJ+o93gS7TWJBomPLc6sVakKgUCgUCkX+5ZawdOuGS5Ed+mcnz7dv5xPBLYSgZbMmrF2+nIatWuCwOJGagdAEQtPMlHNCCNOH+4ZbifLq9jUisYKntAjqNGzE2mWraftUa5+0feHSJdq/8iprVq3AIB7d6XQ5lSsUCoVCoVDkAPlOdEskBgYSg3937qTlU2058d/pbLdrs9n4YMggflk4j2L3l8JAoiXm3RYyLTmthHZOIgRoAtAEoaXvYPqvM5k47nP8/Pyy3faZc+do1/Fldm/cSjx+OIWBlE6Um5BCoVAoFApfk8/cSyQGTjAcHD98mEZNWnDSB4K7eGgRpk79ilYt2yN1iROHmVNbc0VN5pHjv72RJE5xpGTVymV0fLkTZ85GZLvdUiXvZuXyJZS+rwxoOhoWhNCz3a4vUO4lCoVCoVDkX/Kte4lLdDk5c/w0Tz71rE8Ed7Uqldm6bT1NWz2LISSGJDF/s4YmXdmchVSCOy9gXgUhqNe4CatX/0W9WrWz3e7J/07TrHkrTuw7AtJQMbEKhUKhUCh8Tj6zdIPj+jVatGrNilWrs91Wo/r1mTtrDsHFQkFoGJrLj0TzOCOq6E0eRbp0cczlaJ59ri3LVq3KtlW4bu1aLPl9PgGFQxFCJy8Yu5WlW6FQKBSK/Eu+tHRLKYmLvU6nTp2zLbgF0OPNLvy69DcKFyvqOhnaDcdtz4BJJbjzKInl3AuEFGD+4rn069Uj202u37iJrm/14npMLNKQKrBSoVAoFAqFz9CHDRv2QUY2vJmWbiklTicMGTSQb6ZMzVZbQgj6vNubzz4Pw2YNRCYG6YFLXydLDajI00gh0HQrjRs/gSZh3fp12bIO7967l5ir0TRv2RyhCY/UkAqFQqFQKBSZx60r84foBmbN+In+AwZgGEa22urzbndGjh6DRVgTrdmY2f5uGLuVhTs7SCnNf5cuXSI6Oprr168TFRVFQEAAmqZ5LbdkB4FAEwKhWWhQty4WnGzcvAWH05nlNrf8/Td3lyjGo9UfUxMwhUKhUCgU2SJflIF3y+sdmzbTpHlzoq9EZ7ktTQg+/HAoAwYMdpX9FgLpzrAtEgvcmGdCie7M4nA4OHToEKtXr2br1q1s3bqVkydPEhcXZwpsKSUWi4Xg4GBq165NtWrVqF+/PjVq1MBqtZptZWmsub1BDCffT55M93d6Y4+Pz/LxFAgKYtmfS6lRtyYIDe0mDQjl0513iYyMxG63ExISQoECBW52dxQKhUKRB/E0MuZp0S0lREdfpG6tOuw9cDDL7WhCMGxgHwYPG45mDUQKiUxSQ1Jp7Kxx9uxZZs+ezdSpU9m/fz/xmRS6FouFhx56iA4dOtC5c2dCQ0OzN9YkOOIdfD/ta7p2652tlZEK5e5j/ca/CAm9E+0mRVUq0Z03+fjjj5k9ezaa5gqLmTx5MtWrV7/JvVIoFIqc5fLlyyxYsIDY2FgaNWpExYoVb3aX8jx5XnS7M7bZ4xJ46YXnmff7b9lqL8Dfn9nTp/Hkk8+AzVXT3UjMww1KdGcWKSUnT55kzJgxhIeHExsb65N2CxcuTJ8+fejbty/+/v5ZGnNSSq4JCEwwGP3pSAZ9MCRbwvWZNq35Ze6vYLEABlouxx7nlujes2cP69atY8uWLRw9epQrV65w/fp183Nd1ylQoADlypWjZs2atG7dmjJlyuRK324Gly5dokiRIql+XrduXS5fvmy+fvHFFxk8eHBudC3Ps2TJkgzfE4QQFClShMcee4yAgIAc7plCocgukydP5osvvgCgatWqTJ8+3Wdt79y5kxMnThAYGEiDBg18UgQvL+Apui03uS+pYhgOJo7/ItuCG+B6XBztXu7EmE9P0aVnNwQ6AgsupwEltzPD9evXmTBhAqNGjeLixYs+bTs6Opphw4Yxf/58vv76a6pXr55p4S2EIMiQoGm8N7A/1+Oj+eiTsVkWrwsW/cl3E7/ljZ5dkcIJ2LLUTl5lw4YNjB8/nkOHDmGz2bhy5UqKqwNOp5Po6Gi2b9/OoUOHmDp1KnXr1mXQoEHceeedN6HnOUNMTAzPPvss//33H3Xq1OHbb79NcTtnkpiBzK7w3MqMGTOGM2fOZGqfypUr0717dx599FEKFiyYQz1TeLJp0yYiIyNp3bq1uWKjUKSH54Q6JiYm3e0zOs4uXLhAx44dzWd1jx496NEj+1nJ8hp58pcmJOz/ZwsjRozwWZux16/z9rt96fd2H+LjYhGG0+U0rlbvM4TT4eTff/+lQYMG9O/f3+eC242Uku3bt9OsWTN++OGHLLUhhMttH4tgyIgPGNT33Sz3x+F00Kvfu2zdsBIh80Dibh/hdDoZPXo0vXr1Yu/evcTGxhIVFZVMcKc06bl69Sp2u50tW7bQpk0b/vnnn9zqdo5y6dIlXnjhBXPisX79eqKiolLctmrVqvj7+2Oz2bBardSvXz+Xe3trsWvXLrp160bbtm3Ztm2bz1bPFCmzYsUK3njjDQYMGMCOHTtudncU+YiGDRtSqVIlypQpQ9u2bdPcNjPjLCoqyss4du7cOZ/0N6+RJy3d9pg4Xnn1La5cS38WlRmklIRN+przkReYPCUcS0EbNqmywqWHYRiEh4fTr3+/VEWIr4mOjubNN98kIiKC/v37Z8oSY/pOoaOJAAYPGc62Hbv4Y/nyLPXFHh9P5y492bRuPUEhITdyuOdTpJT079+f9evXJxM3FouFwoULU61aNSpVqkRwcDAxMTHs2bOHLVu2cPXqVdOqe+3aNYQQvP766yxcuJASJUrcjMPxGVu3biU6Otoc40IIEhISUtw2LCyMnTt3kpCQQLFixbjvvvtys6v5Bk3T0v2teK4anDlzhpdffhkhBG+99RZvv/12TnfxtsPpdNKnTx/zvOfWPV1xa/DII48wd+7cdLfL7DhLuhp9q8Yz5TnRLaVkzOcj2bFrV459x4y5czh49DBTJ0/mwUeqoxkSqYm8afbPA3z++ecMGDAg2ZJ6TpOQkMDQoUMpWrQob7zxRhZacD3sbQUCmDnvZ5o3eZJNW7dmqS979x9g6LChjP0yLLFd36Q8vBlMmTKFdevWcfXqVa/3NU2jbdu2fPDBBykem5SSP//8k4EDB5rCW0pJQkICH374IV999VWu9D+nyMhSqRuLxaICJzNAjx49eOutt9LcJiIiglWrVhEWFmY+mKWUTJo0iU6dOil3Ex9jt9uVO5Qix1HjLGXylOg2EiRbNq7k05Gjc/y7tu3YSfNWTzJr9hzq1q2LoQkVUJmEhIQEPv/8cwYNGpTrgtuzD3379qVKlSo89ljW8mZLoVEgKJjwqVN5omULTv13Okt9mfTdFJ5+qiX1mj1JfnU0uXjxIhMnTiQuLi7ZZzabjR49eqR6joUQtGzZkvPnzxMWFmZayRMSEli7di1RUVEEBwen24erV69y4MABzpw5Q1xcHLquU7hwYUqVKkXZsmWxWPLUbcln2O129u7dy8WLF4mOjkbTNIKDgylXrhylSpXy6XedP3+e7du3Ex0dja7r3HPPPVSvXj1P+u6WKFGC9u3b06RJE1577TWOHDkCuIT3/v37eeyxx25yDxUKhcI35Kmnm8Mew9u9/49Yj6wJOUlEZCRPPfUkn4/+hFe7dgUsytfEg48//pgPP/ww2wWJssuVK1fo1KkTGzdupHDhwpkW3hoCKSzcV6kSU8Kn0KplaxwOR6b7YbfbeaN7L3Zur0tgofTFZV4kPDwcq9WaTHRbrVYmTpxI8eLF020jpQBXm83GwYMHqVGjRor7/Pfff/z5558sX76cvXv3UqBAAaxWq9d1sNvtSClp1aoVPXv2TLMvDofD9CWvXLmyV573tLhw4QKHDx8mNDQ0Wy4hMTEx7EpcjQsMDKRy5cqpjstVq1YRHh7Ozp078ff3NycV7u1jYmIoWLAgHTp04KWXXsqwZXfv3r1cvXqVBx54wNwnISGBTZs2MWjQIAzDMH+7TqeTRo0a0bZtWx555JE8mRWgWLFihIeH065dO86ePQvAwIEDmTNnTpqTuWvXrrF582a2bt3KuXPnuHz5MpqmERISQoUKFahduzYPP/xwbh0GAKdOnWLcuHGcPXsWXdcpW7Ysffv2zZLV/uDBg2zcuJH9+/dz+fJlYmJiKFSoECVKlKBq1arUr1+fQoUK5cBRZI28eD3SYv/+/WzYsIFDhw5x+fJlYmNjKVKkCKVLl6ZevXpUq1YtW6uavhwLivxPHhDdEqQTaRiETRzHtp0551aSEleuXuXNHr05fOQYw4d9iB4YiCbyr+uAr5g5cyYfffTRTRfcbvbv38+4ceMYOnQokPkUlkIINKHRsEkzRn48jH4DhmbJZ+zw0WN8PPIjPvr4UwyhoaHnqww4ixYt8nIrcbtJDBw4kPvvvz9DbZQrV46AgAAvdwyn05niUuLZs2eZOHEiCxcuJCAggOjoaKSUafr3LVq0iMWLFxMeHk7lypWTfe50Omnfvj1nzpzBMAyKFy/O3Llz0xXee/bs4dVXX8XPz4+4uDhef/110/Vh/fr1rFixArvdbm6v6zpz586lSJEiVKhQgSpVqpifvf766xw7dgxN07Db7fTr148OHTp4fd+5c+fo0aMHx48f5/r166YrTkrY7XZ+/PFHfvzxR8aPH0+1atXSPJZPPvmE3377DV3XcTgczJgxA4fDQefOnRFCEBcX55XyEVxBTatXr0YIke53/Pfff0RHR3PXXXcREhKSZl98SWhoKGFhYbRr1w7DMDhz5gzbtm2jSZMmyba9evUqkydP5qeffkp2rG7++OMPxo0bx6OPPsqAAQN8KvaWLVvG2rVrqVmzJk8++STgOm/h4eEsW7aMCxcumNtu27aNTZs2UbduXVq2bJkh6/3GjRv58ssvzcldSsyYMYOgoCBeeeUV3nrrrQytEp08edLrta+C4nP7emzdupU//vjDXIHLrLvX+vXrGTduHHv27El1m2+//ZYKFSrw3nvvUatWrVS3y+mxkJfYvn07M2fOxDAMqlWrluy+58bX42zbtm1s2LCBU6dO4XQ6CQ4OpmLFitSqVYt77rknW23nJjc/T7eUYDg4dGAXDRu15Gzk+Zz5nnQQQNcurzPy8zEUCCyUoQCgWxEpJZs3b6ZZs2Zcu3btZnfHi5CQEP755x9KliwJZH5MukV2Qryd1zt1Yvqs2VnqR8ECQaxbu5QHK9dAF3qOro74Mpjk9OnTtGrVykv4PfLII/z888+ZbuvEiROMHj2a3bt3A9CiRQv69++Prt9wvNmyZQvdu3dH07RMjyUhBAULFuSvv/5Klr/54MGDvPTSS2abgYGBTJ06NUWB7slnn33GvHnzzPzaxYoVY/Xq1cyYMYOwsDASEhK8AkuFEBQoUACLxUJcXBwTJkygdu3aANSqVYsrV66Y2z777LN8+OGH5uujR4/y8ssvExMTkym/RqvVisViYfLkyVStWjXV7apXr2721Wq10rJlS9asWUNsbGyGvs/Pz4/Zs2enONEaOXIks2bNwmazERcXx+eff56i6E2Npk2bmikDe/bsma5Pd0oMGDCABQsWAPDwww/z/fffe42DEydO0K1bN06cOJHhNm02G59++ikt+Vm6AQAAIABJREFUW7bMdH+SEhsbS506dYiPj0cIwW+//UZQUBAdOnQgMjIyzX2FEAwcOJCXXnop1W2++uqrTMdIVKtWjW+++YbAwMAUP3c6nQwbNozFixd7rXT5+/tTvnx5ChYsSM+ePdP9HaVETl0PKSUrV67kwIEDVKlShbp167JixQrWrVvH/PnzzUmyxWKhefPmlC5dmocffph69eql6kolpSQsLIxvvvkmw33VNI3+/fvzyiuvJPssp8dCeoSFhbFs2TIsFgtvv/12mr/VCxcu8P7773PixAlsNhuNGzfm3XdTz+515swZPvvsM/bs2cNdd93Fu+++y4oVK8xUquXLl2f+/Ple+2R1nB06dIinn37afN2mTRtGjhzJ/v37GT58eKpZsvz8/Hj//fd5/vnnUz9JN5k8ladbCoFds/DB8FFZFtyusLZs9gP4+rsprNuwgQXz51O67H04dNCNRHF3G+hvKSVHDh/xEjR5icuXLzNp0iRGjBjhJe4yinvQW21+fP7FBDZt/ZvDR49mup2r12IY9P5wZixaTCD5JwD3yJEjBAQEmKLbarXy7LPPZqmte++9N11RMHDgQNPCmxRd1zEMw/xM13WEEKa7iZQSh8PB3Llzkz2QYmJivCZchmFkKAgyNjbWSyi7ReuhQ4eIj49PZp2TUpqrArquc/DgQVN0Jz0mzxWhuLg4unXrRnR0dLKVIpvNhtPpNGMkhBBYrVYSEhK8LOG9evViyZIlBAUFpXgsng+zhIQEVq5ciZSS+Ph4LBaLl9uOzWZLJsQTEhIYPHgws2bNStb2kiVLsNvt2O12dF1nzZo1mRLdvqB169am6P7333/ZuHEjjRs3Blz3gU6dOiUTNMWLF+fBBx8kJCQEPz8/YmJiOHbsGPv27cPhcBAfH8/7779PmTJlsl1FLyIiwiuY+PPPP+fUqVNERkYSFBRE1apVueeee7Db7ezZs4f9+/eb+0opGT16NLVr16ZcuXLJ2v7222+T/basVisVK1akdOnSpovS6dOnOXjwIBEREYDLEjh06FDGjh2bYp+PHz/OvHnzkr0fFxdnWtPLlSuXadGdk9djx44d9OzZ03zduXNnfvjhh2S/K4fDwaJFi8zXlStXJiwsLEUXtaSCW9d1HnroISpWrGg+V86dO8eaNWvM36NhGIwcOZK77rqLpk2berWXk2MhI1y7ds2Mg3jvvff4/fffU62dsHbtWtatW2e+Pnr0KG+//XaKq4RxcXG89tprpsX65MmTnD9/3uvcp7QS7qtxtmnTJgYMGMCiRYvSjCmz2+0MGzaM4OBgmjVrlmabeYGbLroFks2rV/LLr/PT3zgFdE3j1Y7PMmPuQmJjs+8LvnvvPho1aswvM2dQpU5tNEMgNO228PW+cOEC7dq3M3/AeZEpU6YwZMiQbAbbCQrcUYzvpnxFy5b/43qcPf1dkrDoj6WsXzCf5m2eQeYTBxPPCorgEnyVKlXKke+6ePEikZGRycSp1WqlVatW/O9//+P++++nSJEiXLt2Dbvdzr///su7775rWq9iY2NZvnx5tqxAGeHVV19lx44dHD582GsiYLFYzMlAhQoV0s1J62bChAleDychBDabjf/973/Uq1ePBx54gODgYAICArhy5QrHjx/n008/Zffu3TidThISEjAMg5kzZ/L6669n6Dvdk2SLxcK7777Lc889R8GCBbHb7WzevJlBgwZx5coVLxGxd+9e4uPjsdm8Cz55Pkg9Jwi5SdIHsufYHTZsmJfAa9OmDd27d081GHX37t106dKFK1euYLfbGT16NFOnTvVpf1etWgVA7dq1GTVqFKGhoV6fr1ixgvfff9+cxDkcDpYuXZpsFWDv3r2MHz/efF20aFHef/99mjZtmqIwcjgcDB8+3EzhtnjxYjp06JCi61C5cuX44osv+Omnn/j777/N96tWrUrdunUJDAykTZs2mT72nLwehw4d8nodHh4OwB133EGZMmXM2ITo6Gj27dtn3jt27dpFr169mDlzptf+W7duZfLkyebrUqVKMXbsWB566KFk371x40bCw8PZuHGj+RsYNmwYdevWTbN6qq/GQkZ54YUXzKqQsbGxLFq0iC5duqS4rXuC5kZKSWRkJHfffXeybVesWOHlIhISEkK9evXYuXNnmv3x1TiLjIw0J95FihShcePGVKpUiSJFinDq1ClmzpzpVYQrLCyMxo0bZ8kgl5vcRCOdgZSQYE/g/ffeT9XXMT26vNKZsPCfWLZkGaUS3Q6yy4nTp2nSshULf5lLvEwgQUiX67lPWs+bxMfH06tXL7Zv336zu5ImkZGRrF27NlttCCT+OKhfryGD33svS21IYMDQYVy/HpNvxkVSy6vT6aRo0aI58l1RUVFeIkHXdYoUKcJvv/3Gp59+Ss2aNc0y6wUKFKBo0aI8/vjj1KlTx6udzCxXZ5VSpUrx66+/MnjwYK/gJiklS5YsYfv27cyYMSNDwWpxcXHMmDHDyzfcYrEwY8YMhg0bRpMmTbjzzjvNh3ahQoWoXLky4eHhXu1HRUUxY8aMTB2HxWIhLCyMzp07m8fh5+dHgwYN+PXXX5MFT2qaluLyd82aNbHZbPj5+WGz2Uzrfm5SqFAhr4m1eyJ06NAhlnvk269evTqffvppmtlfHnroIQYMGGC+3rRpE4cPH/Z5n++8806+/PLLZCILoEmTJgwZMsTrvZTG9uTJk70mOaNHj6Zly5apxitYLBaGDBlCmTJlzPfSKsvdvHlzxowZ4/We2x+8U6dOmfbfz+nrkdIqWceOHVm+fDlTp05l0qRJTJo0iZ9//pn169fz3HPPmdvt2rUrWbsTJkww74G6rqcquMElmr/99lu6d+9uvnf58mV++eWXVI/NjS/GQka57777vPzN3S5/KZGSi0ZqRjZPizjAM888k2yCnhq+HGft27fnjz/+YMSIEXTo0IHmzZvTpUsXZs2a5XXPPHLkCAcOHMhwuzeLmya6DVzu3N9N+paNW7ZkqY2yZUozcvRoAgwrtWvVZfWa1Tz0QAWf9O/qtWt0ePllRn30ASLegSG5ZVW30+lkyJAhKS4150UWLVqUPV/nxOI2QvPj3QGDePThzPswAvyzaw/ffxeO0zCQeSPeNE2SWiydTicFChTIke8qWbIkwcHB+Pn5YbVaqVSpEnPmzKF06dJp7pd0OTgzubOzi9uf2o2nH15GWbFihdfYDAgIoEuXLum6M/j7+/P00097fd/58+c5fz7jLnclS5bk8ccfT/Gz0NBQOnfu7CXeUvsNjRo1imnTpjFx4kTmz59vBoblNin55M6efSMOw2az8dFHH2XoGiUVrhs3bvRNJz1o27Ztmr+n1q1be4mNpOf/4sWLXgL2ueeey9CEx2az0aJFC/P15s2b07w/Js2akR3L4M24Hi+99FKKfQ4MDGTEiBFerlDLli0z/z506BBbPeo0PPTQQ6kKbk+aN2+Ov7+/+dptyU6L7I6FzOLpJpia7/Ply5fZsGFDsvfXrFmT4vZJK0J6Tmgygi/G2fPPP8/QoUNTzPRStGjRZO6RSYM38yI3z9ItBdEXLzF23GdZ0rKapjFh3BgKBBdOfAPuLFOWFWtW8WSrFj7xBolPSOCDEaNo36EdV+xR4IznVlTeP//8M+PGjcs3FaBWr16d/b4KHaFp+FltjBv/eYZn8J5IYMTHH3Ip8jQif5y6ZGQ01V5m8fPzY+HChYwdO5YZM2Ywe/bsdCtWxsbGsnnzZq/38kr2nIyycePGZP7WL7/8cob2rVatmtc4DAwMzJRFNr0UiPfcc0+qQXaeCCGoXLkytWvXTneSlNt4jo+aNWtmOL+5n5+f17Hs27fP113LkJ94hQqpG4X+/vtvr4lxZkSOZ7tRUVFey+45SW5fj6JFi6abqcLTTeOrr74yrZ9JBafn6kBalC1b1syaBaRbzhyyPxYyS9OmTU1heu7cuWRuJAC///57iqlyFy1alKKngeeEv1q1atx7770+629GCAoKYvDgwWlukzQQ/L///svJLvmEmya6NWDKlIkcPXE8S/t36fQqzZ94CkMDQ3NgCCdWaVCkYCizf/2F3t3f9lmRjXnzf+PpJ1px7vQZpMRlpr8FcDqdbNy4kTfeeCNfVY46e/Ys165d88kkQWqSOvUa0KdXryztHxF5nunhPyAxbsX5WLYIDAykSZMmPPDAA+Z7TqeTo0ePsmbNGubNm8fs2bP57rvv+PTTT3niiSe8UmvlR7Zt2+b1+r777stQwSBIbuUXQmS4RLemaTz44INpbiMSV3jyKzExMRz1CHyuV69epvb3XOpPGt+QXYQQlC1bNt3t0nom/fvvv+bfwcHBGbLCuknqxuDr40uJm3E9xo8fn26BpwoVKphWVcMwTNGd1Bd5y5YtyarypoSUklOnTpmv7Xa7V0B2UnwxFjKLn58fNWvWNF+n5Hf966+/mn/rum6ex+joaFauXJls+9OnbxSRa968uc/6mlFq1KiRrlEo6b3V060vr3ITAikl0oCYqEt88WXWykYXK1qUoUOHIKx+6BgYmoGWGM6m6QaasPLJuDHc/2B53us3kGvZXKKWUrJm3UbqN27M/F9+4sHKtUDzzJmSPx9kBw4coF27dhkeqKGhoVy6dOmmWx/Pnz/PuXPnfFIQQhcCQ+j0H9ifaT//xOkzZzPdxqjPx9Hptc6EFk8ejJLXyY0gObvdzsKFC/njjz/Yvn07QggCAwPRdR2n04lhGCnmlc6PeIoHTdPSTPuXlMKFC3tdDyllht1r7rzzTtq3b5/xjuZDIiMjve49jz76aKb293xA+zo702uvvZYhoZUWntbJKlWqZKp6aOHChb1e50b2qdy+HhaLJUOZVXRdN+8tgGlQSmr9P3PmDPXr10/3up0/fz5Zjum0npm+GAtZ4b777jPdk3bv3u3lcrR7925z8mGz2Zg5cyYxMTG88sorSCmZP3++l7A+cuSI14pdehP6nMAd83OrkeuWbpcvt8HX33zHmRSWQDJC2BdjubtkaYQAoQk0obvcBRAIoaMLHX8svPXm2yxduJDixYr5pO+Hjx6jfuMWTP/xewzpBOnEJbzzn4kzMjKS119/3WsGnxZBQUH88ssvjBo1KkNL1DmJlJLz58/7zB1GCEHBkFA++XQEmpb5CdT5CxcJGzcRpIHMw+MhpUC6nPaZXrJkCU2bNuWzzz7j77//NsW1O7vJxYsXuXz58i0huME7lZ+u6xTLxL0nKCgo2SQoo2O8adOmyYTXrUZS62Jm70NJg2R9SYMGDbLdhufxZfbYkhogcsNVMLevh9VqzdREJCnR0dHJ3ouPj2f//v1p/ksquIsWLZrm79oXYyEreLqXJQ2m9IwVaNu2LRUrVqRatWqmdXzdunVeq2qe2wO57lpyK3MTRLfBlctnCftqfPobp0CVByvxQvvnMCwgNVxBcWiubMlCQ2gCq9AQFg2hQ4369Vm3biW1aqZd4S2jXI6+wutdu/LdV+MwDPcDNu8KrZSIjY2lS5cubNq0KUPb+/n58cP3P9CwQUP69OnD7NmzU0wxlJu4fdB88XARwjWCXny+HdWyUBgC4Otvv+HCuRO4xkHeXPkoXLiw10PLYrFkW3Tb7fZUVz4mT57M4MGDuXLlClFRUSm6MFmtVnMJMSgoyKdLrjcDT9FssVgy5c6RHdeP1PJ551fsdnuy8ZLUuugZ3JYRctK1Jq0UchnF8/jy0rGlRl6+HinhCxdKXde9Mq+khC/GQlaoU6eO6VazZ88er/vywYMHzb9btWpl/t2wYUPAdd/y9FVfunSp+XfFihVvWavzzSDXn3DCgFkzZ3LKw18oo1itViZ8+QnCakvFrVqQVPAIIShdthILFy3kf089wzofRK3HJyTQrVc/Nm7ZwfjxEyhQsLArj3fe1FpeGIbBoEGDvAoJpIWmaXzwwQe0faYtItEK/GSrJ1m8eDEvvPDCTUvRI6XMUnaJVNsToNkKMHbU5zRq0RQjk2L+/KWLfP/DD/QZMMwn/ckJQkJCvCYpFouFiIiILFkxDh8+TL9+/Th48CD+/v6MGDHCK8vFmjVrmDx5cjJRb7FYkFJSunRpatSoQfXq1SlfvjwlS5bEz8+PXr16JbOy5CesVqspvJ1OZ4Z8Rt3kl0Dm3CBpQFShQoWSibrMiqi8fn49xVp+OLb8dj1SssS7U2Lec889afoPCyEoUqQIDRo0SDdg+WYRHBxM3bp1WbNmDTExMRw/ftx0c3HHyvj7+1OlShVzH0+XIHfgZEREhFdga1ZytytSJ5dFtwRnAhO+mpz+pinQrGF96jRojZAWNCETl/KTC21PhBBoAoILF2PR4oUMGTyQ8RMnZ/sHL6Xk+x9/4tLFKL75+muK33U3mp63VbeUku+++46wsLAM+2V36tSJd955x9zfXZ3z4YcfZsmSJbRv3z7DFnNf4kvBDYkjSBPUebwez7RuzZzff890G19/+wPde/0fgYEFyYszsIoVK3qVOTcMg2PHjnkF4GSUd955h//++w8pJdevX2fw4MHUqFHDXHYdOXJkMkuYzWbj3XffpV27dqlaxUqWLImmaTc9biCr+Pn5mS4m8fHxmZqURkdHY7FYvDIJ5OfAx+zgmWmiVKlS1KhRI9ky//79+zOVXcUzMCwvnldPUehZtTAjnE5ixMqN40u6upLXr0dSF5yCBQsyc+bMDGcxyQ+0bt3aTAG4b98+ypYti9PpNFPpPfTQQ14ZkipVqmT6v7sNBJ7BsRaLRYluH5Or7iUSgxXL/2T3/oPpb5wEIQRDhw5G6DqZyc8mhEDTBJquUaBQIT4L+5KvvwzLUoq4lFiweBGNmzVm754dgCSvGlOklCxdupQ+ffpkWNA0aNCAzz77zLXkL2+0A67zWqpUKZYvX87LL7+c6w+xggUL+jQbg8C1WKFbrXzwwTAsWcgpeuTYcX6bMxvyaCaTIkWKePkixsXFmZXsMsOpU6f477//vCxbmqaZJX5Pnz7N6dOnvcSjxWLhnXfeoVOnTmkuQ0dHR2dpQuw5mUiNK1eu5LiYv+OOO7xe//PPPxk+nr1793ptK6W8bZd1f/vtN/Pv3r17ExwczF133eX1e8+sMPVMv5gX/d89XfaOHz/uFR+QHklTS+bG8eX29XBXak2PpFVU3febpMGNderUyZTgdjqdHD9+/KZUaM0ozZs3NwuebUmsf7Ju3TrT/z7p8VqtVnN7d37vvXv3mp83a9bstr0H5RQZEt3upfxsIUE645n5409Z2r1d27ZUq13fFYlpGAgJGprbmzvNA3HfGFxBlv680aMHv/z8E3eXuCONvTLOvgOHaNCwCUsWLkA6Hb45Xz7EXfK5c+fOGY5qL1WqFN988w3BwcGuUtiaSCZyhRAEBQUxZcoUPv7o42SBejmFpmkEBwcjpcThcOBwOLzKd2cHIQSVHn2UzlksPf7d1HAcCTF5UnSDa6nQ8zodOnTIq8BFRoiMjExx0up+cB49ejSZsLbZbJQrVy7Ndu12e4ZysAcEBHg9fO12O7Nnz04zo0BcXBzr1q3L8d+lZ3pEcN07k1Z2S42ZM2d65dGNi4u7KVkQbjbr1683H/wFCxY0S5oHBAR4CdOUCn2kxrFjx7yKfeRF66an24LT6UyWsz4tPLfVdT3dXNa+ILevh8PhyFCO7K1bt5rC2N/f38x4kjQDR2Zy4O/Zs4c2bdrQqlUrWrdunWdT7FqtVl544QXANXEdPny4V67rO++8M9k+7mu4YsUKRowYwffff29+1qFDh5zt8G1IhkS3ECLbszungMhT//HroqXpb5wEP5uNvv16IoWGyKKacQtGIQANWj79JKtX/ElZHxV/uBwVxTMvtOezMSORiQLQ9YC/uerLMAzOnj3Liy++yNmzGUuHFxISwry58yhfvjyQfn5fi8VC//f6Ex4enisBXUWLFiU0NBQpJZqm+WR8eiHgrR5d8M/CJGLj5u0c3XsAp5Y3VfeLL77oda7i4+P55JNPmDx5coatwEePHk2xupjbVzAwMDDFttK7Rl988UWyIg0pPdzuvfder+2klPz9999pVrUbO3Zsmt+dElkZV02bNvWakNjtdiZPTt+dbs2aNV55mgGKFSuW54rT5DQRERF88MEH5uvRo0d75S9PWu46IyLM3Y4nzZo1y15Hc4CaNWt63Wd//PHHDO23e/duFi9ebL6uW7dupirNZmcimtvX4+23307zN+lwOOjdu7f5esCAAWbBnqZNm3rdt44cOcL8+fPT/c4NGzbQqVMnjh07BiRPPZjXePrppwHXvXPWrFleblkpTW7cz3kpJTNnzuTSpUuAy/BWvXp1n/UrLxkibyYZt3QbEsOZdWui03ASNv4rotJIKp8aTRrV44GaVXFqBoaA7PrLCgS6sHJvhYfZvHk9T7bwzQ049noc7w0ayhuvv0bc9etIHEjp5GZW07l29Rpdu3Y1l/7Tw2az8cUXX1C1WtUMu28IIdB1nRdeeIGVK1fmeHqhMmXKmP55UkrTwukrazcIHqz+KG2eapH+pkm4HhfHpG8nI/JoXfjixYsnc/GIj4/n66+/5qmnnmLBggUpVi1zc/LkSSZMmOAVIGi1WnnnnXfMQKSKFSsmE8uefoVJcTgcjB07lrlz5yYLPHQ4HMks2AEBAXz22WdePrBxcXGEhYUxd+5cr2V5h8PBqFGjWLBgQYopw9LCYrHwySefeFnO0qNBgwZeD/aEhAT27dvHmDFjUj2va9asoXfv3l4TiQIFCtAriwWbssuFCxf44Ycf+O6775gzZ06uWPUiIyMJDw+nbdu2pq+v1WqlRo0aXtu5BYWbDz/8MN1g1VmzZrF69WrzdZs2bTKU7zm3KVGihFd8xYYNG7wKmqTEhQsXGDp0qHnf8/Pzo1+/fpn6Xs9zk1ly+3pER0enWrYcXCXaPb/fs2BPsWLFaNq0qdf2w4cPZ+3atam2N3fuXLp16+blvvbggw/6zD01JyhVqpS5OuSJruteQZRuUhPWSa9tdsnOOLuVyFAgpdPpvGG5lVkLejDiopk6/edM7yeEYNCA/mjCBhIMQWKKwOwhNA3NgNCQO5n9yyy6vdmN6TN/8UmAZfgP0zgXcZYfp4UTUCwEHSsWmfvV4BISEnjn3Xe8rCDp8cEHH/BSomtFZvuraRrVq1fnjz/+4JVXXuHvv//O1P4ZpVq1akjjxnUSQmAYBkIInwRYCgRW/Bk8YDC/zF2Q6TExZdrPfPTRKIJCQrLVj5yid+/erF27lqNHj5pC8Pr16xw/fpyPP/6YESNGULVqVapVq0ZISAhCCOLj49m6dSurV682C9qA60ZeunRpXnzxRbP9oKAgmjdvzp9//mm2b7fbCQsLIzo62svvOTo6mrlz5xIdHZ1i+kI/Pz9OnjyZrNxv/fr1vcS1lJKDBw8yevRoFixYwBNPPEFMTAzz5s0jOjo6Q25VSceN3W5n3bp1bNq0CX9/f2bNmpXi8qwnFouFvn37MnLkSFNEx8TEMGfOHBYsWECzZs0oVqwYISEhxMTEsHLlSvbs2eMlbAMCAqhSpQqtW7dOt885QZ8+fThw4ACGYaDrOlFRUXTp0iVLbU2bNs3LPzspUkouXbqU4rV/4YUXkqVfq1atGk888YSZ0mz//v106tSJ7t2706hRI68JT0REBJMmTeKXX34x3ytRogSDBg3K0rHkBv369eOFF14wJ3lDhgzh2LFjtGvXzsuVIz4+nk2bNjFkyBCvct29e/dO140rKXPnzmXv3r00atSIjh07EpKJ+9bNuB5vv/02Dz74IMOGDTNdRnbt2sWHH36YzB/5rrvu8tp34MCBbNiwwRTmdrudrl270q5dO7p3727GvLjd7n76Kbk7bMeOHTPV35tBs2bNklXHbdiwISVKlEi2be3atb2KCbnxTC3oC7Izzm4lMiS6dV0HPTsZIyRLl/3Bucjz6W+ahIb161CjXgPAlpiTO/H7s6lfhdBAk0gEgf7B/PDD91R/9FH+b8AgnNkMtpLAoiXLqFe/MfPnzaJc+YeRAqSeWMgyF5BSMnHiRH788ccMi8aXX36Zvn37ZrkAgXtsVKhQgeXLl/Paa68xf/58nwevtWrVCsSN5Sqb1eYaD5Ib4yMbuFrQefiRajzZvAUL//wjU/tfvRbDvN/m8PKrb2S7LzmBxWJh+vTpdOnShX379nnlPHc/jNatW8euXbvMXNNOpzNZkKOmaZQsWZLp06cnczcZMmQImzdv5sKFC+Y+sbGxTJ8+HavVao4Vu91uCmKr1Yqu68THx5tjxjAMunbtmqxMsc1mo2XLlixbtswUrIZhcPXqVXbu3Mnhw4dxOBzm8VgsFnRdT9Pvu2TJksms0W5hHxsby4IFC+jatWu657d9+/asWbOGDRs2mOfW3Y9ff/0Vf39/dF0nJiYmWX8CAwMpVaoU48aN8/kkPaX2Unrv2LFjXoVPPLMZZJbo6OhMrzBomkbHjh3p379/ip8PHz6cyMhIs9T1/v376dWrF4GBgRQvXpwiRYpw5swZrwqPAOXKlWPs2LFeRVmyStLzltFrlTQmJimVKlXio48+YsiQIWasynfffceUKVPMY7NYLBw4cMBroqbrOl26dKFTp07p9iEgIICCBQt6WYT37dvHvn37OH/+PMOHD8/QsbjJ7eshpWT37t289NJL3H///UgpOXTokNf5uO+++1I8juLFizN58mS6devmVQxm1qxZzJo1i4IFCxIQEEBkZGSK3/3UU095pUaFnBsL2aFu3bper3Vd5403Un4eFSlShMcee8wrC1mpUqWyvWLt63F2q5ApdaXrepYGhzQk30+dmen9hBC80bkzUtcRiUGTIu0MgZluH80lhhOsFt56tycLfplJiEd52uyw9+BBHm/akgXzf8FBArnl5iulZO7cubz33ntpugp40rBhQ8aNG2cKoqzeBNz7utMxvf/ar38yAAAgAElEQVT++9mqIpaU0qVL06BBA5xOp9lHSWLObk2YucSzjQA0Sbc3u2bpXHw/bTrSmTezmIDLfeHHH3+kZ8+e+Pv7p7hceuXKFS5dusTFixeJiopKluO7VatWzJ49O8WHZsGCBZkxYwYVKlTwyn979epVs82LFy+agttms/Hkk08yd+5c/P39zTGTkJDAxYsXU3Tv+PDDDylbtmyyAN6EhAQuX75s3uxtNhutWrWic+fOXpbTpFafypUrU6BAgRTHq5TSK14h6STD8xiFEEycOJFOnTphs9m8trXb7URHR3Pp0iUvwa1pGjabjbZt2zJz5sx0YyM8/Zz9/f0z9IC88847k90P3JkLPPEcC7qu50oF2hIlStC7d2/GjRvH8uXLGThwYIpxA+AK2J06dSrvvPOOV/9jY2M5fvw427dv9xJ4FouFV199lTlz5lChQgWf9LdkyZLmNfL398+wddntPwuk2penn36a6dOn06BBgxv3OCk5d+4c+/bt499///USmGXLlmX69On07t07w+6AvgyQy83rUbt2bXr37o2/vz92u53du3cnWylq0KAB33//vVeZeU8qV67MvHnzeO6555LdO65evZqi4L777rsZMmQIo0aNSvZZTo6FrFKuXDmvsu49e/ZM0bXEzTPPPOP1unPnzqlu6/m7TKuYWWbHWdI4hNSunydJnz1J00LmRYRhGBmSBVkVYVJKzp89S/mKFYnORKEIgBLFi7Pv2HECAyxYhQWRGEaZfnbuLPQTJ4Z0IB2SbVu20+7FDpxIxQc1s/jZbEyaEEanzm8i9ERbbA5avHfs2EHjxo29ZvJp8eCDD7J06VJKlCjhM4HsuSoybdo0evTokeHMKakhhGD48OEMHDgQp9OJpmnomusGoOmaz3N3SyTX7Vd55KFHOXQ4c9a+oMBA9u/ezd33lgFNZtkCnxvBJ9euXWPt2rUsXLiQI0eOEBUVlWK1uaCgIIoWLUrVqlVp3bp1smwAqbFt2zYWLFjA33//zfnz503rr8VioWDBglSoUIF27drx+OOPAy5L6+jRo9mxYwcFCxakf//+qQZaOZ1Opk2bxrx58zhz5kyyVZWiRYvSrl07XnvtNWJiYujXrx/bt2+nWLFifPLJJzzyyCNe2584cYK+ffuyf/9+s5CPlJJixYoxb94886Y+fvx4fvjhB5xOJ0FBQUycODFFv9SrV6/y+++/s2rVKo4ePUpsbKxXyXubzUbx4sVp3Lgxzz77rBn0lR7r1q1jxIgRREVFUa9ePUaPHp2hap6ffPIJCxYswGaz0bNnT55//vlk2/z222+MHDmSuLg4ihUrxoQJE7wEQnpMmzYtU0WBgoODad68OaGhoRnex41hGBw+fJh9+/YRFRVFTEyM+Zvx9/fn7rvvpk6dOjnyMN63bx+bN2+mZs2aVKpUKUP7XL16laVLl+Ln50fTpk3TreJ45coVdu7cyenTp7l69ar523EXa3nggQey5J9uGAbz58/nzz//5OzZs1itVkqXLk2fPn2yVW3Y19dj5syZjBgxAnAd8+rVqwkNDWX//v1s2LDB67cUFBTEI488kuw3nRZ2u50dO3Zw8uRJoqKivO5NhQoVonDhwpQvXz7dgji5MRYyS0JCAitXrsRisdCkSZM0t5VSsmbNGg4fPkylSpWoXbt2qs/SY8eO8eeff2IYBg8//HCaZe8zO84WL17M8ePH8ff35+mnn07RKJC03/PmzSMiIoKCBQvy3HPP5YqRILN4apMcFd0y8ctmfz+NDq+9mun9B/fvy7CRn6AJDU26xJVMLIrjEt2+lN6uIDzDMMCAiLNnee6559i0datPWrdYLHR/4w3GjB2DJTDQB17pKRMREUHz5s0zHDgZEhLC0qVLqVo144GTmWXOnDl07Ngx2wFZ99xzDzt27KBw4cKuCViiddudwcT3SJxOJ599Mpr3hmbeD3Tc6JH07NsHIfQ8LboVyYmIiODUqVM4nU5CQ0MpV65cniyoolDcyniK7oCAgGR+ygpFfsBTdOdocRyXJJbMnDMn0/tqQtCxY2d0oSVxy8ipNHwaQuhomgVN07m7ZEl+/2Mhr3R80ScPW4fDQdikSXR66UWiLkSaQam+5Nq1a7Rr1y7DgjsoKIjwqeFUrVrVtx1JRErJrl276NmzJ/Hx8ZQsWZKHHnooy+0999xzBAUFuQL5pGHmDs85BEJovNi5A4FJAroywozZv6DJhDxYm1KRHiVKlOCxxx6jVq1a3HfffUpwKxQKhSLb5KjollISczWaNRtST8mTGg0b1KXCg/clpl6TIAwQLgu3hvCxlfsGLj9vgRRQtEgoU77/gY8/GJIl0ZUSM39dQIvmT3LswGGcOH1myXQ4HPTs2TPNdEqeaJrG0KFDafN0mxyzcF+8eJHWrVsTERFBkSJFmDhxIkuXLs1SWVlN03j88cfRdd38p2laDlq5XQghuKvEHdStlfl8pdt3/sOVyxfJs47dCoVCoVAoco0ctnQL/lqyistRmYteB3j+2WdBWj0KzOSMyE4JlwjVcHve9H3vfT769GOf+Ttv3b6NGnVrsm39aqTMfm5pKSVjxozhhx9+yPA+HTt2pF/ffqZgNQzDlYvdR5lGYmJiePbZZzl16hSapjFs2DBatGjBHcXvYNasWfTu3TtDPqhu3nnnHdOvVxNajk0UkuL6Hn86ZaFCZYLDwdKlq0AqK6lCoVAoFLc7OSq6EQa/L/5/9s47Tob7jePv7+xew51yTu+dCyJaRBddQkRL1AiiHAkRRBA1P0RNCNGiOwTRie5EiSRaBHF6Ob27vjPz+2PvJrtXd85eY96vl5fb3ZnvfHd3ZvYzzzzP54nfozU+MmbIwPttWqOqFmRAFpJNrDBlBEy0O4bZbMbk6ka/fv0ZPWYUGZ2UpP/g4SNq1G3ET/N+JFzISY6FKorC6tWrGTVqlMPivX79+nz55Zf8b/z/aNasGbly5cLd3R03dzfc3NzIlSsX9erVY/DgwRw+fJiIiAiHx1YVlYiICPz8/AgICLA60PToQZ8+fawXLcLq9NCjRw+tbXhieHt70759e2t0W0jOcyhxECGgSYt3yJ5IUUdczJ3/E0ak28DAwEA/8TnYGBikV5JVdIeHBbMzhr+uI9SrXQdvb28UYbF2oFRFVOlkyqAq/zUBsuZeKyDLDP58KKuWrcC3VCmnbCfSYqGX32eM/WoIEWEhia8Qc55ROdM9evRwuEgxS5YsyLJMtWrVGD58OFu3buXu3btYLBbt3507d9i7dy+TJk2iRo0aNG3SlA0bNmCxWBIV34qqMHnyZJYsWQLAO++8w6RvJ2lpIEIInj17RpcuXeza08aHJEksWrSIcuXK2aWTpGiOraTglTUrDevV073quXPnCXmu/06PgYGBwauOrTWmIcANXgaSRXSrqCiKyum/T3Hl2nXd67du8x6SSSAkEwJTVFOclCHawUQy/ZcrrCpWxxSLWaJek2asWfszdWrXdsqcZFlm/PipfND2Q0KfPwVVBRnsXYnVGP+s87x06RItWrRw2J5LkiRCQkLYu3evXfMLsEafc+bMGcu2SFEUdu/ZTatWrfjss8+4e/duvO3WVVXll19+YeTIkaiqSqVKlVi4cKHVwidq8YiICDp06OBQFboQgg4dOtCgQYP/BHcKR7kBVARCMtO6XSvd6964FcTefXuxqMlVAGxgYGDwclKlShVNeCfkM21gkF5INtEtqXDs6FHd65rNJmrWrI6QrKkEpihzveg2KMktXLQmK1GCW5ZlhCQwmUy4CgVXs6B4aV82b93M9MnfUKKgY766CW4TWL9pI+82f5fL1y8jo0Q5ktsuYf/v+bPn9Ojeg2s6vMQVRbGLiOfOnZthXw1j9+7dXLt2jfPnz3PlyhXOnj3L1KlTqVGjhpbHrigKs2fPplOnTgTdDNL8i23H/u233/jkk0+wWCzkypWL2bNn4+3tjWSyppXIssywYcPYts2xDo9+fn7Mnj071Z0jBBImTNSpURvPGAb+iaGqKn/+/qd1Lzbs/wwMDAwcxsPDgy1btjBv3jymT5+e2tMxMHhhksWnW0VFWFRatmrO+o1bdE2o5puV2XdwL0K4Yb0mEDbbty3yS57CSkukBZPZ2nlTURRkWcbFxQWLxaJFWxWs0W+hqoTcvsbYAUOYvWEDzyLibzHtKEULF2XO7FnUrl8fEwLVJEd5tfzXmSwy0sLHH3dj+fLlSdpG9uzZGT58OB91+YhMnpnidQCRLTK7du9i4MCB/PPPP9rzjRo1Ys2aNWTMmFFb7+bNm9SvX59z587h6urKli1bePvtt7UUHVVVmT9/Pr169XIoP7x69eqsX7/e2pVKRbvzkKoCXA6lWZOmbN25T9dqLVu8y7o1G8CkgtB3nWv4dBsYGBgYGKRfkt2nWyBQZZk//zyue916dd/GIsyACRAp6vygKIqdsJNlGZPJZCe4VVVFsVhQFRlZVXDJnZ//zVrAeL8+mJzgbnLx8kXefa8Fm35ZS7gcjqJG2kVIZVnm22+/ZeXKlUkav2jRouzdu5e+ffvildkrQcs9k9lEo0aNOHz4ME2bNtWe//XXX/nqq6+09YKDg2nXrp3WxW/a1Gma4I5m586dDBw40CER+cYbb7B06VK8vb2txZOm5K33dRiTibfr1de92r79B1BkmeSuWzYwMDAwMDBIuyRPeokC5wP/5fbdu7rXfadZE9RUFCe2OcPR9nkCoQlui8UCWG3rAGvjnizu9BwzjGF9ezllDqFhYXzQoSOjRwxBkmVUVWi6299/JaNGjUaW5YQHiYOSJUuydetWfH19/2tJmkjkWFVVMmXKxKpVq+yE96xZszh8+DCKotCzZ08OHToEwMCBA+nRo4dd+snZs2fp0KGDQ23gPT09Wbx4Mfny5dPWT/UIt4YrLd5tjVlnQc+Tp085eeokRk63gYGBgYHBq0vyRLolOHf6H02gOkqmjBkpXakKrqpAiCixJdkKQ8nmn/NFWHSkWxN7CFCt6TJgFaAmkwmz2YxkkjBJEqbovptungz/dgrVq7/llLlEREQwcdIM+vf+nGcPH2NRVQ4eOkzfvv0cFty2Ptju7u7Mnz+fYsWKWd+bg0I2erlMmTKxZMkSSpYsCVgj7mPHjuWbb77R0lzatm3L6FGjMbuYtbHv3r1L27Zt43UqsZ1DhgwZWLhwISVKlMAkmbRt2/5LXRTyly6Op6envrUUhWN//GGkihgYGBgYGLzCJFNIWeXY8WO613qr6pu4uLiiSNYx0hp2hYOyAipaO3JFUTG7urFn904+7tTBKQJRVVVmzJ9H02aNOXHkd9q1bRfLdSQ+smfPbicO+/Tpw5tvvvlC88mWLRvffPNfk6Bdu3Yxbtw4AMqWLcuPs3/ExdVFW16WZbp3726XD26L2WwmU6ZMCCHIli0b+/bto2nTpppLSeqLbHtUrHdCalXT/zn+c+rvlLKYNzAwMDAwMEiDJIvolrFw+I/fda9Xq1Z1zKoS5VeS8ikmAmGX8B5dq2mb5hCdNqGixhKGQghcXDz44cc59Oj2sdM6WB46+idv1qjJzZs3HVrew8ODIUOG8PjxY8AaQe7duzcmk+mFhKwQgpYtW1KxYkUAIiMjiYiIIH/+/GzatIksWbPY5cP7+fmxadOmeMeyWCyEhobi4+PD4sWLKV++PG5ubpjN5jQnuFFBqGBWFKpWq6Z79cN/HUFWI5NhYgYGBgYGBgbpgeRRtpHhnDodd3QzIapVrYYkBEIVqRLotkas/3NIsU1pUFX1v0JKWdGWsxXk1j9ASGa+nTKF8eP/h0cM3+ukoqiOtWc3mUxMmDABWZa1uVWvXp3ChQs7ZR5CCFq3bq099vDwYN68eeTNm1d7TlVVZs2axcKFC+MdJ3puiqIwfPhwGjRokDbFth0CoUKDum/rDlqfPH2G4MdGkxwDAwMDA4NXFaeLblVVefrwMXfvJ95t0BYXs5n8BQuihZdTQXvFjEybTCbNwUSWZat1XVTqg9lstssBN0k2xXUCXN08+HzQYI4cOkDJYsVTZP5CCIYNG0bfvn05deqU9nydOnWcFnUXQlCrVi3tsbu7Ow0aNLC7ONm8eTMDBw4kMjJ2ZDemqP7kk0/o1bMXrq6uaSRvOxEkQb6CBfDw8NC1Wlh4OPfv6C8sNjAwMDAwMHg5cH6kW4Uzp8/pLhrLmcOHYsWLoAqBmorCK9qfO/pvVVVRFWuUW5Zla3dKRUWWZU10y7Ks2dopsvU5d1cXJFXFt2x5DuzZScN6dZJdUDZp0oRhw4YhhODRo0fa84ULF3ZqUWKePHlwcbHmbkdGRtqNd/r0aXr27BlnEW3MNr45cuRg4MCBmMzW59O04LaZWq7cOSlUIL+u1VVV5cTJ006elIGBgYGBgUF6wcmiWwWhEHD4iO41K7xeFsUkoYjUbZcthEC2/JeaER3Rju5MKZmske5of2tFVrS0CEVRUFRFS0ORZRkFyJYnF1vWb+CLAQOSTVhWqVKFeT/Nw+xidSyxveiJFsjOwsPDw9raPQa3b9+mXbt23L59O871bNvHly9fnk2bNlG0aNG0LbZtibKNlyVB/gL5dK9+8tQprA2eFNJiofCLEB4ezq1bt7Q6AoO0zaNHj1i7di3+/v52d8VelNOnT/PLL7/Eew4wMACrtWyZMmUoU6YMCxYsSO3pGBikGObEF3EUq5BQkbl1y7GCP1tKlywZFU1UQCukTHkxJkkSmK3dGKMjsNFCNlp82y4b3SkxWmRDVMQ2SlNZPb5dEJ5u/G/ieDJlNPO/b6cTHh6BsyhUsCCLlv1EtpzeqCgI1WRnF/js2TOnbSt6vGjP7WjB/PTpUzp27Mi5c+fiXS/acrFYsWIsWrSIcuXKaa+ldeGt2vxDMlHjrRr8unOPrjGu37iGihzVXTR19u/k4Pnz59SvX19z1hkzZoxd3r9B2uO7775j9erVgPWi/MiRI7pTpmISEBBAr17WXgUeHh4EBASQMWPGF55rSnPz5k28vLx0W4MaOI6tKcCtW7ccWt74TgxeBpwb6VZBRXDvzh3dq/qWKm0toEym9u56iBbTtsWIQghMJhMuLi6YzWZcXFw0NxCLxYLFYsEkmf4rBhRgkkxRudQCFWuKypDRo1nnvwJPJ/4YhQQHc+NMIKgyigoqFvLl+6+w8fRp56Y1XLlyRbvAyJ8/P7IsM3jwYPbsSVyEyrJMr1698PX1TZfBXuveKfAtVVr3upcvX0ZVZJv3nQ4/gDi4c+eOnZXl33//nYqzMXCEJ0/+K+qNjIx02Io0IY4d+88mNjQ0lLNnz77wmCnN/v37adiwIc2aNUtSAzIDx/D19QWsv6ulSpVKcFnjOzF4mXCi6JZAFUiKxPFT+kXea75lsbZ+T77mN3qwa/seFeG2dTaRZVn7JwnJKralGHnTto8RCCHhghv133uXI4f3UbpECafM9e79+7zbth1TxkyASJVIEUn5Cv9FkTdu3Eh4eLhTtqWqKhs2bNAev/7660yYMIH58+c7tH7jxo3p06eP9YJFcqwrZlogOjYdvWcWiWoypIfzgRcRsoq1vWjq7+POwva4iOuxQdojZs2NMxo3Va1aVfvb09NTE1bphcDAQPr06YOqqty/f5+QkJDUntJLy4gRIzhw4ACHDx9O8K6Y8Z0YvGw4NdKtSNbkEFlnJ0ohBAWKF0dJYxpECKGJb7CKCYvFYpdGYtvIxba1elwFi0JEpaIIiWKv+bJ552aqVqnolLmGR0QwYvQ4Rg0diiUM6tWuj3uUXeGlS5fYvXu3U7bz6NEjlixZoj1+8uQJ48ePd0hodevWjeXLl2M2WVNf0oVbSRwoqJQu+xomnY4wFouFiEgZVUp/79nAIDGqVavG5s2bmTZtGjt27HjhdJWU5ubNm0bX2BTE29sbLy+vBJcxvhODlw3nim4kLl+8xKWrV/VNQghcXFwBOepf2ig0sxXO0e3fo/+ZTCatmFKPcBSACYELZgrkL8LeA/vp0rGT0zpY/m/qFN5p0Jjs2bJTOaoDpaIojB8//oWj3aqqMnXqVK1Yzs3NjV27djkUfShQoADfffcdmb0yA+kjum2Lim0JpIoQCuh8D/cfPuTs6bMomBJf2MAgHVKkSBEaNWpE5syZU3sqBgYGBmkOJxZSWjOXsUTqvjItUbQoGd09EMj8l9OdvkSZHsxIICTMisAsMtC2Qwf8V60kIg5f66Sw77cDvF2vNh982Jbf9u9HVVUOHjzI5MmTGTJ4CCaz/s6UiqJw4MABpk6dqj0XGRnpUIQ7Q4YMfP/993E6nqQ3VKIunISgTIli/H32X50DiKiOq2kDWZb5559/uHTpEg8fPiQkJAQfHx/y5s1LsWLFyJUrV2pP0Y7g4GD++ecfbt26RVBQELIs4+HhQd68efH19SV/fn1Wjrbs2LGD8+fPkzVrVmrVqvVCYzkbVVU5d+4cZ8+e5dGjR4SEhODp6UnOnDmpVKkSPj4+qT3FJBEWFsbx48e5fv06Dx5Yezt4e3tTunRpXnvttXRzcZ7ax1H09m/evElQUBAhISG4u7uTPXt2SpYsSenSpR3+LC9evMi///7L/fv3efr0KV5eXuTNm5eCBQtSLAlpda8ayX2O+vfff7FYLOTIkYMWLVqQKVMmJ87eILlxquhWAVW26Bbd3t7emF3NKMhpIL6dElhPfooEFy9domeP7k4T3NGcOH2aoOl3yJs7NzeCglBVlTFjxlCoUCE++OADLUrvCIqiEBgYSKdOnQgNDbV7PjEkSWLKlCm0aNECiKODZzoi+lJQBTCZyZc/ny7Rraoqz54+4T/pnrrs2LGDCRMmxGvvJkkS9evXp1u3bpQtWzbJ2wkJCeHUqVNcv34dWZbJnDkzZcqUoUCBAg7tB+Hh4axfv55du3Zx9OjROJsuRVOuXDm++OILKlWqFOfrYWFhHDp0iEyZMlGpUiUkSeLgwYNs2rSJjRs3astNmjSJbdu2kTt37gTn9tdff3Ht2jUKFChAxYrOSRWz5dGjRyxcuJA1a9YkaMdYsWJF+vTpQ7Vq1V5oe4GBgWzcuJGgoCDtWM+aNSu+vr688847iaYD6NnOrFmz2LdvX7x34LJnz063bt348MMPcXV11TV+UFAQly5d4sGDB3h5eVG8eHHy5s2b4P5mW1wKaBc2iZFSx1Fc7N27l23bthEQEJBgMWyePHn45JNPaNOmTbyfwblz5xg7dizHjx+Pd5xy5crx0Ucf0bhx4xea9+nTpzlz5gxCCKpXr06ePHniXC6p30lSePr0KWfPnuXBgwcIIShWrBiFCxe2cwKLD2edo54/f85vv/1Gnjx57Ny9/vjjDzZu3MjatWvtlv/ll19o06YNNWrUsOsKbZB2EYqiOKRzHflxtCBzdO8+qterr2sSNatXZ3/AflRJRkUgISFeokKzuFBVlbt371K/fn2nu4vYYjKZtGJQsKaEjBs3Dr8+fnhkSDzn0mKx8Ouvv/Lxxx9z966+jopCCL766itGjx4dqzFO+uQ/D3lVVXmnaVO2bt+ha4Rta3+h8fstcHTfTq58xvnz59vdtUgIs9nMrFmzqFGjRpyvBwYGahdVAC1btuSbb74hNDSUOXPm4O/vH6dtZeHChZk6dSolS5aMd9urV69m1qxZuvY9k8nEihUr4hQ448aNY8WKFQAMHz4cX19fPvzwwzjHmTJlCk2aNEFVVc6cOYPJZKJkyZIoisKJEyfYvn07y5cv15Zv1aoVNWvWpHjx4hQqVOiFLywPHz5M//79dVl+9ujRg/79+ye67f79+7Njx3/77tatW/n3338ZOnQoYWFhca7j6enJqFGjaNKkSZyvHz16lOHDhxMcHEzevHlZsGBBnAJp9uzZ/PDDDw4X3JYtW5YZM2aQI0eOBJezWCysWrWKVatWceHChVivZ8mShR49etChQwc7ER8cHMzy5ctZuXKlnXB+6623KFeuHD4+PrRq1SpO4e/M40gPv//+O1OmTNH92zF48GA++uijWM//+eefdO/enYgIx6xse/fuTb9+/XRt25ZOnTrx119/AdClSxeGDBli9/qLfCd6CQgIYMGCBRw7diyWO4qLiwutW7emT58+eHt7x7m+M89Rffv21VzAZs6cSb169ZgyZUqiXuYmk4khQ4bQsWNHh+dgkHKoqqqdk50a6QaVoCQ0RciYwSOqKc7L5V+cEM+fP6d9+/bJKriBWCeR8PBwBg8ezObNmxkyZAgNGzbEZDJp3TWjEUJw8uRJxowZw+bNmx0+GdvSsGFDvv76a6e1oE8LREtggURWT/1Rv8DLF2iEBYFzGxbp4cyZM0ybNk17LIQgX758yLLMs2fPYok8i8XCZ599xvr16x26NXr27FnWrl3LrFmzEvTgvXz5Mh988AErVqygdOnYFowTJ05k8eLFca4rSRL58uXDbDYTGhrKvXv3tC6osizz1VdfsXbt2lg/yrZ2hmvXrk3Q1i579uwADB06VIuCt2vXDkmS8Pf3j7X82rVrtUhU0aJFGTduHOXLl493/IQICAjAz88v1vErSRI+Pj64u7tjNpu5efOmnUieN28eXl5edOvWTdf2JkyYwKFDh+LsJBvNs2fP+OKLLwgNDeX999+P9fqRI0e4ceMGYI3QBwYG8sYbb8Tajm0hNqDdegfr3bOgoCC79/T333/TvXt3Vq1aFW9x5pUrV/Dz8+Py5cvxzv/x48dMmjQJf39/5s+fT4ECBQDYsGED06dPj7X8oUOHOHToEGDtnvv222/bvZ7cx1F87N69m88++yzei5YcOXLg6elJREQE9+/ft7s7+f3331OnTh0KFSqkPRcREcGAAQPszvE5cuTA1dWV0NBQLe3HltmzZ1OsWLF4L8ASwzYSHFdUOKnfiR5CQkIStbqNjIzE39+fjRs3MmHChFjbc/Y5yvb8tHr1as6fP68JbpPJRMGCBTVHkNYAACAASURBVBFCcO3aNbvPTZZlxo8fT6lSpeK9y2eQNnByTjfce/BQ93rVqlRCBkya4H65c7ojIyMZOnSoQ77WyYGqquzfv58DBw5QoEABmjVrRrFixciYweodfuXqFbZs2cKZM2cSvE2WEG+99ZbVqcSBW3PpAdvmOAIVoQoqVXyD5T+v0TVOaGgIqV0kvHr1ai2CnjlzZlavXq2JAFVVOX36NDt27GDx4sXaj0RoaCibN2+md+/eiY5/7tw5RowYoT0uUKAAvr6+ZM2alevXr3PkyBFtvwoPD2f69OnMmTMn1jjr1q2ze+zh4UH79u2pX78+JUqUsBNgz549Y8GCBcydOxew5qXu37+fBg0a2I1hK1TOnj1rJ7rd3d0xmUz4+PhQv359KleuDFijitGsWrXKbjx3d3etOZatULx48SLdu3dn5cqVFC1aNJFPzJ579+4xdOhQTXCbTCbatm1L48aN8fX1tauNUFWVS5cuMXToUO0Cfvr06TRs2FCXsAsICNDeT9u2balQoQIeHh4EBwdz4sQJVqxYofUtGDduHNWrVydnzpx2Y8QU7DEf79y5005w58mTh+HDh1OzZk27O2FhYWHa+TF6P7lw4QJTpkxh+PDhseYeGBhIly5d4ky/yZcvH3nz5uX27dtcjSrwv3HjBr1798bf3x8vLy/q1q3L4cOHCQgIsDvfFSxYkNy5c5MjR444hUxyH0fxsX79erv9WAhB48aNadWqFaVLlyZr1qzaaxaLhd27d/PFF18gyzJhYWGsWLGCr776Sltm586ddsJ6xowZduLy+vXr7N27lzlz5vDo0SPt+Z9//jnJojsxkvqdOEpoaCidO3fmzJkzsV7Lli0bRYoUISwsTDumgoODGTRoEEuWLOG1117TlnX2Ocr2ew0ICCAgIAA3NzcGDBhA27ZtNUeyiIgINm7cyMSJEwkODgas+9zixYsN0Z3Gcb4icixbxX4SWmGfAFV6mfU2AD/++COzZ892ePnoH3VnEZ2XrCgKV65c4Ycffkh0HQ8PD8LDwx26JZwnTx4WLFhAtmzZXnyyaQztclCAyaz/1qa132rq7uC2XUNjijMhBGXLlqVs2bI0btyYzz77jKCgIMAqBvVQqlQphg0bFivX+c8//6Rr166aqDxw4ABXr16lYMGC2jKPHj2yixTmy5ePWbNmxVvI5enpyaeffsqGDRu4E9Wc659//okluuOib9++dO7cOd6CpJji0WQyMWrUKJo2bWr3o3rjxg3WrVvHvHnzkGWZ4OBglixZwujRoxOdgy0LFiywEzcJ3TYWQlC0aFF++OEHmjdvzpMnT5BlmSVLljBs2DBd240eJzoCHE2TJk3Ily8f48ePB6yieObMmYwdO9bhsWVZZuLEidpjd3d3fvrpp1jbin5t2rRpPH78mE6dOnHx4kUA1qxZQ48ePezEflhYGJ9//rmd4HZ3d6dTp060bt3aTgQPHDiQ7du3A9a7LJMmTWLs2LHkzp2bGTNm4O/vb/eelixZkmCBakodRzG5auMO5u7uzvjx42nUqFGcy5rNZho1asTOnTvZunUrELtZmu37KFiwYKxobv78+encuTPNmjVj0KBBHDlyBEB3uqEekvqdOMqYMWPsBLcQgiZNmtChQwcqVKigPb9ixQrGjRsHWPe1QYMGsXXrVoQQKXaOGjNmDO+++67dc66urrRu3ZrcuXPTo0cP7fl//9VZ2G+Q4jjXMlAFWU5KZFSkEZPA5Gf9+vUMHDjQ4XzGunXqsOSnOWR0ouetZDLhkz0bGTMm7CYiSRLly5dnyJAhuLq6OuZU4pGB5cuXU6pUqTi9ytMrts1x7J7UifXaKXXTbe7fv6/9ndAPmK+vL/7+/lSuXBlJkqhevbrD2yhfvjz+/v5xFhdWqlSJZs2a2T0XMy0gOuVAkiRq1qyJv79/os4JkiTZFT4+fJj4XbdChQrRp08fXQ4AtWrVolWrVrFSHfLly8enn37KN998oz33+++/67pgDg0NtYueVapUiQ4dOiS6no+PD82bN9ce79u3z+FtgrVYctGiRXGKYID27dvbFbutX7+ea9euOTz+rl27NNEJ8N5778W7rWiyZMliF0mNiIhg165ddsssWbJEE+VgLVLbunUrAwYMiCWC69ata7eubU47EKtoNjqqGB8pcRzFRfHixQEoVqwYixYtildw25IvXz7t75jHhW2UO6H34e3tzdy5c2nbti0mk4maNWvqnbpu9H4njnDy5Em7Bm/e3t4sWbKEyZMn2wluINYFyNWrV7WLlJQ4R5UsWTKW4LalevXqdsXTSb0zbZByOPXXXwgpWlXowtosRAU1/YuzhDh58iQ9e/Z0+MAoWqQoixct5MMundi0fjV546nw1ossy4SGhvH14C9p17at9ny5cmVp27YtA/oPYObMmfz111/s3LmTAwcOxKoijwuz2cx3339HrZq1nDLPtIrAuquqSblMVFTUVO5kbHv7ec+ePQnm6/v4+LB48WIOHjzocP6k2WxmxowZuLm5xbtMzB+3mALO3d2d7du3ExAQwJw5c+ItYoqJbf6qI770iQm/uEisbXXz5s15/fXXAev7crTQDqyt1J8/f6497t69u8MXrbYdIG/evBlnLm589OzZM8HP2GQy2f34y7LM/v37HR5/7969do9tb9EnRPfu3alSpYr2+OjRo9rfFouFZcuWaY/LlCnDokWL4rXnq1Wrlt33bTabX6iteHIfR/ExZcoU9u3bx8aNG+0cLhIioePC9n2cPHkywToMs9nMqFGj+O2332IVP6YXFi5cqP2dMWNGli1bFq/zUM6cOalf/z9jiOj6J0iZc5QjbjdJrRsxSB2cnNOd9NQQ8ZKHue/cucN7773n8C05b29v1qxdQ74CBUGo1GjQlIMHDtC0WWPOnAt84fk8Dw5h6KiR2g96yZIl2L3jV7LnzIWqWiNDkZGRtGnTRitcSQghBH379qVr165ae/eXnSTtsmrqp5dUqFCBf/75B7DeWq5Xrx5Vq1YlX758lClThipVqtj9EAO6mp2UL19eK0KMj5hOFHE5dJhMJl0pSitWrNB9e1WvzVbx4sXjdH+IScWKFTlx4gRgFZwDBw50aPzodcDqNGQrOBMjpti8d++ew0LgzahGWglRs2ZNu9z7hIpQY3Ls2DG7x5cuXXJoPVdXV7vvyFYQnjx50i7aPHLkyAQjoZkzZ2bz5s2cPn2asLAwypYt+0KuSsl9HCVEYk4uthw7doxffvkl3tejLxDBGilt0qQJ1atXJ1++fJQoUYLKlSvHujhNr82PIiMjtfoFgF69etmltcXF999/z/nz57l37x4lSpSwuxuQ3OeoxOYGpLvOr686zvXpthp1615PkyDi5Yx2P3/+nA8++IArV644tLy7uzsL5s/XToYqAklA3kKF2B+wi549+vLLxs0vnOetqCqoKpIksXjRLLL7WE8eQggsFgtff/21nXdxQrRr146JEye+VE4lyUYqp9u0a9eOlStXarnKDx8+ZNu2bdrrQghKlixJ3bp1tbxBPdg6I8RHUlOOrl69SmBgIE+ePOHx48c8e/aM+/fvc/LkSbs0A0fw8vKiS5cuutapX7++Qz7Btn7W0YVOjnD9+nXt79dff13X7fQsWbLYPU7Itzkmjvhvx/xeHY2kWywWzdUkmqVLl3L58uVEiz0DAwPtCllt39Mff/yh/Z01a1aHooJms9lOZL4IyX0c6eHBgwecPn2aR48e8fTpU+34CAwM5M8//0xw3bp165I3b15u3rwJWNN4Yt6ZyJ07N7Vq1aJly5YOR9fTIn///bddwXOtWo7dlS1RogQlSpRwaFlnnaPy5MlDy5YtHV7eIH2QJqwlXuYgd2RkJL1793Y4x1IIwbix42jevEXs1xBkz1aA5ctWMeF/4xg7YbxVOL8giqIweNBwfv55FdlzFkAVsOCnn5g8ebJDwr5ixYrMmjXrpXEqSV7UVN/hixYtymeffcaUKVPifD26++G5c+eYM2cOtWvXZsiQIUlKxXAGf//9Nz///DOHDh2yywt+UWrXrq37PWXMmNFp248L2zSumFHSxIgZfXyR1Im4iPne4/PzjklcqWmRkZGxhJ0j2Ea9bYV8anRKTO3j6N69eyxZsoSDBw/y77//JjkIYzabmTBhAl27do3XMvLWrVuaB3qZMmXo37+/U/zGUxrbi1pJknQ7C8VHcpyjmjZt+lKaEbzqODenG5IYxbMah6f2bXdnEt2QZvLkyVozDkfo1asXAz4fECtFQwJMkgATmDO6M2rUGKZNm0IGJxSWAAT8doQqVapz9OBejvx2kAH9+yfo2RtNkSJF2LBhA1mzZtWily9D4aQjJGlPVyHVVTfQrVs3Bg4cmOidCUVR2Lt3L23atNGVw+sMQkJCGD9+PB9++CFr1qyJ88dMkiTy5s3Lm2++qfsHVK+oTQlCQkK0vxPKiY+LtNqASk+kPzFs70zYOpakVrpDahxHqqqycuVK3nnnHRYsWMC5c+fiFNze3t688cYbDnVKrVixInPmzHHoLs6ZM2fo2bMns2bNStL8UxPbfSZTpkwvfGc2Oc9RMe9cGbwcODU0KakgkjCkKit2VmwvA4qisGnTJkaMGOGwU0nNGjWZNGmSZhGoiVi7pVQkYQGzmX5+n1Gp3Gs0b/0BDxxwakiMq9dv0LTZe5hcXOyKPeIja9as/PTTT5qrwcsutm1/1gQgHPta7RCSSPX0kmi6devGW2+9xaRJkxJ12Xj27BlffvklO3bsSLY2zLaoqkrfvn01e7JosmTJQpUqVahUqRK+vr6ULl1aS8GQZZnatWs75FqSVrFtlPGyHE8JXTxkz56d7NmzJ3jBEN1kpE2bNna557ZBgdTMa03p42jWrFmxbF7d3NyoUKECVapU4bXXXtN88aPp168fu3fvTnDcatWqsXXrVqZPn86mTZsSLAxVVZWZM2dqx2J6wZn7zKt6jjJ4MZxbSKmCkJIguhXFKmBekp44iqJw4MABunTp4vAt3hIlSrB06VI83BM7EQgkXECy/ihXq1OfY8eO0rpVK/746+QLz/2Rg3mgJpOJuXPm8tZbb73wNtMDts1xIOoWkapfdUsmU5oR3QClS5fmp59+4vr16+zZs4dTp05x7do1nj59yt27d+2q6588ecKqVavo3r17ss/rp59+svsxc3Fx4csvv6R169a4uMTdzdNkMlGqVCmHCn/TKrZCwNFiw2j0uJU4A0cvCuISlzly5GDatGmxXGz0YGvz6GiqS3KRUsfRiRMn+PHHH+2e+/DDD+nbt2+Cd25ee+21REU3WKPjY8eOZdCgQezatYuTJ08SGBjI48ePefDgQayC53nz5qUr0e3MfeZVPUcZvBjOLaQ0gWcm/TmP1qiqsBZRph09kmQePHhAjx49HC5k8vb2ZtmyZeTLn0/f+xfWPO/8BYqwddt2enzcjfWbtyZt0no2KwQjRoygZcuWqKh2UfmXHWHzl6IkoWhYSET3tUxL5M+fP1ZRYWRkJJMmTbKzZdMrBJOCLMuxOlT27duXDz/80KF1kxNH71rZRtT01DrYulKcP38eWZYdThu5cOGC3WPbzpXOIKbzkqMpHRkyZMDb29vuoqBTp04vJLjB3lM6Lveb1CC5j6Mff/zRbh+vUaOGXffX+NB7XHh5efH+++/z/vvva8+pqsq2bdsYNGiQFs3XW7yc2tjuM8HBwSiKkqQUk7R8jjJI2zi3OQ4KliS4lxz6/U9Uq/ExQknf9oFPnz7l3XffjfUDGB+urq5atECSpCQ1lBFCkD17Tlau/pm+vT5JdgHcuXNnhg4dimSStDm/7Ng2xxFRPT0fPtIfWSyc1zle60llz549dOnShSZNmiRa3Ovi4sLnn39uZzt3+/btZJ6h1X7N1qsacCiapqqqLhu7pOCoWLJt9qMnj9N22bCwMF3vJ9q+Lho9dogJpRLEN76jbg5gjQTb4kj6WjQXLlygZ8+e1KtXz64+xnbMCxcuOFRIGB4eTu/evWnYsCGrVq1yeA4xSa3jKKYTiSP52hC/veOFCxfo378/devWZd68eQl+hkIImjZtSu3atbXn7ty549RuyclNmTJltL8tFovDjmJTp06lXr16jBs3DlmW0/Q5yiBt41TRLaFSolBh3espqpLG4n5Jw2Kx0KtXL7sGDglhNpsZN24cLVpYnUpeqHujELi4uTP+++nMnTkLN1f9LcodoVq1asz47jtczC4vVcdJPQisF4aXrjrekS+aTJkyJS0Z3AmoqsoXX3zBH3/8wdWrV/Hz84uVGxoTd3d3u2YeKfFdx/UjHt/tWls2bdpkd3cpOcTAxo0bE71Nv2PHDrZs2QJYUyv0tIGPGf1duXKlQ+vdvXvXTkSWLl06Ua90W2xbYseHreAVQiTYKS8mMbsXrl69OpZoiYvff/+d9u3bc+DAAW7fvm3XrbNq1apalPL+/fssX7480fE2bNjA/v37uXHjhiag9JKax1HMfdqR4+Lq1av89ttvcY4xadIkduzYwZ07d5g2bRr9+vVL9IIoZjfZ9HT+z5Url5315ffff5/oOleuXGH+/Pncvn2bFStW8Ndff6Xpc5RB2sbJpsoSGb30V5GrsowQSlq7466LyMhIhg8fjr+/v8MH0kcffcTAgQOdJlwlIeEhudOtZy/Wr/6Z3DoaKDhCdm9vlq1YSaYMmRBRHt+vCiqgRP2L/pl+eF9/MUwGT8fbjTsbIYRdRbyqqvzwww989913Ca5nmyqREkWUBQoUiJWS8ejRowTXuXjxIhMmTLB7Tk801VEURUnUu37jxo3aOaBy5crkzJnT4fFLlSpFkSJFtMebN29ONDKmKAoTJ060e79+fn4ObxOsubkJ5biuWLHCLsrarFkzXdZ3zZs3t/Mcv3//Pl988UWC3Xk3b95Mz5497cS5bfe9nDlz2tWUfPvttxw/fjze8WRZ5ueff9Ye+/j4JJi6E1/qRGoeR7b7Bti7ccRFcHAwQ4YMscspt91PYuaB79mzBz8/vwQ7Jab0+cAWZ6Sz2Hpf79ixgwULFiS4vL+/v93jXLlypelzlEHaxumdTDwzeekWkKFhYahyZLoW3StWrNDV7rlp06bMmjXLuekZAiQJkFRqvV2HN6tXdc64UTx58oRfVq5CkRWr+tTs714t8a2iosgRPErkBy8uPDN7oaTi59WmTZtYz82ZMydeIfns2TM7seVI45sXxcvLK1ar7IRu4f/222989NFHsQRIdLMPZ7N792769u3Lrl277J7fsWMHffr0sZtr8+bNdY9vK5gjIiLo1q0bBw4ciPNi/tGjR3Tv3t2uKcv7779PvXr1dG3z7NmzdO3aNVbnyKdPnzJlyhTGjRunPWc2m+nXr5+u8TNnzhzrQiAgIIA2bdrEirKHhYXxww8/MHjw4FhpL40bN7Z7PGDAAE04WywW/Pz82LJlS6zPKjIykjFjxtilyHTq1CnBOffr14958+bFKfRS6ziK2SwlICAg3mj9lStX+Pjjjzl16lSsuUTnwLdq1SpWTvORI0fsvm9bFEWx6+iYEucDWxL6ThylY8eOdo2Kpk+fzowZM+K86Fy7dq1dLn6dOnUoUKBAmj9HGaRdnFhIqWJBwcXDDVcXF8IdyBGM5uy/53ka8hwvL7d06dX9+++/8+mnnyYYtbGlTJkyzJ0716HbUXoRQiDLFr753wTWr98MWCPU953gbBBpsTDoqyFcuHieqdOm4+6eAcUcAZgw4fz3kpawNW9UAZlIHty7p28MIRDChEIyXO06SM+ePfnnn3/Ys2eP3fOTJ0/m9OnTWuQqODiYGzducPz4cbsITswfmuRi6NCh/PHHH5q1lr+/P1evXsXX11eLmIaEhHDs2DEtulmnTh0OHTqkCbXAwED++OMPKleu7NS5KYrCnj172Lt3L82aNSN//vxcu3aNrVu32om9Fi1a0LBhQ93jN2nShKNHj2rpIo8fP6Znz57kz5+f119/nWzZsmE2mzl16lSsDnsVK1bkyy+/THQbcV3onzx5ko4dO5IhQwYKFCiAoihcuHAhVvHoJ598kmgnybjo2rUr58+fZ9OmTdpz58+fp127dpQsWZJChQoRHBzM77//HqcAatu2bazvsnTp0gwaNEiLID5+/JhBgwbx3XffUaNGDXx8fHjw4AF79+61ayFfsWLFWAWPMaO2Dx48YNq0aUybNo0FCxZQrVo17bXUOo7atWvH9u3bNQF//vx5WrZsSfXq1bWuorIsc+bMGe1YeOONN7h27Rr379/Xxlm2bBm9e/emcuXKfP7550yePNluO+vXrweslo5ms5nQ0FDu3LnD33//zbVr/6XVJff5QM934igeHh5MmjSJHj16EBoaiizLzJ49m2XLllGnTh0KFixIaGgoR44csbtIy5Ili12qWFo+RxmkXZzr041C/oL5yZcvLxcvXU58hSjCwsKRQ0Mh8U7EaY4LFy7QunVrh51KsmbNypYtWzRv6+Rg6dJlTJ4yBVVVqVatCmvXr2b6/6YyecZMh90X4kNVVebMn8/161dZsugnsvp4I5BQTen6RoVDRAtvASgR4Vy4dj3hFWKQxcuT/EUKOX9iOpAkicmTJzNr1iyWLl2q3Ua+f/++XUQnJkIIevXqFWerbdcY9QOONHWJuU7Mxzly5GDRokV89dVXnD59GoBDhw7Fa7XVq1cvPv30U9atW8fXX3+NoijIssyyZcvsftBy586t/ZAmtS131apVuXLlCnfu3GHz5s1xLtO6dWtGjhyZpPEBRo4cSaFChZg7d64m1q5fv27XUc8WV1dX+vXrR9euXR1yY7AVM5Ik8dFHH7Fy5UpCQkIICQnh3LlzsdYRQtCxY0fdqSu225kwYQKlSpVi7ty5WqfKaJEYX1652Wymd+/efPLJJ3G+3rlzZ7y8vPj222+1SOKNGzfizIcXQtCoUSO+/vrrWJ+Tr68vOXPm5M6dO7HWi9n0JDmOI0cwmUzMnDmTMWPGsG3bNlRV5cKFC/EW7lepUoX58+dz4cIFunTpokW4lyxZQu/evQH4+OOPyZw5M99//z33ogIJsiyzdu3aBOdSvXp1OnfunKT3YXvRl9D+quc70cMbb7zBwoULGTZsmBY1f/bsmd0FoS1lypThm2++sXM/SY5zVO7cuTWXH0cLoXPlyqX9ndRzmkHKIRRFcehed+IpECqoMqoCpUuV4t8L+m7/7N+xmZpvNwWE1cY4HSi4x48f07RpUw4fPuzQ8m5ubqxZs4bGjRvbOZU4k7179/LOO+8QEhJCgQIF2LF7M0UKF0INMzH9uykMHTHqhYV3NFUrV2LZ8mUUKlISVVJxUUXqhXBTmONHAnijWu3EF7Qhd86cXLpxDZPZhAuO2cAlZ6HN7du32b17N5cuXeLq1at2d2pMJhOurq54e3tTqFAh6tatG2+rbUVRGDt2LFeuXMHd3Z2+ffvi6+ub4LZDQ0MZPXo0t2/fxtPTk8GDB8cbPT158iQnT57k/Pnz3Lx5E0VRMJlM5MyZk/z58/Pmm2/yxhtvaMsfOXKELVu2YLFY6Nq1q53Lxj///MOiRYvInDkzffr0cajNcs2aNbUfwsaNGzN16lRu377NjBkzCAoK0o4nIQSFChWicePGdk1cXoTQ0FAOHTrEiRMnCAoK4unTp1qUTJIksmXLRpkyZWjSpImuC/l79+6xY8cOZFmmXLlyvP766wQFBTF+/HgOHz5s1xnT09OT2rVr065duwTdMqZOncr8+fO1x4sWLaJKlSpxLhscHMzhw4f5888/uXv3Lo8fP0aWZYQQuLu74+XlRZYsWXj99depUaOGFsVNiGfPnrF7927++usv7t27p+XLuri4UKRIEUqUKEGVKlUSzEUPDAxk3LhxHDt2TEvbKFmyJHPnzrUTXLY46zjSy7Vr1zh69Cjnz5/n0qVLREZGIoQgW7Zs5M+fn9dee4169epp6TfXrl3D39+foKAgmjdvHitKHRYWxvbt2wkMDOTSpUt2+4DJZMLFxQVPT0/y589P1apVX2gfX7BgAQcOHECSJDp27JhgOlRSvhNHkWWZgwcPcuDAAW7dusXz589RVVVryFS8eHHKly9vV0sQF846Rx05cgR/f38KFCiAn5+fXR1EfDx//pyZM2dy584d2rdvb0TN0yB2zQ6dJ7oBVQZF8H7L5vyyaYuuSS2e+wOduvUmvYju8PBwWrVqpbkUJIYQgpkzZ/LJJ5/YuX44U3RfvnyZWrVqcePGDTJlysT27dupWrUqQoAkBBZkvhwwiKkOVGw7SnZvb378cSbNWrbEXXVDNanWWHAa//5elK1rV9KsdeKerLY0rVePTb/uQDULTA5enRjV7amPregeOHAg3bp1S+UZJS+KonDlyhVCQ0Px9vYmR44cDkXP9YjutE5kZCRPnz7Fw8PD6X7nBknD+E4M0iu2otu5cUkhoaqQP6/+fL+jx46TXgryFEVh+PDhbN3qWCMaIQQDBgygR48eSCJ5ItwPHz7kvffe48aNG5jNZmbPnk21atUwSaaohiywZeMWZs+b59Tt3n/wgE6durLgu5lYFNlqaPLSC0WVA7//mfhiMciRNw8SEiblFbkd8BKSnuzRkookSRQpUgRfX19y5cqVpOYh6R0XFxe8vb0NcZeGML4Tg5cB559NJUGeAo43ZYjmxo2baao9dkIsmL+AKVE5047QtGlTJkyYgNlsRkjOj3KHhoZqVepCCAYNGkTbtm2t25Cs2/jr+An69PFLFoui0LAw+n0xiM/79yUs7AkoMmoSWqSnJ4Ku6686z5Mn93+mLwYGLxnOSlszMDAweFlxsui2poaUfU1/kchfx0+i2vh/plX27NlD/wH9HRbcVapUYcGCBVbBnQwpJYqi8PXXX2tWVZ07d2bk1yM1D1FVVbl//z5tWre2q953NqqqMmP2j3zY5kMe3n+I0NjDyAAAIABJREFU1cb75Wx3qyoKf5yI3w84Pl7zfe2lT7sxeHWJ2SY+Y8aMqTQTAwMDg7SJ8yPdQvB6Eiqz79y5y4XzjrVOTw0UReHff/+lQ4cOdgUmCZErVy4WLFjwwsUe8aGqKvPmzWPq1Kmoqsqbb77J1KlTcXH9z74vJCSE9u3bO9zu9kXZuHU79RrU4/qVc0SqISiK5aXLS35w7x43b+qvnH+9fHkUIVAN4Z2ueBVSSpJKcHAw+/btY/78+ezcuVN7XggRq5GLgYGBwauOUy0Do/HJnRsfb2/u6fCGjrRYCLoVRPHSpaKigWnnh05VVO7evUurVq24ffu2Q+t4eHiwdOlSSpcqnWyt0gMCAhg8eDCKolC8eHFWrFhh12EsMjISPz+/RNtWg/VH0s3VlbAEOpE5ysnT//BmtTqsW72cqjXqokYlVLwM4kVVVU7/87dmveUoWbNkJk9B/bUOBqlP1qxZNY/jl2EfdhZPnz6lQYMGcR4LderUwcPDIxVmZWBgYJB2SZYKGeHqQvlyr+le79ChAARpL+c1IjKCvn597YzyE8NkMvHw4UNNcDqby5cv07JlS54+fYq3tzeLFy+O1R1s2rRpLFmyxKHx3mn2Dju37CCfg96giXH77j0aNmvJ3B/nICJlkNO/E4eK1Znl7xMndX+rJYoVxT1T6rWAN0g6lSpV0v4uWLBgKs4kbREUFBSn4C5RosQLeZQbGBgYvKyYRo4cOcqRBfVEeFQBZ04c5+CRo7omIwGdO3dBSCppyfD53LlzDPxiYLztduMiIiKCTZs2YTaZeeutt5wa7b59+zatWrXi4sWLuLi4sHjxYho0aGC3zLp16/j000+xOJAn7+vry+qfV1PKtyTvNWvI6b//5vJVfY1f4iIiMpLt27cjqeFUrloZs9kNRPqNFgpUUFQmjh/PucBAXet2aNOaeo2bIJAQIt3UDBtgrcvw8fGhatWqNG/e/JV084iL7Nmz4+3tjSRJlChRgtq1a9OhQweGDRtGJuMC08DAwEAjeXy6o5BRWL5gHl2699I1KZ9s2Qi6cQOzuwuIZMl8SRKKorB48WJ69eqlNaZwFEmS6NevHxMmTMDNze2FBWd4eDjt2rVjw4YNSJLE2LFjGTxoMGaX/z6vgwcP0qxZM63jW0LkyZOHgwcPkj9/fquftyrz+NkzunXqyi9bNjslOi2E4P0WLZi3YB6eXtkwI5DNCiYHG8SkGVQFZJVsPtl5FNX5zlFmTp3MJ5/1R2BCEiA5uBuk97sDBgYGBgYGrzLJ59P93yaoWvVNzGZ9ourew4ccCjiY5tJLhBB89NFHrF+/PsFuZnGhKArfffcdjRo14s6dOy8koiwWCwMGDGDDhg0AtG/fns8//xwhhDbu5UuX6d69u0OCO0OGDMyZM4eCBQpiMkX5eZtcyOyVjeVrVjNk8GdOieqpqsra9eupX78+V65eQEZNp17eKufPnOGpznxuSZJ4q2p1TEYFpYGBgYGBwStLsohukypRvERxcuXIoXvd/QEHSEtFlICWGtKkSRP27dtH8eLFdY8REBBAgwYNOHH8BIqs6Bbfqqoye/Zs5s6dC1i75M2dOxdXF1cQ1tcfPHjA+63e59y5c4mOJ0kSP/74I02bNtW8vEV0K1ABLq7ujPtmEmtXLCNTJudYfx07fpK367zN0UOHMClmUKzaO73Ib0WobP11m640I4BMmTJSvkJ5hCKQVBDp5Q0bGBgYGBgYOI1kinQLhIsLVatWSnzRGOzatx1FldPsbfVChQqxePFi3N3dda97+vRpGjdp7HAnS1t27NjBF198gSzLlCxZkoU/LcTV1VXLkbZYLPTv358TJ04kOpYQgn79+tGxY8e4I9lCYBJgksy827otG9atIldO/RdQcXHtxg0aNGnEKv+lWNRIZDUdRb1VhV27ftW92puV30C4mUlrF5MGBgYGBgYGKUfyiG4BCIn69evpXvXPE6e5dT0IJToMmoZQFIWHDx8ycOBAwsLCkjTG3bt3adO2DfPmzcNiSdzDWlEUTp06RZcuXYiIiCBnzpysXLmSQoULIaJEnCzLjBgxguXLlzs0hxYtWvDNN9/E+3q0NFSFimoKpXbd2hw5HEBZ39IOjZ8YwSEhdP64GxPHjUC1RForb9N0vFsFVB7ff8SBw3/oXrtZ0yaoqoj6YI1Qt4GBgYGBwatIMpbhC6pWq6I7thcSEsLOX7cQKSyoyKQlMRYREYGfnx+HDx8GrBHjChUq6M57DgsLo0+fPgwZMoTwBHyxVVXl2rVrtGrVijt37uDq6srs2bMpV66cdZtRUe7Fixczbdo0h+4OVKxYkYULF5IhQ4ZEizoFAoEbkupG3nxF2f7rr7Rr00bXe42PiMhIRoz+ln69evPk8T0UJdJaqJgWURVUItmxbavufG6ANypWBiRkk4wsWVCEkmxWkgYGBgYGBgZpk2QT3QIJ39JlKVK4kO51V/ivxsUio6I/9zm5UBSFadOmsXr1au25Dh06cPDgQf73v//pbgQhyzJTp06lXbt2PH78GFVV7d6rqqg8f/6cXr16ceHCBYQQTJk8hebNm9uJ5YCAAD799FMiIyMT3Wbu3Lnx9/cnc+bMDs/ThAtEtbD3yZGLRQvn079PL8ymF3ceUVWVOQt/okmTxly7fgk1jfroqUJFURRWrlqje928uXNTofzrURefSlSUWzVEt4GBgYGBwStGshrOurplpHmTJrrX2//bIR7deYKquCS+cAqgqirz589nxIgRmjCuVq0aM2bMwN3dnUGDBuHv70+WLFl0j71x40bq1atHYAzf50hLJIMGDeLXX605xH5+fvTx62MnuK9fv07nzp0JDQ1NdDuZM2dm3bp1FC9eXLdnuBACySRhMplwc/NkytTvmfvjj5ic5Fd85OgxWr7bhtuXbmCRVRJ3Fk9ZLJh48ug5+347oHvdxvXrkdHLCyTrZy4hWb26jfxuAwMDAwODV4pk7vIg0axpU91rRVosrPt5nbUZSSqLE1VV2b9/PwMGDNBcKwoXLszSpUvx8vTSRPg777zDtm3bKFmypO5tHD9+nNq1a7N7924t4j116lTNqaRu3bpMnDjRTiyHh4czYsQIrl27luj4Li4ufPvtt7z55pu65xaNEAJJkhBmgeTmQtduHxPw62Zy58qZ5DFtOfH3acpUeI11q5cjWSLTzB0OsB4kv27cypOn+lNLGjapaye4paikHUN0GxgYGBgYvFokS3McW54/vU+BgsV49Dhx32hb3qpSmd8OHQDJNVU7GF68eJGaNWty69YtANzd3Tl69ChlSpex664YLYhv3rxJy5Yt+eMP/QV3Xl5eTJo0iRw5ctChQwdCQkIoX74827dvJ4dPDs3aLzIykh49ejjU4l2SJEaNGsWwYcOc20lPBeQI/j5xlLbtu3Iu8IJThnV1cWHCuLF89vnnSJJLmmhMqsjhtGnZinWbtuhaz9XFhaA758iStRAmJKILMqMqjR0aIy1dfBgYvMzMmjWLo0eP4uPjw9dff42np2dqTyld8bJ9fjt37mTlypW4ubnh5+eHr6+v08ZesWIFhw4dom7durRq1cpp4xqkTWyb4yS76Eax0KXThyxZoS8f1sPNjb+OHqZ0uQpJ264TePL4CQ0aNtAEtJubGwsXLuSDDz6IJYaiRbeqqoSEhNCzZ09WrFihWzRJkoTZbCYiIoJcuXKxefNmKlSooG0jOtWlX79+DnXHbNOmDcuWLcPFxcXpFy+qas11fnznLh92bs/O3fucMq4Qgk4ftmPe3B9xyeClPZdaBF25SP4ixVF0fpeNG9Rm/fZtmCUPm96bCoboNkiMnTt3cuDAASRJokmTJlStWjW1pxQv586dY/Xq1URGRlKuXDnaOKnYOiWxWCxUqFBBu5s5c+ZM6tXT7771qvIyfn6dOnXir7/+AqBLly4MGTLEKePevXuXunXroqoqLi4uHDp0iIwZndMLwyBtkgIdKW0QEo0b6T/4QsPDmT1nLoqqYBUqKUtYWBjdunfTBLcQgq9HfE2bNm0SFEJCCDJkyMDChQsZ+uVQTDoLDhVFISIiApPJxI+zf+T18q9rr6mqyqZNmxwW3FWqVGHu3Lm4uCRPbrwQAkkIvHP4sPaXdQwa+LlTxLGqqixZsZJGTZpw6+YNVMVaUBsdJ045FBRUVq5arVtwAzRr2hRJuKclAx6DJDBr1ixGjBiRZJvQpDB+/HjWrFnD6tWrmThxYoptN5rz588zcOBA9uzZk+iyixYtYuXKlaxdu5aRI0fyLAkOP6lNdPpcNGazOcHl9Xw+rwJ6P7/0gO17cOb7uXXrlqYhIiMjefDggdPGNkj7JP+RIQSN32mLV6bBPH3+XNeq69ZvYPSEcWTOlAVJpGx+95gxY1i3bh1gPaF8/PHHDBo8yCERLYTAbDYzZuwYSpYqSZ8+fQgODta1fVmW+d/4/+H7mi9FixYFrNGvTp06OSS4ixcvzurVq/Hy8tK1Xb2IKOtCz0xZGffttxQrmI8BQ4YR4kBxZ2LsO3CYBvXrs2XDOvIUL40qBK5OmLNjWJv2PAl9ytyfFupe28PDg3febY2LCqpkE99Wo36YjJTudMGUKVNYsGABAA0bNqRmzZopsl1bgR8SEpIi24wmMDCQfv36cf36dW7evJloxDLmxUhwcHC6Sy0wmUyMHj2aY8eO4ePjQ5UqVeJdVu/n8yqg5/NLL/Tt25fChQvj6uqaLu/eGKRNUuByVJA1WzZatGjK0uWrE1/chptBt9iycg0duvREdYGUzDAIDw/XrkZz+ORg6tSpmKOs8xwh+sq/Y8eOFC1alE6dOnH58mVdczh69Ch16tRh1apV5MqVi549ezoURcqUKROLFy0mX958Vu2ImrzpGcIqJM2qRCe/vjSoVZfaTZtxPSjohYc+8+95KlR9i2VLVlCnaSNchASSTcv6ZEOAbGL/5m2cT0K+eoN6tSlUuHD0SIbGTodERESwcOFCu8evAlu3buX69evAq/OeAd577z3ee++9RJd7VT+fxHD080svVKxYkYoVK6b2NAxeMlKoTE3Q+v0WSVrz+9nzsESGkdL36Fu2bKlFtZ88fUJQUJBu4RotvKtVq8a2bduoVq2a7nncvHmT5s2b8/bbb3PlypVEl8+QIQNLly6l6ptVrfNNQbUnBJiECwVLv87mTVsoXrSIU8Z9/OQpzVs2Z/K40ViUSBTCkQlPdq9r1RLJd9/PTlJedevWLW0GivG/QbrAYrGgKGm0YVMyYgjJhDE+HwMDg6SSYt4Qzd55jxw+2XWv9+fxv9i3fydCpOyPX/Xq1bWr3LCwMIecQuJDCEGJEiX49ddfadmypW7x/vDhQ65everQdj7//HOtgY6IsqpLqSJEIQQuqAhJpVzZMuzbsYVmDRs7ZWxFURg95hu+/HwAoU+CsSgmVDV5Cg2tIyqcPPUH+w/9pnv9jBky0KZNGxQR1eE+rXe5tyE9iMykzjG6yMsg/ZMe9lNHeFnehzORZTlZLmxS+rNOrvcRTcyGegbpg5SpdlBBNXnQ8+OujJ04Se+qLF++lLeb1EEVmRCIFLlSEELQtm1bjh49CsDmzZsZPXp0kooSo0Wvp6cnq1evZuTIkYwfP97pB0yPHj0YNXJUqjp9CCGQzQpCFeTJX5w1q9fx6QA/5i9a9MLvV1VVps2czZmzgfiv9sc9axbcFYFqcl6zGYUoUz8lknHjJyRpzp3af4DZLTMKIEXfbEiD+SWyLLN27Vp2797NpUuXePjwIWFhYXh7e5M3b15KlixJ+/btKVGiRGpPFVVVmTVrFgsXLiQiIoJixYoxdOhQKleuHOfyDx8+JCAggAMHDnD58mVu3brFkydP+H975x0fRdHG8e/sXhogARKaiJLQQfClKIgUkS4E6UgLVQkBBQVDR1ApUgQLoAKKCAJSpRcFaSIgCqIgSEekmVBCSbndff+4u+Uu9dITmK+fyO3e3tzu3JbfPPMUVVXJly8fJUuWpFatWrRu3ZqCBQtm8tFIUkJ4eDjr169n7969nDhxguvXrxMdHY2vry8lSpSgdu3atG3blsKF06dmQEayZ88eduzYwYEDB7hy5Qo3b97E09MTf39/qlWrRqNGjXjhhRey9B6eVfzzzz/079+fkydPYhgG+fLlY/jw4QQFBaW4rcjISObPn8++ffv4559/uHHjBpqmUaRIEYoVK0a1atXo3Lkzfn5+6X4cFy5c4PXXX+fEiRMYhoGvry/Dhg3jpZdss/2pHfyfOHGCrVu3snfvXi5cuMD169cxDIMCBQpQvnx56tWrR+vWrfH29k7Pw5GkMxmfMtCOrhucP3WUCpWrcy+FWQC8vDzZ8eM6nnm6AcLu05sZnDx5krJly5oj5P379yf6kE8JhmHw6aefEhoamua2HDRs2JCVK1eSJ0+eBN/P7Ju4YRgIQLePxj//dCYDBw0m1po+9SbLlAxg+YpFlKlcHQ8sKOl1fDoYBhw+vJ9na9UlKjo6RR/38PDgwM87ebJyTQzFQCigpkFxZ5Ql49KlS/Tv35+//vor2W0bNGjAlClT3L6ZR0VFsWPHDnbt2sWpU6cIDw8nb968lC5dmooVK9K2bVt8fHwS/Kyu6wwfPpzff/+doKAgQkNDWbp0KdOnT+fWrVsu21atWpWFCxe6rDtx4gQff/wx27dvd8uylTt3biZNmkSDBg1c1huGwcqVKxk9erS5rk+fPoSGhuLp6elWzvu09EOtWrW4ceMGAI8//jibNm0CbNkO1q5dy+bNmzl16hTR0dF4e3tTpkwZqlSpQnBwMJ6eqQ83Dg8Pp2/fvhw9ehSw9c/atWspWLBgokHkgwYNYsuWLebytm3bKFKkCAB79+5l+fLlHDt2jMjISFRVJSAggIoVKxIcHEyhQoUS3ZfY2FhmzpzJggULks0c4+XlRe/evQkNDU1VPQLDMOjQoQNXrlzB09OTTz75hHLlysXbLjX9A/D7778zfvx4jhw5kuy+lCtXjsmTJ1OqVCm39v3KlSts2LCBX375hRMnTpjnWWBgIN26daN+/fou22uaxpYtW1i+fDl///03t27dIiAggFq1ahESEpKqIFh3+2/NmjXMmTOHRx99lAkTJuDn58e5c+d4++23OXjwYIKC1N/fn3r16jFkyBB8fX2T3ZeffvqJoUOHJpsVxNPTk1deeYX+/fsn+P57773H1q1bEUIwYMAA2rVrl2hbhmGwePFili9fzvHjxxO8b/v5+dGrVy/y5cvHyJEjzfWbNm3i8ccfT7Tta9euMWnSJDZt2pTs88Df359Ro0bRuHHjJLeTZC6Zm6fb9pXoaOiGTovGzdn8/fcpbuGloBdZunoVnsIz0wIqdV2nSZMmfG/f31deeYXPPvsszQL25s2btGjRgt27U+66kBClSpVi27ZtFC9ePF3aSy90QMPAQMOiaaz45ltCB73BfxHpkyLp0aJFWLp0KbWeq4MuBJb0OC900Ayd7l1eZtHSZSn+eI1qVfhx3x488cEQBmRD0X3v3j06dOjAqVOn3P5M/fr1+eijj5LN3rNmzRpmzJjB5cuXE93G39+fAQMG0KFDh3jvHT58mE6dOpnLP/zwA927d+eff/6Jt23JkiVZu3YtYOun999/n4ULF6Z4Gjlv3rymcAKblax9+/aJVnv18vJi3LhxtGzZMtE209oPzqLbz8+PXbt28dNPP/HOO+8kWYW2QoUKfPTRRzz66KOJbpMY8+fP54MPPsCayMC4XLlyfPvtt/HSp8UV3WvXrsVisTBu3Dh+/vnnRL+vQIECTJ06NcFKuZGRkQwYMCDFRcYaNWrE9OnTUyy8Y2Ji+N//7qdnnTFjRjzhktr+2bhxI8OHD0+Rq0Hu3Ln59NNP4wXybdmyhc8//5xSpUoxduxYfvvtN1599dVEradCCD777DNq164N2Pr19ddfZ9++fQluX7RoUWbNmpXiysru9B9Ay5YtOXnSFpjev39/Xn75Zdq3b5/kdeKgRIkSrFixItGBKsDx48fp3Lkz91KQPWvw4MH07t073vpOnTpx+PBhALp06eIilJ2xWq0MGTLE5RpIDFVV8fHx4bZTJrekRPeJEycICQlxq38cCCEYOnQowcHBbn9GkrE4i+5MSqYpUFARQmXkiOFssZc7Twlr121k//7d1Kz5PB6ZZOpWFIXOnTubonv9+vXcuHGD/Pnzp7rNmJgYevbsye7duxFC0K9fP06dOsXmzZtT1V7hwoVZtWpVthPcYPOo8EBg6Cpgod3LXSlZuizNgppz9b//0tz+v5cu06JFEJMnTOTlkD7kUTxsmULSMigScPyP31i6YlVqPsqwoW/ioXigaKBl0xni7777zkVwt2rVipo1a6JpGjdv3uTnn39m//79LtbF7du3s2XLFpo1a5Zgm7quM3HiRBYtWpTs9//333+MHTuW8PBw+vXr5/Le9evXXZaDg4O5ePFigu3Uq1fPfP39998nGHcRGBhIpUqVKFeuHIULF8ZqtXL9+nV2797N7t27MQyDW7duMWXKFCZPngzA7du3+TeJzDvR0dFm9oq4pFc/OBMeHs6LL77oViD10aNHeffdd5k9e3ay28bl3LlziQpKsE3/R0dHJ5uzOCQkhKtXrxIbG5vkdhEREbz11lts2bIlnpAKCwtzEdxFihQhKCiIsmXLmgO/K1eusGDBApffauvWrcyaNYsBAwYk+d1xifs8Suj5lJr+OXToEGFhYS6iuGHDhtSsWdN0bYiOjubAgQOsWLHC3ObOnTsMGjSIVatW4e9vi4WKjY1lzJgx3Lp1i6NHj3L48GEuXbqUpLuCYRhs3ryZ2rVrc/HiRUJCQpIcbF+6dImRI0eydOnSFNWYcKf/wPX6XrBgAcuXL+fKlSsULVqUli1bmq5sp06dYv369S6xTGfPnjULwyXG559/bgpuHx8funXrRqlSpYiOjuby5cvs3r2bI0eOuAzMZ8yYQVBQULxZF+djSEqvjBo1ykVw+/r60qZNG8qVK2fOOkVGRnLgwAHWrVvnIriT4ubNm/EEd6VKlWjQoAFPPPEEYLvfnD59mnnz5pn3a8MwmDx5MqVLl05V8gZJxpKJGextXre1n6tFhXLl+PPYsRR9WjcMRr01kh+2bQMPLzIrEVuzZs3w9fXl5k1bBpPdu3enysfMcdFOmDCB1atXAxAUFMSUyVOIiY2hT58+rFy5MkWDES8vL2bPnp2u5WnTE8evY4pgRVDl6Wc4sGcfXXoEs3vvnjR/x81bt+g/8HVOnDjG+EmT8PD0AUWkeDbEwMBAB11j+PBRST5cEyOgxBM0afIiGIq92LuBMDI3g4w7/PDDD+brp59+mgkTJri836NHD65fv87bb79tDjgBfv3110RF98yZM+MJTR8fHxo1asSzzz5LsWLF+Pfff5k+fTpXrlwBbFXrSpcuTcOGDRPdV4fgrl+/PhUqVMDHxwcfHx/KlCnjYgWM6ybj5+fH+PHjqVu3boLtduvWjdGjR5tCZ+fOnaY1omjRonz//fd8+eWXfPXVV+Zn2rdvT8uWLcmVKxfly5fP1H5wCO4nnniC4OBgKlasSPHixYmIiGD16tVmLnGAHTt2cOjQIRfLozuMHj2aF154gXfffdecWXjkkUeYMmUKuXPnJjAw0K3KeY7f7JFHHqF79+5UrVqVUqVKERsby549e5g4caIpjMLDw/n666959dVXzc8vX76cHTt2mMt169Zl2rRpCX5348aNWbt2LYsWLeLq1asAzJkzh3bt2pkuLulFSvvHarW6CG5VVZk1a1aCud5btmzJ888/z7p160wDTHh4OLNnzzZdnI4dO+biYuUQpF5eXjRs2JCSJUuSL18+IiIiWLNmjTkjsnnzZiIjI9m5cydRUVGULVuW2rVrU6BAAfLkyUNERAR79uzhl19+AWwDt40bN9KiRYt07b+4REZGEhkZybPPPsuHH34YzzWyT58+DB8+3MUgtWvXrkRFt2EYLve2Xr16xXMdcbjUDR06lL///huwudscOnQoVS4ZBw4cYM2aNeZymTJl+PzzzxN0m2rXrh2enp4ug6ukmDBhgovgDg0NpX///gkalerVq8eGDRtYtGgRsbGx5uD/u+++eyjjA7IzmZa9xIHVw2DoW4NS9dlde/axZf0G0HR7kcqMj9wtUqSIS/GD1GYx0TSNBQsWMGmSLTivevXqLFy4EJ9cPuR9JC/ffPMNQ4YMcfsCURSFDz74IGfkRRXYzjTFltL78TKBrN+wjj7B3dLlhmDVNKZ99Ant2rXl2tWLGEbKo9QNdHQjmqNHfmXHztQNBl7t3QefR/LYjlU17MI/+2UnuHTpkvk6MWGWP39+PvroIwYOHGiuS8yf8vDhw3z22WfmshCCLl26sG3bNiZNmsRLL71E9erVadmyJZ07dza3MwzDLYtsjx49mDlzJv3796dXr1506tQp3rS7wxUDbO5WS5cuTVRwO3C2lN+6dctF0BQqVCie9blu3bpUq1YtUcGd0f3Qq1cv1qxZQ6dOnahcuTL58+enZMmSDB48mLZt27psm5RbR2IoikKdOnVcfICLFStmHndKZvieffZZNmzYQGhoKDVr1sTf35+iRYvSrl073n77bZdtnV0dDMNwGUDkypWL9957L1GxX6RIkXh+ubGxsSxevNjtfXWXlPbPhg0bXNyiunfvnmRxpQYNGjBt2jSXwcKKFStMy6jzOe7A39+fr776iilTphASEsLLL79MaGgoq1evNn2zb9++zZYtW4iKimL06NGsWrWKwYMH07NnT9q3b0/fvn358ssvXdx8UnP+pIY8efIwefLkBGORvL29ee+991wE7LVr1xJtKyIiwsWF56mnnkpwu3LlyrF06VKXOA53fMUTYufOneZrIQSTJ09OMk6hRo0abrX777//smHDBnO5UqVKhIaGJvq8fPLJJwkLC6MbGPHgAAAgAElEQVRJkybmupMnT7JnT9oNW5L0JdNFt4rgxVbtCSxRIsWfNQyD0W+PJUbT0DOx5IhzAMX27duJiIhIcRs7d+5kwIABREdH8+ijj7J06VLy5MljpvZTVdXtMtNCCHr37k1ISEimpgRMM04/We58jzBr7mzeGTEKz3QqU79uw2aaNWvG2TP3i9m4OyxTDBU0hf79B3HzdsrLWBctXIS+fUPBHkCKMBBCQeD+FG1m4WzFT+5cdjyQg4OD6dixY4LbfPbZZ+Z0rcViYdq0aYwcOTLBB1lcsXz8+PFko/mTE89gE+adOnVi5MiRLF682C2f5rjVWuMWnkpp6eeM7IcWLVowZMiQRLMntWnTxmU5IR94d0lryeuSJUvy4YcfJpoZonnz5i5Buc6uOvv373dxKahSpYrpXpEUL7zwgjnlDqRbvExCuNs/y5cvd1lOaibDgaIoLr64MTExZgathGIVhg8fTuXKleOt9/b2Nv24HdSpU8clXsIZVVVp1KiRuZxSX/rUUq1atSQziOTOndvtKrBxZyeTurd5e3szY8YMxo8fT79+/ahevbp7OxwHh3862HzOk8v05JjtSo6VK1e63A8aNGjgVpxCx44dyZUrl7ksRXf2I9NFt4IHvr75CO0bkqrP//r7H6z4dgmKyLycuy1atOCxxx4D7qevSgnHjx+nR48e3L59Gw8PD7755htKlCjhkmfz/fffZ+bMmeZyUhkImjdvzowZM3KO2E4AgYKqejPs7THMX7AAby+vdGn3t8N/0qRxU3bv2kEUBvewZSNJFt1g9fIV7P45dQ+b0NB+5PErgK54IOyJLXWw5epOVYsZh7M4Wb9+PfPnz+f06dOJDvpq1KjBsGHDEkytd+XKFRdXgH79+tG0aeK52atWrcq7775r5sEfOHBgsr6j7qSCK168OKNHj6ZLly5uuUCALbOGM2nJ45vR/ZBYhgUHcQOxkvJJz2iCg4MTzaIENoHnLDycZ14cLg4O3LVA+vn5MXToUHPZncFcRhITE8Pvv//uss7dY+nRo4eLy+CxRFwxc+XKlaSQj3u9tm7dOpEtbTgPVDPr/CldunSy2ySV2cOZggULugzmZs2aZc42JHQuqKpK69atee2111Lkv+4gIiKCP/74w1x251j8/PwYNCj5mf64gx53z51q1aq5GEccWXYk2YdM9Om2I1QsAvqG9OOTWbM4eyHxSPzEeOPNITxfpy5FnwjAnlU53XfTmUceeYSgoCBzCnjhwoV069bNrc+Gh4fToUMHLly4gJeXF3PmzKFOnTou0azr16/nnXfeMR/6FStW5Ntvv2XgwIFs27bNRQyUL1+eOXPmJBnBnRNQEKCoGBi0bd+e8oHFaduxK6fdCBZLjpOnz9C8eQs+/OQjuncMBg/FVi4zwXPFti782mXeHPxWqoRX0SJF6P/a6xgKGCjmSNbxbRl/hqaMpk2bsmvXLsCW1m7y5MlMnjwZRVEIDAykRo0a1KxZk5o1ayYrYPft22cOFFVVdeu6aNu2bTx3iMQoXLiwOeBNK4ZhcPv2bf755x9Wr14dL91gWsjIfihYsKDLQCkh4t4PslJwupNW1VkcOe9r3JR6u3btYvfu3Ym6Cji4evWqi2VZ13Vu3LiRIXmY3eGvv/6Kl61k3rx5hISEJCmgrFYr+/bt48SJE+a6xCy25cuXT7JuRNz3KlSokOQ+O1/rmqZx7969DH/OVK1aNd3aUhSFpk2bmjFT58+fZ8iQIYCtL5588knzvla1atVUCW1nPvjgA5e0hO6WjHfH0h33Oli5ciWVKlVKNmHC33//7eLXnppZeUnGkvmi206uR/ISNnAQoUPeTPFnr1z7jzeHDGPRkq8xVAvpVxolYYQQdOrUic8//xxN09i3bx/nzp1L9kFotVrp27eveQG9+eabvNzxZcD2UFAVlQO/HKBz585E2/NBFy5cmGXLllG6dGlWrVrFu+++y9SpU9F1nfz587N48WIKFSqUo63czigKYKhUqv4cWzeto2fPXuzcuz/N7d6KvE2/V0O5dO4f3ggbireniiGigFwuZ4uGAZqV4SNHc+HfS4k3mAR9e/cg1yP5bO7bjiqUOAWSpuVAMoAWLVqwcOHCeBY0Xdc5efIkJ0+eZNGiRXh7e9OiRQs6duyYaLDun3/+ab4uXbp0khbO1DB+/PgUF6SyWq0cOnSIvXv3sn//fv777z9u3rxJZGRkhonRjOyHnDbATktxjrg+u5GRkS5BlikhrW4yaeG/BLIzrVy5kpUrV6a4rcTEYXIWYOdnhKIoyYq9uP0VGRmZoedes2bNeP7559O1zX79+rF161bu3Lnjsj42NpbffvuN3377jdmzZ1OoUCHatWuXpoBb52xClStXpmvXrm59Lrln9+3bt+PNOh45ciTJPOGJkdaBhST9yXT3Eucv7tC9E088njor1rJVK9j5wyYULdZN/4G08fTTT5vTRzdv3kw2UEfTNIYNG8aKFSswDIOePXsyZswYhCIwdAOr1cqZM2fo1q2b6UuaJ08e5s+fb6bFypMnD5MmTWLqlKmULFmSJUuWULly5QdGcIMtp40qQFUMAsuUYvPm9XTs0C5djjEqOoqRY8bQs1tXIm+GYySQMVvVNQ7s3s6CRamzehYtXJjBgwdisUcZJER2+7U8PDyYPn16sg/hqKgoli9fTvv27Xn33XcTTAHnbOnJiMqOCRXYSIqVK1dSt25dgoODmT17NgcPHuTcuXNmRbqMIqP74WEhbgGk1FK2bNlUB8elB+l1HADPPPNMguvjxiQkRe7cuZMVYHHvue7GGKWWlOYCd4fixYszderUZAd+V69eZdasWTRr1iye7727OPuQlylTJt2ey+l57rgbuCnJPLJMdKNCXv9ChA0enKqTVdM0uvcOJfzKVTSs6GhkZKYIb29v2rdvby4ndaE6IvA/+ugjwDaFNmPGDCwWC0IIYq2xGIbB+AnjzWlEVVWZMmUKjRs3jtcfrw98nUOHDpmBLg+S6L6PAah45fbns4Vf8+aAUCzpMEo3gCXLltGo4YucPnEe3SqIseUqQTOsRN66Tbeefc2ZhpQggOGDh+OVpwDCXgpIYGRiiG/qefzxx1myZEm8SoyJsXjx4gR9EZ2DD1MiAtzFXSt3VFQUPXv2ZNSoUfGyPKiqSqlSpXjppZcICwtj9uzZLFmyJF1z2GZ0PzwspMWv3kGxYsXipcHMbNLjOIQQdO3aNVG/bXdjF4BUVZnMaDJqJqJevXp89dVXbon66OhoxowZw/z589P0nUllVUkp6XHugM1QmNJ89ZKMJ+vm3wCLIXjl1RAWL17K7lSkKDr/z0XGvP02n8yeiVAtIFQy0oO2bZu2TJgwAU3T+O233/jzzz+pWLGi6cvpEMM//fQTAwYMIDY2loCAAFasWIGXl5e5na7rrFmzxrSWCyEYMWIEr/R5JcHdVxQl3aftsx+2fIJCgLeiMH7GVMr/rxIDX3uTO3fvprn1fQcP0qhRI5YtXUyFGs+gYmDERjF29ChOnjmbqjbLlS1N7z498cATXVgRprVbwZGXPrsFUTrj5+fHxx9/zMGDB1m2bBnbt2+Pl8HDme3bt/Pzzz+7pBZzDvhNr4dFapg4caJL6jlFUWjSpAlBQUFUr149weunW7du8YIpU0t26YecTkJCsmTJkrRu3ZrixYsnOQgTQuDn50eZMmWSDETPDBI6DlVVadWqFdWrV0/WCu/p6UlgYGCSrg9eKQg+d85o8TBQqVIlli9fzubNm1m1ahUHDhxIsiLo7NmzadWqFfny5XP7O5yNXzt37uTHH39MF3eZxAZTtWrVolGjRvj7+yc5a+FwJQoMDHxADXQ5mywV3UIIVC8vwkaG8dNL7VL1sJo7/2uCuwXzzHO1bbotA8+x8hXK8+STT3L48GF0XWfu3LlMnz4dTdPMk/vIkSO0b9+e2NhYfH19+fzzz3nsscds79sV2LRp03jvvffMm0DLli0ZMWIEihp/4uFhvGgUFHQFuvfoQfmAQHr0CeHv06fT3O7Z8+ep90JDFs6dx0vt27Jr525mz/0iVW0JIXh77DB88trFnKIiTImd3UInk6ZatWpUq1YNwzA4c+YM58+f59atW1y8eJFvvvnGxXXixx9/dBHdzlbdjJ6OToy9e/eybNkyc1lRFD788MNkrfhpqSwbl+zQDw8CBQoUcFkuXrw4y5YtS5OfeFYQ9zjAVlynQ4cO6fYdKRHdDyOqqvLiiy/y4osvEhsby/Hjx7l8+TK3bt3ir7/+YvHixabLWWRkJAcPHnR75g9c7x+GYbBx48Z0Ed158+ZFVVUXd7jmzZszZcqUNLctyXqyzr3EsQNC0KhFS7p0cC+bQVxirVY6B/fg4j8XMIyMde/29PR0KWqxbt067t27h2EYxMbGcufOHXr27MmlS5fw8PBgzpw51K9fH6vViq7r6IbO1q1bGTdunCm4n376aebOnYuXl5eZcztH5d7OACwoeKKiCg+efb4Bmzevo1LFlPn2Jsbde/foFRLCOyPH8krIAO6lUiA1faEOHdu1sQ3yVGyjPWGv/mO/rLKjlVvTNPbv38+6devi+TgLIQgMDOT555+nZcuW9OvXz6XYCxCvJHtgYKD52lFh0R1+//13vvvuu3gBT6nBuQQz2Pwr3Xl4pmR/kyM79MODQFyXgPLly6dIcP/zzz98++23LvmTs4KEXBuqVKni9ud1XeeHH35g48aNibq+ZbU1P7tx9+5dtmzZkmBhH0f2koYNG9KmTRtGjBhhZjZxEPfelhzdu3d3OTfd9cW+efNmku873OGcSWl12cOHD7NixQoXg4kke5DlotsmTBSGjQojfyoDX86cO0dov1Bio++R0VKnS5cu5hTn6dOnOXDgAJqmoWkaU6ZM4dChQyiKwujRo3nppZeIjY1FURR0XWfPnj2E9Asxxc7jxR9n0cJFFChQ4KEW2XERKLY/YXPTKB5Ymu+3b6FVi+bp0v6NyFuMmzKRk6dSZz339/Nj8pT3QeQFoWRLcZ0YPXv2pEePHoSFhdG1a9dkfRErVKjgUmQjrvuJc2GO48ePu+RcToxjx47RuXNnhg8fzssvv5zCI4iPc3EVcC+vN9jcwNKL7NAPDwJxC70cPHjQ7ZmDpUuX0rx5c8aOHUunTp2ydCCTN29eSsQpAOfu+RYeHk7nzp157bXXGDx4MHPnzk1wu5xm/c9IwsPDadKkCYMGDaJXr168/fbbCQZ+O9OxY0cXN5+kXOsSokaNGjz33HPmsjtxQZqmsWrVqmS3i5si0103OE3TGD16NJ06dWL06NEMHjzYrc9JMo8sF90C8ADKV3yKUSNGpLqd9Zs2M378u1iJwdAzTgYVK1bMDMDSdd30y3aU4gXo2rUrgwcPRlEUhBAYhsG9e/fo27evWW3N29ubxUsWE1hS+l0ljK1PhBCoQsXf/zGWLF1K2MBBqG5U5spIQl59hYr/q4EhFAwBhl12xw2gzG6/qmEYLgU7Dh8+TPv27Tl/Pulc+c5FM+I+6KtWrWpm69A0jUGDBiXpOwmwevVq05Xs7Nmzac4qEtc/NrnvB1uKvxUrVrisS+4hndRDNTv0Q0aQmgDjtPDCCy+4+LSGh4fz4YcfJvu5mTNnMm7cOPM3VBQlU1ItJtU/QUFBLsuffvppspVCz58/T5cuXVyu08R8fKV7yX0uXLjgYtVdtmwZr7zySpIDNm9vbxcXkdQMYpo3b276V58+fTrZa3jPnj1s3rw52Xbjnjvbtm1zyb+dEPfu3aN///4u97WUBNtKMocsF91gKw0v8KB//9eokkwRhMQwDIP3Jkxm06p1GerYbRgGIU7VNNesWcM777xjlnhv2LAh06ZNw2KxmAVwIiMjqVu3rpmpxNPTky+//JKaNWo+lILbMAx0XcdqtWK1Ws2ZAk3TzHWOap1mkCrg4ZOL0R9MZPbMD/HJIivPk+XKMSwszLZHwrALbsefHftidstiIoSIV8Dh6tWr9OzZM0mLt/PDLK4VWVVVF5erI0eOMHbs2HglmR0cP36cpUuXmsvPPfdcmnPJxi0Tff78efO8SYiTJ08SEhIS7wEZN+tJXJYsWZLoNtmhHzKCM2fOsGnTpkz7Ph8fH5d+BJtBY/r06QkOimJjYxk2bBgzZ850WV+lShW3ymanlaT6p0OHDi5ZQ27evEmfPn0SrRJ48OBBOnXqFG8QnFjRFelecp9y5crFC5bev38/r7/+eqKxYpqmubh6uDtD5kzTpk1p3tw2A3v16lXGj7dlJEvouv/333/56quv3Gq3WrVq8VxK3nrrLTZs2JDg9leuXKFbt27s3LnTZX1ixYcuXLjAF198wcaNGxO9R0kyhmwhuh145PZh5sczU22hMAyDPiGhnD950nahZUAWASEEjRo3MkfIly5dYsqUKRiGwRNPPMEXX3xhBlU5LNxvvPGGS4WpoUOH0rZtW4Ty8PlvO8Q1hk2oWCwWVFV1+XO44+ia7c+BALyEhR6vhLBi6bcUzORqc16ennw840O88+ZFNwwMEUdsJ0B2+2XDwsLiWT8uXbrExIkTuXnzpvn7REZGcuzYMT799FO2b99ublupUqV4bfbq1YsyZcqYy6tXr6Zt27asXr3aFOzXr19nyZIlBAcHmxZgb29vwsLC0nxMTZs2JSAgwFy+ePEi06dPj+fPeP78eT799FM6dOiQoK+jc4EbIJ5o++WXX6hTpw7BwcEu5Z8dZHU/pBdxj/vNN9+kXr16TJs2LcnBTHoRGhrq0o8Ac+bMoUOHDqxfv56//vqLc+fOsWjRIjp16sSaNWtctlVVlddeey3D9s/d/vHz82PUqFEu254/f56OHTsybdo09u7dy7///suePXsYP348vXr14vr16y7bN2jQIMFrDpK3Yjqn5HMnPV/cQV9Oei55e3szbNiweOt3797NggULuHv3LoZhq49x/fp1Dh48yPDhw136O7F+Tg7nWgJLliyhVatW1KlTh/3792O1WgkPD2fo0KE0bNgwRdmSxo8f7/IbR0VFMWTIEAYOHMj27ds5c+YMf/zxBzNnzqRjx47xBnNFixZN0G1N0zS6du3K1KlTGTx4cLpW5pUkT5ZmL3HGcat6tsazvNGvHxM/+CBVvrJXr13jpbat2bB1LQULPU7Katm5h7+/P40bN2bp0qXmhVykSBHWr19P4cKFbTdlw+Z+MnLkSJeTOjg4mNGjR6e4yl5OxxFs6hDaSeE8ENF1HU3TzAeCBQVDgQYtmvLjjo20b9eNo38dz/D9B+jbqwfP169PLJp9MkWY1S2Fy9lqf1hlwyQmZcuWZdq0aQwePNjF53XTpk3JWjQfffRRmjZtGm+9I2i4V69enDp1CrCVIx5hdxeLG4nvWDdmzBiXAERHWw6EEG6JBW9vb6ZPn07v3r1NcTt37lzmzp1runiBa7nx1157jccee4xhw4aZQmnGjBk0btzYTNPm7e1NkSJFuHz5svk5TdP45ZdfWLBgAZMnT86wfkip4Im7fVoEU1xfZLDlIZ43bx7t2rWLV4k3Nd+d1DZeXl58+eWX9O/fn0OHDpnrjx8/zltvvZVkux4eHgwfPjzRCqrpQUr6JygoiNjYWBfXF03TmDdvHvPmzUvyeypVqsTYsWPN5biiOLnc287XkjuuE3HdVTJi5sV5n9x9Brr7mTZt2nD58mVmzZrlYt2ePHlyvGs1Lg0aNEi2wnRitG7dmrVr17pU+L158yY9evQw3UuTIrFjCggIYP78+fTr18+lwunWrVvZunVrkm36+/szderUBAdm165dc5nZjFuZWJKxZBtLtzkVrwjGjBpD9aopi9Z15vCRP+jSIZioO3czLKOJc6Eci8XCp59+SkBAAIqwFaUXQvDN4m+YPXu2uV2tWrWYPn36Qym4HcLZ+UbuWO9wKXG4mjjfME3Lt2nxtgldC4LHKzzF9h930KJpswy3ypQtXZr3xr4HQtgCPIXjpBJO/xmOVffFdjaMsqxbty6bN2+mS5cubqXN8/HxoWnTpnz11VeJ5osvWLAgy5cvN8WsM85Cs3DhwrRs2ZLly5fTqlWreO089dRTZk7hatWquT3rVaZMGVavXk2fPn1s16HdGukYtDn2oVChQgwePJh+/foRFBTE+PHjTUHi5eUV79oMCwtLUHw4+7lnRD8ULVrUfF28ePFkj9/Hxwc/p5kfdz6TGC1atIgX0Ag24ZZQKjznfc2TJ49b55Rz3yRUzjx//vwsXLiQ999/n6effjrZe6afnx+tWrVi6dKlqQpKdcy4OUjqvEtp/7Rp04ZNmzbRqVOnZEuOq6pKlSpVCAsL45tvvnH5TZ0rnaqqmqD4d8ZZcLlT58F5e0VREjyWxHC3/2rVqgXYhKbjdXI888wzZtvOgYsJERoaysqVK6lfv75bAw1/f3969uyZoCh3PoakzgdfX19WrFjBzp07GTlyZLxnnIPGjRuzcuVKwsLCzPtTQECAy/UTl4oVK7Jp0yYGDhxI2bJlk33OBQQE0LNnT1avXp1otpwiRYqYVn1FUahfv36SbUrSF6Hr7kUdZsZUk4FNy1jR+fvIz9R8rjG3bqc+Av2VHj2Y/skMLLl98cBASUezY1RUFGXLljX97+bNm2f6IlpUC7t27aJFUAvu2gu7BAQEsHPnzngP4ocBRx5zx59DWCtCQVHtwaa6zT/auYCQoijmzcnh321awQ3DPqDSibVGMWLIMGbMnJkhGtfby4s9O37gyeq1sCgOtxIA2wDr/shVB3uJHFN3p9HanRnT+eHh4Zw/f97FZ1ZVVTw9PfHz86Nw4cIptnpdvnyZq1evmoFMHh4eBAYGulWaOyoqijNnzlC2bNlU++VGRUVx6tQp05qfJ08eihcvnqB1MCYmhtOnTxMQEJBgcNrZs2fZunUrly9fxsPDgyeeeILWrVu79VBPbT9ERkZy4sQJFEWhXLlybg0+IiIiOHPmDBaLhQoVKqRpcK9pGps2beLYsWPcvXsXX19fGjZsmKAF2Wq18ueffxIbG0uJEiXw9/dPtv2oqCj++usvNE2jVKlSyfZHVFQUly9f5saNG6ZbjoeHB3nz5sXX1xc/P780P6NOnTpFREQEnp6eVKpUKclzLyX9E5dr164RHh7O7du30XUdIQS5c+cmb968+Pn5Jfpba5rGpEmTuHDhArVq1SI4ODjJ7zl58iQzZ84kOjqaoKAgmjVrluT2mqbxzjvvcOXKFZ566in69euX7LE4427/nThxgqJFi6aoSuaNGzf477//4qXSSwrDMLh48SKXL182DTlCCFRVxdvbm0KFCiV5rl69epVz586Z16C7QYlXr17lwoUL5iBbCEH+/PkJDAw0++Ty5ctcu3aNChUqpOjeeuvWLa5du8aNGzfM56qXlxe+vr7ky5fPrfsr2H7rP/74g8KFCyc7EJSkHYd2gWwmuh3o6AirlTXLVhP8Sm9u3bmdqnaEEIS9OZB3J0yxTVPb7wHpdSQjR440yw3Xq1eP77//HsMwOHnyJE2aNDFTmfn6+rLmuzXUrlM7U4J7shO6piOU+z3usDxaLBZ0XXcR0s5TcYqimELb0WeaptlErllEyEAnBtAhxsLsj6czdMw47t67l277L4Rgwuh3GTpsGJqnglAMJyu3k+g2AGET3Ybd5q3cN4anmswQ3RKJRCKRSDKGbC+6wQDDZv0cPPA1pseJTE8po8Le4p2JE0Go6ZrY5OzZszz55JPcuXMHHx8fDh8+jK+vL02aNDF9EVVV5ZtvvqFNmzaoqpqjglPSA82qoVpsI3mH/7tDcAMugtuBYRjxxLpDkDuLcPvWtj9DQdOtbNvyAx07v8yNZAoQuEurFs35dslKPLw8QBX2FIE2zL2IewWl408sRbdEIpFIJDkXZ9GdTc2uAgQYKox8bxRPPVkhTa1NmDqVkWFvYNizZqSXD0Lx4sVp2LAhYMuRuXjxYnr16mUKbkVRmDp1Km1at3noxLYD3bjvn63rOqqimuLZMQhxuJyY6QGFMIW643OO9Y7p2Pt/CkKooAh0VaV+k8Zs2/wDBfLlS/O+ly4ZwOwvPkH1UjHM9IA2MkNwSyQSiUQieXDIpqLbhkCQP18hFiz4mgL5Uy+idN3g/Q8+YdyYMRgxsaAZqbIgOgL/TJ9kRaF///6moJ44cSLr1683t+/atSv9+/dHtagPnVsJ3PfLdkYowgyqdOTrjomJMV1NrFarGTTp8PV2tOXo54R+OwPQhUAX8P22LWm2dD+SJw8L5n9FofyPYgBWAbrdyp2g4HZ6XyKRSCQSiSQu2VoJCkBBoXKVKsz9bDaqmvrd1Q2DdydNZMSotzAMq00hpRCHNdYaa8XQbQKxatWq5LNbVZ2rXzVp0oTPP//cDJJ42PJxAy6p/hyi2tk9xDGI8fT0xMPDwwyc1HTtvsgW9y3cjika59zdjpkLRQePWCvTJoxl2MiR6GlwyxBC8P7EcTxTsyag2lxK4grqBOrhJLBaIpFIJBKJBMjmotuBjiCofXsmjBuXJouxYRhMmvoho0eOwqpZibU17tbnrFbrffcGRZhuE7ly5YoXsR4YGMgXX3yBl5fXQym2EyOuhdowDDPDgqNCpUOUO0d+x8N5lQEaBtFWK1MmTmL02+PTJLgBhgx6nT59Q0BREaqCUBRUIexhk9xX1cL13+xWgVIikUgkEkn2IUeIbgGohsqbYcPo8nLHNLc3fspkegd3JfLmDaz2HkhKpjncJKyxVpdiGwKBh8WDbt26mdvmy5ePFStWUKhQIds2D7ngdvbTNv817r/nnCLQUQjFuc8cWUwc600XE6fvuHcjnKGDBzDi7TGJlvx1lxbNGjJ2xGiweGAoAoRAsQtuBafEJQ6Eyz9SeEskEolEIkmQbJq9JA72OXurAlrkHZoHvcgPO3amudn69eqxdNly/P390AX3LZlxcOTDdOQxdvgjq4oKAiHqIGoAABFLSURBVK5cuUKpUqWIiYlh2bJltAxqaZZ4f5ixWq0uGVtiY2PNzCUOMa3rOqqqmv9qVs30+3ZYwR0WcA8PD3RNt50OqoKqw7X/rtEjOJiNm5OupugOtZ99lk0bVpE7V340iwDF4npOxPHhzoyCkzJ7iUQikUgkOZcckDIwcTTd4Ob1s9St14w//0x7+e//Va7MgvmzKV+lOhY8zfUOlxLHa1VREYrAarXaqk4K53zR0KpVK2rXrs0bb7xhWsOzS59lFQ4/bIdft6ZptuqSdtEthDAFtaN/HX7gVqsVDw8PF9cehzhXFAVdGPx95Ajde/Zh/8Ff0ryvgQEl2Lt7NwULF0UYOoYChqLeL6gUN2jSaTEjp4uk6JZIJBKJJOeSg0W3gdWIRdU0zv5znsYNm3Hy1Jk0t1rY349Fi76kfqPmCBSEsFWpc1i0AQzdHgAoEg6KdFhxnddnjz7LOhz5tp3T/2mahiJswZIYmLm4ndMIOotyXddNK7gQAk3XURTYumE9vfu8ysXLV9K8n489WpStm7+nTMky6F4xqHhiS+iuuLjDmKZtKbolEolEIpG4QQ7I050YAovwANWbYo+XYf3mFRQvVjTNrV75L5wXW7Rl4rvvEa3Hmn7BVqv1fo5oRcSrnuj85+np6WLhftgFN9gHJ4pwEY5CCGKtsS7vOfrVMchx9J9DcDs+FxMTg0YUH0+fQqt2HdNFcHt5ejDzo8mULVMOvFUUxcsWQClUm2NJHAu3sw+3Qo67gCQSiUQikWQROczSbcMAYoEYrJw+fIgWzV/iwsV/06Xt4PZtmDN/AYqnF4YBhqFhYAumc7hAZKe+yO440gI60gE6rwPX88rhWuLseqLbZxiEMLh86RKDBvZn+cq16bJvRQr6s3b5Mqo89ywCC9jdYFyEdBYXv5GWbolEIpFIci452L3kPrq9VDx6LL8f3svzLwRx8+atNLcrhKBbUBCDh4+kQrWq6ModMCwoeD2UZdzTA4fF2ll4O3Cxgjsqkdqt35oBhq4jNJ2ffthKyBuD+Ovvk+myT/4F8rFm9RJq1GpsqzapGCioxC0wb9uvuAuZhxTdEolEIpHkXHKwe8l9FAQ2d2APyj1Vg53b1xNQ4ok0t2sYBgvWrKFBsyas/vpLLPcEqlU1gwElKUcIYWYr0axavJLvjj8DWzaTWHsAq1AEUZERjBvzFi+0bJlugvuJx4qxccNKKj1XB6tioCs6ialpWexGIpFIJBJJepBjLd0OdMOWO1mg8ffx47zYvAUnz6Q9uBLA2+JB7WdqMnz0SGo3fAEPRUEIxR5kJ0kJZkCq3YrtKIIjhM2vW7dqqAbEqKApKhZD5+CeXfTu249jf6U9S42Dx4sVZ/3qlZT7XxVQBYYw7L7ZwpaJOwvSAiaFtHRLJBKJRJJzeSDcS+Jh6MQSzd9nTtGmWRuOn/jb7Y8KkrZmqqpKr+5dGDt6DIWLl7C7SAipvVOI84kHuJR2t60XxMbEcOdWBOPGjWX2nC+IiYlNt+8vGVCC9avWEVixrM19W6gI+y9vC5qM84Nm0e/rPAsgRbdEIpFIJDmXB8K9JB4CVKFTIqAsGzeu4rlnnkm3pjVNY84XC6hc/Rk+mj6d6DvRGDpoSNeDlBB34CaEAEVBFwo6gnvR0SxZtJAnK1fhw5mfpavgfrpKVTZsXEvpJ0uDoqMLm21bJFQQKQH9nZk4BiOGe+NhiUQikUgkOYAHx9JtR9c1DGEl5m4U/QcMYP78hQkK4+Ss24khgFo1azHu7RE827ABnhZvLGnb5YcaKwaxeiwHd+5izJh3+HH3rnS37rZo3owlC5findcHTdHBEChC5X7pG92uskWm5uBODF3XsVqtWCy2MyunXHsSiUQikUhceTAt3XZsAXkK3l65+Pzzzxg3aoQpXpwxAMW5kI2b7RvAnp9/onHzlrRq3IwDu3ZhGFabgL//P0miGKAb6IaBgc6xQ4fp0DyI5xs0ZvuunekquBVFYeBrffl66dfkyp0bw+63rQo1zu/tlIA7O2DvAkdFVIlEIpFIJDmfB87SbeabMAx03Wb5XvLN14QOGETk7duATWzr6STuLBaVtq1a8NbQ4VR96mmEqjyAQ5n0wQAMA0SsztGjR5g4eSLfrVnH7Tt30v27cuXKxXtjR/H666+jeHgihIou4L7A1l2dS5wiJrM6eFLTNAzdwMAwc8NLJBKJRCLJeTyYgZTxMOzFbQyE0PntwD669ejN0WPHUYVAs4tu59dpQRGCoBebMui1QdR6vh6eXl7xxFtWi7mswPmYrTGxHNy7l6kzprHyu7XpNvCJS6mAEnz5xTxq1aljyzaDQChA4lm4sw2OwkGGYUufaLFY4uU2l0gkEolEkjN4SER3/CwQ165eYc4HH3L860UcvXuL327dQkC6iG4HihBUrlSJNwcOonWHlnjnyY9iKGamk5zXiynH0ZuGAbGGhvXeTdat3szcOZ+xY88eMw93eiOEoGfnLoyb9B6FihVDQUWI+7ZtYQ4BEvsVsl6IOwIoHTnLZUEmiUQikUhyLg+N6I6LoevoWgzRfx5lSMhAZu/bnaHfV+Lxx2jfrjUDQgbxWIknwENNxPNE50HySTEAdLh49hzTP5rM4iXLuXTlaoZ+Z768eXl71HAG9O+P8PbBEAJwDHZsTiSKWeomob52LoOTtb+Fs7Vbim6JRCKRSHIuD6/oxkAzDBTN4NzJP+nQqTu/HDqU4d+bJ1dunqr8JCEhvWnerBn5C/ijKx5YFYGKrTiLsP8/x2AAOuiqk4w1dG5cvcSmrZuYM/dr9h84wJ27dzN8V56qUJEF8+dR4X/VsKCiWwy76HbYte+/TtqanfWWbgcyP7dEIpFIJDmfh1Z0O9ANHYNY7ty9ywdTJzPl/Q+5e+9epnx37lw+vPD887Rt2ZZmLRpSqEBBDG8VhIddeOcMDEDXNDB0/j13gZ07drNy7Qp+3LGDiOs3M2UfvL28GDQwhOFhYeR9pACG4mWrFuoyfjHiZOJOytqd/ZDiWyKRSCSSnIsU3RiAhm7oYOj88duv9AsdxM/7D2Tqfvh4e1OxXHlatw7ihecbUOOZZxFeFgwEVrt2VLCVuc/MkuTm99jPDB3smT9A0TX06JscOvgna9dv5Ke9P7P755+Iio7OhD27z/8qP8Vnn31C9aefQVMMLLoALLY9V5yrhSYUzipFt0QikUgkkoznoRfd99MK2hcF3LsbyeyPZjB09HtZkh/ZYrFQtmQpSpcqSd06taj01P94+unq5PF9BFQVIRQEimkNj1tSPb0w7PmzDXS78Da4e+M2e3/+iVMnT7Jh8xb++usYZ89fINaqpfv3J4ciBCOGvMmwYaPInS8fhmKgoYNh2Py2DcWWsSRe1zj7bIMU3RKJRCKRSDIaKbpdsImxaEC3alw+c55xY0fz9eIlGZbSzl0URaFo4YLUe64mpcuUpkjxEtSo9gyFChakSOGiqBYFLIqTWdphG0+ABMty2vKZo+vExli5du0qN25c5/CRw5w5c5ITR49x4NfDHP/7FJquJ9BA5qEIQbu2LzHxvSk8EVAS3QIWu/XfUbJdoCMMJYlzNatrTaYcKbolEolEIsm5SNHtjJPrBth1qG6wafVa3hwxmL9OnMzKvYuHAHx8fCjk74/FYsHiaeGFOs8hLAp5vHMTWLwEj/gWIFeu3JhHZRdu96LvcenSJU5fuACaFV3X2PXzz9y7d4+Y6Fgirkdw5+7dbFdTs0zJAD6a8hENWzRFeDjEss3u7zoUMOwZSnKGoHYHKbolEolEIsm5SNGdBDpg6LZ4vGj9LovmzmHCxA84c+58Vu/aQ8djjz7KiLCB9O7TF9UrN6BgWGxi2zGgcKopaffVN1Ck6JZIJBKJRJINkKI7CVws3gKEoXM7IpKvvv6MqTM+5uy5f7J0/x4GihUtwhsDQ+jTqx++/v7o2KqG6kJBEQaqmQJQd8lMYispgxTdEolEIpFIsgVSdKcAW54TUHUrt+/c4usvv+L9qdM4f+FiVu/aA0eBfPkYOCCU194cTN48udEtAovhgaHYZyCcspnb/uI6lyBFt0QikUgkkmyDFN0pxApYDLAKULFy+/Z1vv1mER98MIujx//O6t3L0QghqP7U/+jcpQPBPYPxze9PrOKBhwGa0PA0VAwh4oVAuha6saGb7z8456oU3RKJRCKR5Fyk6E4T91Pq3bt7hx83/8DcuXNZt3krVi3zU+jlVBQhaFS/HiGv9qVpy2Z4eHiAagGh4giEtIlr23nnENQOKzfgkoI7+xRxT1+k6JZIJBKJJOciRXcaMf2+NdAUULBy7sTffDJrNstWreb8hQtZun/ZmWJFi9L2pZd4/fVXCChTGaFYQItFUwyEoqLY8484u5JAnALtcerd5MwM3O4hRbdEIpFIJDkXKbrTHR10HV3XuHsvhu1bv2fenM9Y//0PWVJoJzshhEBVVRrWrUv3Ht15sWUL8ubODwibcFZAw8AQhj3LuJKgVdtFZ9sXEsscLkW3RCKRSCSS7IAU3emOvcgMBggNw7Alr4u+c5dDP//KVwvms2zdBiKuX8/qHc008uXNS/26tXhrwEBq1HoWkcsTFAsYCsJQbRs5FbcxHFlJ7FljHCI7nuh2MnlL0S2RSCQSiSQ7I0V3huBwcnD0k5NcNHTCw6+xc9tWdmzbycq167l4+Qp6Fld5TE8UIShSuBAN69enRfNm1K//Av4F/dAtniCU+8GNcc82p9XOZ1jcZReSfPPBQopuiUQikUhyLlJ0ZwGGXW3qmgbWWA79+ivbtv3Ivn37+fXwIc5euJCjBJYQgsDHn6DikxVo0qAO1Z6pRvVna4LhgaqpoCigKOhCB6E+UNbnzCQnnRMSiUQikUhckaI7C9ENW7VLsAsqTSP63l2u/HuBHT/t5uAvB/nt1985fvIUERERaNnAGq4oCn7581OhXFkCSgZQt1Y96tSoSbHAx/HM5Q1CoCiKWSMSDZvotruNiHiZsxPMRSJJACm6JRKJRCLJuUjRnY0wDAPD0NGxEis0hFDxtBoYsTpHjx0l4noEB375hUvnz3P46DFuRERw6M9j6Lqe7oJMVRSq/e8pCvsXpFTJkhR6tAiBgYGUK12WihXKo+byRgMECpqhgWELfhRCIIRDVisYhsAwvWz0OKL7Qc41kv5I0S2RSCQSSc5Fiu5shoGBFR0FA9VwrBP2ojC2TNWKYQA6hqZx7+5d0HUiwsM5feYsETduolmtoBtcu3qVw0eP3Q/sNMDZoqyqCk9VroR/QX8URcE3b24eL16cgoUKo6gWcuXJjaKoGJqBYVEwMFAMENhN9HZ/asMQdpcZYbfc3//XEQzpOJL72bad1zmQ51VSSNEtkUgkEknORYrubEnqowNt1nIDYTh+p7guKYpNBBuAsAlgQ8St6piZv+9DFAmZRqTolkgkEokk5+Isui1ZvC8Sk9SLUJt7h3AyICsgDLsjh22lYc+L7dDeCjhZwdNIipuQglsikUgkEsnDhRTdDxLC9YXNqcQ1WNFIcHuJRCKRSCQSSUYiRfcDS8KKWupsiUQikUgkkszHbdEtfUslEolEIpFIJJLUIfO1SSQSiUQikUgkGYwU3RKJRCKRSCQSSQYjRbdEIpFIJBKJRJLBSNEtkUgkEolEIpFkMFJ0SyQSiUQikUgkGYwU3RKJRCKRSCQSSQYjRbdEIpFIJBKJRJLBSNEtkUgkEolEIpFkMFJ0SyQSiUQikUgkGYwU3RKJRCKRSCQSSQYjRbdEIpFIJBKJRJLBSNEtkUgkEolEIpFkMFJ0SyQSiUQikUgkGYwU3RKJRCKRSCQSSQYjRbdEIpFIJBKJRJLBSNEtkUgkEolEIpFkMFJ0SyQSiUQikUgkGYwU3RKJRCKRSCQSSQYjRbdEIpFIJBKJRJLB/B9TZHac4MgfygAAAABJRU5ErkJggg==
-"""
-
-def extract_amazon_order_numbers(text):
-    """
-    Extract Amazon order numbers using the same pattern as Java code.
-    Pattern: XXX-XXXXXXX-XXXXXXX (3 digits - 7 digits - 7 digits)
-    """
-    if not text:
-        return []
-    
-    # Nettoyage comme dans le code Java
-    if "List of orders with error in label purchase" in text:
-        text = text[:text.index("List of orders with error in label purchase")]
-    
-    # Pattern Amazon exact du code Java: ^([0-9]){3}-([0-9]){7}-([0-9]){7}
-    pattern = re.compile(r'^([0-9]{3})-([0-9]{7})-([0-9]{7})', re.MULTILINE)
-    
-    order_numbers = []
-    for line in text.split('\n'):
-        line = line.strip()
-        match = pattern.match(line)
-        if match:
-            order_number = match.group(0)
-            order_numbers.append(order_number)
-    
-    return order_numbers
-
-def get_amazon_image_path():
-    """Decode base64 image and save to temp file"""
-    img_data = base64.b64decode(CAUTION_IMAGE_AMZ_BASE64.strip())
-    temp_file = tempfile.NamedTemporaryFile(delete=False, suffix='.png')
-    temp_file.write(img_data)
-    temp_file.close()
-    return temp_file.name
-
-def create_amazon_overlay(width, height, image_path, order_number, count=1):
-    """
-    Create an overlay page with Amazon caution image and order number.
-    Similar to create_overlay_page but for Amazon format.
-    If count > 1, displays *count before the order number.
-    """
-    packet = io.BytesIO()
-    can = canvas.Canvas(packet, pagesize=(width, height))
-    
-    # Image calculations (top-right positioning)
-    try:
-        img = ImageReader(image_path)
-        img_width, img_height = img.getSize()
-        
-        # Scale for Amazon image
-        scale = 0.375
-        
-        # Position in top-right corner
-        x_img = width - (img_width * scale) -8
-        y_img = height - (img_height * scale) -328
-        
-        # Draw image
-        can.drawImage(img, x_img, y_img, 
-                     width=img_width * scale, 
-                     height=img_height * scale, 
-                     mask='auto')
-    except Exception as e:
-        print(f"Error adding image: {e}")
-    
-    # Add order number text with count prefix if needed
-    can.setFont("Helvetica-Bold", 8)
-    if count > 1:
-        text = f"Customer Reference: {order_number} *{count}"
-    else:
-        text = f"Customer Reference: {order_number}"
-    can.drawString(15, height-318, text)
-    
-    can.save()
-    packet.seek(0)
-    return PyPDF2.PdfReader(packet).pages[0]
-
-def analyze_amazon_guide(guide_path, log_callback):
-    """
-    Analyze Amazon guide PDF and extract order sequence.
-    Returns: (guide_sequence, guide_counts)
-    """
-    guide_sequence = []
-    all_found_ids = []
-    
-    log_callback(f"📋 Reading Amazon Guide: {guide_path}")
-    
-    with open(guide_path, "rb") as guide_file:
-        reader = PyPDF2.PdfReader(guide_file)
-        
-        for page in reader.pages:
-            text = page.extract_text() or ""
-            
-            # Extract Amazon order numbers
-            orders = extract_amazon_order_numbers(text)
-            
-            for order in orders:
-                log_callback(f"   {order} found in guide")
-                all_found_ids.append(order)
-                if order not in guide_sequence:
-                    guide_sequence.append(order)
-    
-    guide_counts = Counter(all_found_ids)
-    log_callback(f"ℹ️  Total unique orders in guide: {len(guide_sequence)}")
-    log_callback(f"ℹ️  Total orders (with duplicates): {len(all_found_ids)}")
-    
-    # Afficher les doublons
-    duplicates = [order for order, count in guide_counts.items() if count > 1]
-    if duplicates:
-        log_callback(f"⚠️  Duplicated orders in guide: {duplicates}")
-    
-    return guide_sequence, guide_counts
-
-def analyze_amazon_labels(input_pdf_paths, log_callback):
-    """
-    Analyze Amazon label PDFs and extract order mapping.
-    Amazon labels have a "List of orders" page at the end with IDs in order of appearance.
-    Returns: (labels_mapping, pdf_readers) - labels_mapping maps order_id -> (reader_idx, page_idx)
-    """
-    labels_mapping = {}
-    pdf_readers = []
-    
-    for file_idx, input_pdf_path in enumerate(input_pdf_paths, 1):
-        log_callback(f"📦 Reading Amazon Labels {file_idx}/{len(input_pdf_paths)}: {input_pdf_path}")
-        
-        # Keep file open and store reader
-        f = open(input_pdf_path, "rb")
-        reader = PyPDF2.PdfReader(f)
-        pdf_readers.append((f, reader))
-        
-        # Find ALL "List of orders" pages and extract IDs in order
-        # The list can span multiple pages, so we need to read all of them
-        order_ids_in_file = []
-        list_page_found = False
-        
-        for page_idx in range(len(reader.pages)):
-            page = reader.pages[page_idx]
-            text = page.extract_text() or ""
-            
-            # Check if this page contains order IDs (list page or continuation)
-            # Criteria: contains "List of orders" OR "successful label purchase" OR has Amazon ID pattern
-            has_list_header = "List of orders" in text or "successful label purchase" in text
-            has_amazon_ids = re.search(r'\d{3}-\d{7}-\d{7}', text) is not None
-            
-            if has_list_header or (has_amazon_ids and list_page_found):
-                log_callback(f"   📋 Found order list page (file {file_idx}, page {page_idx + 1})")
-                # Extract order IDs from this page
-                page_ids = extract_amazon_order_numbers(text)
-                if page_ids:
-                    order_ids_in_file.extend(page_ids)
-                    log_callback(f"   ✓ Extracted {len(page_ids)} order IDs from this page (total: {len(order_ids_in_file)})")
-                    list_page_found = True
-            elif list_page_found:
-                # We've found list pages before, but this page doesn't have IDs
-                # This means we've reached the end of the list
-                break
-        
-        if not list_page_found:
-            log_callback(f"   ⚠️  WARNING: No 'List of orders' page found in file {file_idx}")
-            continue
-        
-        # Map each order ID to its corresponding page (ID at position N = page N)
-        for idx, order_id in enumerate(order_ids_in_file):
-            if idx < len(reader.pages):
-                # Check that this page is not the summary page
-                page = reader.pages[idx]
-                page_text = page.extract_text() or ""
-                if "List of orders" not in page_text:
-                    labels_mapping[order_id] = (file_idx - 1, idx)
-                    log_callback(f"   ✓ {order_id} → page {idx + 1}")
-    
-    log_callback(f"ℹ️  Total orders mapped: {len(labels_mapping)}")
-    
-    return labels_mapping, pdf_readers
-
-def process_amazon_files(guide_path, input_pdf_paths, output_path, log_callback):
+def process_amazon_files(guide_path, input_pdf_paths, output_path, log_callback, dry_run=False,
+                         profile=False, memory=False, part_orders=None, optimize=False, fuzzy_distance=None):
     """
     Process Amazon guide and up to 5 label files using Java application logic.
-    
+    The guide format, "List of orders" page mapping and overlay layout come
+    from the "amazon" courier (see couriers.py).
+
     Args:
         guide_path: Path to Amazon guide PDF
         input_pdf_paths: List of 1-5 input PDF paths
         output_path: Output file path
         log_callback: Function to log messages
+        dry_run: Only check the guide against the labels (match report, no PDF)
+        profile: Save a cProfile of the run next to the output (see profiling.py)
+        memory: Record the memory use of each stage in the run report (see memory_trace.py)
+        part_orders: Also write ready-to-print parts of this many orders while the PDF is built
+        optimize: Shrink the output PDF after writing it (see pdf_optimizer.py)
+        fuzzy_distance: Also match labels whose ID differs by this many digits (listed in the run report)
     """
-    pdf_readers = []
     try:
         log_callback("🚀 STARTING AMAZON PROCESSING...")
         log_callback(f"📊 Processing {len(input_pdf_paths)} label file(s)")
-        
-        # STEP 1: Analyze Guide
-        guide_sequence, guide_counts = analyze_amazon_guide(guide_path, log_callback)
-        
-        # STEP 2: Analyze Labels (up to 5 files) - Extract ID->page mapping
-        labels_mapping, pdf_readers = analyze_amazon_labels(input_pdf_paths, log_callback)
-        
-        # STEP 3: Generate sorted PDF with Amazon image overlay
-        log_callback("💾 Generating sorted PDF with Amazon caution image...")
-        writer = PyPDF2.PdfWriter()
-        
-        # Get Amazon image path
-        image_path = get_amazon_image_path()
-        
-        missing_orders = []
-        processed_orders = set()
-        
-        # Match guide order with label pages using ID mapping
-        for order in guide_sequence:
-            if order in labels_mapping:
-                log_callback(f"✅ MATCH: {order}")
-                
-                reader_idx, page_idx = labels_mapping[order]
-                _, reader = pdf_readers[reader_idx]
-                page = reader.pages[page_idx]
-                
-                count = guide_counts[order]
-                
-                # Create overlay with Amazon image, order number and count
-                overlay = create_amazon_overlay(
-                    float(page.mediabox.width),
-                    float(page.mediabox.height),
-                    image_path,
-                    order,
-                    count
-                )
-                
-                # Merge using temporary writer for Adobe compatibility
-                temp_writer = PyPDF2.PdfWriter()
-                temp_writer.add_page(page)
-                temp_writer.pages[0].merge_page(overlay)
-                
-                # Add merged page to final writer
-                writer.add_page(temp_writer.pages[0])
-                processed_orders.add(order)
-            else:
-                log_callback(f"❌ MISSING: {order}")
-                missing_orders.append(order)
-        
-        # Add extra labels not in guide
-        for order, (reader_idx, page_idx) in labels_mapping.items():
-            if order not in processed_orders:
-                log_callback(f"➕ EXTRA: {order}")
-                
-                _, reader = pdf_readers[reader_idx]
-                page = reader.pages[page_idx]
-                
-                # Create overlay with count=1 for extras
-                overlay = create_amazon_overlay(
-                    float(page.mediabox.width),
-                    float(page.mediabox.height),
-                    image_path,
-                    order,
-                    1
-                )
-                
-                # Merge using temporary writer for Adobe compatibility
-                temp_writer = PyPDF2.PdfWriter()
-                temp_writer.add_page(page)
-                temp_writer.pages[0].merge_page(overlay)
-                
-                # Add merged page to final writer
-                writer.add_page(temp_writer.pages[0])
-        
-        # Write output
-        with open(output_path, "wb") as f_out:
-            writer.write(f_out)
-        
+
+        with profiled_run(output_path, log_callback, profile, [guide_path, *input_pdf_paths]) as profiler, \
+                OrderLedger() as ledger, memory_tracking(memory) as stage_memory:
+            result = run_job("amazon", guide_path, input_pdf_paths, output_path, log_callback,
+                             parallel=profiler is None, ledger=ledger, dry_run=dry_run,
+                             cache=JobCache() if profiler is None else None, memory=stage_memory,
+                             part_orders=part_orders, optimize=optimize, fuzzy_distance=fuzzy_distance)
+
         # Final report
         log_callback("-" * 50)
         log_callback(f"✅ Processing complete!")
-        log_callback(f"📄 Output: {output_path}")
-        log_callback(f"📊 Orders in guide: {len(guide_sequence)}")
-        log_callback(f"📦 Labels found: {len(labels_mapping)}")
-        log_callback(f"✓ Matched: {len(processed_orders)}")
-        log_callback(f"✗ Missing: {len(missing_orders)}")
-        
-        if missing_orders:
-            log_callback(f"⚠️  Missing orders: {missing_orders}")
-        
+        if dry_run:
+            log_callback(format_report(result["report"]))
+            log_callback(f"📄 Report: {result['report_paths'][1]}")
+        else:
+            log_callback(f"📄 Output: {output_path}")
+        log_callback(f"📊 Orders in guide: {len(result['guide'])}")
+        log_callback(f"📦 Labels found: {len(result['labels_db'])}")
+        log_callback(f"✓ Matched: {len(result['matched'])}")
+        log_callback(f"✗ Missing: {len(result['missing'])}")
+        if result["from_ledger"]:
+            log_callback(f"📚 Recovered from earlier files: {len(result['from_ledger'])}")
+        if memory and not dry_run:
+            log_callback("🧠 Memory per stage:")
+            for line in format_memory(result["report"]["memory"]):
+                log_callback(line)
+
+        for match in result["report"].get("fuzzy_matches", ()):
+            log_callback(f"⚠️  FUZZY: {match['order']} → {match['label']} (check this label)")
+
+        if result["missing"]:
+            log_callback(f"⚠️  Missing orders: {result['missing']}")
+
         return True
-        
+
     except Exception as e:
         log_callback(f"🚨 ERROR: {str(e)}")
         import traceback
         log_callback(traceback.format_exc())
         return False
-    finally:
-        # Close all PDF files
-        for f, _ in pdf_readers:
-            try:
-                f.close()
-            except:
-                pass
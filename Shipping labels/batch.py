@@ -0,0 +1,169 @@
+"""Batch runner: many sort jobs from one manifest, in one set of warm processes.
+
+    python batch.py morning.json [--workers N]
+
+The manifest is a JSON (or YAML, with PyYAML installed) list of jobs, or
+{"jobs": [...]}. Paths are relative to the manifest:
+
+    [
+      {"name": "Shop A", "flow": "temu", "guide": "a/guide.pdf",
+       "labels": ["a/temu.pdf", "a/evri.pdf"]},
+      {"name": "Shop B", "flow": "amazon", "guide": "b/orders.csv",
+       "labels": ["b/labels.pdf"], "output": "b/sorted.pdf", "dry_run": true}
+    ]
+
+Each worker process imports the engine once and keeps its warm caches
+(decoded caution images, rendered overlay templates) from one job to the
+next, instead of paying the start-up of a new GUI launch per shop. Jobs
+use the same order ledger and job cache as the GUI. A combined summary is
+printed and saved as <manifest>_summary.json / .txt.
+"""
+import argparse
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from assets import get_image
+from couriers import flow_couriers
+from job_cache import JobCache
+from label_engine import run_job
+from ledger import OrderLedger
+
+FLOWS = ("temu", "amazon", "temu_fulfilment")
+# Output name when a job has no "output" (next to its first label file, like the GUI)
+OUTPUT_NAMES = {"temu": "Temu_Sorted_Labels.pdf", "amazon": "Amazon_Sorted_Labels.pdf",
+                "temu_fulfilment": "output_sorted.pdf"}
+
+def load_manifest(manifest_path):
+    """List of job dicts with absolute paths. Raises ValueError on a malformed job."""
+    with open(manifest_path, encoding="utf-8") as f:
+        if manifest_path.lower().endswith((".yaml", ".yml")):
+            try:
+                import yaml
+            except ImportError:
+                raise ImportError("Reading a YAML manifest requires PyYAML (pip install pyyaml)")
+            data = yaml.safe_load(f)
+        else:
+            data = json.load(f)
+    jobs = data["jobs"] if isinstance(data, dict) else data
+
+    base = os.path.dirname(os.path.abspath(manifest_path))
+    resolve = lambda path: os.path.join(base, os.path.expanduser(path))
+    loaded = []
+    for number, job in enumerate(jobs, 1):
+        flow = job.get("flow", "temu")
+        if flow not in FLOWS:
+            raise ValueError(f"Job {number}: unknown flow {flow!r} (expected one of {', '.join(FLOWS)})")
+        if not job.get("guide") or not job.get("labels"):
+            raise ValueError(f"Job {number}: 'guide' and 'labels' are required")
+        labels = [resolve(path) for path in job["labels"]]
+        name = job.get("name", f"job {number}")
+        output = job.get("output")
+        if output:
+            output = resolve(output)
+        else:
+            output = os.path.join(os.path.dirname(labels[0]), OUTPUT_NAMES[flow])
+        loaded.append({"name": name, "flow": flow, "guide": resolve(job["guide"]), "labels": labels,
+                       "output": output, "dry_run": bool(job.get("dry_run", False))})
+
+    outputs = [job["output"] for job in loaded if not job["dry_run"]]
+    if len(set(outputs)) != len(outputs):
+        raise ValueError("Several jobs write the same output file: give them an 'output'")
+    return loaded
+
+def warm_up():
+    """Worker initializer: decode the caution images once for all the jobs of this process."""
+    for flow in FLOWS:
+        for courier in flow_couriers(flow):
+            get_image(courier.layout.image)
+
+def run_manifest_job(job):
+    """Run one manifest job. Returns (summary dict, log lines); errors are reported, not raised."""
+    logs = []
+    summary = {"name": job["name"], "flow": job["flow"], "output": job["output"], "error": None}
+    start = time.perf_counter()
+    try:
+        # The batch already runs one job per process: scan each job in its own worker
+        with OrderLedger() as ledger:
+            result = run_job(job["flow"], job["guide"], job["labels"], job["output"], logs.append,
+                             parallel=False, ledger=ledger, dry_run=job["dry_run"], cache=JobCache())
+        summary.update({
+            "orders": len(result["guide"]),
+            "labels": len(result["labels_db"]),
+            "matched": len(result["matched"]),
+            "missing": result["missing"],
+            "extras": result["extras"],
+            "from_ledger": result["from_ledger"],
+            "report": result["report_paths"][1] if result["report_paths"] else None,
+        })
+    except Exception as e:
+        summary["error"] = f"{type(e).__name__}: {e}"
+        logs.append(f"🚨 ERROR: {e}")
+    summary["seconds"] = round(time.perf_counter() - start, 2)
+    return summary, logs
+
+def run_batch(jobs, log_callback, max_workers=None):
+    """Run the jobs in a process pool. Returns the job summaries, in manifest order."""
+    max_workers = max(1, min(max_workers or os.cpu_count() or 1, len(jobs)))
+    summaries = [None] * len(jobs)
+
+    def collect(idx, summary, logs):
+        summaries[idx] = summary
+        log_callback(f"📦 [{summary['name']}] done in {summary['seconds']} s")
+        for line in logs:
+            log_callback(f"   [{summary['name']}] {line}")
+
+    try:
+        with ProcessPoolExecutor(max_workers=max_workers, initializer=warm_up) as pool:
+            futures = [pool.submit(run_manifest_job, job) for job in jobs]
+            for idx, future in enumerate(futures):
+                collect(idx, *future.result())
+    except BrokenProcessPool:
+        log_callback("⚠️  Worker processes unavailable, running the jobs here...")
+        warm_up()
+        for idx, job in enumerate(jobs):
+            if summaries[idx] is None:
+                collect(idx, *run_manifest_job(job))
+    return summaries
+
+def format_summary(summaries, elapsed):
+    lines = [f"{'job':<20}{'flow':<17}{'orders':>7}{'matched':>9}{'missing':>9}{'extras':>8}{'sec':>8}  output"]
+    for s in summaries:
+        if s["error"]:
+            lines.append(f"{s['name']:<20}{s['flow']:<17}{'FAILED':>41}  {s['error']}")
+            continue
+        lines.append(f"{s['name']:<20}{s['flow']:<17}{s['orders']:>7}{s['matched']:>9}{len(s['missing']):>9}"
+                     f"{len(s['extras']):>8}{s['seconds']:>8.2f}  {s['report'] or s['output']}")
+    failed = sum(1 for s in summaries if s["error"])
+    missing = sum(len(s["missing"]) for s in summaries if not s["error"])
+    lines.append(f"{len(summaries)} jobs in {elapsed:.1f} s, {failed} failed, {missing} orders missing")
+    for s in summaries:
+        if not s["error"] and s["missing"]:
+            lines.append(f"❌ [{s['name']}] MISSING: {', '.join(s['missing'])}")
+    return "\n".join(lines) + "\n"
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("manifest")
+    parser.add_argument("--workers", type=int, default=None, help="worker processes (default: one per CPU)")
+    args = parser.parse_args()
+
+    jobs = load_manifest(args.manifest)
+    print(f"🚀 {len(jobs)} jobs from {os.path.basename(args.manifest)}")
+    start = time.perf_counter()
+    summaries = run_batch(jobs, print, args.workers)
+    text = format_summary(summaries, time.perf_counter() - start)
+    print("-" * 50)
+    print(text, end="")
+
+    base = os.path.splitext(args.manifest)[0] + "_summary"
+    with open(base + ".json", "w", encoding="utf-8") as f_json:
+        json.dump(summaries, f_json, indent=1, ensure_ascii=False)
+    with open(base + ".txt", "w", encoding="utf-8") as f_text:
+        f_text.write(text)
+    print(f"📄 Summary: {base}.txt")
+
+
+if __name__ == "__main__":
+    main()
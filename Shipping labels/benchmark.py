@@ -0,0 +1,244 @@
+"""Engine benchmarks on real label files.
+
+    python benchmark.py stamp "../data/Evri Shipping Labels.pdf"
+    python benchmark.py text "../data/Evri Shipping Labels.pdf" ../example/4.pdf
+    python benchmark.py fuzzy --labels 50000
+    python benchmark.py backends ../example/4.pdf "../example/Temu _ Manage orders (1).pdf" --flow temu --save
+"""
+import argparse
+import io
+import os
+import random
+import tempfile
+import time
+import PyPDF2
+from reportlab.pdfgen import canvas
+from assets import get_image, get_print_image
+from couriers import get_courier
+from fuzzy_index import BKTree, edit_distance
+from label_engine import run_job
+from pdf_backends import REFERENCE_BACKEND, available_backends, get_backend, save_default_backend
+from stamping import OverlayStamper
+from text_extraction import PageTextCache, extract_page_text
+
+
+def open_label_reader(input_pdf_path):
+    """Open a label PDF from RAM with the reference (PyPDF2) backend."""
+    return get_backend(REFERENCE_BACKEND).open(input_pdf_path)
+
+
+def create_overlay_page(width, height, layout, text_id, count):
+    """Build a one-page PDF with the caution image and the order text for `layout`.
+
+    This is the old merge_page() path, kept here as the baseline of
+    `benchmark.py stamp`; the PyPDF2 backend uses OverlayStamper from stamping.py.
+    """
+    packet = io.BytesIO()
+    can = canvas.Canvas(packet, pagesize=(width, height))
+
+    # Image Calculations (Top-Right Positioning)
+    try:
+        img = get_image(layout.image)
+        x_img, y_img, draw_width, draw_height, y_text = layout.place(width, height, *img.getSize())
+        can.drawImage(get_print_image(layout.image, draw_width, draw_height),
+                      x_img, y_img, width=draw_width, height=draw_height, mask='auto')
+
+        display_text = layout.display_text(text_id, count)
+        if display_text:  # Only draw text if there's something to show
+            can.setFont("Helvetica-Bold", layout.font_size)
+            can.drawString(layout.text_x, y_text, display_text)
+
+    except Exception as e:
+        print(f"⚠️ Image/Position Error: {e}")
+
+    can.save()
+    packet.seek(0)
+    return PyPDF2.PdfReader(packet).pages[0]
+
+
+def _label_pages(paths):
+    for path in paths:
+        reader = open_label_reader(path)
+        for page in reader.pages:
+            yield page, float(page.mediabox[2]), float(page.mediabox[3])
+
+
+def bench_stamp(paths, courier_name="evri"):
+    """merge_page() overlay vs Form XObject stamp: per-page cost and output size."""
+    layout = get_courier(courier_name).layout
+    results = {}
+
+    for mode in ("merge_page", "xobject"):
+        writer = PyPDF2.PdfWriter()
+        stamper = OverlayStamper(writer)
+        pages = 0
+        start = time.perf_counter()
+        for page, w, h in _label_pages(paths):
+            text = layout.display_text(f"PO-210-{pages:017d}", 1)
+            if mode == "merge_page":
+                page.merge_page(create_overlay_page(w, h, layout, f"PO-210-{pages:017d}", 1))
+                writer.add_page(page)
+            else:
+                stamper.stamp(writer.add_page(page), w, h, layout, text)
+            pages += 1
+        elapsed = time.perf_counter() - start
+
+        fd, out_path = tempfile.mkstemp(suffix=".pdf")
+        with os.fdopen(fd, "wb") as f_out:
+            writer.write(f_out)
+        size = os.path.getsize(out_path)
+        os.remove(out_path)
+        results[mode] = (pages, elapsed, size)
+
+    print(f"{'mode':<12}{'pages':>7}{'ms/page':>10}{'output KB':>12}")
+    for mode, (pages, elapsed, size) in results.items():
+        print(f"{mode:<12}{pages:>7}{elapsed * 1000 / max(pages, 1):>10.1f}{size / 1024:>12.0f}")
+    return results
+
+
+def bench_text(paths, rounds=3):
+    """page.extract_text() vs PageTextCache (shared font cache): pages/sec and hit rate."""
+    results = {}
+    for mode in ("extract_text", "font_cache"):
+        pages = 0
+        best = None
+        for rnd in range(rounds):
+            round_pages = 0
+            start = time.perf_counter()
+            for path in paths:
+                reader = open_label_reader(path)
+                if mode == "extract_text":
+                    for page in reader.pages:
+                        extract_page_text(page)
+                else:
+                    page_text = PageTextCache(reader)
+                    for idx in range(len(reader.pages)):
+                        page_text(idx)
+                    if rnd == 0:
+                        print(f"   {os.path.basename(path)}: {page_text.font_cache.summary()}")
+                round_pages += len(reader.pages)
+            elapsed = time.perf_counter() - start
+            best = elapsed if best is None else min(best, elapsed)
+            pages = round_pages
+        results[mode] = (pages, best)
+
+    print(f"{'mode':<14}{'pages':>7}{'pages/s':>10}")
+    for mode, (pages, elapsed) in results.items():
+        print(f"{mode:<14}{pages:>7}{pages / elapsed:>10.1f}")
+    base, cached = (pages / elapsed for pages, elapsed in results.values())
+    print(f"gain: x{cached / base:.2f}")
+    return results
+
+
+def bench_fuzzy(n_labels, n_queries=200, max_distance=1, seed=0):
+    """BK-tree lookup vs brute-force edit distance over synthetic 20-digit Temu IDs."""
+    rng = random.Random(seed)
+    labels = [f"210{rng.randrange(10 ** 16, 10 ** 17)}" for _ in range(n_labels)]
+    queries = []
+    for digits in rng.sample(labels, n_queries):
+        i = rng.randrange(len(digits))
+        queries.append(digits[:i] + str((int(digits[i]) + 1) % 10) + digits[i + 1:])
+
+    start = time.perf_counter()
+    tree = BKTree()
+    for row, digits in enumerate(labels):
+        tree.add(digits, row)
+    build = time.perf_counter() - start
+
+    start = time.perf_counter()
+    tree_hits = [[row for d, _, rows in tree.search(q, max_distance) for row in rows] for q in queries]
+    tree_time = time.perf_counter() - start
+
+    brute_queries = queries[:20]
+    start = time.perf_counter()
+    brute_hits = [[row for row, digits in enumerate(labels) if edit_distance(q, digits) <= max_distance]
+                  for q in brute_queries]
+    brute_time = time.perf_counter() - start
+
+    assert brute_hits == [sorted(hits) for hits in tree_hits[:len(brute_queries)]]
+    print(f"labels: {n_labels}  tree build: {build:.2f} s")
+    print(f"{'mode':<12}{'ms/query':>10}")
+    print(f"{'bk_tree':<12}{tree_time * 1000 / len(queries):>10.2f}")
+    print(f"{'brute_force':<12}{brute_time * 1000 / len(brute_queries):>10.2f}")
+    return build, tree_time / len(queries), brute_time / len(brute_queries)
+
+
+def _output_pages(path):
+    """Normalized text of each page of an output PDF (read with the reference reader)."""
+    return [" ".join(extract_page_text(page).split()) for page in open_label_reader(path).pages]
+
+
+def bench_backends(guide_path, label_paths, flow, rounds=3, save=False):
+    """Full job on each available backend: time, and output checked against the reference backend.
+
+    A backend passes when it matches the same orders and its output pages
+    carry the same text as the reference output. Returns the fastest passing backend.
+    """
+    results = {}
+    golden = None
+    backends = [REFERENCE_BACKEND] + [name for name in available_backends() if name != REFERENCE_BACKEND]
+    for name in backends:
+        fd, out_path = tempfile.mkstemp(suffix=".pdf")
+        os.close(fd)
+        best = None
+        for _ in range(rounds):
+            start = time.perf_counter()
+            result = run_job(flow, guide_path, label_paths, out_path, lambda message: None,
+                             parallel=False, backend=name)
+            elapsed = time.perf_counter() - start
+            best = elapsed if best is None else min(best, elapsed)
+        output = (result["matched"], result["missing"], result["extras"], _output_pages(out_path))
+        size = os.path.getsize(out_path)
+        os.remove(out_path)
+        if golden is None:
+            golden = output
+        results[name] = (best, size, output == golden)
+
+    print(f"{'backend':<10}{'seconds':>9}{'output KB':>12}  golden")
+    for name, (elapsed, size, passed) in results.items():
+        print(f"{name:<10}{elapsed:>9.2f}{size / 1024:>12.0f}  {'ok' if passed else 'FAIL'}")
+    fastest = min((name for name, (_, _, passed) in results.items() if passed), key=lambda name: results[name][0])
+    print(f"fastest passing backend: {fastest}")
+    if save:
+        save_default_backend(fastest)
+        print("saved as the default backend")
+    return fastest
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    sub = parser.add_subparsers(dest="bench", required=True)
+
+    p = sub.add_parser("stamp", help="merge_page overlay vs Form XObject stamp")
+    p.add_argument("labels", nargs="+")
+    p.add_argument("--courier", default="evri")
+
+    p = sub.add_parser("text", help="text extraction with and without the font cache")
+    p.add_argument("pdfs", nargs="+")
+    p.add_argument("--rounds", type=int, default=3)
+
+    p = sub.add_parser("fuzzy", help="BK-tree vs brute-force fuzzy ID lookup (synthetic IDs)")
+    p.add_argument("--labels", type=int, default=50000)
+    p.add_argument("--queries", type=int, default=200)
+    p.add_argument("--distance", type=int, default=1)
+
+    p = sub.add_parser("backends", help="full job on each PDF backend, checked against the reference output")
+    p.add_argument("guide")
+    p.add_argument("labels", nargs="+")
+    p.add_argument("--flow", default="temu")
+    p.add_argument("--rounds", type=int, default=3)
+    p.add_argument("--save", action="store_true", help="make the fastest passing backend the default")
+
+    args = parser.parse_args()
+    if args.bench == "stamp":
+        bench_stamp(args.labels, args.courier)
+    elif args.bench == "text":
+        bench_text(args.pdfs, args.rounds)
+    elif args.bench == "fuzzy":
+        bench_fuzzy(args.labels, args.queries, args.distance)
+    elif args.bench == "backends":
+        bench_backends(args.guide, args.labels, args.flow, args.rounds, args.save)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,422 @@
+"""Courier plug-in registry.
+
+Each courier declares how to recognise one of its label pages (detector),
+how to read the order ID from a page (ID extractor), how to read the guide
+and where the caution image / order number go on the label (overlay layout).
+The shared engine in `label_engine.py` only talks to couriers through this
+registry, so every flow (Temu/Evri, Royal Mail, Amazon, Temu-Fulfilment)
+runs through the same scan / match / overlay code.
+"""
+import re
+from collections import Counter
+
+# ------------------ ID HELPERS ------------------
+
+def normalize_id(id_text):
+    """ Cleans the ID. Keeps A-Z, 0-9, and hyphens. Uppercases. """
+    if not id_text: return None
+    return re.sub(r"[^A-Z0-9-]", "", id_text.upper())
+
+def extract_ids_from_guide(text):
+    if not text: return []
+    # Broad search for numeric patterns in guide
+    return re.findall(r"\d+[\d-]+\d+", text)
+
+def column_ids(fragments, pattern, tolerance=6.0):
+    """Order IDs of the guide's order-number column.
+
+    `fragments` are the (x, y, text) runs of one guide page. Every run
+    holding `pattern` is a candidate cell; the column is the x position
+    shared by most candidates (within `tolerance` points), so dates, phone
+    numbers or quantities printed elsewhere on the page are left out.
+    """
+    cells = [(round(x / tolerance), match.group(0))
+             for x, y, text in fragments for match in pattern.finditer(text)]
+    if not cells:
+        return []
+    column = Counter(bucket for bucket, _ in cells).most_common(1)[0][0]
+    return [raw_id for bucket, raw_id in cells if abs(bucket - column) <= 1]
+
+def extract_one_id_from_label_text(text):
+    if not text: return None
+    # 1. Standard PO | 2. Long Format
+    pattern = r"(?i)PO[\s-]*\d+[\d-]*|\d{4}-\d{10,}"
+    match = re.search(pattern, text)
+    if match:
+        result = match.group(0)
+        # Filter out invalid short IDs like PO9 (from postal codes like "PO9 5FH")
+        digits = re.sub(r"[^0-9]", "", result)
+        if len(digits) >= 8:  # Valid IDs should have at least 8 digits
+            return result
+    else :
+        pattern = r"\d{4}\s*/\s*\d{10}"
+        match = re.search(pattern, text)
+        if match:
+            result = match.group(0)
+            digits = result.split("/ ")[1]
+            if len(digits) >= 8:  # Valid IDs should have at least 8 digits
+                return result
+    return None
+
+def extract_amazon_order_numbers(text):
+    """
+    Extract Amazon order numbers using the same pattern as Java code.
+    Pattern: XXX-XXXXXXX-XXXXXXX (3 digits - 7 digits - 7 digits)
+    """
+    if not text:
+        return []
+
+    # Nettoyage comme dans le code Java
+    if "List of orders with error in label purchase" in text:
+        text = text[:text.index("List of orders with error in label purchase")]
+
+    # Pattern Amazon exact du code Java: ^([0-9]){3}-([0-9]){7}-([0-9]){7}
+    pattern = re.compile(r'^([0-9]{3})-([0-9]{7})-([0-9]{7})', re.MULTILINE)
+
+    order_numbers = []
+    for line in text.split('\n'):
+        line = line.strip()
+        match = pattern.match(line)
+        if match:
+            order_number = match.group(0)
+            order_numbers.append(order_number)
+
+    return order_numbers
+
+# ------------------ OVERLAY LAYOUT ------------------
+
+class OverlayLayout:
+    """Where the caution image and the order text are stamped on a label.
+
+    The image is anchored top-right: its lower-left corner is at
+    (width - img_w*scale - img_right, height - img_h*scale - img_top).
+    The text baseline is at text_x and either `text_dy` above the image
+    (text_anchor="image") or `text_dy` from the top edge of the page
+    (text_anchor="top", text_dy is then negative).
+    """
+    __slots__ = ("image", "scale", "img_right", "img_top", "text_x", "text_dy",
+                 "text_anchor", "font_size", "text_format", "count_format")
+
+    def __init__(self, image, scale, img_right, img_top, text_x, text_dy,
+                 text_anchor="image", font_size=11, text_format="{id}", count_format=" *{count}"):
+        self.image = image
+        self.scale = scale
+        self.img_right = img_right
+        self.img_top = img_top
+        self.text_x = text_x
+        self.text_dy = text_dy
+        self.text_anchor = text_anchor
+        self.font_size = font_size
+        self.text_format = text_format
+        self.count_format = count_format
+
+    def place(self, width, height, img_width, img_height):
+        """Returns (x_img, y_img, draw_width, draw_height, y_text) on a width x height page."""
+        draw_width = img_width * self.scale
+        draw_height = img_height * self.scale
+        x_img = width - draw_width - self.img_right
+        y_img = height - draw_height - self.img_top
+        if self.text_anchor == "image":
+            y_text = y_img + self.text_dy
+        else:
+            y_text = height + self.text_dy
+        return x_img, y_img, draw_width, draw_height, y_text
+
+    def display_text(self, text_id, count):
+        text = self.text_format.format(id=text_id)
+        if count > 1:
+            text += self.count_format.format(count=count)
+        return text
+
+# ------------------ COURIERS ------------------
+
+class Courier:
+    """Base courier: a label page is recognised by one of `markers` in its text.
+
+    Subclasses override the class attributes (or the methods) to describe
+    their own label format. `flow` groups the couriers that can appear in
+    the same job (they share the guide format and matching rules).
+    """
+    name = None
+    flow = None
+    display_name = None
+    markers = ()
+    layout = None
+    # Look for the ID on the following (metadata) page first, and always
+    # consume that page once an ID is found
+    id_on_next_page = False
+    # Allow first/last digits matching when the exact ID is not found
+    flexible_match = False
+    # Digit edits (wrong / dropped / extra digit) allowed by the fuzzy matcher, 0 = off.
+    # Off by default: a fuzzy match may put a label on the wrong order (run_job(fuzzy_distance=...) opts in)
+    fuzzy_max_distance = 0
+    # Keep pages that are not labels (appended at the end of the output)
+    keep_unlabelled_pages = False
+    # scan_reader can scan a page range on its own (sharded scans split files by pages)
+    page_range_scan = True
+    # Part of the page that holds the order ID: (x0, y0, x1, y1) in fractions
+    # of the page, origin bottom-left. None = search the whole page.
+    id_region = None
+    # Shape of an order ID in the guide's order-number column
+    guide_id_pattern = re.compile(r"(?:PO-?)?\d{3}-\d{10,}")
+    # Header of the order-number column in CSV/XLSX exports (lowercase)
+    guide_id_headers = ("order id", "order number", "purchase order id", "po number", "po")
+
+    def __reduce__(self):
+        # Pickle by name so worker processes hand back the registry instances
+        return get_courier, (self.name,)
+
+    def detect(self, text):
+        """True if `text` (one page) belongs to this courier."""
+        return any(marker in text for marker in self.markers)
+
+    def is_label(self, text):
+        """True if a page detected as this courier is a label page."""
+        return self.detect(text)
+
+    def extract_id(self, text):
+        return extract_one_id_from_label_text(text)
+
+    def read_id(self, page_text, idx):
+        """ID of page `idx`, searched in `id_region` first, then in the whole page."""
+        if self.id_region is not None:
+            raw_id = self.extract_id(page_text.region(idx, self.id_region))
+            if raw_id:
+                return raw_id
+        return self.extract_id(page_text(idx))
+
+    def guide_raw_ids(self, text, fragments=None):
+        """Raw IDs of one guide page: its order-number column when the text
+        positions are known, else a broad search of the whole text."""
+        if fragments:
+            ids = column_ids(fragments, self.guide_id_pattern)
+            if ids:
+                return ids
+        return extract_ids_from_guide(text)
+
+    def extract_guide_ids(self, text, fragments=None):
+        """Return the clean guide IDs found in one guide page (in order, duplicates kept)."""
+        return self.clean_guide_ids(self.guide_raw_ids(text, fragments))
+
+    def clean_guide_ids(self, raw_ids):
+        """Clean raw guide IDs (from a guide page or an export column), dropping the invalid ones."""
+        ids = []
+        for raw_id in raw_ids:
+            clean = normalize_id(raw_id)
+            if clean and len(clean) > 5:
+                # Logic to add PO- prefix if missing
+                if not clean.startswith("PO"):
+                    clean = "PO-" + clean
+                ids.append(clean)
+        return ids
+
+    def scan_reader(self, page_text, couriers, log_callback, start=0, stop=None):
+        """Yield (page_idx, raw_id, courier) for each page of an open label file.
+
+        `page_text` is the file's page-text cache (from the PDF backend):
+        page_text(idx) returns the extracted text of a page,
+        page_text.region(idx, region) the text of one region of it and
+        page_text.page_count the number of pages.
+        The courier is detected page by page among `couriers`, so a file
+        mixing Royal Mail and Evri labels gets the right layout on each page.
+        Pages that are not labels, or whose ID is unreadable, are yielded
+        with raw_id=None.
+        Only pages start..stop-1 are scanned (the ID page of the last label
+        may be page stop). The generator returns the index of the next page
+        to scan: stop, or stop + 1 when page stop was used as an ID page.
+        """
+        num_pages = page_text.page_count
+        stop = num_pages if stop is None else min(stop, num_pages)
+        i = start
+        while i < stop:
+            text = page_text(i)
+            courier = detect_courier(text, couriers)
+            if not courier.is_label(text):
+                yield i, None, courier
+                i += 1
+                continue
+
+            offsets = (1, 0) if courier.id_on_next_page else (0, 1)
+            raw_id, used = None, 0
+            for offset in offsets:
+                if i + offset < num_pages:
+                    raw_id = courier.read_id(page_text, i + offset)
+                    if raw_id:
+                        used = offset
+                        break
+
+            yield i, raw_id, courier
+            if raw_id and (used or courier.id_on_next_page):
+                i += 1
+            i += 1
+        return i
+
+
+COURIERS = {}
+
+def register_courier(cls):
+    """Class decorator: add a courier to the registry (registration order = detection order)."""
+    COURIERS[cls.name] = cls()
+    return cls
+
+def get_courier(name):
+    return COURIERS[name]
+
+def flow_couriers(flow):
+    """Couriers of a flow, in detection order."""
+    return [c for c in COURIERS.values() if c.flow == flow]
+
+def detect_courier(text, couriers):
+    """First courier whose detector matches `text`; the last one is the default."""
+    for courier in couriers:
+        if courier.detect(text):
+            return courier
+    return couriers[-1]
+
+
+@register_courier
+class RoyalMailCourier(Courier):
+    name = "royal_mail"
+    flow = "temu"
+    display_name = "RM"
+    flexible_match = True
+    # For RM: only show *count if > 1
+    layout = OverlayLayout("caution", 0.06, 20, 335, 158, 63, font_size=9,
+                           text_format="", count_format="*{count}")
+
+    def detect(self, text):
+        return "royal mail" in text.lower()
+
+    def is_label(self, text):
+        # Every Royal Mail page is a label
+        return True
+
+
+@register_courier
+class EvriCourier(Courier):
+    name = "evri"
+    flow = "temu"
+    display_name = "Evri"
+    markers = ("TEMU", "Evri", "Fulfilment")
+    flexible_match = True
+    # "Purchase Order ID" block at the top of the packing slip page
+    id_region = (0.0, 0.75, 0.75, 0.92)
+    layout = OverlayLayout("caution", 0.07, 20, 30, 15, 88, font_size=11)
+
+
+@register_courier
+class AmazonCourier(Courier):
+    name = "amazon"
+    flow = "amazon"
+    display_name = "Amazon"
+    markers = ("List of orders", "successful label purchase")
+    layout = OverlayLayout("caution_amazon", 0.375, 8, 328, 15, -318, text_anchor="top",
+                           font_size=8, text_format="Customer Reference: {id}")
+
+    def extract_id(self, text):
+        ids = extract_amazon_order_numbers(text)
+        return ids[0] if ids else None
+
+    guide_id_pattern = re.compile(r"\d{3}-\d{7}-\d{7}")
+
+    def guide_raw_ids(self, text, fragments=None):
+        if fragments:
+            # Same cut as extract_amazon_order_numbers: ignore the error list
+            for end, (_, _, run) in enumerate(fragments):
+                if "List of orders with error in label purchase" in run:
+                    fragments = fragments[:end]
+                    break
+            ids = column_ids(fragments, self.guide_id_pattern)
+            if ids:
+                return ids
+        return extract_amazon_order_numbers(text)
+
+    guide_id_headers = ("order-id", "amazon-order-id", "order id")
+
+    def clean_guide_ids(self, raw_ids):
+        return list(raw_ids)
+
+    # The "List of orders" pages map the whole file: it is always scanned at once
+    page_range_scan = False
+
+    def scan_reader(self, page_text, couriers, log_callback, start=0, stop=None):
+        """Amazon labels have a "List of orders" page at the end with IDs in order of appearance.
+
+        The ID at position N of the list belongs to page N. The whole file is
+        scanned whatever start / stop are.
+        """
+        # Find ALL "List of orders" pages and extract IDs in order
+        # The list can span multiple pages, so we need to read all of them
+        order_ids_in_file = []
+        list_page_found = False
+        # Pages read by this loop that hold "List of orders" (the text is not kept)
+        summary_pages = set()
+        pages_read = 0
+
+        for page_idx in range(page_text.page_count):
+            text = page_text(page_idx)
+            pages_read = page_idx + 1
+            if "List of orders" in text:
+                summary_pages.add(page_idx)
+
+            # Check if this page contains order IDs (list page or continuation)
+            # Criteria: contains "List of orders" OR "successful label purchase" OR has Amazon ID pattern
+            has_list_header = self.detect(text)
+            has_amazon_ids = re.search(r'\d{3}-\d{7}-\d{7}', text) is not None
+
+            if has_list_header or (has_amazon_ids and list_page_found):
+                log_callback(f"   📋 Found order list page (page {page_idx + 1})")
+                page_ids = extract_amazon_order_numbers(text)
+                if page_ids:
+                    order_ids_in_file.extend(page_ids)
+                    log_callback(f"   ✓ Extracted {len(page_ids)} order IDs from this page (total: {len(order_ids_in_file)})")
+                    list_page_found = True
+            elif list_page_found:
+                # We've found list pages before, but this page doesn't have IDs
+                # This means we've reached the end of the list
+                break
+
+        if not list_page_found:
+            log_callback("   ⚠️  WARNING: No 'List of orders' page found in this file")
+            return page_text.page_count
+
+        # Map each order ID to its corresponding page (ID at position N = page N)
+        for idx, order_id in enumerate(order_ids_in_file):
+            # Check that this page is not the summary page
+            if idx >= page_text.page_count or idx in summary_pages:
+                continue
+            if idx < pages_read or "List of orders" not in page_text(idx):
+                log_callback(f"   ✓ {order_id} → page {idx + 1}")
+                yield idx, order_id, self
+        return page_text.page_count
+
+
+@register_courier
+class TemuFulfilmentCourier(Courier):
+    name = "temu_fulfilment"
+    flow = "temu_fulfilment"
+    display_name = "TEMU-Fulfilment"
+    markers = ("TEMU-Fulfilment",)
+    id_on_next_page = True
+    keep_unlabelled_pages = True
+    # Same packing slip as Evri: "Purchase Order ID" block
+    id_region = (0.0, 0.75, 0.75, 0.92)
+    layout = OverlayLayout("caution", 0.07, 15, 30, 10, -30, text_anchor="top",
+                           font_size=14, count_format="")
+
+    def extract_id(self, text):
+        # Premier ID trouvé (chiffres + tirets)
+        match = re.search(r"\d+[\d-]+\d+", text or "")
+        return match.group(0) if match else None
+
+    # Label IDs are bare digits and hyphens: no PO- prefix in the guide column either
+    guide_id_pattern = re.compile(r"\d{3}-\d{10,}")
+
+    def clean_guide_ids(self, raw_ids):
+        ids = []
+        for raw_id in raw_ids:
+            # "PO-210-…" (CSV / XLSX exports) → "210-…", as printed on the label
+            clean = re.sub(r"[^0-9-]", "", raw_id).lstrip("-")
+            if len(clean) > 10:
+                ids.append(clean)
+        return ids
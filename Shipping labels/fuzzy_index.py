@@ -0,0 +1,86 @@
+"""Fuzzy lookup of order IDs with one or two wrong, missing or extra digits.
+
+Labels are indexed in a BK-tree over their digit strings. A query only
+visits the subtrees whose edge distance is within `max_distance` of the
+query's distance to the node (triangle inequality), so each lookup
+compares against a small part of the labels instead of all of them. The
+edit distance itself is the bit-parallel Levenshtein of Myers / Hyyrö:
+one pass over the string with integer bit operations.
+"""
+
+
+def edit_distance(a, b):
+    """Levenshtein distance between two strings."""
+    if len(a) < len(b):
+        a, b = b, a
+    m = len(b)
+    if m == 0:
+        return len(a)
+
+    # Bit i of peq[ch] is set when b[i] == ch
+    peq = {}
+    for i, ch in enumerate(b):
+        peq[ch] = peq.get(ch, 0) | (1 << i)
+    mask = (1 << m) - 1
+    high = 1 << (m - 1)
+    pv, mv, score = mask, 0, m
+
+    for ch in a:
+        eq = peq.get(ch, 0)
+        xv = eq | mv
+        xh = ((((eq & pv) + pv) & mask) ^ pv) | eq
+        ph = (mv | ~(xh | pv)) & mask
+        mh = pv & xh
+        if ph & high:
+            score += 1
+        elif mh & high:
+            score -= 1
+        ph = ((ph << 1) | 1) & mask
+        mh = (mh << 1) & mask
+        pv = (mh | ~(xv | ph)) & mask
+        mv = ph & xv
+    return score
+
+
+class BKTree:
+    """BK-tree of strings; each string carries the list of values added with it."""
+    __slots__ = ("root", "size")
+
+    def __init__(self):
+        self.root = None  # node: [term, values, {distance: child node}]
+        self.size = 0
+
+    def add(self, term, value):
+        if self.root is None:
+            self.root = [term, [value], {}]
+            self.size = 1
+            return
+        node = self.root
+        while True:
+            d = edit_distance(term, node[0])
+            if d == 0:
+                node[1].append(value)
+                return
+            child = node[2].get(d)
+            if child is None:
+                node[2][d] = [term, [value], {}]
+                self.size += 1
+                return
+            node = child
+
+    def search(self, term, max_distance):
+        """[(distance, term, values)] within max_distance of `term`, closest first."""
+        found = []
+        if self.root is None:
+            return found
+        stack = [self.root]
+        while stack:
+            node_term, values, children = stack.pop()
+            d = edit_distance(term, node_term)
+            if d <= max_distance:
+                found.append((d, node_term, values))
+            for edge, child in children.items():
+                if d - max_distance <= edge <= d + max_distance:
+                    stack.append(child)
+        found.sort(key=lambda hit: (hit[0], hit[1]))
+        return found
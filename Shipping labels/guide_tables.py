@@ -0,0 +1,91 @@
+"""Guides from the seller portals' CSV / XLSX order exports.
+
+The export is read row by row (csv module, openpyxl in read-only mode), so
+no PDF is opened and no text is extracted. Every row of the order-number
+column gives one guide ID, in file order: an order listed on several rows
+is counted several times, exactly like a printed guide.
+"""
+import csv
+import os
+
+TABLE_GUIDE_EXTENSIONS = (".csv", ".xlsx")
+
+# Rows read before picking the ID column when no header is recognised
+SAMPLE_ROWS = 100
+
+def is_table_guide(guide_path):
+    return os.path.splitext(guide_path)[1].lower() in TABLE_GUIDE_EXTENSIONS
+
+def iter_csv_rows(path):
+    with open(path, newline="", encoding="utf-8-sig") as csv_file:
+        sample = csv_file.read(4096)
+        csv_file.seek(0)
+        try:
+            dialect = csv.Sniffer().sniff(sample, delimiters=",;\t")
+        except csv.Error:
+            dialect = csv.excel
+        for row in csv.reader(csv_file, dialect):
+            yield row
+
+def iter_xlsx_rows(path):
+    try:
+        import openpyxl
+    except ImportError:
+        raise ImportError("Reading .xlsx guides needs openpyxl (pip install openpyxl)")
+    workbook = openpyxl.load_workbook(path, read_only=True, data_only=True)
+    try:
+        for row in workbook.active.iter_rows(values_only=True):
+            yield ["" if cell is None else str(cell) for cell in row]
+    finally:
+        workbook.close()
+
+def iter_table_rows(path):
+    """Rows of a CSV / XLSX file as lists of strings (first sheet for XLSX)."""
+    if path.lower().endswith(".xlsx"):
+        return iter_xlsx_rows(path)
+    return iter_csv_rows(path)
+
+def _cell_id(row, col, pattern):
+    if col < len(row):
+        match = pattern.search(row[col])
+        if match:
+            return match.group(0)
+    return None
+
+def table_guide_ids(guide_path, courier):
+    """Clean guide IDs of a CSV / XLSX export, in row order, duplicates kept.
+
+    The ID column is found by its header (courier.guide_id_headers); if no
+    header matches, it is the column whose cells match the courier's ID
+    pattern most often in the first rows.
+    """
+    pattern = courier.guide_id_pattern
+    rows = iter_table_rows(guide_path)
+    header = next(rows, [])
+    names = [name.strip().lower() for name in header]
+
+    col = next((names.index(name) for name in courier.guide_id_headers if name in names), None)
+    pending = []
+    if col is None:
+        # No known header: the first row may already be an order
+        pending.append(header)
+        for row in rows:
+            pending.append(row)
+            if len(pending) >= SAMPLE_ROWS:
+                break
+        hits = {}
+        for row in pending:
+            for c, cell in enumerate(row):
+                if pattern.search(cell):
+                    hits[c] = hits.get(c, 0) + 1
+        if not hits:
+            return []
+        col = max(hits, key=hits.get)
+
+    raw_ids = []
+    for source in (pending, rows):
+        for row in source:
+            raw_id = _cell_id(row, col, pattern)
+            if raw_id:
+                raw_ids.append(raw_id)
+    return courier.clean_guide_ids(raw_ids)
@@ -0,0 +1,137 @@
+"""Job output cache: a repeated job returns its earlier sorted PDF at once.
+
+Entries are content-addressed: the key is a SHA-256 over the engine
+version, the flow, the hashes of the guide and of every label file (in
+order) and the settings of the flow's couriers. Each entry is the output
+PDF plus a JSON copy of the run summary. When the cache grows past
+max_bytes, the least recently used entries are removed.
+"""
+import hashlib
+import json
+import os
+import shutil
+import time
+from couriers import get_courier
+from records import GuideEntry, LabelRef
+
+DEFAULT_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".pdf_label_sorter", "job_cache")
+DEFAULT_MAX_BYTES = 500 * 1024 * 1024
+
+def courier_settings(couriers):
+    """Everything in the couriers' declarations that changes the output."""
+    settings = []
+    for courier in couriers:
+        layout = courier.layout
+        settings.append((
+            courier.name, courier.markers, courier.id_on_next_page, courier.flexible_match,
+            courier.keep_unlabelled_pages, courier.id_region, courier.guide_id_pattern.pattern,
+            courier.guide_id_headers, courier.fuzzy_max_distance,
+            tuple(getattr(layout, slot) for slot in layout.__slots__),
+        ))
+    return repr(settings)
+
+def dump_result(result):
+    """run_job summary -> JSON-able dict."""
+    return {
+        "guide": [[e.id, e.count, e.first_pos] for e in result["guide"]],
+        "labels_db": {lid: [[r.file_idx, r.page_idx, r.courier.name, r.w, r.h, r.raw_id] for r in refs]
+                      for lid, refs in result["labels_db"].items()},
+        "matched": result["matched"],
+        "missing": result["missing"],
+        "extras": result["extras"],
+        "from_ledger": result["from_ledger"],
+        "fuzzy_candidates": result["fuzzy_candidates"],
+        "report": result["report"],
+    }
+
+def load_result(data):
+    """Inverse of dump_result."""
+    result = dict(data)
+    result["guide"] = [GuideEntry(*entry) for entry in data["guide"]]
+    result["labels_db"] = {
+        lid: [LabelRef(file_idx, page_idx, get_courier(courier), w, h, raw_id)
+              for file_idx, page_idx, courier, w, h, raw_id in refs]
+        for lid, refs in data["labels_db"].items()}
+    result["fuzzy_candidates"] = {gid: [tuple(hit) for hit in hits]
+                                  for gid, hits in data["fuzzy_candidates"].items()}
+    result["report_paths"] = None
+    result["timing"] = None
+    return result
+
+
+class JobCache:
+    """Directory of <key>.pdf / <key>.json entries, evicted by size (least recently used first)."""
+
+    def __init__(self, directory=DEFAULT_CACHE_DIR, max_bytes=DEFAULT_MAX_BYTES):
+        os.makedirs(directory, exist_ok=True)
+        self.directory = directory
+        self.max_bytes = max_bytes
+
+    @staticmethod
+    def key(*parts):
+        digest = hashlib.sha256()
+        for part in parts:
+            digest.update(str(part).encode())
+            digest.update(b"\0")
+        return digest.hexdigest()
+
+    def _paths(self, key):
+        base = os.path.join(self.directory, key)
+        return base + ".pdf", base + ".json"
+
+    def get(self, key, output_path):
+        """Copy the cached PDF to output_path and return the cached summary, or None."""
+        pdf_path, json_path = self._paths(key)
+        if not (os.path.exists(pdf_path) and os.path.exists(json_path)):
+            return None
+        try:
+            with open(json_path, encoding="utf-8") as f_json:
+                data = json.load(f_json)
+            if os.path.abspath(output_path) != os.path.abspath(pdf_path):
+                shutil.copyfile(pdf_path, output_path)
+            now = time.time()
+            os.utime(pdf_path, (now, now))
+            os.utime(json_path, (now, now))
+        except FileNotFoundError:
+            return None  # evicted meanwhile by another process (batch / shard workers)
+        return load_result(data)
+
+    def put(self, key, output_path, result):
+        pdf_path, json_path = self._paths(key)
+        # Both files are written aside then renamed, the PDF first: an
+        # interrupted run or another process never sees a partial entry
+        tmp_path = f"{pdf_path}.{os.getpid()}.tmp"
+        shutil.copyfile(output_path, tmp_path)
+        os.replace(tmp_path, pdf_path)
+        tmp_path = f"{json_path}.{os.getpid()}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f_json:
+            json.dump(dump_result(result), f_json, ensure_ascii=False)
+        os.replace(tmp_path, json_path)
+        self.evict()
+
+    def evict(self):
+        """Remove the least recently used entries until the cache fits in max_bytes.
+
+        Several processes may evict at once: files another one removed are skipped.
+        """
+        entries = {}
+        for name in os.listdir(self.directory):
+            key, ext = os.path.splitext(name)
+            if ext in (".pdf", ".json"):
+                try:
+                    stat = os.stat(os.path.join(self.directory, name))
+                except FileNotFoundError:
+                    continue
+                size, used = entries.get(key, (0, 0))
+                entries[key] = (size + stat.st_size, max(used, stat.st_mtime))
+
+        total = sum(size for size, _ in entries.values())
+        for key, (size, _) in sorted(entries.items(), key=lambda item: item[1][1]):
+            if total <= self.max_bytes:
+                break
+            for path in self._paths(key):
+                try:
+                    os.remove(path)
+                except FileNotFoundError:
+                    pass
+            total -= size
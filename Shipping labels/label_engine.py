@@ -0,0 +1,813 @@
+"""Shared label sorting engine.
+
+Every flow (Temu/Evri/Royal Mail, Amazon, Temu-Fulfilment) runs through the
+same four stages; the courier specific parts come from the registry in
+`couriers.py`:
+
+    1. read_guide      -> [GuideEntry]                  } run concurrently
+    2. scan_labels     -> labels_db {clean_id: [LabelRef]}  } (read_inputs)
+    3. match_orders    -> MatchTables (groups in guide order, missing, extras)
+       (+ resolve_from_ledger: MISSING orders looked up in earlier jobs' labels)
+    4. write_sorted_pdf -> overlays (Form XObject stamps) + final PDF
+       (dry run: match report JSON + text instead)
+
+PDFs are opened, read and written through a backend (pdf_backends.py);
+the engine only keeps LabelRefs (file index, page index) into the open
+documents.
+"""
+import os
+import re
+import time
+from array import array
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from couriers import normalize_id, flow_couriers, get_courier
+from records import LabelRef, GuideEntry
+from pdf_backends import get_backend
+from text_extraction import WINDOW_PAGES
+from guide_tables import is_table_guide, table_guide_ids
+from ledger import file_hash
+from fuzzy_index import BKTree
+from match_report import build_report, write_report
+from job_cache import JobCache, courier_settings
+from memory_trace import no_stage
+from pdf_optimizer import optimize_pdf
+
+# Part of the job cache key: bump it whenever a change alters the output PDF
+ENGINE_VERSION = 5
+
+# ------------------ MATCHING HELPERS ------------------
+
+def extract_digits_only(id_text):
+    """Extract only digits from an ID."""
+    if not id_text: return ""
+    return re.sub(r"[^0-9]", "", id_text)
+
+def get_first_last_digits(id_text, n=4):
+    """Get first n and last n digits from an ID."""
+    if not id_text:
+        return None, None
+
+    # Try to get the last part after splitting by "-"
+    parts = id_text.split("-")
+    if len(parts) >= 3:
+        # Format like PO-210-10386798799991976
+        id_text = parts[2]
+    elif len(parts) >= 2:
+        # Format like PO-10386798799991976
+        id_text = parts[1]
+    # else: use the whole id_text
+
+    digits = extract_digits_only(id_text)
+    if len(digits) < n * 2:
+        return None, None
+    return digits[:n], digits[-n:]
+
+# ------------------ STAGES ------------------
+
+def guide_page_ids(guide_path, flow, start=0, stop=None, backend_name=None):
+    """Guide IDs found on guide pages [start, stop), in order, duplicates kept.
+
+    Takes the flow and backend names (not objects) so it can run in a worker process.
+    """
+    courier = flow_couriers(flow)[0]
+    backend = get_backend(backend_name)
+    texts = backend.page_texts(backend.open(guide_path), positions=True)  # order-number column
+    ids = []
+    for idx in range(*slice(start, stop).indices(texts.page_count)):
+        ids.extend(courier.extract_guide_ids(texts(idx), texts.page_fragments(idx)))
+    return ids
+
+def build_guide(ids, log_callback):
+    """Fold the raw guide IDs into GuideEntry records, in first-appearance order."""
+    entries = {}  # {id: GuideEntry}, insertion order = guide order
+    for pos, clean in enumerate(ids):
+        entry = entries.get(clean)
+        if entry is None:
+            entries[clean] = GuideEntry(clean, 1, pos)
+        else:
+            entry.count += 1
+
+    guide = list(entries.values())
+    log_callback(f"ℹ️  Unique orders in guide: {len(guide)}")
+
+    duplicates = [entry.id for entry in guide if entry.count > 1]
+    if duplicates:
+        log_callback(f"⚠️  Duplicated orders in guide: {duplicates}")
+
+    return guide
+
+def read_guide(guide_path, couriers, log_callback, backend):
+    """STEP 1: Returns the guide as a list of GuideEntry, in first-appearance order."""
+    log_callback(f"📋 Reading Guide: {os.path.basename(guide_path)}")
+    if is_table_guide(guide_path):
+        return build_guide(table_guide_ids(guide_path, couriers[0]), log_callback)
+    return build_guide(guide_page_ids(guide_path, couriers[0].flow, backend_name=backend.name), log_callback)
+
+def label_page_texts(doc, couriers, backend, window=WINDOW_PAGES):
+    """Page-text cache of a label file; text positions are recorded when a courier reads an ID region."""
+    return backend.page_texts(doc, any(courier.id_region is not None for courier in couriers), window)
+
+def iter_label_refs(doc, page_text, file_idx, couriers, log_callback, backend, start=0, stop=None):
+    """Yield (clean_id, LabelRef) for pages start..stop-1 of one open label file, in page order.
+
+    Pages that are not labels (or without a readable ID) are yielded with
+    clean_id=None, only when the couriers keep them. Label pages get the
+    backend's content digest (see drop_duplicate_pages). Returns the next
+    page to scan, like Courier.scan_reader.
+    """
+    keep_unlabelled = couriers[0].keep_unlabelled_pages
+    pages = couriers[0].scan_reader(page_text, couriers, log_callback, start, stop)
+    while True:
+        try:
+            page_idx, raw_id, courier = next(pages)
+        except StopIteration as end:
+            return end.value
+        if not raw_id and not keep_unlabelled:
+            continue
+        width, height = backend.page_size(doc, page_idx)
+        ref = LabelRef(file_idx, page_idx, courier, width, height, raw_id,
+                       backend.page_digest(doc, page_idx) if raw_id else None)
+        yield (normalize_id(raw_id) if raw_id else None), ref
+
+def scan_label_range(doc, page_text, file_idx, couriers, log_callback, backend, start=0, stop=None):
+    """Scan pages start..stop-1 of one open label file (see iter_label_refs).
+
+    Returns (found, unlabelled, next_page, courier counts): found is
+    [(clean_id, LabelRef)] in page order; unlabelled holds LabelRefs
+    (raw_id=None) of pages that are not labels, only kept by couriers that
+    want them.
+    """
+    file_couriers = Counter()
+    found = []
+    unlabelled = []
+
+    refs = iter_label_refs(doc, page_text, file_idx, couriers, log_callback, backend, start, stop)
+    while True:
+        try:
+            clean_id, ref = next(refs)
+        except StopIteration as end:
+            return found, unlabelled, end.value, file_couriers
+        if clean_id is None:
+            unlabelled.append(ref)
+        else:
+            file_couriers[ref.courier.display_name] += 1
+            found.append((clean_id, ref))
+
+def scan_label_reader(doc, file_idx, couriers, log_callback, backend):
+    """Scan one open label file. Returns (found, unlabelled), see scan_label_range."""
+    page_text = label_page_texts(doc, couriers, backend)
+    found, unlabelled, _, file_couriers = scan_label_range(doc, page_text, file_idx, couriers,
+                                                           log_callback, backend)
+
+    if len(couriers) > 1 and file_couriers:
+        log_callback("   Couriers detected: " + ", ".join(f"{name} ×{n}" for name, n in file_couriers.items()))
+    summary = page_text.cache_summary()
+    if summary:
+        log_callback(f"   🔤 {summary}")
+
+    return found, unlabelled
+
+def drop_duplicate_pages(labels_db, input_pdf_paths, log_callback):
+    """Keep one copy of each label page of an ID (same digest), e.g. when a label is in two files.
+
+    Only pages of the same ID are compared (through a set of their digests),
+    so the first page of an ID is always kept. Returns [(label_id, kept ref, dropped ref)].
+    """
+    duplicates = []
+    for label_id, refs in labels_db.items():
+        seen = {}  # digest -> first ref of this ID
+        kept = []
+        for ref in refs:
+            first = seen.get(ref.digest) if ref.digest else None
+            if first is None:
+                if ref.digest:
+                    seen[ref.digest] = ref
+                kept.append(ref)
+            else:
+                duplicates.append((label_id, first, ref))
+        refs[:] = kept
+
+    for label_id, first, ref in duplicates:
+        log_callback(f"♊ DUPLICATE page: {label_id} in {os.path.basename(input_pdf_paths[ref.file_idx])} "
+                     f"page {ref.page_idx + 1} = {os.path.basename(input_pdf_paths[first.file_idx])} "
+                     f"page {first.page_idx + 1} (kept once)")
+    return duplicates
+
+def scan_labels(input_pdf_paths, couriers, log_callback, backend, readers=None):
+    """STEP 2: Returns (labels_db, unlabelled, readers).
+
+    labels_db maps clean ID -> list of LabelRef; the courier and page size
+    are recorded once per page here so later stages never re-extract text.
+    readers[file_idx] is the open backend document the refs point into.
+    """
+    labels_db = {}
+    unlabelled = []
+    if readers is None:
+        readers = [backend.open(path) for path in input_pdf_paths]
+
+    for file_idx, input_pdf_path in enumerate(input_pdf_paths):
+        log_callback(f"📦 Reading Labels {file_idx + 1}/{len(input_pdf_paths)}: {os.path.basename(input_pdf_path)}")
+        found, file_unlabelled = scan_label_reader(readers[file_idx], file_idx, couriers, log_callback, backend)
+        for clean_id, ref in found:
+            labels_db.setdefault(clean_id, []).append(ref)
+        unlabelled.extend(file_unlabelled)
+
+    return labels_db, unlabelled, readers
+
+# ------------------ PARALLEL GUIDE + LABEL SCAN ------------------
+
+# Below this many pages (guide + labels) the process start-up costs more than it saves
+PARALLEL_MIN_PAGES = 50
+
+def _scan_label_file(input_pdf_path, file_idx, flow, backend_name):
+    """Worker: scan one label file, returning its log lines instead of calling the GUI."""
+    logs = []
+    backend = get_backend(backend_name)
+    found, unlabelled = scan_label_reader(backend.open(input_pdf_path), file_idx,
+                                          flow_couriers(flow), logs.append, backend)
+    return found, unlabelled, logs
+
+def read_inputs_parallel(guide_path, input_pdf_paths, couriers, log_callback, backend, max_workers=None):
+    """STEP 1 + STEP 2 at the same time in a process pool.
+
+    The guide is split into page ranges and every label file is its own
+    task, so the wall time is close to the slowest task instead of the sum
+    of both steps. Worker logs are replayed in the sequential order.
+    Returns (guide, labels_db, unlabelled).
+    """
+    flow = couriers[0].flow
+    workers = max_workers or os.cpu_count() or 1
+    table_guide = is_table_guide(guide_path)
+    if not table_guide:
+        guide_pages = backend.page_count(backend.open(guide_path))
+        chunk = max(1, -(-guide_pages // workers))
+
+    log_callback(f"⚡ Reading guide and {len(input_pdf_paths)} label file(s) in parallel ({workers} workers)...")
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        # Label files first: they are the longest tasks
+        label_futures = [pool.submit(_scan_label_file, path, file_idx, flow, backend.name)
+                         for file_idx, path in enumerate(input_pdf_paths)]
+        if table_guide:
+            # CSV/XLSX export: read here while the workers scan the labels
+            ids = table_guide_ids(guide_path, couriers[0])
+        else:
+            guide_futures = [pool.submit(guide_page_ids, guide_path, flow, start, start + chunk, backend.name)
+                             for start in range(0, guide_pages, chunk)]
+            ids = [clean for future in guide_futures for clean in future.result()]
+        scans = [future.result() for future in label_futures]
+
+    log_callback(f"📋 Reading Guide: {os.path.basename(guide_path)}")
+    guide = build_guide(ids, log_callback)
+
+    labels_db = {}
+    unlabelled = []
+    for file_idx, (found, file_unlabelled, logs) in enumerate(scans):
+        log_callback(f"📦 Reading Labels {file_idx + 1}/{len(input_pdf_paths)}: {os.path.basename(input_pdf_paths[file_idx])}")
+        for line in logs:
+            log_callback(line)
+        for clean_id, ref in found:
+            labels_db.setdefault(clean_id, []).append(ref)
+        unlabelled.extend(file_unlabelled)
+
+    return guide, labels_db, unlabelled
+
+def read_inputs(guide_path, input_pdf_paths, couriers, log_callback, backend, parallel=True, stage=no_stage):
+    """STEP 1 + STEP 2. Returns (guide, labels_db, unlabelled, readers).
+
+    stage(name) wraps each step (see memory_trace.StageMemory).
+    """
+    with stage("open labels"):
+        readers = [backend.open(path) for path in input_pdf_paths]
+
+    total_pages = sum(backend.page_count(doc) for doc in readers)
+    if parallel and (os.cpu_count() or 1) > 1 and total_pages >= PARALLEL_MIN_PAGES:
+        try:
+            guide, labels_db, unlabelled = read_inputs_parallel(
+                guide_path, input_pdf_paths, couriers, log_callback, backend)
+            return guide, labels_db, unlabelled, readers
+        except BrokenProcessPool:
+            log_callback("⚠️  Parallel scan unavailable, reading sequentially...")
+
+    with stage("guide parse"):
+        guide = read_guide(guide_path, couriers, log_callback, backend)
+    with stage("label scan"):
+        labels_db, unlabelled, readers = scan_labels(input_pdf_paths, couriers, log_callback, backend, readers)
+    return guide, labels_db, unlabelled, readers
+
+# How each guide order was matched (MatchTables.guide_match values)
+EXACT, FLEXIBLE, FUZZY = range(3)
+MATCH_TYPES = ("exact", "flexible", "fuzzy")
+
+# Shortest digit string the fuzzy matcher accepts (fewer digits = too many near-collisions)
+FUZZY_MIN_DIGITS = 8
+# Above this many unmatched orders the files do not belong together: no fuzzy lookup
+FUZZY_MAX_UNMATCHED = 500
+
+class MatchTables:
+    """Array-backed result of the match stage.
+
+    Guide rows (guide order) and label rows (scan order) are numbered, and
+    each match is an edge guide row -> label row. Edges are stored in CSR
+    form: the label rows of guide row g are edge_label[edge_start[g]:edge_start[g + 1]].
+    Groups, counts, missing orders and extras are then derived in bulk from
+    these arrays instead of per-order dict/set bookkeeping.
+    `candidates` keeps the ranked fuzzy candidates of the orders that had some.
+    """
+    __slots__ = ("guide_ids", "guide_count", "guide_match", "label_ids",
+                 "edge_start", "edge_label", "candidates")
+
+    def __init__(self, guide, label_ids):
+        self.guide_ids = [entry.id for entry in guide]
+        self.guide_count = array("l", (entry.count for entry in guide))
+        self.guide_match = bytearray(len(guide))  # EXACT / FLEXIBLE / FUZZY
+        self.label_ids = label_ids
+        self.edge_start = array("l", [0])
+        self.edge_label = array("l")
+        self.candidates = {}  # {guide_id: [(label_id, distance)]}, closest first
+
+    def add_matches(self, new_edges):
+        """Add label rows to some guide rows ({guide row: [label rows]}), rebuilding the CSR arrays."""
+        starts, edges = self.edge_start, self.edge_label
+        new_starts, new_labels = array("l", [0]), array("l")
+        for g in range(len(self.guide_ids)):
+            new_labels.extend(edges[starts[g]:starts[g + 1]])
+            new_labels.extend(new_edges.get(g, ()))
+            new_starts.append(len(new_labels))
+        self.edge_start, self.edge_label = new_starts, new_labels
+
+    def missing_orders(self):
+        starts = self.edge_start
+        return [gid for g, gid in enumerate(self.guide_ids) if starts[g] == starts[g + 1]]
+
+    def matched_orders(self):
+        starts = self.edge_start
+        return [gid for g, gid in enumerate(self.guide_ids) if starts[g] != starts[g + 1]]
+
+    def extra_labels(self):
+        """Label IDs that no guide order matched (scan order)."""
+        used = bytearray(len(self.label_ids))
+        for row in self.edge_label:
+            used[row] = 1
+        return [lid for row, lid in enumerate(self.label_ids) if not used[row]]
+
+    def groups(self):
+        """Guide orders grouped by the exact set of labels they matched.
+
+        Returns a list, in the guide order of each group's first order, of
+        (label_ids, [(guide_id, match_type), ...], total_count) where
+        label_ids is sorted for a consistent page order.
+        """
+        starts, edges, counts = self.edge_start, self.edge_label, self.guide_count
+        group_of_key = {}
+        group_rows = []   # guide rows of each group
+        group_total = array("l")
+
+        for g in range(len(self.guide_ids)):
+            if starts[g] == starts[g + 1]:
+                continue
+            key = tuple(sorted(edges[starts[g]:starts[g + 1]]))
+            k = group_of_key.get(key)
+            if k is None:
+                k = group_of_key[key] = len(group_rows)
+                group_rows.append([])
+                group_total.append(0)
+            group_rows[k].append(g)
+            group_total[k] += counts[g]
+
+        groups = []
+        for key, k in group_of_key.items():
+            label_ids = sorted(self.label_ids[row] for row in key)
+            orders = [(self.guide_ids[g], MATCH_TYPES[self.guide_match[g]])
+                      for g in group_rows[k]]
+            groups.append((label_ids, orders, group_total[k]))
+        return groups
+
+def fuzzy_match(tables, max_distance, log_callback):
+    """Last resort for the orders still unmatched: labels whose digits are
+    within `max_distance` edits (wrong, dropped or extra digit).
+
+    Only labels that no other order took are candidates; they are looked up
+    in a BK-tree instead of being compared one by one. An order is matched
+    when a single label is the closest, and its ranked candidates are kept
+    in tables.candidates either way. Skipped when more than
+    FUZZY_MAX_UNMATCHED orders are unmatched.
+    """
+    starts = tables.edge_start
+    unmatched = [g for g in range(len(tables.guide_ids)) if starts[g] == starts[g + 1]]
+    if not unmatched:
+        return
+    if len(unmatched) > FUZZY_MAX_UNMATCHED:
+        log_callback(f"⚠️  {len(unmatched)} orders unmatched: fuzzy lookup skipped "
+                     f"(over {FUZZY_MAX_UNMATCHED}, check the label files)")
+        return
+
+    used = bytearray(len(tables.label_ids))
+    for row in tables.edge_label:
+        used[row] = 1
+    tree = BKTree()
+    for row, lid in enumerate(tables.label_ids):
+        digits = extract_digits_only(lid)
+        if not used[row] and len(digits) >= FUZZY_MIN_DIGITS:
+            tree.add(digits, row)
+    if not tree.size:
+        return
+
+    new_edges = {}
+    for g in unmatched:
+        gid = tables.guide_ids[g]
+        digits = extract_digits_only(gid)
+        if len(digits) < FUZZY_MIN_DIGITS:
+            continue
+        hits = [(d, row) for d, _, rows in tree.search(digits, max_distance)
+                for row in rows if not used[row]]
+        if not hits:
+            continue
+
+        tables.candidates[gid] = [(tables.label_ids[row], d) for d, row in hits]
+        log_callback(f"   🔎 Fuzzy candidates for {gid}: "
+                     + ", ".join(f"{tables.label_ids[row]} (d={d})" for d, row in hits[:5]))
+        best = [row for d, row in hits if d == hits[0][0]]
+        if len(best) == 1:
+            new_edges[g] = best
+            used[best[0]] = 1
+            tables.guide_match[g] = FUZZY
+            log_callback(f"   ⚠️ FUZZY MATCH: {gid} → {tables.label_ids[best[0]]} (d={hits[0][0]}), check this label")
+        else:
+            log_callback(f"      ⚠️ {len(best)} labels at the same distance, left unmatched")
+
+    if new_edges:
+        tables.add_matches(new_edges)
+
+def match_orders(guide, labels_db, couriers, log_callback, max_distance=None):
+    """STEP 3: Match every guide order against the label index.
+
+    Tries the exact ID first, then (for couriers that allow it) every label
+    with the same first 4 and last 4 digits, looked up in a prebuilt index
+    instead of rescanning all labels for each order. Orders still unmatched
+    go through fuzzy_match (max_distance edits, courier default if None,
+    0 = off; the couriers default to off). Returns a MatchTables.
+    """
+    flexible = couriers[0].flexible_match
+    label_ids = list(labels_db)
+    label_row = {lid: row for row, lid in enumerate(label_ids)}
+
+    # (first 4, last 4 digits) -> label rows
+    digits_index = {}
+    if flexible:
+        for row, lid in enumerate(label_ids):
+            key = get_first_last_digits(lid)
+            if key[0]:
+                digits_index.setdefault(key, array("l")).append(row)
+
+    tables = MatchTables(guide, label_ids)
+    edge_start, edge_label = tables.edge_start, tables.edge_label
+
+    for g, gid in enumerate(tables.guide_ids):
+        row = label_row.get(gid)
+        if row is not None:
+            edge_label.append(row)
+        elif flexible:
+            key = get_first_last_digits(gid)
+            if key[0]:
+                log_callback(f"   🔍 Flexible search for {gid} (first: {key[0]}, last: {key[1]})")
+                rows = digits_index.get(key)
+                if rows:
+                    log_callback(f"      ✓ Match found! ({len(rows)} label(s))")
+                    edge_label.extend(rows)
+                    tables.guide_match[g] = FLEXIBLE
+        edge_start.append(len(edge_label))
+
+    if max_distance is None:
+        max_distance = couriers[0].fuzzy_max_distance
+    if max_distance > 0:
+        fuzzy_match(tables, max_distance, log_callback)
+
+    return tables
+
+def part_path(output_path, number):
+    return f"{os.path.splitext(output_path)[0]}_part{number:03d}.pdf"
+
+def write_sorted_pdf(groups, missing_orders, extra_labels, labels_db, unlabelled, readers,
+                     couriers, output_path, log_callback, backend, stage=no_stage, part_orders=None):
+    """STEP 4: Overlay and write matched labels (guide order), then extras.
+
+    With part_orders (progressive output), every part_orders orders are
+    also written as a ready-to-print <output>_partNNN.pdf as soon as they
+    are done (extra labels count as orders, unlabelled pages go in the last part).
+    Returns [(part path, time.perf_counter() when written)] (empty without parts).
+    """
+    log_callback("💾 Generating final PDF...")
+    out = backend.create_output(log_callback)
+    parts = []
+    part, part_count = None, 0
+
+    def flush_part():
+        path = part_path(output_path, len(parts) + 1)
+        part.write(path)
+        parts.append((path, time.perf_counter()))
+        log_callback(f"🖨️ PART {len(parts)} ready to print: {os.path.basename(path)}")
+
+    def add_page(ref, text, starts_order):
+        """Add a page (stamped with `text` unless None) to the output and the current part."""
+        nonlocal part, part_count
+        targets = [out]
+        if part_orders:
+            if starts_order and part_count == part_orders:
+                flush_part()
+                part, part_count = None, 0
+            if part is None:
+                part = backend.create_output(log_callback)
+            part_count += starts_order
+            targets.append(part)
+        for target in targets:
+            if text is None:
+                target.add_page(readers[ref.file_idx], ref.page_idx)
+            else:
+                target.add_stamped_page(readers[ref.file_idx], ref.page_idx, ref.w, ref.h,
+                                        ref.courier.layout, text)
+
+    def add_label_page(ref, label_id, count, starts_order):
+        add_page(ref, ref.courier.layout.display_text(label_id, count), starts_order)
+
+    with stage("overlay"):
+        for label_ids, matching_orders, total_count in groups:
+            # Log all matches
+            for gid, mtype in matching_orders:
+                if mtype == "exact":
+                    log_callback(f"✅ MATCH: {gid}")
+                else:
+                    log_callback(f"✅ MATCH ({mtype}): {gid} → {label_ids[0]}")
+
+            # Add ALL labels in this group consecutively with all their pages
+            page_counter = 0
+            for label_id in label_ids:
+                for ref in labels_db[label_id]:
+                    # First page shows total count, subsequent pages show no count
+                    display_count = total_count if page_counter == 0 else 1
+                    page_counter += 1
+                    add_label_page(ref, label_id, display_count, page_counter == 1)
+
+        # Log missing orders
+        for order_id in missing_orders:
+            log_callback(f"❌ MISSING: {order_id}")
+
+        # Add extras not in guide at the end (labels that don't match any guide order)
+        keep_all_pages = couriers[0].keep_unlabelled_pages
+        for label_id in extra_labels:
+            log_callback(f"➕ EXTRA Added: {label_id}")
+            refs = labels_db[label_id]
+            for page_counter, ref in enumerate(refs if keep_all_pages else refs[:1]):
+                add_label_page(ref, label_id, 1, page_counter == 0)
+
+        for ref in unlabelled:
+            add_page(ref, None, False)
+        if part is not None:
+            flush_part()
+
+    with stage("write"):
+        out.write(output_path)
+    return parts
+
+# ------------------ LEDGER ------------------
+
+def record_in_ledger(ledger, input_pdf_paths, labels_db, backend, hashes=None, duplicate_pages=()):
+    """Store the labels scanned from this job's files, with their page digests.
+
+    duplicate_pages (see drop_duplicate_pages) gives back the pages dropped
+    from labels_db, so every file is recorded with all its label pages.
+    Returns the files' hashes.
+    """
+    if hashes is None:
+        hashes = [file_hash(path) for path in input_pdf_paths]
+    rows = [[] for _ in input_pdf_paths]
+    found = [(label_id, ref) for label_id, refs in labels_db.items() for ref in refs]
+    found += [(label_id, ref) for label_id, _, ref in duplicate_pages]
+    for label_id, ref in found:
+        first, last = get_first_last_digits(label_id)
+        rows[ref.file_idx].append((label_id, first, last, ref.page_idx, ref.courier.name, ref.w, ref.h, ref.digest))
+    for path, hash_, file_rows in zip(input_pdf_paths, hashes, rows):
+        ledger.record_file(path, hash_, file_rows, backend.name)
+    return hashes
+
+def read_inputs_from_ledger(guide_path, input_pdf_paths, couriers, ledger, log_callback, backend):
+    """Dry-run STEP 1 + STEP 2: label files already in the ledger are not scanned again.
+
+    Their labels come from the ledger rows, page digests included, so
+    duplicate pages are found as in a scan; the other files are scanned.
+    Returns (guide, labels_db, unlabelled, readers, hashes), or None when
+    no file is known (the normal read_inputs is then faster).
+    """
+    hashes = [file_hash(path) for path in input_pdf_paths]
+    known = [ledger.file_labels(hash_, backend.name) for hash_ in hashes]
+    if all(rows is None for rows in known):
+        return None
+
+    guide = read_guide(guide_path, couriers, log_callback, backend)
+    labels_db = {}
+    unlabelled = []
+    readers = []
+    for file_idx, (path, rows) in enumerate(zip(input_pdf_paths, known)):
+        log_callback(f"📦 Reading Labels {file_idx + 1}/{len(input_pdf_paths)}: {os.path.basename(path)}")
+        readers.append(backend.open(path))
+        if rows is None:
+            found, file_unlabelled = scan_label_reader(readers[-1], file_idx, couriers, log_callback, backend)
+            unlabelled.extend(file_unlabelled)
+        else:
+            log_callback(f"   📚 Already in the ledger: {len(rows)} label page(s), not scanned again")
+            found = [(label_id, LabelRef(file_idx, page_idx, get_courier(courier), w, h, label_id, digest))
+                     for label_id, page_idx, courier, w, h, digest in rows]
+        for clean_id, ref in found:
+            labels_db.setdefault(clean_id, []).append(ref)
+
+    return guide, labels_db, unlabelled, readers, hashes
+
+def resolve_from_ledger(ledger, missing_orders, labels_db, readers, exclude_hashes, couriers, log_callback,
+                        backend, flexible=False):
+    """Look the MISSING orders up in the ledger by exact ID.
+
+    With flexible=True (and a courier that matches by first/last digits),
+    orders with no exact hit are also looked up by first/last digits; an
+    old label can share them, so those hits are logged and returned apart.
+    The latest file still on disk (same size) is used. Its label pages are
+    added to labels_db, the file opened and appended to readers.
+    Returns (guide IDs resolved, [{"order", "label", "file"}] resolved by digits).
+    """
+    flexible = flexible and couriers[0].flexible_match
+    file_idx_of = {}  # ledger file hash -> index in readers (None: file gone)
+    added = set()
+    resolved = []
+    by_digits = []
+
+    def open_file(path, size, hash_):
+        if hash_ not in file_idx_of:
+            if os.path.exists(path) and os.path.getsize(path) == size:
+                file_idx_of[hash_] = len(readers)
+                readers.append(backend.open(path))
+            else:
+                file_idx_of[hash_] = None
+        return file_idx_of[hash_]
+
+    for gid in missing_orders:
+        files = ledger.find_exact(gid, exclude_hashes)
+        exact = bool(files)
+        if not files and flexible:
+            first, last = get_first_last_digits(gid)
+            if first:
+                files = ledger.find_digits(first, last, exclude_hashes)
+
+        for hits in files:
+            label_id, path, size, hash_, page_idx, _, _, _, scanned_on = hits[0]
+            file_idx = open_file(path, size, hash_)
+            if file_idx is None:
+                log_callback(f"   📚 {gid} is in the ledger but {os.path.basename(path)} is no longer available")
+                continue
+
+            if exact:
+                log_callback(f"📚 LEDGER: {gid} → {os.path.basename(path)} page {page_idx + 1} (scanned {scanned_on})")
+            else:
+                log_callback(f"⚠️ LEDGER (first/last digits): {gid} → {label_id} in {os.path.basename(path)} "
+                             f"page {page_idx + 1} (scanned {scanned_on}) - check this label")
+                by_digits.append({"order": gid, "label": label_id, "file": os.path.basename(path)})
+            resolved.append(gid)
+            for label_id, _, _, _, page_idx, courier, w, h, _ in hits:
+                if (hash_, page_idx) not in added:
+                    added.add((hash_, page_idx))
+                    labels_db.setdefault(label_id, []).append(
+                        LabelRef(file_idx, page_idx, get_courier(courier), w, h, label_id))
+            break
+
+    return resolved, by_digits
+
+# ------------------ JOB ------------------
+
+def run_job(flow, guide_path, input_pdf_paths, output_path, log_callback, parallel=True, ledger=None,
+            fuzzy_distance=None, dry_run=False, cache=None, backend=None, memory=None, part_orders=None,
+            optimize=False, scan=None, ledger_digits=False):
+    """Run the full pipeline for one flow ("temu", "amazon", "temu_fulfilment").
+
+    With parallel=True the guide and the label files are read concurrently
+    in worker processes (large jobs only), the matcher starts once both are done.
+    With an OrderLedger, the scanned labels are recorded in it and MISSING
+    orders are looked up by exact ID in the labels of earlier jobs (also by
+    first/last digits with ledger_digits=True; those are listed in the run
+    report, which is then written even without dry_run). fuzzy_distance
+    turns on fuzzy matching for this run (digit edits allowed, 0 = off,
+    None = the courier's setting, off by default); fuzzy matches are listed
+    in the run report, which is then written even without dry_run.
+    With dry_run=True no overlay is rendered and no PDF is written: the
+    match report goes to <output_path without extension>_report.json / .txt.
+    Label files the ledger already knows are then not scanned again.
+    With a JobCache, a job whose guide, label files, courier settings and
+    engine version were already processed gets its earlier PDF back at once.
+    backend names the PDF backend (default: see pdf_backends.get_backend).
+    With a memory_trace.StageMemory, the memory use of each stage is added
+    to the report under "memory" and the report is written next to the
+    output even without dry_run (the scan then runs in this process and the
+    job cache is not used, so every stage is measured).
+    With part_orders (progressive output), the sorted labels are also written
+    as ready-to-print parts of part_orders orders while the PDF is built
+    (see write_sorted_pdf); "timing" then gives the time to the first part.
+    With optimize=True the written PDF goes through pdf_optimizer (merged
+    duplicate objects, object streams); sizes and time go to report["optimize"].
+    scan replaces read_inputs (same arguments and result), e.g. the sharded
+    scan of shard.py.
+    Returns a summary dict (guide entries, label index, matched / missing / extra
+    IDs, IDs recovered from the ledger, match report, timing: seconds to the
+    first printable label and in total).
+    """
+    started = time.perf_counter()
+    couriers = flow_couriers(flow)
+    backend = get_backend(backend)
+    stage = no_stage
+    if memory is not None:
+        stage, parallel, cache = memory.stage, False, None
+
+    hashes = None
+    cache_key = None
+    if cache is not None and not dry_run:
+        hashes = [file_hash(path) for path in input_pdf_paths]
+        cache_key = JobCache.key(ENGINE_VERSION, flow, file_hash(guide_path), *hashes,
+                                 courier_settings(couriers), fuzzy_distance, backend.name, optimize)
+        cached = cache.get(cache_key, output_path)
+        if cached is not None:
+            log_callback(f"♻️ CACHE HIT: same guide and label files already processed, "
+                         f"output reused ({len(cached['matched'])} matched, {len(cached['missing'])} missing)")
+            return cached
+
+    inputs = None
+    if dry_run and ledger is not None:
+        with stage("ledger read"):
+            inputs = read_inputs_from_ledger(guide_path, input_pdf_paths, couriers, ledger, log_callback, backend)
+    if inputs is not None:
+        guide, labels_db, unlabelled, readers, hashes = inputs
+    else:
+        guide, labels_db, unlabelled, readers = (scan or read_inputs)(guide_path, input_pdf_paths, couriers,
+                                                                      log_callback, backend, parallel, stage)
+    with stage("match"):
+        duplicate_pages = drop_duplicate_pages(labels_db, input_pdf_paths, log_callback)
+        log_callback(f"ℹ️  Identified labels: {len(labels_db)}")
+
+        tables = match_orders(guide, labels_db, couriers, log_callback, fuzzy_distance)
+        missing_orders = tables.missing_orders()
+
+    from_ledger, ledger_by_digits = [], []
+    if ledger is not None:
+        with stage("ledger"):
+            hashes = record_in_ledger(ledger, input_pdf_paths, labels_db, backend, hashes, duplicate_pages)
+            if missing_orders:
+                from_ledger, ledger_by_digits = resolve_from_ledger(ledger, missing_orders, labels_db, readers,
+                                                                    hashes, couriers, log_callback, backend,
+                                                                    ledger_digits)
+            if from_ledger:
+                # Match again with the recovered labels (already logged above)
+                tables = match_orders(guide, labels_db, couriers, lambda message: None, fuzzy_distance)
+                missing_orders = tables.missing_orders()
+
+    extras = tables.extra_labels()
+    report = build_report(flow, guide, tables, labels_db, from_ledger, duplicate_pages, input_pdf_paths,
+                          ledger_by_digits)
+
+    report_paths = None
+    if not dry_run:
+        parts = write_sorted_pdf(tables.groups(), missing_orders, extras, labels_db, unlabelled,
+                                 readers, couriers, output_path, log_callback, backend, stage, part_orders)
+        if optimize:
+            with stage("optimize"):
+                report["optimize"] = optimized = optimize_pdf(output_path)
+            log_callback(f"🗜️ Output optimized: {optimized['before'] // 1024} KB → {optimized['after'] // 1024} KB "
+                         f"({optimized['merged']} duplicate objects merged) in {optimized['seconds']} s")
+        finished = time.perf_counter()
+        report["timing"] = {
+            "first_label_s": round((parts[0][1] if parts else finished) - started, 2),
+            "total_s": round(finished - started, 2),
+            "parts": [os.path.basename(path) for path, _ in parts],
+        }
+        log_callback(f"⏱️ Time to first label: {report['timing']['first_label_s']} s, "
+                     f"total: {report['timing']['total_s']} s")
+    if memory is not None:
+        report["memory"] = memory.report()
+    if dry_run:
+        report_paths = write_report(report, os.path.splitext(output_path)[0] + "_report")
+        log_callback(f"📝 DRY RUN: report written to {os.path.basename(report_paths[1])} (no PDF generated)")
+    elif memory is not None or report["fuzzy_matches"] or report["ledger_by_digits"]:
+        report_paths = write_report(report, os.path.splitext(output_path)[0] + "_report")
+        log_callback(f"📝 Run report written to {os.path.basename(report_paths[1])}")
+
+    result = {
+        "guide": guide,
+        "labels_db": labels_db,
+        "matched": tables.matched_orders(),
+        "missing": missing_orders,
+        "extras": extras,
+        "from_ledger": from_ledger,
+        "fuzzy_candidates": tables.candidates,
+        "report": report,
+        "report_paths": report_paths,
+        "timing": report.get("timing"),
+    }
+    # Labels recovered from the ledger depend on earlier jobs, not only on the inputs
+    if cache_key is not None and not from_ledger:
+        cache.put(cache_key, output_path, result)
+    return result
@@ -0,0 +1,165 @@
+"""Order ledger: SQLite history of every label scanned by previous jobs.
+
+Each run records the label pages it found (normalized ID, first/last
+digits key, source file hash and path, page index, courier, page size,
+page digest, date). When a guide order is MISSING from today's files,
+the engine looks its exact ID up here (first/last digits only on request)
+and pulls the page straight from the earlier carrier PDF instead of
+re-scanning old files.
+
+The ledger forgets old files when it is opened: those scanned more than
+RETENTION_DAYS ago, and all but the MAX_FILES most recent ones.
+"""
+import datetime
+import hashlib
+import os
+import sqlite3
+
+DEFAULT_LEDGER_PATH = os.path.join(os.path.expanduser("~"), ".pdf_label_sorter", "ledger.sqlite3")
+# Orders older than this have long been shipped: their files are dropped from the ledger
+RETENTION_DAYS = 90
+MAX_FILES = 2000
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS files (
+    hash TEXT PRIMARY KEY,
+    path TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    scanned_on TEXT NOT NULL,
+    backend TEXT
+);
+CREATE TABLE IF NOT EXISTS labels (
+    id TEXT NOT NULL,
+    first_digits TEXT,
+    last_digits TEXT,
+    file_hash TEXT NOT NULL REFERENCES files(hash),
+    page_idx INTEGER NOT NULL,
+    courier TEXT NOT NULL,
+    w REAL NOT NULL,
+    h REAL NOT NULL,
+    scanned_on TEXT NOT NULL,
+    digest TEXT,
+    PRIMARY KEY (file_hash, page_idx)
+);
+CREATE INDEX IF NOT EXISTS labels_by_id ON labels(id);
+CREATE INDEX IF NOT EXISTS labels_by_digits ON labels(first_digits, last_digits);
+"""
+
+# Columns added after the first release: (table, column, type)
+ADDED_COLUMNS = [("files", "backend", "TEXT"), ("labels", "digest", "TEXT")]
+
+# Columns returned by the lookups
+HIT_COLUMNS = "l.id, f.path, f.size, l.file_hash, l.page_idx, l.courier, l.w, l.h, l.scanned_on"
+
+def file_hash(path):
+    """SHA-256 of a file's bytes (identifies a carrier PDF even if it is renamed or moved)."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+class OrderLedger:
+    """Label history in one SQLite file. Use as a context manager."""
+
+    def __init__(self, path=DEFAULT_LEDGER_PATH, retention_days=RETENTION_DAYS, max_files=MAX_FILES):
+        if os.path.dirname(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+        self.path = path
+        self.db = sqlite3.connect(path)
+        self.db.executescript(SCHEMA)
+        self._add_columns()
+        self.prune(retention_days, max_files)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        self.db.close()
+
+    def _add_columns(self):
+        """Bring a ledger written by an older version up to SCHEMA (its rows keep NULL there)."""
+        with self.db:
+            for table, column, type_ in ADDED_COLUMNS:
+                columns = [row[1] for row in self.db.execute(f"PRAGMA table_info({table})")]
+                if column not in columns:
+                    self.db.execute(f"ALTER TABLE {table} ADD COLUMN {column} {type_}")
+
+    def record_file(self, path, hash_, rows, backend=None):
+        """Record the labels of one scanned file.
+
+        `rows` are (id, first_digits, last_digits, page_idx, courier name, w, h, digest),
+        the digests computed by `backend`. A file already in the ledger (same hash)
+        only gets its path updated, unless its rows came from another backend
+        (or an older ledger without digests): they are then replaced.
+        """
+        with self.db:
+            known = self.db.execute("SELECT scanned_on, backend FROM files WHERE hash = ?", (hash_,)).fetchone()
+            scanned_on = known[0] if known else datetime.date.today().isoformat()
+            up_to_date = known is not None and known[1] == backend
+            # Updated in place: the rowid keeps the order in which files were first scanned
+            if known:
+                self.db.execute("UPDATE files SET path = ?, size = ?, backend = ? WHERE hash = ?",
+                                (os.path.abspath(path), os.path.getsize(path), backend, hash_))
+            else:
+                self.db.execute("INSERT INTO files (hash, path, size, scanned_on, backend) VALUES (?, ?, ?, ?, ?)",
+                                (hash_, os.path.abspath(path), os.path.getsize(path), scanned_on, backend))
+            if not up_to_date:
+                self.db.execute("DELETE FROM labels WHERE file_hash = ?", (hash_,))
+                self.db.executemany(
+                    "INSERT OR IGNORE INTO labels VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                    [(lid, first, last, hash_, page_idx, courier, w, h, scanned_on, digest)
+                     for lid, first, last, page_idx, courier, w, h, digest in rows])
+
+    def prune(self, retention_days=RETENTION_DAYS, max_files=MAX_FILES):
+        """Forget the files scanned more than retention_days ago and all but the
+        max_files most recent ones (None = no limit). Returns the number of files removed."""
+        stale = set()
+        if retention_days is not None:
+            cutoff = (datetime.date.today() - datetime.timedelta(days=retention_days)).isoformat()
+            stale.update(row[0] for row in self.db.execute("SELECT hash FROM files WHERE scanned_on < ?", (cutoff,)))
+        if max_files is not None:
+            stale.update(row[0] for row in self.db.execute(
+                "SELECT hash FROM files ORDER BY scanned_on DESC, rowid DESC LIMIT -1 OFFSET ?", (max_files,)))
+        if stale:
+            with self.db:
+                self.db.executemany("DELETE FROM labels WHERE file_hash = ?", [(hash_,) for hash_ in stale])
+                self.db.executemany("DELETE FROM files WHERE hash = ?", [(hash_,) for hash_ in stale])
+        return len(stale)
+
+    def file_labels(self, hash_, backend=None):
+        """[(id, page_idx, courier, w, h, digest)] recorded for a file, in page order; None if the file is unknown.
+
+        With a backend name, a file recorded by another backend counts as
+        unknown: its page digests would not compare with this run's.
+        """
+        known = self.db.execute("SELECT backend FROM files WHERE hash = ?", (hash_,)).fetchone()
+        if known is None or (backend is not None and known[0] != backend):
+            return None
+        return self.db.execute("SELECT id, page_idx, courier, w, h, digest FROM labels WHERE file_hash = ? "
+                               "ORDER BY page_idx", (hash_,)).fetchall()
+
+    def _files(self, where, params, exclude_hashes):
+        """Rows matching `where`, one list per file (a label may span several pages), latest file first.
+
+        Files are ordered by rowid, i.e. by when they were first recorded
+        (scanned_on is only a date).
+        """
+        excluded = ",".join("?" * len(exclude_hashes))
+        sql = (f"SELECT {HIT_COLUMNS} FROM labels l JOIN files f ON f.hash = l.file_hash "
+               f"WHERE {where} AND l.file_hash NOT IN ({excluded}) "
+               f"ORDER BY f.rowid DESC, l.page_idx")
+        files = {}
+        for row in self.db.execute(sql, (*params, *exclude_hashes)):
+            files.setdefault(row[3], []).append(row)
+        return list(files.values())
+
+    def find_exact(self, order_id, exclude_hashes=()):
+        return self._files("l.id = ?", (order_id,), exclude_hashes)
+
+    def find_digits(self, first_digits, last_digits, exclude_hashes=()):
+        return self._files("l.first_digits = ? AND l.last_digits = ?", (first_digits, last_digits), exclude_hashes)
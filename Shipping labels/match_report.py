@@ -0,0 +1,105 @@
+"""Match report: what a run found, without the sorted PDF.
+
+Used by the dry-run mode of run_job ("are all guide orders covered?"):
+missing orders, extra labels, duplicated guide orders, label pages found
+twice in the label files, the orders that were only matched by
+first/last digits and the fuzzy matches (to check by hand), as JSON and text.
+"""
+import datetime
+import json
+import os
+from memory_trace import format_memory
+
+
+def build_report(flow, guide, tables, labels_db, from_ledger=(), duplicate_pages=(), input_pdf_paths=(),
+                 ledger_by_digits=()):
+    """Report dict of one run, from the guide entries and the MatchTables.
+
+    duplicate_pages are the (label_id, kept ref, dropped ref) of the scan's
+    page de-duplication; ledger_by_digits the orders of from_ledger found
+    by first/last digits only (see resolve_from_ledger).
+    """
+    def where(ref):
+        return f"{os.path.basename(input_pdf_paths[ref.file_idx])} p.{ref.page_idx + 1}"
+
+    loose = []
+    fuzzy = []
+    for label_ids, orders, _ in tables.groups():
+        for gid, match_type in orders:
+            if match_type == "fuzzy":
+                fuzzy.append({"order": gid, "label": label_ids[0], "distance": tables.candidates[gid][0][1]})
+            elif match_type != "exact":
+                loose.append({"order": gid, "type": match_type, "labels": label_ids})
+
+    return {
+        "flow": flow,
+        "generated": datetime.datetime.now().isoformat(timespec="seconds"),
+        "guide_orders": len(guide),
+        "guide_lines": sum(entry.count for entry in guide),
+        "labels": len(labels_db),
+        "matched": len(tables.matched_orders()),
+        "missing": tables.missing_orders(),
+        "extras": tables.extra_labels(),
+        "duplicates": {entry.id: entry.count for entry in guide if entry.count > 1},
+        "duplicate_pages": [{"label": label_id, "kept": where(kept), "dropped": where(dropped)}
+                            for label_id, kept, dropped in duplicate_pages],
+        "loose_matches": loose,
+        "fuzzy_matches": fuzzy,
+        "fuzzy_candidates": {gid: [[lid, d] for lid, d in hits] for gid, hits in tables.candidates.items()},
+        "from_ledger": list(from_ledger),
+        "ledger_by_digits": list(ledger_by_digits),
+    }
+
+def format_report(report):
+    """Plain-text version of a report (one line per order / label)."""
+    lines = [
+        f"Match report ({report['flow']}) - {report['generated']}",
+        f"Guide: {report['guide_orders']} orders ({report['guide_lines']} lines)",
+        f"Labels: {report['labels']}",
+        f"Matched: {report['matched']}",
+        f"Missing: {len(report['missing'])}",
+        f"Extras: {len(report['extras'])}",
+    ]
+    if report["from_ledger"]:
+        lines.append(f"Recovered from earlier files: {len(report['from_ledger'])}")
+    optimized = report.get("optimize")
+    if optimized:
+        lines.append(f"Output size: {optimized['before'] // 1024} KB -> {optimized['after'] // 1024} KB "
+                     f"(optimized in {optimized['seconds']} s)")
+    timing = report.get("timing")
+    if timing:
+        lines.append(f"Time to first label: {timing['first_label_s']} s (total {timing['total_s']} s, "
+                     f"{len(timing['parts']) or 'no'} parts)")
+
+    def section(title, items):
+        if items:
+            lines.append("")
+            lines.append(title)
+            lines.extend(f"  {item}" for item in items)
+
+    section("MISSING", report["missing"])
+    section("EXTRA labels", report["extras"])
+    section("DUPLICATED in guide", [f"{gid} x{count}" for gid, count in report["duplicates"].items()])
+    section("Label pages found twice (kept once)",
+            [f"{d['label']}: {d['dropped']} = {d['kept']}" for d in report["duplicate_pages"]])
+    section("FUZZY matches - label ID differs from the order, check before shipping",
+            [f"{m['order']} -> {m['label']} ({m['distance']} digit edit(s))" for m in report.get("fuzzy_matches", ())])
+    section("Matched by first/last digits",
+            [f"{m['order']} -> {', '.join(m['labels'])} ({m['type']})" for m in report["loose_matches"]])
+    section("Fuzzy candidates",
+            [f"{gid}: " + ", ".join(f"{lid} (d={d})" for lid, d in hits)
+             for gid, hits in report["fuzzy_candidates"].items()])
+    section("Recovered from earlier files", report["from_ledger"])
+    section("Recovered from earlier files by first/last digits - label ID differs, check before shipping",
+            [f"{m['order']} -> {m['label']} ({m['file']})" for m in report.get("ledger_by_digits", ())])
+    section("Memory per stage (Python allocations)", format_memory(report.get("memory", ())))
+    return "\n".join(lines) + "\n"
+
+def write_report(report, base_path):
+    """Write base_path.json and base_path.txt. Returns both paths."""
+    json_path, text_path = base_path + ".json", base_path + ".txt"
+    with open(json_path, "w", encoding="utf-8") as f_json:
+        json.dump(report, f_json, indent=1, ensure_ascii=False)
+    with open(text_path, "w", encoding="utf-8") as f_text:
+        f_text.write(format_report(report))
+    return json_path, text_path
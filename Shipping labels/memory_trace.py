@@ -0,0 +1,82 @@
+"""Opt-in memory accounting per pipeline stage (which stage blows up on large files?).
+
+    with StageMemory() as memory:
+        result = run_job(..., memory=memory)
+
+run_job wraps its stages (guide parse, label scan, match, overlay, write)
+in memory.stage(name). Each stage records the traced memory when it ends
+(current), its highest point during the stage (peak) and the lines that
+allocated the most memory during it. The list ends up in the run report
+under "memory".
+
+tracemalloc only sees the memory allocated by Python in this process: the
+worker processes of the parallel scan are not traced (run_job scans in
+this process while tracking) and neither are the C allocations of an
+optional PDF backend.
+"""
+import contextlib
+import os
+import tracemalloc
+
+TOP_SITES = 5
+
+def no_stage(name):
+    """Stage hook used when memory is not tracked."""
+    return contextlib.nullcontext()
+
+def memory_tracking(enabled):
+    """A StageMemory when enabled, else a context that yields None."""
+    return StageMemory() if enabled else contextlib.nullcontext()
+
+
+class StageMemory:
+    """tracemalloc measurements of the stages of one run. Use as a context manager."""
+
+    def __init__(self, top_sites=TOP_SITES):
+        self.top_sites = top_sites
+        self.stages = []
+        self._started = False
+
+    def __enter__(self):
+        if not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._started = True
+        return self
+
+    def __exit__(self, *exc):
+        if self._started:
+            tracemalloc.stop()
+            self._started = False
+
+    @contextlib.contextmanager
+    def stage(self, name):
+        before = tracemalloc.take_snapshot()
+        tracemalloc.reset_peak()
+        try:
+            yield
+        finally:
+            current, peak = tracemalloc.get_traced_memory()
+            diff = tracemalloc.take_snapshot().compare_to(before, "lineno")
+            sites = []
+            for stat in diff[:self.top_sites]:
+                if stat.size_diff <= 0:
+                    break
+                frame = stat.traceback[0]
+                sites.append({"site": f"{os.path.basename(frame.filename)}:{frame.lineno}",
+                              "kb": round(stat.size_diff / 1024), "blocks": stat.count_diff})
+            self.stages.append({"stage": name, "current_kb": round(current / 1024),
+                                "peak_kb": round(peak / 1024), "top_sites": sites})
+
+    def report(self):
+        """Stage records for the run report, in run order."""
+        return list(self.stages)
+
+def format_memory(stages):
+    """Text lines of the "memory" part of a run report."""
+    lines = []
+    for record in stages:
+        lines.append(f"{record['stage']:<12} peak {record['peak_kb'] / 1024:8.1f} MB"
+                     f"   after {record['current_kb'] / 1024:8.1f} MB")
+        lines.extend(f"    +{site['kb']} KB ({site['blocks']} blocks) {site['site']}"
+                     for site in record["top_sites"])
+    return lines
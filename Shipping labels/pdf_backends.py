@@ -0,0 +1,341 @@
+"""PDF backends: the only place where a PDF library is called.
+
+A backend opens PDFs, reads page counts, sizes and text, fingerprints
+pages, and writes the stamped output. label_engine.py only talks to the
+backend interface, so a faster library can be plugged in by registering
+one more PdfBackend.
+
+    pypdf2   - reference implementation (PyPDF2 + the Form XObject stamper)
+    pymupdf  - optional, used only when PyMuPDF is installed
+
+`python benchmark.py backends` times every available backend on the
+sample PDFs, checks it against the reference output, and can save the
+fastest one that passes as the default.
+"""
+import hashlib
+import io
+import os
+import re
+import PyPDF2
+from PyPDF2.generic import ArrayObject, DictionaryObject, IndirectObject, StreamObject
+from assets import get_image, get_print_image_bytes
+from stamping import OverlayStamper
+from text_extraction import WINDOW_PAGES, PageTextCache, region_text
+
+REFERENCE_BACKEND = "pypdf2"
+# Backend picked by `benchmark.py backends --save` (the PDF_LABEL_BACKEND variable wins)
+DEFAULT_BACKEND_FILE = os.path.join(os.path.expanduser("~"), ".pdf_label_sorter", "backend")
+
+
+class PdfBackend:
+    """Interface of a PDF backend. `doc` is whatever open() returns."""
+    name = None
+
+    @classmethod
+    def available(cls):
+        return True
+
+    def open(self, path):
+        raise NotImplementedError
+
+    def page_count(self, doc):
+        raise NotImplementedError
+
+    def page_size(self, doc, idx):
+        """(width, height) of a page, in points."""
+        raise NotImplementedError
+
+    def page_texts(self, doc, positions=False, window=WINDOW_PAGES):
+        """Page-text cache of a document: texts(idx), texts.region(idx, region),
+        texts.page_fragments(idx), texts.page_count, texts.cache_summary().
+
+        positions=True when regions / fragments will be read on most pages.
+        Only the last `window` pages read are kept.
+        """
+        raise NotImplementedError
+
+    def page_digest(self, doc, idx):
+        """Digest of what a page shows, equal for copies of a page in different files."""
+        raise NotImplementedError
+
+    def create_output(self, log_callback=print):
+        """Output document: add_page(doc, idx), add_stamped_page(doc, idx, w, h, layout, text), write(path).
+
+        Overlay problems (e.g. a caution image that cannot be drawn) go to log_callback.
+        """
+        raise NotImplementedError
+
+
+BACKENDS = {}
+
+def register_backend(cls):
+    """Class decorator: add a backend to the registry."""
+    BACKENDS[cls.name] = cls()
+    return cls
+
+def available_backends():
+    return [name for name, backend in BACKENDS.items() if backend.available()]
+
+def save_default_backend(name):
+    os.makedirs(os.path.dirname(DEFAULT_BACKEND_FILE), exist_ok=True)
+    with open(DEFAULT_BACKEND_FILE, "w") as f:
+        f.write(name)
+
+def _saved_backend():
+    try:
+        with open(DEFAULT_BACKEND_FILE) as f:
+            return f.read().strip()
+    except OSError:
+        return None
+
+def get_backend(name=None):
+    """Backend by name; by default PDF_LABEL_BACKEND, then the saved choice, then the reference.
+
+    A default that is not installed (e.g. PyMuPDF missing from the EXE)
+    falls back to the reference backend.
+    """
+    if name is not None:
+        return BACKENDS[name]
+    for choice in (os.environ.get("PDF_LABEL_BACKEND"), _saved_backend()):
+        backend = BACKENDS.get(choice)
+        if backend is not None and backend.available():
+            return backend
+    return BACKENDS[REFERENCE_BACKEND]
+
+# ------------------ PYPDF2 (REFERENCE) ------------------
+
+def _digest_object(obj, digest, visited):
+    """Feed an object and everything it references to `digest` (raw stream bytes, no decoding).
+
+    Object numbers are not hashed, so copies of a page in different files
+    give the same digest; an object met again is hashed as a back-reference.
+    """
+    if isinstance(obj, IndirectObject):
+        key = (obj.idnum, obj.generation)
+        if key in visited:
+            digest.update(b"R")
+            return
+        visited.add(key)
+        obj = obj.get_object()
+    if isinstance(obj, DictionaryObject):
+        digest.update(b"<<")
+        for key, value in sorted(obj.items()):
+            digest.update(key.encode())
+            _digest_object(value, digest, visited)
+        if isinstance(obj, StreamObject):
+            digest.update(obj._data)
+        digest.update(b">>")
+    elif isinstance(obj, ArrayObject):
+        digest.update(b"[")
+        for value in obj:
+            _digest_object(value, digest, visited)
+        digest.update(b"]")
+    else:
+        digest.update(repr(obj).encode())
+
+class PyPDF2Output:
+    def __init__(self, log_callback=print):
+        self.writer = PyPDF2.PdfWriter()
+        self.stamper = OverlayStamper(self.writer, log_callback)
+
+    def add_page(self, doc, idx):
+        return self.writer.add_page(doc.pages[idx])
+
+    def add_stamped_page(self, doc, idx, width, height, layout, text):
+        self.stamper.stamp(self.add_page(doc, idx), width, height, layout, text)
+
+    def write(self, path):
+        with open(path, "wb") as f_out:
+            self.writer.write(f_out)
+
+
+@register_backend
+class PyPDF2Backend(PdfBackend):
+    name = "pypdf2"
+
+    def open(self, path):
+        """Open a PDF from RAM (the file is read once, then closed)."""
+        with open(path, "rb") as f:
+            return PyPDF2.PdfReader(io.BytesIO(f.read()))
+
+    def page_count(self, doc):
+        return len(doc.pages)
+
+    def page_size(self, doc, idx):
+        box = doc.pages[idx].mediabox
+        return float(box[2]), float(box[3])
+
+    def page_texts(self, doc, positions=False, window=WINDOW_PAGES):
+        return PageTextCache(doc, positions, window)
+
+    def page_digest(self, doc, idx):
+        """Content stream bytes + the resource graph, followed recursively (forms, fonts, images)."""
+        page = doc.pages[idx]
+        digest = hashlib.sha1()
+        contents = page.get("/Contents")
+        if contents is not None:
+            contents = contents.get_object()
+            streams = contents if isinstance(contents, ArrayObject) else [contents]
+            for stream in streams:
+                digest.update(stream.get_object().get_data())
+        _digest_object(page.get("/Resources"), digest, set())
+        return digest.hexdigest()
+
+    def create_output(self, log_callback=print):
+        return PyPDF2Output(log_callback)
+
+# ------------------ PYMUPDF (OPTIONAL) ------------------
+
+_MU_REFERENCE = re.compile(rb"(?<![\d.])(\d+) (\d+) R")
+
+def _mu_digest_source(doc, source, digest, visited):
+    """PyMuPDF counterpart of _digest_object: `source` is the PDF source of an object.
+
+    Each "N G R" is replaced by the referenced object (dict / array source
+    and raw stream bytes), followed recursively, so object numbers are not hashed.
+    """
+    position = 0
+    for match in _MU_REFERENCE.finditer(source):
+        digest.update(source[position:match.start()])
+        position = match.end()
+        xref = int(match.group(1))
+        if xref in visited:
+            digest.update(b"R")
+            continue
+        visited.add(xref)
+        digest.update(b"{")
+        _mu_digest_source(doc, doc.xref_object(xref, compressed=True).encode(), digest, visited)
+        if doc.xref_is_stream(xref):
+            digest.update(doc.xref_stream_raw(xref) or b"")
+        digest.update(b"}")
+    digest.update(source[position:])
+
+class MuPageTexts:
+    """PageTextCache equivalent on a PyMuPDF document (positions from text spans, same window)."""
+    __slots__ = ("doc", "window", "pages")
+
+    def __init__(self, doc, window=WINDOW_PAGES):
+        self.doc = doc
+        self.window = window
+        self.pages = {}  # idx -> (text, fragments), oldest first
+
+    @property
+    def page_count(self):
+        return self.doc.page_count
+
+    def _page(self, idx):
+        entry = self.pages.get(idx)
+        if entry is None:
+            page = self.doc[idx]
+            height = page.rect.height
+            fragments = []
+            lines = []
+            for block in page.get_text("dict")["blocks"]:
+                for line in block.get("lines", ()):
+                    spans = line["spans"]
+                    for span in spans:
+                        if span["text"].strip():
+                            x, y = span["origin"]
+                            fragments.append((x, height - y, span["text"]))
+                    lines.append("".join(span["text"] for span in spans))
+            entry = self.pages[idx] = ("\n".join(lines), fragments)
+            while len(self.pages) > self.window:
+                del self.pages[next(iter(self.pages))]
+        return entry
+
+    def __call__(self, idx):
+        return self._page(idx)[0]
+
+    def page_fragments(self, idx):
+        return self._page(idx)[1]
+
+    def region(self, idx, region):
+        rect = self.doc[idx].rect
+        return region_text(self.page_fragments(idx), region, rect.width, rect.height)
+
+    def cache_summary(self):
+        return None
+
+
+class MuOutput:
+    def __init__(self, pymupdf, log_callback=print):
+        self.out = pymupdf.open()
+        self.pymupdf = pymupdf
+        self.log_callback = log_callback
+        self.image_xrefs = {}  # (image, drawn size) -> xref in the output (embedded once)
+        self.image_errors = set()  # images already reported as failing
+
+    def add_page(self, doc, idx):
+        self.out.insert_pdf(doc, from_page=idx, to_page=idx)
+        return self.out[-1]
+
+    def add_stamped_page(self, doc, idx, width, height, layout, text):
+        page = self.add_page(doc, idx)
+        try:
+            x_img, y_img, draw_width, draw_height, y_text = layout.place(
+                width, height, *get_image(layout.image).getSize())
+            # PyMuPDF coordinates start top-left
+            rect = self.pymupdf.Rect(x_img, height - y_img - draw_height, x_img + draw_width, height - y_img)
+            key = (layout.image, draw_width, draw_height)
+            xref = self.image_xrefs.get(key)
+            if xref is None:
+                self.image_xrefs[key] = page.insert_image(
+                    rect, stream=get_print_image_bytes(layout.image, draw_width, draw_height))
+            else:
+                page.insert_image(rect, xref=xref)
+        except Exception as e:
+            if layout.image not in self.image_errors:
+                self.image_errors.add(layout.image)
+                self.log_callback(f"⚠️ Image/Position Error ({layout.image}): {e}")
+            return
+        if text:
+            page.insert_text((layout.text_x, height - y_text), text, fontname="hebo", fontsize=layout.font_size)
+
+    def write(self, path):
+        self.out.save(path, garbage=1, deflate=True)
+        self.out.close()
+
+
+@register_backend
+class PyMuPDFBackend(PdfBackend):
+    name = "pymupdf"
+
+    @classmethod
+    def available(cls):
+        try:
+            import pymupdf  # noqa: F401
+        except ImportError:
+            return False
+        return True
+
+    @property
+    def pymupdf(self):
+        import pymupdf
+        return pymupdf
+
+    def open(self, path):
+        with open(path, "rb") as f:
+            return self.pymupdf.open(stream=f.read(), filetype="pdf")
+
+    def page_count(self, doc):
+        return doc.page_count
+
+    def page_size(self, doc, idx):
+        rect = doc[idx].mediabox
+        return float(rect.width), float(rect.height)
+
+    def page_texts(self, doc, positions=False, window=WINDOW_PAGES):
+        # Text and positions come from the same get_text() call
+        return MuPageTexts(doc, window)
+
+    def page_digest(self, doc, idx):
+        """Content stream bytes + the resource graph, followed recursively (forms, fonts, images)."""
+        page = doc[idx]
+        digest = hashlib.sha1(page.read_contents())
+        kind, resources = doc.xref_get_key(page.xref, "Resources")
+        if kind != "null":
+            _mu_digest_source(doc, resources.encode(), digest, set())
+        return digest.hexdigest()
+
+    def create_output(self, log_callback=print):
+        return MuOutput(self.pymupdf, log_callback)
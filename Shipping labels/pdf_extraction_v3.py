@@ -1,369 +1,84 @@
 import tkinter as tk
 from tkinter import filedialog, messagebox, scrolledtext, ttk
 import threading
-import PyPDF2
-from reportlab.pdfgen import canvas
-from reportlab.lib.utils import ImageReader
-import io
-import re
-from collections import Counter
+import multiprocessing
 import os
-import base64
-import tempfile
-from amazon_processor import process_amazon_files, CAUTION_IMAGE_AMZ_BASE64
-
-# ------------------ UTILITY FUNCTIONS (BUSINESS LOGIC) ------------------
-
-# Image embarquée en base64 pour PyInstaller
-CAUTION_IMAGE_BASE64 = """
-iVBORw0KGgoAAAANSUhEUgAABLAAAAS/CAIAAACVFZZNAAoJzElEQVR4nOz9Z5fcWJItCkK7DB3UKplZ1dX91nvv/3+fmTUzX+69c6u7qyo1ZWjh4Rpyloljxw4ADwaZzCxmFiyrSBAOhzg4gNu2vc3Mr6rK66yzzv5YVlWV7/u1Bc/zfN+HNZ5fefzg07LvmW1gyX4Kf8Mnztc936d/+xsO6tE2rvl3WPObmT3VxhpzpXAR9E+6ZPrMwxFoHVXeGvcma3hjXKXXyEHt7eCP6ft8Vr79v31Rqx3IAZX5zh90nr4xu4T/8NQ6/vbnvSs8W8yJ8Vg6g4CfVmVZmsvnj8qypFFxzKyg24MTFU6Y96au4pafNn33aXjMENmhqg8ajST9U+aDWS83XfZFDw5PEnM/Kzkx9wHBNbQfc0E0HXjE+ErKqqS5BH9VVVmaP3DwqqosYMRo96UMLB8CR9cOt5m3Mlx6djTnixoW/qLvB3K58Bf8y+fLMg8PHUmOg9fOY16bZWY49b1wbwFPoF9q9QfWfcXhE2GmB98M953p3Mv6t/h1il+njc0EMC9Yr+W1XFuQudF8R90+t/XGfM637qezzjrrTFvk/Kuzzjr7Q5h29ZofscvC3pnnI2Cx7pZBH+zWNL7PbpLylvSRtH+s3a+qqoIgsGu8f6Zt8JCqxihY4EVurMVyt/inDTzs7NciSTgEYzLcJsB/N+AKGXyoT8x4j+yfup6qe/d9L/AD62c7gJAPry/7c5o5AXXxxk222/B2iCcYbVWVFwQ4FABvYNjLquRlr+TrJ7DhjpSGONq3dk9KbWxgnP070IiIB8nAQYVm9J9qtzLmMs/rwyvfaANF5pLMQxj4XikzIKDnMfCq0iuDwCtLuneBF5RlCaCMwhK+Tw+aoBaaPjRJnGt37pKZCDo+QHMrgOlj4aUL3swneAsZn5svI6jVt4XjLOblwHep8cqqDe1ns9pLSV5xdJOduSmvQfWRhYjyrdZD4HMN0xYRoLxgYUFFCtpf1O6a2gnXDrTp6sjoAjs02Flnnd3FOkDYWWd/TNsUIW6NLksM+5b9yL91sF/M4bDueH6/KUnoILgaQ2JWOrRNc6icfzcD+bQGmS6D0sATNFSs9XwB1iCu8BDjKO/bMjC0Ax+AnAy4dRDNQYVwo43ppsh9JxQDOwjQo7feIfM7BumYQ/4WehETNsDrc0+eP5GBAkRIkBcILsI6QJNZ5kyjZJmZwsXJHBP2pnaJLkXm1QChQwzy1vYp0XxgDRPae62fC6EW8eY5Q6KQhpy7YEovAN7P9/0SkSEsVGVQBRyWobVApnohbANkYYALhukyLDQCa54/dqCY4DJXX79dhhTXnBPdFlgvAy+wUJFg5vmQkW+EAuSpVC8ZDpTYp9XBmL+aNY4gnB591PKGtHBbfUSTrkkkelWAcJmxoovxKFJWD5nd5Wn8rd+inXXW2R/W7vbS6ayzzn6fdkfJqNmaMQLL1cR9Md629nSNq2M9qdtFSrVY+D9XyNQqGW1uoxe0iPSW3VrAbNaII6x1ouxlurtqCPk0CcN0IsIjx42ueZCuY21MsI38S6v0biGU3eG6Ter2MWa/DiSXzwJRQjtlSQClKErab1kh3HHVo/r2NJS2dfKtPkS8jfo/6R+bekWkKWkNed4WGOECKiV9ugrnI7ou87ixEBF3ChdYeyRRz+kQUPJEUnyB4wwIwggBeh4LRHE/pCYlEGiHSBAaK5INpNbTmMMTdhZoraarKRbOlVYFFki6BJedoXZ6814MfrlNRGoZWSFqBRt/PttIu6n3oXvvDD5s3abtI/s61ZJRrUq99Tmqr1Fa5RrJ2dzYge+dddZZZ3ewjiHsrLM/srX6BBTFF8moKKPAc+SvaXDoZoE1laN21QfETlop+k93VjY4TEw+1Z0zlx9wLkfrbwWZ6HExqjtXziWucwWUVItqrk1OhsjlwxyCEr/ZM3d99poHf7vdonD7tPtov27EiMBh4sqAkYflsALQSDKeQfBjEghdxC6Xviltj8bZublCyTEgVOiYSNS2G2E5GcOCwVXUtjTX1TJiAVCQzkrAVvxIKeIRPilBM8qCWlqHKlHe3lx4VZYB0IZBQIODeYWoV1RZrGbcmIwSLssXVsqcmJwqKY2FHG1EK6wpAMjcdYPSI+zn3B/3QavdAVeXgNxbnTz8BabmAP3hSOgFubWch/vOtDtpfMSvUyEYTV6iJGxrKrX2zmx5i0pOpgk93PLK/RJesJ111tnvyzpA2FlnfyxrLXtwF+dAK6PMghRJaW4scNLbkDHYHvD+J2mcbhfQmvOSBThHUxZCVXtxNaOsD2stC9HkEoXTsi6j+JA05EYZZ1L+HNcc4KS3EWZvXnBGwf33R9yFzYUuPo97rhCGwWM4CHgffMAwLJuE6yKGza3NY7WR5jxZhmfAOQJvBpaM1swCbWwCJfWRd4bJSjmdc/448qqt5FJdfGr+pvsOulGznZxfqFg+3y8DxB+sFDWFZ/ARZu2oiEhhATIOA6IUYaDwI1jgYaFpbEhLzXjxJ+bPeikUfmiUhrk5IRkB1SGUOgg/f2Y/Xrs6umXPztjdzTTJ6TyhbSLSlpxq/VHt3XvX02mDxzU22zmYG2yq7UWv6UjCzjrr7M7WSUY76+yPaA00eCfJqHzbSEZbHaOPNN5RC83i/UZWLyPRiuLICVWlOIR+sfo9I/VsOX2Ta7Xp6O2mDi0OrfB3tiTJZjrO8YzLktgDEiU6dTs+abRlcIqiAOIuCIqiwL95QR/rrgvIRJFAlPfjeUEYFkVBa+Sj0qyRj4o8r2prisKrqjAM9bcgm06vwYUwCIraGtiG9hNyKlcYkDITPsI1YRCCYBVOOdi0w5DW+HR0uAV6Y1GTlkZ62hyWqrQYbNN9as5YOgRoUIuC6USSlTIIRDrRgAqW3fqkQRXJrV3gEIbSPUoxFUVASfhCT0l1xrRBTcPLfLV8RxhAkYzSFdlDmNRN2ZqXahirUaLm02FhPaCj3pnuRrxvp0ipWtNaonmT3akWqKqNJPD7LkrRDg121llnH2UdIOyss38Jsw6T0S+1Kg9bax60bWzLn9y6MW6quJbf1k3hU21e6ebrcj8ydS+dbD3hQXys+ui6fWqc7bCaeoYOkaLpIK09s3lb5utOftpvaMK8IeBhEEInBzU/ye9sR6F3JTAlddCoFlVCnQK6JLkVjosrcOAC1VBxWEGkv3gNnTZtzAJd5gmJFSSlJU0SXKBgAYg44aBu3U6t/G1ejlbzCvyT1EEt9hPBJ2EjQLkkT20nDz9gcKz6AuUZAjLkW2kzBy0WpH8w12oJb0v1yTSGkXFV36KxlafAbZuB+2EtNOcNOow3ozwbLaLXhYsb+QKFtjWzUj7jZ6/G4apKrb/MamCP3wku/NOyCFcXqoTlH0/pG7Bb30au3KlFvEER0FlnnXV2Z+sko5119gc1Q+7pOpZCAjjbkAF74MpAa/tTzipUuUCnsuaZtZ0EOaaftyTE7caOk1Z6ShsDu4VwlSohTeM4XqiXfmFJmyg8oX4gV/m3O6ylF0pFDoMA0EesI0NJaMNCl6pGKNmv5O01Y4LuCBjNoCSnqSHmi8U1BIE2ktKNNe0L5YaP8AZiZ0ILCD0k4uhM+AwNbwZMn6nbyF+XQo6qII1BQiTyFYDkmfvJCXvq25CtR3OCU+9kATduPXmF5zX5piq08GeWgDNkm5HP3opuBJsBrlWaTsQk/BG1QKCP1FXT/aTKNcyQE4omSGkuhJA2AWxuaMH1MGmWiq7UVNXlGIrJYVSlVQ1Lbx7NWr1iJzZlZz/PO1EKGwU1A3UhG+FU6COd+fwJD86t5N4t2tH6C9aGzu5ktYzBlrOgF5kKo2zQwHfIsLPOOvs46xjCzjr7V5WMtmUbNjjDen7Lx9aZ3KRo+vWuWfmO9qKc7cyaZl2WJvZj9Z3yZT9NkrbxTcvevlvp00hG7Zo7QGqkg2A/qOcEXsURdiplZhiGeZ7rhSiKiqKoUH6ZZVlVVVEUQU5aUYSYWlbQQlXleR6GIX0UoDITtqmtKcswDAmeEXKgNbTA1Jz5SGp1SvlN2Ua4PliDKKIsCl6Dl2YRIKXGmQUtKKVTgkszNVdIUKqVpbymqoIorNQaGrSyJMgBX3fYWg4HsAQacRRShXBdINEMQkiDrLwKpadgEYhR4aMwDAu83igMc7wWuAV57uECSE+9KoyiypWwkhiVVLvCzbaqSbUqFce2IKjJlCxyvDRtzBqDumjmCw/mEGKG2LSbW05Yz3MTi3GYO4bBzHjz3wIU7VR3FlrT8mw1H8UuStiFHydDTH4076q0o+6LsSYHVderUd/dJaNN++AbspOMdtZZZ7+SdYCws87+FSWjsl6DwzogbItt11Sgdj91pehtnSd+DWuwf9Yr3YT6PiwZFZaMnFf6VuNyPqgBawGltvgn/WEVdLZh/EdfP/9n9IG6I4M5T6vuw9qUBq0FASQJQq4gQo4iz4MgCKIoS1Mf0VFqFtbrNYCWMEyzDLlMnxYIWxL8KHAhoDWYgUdr6BC1zMA8B/haywwkzANISW0s6IXOmdbY5ENckEMA4jJrdPofXUVhF3DjKJL8Rsr6kzUB4lg6H0SGCMZAMQsjREiVynviEMJ40mDSAm0cBCGdRhgElEJJgJnOk0hOQOAojo3iiO4ibIMZhgAslSZW5pVNNK0l6G4GAzLx6oBQGlqokiUEaw1vrkGRLeqDl+xIeYVpdE4Gj9pSs0dPTuT4UHnb+ljp4JTejf1T9VMU8Gkfq7viM7yEDTpw6cTT9s40bSZbNfmfUgXq47e50wV21llnnTWsk4x21tkf3OqaIuXYaaKj2ZTaOH8s6zL7ES+QE7E2B5W4NmCt4cKvc4FWxii+oyRENd3Tui60qZPE6vxmDQ6b7ixPl8c7dNxxcU5r41OXERpKsK0txMc5dtJ3TrUWMAuOc28unEpN4kJpVJcmxQ6gS4EGZ5BleZrSFQKRiAtpmtKugFHEe5wjtRiYNbbeCfJ4LOlERo7WUKqb3BQr+zQ99ySNkHg8uC6zTVkUVMrF+ZYW/apbSb35ZKCYLFJKTBBAKj6HcCltwNmDpvkEoj/7ETWqQJwGOwsCQHewEIbUNoO6aAD4gwXYLR4L0A7RhgQafT+IIiBXAz9AHGg6DZrMVRYJVlwWtdT1UUVxKhPPdEGU0aBz3lBUEy/H1C2Fh13aYVgVp8FmChTZQjWEJAFC8+wyzRKhXYYTMTGNVWoVMlseRuzgrlbw12jP8toR/pAV2CwZ5cYdeAosTOURMmptreDdiM1oz1wdpw1Fum0nbCcJX2pxcY0cl+H8sLFSVLJhNzR0vcO7t7POOuvs46xjCDvr7I9sNcnoLbLSGpvU/PodlUhOccsWRdPnSSbUKUmyxvztrHEzlNpPvk4hMgnAn7n0C6vUdFkd9akegXYGctNg1grJ1M/QlJQsClB4BiAHhXKRSocJp0SkFnQVKEofqrBUgvFA2BmF2TrN8wx0oXmeZRk66kGW51VZ9gYDUo32e728KPIs6/f7RVGkq1WEuGK1XpMqcrVahbhmTeDQ89brtR+C2HK9Xgdh6FXVOk2J2cvSNE6SsiyzNCUWcb1ex1GcwxEyOlaWwUdFUeRF0ev1yrLIsjyiNXkRJwku5EQ55lkWRlGOVxRFEaxBFWuR52VZJrgxcYzwQVHEoMAsyrIkWWxZlnEcUY5hksSwn7IEJScA1arXSwhhxsgillXV6yfEjiX9HqHYXq9PtwkWED9EQUiPUhTHgPQqL0kSQkG0pvK8OI4pNy+JY7hTVRVHEfn0vV4ft6mSJEFsWcVRTCmm/V6/QLVn3Eu47A1OkpriNAj8KIrzLPN8P44i5j+RcsTqqXBHpPypkb+WFJWg/UBWMIlRaQ1+RNVTncQ2ExJx0g5pwWBvlWpqyba6dl0g4q3POB6smcdLD4zTMUJwsRCn9Q/04yk7EOW8uS6DW005HFc76ihF9ZpGmRndduKODOFdwkB3efd2PGFnnXX2CdYBws46+yOb5QPbkEmt8EyLflL4KwF5typFJbHnjmKnj7gQ5eiQLtLkIHGOn7ihLjHYXpt+M07j+iLY+I28WblSU7yjmeDnLtQ8s1ZMrj66g5JNSECs/0GlI8Gnh34DpNXMIC0t4vS/wPfSFBYgZwxwo59nKXzL99NVSoTVcrmkqwBQB8VayhwRER0hS7P1alVV1Wq5XM7nvuev0/VytYrCaLFaLRYL0o6uV6soitZr+CiMovVqtVqvoyjK0OI4hr/yPMY1eVGA0DRNAcD4PiExbN4ABw7DAAAuVCsBkSRVtjR3kAgiy41oVTPKFbniqDT/gPxAxbFYPMOMGxWGEWcdxpC/LreRkYBdRcMFalIk/hCMBTApQBsb0oeE8QI/6MVxGMB/SdKL4igMw16/H4XwaRRFUQhrkiROkiSKoqQHFkVRHMMa+DNKwhg2BBSKTCYeCI5LOlJK2vQ9HwhGvMYojiq414A8aQQiVKXC4Bh5qipbZCeySDpNUVZT9kY//lIdCskvCj3YuSkpiBJVqoVpNDpq3Er9ZNSjOULQ2xcIT4naoyf3SGrz0EU5aFA1mxespzCr3HdiE027jPrD6FxOoxGFtFqti9dvEeffnjS4aeNmCnQHBTvrrLNPtk4y2llnfyy7S3PkWuX0tli9oyZV6XNa0dSgBLX/83kuhbRbui6+OT1xF/k6apUSRTKqugtqFWi7bs1WoGTG1FawtBhEFRGREagtbGIOaxf4IQeOQIrxs7GDnFTDxIw2/A9S/jJIb0urDFkyoNMQgOEy8G/AsGVAzeG2+XK5JO1lmqZZui6QtZtOJsStzReLFNBeOrmZrpbLLMsWy2UGtWd82Hq9rqoqzYDfo44UaZaRCjRFWWnlFjURPEuDzB0gDG1DRWIAQyHiNj0PAf2YVgxeWfEagkR0c6i2p4Bt2pbgMm0jjRx4aqpmDwwsSI+K2ktpU8GFNE3tV7vGiPRo6pEUsyhySA6kW0k7L0tAbMijRiHAPr+qCOb5QRCDJYAb47gHZGDQR0vieNAf9Pr4f7De1nir3+slvd5wPALaEPBkL06SMISdwiEIFiK8JKCYJAlNKT3JKdoTmrgIjx7T0ZZS03JQuDmS6adrELtrNmmhnecLEyDNO8GsQSWvtGpsVgNWwR0M9yi0Sd0v9KNr9dtuWU64R0o3K0dnNacpcxqYlwOl1yLvb7pokCa3iQlrj6xNtGbxKp43H4LeiPyCdZs66tdvTQV6R8loKzL85aG3zjrr7F/TOoaws87+gLap0L9xE/0PAsLmflqdjKZIqSYZrS3c6eSFoFCN4I1LZb1Dl3YjD5IRlDl5+pMoRGn59oGTaBOnOQSRq0BzF+90fe1HBPEeFvyk/u9U8JPloFRgExcQAEJFkwogHdSAmc9neZ5XRbECDFis16t+v5/n+fRmEvlVlq5ns9lsOl3O57P5/GYyuZlOV6v1fL5YLOAbKwR/RVEuF/MszfwgSAHrZVXlzebzLMs93wMpZwmorKwqqtQCw42oD0AnZSGaki2lqfgixTxrhV6ohGmtBGgUx5RwKAU/odgmVQeFb3HVTdomimCN3ZjkoGZj3iaOi8YO9dFbj2WAShVFsZRL1bVJYSGm4p841bHUZxRRtVJOTqMyM1xUBgEPQEMEY4TfWEGKNGMvSXpJLwz8Xq8/6PfDIBz0+4PBII7j4WCwNQRAOBgMdvf2hoPBYDjoDQcAGfu9IIp6vR5BzX6/7wc+IMUYLi0C/hCe60F/UJVAI8cJ6F3pWvwAmMwsg7pBURhleUqpjCgzBrCJxV0BZlpcvdngDpOslAEe5q8qhkyzgrVOkjV9qQofOA+i6aZopAfySKoHr84Zmtea/ozk367U1HnChRWku0baWvMSqD20bUmC0qLUfa+6r0H3o7bk7XbjU/u4t3FnnXXW2R2tYwg76+wPaLd4BrYTmvl3HQ+6ve9sPXflQGl6sO2IbhUbBFMNMFbHZjbczyF6+Zt6qFl1GWr7mLqRc1GsQo0erZ2GyhRqc8XkQhSrAMbFRcw22pf8DB4YVwbFPwH8sOtMCKqAvgVBnuVEZeR5UXlVlq6oVcPFxWVVFvl6uViulovZzeS6qryL8/Oz05OqKC4vL68mN2ma3Uxni9W6rLzVak1wKM0yAFFlmSOSBLCH+K3Mc5BxYkVN8tFzBG90poSXeMzxvAU40f2ygBB3TmNEl0Nb0gIRdAC/qEiMKQCjtyHWlxL/Gh8BNpM1hAaJYJQdtn7Lft39yLJk/JHzdb1QUFFNo1jGjyLu+WEUjSRYNSVJqyAHqEVrCOdTAVICyTSdgFGMYx9BI4lLkzgmMpDoxCRJ+v3+eDDo93qDQX9nd7ff7w8Hg+2dne3t7dFoGMXxaDzu9XthEIRxEiLupbRAyBclpSvUOwWxMWWZwtDBNoS4Kp+rAlU+t6vwAO9y4dv2SY7Jq3iTTQEb5kw18YhFZpohqho4NHVcbc5sTUSqE/oabxjZmFIdLbNIOZxGegokJWUIc4cKswfGaRZK1nfumL9hAb5OvCBH3RSHySpcs43tYXOnAqSqDJiuXNU4sQ4NdtZZZ59iHSDsrLM/kNUTWtwPuSW0q5a0ldzZvSDJXK0A4C15hmJuvL31zLQ7iH6nkxjD7px1gJQviCpJLqGpUowswSB6M1o0h1DEgj4W+WGmskVrdYcaqBaqwWJjqev4affKciOkjGM5LufBIUZBhWeG4KfM8xzWYOWVPE9R7Zne3NzMpzer5XxydQX/u768up7cTOdnZ6cg+MzK68l0na7jKFqnWVFiazvEM+h0w/7h/1CfpSBJJSEwapoHWAXPT7o+0E2SjgWUv0dG2INEoc5dURdL/KFJh4TVRYMPkh3au9xgk+yCqadKTJ0zN4QgNmCvvnNAHU6FUg1UZD2hUn1Q0TrKF0WuTNsBACbFIOkVWZqZszcvWJHErsgT0g7DMCLhYhxRHiDwnLwjAFywLRXO6SHD2O/1hsAbDsbj8c7Ozs54azQebW1v7+5u9weDpN8fbW/3B5C7OBwOe/0+gk+AnZB5WML9jTDhEDMbocOEH/iRCbUEIasrWWjKxTkt3/ZBst0+O6TLNfC4Nv/1wNKhEBZSqVXp5YBATsQGNBnVAy/Pu5F4i3hWZop6yUjZVMKwqP/GdwtiRfwQtaO0Q3z11Zi8W6QGtiCVO0SMPamBzS2yjA/Y7ZLRjxNjdNZZZ50Z6ySjnXX2x7Fb5KDN0iZ6Y+1StBZEkRr3TpUONzvuFvlTDW65rx2DYp1tzZJSYfG2tlwMnT3DQvPNGrFHHI5ThFDOWYtILVmgq02YdEF2QBUfqEnCu5hqu5fXuqUjKQjiTw+YrgIbyufQ5D0Ilos5AsJ8sVjlWbZaznujcZqmV1cX08nFdDK5vrx+f3R8eXGJxV/mV9eTdZpeXF0vV6uqrFZrqOCCu2UqzA9AUQl1NVFRWRRFkiQEMqU+ZxyDWjLPc7sGFZUF6SfRqDE6Nt/jToY6D0oHJOpzyQXuralozsa1Ne6C6ZZRn5Ob1tzykZtvZjsc1Fr/qTUVkX464wvuJm4jC6DeRJBMxKB8RAV1sNwoDCah6yAEuo1GlcYOJIvqoUKIjtVrYkwd9P1eD8jDMIxGg8EA0xHHW+PtrXGSJOPxeHtnezDoj7e29g4OxmhhGA+Ggzjp+b7X6/UgszGCHMeqqgb9HuFTSkfEfhhwGnEc5znMRqj7CvPT1OCBYjwMblFa+WE9tioOVNAsoHKvto+I4cYlXVbSC+100njUVS4oU1Vi6Om122iBKG9b+49SVrlvh3S6/1Szcbe2Ms53IQY3vZbv0sW+s8466+wu1gHCzjr749gmr6JJ8cn2m7xkbU5Cjvtd/tZm16O2Z+3YbTpVU4vPr/XFFmZPBGCqIkUte1CVJDVb1sqEOhlIrYCwNgiba8PcxUilKaQTt2sHVs0LA2jyDgBD5KDrFWGGi/MLr8qz9XIymS4Ws5ubSVFVpyfHR0dHWZZfnl9OJrP1CqBgWVXXN9PFculV3jJdZxnwUQA+8YoQjhpmro7WSKiqBssh2VQtzkaRT+58qLLpSHLZGk24k/vbvqBLfn7C19s57fb6jepKW+61VgBuiKHYSaL6BFp+CLXHGqnQTKDPqAG9HEX0zSZyAfgkDECaCxVEcS20s0cAGccxdUQEQWm/F4UhZCIOBkkcD0ejJImZSNwaD8EGW9vbo/GoP+gnvf5oNI7jBL4Vx34QjEcjKJbj+0mvb+SvwO5FEbSvgAquIWuLTG9G26/xwyVz1Wga+Af/UGwtriKUaItJ0avApiPWHnOpE2OKWlW3PLluEqHpVii4kf6PUljKOaRQl8grnPdh9XFX3K6zaJQtNbJXp7LXB3df33OHCDvrrLM7WycZ7ayz37M1axs0NyB11YbgtEPJ0bab/RXlBLu+hii0ML7e6oJvjmo76kLbl9zoJylNEJekg4TFBkogCrltthyiiyg0ZyjVQTX5ozOA2pmr9pTDDbfFBU5mJbu8INSsIH2uKBC2QQf4jJoH5tBvL8vW6xTkoBOSg15fXU2m85vp9fX1zXw2Ozo6vrq6CoLw5ma+WqdFnuZF6YfB5HpSlEUYBMs0x0OYHvQoPnXUj/y3Il8o446adxNDgyVAmRZWYM/iH9Ln6cnDZS3bppY7Ez52wT3IR3+9Ock/+VsSiQDdbFs0VUCCRof8N/7JcJnWYPdIKJpKH1VQN8gQ4fZhkVsQmsRIuIN4iAJLDXm+n9Ot8bzlej1fUH+LELIRgzCO4ygExNjv97e2xlC0pt8fjkaj4XA0Hu7ubo8BGQ73dnYHw0EYRTu7u4PBCLIWe2ssbRp4QC1HVRnXOjFUFXRNJBmsgVUWYtEmOACmNIs7VO4zCAmEPF6EEn1s10gIqjTVOPHxrDG6eDyiKG2mcXuKnX1VCgLjVfbfpBCVN6YtkcoSVud1al6Md0KGLEitn5vKW5SSpFizFMI1fCq3VCLd2KH+c3V97ayzzv4FrGMIO+vsd2+3S5I2OUYa8GzS1324Vo3JoyO3vck33u6L18ufui0rGAwoL7z15Gv7bHA7utCgoTSBlUE2Q1fW/2jniX1IAE749dytpRlGkJBFtUApyy6A/ukZyEHDcDmfQ5f5qlyusyxLF/N50ouzNL2+nqSLm+nN5PLy6t3R8fVksl6n0+n0+uZmnWbXl1fz+QKaQ8wXdLgM+69jm0GgHIs8D7FiZ17kPZKD5kAPGm2e8WmJeXN/BGqjitmC7J62dlPs7GOsnssKrSNwiR16LEZqZKVAA9IChReo1WFVgWqX+lvA7ML7ClPZVDeVlhvIJeIHUFMUoGAYQs4hwMQgHECbC2iQOB6N9vf3+r3e1vYW9Lro98Zb494AwCIsxFF/0IuiZDAc9noDz4fCNlCWxvOSXq8sodyr7wOXGMVhlhbAWILeGDqUQOHWCphw1JfCVUOHyc2sFccaPL/AcAlXK2VWkGrVEpUtfWh4TG3zSZ7PppOEgeIUGamztQwc6xSi1ZYb7aj5isnl1Cjd0LabtBWbzImdNRfaJKOfOOc6QNhZZ53dzTpA2Flnv3uz1TjbK55vUGZ+yIlh2ZvJ1KNig05NGtK/CQFXW7AHqR9Lykigj0jhfPslfarSl8zpJ6bOsI5mzKIhJQjGCBrUhCF5qL+kSru5OlN/0rTgA0+ccGCIrdjpShG2VelqQVU3L8/PPa/M0vV0NptPJ1dXF2maQ3XQs/OiLM/PL65vZnkOPQDLsqJeEZ7nzabzNE2rqsqyFFkiD4vNANqj/RPytCJaPEVag2cF5/mBzD17edSxQ4iUDg9+BhN5IDPVNSZQc6o0ZVUOm9WXqqdJxJqQgkiBDkQyURhRVRhqeR9g83pAdNQIsdejphej0SgMASIOB8M4jobQ1gKqmI7Go23Ql0Ju4nAE+Yf9wXA4GCb9YRhF/f6AjhQnfZznICv1Ki+OI5okURhxs3tQnyIbitujyvS2J8408GBtM8uSOULBuYXNiUglelXyp9Ut25F3qVrNPHN9KWp+yVhQhtd0JpRiMLbBvSQdbkpl/GizD6Yc9EMq6NsXfvkpddZZZ/8K1klGO+vsd2sqyaS2ptUbaG9zrKqZt3ilEkzX3peqBYrtzoxWkEPa7MlB07zyA3C0IgUYflhDJsZdM/I7g+Ja0h2xOqIoJHVldn3FlidE6Wmj1MTdRpxye5yrgGXqEe9xw73CNAz0gb2DrvEA2LIsTVfLdA2E4Gx6s5jPlsvFJZQGvbq8uLi8uJgtVhcXF9PZvPK8yc1slWZ+BeVePM+fL5ZUhmQ2X5ZlgQeEE+BapAgCC1gPbnFh+rmRNlUy/XQpf+Nst/Gr4uuKZs5OofZxaU2os7NIlWNtpazvsuYPZjZrzE2wVLyQHe4KW4AQD+/LXRTCinhA3/cKqNJZwtwrgiqEf2PXwQJbjHg+gLQkWkPHwjCMqHJMGCaTCZaWifo96FcRJ3EvSWJocdGDXMNBbzDojQYD4AzH44N7h9vbO73+YGdvfzAYIsjsJT2QlWICY1RVMZ+auX/QjoRvKNbOAYgIF8EUvZFaWgCmEC9NUqJNaSXnrKpar1ZOzmrSgJp3UrinNeohQSYbxeJnm+WgOu4FPTPovUqfqVrNJGG1IgPzIvolMExetq0Bvs4666yzX8n+4D+6nXX2BzRb376FD9RVRj+wmzsxhLXC6SxtshBCWETzl3a59LGaKYXCA7j/JkxrcYg9TxGByem5qYka4TQuEHNyrAaM+YpbRgecaWwWX2E9SXJAOW+nLAOQ8AHzBulkCMbCMMrSdVFAv+/FYoG1PAsviIq8WC7nUeivV6vrq6vV7Go+n01upm/fHp2dn02n85vZ9Prqep1ms5ub5Xpded5iuSY5KOwEdHfAKFKHvSiC6qB5nkF1UKwFGiLvlxeAQokYTNdr7T07Gl1be1HKQnI4QCV9OSN/u1i3jfVlh/72Sdj8+l2O9cGJ3brDTd+649H1Sdeq49SvVAaxhm+dmcsGkAU/xNxOakSBZBTvlL/GemkDb0RdKU1B5HBxEhOojCIoMON7PpYtNfQcokYq+YP/hNXQsRClpQn0ooip2yGVD+31enEUhmEwGA6GIBwNqbnFcDjc3dvd298bj8dbW1tR3B8OB73+IAqD/mCAiDKJ415ZlL1+QlfR6/XwrCJoHVNWSQJzmKhLKgJMElmq/KSeaB4zeBJxaJnophuKeyZZKaUQm7xB21LSYmzzsqIvSpEeO8jOH5zCZwWuRihh3y6uCl3MzgJ+zLzPXzu6pRKpLaiq13T0YGeddXZ36wBhZ539zgHhHUp3bqo7qh3NWn1zR2GlE1psZN16SQoS3unEai61WUk7dqvFK3Opg41h+FtFUx+uFSoelel1DuQbusiQGUg19/M8w07i0RrVm9TQrizLm8kVdSQ/O7+oKpCDrtbpfHZzdXmxWq0uzsGqqry4goKgq8VsMp3mRTUDOegqCML5clkUJTA9kIIIJwOQEqFwnkP5GVuJkTICjcNL/CQ7sAhi6QqJKiRPujEmUtzCdtWjP1rTBT+YQPhRG9dMytW03pgmWruFTvwgSLt949qa1llCg67TTzdeO1GjCg1KCMQUvYUVXEzF90IAhC5dpZ4Hs5a7VgrY4wpGsIa6QUjxT8Yo1AAQ9ZAAOFVbBfobDDjDCFpZhIABYTX8DRpUaHGRYAnTpAdsYBRHo9GoD5VpIOFwb29nOOyPRqPxFhSnGQyG/d5wNNpKkl6/l0Qx5ByORkPKZ4RERNt6EQAhDYs+YQnWNBMOGy8NThek7EoJQ9FKqbkiD4qty4LcIw1ajQXXoM+ZMMj+CVWo0SANrFaZSm3S2yNun8dUy0Unl1tmYGedddbZHayTjHbW2ZddONREmmvOkENlmGyTux/E5sPYVZpdoxWqyqhZJTJOSacx/qiT8tfabYLD9eYjEHrplnXk27npbU4CG56hjsS31tmTgv9ype513zr2xqQ4J1AWWKFTeglCs/g8930/S9Msh4aBVVWu1+vZdLpcLLIsndxMlovFer2agN1cXpxfXpyv0uzy8nI+m2VFNZ0v1mle5WmWF2EUTa6vqdvbErMEpfc2Mxs4DgQFqQcgjYzTLJ7xIBerZL+QYIDALeksTkPErqJFhgII3ZFSHModWjh8YMo5rPKtGxMvpO7WLXGKD9jnr7XonpjmjQxOEHZJzliqcFbOoBMrhuQzdUaxnRMwadehbFnODSJGg1sZfWhel2M1BipwJ09usE5njGsxdsBZrwD//NWK5kwE/ethMUpiQo9U2yZArSm2KIygpX0MKtPxqN8f9IaDwWg8Ho2Go9FwZ3trPN4aj8d7e7vj8VYUJzs7e8PROAiCNE2TpBdFAXaCtyNHfSzwWIAFibFm+bsBX7WnVw01wR+kFj2/CkwyIb5cUJWOXSv4QYA8X6LH5f3Ft1GRayZPkRcYENKeVFazXIFoTHVl5tujcq2k8aeYGZ2qCWg/D0PZWWed/UtYxxB21tkXac2fd/sJ+j0Gj+Eqg9B++UEFfLnOaGtfe1Ec6n/Wtmn12ukL8s8aK2ihiUlorMuxGgsflBTeQicaRg6yj0iWSX23y7LAmocEC/31elUADgQ9Jwg48yyKoIH7cjEv82yxmJ+fX5ydnU6nN4vl8vLq+urqarVaTW9uptNpluXXk+t0naIcdJVlRVmB2rOAvwGqFSX81+v1iyLP8rwPJRxBBUp8I0nmaAFpJbjKHLLCgOGRNg+ORk6NjL1BUo4RcLeB0Mbr5ftL3Fdj9GoDq+9gk621axT2cyIaQrSpU9Vnqz1+rUfdZB/k+j524w+GV+QSbvfsazjWzmPBgyRmVhdLH3qN5umC7enQ0jOdQwOEZASIug9sHEfMK3KfhgowGM0oU+WFFaymHSIxaUxyMlpFNAtST6gsGqK+dDAYhBHUpOklcRzHo9Foe3vU6/V2trd3dneGw8Hu7u5wuL29s72zu9fvJdtbW2EU93r9OO6XZTkY9IsCpnev36+qKo5ZTSoLIeQlUmcLAHjUqMPV7lrluaaajZYBKrLaBaN0oEI1hv3DgjjMvzp3ANl4FRQz7ziHJMRh4lXufWy2lb9FAfGLrMkHdj0nOuuss4+xjiHsrLMvzFrjum4EmOPWlhikTlVtFF9DBbo5EQUj4ApFbPLyrafhplRJ3p3+uvhn2rm3O3QoQuWDWv0Y66/k+63U34eVoBsGmpFG5ZVFWWGLOOgGiCUp0jSjci1UsmVyfeX7Xp5n8/kiXa3m81lZVrPZzfXVdVFkx8enx6dnRVlNZ7P1Ol3MZ4vF0quq2Wy2Wi2rqlos19QdPssB+9E+yWdFhSeMwTpdERu5Wq3o/LAvhS1wDywl0iCUBhZA0lkdRJHYle+OUoEKK2xgmrkLium198GZeRKfqLf8dgTA7OzaIpCiW9OQ7I6i07ts/082O4Af4GFa5qRByxL/sCs1mtCcbS1So5btGrMDp5gSnyw/ojnPOnlkOdyAyAcFq1UVVtz0gpSQcIkAzYyw0wNkFYRBAdVruKvKcrnq96Fs6eRmdnUFLS4GUJ50EEfRaDwaj4ej8Whvb3dne3dvb3d7a2s4HGyNd5LeYL0axHFiSq76WZZieVJLa5rIlI+1R6n5g4LJjQcfEK8KVMFXcQ19RrwgQF980Bhx49/miFiwVMbERFOYuMUiM5SHbKvLEJvbFpCTEl+6W4bNS/yMgK3JundosLPOOvsY6wBhZ519SSbl7BRXY/sk2yIHjhNqi8rgf1InHXu6tx9HXCrrCm1gI2sHNR5+jXrauNAEnzV3jU/DSrdc79a6eg618ktwgjk9angN9TysZ0yFK7BJ/DpdA4mXZ2mazueQ5rdara4uL6c3N5PJ9fXV1XQ2n1zDn3lZnp1dTGeLfr+3Wq/LslqvllR45mZyk+dQZibLSdQJUBPd6JygMqlAWXkL2JPOER1w7eTpqj34BzeZM6JZuTagDc1tM0AN/0K9LSW/aYkjf+bc9Pq/qg+uaoNuNRx4+11roZE/vlrjR82K5ul98oEED2/a0kI/F9K58tHWwIbD19Z0vBIncd4HtRMh+YCZWSajDhhwvpXwCMCOC2wbSGsIkBUVzkOUSZsOMdzXIcDmEEUBYmnMpw3Xa6pGA7mIngeZh5SUmCRJrwf/G2+NRqPR1ni8v7dzsLe1vb21tbVz7979nd29OO4tRzuD/sD3Pfh+FFclVCulGlAEokIP1KpAaCIwQ6aw/ZbVgLXO5KRnDZ8bDPsgpq1806OihiRNtEikzlo7yoPv4sFa0WZYQ6erxRduDRhHFf95rSMJO+ussztbJxntrLMvtMW8VIzQDYtN/TjFxSggV/NryTvRwWvKzKnJn0w4vE4nylc042cj5pTypyWjG4ggy18xw2C95JoXrdV3TtkGNw/rY/VWVMmQejBIP8AwhMKhBVTqpzKhANWyLM3SzPOqxWK+XC6mN9dVVS1BDnp+fnZ6cnp6cXF1dX2NRUHT+XSywqKgk5tFmmWY14fupQ81YLDODPSm5y6F6IyWZRlHEZYJzYHcgxYRQEiau8FePpSWoUob5tq5Z53qgEa8qeUx0LO0N4GKbJjkQ0bACqW303G1tNLOPtU4jVOeVzPhidY1D55FdJIoZyM1kuMp5X9chfYmFF0LwUB/EhMVoAI29JGUaJL3hnwrCEKq1Una6aosI+guCJtBMiFeUohgz+RIUpEYFnYSaERZKRwlSZIwisIg6A/6cRTGcbwFHQ5H/V6yu7tzuL+/s7N97/797Z39vb3d4WgcR9F4vOUHUS/pBxHAwuFwhPV1QyoeEycJCq2hySeJSJHJrL8RnFcWLpHaFgYB5AC4DY6GXy/JSy1kbO9D+yrWyF2eRGle33ihbUL6rRr4z2wdGuyss84+xjqGsLPOviATSKCpwjofyOFpS/FZvIeCJ1uhnqpHKDxpO2gZgSjvk4CYgoFMoCmYJ5BDvqQD4VKOxXJWKvQt+TO4b7XQXNf6kfaOP97JIWSE/l9ZIENQlEWFtTTyPCUuLc8BmM3nUw8aBq5OT88n15fnZydFkb8FOyrL4ujkdDpbkAFQXK2w+KcHvQK56AsMEdb5LKgaZIH8ied5WZ7TGOl6oTRCWFnUlBsB7xZuDRGAUonEURC6VUTUDTJ3cEOcTwUTnOGxn3do8HOYwwc2cmIdqsiYjfvI48nVS+iRtmWZboGCGtTxSv1I8zm0nSz/QYoCSwBjBAOf5bygVQUoN8FCLmBr0KzZi1FsQvgDAxpBUUBSLmbhpjirveurSb8PPQ+hzWG/n/Ti3Z3dB/cPgDk82B+Ndw72d7e2d6D34XgnSnpeVYZhlK6rpNeHEUrXcKpA6+EFlL5HJVRr0aVWNSmhRJSOIt9IbyrMnKRXBPSyAIEqZ2KWNkIn4TPG0obe5Qf51lgKdctwYnZKb8/i6s+L3zo02FlnnX2MdYCws86+IBN3sLZSQtRM8dmt3X7f7tdv62hMsECjR9ol+yuO5lMtyMaOZJTpQteEhjQnq9g/SuYxZTA1sbl5gS79rpXzFIFJeYwohSPIiomCJOBM1yktr9N0uZiDKnQ5Pzs7OT+7PD87Pjk5Wcznb98dXV7dZHk6uZmVlbeYz6DcC2jkUnKXsZ0aYDxB0VT1kwhDcgShGCmPKgFm5hIdt820WiQ0CBUXTSeJOsDQ/6wxurWCRCYcQBC/KfV04ENnv8xU8MIBbbbETpubbjCJ7R5n2qAjFKzdJBIxupVOa8+pkhA7+J+6jNBk0g+S5Zxxfpot7WuCnyYRTyL1SAfgFhZmF/RE6MaAIWqkiTxMetAp0UdBqY+tFOMo8nwvSeJeEm+NB4cHe1iMZvvw8OD+/cP9vcPx1s69B493dveCMMryDFoaIlVoWmcIxoZUxkZtnrYbhMjQNLgHlp6GAEuTIn/I98motN3uhS3Pj5GbSr8HSRTU8E8Grqb7ELVqM/Ozs8466+w3s04y2llnX5DZ+i62jIcKUTubkteImS3k0hGFYKk2Iz213d792/tb6IO2nlhtoaZeqzuj6nhKZ2X8TuVINivv3VY5o33cuKx8nkPFxSAIiIgjXSgViYG/itIPfCzkmfmBv5jPsyxN14s0LZer5fn52dnJ0fnZ6cXF5enp2dnZOdQLPT+bzJZZXi6WS9onIkwuRgoN6Yui10ugNXyeRxGVJ2UHGglDPvksg9aF3KCsApoSVWmm55rRE+qL0oRPrVilYRfZma8hcyF7CXdiYwzjywtQbqh8O/tF9iEpM93o2sTWDwy3BbRFZhjPy//1YyaZh7ShoQ/VzmUPfCx3X8wHGg2qc+7WK5C+lzLlmNnGlvckdUZZKSxEUUQqZewhAd8LoVop7I3pboqAcJ1cEG9TtnMQBHEUxRGoTAeDwRY0M+zt7W4f7u9vbY0f3H9w/+HjRw8fHBzeHwxHWzu7URTHSZ9bJoZR5VVJkhA5j6EZ+yhR84zmvbB6WlOA1DD2QNezmoCfZJOKqxg8I8VXON+OMN2dOlfpqiKsDn7TS6+zzjrr7De2DhB21tkXZI73r2o/1vtM8NYE8+qlY2rUgc7943oz8hH6J7YIXq0cgu3yzA2g61XdVU1RXqM4haYeFHxiAwjZKzJwiDckfOuK3+7iJxHhJiI3olGLvCANW5qmdHDSha6Xs8qH2p5nZ2fpej6dXK/T7P27tz+/ejWbLU9OTifT2XQymc0XIG+bTFdp7lVlmqbk7xIspLaETb7UOJrQy56GK0Cj1oVYEQPGGRIXES5y+weqWk+jgaVutBOvJ4eBAPqWW7BAm2nOgZSsGvxpye8mWOgIjFXBFKUu3VBa5l/VWvPH9KdtoQ0GGjKuDbBgKy0J8pNn02TuOXewRRVqCCv1OKpTMhWGdIcLkybMKXa8Ev8jOh2LxzAgpBozxEXSWysEqaihHF1UxtS3ecbxcUAWMQQ0CMgQuhvGYRQOB73trTHkGe7s7Gxv37938OTJk/sPHjx8+GhrZ3e8tR33Br4fDEdjOkwQxYHvRWFINUAD7Jdo3jEtmNAODw4aaQc4hmKK9EpvT5tEjZvY/u+wZ0lRVMO9OaRl21Q4OnlEmGpkarqJzjrrrLNf2zrJaGed/VNNsXNGXGTWawOfxelAaAWiRgZYq3RnSULlWLDaTISm0r4C/2xUgpFyMgL3HMja4rvoOLo5M61ME2RIa0ytFHWhnCD3YVbQusIsWKW4viVRyHn1PS8DLAdAMcuydL1M1yAMvbq6uJlc3VxfnpyczheLn3569f7oJMuLyWSa5sV8NquqMoqi2QK6DkIdigIUoQg4AexhK8JcqDY6d+rxHQSQN0XuHX7L0jC14WHVm7pwzZdSNRLm+uwFOxPHYkONz6wTj5NAkYkt7QjqX3VoXo0TXHhqkf/t9+hfwe44UQWDSTYa/iWjDxNEVJC2aIkpEEuzHOeQ6WNfqy+6+eQsGhHUqAWqrgy5VvySlQjEfLl6WH7uaJlUmPZK6VIsFUr7JUiIxZwQSWJVmLIK87zwAz/NiiSB0MlytZrNl1EUnp1fjYaDt+/evXt/9Ojhw8ePH967/+Dxkye7e/th3MuybDAcAtkIKu7IaFl97HPP6lDdyLR5p+jf1GKR0Z4IFgxtKPwhPcewMVXOQU23CMVrKbpOdM+J0jWqOnM5KJuA3WHCzjrr7De2jiHsrLMvVynq8EAiLHO7xjkenVaKUokZUpyqxDKpVVirYqCghlM3prHO5go6lyDMgoKFbmDctG6mBtMUuVds4e3jI26ZkoMGoN6sSqgxWHkFVMYPQMxZQL+HPM+gj3zgzWezLM/ydJUV3mq5urg4m12dXl1dXF5en55dnJyeTWfzy8vzq+vJep1NZ6gL9TxQlUL/idIPQqwJmsdxVCAIpOqgUr1TKeucAL/cHXLgsdk3ucgiZrOMjXErTbN49+LNzbfToeWt3YYMrCjRkIc1+mgTN9gIDah9qvUt86CzjzELyvRK9exYWTXeStIx4rMTSjRBJshtD5GBaEp+aj+iv9zgAEdahFeua8VNS3fpNaqKlJJmwQoTKMlWypZ6XhVB+VDg4Kg1RVmV+D5g8AZcYQhEXxRFSRL3e9D0fntr/OTRg93dnQcPHxwe3tvZ3Tk8POwPxweHh6Pxdr/f7/X6nuf3+/0Sdgt5hp7nxXFMLD3KuYmNJI2r886Rp4fpQR8qD9fQYP2hgDo2AadKYm8JTrJsYwi13sEmXBrAzy8NQ+/KK918q0OFnXXW2a9uHUPYWWf/VGv68dINwgaeTVHQqt4+3n6k1oiez6QWKmxp/jB+v1OSZNOCDlfX4YF4gVAbEz0a4rVquTEUreccOuuKUWD+jgQLqbmkfR+nCBZl5ZeBH+bQ3h2OA1lAeb5c3vh+UBbF+cV5ul5MJ9fLRXp89O7tm9fzxer07HxyM4e+EtN5UVWXl9fL5aryqizNyK8zXeOrLF3TgVcrXFBOs/jBIP40UEnrvsw4y+iR200FDPWw63vfxrkJ0FZfsEo/3oQmyAbbUMawRvjophaCDJ27o85N76vDhJ9mLsPsPmi6glMtvY/YJEPrMU3YSNnlQ6jbrrZwyj3hxBEJgCIvjUl5YatZVcEDcyCjGBdRKx3J0F9Qj9eorKsqY9019jwk1QCdNgZ6ghCKMQWeBynBYRBmeZFBgWD/7PL65Pxqd+94NBzu7+/u7Owe3js8ODzcPzjY3d3r9QZFMQqCaLWqBoMhvSh8aFDBnQYVVdiScqm7cfiMXetvSCuSZ0AIaBYW/MojNYB52Ok6dcsKp4SsCt4Z/E1lZc1D57wWOkTYWWed/brWAcLOOvunmXYLarrQurwowGLopkKMY268X7WzN5JC7eK5TQtbF9zkPcc1bIErWnpGKyBYXtky61oMKYDQfvU2NFgjJbROlQAhNhKExg9VleZ5RrQd6UJXq3mappPrq5vJ1fXV5enJ6c108eb165PT07LyJzezdZqvlrMc6MToejIriiIMGOOVUiY0h5aBBv6Bb2pOw5ySIfscYkctU31FNxOQy1Q0LryVo61vUkNfGgM2v7NpP/VcVJ0ndmeT4jSdfX4zTyACPzTV8gUmDxTHpPxbAybNVxt8o1ng79pjKKWBKV0qAmScaFhyxclRZHW22QnNcPmoJnSkyqRq9uMTY3g0o/WW7hGi25QGqzTFoL9L5XnL1RriKGF4cX2zcz3p9ZLRsL+FdnBw8PDhg3v3721t7z548HB7e8f3gyzLe70eFbaJoO8F8JZSiRSxn30/tUhJRZErl4/JvRTaohcF1CuGqqzYW1LQoBVj1FUY/DFfpbxZrey/nu6IaYr6tdxxhZ111tmvZJ1ktLPO/mnWKtir1xRV7eN1RheLDOsF7YyGtC22XWsbiNu2O/XipLRgRfqnIcfUMdXfJhGw5iMKAjQ1AFucGzlPIhMwHw8qwdBXOH+vKPIiD4JgMV+AnrNAfWhRLJeLXj9ar5YXFxcXp++ur66uryYnpxfHJ6ez2fxmcj2ZzvI8v7mZZ9g/EGWhBYm+CFvGcULd6n1MicJMJx7t1WoldXAQeDboNb5AjetsaRCpnmPLDFr8WJ8Pel40HUr+qzl6DSKh6UHe/sKvEcLtIQC9n1ZJcWcfb67C0KQMEpWM7BmBJSKraXto7oflSajYlM5PNFLh2i3dpEMgeorLMplghwQf7MtAy5uZzJI8VzdLjtgzJYrk1YgwrWidTowgZRKFFONJej26DLxouEIpHBoEcNVJkgyH/SiM+oPBcNDvJcnW9tbB/v54PL53797hvXu7u7v7Bwe9pLezs9PrDUajYa83CIKgPxiUZZUkET73RZIkVOGFKtAYrFh/imqC2HpYSmcMqtiZUnC4qmCr2W3vXahfDlRzp6626Kyzzr5gq9p+dn8XT24HCDvr7J9mTdgmFV82PZgNhafjSUoqUdN3aYT563lizrdq0jEDDrl/oFqvqT+3kqHDFeiVmzIG5XykkKlRgfpplkIFFsgezKBMKGKzoiwuLi6rslinq+VyOZtNr68v03R1cnxyfHScZ/nl5fV0tryZXE1n88rzptPpap36vpemJFfzsyylYckyogGhcb1BOsx8cH18KFW6lgvVckrCrrWLqt0+QY8WL+skwpZxkGGsyf8+hsEzfJJ2cD+I4GplaVtiFjXA+vEn1hmZHuea06/HUz9ZwqwZgER4yYSKFFHd9pi2nALdzxILw+hAhqBBZ3OOcBBEbFGPq/0C0kKAxQiV9kR1ejWbLYAwDAJq2CIFQuXasa897CgIwzCAP5JeAh0noqjf7wV+kCTxaDSKo2hre3tnZ3s0Gu7v7x8cHOyh7e7u7e8fjEbj8dYWtKmoyqTXL/GZxQxGLwwjVfP4A/nMZiQc7lRHz5TIVpOlpNs3g645efXuh3Ro93XalFF0VGFnnXX2a1gnGe2ss9/ObikfpzvLi0lPCExWafW5re6Le0lLQ2VDEGjfpd4lQuswqWKeVLqztWdU7Tv5rnEbpV6okoxyzZj2HnqbUZDGKrZzIHZ7h9Q+zB/Msmy9Xq3X63S9vr6+nk5vVqvlZHI9nU6hMMzV5WqZQd+I60kQhrP5IoN6oTdQZCKOr66nZVVCTXyK5gP6Q10oFg71Pb+sqjzLyavWkK+qIJuIG6iZyjF3DNtr0F1Xjhr4XicKjfds0i39WxKJPsj4kcaPd6I0h637qTGEzqfmPFoAYeebfrxpcv0DN1GQmPv0mbw84aZkNvH9MdvWJJFOgwnoJGG4QXvETaejalkpSGOOYmAPgyv+QzGE8IzZCW/egaiJNVSieej4okRXgFiNX0bwnBYZ9CAMoHYUjeHNdB74fnx6PhwOer1kazza2d3dGo/39/fv3zt8+OjhwcHh4ydPd3b3fKhIWkRRHIZBlqWIwfgQnhd6mOJLr7Vbnmtb6QdP1FSCJdRrNsCsQlNMVSk3zCCLjEL1OpToQOMh01mf6rXcEPl31llnv6ZVtsB3feF3ThJ2DGFnnf3W1vLQaV2oW25Uf6ueomNgg9kAUYfrzdsFygeqf2QqwCgVqDigImziuL5ySQTaGe+P/SdpI2FrM9z6EhRQmmWZFCEsigJcT+wS4fvefL5I03S1WpZQ2WV5cQHA7xrt/PziZnK9Xq+n0+lsOs2y/Or6mqq/zBfcRx5Kg2L/eCr/UKJUrCiKLMujKCiLMi9y34fCg9JSwuVtzKUBe8CJTwRZb3fl64BqA5XqrDVpY5ydaLvW0xxxi862cHc8eSxeAGffinvrOs8PWffrcBdrIvq7fcvqjeskoYscHFJd1JzEwFGTdyO/VGpMRogOI613aFTdVKfXKVPkMNL6S81ggikRJeVR8F+kvaQeg/S9ss6E8e6kW4PJyzU9ThFiIQSEzZIkIeEAlSSlizUdDe0RsZlh3EviKIoGg/5wOEiSZGs8PjjY39raevjgwdPnz+/fv7+/f9Dr9XZ2dsMw6vf7QEhWXn/Qz4uylyT0zERxTDdV9zNUw6La9uCbsigLWnDatEo6N54x4DfnU3kH61GmwJN9i8prockTbppRnXXW2a9u1UY0+Pu1DhB21tlvaG7HCLJat4mm5pM2MoUWbIf6BgKsS0a1+1ZrKO8whAIOmWBkiMg1HtS+mIRU3eyCMMQ8JksL8EVt0IXakTDnACeGXim1bg+DYJ2mZVnmGRT8zLLs6Oh4tVre3FyvVunx8fu3b99mWXZ+fjGZ3KxBK7osq3I+n69X0DBwtVojDvTSLEM0VBVFTrlJec5VYUz/eupbaMdjgwpU85pOmY3Wca7/sxHqrwNCdvW0wA5Pw27svKjbKBq+cXqaGTAoU+UD7/mPzTbszLtbYaTbvy0TsLa75uhziSZXq2wLCiuZcTMt2D09PoJxZmpxBmdzV3HqvAzMJHZzmHWQSJ0fox/apToYPxxyMqx9NRVWDCAUhQJqR1kwSY8lEP6UB8iYMEziKEA16WDQ930/iZPRaBRF4c729uE9EJHev3dv/+Dg3uG9vb390Wi0vb0TJ8nW1hY9Zdi1osT8TIgE0REJ4N5yIzc+lWgUUAPJg4n14OMJC/RqooI33O/RFKESrHt3KNhhws466+yTrZOMdtbZb2WkgbLpYVApENboCqIbzIJG6WJvqADjPdawWx0ZKlmpBYSkzHThTR0XsJ9BQi5aItkkQUQ+Pdti/i4ustK7cQMJKRyaVuV6tYZKoWm6WCzOz88uLy8mk+uzs7PFYvHm7ZvTk9OyrCaTmxVstgY60fMXizklHOYoAKVoPaJBYAcNpcecHreUUDhQN3fXVyEQ24yB7RTfjga5abhzqR+aFSIdM8cThZ2V/23eiZWR8Z0QbtAiDS7nuJHL2ohmO/uACfy5baPW8Wynl3X9Fr2ycZ/trWVYSX0Ubj0B243GnoQCLqrSiT1Hu6HTpOHWZGB9Le5pmyfOzlXer8gRpD2KWdOUYjmPG/D+2PBGROZZlkEXwzDExGAg3GbzuVd5Jydn746OB/3e7u7O3i7Y/Xv3Hz969ODBg63tnfvw5zYdNIxi2BXGp7iWD8IyIyttsWb+J71/aFUAfWnqJKO7gG/wUnQZtwWbZGVTMqrP5w/EW3TW2ZdklXpN+r9jgWjTOoaws85+ZXPloO4nbocJFX3/oBaxuc0mv8FhBbFaigPJjKsHcibjALG3Zzwd8+qT2oDW4SDllmTXcaW+tuKnFoJCRXig78ihob4RZQWenFd5i8VivV5fXV7OZ7PTs9Ojo6OT09Ozs9P5bA7tIy4vV6v1zc0U4R/wh0XBzCeRftCZEA8D5UlRKwrFKvC4sH81KqaRYCXInAgBoUBrXKjG0qYTfW3M3fItjUngb2YIFbUiQ9167+kPLb7jhgHKtWQJYWui4O0prLdMpM4apshwCYcoU/dks4lKsrFr+02VHiZ5d3rfRk0q7xkJJWx2SkgGYAg6yVltXJowijI3eP1mNOhEhJSyAS+WHhxVNYmEpbRDhoJ8YOjYSdtIBEteQFEU0TyVBaDydMYkAcvADwOuIBqDkhRsOByMR+NBv7+3u3v/8HBvZ/fRo0ePnjx59PjR3v7+aDwejka+F0RxVFVVL0lAUAu1SRN6hmmH8KpU4FD3+KErt01KqXM9Xr9t0YFliultzK3tDQ4k47erUpK3jnINnJsG96xK+D26pJ119gVa1XyXKr+unstTqxfw+8GHHSDsrLPfyDaqQBvB4NYiAa3bqIovDgZpzyFEh0uDmToMEPdDeTzaHRFXVMqNcpaLm/Sy6fLB9ykKaD0GAk6uILpeA8tH/yQoeHp6+urVq6vLy1evX52cnmVZOplMiqK4vLpazBeqTKiXpSmBIYSFsH/Gh75HBWNIl0VnmGUQ8td1bZBdxBQg/LpKfWxvx1FT25rl9qIq+vs1VV0zh9Bsxu6c/NP6zobDlK7Wss6lXSwf6CQxSm+3VjKh+xX4FHPU0Upm2fIYfiCBsOnu1+af7lXXch7shbTok83x2s4Bd8z7NxvbB53+Js/GvhXkjaGvWb98aujFZkXSxZqXj/muTHiDqW2pVJyW6rh6SEXX0BxS0VjaVEajvYyiCJFhnCRJGASDfn97PO71enu7uw8e3H94/8GTp08ePX788NGj8db2oD8IoqjyqsFwgKcXBKCOp5aGvMe7OHnmPI082KxkyToKu01jwhLeq2qnFg/iP5ohKnPJ9e4U9UHprLPOOvuQdZLRzjr71awRQ9JG7n77R20QsWXPSoalJaPtLbNU+orNY+H+fnAm4naxZ0Z7IGSoItaUcAhr8Jzg68q5a/VAHIEoB8SrsigpbxCKhqaQ/jefzd69e39ycvzjjz/+9NNP88X89PRsvV6vV6s0y6Iouji/wMISIfQJ9KGnWYFdIhDiQvnCqqooEVFIPOoLTwUPzcmA/6RkaeQ7krPF94WbwLWV9mleGn+p7TOnFEQDolsZnr2F4BoKR8LQVpIbxe+3qV93BnIWLXb2a1QV4DtF2m0FzuvgW233gV07xlUsN20sYMxMR7O0eXa661va78muuYOCXYfi8Vo02ajWjZJcAzmLG7F6jWI2zXoDduj7ijx3olGNrqoienBoeuHoKhAjICkHVZr9wM/SzDedDD3Pm87AgiA8Ojl5/ebt9nj8+NGjF8+ff/XixYOHwBlu7+2ifABaI0YR9KtAVAhYlNWkGI/bMLrOReBS4BFtiIVIDVSGNvVY4ZmSKe3V6sRQdz41mX9F8mqScFOwqrPOOqtrelz7mMKhLdKb36diu4sNd9bZr2NtioKmW6PfIx+QjDqtpFv6Cm46hOWLyGvjlgumEiEhDex0QLF0QoBMpYkazqA9/aKzAWwsLKNOFRwR6Syf5zmJOSGhLy/8wM/zPEViEGrCrFaXFxfTm+mPP/30w48/vHnz5vj4eD5fXF9frdOUZGZUgxRbxoP1ej0kFYsoCmElNo2gMipSKrFE9k9caUVrmPFRhXmkdmgYSIkdM5g6fcsysaBn05I2VdGHkyytfEsPC5+dAE/jE7vgTnia2izgb7RCQVemK5swzXKH17yefrITKXLTPNpHwNF/qv0KpKh46RawaNR0+86bQZNW0OhuUecLXUJPHZcnQRsl6B4owDqe0ob+drjaPClHSk3K5fYzxOeNUBMGbyyi0cVnaEP1TjERHJzW+OLhlx4+FpQXrMXbUrsljmOa/KgmhYsJowjLt5S+B7BQpA2E5cIgTGJoQZHEyfZ4/OLZs8ODw2fPnj17/vzhg4e7+3uj8Whnfy/p9wcD6G5PZWzKokx6Cc0BUqvSa7MJwOSdjF3ssfWGaXZqG35UTSm+eUfoXZn7qK1ez9noZX9ZuaPOOuvsE9Hg7zelsAOEnXX265pFXG303SY+sO0j1gvVwF5r+QH9kSYGpasB0XTue8pgQFPrXERX5IVImgpzhrbUYd1MphC0fMCz8bI8IyyWZlBBdLlYFEW5Xq8vLy8uzi9ev3p9fnHxn//119dv3kyhg8QMpaQrUHKadhDYPh6SDMmLcoCuXDg2q6DTMzk8ptFzAImCWoFF41QjMDV0d96NVuslgBAGUX2oyQx0zA0gFIaQMxebgro7UEa3WDObqHHWm7/KsNOOQ+t2zQxDe1HeF2019XXzsfq0vdYUwXbI77BfLshUm4W1nQnr7u74k09bk4GiDTdcenOfdzqOHlKeTG6QwM5MAYTCqBt5tJBiknqMEShTtqoZ6CAmndLxJCmRYkBwIdi6BjeSVhgAmUj7ANpKPoTWlEZhGEdQm7SXJHvbO4N+/2D/4OHDhw/u33/w4MHBwcGDhw93D/f3D/YHw5Hne4PBgMrERNiUAgAn7hd2uJkwpPsHb2BXtC8jjmQsniolArRIxIl9dZxOLYKXd7W9BUbb77az/33yF5111tmvaZ1ktLPOPrNpkLYpyfgj98jyKya1NPmjDirxnWb3eSr35yLDOmtkJZR2jUTrTeyZ3IsNUFAAjxQOlWItLOAsAQSuVqvlfAEVRM/Orq6u3rx+++OPP7x+++bnV6+W6+V8viCNFiQBIvtHABDqw5hGEZT7Z3P41EBhKdGgJA9Qg10L13S6l75+qcHYHuNvuMm26H9jKKzUreWuOyK6jX43nctdoop2pplzr51PrSyF8Z9N+Qo1T2o5krU9NJdvSWyjj2uFW+/I1NWQxm3WmjVnRDuqzbdOeLOX1nqgO6B0dxq4mztM8aYvi5wYYzx6S82S0ebN+gS3DEfj9GRtU3VKTFLrXWjmMDrtbZxKqOZa1E4aA2h63pgn0M4/ITQta272aq7fEJDSj0KBWBaq8quPXzV8PuYSsOwwiyOgDb3vlVCEhlFiGEDvU1jM87zIvcq7mc2upzc30+nJ6enh0dHh/v79+/fvP3zw8puv7z98gK+motfrk+QB4GUZcMzP972i2JRHbd8JUA0Vuy9KZ0KMZFUobeUQHvfcMJQjv04tHeo8nrpCq1kW7lGL1RFq1nMRO+vsX90+1FSw0mHQjycJa0HJL/bR6xjCzjr7da1VMqpVi62Cvg0ghFZh0RTjYxEOM5wV+1W1CHSd/GH3SHwsC/uYIWT0Z3s/GzyoCuupenrUuI8ahUEFUSwlymJO/IgqfK5Xq/l8fnF+cXFxeXF+fnpyenZy+ur1q9Oz0zfv3y1XS6waio0jqjIKoxyFoXEcUxGaGiB0Boe9/yoIQlX2Bj5p1MCoJ+a4TGPdn3ZD+OS5MvNgRtVs34KxVQfDBkOoaSKl2WuZOR9kj+Vw+mbZc1C6MlH3yd2WXFZNkzKLjCjehgPccWgnsW3PDBOVQKHeph+aJiVbu2QTUnF+r2XL5tfB47fnadaY+6CfCD2fhWiiNTQL6NrNmdedAVGM3lpVyC0jrBgeFS2y4uQ6yUsDr8qH6u7td7daeEC4fcIGG5hhmq2fTkg2O9iISBo7BhJqMopuCaLou8+XrOrompu34SmwExCbxWPKIt5lur+gJsVpTTmEsCaKCXrBRmi+58Vx3O/1hr1Br5dsb23v7e5ub209gL72zx49enj/4YP9/f29g4Nerx/FMTY/hGspyrLX64EMAZte6L72zZGlwSGkSpVIuVOOuUTJaq6ziHVvUoT8/OrmwXcfJXdB7ozeT8cZdvavak00WG18Gu4CAu8C+b5MWNgxhJ119htZjTbk3BtFJrBDsIFOtA5QgyHEv6FOAdVtqPm+tXNQy/inm4JSA4QtOSqNXQmWEBIPW8NXIhCFFvMo+Ly4uLg4u3j75s3Nzc27t+9OTk4mk8nJ6cl8tViulgT5sjwnn2W1XpNaVPhAaRZPhXAwHA9NCLHATIlukHFzLOti4TcXzrEXYAkHO1DostaJR/UNd7lxoxr3TdOtGmsqJGv/bnW/NzrlmzeuuctWk2erTzinKOVqaAHwG7umNLwWaKoES6iRIeyxzAHbekR1mGyl3eg3lwGY0f4hUoAcLW4cyUWPNkJH8ryltySmeIF7XnkeFC1CRKdxsuyW1sDXDfFC1YYikP/J0VvvpAHymINnAzLqRluAV8NixAfqNa1Eom0cYQfqtrv+qXYr3Ltb4ummPbevZMLL3hHmKO1/clRTLMpAQjMqtZCNi6CcweXCVwL7VcxDOtCUhcwESg+EKVEUxTpNgyDIijzN8+V6dX55cX55eXR6sr+3+/jRo+cvnj15+nT/4HB7Z6fXH3ie1x/0y6par9aQT2hiKBwZaRCGgnqlPg29vPHVw5NHsDpWl8JHI4CaNALmzCPgBLaY+1MjQ3ExeRDM08ele25vfttZZ/8S5m9eaNiGIEv7wi32ZT53HSDsrLPPbL8kYsRgjwkB6/vq8HDbGuxkBVIo9GFRISW1Z/RRdBKgrLGfqdIINWuGzGpSQ+1tZykQfXmRp2maZ3meZ8vl8uL84uz09O2bt69fv17M52dnZ9PFfDadzhfzEuEi+O+mXmhJLr7x3V2dJ6YJ4fVSpo1iN6333EAgpLVVLpSVvDniq1YhH/uX9uJ5OyjLX9udGurN93rTJ81NN3+k2pZo1NAKIEktbMgJPofaCdo6Mb4XeEHpgfjWgz/BPeVsTLMnl86xzIYAQmmIUifE1Jb6HtHGQkoLRJTvanUrrZSNCbpRQlgYhIbz8UvqOWKa3dUUMcwI+T51LCH4QKuwOK3cAK5uwoJreLowgc33wgjHpICSufo85d7VUuqQMLT/tDDVzIlNROMv1PHUKG/3X58TYd5FZ2WpQF5vh4tKW/E3qUWfZuANPWxSdGvHMtEcEbTjlDXLEOPgfchVV1Xhk4iUm2t4EFYCts+rvJW38v1guVpleR74/mRycz25ft/rvX/3/v3R+6dP3jx68uSbb745vHc/TuI8z3q9fhUGFbRXDQPsVchovyhoZrbrSA2BT1y6qgsdMO9HT6B5KQnkaxKwesz1Neqwl/R7RFpW+trXE9S/TG+1s85+das2koS6xBq5GhxPMQvtutA7VCv9cqwDhJ119pnNOHktrrBeaIdqDZlQzWoKIvMnRpl1jRN2fhTUkUPXfLI2hSGl9AhV2HRVUdQJRdiJFSSnnCg+bBSxXi2X6zRN0/XV1fVyOj89PT0+Pn77/t352dliubi+uppDXZliMr0B0Eh7AQwJzhPsGvdPrhK1j5dTELLKvJcVuaqq5nBRCmYV9Nc1lJEB5I7WllXTkk6l4NOJYuzgm3QwB1hudv7ILdN4zM12rMtHm3RxWyTS2UaRzLYBmt653n9zHuJfMHdCwFSmKo8dA+eQt5y57L9JMkscQehEmcxE+gnQNRVQ+N7oc9YAEu4aoj5aYcq/gleNPJ7NTmPn26E+7a23DwN8D1kaXg/KV/SuA+rEAAVEEPwCemAlp2W+yBNnttlMI+arBeI4pDFX+uXbpvCheYrbpeUS5LjdnCmqBtwOpnvoX8fUIyw4REM7c19KqMBJqnh9MqLRtrJZZ1q6CJwaBpp5Ao8pVJwKIIjDdDR+vcDXVxQG0CIVQwo5vojSLMMaMcFqvQqxe+FiuYiiaDK5uZnNjo5PHr8/uri4ePDgwYP797e2t/YP7kEl0uHI8/x0vQ7CMM+y/mBA7yLsWgHnxmpS95bpnwZaJr1rXVQij+KG8EH918H3K8hy5F0TO9vsGtKUFXyu+91ZZ78z871WONfeff5unl7rt75M6wBhZ539KiZ+/CZFgaXvau+ghjUTAmW9jVHJNl4FPs+ms9K+rwGELYiQqJ4NEWhWE5aFpwSi1ANwvVqdn5+vlqubyc1ytTw9OX3/7t1isXj77u35xcV8PptjZ/npbEadJCBpEGnAdL0miRTVkHEGygTRpY+8PZm283P9J0GDwvnoanu2E4TctuaI6WPpPB9NXVAGo/G3a4ewIFzttn25+c9PMZV1ZnmVNufPxaVaiUe7seOmQbX5mq1jpFWTLnNM6Fdaw0m6osNIuIeGZeTgLApi7VzzQhVBTbw2kHscE7EJtUwsieRVxK818KMhGd8Jw+nJgwMfESbk/pZQv5a4VRSRSmsQ2Q193dwJdsbtg2aYoBb//pZ/qXO+s9XmuiPf/fWAoJ43NGGwFbtPXQn1kZnhR8Bm6EH3tpuHUK1ST67VlOLoKp0w79t0r2C2nzvsAAzkB8WDesh0oCgKKzgT3BhLvfhQLRkszbPzi/Oz8/Pj09O93Z2HDx48fvzo4cNHB/fu7e0fbO3sRHEyHA49318uF3GcUPiA5h3Q7qaPvL0G9fbl113LGwPmtoci6la1iB0keaZMyMy8Ezm8ogM3eg9317N01tkf2XwTVJW3i/aPjBjhwwtN3+/LztTtAGFnnf0zjEPj+Ett8kZaitA064VaZ9cW7dD+AdIuLD11csmQ9eH2ViavhhxaJi8akLDlrFHIZ04GWBHAgVmWI8M3n83Oz88vzs4hM/DkdLGYv3379vj4eLaYn1+cU33RqqyiKJovFtCMq6yIG+TkQ6gmD4VFaXjQaWOmS4NYZyiwWF9tcDTjpIabr0jwYSO/q0ay6RvljIDD3zaYWHvkWv2Yzf62Yr/c5oR2RybNrwGfNlkzE7X5LQuN9DoHergBCHWhZmLViUcu6liDaqjG1OffdD1box72nJVuWA8mNCbRX/WgRZ05cyUR1sykVCiRU7X6OpSEKiLKFgPls5CsX/PQ4DqgtdmP57w4Gn0XxdKZtMyED/kIFsFt/kj+uTEW5EAM4XyJHlc0YyvG+EWm2x3QwJZeWUE+sL1tLvxxZyGX7Wk9HeG7TBxCxbjUvlxSFt64NmeR5RWUgBfgKwW+RdQacGxeFQZhUfp5llPtmazI/cq7nkxuptNev/f6zdt7hwf3DvYfPHr08quvHj99urWzu7WzOx6PAWEC0whlZugq/CpAJtJy462m38amgw6qSEVTbYqp6qFobR9Ka1GBCqOos9DNwZxUZgdtd8iws39tyWjVJuyS9IrbF5qy0i884NJVGe2ss1/ZWt8sbX29CRTRa0TeO9q9ri/UcuGa7crZbzVeDzqBoHTTZpAhRc1rLyqmazBeD54QVhANQ2gHn0MoHVRz63S9mM8vLy7Pz87evn3z9t278/Pz6XR6dnp2dnG+XC6nsxlXl0FNKRV/x1B7TiUc8jwnaSi1m6eTkFIQmBJmz4cunrgmbvesAuEOL1d3mHA0IFrPWjLXZWrRcTULWWicc/vL8/aeCmbZkrUWojcwkl5juBN7zredhsJRTUiwEYrYyh48FWunJNiaEM4mT33TEMkvq84MlPVWrNsmq67tRH9U31jRofaSzSRo/boWUSvML5QT79WcI1Qigd9QaIrHtLYU6OEp47JjZkgdHts+1Hx/ms9wE7K3j4ohcZtVqQSjSnqwIkIpJVK9Wz4q9PAJVveH3Cd342b2vGQD53mhq+O3G/fxs4S1/r7WIosunbWdYYT3s4yThNrYUBFRKtAir05oXRjHcRTFcTwYDna2t4eDwcH+3oOHDw4O9p8+e/746bPnL55vbW31e/0wilEsGmVZNhgMUGxPIlI4BSgt03z51MTDWKtZ8GFr5Wr3B0KmP0Nk7MLKFXd1QEC9FuzLqPZsfrH+a2ed/RpWtWo+tfRDvVCdBcF+eo3+tfqyq/l2DGFnnf3KZjVNVpHGbqHh8QTMWVDHJeZgUVRwdS/NjT+pY7EvIe8gCZs30CDrQp2YujI5YqkqiJbQTCLI8wKy/vJ8uVienpy8f//+h++/+/GnnxaLxeXV1Wq9Pj8/n81nmFWYksfM7SKqKi9yaDNYVWmamoRBbHHAjggfHIu2YOaPezL6H86J0hpzKa43o9/EJUbM65fbgiE1hWFvy5185U0bNLIHeVluiO6RYGrqcD6nFF9ROkmbEiYSO8m7M8dsgfqa9XLPj6gvMxf1YKsBV962RWK6DKke8E3wtYZsLeDfPKR8jaY26W3jLtBOD7299BYgzcprlZsqXzepV1IVpnU4lU6cq2faQ6hSri15JPpmKZlsC2yvTR5VZ4QEq5a3lQ4g9IdBSvrs6auYtCmkaI0D/xVsU5jAXOAtHpPzoa7VwnPeXDS9TPgD2d4cyTZdNQ+ggCET4ffzPKfhwNrGThWiMAgKIw4oK5A65HlxHd5cXU9OLy56SXLw/Q/Pnj178eLFi6+eP3z46PDwftLrURxhMZ9D0wuq+onvN/dRdU9VXTAGjGBGmAo0uDvLYssw0pufVNwmYdUlD80a+zOh42KtKe6ddfavY36b1LNFdCNUPNdPNkrRquXrZtfel2wdIOyss1/fpKF8U0hAbCEr2cSnlzVQKgYQka2VomAk71m1R1dkBjtI8pHKG0QcyJ7ULe6Xw4aB7wPlM7ARBJzTerVeQnv55dH7999/993R0dEPP/5wen5eVdV8Ps+LYnIzybLM9/28yOFiAPYx30hNAipbShI0XOSQUhKWpWJa2l6ba1R+q3L6Nl2OS6SQitABMnzJTZ6QjqIzKn+Zr+SgM33H2R9tZa4UeagpAnMBdcKZvuEAt/p41BZUHR0unYrXjW41HrHNd3THQh+kNemvul2/2hypTV6pXu/WnNTHbJszTRq9dn4Gi1mu0kZxBGwYd5wO37ZDKZlCj6gCLZJTWjtVxcyQ7+/EHXTLRLNGY4mGDJAngBoWNbUM0Nd40z5SFIZw6t/8MrNs5GfZm/s2s/merXEcN4+uMaVMN0kHmNlv0HsYnwiWZBjQDRl9ZVGAGDQD1bzneTc3N9P5zPO8d++PXr9687f//tvLr1/+x3/8+5/+9M3B4b2t7Z3REEWkeRb4ARCPeNgK29MTtP2QiJRP1eVJLRtIV0Tz03atwPNWxUWtYL4WndH1lnQ07UsWuXXW2ee0aoNS1MmjaG8MpgIuxtNrIxu/ZOviQJ119iub20ZCaskYAsa+QWqSLQaExv+rhe3JQ3c9vpo+DiPQ6nddy0Q1Udg8ZfIItUAUlwHFrdM0W6dZlq7X6cnR8Y8//fTjjz++e/f2/fv319fXaZZNJhPg/aoqyyFDsCiKMIogNZBqBgrExTNjHZTuWwDVF5zRcOq4CInUkLcJarK8UIveSVgIzRDacWW/WQ0yI1Y1UrCmHWN9hNUKz9A9gSZm6qboEdBb6vW3O20tQNFcnrOtFDaxkMiOi4QE5D9xtSWX1bkRptO9WWkQvZr81uNEb7g5MrXBcht1Gv6S/GnuqFH/epvi1NbZb26sR5K0h1ZkjGugPaOZoop8qzbTXBakbUiB4/Mnco7O0NxqZ88GgxjxslOxwJkq5n2jAtI11M4h7RqKUJeAzyeFbPj+/TIsV3v8akPWSka5sar6vL7lxUUfm7kpOl56LVgCGtC1AUv8PjSCbRlM6qBj5f3Y156OIAv0IqXlIAwjSBSEMrlJksRhkPR6e7s7X3/98uGD+9/86Ztv/vTnZ89fjMbjJI7jpIfPe1wUZb/fo0ifiEhvTy/kazB97ekquFwT3D6WlBtASLcAZpYdWJmgtWgUX5P9sXA155119ge02wBe1aLNrrXtZfgnD1GbZLSpFP0y8WHHEHbW2W8ddpJmg82ug7IgvRYMMeiAohZNkW3tbLwoBa5MEznrS2kHSJ8nvd0kcZEQnedV6xT/W6+KPJ9Op7Pp7M2bN3//+9/fHx39/PPPN2hpmoZhuE5T8iah+ijubb1akRtoW31LMpMuo6Lc9OYr1C3v6cTDnY0oYWZjrMtwX6a9oc6G4y0YuRApqsCP8TUNffDLOncbrFXzQdEbY+AhNwKcTnO/NoXw2n9dRLQofqAZZxVA4H+L+ozWuTpPmq5EaLPnKfDQhVW8qb2JvB+LwohptM0tW5JXdYE3HC4XELchW7W5vcg6RSbecO1f5iEyclu1mQ4SGH9ayZpVGxe6Y+p2MAgx8Ia2r52UaY/Cx2UNZO1utgJCxpNGWeAytwZTUi0pp8eAuQebIhr1ed2S7fyxptBHfV93CEk7s0PDYL2Fg94FIWsBpYQ6Gge0b0x1FHpJmgmPVVHNJE+zlDYLw4i+FIRQeFYfuozjdZZD5CzNfv751c8/v3r79s3Ll18/ffb8HhYj7fX7Q+xRsVwuQUQKewYpvrwTNvmLVkTKtVLt5JOmhfzkY797VrspKCihnPrvjrzatJqikXDbWWd/JLul8qffFmPlvygOqd6W4okJJlTh+Q/v+UuwDhB21tlvohQ1pUQN8+eEl6xDh5FeWYOxXwj5kmsCxJ2psMKOpPIHqN+a8iappDrqhVQpURP6bbwHJevGiBJJ21mWRZpCZ/nFYr5aLac3N2/fvDk5Ofvvv/3t22+/nc6m19fXQRBMp9MggEILWZ6VkF3IOYdUS4a1jtQ+rMIIvaJY4CRdN1TrHVtdxjrPYC7BFlOv4Wfr4mhFmfH8VVYnjhJn38gJ1PSmPOxGWvkRU8KlivSvgtHP8o016lDyaKGhnopBbnSim3pXuWoDE5iLMjPQ7olnYJPMUj644vLoJ1GqjZq5bbp6NCAK78FsZc+LpzqnBVp4Xk84JOgoxfRt/MIJ0DK1jpNeXQiL/qhdIABsc4fpPMPQzCA6QzlZF0bT7iTtVgTLnJkn+JBDMBa4GthvCq4a6G1uBLvhzA/WnkyzglkuN3RC3RTsC4TuobnToqgU+ffGMIape9ygZ506OR9lMm0oLnHrzPU2E631jzS8rJ+Ygr3MPOv57H6F4hzqEK0umn1mMJfb8owkcaABLitQUhApBxmGyC4WZblcLuHb197F5fXV9eTnn1999dVXX3/99dNnz3b39g4O72/v7FKxLqxDGlYVi3WlrMuHRKT1YYLnCKJdWC83ELGy3aS9naWhUmsfNfn2L9OR7ayzX6sffdWsLFDXhcp6/aDVv/57IAk7yWhnnf0qVi8lqnN8DMtFPFNND8n8i9E82X8KM+OoI6VsIK8SzSQv645nbR6GOB8iECVyD2v6F6vVMk3T+Xw+ub4+Pz+bz2Zv3779+edX/+N//q+Tk5P5Yo54r2DnCOvMRFGc53mWZb1eT6NByCIsTIkUdt+JmeKMSs2F2tHQwkWH5RBRFJvJjkSGkNtjGM2Uq8OkUb3l3kkcXUa+HrO3fWY/yVNuPag6REtgUqSEde7IrpQ0s9rQOZvT75nl2xTyMfluahw45MlhCppvttiM3AYeEEOmwua0Zx5CA4awXD7PYfk610xyz5ymM/jHAmaxZD55+ZKZJ06/kJPm6KzGxD3ymRvAy1GAIFAF/YmlRBmeeaQ4hmIKHdkKpTTHbD8AbnYPZ1gWpeG+kTJqyPOcbECjPtKBZBN/VqLP1ooEllV3HhZastNADSoNtQh0HeznFBCyosPakyin6jynLkXbyG41d4d4s495VjQrvOkzNc8dyNMqQ9XvFiJjwyAkFK4vRI8PRy/w7lJHHDoOhcx6PVB7llUZhzG9yUn1zWELovuhqX3US5LRcDgej+7fO3z85PHB4cGzZ8+ePH364uVXB/sHw9FWr9dHTTJU7RoMBlS4y2jIScfZgo3pdER5wfp2nFoW/OMamKIyOu5FKrrbTHX1YyHjVnsK7n4fO+vsD9Z8wqstbKgp+nspLirWMYSddfarmM4MFP/Nvim4SzLTNuIxW9/LokFRLfKOrQINHVO3bKgChOynktPAFer077hhcLi1ICFAam8F/eKLYr1eZ1m2XC7ev39/cX5+enJ8czP97rvvXr16fXR0NJvPfM/HzEAwEIhi6ZEsSwuoIFqu07UT6taxNOBpqOxBe4ZkDc80WQvJzeJe1rKlcoiVTAzM4qVbvVLGK5tPQBMKonvUe9QOVu3MmwkJzheUq92ISlocLJihtn0NP7deHFNa9her3v7aGRxVtJE1o0z3mE5uslcVajCFUWV0oKY/61BhUhodK34JGn/jM0DaR911zezCJBBiahPAOPFxUWNnfX0sogudCVU3ArNDAni0QK0CFYlH1SqR6KOZyU8Vzy9Yg43FlaPMDxfvUPvNeGIB6fl4DSNhALc6msNrLF9vaFsD9UReKxBY3xpTIdPcIFVvimeMLShp1Uxeo4q6fb2I6lHdf8mQ0XOqderWJr8cS8cePirzVqrvtDQXbc5vLL1FS3ZA3L3JGDLIMj0YJACnL009vPr16/h1FDiDaskli0gh/kUvXJgfJd1LCJl5qef76zRdrdfz5erdu+P374/v/fTz6zdvvvrqq6dPn927dz9J+v3BACqRLhaYpkixCRSMO+kA9aGuR4KgW5EIwFmTAqJW3UdHOtkqJN8c2mZZ4JYWrp119gczv75gHA39frNt6OsCURWFrO/wy7YOEHbW2We2WqKg/EgbyRbTJpKco0NRhjY0dBnL3IyO0FZJRweXXkJUIMbUuhDn2O013/JOUowcIjl0iwpsNE9QcD6fz+bzs7OTo/dH5+dnp6enZ2fnr16/vri4nM1mleclSZyBJqoqUCNKHACiQdqXUywEIIQ597o7p/6toN1G39ESRMafuV16sQllyefuouod7uonFb2AZsov6KPUmA0B201+r9nfz6FETFc1s0HtJJzhoauzKZomu09jA1FtNsOZ7riqX0N1PlyrX3SQem92Y1UWnwvGmHIsJm8QKDgm92BNGFYUU8B8V4JenEaFbi261KK7FsQVhlyY0Xjt4O/iDqUYDDWXwyYBoSFF6SNoG0C8nwF1iO74xBglAqBzgynSDpP9b5VjZs7ZAi+l6ObnVPp8ykyQepW8pjGTDYgjUGxhooFb6raJV9IoIkQiYC08lReU/ZI8IErHLjPCTBj3SVGg3Z6Qm15ZoxBrsRLvLnbn7Y3iVW6BOWMn2oKSXQ/YNlStk2RXnaobeXEu2d4rHlOio3WaNwe67GMVSldJOrPU81brdVlVURRfXF2dnV2cHJ8eH5/85S9XL7/+end3f2dndzQaBz40vcDEYVT9E+EMatIPlIaGOU8TJeT0Y1Fe0PRjGty8NyVc0BTY1+JKDiHsErKddfYHrivj2SJmUl/KPOONN66O+JtY6kYx6hdoHSDsrLPPaY7jYrxwDi8xZSJZgtw8gOQ9GOMu7QLuABVWVozHXIHh25jI4HeNVAcxpeHoFLRHZQgB3/fyLAcvIQzyHLoJEuzMs6ysqnS9Xq5W19dXZ6enV1dXp6enl1cXZ6enl5dXr1+/OT09m05n0FqwLObzeRxHhAapcB+pzej4UI3GdD+jKDWdDPJFnOEjjojWIkmZxNvptToJ0BY+N06Mc4+4DKakcTqtIBnW2Dh60wQqmFNxNb1OzJ5gCQMAA91toiPdGrfdH6Ej20GctzEbKJ7QsqRmgUkVxi4UGmB6TdGSLpwwlyPdLCzlCHVlrdgScF3gHDrQ3rD5OdQ6zBLd2QJyILmOEaT2MUUHYAmkcQZc5Tm4rbA9+tVhFJY5HD4MQqBiAD2GZVHQZM8Rv0URNPsmUi4roccJrEHeBncIcmXaxg+gOCRvHIZFlld+BREN3Bh6B+DJJ3GcY+O5CBaA7YnCqDD7ybEobhiGVB03DKAAL91Zumo4Q3S+9X13+kzQnVEgXBwR0ohTazoh/wyeMQDT/rPGWttn28xpkRQIi+hQ2QItcFIh4gyp9QvzWta/4f/b3DlCzgCRzevHvp7cMIOeHnYmb+ageEgUW6XeYAxLm1DEnJizhiMUdaoQT9yU7uEUVnOifptklOet6+oRnGeGDbvG02IUQaiiqrw4iiglPPBAhA+1uZZQbzkKw4uLqziOe/3earW6nlxPbm7m09nx0cnzFy/uP3jw5MnTrfFWhC3vq2odwByr+n0+H9gtXlcQhMKOO1dt4lAcfzGhGdHJ14W+ggbNbdCxs+Yb2AhenBjWF5gN1Vlnd7d6g8FKzWd+d7pdneuZF/WnoKYU/b1oRztA2Flnv5bZMsTG1aiVJxE4RAjQ5tFprkbIGeMKtmhE8UMpHGrrN9ZPiA6FyXVeBY5vCe411wXFMgjrdH11eXV9fXX0/v3V9fXR0fuTk5N1il3mZ4vTs7PZfF6URZ5n5EutVqgLRbqGLkqQj0EXBqtqH1i5JjXkxfyXdPTm2iXOkNbkaq3cQS1fyP1MCUNdJFbXm7beVp2ltLlQhgZsjftlPlB7lTNRJICmeNn11E0aDOa38E4LWqhUD8k73ZFxL8eOvEWmqgCuCn+q2yIjoWR1RlNqnHfLNJr9Iy1jcCne9sAPSsx4YlEiYWnT6YNOg8i6yvMiQ7uJj04LWg+sF2g03I15DT9MxPHqjcPQZ2gXlCVwg9R2hWhA+AhLIpGyWlhEp4EbZprJGkGGSGfyPTI9QjHuI8wguO/YhcUERTThaMMkdZLI3DVLI3JloA1Ph9ObVE0vVoVWXuBXwM1iVwN2gLioFT3phgk0JJtwzziSak3rkyEsZfMj5/z0BDUPeut3arvaqDO3F8udWDnXzo2zNDc2Z2VeqnXlGF41c8WwX5w1HkiX8SzyKicuGIargGb3nBm4hnu6WCzn8+Vivnz16u2rn18/efYUFaRPd3f3dnZ2wigaDoeBHyyXyziJvarKC2Hg8YeAE13rZ2ufAhFT2Bq1EPvhfhuqzSlWJK2D7WZ7krrvK8LUL9rR7ayzX2R+UzJai8OqX/amUvT3oh3tAGFnnX0eqwfCJSfHVYFqWkyirRy+xV96rraiIuum4IX4jUYmyi8h+4kcvfbaMUfkqhvE4xXYYD7PQSCapmlZlIvF4vz87Pz8/P27d69fv1osl2dnZzfTmyzLp9NZmmbz+QJ6MZv6BFx+htVR7CiINM52tkBRmqSnSUnPW0bPEWrZIo1OyRl9sRbPNRSPG/3CBmdyd9PVG2lnfEVyyGZynosGG9q5mocpSwoSKvfrlv4T7om2dGJvUCaWW6KKl4L9MO/I4aOYmDWd3AQqMILCU4si4DRgTRR6yP+RRBN+b6LIw9BDHMaFD/QjFcsoyxIZFThKFEYkKAWGBEkWWvCqKgHOBOZvkiR0TbGsicFdBhkzrcGucbSQJLAAG0cRzXzbUA46v8HXYQ0OaRzHmN1H27SsgVONY4KCUkEkjiPgYEug3IEPrfBKEb1HUUT0Ecr5wBEHzgcWqC+io0Y11UpZpkrAq475jfjTuPj8fAl1JpVeawDK1gyyoRkz8/A7SJnha8pW+LVTFxaoFSlOf2zdZySXZse6OPDt1tIlsu2LpgdkbQK7dWs+9Cw4emwOoqiWmsINqp1oVMmzX9V6VdIPOQWRbdTUDUS+qYxEQ8XByxOfhdlsBlVGT06Ojo/fvnv/+tXrr7568c033zx69Gg0Gm1t72xvb5O2OQyjIID3NtdwgvvOqFzq3DbH2TDTFrdz3ST1UrKvTdObUcsQ9MtKx7m0zpbDlp119gcwv8UhUZIiRxHTLhltUIK/C5KwqzLaWWefzWryOSctUDkZBP+YplIUFTcadkgZ5hJMcIqqX9j+1Yb0YBet9ZSoWgz2uAOygvoKFkWRpmme56vVcrlcTa6vV6vV6enxm9dvXr9+c3J6Mp/Pr66uFotlWRaTyQ2wiHmRZVleFHmeE21CRUT14RwiTCgRajjhZOZYV0ynqbjSMnbjSJrmdFtrvLWE16phLWf/hg5qKXZokJAc3h6iBrPv4Pc0gZ9B8QzjW+6QeyXW+Tcpe45Dp66W3FBV+aOxVz00KK0k8bDJTYWVZYlKMyDASPPJACYIoUYLyziLAooeog4Te2oHeVGECAvgIz+I4ijPcgIKVQXfCqO4LHIitbENBPInClhCkqGpewlpgRQ3YQrUD0LOBhS2TBA4jyocGvdvbi6d56bwrRbLibKOVgQhwFGrtePNWK3ttAukHjAm9c7kU8HDaxLw+CAEPumh4zq6psIqjjAfTutsERsj3jbVaPAr0ixcU0BwpawgJ0yup3XjCakrBjcFSgx44QUp4mp2Yru944zWLys9rTHeBI+8A8bUy/ATrMlT3XYhDZMnMYBZG8ojYAGh2Z37+NgQDOF/2c7FUOLwMYZibTMVs8WPe/0+TUKRjlNAhB4rFJH2d7a2x1vjB/fvPX/+9ODg4PGjx3sHB0+fPN0/OOj3qeQMBEFKCE9gLKPyTA9D21q2OTii9639HtmfJFV7tvb41Eav9k+tL+1Uo539YVMKqzquu1NN0Sb2+4LRYMcQdtbZZzP9g1uT07jbWAaJWwsa8lA+1ZFndvn5L0KCQg/KT/LG32L2WTGJBcum+1gFtMgyQoOry8vL6WRyfHw0uZl89+13P796PZvObqbTsizn83mKvSjSNCsg1bDIEVj6npemqUoxwtASYAkVhidOydQtVKIsGyB30Nrtg8sKyLof44wqLt4W5LJBe9mr+aSRUd6UThke5MOv85pTxYdsa+TVcqZtu0e+Tv3C8Bgb2shyF/wn4jrehlWecsnM7MFJouyRv2GaxeNNNKnzULQTZY2AR0r4DjBgAHzAiw0Q0YUGSkHDEpjMQRRFtGtg5Gh3cFCcq6YKCx0YyoQWRQV+tgc+Ou6HQgzoNHM5lhKT+lh7abhZztMrwEfnWhpEV+I20AsOepxgJiF+nUIYhDNNvh+WJFXoC3x33Jj6g9vKNJSFhVprxeOZCI6mUxzxMRgcxWyGYAo2K4BFxOxKx5+g1hom89DcWIlz6GQ9VWnHqBGkJ4cR1rZMShV8aZuNQkpKTSxgKhVHqVHQxnqTQoq1ggTtMzmPKidatz28Dbbzk90qgrQlNtS0yM+8u5tb8/FbLsReh96NhUwUBOHCUPAQYf6qfWnzNMOCoH4UwbRfrSZVNZvPptPp5OZmOOgfHOwfHt578vjxs2fPHj56dHj/HoDCwSAIwixLkyTxPT+H/FgS6kZSpqh+lkpAwtEH9aujwyW1zMDa0FEQx3IjqlppBwg7+8OY33wZmBWbYiXO/JdvNx+IL/sR6QBhZ539InN1jK2emN1SFmiZSLZ6Cz6NIkXwY10Iii47NQpdH0AfmhKBGBNSz8D1epVlKfSZXyyuLi+vLq9OT49fv359enr600+vrq4nabrOMmCBlqtVnkM1BGINgMzAvZUIL4XkMfSlUlNZdkr+c7i9FszWpM7cQW6uIVmjYlMJsBkJ5sZ7xI7gpsMZTCucBqr7fmFoT9FT9YT1W8Vu6qiWK3O/13T+pIQkqwEJFnKOE+bBmQqplA/G3n8YhnYXiAKgQgYeIIoirNEPhVVoaHAN0YHEWfsg9eR+aQDICDOK+0vlQ20lILxVBNIgSxC/RuRJFEXAq5Aak2htIzelJoMh8Yq4JkJekYrNQPHGEMp2oO4UZKuosgsJhQJwRR6Pvo4tN2HP2PDNX6cQ+OBaoMQBVl6BR4dhxxRZiqrQXSixYBJ0JKcmG9CBEJvUoaaU8ADm5VZBFPp5Th0+qR0LXCy2QARmKPeLAk/ScPg+9DOHawRYjwyScIZUfQpuE91Up8IHhjWU7LjajKlYWGriCfX5Yxub2Ammks18yvlUE9TZjwgjG8e3JKF8w/GlpGiwywTyi6P+ZHykQFEeCSXEEB649fXpxKrajiUz2T03+RY/gDJE5lXPjK+KbEAQhOYkMsbefL5IsywMgvdHxzs7Oz/++NOTJ4+/evH8+fPnB4cH9x882t7ZCfwgh16vfXhAcmLmywJvEYhGbn2dcsYjRk8IDtZKkja7TdBfpeeRiFxfrQ2rGaW87bZy9xvUWWdfNklYSUkI86Zt0Y7KrN/cyfBLJgk7yWhnnX020+SVA/8MOKu1D641SRfRkU4NZKxkFHGKJ+RSf62uDDkf0mseKUFYzvNssZhPrq8uLy+ur66Oj0+ury/fvXt3cnL6448/38zmaZbnWUr1JMqqLHJgBSEPCnvNB+h5A1WY53TSAbinuCCdNmrnoofG0IMq1U6RHq3+g25sQKI1cptor+0s251MR/0dnoIYLTWYNfkosznmi5oQrqU26ftjFWuY9MMqxIbXRSuonwJTfEjR1GL1QqdwwzPkdqS7ugyytF6gG0pQhHxBqmCLLBngFhl+KnBPJxkZjRyKdmFM4ggAGLTkThK68GG/h7CqDCPM2fO8fq8PJYvyIooAuhQF5NHBhZQl4beiLOIopj2HUcQJikauCRvTiWIBJECX+PUQjVATOr8wLUOEfwCfkEgEiBWGVD+G2MIwCGgb2CMUbASSnGSxXIk0ywCBBT6Q3pA2iRVEK0iAzDLgKqm4aFkUcZykIJzO4yQmuXWv16NnIY6TDGInuKYssjzvJXFeQIJuladVBYGY1QoWsHITR2ccg5PAlRiAwGXSl/LrgqS5eMvgGWTRraF3SqQ66bnQbr24HzVNoMx50x0SIZMQsCJVkBmnyg21aJxrkEhpAOTroqdloqn2OJDKwMStzNy29W+bYR15iu/8/KtXSTPZWItBVclNOUkjyJTDOo+txbmmfq6K05FckxS4MABRGNEwJkmP7iKKRvm9QvM8wDq3vV4yGAx6SbKzvX3//v2D/b2nT548efrk4cMHBwcHW9vbOzt7cdyL4qisvF6vRyR2HLOIFGMH7T2HKMzBXSjU3HAkprZvjVXVmmnDOxXGU8aqhTDprLPfuVV3UIreSTv6BaPBjiHsrLNfak6F7oZvgg6Qco6UWlLnRNV+TaWzoKRmuH0IGGu0/c6zMyMuVI4cH5Sny/P1ej25vp5Nr09Ojq6urt68fvPu/fvlcvn+/dHkZnYzJYEo4D2ia/IcWIuqKqHkjPVaOTPKvtza9EU1z1MUo3qLOnxSyyqHx43T2UqYjCI+/o7Zw7S8nPmtzcoo6wAZTk2yAI3r2p7C5ORS3nrZDRUf85c8Ncwc0awrifeIN0Ng5/CXbtEQUhgHJByVGjDIUMD3dT3YELsFWvfY9yKGbRj4xLxBwv/ksXqeH8fIE1ZVGEXwdSzBQqgviqJeHHm40O/1Ah82juLEh91GQRQFmDcVxwnyfEhOoguLBfcT8mWRfgThaBzFuFWEWYskMQWEB3uB0zLZU/gdymw0jDoiakuDEHyCFD4iDLm+bgmxD8r74u4vPjCENMqUgut5ABrzPPN9D1l0AJA5ZtUGPn4EX69SFGOXeb6GpSLLU3wEy9VqBTQmCbDxSaJnk54p8zeTRPA5oQdV2IOLnUIzD5aR0ysH3w3OdGrAJAJjTlEEk0Hqkjn6mWJ62bD+NIX08yhlaM0aad0iexfZpLSfIVxJwRJsAOEEX+Cq7WYcMrN9R5sBJ+9O5uq3Tcz+Fm2XUsTSucvw4KdcCNqNcFnxKZcGMqPI34GHCC4d8C6+RWEKoVGYw9ZoxSie+aa/WkEfoOls/vbtu9dv3t472Lt3ePDkyeMXL148e/Z8d/9wa3vbD6GlSr/fh4xxJAzpKaZAYvuYqBK7MiXk9Q4TX9QrauQkwEcptjr9skOAnf1Rzb+DUvRO2tEv+xHpAGFnnX0G04n6TOyI72C8fI6zuvH7ZukL6S+oSsGxg86eFX+l5SQIJJifdeNgIqeHRWIuz89PT4+PXr36eTK5eX/0/up6spgvryeTLCtW6zXmIJGPA8QO+s3GRXUz/9gFN6dvPUIVWLfOg/zRsJoPoV+pBkA2e2JVn8QPtJm4rXqNe1rmBkAZVfKyDIsCnhQNi/ZfJXVKm87Vocuz56+acJhBlgt3EStTEAYS1rgZ6CMHjeQY81FOHab8ERXH+CrEG2fiC5Brx+QhC/a4fAnOQSz4Cd8KAz8MgySOB8NBGIS9XtLr9cIg6Pf7SYJgL0mSECpt9pLeaDiIwjBJkj4kOwVJnPT7/SgMAwSEcA5RCCEOZELg61gYCWEdEJJRHAUBpCMmvQSSGEusT4PzLUrg68gERqil5GZrwLFgkVIWcKJBTqNx4blbN4003TJGWwD2qrKgjoJ5kcOhK+yriamGVLgFH6ASm3Zm1DEc6HL05nEFrklTIOGrCmv2ros8W61Wq/V6uVwtV8s0y5eLxQo12LB2vQbxdgYxmhzr4hCe9L0wywsPzwchIfJ+eD+Z3QWogFVYsZxvATJSBA8oXsVWGdhRADNFVQMbFjtpvkgttDg0+jmg/zeb3jOmUtEbh4OTL2InSZG6yzfpJacpNsLzDAiFrVIVUzmp8iNFAbWXDDcSVM9Os5KKaHFVVEeLSG0+cw1Em2vjx9yKuLGVTm18bE4saTpM/U9++OkljkGKxcJfr9ae552dnb0fjcbDwcOH99+9ffenP508e/b8+cuvd3b36akGehCIdEq7ZU0o6b0/OD4O0aeuSuQYzitYboqaLXTPpB1LBxE7+8NY9TGUYEtnzls++mKsA4SddfbRVsMojqrQBONlS/kWfYWqX5BAjtbKpyQwNGlYvMZU+2DXjasNNs4HfNM8l5wr6gaBlTCq+WKxmC+urs7fvXn9+vXPx8dH5xeXZ2fnF5dXq9Xq4uJqvU4VPQHeNnrCAgRZ6wmxZyqwYbxwc2hOEqSXnngDJXS4tsk0GPi2AyId5Grjo/5p4bTEoaXyIzf5+gWK96Yuzp6DKX1pc+pM2o90AmCXFk8M7inBKeUkyZ90IKK8ahepdMX8T6Y9sQ0cqECN5pNxODh50LRAlKhU0hOSzbAmJ1AN2FmEG/rhXjGdj2VvmFMHV8HN0PwgjALio7a3RgAOPW+8vedVJYC2MAp8LwGAFiVxNOz3kzjsJfFgMNwejXo9AH3bW1sRcH9RfzgCejCKkl4/iWOoNoOcIEngQPaJfdPCkHrU+2EAa/CMALlR0iHBi1A4QHM7iDAB4ChkICJXlr8y5+n+Nsv4m/tSW4ABxcQ/XYFTjzaeDGb5QuUPBoe4AA9XWQI7SGNOj1tZFmmawcdYvDdL0zRdL5fz1XKxXC6m89ViPpvN53nuTaez2WyRDPo309l8segl8XKVpmlGneGzPE/X4P0XRZ6mkF2GwZkirmKa+FXFLTrEpAwMcJqkpy4woQyfWTu7EAsZiSCRb0iZmuYKOGgScvILwBU0CRkCOFwZqJSZ1rIqSxvgID0qcVE0YVVfBq3IlMdB6bH157YLhkWedvvqo9Cg2TmnOzcgjXxL5A/mWGao1aNtpgrMEdmDLrzZeia66ywNkyQR9Ho96goEcw+LeHG93yBYrVYhZthO5/M4ik4vLm9uZscnZ1+/PL66vn7+4vne/sFwOB6Ot1DDHONMxlACiq7pou0z1XZucgny5me4r4Kd8mUJx9QXZHg3tcPtrLMv3Kr6xNWQ75YFIz2oP/4tPeu/SOsAYWedfbSxJ0oBb6drk195nABjdaHI1NHPP7me1nNCxGPxnhG6eRsAoTm4NUJKViAKveZhGTgKqPsSrNerq4uzo3dvf/ju22+/+3Zyc3N8cjZbLC8vLperlR9AOQ2qHUpVMSoPKA4X4uJRqQjJBrQjTJc+OVsGs810WH1Tg0GpVaij8/Uz+xWs6R2qzBjehhW/QqGYD7WMtqmJvb1nmsHetcqi9JmEGaxMjRR1JgQhVe+RHANHEAt+Yr4ZVWrxkcpjxhAAIcCzKIZfgSiM+j1IPer1kn6v34uD8Wg4Gg6H/WRrBH9vbW0NR6N+fzgcDpN+HyjBpB8BBIxBLxpFPgg64T/OgwKqrQpB5xlSgz5qLEGwFDEtYEHDfWGHCVS0EiWoa+gDO4fiQnrEqCKLqvzJTwtXXuEu8FxutEZfsL+LExXmM3bUpCxYaf9Ae5OKnXIISjtkhx52VeZF6SFCo06DHis/iZMvM6ARU68ssmy9TtdZXqTr1XIxr7xwPodSkr7vTa4n15NJkS6ub2az2XK1Wq/WIDFdBD4kJSJ4LvIiMG0MifCRdwhKWjE5DbvAoMqvrOCa+B0EIYsMwhUcRYEVNK0YacvMc4qDNOgkptINqsO6tIJ/+A4IPcvSCPMY6H25IR87tyWCxm8SUlg64mdXaCAlSdvaLZq9utItg9NqKkcN8+q9ZHVESokkdIROxcU2mSFnZbeGfxPgTbDZ8yqs3gw7C+EpQBRtilFzwAI12F5VLarqzbv3ZxeXZ+fnRyenz58/ef7s2eMnTx4+ery1vTva2vL9ENrZxzHXSmImEmo5bT7RFhBbQr4xJxmappDur55+xOj6qGYR4ckOE3b2uzO/seIuKlC7ycZg0BduHSDsrLOPNq3Ts6tM1UtKQNIOhPQA5HwYhTdMAQJt7AdQDysDPFteKOwlsFZUQtjAXJBurSrLs5OTb//+369f//y3v/3t59fv0jSdzuZF5V1dXmFqViT5gdgzgFIHgZSQ5uM2RVABOBtll8KRXOel3TeiKLP7iVO7QQobOB/bqjFSCdDl1D63OR4hO7b4h7p0/dPg8JsWtN76e+C6sITcKI5g0whVNTMFv7FyjMm5ovquJt0UNgBZJv4bwB7evjCOK2QmqawLqEChiAul6gFU6yXx1tY4jqPBYDAajXpJMh6NDna3toaD8dbWcDgej0b9waA/GPaHQxBqhpD1R7pTAICAWIDlo9qecERIJiSRGipNKajBJ8i6RUNnMekqY17SHmjumbKTRAYyPS73hAYBr4S7Zwj1Z3S8wF5x4KUFEwq2tIwuQmuqQAP/pFI9AJWxnQa0xYB2GuZUAZHGxHqjwRqcpPgoQVkaSEvMswoAbZ7nWRTFeZFn6TqOozRdL+bzKABkeDO59spiOr25mkwX08l0Ol8sV5PpDEpNptl8vlguV3lRLAErYpQHWw5gqR4oe1NA540gg14dBTYnhGcZp0FelgX2VwQoG2JXDyyyGnqQU1whMAAci+wrTTouIWkwJ6XNmp43BFRCgJs6Lw3vJt8UQTgimBdi361GaUTX5jGry8GtdNpWoJEe8bI/CTlp7ldJGdVzLftscHca1NXrPJnTrb3WajzhBj7QBoWs1LSe2snISuJAFGvgI8JI43eo4i4WTyL9cGH6bc4X85vp9GY6Ozo6evfu/YsXz16+/Orho8cPHz/f3duHmkk5JNVCuWAqlYyVmnTRrMZp+7U4SEBCVrlwE5JT99iNDPJ84H9air6zzv4oJKHHvsjG4jEbi5R+2dZVGe2ss080LdaS1EHhAPk3nkRcAnvcHDNnQeqIojdHP6JU+qOuRReBqKk9SBkjUkq0LIvVCnrNnx4ff/uPv//3f//XX//3/z6/uFyt09U6TbOcnA5IfkI/lURuSZJQ2hJ52HUxp06TM+dBn9XeIRsAoR0TaZpHXI18dvseWlOYNpkT5v/4V5yj0aUCJVbtptla42jWIAf3LZDSHcqdkqZ56PxxEpFDQ3FRUCmnmec5dkoAgEHqS24gQbVTjHmeB0JNKqbJclyg++gXamd7m0ZvOBoHvt/rxb4f9HrxGNi/3ng02hqPDw72Af71B+Px9ng8Agow6Q2GQyz8EseQJAj1XjB/D3IKEc9JS0wrc+bm61KLhDOSEHDIQJnxEdqimcHFT4GsqanRajjBBCbsDjfXeBN4YKYHZ6bxNoYGqa+xqkhKQaQFKDZjFuDCuKArtGnkvm0E8g2lVRV5RmGiLIMapVmaZuk6TdMVpBsu1us1osTJYjHHfnTz6Q2wh14QXV1f30xng8Hg+nqyWqWj4RAAYlF42ZoKmS5WK6InoZUHSQ+lmqnRgJclgEAOHXGaIqMLz/eLHBaoLrEssGYB6UXKsfTxtcPAH3WJ9OqjZwaoVBKUmp40wtHpIIt+PGsjrBKX1ZtUvSYMClXvKHke7SPPMPeDXtjdWayan9fEljBoqMwWbKVArkMzKvQFgQ4BVHTZEIbAtXEU8UIMFZ7o5Swp3FCJNEmSOBr0+/t7u48eP75///Crr168fPnyT3/+t4ODw+FoK8HWFJiNWPb6PTpjVLAjqd4GDqXBpi2IbYstWYJa0SaK7TRvA1YJb9bQdtbZ78+qxsvid1JB9C7WMYSddfaLTJV/NA2/SWRkfuPJk5FsKFG4mboe0kXC/nwqEVFLLQAh08DHw5IDaZqhe1dkUNginaMi7f27dz/99OP//B//4/sffjg/v1gsV55X5eArorgUoWNVYYt5ZBjTLKWTlgqNUt9P0u3EnVHX74b2xTdQOMz5kiG+nH063vmHxvluJkVcdT/vWh2W9q+5/zI6TMIbzWOYWo3SQ5KK7+HH4p4qFkKNokEmQpzZEeAZxBMEaq5EgQ/BfqjMSc46taX2kdRiTxRZPwaxfgBN+WL4KI6iXq8XBP6g3x+BDXZ2dra3x3u7u9s7O9tb463tnX6/3+v1+/0BZf31egnwi0nS6yXYfCIAKBhBdXvAmyEIMil0QQOBbiUGMYDTdsaG6wPpUpatWUwuD8vMufnIPBAKeeuUDANFagytwYSGV6qxuBo3agApjryw3wxiSf5NdT4NF2X4zyqgEqZQmpFPCihHwadY3wPTI72IMru8pIfRHEhNLOG5Ba7ey3MQmOKznGLL0Gy5mC/mc6+qbm4mk8kkL8qL8/PJ9SRdLm9m88UqhfTDNC3KIkriHDhDyGmk6qkFqFhN4VLChLheSqdil3YjRyadLTYj4Tw3U9JUNdALMLlVFR8Sibt8gwfftLRgNrAW1uIn2gIk8z4QDYVFHVxSFd5xRlZBQmku9mkVoeZuir5Ap4zWHnGlBWiLYan1TgUalSCkqUINheRMtKhVwJX+Ov7NclB9dMrmBfE/tLOHT4sCK85QZWASAiAsT7PU971iuSqqq6wozs4vzs4u3r8/Oj09/eabPz199nz/4B6Ec3o92Ns6xVaiJD2g5M8WqMadbHCBY1XAWPLK5mDp7xO2p+id0/21w4Sd/QHM37zm9z+7O0DYWWcftnoHUgcRGSrECkXZm1HFHpjmc7wHk98vif7W6938wymxfVqm0D9WNSyw3fxqNr25ur46Pjr6/rvvfvzhh2+/++4a2IYlasOo/CRyg0UOPhiTVHD+otkUQGoaL5iosOMVmY1d/8Cm1qiaDaoWzG+RWq3fzyIhMyl/hlto0xDW3+1ym1hs5Z6wq0gz3q0rfLUqUA0eNeDhPXPdSCwMg2oxporjKKaEOiCaqBAnwj/pjcad3NENTYC+Axqv3+vRn8PBIAzDwaA/Ho8Hg/7W9taDBw92drZH463xaLS9s5MkPWx31qOoRITsX9KDHg+QF4g7pGxDajoB8IGJIapdKYVXARcZbSFfm2H+pOwEYCRymZH/BKxQJ6KVMlCUZm0V2xze/C6+5h37R6k7ZdaY6K9w1O4bQCqhmD4LRLBjLp+QvUDg88b0YJWIrSLsDQnNNKK4iJPcQ6JvMIC4DfX7xNgNQMMwDNar1Xw+831/ejO5vLzMlitIQQT+cH4zm63Xa6getVxmqBhfrVbw/QLS0vK88KnRYp5HmKVJ6lzCipHvF1hklbjwqqSSrXDm0C6SsQBsQO8QerDDALS1ILKlFgV4JfSESbanSDtNp3szgJY1k6eB3y/8HOk3LTREMW3rsUmmTiSU96886bW5JHf/lrlxe2ZvEwLVcB1jK4MHNeHJYYbWM3E7XNM6rO4j58ORInrpQ+AAdw/I3YSP/NIvci8PCg9yVqFt5my+mKJdX11fXFzOZ9OXX3+zvbM3HI0HwxFUHcZWnDLcHszSFme2qYltqvrdZ4d/Jeika/G7Vtn2LQPeWWed/fbWAcLOOvuQ6SIEznpPyaBsSFvi3OgXclydv67kNBoNomdACxvDTPR7TEpREohSU+wsy1bLJRQSXSxWy+XJ6cnx0dGPP/74+tXrv//971fX19BPAgPM0HA8jOgrcRShKsiDLmq27bITuq6BWxXLN1duI/ueVr26IlO5dO6dWB9dRETNMjafZjJ6NWmrSQyjnDZe10z+lnO1/hAFvGuUlBYfWp+3gvZ2UkAIwA/Xd5HCfbrvHzaaMw3HK8QM0MAAAv9UfNP3/DiJPa9XVdWg3ydosbOzQ7d+tLUFDroP9TpD34e+D0GYJPFoOIyTBEDgaDTs9YbDwXA4Orh3ON4a9weQGTgeb4HKLI6GuGWS9CgbEOqNSqNwSg2EmiuQ4mi6F/qxH1FqmZQ74m51nDKlK61iBprhGQwUqklG+U7V3WIpTyIPlBTotySear14B+eyGYmQE1VOKlG4wPXZnCia7KaMp7Q9UF67phU9H/I3KQURVsLtx6/FtGe+Lj4E9gPARvMeNCLHzL4y7lntMaUHVyWUqAHGDwvVZPfvP4ZHHp736c3NcjabzwAALNL06urq+vraC6PJ9WQ2n/d7vdl8uVyv4yBYYZeLqoIMwqIs11zItAANOUs04WJNc3OqaApdQATk0BygslV0FQTYbCKlWSA0SJ0UJWPTpOMSsa0eTybh8UHDA0GlXKz3I4p5g7dgT6zy5QgVvGMNb6U0w+69VrdMzYm2N46deI0PHdxopxzFa6QXpOybiVI5BxHB1tTR8m6h94MqbmSLD9OYEpuLVZpgoIGxBw0wcMIUGLq6uo7iuN/vF0Uxnc2mWM327Pzs5cuvHzx4dO/+w/5giD9GWL2pAOlyEieo/aXE4/ob0Yi3oaCRFrzUxk8F/jC2iG8zdXPrO+zQYGedfYHWAcLOOvuwbcBp/NsoZegwgG06KZsoKbmSLaJQWYOF/5RStO1IVGiO+L2MBKLQ4Xq1Xl1fXa3X65sbSDp6//79Dz98f3F+8eOPP11cXl5NJqt16nt+lmd0sqsMumNTkwlmpRB7YPUaOJA9C/Mj3+I1tckn7YcmYKzWqG+6F+XwBh+K03+Euf21rVuJKAX+M2fSULY6F+IqeB0/xqof7dcYKLLK0f2KBtWS6kQfoReITQKpgwL04oOGeywPQ18NS7SAXpQ2G4/HvV4viZPtrfFwNNwej3e2t3u9/s7O9ngLMB9s0O8FMbSIgO4PYdQb9JH0g8qgPgJIpAeBC8Jyo4BjgPCh9hisAqXTk2sFEIh4kV17nRrGJFDLrbBNEayOF79yC2Nc902VCrR2B36RtaDE+p5VMMhEAFQtfnfaKKEgfYQJhgqvGIWwYaA9akeOHCylJjJBBL4/3P2ihLVw8yNoJOBV5cgHWSlkHsKf2XIJtWegful8XpTVbDadTCZh4KO89NqrqslkMp3O1qv1zWwxg9I0yzXoS8so5FaHIfQ+hGhRnnPfUYKiwBlyJiRfJ73HqD0pVFnFkJJpe6mqTaIIkvMODc/FeI5QHw0yN7u3T4iMdz1Rz4QbfEaDMt4olGd54u1icCsXsN9uzILbJ0v90OrUlPpUCE9HTrHpzWbJNU3KmQ5E5tVlQJSKR3helWUZPYoAEfGxhddFUcDPAVKFs9l8MoUfhffv3//bn//89dffHN57sLWzF0J9oyyJE+qxaTrqkATcnfwSuCwDoxjxUDAtgULaRgFdB8Q6nG2nGu2ssy/ZOkDYWWftZoPKrfnDJteFqyYyDuRm8CCKw8A+Sut4P0ydUQ1RqQ7Z9H3dc5Cff6kRkUMlCnAIF4v55HpyeXV5M5kcH7+fTmc//fTjz69eXVxcXVxcVFW1xLxByQPBEhbABkh+CB9f4bdWx8WJBG9SYTER4nj5mpyre2MaGv1iM7I+93wkB8wFctypuc5NGTao1XVrODI1NCB3mfhkQbkQXIcqfaKjw6Njxh2V4iTFHTSGCCPgCREecM9A/H8M4s/+zvZWEieYAQhIb2tr62Bvb3t7a3tnZ2t7a3t7G9P/ouFoBIAPW8AT0gCNH54jLGHbCSIgeyArDbEKpW7jZ3ApTw+/xmMgk+kMnR5/NVri3tuW4gwsxDM3vr3jyXNeH8ZQvsCcDF3B0qgCayEP4xRbgKwHSqdSaiOKGOp+INuT5blfUqsJQmHYmcOHzvVxHIV5HMXJAPUCw9F4jZnDeZYFQZim6XK5SJLeEmrS3PSSeDGf3Uxuqnw9nc6up7Prq6vZbLZar7Fs6SrL8pvZDPSlZbnCZESTWgxtL+I4yoF/An0vsYhQZgblCQHUm4EXC9WtBUEjThvaxlchJ7g8SrQ0Mulagag6eFC5o2YSqTel4aHlBc2ASWJAesHeltteNVbx8PHGb0R+gRjNhHpv0+FtZz/+moF2Ao71s0ZVdr2mKkHVfDZzhnZGURygmqlWEGL92Wy2TrNLsKvpDRCGz5+9eP7yayhAijRjkvSAeIS7GXgeFuzd1KgQXmTwWwa5ooEtiWzuMt8eUY/Qb5ekoAvzKXe8tqazzjr7p1sHCDvrrN2s6EV+39QvnAp72hxBZATARTT9+sjXx+r2BgYSNKT4r6MoajOpNklVIiiZJ8syKDw4nV5eXR0dHV1dXp6dnZ2fnf386uej4+PpFH74U6xgiEpRsF4Sww5KSAHCNm5wBVQnEMsGWg/dqSKjeC1T7M8yb6z64q7XuAaIAfBMzOaqhLrj6fGem6iynSQ0SYCsQzXFe5wsMuFeaiKlRu6ZuQqLw3U5UNtQ0dTxk7OnNg9GFcXKKGoDCDe6hDIhJo0uqKCcB2AnuG15bkqDemEUelD6H5WhIeA1z/f7SUK36f69+7QQJz3f97fG4yDwx6PRzs7Ozni8Dfhv+969w62t7cFwMBxvjbfGoBQNQ6gFSj0BY6gFSowiEX8GfyISFhKSF5CdJgKHAxTSO8AZPJVKZMXPm6dt/buNRM36GivR3LxNaz5huwLt46q91bdu+baKA9k/LX65BXboPdmkSPeSbb0lkh9i38iYa9KamYOCU8BV1HA8ihNM/wujuDcYMQogVSK0My+hcgy9NKg+TZqu8zxfr0Fdvl6tFvP5zc1ktVrOF4sJFDGdLhaLvPBupjfL5bLf719dXU9noDidTud5UQwGg6r0SkhUgxhTWVYrqHzD5Wqw62OV5RkENahZQohZlOr5J66USL7ACyiTjVBPfdIIoyrBsuZbwtx1yLaFIk4WBColMe+MAKitObThPdOYk3cwLCNdFiZ71pJj8hOhq4zypzLDbeKhZQAldCgPmr16gtNFCXyuV3nYTALufAw5nxDvY9WuSTCOwvDy8nLW60H52cq7ntycn0PfwmdPn+0fHGxvb4+2doo8ieKoyip/gEcsoJSxFrOoyVt/Kmmw6T6rayV5MHyRfv4IDxt5uYSWPlMssLPOOvtM1gHCzjq71VQynJO3xAQUK6kI/1DKv/gkGNunWnuUvOaKEJvqNGXsR0m5+BLqEFKYOV2vbyaT9+/fv3kNtlgs3r9/f3F5eXR0dDOdllWVZTnEemEho1NbrtYS4CeOQgp+qMQtXTWGz6GWJaKzeujfDn3qAEbtEN7p138jO6czgkyalwYc6nY0W2qbrZx/MHtD/k0T27SeLLlz5FsaepPHB9PuOOjPrUbMJJBbHQTUGxApOzw8AUKKlAdB0IfKLn4cx7s726NB/+Dg4NGjRwcH+wcHB1vbO7t7+1sgCu2FUdQfABlo6L4Aar9g9RdAmREY3kqM9eNFcj9JPKLAPxlS5rj5PKWeqjQGBwGgwYGSu/UBPqXuW+M8kYo7Mmu0rE4iEW55RqcWZeNbdo1TCcawiw6fvyGpiea0M0HsNupBFkQhBYosR2wzZhXL5R6XJpxdkGdNSHfpytlCwjOUxLsWBoCpIOPUL2CRuTsIMJCCIIxAEkwKc6g/iaVFobUMZBznFF2C2pXQsBSQYp4Xq9VytYK6U4sFlCjOi/x6cn19Ncny7OzsfDK5gYYYi1W2ztbrcI3tEEfDQZplgE08r8hBdwBVWFW7COiYV0i2oWAGTqGm9vMYZOHUQe7zASoLebkq1s19Sm0eLydrmx4harT1+4Dmr8CYW95HHwVU+Gn3Sr/gZ01/3S2NxDPGIf3qHDvjsOaZ1MTV+BK2h6FyMlZxin1HvarKATQCjbxcLN8fHd/c3FxdXb99d/Tm8ZunT58+evTw0aPH4+3dnb193/cXi3mv1yNJLzUadcbT6ljoDaIzzE31Xco7wGq7JgjA8JjvF7ZAbAZxOqqws86+BOsAYWedOWZ9Pvd3ixJj7DaWCOM8IfRaJJmQN2C9ovrfB6Eg7ViXdAOZKDUNzCBv6Pzs7Ptvv33z9u3rV6+Oj08Wy8X5+flssbi6usoxWpwXOdWNoNrx9HX7u8txeaHcapdu/dpm8QDBBByeF7/bDJHCSnaE1GXZa6QxuLv7ZVE0Fr6whxU1amNX5NBINznj3Jjb4EAIKzplxGtydxy1n2XJKBLOJUvpzEgF6kH7AQRfgMSgWXwITftCrAYBNUKpuTnVbomiqBfHo0G/l8Tb29uH9+6NR8ODg/2nz549evx4/+Aw6fXG4y0AedANEPpMVNCnGmBkL+mxshRLg2JTQPw/isF0sQqEEihSVdWDGHvo8dF+tqrZwfOahV6M8H3POnaEabgjvDw7CDvr2WXyETPrzgIL7wwOFNwlfrykq7ESW2CDml4clCEflB5ORS02n+7W510J4UrfA9ACGX2C3uSS6eShFwdvDEUbEdFR7wGaLfQQqDRdNVVtSEWkkMIkqvNhDaHezg8KiPuAvjTLfWweDkWKcAMQdmKHBu4oCEPnA10Iy9x/IgzCvMixng1ghhy6I3pZlqfpKggCaGR6c1NVxWQyOTu/WK3mN6BKmF1fTa6voWrxarmazmbUKmO1XudZ1u/16DWFGnXseRFWfq5aa1IRHbwGapVZa8LJFwhFWCXspOC1TeFUUArErIRCeHTCIDKMG6TmEvaW8aRyndDUgUT+G3DIx8FCM8nbIkk1HKdiW6274qtUelOBlKa5J1GLqooRjzA9ohTrgX6SAAntSzmYTpfL5c10dj2Znp2dn5yevXj+bD6bP3j4sPS87Z3dACZUQQ1SoAgu1PVp+ZESUldJRmF+2fqiVF/LzGz7hzuwtzP/nXXW2W9vHXHfWWe3WU08KZFOIjWMKNIGS2VZorXi/XP/gFvLx1D+IWT6UU4RYjlyhVcrqB9zfn7x848/fPv3v3/3/ffn5+fL5fL45GS+WGQEF1GgGMUxg0Dbl1oQFB+d0thURwl2uFpBoMAnkQbZ/C7DagjKlG9RSww9kk0n4I53QU7aNnFWOir6k1c6RVD5u+6GzMu16lelPpB04qLPCFCBLjSA75PalvA2JXpV0CWMXTRs1AdF/6BbYK9HDO+Dg33M4cwG4x1qPed73qDfO7x3uLc9vnfv8PDw8PHTpweHh+Ot7f5wtLO714O6MdAWAlAlUIKQXciSYygsyjWBEGlgBwgmG6UWBZYrsiOgIBlCxA0aOVVgc4O4UZVOaRF2YmVd4t3MfhT4tNyN/K3wjyrWo2qW6vvYRgJrp1tOXvC8LfnrhHhsgQ5z39Tl4P9VD0LeD88WU27UPWU7MBuiE/WtN0932chmb8ILwQrMrTyBEjup5yEJCOnwIuXmlxVNX56usAbLhYpDD/vCVjSAl7IcoGZGBGKaQjnT1RLgBFauurw4P35/NJsvT45PJjezMPAXy3Ve5LPZHF5WlOSMatUsTekkcmp+qN6RWmxO50C0NtVPrkEmnsaCiYz4k0rCykuXgCJCTft6UWy3CeBBsdacvqbeAO4DckfTGLX1c+TnJe1WrXffTpIlaV6MfHr8IuJd6VexPu8c8Te8beKYqPgEo0V0Z6lsmIfqg36vN+j3B/3+3t7ui2fPnjx6+M2fvnn85OnzFy939g6g6Si8bSL89fESyEOGuSgi0prJDaWKylSi1mbXy5NjLk0rUWu/gx0a7Kyzf7p1DGFnnbE1+5LxeuXE6Sw73SxB1G6CljQ5o2Wit6BBdkmwXXSR5/Sbn6GVRTGbzd69fffm9av//b/+13fffXdxdTWfz8uqWqxWoPpCJ4xOZrVaiVaHS70Y/AO/3LacjXUydCy+hccwW+mKoHzCNf3S5rH94JoP7MG46ToMby9D0v/IIVbIATwquTxx9uWS3P1rzED8DwuCIWZuPrfOmGlLjU4rkR6kC42gsCcWeqi8MAj7SZKmeeB7o+GwH0fJsLe7u7W/v/fo8aPHT549e/H83v37g8EwipPheAyVQKOwl/SBYIwS7AcBXeCo3CgdHZMDucajuQ8m6Qj0eKgupMu32JsXaE5ATJ8qlhD0dRtsKq2i/NEODmUsDNlYaz/JB67dbCtEkzWKEyM0ye1YpIKIkLq6WTxu3GxcYZkWaQWpn1OLP4Xzkw/VZDOxBYEOTq6UipxoyK3ocZ6brK425UabSZUE6bFKMVVf5a/JnORTZzqT4zjmxAjumjGkPQiMoIeCBA44J2CVaeHhQ3MHriPqB37kxyWkGUdJ0i/Kso8Z0VCvZr0mcAh5hnk2m02fPnm6WKzevX1zfHyyWi0vLifzxbKX9GADKH0KvdJzikcYIk7CUra8CgN1uf8CzuXh5f6lpCw1TTsZFvO8wEonOEss0jB3wXb+VDOQS7bUZKMsWPhITNiUidasJm9vIh8dv7Ara9EFusUqUODshDhofA+YeBb8amAOMWNC7HEKYax1mvq+v86ydQZBx7OLi/OLi5cvT2fT6dPnXz189Hi0tVXkUDGIKGWMNgH7bIoPu5dvToOUv/T+Q3AYgPCX+264dKH5Z8cQdtbZl2YdIOysMzD5SXe9XMsRKXdQ4UCJg1r+0Lgm9AOuQKAV8G0wRIIYJ8fwOUmboArEfH4znR69e/ePf/zjpx++/8e3315cXi2XS1CF+X6ag+4LmlGZgHme54TcrMTOMJOUDyYoRnCCeLhu6Llh2rW3ok9xkOucW+2XvpV+/KCpwgZEADY2MNJc2A4gE2+h5b72rJVkVl+I8EHaWccxxL5rSutrdoGuGBowhxGUcKAKQJTAQyShD2H7ZHs8evDg3mg42NvZfnD/cG9vZ//wcPfwwcNHj7f39nq9fn8wAMjnYTcw3+/1+8AHBlA7xPSl4DaGVAyGWtU3ybG6FNZFSoIlDI8NO4VKkRjkB2RIENH0rXYLCaph0TLOBiRrSkbR/7bRAwNfaYdMVNJ+BNlSZ06+K+BuMg5k+t1wRDaZj/MkLROo9KUiPTUTj+lfo23DVTXWxdOiVjUIFityQqkzpd2BEhKVcIhtguc8CKBHNbx3ybw96UuxCSTBYy51pCesFp8bggnbgjhMqQI5hMfoXvtQm4SegxyrVeEoA3CjSe0B4w0iZ6hXC40RARmOx1tpmm5t7WxvbXued3jv8P7791m6Pjs7v7yczGazy4urxWIxnU1ns/mq8uI4zvKsyAsfNAtFXkBVHBSTFnBR2BoVny9MwPaxupWkvOoWl4ZNVoE20rtjXINnpOWgaGjVo2+QoQgLzKa1F9FHFbatv0A2mJaMbNpAdig/NU4eqU2FlAtXbeDxhknrTjLA3vTmwq9o4o7+gALUfgCtSa6u5/PZ9Obm6vq6KIpHj5/0B0NIae73ie0HdfitgE2HF+3vHGB0o6k2AyuPjBSnqe3IRnk6fNhZZ7+5dZLRzjq7E4VV045aFxu0WFx3XDuFQglKjycu87hZe0M131EeBpVj8jTLi3wOxODbn3/48fvvv/v51c/f//DDxeXVKl2DQNT0DcswdSfBYpU54kOpsEfnIz3lmgdVhRZ4tQN02Xfis65F1W21gLbXCJ2bTobUVvvVd8Co2oIWFMZ2Rk/3rXY0SW3A3snmYT+Kh4UlWqasq2FTmZQzKToiJYU8LNBhAYMX+VjNjzJ5tiG+npdlMd7eqcpyb3urH8f3DvYfPHjw1fPHh/cPd3b3xrv7ewcH/cGwDzAQWsNjZ0QoB0MEka40Iwvk/mILxUBA7S1SK7f6kX7V860l8Rwvk5yPpYP6S3ra2xu1kSdskoHSicS5r7yeqz/KLRauRBMh8pFzEPYxG1+nLCaOdvDGBjy637eMkP7MxhscmsbOIv0hb+7seFMc5YOmdqRSxtiVtvElNced58EQiI2COuoIphYyoQm6+bQGi+WqOBdXBCGoRlUiDb9HdXDz1XK5Wq2m0wmKSZeXFxfXV5eXF5fHxyc30/nx8fHl5VUvSZZpCu1PMXpVluV6vYYaqCImx1RnwqjcApEaG5iXKwc4THtGeRlpUYMAQjvcwjOqOAjdP1BeYNiDaErpwdN6Q1qCT/qmNl59rVmCNUmIy2HaeCJ9ACoDDAFwBVfUqMtHtR015xwlaqqolhdFMR0qjhMpJYVtbWB/cRQNBoPD/b2D/d3nz559/ac///nP//bk2fP79x9sb+/EMXy3LIsegkNqXdP6HibEyzeQDs+zy9VcYA0gQfXS+qg2VrXXdWeddfbbWAcIO+usBR258jleoN9aWEO5N4YAqW2mYtom/V8A4Qa9aAnl+Ko0TbMspx/RNE1Xi+VysXj35s1//+d/fv/9d3//9h8nZ2fXk8lytcby4JQ5AmiQnDRJIkKPCXuC4Urpd9Hw71sQb535tOcsiSG3/VrX3iecu7j5JSMDoo/u8CC0qAe2tgc71ECaMXJVmZHNE7CErQWEbOL4EnFB9fqQu+OdBEGInbvKEDoEQm4f9gagPJ0giWOv8oaD/rDfu3+w//WLF//2p6+fPHmye3g43tvf3t1LegD/kn7f9/z+YIC5gSHxJTH0iIejhGFEPcrN1ZiQu7kRtWHQqXgtd8RE6FkqyugX/zLeMPmRDBLsnTYlWwxIUJyhfFS/nSTt010ZG8ikhuBq97bRql5dra4Bo47ofN3UIhFi0NSS0XWD1NkzeQhQ3ImINOvNWIwgsErlUtZHXeasQMt6mz2dgekMjlJOyiDYlwpeF094+53mfTeCzObDp7nQynnpicScT0xehlTrGNueE5YDoJJl2Wq1Wq9WeVGslqAmXS4WlxcX08n07Zs3796+u7y4PL+4mC2XRm4KMvg1dsTBtyi8wLDNIb7ITIVS896QCwd6nFEEvkVRhG813tSDQRI7jUxUZh9PZkIpBeZJitKYjm1KQ7fcwdvfXc1gk/qKUxZIb0A/BfZlqt60HPpR1VDpFWCTz93D1/TYCt8yjS/BMckDNBnU8AcUq4qiJIn7Sby/t/fg4YOvXnz153/7y7//+388e/5ivLUN7UaQpo4TkCpAW9MN+YQ8znQzzE+kRBmoraJ0ItVMrDTFkZHSw9tZZ539ZtZJRjv71zbjEqkwp+IBRCdGC6Z4I0RuobAaypWIPjJf0WouqgnHuXe3noJwjrTDLM8X8wV0lz87/6///Ov//J//483bN2+P3q/RA6sgLS1IQW9FbQZz+vUV9BVK6f5Gdoo+7IZ/OY3DRfam0CBVAGR3DdnR+p7oeFzP49bf9Vq8XH+gt9kgYDWHMzdR9/UyHqUQIg3soqoCqrC0m/BjdivuGoXwvRA7CgJ4A0hHrcBGw8G9/d3hoH+4v/enb/701fPnz54927t3b+/gMBr0PS+I46TyqiROaJ/9Xh86SgOUBPBJmBLdbiwYE7DilxoKkjsuVUaa49g+MgJioARlrQeAI/WkhDVhuc2cR7Emf4SOHdNHpmaMZOg1b5NTuVXfS9tooDW9UF8Va+dYOyq303zLEI+1Ci8yax2NrExp9XX7kUEUBkYw0BOgYbpcysNgwKdiSkU0rvpW6ASylms1NX4YoEraJI8PLrk3lbWPtiTOBtdZ4WoBsQKHHfTiqIud96GVJWZZVlXQtCZNoRgpYQlQkya9fDCEznjFDvFajx4vsiz96uuv3755c3N5dXJ8fIqNK84vzufzxWK1nM7nq/U6jCLYZ54nMRRELYoihDcYAE86eVOSlHTCppGm0t7TPyFjDd5BirI1by3qqKlKTWHtHby5+FqG3ZPYUihKd4q59+jOpl5odoT1HqTCV1OEQmIEnWigA1i1AzHy23gW+NRbgQa9QOy34ZMKYltpli0XPtyd5XJyPbm5uVmvVlmaPXr8ZP/wYDgagcTa5GY32nu4F853zIcMQno5wHtH8rpbqFd5Wl1heUcSdtbZb20dIOzsX92MmgUi7vLzaUOtrAblYn2QhAcly3HBlNB0f5LNLzdkAplfdCt4VL9w6IR4vpeu07Iqqeoj1KFMsxUU9Ls5Pjr+6//6n//5X//56vWr91hKFGr3Ub/pvIDyldhPLAyCEjJ/fKxdafaN/4VQ6FKoDBSGqbNsOEB0huzxqqKAoAWyO1Z1Loy8sAUT2j8/5EtpQNiIgPMS7a4ul6r15jKNPeh4zdw2WziUiQVQfpIHJjQg+4nYvY2hIKI+goI4nlDKD3iSstjf2c7zIgqD0dbW1rD/5PHjB/cOnz598vDhowcPH95/+Gi0tdXrD2OoFZoEqG8NgVQMgf3DJoRGDgqtIriVPP6z6QmJuvWOTpIJz4u/pTESb0BQhJlD1WPDBPJRuceTQCY/55qSqK89F8jSg3JrlAIS0/14gV1LS9qRoMxOM8mC0zV/zEVoXFdTPNtBoD+Jd1KsoNBJ/FHzW5YVFfxXl8ci0SosHNcvqaPBBgwUFGmnLl0jDZMUjHGDNHwghsHwH2Ahc5scaqV+O3Q4qv6hw8e6XrgmaLEHOsQpksSrKuhzCD1OiW4KQxI4eJVXlEWv1y/yfDzeOjg4uLmZTm9ujt69v7w4Pz89Ozs7X6Xr45OT6Wy2WC6gjWFVpVmR51A0a52mWJ03pMYVpvElt0WhtxGm8xq1OSxAxVSRN9OgyfmbdGxhCA1rZoTKNC5hEJIm1RT21C/92+JZraGZGvZr/XoTBwpt5ggstdJEXpLqa/qITREEh12Eo4PaWhTTkT4fQVZBO6IwCKoo9IPg+PT8ZjqfzuYFUL7Lf18s8nR97+HDwXCY4wkMh0MqsEyvxNYLrBUcrsWhmuoGKZ/LYFhV1u0yCTvr7Le0DhB29i9rVhQk8jDtRNKPLBU4AIeYBZnGvTY/4k39m0ryYaWoLUNiD047I7VSmWfww1yWBamwrifXR++O/vH3f0AVmVc/n19erDG9EBBjzgXcV6sVZfOUVF+OoQWdD9OS2rGuXXgj9aU2OC1yPysq4399hnsgvk4zjs6jJ53om7DTRY/NOLo+dQGKxtuH2nmSMchhb6lqj3+TrApawBuDND8uJB8kYRIGYTKI93d3Hh7uP3v29KuX3zz76sXDR4+H4/F4NBqMtgD8xUmEoizAnlWFewM/icqEkltGXJwbMritCsVdTJCDavcnE0FhDXIbDaWsOrtT4UYcZIdko3KZDU2jBhIK40keHI2vqSVjlWw4+LiNkXi6axhTmkN4m9GLnK8RiAopIVhXKD7Vy0JvLHt06tY42+iDCgVrasC0jsbGBadph0xZ3z15q261m5j7xhCaqV3o9W7SJT/RzAWKaYW5KCF9HwY5gsq3MGklkgJQoQqiCOqR9PJ+rz/oD4a7e3s7O7uz+ezq7Pz05GS9Xr95/fro+PhmOr2+mQA3tU4XK79AEEgqZnpAbDcJz6tQVF2DZ6bKKH+A04d6QDrAXvHUzhsPC7LClUBrBy/AGigMCDEOAo0K5QvSLbNmOgyhWXA6602gUb4romgmpaWgLuUPt8UQBRM6dXIbytU2fMhtPrDhJFYfQiUC7CaKIKKY53EcZXk+mc6+/+GH5WKxnM/T5aIoioN797d2toMwXK1WpB216tb6DHLXwMjK+435T3de2XBVs/ru7QPYWWedfV7rAGFn/5Im3q3mHNQvq8KEFIRGl5lTrZo96025P6XwwQ/aUwaFgjABaSzOXhZpms5ncyjMcPT+2398+9//9V/v37+f3NxQV4myxF7zeDLQZpCUouqEue2BSlUUF84R2rUhjWaTCfU92YYz2T4PFqSh2AB9uOQLpgWyByFxfiUXFJBTz65T4jf2g6hiHjcNd3lFdTroJbJHgqI4eEPqBYB3IfB849Ho0cMHezvbjx89+Pqbr588fbZ3eG+8vTMcDquqGo23sPUEiOrA4/SDMAEiBWhBbBwvNUIpL4u8K6y1GHzSMDrqTUOmETVM44bd1SmZxzJutC3hQVcxaHPlailtDBcZrKlIhykTStIvnCqm8idG+zFTD4ATkYSmC6JJ3pOvwwgwYWYL56C/bjeugStBn7d/pA6x8Vuq2OkGIOfOH+I/Nu1HHUK+ZQaR2UOerQbjSfoljTPeQFxWWM15XFQLCkstmqo61cfHF+oEjr1S1zWnO4g4MC8LcPhxelXIfEe+50dRHPhBlmf9wWB7udreAsuLfHdvb/9g/2YyOTk5ntxMryY3gQ+t7b0qTiG9MPd9LI6FPQ+47gs9JFjCl8lhMybcqOM2zCD0oIZROlwh/CK+jnwPqDToZlFqFFhj8OrvQCW1lfuy6Ww2wTZZya1E1AutFq+UQIbeTxMEuhBRH5HF/yYWBqSf53lxHBVFsVytrq6voa1tmpZVlWX5s+Xy6YsXu7t7PmRWYxjgVlVnbdqYYB+/b+tkvsLAvNa8As2LqMOEnXX2W1gHCDv7V7QaydWU3MivnVvnwGrknCr/iunSLjLrxUxhAHs4LJmQQkF26A8BUtWqXM4Xi/n86vrq9c+vvvv2+x9++P790ftXr19NZtMsg2IM1OuZip2wbBWdIZSbYoWUEBoSsLYNZWRyWaqUKCMqLA1AIKR27eRGOJmAmqRpdT4+0XCnoryte1o4bswFmYUWdlI+lXQsRddSqF5kknSsKIrkniLhByo1hme+FwMNGMTDYYkbHO7tZTnocnv9QS+KDvb3Br3ewe7uvXuHL16+ePDwwf7+wWh7Z3t3r9/vJ9hHPkZW0PO9KIwiqNTHvg5DXBClYiKiMenx9bFoUGUAup680mfSLLRepkg9DYlt2sFZ99GKHvGrBj7JTKcULFPnho9m2m8aHCf/Mswct0aUHglEYjtxFHsGkIyESJUro8DfQQv0soVu6UJwAF3cYllF/UUNN+3kE/qF9qPRgpydsx+dHmxYeZdsbDk6s33mdWHCNJwxh8sG18vNNf016CEwl+6Qi42KO+r4n8Gf3kQHkZia3kAUlkqzlK4mikFcGoVRL4F+6OPReDabjbe2tra31ovF2enDt+/eXU1uTk5OrqdTUD2kUG9mPp8RdZ9DvSx4/8J7D/TVVH0GJRKGQJQbVBg1aWsIzk0yBSO2CtMU1R2SrwaVX+KUdXBUDeoIFLd3u/XFKB9ZFf4mhGPaY2g0yFegZN41uFl7h9eKndbKiUkfyDAkSrb0QDAPFVhn82UYhkkcXWXpYrFcr9dlVc2m08VyvlotX7x8ubO7R/c0CFHZ6/thFEndtNo105nVfkbtr5Bsb95IzB8S1DcjpjFkBws76+xXtQ4QdvYvbc2u1vpnWy9oQKKZwBorqEoesN9cC5dydUeEhVB2D7JX/DzNFovF1eXlD99//9e//vWnH396/fbNzWw6Wy6zHORSabrGEDn0lYL0tbLk6iZQbhTiu9pBsR46+pYt1/zBYXG3kSZ/et1nQIUbduA40q7LbhtVyVlqNKG+bjkNncNiPWYb+DdwEqkNIDig/QOVe+n3epXnDQfDg/293dHo0aNHz549e/Lk8YMH97d2dnqj8e7eXpwkCTKBWBUmDsIwSRJMD4XkQ9p3AMlO3DPMdTw/adiUXtl2v6wReZQGZeAix9pVniChlhpLJkmFJv0NIJm4oLqBmCK+kCnCFFz6SCk97fnQNMTBoK8DDcPPi9xHgUimz7h4xrUBU8jNTgmHblMctwP97BqzjR5YqU3qzjrm6NyaKy48kG0dyG2uxynlYmavJUCAEuVLFnhu2hgaVpTuhUUXDlzks5fimR9PDH6KiYa81j8G8KEHHHiEalI4514vTpK4l/QH/Tzf293fn89m9yHP9uECCykfHR3N54uLyWS+WsVRSCVJozBMoZ9OAR0+seJMGVTYUgdqlnC+d+P1Wz9DbnyH99GFcMKm+mqIzQtDEjvN89R4VelD3RGrCLa55dWpcZMu5qvCeQ462kBaSjhP4kI6N0/KIMEneZ5DGmFIDS48TF+IvDS/ni3890fT2eJmNpvO52VZPn3x4t69+2EULRYLeMuRwiEMmxdfezCgeA8ej04Df8jcQtBCgkKehuzENoZR49MRhp119qtYBwg7+xcwkdm4oVx2BDbgQG7ma6Kb0ue6VUum3BGHV3DPgn/zuNw5FdfLoY77zWTy9vWbt2/f/P/+f//rP//rvy4vLq4mk9LzoO4CkIEQI+evGOUqtJGqeyLCoOEf7gdGMqQVl7XrFt+iqS9qjql4nJ9iGl1vNFF6meG10N36wCoubsBdbeht/g9/1cpUuToCRMqrKArjKK4q7ixflmW/l+zu7Dx+9PD+4eGLp0+fv/jq6bOnewcHg8FgtLUFsXHIEEyqqhr0e4QnMcEG9kkpoggIuVSMh4K3Txuuxshw4VBOVQJIRtiMFcQK8MrgSIKkLVxC8A7oSlNkQrSaLDjFodNt6GvRel2qxy6o7vMGQLHmk3Lt6kyLTAn7VDa2sYEAvJUBS4Fb92PPkCCL4lxMoRdVVdYl/DWVpzAnRw4cLYBTU1QaUSg8KcjQgAp+AO3NwA1ljUghGzfOXRIdo9HobpBeOyVOfwUTarZWAoT01XgCqIUmcWkQRHHci0EOOt7eXu2lZZ4/ePS4LIuXL79+9/bNYjY7Pz+/uLq+nkwuLi9m8/kUcMhi5aVhBNVNs7KMUYyaVXkShiSjx8mmEJtTG1lG10iOBddJhMEVhRIjTVmsJs5iirS6SLI5Do616U3uOKj0ZUt42tN0khq1ksLCKnML2kJ4Oo7J+auUgIAZmqgpwTlJz35ZeTmWPl4tV4vFIkAVQ5plURTvHxxQPWQqD/UB+o6CHFjOVVJzWdCh4K87epz0zfytmdn1iridddbZZ7UOEHb2xzfHcWxgPyLrONPMfmoFNvSjVpaFFKFxf/9aYKETriahF9ZbAzIQ+gdiLZmyzFbpEonBy4vzH3/44f/7//l/f//Tj6fnF7P5Yp1xFRmsKZrHcQJ0YpVD/W8oSGqbIlI2moJwtMSnpvxv3YXZ8A/meqWhsAzCLXURmwpbd2N77bdtueEnXVMN7LI3ouDi6zMIMe6bRd1KRYa6WHShStTuBkGeUyM1aCQIAtEgGA0GFaKXUb+XY3GF7d29+3u7X3/99Z+/fvny5cv7Dx+Nt7fH29tJ0gvjGJSgcUyNnrGVINYLxVqkVIcFxafYF9GAwF+OBiU3jCP+HqkoySFG2sTgZ5WGJKhHqlzgl+mUWGfLgQwGIzyQJjGWUJKhp/RtUvfC8HqW2SNmRskzTdKc5gGbqA9Pybrr/A9Xb2mO5ZTxsJSg4tBaIjRmweUNeUD1H86eGzEg9QXLNxt1XiNgRB68Wqcv0PaIsQNvL97eL1tWxjbco10K720zSA199xu40e2DgwZqUhRI51nGrdCxgwoUKk0AGQ6HwzzPtnZ27j98OJ/eLOaLi4vz6+vry/Pzk5OTi8nk6OhoMptnq9XMD4b93mK5gnqYWONUFybimsg8YvA6w/GRBEyVZeey4vItGXBu9oG8Pm2Cr1sJtdjXUc02UX8bGLxNZt7jII1lQs8EcdTXzWRqHlRrUpoRHFG1yI8cpexhndgyShJqwVEUaYAM7XWe9ZIky4tvv/9hneVFUWZp9qc//9v+4WHSo3xqrgrLBbcaLzrDzfI5GMEqhQtsqw+N303tGeCBzT1xrqsrQNpZZ7+GdYCws38J0+SSs97NJNQ5dQrM8M8ZbSY/0rUFE8/lNfYYvoO6QAOFvN96vliv1rObm8vz8++/+/avf/3rP77//uT8bJ1meZETOUZbliX0qQeKENWh+tdduwKW45M19SaB9qyU+Ih9gwZ4s16q2fFd49waEtve9HfQStZ/421vNwUtzKZMgpr/u40J7IgYx47Pgdw7ZO2wwAv4l9CPDErFRJD0NxgM7h3s//nZ4z//6c/f/OXfH7/46sHDR73BMEmigNvQQ9JUHMekC41IYorNIfHKgRTBhiIf9lhcZ91Bd3pBIgt05sY5VW6ilKEg5CCDxKornanmMGlSR9d4i2bHBtox14dUolR30MSgiwyxeqEp3mjqhbJLza3G7J55oZYMp24xw55WTr65oAg9Sx4aL97ggBoJbtbYQrtqjd1z/UotqLSMk0UallNVY2g+0oSVuTcOKdpYsF+XfiDmWdDtYuwZ2mI/TujqN3OgpaClPJVQU5fRPnbHgbhY4WG7l8FomGf5YDja3t1N0/Tg4cNsvV5M4a14eXX1+tWrt+/eXl1eHZ2dTZcr3/OWGbxB8eUG9CO/XkQ4gIy8eUvScFu5J7d5tGfqELq0gghX4MrhuaAAhX1tNbMJ9Hu3pVTyp5CEvL0oPN0YhUaz9T3L9k2g2HJuPDpWfZ3nGc1G0roDMCuKPC9Wy9XZ2XmWZlmapas16EvL8t7DB0EYLpfLJI7phXBLz3pZb24ZnowfQItCRwavXmhuQ0IJZUpvzA4TdtbZ57UOEHb2BzTTScL8uKhSZjUcpYVwQi7VYuq0D7NGDiLBW0aFLb0lzCEMtAHL0yxN0zzLZtPpzfX10fv3R+/f/9d///d/f/ft+eVliqF0wH4V1BQlNIj5M1JFwR7b0izqQPrI7j+NNrClfHqr/bLfWjMW5AGID8uujW2X3PyGc4GKTLKf1dO0jNUdBeMSi1YQOLwAmLQQQ9pUhgSgXVVFYbg9Gj04PLh/sPfy+bP/8//6P7/65s/3Hj5OBsP+YFhV5WAwgDKKkGMI3R3DMPAj6iiIfeRxn+TbY4JcAdyIATu1KxXgjr4kRMG5HbmANBJbGiKI2tNL6iBPBMPp2sYEjBDUEZlSs3SaTGMXJ2B5Raz7T+EM6uGGCk+U+zGlYJWBoqCuLTDEM0Jfoiqp+hFcoKnSoY4O/ITjMjJ6BBhJMjYTymkgww1YUYSdOmmqRfPpbqyf99qa2oIq6KK/RUiD/lD9O2RBmkOYfE4FWXlaMB3S0tXDOTHNk9/GPv26KYRefXxsdEaEgQxTpSQpTC2kCQlFAbMUx9DgM47LJM7zfDgapWm2s7e3s7f3aLG4d3h4sL9/cXGx8+bN+9OzyfW1N50tyjLq9YqiyLAvK45YyWVOMXrB73BFHevXjY2lSC6uRYNS6YjLEdnXrKkQJhGuWtNa0V/cwiJ+wvCKHtblqmXJHktzaDV1RvsPk/lMJgoEEA3zDKJs/DgI8nVaBQs/g0hm1sM2PGVRRnF8eP++H8eQ0G4mue5DUzP1PMIjTzJyejPRZHAqJ3EQSkFEc7K1iF+HDDvr7HNZBwg7+4NYq9/t/tOCQL2gHSxUjlZaKarD/IoVFF+Q0ih0qXfrc/NB8Fc2y6D5MiXYrFfL6WRyeXl5fnr6+tWrv337jx9++vHi8vLqZpKmQAkSJsQapJhtqKU1iqJUbcf5cmrqInHCVC0TgyVs2pGlTj/swzSS0zbfD+vCOD0GjLdF3oqCgOyIcb9j9ETEmRbJkOvEsOyIrgwWTBUULl2AXRzyoiAtYhQGUQjFP4dJAnl3HiwUZZFE4e7u7s6g/9WLF9+8fPGnf/vzk2fPDx8+3t7d7w8GyCn6UdQP4zioSmhjDWfIXbwg7Q4rh9aKzoegHZUh4xlCM8HMTOGWoE6saTXO0KjWsIuaZ9iMVpNAyBcuvq/hkniWEGRS56BZ7voCC714Yhtv2LjEptpJTYHWJoitERpcOdUIXJtHty4kc6TEnbm1QAQJy2DaK5X5dme7Rden19QUd225UghADKdor1lK76gFq4qz4QzBdbbGjGIFDTrkUXXOuRbVqn2kodotsFDeWp9m7glAAw4VoXHhi5ow9FwndOdJTep7YRTmXg/+SsqkB6xUfzDI16utne3x1vjk+Hg4HMRJchQGle/31skqzdYp1DL1sgwxU4jhBoKEGL7AkAY9UCYbHOIdakLbrq3OcKFgQMC88+o0sUXSOjZLNOubdGeNaLs1AY5o4WvATy7B/WFqKj7MxigJIFjGrxTDccIbCl6WFfTOgfcSdMgtSyjxmmV5kgD2++6nH9M89ypvvV7/5T/+j3uPHvR6PeywE9W0o9wxyD1Pxux66Ex2pERw6WWK/0ChhRpXnQIs2tdPHuTOOutMWwcIO/vjWD1SqMOJIu4x/6LAfItA1HEEiQJk8k/97Dot4BHwCFy0B6eYK7j7FTRXyLKMmgiu1+vZdHp5fv7dt//429///v1PP74/Ol6sV1mWUz31NE0p5Gx+rQUOWR3RZp6vBbTV3AurE7JhYttMudV/FAHaXflF57tCYzKDJpjIIAHF2Bh5btObtGjDKFANNGopEQEgkBgt/AZwg0YKBQ06wjCG/JdoEPUP93ae3Tt4+dVXf/r3//jqT39++vzFcDwejsaQGxgEyGxBAX28y6AXZV7YNBIUmKrca8cHp9qw1CDEKwEVm8km4W8DedhMuSNV+0KkaeDIWT2VvYO1yS8DqhBFnRyr3Wst9FXgp112+AH1ptbotZyTPhXHi3aQkkpKdAWerP2rH90FbB86wya60+C07kBv6pYpbGHtEGZ/NW6W77MhYZgLdbdxfX17LK91nFWJHAeDqTfR5jekNHkz4RvhOXUl25o5t8AW1CGXnvWb2kvfoMjgU8PelPQOpU3CAoYFVg/6veF43B8Md/b3t3d2RuPxztYo+fn1ycVltFob2TcUKynLMkOc5mPhLWGV1cXa0eciT3x8Sj/GdDUHaNlnwT4q5tXkvOjlRpsathKM07fp7np7M1B2UYdY5HeqOZlb5nObyd5suBA7wmCiu1ciL5ihUAVqutBFFQWkZBfBarU6PTtfrVar5XJycwMvt6p8+PhREATL5ZLa+ZB2tP1XxA0XUS48CipYRaICKCqSRmMvtbCUil7Pq44k7KyzX2gdIOzsj2LNeLkR3DiRbFxTqyCKNWNq2lHzk2nCnCIQxRU2taM1zUMpRZHFomgrdNaCbr+XFxc/v/r55x9/+N9//ev3P/18fHK8WK7CKIS+89h9HuvHqPOxMeAAFIbGkzZgov5b2GBGdajYot9aNfzamWsTWPxBs5jG/WdtG8NHGUzYcFKlnkndtxMUw0o78j1RlWi7mXNpSfJpSmwgEUVhnuXI9UUA8IJgPBg8ONg/3N158eTRv//l319886f7T57u3rs/3hqXRZH0+kDVhpBVWJZlBEIpLEuDvo6pjsGFQ5W02MA27OBMvj51GQEmkNZUwFTYRibyXdViwFbjBD+Z1YXK1WQdp2hG3bZe9mRMZzuuL6LuiU0f2uhZNpixlgWvscA3nnIIVaaexW9Ci9ECY3pdE0Vy7GQqtybytaDEOy/ouW0DQCZo4SQuKiZd42R1FvbucBjIqH/p9VD/yAp68Q9bEan9hFVKJMt27T1SAZ0WxOE2rXf4VdsKhLWsRklp/PENSVxydBIauLUvze7d516TZvIildemcMvwgGAJGqD+wMIIdQRxr9cbjoZb24PReHd3Z7y19dOrN0fHJ77vLVZBXkRZlmV5BvwVJrxBIRvPy7HZeoHqAJPJjKoAeouaQyJliPpk9VaX03UvQVCdbX5phxknCFckbXma7JTwPt5M7IyTeGtqkU10d6s1o2w6homBT/guy2KJq6ekZXoXpWlVlsvlcrlYQiZn5RVFGUbhw0ePqEqQsHY8IRs/AALk4M2MrR5pshnRC5+I/l3T83bTE92hwc46++XWAcLO/iCmpTK6E24NogD+QOynf2koY0oqoFg6zPySW69FwT8ljKl3FKcSMn4AIVXsJg/uRlkUVFP03du3P/74w//r//n/+Pn1m6ubm8ViiTVjiiiKixLKilLbAzL6QWaaAgGq8Zu1R2LWmB9Gt+wB/8CbK6WPdOKJ1Gq/zWVxvJsN4++AQHdfXOncjCpDPbdqPOi9sAmE2qHDwAiLSzJLHGfwQjDPku8t5SaBeAlqwHiDOPFDcAUHvX5egEB0b3d3u5+8fP7sxZMnL7/++snz5wAFD+4NhsMQ+sj7/f4wikJo3YzyJ9obzAEQrLGQ1fFl7aibihrUPludM2BBvhcFbygNxo1StCp4Z0XBuXMwixj2ckol5z7BGt6/dKwTiKFhn8LSDA4sRdAglFod4tuoNqG2HPrP8gB34usaGzdrkLZ9UbPxdzjK5ivdtKZ1Vgt5y6OpQSFHpezM1cPS8pGqcCnHcMa27UI3CETbOkyo7znr+RnikJCRBpjKOyycYCaTgxoktlTMFX3LQEiagW5rB3s4B8DUFsQwegP/JbBLeO7SNCvKovL8pN/fxgpQ492d3YPD7d3d7Z2d8bu3F1eTVbqazOb9qjdfrMqySuIgTVNgqHw/yzP3TYg9KnAw4F2BPQ2oULDpc9BAs/zkmjefgcHujCAQBTpT7GYPNVQNnLab/XLEIuE/Te7pgXUxqpWMqunt4CtZjzoICbGhmL+ERkee5/V6PTpYnucldKHwszCI48T3/Z9evcqybLVezRbz/+v//r8fP30yGo8h2aGARkrQZQSzDZvnxpRsBboJWmBemqMLnD0owT+pIkOietqbLHSS0c46+1zWAcLO/gBme8zxv02EUgsIGUfQrzX+6FFtA+vQqO/Tj5iOZ9Mvk5YbySZOHNTsnvoHEitIkCxN0+VyeXlx8cN33/3nf/7nz2/eXlxPuAsF7n+9XmOzwSJXyJZzKLTrR9ksUr3T/CQ6LrkaCuUE8LWSUM14b/Lt9pwTGWHHA2oLSwvwkDHccJ+wIV3NNWx3x93rEPGVyXkx0N5+kxIQsXgMlrkP/DCOsP4dHHEw6B/s7j7Z2/n6qxd//vf/ePmnbx4/fzEabw3HW1GSwPbgSkKhC5IvUV1Euem2S11zgFxRHNRMF/aPElOxUwg7XXTeXAxGsk9tARLMggJCQPX0s3VH5YYISUb/byByrbxS4XebifnZvNU/pG1ElU7hyo0EptSzlDdJ7SOHFDUAuMa+uqLfOsnZ9qS0WIuIwOo2haBGAGNaXOJGotSzxT00IqW/KSXNTDaHvJW9bDoNrdrgJxv1o1jiyMcKwEAVlpUXAF8Y9kdb2zu7Wzs7T5+/ePP61du3785OT98eH19N53Ec30yneZ73+r2yKPMCRRZQDhM72mOGsQlFgT4VFAQhqq8xs5deHOqONMSfSnmipOvqPqAWHFYixDEjZ8u01O7dJ5veQ10o7lJqNYjIkYvai1V+U+x+MTUaNyRYaEKgXolNfMqiWKfp1fV1lkEm53K5hN+sPHvx8iVkyK/XVDWIhKPtplp9BHCT4G1HAT6sI8Uhyvr5NyZS15mws84+o3WAsLPfuTFSaNHJSDtyiZWyLpQZpoqCodi0yvyo6EoPnsaDtkEa+Su8TUNHKdVEGapxAboiXa9nN9OT9+9//P57yBv88afJdEpaxPUaJFKwETgxCBYKKJ0Hh0D2Ucr2SS5TjXlrjIezXEu0MKVXFbo0BfQ2j7LFGq0bsae1AZTqL+rf+Zr7peVo7IC6oJLdVNXPQKNxLPKJvf+wnD3ol1ApispJv99LDnZ2DnZ3nj95/H/85d9efvPNg6fP9u7dH423qqIYQBEFyDAMqeIoEIPg2AEOpKIxWKeiTgS7w276XmCVF775IILDFCc6Z7tg/RubAWmBgOkJL2o+0fchv1EbUwcheq0oorPPa0ZD0DLCNlOwHb9x4wlbP4Zv80bM0K6Sbd7WDf27nb0Z4k+tYBxovs9hBynwUV8jkMNQa5aN5r4j7kU0pKeNkVTEKIZdwshUKvL8Ep69AKqYYAJw0usNwIb7h/fuP3jw4MHry4vzp+/fvz0+ubq+OjoOprNZ6QUUWev1oKseUFtY6Jg4JXlMmV/C/qxUCVeQjwynfYGaBXv3nQVb4wQYNiAK+fWP6QLOS7iG2T7ZWvcAtJvbe6jGzolSQ79yHXzPPzX8FZGW8M8gdXYNggry4UvU6ObM+JVlHEFedn8wkP4Tm266XYmnUAZw2vT6gvxRm4TsXGlrkafmZkat/aEwSWeddeZaBwg7+11anY8yMVvi5WyrYvy5V0l0LAEirwB7/4oYhz7mGgMS9ZU/FV8ogkf2rwyYhB6DpOrMskwSKoqiWM7nk6ur66urt2/e/O1vf//p1avLq4vFYgGaKMQtBehsoIIlSrP8ouSmBWEYGm+CZZ5OKJeC68Lx2VyyNm/DBYeGxmOYccdSMbKR83tshob4tE0/w06dGOecXSZEqsqZNVAmQpqYoVcXhiGV1uTGjCjbpYB0r5f4WOFzPBoWRRGFwc72TuL7T588evr48Z///M2LFy8ePX26f+/BYDSKogQw4GAYRjF6osAlUs96bGGPolBLwrSgwZoqVhpfYy0hWETNm+GmjaSUfUSiJpzMMHYsLcnNZLXFdzJISuAna+xGFnY4oFqWOlfpF5oOBQk/Bv+wnK1QZo5PLBvLi4upEru7jXpXGzJpyei1KKWN+DXzhhpCmjXMGhn6SKdreTV6TGe9ykREJGDAKufKWoFAa7qXArQuv9l8b2D9J9B2FvxiIa4v7vV29vbjpNfr9+9PHty7f2/31auL68n21tbx2fn5+QVm/4ZZui6LMvDj9Rpa5zmvR0PXS3NHpMLUqNqeNzbTWgpA1ThSdQXyIwGDQePhMPzqym5pWvhBq1Fn9sVh8lFbkZh+Y2shvk4dZZ7X/LxKR41+vy/9dKmaKElU0ix79+49/tqW6Rrsq5cvR1tjD3/U0nUahkZwQapg52WEKlBT+lWnOegUen3Jcl1aMmoXaj8oG4QqnXXWWat1gLCz36upuurmd97IKS34sb3d5LecQp5Sq8Vp/+v+qFs0SCUH1Ho+B/tbw3gNUi/gx6osM6wUWhT5er1ezOeTyfWbV6/+/re/ffvdt++Pj5aYW0jOGXWfhxzCMEKKy4MMGC6oYogGbvVNWs/2+LCkAW2EbYpf/ChHpFEmok6JsPNG8MnyfG1hXmZW7WZGJ1mXmsn3NKBXB4XvEXLDsnZQbxB8Dmo2H0Ih0V6S7O1s7Q6Hz548+cu//+VPf/nLi6++2trZGW9tx70+aEqj2AvCJMEa+Jh5SINu20h8yJfQjrMVKlu32g6gM5QNZs+dfRKO0FBASpsQ5FM9/VRZBttIhH1z3ayxQ4O/pik8Jk5sDfu1bG3/vYE6u/1gH3F6jYeLlasW2yi6SJV6VWVSbqn1bwCFSUdE5Cg9Ks02tTIh/Aqun6q8mvmfqO0kYgq/GIZBr9eLkyROkuF4e3t3b3t39/p6sr+/t/Pq9XjQPzo9my2WWRjkObBYtEtu38N6/sLHQI0Gp0ZqgpptPrJ5uizb+YGh1SJeaHmK6pOybIF/Nannx72QN4hvnWJIG9Bgja3VGEz/tsky5cALVcgSX7oRZblO06Io3h0dlWW1BvgXhkHw4uVL6FlfFJidCK9m6tHaGDj4A1IvTR8d+smW5VqNNzVXG1QhZde7zkAnIu2ss4+yDhB29vs2HcgWmY6NesIyuBGiF0JmCX77TZlFzgwUGIi7s6VEBQGKk91yDlRIxPziUt5gnmdFXqxXq+nN5Pj9+3fv3v39v//2j2+/PTs/W6cpZmlwzXppPw/lJ7mcmz0wlQ5pCHv44muiGU7Fca2RbvGZhl7Jq3jssMmYnIau7splJxtnZhfklrBTAIIxIieAIuDaOpaxhb7wuBBB5Zc4LzLP8yNIOgqiMBz2e4f7u7tbW08e3n/51dcvv375+PnzB4+ebG1v50UxHI2hf0QUxUlSVdBSgtSc3FICka3pBNjuUmgf1wk6sD8pWVi2tqDDIkmZBNKDWj7aIZccr06hPdm/sNW254DDFtv71NlvYb9+I/g7ncWtrrDhny3SqYW3VEcX91u1nDrmnxn1mWNrar8edWK5vtmhREVUeMSeoi7aBOVGQ0z51pVa4DGF6M9oNBqNx/cX8wPoYn9wuL+38/Or47Pzs4vLxXINzX68qshB3BiG8FQUJQCVwgey0YcnHbh69X6qtZRU1+Joa3nENr1ORUhioKzIxd1omhM++KWv5k2or7aB0ua3TBUdEoU3IYjgsbyZbGDiqQXeoLIsp/NZcfQekrchEhckSfIkeJb0ej5wg1yHeeMTYqJWVMaZOs3oMzEQ8bbrpZ/5xo5NknaHDDvr7A7WAcLOfsdWCz97Krht5EAo3mMQSGXxuDgH4A1bO6aOBuV32tBXoiR1DFwK7NpESlEgBrOsQOHoep3Obm5ms+np+/fff/vdt99++9Orn88uLk4vLmaLRZblcRwTEpTeFdBBCw9pfCzUHRE+MuFTU7pSqX2UV9L8gdeX1xyrjxho2ZvAG0PHWpWqkn61EiN8XVp8qbVPDKaALUX6j2vKAfWHRQ4qbPOAZfH8MIyqyiNEV1blvf37eZ4PkrDX6++MR48fPXr64P6zZ88ePX784PH/n73/0I7kSLZFwdApoYECCqU1my2OuO/93/u5eWtm1rx77rnndJOlobUGUoWcZWbu5hYekSgU2exmkWHsRiVSRHh4JNx8m23b9nDp3mq314taLS8I+71+AFKiDiYSfcg/OA4I7ZEETU2n9cpMCL1+bJFQasdWE4PXPaBNNhS5aZqUZm6Rmg+FeSWlrrRVlXOrk4uG08YZ15/Tc7yxr7cS3/CfOY4pW3wRJpMwzAASyd22VghJqNCLDH7x67Jet6wz1GhcIhPxd3H7RVGNH2T1XdeJ49h1nCAIOt1umiZ+AM0ponYnCMLllZWV1bX3Hz7M7O0fHB6OxvF4NIwT8ALjyShNM9/18ywLoFoYG8FAUW4G6yx2hdHqM0p+RtaC8lgkAOZuEDxV4h8pNKqI36UrVX0kCbSoI/9M4Zkq4Ky+xJPP98v6lOLMg4oM1GbnrktOrXCc0If2SNQ6CJwdVDrArYn9+PDoCBbnwE/T9F/+7d8ePX7Sn+23PDdN0jzPYLGNIlo7Le6oYM4rEjJ9K5Q2m3ldMC3K2WZZNyha9doz0Fhjjd1iDSBs7Bs2E8lmqh79i2VaqkpE8GFYM1xXCVaqA0WuSzd9Js9Yw8+Bn7qNAzRlwgeTySSJ4/FoNBmPzk5Ojg4Pf/jrX//6tx82t7dOzs6TPB9NJhlUtrgxaYpilFp22+MNgc53Mv3VROhr4ZZ5599hYk0IuXoK3vVYw2DxGwNfBKrmCzQfEfsjKfyDWVxZJaWyagDjAbL5QYBYjniqvtcJQVdwrtd+uHZvffXe40ePHz56sv74ydra/U6v1+l0ok4HEF8Quj4RROFUmA9EoKkURL+8kTdxbp0Z1KEHk9jk+AFPpSn7Y5RIsNLoj6g301cN971aw0h/+Qh5qr525XvEx5Ff1AYNNkZW4hCKHpWqA6RR+edslepaaS8kMqRh6dbQAfW7hGypzU6kNg+mP+LdvqjlQjLAaYEfUAt1it75vt9ut3ozM91+fzwaLS2vLCwsHh4dfPr4YXdvbzAYnp1fjiaJ77vD0ThJ01aIfX2yPHNzFxu75Frl1MA/PSeko6ovUa3MWp1VsUpFtYIesCKqwN8yPuM5DjRFlCWItWWWJn1615W8Zskv8y3Vc/KlarZQmlmlNd1GkWQUxQYeQsaVWJqaO1oUxR5wR/M0gSJDp3AePXnseT74OyT9+llGfVzrM4W8DMJ8E/9TtVuqyXPqKzBfLY6N8mQKfHi3mWyssd+1NYCwsW/DbIFp5YC5zkRVNoBagJaT4e7zSu8Re3zLGC2DwEq7JPOwItJmzgbd5lhLDjUEJgAFh6PB4Obq6vzsdHNjY3tr57//9rfP29snp6dJloVRmKbQhs5xChJGh4GVYuz1J5KlHhKP6dwhB/FLVusIv4wYmY5YeT+jJmZ/mX2d/sdKUMoTl8bA2TIiiOoyFVOkKRKRRKF1PNB9CcMQ9QyALOq5oCIzNzvzBDRjVp89ffbk2Yv1B49mFxZbXYCCWZb1uh3Xg3RgGLVgyQsCumHUmgLzsS7kJK2gdWXSxM4DcSCr1Ko7YmoIteJiaRq5vgoKFOE/o5VaKRw0+WhZkqTzipwYluKTImH8hbvb2O/YSt/wWziKHNLBf6ZsqXXYyoQ8KtozpXeqY5VOcSeSLZ8dRLZAXgoCJjn0FfRcTBU6DvQtzPOi3emmaTq/sDg3vzAcDp49e/bx47vL88uDg/3Ts8vTs4vjs/PBcBSGQRIncR5jO/s8TYHekcERMqY7wF8qAk5MI4prEHLIfAGqV141KleOOZJLsjJytQlVBjNfnJxpb7ljsrG2yFMVM9TdAgKEJf5wUWS6fg/V0YCRGyClH5dUF/q7RoHXahs/VquKZJ0Lwwd57gFar+Y5dfjNDJ4jbkYA2MTgbkG/jTXWGFkDCBv7NsymPpa5LqaKT0eedYxQ9ZoHZ2xcI6eq9JF1ZZrahWvKaC0aBG1S6GsMHZBzKLh3qZt8PB6PR8PLy6uz05PLi4vdnZ2Pnz7/x//8n7sHB1eDmzQFTzkc5I7rZXmWplkUReA+QTdPuTakQTLuMw8qlB5ddy94SrLk56dTQ9XslJVzptwOEcMuZfn4BpW4UfQ+HWtXBZ+wvcBKHo3TVNIPU6Z5ijKtCNahD4TnRq0Wnas/20uSZKbbnpubu7e08Pjxk+/evHr2/Pm91fu92blefwb6KWONURCGlEtEfigoiJIUjWMRRG9pmWVNo5YlxO2aVrKVidxqvL9EZBIt11VGhnPCNOdUhKVxn55tlSNUUQo1DvqFEz5NYrCxr7dqatzKLIncvvmqC84pYgLKkom/ApGGkl1tuBKb9+7Mgy595acPVw8GeOT4lwsUUgcqA5EUAn/3fhguraz2J+PezOz8wtLFxenZ8fHe7u7J2cX2zs7J2cX5xUWeFy3fSyYT13OCwJ/EsNp4rldg93MMIILLcLNMNQ0lkEuldKae3ITFyhxI4LdbSygGoLCgTjxJxyy0G6DesvzSLfNwN6yobkc55CRObR1E+0HdFlKvZgqK42ChQz3MQogrdlYUIOiaJCAq6vtRGE7i5ODoCCW7guFo9Oebm4ePHs0vL4dhlGZ5Fsee64ZRRGwIkAKbQs7Xq6JJdcrFtlQGqSdcaZWVdWXI9Zc0rhtrrLE6awBhY9+GTSV+mJI2g0ZIyZq0/vmN7BKESoyGPpZ4qK7rqs0NYpvAHMLReZGkKXWfBynR4eDk6Pj89PQQotGnb9+9+7SxuXt4eDUY5NR+AMeTpTFmE7MkITlS3jfok91hH1AjcFNuP/XzTfIPa49cM0HWtkNQQ3nfxJsdCrXXJzaV0AAgc8jtganGVr4P2qGe66zMzzx5uP76+bNnz56tP356b/3hvbX7rXan1W6TsAFKvrthGNI5qDUWHVLX8P2k/YEWIzIXZLReKENXCkVLhidtjqnpvKacKQocvUvnDLHYUqVGabQW8U8cWTSrb6yxu5hQdmHZI/rVnVqdpXfn4hnDbOBGMeIEVl8DkcjWzTLNm8FuSxlVTfFBMOijC3Jdx4H8nl4ogna71el2O53O/NXivXurK/funZ9fLCzMb25uHZ10D49OBqNx4HsQqMuIzAkLNKztOiSmFmfobSO43yyDguuA7hNTYm3QBLHTseJrVnATzAdFVBBE5Vn+2cWEPFNSwqrGjYqOkzQm/Xw5gFqGi8q34tEMdxR7LMVxfAVs3DxJ04urqySBbhQvYCkGmq7n+4XnemnqBLD5LDUcFGYNku4Fzxg7TVHMKZTGZWUq+8tbthCNNdYYWgMIG/sGrEqwsYrZyIkqgiWXDuJLstd8DUFUtZrHOg/sPCc6RNtj0MIuKiGZoXRdnmXjyXhwc3N2fLy/v394cLC7u3NwdPR5Y/P07OxmOHAcJwrDJI7hgxALRvkCCDunTHXlfYzZWEzZDZSAwS0idz/PJHdRTrtNJiuxcvR2gV8Qb5aKFJQq1Mp+BlgqnEW7PFCc85AfGjoFhH6hSaDjtsNwYW7m8frao/W1Fy9evHj1Zv3h45mFRdz5dYsib7WhnhDEB1Efj3Ag7Liw+lBzwDLEYPWbA1MgNIVlVCZTuQUwmijzqXpz61pKzJxU2ioi+rMSg2pvjZWr6iVJGTWdJNTN0emWUleJxhq7m8m+lhXWqFxhpqhi0ldc5ffkCiA51XIBUVtzuWTpzTroLf2UK8CmK2qokN73kATuwl9QTH9K2HoGw0lhNIO2fH09Bza7t7fX67WPTs7Ozq/Gk7iI41arRXE6N83yHJYI/gul5BhcmtZTpeCPXLiMBKlUFS4HHGUQTTxQ9HFaGXNskqHmyggR37VPbN1M6QflCGKVUKob7dRxQ0RzP8Py0NV6RZZxbSX4VuzBm2ZpHMcxUGHgfz50ePVm5udbnU7UihRjQoxkyl02z+seHppqIRxlVVPNIGoRjhRRuQYXNtZYjTWAsLFvyZRyRyWIye5K1HTRE6U+g0Yihp/Bfm7kMFBgpCbbQkfIMqDKuC7sFUBCBk8UxzH0GLw4u7q82t/fOzk63Nra2t3b29ndPTg8uhkMRpM4g8gvFNODikGWGs0CPeaA9FG0RI0KEpeZolIRjp+hf6yp+LvNc5kqVjppWUBCD8TUapo3S0Ylvo8IoijoouK+RAsFFTvE6lB/EkBFULfbo2Tv3Mx8mqbdVjg7N3dvcfHp0yevXrx48fLV2vr67PxCf26u024T0TUKo8D3czgI4EBP0bToKgwC9LBzfe0lm1916s0w5CQjzoQjVMWU3B3KGISGbXpCGPmLySUyqJWVNXMuMLj+ztrJnF9Lx4PGvhGT359blo7yEkQZHWaK1iiRaqaofUAj8iGWbPpXkTgMUGShpS/JgVhJJNVFFEgBxDCHGBxyCrqdbhKG0LcwbEWtlu+7s3Mz3V6n9XnTdZzjk3O3CIswArFoqFhzitzLcqBA4lKmSsQVsR/7ACmuuFYilcQTRZEtFE1RXYkKRArhYH2llN6Eno0IO6k9hZky/U5aBH7uIl/S+7K9J0f0ZCWkaaekF3BIBiqqC+ioUVU2cWvhXXFMzNg8D1zXOzg4iMfjNInjJBlNxs9fvFy+d8/zZlnUre3CPLt4m1Qb29qBKwdS8u+iUNNkaM1bydfomyKjG81C2VhjtdYAwsZ+1VajMKbJRVZ9HUvIWEewSKEl1mhVVHTKGOhk2OMYvFeSQNxzMhmNR6OL89Ojo+Pd7e1Pnz5eXFx8+rxxen5xdHw0GAwRRgIZyXEd6FOPg4QwNm2tqG+BGIrhGpVL0ezEoLg4zmXZFJq/67RPOXvNM8zF5cFJaKu1xU2igERWQCIC93O+74VY7UfbEs/32mHLKYrZXufB6r1XT58+f/bs0bPn648erz140On2Wp1OANu/ALB04aAkPUSwUdkPDotid5rUdev12uV/XOfEWQ9BqsI7pd5VkZJX82AC2GW4VgKEJLOoZkOkVwWkJMqo9Wpl8ptNTmNfbbwYcj3y7bka2bxebLXN2yT1VD9TWcokXtRND9V2HwGiXMqmr8r28XWjPPUrkc01AAOkgUonfq/f7/V6i8srC4uLs3NzS4vzHz5tHB6dZVk+GAzT1G2higxE8Xx4oJrEyvnBwCG1C6KWCLzq0SVQstCrX65vvR3YlseSQ7Puwlev8FakiJKNFmbHxQe7iNBboDqa82xOOatJxwPJVBWdUqwZ6N6Bt4BGmOV5nECvjyw7TdMsyXLsBAnJQ6coona70+n6vpckMQQH6dpr52RK7yLZAUU5aHG5MqApZW/vFGhorLHfqzWAsLFfr30xdE0ZJCQfCinRSp5qGibko3F2xjoHBbB17z9wmJTlm0zGk9Ho+ury/Oxke2vj6Pj086dPG5ubpxeXR8cnaZZdXl27rteCLnkgxg1K3FnK8XVOHJm8X5mKaWerphZaVEQBNJD4OSb3IiLxZYMQqRTHVTc29CIc6EFLQRXoLiMlBIEAAaEQRSuIQrt5xHitMFqYm320fv/B6urz589ev36z/vDR7OJSp9/v9nqOU7TabWpO6AUBMUUpgI01eKrblSo4mbID4BC4Kokh0maB7M1yJY8KnWs8ZmoJRX7DKNHTa2qbC3WF8iU5A/rzMi+ikoZ8T3/mDW2ssdvtSzhQ9eyRPWVE4sWUbtFLDPo0ZCgdUXU5pEZBlKkS76qI2XyZ4kevUaMWEB8O1MofgqAUBIUKZ0IvYOvXrNPt9GbmllbuLS4tP3iwvnLv3oePGweHRycn56PRKM+B90FM0SzLkjTB+JQH5A4qksuhaZBLTS+oqyqLQAGPFYCRWvQqKVQ5g1z1rfggRGMQ6laG6vIzYKGJn7JfwPPJdpA0z6q5KmDB3DA76IyaAcGYUDaVNV2CMEnIdRkptOd1QG4tSQqcOZQgBbQ9v7CYz+czMzNwkDyHRhNlFGffYv0lk2LU5cvU06Ijqiq6Kq6UXJQd+GuQYWONaWsAYWO/XmM3QDsP7ichE4OUudElWMZblITFVE1WOTdYRS/COCocxwk01fX8vCiQU4SAcDQ8PNjf2tra2tzc3tnZ293dPzi4uLo6P7+cYN2E43hpmo7H4yiMUoiW5qggiqNT6TOIWPPppLKK4CUawpZStzOv14Thb9klWJf5xd2ELNG0FU304ah5gieazPNHOQRrnDf+L88ySgkSTcjzvAh4XKHngjQ5huLzhYWlNEnaYdjv9e4tL7148eIPr149f/Fi9f793sxsb3am3W5TlWEQhsC2hUIhn56h7vJIAzajqg09V3cDnAMhNIbfH/PVEtxRrcChxTEUTjQbPZ4kt/6ZsgwMp1P1UyLB2lhj/ySz/jQMU9S8WuJ+igSjnRMr5R4FB9U0hVVZHYjJyJ06ZeGkoMhtDIV6IKG6FBJvPE09J3Pz3G21u54fPIAu9qvrDx6vP/zw8f3H7e3t45PT0XB8dn7ZKTqj8aiIi5YXpWkaBHCEOE6ITcLNIxAB6qmBc7godqpCaYT0eISwpJQznjQXcvF3BSaEQCSlHEXmTebHvvY+mvsl2A9ytYd51qiVcbvymoqQq+Au7B217mhKLBjQHQ3xHkI7EEixuk6aZUEQeK57fHwcTybj0Wg0npxfXD5//nz9/n13ba03M0NrNVQNIJ4k7ijlDKvXIuGcJTeq5lyojBrWrkhtU2fIBg021ljVGkDY2K/OLL6HfFLmr/ICKvqMjEy5tMtkAilPpCvJyLcZVzfl7NRSiQLUaZJmbgadA9M0iSdX19cnR4cfP7zf2tr88OHj/sHh8cnx1dW1IsmAwBq8k1g348mkKPIsywMQVeMiMtT1rrs0gwH1XsF6jz3Ou9FES3p/gq45zXjzZu0LS3MmcQt3JNTJNhLPtAL8iiDKzR48LwyA8kkJvSAIoigMPK/fn7m/vPL6xfOXL188ffny3vr62v31dqcdRFAiGAQ+bUmCMKSQPJ5IdQvRmbs7m44iy3IppRGhwFtpApVOjN7KAiZWJFKG6RpA4vfXUOzEZlqwQMtKjI019iszQbEr/S2Lv2nZ154Tg4ZNKmFevclwWA4dQfEB60bya3f/K+HUIxwaNYeZGAL9ffLABV5CEM7MzM/OLczMzj188GRra2N7a+vk6Ghza+fk7LLbaV9dX4E6ShCgSopSIs1zhEA6ZUopNuICgJfBmJdKRmk+uJ4cdUmlBV9mArVYjaI26EkrKL4pF6ifRh/VIFy1jix7QLhfGpTzEGEFp1JJTmbq+dWjoNysDt3iypamKVyBB6G6HOVGC8e5ur5BVTXn+ur68uJi8OpVnmUra6v9uXnXdUfDYRRFSmKrjtBRrU0QAt16QsTXTjJFy9xRuEjd/0O1S2mQYWONNYCwsV+pTQuClqLLtNgjZ1TDEb19qYq8mUKPKQRRcQqrpF5JgqbJcDi8PD8/Pjn+/Onj3/7218ODo929vcFweHlxBfFQUEbJcDigI0oBVtQiQJCkorwsKKrTRQKE0PZAXyCN/7a+w183peUyNlNTUUGGomDETqCJjwuQo/ZEDDaZFIn7Qiq00Qf1aZeAD0g8BmBhGPquG0XRwtzc+ura6vLKkydPXn/35uHTJ4srK+0OGDBIWy1UX4BwfZHnge8jts8lQfR2787ZVfNAVQjS9KsvUlHkpRQea8aU0iSSoCvyfDxdio1FYLH0fa6g6sYa+/Ua56w1tpErh6mAFiE8Vdtsoig1QjP0iogkMZ7UCEkqkloc9S8OWafsSipSDDYItYEUse92OiBQPDu7MD+/sDi/dH52srK8srm1c3VzfXjoD4fDcZyOJ5MsL1CJNE9TWOpJZ8YElDzlbEAbRrM59DpqrrXk03RXJLFWEt1RH0rRLYDNSWjQqi38WkzIJ+Nlq7ye6bdRQz+NRWur6/UyR4iXlGJNNi4vMsf1iUFKqT/X84A7c5m5jjuZxGPIFE7SLJvE8YPHbn92VrF7FK+kgC6TUxQB+DFzVrEeQVyj4B+rJ/VqbPd4NN++BhM21lgDCBv7VVqVD1l+kNPCr0ikiNqEyJstHWMEtaezRMgLQmYP446IAElWFPiN49Ho5ub65uZ6d3f3w/t3nz593Nvb29rcuri8TpJkkiQJaGuDlCjEkoEyqtAdpDFNrSDGU1VxGlyC8cr6MvTVc7WDkrlj7CGiyaUM6l2Mp69c7merDFiA0JpO1QGMu1epJmaqpyDW18Blu0Csgmwp1d2wAGAUhvAgAiJWURTz8wtOkc/PzABBdGnpwcOHz58/f/zk6era2tziwszsbLvdVp9ttah5veokQRRREKaDWHTtN6f0FZKpDUGRMqwtLU5kPqK3C2qazC6VjqOuWm1W9TMyQ6mJpur2lZOXzf6jsW/UDDKUUSbxmkzqYcKGpDdLajKGDm/aGNCqzm+jumNYT1SujeiKUtjmq8aNISMIQhVFEoYAEkEeDNoMerNz81Gr1W53ri/X5ucW2u3u6dlZu9U6O784Pz+HjqZBmOVpHCee500mMVIbfQj+YZU5Jaww+qeDiRq8lRdq4YL00gl5OcKWJokpaTI2Gd3ChDyfFqnSui88zyX/Ub6r3ArCvJNaPegacfZA/B7ggVDlJC6nNAXQqAMvP8DkKvlQoJjmwen5+XA0uhne5BgtxUKMeP3hw15/JsEV3ve8NE+o+SxTfKpfPhO31fxdFYNTRd4mtkry3RSxJLkB0RJW8W8bNNhYYw0gbOxXZFVlMBHwU17W1BNqLRn6LOM9fmgwD0Vb67Rk5Lkpo0cVEfRcPCGgl6ZJcnl5fnJysrW5+eOPP+xD9eD21dXN+eUN7AwcB6RE0SuNx2Mu+aDB+xibVgHfcnxbx8HFf1qxpLaAR7tA2WTx64lDsqjSnAH/mVoUVC4dVNVzELbmOiCkGym+qKJDokHzKSy5ofYPAfp58txhELRbrcD3l+eXnj56+Pzp00ePH9+7f3/p3r17q6sgQtfr0vsJU6kP6htMNGAa/7RrZfaTzAeatlT1CoYsL2raXRtcSEp8yKPS+WjzOZkI5ZpA5peWewY2+4/GfgNmx1gEgOHYlqaMUn5PQwouKVTk6rrOsbzW4DspzU4fque0T7MyJx8eYD6qoKUJQY3vOkgi9YNuFwSrOt3eyenpwsLC3v7uxdnswdHx5fVgAn0svCRNCcpBPTnGvKBpoXZbeV5qdESV0mWqpz19fH2Kfc6LBqtP1U59zcqvPjvdH9wpw2o166uRChMpYOknxC1WmBO4o+T8PC/XqcIkTYfD0eetzfFkHMfxZDzKi2Ll3ur84qLbbg+GQ4COumOQCrLVpQrV+o88HFIVKrD37NQLE83rmbghNh631JE01tjvwhpA2Ng/32TXBBnyrOJAzbKBUB/GZVVdu0z/KAemi+Blemvq6Y0pnXHI+43BJuPR5fn55ubGweHhj29/fP/+w3A0Oj+/zPN8OJ4gX1FFRlVuUIA1RES67QHKDxiRPWNIqmQ2j+p7X6YSiUZ2GEsuFdNYQeKvIo7e/i6JBqtwmoKxPFpBqdS5RGwHj/HdPAigZIfuVBSGgee32+2lxcXXL148fvjw8ePHDx4/Xlq91+p2+/1+p9txCqfdalM+EEhHeQ6N6blPNLp/Im7VXoPWTdDfFppz1BLAf5UendQup/fpjYLIfuhnPEEQ5bJAkSalckNRQyhBe7mMsLHGfltWCY3ws4YkrwUgMRUl3mOIEaWFkf5yDSZSnUEF1c8I/X5pG8/4hRij1N9B/dVDN3vAKrnvuN1e3/eDdgfiUfdW799bXV3dXbs4Pd7f29s/Ot7bP3Tcy9FoXAR+CpwQpIS4aZIWvg/hqgx6VXgpCJGC4nEpWcf50DKIFTlTwoSarUGLSbls0s7RlW+AvNqa6a2YdcOMB7XIwVwiWD619KrkoXzH07hWXWqeZY7vk4eFSXYcaDibuGPXubi4SJI4y1LPhxkbDIePi2JxaQkigMQBAUlYPPkU2E/BBvCJWhTA0e5ABf7KmFl2pOC7odO0TPBouKON/X6tAYSN/ZPNCEMbwAPGmqLynVSuoKvJVeSVY7EG+lFkkZ6cDn0I/0FfQWSHQhQzy0EmO47TJB0MBmcnJ+dnpxubnz98/Pi3H98eHBzc3AwGg0GSALM0R1pplqZBGKZZlmRpiC16CR8qaCpiwgaEaM+qahQ1A5aNJ8Hk6/SvGNUuYb8qj+j26ZaCAuWPqJNQO2ZRhinplrQzULCVLo7F3JQIJ8m8QBWIE0ArMKfb6VA0N4qiLMtmer3VlXuPgB364tmzZ4+ePF5cXm532t1erwVto6EyMAQECQAScoy4gQOJAjyIVJ+rKtEZZy/JWpQoJL6ZEr3B6YKpNAwjkZTWqQyVJrR6zStJGMW1lZlTycaSMqMNFGzsN241OZw6gqharDkFr5miHE3SsSb6W0IdFk6ys7PQNQK4+OARmV5RMzJO25eZF/gT2uARlqO4DUgWO+HM3FzYbrd73f7MzGQ8evL0ZGtrc3lza2t76/DoJMuLwXDsuu7NYOBhj5wkTYnKnmUpLFOqBACGR+KZ7AhMnbOaCFMnIFd+1e7eBNnUewAdIZq1Fnwq3eSqSfG8nlLtiAx3tWyw2Gp0p1Wv8Ig6UVeSb6PB6MCcummQZ0W9t4xonHAsLKBw2u023Kk8n8R5Sk52EsdJnGd5FIXj8XCSTC4uzp88fba4uDg3v+AFAQmzAaszCEh5larES184lNtRNd6WKpjgF0kXrL8tVC4uWvjqtsD8nrqvUmON/ZatAYSN/QqsjAlrvZ0O7CGA0k9xJsoiiDIkZGJJzerOGUF0w2mSkD+eTCYj6DF4fXVxvrezvb+/919//e8Pnz8fHhzf3IBOWpqC3BygQdQUzYtiMplggjB3AyFWSY0WUDkdTEiHC9dVAnAMFOtwnaTnmE/KDKiEkT/ByqivtHMybljnP3ECMO7LTZ+Y64QpONpFKDQHreZ9wHieP7ew8OTR4z//+c+vXr1af/hoYXFhYWkpjKIwwgbzCAKphxjk8dRxKJAPyjG3CcZICpbI/inkxulZ837N1TJZPKVFKKp2xLRwnpa0RU2+Qr9awoANCGzs92vW36nIwOt/NWWP/uDMHy+n/ShVRi9iL5ly7RzLA4ugz53N4nBSawpe6AjjAWm91+/1+nlRrD98fP/h49evjzc2Pn/e2Dg4PNjbP7q6HswHwfX1DQqRohIpgp8cWxSCa/AK3UHCIDtqqaBWbK7rM85OwjUKPplVS/o7qqyzCDVlNo2go/KFyx/WPeITKL1OW+pTosGaKRXMCAV3uf9QAa0dVV8gH8RiMoTzaZoNR8Ptnb3hcHh9fb2ysjK4uX769Lnvg8zYWLWgAGavEp6dJjOjn9TsXJdK7wXdwySoq4wk9Y1SFd/qS9ikCRv7HVoDCBv755vxWhIHamikdvZIH7F4pBw7Fq7MYEKOYtackRmiGhViw2FAg4PB4PL8/Ozs7GB/79PHD5tbm+8+fDw9v7i6vIIq+TBQBFFIDaZYSAIxYIMuDX7QPKcyMDCXwBrgJv9U9rUlvotmJJaAs3pE75DpO8sYwzBsKU09v00AP7uJnq5soWEi4tb4U+3OqG4f3gXwLwyyFOQElBKM6/U63Udr9588evTmzXd/+MufUUig3+60W+22UzitdsspnCDw6S6TgiiRTvmGimaM9vfH6LVy1aDYvtB9Rtau3h/IglWqCuT9Fu5Cy3qhpRnnzazCjiXKaGONNWastADT3h3/Iiu9DRVmgiiQ0msq00NEnbUM/kDnIZU+xE/dMQyj1zfMB4J5XkQdL2gd81wQM8ZGOCB/5c7MzM7Orq+vr95fX127f3R0sLu7u7N3MLgZHBwe3twM4jSdjCdZlrWiKMuzNCGNGVx2aM1n9VRDHAG6C/eWUPRMHr7CJJoWKeaTjSAWR774jJpcY1UeqLku+5TS3ZE+1P6Idpj1qTOGU5pQQc/lkCLF5vUiHoq3DAVI03Q8cS6vrpI4Hg6HMI2TSTyJQ4gd+t2ZmajVDoIwLxzf+MrqmU0wUnQhxkoNcWVWylQJ4hguCFFdFM+oIszTWGO/C2sAYWP/ZDO7c2aAoBH3kh6TQ+X+vIodJLrPW1kcCQirZ8T+54DckiSBIgd8X5blg5vr0WBweXl5eHBwcny0vb21vb39v/73f52enY/HkyTNQEDgJg9CYLMkSRIGQQZDAiRJJ1XsINf1g4D2ARZvSv5EspOOWIrQbSVDqD0h1cFpjqRgxyiFd7Fr4M/Rv0pxTZR7qE7x2GmKwsEMBc1hrCbISs5Hi4nTJBN9l8r5PMgHuq1WO4oiEJPpAAU3CoLZmZlOGD179uz7P/zhD3/84+OnTxdWlmdn56DFPI6Ic4NU+UlUJdirgZ67+wWCqESDIvmqFETVxgjZZzlTW3UwG5+XEqX0cgUD0z7TpCb0JoNnW3+BG2ussVtMcbP5r0z1b1d/QzonqBJjOg5Gkl/4cfVnpkgJmq8u8zymE4wiptZYLWyk5UU1RifFaax8g3U+y8IoCoJg1Q/b7c79Bw8ePnx8b+Pz0eFxv9c7Pjk5Ozu7gnhWMB6PkOfuQ4Uhkhq0/GbmudBZQdUzozAWRBJxtCh3aaFANV/sGSk6RssZjpDY9DpBqpdrCm5ijLImfKZ8pyxz1wu7Kry3JwVJENLzkuq1Zm1oF1b2WZpjb4g9uut9EEBElRxHlmVJEsSTGGr1k9hx3CRO8gz6Fibx5OHjJ/NLy17Pz/NsOEx834uiFslWE/FEjBHZtvo7oUozSrFXdobqC8LlrLipgOGSnKrg8JZU7hpr7PdgDSBs7J9mVW+tFVU0cBJOpiLURtweRRnR8ASVPEWGsOakaAjkwEUBJkQvOh6PB4PB+enZwd7u1ubG0fHRx0+f9w4PLi6vJzGwSbMspboQiASjtJzk55BYAQ/STubZ2T5dg0FbIg8b9jLuI18l3KtVBGFdjnWBJrenEpQkB1qeaoLNYnjV6hrrsSZliYQscDpRGd51YaeC2xTP8yPsLUH9uDrtaHF+fmVhEdDgn/706s2bJ8+f92ZmWm1QGAeZGbwhAXh4r3AxH4iDk6oP0+4jjUPHBzAPqK5M5StxH8Av1krViU4f4t+6GbAgs0o1yt1nY4019gUrx1wkgUIn+EwpLxOy+Q/OchhGbtS8otdRk2nkiM1tMRumlzNrFEmksJ6kGfRV90Ex2g/CKIyiqNPpz8x2+/3790/n5+c2Nzdnet39w6Prm6HnuUkCijNqEEWRIAbGyBuucSyXo5YlYN1zsTmzHHT+yoxY8SE1eCM0WC0FVy3XVTi1nt4pr1qXIWC+sRK+lI372NlZi51FjigvnqilJi4M0q06vUnhxQwDqZNJfH5+AYWFcRwnUIfpuV4QgmfIksQPQhddMDw9RWUG3ZGOKehUoSHQag5I6YvFVYZMXeba1sYa+/1ZAwgb++dYaUPP7QHoJeHWDWVU10WIXshMEFVtCEzh4LSTUh8rpr8A8RMqP8bj8fXl1eH+/uHBwSZWiRyfnu7u71/f3IzHE2yuxwfI0wwUaKj9ET2rEFXZU3JYt+6q9Yco5QWhU0rUmaQiQxXtl61yEj6awj+W7ovAhFSFY/NIzWZCbDvk9qIeFEkvq/2mj3rtSZp6nh+EIX0kDPxee2Zhbu7Rgwfff//HV2/ePH72dGV1dXZurijydqtNKj6+72d5BgqioMSAoqxM3awjiJp4s84qcymjyi2b4iLecNpRBd1JWYNmApFlchbXEpZoyWb6pdBoY4019gUrtVMXnU8FAVuV8aqAn4rpGISkelRUsB0BL0KNhOlI6pL+ovWCq1BYSfapPDz9NKiD6hbzPiCaieO5wCald4LYlVN0Op1Wu724tDQ7M9Pv9w4PD+Hn8enB4dHNcJjleQtFkqmqMMs9JFa4mZtRowtFTPV8qXGpJ4WGrsuX67wZEzTqfB2MlNikkqgprlT2+FDXzghNFjVMC8jyZwyzl++cCSAiyIQOhSCdyp49w061nGCEyCz0pkDiK8ZnY4R/VJruB77jFO1ur9XqeJ0uxXDJU0ytJ8QLBIctE5ayFYf+CiifqJZ5Ztia3CaJqzW9KBr7/VgDCBv7Jxp7Q02aFNxRqRnD+waNlYxDEtktvX2vX7+LPKMaP2gbqDoH5kU8mYB+zOXlxdnZ1ubW548fNrY2j46Pd/b2zi7Ooc0gxi9BT9z3ieWiHIwgKZkWF7r/uOxGaPkuxYOitKYZN+ecFBDhsg3+nHVVRpZGIyPOnbJbNiQs9WsB4p/lrZRSEBA7D27JyB20jKPFQhXYahQ5bdwwYB65rtPpdrIs9xyn3+87RbG6uPJgff31y5cvXr58/urV6vr9fr8fRlFRFFHUAgQJQBKEHDCtSN0pytFlQRDlciOigMrn6RoUPtQJQ+pBrLc1rFBRQnrqLIZtzHwtHa2nokjxNgslq/vShJMba+wOJvmNmtenolcmsMJ/TOov0Ozs9V8umVwQygsgix4j9FJ9fVRpAmmT1heJVVnzikQaBB4uhkkSE7EiiiJcs/wgCOF/YbiwsDA3N9ff3O71ets7O5fX18PBKMuyKIomk7HrBrnrYXKMI1cQVOSL08VvdHakm2hAyDUUcuQVr2JdharcrmrAiC4LPGkKDVrHMWUCYtLFalm6m7pXUolLj4jXVSFYkXIkek6706Fn0iwrJhPQHQ0C6NjhOEdHh06RB743moxfX16sP3y0fO8eyp0WIBcDZQkAHzGA6NeMXH87mGOkaLoq8KwTyyb8TLdAVHAS/QVTmxRVaDBhY78HawBhY/9ok/Qe4zw0ClK+XIqCGL6HjvVpXig98L7EFDVle3lWFE6WZ3EcU2JwNBxenl+cHB9vfPr89scftne2t/f3bobD84uL0XgCSCNNiRsaxzFV7ZMOAXMaS07aIBcjWCKGUZ6EavxVNu0qv3QXf4QxWmDUqBEoNKibBZtyf1YNMGFxS2ygSnDFQ8JxYCMEFS9K6Q56OSO3qsBe87PdXqfTWVu59+blq+//+MeXr18ura4ur6y02m14cxi6nhtGqCBKdTTE9fnS5alggUojq9A/N7xWD7T/V7RavCzl1FXCgHcz5j81MxQ1p7nnO1jaieo5ta3ZKDTW2FeYSSKVfq3EaHj7rkmknMBnEqD48xOlxKx7rI6iCoD18SQNUj1T+zfMCiV8Fs/zCT4FWHjm+34UhT20hcXFlZV7y0srB0eHMzP9z583rjuD8/OLNE3a7TZUnyNVEioNsNyAWgfBhdDahcWG3PNA1XjTyUotiGrEt6fAQlfxL6hI3jhBkW0VJqGj0OJibGUfXIrfyM+WAadhVZiAox5tmiQqM8m8FCTsTCaTs4uLSZyMJ5PTi4vB4Obq+urpePjg4aM8n2t3uoTMwyBUvGBRA65OaSKjTlFgTBOAdY1SmiHO6FShchOmHFEdscGEjf0erAGEjf2jjKCdYYrSvzqYJ3AIFfXxA4JeLGCtKgFICNKIolHPpmlnJseGScE8T+I4nkwmk/jq8vL89HR7c/vk6Ojdu7fvP344PD46u7oqHGc8mbiOE3jeOEmoHgM1RSHvp6QCNJjSWxOZAmT8WhoDXSPl30A+hyPeZQcs+Zyl8d+du2L2OFw+KIs8hPKO+BCHi3mnJVt66PcrabscFQ4CHxQCQBUmDEPfn+n176+svnz58vnTZ0+fw/8WV5a9KOz2usDACoKoFcEHA+hXhT0GAb7SQWs9LpN4aNowXo7CfZq26kGveVJZMHRiWROCM4CVO3KborE68HRVftRqUKzFB5o9QGON/TJmNUE1YE+wHYjbx5CRWdvsCxQOVJt2zQpV4SIiOMADfQB2OPRHrvrt1Wb5eREGYqdbFtlCPVIafxjl0Ma+1wdAuHLv6dXVwwePfrj/w8bG563t7cuLyySDAvU8y6JWlKVZkjqCbALaKoJQqdU4MUpGV8o0DbIqbJsWBuUPkuwoQkvgtYgLNA384B3IH6kWpfNslAagUCUeX0v+yCZ++v2EZgVPRa+9So0MuTbsdDw3jbGdfZxAuHYCjno8Go1Gw0GepWv3H8wvLXd7/UDHAYtbuaM6SGoq5mVTID3lzDOxZ9jEJXQVeoMJG/ttWwMIG/uHmIA6em2FX5U7RBerC/x0AaHO86hILeJDnc2STFFBH61brwHIIYoD3ieUDEKLiOFodHZyenJweLC/v7W59fHTx+2dnZOz06OTk0k8gToPbCg8Go/brRZwWrhKTUubIlFUle9TvksHXwXKE5fPwM+UZ9gMKv1OJSJnu3kdYKUPGblLPgH3OoaguvBwlmYMPaXcqRgCkWS4VRM3+VC1PehNoVwQBVRbrRZ91seJ7bTaD++vP15/8Ob1m2cvnkOv+ZXlTq/b7nbb7XYYBNh/IgSSKErqUR0IFX7KL0bpK8PBac2JFZOkNHiyTO0/8EtC2VrcgtB2ilsFip6BnLgVnQNVTtUaQeP+G2vsF7Vq2KtU7qUWM5MuY1UVkR401PnKUgqsQhSQVDx/zjfaXcgVj6J+bHIZUFWGSCLF4sCsAKHQIgoj13WXVu7NzS8uLq8sLS8/evxo8/PGxubmwcHB/sGR7/lJCvoykeeOxxMMgkGxIpAqtfKoYTqaOm2kMmqHYuKhPGNEhEVwxVMkBWaoXlqVzEOHJNWRQne5MFPnFtAlgi+zyrjhyJkcgEVM1c0w+A3mttpMX/2pCOsI6CaNkYDjum6UgqsuDg9urq9urq7G0OnXyTIIJkYQfPSGE1B6g+wrqNK4QeCT7qjtNPE/Lu7QZ9WFjXxJIuDK2mTUQ0pGRZv+hI39tq0BhI39g0zSQZUbJ3/OCLCMkoxvF3whLkbXCjLMG72NKUo9BtMsi+NJmqSj0ejm6vri9Ozw4ODjx4+fP3/e3t05PTsbjoYkKEdiAOSAoek8+lIpwiYUCOhE8jrK3Ev+t1rRUReMtUhBt06nNE2B0YCZ38NIWadkNV7lEeuTIYnJEiM1SgOsOkAOm2RgfN8LPL/Taq+v3f/jm+/evH7z5MXztftr88uLUatFQu2tVougPsM/NZopgW3F5BFTpJN+aicnvhpKTsIUWJoLkAw0zgWUwKfaEfKWQHFYrWRiY4019sualX2yQYhpz6MYnpRAI70UlSoUDFHtLrQCjVxLTLs8zSMwdPovm4Q98JNgDwS2gEoKo/I8zBYCbX5paXl1ZXVleXlne6fbfrd3cJik6XAyTlNAp5p1klGkEYgP2BSHyhPKVFXDC1WLlRDHVCyIMneUpXekcBihS0ReKpommbnTMmAyaCleK9Fs2asZx0OVm4JwqjA8E1XFiUh3lPKtFGMlsZkkSca+l+UDzF16KfSISqPQj4KwyPMgajmOl8RxGIYYNfZ8aGE7JVVIlFExfFQkx0p4wx01M8yXqCfKsE6aPGFjv2FrAGFjv7QZDS8Zv1RcHsX3UUkrepMsHTTxYBGwdO9GFRX17kA1jCfQ9jaeTC4vLo4Pjz5//Lizs7OxsXF4dHR1fZ2kSS6a13GRB6nCCXVJwjUmAsrXaECaeFZ9qK4SQ1Y71Nfs3XJR1gE1rhG/0mDN1qIMX0u3p15iAY/GgBCSe4GfpZnnukEYoo92O63O6vLK2urqqxcv/uUv//Lg0aPZxfnZudkIKwY7nY7nuGEQEKKmBl90KA5p33KNKqBraGIaA9Z145ACCfJy1L4Q/2O+mCgUVFFfmZdoRGIaa+yfYlYszKAgvWunPL/KU/FfrqY1qE+xEqm17Gp+oP5Hqdawl7nL8OiBaWePzFFO6AWwSvo56GZFrVa7i+WFS4tL/V6v9/7D4cGBc3kxGo99r52l8B8Kgap4ZQHwhPiurCPjVCmjvPKXyvzKSFUpltpXhLQMo7NSihiKA9OjkmSoIOjyi3qyFRG3lrxqeKQKR8lXRSKUykPotubIx/E9L3WcJPXTLE+yHDRy0CO3Wy3PdVdW1+YWVzrdnucDNwRLD26jdHLxoGxer/J+FCAwVBsNn5UjYBxo5qfBhI39Vq0BhI39giZKuWw2i36DWWThH6MSies1ejFwkyp1Q28xa7HFYJGHylAMBh1AlmGr3jzPxuPR+enZ8eHRwd7e3u7up48fd/f3Li4vj09PboZDELwmZmmWcUhRuQ3icCIVhj20bEXI9fco6kIqJSIFyjkonSqUyJa5N+SrJP2pajJkK+aBMZ/glZY/RAOE5siy9oNGqJryQj9EOjh2gQLoC40BXbcVRaQH44Hmah74/vzsbCuMnjx+8uLps9dv3jx+8nhlbW1ufq7T6QRRCN2cwzDwA7p62CWRFg1vpGpbzKv8XkXbU82GjCbwVoa2I6XgNR1Dxcg1eUlPib41dXQ1fYBGOLSxxv45ZoEQiRLVJl57B/kRWfdVJhHYUTSuI1TEgUL1IyfNz2kCpLeMFsCh6xZh6CMxnrTHALp0OsSenJmZ7XS6juu1o8jb8W6Go6ubqwR4p6D4Qn0pcB3zHR8IokUBPkj5F/xdAESlfGVSdiLNRzOmWA9TaCZK+RP9jO1ESo61vGwqLK6dnKTqCvoJa6JpX0c3QqVpDfmFBk+ta5XQDgyoha1rYSI8D+RGScIt8J0iOj07i2Po/+QHwWQSv3w9Xh2PF5fvtTvdMAghSNtVV8Vhx1tIQ5IGQi7ZZJ+ZlYL16vpaqB5Bysg13NHGfoPWAMLGflEz8h6lgJwBNeTtwOEQulLF9JIAwy2XZG0DPeZiBeuU6LbYrYKKTBwPbm6uLi6PDw4ODw4+ffjw4fOnnd3d84uLOEkmcZzlAALjOCZgJoPTpulT2fvVeFwOLGqnatRERX2her3S+ukWHGhdnTTBFCJ/XPOSAaR6ECjOgjU2HCJFyg3F13UpCOjUuZ4XRlC4AaMtnKDtL8zNL87NPX3y9Lvvv3/5+tXjJ0+6vW6314NW8x78R2U2CMbgQHwTb7suvXEwRf6kLqtZoCwTagK0WrlHNCSh5J96THxSjZNL6QV76oSPb9BgY439c01nuhSskX/4VljQ2p3LogMTOyv3b+WWtlpNhoSLLXnMO5kiw+vxUDt7k4lCp9HpwtrY7nRW7t2bnZ3d3Nrq9boX6HdAVNOLHTcJAqgnzMEJYbawgDVTScFooVG1SlsLKV2jiQXeaW55Fr/IRimBahG9ZSxq5t8olal8o/msRqoGwYoHHBtV8VDXddK08LwcYpGOm7sJYuarmwHMi+/Fk/FwNHx69ezRZLK4tLK4uBwE3ng8iqIWwVEfHNAU7qgeGQRGoSMG1v9TYxKKK8rAoGhqoptPmNB1kyds7LdnDSBs7Bcyzb3Qsm/6WdUk3WR7OC1GCTcstVcuUSSMJBrkGr7b12N0sVmcJOPRaHhzc3x8fHxwuPn58/HR8cdPn3YPD84uzqFavSgSbEsILZKyTCtaqihoTfqxRHy1URxXSjCxh72o+SmMizxUq6wvUUZrP66xkJocI8THdBkOHtfATsLP5inCgUEACqKu65EkDBT6h+H8zOz83NzD9fXXb968ePXq4ZPHq6ur/V4/SZJut1cUwAv1/SCnB1Bao8pC1NjqJN4NQ5hEhYDXRGLxWl2WBillcmSMnJ6QIW2TTyCsqAVDSwRRTSE1+5K7z3pjjTX2DzGp/itTWAL10WJQzYlV2ePmNeWCHFicWAhTlTarmNmdSKQ6Iskk0sh1M6yyjuPYL6B/fRhF7Xan3W4vr6wsLy+vvP3x5PRsb3//6urq8vrq6uYGWCeul0CRXBKGIcYxQSjFcYo0xYI6TJfpzngqAcgNY6tOin+Z5kgMBsOY4DTaDoFShnfi+BRZ48atJQhfPZta/yVT0xzJfEQlQjEf5ythNLWe0xbiMkvDMEjTZDKZ3AxHkzh+8Gjs+8HC4lLgBhjfdOGTatmvuX0aCmPMEGsJdAtgFQk1+j2cHEUcyMWEmsnELzVuo7HfjjWAsLFfwowLxzQNsBTLEtuGB6h8m1KJ1IpweiHWoU+Vn6ODkriLDdXw/1maEIxJgYwDP5I4vr663N/d29/e2d3d3dnb3drcPjw6vLq5Pr24gIaEWYaZKFCdaUURUUZV3b3w9LK2g6+CGmNIRhOHFmV5noxOyzFTTJSqUIiMym2j7mRyAkQxZWlmTOWMKTihIo28gN0MpUPh1wyLMTwXCmCiCBRjfODrQnfBmZkiL+6vrD58+ODVq1fPnj9/+uLZyupqr9fDJhxFp9vBuKwPam/Qrgt4O0A3xbtVO+CSdoLeTWgIrapKxIBFLQofSVQWiQfWJkWnB634tBhK49Iba+zXa1W0U0oPUmBIow7RR7TEMGdaB77IssmUhFMJH5kIMsSOr1se2KVRxR5EOCHL5XT7fc8Puv3+wtLi6fHx8dHR7v7+8fEJsVTGk3E+yINOkKQJdOjx/MlkAg+ARKrlUCoNG/gKcaW9rRKdaC/KqVHYDVsHeaJMgGsuRYW8zBDKi9MZQsN9Kc2B4Iuq21St7ODIHYt18/aA8qVFkQF3NE1z10uSNAig6+PJ8fHw5mZwfQOcn9EAGT1Qoj43v5BlIRBbfD+OY9d1fD9AtF4TN+YviQvNiuAAPGblKUg2XBVSAo+XXLR6oNOD6hJUBKGxxr55awBhY7+ISe0y/QznzNSKrGNvVhWeNiZpKsImJZrqmijwKVGkO00z14UGE2maTiaTq4uLg739zU+fdnd2P2983j04ODpEFRkEfnTiNEuxXiNP0d2S46xQj9Q2gtsuGbAiLlBeRjkmLUKL4lXw7nXE1y+aBYq14qrKnZpGu9JXGb6rmmD1LDaCAF0DGIoXoJH0SytqLc7O9fr9teWV1y9fvfr+u+cvXywuLy0sgo4oir3CjyiKVACbtFh1T47bHSXvQRRVmGdMNQgujVsp1FViAWov6KlcoOT6Kg5qefuoZknkAhprrLFvxqq4opZPXjYVpKvnjlK3UqlhZkPB2poxi6paXo6x+ppTUoBP/Far1QN5md6Dhw8G19cnJyfHxycbGxub29tHx0cHB4eDwTAMgwRjmeiOoIl9im0VkNmoir0ZYgGUgS6wIqBWDk3KsakRq7ICZPULwoimaSCInVYQoSZSo3J1pTXTok9aRwix7p04DS/vhLscx02z1AV5b/x/7qUoaTaKU/dmuLV7MBiNh6NRUeStVuT73tz8kuO4yB2NCL5hA8kqGlRMYWhCSw4ItXa0k1EPdONEdWNF8aH+kmiKSlNP2NhvxhpA2Njf38p1ByYqqR9gHyBR+i+wYkk7W8QWTXOJaSFbjcQAreVZAZWB4/Hg6upwf//zx49vf/jh6ORke3fv4vLienCTZGlRQJEhCWDmmWqBSN0mSFVFFZ+UTBWclK6zvMko7zNKg2MOivKr+oO3S27WmpoQzd5RwxA+VafRDHwqaZTLS3CpMaBfFJnnAxqkCQ/DsBVGi7NzD+7ff/z4ybOnT588ffrw2ZOFpUXX97vdrpYeDYoc5PWQgASJR8K3oBnAse3qndJa8foRPsZgL/lloehW2mbZNUWIAzkXzT5bV3vqSk5FDjV7mIbr01hj37QZNVH6lZdcAke6wNjq2cByZZwrVAEoZvnXSEIbtUnGgcwF4bNbcllQgY3NijibhIpcWavVurlp9fszs7Nz0Mt+eXlxaeng8GB+bvPw8Oji/OIGmrBn7VYbKC5uSk16oeEhol7Vs15dCCzapYHKpRKvjFprGIirP1/SM9PyaOyOSzqnlomLFi0aKo0oVMWj9tulEJ592+hfUtfRR8DQa+7AJGZwyzxQmnGgQD1NB6OJH9zEcZLGcafXC8MAOC9BODM7bwjEKuhng1IlOg1zQmUURBoWLet1JJFHIrmjWpeIv2zyu/EFANxYY79yawBhY7+sSWjEmmO5FhMVqUETgStR+0S1QS0gpE9D/QVWilPXQYiwpulwMDg8PNz69PnTh4/bu7tbW1snp6ej8XgUx0mSpGnq+ajzRqrfApqSpAqfVzEVy6WD5AapBS+zRvmS1diE8yunS8V0YCGL7C5VO4f8/jJgZv+uNjoqVQg0Tv1BVZ4HI6TrklpxwLBxnQCE2pxut0tB0Xa77RRFv9N9/OjRs4ePnj9//vDJkwePHs4vLXa63bDVarfboBkD3J4AWE1Q+OlTC2SWycGs3XQpUb1zA6l1QsWmplSzlzSNiWBjaVtTryBqms4zK4zPau8Xp0x1Y4019m0YNxOolAvSU/ySfjuaYXCo5VfhR1qXVDG3dSYr7SZVT+WpbOMuO+QmEuptCzIznTRJPT9odTrdfr/T7S4uLvS73U6rfRBFh0fHURhOktSdTKBgAdQ1PRfyY6nr+5QV1C5JSV4zacViZqq27LqHhJVEVc5L+DZ0ZaDKXb1+PigIscDSS7DSyHTqEjtDE9U+Uld5ytksyQqo9dyHq4MHXDfhuW6KodpWq016q5PxJPXTIEjSeNJut5M06bz/AO/0A7fI7z980p+ZQ7IozHmWQYdD/LWkO8oNKtV1S4Kx1jcwjoT72ivKKHxIsXZNYUuZ3NRYY9+mNYCwsb+nWSEyTQnR9HxmpnB9nUiaEVVD0f7V/9HvqF8rVQjqlIqbgn4MsF0CucHJeDQ8Pz7e39ra3Nj48OHD9t7e8enpYDCE/CHFQ0lTlDSvdYEZ+w0h26YESapnZnRKCtpchVCjxs2zUztpXHBYpyhTCfqqqbIIo0wkUsrfhIIEr1WVDgJyg7BtkUPMFQKu8KRCcYHvt6JWqxUtzs0/e/T4D2/evHz5YnV9ffX+/ZmF+TACC8Kw3WpRXNlo/Aipg2nXaGicuOVSUViL6CW6Pmlipyj5IBUAdaMEumNNGcWGMrHbMlxsgriNNfbbtOriI8GJ9k2gJ6mXdU0Z5NeEA7PUSsl7MaYUKjUmZ1h3dl10h1x6UGxm/rsPB2m3Wu1Op9VqQbpwdrbf768sLXY7n/cPD0eT+Koo0jRto/wmdEJC9ALuCp6AmGoOiAnZJeR5eKlUF1XqRVgt4aNFv8Dj06KphqtXzins2JKeNXdSKjFsxcJb8lR8RzhOWrcmlykhJBieQrYVSwNdoJ7kmeumaTocDnd299M0zrMkS0aOU9y7/3B+Ydnz/PF4FIZQVUiC2fbl6+J21aVYo0SlN+sA6EbIi15dYVvKK+J+gD6rFOaIX8o56cYa+1atAYSN/d2susXXKmhGyUyBJiEQwvk37lBvqKKm4YTZ81dOqlsWQG4wj5NkNBwNrq7PTk+2Nj7/+LcfNra2tvf3zq4uh6NRlmdI5CEtmDxNEtPwEM0kBk1hvTxT6Sm1SaggYBNOZoW0OjpSSYlUKKqXrM7DlIRYzMEEJqz7rNnEaOxEaqI5bjXCMMzzPArC+dnZ50+ePHn48MXz56/evL63thZ1u7Nzc1G7HQZ+p9N1HTfwA+TlZpAY1L0ZqetjndIPnFE1F3FASpSbWkFylEIGNVsqrurhBlEGYyvql2SBlioONStM3g4xUY011thvxuxGhRp8uC4s9fbioPVjKGCmF2qdbrRp/vxY5bo4Sciv6JW8xGvhuKJKfCEggUUSqfUaK8J7fGi6HkatVq/X6/Z6K0vLc7NzHz8DJvRcZzAcZSiUXRROFEHT9iRNadGGHn2YTNNSMZr8CkEzWh5L9BwrPWi4NjQbJjBbonfWVRKyJ+cYnolk6mOaSRDgWRyiHKcT9EscD+rxSPZmluUQdNUtkVKc7jRNxxP38uoqTeMsTUn9JU5SzwsWl5Y9D3RHoR6C88BTnamOIYqJolgkSaTruKqoy6+WSDbc0ca+fWsAYWN/N1MEFc39k5qi/BI5CPTTojKbC+VN4JCpfRpjVAPATpGl4BeBy4FMQ5KRubm83NvZ2d3e/vzx48bm5l9//OHk7Gw8mUziGNihWeb7fpplSQIa36AlA9AGgKJkVLIP042qEHIqXqNxd9SyllXV6GOSvWltHySqsTxtbRE/xbAttFN6gHRNrg+01E1JNoCFVTzXyzDQ6rkubEPCEN7TbkPtH/San5uf6X/35s13b968fPXq/oP1ucXFmZnZdqcdRS3qNa80V1XZoTIaj2KumrujK2/EpeqQOlQbEtIDri7PWCmhWmZ4CsArij0QTlbnRAanLcJYY4019puzOtRhR80qtNIy0U+RWfSWX3yMI4DUdJD8V2VFug0DsIOj1TJEyS7XdeI4oedb7TZhp5nZufmFxZnZ2YXNzbl+/+TsdDAanZ9ftqHycAAxuzBM09QPfC8HSWpYkEkPTSizTRuNrHdwXBfkasxL+rK1m7YpuGVYhQqlqB5OhFUtCV71Yox+qyOhCKzIaKozMj5jBVDlKUDG2s/QZ2QxYOMgSeLJZDyeJGnuuN54OE6SJM/iIns1v7jkB6AuA4UhIF0OLSJRClvSf9RwZMZSRbAVG1YwmlSSEP0XcEfVLNHRytzRxts09k1aAwgb+zsYS/+DcYWYipkpbo4kjarPlHsHm8glETxEcnCqb8vzDLvWElN0PBpdnJ/vb+98fP9+Z3v7/YcPOwd7pxcXw/EY6/KV04wTaE0BGUKsVZA+TEWUdcSXuY6SoGilCpkpao4zvT0R4xWVOvuiaXKOYf7oaC6HwUtBTR6YIrIYRhRlXB2UEoXuED5uSrDCHhoMzs49WF397s2bf/3Xf3367Nn6o4edbheygmEIhYLAMnWhblCebgqHlxOD4DNxYpSX5aJ8refA4g5uueU0K7/r2dJXZrVYVC9qFYm6DGtjjTX2O7EKK5JrEZSX8Tzo8T7dW+kHVnKwnIGUzI+yypV6ux291EFBU6MObdHhZ+D7GXTOCwIIycGa3O31Z2fnZ2bn1h882tne2tndPj8/3dzeOTm9CMPw8vIqzdI2vB1b5mI1G8RDCZPoagheOgW24uEZsGeKtNW6XB5wndH78yKHk4HMjfA1X3JndpIQdWJ4yjicatVN0Cxzc4c0SYF8iyRQIrsCdzTLhqPR3uERlIpMJjm0K4z8wJ+dhzzheDSKWi0En9jx0UaDMEtK1BprJ/W/UmdGBDNr6cR2i8IGEzb2TVoDCBv7ucaZHJnS0S+xJhsE+5geSXw/TcovfYhooqrZYBkLVU+qJNHyfJIk48Hw8uzsYG//w7t3P/744/HJCbSev7wcTSZYI6G6IEIiEdvQk0/V9SH67DwMDlKy5mVRlrYri83J4GttoNSy6oah5j2MkJVb1DHpcuLL7AA0wVYDbs3QxaERyKagbIBbiqJwgtAPg2Budvbhgwf/x//49++//yN0lVhanpmFxoPtbsdxXGhMj4lTUkeAnKSQzpv2lZB8YPgQlW3i/kRMjpJXrfOfUopATbSZhfIWTU9F44Mba6wxXhYUuONMDhogQos/aTenoRpnNL2wG/57lSpYpoPQp0oF3nxk/aTnENPCdf0MGremGNb0fT/Ksi50pugt37u3dv/+/Z31y4vThw8fft7cPj+/2Nvbv7q+VtXvRQFdczEkCnR9IH8oiITXhUstgR/Nm82x466ohuCVk4saDFiqiGcbwzpwpcst57zmnWUvKUOl1jDqPSb7PH2crMByR9BXBRWzwoGQbppmk0k8GIxSkIpLOt12GEaO6z3xw9n5RdQ2U4WPNXBdzYAKstLUuQgJJSAsD1FdipkP+ig9VFJnjY51Y9+eNYCwsZ9ophqhvMSjYicgPQRg3AvXJNIos0cLLngyCW+4BdBUHRk4BLjAPCcCJGqKJlmcXF5c7O7sfPzw4dOHj4eHhxubm4cnx4PRMMY3pGkWItlGk2tQqU0v8kGg/hCEU5JRVPGsRIcalJiXmVvCHM4ya9RCPrejxnI9TAkKmt0HwbPyoFniBevlqT5ThYE7nQ71DISClixrRdH9+2tPHz/545/++C9/+cujx49nZudabYinttrtIABOKRUKEpIkyuh0HKgQqoqf69C7ETUngqggBnMMQbeKNnNFRF0O2AuJgsruoXG9jTXWmDBeoyCVZFUBqBoEo1Y1RTKsFHbUvzKSVKVkuj+5og6W6+O+PExYWsuN7LM0C6NwxpsJgqDdbt/crK2srM7PLRweH8/0+weHR6dnZ4CIPC9JkHEaBHGcYLSuKIBHCu37oMUFUkk5pQlhUFk6KB6oJhO6GxQLhFq5UvPBkjczyjpaMJuDkEYaQN4CMTsmL1jTq4mKNvUIqTYE5yctHCfodGiQCeLhNEuTJG2D53I/fPgMQc8wCny3KJ72Z+aTBEpCOl3SHcXWSqr3hq2DLbvXYhATca/avhiwLLKC6guUq00LXSBmHSuc28Ya+5VbAwgb++lmcSfMsq9gkwKBRgaNaxX03l41m6fKAWaNSrPPqM4LRfVunqYpdJCI4+vLy/OT48P9vb2dnb29vYPjo9PLi+FknKP6KKzqRTHBVCEgSc/jbYIpgi8nNg3g0k9xpzsHPqqYpep6TCTR9Fe056qy67AvrvIx+bLtw8uUUfsIzMl0HGTXUOkgGFFFqdlgZ3Z2/f7ad99998fvv3/95s2zp8+6vZ7re4AYPS/EnwQ4lcQP1frf5uFk+yb1TsmkVdp0ihFaQnIqV0xfDI0LdeCWi35MpF+wsxqP21hjjdWYdig1z5eqwc0yYje4txCRXMwqb2Z0IOWuakyyOskvQPMeUStfQGW3B0XeYdjp9WZmZrq93v3zM1Ai7fVmer2Do6PBcBjHcQzNClOCplQMD1gR849Y4wZhWZOtEqUZlrsxBfMUibXWebpMu68sy6ioY5S83B14pAJuG53S+sJ7PTB+Jk0TqIWnWna4TBf3A9loNN4/PHGK3HcdH0R8/HytmJ3DnvUj0B3F/rieX9+zXg1Aia6qHQrvBLihpXiG1XhqSKR3KgpprLFfjzWAsLGfa6Va9hJzkhd75X316ilUHwllgUiJAYDT0CCfgHBmnudxDCXlo8Hg5OhoZ2tr49Ono+Pj08vzy+vrSRJjDyLV2qhACW/NYMS4IEV0S2ep6wWonajaWSjPj8ik7DWrQmr2kWRAVQ/AQDjhQATdSMxEuXKOaSvcNYminhqMKaYL1Fv4oLZHQjL03iiKFhbm799fe/3q1b/8y78+f/58eXmlPzvjAVwMWu12URQEGsF5CkAIJSu3fhPMZksF0a2QMM+DuUAB7PhrQzfDNB6kjKu1uWuQYGONNXZ3qzJFgeBXUiI1DqHcGqHk1GRASix6GiIKVW3BQbWHoYW44EVBwk+0tjaOzoN673an3Wq3FxYX+/2Zfq+/vLg/2+8fnZ4cn5zeDId5nrfbLWTKKGk0R7d4ByVS36fCeKWXJjzLFMym6w70dZlEYk0pxB1wr13YKVhFdbKucs7N5GO/IcKqOTYOAaaPjr/CNGbgL7IsnUzcgT/cP8hcp2i1247nx0nmuv78whIJjHMer9SUo3JRCv5BKJnrAo26jB6x5LOWrrcSK2+ssW/AGkDY2M8ySafRXAteE5UUG6NBXoQ5z0MulaJ/TGipQ4PwRtIUdTDqia2Z0qLIBjc3R/v7ezs7+3u7p2dn29tbB4eH14PBcDSK4xiqBLEjguSmaq8Antdog2LP2bKawFReIsNW/pUAao3GWuVXQzOSdRR8WBNz1Scpn52xNEaE4SHhNCpMgWPj9ULvYNwcEBt2dnYWpXo8H4U5Fxbm37x+/ac//+n169ePHj1ZXl7u9boBRE99UpGBmkNSEKXGErf2mteXoFCo+hLoBDHLrLPP5BgyqbJxrY+YaXLAKiysa1N1baRhbTWOtrHGGvuyybXCltAUy7j1fhnyq4JASVJQuqO6DaCuhkAAM73ngTytOqPnQRzOdZM4drGWAXoW+sDVx9Ae5LVmZ2dnZmd7W9u9Tm9nd3fg+8PxGARIW1ESJy703vMggYZrNQwMKZfsVLkVBwc5uR6QXipHJHWDxlrai5hGWRPIetyyEUhtgYlM0pKiqBI/4+MTj0e5FVOuiQ43c4qi3WnD53InKdK8AKG4NE3iOMkLN2y/i9M4yfLJZPzg0fPZucVWq+V50LY+d1l31NcZ1BLXxkRaOXVMzXNLhYSm0gFcMJWo4u5CMJAaJ9XYN2MNIGzs66w27Keyf0qARbNxVOW5KtEHlMIbfYH6zEP8AYKW1eMzUxT0o6EcAniicXx1dXF6fLS/u72/t7exubm5s3NwfHx1fZ1Cdwlo0IRlFKnsPm92A3hkt47iY2rg6T1UFiBCvuaBfqsp0BcYz61UoJdYNYIhI5sQ6tipOVoJe2odHvK6pPnGkIlLRKjeDxv5UsGgB92uoigIvNV7K99//4d///d//+4P3y+trCwuLEZhBBwaD2hLDP8s//3Fr4Set5wCsAoKKoKorub31ODxeqv7A72H0Bxda0q1uF/pycYaa6yxO5qEKJV26uoN5iW5yOg8kFZeUbLJXBahuCsq9Vh4Dix2XEt3i/Q0E1/kso+rN8VJ4YM+Uv17vX6315tfWFxaXllcXDw9PZ2fm9va3roeDi8uLpI09TBV6LqJB9qbKammAfTRBXgWMNYrrsKB2A2onOYSatu1k1m9EIRqHALWU2jlCcUDDoaqwHA58GqqCwhWywMg+k6g8SDVuYPnyrM8c6Gw8GY02tk5BN3R0WR4c5UXxYOH2cq9NehZPxq1WhE6Oxd7M1V1R3W/J1CXUazeAl2b1sU2hRlc11AhD3M34sZVNfZtWAMIG/t7IMNyL6FS2hDFvlXQkFSmmfunyvIUH9G91c0w7srzHJoKAlH0+nB/f3tz89OHj6dnZ1t7u0enp1eDmwSaSaCQie4xOA3H8mAqVFFd78irvyTb8GBETYXkzdI1mFQaC61WrsqpcX5iLJJAy28Ss6Rjl+qHLMMgrhH05Cigd1ORQ01Fv9t59uzxy5cvv/v++7/8y7+srNzzvKDd7pCsThD4ea6lREnkoEwZmvYFUBWj3GKebreWa1cJUanSKtiyJhlIOyrROsJgcDMlGIFv3GtjjTX2U82ONFGXoZrwk4ln8RqlN/2cqiITEUTdtaCARupMIiUXQIedNiR4QTV6dRwvilS5u67ihmb0kBDrdDrdxeXlhaWlm+vrtfv33799u39wsLO7c3F1NY6T4Qh62fst34kh4wdVc9RysEL4NG0wpHsR/Fj5ztsnk2eGzeTUVDNd9W7+mDmCnkGODlNOkDyvFvXWsVDkjjLXhqLDdGLfA9CbwoQHaZZNJpOra9DdSZIYNxvAmI2iaGn5ngs966Vrqd4ScjSYmeQ8JxVX0j3FrwxdIndwLKeRNTVGt2Bm3YTGGvvVWgMIG/s6q1DkkbiItBOWlFGKkqx2ja+V1CJFLstgG1GsR6aOAwIyueu5eZYCvMsytygGNzd7uzubnz9vbWxs7+zu7e8fHB5dXV1f3QySBMSnoV07HgDFSKHUHgr38YjgdMuOkOKzug9tqbLCOE3VnagkLj7NTzKWqoqnlfGV1K8xFCZVDKjL6syZsFBQ9Y9CoVCVv9QidTR97XabhGH8TqfIizAM5mb6YeQ/e/b0T3/+0/d//NPjJ8/m5xfb7W6n08FevcAsDXwf5Agw3HpLCo7Zv+bSeGyqPEPdd6aMKlitYwesYmcafOl5JWdPWwyd9dRQkndvjVttrLHG/k5W6uyq1iiF4ix6hh31E1hCveIC75EOR9RBpIxiZsljcqFBiLcbeAF0WxQtTR2nQIHNVqcDQplhODc/P7+4OL+wuLezvba6urO3e3h0fHB0FIXhaDTK/KDVcuM4pgpF9sUl/Fb2dFRnWGW7lH61nJmR+GLvqadF9ZeqW69rgqTwu2q7a4KcRo9aO1TZsAo9CdF/8jxot4j7Op4kSZqFKL46jltpXvjhRpZCFT34uiKbn1/Kwzb0M/SDeAJQ2Q8CnGO5/eCQpfLSrIlAw1eTx1HiSsWHkhul2plS2LnxX439Sq0BhI3d1SrCayohJCGN4YUyrFLcCxVjo/WeQp5aA0WlCJEUUrNWUpbPzV2lKZokw8HN+enx/u7OzvbWp42Nvf2Do+Pjy8trUKBG7OcURRLHrClqvBZW0IleB4z9TGLTAoTm6sW/U+Ol/G5FKhF5rjrRMVmxSCk26WINHUXkyIiOy/hQOS3s1QsiBMgQDcIgCAPf84u8aLXChfm55eWFJ08f//HPf379+runz1/M9Gfb7Q6K2EFjCZXEo86P06VE+aJAYlvPFiUSlRvUVGEzRSX2qUF8BB0J/IooNdaQwD0qNY+WfNrGmzbWWGO/iFn5K72vl4FLCagE0Z0zRvoZ5kKobBFETQFxqNVRto+dQl3RPXxZb4ZSh77jeMh58T2v02lDMWGvt7KyvLa2em9z5eDg4O2HD3sHh1AHfnOTJAnpr6QeUGaoGy0v+BbwIwkxq2mGCdhxcFP/Sm5VZS+x/5P+iCDTlLOoTCHl/J4hXirvgN0CdWy2PihJiULdkpY5pWma0nhwxpTQAOiOjsdHx6fYcSoLA6/TbgW+Pzu/4rveeDyKwhA+lOcOFm/aXwjNd/VgZpQL5/vGdFAWGpdtF0s96xW/tU61rrHGfjXWAMLGvs5Eaoi3/aZ8vEQZ1Wk3KSlZqhoUaULzwzoZLbdAz8zjJJlM4sl4eH5yvLO1+f7d2929g72Dw7Pzi5vBEB0Suj38FDXhBUqJ6sXERE9uHatOQSMTEKYmrWfsjku6cPfk8Bky8TuMOIpGjvQJCYSMtpmKKutQtC5WoSOY3hIY7CS/GgRBpxXNz80+WL//+g+vobHE8xdraw8WFhYdx+l0Og7IFUAFBVCMUHIGajhJjG7KfScgSDeVkTMWMaI+N6sH4SdM6WCFjoUsYvGMaRWtWEJa/JzpQo011lhj/zizmKJy4ZIBO8kLLcf32Plp3VHNjuT3igf2CscVjEwi5c5MMbkXlJrJ87zVbnV73bm5uZmZmZWV5W6v2+m8Pzo+LopiMBgUQQB9KRJgnEJ01YNaequmg3JZ+jLsFCB7Lkt6FKsaTcE5a6qVrkUFB42sTh3MM55XSQnownvjalWTPxVeBpmC3NA96V15XoBkLFbUQxtGPGCWZfEkHgxHuA3I5+ZmolYLlNf8cHZu0XN8DGGr6oaau6D4rlr+zPVIk5ZHLTmt8nJUclTHw5XeHsVatehaY4392qwBhI3dyW6pIjDV6fqdhnZCvH/Fv/cs5gnjQ04VynNhSyVg3cBCjiIxRZ5PxqPT4+Pd7a2tzY39/f330IP+aDgaDUaTJE7SLPX9gLrVa14l5gWh8SCIidHp6SSqXk0X3UlXV8cO0heoSwpvR4WcZLTxI7OPTLE9nlGcHesduOAEBokAEN1t4Qa4CaCAJKNqEAh13U6nQwHSbrfrOE6/231wf/X+/ZWXr15+9/0fHz1+Mr+w1Ov2oOl8q41MUZgZkp9RmqLyBpXvuwJ7yIJRskE4cSDzgw9zWUlY0WE3dCy662bngJcCfCr9KZELLc9o40Qba+z3Zf8UMWFLeaWkEGJhtzKnpewHMX2lZSjdQvVLcKA7QlFmFSppytuvlDSj4UeBgTwHpFMofdXp9rBhUDAz0w/DkNzfaDwJfH8wGuZFEblOkuDpUAKzyEGeTfV5hxo83Zte+xTVBR7r5CuzAaiY/IX0lbXsHi4EYCDEYb+i2oG2pOIDz5GONu0R0IdQ9hX+w571OjNLnrkoUmy62G5Dz/qcetbneRoEcZK02+0id3589wmApBvmTr6+/qQ/uxAELYyKgv525rie1h01ZY/U2wIf2nsC3kqo83PIF10cltJocXWg8agdQYMGG/u1WgMIG7uTlRkm6kkOMupfSUqk/ElTGUjhP2gmKzOF09dHwIGU64vjOEni8Wh0dXF+Aqqim+/ev//waePg8Pj6egD5Q6i3h5PHcYK6MxAHZblSU9et0lFaFVXTd/Ql6qJ2I5fCYzFkGyMn8wVUqPUH7PmozpCZZZ0q1WFlPhCVaMLQPBO5JJeMY0NQ5wdh0Gq1up1Ot9Nevbfy6uXTFy9fPHv+8smz57NzC2EYRWHk+34URToRasozpl1B6eZCjFOJyWInRkWY4QJCdRXmX3WfNdFIFgTyTkndBdo90TPa1fLDxok21tjvzv65Co23SJLyG+SvsEKrTuYK8ikqqSm9ltQJUv4U75GcTHNM5YyUBCjGT3OSDdM0FPCTrtt3XehY2OmGrXa3349a0dbWjh/4l8V1kiRBEOQZdGUgg2NRgwSQolYF8hwGZZ4qA0WBdaqFD+Cdciwdrzc+iGi5ZF7UnFR7arXH1twZLifXhCLlxHmq1QmoZz1GOhWdFVKFaTocjvb2DoE6BAzXiev6q467sLDiukEcT1oR6o7C7fBt0VFTZaoqGNUYOFdsWuuWWxPKr43aGjW6o439eq0BhI19tYlCAP2E6TynFEeQv2HCowrscDkfE01qa9UEFzHPcmCJjkfj0fDy7Oxgb+fDh3efPm982tw6Pjm7vhmkWUa9d+HNOTTnxUieCnBqtRVO6zEx06At2UJQq5yJV/GnrrFQYnFVnRguF5k2WZaZQKipS1d8UQTMijxphqAPQvxMLT2nmhC6ngdqcp7XiqLZmZl7y0v37i09efL4zZvXjx4/WVxZnZtfbEXtIAja7RZJyJDsAR6kps+HSXJqhrBSBlK9mJSYDexyqOESYFWDA/Wk6XSfZlbR3IozSZBYVnfgZxprrLHfq1VZiP+sBqS1J61jP8qGuwoFiKgaAUISeRHiyro9rXJ9dhoSzBQTekB3USRSignGMXBLO5281Ypa7TCKOr1uH2xmd3fX9w9vbgZ5nk/iOEPdUcpkuqC75gCRFLmV8JjqLGpb/mgha7oO7liovISuy5g2e+xSzWpf3kNIOEUlEVxGMT2rpjgpmo1KvBvIeRaQBC183AakOCrSHb2+cossc/IsCALX87PcCYJocXHZ93WHEBk5Lt0C4ZlYmrzk7FQ9ir4OFRbAH8itMcFNRb5lf9dYY78SawBhY3cyWXKgH5jgHDa3RaDCIBCBg1zySsTI6WhQaYpqBAIiMXk+vBkcHuwd7O5sb2983th89/7d7u7B5dVgMBoDBMwzz/PTFB6GYahVx0xyTjP4Kb1lLibXV8LurerSOGpr8VoZEXLdg1Rss44h+CfqMzL8zFxNeoepWNBbBGTpeKo0AlkxoI8W+GEATYiDMARAGAQz/X4Uhg/X1x4/fvTi+bPHTx6vP3y8tLzS7/e7oCYahGHoBwG5TSKKKvRZd7vltdC9gIGowkyVCoZ9TG53XNJsUgJ7rCKjZoI7TUln2LjFxhprjK1axX1bXfeXjvNzYGRtVvC2wj9dDKHL6AkxlAKG2t1Qx/hSiXU5XmYPoHpGJc/mQwtZpyhSp/CDYHZh4XEQ9mfm+rNz79+9m52dPTo+vri8PD07b7fbKK+SR6GbJCkVKOZZ5mJgEWK45SnmknLzNBE5igJKE/UklxRy8DkR39P9iTk3SvdCOz2Nw6wKxhJvhvTOUOqbVeyoO4Vs4KtSiNgmvijcLPChdYfjenGcwN4gCJI4nsRxmhVB+L4A0qwfhX7gu7NzCwkkSd1W2yuw1zF2NrTVtlV6UIQwlcgM660p6Gck65A7KnT1WHu8cXuN/fqsAYSNfYVZ2TN2coStyDV4QPe3mfaaHarQDteO15JPshxqLUBTNI6TOLm+vjw7OTrY297e3nr/4ePnre3t3cOLC+g+T5qiRV4kWQLJRF09qNNZMBKlCycFcPgnxzU1edQqG5TXSl3geZzleRHzU7dlqRBQzPttl8/Uyxrfj/OWQ25Qty1WlFhCgwtzsw8f3P/uzetnL54/efJkdm7h3ur9VrsdQHVJRCCQK/PZOVVHa8pCpPwA0lZp8OyyqWkyPfREjajgFmtCUPmZxhprrLGvMklfr80ZSpxWfTMvaD8nwShXbHkouVSKEeNLJJtsK7FxhtA4D5OaurUrhVH+1ObrnrEKXLXaQRB2e912p7O4uLh2f21rc+v49HRra+vs/CLLsuvr6yROwkgpzcBnEQ1mVDfIAE+4M45/gsg0ZfDsl4w+m9Br5aI/+rDR0uH3siq1QYOme4XaKWiYx3lIS/C8dIe4UCNJU1Pu6EAs1Su8JM0Go9HO3hFuHvJWFPa6vShqtVp9x3XjydhrR+pmVBC4wrim67IN6tQdEDJx1j2V1SgNHmzs12YNIGzsS2Y5p2IaZsAlFCNkqsBMpbmUOJpJpk3h35jQIMLC8Xgcx/FkPLo4O93b3f748cPu/uHW7v7xydlgOMpRfg3TU3A6pSKjw5bq7GXUOQ2LUH9Zq0JcvSJ4LAoQVklCol1VfQBbrv1GyLqOgKRZoBRXBBomXaA6BcwjZgshPUgVINhewu132veWFr578+rF82dPnz1//PTZ/PyC63m9Xs+HXGIQhBArJfEY7hVxx1Qw9dFSexqMy9Zsqsr+jTs6ceRXhpAbX9hYY42xWfBD7vXvmCSsoj7rzdOO83MgYqk/kM5OcWsKNij5U6dgEn2pjZChz9wtbcSIi0krVE/IFwWiKEURtVoRAJ1oZmYGkoRHxzMz/e2d3cvL66Jwbm5uXKeIkwT4OKA+qkoPXNfJVEG+Nc8SA9U7UlVNgQk92gvoYKIyAwvVe+2jmxkxT6pXNCeJc61W0FmVOzLjVMepaVuidEe9zEXuaHxzM9rbP/Y8Z3Z2odPten6wsrLe7vZBrIezm1O4o1g6Py2QKv8RV2061OsoKisU3aUlZWON/UOsAYSNfck0Tb7Wv3IoTyUJoZeRrhUwn1YsEcUUrHO/1DXIdd0kybIMWgb5njcZDY+PDg/3d/f3do+PTz5//ry7u3dxeT0YjlBTlKoHgR2KDZRgzWVnTGQY4+wrtfDmEmi4LJnDb8AfDIF4Za86Q8kHun2HIZtuaNdOtBw1zSw8QD12ofd87vg+nJY6yHc67TCM6ALzPA98f2lhfm158bvv3rx69frZ8xfLq6vz84u9mZlupxuG0J4+CEPUTqOe81ObzqscYGWKuA29dmfqJVHKX+LDWNer48JaiL1Bg4011lhdou9rH0wDgRaYrIWF1We+ChlaYtQCPwloqmCFAUScOuJMmJVsLEk0T4Md06sZsXsQPIjjOIPYqDs3Pw/rf+C3220f2/C2w+MkHkdReH11hUUWUZLEHmBCKEhwHJ9cj4UJzTm1B6ikSaEqg9vZQkQTq0hYj7pMJxU3sXqV3AlDleppL0Nd6fWNFncQYRq2xlATrhOOCG6zoNMBaJgXsGuA5oRpAj2NO4Xjdbpv0TWGYRAsuEXRaidxAizSdoc2JMgdLcVPjUPkKnvh3TgDWsmyInkUA9UF1rOoYtPGITb2q7EGEDZ2FxM0S+FcWVyEgnO0BqqwJcYKFfXfBFMVbbRydMJcEEjNc9AUzbMUkoOj4eDm+vzsZGt759Pm9v7B4cXldZpm6nzo9rApBZRAaD4/4zqVIZSqLco1VYag5GbEO3U5HH3g62iO9buK8mkl9cj03TA1+9rL+KpKJMsykGdFAgw6MNf3vShqLy0sPHm4/ubN6zff/eHJk6crq2utdrfX7yMHBmTTUMrHdIu6bdOjSz3M1oTygqXK/9LcVWLkpRyqLiw0JNKmiL6xxhpjqy5HtdWDsjnqF3mh1eN8USx0Ghn1i2awkG48rlOF9GxpqHwVqirARCB1/rB05LuPwlwB+EGEMUCfwTMGAbQr9FwoK+h2Ou12e3lpOWpFu7t76OCuJvHE81pUbZEWKWix+KR5ozwCxFhVVSQ6SYRlmlMpbxb2qUdvgxUWFRRYGbJ1kQwrGW2qDQN/QvFLLA/LIV9doaB+ZzAGvCFda0k96+GikjS9GQ53dg9aUdhut7qdluf53f5cq9PzCj9J4iAIPWyvO/2+E3dInS13PKVmpyscNbJlf6qKJHUnpq/aVjTW2C9uDSBsbIoJ5dByJNXw/Em4hcRfdGN67cq4UJCRD5fHlSmDTAKB/+VZmiRpEidJMri5Pjs92dvd3dyG/x0eHV/fDDFop2oUJUHUpDFROUalImWaUpywnL4Ui7LAhOzi7iJjcFtK0FxvCQ1SBw7GVISntSPTCFwJgXIfP8oKgoeLwmhutre0MP/40YN/+Zd/e/7i5b21+4uLS73+jO/73W4XaaUhFS1wj8Hbm86rNKcIfBLFRbKEajdVt5FgTR60gYKNNdZYyaqwzVqgLAZ79aUqb4Wfqc0TWseZBhqnxvXM2U2WrLwwavHL8kv2A1GALRJm6glWMrtz+kh9kGgghDvIs6RpAi/PzLie20abnZvtdFrdTntzazvPM+dalVoUThG44DL4iOTZka9CnYS169dzYN9BHeGs9Gq/3YQ2pw4gl2esBljyZDH6U+/kOg+hMYOYVnF9PM/LgFvkpWk6nkwur663dvZbrQi7F7rL99bmF++Fs6DWBp/yHK8AaF39MiipOcfNXQWYRQ2o0BnV35USEVrnEOVsf82MNdbYL2INIGysxkzFl+WGtV/WJEBDHURwCNJhJC4qNTlZUMYUEooDEskzRXFRpyiCwB8Oksvzs7Ozk+Ojo4ODw0+fPu/t75+fX1xdXY8nMeTKgEgJhnFQ+pwq5IPyelGMyPxGGoe8PCkKypx+M2JimZbKGXS6sC7eKQRXSxdOKbK6bQETR8l/QdIT45d0aM9xCx/5t5RlbYVRhN3ksVokn5vtPXvy+NWLZ6/ffPfsxcuV1fv9fr8DHNEWqsiAP6NqelVh4vnWMGpNuXMmX7FgLA6KZGNqgvqVqxNvMMSexuc11tjvxG7JyFW1WOixJfVcYYGatu+3VwlOQ5XVX7nerxZVfjnSZ0RS5Hj0dZk2A6UrtXCvdDGmXat6s2Gcfi2X1XEgSaif8IIg6HV7PvgOSACGQZBlWdRqhVF4dHR8cnqWQY2G7zggxYmNDVHXDf+lqrkCnGwpLIij11UBNF1OQZ2DS9dYyYSZggkFL7W7Bvkd7T5KUWMJQ1VxCrlOKFbUaJrfqWBiKdqLA4PdRQtIpJ4znsTQkhHbVTmuG4Vh4QZJkr56nSDLyen3Z3EKoUwjgP4cBXhRmzta5gyre1a+WFktqqsqIM7LI9QxAP5WNdbYP8saQNjYlzOEHLZUP0kvSyUGgV5SBlNeqVJOFQ3SA1vLBD8K63ueZWma5FmWTCbj4fD66vL89GTz86d3799/2tg8PDoeTyYpK8ckKZI+WLzbkG9UNE6m+LBJvboAXQpoxEW5OJCjvnzt5QoKVoomEFcXszZWu+ORr5eOjDFDjbZV7TzIo7le5gL6dYH5E4A8DPgnZ2Fu9tXzJ//6r//y5rvv1h8+Xl1bb7W7nue1Ox0/CKNWi44uej6qPvaVO2zvZhTrV90a1kAQBBmR8qV3so+cjglLrzbWWGO/Masm62ox4S3Juluq+2Qzc7lY3XFJmSZJWssUnUY9nX7J7ENMu13N5yBuZZkcUUoM1iQPyycVmbY7S4+Qv+b0WBD4OEiQFvNAm9qLWu3+zGyv31+5d6/f73/qfo5araOj48l4HDohpQrdzAUkCF0KkWOSuygspqg+av5VTV95SswPphKplyu3TLk8hSXVW9nT1F6bycoqvpHqgltzOp5WvROAB2maeR6yYn2vyL0sTSeOe3U9UOWTGF0GT9pqhWEURm2Q2EkTEnGdxh01N9HzHOTr2rej/EmZ/qXfS8GAxhr751kDCBurtVKsC5dcVbenyYSKMorLq+KOcnRTAUIqJuDMYKVwT1cEwKGyNEmBKBoPBzfHx0ebG58O9vfffXj/eWv77PwiThKncHJSP8uLjLpNSKJjxYUYNom6BOMzVKm7fsZOD1bQoE6CMcrlFKS1i6mwSurJM2aCTAdD7SD00GR4GFJ9NE9Q+D43+/zp47/8+Y//+m//fv/Bg3ZvptPpeQH0GGy1O6A7ik3niwKbzusMIV6U7XGqMXXSFFUNJOoILdMe1Eb9f0LfsMYaa+xXbtO4ml/10i1tBmsb/d3yzBcfTAOftao23P/99iPr98tGAlSArarO1MKuHR/hQEobYr0Zp7mmgGGOFGrAdEe0QO9H7gyWzYETgB5FWQblFa7rhmHY7UJHipmZmfm5udm5ubm5jXardXJ6Oh6Nh6ORm4B4taL8OGlR+Jnj+HoTwKoAXCNZ9XHlGTZ0GBTQptoQ2eWer8/0k7jl8pRAHSMx48fVYXR3JDMhzHUCiixU+sEnPNdLM3g5juPLq5sgiPytXd91IzTX8+fml712xzS9nz7hGiETc1R/68q7COsbrr49+gtQiGcaNk1j/yxrAGFjtnHuq0yHMOu86giEKx5VnOM6TvCG3KFp+ICP4En9hHJt4G8cZzKZEDvF94PYmQxvrk9Ojw8O9rZ3tqHl4ObW8fHp2fnFeDzGunBgvBBiUp0G8chFkRMK0qKgTEIxxFburl4Ch1V/XIKYTrlnkvaD2sFUYpF0AENtmhIMRt+AwBak0ZDmSv3e6T0eRj0DpO60ul3oOw8wD/g/M/3eixfP//Uvf/n+j9+v3n84v7jc7XZbrTY0pg+jECcBVWRcB44qms7LfY8uq6jlXNmaouKj5hLsS7Yd2LTId2ONNfZN2zSKprWS0DMWIbPakkEeZxp78y4PpoG3aZ0qao/DdD6rklAOTBzQ3t+Xzm65FailMIoylphzSYhSFMlR4LAKbm9ZeK3D0r9UhY6OyQvDkCBSr9cH/xK1tDapEwTB0fFxHMdhGEAmzXVV9bkPEVjMx9FlKrpPplik2GQCHQacRwMaObd4EKS8qHcWeWkOlMtVvSo00ad0ZQptq9rA8gxwkFqpGBgBO3GPaRKx0CRznMz322mWgQgMqNLBP2fnZ3mauE4RgCsNAz/odDpBGOZ5MBwOYYMROrkHpyOAbc1zadfE52USKe8H1G/wO+vVCEj5hXvaWGO/qDWAsLEvmFpOFRKjYjeDt0g8WYUAEYJQNbfJEKp2SbzG8eoJxwVN6DSFRdBz0iQZjgaX52cbnz++fff208bO0fHxaDRRsqKFk5CmKPHvVd8ks/ATpUg9VP3TDVtDYFn1u/kprrTaTJA9NcdoNRdIUFVrfJcahR1Z1IeQPe8RN6rDYA9dL8uBKeqhWFxAjQQDf64/8+zx4//zf/wff/7Ln9cfPlxYXI6iyPdBPYYqRmjCsRCjnk9l4L1uEjWtJ6FAkuZXmXS9PWfYeLXGGvuN2TQMpnMvNWQ5Xuop7cZWyyCtPmarMDa+MDZZpEckwC9SFe4CICUbQue11OtG1YzyXKVDg8MovVZXVqdApuaKcGKQB1CTKkQ/Mr0nnhCtQUEyPK3Puqau67ShhX3Q7oC1Wi1o+xQnGRTnBwiDsdotz33Po1881yvgXmA/hsKFJ7W3Vfm5UqWJkjQDJ+UHxDLNgYMCAVExy7p3oCbrVN2X6OhguxvWQavNoTKLVzkyCLbCA1QioHmAy8myLE6Sm+HIP7to7ezN9Hpzs7MrKytR1M7zAiij4Ispwlp3Fork0uEcx1PhcllIaX+Dy+J6uo2zSr827NHG/jnWAMLGpJlFWsbeiGapmaKYWaKFleqvddqMQKHBNrdzLVTwTDWcSCfp9dXlwf7+p08f3r57/3lz5/ziYjJJ8hyazhMtNc0y9TlMojE9o5QHK8VlFb1E96lnIVSz4tq+f9q+gd2/zkFWXi6l4MxzGk+q9u5UCM/8U8VnMRsSDqOCX/GRj1sUrShaXVl++ujxH77/w7/82789ePSo1e50ul3IrAJZNMqLAppRMEG0pmAD7yCWUxK0Z8kcuUtTFyYC3noi1QPYEOB7ShLq4gKs9zfWWGO/ZpvG1ZxOkqzJDcq8X+0BJUKzIGIVicnKr7vQQcluYYrS8L54pXwcXj8t7mgVuzIb0dAShVJIiU3Kn5KtGmpaD8iuFZWQJafS5DCm0Cw130QxYEGhGoENjSxAfJMFKQiO+R70sA/DLM3SNHVddzKB+g28LQGhPXDCiKMoealOoSeWZQYkiCW2CyUZia6C1BhVWllz8RikLNNQxKzoQ1fBoi7NFBfOfCQ1MPX9ZEIvfiW8osgc2E14bpr6gT9JkuubwfnF1db27sxMb3FhwfOCdn+23e4iBRf0CAqKn1Z7ZugZgMtE0bvSOA0d1JqhEtjX2WUaeONDG/tHWwMIGysZQyoR3xIoUbtKyM4hGYVl0WQSDdEg+B5g6kPgjE31W08TCEMiavTzIhmPR9cX5ycnxwf7+3/74cfNrZ2zs4uj45PhcJwk0EEoy0ASjKgpHI1WyIdFnLVDYtylMafOWeHIZOmhXIl1J9upgWQDIHPTqr78otleWK2cCPgRrYUAJUNBjaw0PQcvqt/vA2XUg+ZRblHcW156/er1X/7yl9dv3qytP5idne8ClTQg+TjMEMIZPZCJMyovasZ1d0HVdV7fXQCHmkVTDQZU/a6OT5uXanmh1ZLCxhpr7Fdr1SK6KuSznrReqi4g1QdVpiiDtOp7NI76wnGspcaiev6EB9YBazOZ9TR7zDIRLDSbeoX4TEsGs3jqXq+lpq8aOlog2YKy9iTcQYm0pHqCDiIMQ26cHjpOrz9bOO5oNLq6upqMx2mSHBweJdSvAhijQYE+iuoycijg1x/GA4Ir4XZNRn4NvRvEN0F5XHkOzUuhKHLV2ZqkIXNC1WUa0o19dfp1VcZS0j4wGwDZTok+kCO49SLoPwHEUXgmd53i/PysHQW7u33P/88kyx8+eerMwRF83O0EIUyC5/vAe8XobfULmVOvDkkZ1VfEVBu539B5URUBodKb2+9pY439EtYAwsbIJNcdf9eAhiAcrm3IEDEsCPQIHJDTCUIDyfSb6oSaC+iCi2t4Esfj4ej6+npvZ+f9u3fvP3zc2Tu8QSiIni9HSimoirIeGZNFSqUCGu+JaxIiopZEio7YyTfXcXlqJslCg/aKTcX2pTylOG85j0gMESgnwHbz1DoXfQ80n29FURj491ZWvv/uD//+P/7HH77/fvnevZnZOYjlAlwER0vMUpR2rWF+4mWBs6P9BCQSVc9D5R51pUppnKWRV92SdqjKVYskbVM62Fhj35ZNawJhqXHeDpa+KsEoEU4d2mRPJCVbbMd0S+eJW3pI3CVu9UVNrLpGGjKrKS4HA3HEqsCxyqW3fmA0BDnI6t2pH/yXVlyDhZAr6TG2wdxdGIaei71rwzAIQY90f39/OBwFQZBAs1+4wgxVvtHNUxGHEppj4WlIxKkuS6UzKxBLYUn6pLwQDZ4lRjLuWgHnL12iDvfacczSLzptqD095jyVVnkOdRp5HCdX1zfQub4ohqOYyvIfPXZB3zsv/BD6NPqers6oDIj2QsivNXNuvqsscGDlOM2w1Q7jKxs5NtbY38caQNiYpayp3HCpXJvgBCIy8gOYf4OlC2CJaG+gQ3j1dQ1ctwalgFkO/JQkvbm+PDk62N/d++GHH/77bz8cHJ4MhmN4NcUuQWjKjUBaEo/uo2skDRsuFORQIZ0LFnUlI3ML66kyQtukn1duSf2OuUn1wKnVzWOiCzBsKfRr+uaaDhauBoQQ5EaBOJT6dDvt9oP791+9ePn9H//4/Z/+tLq25gdhu90mDR4P3w90H5Rug2xt3U7FIv2q0GUpPGlvL9SFUCpYTgJ9EzjUOT2b2lhjjf2arVosNw2oMKW8TK0wD+4oA8Mn5QQXLc913NFS5mQ6rbQezd4CCGWznGkwkhgWXFwtoK+S+6pis9pZZd1RnKxSR1xKEhJPRL0uPq6Qyp1jaqZj0K08Qy4ioC6+XOgPXsxz/SBY8Dw/8FtRq93uRFHUisKj4+ObwagYDBNEjMR4hE9n0JYCjkkQkSYTWCdQGWF4tLqeXnse5RJNQaDMjomvH8+S2lHwleJ90B6UgaS+Pv2ZqdBRn5ZaPNAw4GIUyRc4R3ECX8u8cPK9Iw9otkC6cSGQ6vRnF6Kiq5TteKtUnedKkNj8NVU6dZTvo7oM2oHRKBuuTWP/SGsAYWNldMSSKOi5jeM3zHuVJsSklBJXUes2/g/JojYipONkCPIYPKZJcnV5fnx09PnTx4/v3//w49u9/YOjk9PhcJSlUDcITNE0C0Loolv29DJNiKaL8s2A0VepC6hc6S3UUH08OydmmhmWuR/Wp4zLV8CvTBN1XA+7z+Nuw+WW8WEQer4XRREhwwjite695eXnz57/6c9/fvn69ezcfKvV7vZ60FcKJWSQKWq65VpFg6ahIf7Kt5IwJzwQZNr6oL7MF9PVYfsK6fCsGHZjjTX26zdrlym5mtPQlySI/gQ0eAv503ogkacso6sWK95FwkqOXw6VHAofoVZllB6ISsIvwN3qGdWYVQGbQrekMqr8KabU2I1obqE52TSFG4ZW6hmTITOgx5lu1IhI0yALaljvBUG327+3ukZSnO1W1N3o7u0fjEZjamQPVQyum2CRoQNpQ4i6mjtCmwQmlWi5F8UV1c6Ih8WeA6dIJIgrOWoDDAlSSUBlkmlKgbQ28iucI2vfqJdVaACUCrxJEQeZn3peBtxRd//gwCnyMPAnILRTPHrybGklzHOo2E/HY+rw5OOcWM7XfFfK6UE1XhERrv3a0CHuch8ba+zvaw0gbEyaRcyB30mlTbYsV1xHRY9QCinUBl30mygfF+FQjnJeVG+RJMlwODi/ON/c3Hj79scPICSzfXZxlSTAEC2cAvrU53mW5w6mCrMsV6qlqHRKxeEchmT8qZ6hbYvkJNXV6P+U6povcXNMxHrKGxW/E7VlqGoQMoREEkVBUarvv7e88ubVq3/5t3//7g9/WFpenp2bjaIowM7CKp6pnGl9RLQazre2L8YxW75HxHdrIuGVkonGGmvsGzJeFmr3zVW0Y6X4JN/PAmO1ebPahB7DM4uVaj0jtUQYG5RPUf/SLVTPaZk9Kx94lzHTu8pSoOpTBmNrNo0CR2U2qa4krGs6rxVIuABe1JgpaKEYHFR1ZuoW7/gdQJSLPhUoKfhr4PvofMJWuzU/Pzc7Ozs/N+e57v7BYQaEmyxJEobK8HueYy6Lrtd1oHsSXYtAbUxIKbfX0DAPh22iDPW3jFKgatpqTSNH9cEv5dYUwxfwf4GsF9fNs8LxIF2IFaFxEl9c5mlWpFk+niSdVrvT7vZn5sJWezQaBz71ePT8aclcnY0FzrDjFQ502SrTpLmPRumCrYM1GcLG/pHWAMLGwJjPwpraFlNI7gOw6I3wiC4gNDmx2sXLyJpQC8EkzW5ubo6PDre3N9+9e/vu3Yejo5Pr4SjJIClILFGGdGmWYglhDs2c9BlZoVmNXlepS2k4K8LMBMi7mIxK2iKiZa9VqeUQgMo8qam0yCMirTflUXy/wEYa1HjQ9/1et/fg/v3nz56/efPdmz/8YfnevcD3sNmgen+G71fbILXbsO8mTbQW0YHyd45YT+W6mJ2H2OExfUXEfRtrrLFfuU3L/FuQ75YyvGlJQrLb2ZuMsqwcnfUGOVp5Cv2APlVKGRGYkem0aQBVDvUnPKidTAtYkty1aERhTy/+Y2rgLDap6fVK7xcPZJM6vg4lPqlzZXJB/qplmTy27xsFMvIj2IzBn/WBdtLr9brdXrfT9VGE5vjkbDQe53keRQD/0tSDnCHeJqxCBD4ONVzQt65cACp+auwGwVBzser7VvKcxsPXQebKFclobGlCRI5XvUeXDqqpgMA3NgfOssx1nAyqAIGdRG2uoqgFgLDT6fVn/SAM2x2/3Rbys1MHR5slmNtct2IW6UyTUNU3Xoqfyyr9EkepscZ+MWsAYWNgms2gnbFYTq0mTiypzc6Y5EYp5qb9mWnASjR94GBoOZY0TSaj0fnF6f7BwYf37zc2No9OTnb2D7AB/SQMwyzLswwK2dXHYe3GICjCIPXYpCIZGaL3AdUUQkrYqBCjmBS5rd2IfGlaqMbDTkJa/BD2Rlg6b/phoPgnsnFQ8YUQHbBqUY0bIrFhCO42ikgWvN1uB75/f3Xt9avXf/zTn548e7a4sNDtdrvQITcANBgEPv5kPVIrE1kqrDDaqiXJMoMGyzhWPlOaKLk7lN+AJnjZWGO/VqsmwaoPrBzgtJeqPyUMY2qllaxjKrs1nmrmTXoZLimUQ5LBLPmpamcIg3Aq4PAWfrv8lPzgtJPKU1TBdg0jg/XKdNMIgypFGwkbz5Q7XrC+l16WxSn0sq8ThnddlvnqgDXqOBk0bQcGS7vbcTw3TdI8TSbj8fX1zWQySZI4Rc0zDM7KoYKXweb1nou1hYpXzDULnCTU0qsKgmrFcnFdFpTT4HHKBU2F8ZR8I0E8cXAOEKMiN21OYLDUJQvQoOtkrlMkhZcCDPaybBLHh4eHUeDPzfSDIEyybOX+uus6UdQK8jwZJ0EQFuCRaR9kS7upMIc+l75f5TCujBSwHHrlO3bHe9pYYz/ZGkD4u7YSclPymJqZge1jpZy3/En90yXFX1MXzU8ODhLv1AEWaDaZTOI4Ho3H52fnuzs7nz993tjYOj45HQyHWZb5vpemSYY5QnZ7tNSSQjcpmUpUSteBVek8RDo1tc2F6COWbBg/fTsstBhHutBOvsPOsKkQXoVbZbpcaIlqiu9Sg4kgCMIgwPaB0D2i0+n0e70Ha/f/+P0f//jnv7x4+XJ2brbb6wJTFBGgpNkw2aZ6S9XcCIVV7WM0iucL0w0kdV1kRRO2dqfCQLxxUY019iu2OpWpEr6qpgFrGRC3H1l6geqvdpO1EiO0dDROLakttEhLEq/PDnhNwQPWSKpWywWtxZYWyLQOIhRxlN7M7dWMguEpBnDLUPV0yFOKqg7F0NFHxvd+MZVWcwY8CPonFb7UreQdx2m3W0EYITUSTn1+eZnnRZohd9R09i0yYIuaGn6K28JIoGLdaLBywo8gW22fp1JmTNzN6vxP+wLoHLKeMfm1FEFPPf2azaqE1jT91SsyjGTHSXJ5fePu7aMMuNdud1w/gCJ/zxvijgVyrZ4HzOBbv2/Gn1JmWGUWxTdBRF3lxTSJwcb+YdYAwt+vCdaK/l0tSdirgDVFSyuSJodqgigv1+aHPIWgnuZ5PkEbj8dHR4efPn784YcfN7a2T07PR+NJHENxgu950A9X64OyryVaSRkDKW+pwo46CGdXvEhSUdkqLsR+kpkblQuzV2iO0lbilBxoZ5YrqsuA68WdBKYQW61Wp9NZXFh8+vjxyxcvX71+8+L166WlRfTHbWKTws4Dizmp9dP0bYdChGpK6G2Kq6PIOfpG1sTOOSVYLbY0QevGRTXW2DdlVfhXZmbWwzMLItaSSK30Gj2QTFG5tkhNUYtNWo7EebqtnxoSaqDYl8MnnZYttBZJCQZu+ZQcWO2bazmJlouwkGFt5VtV6FWiZabr42JO7EKTNWKsWPJsd2a+WGfEoKQWvUZPkWWgHNPr9duttu+HnuenaRqEwe7e/vnl1Wg0hqa2oeM4MXEswbPAPYVjIu/UU0WUXo7ZMAo3c9iZvlQscKaKVXhM/NhCgzXcnKml+kZtTr6/7OjFXeYghOMUqCiToetPPc+JY9dxLq5v3N29frcXtdqg5Ob7a/fvhzpWmxehkxeeiwqrU+CrLP6sGW0lCmPReRo+TmP/AGsA4e/YCMZwKskQXaTTKWttq08qUMDUzdqlijpG0HFQFSZzPTdO4tPTk62NzU8fPm5tbm1sbl9eXsVpgn0moPt8FIVpmjkZ+BVaRoMAShUUF59cCnNEDcnVbFocq39iheykrmGKq7BCyPZKXZFjkZub6lk8JeNGcUT4D3iioCnqd1qR4wLku7e8PNvrP3785OXr169ev7m/vj4z0/cDYJBCHyTUgoP+hJhLhJa40+6nijrqnYHoIijCtvhK+RKsgKu1c+ItYeOQGmvsW7Eq5NME/pJQ5y10Ryk0LQ9oJdboVVoDa/FYNdUzjU1KRikak7oh6IDvwQfwWfkMddKTD+hc1WfkCJG9r8rO5Qil3GgtGpRYwspk8tzjVWmhlzKQrqXdyrvGy69ZjK3u81wJV7mD074JX1y6aVbhH7iPDvAmscjPDZyZ2Zn76w/SNO32et1eb3Nzc2d3z21FY6dIs6AVQVkG9R/GFg4qBMkMWTqsmRk9FL6DVZYtc46seIRMq8o4tH2xjAbrjmZmrTx7qq1iUbSiiD5L0ndQMAklL7nveRs7u4Xrha32cDAcDQcrq6tzc/OQSwXtg9T1vCDPUf0bCKjV5hOlL0npjqn9TO2XraSJ0MDCxn5JawDh79EkoR9dTQlYlZdoQxKkLJ0iPRJ1U61T9L/yKXRW0HGcNE3jOE6SeBLHN1dXx0eHHz98+OHHtxtbW6PROM0y0CvDnwUswdCPXsiCl+u2GQqqs1BrXKVAU90G8QVzWK5aH3JHt6reJh+XKVISVKvNBD7GykFwt9RkApg52O4pioJup3tveXnt3urjR4+fvXz5/MXL9YcPut1u1IqCAJpPgBgMNnvUbNn67vMyS4nbBYLOVa6OeEBRd9xrVOLf5s0mziojuI011ti3Y1VN0Wkw7xYmngVprJdu/6y0O4ATcihAY7QSlRJw8puryJPXWwKEtEF3df+9u+QAq1d3x/Fj2blKXXHPuVKatMScLHkiBVNFZJYqJZQiJaYKdUWAPWO3kTvusmKbjC74Duq/50PuK/CDcMnz26323Ozc7MzM8tJSt9vd2dlttdvO1VU8iR0H8odO4aQZleGhn9IeUEEydOEwIeaEJidnHBMyVxnD0Z2SUQmJmat0Hv6HWaO1V87EHwuX0WjTLCW1dHqGCk+yLBtNJsenp0mSjOP48YN1umHtqBW1WuPxOPShWz04dw6WV6yMSCU6tuK0X9C/bayxX8gaQPi7M6X4yTpXmiuq+yQZlVGDA43jxEigDrcJ/1+jw0m5x7woxpMx8EQnk5vr6+2tzR/++td3797v7O5eXd9M4jgDEVGoMKRPAmUUfUA5imwthdwpXV1SzanN9aoQa22A1pQRVPOB09ffmoijnGFOumKYGZyrqvdwsOQAHG23015aXFhbvvf00aOHj548fvp0ZW1tdW1tZm7W97xWuwVvwx5HNBVWTL16RrXRKFN8hT6ZyRbSSyC+o69FXldpHpib1KQHG2vsV2P1mSUmpFm1SeVPWTkrC41UAVgtiVQisWrN3s9cK/R6XBp2UWfWNXLSqYavgS/ouJqdD6yCw7vjRvGAMmDK16BcSil/yAkxoSJTf2uZlg+OWgMd/UMiQhsb/nQVaIbN9MD3/Awa5CZJkrl5p9sDpc1er9Przs7Pzcz0+73eyemZ4zjX19cUgaQuClkW5BmIYOeqrFGQXUHGE+v59VCl61ahZQXhSaMOnlItLmyUWwlAi9stn9K3vtTgvvT9FOlWnUKHYhlKcsJ1QS8NAIRxHA9IEi+JnTyn6v92qx2GYdTt+m6Ltkm6y2E9fjMe1pY8V9/5v0u+t7HGfpo1gPD3ZwJEaRVNyrJJJwpiMyVXhx3nVeW6EnkxmUFr20H5MfAlkOgrwiAc5sPLi4vjo4ONz58+fPz433/72+Hh4WA4dEDai7ilqAbKuTUd5bVq+suRQvMMuXSrVZR5qcLRl7scTW4pI0ld3M0pMknRsbZBEMDUwy4HqmGGoJW8C5qiUSvyg7DdaoWBvzQ/9/Tho+ePnzx9+uzRs+crq6v9mX631/M9D9KDUNBPpYZgHOeuuZPqYgnxQZ8JU/mpRy85TspjGcSogthVck7tvrOxxhr7p1t9bkT9UiKnVZmiVSQjGZXWe6zTWQ9u6ez3E4zXbUg34UnyHHrSOg7knfRqV2KCTCOIEqyA9jxoapwQmIPVHjmR9nzKSeCcDB+Q3yOwnzWHqrOfzL6W3JBNK61BldAWj1+m+8VqMcody9tkonXW3bEnVkhkf9H0mCnHRVozKmzqBcH8wmIQhq2olWf5D2/fXVxepWk6Hk8CP4AyuiwPgiDPM9hLuC6wKB0PEC0CKi2Do8oaXA8Ap3Y5eGpPJXWF7gsicxyBnEnrQkVsWH2Mpke3RZYsKP2GMibk2KiLWqN83izNKHKaT8Z+AolQIDS57u7Bvuu6URABxM3y1fX77vx86ERBno9HI2gnjKrgtYpE+ptgp0mtDcgtoYc73srGGvtaawDh78imic6VHzBXgiNn1H1eNKMXEeG65clsQdI0pZ4T49Ho8vxsc2PjP//zf//w49vTU2hqBEXb0H0eVeT0OkhklVKBili++XTsRkQKsah3D/qDt2DCWsSoL74uYlfOEGofZzYrKP4CNRjUc4Jq/3w/aIVhFATLC/PPHj/60x/+8Pz5i5W1++uPHre7HWhJ3255vh8CU5RixHQnpnoASkWWAuomIUj7COyThU8V0I6Dwtelmaylfn3VHqKxxhr7x9g0xrt8hnCLlQ+sPlMVg+HHBkSVf1Y3plZ07O+1YaWCA1bq11yTEibU65/hkXLdI7Mz+GgkylUihnwpz1mNSDJNQ9Am1JQqAj7FSjHAWJtltcB2VRXGzJ5W6FbVfUYGDGO1UkWzPO3V+f/KlVxhTPJ+QGnB2cPgJrwaQk4scj0IVuZZ9mlj0/f90XgC6cE0yIvc9/zchU73he850FQCkDagRHWjzHBoCtj3o8c0gNB8b2svqoroym7atEXWVCYZ7bWOo3JzTHDlAdDAIGkIfGPY0uTZZBKfX1xAIBv6FBbtdieIola743v+CNAgsm19v3ALplZVBy93FzocYGQdbhFuazKEjf1y1gDC36PVis5p58TyywQJKl5fh93AatNWIvQFPeiTZDwaHeztvf3x7f/+r//68cd3x8enw9GoKAo/COI4LpySqig73RpOJgvd6AoBfgHwDtdjCN3q29kXtTiwniNkv6yGZ+TgEMHRnkOlW3FAgHYBE6q5jaJwdXnpyaOHr1+9fvX69b219Xav34E2g2EURVGrJSExxadp6q0R5gUooakSSqyFV0wkPDn4YTUvFGNW1CJdGlEONJabIPGE3j5vjTXW2D/aytmD2gcSBUlhmOqCXxcCK632VamYaocG/uBP3qRaMJVRH10I7cKtB1YNpJUhhE/iY3PAUrcGBIdl7qgcSW2TCZ4ha/GswDFANZgtNNFMUusu1ZWJHgMGr5auyPgcflbrjspXfolVWt93quLTDJQsg+uCec6yYAEUsNNJnCaQDNzZ23OgW0MWRVGBvd2dTHkQzy1yJBYBesS0o5o1oepJxZYIrzURZorXrlax1gZzmRGjdL2nbFSq0Q2aUL4XKq6NEgWQOXRzN009z4udeAjkWACE3XYnarWhEUXUure2GoSh8eB5kXuOKimsP3V5ADbhtSagUEaDv9AXoLHfrzWA8PdiVnh1GiGB6Ru0qhJVRDvdmvhW9RRxHKfAFUHPWhTj0ejw4ICaTPznf/7n9s7uzc1NDlx8EI8JAhDoohFxHTkfzV7o9Qv0Q7xauiI5mIrSdD0CrM6V9CLWQoxhPxNBVP6bBOuwXJDeSILUURSROHW/1wsCf3F+4eHDRy+eP3v85MnCvdXZhYWZmdmo3fID6G1EeqpqErAwo54pigAwd3Kdl9Q8I1Urz/fUUzOlM42KsFPR6i5FbafkHxprrLF/rlmddUgVUb5BoUGKD5WZovyAZD+sBrPVRJmFDPklQdsztXbTBsw8TPAI+E5+QLJhgBMQ4NEunMdGrFHUbsRe4VhXQM9TFEyiXCk/w/FE7BqHvfWwEtvLc+hEnuegCYlsRur+miSJi319qH2CHwQ8Qlag4auo5v14nkjTGoeh8pBZZgrjyXmZLoKaxzHdC+vrUh3rqHhBv8SgVLNInV/AhL9DPwLZQiheSBwAOb3+zMMnT5M0HwyHk3gygghvO55MXNcNgxDck5t7hZ8XGSJ06NRAQJnuu0qkmrZS+IUECKW/ckLorjoqE6EQZCFmCpkEp25JXGoRrLttKa4Mz57hrqqz0PcMc4BteluW55M4hjaMaRqnwB3dPNgrfD+IWoPh8M0fvltbX+v1Z4ANhMoI8OXBVsO1QROqkKzkvUsbrdqdTEMibewXsgYQ/m6MEAt3Kke0Vg0wM3KQMWD9gCXA6tcgyI/hGocYD+BKmqbD4XBrc/M//uM//td//u/dvf3rmxuKMtJHSEJG7wNq2jxU10ErkFwagAJo5csRnltUC9592kq7IvGYhVpN43tiEamwuurv6wW+34qiMPDnZ2Yf3V979eL5i5cv7q3dX1pe7vZ6YSv0AxQoI1IOgTNdbWHPsHQe2mmS0I8oz1euzmBacb/I18q5VWp45blqfExjjf1KzN720cKjmlnbdA9GSlZisHrA2uqmat6MX+JPVXeotw+eKawEBqwHPFRCifSA5P6JYEKvUgBROxdFP7FGSD+VLAniPYhLQkUX7HMAz+ALCpPohhbmcQEN+GTeqZqKrM4YPRD8W4amCpBw/JIgnAEwnCgr683YqR9z25n3wXKjSv/tH6D8LPNmruu2Hefe6lrgB77v9fq9Truzub1VQOf6qwxThVmeQV4RykLUDFD4gfpQMWxT/glDm9qvwR6Cz2vFc+Xz9hfbIK6abzv/xhoKzCkqdT4UwtpctUkBbvjuYJSBAgRZlkFH5eOTySQeTcYPjx9keZam6eOnT8IomkwmvuvlPmwDoOlUzTdHjVh+janYxCJC80tcGyKA4k9XEWqssao1gPB3Zmbt459aDUxS+w13VAEM03JwyoGZ709vAI2YPL+8ON/4/Ol//s//+V///de9/f2bwcB13VarRQFgbi+BEUQeYBV6lc9SNvkSP6juZkQl91etoeU6wXKcj8AU7cl4ZExVIn1RF4TT3E4rWpybe/Rg/eWLly9evry3ttbqdNvtdhCGUFmIPBMA24jSFcCrEF0ggEqnxL2LqpQH6TbaQzAhhyRES5tIifrqJ6ChnzTW2K/b9PpVQiz0t181mXmT8pu3oBrJYORnqjvyW8JGtYWL1QpGesACkpzMJNSXpikJktFP6k9LPylVaAoMxPqvCPYIBcmIo8EPfKrjxvWWESOPhMfGXFl5jbzsK1aqRi61/tCqD6TWBRb5goZufVj2o6cHKjDINWaldVoRSAVm/LJ9bXE4XLYPKjysbaamzvezLFu6d88FTexOv9fv9brbOzuO415cwnwm2FvYxR1mkSL65a8WQTCceH0h6kusZqESFJ6GBstfTi2uVkJLtX3gxaRNmQyGqxy20LUh6ramWerEjusM4iQeTyZxHGNIPI+wz3C723GDwIRqyV/XnatCBC1dJj/QXx7FpdJBmdKrjTX2M60BhL8bs72yYk4Q/1BJJaulWhFa1Aormgmp1NgUpqhK9OFqlaTJ2enp9tbWjz/++P/7f/6fra2ti8tLcuyTydjzwJ2oyDFqdLpuMO3ItZsMybWou9ZShvAnsEbrHHwpoK64OjiNvkfN4uHAmBQEa7VbYRj2Ou0gCOfn5h48fPDk0aOHDx8srywvLC72+jPdXjdqtVqtNrGbfA9+1hdPYhLSuEuk8lIOVhflG3+j4tCylIJxPV2O8Ezq0pqawcYa+7WaheVKaSusVdYMUaaKkgILPFD5NKgrLi1fVV5oTeH0l/gCNCROuNF6ThxL7htEToFBKb3k+36SJCnyNsfjMacBkySZTCZQphXHg8GAKCTj8ZjIohNkJBJQJJJnmqZRFFFgMQxDmhmqZHMcp91u08g77TbldrqdDvD3XLfT6VD0rdVqEWZutVr05larRYOHBCNST2nkdEZSB6ML931UG1HRRrM7l7OhJlMjXuOzdBqIp5LugUoNEeuE4rfyOLhYs3suidDc8bsku0OJDiV3+AIqz6LKIzQvd2Z29sHDB1EYFDn0Z7i6ukriyWAI2ipRFE3i2HcCmCUEf3mW0mdJTtwEOKaANkv+h59UdCSRU6UZMT2k8PIgS6nmjC7ATqXiFkdncctXK//oeKj0ZQDmc5blkzz14avYSqI8L3Z2d9MkzfI8xp7Ljx4/7s/NBo4bZPk4GVGa2gMxgRr/XpvGlxdrbVpkiv7nlO821phlDSD8HZpMk0ngBLBC1iTw6sXL8i1xLAqkoeMHes94PD47Pf348cNf//o3yg0CdMGVNc+LLI2zLM/yLPB9OA1VDuijmQVeHF8/V+IplR4LBykRoNVg8KvQoHYwJRaVyTNqV89UT9dFQTaMpkIoGjKETrfTWllefPbowYvnz9YePLy/vt7t9YMgwNpC5IuS1os+SXV6yVcQp4lQnlaZw3ihioyWuF6GXGT3O2qssca+zYbyDPl4NcNVAbWE7YwcvazAnlgfpuW+qlvVWu6oNTw6F2FCCQUJpPk+KPXTVdAD3lvf3NzQQa6vr+nNcRxPJpPhcEiFBvSGyYTq0xRWpDMya1ReLLeh5yShi4ksVcgdQoV2u91utVqg59xqRVjaDU3k8FV+TxzHdBCCiExA5YyrnJzyvJWmy2bkUpyuTHOl5zX7E+GWoIyyDyMEqWCnbuv386sHvy4OqJmugJ+xsJC8edRqLS6vdKFRIYiiZWla/Pij43qTJEniGLi+Gdx3mDoA1sBdoXpL+zJLU1Ly8vKbyWFRs3fh2VM/aRsDfxecddStO0R1IV+W/puqpSZZfwIc3cCOUl7uACWWQOD55QVEONI0S5M2fLugO4frecMRbHJ8loirwLcqOKw+X60eFE8yibQh+TT2c60BhL8j08JV+mFJek0x1GULcitfdfvOgDFhmmbX11eHBwfv37/77//+73fv35Nrb0VREseEoyA9SLwmudKxU52ytkkxdMXzEYwQdi0WYrwFQ95iliacQGqcgTMkl0ypDlCrjgK2Z9DyCnxAr9ddvbfy9PGjFy9erD941Jub7/b6UbsFIjJRBEWGuHNBR6tPKShBpFVG/BcC21RjUIoNa4ppuVBQkXeb3F9jjX2LZjEjdK7JvGRKB7F7uSYcqgcWW57VVmohTTVJeJfhlZJg4hmu/WMWKLM9Kb83Go0wj5IMBoPJBLDDYDAYDoeDweDm5mY4HI5GowSNiCf0KSaLil6FkEIk+Ef4kyAoPYjjmCBfnueAABHgASJst6GuG/5V1mq1+v1+u92Oomh+fr7b7fq+3+12YYnG6SIYqdoJ6LQMPaYAIGuc3r7Fz6f08FBTWiod1AWHRlzU1HKww7TrS385o36AKJzmZZkDCD/xs8yBegc3CkPPc2O8X3me/e2Hd1eDG+wmVXgpcEQBw+N0GVILNpoULJ8abGhFK+rdN7+HairpyQIqLOTxNLup8lNb9cjVPwcOdkCMXL8EX04ngW82kppbrQhaDYdB1GrdW1sDfnIUAb1IJckdp8AGjHXnsv5yZd2gHGc53s0kUvVN+eKdbKyxadYAwt+R6QZJGEKrROCo6tv4GEBfOp04hcdIjpkpQ+iMs6ury5Pjo8+fPvznf/7n+/cfjo+PgWE/iRE1qXCcYmvovvCcG6TRWAuf5RXIE3r0Buo2oWBhDYPUFnO+40QpOGhGotvUa84mxSX1aElSFXOD0IA+CIAfEoXh7OzM6urqw/X7D9fX1x8+XF1bm5md68/MhCg9GoYRXhJ8Cue70n2eALMi9GJ6EOstKWcJZYTspDnSfIe4fmONNfatWCk5oKGA3BwrdiK/JKjjHEHzXE+3kbW311WW/hcJovyA9sdI9QAWKPkCz/MGgwEmSwAKxnE8HA5BdjHLbm5usiwbDodXV1eHh4c3NzeTyeTq6ooeUHowy7LBYJAkieM4xCZ1XZf5paw6Q+CTC7b5AYE02ciBNR4J3VHqL4I9uttutztIIu12u/1+Hxj+vd7s7Gyn05mdne33oSFQD9Shg9nZ2W63S6nF8Xjc6XToXAGqkhJblWilxAP1sIjAQhQWfq6WbloTXnpeVCRaYFKhoH9IIZn6/lCtuwPXS8A7y3M/jO7fXx8PhyfHx6dn5/FOUkA4IHE9D+YH95rgpLF7SIZyokQfzVOUY8VYBqt8Vs/LfRo4KKDYOfQs3Fl8K8VNdRJSfbzcPUs+aaXceT7lCBhnFlr1oNVqwQfzHERv8zz10iAMHNeZTMYHBweh73c77TiOv/vjH1fv3+/3+612AR0dHSeD70wBxCizzSidyGhB4SO9vyjNf7kXhQwrNE6/sZ9lDSD8HRkVlFOtCXe5Lbe7oTVKxZKtPUTlcJSpUgQeIAVl2Wg0vLy8+Pjhw3/8x//67//+753dvdF4nKWUD8yzFJZqyqfp/g12QtLa09SdU/X3M8+qD7hT4N9XAcKytygX+vPIdL2OGrfafAFHFHULPGCBQrB5dmbt3vLTx4+fwH9Pe/2ZIIxa7bYfYHoQc4JYqq+2a9ag6RpVNZCmjhKDl/yYig3q2bNSmY011tg3bVaHOsnFkA+sxGAdxcNmh05DJnckiKKXAExICJBSf+PxmB5fX19PJpPr6+ubm5vLy8uLiwvHcS4uLs7Pz4Fcd35+dXWV5/l4PCb9mMlkkmXZBJU5KKlI226ClHReLkGUqVGLNmJBZXpJAQVN/qSGQFS2TQCPsGK7DbXclC0kZEiPe73e3Nzc/Pz8grZWq0VFjI7j9Ho9wsa+HzAlkJbtqogro9bqhUzD53LylXszPkhkk/6RWpNaxVtdDvbqoGsJFxefFs/jBJiivufv7u27rnczGMRF0Yoi4AwjpkozqDaE688KgIT6u1lSvKnEKaRkQGEDPRPgMDxifhN/56WTnTLPOtko3bGGnZyRc50Um5QwoxgbKcN1jSfx+dUlfWVvhkMPwxMPHz0KwnA8HsMXj+YNBW+raLCUNEa9WrlDM8p25buhrob2dY33b+xnWAMIf/vGOwZcMHTloFZ5tnyS2R9Qjwn5jHVYfXAul7+5vt7f2/v86SM0mfhf/+vo6DiOE98PKH1HtYVUTa5bG5n1t2T12LNeVMb+aHlLdOfSwRJVx0qImraEpipBIzKqWaC0Ha7+0FEDQs6dpYX59bW1F8+ePX367N7a/ZnZubAFsqLEXALgiB17p23CtF9TmyH1DFRhQNsm+T72hXy/GmussW/UrPwP73AtQU4pdyGRBu8LrcrAW3ihU8l4aAxdpBQn9tyGpoLEzxyPx6PRiMifl2jn5+dHR0enp6fn5+c3Nzf0/Gg0IrgYxzFpt9D4KaQ4Go0YB1rXzmNjuVQeTHWpZ7NUN/iBLDVkZEhPhij7DJJgSCgloNjr9WZmZhYWFlbQZmdnV1dX+/0+SeMgvxRSl4QzZdq2SvqQFYa1iikWm9TgQJMJtLHMXfDk7d+3r/uUmEf+IFw4IvmFpeXnL1/lWd6KWt1O9+D4+PD4mMpE4URpChhJlHJwmpejrrXnFN89iQkVj1YSgRgO6qI6cesZDCqdXoMh1VvLfzLk95Vqk750epyz7qggAGOTxhhlgLCjog/Fq1DCGkIpa6vdUUeANHKe4/RNm2ApKyoSgPpvoaQbJ775/2AWcWO/OWsA4W/cDN1cNS+SkTbVc0KzDhQWUqvbrWiQQsJEbKB1ajQanZ2d7ezs/N//r//7hx9/PD4+vri8Go5GaZp4nk/ruAeybEhM1XrMwHgsAz7ZmF78FKuhJZwgjLJknOgkqmXtm29p3STCjXZ2UUd/5TvhXx/lCFBXDWQJ+r3e0uLC6srSg/X7T548ub9+/97avajVDqGMpUMieNBjAngj0FLZjoYKxEt7r9JUkLAdD0C3maBaf8Nzbayxxr5Bszb3pdbVohM9rOcg3gj/Kcym21HUgsAqILTWdmudp4WasBkhH5kMpBbzRVFQVvDi4mJnZ2dra+vs7Oz6+vr4+Pj09HQ0Gl1eXo7HY9d1h8MhtZylUkDHcU5OThitWZlGZp+Sgih1imcpUYKRpPmZ57l8hh7QM/DxMEQNM6Cz0hUR/OMHTKyV7ezpJVRIAQFS0IHGAsKZmZmVlZWZmZnl5eXNzc1+v7+0tNRut+/duzc3Nz83NxuGIRU0JklCnFI6IJ/lFshn1Yvad0pUksnsYvWAP/n79tMM60rAlxXox4FDG0ULi0svX73udrpR1Op8+pQlsZvn15gugxuK9YfAvaSUr9yQaJ0cdvkW27a8n9HpMKW4reorTRdiHdE2aFCBSC3KLePFmu9DdR+GH0QtQEQPRhWR0fuKqNUil0vs6Mz3QYC0KPyBd3B4GIRBp9sBrd80Xb2/PjM357huGEVAhHbwy6aTq7U3paKAUAK/Qg/e6MA3aLCxn2MNIPyNm6XprMoItTQl9IlVcuQKFloU+lsYLAhVgDtB1f+D4fDw8PDjh/efPn2C+pDBEJghuD5NJhOSFYDKCly1GMmoDBu3WipXEsoIsYkL1kFBjqTyZ5kRWz8tZUqqrNK+hTclmPo0GJhG9XbX8XyAZEEQdDudfq93b2V5bW11aWlpFlUKwlbkByG1wKKaQxylHUI2Po0Sg7j6Q7iRMpG65JIl5kpy540baKyxb99kAEg/pVXAdBoQFl9+qVIlZVmVOvHFAVjZSGoNT6/S3nc0Gg0Gg729vaOjo48fP37+/HkymVxcXFC2cDAY5HlOXFASCyW0xgOwusPLjvOE9IqiiFGmkl6lz9IzNAbDmxC0EckfYaNzWQlGOT8MCDnQyQ+oYpBkUa+uriDe1++T3gzxSFdXV9fX1x89erS6ukp1ho7jjEajkJZ6mW6qUHOrud8SSiwTQG6RSfs5GcKfZTRUzPG5WD9ZOE6r07l3/36v3293u3Pz860wfP/hg3d6UlzB5YEqWpoWQeCkKXapAl8IoQ28AvUVvYsvK3M6VerQBH/hZSnzo/OA3Jq+FIjWx9TUUj6JhJ2Ct0nPFI6TYbRCpoI9DHBMJvHZ+Tk2zYRSmX4fOzXO9J2iGI9G7XarQNWA2/8kNVeL5YJpynnu7T6E5sFXdptsrDGyBhD+xo3RoOGfKBFmetIsdMJd2TJ09jGZwIM+O07iyXh8fHj08f37v/31b1AokiSqRlzVYafUbaIoYEtRFA4Wpatz0Luq7VkVzMJiOo2SpkI8Xg4F179EOqr5iLg4U7tYOns9jUr0+0IYjSfWp/VaUdTvdRfm55YWl+bm5ntQUN6BFhOtFuQEA+AjqX3JdLIo3zAIUMLcFQDbWXSOdabxdZUZIKGdOk5RY4019iu3W7JGigWqEaFJaCiahc08lAinNjF4+zAkvpKAjZKEhJEuLi5ubm52dnbevXt3eHi4sbFxdnbGtE9ShaFcGfec4BSfxD+MvhjgMQRlUMfosZa/arFn6c3Wp1SDXF2TSU9yi3l6RkrU0IBHoxGl+BiFklw29bGAwF+30+v15+bm1tfXX7x48erVq7W1tcXFRSosJBUcyhBOg2oWg9T2gBXdbPkG/pLoZzhY+Y8zBQVdN8f4JtxllJBxsKmSj6yZEHt6OD/8kOfF9c0NN6iEzDPmCdF52REQy/NayVJ6C/2uqjdQcdzShuE/hHIC1uwimDiq/mqMNI06NDpXq0uhIh7R54k7nUEVDBh8yeF7nscghgQKcHlRzPS7MzP9bq/b7vYWl5ZdDBlUVQNqpldvS5C6ymOWXw3GtHYZqZbfa2TGG/sKawDh77EuhVWzBPewxEihmFftocgTI6MH4l++70+uJ8fHJ1tbm7s72+dnpydnp1fX10mcZFpzHJxiljseNIqFNVcX31epIEoTT8fb9JN+DppkCIwwNie2SmXApun1pcPWoTpJkRVpSTtDWL9kC9YKl9ej7/f6vW6n0+l0u0EYtTvtMAioJVEQQhkBeBw1ySArWo8Gdb/dwrpf0FVJ02eZI8K7QvNMgwYba+zbM4kAZW0SZzYA8Oi0hlktxTJSS0o0J7iDIr2lIEqoBqiheZGA+As0h0iS5Pz8fHt7+xPawcHB9vY2tQocQYEAhPy4zwT1YyAXwORPAnucb6x25eYaQt7N83rOwEkiIqaeVkmVfBx6hsio9IDgIg2MYCEzVxlD0lRMJhPySjc3N9Swnmi0RCuNomhvb49Q8evXr589e/bkyZN+v0+gkS7ZcZwQGjMgwbJcWCgdkDUVtWnAqlpp+dV/dOOBUuZZ7xviBL4vfhCurT8oCgDSR8fHVzc3aZIMRiPQ1UYLOBssqNGl2QCOjI5o1Plj+gDALjd3gE/DQm+KQikHqf6WdD2evgBFVEKyjnTK5k4IZpAmNmH9PyQDYdyYJAxDKixMiZyceFkWgfjqjb+1s9vtdmfnF2ZnZsLAn5mbG4097DflFxg6p7LV6tzSJgAmoURYVV9/KS6KnFlORANdSc1hgwYb+xprAOFv1uoYBfol06FVLpriqVuWEbUmgUdHjTjgDl1fXe3v7uzu7ByfnMQxBJIBDVJfngx77+DxqefeNMRlFcBolrysNi+RJEsfNM0BrUV8qt09as6zI+eWp1FopcLaTTuGVhRCayYIkAYgNhBAJT1rl4HEWK0D0CNXvt3CvTpnynNkAL342VhjjX2joTr5JLMbVFcJrBXkjJalR1XliMpU4R2HIdmVkNzLiyzP0jSN4/jy8nI4HB4dH11fXb9HOz8/39vbG4/Hg8GA4BOF/9Rn0eI4pqOxXighLiJ/WiDWKo1jz1VlvVYZmNZPq9didZ2vqUkrpxD5pJJ2KLsCcBpzPB5PJpPRaLSHtr2z8+bw8PHjx+vr6/1+P47jdrtNJZfEJq3NFt7yjIUeqyDQEH/+TiXkP4l6CuNSiriuG2h05wX+6vr9OJ5cX18mSQxt6zHDXOS5jzWfVLEJYmmynwRfrC5iYf9rMnhM36SACdNA6y6EeUIWGhTBFGrhZMIK0sqzUUohslgoZx5ZtgC3QNloPD4+OQlDv9UKZ3qdTq8bhMFM2HJcN4ljaH9SM3A+L77Ge5u6q+PrVlQl3ZnQ7PDucvcaawytAYS/TZOrk5BNNgDDtBlkEukdCkw4QgXbhDSJJ/F4Mj47Odne3Njb2z05ObnGzQEwJfIsT4E9keeZWiQhojaVNC9WYYsxxZxP4SosWj29T9ceMLt0mlUDh9aO6i5zi/MAlBIOyVKW1feBMwMiM6hcp4gsFORTDm56FJcdlwoVq4oXrhhEfGxaihneKWNuSYJprLHGvh2zhCtQTorlhQ0IMWkxJQlWY3TAOyxlJbIlp+OoSpCKw4fD4enp6eXl5fHx8cbGxuHh4fv37w8ODqh9fBRFw+GQER2VGnJ7esqPsTgNnYXyIVzvx2nA2uo4eSHVzXo11Wa9agEMCyRYp6giAe75IUGpzDrSdY1GI5JRJSbtFYqsJkmyvr7ebrepbR0LkN5utYPkl6qEGjF4lTWSt/dnuoK7I0OWJGeHBbDQ95M07c/OrD96eHV1ESdxXuS7ewcXuH+ArKCODkBhoWgrYtrv8kGptET1LmTEAxMgq0Wr42fas3iDjQbx6IqzI/KzNkoj9qWOzaqtEysucNqa3pkVECLJPG/iOoOhd3B4FGI3y1YboKAfhLPzC/CVIBmC6bfJ9JowFyXhZ+k9QFaSo1UpRrsYp7HGplkDCH/DpvgDmmRQjr2xA0bChm4TL5su1Kwg4OyxiRA59TieHB8dHx4eHOzt7e3unp6d3dzckHfMMggBOhmsScqNic7ufEBBAdK0fJC54a4SHCI3ET61BFtcf9UZsEIinTIzIrv2hVJJjcSoY4eI1aFEKr0PKyThUklGNU3iLIOiAt9zATWPJ+0O8JQ8P3Cgt5BualjJjprRqIazpMdNUWpElKIpGd0hI7itNwXNwt9YY9+W8W5VYjOWF1ZSohgegk1zhtw4IWpF75eLttXV4PYW8yTpSeRJagSPi1h6dXVFfSN2dnaOjo42NzcPDg4+fvxIxFEqKRwOh5T+IlFQ6itIOp/UkULuxWWSzSqHkwOzcoASNN5SkncLOLROZKEp2QJBuiSaEOpbSLlNqI5DJ0jXRVdN9QLUdoLSnuPxeIhGVYVra2tEG6G6Suhs4YGydLUphRxwSV3WgBmFDnhC9JSWGpSLB1/zLSzfC4t7XENCnjJyul8wRZp01J+ZffbyeeEWcZrGSXp9fQ29HAcDDysM4XuoG5DoSEfpxpmzU5EE6aUjaERAWNOASkdUoLjfYNTSMNVfDimt0x8UboVErpH9qTkCU0bVcDwfYr5SeykIQjpXkkJEPEiDJIHwueM4JDDu4HcgCPx+fzZJYRgtB3pgUpjeTunL+Ijus1FSkkMDwiiOiCCg+iDAXFVJ2Fhjd7EGEP7WjHVi+NeKqeiWzmuZB4omP61wDtdlrAIH0cs0SYfD4fXlxfbGxocP7/d296jvMMgu5xngRujJB8UkvB6xyFvVu7B3hn0PVAwCLZ7QoFUGaGMn4/cqMb06QxpVPY+oBgYbfqqBm+oRemoPllx9dUWR4tKfpOlgMBwNRylRp3IQYsXmRDn24XV9H+KR1rlFyyGsBdfIl6XOWP1VsEYNw5f9VmONNfYNWRXeMBIw+Q1uOCGWuGm5wWk8SXl8xWqj1kH4gB7Tg8HN4ObmZm9/7+j46PPnzxsbG4PBYGd75+rq6ubmBuT10ehok8mEjkaKMqWWOeVqN12gXsp9WS9Z2IOeYUlSvnArh1Z7yVVaaW15nvUrpy5ZnEakoNTbOPMpc5tZlsVxfHV1lUGXAQDGpMWKzQVgo0U/VZliGRJL42vhfKB4nugjMsNpEoPW9SqmzM9zCtYBv5xr0u8B8wH3Fo7Tbrfv338QgcyM3+l2gsDf2NgsimI4GpO+aJ4rUQOQzwXlc31bxfddpdFEU0C4PsRw09KDhPBMOEBcEe4B+P7BtkP0QJRcJJUNNKQkMzN0ltJEFfDdSKAuBsUSUM4AhEgncXx1c7OxtY0B77wVBp1OJwyjIIKuFWmaQIyg1oFr528KScwF8nCJLCD05FQRjVacalhDjd3NGkD4mzJRZFwK7MlnaCVRipRltgktq3pJKaewLNDm5IPBzfHh4ebnz+/fv9/Y2oaS8SzD0jgVZkuTlJJnurOFafcz1YGJXrEECCu+21wpLdYWC+RuGcJbI53qIMQJxZmRq6l6jhGhobNSzBj2AZN4OBxeXV8PB8Cq6vT6baTYEl2KWg/Z55TkEAKGFAnWF8gPtJgob/4UfYUzpVb6tLHGGvsVWrUBHT+wWhFw4xm1eApdRIma7kJ3tzJOjNm4RzwUhF9fX5xf7O3vvXv/7uT0ZHNz8/T0dHA9uLy4zPKM0SAdgR9bCIrOxRjPumrOcVkI0JITk1fHR6h9XM1lVROD1SdrE19SktSaMUZoFvYmiCiPQAlD6rtIF7W0tDQzM9Nut6eIwdRYPYVExAskRCwfSnvSnwcEpk3RXXRHWZtHF/5Fy/ewU67rhgE07P346TOEUNPU9WBHYbpoQtRUS4pTmyXOx6l/C5Dd9Bw3p12LQXbV8Ve3GXTriOMKjGyVbcQogLoE/WalIm5SiNO2GOpdOFpqFkXbBxgdzICbptl4PLl0rjbyzHWLbrfbarddz59fXO50uyrvrc5ZOXb5jFJtTqUEzd3GvQPRiirx8WZX0NgXrQGEv0Gr22QoXihTL1RHuzpOCNdI8AGpTRSs1VRJXxTDm5vLi4v9g4P3H97v7O1eXl6enZ/fDIdxQrEuUzcCIqEBwCYVGybaJ9EtxCmsAKQVkb3lMkuA8Es2dc8k1JlLUUlBXqFTqvOqoeL4wa8UpDad+T6s+1dXvU57NBii4sJwZjaGzhtZ6jhuAHsmJ0uBoOX5vpXWo2ClqhQHl+fJVlRMVBFyZ5RKxRfUp5pVv7HGvhmzsAcTBa0HamWgVco0PzVHqD62THZl4MQjLdHEFE2B1zAYDob7B/ufPn3a3NrcP9jf398/PzufjKHB4GQySZMUOR9GQdSCT1ZCr5qgYxJpbTav+lLVC1huovpxfsaagSox1YKU9IC9khS5kflA+pWmsdPpyN4VhACpM8fe3h61YYTOTHH88uVL4ouGYUgNLVrQ0xwORcIqt/B7LbdYJcRW8q7MbPy53kCGJ+74EY5Uop8EyKUFh5xeb+bhw0fxZHx2dnZ+cXF1PQgCL46hVb2LrFrXdZIEWUjMnS4nvTGVpy6RNhp57hWAsjiOXRp83cCQIqQSaHlWZBZywr1S6bwlnKY2HWZnwDsC+hX09vK0KBy/3aIeG0mSwAYgSbIkydI0L5woaoEoeRBEYPiVGI9QdVWRosX3AZta0ZH5TDo6rKLWYsuiY0Y0xBIM/ipg39jv0xpA+Buxso/USlP6Jf6HV5nqJsJDJWULCorjg4sELkwClMhJPLm4ON/f293a2jo8OroZDqGgBKVT4jhBLZlSWydrf6AUEXiF0s6c3dsd3U+ptvpnGLd1ls5MvsxzJQNvuEXj+kzaV6WeFw8Gw/OLq/3WYa/bWVyYn5ub6c3M0JYuSeJWq60vuuRpVODc8TD+iXeQ5NPUUFgphwvINUZFLVYHmDbAX23aEDbW2Ddk1UyUrGoziAWzGjKTJlNqtyMKeiBbzNMp4kmcpMl4PM7zfDAYXFxcbG9vv337dv9wf2d75/Lq8uIcGs2TcCg12WaCKINJbujHY+NivFrQZe1Nb0dutVdUe6X1ZQXlZ25PJFrQmqdUOkR5mbLVIYvlUD0h5VEJMI/HY3ocBAFVVxII5FpE13WJTXrLZXJDJvmV+OL+/meqifwsPRL0zNBZgRCLCzHoqNVeXrnngB9MLi4uLi8vJ5Ox50ELEJSjBWSNAWXEkVQ9YbgwiGoUOII/BSjHy+H2aGaMZshWbr/ZhKj/YSBVo6op469zpFNyg9Zz9H/mY5PWAJSOFAWUkwyHW9u7vV53bm52ZXmlPzOTBEGWQRlgBQ2qSDVkQ6mGRIsIlDQh+PusISBHq0u6o4019iVrAOFvyjTnU/EYAVxxN3PDLC94QVUQUQMNXCOnLhxFASzQBGRSJhfnZ1ubm+/fvTs+PhkMR1g6p0rDswwF5XLQ26QdCB9B9tcq4Sxa4vVOgs42ZQlTnHqJcu9oX+PYDAvT5A3VoirQohLtUfu2DFlDaQLh4evBYP/4JIqi2dnZPjSl7U/GI78XqHI/JRhT43HodmCSEPA50VrwpiCxRp2Wh8hXj6I3CtGb4zbhwMYa+/WYRCNWUksKSMrSNfNh/FOW7FDT0fVLqIDZoSwECjm+NBuNR4PBYDKZXF1d7e3tHR0e/fj2xw8fP0wmk/OL8zzLr6+uVY8+aiGEwIaOxkxRXo25yR7TQa3YYu1qXWmf8HUzecf3WwO43W/w9MqrsBKYtN2XZX48D4QSaX6oPX0OWKBotVqe51HneuKOSjg97VqqcLqa7bEmsEr1/Bq9UJvRWv3S3uk4WKWH6jn4/jQLAkB5MANLK8+eJ7u7e1dXV2maXl7djDGV6jiQIsPeg7gZoWLU+hy4SpYXoJqi9i3kq4lBq/RgdACXr4cisdXRMmtJnMhQVPEd+p2VuWKoScouBVBZ4Zx5loN4KjyBYYI897ERxWQSX13fbG7uzM7M3Ftda3e7C4vLQRjpjQ11FARkKE9kU6/xhy4drGObciBZpxA5GdAUFDY2zRpA+FswWbkhclbUy9gwRY1AlQ5cEWIkChJXEtr5RtBKAUYRNdkr8nw0HB4dHe7u7Ozv72/v7l5cXcUxqKcotTrPz/KsQPlSXpJoL8KjVQMW8eO6/RBfHXdVqPA37lw0qN8uUpRfcmzKnRgoaGZbuxjFYMGLRRYWlE3inuD8PEvTKAi6ve7cwvzc4vLieBxGID4O5BDPL1rY+8hxgTpS3jap5AA6BhLVVhfNUtcks8byQShJT23KeLtgHugwZmONNfbPNa1cb6fsSu8RK7Bse8CvWmm323ERQzjKVlFLQypyHo0ADR4eHp6dn21sbGxvb3/+/Pn45Hg0Gg0HwyRNgFGn28l6LkiJUjM9Wsyr7dFZApQeVPvISz9VhWS30Dgtkwes4uEqxfSrso48BmJyyjfIG0eXxmQW13W5XDCOY5LZpCk6Pj4Gtm0KKHE8Hj9//nx9fZ0LLOkjaZq5rsox1l53re7oLaWVxU+VCRXvKZF4f/IBsfodNiSeB4lQjHh2Z+fmnz97fnN9fTMYTSbxZDIJwhCCqU5AOjEOkG8V54i+GWpsKi6iYB7tTyh1yKV+5PVKewgRDQfEVdgcKKPmZq6HygxNr3tzoHKMW3fBEofQ78uyvMhAUycvCi93kpi05aDrRuj7m5vb//H//M8gbL35Qzg7t1A4XhDCFWOqsLCSxlIIV10OXq4RFzB1hEpRRreewOIgIzvcbAYam2oNIPytGMMD9hl6daSIk5KcIuxBSwOHnAXzwXLJKnpNMnTYYCpJktFwsLuz8+Hjh63tndF4guUBxJyBJTpDvqipfCHTnk+WmjBW5MVOak/zlTEavN3x327V3caXMCEX6dWeUvI2jZie78FOCEogkvR6OPTPzoJWqw82s7iwEEatonBana4L85m6bsBreM1oHYiwIhWUtMLgF7iZyOxFIErujXKCwDOVexqzAWo8QGON/bNN76rVjlFmlngh4uQb6VJUlkG1hMrE4BeZotxrnsrbkiQZj8aTeHJ1eXVxAcoxnz59Ojs7e//+/dHR0fn5+XA0BHyCgS3mhQKGTGLGgdYaLkGsXOTlFVUBoXxQ5Y5+DW65bc6tN08rh6vNwllOsNZlVFmmnDlU3TvSFPqwoxFOJli+trbWQyMASeBTpyLrr1SWYNyerDOxQrwjNXWAd1IfFd5EqNCVTnEHF0xlbjgMKN0jVu3c3MLL16/zPINKE5yRm8HQ99w4Sbw0BZppDuRRgEecoYMTKg4MU5m0eou1WxB8KPws7SDoKFI2r/oNsVTWybGq0+tn9OxobW97xjRO1llLyBIj25N4s2me5XF+cX2zd3DU63aXl5dXVpb7/ZkgjMbjSTuKcPg1kFU2xiQzv2q+kIoBw4zTF6DUoKIpI2zsdvP/r//r//rCWxr7Foy1pwzFXBUTqhWQnjG1awYecc+Cmr0FtX4gFW1sQpheXFxsbm7853/+rx9+eLu3fzCJJ0mSoqYK9lGGOLSCddKD4jpr58HY+VE3izxDxRr8bHUkU7c+d9s6VMPqNjgsPyPepNNzYl9TU1ouQpgKeLtuhhcCkWPX7bbBPA86L0EpSRDSYT3Pr6tDUHfGo0oAE8Isc8nE/a6yy35yhLixxhr7O1ptyVxVSpS5o1xiLVdCULJHzGABwml/1Hw0siRJJpPJaDi6vLw8OT75/Pnz3t7e23dv371/9+HDh82tTeyofgW5Lx8IotyLgj4OD1QfIKWpZdUuTovWWQ+qGdHb7XYiZa1TkPM8Lb8qUV81zyaLM2tTmvIqrGMyBmaOBu3aqVMFYXIWoQlQVoQrx9AXTEX4tfB76rzpZJFwTOY4nO6r/az41ukHdbTeW7571rB5PgH34hOe74OaShT5njeJxzGUskKrepLppr67jgNVGLpfIDUO1l824S7FF8xcaMmlahlS/UkdjKZwOeqLmq8COG6uM6ybVnFR+mbR9kC+pZTPZGete1Egn9bz86II/MBzi26nPTM71+l0PNcLAh8aU3k+pifrtyt831V8X9Nl5f1ARMpf/lKsv9kDNDbNGkD4zVvVxRruqIQoemnQ66VaGjkqpigXYq1ACmiKKK9IsyyJ49OTk+OTo63Njf/P//v/u7m5dX5+MQYyDLYeJFCnIt+6TzyOTTVwF8kwGWMmZgWgQeV4yozNisa6eBUffGl7cfu2SbzPuAoerYB8uis9RcHxvcYFofpZXhCPCJ6ANozQdRCadFEByXg8iYKg025HrcgPAtcDmpAOJKs7WI5N4pjErVVIVPXjMP/Y9115O9Mt44sUrMYaa+yXMwszSBDIqUKLHFGFHBYanFZAyGVsXMlGVM+iKAaDwfHR8e7O7ubG5sbGxtt3b99/eH94cLi7uzsYDMYj0D6BjNZoTL3mifqI0bqMeqNiiQEOGPmNnLWw8B5zKfknP7h9oqyMTe3CVc1PWkeoZvasiZK7eZ5GmYRhNEhIWFI0+SroGf44XyAz/Zg3S0egTCCpuSKDFArOESMBi1J/Flimlrpp9bskIwW3h/kMCMQ3mQ6Bt6ICK5taS2k2zrwEPG45oJJeY5XaHFQGAtcphsPBaDQcTyZxPInjOM9VeWqGJFti3OgYM/XoLat+lsLHJspsNjrWtsEap+Z4mj8uSjDqnsNIWlX/k9OqALyOp+tXAOth6AY3JkYvDxoShiE2pmeBApBUTV3fX5iZnen32q12FEX0FwJUI25NXIGFnBXk/RsrzvHOQV29+VftwqgB47Q71djv3BrK6LdtFoHEyh3pFvWmkIx9H9HjeUEpNV5Qh8b4mQoPwyoex5PxeLS/t/v+3butnZ1zaEulVncqVqR3K0fIyyHzVxXbXvo5ijbjaq+5GGWEY4KU0+LK1rN8GdPc2PSprKqFKQEeHmn5RCT5ol/XwmKeB0/jRipHrZ30CO/FeDymfRP0m0DHDwxSByLHsIdQvYNKx1fj1vfRg90Yv6bURasJUnI5hlRTbuLcYMLGGvvnJgatTTYVpFWTaRaAuWNikI/JKpeUlRoNR+fn57s7u/v70FVie3f75OTk9PR0MsZdOLIzuJke9EvIFfdf9djh/oGC6EEk2GkRSevx3RODfDqZpqserYbPUgalFiVVDrsWZFo3i2AJ3x1Z6M7PyEyp5YK5KyN9MEkSx3HOz89JgxQKNYcg5wNdiLKlubn5IHBGo3EUhfJ2WxdojdlKQtZMvimqMyjZuZsvKFN4BA4pz3gVo047Ho0FkmSQIPSdMOr3vdW19e++G+bUN6LIx2CTwPczx8m0yBztTyjEqRBeZTBitLzjIBiHAxOjrcYdOCesqjD0O2q/saDdBq5Y/RXq3ZY6OVR1qKulrY/ZZUHCE7YHSqAoz3P6Guzu7v3w9u3a2urC4lK3P+P6oevmaZqEME/1aFCwBrAXhVXDogtI9GZA7bXMvqHZAjQ2xRpA+C1b7YIlIaJkiqJpUMbUC4vjYA7CD5R29gj2E3t7u29/fPu3v/14dXWTF04YRXEcq5VHR7hBUUarjJohqbOLiK/gssp8ZumhGMxdWyGJBKNymT8pHqaBmPk0e8ZSJYZhpEB9H/zHlwxHALLoaDw6OjlRKj7gDMEnzi0tdXtOq91WOxiQli6l9apDodp5OBfgZ+PgmQBjaEKsFsu6MnUX+BOmpbHGGvtaqwbsvkikrLIcazFh7bn4AW06JzEwRU9PTnd3dt++fXt4dLi1tXV6dnp9fT3BCnAsAleMfQMmkfNgxkOuAxvjqLibWtjVSL6KCFodsEzr8QFpAy1f4omqVeasRd23Fw1Om3xLBe2LSTM2OYf8BgaEWncUek7EcUwkkclk4nn+3Nys63pWdKD2LlcTp5wArJ1Y5RToSSojEW+iA02/P/y5qWWKd/EkmAsF1EqJKr/wEydxnKLX663fX8eKesigjuELmU0mkyRxia2sbwdfC37ljO+lW0OvaiKlikIrhXWd0a1hE+lUG20T9IHKXwnNE1IsbkRppqWK0pNRI8A4rHUSVT9ZyGpeUB8tcrz72eXV9efN7aefPy8sLXW6/Zl51+t2iyJAXQaVbbRmko8svwB4kThX2vmXQtiimrBBhI1Ns4Yy+g1beeHhRVKs8vjHr7gCSjSLonTmU0TXLzElSfoZ2B2KBhOPx1eXF/v7e+/evv3hhx+3trZPoT/VaDyeMKsxSRPaQBAapENzAA1P4wbUjb1EZ1Drcdln/USrsuTvyhfF+UOGf4mIhdIu0tPrI/N7OAUqNh/o1HVfXnVV7ng8ggTr4CaGns5Bq9UK2y0f+EVQKQGZVQiIkuh2ebdXOoUB0vwO6RWYEsMBTObM8FXIjUsDCxtr7Je2KvyTQEW04bGXL0rHWVCQkwzVHBfxNTiKR70lbm5uDg4ONj8DTXR3d/f9h/cHBwfXV9dnp2fX19eDwaCAigDoJ8Roh5RRlApOmdyhq5qxqze1xKlk5H5CVrCauKvFzNUnmWrLajfVNrbVI/AaWIXotfhz2mppJTO5Yb0FRBUHUrNp4nhCKq802iDw0zQjCi45Dd/3Kb9bm8/kcZpAQ90IjRdj/MzYz2JR3pYwpP5VZhotgG0d+fYkoeqDhcCFpQZcD7DiZDS8hMaEF2OQwB1hFQoqynjcktfcYn0844dxu6FugQ/1d+DKRc6QP2GPSFcWmj+nCuDXeUBV/oibBGRecqWh/ororxkn7fCnJkDprhK4KYNCkjyPQW8GuUV53u115+fme70uKAwE2IEDD4NAuv4LwOwrolrJu6PYr+UlxdoaTb9Tjf1OrckQ/haMFkxFCJD5KwNfTBRTrwV2jpBNRZuwdjBN0jiByoeLi/O9nZ0PHz5sbW9fXl/Deo3rtHJxFA3VgA6hiMCnggDJQyZShn6d4OpP2UZYZhcMiPN94c0M9kS8r6QgJno5qpQc8TOsxk34VpgeWMahMy/GAtPccc6vb5z9w8z1IYcHDScCCBVHaafTcQs3Qe4o6ItZ4Wc9UM+lnvU+FR2WMg8U/RTOTzpvm1M0JbfcWGON/V2sStK2ir4k0jAvCX1Cs9nFpVGxx+6QHlSlgzkwReM4vr6+Pjo8+vzp8/b29sdPH3f3do+Ojm5ubkgAk3rNU9N5ietMaVyRc+mglqXGH9z5zf1KBoc2C/jdckUs2lmbXLUeV1vnVROY1to4DT1OG/a09CCf3YJwPHhqukC5QQKHnucN0RAcFmtraysrK47jj8fjKIok+K+dvWnMSUtTlBd85SamS9HUXjEdQ1IQGTixy6NHt4jclKYLvza+jz3ro6jIu4tLK89fvprAVgNmZjQaOyNMJ+YeEI4o0AwJM2waISekLunFsQIlQlByi+WIs4ry6t+mXD89r5y+9Qnzmi49tBoYYjNGyHCKIeJXAuK/WZbHaXY9GG5v7y4tvl1ZWVlcWur1Z5IkoWJUFhyqTmNdG4nq18+M1kxBAwUbm2INIPy2TS0Kqvu8eIb+8HmpooWDdxIEv6Z0JNAorUDFr3g8Hl1enG18/vzXv/11d3f36voawSBhRhCb0eQM/BjTLsRGgZ2HKMevNuCCNxJJRzqzuzcalLTY2o9UTyc6HAp1Zu3feC4MACyHJ8UbyB3oj9G2DBAhxtE9Ly3SwPfHcXJyeem42KwXOlXBX9/s3LzruN1ez3QKqluvoYBQi/7k6GFY0c5sArTPql4vO2+rs1lTVdhYY39fm4YlOJFVrfq2HkiYUWu3nbRQaHA0Gl1fX+/v7X/+9Pnt27cnpyfbO9tn55AVJPoiNBjMIYXIuimKJFk4rl9OIyjkp45vbZxvwYFVMHZLgkJuZC3MVkWDtQOwDm4QSyXrKBFm9R7VnkiWC8oxW1kXWUwoCCMG1/GiTZo9WDUHfSmIVhqG4fLysu9Ds8c74qta0Fsasya3cHD2611AKcmmMnZ8FjF1essx9YCkIMpUTaqfd5xicene8+eTJImLPL+4us7ziyxNcox9khyri+IyWa7L8nSjBf466ssvskwJ2OiMa337KAMUKTit+jWY71LpewUHUg0HoTqGnDh9WAPFyuyXbxPTXKFrceaBCHnm+l4Greonl1dXHz99XlhcvLe61un1ZrAjJYqI4tlMIWL1vshwjAr960suj4i+CcistSqJGmuMrKGMftsm6EbUw5wgDsMUjhgh2YEfa5po7XpAsnRUUlIU+fDm5sOHD+/evt3Y2Nj4vHFyenZzc5NmwICHVvXaq1CDdeJUsG/Xw1Cce1acA7kColbo2kPhv+1Q3bQ9kI6fEx3ViMVNM7Fiu7XH0UI6Mlau/InkKkmqK/2jq79LLoRgL5BC6QhZ5jrQiQlUHCbx8GYYY2De9/woAoqI70HbpQwqTFTLY3vbVAr6lTifXAvBI5RXaIfMxd6rcQmNNfZLGP+JSZ6bBV1klZp8ic1iik77g02gh7ciJaLmM2ydr6+ud7Z3/vbXv717925nd2djc+Po6Ig4ouPxeDQa0SKTZihqJUCCVDQBgqiqkrLTm1Lt8Iu0DgmlquD2i5nPL3I9rDffZTBfHKd1syzgRw+olbzEe3whlgINd4mghpB0v0BBZTIZjUZZBtKj1Ms+DMMoCjWbNJAc1FuSRVZ9Y2moGqZavkDk2W5zBNULt77P6qvigdS2/kLQ8/XIkA+iiI4wQvy+gaxMNhwObgaj65sBapur8j9CUlmmkn5qI1H+Hoost9oKidko3Tf7y8FhD3FR9Lz6VzxmcqZ6pH5Vong1321sM08bFHp/XhS+59OwkNut9JxcL2hF4fxsv9Pre0EYtdtAF4J9VX19R/XbKGPiumJSNR4rfWrKF6mxxpoM4Tdp1aBgSVOEoJ7WLJYEUcETnX5wQkUYl0L+xvDk+OjgYP/45ORqMJzEMSUPKbYsvJE5AI+EC7lV7A5rEqssHRGkmzYiFaRj09dTw6i5A3OJ50kyLhUctfYB6lkxbbVYa5qhhABUBzqoLAr674FzdXPtHO07P7qQgB2OUgzYO07R6fZoexdFEd1jeSh2S6r3kOg4TB6SijaVAxS42so81D7TWGON/d1NhrqqG3eZwpL1vdPw0i3Hh6UYZQyhk1uaDAfDg4ODj2ifPn86OT05OzsbDocKXeAqR5RRKCAsVBt664zW+NVCx5lItbCbXJFcT2pxS+1Ld1l/rOzc7UvuF9f/L+ZGrJTmtJFbEF2yf6sglu4RZSZ1syXwnmmaDofD/f2D0QhShVmWtVqtKIoWFhZc1x2Px61WS5F4BSyxrArYaoahr8q0tJWA586mGioIEilTlMTw3C8eWEmtuI5P0DcM5xcW8zwdj8enp+dXl1dJApq3k0kMk5ZB9wf4iCiX0FdX+pKKmDIHbPn2lfw73xwjC6dYVmorZSZcKXqr7zowWLNcqb2UQ6/aHbPajT6rOqzamEF/Rbx8LwionDJN0/OLi53dvZ2dnQePHi8uLdFXJU3iKIRd+hdjJZLxxBdiZoGvtpEcb2y6NYDwG7YK3Yi5jrYMNC2J04kH5oB6QXQLKCR0x6PR6cnJ0dHR8enpxeVVCq2BqLmqir8ZbW7EKWo8uO4pka9SjguPXK5w4FNPH1VVQU1dFP1TpdGzl/rS/HHOTFJpat871buRT7J7dugDIXcURwNx9yJNMy/w4yy9uLqCisEcosWTyTjPs4fJ45XV1V6v51MgecoJ5T01dznPQbmMqzCFwhB9I7SfqLm8Bhk21tjfxaYVCsq1pvoSmyj0ttsMTv3bFIAMOIcp1A0OBoOjo6P3797/13/91/7+/vHx8fXNNTZExXwLrctFga1fidQOBeOydLBKwiRGeqkbmx6zKX3UZnEdrRVG0imnTeMtc/sPMwsbW9jPyptVvC2Ac4mrmTvKn6UaQmpYf3Nzgx0K016v12q1ArS5ubnSl+pWgHV7aFJRh2QRgeU17zC94j6WwF6VY/vFAYuZ8UgLiQos+zNza/cfPHr86Oz8PI7j0/NL6oHsOCn1U0jTAvo6VY7LsQpTu2KUYugPihRHC6y3MKwkDaV0yKZ+uDLijqTRwvFyCM0KlF5JMHJAVp8IIaOuQ9RsKZ/YQG4wiZOz88ud3f1Hu7vQgqLXhwCxQbC33X9WIjejpO2gddv110CGBm4JNDT2e7MGEP4Wos4yDuW6XtVDM7/81nWfKrYhZgmxzAzIG+dnZ4cH+/t7e2enp1eXl9BRF4PQvNxmquxPHUJtesQKCLQHlP1Sjfvy3KE4n35VqKPecsnTXjGdAMtPk9qLTW6ZbjIyaE5qLfWyq5OaTU41Yl5UFcpztSRCc5J58JH8U3jueDgGjlaUHx8fDweD66ur8WQC7NuiiFpgQRCQAF2r1YLUIh7WBDnLYXLR1x4ZubjZoxilIuPgno3rEGRglS+n8Q2NNfbz7ZYkXknko5IbVB8X6s/Wq7UkCErxMcOcqgFHo9HR0dHbH9/+8MMPOzs7Gxsbl5eXBBRpYfc9H6oHgeCByzjKhzEK5S01j5akRDVFzn5VXns1jTkN2t0xyzftPV8lYFPL//xislG+rVrLZ8F1HrOVfiGTgj3AECmKMAzJQVCHekjqJkm73c7z7NOnT1EYdbtdUBrzvF63l6EANbJMlC/glvfTpsWkoPWwpmRlFcnxqybTCnOwtAn6Q9g/MP40Pmb60WB+QHbbc90wz4uo1e71+4sL/3/2/vNPbiNJG0Xhy1d7wyYpirIzszt798O5/9/7j72f7znv7tkZjQxFz262d2W6HGzdX2RkRgYSQHWToiRSqtRMswwKSCSAzHginnhiZaXbbrY6g8HQ9/25ZU0nsCAqTpBKdhVdkPJ2tM8cEYquAjKJ0AABgTaMk7M4mjwd9k+uFfhLFCWVgBM34jF0JvDHbgzVS3QRWLaPFlSUpHUXMOHL1wf39/a+/OprqE5l267nQlUS28k8FCXS1TVKR5RIsnSViMVLBg0on6s7kxiky7ZsS0D4CTceGCzRFmUIjVFGF0eBcMISvmOwFtI4DMejm0G/1+v3xpNJHEtmEZahx+aiVwqnFTUdSlwhKiioOVoYPILoiLWWEMcQneUuXCCjMZdYyZlg2O+21W6x141GRY9PbgzVKx2rBDEx1YHcrgBmg44M/N8FMZ4ktTx7GobXw8HLV6+SBPIJG41GXVQmRBMkSRLf93n+Sb57ZCkyawcLXaC+NdXxYJwuNiBqhRLXjwg3FQh72ZZt2cpbKQvLCAYayjHGxkYYiheWWDBjSxYi5GNncRSHUTgZTy4vLt+8fvNCtKPjo9FoFMVQd55gSRiFpG2jZxWt1KGCfqiUX1EEyPBJGQE06p6xzWKIaLwuTSt41yBhKYHzVjYEB+FF1HeXwxnX1OCgEncUwTyFCmez2dnZmed5tRpgwlqtZltWq912HSeKIlwL7ni+xUisMXpKXsRYFG5vVRujU9L46NbrJd2W4q7zfd+27e7K6v2Hjy4uLvrD8XR8Eyd9sQ56gmUJrlVhfUB5JsSfhMxUXgddcVyHjYcIHaM5H7oZKtW4jeo7SbyXC/qJjTMR4lRyCaZ32+Dk5t6KM8+A6W1lIpkwSdPpbHbV6+0fvD09PXn4+ee1eiOKYig7YUvt8QVoUAFwnc+YOyt8rvNpI8XHc9n+5G0JCD/JVhEVwweexLW06+euzzvOJ2BggMN5Np0Metfn5+fj8RTJouRqysSSBmuJoGIwbKE7xpkTlKYnJ6A8ZjJ48HdoOc8eW+povp4XSU3v06j+ll4htJUg10WeKqBLVejf4D+yTrH4DSz/1tzx3CRNx9Op27tOkng+n7c7HT8I9u7f73S7jUbDEZV8FzD+dTY/KpoKoq6jqC9UxUP+UxxZNAqwZCJFkJck0mVbtju3IoAxUN+tn3DscUemqH6W51aSQXxpMpncDG8uLi7evHnz5MmTg/0DKDY4upmFsyROYEIHxSooTpgkSangcD43Wu6cCm1TeLBqIiqiQY6EzW4XzuWOVI538hjy7r3rxkW+aCn6XRzDNGBz6c2AnyMgDMNwNBqdnJwEvt/pdn3fR6zod7vIPbnLiVQxco0YdfGHd8fb/BClFGgiIxm3VXE/qs6eZ7lzR+Q9NJqtza3tzz7/fDyZReFsbjnXvf4IDgGirOJXUCRZYCix5IKYjdhb2RG4jChRd/O3XO6kc2iQdkL/5r8SXKB55li2Sg297VyxM/rXYBWIYYQqxGkaQYuPjk+ev3h578FD1wta7Y7nBo5tuVwyoKLJ2KBG2fIiEO5l84YUmKju8LL9GdsSEH6SjUeFePxHTdZiG71yabmC8t2JX4oqxsncAmHMNEmjcDYcDAfD4Wg0vry67PUH49kMSqhjlXlGVSp6m3ToUu0eRZt1TneF6/nOyz1HxKbCsrnrwjz+Po12giOJCT+C4oUwVwZF1Wm4HqzfchzUDgBF21YNig6n87kzm0xd1/V8/zIKJ7NpGMceWAAg3/rZo0fIC8ILJ9hEki9UpUWuhl2+QDcqZZPSGTBbBOK30CtYzATTWG7GTJ9lzaJlW7bbGg/9kaYoN5E5ddBAehxy8Ed7ASDEEnbyMZ8DUzQKo+FgeHBwADrQouTg8+fPL68up7MpMhKzNHOEwH2SJCBlOc8gb1BZsTCP5RcRwn70IZH0bseoolFA8i4DeBcS6fu1W0HOHYNjxjZF09xAv5p/Kz6RAioMPuH4NBoN/DlSSVF1DIWma/U6bud5nuM47XbbiO2QumnVSRn3IXdiFtHsu0Zf8/TUHGmT4n6w4oh1iHiJFV5s4EZmkOAHodP5HDIJHz16PJ1MBv3+cDCYheF4PLYsy/e8JE3mc83Cheg4pMLqa2RGdLN5KqKCiAkZfVcVKVTcJpFZYVoOmudJqyF5tHH/KpIOjvGyWGP+XFnHxLYwcEkyd910ntlp4mbucDjotZqvX71eWV11Xe/xF18JgVLH9X07yVKo3+iVcoax5D0/CA45Xh2mL8GuTsFncdfLv2x/0LYsO/HHaQUjA+sxSL7oAgKSnE9xPhYiyHEEZNHzM9Cpe/b8xeHR8Q1kvcfgY4atoNAPpkQT4EFcpCv6yZI96iu2CuqFMd/5ypTu6pMtEmHfNRhYZXgxT7BYF/LMUeLh0qphkL402YQ+kZI+tl6Rcj+B8ZxMJnEECQO1Wq1eq9tAL4XsQSKRlia05M3K3JoooSvdAblTU5Fa/Xnu3AlDLteJZVu2YjNCfMVcwVKok7O8bVHXgTFFaZamwg+VNFExXSPPsN/rHxwcPP356auXr168BKboxeXFZDLBCgdU7EdKjOLELMCkqlwqQaDR4dKp+i4kQJrnF8QGS/mlv167C441YrPFtMMFzQD/xomb0bO8Lc7lfHAbrEmIufpBrdZoNIIgoOogiAeq7hB+FGNVqiL33hqRLj1jeoE1n4zdcdS0ABCW9twPanXIpg9c18myNA5ns1mUAFiEdEraCdoqMm2eJXQUryDej2R9kOtZPWhY9MLQMVeZL2y4cmdUPhq5D40KUMRjkhoweBsIjo/IJpEmRQzegcz3vU6nvbq62m63XddFV4647pVOYSkYoA5BvcAOcv2nvPlE57pc6P/sbQkIP8lWlYiCL8R8kUMphbfm7nARQkQ4n1s3w+HZycmLFy9/+vnnlyBLMAzDUEhiRty2kDTFnEuqemVROc4lcyfVSHyXTIYitlEHuuM+zP0Udpv7Ti85tCXNp7TcEv5WYEsbCsTDEnmG0ssrMDD8nQP3JIqiyXQSR5FjOYHngyfQdwMhM4M7WVCLjPcUlxb1CbpDladTd8aAgTqIyDWCNJt02ZZt2VSrirQUEwVLWYK0Mbl7VKyuRK3EOCjOvThdTKfTXq93dHz085Off/zpx5PTk9PT0+HNcDweo95MFEVzLgedV4jJmYaq2CA/VhWe0V8VXHA8JGXszWhG+Y1fu919EqvCS1XNIMiUIq5b+4BRRPAAOg4il0hIziAm9H0fy1GgGucCl4HR7bxVkO/Dgq9ua0RFUfdz3mtQ2B1uU1r5mPpJ5+U6rm07nuf5nlfzPWuejkfTWEgi0SNHBYPlDsQpALBSWXYKfMlYN0YIiSaKq7YIsgLtBqOE8lZWS7UESrScK4bpuy6Hhc0xasdDyngGMJ6CJ5wlKaR+1AKv1Wo24f9NIBMJ7zD5iCsvisSZmDfEjC7pojf9O5Q8vFzol21JGf0km8oSXOyi5vZHpVIIwjtLlBwEbv7cmo5v+tfXZ2fn+/tvjg6PLq+ub6CWMeiLZkjSQPNCho9wltX+QiFoKdky2mhQXH7j6DJQRudwx+z2/Knkzu3d0WDFEXIxN1nZhycdGEYPBeOwGKCkyYIyGBoLgo4r52yRTwhfAT8my2azmQM8Un82C+M4CcMoSdIwCsM4+sKxg6DmOG4qMn/qtRqufMosKPG6Kg6P0h0VNBhdQlf1GCVngDKqVkDGJNHFsujFcrVYtmWjVsW+K1JGC0T6yuQuZCNUPWiIA0GTCwpGCNpoko5uRqenp0+fPn3+4vnZ2dnBwcHV9VU4C9MshRBTmvge5KGJSR7FiDHdWEalSsmQWiS5DKotjn8u4H9W5a39NmhwAaY1Pi89nVJCbyk3mDbmwHgBHsahxgL0juPMZjM3jhPfj6MonM2iOKabLAgC3/c9z4P1wnGCIMAuLUAIxdsvd+IVN+RdGv0KI3amsxfhH6vVriSsK/eGy5Ztww4FI9qq1Robm9uhKIO8sX7SGwyn06lQ6pYN42ZQzV6ucwJwqlVRp3Hkw3QyDQISX7DhsUXtFbRpdHgwR5aREnZEGS24rxcMY34ZFZhQrbnIs3JduOyu644n08D3x+Px64O39WZzdW2t3Wp5rttdWRM1MwC7glGhosrGgRRI5tYXV3PIzUi857d6PZbtz9CWgPCTbGoez31YfJ7zD3nF0y6hCxgBIH8dxVEUX19d7r95/fzFi8OT4/EUyhmr+UWBS/KooRtNSdIxFyBMuEKPdA51CfFQ1Wckl9i7nj+dDXapcGoaES/cTVmKHPEoDM/uolVT/kQHBvmv8BMQVhU1OAiux3FMKxIWY3JdN0ri4ejm6fNncBni2HFtL/DXrHXP8y1rHsWxHwRosXmeW4oG2b8wOMLvqFCiTBuUyYU0kORoxbUC45bvbSss27L9gVtVtpVhbZea4IaThQf8FwQGybzDwCAkDYrJYTqZ9vv987Pzw8PD4+Pji4uL0RiI/XPQ4ocZ25pDYQPkdIjisSSStegoxuksGId3Gbbyn3/A6WUBPZV/fvf6h3ShpTp/gaVZuivjCvKswqo7h2oSktIP5ojOwrDf7+/v7zsOhMta7TZqUCN1kOocLk7/K/VcyOwM+uG7cHNocxbxRoQjqYmaaqIKMslV+pYqFEg9hd9Bmmvm+UHQXVmz5lkYzi4uLq97vdFoBIHTGKqtwEXBsCrsFnJiefk9xe+RFgqWiVc0UbksKkAI2ucyfslthkI5BjgcxtFz41DiaCidJfK3ihxxshCyDG8AyKjMQAo4uhnevHz1utmob25srKyuNVttGwKnIFcuy1CVRKFzlTT4iJvzT+E6LH2+y7akjH5KzVjPbhUxV1NGztIoPvBUYAcKVcXxbDa9ODv9/rvv/ud//uft8XFvMEzSNA6jJAVlAq4iowAFMyMUB4kYoASQqomk6if5ztzaSkmeKhuSNrrrfoodA+ZJgRvCqaTEwcUv6HNeKjBn6hG3VG2DSxp2Fn29jtgqm4O0wHgyicKZ73uiMqGPDdgtqAADS0Ll9F283Dq6ie+Vl1MvoMVt8jtcLhjLtmzYDD9REUiUajCyoIrOBzb4cqWYUOdgi/9ms1kYhrPp7Orq6u3B22fPnh0eHZ6cnPT7/ckEnHdUojBNIU7ID0pxSMaAUHCFpXyzUE/5CNyKG3/jiWLB+nLH3y6Y34oBwNKd0LXDy2og3io9Ie7A40dBDogolwfc0TTLaiKZEPIIXJdSCm9NJix2W94JDA2Kdcfsxl3GDXmYshYCpxyrPFVabyh2V32I3P2v/CaOYEp6k9HNdDKeTKeQR6jEC+TwItEaUwu17cHsD3ZAWrRhz4Kaiq5RKmRhbMnwle4k3yM3sQwXvHGh8yebu6PQkkKHLJBChe/Gg5hhHIXx6kqn0+k0W21fhYiFc6ekElXpSq2nHVvo3hD7iZ3gkjK6bNiWgPDTbuY0JF/ADKBUxfXsUOqywoLFiSqFNBoOf/rxX//613fPX7x4e3R8fd2/ubmx5nOoSwicUcE+UjNy3uCRc5xIegYPFhKU+FTKgmeFs1AOrrsAwvyJ0K9RKYxP//o0S71iHOAZPdMzphaHUUfAyZsvw1TYKG9e0HokFX7EJ1zmLBMAmwpMwQBDDAAigXEcj8ZjYc9ltXq93qjXghrQTYVsIFKMEJzTYlQ8Ox0FVHFgUStRvFB5hvKsDFjIbKDiUrdsy/bnbMXoXxXD0AAS5JvHabkUB5Y+YnKyFQKJ2CzbmkwmFxcXR4dHb9++PTw8fP78+enZ6c3NzWQ6CcMwiiIKNOX2JaY0DBXiWy4kQ/0n7x7GVfLnn8tBqmJCftjQH9/t+337C49YTBGs2tLAM0VO6YLbCZdUUo5BSJ9lGawFoiIF5hMiLETnICaIcjnTBS5C3gmSCiPPJp3GXarQ8vuFr590b5BUNcEPJWeinJFV/ZRdFcKY6DGBqBx4SOM47vUH0wnc4SIGDmFb5Z4WAjOYGKt5nyXDTnCRsUXhY+FpyW1PaFIHBfVqn8P/zPLKwaoiubqqUcoGXk2UyUkh9QaOFMdJo15bWemura4BIBQq5Zi5g8VI2KXLXyZWLxpF0RUQ1J0k26kUyi7bn60tAeEn2IjgVwwM5l2VxcJWhd2giDmka8+zLJxNLy/O/uv/+b+/+9f3b4+OJtNZGEVSxgtLWakCx1jVAP1zcjZSJBKBlHI5hBW0dT7DaiB7RzsidzpSI4WiYTnrSq/rvDhhbvrTqJDvk3nRDCaJab3lg28mkddIQ9dzNEJEpqyQ27H4fDKZzGazuTUHPYEgcGzHF6kjyGIiE7PURqH+qXiAtAfpvFTSPKtnSwZB1ZKwXCuW7U/fqiwnepCrytBTI7oaM0zLo0+kB5PKMmWgO9W77h0fHx+8PXjx/MXrN6+Pjo+GN0OMB0rUKLIMyWGET7ehHkEz2a1pgbd+tWCIPki7NTRndPLXO66B7hYczrgZjH0a+zfiOTSx0zaoKDsHoZGg3W43Gg2pVKlup6pVvvRceA/IpUoVle4wLLkTMaql540T6QZVrlXpll10HHWfwX5l85qNhsgYhHqb4/EkimOsk5QKlk3hBOkF4VX4xAjI0zAIHyzYNLlzzEss6Y+Nocgfnc4gd2MsDo2SBCteSpoipNPZEiml7trq6s7ubrPZktoQon6j60qFIXWYPKjLXXG5a8PJW6oqtFzk/7RtCQg/9pbDVIqlbzCRDEbKHV0+CCpExWKUF03Oz05+/unH//v/+T8vX7+5GU2iCJSvYaoEiwTMjEQnE1a6xqWIMxKcWBjR6AN3ab0HIEQYg65HBblUCE+tkXnl0ZzDsrgwa7NJ0VtoJtXhM9peZaJLOJe/UnzEK9dp5lfko6TiunhNsyiCJTCMQnhWRdw18IN6vS7SSAS9RCkKVFlL+IK018rYQfLEi7hdR0Blf3KlKd61dNWyLdsfoxVDAVUEUeNFaatCmDn2xXw+C2ckK7q/v//z05+x8OD5xXm/109iCB9FkVaBNqxSMsRxYixNI6ya243+VI3Ggk9+YauCOr/B/FOMExrjUFjXSgKDVYCw+An+AJG8ZAaKGR4/SeLYsiwoSlSvex6yR13JIVzMHVVzN8SguMFAEz7LLbzDmPKblrukdTkHtp0+SbZMV4UINb4lZ4njuqCwWgtEuCwKwyiO4kwEURORh08+zNwTxdzjpZeJqDDIymF0KjUkaui08cDOh1+v/EjniFHSX236pnUQ03Drc71Z8gggYXh7a6vd6fh+gJkjnuuRT9kYQ8kHlhrwOdSXK6BVGJPFFuOy/eHbEhB+Ug1ru7NVp/SRLjqDczsRPwSoF8dIPYDirkl6cXXx+tWL7/75j//f//1fF5fXkwn44YTUM9TJBcAostiNHjGehu6AmmeTxfCOUy9oTXpXBy8lxOTc3rK2kNC7wYGitaGs/Eber6Z2y4eugPVoYsVSSFjkSL7no4HZ6/npXl4mZlugGRcEAX4FIF3sVRBE09F4DKGBcIYAHtIIfG8+t9I0cV3BHVXcMFlhwlwgzLxTdSsp/Ve5sivSkdyYBTsLhRaXKYXL9ids/MktVk0ofS6KUJCAGX+gjEmJdguUfpG/7TjOZDq5urraf7P/8uVLqEH/GmKDvV5vNB7NoFYbiE8Sn5+0ZIyj5FKPFAW0Cu3wdquzrmpS/ZUAYdHv+cF5qtzzxV1gxPAsLrI4hpTkZpwCD8XwK6L9uQINpmkq8wiE3gyiwSiKqPKk53mQRqDqEyJ3lPpWMvisnwyg5XicErcwsuut8UYSL6GoHsc/OZU18mvjzxWkKtc3wucLh0KMhm1Zrgf5c9PZNJxNp9PZdDKOwsiy7SQFV4hIApTXhRbh/I2fG3PD21Jy59Bgqu8xI5JZGqqnbD/y6HSOdEL5mwSfSQ59qduQQIgYWx1oPs8cx63Vg2aj1mq26o2m63lJmrieC+KowCHPPR38uAyZq21U8QluIvIYZumztmx/krYEhB9pM3JRaKbXU77aLjfPsaRp8o+ZexZ/kSeaZamAfGkYTo8PD3784V/f/eOfB8cnk+l0Ps+SOJFl6AVhKUlSbQyx3XEflToizDrE77+1cc/ZezSmEa2XWJV+UGIlcEhW7AM3NXDvpT0zVpTiGckZv9qxzS1FOYAqrKr3IPLl59Z8OpmOx6MwnNnzuR/4fhDU6w2hHgEuUlL3JsSb64mEuZqOYuUIJE5en0yTecvimr+Wzbdsy/ZJtLskzlVJfClVQw0PqsL7ZFxCBhl47xIgi04ml1eXL1+8fPr06evXr4+Pj3u9nkg3BqYoJp5h7pkSDjGXgAJOuH0quxVl3Sq7+svbXYKQvwYarOpJKdgz6Tz5bxfY2UUAVgwZUTYpZtPZtt1oNFZWVhqNBt4q+by4ygPx3vB1yjgRkxW6aEByq796AWsKTwrJIbMcoio7CP9ErpKgsuP5fr1eE1l26Xg0Gk+mqNSNpZiIX0TOXPWU0VtUZMuNj/Jn8+oMhT7QxgUHxAL+sJRypUHIg67iQGqUrPInRbF6EGRI08x1nU67tba2trK62mq2UZnW9zwk1t4a6zPcxNyNTkFj0zO+bH++tiw78bE3OemoSgDihcrXY7Y7e/L1+wX7xNiegHvZbDq5vrp4+eLZ82fP3x4eRxEI0xFNEoSegaGB/mZV6yLv8zM4lSRLzTK8bzlH48W7DRGV9eHjwIKBZcDPpIFWEiBV2I82h/pKaldVvCB8zzYzMaX2FmP3RF3HNEuduQOQ0IHk8jTLrNROAK6HQ+smTaEqCDoqkyR1Xa/bXRFXJEPJbMiCEMJsRa+rhJVzUVJCQnobKi+JIcJzoLL0sq9ycdWXeW6TsplWs7bRvb3wflu2ZfvUW1UVFoMpSq1oZBuJXgsMd75DooCGYXjdu95/s//61eu3B28vLy5l9XmRTIXbJ6JaKYt6YH1qk7DK+QLGoUvLJC6YmUsjih+8XE3psC/u2K/XDMEYHjks1ngoBa6l+Na4KCgIhK/xBrBtOxSFKHzff/78eb1eb7fbQRB0gEbo8wuxyJpnvP+q+1mDGbQ3qvep8jbkes9+LpYNfSx2kxADReXClfaVinBg+DGO4Uf1RvPevftY6PhmeBOG8XxuRVGYQAVlKEcIu01Bphu15Whlxj4YjFaVhCmejrLInl4Kc8PDri8bMbqQeigKY2W+VUxguXhi7S6ooQGX3BGqp+K6Byioc3R8cnCwv7q21qg3252u7UirpzJ9g6FAEojStUAKF924qMuUkD9hW0YIP4FmCD/m0GDRtZNXkTKakJBJsU46rDJZFk0nvd7V24ODF09/fvbs+f7bo4lwvCUJLEha2k7iokLCdD4IiCaPKq1XnnBiuEt/6YrO1F/QAWgYW5okySwz7U6s7p42OLQie25er+q5tvykggtJiOXWRRL90mBTsE9BdzQI8DhCxwcoQ8jvDaNY6EXEQQCLBGSROA7IDgqxGMjwxCqCzATMdQyV4IQ+uED4tHhLJFjKnME6k6pOk1LwUYNFa9v7Xr9lW7ZPoN0aBDNo8/jWYGxyY7QUEBLbUMzAEOtzHVCfH4/H5+fnR0dHb968+eGHHw4PD3u93s3oZioahgsob5AOUXp0MU/Cf+ZXqlNFtRujzx9s6q4Y5wVQ+fdtpbHWoqyXGZzJn1Ex3ZQfguS7MW+QKhMyWe85EkTRRxAEARJHsVYh3jOkP2kM4wJcTV2/9cRzP8dv89CIA3XSddGU1DynNO/FLRxUrZXIm53LQKgbReFoNBre3MxmwB+FswDHqPROYsN0GHRy6p3rFVwyqPAe1wcVY5DrTSEf0PjKvPTsHOV1xzIX+Qhw6ZPDNyCQn6UwCbiOm6RJvV5bXVnpdro1oTKXJLEQQbW5NKtxecSCT/1dpG+kiiLmiM1l3Vy2P2xbAsKPt2knKL5lBFH9orDYEy2kcq9iwYBwk5Ctm4xGp0dHr18+f/LTT2/23/YHA5k6iJ5pQRplPsU8G0F+yA4ncY6cUIwFr8iX+CUmhcInuqxWLjaoWCkcEC4a6rzJk+uh4tybxy52qawZZ1q1gR6gvI8fvaTqms5jITMTx5FjQ4Vix3GCoOa6jixFjTao2Akafbl9q0HBmhNkNzIWjyjQq9cx8uTCC8xR56eqx3+5cizbH7otIEaWRqv4A07gqliJvmqHKBmKf8MQzN+Li4sXL148efLk+bPn19fXSB1E2Wc0l1kRmtxkWDwiD2fpPueTrO6ynw8LCI0B+finlCLwK+126UKw4B7gvjye8EkfJqz5vt/tdldWVmq1GhJH8VckNlbaE6NLxReyJxUqmsYIEHJTLyCCp4hE0HRsUGUPFnzZ1cFyVusYu+x7fuAHtuPEQmNpOoMqFHMIGyJLRrmu1Rmo9ZCOkRuBAt8y94yoz0qGsXwc8lBQH0WKOZF9oi+/4VE1rg9pIliiXpRjW/V6bWNjvdVue16AUqzCCnBxminpFSPQFucoHFjjNivuZNn+JG0JCD+6xhkpee1yQQHSZUbLZ/PSNYbtW0yZc6huFIXReHRzcXry7OmTH3/84eT09Lo/mMyg3pFgkqaQQyjcbDiT5P1o5Y0bDUX3J0G1DzJQqis4YcppXdU7Yq64AijFwSzrOZUcYo2yEAkeKSRa0hleFpddhmJ9xRLTisFsWbNeTdbiBhChvAzqL82ms+l04op6RBnoj0HBWsT6jgOic3I/ed+nMQL0Ha2XyCpVS4g8SfaJOn2VZijjmuIbzjFeLiHL9ods9Khy06o4URf5CMYLPkkWj0IcUUwOnM1m/V7/6Bhigz/++OPzZ88vzi/CKHQcJ4xCmKXFdE0RJOpq0QtmHJTiTsQBEcGEWzAe5UB+cDR4xw8/zlaKvm71gRa/La7mjFUobxvKF8VvgyDodrrNVhMqrYt7TKhQ6pIVd+w8d0BrxW8uQFrhV9WAsBAkLL9PxHLInchUKaK4Z6q+AOflYdm9uQvcGM913CxNB4MBCRyIHMsUJLjFWKnUSr3cURohq69UukrmKJSGxSJ/kk+H4ReOBwNlFeICzOLLfTEJk7YDkw/gPezSdV1xRlan3W532jUhNi5UZj3cTbFUPQHy0nCxceOV4v9P6Blctl/eloDwo2slWRyam4HpayIzRG1sLDzVrjaZmSBLCWbpZDy+Ojt9+fL565fPj06O3x4eXV33ptNpOrdwG9uWaldqtzprkfpX5YZEVS60UnLxMSbOWfzhe4yVZYt6DOAPLfFsoe+wynYxJkRzFxwKMjSoi/oVTxz/oh6ZTAnINRw5zIMXIDa3chCYJDuNdEfR5AO2aBynWRZHECAIw9C2rMFwgB5R0B71fCEJC2VCRPoQxg20I5KfHuV5FvIKMC9RL9UyNoilh7HYRmVRx+X6sWx/tFZMcjantYr4j1GG3ogA8EOglU+SkhgIGo1GV1dXJ6cnL1++/Omnn168eHF2dnbdu55MJ5PJBHFjmqZUzZwr1hRDTLqHYmKSJYVIdF+lq3F2ouFQqwI2v7AtmDSKs/p7NOvXb0Xv5+KsS2PJNi6cKj6U8z4gC5T/PE1SZIpatlWHUhR1x4Ufep4n1MlU7YoFLW884N5xvNiSLb/Sg5lPRKQXnEGqXYT5gTBSJeULJlNnXi+CNAhRxVGybC6K8LlRHM1m0+FwmKbZdDrLMtBHkSU6ZD6tMHYK9zD6WMVKJ/etu8cecvI4k8s4v5Qy1Fe42zjKlb/S0Xh2jsxbVHQTKxdAalnz2Wzm2rbrOHESt1rNlZXVZrNlKxcwUkaNy83HvjR+SONiMJhu9Vst2x+yLQHhR9eYoLnSnixyFso80Lc9vQoQJvAfWBs3w4uTo1cvX7x+8+b49OLi8no0niTAI42F2znB6RImWcEwFGnbklpJ5Q3yJoIWJ5PlfczoHO+N6Yx+p8Wbz7YACJ0SgiiFs24FnxTYW2zoqFM25+7cW9qS+RnFFeQQXiNBvfqwgwiGqlwsScEcdy5/PZ9HcTQaj0UqxSCKQse2avV6EARCWYY0sqU96jhucQTofimei7y1tCOT+1SFf9e4ELRPuj2Wq8iy/VFa6dTK08D41FH5NFVrinKmKLEBITbY75+fn798+fLJz0+ePX12fHQMFSZmMyxLAwljwnVXNcuV9lxaxwVXXbEz3J9lmIwLfvt+Y/trbMx/9WtPR6WYuWpLDqJK/Zil7l3jvgKcMM+QV9xoNDrdTnelC5hQOARFoVq45RYDQuPmIC0ZDkjUisawTa7Pmv6ZjyLC+l4e+M0PlP6xXN+qxk16ZYVhZAVBAMUJfd+xnSSJw3CWiDghifGg+5UrovOFWn1ifCf2b+TCqHHn7mxOh+EDUna2+ueLVYWMT4gBDlKjqNoKJw5c3CxN6/Xa5sbG2vomrPjzuQchxJLLXcSW5qiyy20YA4azoPyqLNsfqy1VRj/GxjCC9J8JhSyZyYZhpsKMcmuuC/xFb7CAhfGgd3349uDs4vyi1x/cjCJR9Na27SSOhJ8aFEqwDIJtuwhMFL2QF8mhrtKkp51uBadpnoxh9vCuKKJ47jgPgixnbgnNVcLlKeBqlpRZkYKCLxHsbYdmYC73hdojO1USbFHL5oL9wpciKxwusPQQzyEkKFUEwf1vp9ncSq00SUM7sm5uoigaj8doI4azGRBnHbvTAceh7/tAHJJ2G7gPKbEzf0zI96C1R0UnxHrniNAixApl/+WAIVpllxNvU5nQzxzMy1Vk2T71ZtDeii/4lvxt0aZf4G8i0IURP+SL9vv9Q9GePXv25vWb6+trVBMRYlAC0ymPG8nJVGHO3EFlLR5N2SjSRHXAk1fnzu/t11CU+TUaN4h/vT7TUZCmWDX13b0DReVSutb4CfoORqPRycnJ5tbmxsZGt9P1fX+lu+J60v13pxmYhfvkW95VhnQ1cjB+Ir5G1TH8B7c1ku5l2JD0SwtxQlyPTGUU0XB9hyVQBPxsK0jdtJm1tnd2Ph+P4iQSUmq2SKlIZcKeZcXR3HIxwkYXpVzWFL/F3sE6CPvS61cuTs7Cibe2HLgiydbqbhAOZFdjnmaZ7dhpCgygNIWixNf9/suXr3Z2dtY3d+6BoFB9sWVV2uSA5zhfUpSYXyPjXJbtj92WEcKPqxVTfvGV+pxUu/gL0sWq9OUgt0isVsA9yNL06vLq4vz09Zs3Pz97dnQI9awm0zAMQVCG/GMw94qcbJQdUa41XrBci2Vqh6Kyf95l5tSn/B4OYxedaGRvlVVkov6rPHKkbcotIeeCJz1WdAF3SPmK5KzVcnw6SGi4UfUe6Og5u0qVmpRoSm1PS5EfBNgtUYVeAHqQIQSKWRxFYTiLolkcJa7r+gEQRz0XKhQlSTyfZyL3ACB+0Vg0s1XVzQYRBG0sqjVDl/otWDbcN6zGYYkJl+1Tb1XRPP6iGPApcq6Mr4ygItUPRCZnFEXD4fDs7Ozw8PDp06dv3rw5Ozs7Pz8HZdHhjSMUpLimKBmRQrhCvigeXUUz1Cxe4GjkT3Lx178UEPIx+SVHucsMUxz/X6MZ82rpERXw0GCvFLrz33LOC74m7qhifzhJknie12q1ms1mEAS+5wuCj7wNkNdzlztZvi6eV96daoQV8z/XLkG538IhimFP/cgIEZiq4UU6KC7x4LAW/pAkiabTyaDfn83Cm9FIRAtDLGdPXk4aLuKOGheIXwhUZZMLGa72TG+XM2lLOslekHFAvCkWLcwl7BUvgeoMdNl1PWUGKpsBHN/W2tra9tZWo9ESojIOuHDF4UpTPZWxASadeXHLXqMpUuXVWrY/altGCD/exmdSlrZHTySnWty61Mn1H7Vi4iSOwtn11cXR8eH5+cXw5iaKE0W2lxUmbNuGVARRKp1Fv3TgS/UB4QHvdmkZnruetIZU7Nzpu9yZyxPDhQQsIShZC7ZRLmlHOhcVBddW4UTO+lDbABmDAaHqXupkAN0nSsZfIN5NuF3GfgsbyL9KMBuWE0F9wWLEtDAhukvTNAqjoYjugk69iOnKqdyygjio1eu2YNSg0LxjZ45yHucPinfSHGofgSMW4pHSU5g5ssohXgHUIeWDkLcVMFrIXBjLtmx/qGYwRclGZx6xvI1bBnuK5hrar4gGwzCcTqeXl5dv37598+bN0dFRv98PZyE89Y4dRRHXFOXZQcoGLdP/gEkNpjV37oJ+vwW7kn2WzijDVCyfwn95qO3uNuUHp6Te6qX6ULMWh3y5iGvhuhgMUv6i6rYh/I9JpNPptHfde7P/ZmV1ZWNjo91u+56PDBEIl91aqj5/7pLlwcOqaq1aZF5Q1EsHBpVfFMrpsUyTwhFzTkkBd4pkFrm1er4cx/b9QHCCGptb27HwiaZpejMcTqfTuAYJ9qi/ItCgNADIdZLzj7BTMLgAlCCjAqDwc2VjmAG04qgqSJl/0pX0TnEwi9hMsbrgIhKBG+WFLy+v9vf3z85Pt7Z3Gs0Wzh5OlrqWZ6iL5xEvFqXKDSp/bVz3nPbPsv0J2hIQfnRNpw4yZEHsDXpQC2LKtzUxYwMajJNwNru+ukQ+0mg0TqCwhIPSAkK5BCvUzSHxTJgL4mO1G0Q+8jVLMcv5CLVjUTmb7rjQFs5FD0H1/Kvm3kxWaDR2QIA59xZRMmOVyvKJtigMu6BhDgOdqx5/eZYVJ8vWQbXCygW4uPzDqiNYKxIZCqQqS8BLCA6n6ThOZEVpNg9DWBEdBzzHWK8pS9N2p9vJuu1ORy4qtovp+AoOm2MMazesxJIzA1XrAT1nNlBHZcSA7Bo9FMqMIP2MYuHj5aKybJ9EM02iMmIbB4QmnexWv3vZEelvlmXA/Q7D8Xh8enr66tWr58+fn56eDodDLEuIvUrB8SOpiXc5hDpSDsqCTD9qGEqcyAgp1PMKv9gvRIM8NLqov7+OR+nXw4RF+dlSRHf3/RNEMXiVlCbneV6WQRphGIaXF5evX73e3dlttVqu68JfD+RGiC1ZdcolCJ/S74yMj8IDYvQXO40oAhd9jOrRbqvGKq9JLksflQ4HpHbkn74s62xt7YhqTNPxaBzH8dHJ6USgQYz2kXZaIQBbcQ8olpCAwhIN4i7E6YiVDrXXC0+9Aeh1bLAwAsWTM9ZK8m5TkrBYYQHkzy1rMpken5wdHOxvb+80Gk3P80RkFUizmQ2coLLBkyCzhOCjrq8miRfuCdQjWK7mf+y2pIx+dE0FWiSLm4jr+B3OT9z3bJBMzCbQSwQhJHAtzYFYH94M+2/3Xz979uzV6zcnZxc3o9F0OoWcbCFCyuNpKg8wZyQxwjpRG+hosudqJsQstoWnW3DXlTrweL1X/RnO1Y7tep5AyHrtpHSaAq1L/2WHI5E3BDmq2EJ+M3mOlIEjI2U57dTqE5WhTHVWpmVpHEgBbdk0d9T3KTSsJeOFQReGsxiudDSeTOIoAn+gA2FeG+gkYEZ4risySHVsodxkUUCXdw2HJbeWFKhEVeGR5UKybB9/43epESsoVhqkGxs557RN1SRWyuCiQB+GepA1Smjw559/fvP6zdvDt71ebzwek96MH8AMwHuFRecWhCINKCj44LmZp5QfemsJCn6U0qe7tD+38lneCZItnlXu2Ks77u0uneFDUTrvLQ7W0V9+TfkSkGU5cx/BISrNep6XpmkQBE3RRD0CT9epKqNiVg116af82t1xDIsjYAAN/rwY/pfFlyNNE2CNQnAedDZtMHKgSP14PL4Z3oRR5DgAhuHZlGtvzodCPFL9CQru6sbQo+oNDQ7zAuefd8pdIffzO97eVdOFOFNgbFmWFUWR73sQAU6SlZXuxuZGd2XVdSBTJINhAXduERPy2DLukIIK8tAlrB/qlbx5bhGtXbZPvC0B4UfXlCCyTvel3C0iQxI+UpULqv1/4i+qhqagSpdE0WzQ7z/56YcnT58dvD0aT6ZRBGDRErqgYpKVoUIUIyk6wDUq0J4vvpX8y3p1Oyjkr/XcamxmIDkZhYQCep7g0eesN8MDqNcY84i8ThH1lsHP3Ijn7CTlUltg4pgud0kqzUUGFi+xdOlxKzbUhL3l5xD7DaPpbDYZT8bjcRTO5vOsFgSe5wdBTRBsgHwinJvFgrxs8PGg6g23bHHB08tkhcVTavYtAeGyffytKn5F7jA0K/GF8UM1b+Xy90ofNGwICFEvNI7iKIpGo9Hl5eXBwcGTJ09++umn4+NjeJAFRxSTBo3qFMZTVnzomIEr0aAuh1MmGPPeI1Y6FMVvyaD8UAHAD47u3nuaqjLlq1aHquS6xZiZX2tSlaSjOI5Tq9W63e76+lqj3uD3ZKkpn3N/qKIO5PGVlCS1ZenNVjUUxfTa4jnyaG2VP6WwZ1qB5flC9QlRlhCDovMsu76+Hk+mSZJ6HpRrFxHLnPsjfxQ8b4it0eXQq3NuEVQmgS4DlrsQoOImHnZdoLBwl2ugWTGGpcOLh8adC7NIHEss0q1WY2NjfWNzKwhqWZqRSJ4BCPNPpNwzWljyIquTYV+V343LdfwP3JaU0Y+n5Sr8UahNvZPhLzaHImrUFkw5IGG+YcR7o+Hw+Pjw7dHxxWVvPJmlqYR8VI8K6aFkOEjih5gJtA3EoSCzO4xzYdNopQVQjgblxJ87CybubHKZZDiVj5cgQsH/83iWVmEW8eMzu40pBzLsJj4mRM4OpmChjN+q66JOwwgV6o31N/LNXPL6FYTWR6A94YIEZE4umKZkaDDT0I7jeSJ0VqMIRGLRVzqeTNI0i5LEsu1Op6tOH9d6rE9YaSXAreVYWQa9w8qE4rUNXFKKFXO3ItJaRI5mqVmw1JhZto+88bTAorhoDlixYjClFnBxt/wtP1AmntnpbDoZTy4uL169evXjTz++fPny7OxsMpkgGuSHjoUcNK86SHsuDSxQ9I9AYJ4LVjkU7zp6VcGfP4ZH4J0aZ40W1bxoETcyuG4FgXxjdCZgkQnHceI4huDYzc3R0dH6+voWyI00ReFyAAaG86K8z7ROk/7k3ZI9SgOAxg3PR3UBbza3XpRzOgHtzO25I8CXGAeIkaKwNiS8pPOTk9NZGF5cXsWQXAhlOdQRgR1T6K0+Lu+DKkKImqnoyEUNUtEHktfmfh9M+EcJAJ5nyKA4n1KqntyykDJOFKnj2Eli+b6bplkYAhVo/+Dt7vNnm1s79+979XrT9oA4KkamSlecXyZ9eRWBnJW/0g4Bjn+X7Y/clhHCj6TJvDLG0KPPTRkZiQdUdGhBfAlJoKAwKeaTNImuLi/Pz08P9t/8zz++Ozw86vX6EdQ4lwKksZCtVNa/ziMgB5vhYxNzLBpGOclTvhX1q3QJ4C4rw6euQW/BrYjES0yeps9Q/4aVzlvEedKRsDwEpctBEFFkErAvqmGtxr7oRjTqNWmWqe4eq9yruyEDxLkdmyuo0ppDuxD0YDHUgD8YT6bjyeTmZiSWwDTwfd9zavWa5/mCOpx5npckUMuMEKh5/+CZSxiuq2Kq1HY1FNJfwPBeMRNp4S26bMv20YKBIiw0kCFHg4vjG4Z9jOE+5IiisX5zc3NycrJ/sP/06dNnz549/fnp1dXVeDzGDUhTlD9cyCokMUkKFvG/sHPuFCuWAmJz5PuhoKJHz/h8ccjrY4sQ/pJulELi4gS4INhCAb0F/ScHAcqN0p4x68y27W63u7Ky4vu+4zhBEBAB9VbqPr/BFmD7XLDpbjEu4yjGsfRzx0epeidsSbJFhSzAhEJBABTU+v1e77qXpGkYSiU2RcxmDwU7X+qJ5uGosCAqjObsDImasRs6PKiXb7V/Y95YEBAuH2FEaGRoieuLp6yed8gn9Fyv3ao36n69Xq83miJJB4RJkSNb2LO0lNi1yHWJ9Y0Pvnm5ydJZtj9YWwLCj6XxZC0CYNw+oUdUIiLNZmCJaeY+Ya5EWlKSJOFs2u9d7b95/dOTJz///Ozy8hqqTKRJKmoSWJaoM6E1RWV8jz/8bKrkqEZ+Kbeg94Wy9aWtikzC92V8JWcplbrHWLPKs2hMryp9T4I1vS9CrTTXq4kbQSad122tanJn6exsmKQHVC3PVOqegpaKwV+yTOTNTfyj1hsZ8RP2BHw4m4WTySSOY9/3awHozgVBzRay9WRDiNWlOGI0qsRL1h0Qr4iqpOOBupeFfhrbLNuyfTytirdG3/KYHgvR59SM6TXBM2ZG5tCgJIoqwcAoimaz2fn5+Zv9N89ePPvh+x9ev37dBxn9WZZlHDRSYJDvuXiI3ESkZkm9VFQsFu/ttbkjJPuVnv2PBBAWMX/x3EvXiIKpnV+ZFm5JLFDkK9q2LaJkWRAEm5ubq6urWIUCt8R8wioIalV7BThMKoX3d7kEC15w1qvGHyxX4ZZhF0gPiCm2o7RVk+FwOBrdoO62UuwGc8gIQhogmR8uvz5ST6gzObTMBQvo6a4aEOOBLXoN5FemPaVhIXFTPVjK557rdjqtlZWVTrdbqzWE5s3cBbos1OMqqxjJ6DzyXFhnxGkyyqi2joyOL74uy/YptiUg/CiaIvJpy14hE6zml1emlqqahAlzlrreI9DipX85S+fTyej66mL/zesfvv/hhx9/vri4moYhFG9NYtyMVzrGhiR1PVloiIIQgZQnc8uJsQ7eZVUunRPp3Er8mnLBMI0w/ApHU4IY4D1S/wlC0W8R2vB5TjrkaAIUJ2V2tfQUcisldV6tEtrzpmd8tT0uKmpwWRBxga0gGaR0dCwxhIsrTvQibJhOZ9PpbCoKNcJ5gR+xXhd6pBlIzkC5QjqvklOjpVkOoBpMQ+S2tLIWv3zF3d7qrl62ZfsN2mIpUdqGf2LY+qU2eqm5bAQYRbEYIRF5efn8+fN//etfL168eP369XAA6vlJkthQShTERfkPi54Xnh5m9EfNjxoTLrbm7y4kw4/4Hl99wLZgTv4Njm4c8dbAWnGB45vl4UfuV6W7xSMSNbTRaODblZWVbrfbarVgtrcBQmARqcWiIDL/rSChVOXrLD1NY3uTBYoZCPIrqbKm5VtoEc8LyFXhWLy5cUEkXtFccLDDMJxMp8LXLaLrSlSmFHgbI0wfksOUukPlH8yeiFcy+C+W+9I+F++E4vAWviJtP7kBXm7btuv1OloWzUat1Wq2W+2gVg+CAL51XAnsyrpRnPTylgZ1VWcncduD5ZYu2x+qLQHhx9MkwMonLWPlN1XkR34qQ2FVi4oiLQBjXoYHo7B3fX10+PbJT0+e/vzi5OS01x9Mp9MoinCizObzKIyo8gTxN3Tn0JhQNVsxPa+iwkKOion4SpetqGhFQ0rj0rxH3ClrzCDT9VQNDKNeiAEVvzAXAp26V2IhmZZTzjJjJ5+/IijOI0OEClbpA6tTyvUjv97kkaO2GAi9g7C3wPIoQDqfQ/F6rEQfiRZOZ0mazKYT27Ynk4mP6nOwH0h7gBiyDgvjC3Oul0FTVd+MJZuUl9til94EivhiiQaX7eNshrXHTVUKCRbNwVITs7g9ScKIqqGJ53phGF5fX7958+aHH3746clPT58+PT4+7vV7GD9MkgRpgZQGxiOQ3OeC25B2SMlTyecdR7Humb0oJvz3KR97d5ffb99uPW7RXfULqywWj07l48ts/dzrIho0KI70icG6JFZkCMWHIFA2n8/X1tY2NjaQOxoEULUPWxETFj0gC06Hvy5CGmP7xYm1mJqB66D+DbpxC8tEFSakbcipbYtEid71tZBYmzqOO5lOMa+F/QRWZhTkrOKB0+WQ0qHiY+U3N5mflGBTTNc0Lnd+tyU1A/NDpCwZ1hD8O6ICje3AupylWb1e73S7rWbTBxk5j0rQU9VlrYpXuMr8gzwpzLzO71ztbNk+qbYEhL9nY/OdigeKF5i+hZRRNpeIP2pu0k8qru7MiBcuJZiVUKlcsJJmZ6cnr1++/PGHJwdv3w6GN9PZLI5jyC9ExTr4I9cFCgnRPFbiRcujJM2HlP2k13L+vcsSW+Ee0+crISlbNdncKo0kZEsyDqbyIMK0madaCTYFc4axAWTDKSf7fE+LE6JaFWRFr/IUBeZ+wzPUzreCbcf3bHgPjbWWZ8ajKiyL6YEIa5ZBAnq/PxgO+6ObG4w8NBrNwA9S4ThA5qcq2VS69NKaIMeKFgayKTks58PIaXi51Y7fQMu2bL95u7VSHGeK0ieGccbnKw6xDK1RopsiIIyiKAFp52Q8Hp+cnPzrX//6r//+r2fPnl1fX0/GE8eFZxaPjnx+bmUuiCoU0SA7Wz07FcMC5vT+Lu2dfvVbPu8fw9xSHNviOC+IDhkpZ0VKc3H/dOO1Wq2NjY3Nzc0gCMivSnmnxQ6YEM5IbWf7rzqv0tMvPQTfmPuClZWjjBC1Mi6+lGjtENUmqAVB4Isq7FYcxbMwRJd3Np8LpgywaVQpYFqGWI3fwtlVLejFFFx6bKsGIb/n8pMq3h60pksjRyooKGq6EH1wHKvZqG9tbXU6Hdf1pM2jYomGcz8XtlV8KFrccUCKg0CG4UfycC3bB29LQPg7tzwXSHEDFEREW39uQRRI0Su0uzf3IjdtySBTHEVJEofhrHd99fSnn77/17+Oj0+ue/0wDGdhCPaIQIxSflR5oFlNKi6jRYxGOdvxnDgujmqsTIslRu+yIvKJCenztLHQXhahLtbIMhM4FY0kOCPHza9kUj1MaYjl5zdCoLlTLSwYhaup43tKmEeblRK45+OB3BFXCLsx/KdeGUckrj+iQVrnhHKpzJRPQXstmUwm/f4AAoazWZamrVaz2Wq6LtQotGxHKHSLpMmFqy+dN09fMUejIEu2wOm+jBYu2+/S8iaRyZHjKqBVlNGizmeVfcwlXrCSeBQDpW08GR8eHn7//ff/9V//9eSnJ/1+fzKeWJYV1II4juX2Ag9WaRIaM6dxgkYjdRnDcuXP7/s9jFXbl/m2Pq7H/Nfuj+ERWHzoBRsv+BX/CUE+zBhsNpvr6+utVsuDOr1sZazuZzGltqoD5k2Yc0qXd68SfNJ+mG9UQsHqs+Y7JxOAcildxwlATM1JU7BwwOGtlJl4QcI8NTW3xNNHKgCYe6rkt9IYkjF8/tUiS0aNFe2z5Cowm0qbEMoGwN9jOqEtSKRpmriOs7a+1ul2g1pNGEq268FfNpC6wQ6FjSRzlJAEpMebUDpBRH17GjfAsv1h2rLsxO/c1GwDLyWJQuWDSTSoYKHYBCT/FcsCP8g9nKgTLYoOJjQBxVH49s2bgzf7F+cXJyenF5eX0+k0TtMolorMuAesWg59ELp0amdyNzL/uMAsmZex0o1ZVXCRzEIR1G2ckFR+s0YRoqQsJijOi9V+iKZvIDQqEq3KfKVwQqmd2aICFzXBeVUiNOKFOC4KdbL+WfZc7VPwRPSMKP6P6n9sczlI5NE3pniWXKgxt1FuhGFCXefWWDNwMcDNGR1XZI1aFlQozjJ7bosbAVhncRQFtSBJsrn1dgL69qPZbBrOZo8ePWq2uzXXy9IsimLHsX0/EOsl7L9qxhf8HB08McxlfVnVnYCjYRgihpVQITK+bMv2qzcD+xUZevxFca67FQ3i9igPgz+Jo3gwGJyfn//888//+u5f//jHP3q9XhiFEA9MszAKfdfH2CDNWguYfrwD/JE0ASE7izLPXa7n78ScvOOWn5brhzvpbt2GWtXGebOeQQP1Lb+dSKayNDebT54c3uP6OAV6JKQRBkFwcnJydnZWr9e7ovm+z7nHRZ+FcVKlsXFOhFY7UbXfq1spGjR8EFJEgUotoU6mWkEWeBPUoAlB9Sx1Xc+v1bd39yBpIo6Go9EsjEbjSRjC8zUHvRXQ58Tag0KGV5Zg4rCQdx2eQrlEo2Ol4P4WYf/SZRovnjJI5uIsxbOsSD2FcyEJU1QZtWwbEv7V1DQHYwRLbdh2HEdZBmt8miSe55yfnz1/9nN3Zc0PGr4fQCVGH08wE1U6dGVCaXXIkecTC36iKORyEy12Wj5Ey/ZHaUtA+Ps0NZVI9wwRRBVSIBSk3TMciujaOKVPplwhJGt0Op1cnp8fHR0dn573hoPJbIo65sREQrAjRTYZiiuUVddFEowMQ3Xc3LscLKzITlFBLG6gsGVPx88k2IPkeN+Dz13ImaZiFxR2E+BNUvxZASI5+4nCzLL8H1/J2DKFdSZUH4QmjRgd+F+pN11iQkWwKTtJ/KNMATWSHFbrNSC3Qhgu//LhljkXrF5vHMfEKsnE2aU2YNcoCvv9LIQWRWEkSoakjz7/wvU85TS1xYIqC1pUeaOxtNJ8jsnlOUBYGmxREkdzy9H3WDFEsyxUuGy/SzM4osUI4eJgTulrvjFOs5g6KPjboP3b7/dfvXr1z3/88/sfvh9PxoKpMQfJZxEXDFPBc8syKjB9l2fEeBKLgBB9Uka080OlzN2l/ZbH+i2RYVWrqjfIEwv5gQyqyK2sZq58S78S1J+01+sdHh5eXFxsbW01m80oigzZzNJ9GjUSq0rMU3j81km7HPsVfmUq58lXua+qlyRYYUApLZtb4Ma0s/m82Wrv7t0X7Ot5EkfD4WA6ncyzmm2Lwp6W5aQpLJBCXF0lyOR8OjT+mjOFxg87Ndl5dmXLF3993a2qspC8NmB+GsmHHMFtDaoM0G9RiAJqEkZRv39zfHK+uXH04LOTnd178/m6ZVlROHPdlowdmI5uVAgHHVZparHu06HZgOTPa7lY/xHbEhD+Do1Il8pUpoVchwSVfS+5ouZcKSewwgSkYCUWR3UdZzaZXJyfHx0fH5+dX/X7szBCLKRzVECaOXf0Yof5lMA9RQzQsO0KO+CxoKoB0YsEg5rcnwr8Bxe0s30PlLVLY4NUdAi9prkBFwSJFLyBMA/iOJH0Z57cqGo50ImLaRMPSNx6SSMROwfvYL4YvQrqkmO+4BXG+o05n5uuTCgPxRy4pWszDb70qarjw3rj2FZqz5257UClJihJKYLGaSoYa1EMRBJRfNJ13YeO02i2XNcL/AAH59ZwHVswpJ4BRQINugvvpaptiLC7bPlcLjPL9is3wzw1YiDG5wYyXIwGF4eMMKM7iSFv8Ozs7NmzZ99///2z58+urq7CMEyA2KZcR1LuQgZ/7g7bDHO2JNSZf7IN301ptz94Wxwn/AgR44JReu9IqcGhMLgkxV3xidG4G+lDvaYLH+VkMjk/Pz8+Pt7Z2cH6EwQI0bVaeqa3zsBV8OxOU3d+CxNz5ovRSzEFpau3cP9AfhTrtOUKLT3Htj3fb7bbm/OdKIqvri77g/5sNu0PR9YU9bczGAJRbQtxUWnJGfOhxr4iY4i85qw4L3fx6l8Vi39qMfaSSaMIlekl+qjxFcrHoxCxbXuzMO73b87OL94eHGxv73S7K53OiuOAhV9cakWVQ4puirNGxficnSktTzIqxYslleeP3JY5hB9LY9F5eKvCTZL/rbKKmRQnKw+E5E6ICQr+A9SXFzHA8ejm6vLyzevX//jHP97svzk7O5/MZhgfmgsDBeKEQgdTTAsywFRcbwCMIeDi3SVMIOXpxJSqupcHP7jHMqiZB7p66VW/pdXL86DMriuypOu1mi9aLQj8wK/VarUgwL8+5A34oLENTaRUIyFKaG9LFWalGKZircUuCY4K+0R1T6UMUT9RxUVVhJc/kKeac7hRoqN4KxeJfDRQIvmSAaRVIa95nTOtRJUR+hzDCwDwVBokroJCxR6OEs5mUQSpTKPRyLYtKF4vkvFhgYnBwYyxVuU9LV8DkEzL/akK1eNiqTMl8H6RjgdJhskZ06Xr8bIt24dtpYGIMuIWiw+wp8y4V+lDrrRBOyHhR9AUBU6Xl6bpZDq5uLh48+bNs2fPfvjhh/39/cvLyziKITYo/FyCrwGs/ZwuaDXgpA4bNdN4M9VE+Q8ryH6LD/eHaXc5wQ81FEW7v3hxDYhlwD/DK2Gs1MgURVgYhmEgWpqm9+/f397ertfr4E71QWR6wbkX91k1FPkVSsuMLTjxAjUmt03uc9ovWQKsGG7pQfAf0N4UeFh4PGHhzbJsPBmBLXQlNNUUt9OWWwpt0jRXOTCHAI08efofyxDBIXsPXwbLmmR1M4rdyN8bZFbpQmUC4YHeeDYPfHdvb29zYwvNoiSJlT2VdygjCDRurdx5m+aZ8eIPPzn8CdsSEP7udon0uCCqwqZwip5wlUIxX0UwWVgpzSBEESaIkCuPkziZzaYXZ6cvXjz/x3ffnZ6dT2czoJuLBm5oJVfAqJe6xIWOeNmWK+oTcMAjz4EiWuo08io0ctqSqYkLZ0t1dJnPh7MwGToibdBxQPvEEyua+D++AgwY+OJtIP7nuZAkgIMCvEahJSOWCiEryic1IdAKnxcnXHXuJmQl0IanZqiKKdRmMjTkJdLy1UXUzWdgAw3eujDnD0QdBh+BXPBYD3FhiONkOp2NJ5Ph8GY2m1q2JeyHGt+fo7TXbtUh4H9R94zuSz5g3LXMS6ewM78tGWXZlu29WjknrbANPZu5ezVvAVchrlLXPs63mGIUx5A6+Fp46LDq4OXlJRYklCVjVeFYvkOu31v6sFMfilNHEQ2ahu+f+2m7OyD85ZiwKvpUWnuwNAzINytFDvQVL064vb29s7PT6XSwLpHvg2uV3xW8VTFFq0RBq1aiqtPnblbzc/WJWEFyjx5+shAQauKVMk2QUuS7HgxCFIU3w+HNaIzSCViXEIX0RCfyZ6dEE+jxls+Xccr8sVpw5gvHRO3QPC2GiHN/+bNMcupawE+kuGxsrN/bu9fudBwX6k+gODuVs6czpqLIdE78rHlPSKXWSGpdMnr+YG1JGf09m3LuYJoykkfFhKaqjsOzptRFxS/YmsENbbEzoqqnSZzGSRSGN/3+0dvDly9eDAaDBGI+UjYGYonCIS1zD7DgRU4dUr9VwT8J/sT/GMZTdn2uUDpLgUCYeuuEqbPoiEShEtQU3rUdmN8hV9514C8sbLYNoUPfd9FBLsrvovkVxRFEQ6NQJEsKGonrWClUeXaV8piiO85Tpd3AwZAmhORHOUcUyZ8aQ70mRYSceVSwiG+QXyvZPqRRmnuf/yEDW3k+h0g0gPRHMXyyz46TYTnBNEnkEM3i2Qyq18dC9GJjc7vZbDcaDRIsvZUORCsE8HBkPNayRYSVKdbm3lTdD1Sp4pebX8u2bNSqWJGGz6UKEBZ/a1jDxW1oJ2RIJUnS7/ffvHnzj3/845///Of+/v719TUWE4+jmFQKhZcOFKHIRSL7QP7DsvNaEFkyMiR/oRn3G+ccfgytKPH6fiNQNexFckQpGiy24qXEBV0KicXxdDodjUaHh4dHR0erq6uBqFBXKipjgEmjwwZh1egq8kTueEcV63PKQ+C3ZURuWQJD/FPqmqQ9SyTsyTx9kYKbtVrtnZ3d8eOb6+v+6GZk23Z/MJhaMyjix9woOUcJGxDsBB6dVthiPLOY4n+HoeDvJL+qdBQJDbIMDMknxxFDhB8LKsLZ+dXLl68eP37carXXXTfwAwtl6gWBrGwA9bWly82/Kw1Q3zpDLtun2JaA8HdpesoTz7MEI8w5R3hPRlpwtiA5qDJX9BwlJedglLvzbDYbj64uL0/Pzk7PL07OLgbDoZAyRzEuMNxxT0B3FDtDaIQfGs85Ks9gdp1K0FMbZ+hVA7SGNbZoKWPyl5VzJU03kPunFD5VDQiY3z1RWQJcnR5Mbb4fuK7Xabcdy67Xau1uR5ZZR7ltx6n5kGEYx7HtOKPRaDKbASXScYJaLQpDgRqTLM0s18vsVIXLYIzx6Dneox5buZmKAMom46u5hYR53HNgSI6w2JvDbwKC+upw7CZReXacNKSNUYWdqAcFsxTlaqH5PpS3ziDlwItjqEPoOICuEyc7Ozsbj8c3NzdhFI3Hk7/85a8PHnwGcVaxwNi2VRPUGtShzQWK2UXk4nVUuld6TiVIRbUeGTZEnR7HAiFZw7JZosFl++DNMHRI7VM9kto+NpQeF4RKFqBBDAaiqBWRCK6vr1+9evXdd9/97//9vw8PD0ejEWYVzmYz3/ezGEx5eVAIbsADi2lUZOgLpXh9uFJpCrKnKdxYhQ9vDbZUoVzrD9HeaYYpJWjcZcsFh+a3nAHSaBkqzSQsqsLiZrgTvFUcx4G6JuOx67r7+/v/+Z//iTebZVn1eh2PeBfd2tKAIZPEywG8u5946T1m6I2xA5EAu85XrzocaocidhIpEuAdbjaa9+/fvxkOzk/Prns93/dvRmPLBjlumVqfJHg+6EAtnxNkDE45y0kCIF/l7y6Ne/VpyPk+2PWVGgZ5EK5pWni5oahGDE6ly4sLe3P9zZv9//7v/zeoNeqNptv1wbiBGECCE4urOMM07sqG0EC4yCkwLsqt0q/L9im2JSD8HZrkFarkYNZys3wZE6Pi8cP5EqvMJ0mWJnEUTSeT4+PjV69fvz06iqII0gVFUDAVCqOuzBDTmA1f0jyQcz+z+CM6sdViwKx9DBKCpouIILLTvIsJgciBEJSoIYszssqCF6aQ6zq1IKgHQbPeXF+D1mo26/V6o9lEJozloH5KEsXxYDjs9Xo3w5vzy8vhaOQ6LvBoExd4szBWOWck/4ujnA/85bzsGBhEMVNZ9E/FTvW1RbUw9SFbaMmM0959eVkJS8vOyMtBbwlyysPoHIDiEPN4IRqa6EAFNIiFqrLMSZLE971pGF5d93/66Ukkmj23XMdutTt+UAOJ/DjCQrfgaai+gvwuxfpGOsNBe35V2FCNKwUEK2yOZVu2D9NK9R6NXEFuhZfqKxapfUWTiKxzdKNgtYnZbIZFJr777rvzi/PpdMrh6Gw2w+1LpT7kbrX2fe5AxceEk09LcSDvfOlbDiOLQIUffXErBhyWDVtxPI21vurCLQgzIj+ZAmUYlE6S5Pr6+uzsbDab3boTo4fFHFreVbJG3m/GLvuVXGg52pSfk5f4bnsGYwRqtTuOnUENxmbbcZwvv0yGQ5Dzff78RRjFoxG8xrLGjnjuoFZTfnzMW1edsPbkCh+NAy7O2+tMktVEX/JfqJ9jJFCn7RC7B6sFMlMEJOLAKBJCehAZFjbNcDQ+OT1vPX8mDKTVLxtgGkFOqe/N7ZIVHO031meevVRyAsuH+g/cloDwN23KAtY6nYXIu9adJCnkW92ZCqoJvJem8zS7GQ6PDg9fvXm9f3h41esnwJuEDYSmCCDHeZYihsSpUM1FbG4oHgK3k5xH+Y48XHICw8VIlbi5dRJfbF4Q1BQl6Z3A9xq1eqfV3lzf3NzYvLezu7ax1ul06o16s9nCVAEIDyZAnYiTZDIZX1xcDPoDiCxeXI6n0EDQz3Fs8AvC1JrCKpCCtKYYQVr/cmZjvsoSna8q4wOglVuT4irjgOBZaBU1mtDlVywBgPPVJAUlF3CU+zKvCP+WPiMesA6JKOKNyseAc3acxLKCwE/TbDSeXFxcoQ3piwqHOzv3umtrzWaLK7wtWPW5UzPL0KlJQQweX8WnQIbECzTXcv/04rto2ZattHFoV4WL+JZ35EhXQUG+K4r8JEkynU6vrq5QReb58+dYfd73/Vg49XEbCu8YO9ER+DlWkClhMPKEQyIvUFUhvpMFEUIeeiKwSm8xmkQo953MwT8hy7SqVbGUsVU5F4zflvKEjX1SpRPLskaj0enp6WAw2Nzc9H1/wYPAmZwG+Dec1L+88R3qSKANqniFM4IqR9hlB/Idbt8zsFjluYB7UhhGtZW19cePH0dhaGXzyWwmHMdRqiRKYywBjUG3itMkw0zH+LBstGNb7t1D6OVDSMYeHURXAiRpOGESKEePZA0AjlUVtnzfT5JscDM6Pjn76acfV1a6rVb7/oPP/FoNRi+vXW70iQcAqNiGEbBdLtB/7LYEhL9d4zWglI0iYaGaC4hbL34gnzfNKix98EixAJiQYino9a4vr6/PLi/evj08Ozvr9/qxyBjEeQXFzWMg0IudqtlfYZI8YZKq9mGfZXjKWOGRaUFZL6zJrUsmDkOJ0+BpAP8T/oJQqNAYdQPf73a79Vp9rbuyu7P78OHDnXu7ayur3dWVWi2o1+vaZBEG1iycjcYjkM6s1yPQzcys62vBp7WjKMauinGTjlXHdlIrLQkm4EqFb+dMWhOlRcUGkIrtAKREsTL4VvBP8TRJOJuGJDdCpRaAjKqhEjQRVuWqIZ2GwnsArkGRE6j3x5JBKbsjTRM0Dn3fw8vlSX7afDyeoEIPlMYOZ6I+oRXF8V//Fj0ArTY7q9Uwd92B3EtYeJCjW+w849rhAFKCpVRHJbEedYPL0sOLM0yWq86y/fJmGOL0opRRWSzLxh0ipWRR3B6hHQEqkBWdTK6vr/f3958/e76/v39xcTGbzUBFRgA8hG0QY5BiFnLP1Bkew9TAFR2LeRTHz6j4k9JxKI1/krQGFbgrPo+l8HLBgH+EmPCDcxDuHjItjVeXIr2qmHZxt8a1xvJLlmVNJuB9OD09PT8/v3fvnuM4rVaLvl18CkUnYCmP413n5yrQW2IkaP42PndAHSp1i5QOSApBQnhEgBFq20Gttr6+vrW12e62Nzc2xpNJFIbjZIJubjRvMiBSga9cL3CiYJV8BOhzcRDJChKVmhCwCYtiwTiYXWZxQu1Oxb+GrSSjdoxDJBnmwoiEhV4kjiZJLDIt7fOLq1ar9eL5i/W1Ndd1N7Z2rJblOpD04WvyuVkGs2Q+rOi9keWxXJ3/GG0JCH/DZtQ3la80L0Jx1DWpQD6xCMOqlxt8eiHUlaWCFRmfn50+f/781atXl5eXgAVlGXoxW8Ect0gkmpqcDTUaYQT6QhFESfmUCIhVxRNdL9adk9N6QWWEyjDiAoDmDpSaqNcb9cb6ytr9vftfffXVg4cP1zfWV9dWm62mkBr1HUg2BLUYUUwDqj+vzFaazebq+hrUskedVMeezmauFzkzJ3KcBOKIwKIUHFDlWVRhtPzMKGd/c9oWX6D+GA6ABN4OAORi+Ql2L6iKIsys5ExRtPnUwqPuCsVY0VI/gMRzl6Y4cSNozQniiBwnV0mPYYzC9rzpLLq67v/89GkUR1C6PoqyebaystoEG8INw5nngU4d1suu9jWSwJAcT+1uFB017+S8GZJzVSL+ZTdG6RGXbdmMVrxbqoxvA3fxbQgdcffH4rQZWZVUVR0MQyjrcnJy8uLFi6fPnp6cnIShrDgv6PqwsQRdjAlS4lgzwik5+moJkdX47TthFX6O/EOaEo0xXLz/osn48SDDDzWl3P2MuKhPFSa8hQ1UtkExpocpgjhRo1diNBolSYIXMcuASFncueGWNbAfbcM2L3z2js1AyGyIyOupzlFGyCxcV+9gwKg11rJcz5vP50EQrK6vP/zss+FwOBjeXF1fj0fjWhCIDJLMnUMJQyi0JxIeJF9TxQ/l4OhuSwqMlLyxLFCosx3BGy1B2mbPdPlhY2IxhqVwjmRIMZEbEQxIhX2DEVSgCo8nk6Pj00atvruzvbW9u7K6jvzSJInRn2ugwcLl0IaLwbPIeaaWmPCP1ZaA8DdtNNmpcm0qbDI3Jglp5CuDmJMUzF3inIeE0TiOx6PR6cnJkyc///DDj1e9XppmQRAkoCMiPb5oiJT5y6WfivdF+cMUEFIhKuRDKqQkoSBgKra6yQCkoj/cUeAcA3EQwpKHA12ZelDrtjtb65v37+199ujRg88/297ebrfbq6ur9XoddEc9DxMNE5FFjoAnisKgXmt12jj1QXEK3xsMh6PxGL1tOJUBTrY9y7JTC2r0lVIjZMiL9TIXsCXgIikZphxoicVQWt9VBiHzPlkeXGQXRed1sisjv2JXl3QIMEmU5nFN/RJq1HPLAh2LJB0JPhvUTUsSiKwm8f0Hn22JQrc4WJq+U8WrkTBZaACgdwAQcmaj3Ut8W9V17BB+g4JpeghURAYfk7unkSzbn7mVEu2Mr6qsnNLCg6WAsAg4aeM0TeM4nkwmg8Hg7du3P/zww/fff39xfhFFEYq/o7GOtQd5FI7vuTSGw7tk4EDjxHmYsWo0iv0v/rx46MWPfylQKP7qI4GFH6che8dMLY4qjbRP1EqhONJsNhsMBtPpVEakVY5DxQRechsUgoR89XvP0zSwMZ27esEVDSivTiJCEZNbHJmUPGcgUqptsixbXd949Pnjs4vLXq8fhrOsl83nITqdtZNV7Dd3ktixPINT9k05ZLE+BarvLRDS4z3kQ2E8NOI43GpSFgNyhNjJYzDAtYDgZNuZ68yTFKKFo9H48Pjk1ev9nd17K2trnu87zaaSHbLc6rRMZtfpT3RCDOvzEhP+wdoSEP6mzSDeYM09+fhJr5gCUaKpjcv3ht9ieXlIC5xnSRxfX189/fnpi+cvzs8v+v3BzXgMsSDXdcDShqq1WHDceNSVTwhnJnA1qUlNIlPWf9FBPeUpQ0gGFNWecfpkdehKJ/3ieoOl5EX9eVdUVg1WV1ZrQbDSWdnY3Nje2d7cgv/W1tbanU6320XVLDg/sX8/CGRN9gDIorVaPagFLiigptk8tWw7qNedq6ssTYPAHwyHaeL4fgDJPOJRQF0HrGzLOL368onOIx9Uhz2RZGKUkhSX1lDW1lFSCn4asy1FjnNJg8g5ZXUo2DDKIUfxHa1WShdTXADMqRArB2ir4ldw34gBh5IkWTYWnBPf83pJPA3D6XSapCCBOBW1Kfb2HrTaHXQuIncUpg+Bw8uCEvBHoEG8wyGBFb8S8qN6naP7UGkaae0ydQfR3VKCtJdt2YqNP1ZcIqUY6ChKiRr2DZdBrgrfEW8fFf+RNQrlsMfjg4ODn3766cmTJ0eHR2fnZ4KVHdqOlpPBBvnPyhWFf43Jgc+fFJzn3auw2m/hixYBpDFFm3L8FYGjBbiiGAIygPfv3u7ejarQXHGzqs/5D4ujUYXtjbekI4q3HN85d3BgeLDf77fb7V6vd3p6Slq1VcUbFrA3jVPjvlCFDyUQeidUUByr4j2MPdKOQaW7Xmo/GLvCBRDU1cXqHPhBu93Z2Ny6v7d3eX4+GAwG/QEoaQdBBAm9HspjoxgD+k9xH2pVAs8pk9xT1CFJjpLHvNsdpSVLOfan2hLKzuKWkpZhJ80Z0mODTEJRfDKOYyeD+cS27fFk+vOzF5sbmw8++3xzewf3m6UJpgoZUWJK6afAJc4+dChjqilOlXe/7sv2cbYlIPwNW7EOm4RVKqhUYP7c8owp0Aa+ZhHTmU4mVxeXr16+Ojw6Gt6MMHUQq5CrVMOS+araZ6w2wBqJt5xcVZOhHQMZVrGPhKdN1BSU6qLuPMtqQW1lZWV7c2tnd3d9c3NtY73d7TQbTc8HQOIHPnYOqZugcwr16F0nSRzb9ny3Xq+JNLmg0+2enZ+vrq+enpwO+n3bcfrgJowsW+QTih6RDkruSqnXoufImWWcUAxrimUrd14I+NVQVhXZkxoAOU6tDIdpByGDh4WOKTie9zjyXdESLvugvgAR0SSmAZ8LpTJPOJhH48nzF69G4/HNaDQejbI03dm9t76x6Xr+dDoLxJhj2cGqewPEV4XhMZ87Iugry/1KpMezFIjpxNaYvH6AzJ28e6h52f7MrWiTlYYB6XkvxkyMiuGlETlqpLaC0yxQtsbjo6Ojn3766ccffnz+4nmv1xuPQdXQcRzUfE4zyFuGJ2KuHkjW7dLwYJEXalhpxpZ3Rxo0ILIybX5XVX2oCveVUgkNALm4V59u48Cs+Dl/awzCgrW+9GamQB93KXI3MXo2EcyEYcgjhFV6tneReq7+JJddcvdWFZznuQbqrHOGxl0QCCIcWNocx7M814H/1jc2v/3LX2NQn0sGg356dT2bhUKORdKLRIodcGqYM1fm7ONukW3DLTp13aUTlpB19SlrCM0HLWdvyI1FkCBvV+QRpF75ge7kuKKsE5CAprPp+cXl6zevvz06evjZZ41mK4YpCJORTKeAooMxqpjulATiRr7HXWD5sn1CbQkIf4tGU1uZSIB8onm7o5MJIQiSQKEGYRxdnJ+9fP786PhkeDOCcntzATMEIARmpKAKqMddTzg4lbMKP7zjKAQiCOuSqpDrqfwMQ4TiDSvMp8gViELK3PCG3SMLAc0zJwPpEiRyBH6w0u1ubW3t3Ntd39xotluNZjMIaoDwgsCC2vQuqDKAewzuZ5y1IeolvgrmUI0XEU+r3W53Ov1Bv9vtnJ6c9XrXtm0PB1ChEfLllBpECrqjdprivK/U9tT8DUkFgnZLzA3tWDUwHeYlslhqqePcCBfw+0DvqnBLUc2JxZMwO5BKPsRgtLpCWZrJKhG4CoINYdlxPBU0ZJFJGM4zKGQ/m05dx13f3HRcD7mjuWoSFT5agHa2jceAzojRk1raxiLP/J3iHZU7UQ4T8Qlts1x+ls1odww9GdZz0fltoJoFaNBwGGE67mg0Ojo6+te//vXf//3fp6enV1dXQvc4poKruBZkOLeUOTgWQKyiL4lzC6rCmIspiDwIycOAxaNTcMk4YjED05jljI2LX/2BWykavJUUuuBicSsiRzDJ38kYJMSbZDQaDYfD2WzWarWIZVqEhVV+BGMDdinfnzK6YOfsbPVZo0MTnx0s9XQrCJEuZs+D1UPp7jaajZ3de+EMlraT05M0m1/3BnEcCT+yqHYlcgIj5hyhY8jhRQOgcGML6wAWKSYXnD8N03uL16vkUiM5Rvtz2QqLuRW6M+xXWQpSVSkUDcYcoiSMwqPjk5cvXnzx5Ze1RrPRaAoTa5ELH3dKDzStwfiRjCJW0OyXyPCTbktA+Ku3YpxdggWOjoyvxA8XP1OgnpIIcVEJ8+a96+ve5fXJ6fn+wX6v35tOp6hlxzgGcr9CB0W7hCsqW2iLHR1HKt0xNwdKiFSa/iwmLplEqPLb+FkLFWlH1iEQR0euqA8UUFcUnPdqtWBre2tjY2N1ZaXTbncFMmy3WvVGo16vg1qMZP/LYwqnqcy7w3OMo9h1/Xq9udJNpEa066RZFoVxEPhxFDuO0+v14iQJoFxPBF77ucx4E+uCjUUHNXIWhNLcqQq0Y1x0XjOidH3lRasLUBmiaWWXQ60iah+IC0X6JM/fLFwMtXj7HsiOg/swSQTzFTVIQW3VbzSxG1EUp27mpmkcgURRCpn2kJAwnU6m0+k33/5la+ceRDowNTGObahx74ngnwzSGofOXXRcKbGWIzFg2YCCWK5YMuHGFnuEWKy4pHgVHBVlXbZlMxqHQ5z/Vgyk8LeGk+4uSAwbScJgYBCtwNlsdnZ29o9//OO77757+/bt2dkZxgapwoTrgI0OssashAN3F/KIJXUVP+QMbTqpYjiRn5cxCMZ5FQN6VVCQ/hoooohJ7niZuDX58TBI797u2OEFEddSTLjYpDYcEDpFvBArRjlolBgBibAQRMLAhZqXTFvAC32nEOL7hQeNoTBOvHg7YaYGeBiltFIupl0+aKi/Ik5b1GCGRcT3/fWNDZBb2dm9ugYi980NZEy4jpSWwZqE2AGe5UvdUCDN8Neiz1OyTFEax0g6xJWdSJiLfTTcH6pldFRP8BCOGARZ7UpInbromUpTL0tnYXhxdX12dnp2fNRqtZLVta6zIvzjriP1wImdrlXslBnKogf8BuOCF0yHeVmq/lNvS0D4mzYWStKfyedH/SOdWrfz4vAZhvqC4HyOovFodHF2fnx0NA3DGJWzsBi9UJdSaX651ajMU6up7RoTUpEIkeilHUfktirxcuupRLrEdJKkDm3xNSxH0IJC9I7rebUgaNQbnXa70+2srq11V0A4FORhoEm7BL2GKuuGhhPJWLbn+XganW5XhArdIKi3Wu1Ws3UzHHoeIE+xTMyjMPIDGNHEhuDqPNMCJ4rkKEOhPBcwF2zFGBdTf9GLK40vc6hrKLjYC6AdhWrk9U1Qwhely0pEXSZmqzqWl2mbz60oinAMUZ4H4ViSptPp9PT0bDKZTsbj4eBGpCvMt7a2/SCYTqe+79uY8uSCW6A0yY/7WTFUqEIlUqwIayYqAVJZQRFhsdSkISWjQjh92ZaNWlVYI++HMjVFebogt/z4i9J9EhhDQS+qA35wcPD06VMUeUbqgaBxqErx8l7W1R1wVkHnndFhShgjNEiNl7YvRXEGeHjv0eOjURojLQU5d0SGpZTXT6LdlchT4IUaI1m6nwWflF6CIiCkD7Msi6JoKFoUQRwsTVPMH6uy3RfY9MVrTURCQl7v2gynQC6TjQZQPDi2IDrieqwtkduiUvR0o+cUaEe12srq6sNHjx4/fnR5eTEejSLwns/jOEaaksTY0tWSJ2xqWEifSMOJZgs0BISyA6Vo5ErSv2vjIT22Axwq5CGhgxfV14B74IpApePYN+Px2fn55fnZvb29VqcrpAOsNEl8KTdK92FujyrBh46/SOzecF0tMeEn2paA8LdophCTcrGg9SsxEpYZMBkKlXukOSkBKnw0m04vzy+Pj45OT05QE0U9umJ+Y/qV5GDCSbVMRoyHMPOkvjy1nJoEfkq4k3+scKjkjhL1gEaGXmBEKBPOOQdKrAaNOpShX+l0VldXV1ZX250OkEVrgR8EoKxABbhsSxSVcDi9AqUX4JgOnD4AFk8iFsdxG6JdXl64nuP5HhpzN0A6dRKIu8YgbA2Of2lvoT8SyajAKgHPmpRzYSNFa7vCYxLbanesHN+iDaRn0Nylp4JjjN6rvmBXiy9O2m4gvCi3woPm8CFGI3HVS2H1ktxmJ3PmFrzFyMbNaDybhdPJNEtSCz5M3X93Nre2XdcDxqmLLBlx8SsoRBqmk6WIiJPWHJIZpdqYRsYClBhWlhPFppcLz7KVtdIZhr8wDOhSgij/ZMH+Me4XRdFsNuv1es+fP//HP/5xsH/Q6/WiKMLEJJyTkY4uEnxUGBA4FHpKNMIjlMeISlsGciilaFYFOY2gXPFzY3vjtxwbm/yICjUaelvaz08RAb5HK1XpvAsgrBrnUoSJXgkjVowjTxJEYRj2+/3hcNjpdCiiiImIpd0u2i1FWiBzIpcH2N9juOQQqXk+Nwb4tCjXYDFWuQCN4DIMY+WJGlS2nfp+d2Xl4YOHlxfnk8kYROeSFImjLg5pXus176jnNZ5yziN9QEHE4uLe77RelcbwCxvpgMKcvKgiXx94TB4kkTqOE4bx1XXv6Phod2+v2e7UGw27VhNWTWZbTkkuKdlyMmPICBCUC+EWwsXLnI5Pry0B4W/XtGdaznTq8WJ6nBQ3M2I++f3ApI/u6EwkuoWTyfXl5fXl5fnlxWQ2nUwmkZCRoXkqSaCgAiEDwgAE/1QQDGmW+LnoEdouNBPq6Tmf7Z3NIYlPgT9lz+fRrVYSAfcb6V9L3xoKiwomQ71e932/0241arV2q9VsNbsr3ZWVle4qVB1sNlueC3M6UCXFameUZqYml7oMEuhd183Cme/5rWZLwEUbdEfTJEnj/qB//+FekiW2Yw/7N9YcPGdplno2FG9HWpeldEdx5cOz0jAQo23CsyhDk1CCg4YRYRebUVmAolihUbtIMdxIstZiUAnpsdCymW1PPlQMuebDv/J6Cl1WMTzIWhU7gKjofF73G/BBZiXzJJvPkxiM3SAI0jR7tX8QxfEsjMaTyb/97d+3d3abANFrSJhzhMorXv7yi4LxGZRxU8pvOhuSAWtS36E4MtCEFDtI3snLVWfZ8q3IwTPU8AwQaJQ5KYbgSsNiVCuCU76TJLm8vHz9+vWTJ0/evHnz8tXLq6ur2WxGzFKMyYg5Qj7RwpMCgUFI985HLCVitMFdxR8lSvbmxIoF9D8+CLgZJpVxK5PO2jBtS0NbPN5SahcaBnrpFeFd+qSR4V0mn1LIXfQ4lGJCel0VATaC28gRpfHHW46Ub8MwlH5SdRfRHozjFuON/CsDr+b7dut43DJKes+imBY5mWUmmwJic7UWkBqfMRSlY670e600yzzfbzQaaxvre/fvHx6djMYTUHsCpuVYpJ1I3XQs3yfvVKCoap2EEjYBZ8g4lp1BtgMBy3zA7fahKPfaiGUav5SeYYmPNQ01TVPf94VyxPzyqtdpt/rDwZPnL+/t7e3e27Xmm1CbEfVIbYCsnu8TBUfYOAJSggKFjMBqK67iBihegve8D5btd21LQPibttwcypgW2rTHKWXxtKqCfRnI2YG1Hs5mk9Ho4vKi1+9PpjOhYCdMdFmtHm1vFRWSx4ZZjXCK+Aa49RylkpiyBCN6rpPBJ8XXgN1jYXf8Vp+ZDAvqCKKeStBdh1JpwtzXbEXbdgXEqtfrq6urmxub6+sbEB5sNOqijASKVeK4CWdfFXLG6QmghG1bnufL6gyu4/u+63qNWqMFiLO5ubFZr9dfBa8dx7m6vI6juA4gJ7Nt0IFAcC6uXSL2CVIspv0kvgCBUzVChr+QFgvNv1VjVL464JGE/opa9yQrhS4RXam7LMMEr0zd0fxKBiLdcQQRV0je0wdKkzQMw6ur61AUorgZjaJZ+O23f3n42cPuymqaJo7rYpIGRFBFDLvkuig/B0BotGtlGFckbJSejHpSiDCq8zfYVb79/JftT9mK8cAqlFJsZY5/vVs0vJBcEIbhxcXF69evf/755x9++OHg4ODm5gbsLaEpigCSkKF60JTbiNEL6AXGdjCP2ogC8fPiP7z1KTBOjfNjjZM1MhiNnRhvDfa7sVkRUVRdoz9SM7Iib40/F29Ivit6XWVqF10JpEGK914cx7PZbDwez2YzyV+ucNuVCsAa7oDSUOEHnIQp5kVymmRSiMVCsZsou0BsQ56RvK1SsvP53A78AOrIN5v3HzyM46jf76dpOpnOoiisBVCGChzBINNqZdI3y6GR8OHy60gOfVWlOXfEvM9XF5YQ/lCZEFF2qxgvaHfSL4zDUHGOICTrgDafZTtxktyMxienZ69ev75/f29je7dWr4dR5LlO5liujTFCynPBIQI8S502Y8VF1lvZi2X75NoSEP7qzZzBaWrjND/SfKFATvVzhU+jlI9OQFz0Zjg4Ozvr9fujyTiMoYgCOnIwhAikBa7bgUcX5QIwOEhenxwfic9sHAsq1JdPLczsOeSEcSCk1g+VQ6hOzLAdSN00JVtEOP8a9frm+sa93XvbOzsrqyu1IPB9H1CHUJFmMLpy8ifjRk3com6s5XkpZBK6jlur10QAsrW6srqy0u10O0/rzyzbgtpEczsEf2Hq+xDMtO0Er5DgYADbESTaHJfYoTh8jguVHlEDDXuAATF53eli3+YXV8FDzJsgjMQQNW3GbhFi2XCVIC3eLcFV8U4kCC8XWvAkCIMQvvHkhUbTdi7czLMZOB1Ad3Q2nc+zhw/nzVYLEj4bDbwbYJ9YsanqovAaSuJ/yumg6g3Tkm8OlK6ZCwt7wa+8XIqWjdpiHFgqR8HRUekO9Qw2n0eiTafTfr//7Nmzf/7zn/v7+2/fvh0MBpishVQIqQUq/hNTpQIAUixYd4C6hPJahAb50bkvKS9WkdtyQcSJwz8OSHitReIfoj5WOYuhgEP4/u9iF2qixEcfVXjXiaUUCZf6F4wPSzE//6S0WAXhQNoYmcyQai+igmmajsfj4XAYhlBigbRSSutP8L4VL1DpU/OhKKN58qdIjVOLlFoU1OqnFiyegiFj/hVeUjxZaRKIwPja+kYSx4PBMArj6SyEZU2408XBAWJSjkP+JjejeCiNp0N2mg2kNiu7u+nJeqehMyA83zntBzwCooiU77hpms3C6GY0evXmzfbW5urG1kPPa7Q6ruOjIVUWJdZdL7myhVtUWyxmV5fL8afU3P/1v/7X792HP3rLBd1UcjDPj2ILAga0EB5KUJFvMh1FqB6naRbNZleXV1eXlycnx0+e/nzw9vDy+noWhqAvKkjwSEUiBxYmTJuzp7EYE/MAi+3g7KCsFgzlSSwpTXdlzCsfmU4bzAfKim5RjET5PojEYBn6RqNRE0zRvb37e/f29vb21lZWVtZWV9dWO51urVGvBaKMhGCBAmW0osYuPyg2wZgHohaE3eY2xAldD73wge+DVo3n1aBiIRSxiOMwimJP0Ktw/cggR05OnSgQQRX99DKsLquszkcrqLz+EukImIeWltnVxTeSVuVh91XRyCj6ofFSUmIpIeTcxmTJKRNWVPWQJyCMWVgpxZk5UwgTTsMQvM7zLHUd2xeXz/W8WJRZQ1ZSBgU8KA6YOxWF6VB5H09K+l8VVtRrknaiq2R3WetECspWGlvL9udpRbUYo5XWd+EIkBARF7ji+8dDYAABIy3T6fT6+hrqDf7445s3b168eHF+fn5zc4PVCKMoQuNbzKZiMs7m4NhSPFWaVzk0wp4g0Z36QPRUA27puVQ1XEHkBJwT6pLpiLR/3B5gJ2hCSc6+7lsZTi4GJE2jMD/5FHERD3h+Eu0uE8uCaCrzSJbMzMYhFrBdFnSvFPDIKyu+xVtue3v773//++bmZq1Ws227JhLJiq6EqiMW7wF6/QGDQgXXHvKZZMoJByM8w9yQ5711MUUWFSxPcwvE61x3OBjeDIej8Ug8vCqMj7Rw8ewh0UodT+DF0jtDIUKxhumgIg2gwRrV90NZh4tTED81TFURAnxlfRGOaXFLwIsUvAM+GFCeU6vX642m6/lZNofKjMJvpRX5WP/I0igfT2nSqkVYGn7yXr7jtVi2j6ctI4S/ZiOFKSUho5dztpV+gOjJWfAAoV6/MB5QPSycTc/Pz/YPDk7OzgbDIc50aLzjdul8jiE15HbSbhTzXPdBGiW5aKEML7GCODTvcK8xcTfu9PAzagfIr2MBA+wDcA4Dv9Vsrna725ubG+vr3ZVuq9X0fYgQuo5AgFVsioWHE8xRQGouZFbY7tzJXN+2YYee67Va7Ua93l1Z6XTagkfaODo6Gd+MPc+DMo+grQKiYcLVmjlOZlkiFUcwOmVtDa6NRu5MHPJcpQRW0BbrM9JZCBXtXJzWHFL9ZdVo60gkC2YoNHj7ss1VcOI4Vqak9JSKpTQLozBJweMQx8nNaDKdjqfT8TfzzHNBSd91wQqJkxgyWEQmo5KDzR1F5FjM7cyxxJ6lc1WhbqpQz2sgYSBTVg3WYFuQn1nFDkNSddn+zK3o3S8NsHAz/dYIIcZekIkXhuFwODw+Pj46Ojo5OcEIDLJJETGGYchLgZdaz/pZVviQ0CBtwGmZRRphrv/wXGGUXh+CToq6UYwKlkaBxJvycTO6ZxyLv76VDPkHbrfOuqXshgXArLh/es2TWnk5igTKkQPFYzweU8iaZnujM6V9KGrPVN4tv7jlXR4kf8dGUrItNX3m7sRFyiQUZRg9J4ARSHd3v/322+l0GkZRvz8AgRnhTxcF/dwE3biOjFWStcbtEPSzC5clq0pBxb5yneHuXNYxbRaSzaiF2fXlyDOiCCTz+AIah1IQQlggiSC3X15dvdk/2NpY297eWdvYbLbalg0ZIsJxwOta6P7gaRqqUTqQK6sxS8ROEhWGduCyfSptCQh/rSaneKUwJf1CHBnmN5ehEZZyZ7IecjgB5p8oCm+Gg9PT05evXj1/9XJ4c5MIs0MiAFEzAP1bwMqTIalcgQjuExJVGuRjnH+SldywiilpoRNcEhiJIyeOXGE9GGIMWIoAw0mucGp2Wu2tjY29e7u7u0AW7XS79UbD8z3QVxD5aRwe3WUpUh1wEbIJHzp8gpDZdmzf81OoQxjUavVWE2ik7WYrCIKz0/PhcBTOwMKr1YIkSR0nsaHuq5TfzGxYVhULX9awp7GVES31tjCmtKzIVRlGhg1O6UJbNcnSKshuGyIL51QoaAlhOFQuWoYwtiwrJOVVpVyB6zgxpBTaN9koTkB1BkIhSeKJyMTK2karswJ5nnNH6o4KHQ2x1phOceFFFMFH0S8H8LX4ifDPKnRnrIfyxHCVQosHLWCZC8sTDpftT9YM1EeWMRHkquIexRjOgkMg0sMEwsFgcHR0dHZ2dn19fXNzkyRQ7NR1XaSMzpWQvfilRqf86Hl2hiw2KArkOKXBNL03FmTgiA7nE8EQMbEcTTUGDlxg0yNMJW68MZ8vtvk+fiLoXdp7h79Ks1VLN/sFvcvtxHAmxjF45QjLQZrcZDKbzZrNpgwKfbjg3gfPHJNBM6FFrf7l30n3tnzB1KGqRObop3zLFJIb5o1G8969e2Mhpn1ycoIKcjOdL2dZIDwKHmF8YLTTUf3FBU4uV5SDg0dUaT44TmUmVm4g871Vp6u/40u8+k2evK31IjC6CWyy1LKtaRieXVweHp3s7Lxd3disN1rtdseyHKEfY5LSDLeOErrTqodyZqA6Zfpq6LteYdJlVuGn0ZaA8NdtKnKkIm8qqUzPKTLoIR4z8RNl3Rbj/yI+A4J0EPyLo3B8c3N1dfX28O3h0dHV1VW/PxhPQClrnvNkx5i5gnOFnAqxxIUi4NE6DzG0/BHNaUvkpyk/lYw34n6K2jNFTpGy1ee+59HU5kltUbdWr3uet9LttFrNlW53c319a2tzY3Ozs7rSaDZrQnoUxGYE0xTZTe9KSFBbYioiROMEWRXktsTyY7VbbSHKCsYcsq0s2+oDgcROktS2Yyx2b9s+wlqVI6QKjBXdh2oqJA8iXmNObnFdKakjVuh3sKJU+M703RrxEMOFDMCNYg/ICybmBx9PxTcGxpEraW+O7URx7IiEdVErNzo7v4jCME3j+dwK4/SLL77YTJJOdyULAqjv4bp1UYDbtiVFLbfMSNYxfIYDCHeIGknZHe5xYGeBJy+Ju/I/NG3VY7Vsf+JWVEosFcMowrNSQIimMzJFiXsZx/HV1dXp6en5+fnJycnV1dVoNJpMJmEYYkDG5Ao6tgt2JdjlBvuODCyifdJDTadgbI+VV41t6HmX5+DqGZhwIEQIRQUXUqTkE6lMd9ShGJI0lI225CI3pSN59xiX8ZOPEEYWia/04u5gb0FwuBj+veNo0BWkwBe/YfCi4907Ho9HoxEXASqNpBWXVH5xF2z5q0y5fCHQXlUiZeqvSimjtwYJoYSSOBHXdVud7vb2drfV3traHo3Hs+k0EbFBSeGBFUoqjStnJVhpssY8kUJZbRjFE9fecpOtkAeNvLIiI5DqiULGe3PDo8dFnzU495XSBIiiWqKSljWehHPLHk8mb4+Pt7c3dx882tndS9Om53kJ2D+gOu6D3Kg5UGieFkue5vz/Cg+TH1dKNrCY6rJ9/G0JCH+FxmkMtEIrL5GcXskBpl5oCFHx9MhpRVTLASmZOJ5Oxr3ry4ODg+Pjk8EQRO1EQrQKvgmLwXHcNAOnteqafEBlgbtC/IqcxqULBirNEPAj+EcdrnKHKn+SPIggBEpTH9NZsCeQFejYq93ug/t7nz96tLO722g2V9dWa0HN8/xA6MoIegNjzN95rsG8PV5jw3WlkCb2C024Wg2QZ7PZ7rTbzWaz2W4cHhwP+jdxnEwm0zjG0GKaV5+3snkqZapBq1WPKtVeN1IHJHSpSH5b7FfOIc8yhs+CRoE6kgvLZb/j/1mokDwL2MkkTVxB8YThEhESy7Kvs76wDgEbp0kSheHOblxvtlrtjm07YTgDZo4DpSBzJDZ1pmp5Vj4Tl+p3qAiP4OHknN+SJSP3pxlNqHXLT2u5FP1xW7H8nWFylRhhhUILd4kN8gcBH3+UVhqPx5eXl6enpxcXF8PhkOcWEms0H0go0DvZX0r9MkJwRccc3xs5+DQSUO4RPjKIAy2Y9CRlFLgksvitDqVSKSA9yYBFm4s7FTtTnHmKw24Er4xzMV5/hJjwjnG50m2KgpyGDGnVVb47Qi694ZWTEepOidyHDFVG+bFKlx7e89Kvfu1rRGzJHEFSzvvSlS3KK5vlB5ViAi10FftX+0Pni+t59XpjY3Pz8ReP948OLy4vBN8qm0eR7SRglGQ66o7PLtToMpy/yu8DHn1p8jlzW6AyRlgodZOQNza/M1OFIX9XaP8tDxkqe0NiWfQyZ5kDXJ40nc1ml1e9g4O3Dz47/OLLL9vdlQT9U46F7qqSK8GKVqtEFPiDCy2TduPXKmdDLtun0paA8EM39I3Q1MxcLPiRirzrAuEcP+AewMNTMpvBuoxkJZAWnU0vzk9fvnx5dHzc6/fDUFRAFkUmhCsLJAyk6aNIpIptoGJ8wojgKwlnHGrekdFUJHNxk2y/gqWFczYCqvl87nkud5gFvr+xuvr480fffvvN3sP7K2vrjutCpTsf1Ep8IScjtGQQyFGZPtss417VJTnJCp4hnKDrqKAc5mfHMZyy7/u1Wr3T6bTb8P+VTvf46PTy8tqyrOkMYCQULBIlXzGbSGT7wOBDiFVkGsgT1HeEdu+pyJyuMUhGBSH5OwwwBYHnPEB4+xTM2KESgeW/ksRLZbfiNxQYkc5LS51RnMwtiJ3GceK6vvBWJOFsGoWztY2NLJuvrK65jp2mCUw1kCKYwSoK2nFGpzDcJyVSMfagrcP88qlGCJV55KUkyKqurYLceMnJ77psf7hmWNWlTNFc1Eu0ImFygSnMjWw0qsbjcb/fPz4+fvv27dHR0Wg0wqxC3IYwoWHlF9/S7MUZBxyScfO96KGXc4t4oNQkK1NqechIzLSQ2UuiMpAx5DmGpA1ugOmONHSCi62PVTRPi2sEH3w+CO9kHd6FbPl7tQ9l6d4K+e4Iuow7hFqaprL6pSJSoi4uXeK77/z3knFWuWlUnFA6s7FrVR4KClFV71cmWHoujA88d2naaDa3d3YfffbZ5eXlZDzJsj6CJc/1JFtGLJvFGSMf89Xdplc5joux7Jr94rvUs1MOSEqBVZw41EGIkaRkXnBj5ZNKXA8k0MMonoXhydnZ61evv/7m22ar0+64MOOUhYv1nimBX/myZSwQDUo6cfbTYtph5bVYto+mLQHhB24aA+AswKd7IBiY8zuzVqVWin7KWYOYYJqgqxYnr97VxdnJ8cnp6cHBwdX19XQ6g2L0SQw0d7kHmDhECE54eQXzh3oCKwTmDdK0QaxH1WdZwo/RGAjbyfMi0VRKPkaBTfFWUxl1mXX5FqwTQVF1HCcIAsdx6rWa4zqtRuPBvd2///UvX3/99dbObmdlpV6vu54PW7qe70OeGsxdsmoGCpqWiTiLcs/4wtBzxeuTI7qI/3CBdBwPWCS202g0kUTRarY2NzZXV14eHx8fHh4Nh6PhYJClmdtwoyjEmTRJE89zLSGoaQNo12wuWYGdK82w4aJtuI13d5NIfIXyYLmAAK1VdJlytxwdiQFUFq1QwziHdEEMa4OwrSx3CxI7oFrmupguJbTLPNuan18AdzQKZ5PJpD8YPPr885ubm737D7ura7VaPU0zF8o6QSaDCBgKn4epZyA8m8KRoajUMgCiqtgzMUbRZUkZ1RQpyDXBayq5Pc7vY8cs26/dSkN/hP14PRuD7MCffcNjVRp1pyqCBAjjOO73+4eHh8eiXYg2Go0oQihNTPGCZP2pw1QgTqq/KE8QgjFyxt2a8UjfUtBPOm5gxhceFivzXFAQJTIqFTbUVHN9fNgb7oFeY9VEmYlUgTp4rMnAwMZbPi8RXCxe2cV25EcCET9UN4xASulu734sXMXYfCijza7rTqfTyWRCV6RqkEsjWDyybXTe+tUa7duEzdK0kUYJ73DOOFFeQqM6S+EwMl/d9byg0VjdWN/e3t7b3b28uhyNRjPbDnx/FoZKoRceajaxSJ1PHHHFsi7c/KJD5lNT2pXC6SuDTD+lyrzEgk2YuiiHCmkGaHwqPpSYwdLUttw0TmZCKaffn9cC//Li/M3LZ7V6Y3Nnb3193Z1bqZvhnIVEBd4tQn0sfxKJ6zK8IDqkSLwSnGrcuFx8P5W2BIQfrplhQHyhLQFVqoYxRTkwYNNW6dMDRrFADmCRRLN+72r/4OD1/kF/cAPF6NE/jemCcy4yKlPBlDeNGVL4/IrZTbtysQO8mB2WoVKfyxBRKVRh0UVuXcnTVzUGpMUj1I6lnWLbaZY16rXtzfX/+Ntf/+3f/m3v4WftbhcJoiAKKjAkAAmcqgSa1IgUx1k68HCCJiVPpBXKr5hpgv2VIwPWG1RilVM3UEQs2/cC3wtWumsb6xsbaxunJyevt169ffv26vr69PRiNJ56npuAuHxsx8JNbqdi5KGDYNixhVkKcBFZSHnd8lozejw5hsGf4+1UdtNp77u2btW3xE/mNSr01cdbQIykpNKq+KDceX4/ysiGIyAaxPgzyi1mgIQHSZrMwqjX611dXT3+/FGWpntZtrG17Xr+ZDJBoXMVj81Fd9FpC/84EPXDgVM1oISqqAgg8m7Rc0U2DVxEHRgUyxgb02WE8I/RqhQFucHEg1T8V8bURK9J1ak0MIg4LRZtNpsNh8OLi4ujo6P9/f2Dg4OLi4soEgQN0YhJzi3vIkwSt6vAhHnUhK2ITsnHVFpMXL6QnDVVa2Jue74HysxizvY9H9KwPZGzDXLNmmVKOFY+R1KNimdbWSloLpYEZBaDCkPPho8Gz7YqhT1VduRHggk/bFvAvL210Wb8bifqhAVZZEmz2USZGSOiW8pINBREiX9h/U6t/HkXJ7w4dCk1D8o6jj5HoT0OLQhAb7TT7X7x5ZehKKkUgZM9iuPY97zYSpxUxu2ZNruKmeVWZ622SRE2ShiRbmtVjiLfHfqRXLHFfmHBLdOjYhwzHTKlI5LMmnC7QDKfdPeLKovZYHBzdHJ2cnK0e//BytpGmsJElIDcqIueeqNvsDt+CWRckHhgWgBD/YMbS8BsRg+X7WNtS0D4gRpODISy9MJJIktShiXP9Tbq9Mlf5mjzcgoQapziXRTOhv3ewduD12/2j0/PZmGUCfghsSBb3SmAR9iTFgPD8MlBRBbRgm5r2RtloKB9Aa8zQnt0BuSNpgPhrIGeZrI/EBXMsbSd69YCf2tj4/GjR3/5619379+vCRUZ4dr0PA8UTcCGUTk2ueIZincll0AB68hTJeAgued4xXbkPhAehxw3cpwD5z4FPOK6Xq1eb7da7XZ7Y2Nzc2trY2Pz7Oyk094/Pbvs94fTKVRmd2wnAZMxFtrUIpdb9U0StlRMkgvwyLuCw0MmG8itVXkuyk9fvPXMRTEfN0UkWnA00KVWxhxtkj9C8U7B6IGM+AnV1nmKowwiRrZlz2bT8WgMgvtwrTPPD1bX1x2HvNcQRIUcjDIiCYFYWKpVChaKaMuBkPFL6aDM9RbznaC2FNRZyYk6YTxcqcCZR122T6QVwYbGV3lr2AAkpVirtOYePxYHLVEUIVn07Ozs9evXz549Q3HR8XiMdjYxRdEERzha1HzK+WUqom3FgIzRyfL4ofKwoSYWVhiDmKAP//m+TMNGfxzw5QV6xVNDFw8OI4Yck3kCliBI8KewsQX/8f7cCldo8A2lHAq95nKrCsDYuCJ/GBzI0wiNz40N7rK3Bfo9mNfAA4ZCEBo8FzzovQB4Gzs3QtO/WStJwqQ6V9g3xnzB6JZ8QYIOPIjH9gvOEVWFYj6fB0GwubX16PHjyWw66PVmUGApnYUgMpeqUL/jODE+LMaqqhyUOcescGsCqqNhzFWl0CdI9CXtw1Ri2reNjo7fqdUbiEoqDICwEAppOJmTJsncqk3D6KrXPzk52zs5Xl1bb7fbjWbLBWFwWJgdqTlIfaOIAF0LaTZQYbXcZSrcTUtn7KfSloDww7Q5+6uZoiokR7JLlEBIkSKyxzXfIG8E4KQAhFHhfo7C2aB3fXF2dnx8cnF52bu6mkxnYQhZAZY1j2OhKoNOankUuVcdSlI7pxkLYRxMPcyiUkhObktsADk/SB1UyeyTjAUNqCTfSZ+sMODVVxaVyoWMQFEXfnN9/d725hefP7r36PHK5laj2YKi8BYEBiFjUATxEApi6UIVMROq0MSb1DwxfQlIJY/NYjqkluOOitkbxBdE5R5ALI7tQFKg3Wi0d+/VOt2VZgMUUIGIZUOAs9+3fd+fzWa2WCDiOBHlCWEYMFwgQC9ot0rrh+v36J6gnSTjyTj+pFKI3RNBBxI1NYMJC96SULRyXVJslOrnkqHJOS9aK1uNEkPd4iqnaTKfQ1FHKONrQWKr63lzz7u8vr4Zj4fjCVA948S1YZn57PEXK6vraZZ5vo90UxH6BU0zMc65dHbM8yza97i0abtRBTH0KgrZ86LYJBji8owUt0hnodDTeKdne9k+1lY0hTmoKMriGaEG49k3igRQ+k0MVHzgX7iuG4bh+fn54eHhwcHB4eHh27dvT09PUbwRt0FydTEkWAiz56KRGIQh98eCyBuBKDk5iPsfYSdkEtqWHwDe8zwvTVLbsTc3Nn3f73Q6vmqOKBaapmm73caYp23ZkynIU0+nU/wt1NQRfccEaUklFTx8Ar0k51h6XSi0SIsCn81oGsm5Q8vSERdzKT+JVpxnSpnJxr26+HyNADKBaoMyiimjKC0bioYjTI9GEd3xbhg9zM20v1XjB8311iDRaHevxFF66mf7Ktm5WuFSwfeG4lSet7K6urqyurG5cXp6OmnPwugah5tANfoW58IfKnaE+UDYMek0z7tvwK7AUlW6L6h4IJYiRZnBHcgbouDD5V3PvSsE4Cg1WS6U6MCNk3RuzSfTWaNeH40nL14dPHiw9/njxxlYl4kdBMIrBOaW5yMvSa+glPmYv0UZC0cbXRjTkIkbxG5YwsKPvy0B4YdreV8UYkEZOoevKTKh3EfkRuJhHdO4xzqnMu6XxHEUhtPxTb9/eXx8fN3rR1GsaaFgjYDrjwIjtHJIoXOIoOSbtPTzbBAVwJJMcYPTqD9HbgHMoQXBBpqOBKrADDAkZ7oA5/DISBkFxedmY31t9YvPH337zTc7e3u1eiNL07mrVdG1cIJW3iG5CLWU0jTEvHAqpxGBjbxKtAdcPlELlE3f8K+QXlDkB2HZ1IKgXmv4nt8FoZlWrV6r1aAMxmA4chw7ipM4im0bXIlC9QdAucBvIo6aX8ykaooW7qLVTl8WMTZaf+UuPuO7p26Tr7IsAKj7oHooV0N2yxABFrJbsXgJWHxZlgifdJIks+ns8PR8Np2BiEEY2paVPkxWN7Ycx5nNpuJqiqgv7tlcK2g1hT84knKURMlKsE1V2Do/AurW1V4XdS4LBYeW7VNsBvQyAk0cbvHJkLNDOSGTkxtxDzhtonAUxlXG4/HV1dX+/v6zZ8/29/ex1ARXT6Ed5nRZ8pa0EZ+k2UyfV+Fe5UCXpgJ5IhZDXJaMCtq2XW/Uu53u2traxsbGzs5Oq9lqNBp+4AP5E1hjqWM7M5BKnUVhNBgMbm5ugiCYiMJFaLniFJpYCVBb55Jax3FgqbFuwGw+1LwognEpjVRPYw9/4PYe+Mq4dflODCcaJbIiHkCEz7nBpf7E0rWm4Dn9TS+N6bLh8UAVLeTbG+4Y9PJS8NDcNZ6y4h8FQdDtdh88fNjv9wf9/nQ6uRnXMvBtJlh9gYp5KAcluXR5DkvuAjkOklsxDICnYEbSVIAQvdjlviS9T7JVNBTU34k/iN7oGDg7yWkkTdPpdHY9uDk5Ob2+vLj/8HNr3oziuAbyDEpulMNZOf5yv8rZj/vNaV+gmadcy5IzlpeoW7aPty0B4QdrXFxUzQtUXZBbJxLXMCZ6fu0viFaJB1hkqyVROBtdXZ4dvt2/7vejKJJ6LeK4YLFQ+or8LZ8mS1YeOanklDolrKLQIBM0lw+8DLVRaFHNcXyf+BJNCjG7KSstA5opuqwgQujY9cBf7bQ/f/jgyy+/vPfwYaPRxOwa14UMPfC8QTwQBUikeU/8SQSEGBRCEIi4UeZcy45SJExHZHNrHq1weCzxlQupcejS1sV23Gy+tr5er9eDWg2c7cDCCk7PLi4vr6zxNMuymh1AicjYErQsqP8DlS0QAeLSoUo8M74oXSZ9EZSLMecd53ZtlRlBqYZGrKP07iqzmCXeVzvh2EwbyjlcLVZIrB6IGkUQWsWvbm6EuRl6vpel6XQ2e5xlm9s7flCDcANcMqjSBKNehtYoLElmjbYaRbQCkxfQEyDzNJWvUgnmCnEj6aPRiaPLIOEn3YoxjWJIsIopypGhMfcawSjpaFM16JMkubm5OTw8/Fm0/f39fr8/Ho+R7CCo4zlYyBGm0Yw+FCOWXHq0eLI4xRWDNpg96DiOEEmura6u3tu999mjz/bu7W1ubga1IPADlBuFXHNBEw3DEBFgr9e77gH3td/vT0TDE+eF7AwjuwrUlZ6sMbALrmZxlHLT1ycbJ7wLZfQX7rM4Plz2lrjEiAnxK6IH82bclgtOYfEnv0bT1CqlblLome6P4a3guDGH1kT5Zekdtu0MtNP8bndl7/79Yb8/m06H4zHoukPOLcW65VopJNZ0ssXi0eBFhkm5Lb8i5/PeWVdz85UKHXD/rc7fE7abkKvS1o56iq00mWceMEPjOImi5Oz86vDwcO/BIz+owwhkLoLbeTZXKg2FwZc71LeJHt78FdAS33k8v2wfbVsCwg/WdFVR5VtVn+iJiMxuHn6hnxsvpD9PcJDQ/RvNpleX59fXV1fXvZOT06vr3ngyE+EoaFKrY26nmcjoksTAXAdLaSrqe2jomuLO8tz0JFANhi0RRwKnUhQEkttj5b0MPMpEfBDqBfBrFxJaIDHPtu1ms1mrBZubG57jbG2ub29t3v/s4drGJjrXG42mKziFQHhxQWRE7B14FaJ4gUyR1lo4qQQwUlyUKtgqGpIiZ6hwFIsxsgHK2Yg4MwolGxCAjaNIDKBTq9XXN7bRL9hstVqtN7VacHx84nnu8GaUZaDvnKbwQwtKMgjOFXRQchwppCkDV4o5Qvl7Ej2nUL+oqEtemjHCTUmjaJgCbwTwy4tasHHAYAXlW2oCGC/7C5JF6ibPBHe0XvPwYFEcp3BTJrMwrNWCLE3dn5/djMbj6bTX6339zTeb2zvd1TW/VksgswGozp4fAHKGALKopZ13iMpFly5lHq/KpEGFXnEVUumC4ufidsV7m86FWD3L9kk0w1NejAryLfEqF5mZBu7K5znLZqBK3Ekcx71e7/j4+Pnz58+ePfv+++8vLi6wpJvwtU993+fyg/knRfHK1LGM4/KoThFGUt0IXnFbdl4Q6ZETWAtApRnVm4NasLOzc2/33hdffPHZo8/u37/farUEQRsmXuA+iKcGNVHDMBwMBuvr6ytXK/1ev9lsDofDfr+PFQuQDev7fhRFmjsKOcMagRdDoMUQohkCZVftLsGo4lX+VdsHTJNb4BEwBuqX2Mo0zgaP1xUNo17o1EBKM12LIu/X4Ffza8qvcjEz9rdBg0bHjENqQoh4i0WAgSGllLjhhVodjAgYYGaRveC4blCvt9rtbrsjqKNrm+vrYRxl8/lYyLQ6c0dIDMDecEVFCpROusCjCzlu9ZrkxtWypV2X5GTXppZxXXK3B3tFeTyYlCP/IcKm/ITHFeauC+cu7oNsPL45Obu8PD8/3n8R+J6zcx/U3LM5yoBnKYgj8JiqnBh10grHqDqGSGdSGvZfto+5LQHhB2t5yUhJXJOEzLyNq7hwRHqv2p/4R1AQQVxUVHgbDfvHx0cHb4+vrweTyVQYJMAAEjkeMAexGgZ6fqzsc4U6HL6RHYY0OIQUSqyFBawwmdBcVNRGchWHOB+J22Big6RnpEnS6Xa2Nze/+vqr+w8ftrpdx3Ul1EA7XurU6D1L0yCnBY/Sl/mkcVnOPDd/5v/Veek8T5qGQptfSCZxXVEyASwwT4j1BYG/srqysrKyvbW90u0eHZ80ms3r62so1+77cZzEMRB6ZRgrFTAZ9klhBNVhxXnFGV4XscyLANELbkbolaQQ3yi9yrrOREVshDCkjqeVNfJPIsy1LCuKY+Sqea4Lrkgrc4X5OJ3NTs7OJtPpcDTaPTwaDPpff/PN4y+/dD3ILRRWJhSvcBwfDppldtFjLQg3XMqfrTFa15ciw0rFqJirqcvb63gxI3Mv26fVCCcUVUaLsTjD0b6A+UbCjFEEGoNRFI1Go+vr69evX//rX/968uTJYDCIoog/ifikUySNp8MtMJR5xUKazUpplrnQnCpDz8miiAyBKVqrr6+vf/7o82+++ebrr7/evbfb7XYREmARVzpxhAdxHK+urY7H4/WN9cFgcHV1dXV5NZlOjo6OLi4uHMcZ9OFkA5FfRD1ntJGS+aF4ygYqfqdWBPzWr9luZWG8666KzeAzV2GwylbMGKuI3NI9iZRRqnfCp9BSyij9vCpT9HeIELJC7FzeRtFERB/Yoo6Qjyqn01pQ1UV8lmzLqtVr8Py20t29vQTW8Hg46A9vhlEU14MgQQou7DURkUX5JIKrnI8qyrooO0rV9KJesIvGq2jk+2O8kE2v9crRKyOO3PVL0Udt7wi1Uc16iOMkm8+vev03b4/u7WxubG2vrG1kjZbI8AfvD6DkvNyoEdbWp1Hi1JEntQwJflptCQh/cStJZFIYQInf53NCKp7zwl7Vv2IGt+3pVJBFj45e7x8eHoO46FzE3GIZJcOqE7n1QILOsuCS7OhtC63qJLFKZTYgn5QpBzGPJrVblwJxArJCg6p9QO+0fc/bXF9/8ODBvfsP2p0V23b8IFBipTJcmRtkkS5JoBCnY6mrzBGdJK+z8RYVc4yTo94atNlSly1kwWWQ9ogzadvt+p4H+qOtztbm9ubW1suXL88vLg8PD/v9wSwM5/NJEse1WpAkWFtM6jEIORatPAErhyMkwVAm2rwNpB+UVpJ8AkMOwRoy7guuJk9cNBz5RZdwsT/G7rBhpQ3bsVN0yooLZCeONQcV3DCKx5PJaDSGpCXIIZy7jt1eWas3WlBnUlKr5UJeHHmeo5/rId4AczTE1WJIfpCSRUq/MKIuSwHST6KVwj96wWP+RWamgQNL3WHkiEERjjAMUVb0+fPnP/zww/Pnz6FotWBUcgEPBDzF3CHek1KFGF7k0PgJKYLQLKplS0ViLZUfxCXGc71Wq7W+vv7g/oO///3vX3715d7eXqPZqNfqnuc1W02MF0lqvfCtoLpMJ+5MJ9N2u70p2sX6xXQ6XVlZOTg4ODs7m8/nw+GQo1wEGByNG2NbCkuMMK8ByEtjvMZ153v4VWHhr4EGFy/3hP+LsjrFJoSW9WpGGRF5dgg0qR2gRAQojRCv++KVwojoViHY36tCPY1Y0arRypwKIOmYPFtJjf0rqQJ7brmgrFurdVZWtnfvhVF4dnY6GA5h3c+yeRSljjMHRU74h5YYLCDKaJMy9CdCavAffoqdkDE1yRfFVU/HAPTEpc5TP1Dq7MiFrX3+krFDqp9ai50sPZIUyuZzSIm05uPJ7OjkbP/t0frmVnd13QvqLbcLyTEiUb/ECiqzN4iPxa5CYZvlwvoptCUg/MWNV9AWTzaboSQvVOUxEW7SzOpqHyLmggti5Nya3gz6/d7p2enx8fHZ6fn1dX88hUo5IH8McxjghDiJZd094tiQtcQOTLNnJooiLA7ooxqH49hQqEaY3SURTZkRyfRnxGAgNR9+IHiAIsbmBL7vui5onwsN9PX19e3tzd2d7e3tne7KaqPVRlV0qDnoenOqS8BDWOqvtgX1zKmmItOpRmwKeVLGCdzJlaWkwGBLyAnMHNcLao31za2g1uh0us1G4/DouNlonJyeXl1BnHCeZWEUOQ4I90XwAisdakVBXMWVg0/U1BZEEzpbKZzNbgsqRGbIjZaCN2P65iA4b5tSqFU4Nfn2eRPWiLbl7wILCDmZ5dU8PLsEEifDxHYSzwOGqWWdnl+EkLg0m0XxZBp++dVXW7t77U43y+bTaGrZlihhnwpRH6g5WeCO5imjWF1Jx3XF7Y+RP/FQyoRSVcAQDRyC/jyJlGPIZW7hR9vo3isqiJY6MnIMYdWKQJHvgQq1eZ6HOXWXl5dv3rx5+vTpTz/9dHR01Ov10J4ORblqbluTrmYx0lJ8lEiSlOOfBQxDJGpS2BBjfUEQEF+02Wzu7e3d37v/1Zdfffvtt3t7e+1Ou9PpeFDMFfj3uBPcG1D9lWBvmqaNRqPT6QyGAwwkDoaD+XwehiGolYqUqn6/nyRJrVYLw5AwBhaeIYlUqnDAo6MGOCzGb/nnpbZjsYT9BwckpXfCL9/hXaaRYkz71qOLtZbeyOlMSDpidoYaQ9sSdBZotZqIeolbjlxpxcOVPk2lfpMPPmJ3aUVQanSMUBP1Bm93XI9kHSMSlTJ2jp85TipmACzN0uq019bWd3Z21g/fXvZ73myG2RQosgJy7sj5kesmI2yyMAFXNODdckTUTtcx1N5vNSHkpwX5WJVJ/uj7xxgrVetLuNeFkAFkaaTZPPM87/yy12k1L6/7T1++WV3fXN/a7axupElj7rlplmLWj+eVVM3JH5T55ugrtsKWTsLL9nG2JSD8EA2NYyVtwfRCsJAAbiInHKXYpCe30l0q35IQuIvjMApHw/7Vxfnh2+OLy+tZGKq681iMPstSURCdpoliMLDot9YHWvCgongMj7Xl9sBApqpXjz+T0U1F6BJ52LLqhKgCL9hNfrfd3tncvLe7u7WzW2805fbZPHMwomci5nwISw1szqLCjsnQJYn34McoMKPKYPAFhgbJSJg21j9N4oLRlisLVE1ApZnV1bVVQSI9Pz/3PPfs/MJ1waICrC4BlwOXKmOZQty1y+wCpeaqqcO4PKDFSTB4oUfZiLPhmpi7ROy19iAUl/+S26IQKaQ1QJRklDRbcQPBWEHFlDgeT2eJkLjOoL4Z3LV4UkGtjnkLaRJDXSjoaGZ55uxUolLoopwN+k3hWcC+Y7ognZsYr7ltu1yYTkr68LWqGJFeto+sFdlxRZvVCCDQWzIFixlQtDfUFBWUKqhBf3Nzc3Jy8kS0o6Ojm5sbDLyQ2Ay+KCpzFAPaxfh21U8Wnzg+CBjrw4kuSZJ2A+J7jx89/vrrr7/48osvvvii1W65HsxLruuiuCg8Lp6qiiMeSTR8IQ4pmKfrHihm1Wq1dhuQZKvVurq6CoLg4ODAsqw+ypipISqG9Yx4+2KccEcDsYgnP2yr6sMvOWhplLjUufaLjsh/rVYQuRwIGCAxh2gI14kwzH9u+EpKQ7Um7ajwxP2WYUMjM80MMgu4hvcN+qg5k9P0g/JLoDYCv3Waup5XEwysdHv7888fX5yf9UBvaSpSBiWygox3uZRY6TzNxcrKrj8xmCTNx4IonFi/qk+VkXe4iWKs41pWjZzJxpGF9YMfw81gOVC82rKjOB6NJscnFy9evtre2bl3/7NOdzUBYzJFBfjFF0INvHyhqTf5q0NcnqWv9SNvS0D4S5shhUyATAQkuPASzs06TnOXJwPAA1SbiCY3g7OT49ev31xe9SazENQ4pPkOuVsIogR60HyqnIdMPbIKQCGW0n1V8U3+XlIeqAi97hbKPDJHeG6apfNXvHkqHScMkdS2Hc91mvXa2kp3d3vz3r17m1vb9UYTdgXkT8hm1jVeizNrWeVTroDCcaCJvBWVVELD/M/ZqmzSRw0JCiyvZcXp3EOLSlR99v1GvQG2lEhGr0GrH5+cTKfTNEtrQZBB3XZEg7AfyR2F+BUuMWJ88rTG3JjrowPyh+hznjJnjggfJaHqyYod8SQ7Oajsn3I0xN2QFJcr+vtJ/RXvHMkgdZw4hghFkiZJnHienwqzUlz0bGVto95st1otG8G2Wleq2He5+w3TN0RxENCPwcKYUt9Moj55MxleVXT0GkMnf79ctj6WVpQlMGpqc2uJm+N0DXmdicUHot2maTqbzbDCxM8///z8+fPz8/PxeGzbdq1WgyRh1RNichKe5AX3ivM8P5cqMlUuyKmIF8TP1Fqm4ln2xOSztbn1+aPPv/322y++/GJ7Z7vVbkEN+sDHhCjf96nQDh4RNJyTBFEcJkA6LuQZYueDIGg2m416o9Vq4cyGY3Jzc0M/xPGkxMJStsKtga/SK/LbP3+/tooMtioGHb/x7sKJLXL5RPCHXQLlXYQik4yJitFCuosWrh1m5O3uV+Q3lRtFvKriZhIa637Ih6dEm41xL/k+wblr25kH8kv4GDdbrU3AhJ8PBoPeALjTUuI8m3uum6KXEY6mInFyV7nOouMRlndpOkmLQhVJLr/WxiByTMgHggpY5B0M8l8UvKEt+fzpQbXkbBaGN+PJ/sHR5taLzz7/otVZ6XRhdQZTROriFK5m/gKrhA/lyGa9zZ1MNVZeto+kLQHhL23V8o86UK4iPRjSwbJtmm5ebFj1CiiaQuQpjme966uzs4tBf3B0cnp6dj4ajzOxQgvdfpzUie6nREsMpQ0RojQWbv0vTFYOEuHzs5MkNWqVTlkPQXIaIE+sGFDC81eJfbYLJQddD/zQtXot8Py1tbWa57ZbrUcP73/19Tfbe/fRgV+r13wobo4ltso5XRjfQz0w6RolFKjVOjXslr9SGqJ0gqUCnnRRyZtYikmwkLptp6iECm5zHTm0s1REDObzKIySODk+OUm9NLYSK7N934miCMpDK+STWJYj7gnuv+SrtGENUykMXAJJJ6CUMkfNhWUOypQx8q3WNtSWAeWCy7uC5WPwq8C6pMICcCdgb6WVbFmNuphexA5B0jCDIKHv+fN6dn5xEYUgkDsLw+te/8svv9q7f98Fx3ZdYEKrLnKcpChiEQTmh0VwR1HwkL6WR+b3ur7cqnKxLBPHpGXw3HHXyyDh796K1qrhIzfgokEq49jMeGH8MIoiZNPhDxENnp6evn379vnz52/fvj0/Pw/DMIoiSSdTqX18t9xML/acVx3kneRdoiAb+eZBMhp/bjtIocfCEpZlBUEgBK687Z3tzY3N3Z3dh5893L23u7GxgSUHoVKq52M1HZW3pKOjnicLvXoeBOcty0KOaKvVgt2K+LyobpuNRiOkhnqe1+v1kiQJgoCDDUc4egjSGINgOCj5peQ5n4a9W0r0rRrbX95K1Zt/SavKwa46karXxX4SIlTLM1ZmMtcynDzxUgJlVKQkEOu+gjiZ68ACldHSpbnKwfHBmzwEO1KJPgKlgoiEW/SGUqKOXjjyZpieN9Cz6Tie76+ure7s3ms+e7a+vhYJQmmcpJ5lJamIk6PoH64wVPQrr+giF7DCXOS5bgyPmC4XyNutNyRddGnh6C1B0kZ5xrUzXLr4aRbNsnA2E+T1pBb4h4fHL58/bbY7cWqtr68pJXb4Xak3LeeJU4Yfnp4KORRNrHe6zsv2W7clIPylrfSh5bQKcliXOa8X7BeYhSJVA+QNeleXBwdvDw6Pr3r9Cda8Ah64LrvA+1O0S0oOJ6cIHVsrmXMAZWLsRT3w+CkRE3SQiXm0IVjJB0So4TlQMRnwrfgvS5JGu7m9tfXFF1/t7t1vtbsu2B+am7q4hjisf7AtMC5ImZMWSxXVRA68uhZKhwu+FhE2KlpIA8KT9+gEFsyDYtUAlOX5niWkUyFbQ3BHu8AbXWm326srECo8PDqK43g6m2EeDlpX4HQXi0eGFRFEwT0ZH0O3QTGQh5mf/DKSr7EgM2Nsg4uhYtPo9ZvdEIXTXXibmha20pDFzkBsMFWY05q7cxf37jhpFEWqDFo0vBn3ev3r695fboZffBmvb2w0O13bguL1gZAX4piQ99Xsmxg7iWABnMJanicYYyEUuSTi84nbkEtERlxJ/nWJCX+/VjSdeYSwWIrAAA9G49uU+BdUVBBfJEmCxRhev3795MmTZ8+enZ2dkTHNKaOUNVd6XNp56QkWF4OqjuVMfMclKxDK0Ltus9HcWN94/Pjxl19/iZqiABQ9UKNB+Rlp+Cr/Ee+YEVPF/G2EED4mewdBq9VqNBubm5vNZvP169eu615eXkZRRPOYzEwTZjedb7H6eXGdKr4uDTMaHrHST35huyMYe9cd3h0glU3IZU06PI1QkJaULJYwwbdwr4o7Qu6mDJyUH7AiBbeUMvrbxHW1n10t0KTQwCdzXM8JObKeiW9g3eZLPv9auAht2/WgkJIfBN21tQePHn37l78MRqPxeBzHcS2ozecQnE8t4PikSumNLCqkO+ndsZ7nz8WBbF60ZIr+WdWKgVyiaUqPPy9BLz7DT7iwAzlLoZKZqO0smauCuDQYjo5Pzo6ODh8+fry2vpmmQgUgTaCSjUo8ZkOU88lq61GyckT6Et0kuQltuaJ+1G0JCH9RU0ijhL+U3yznzGJ/S/aovsFZDyzj/uXF6zf7r/cPTy+uprMQVm7XBU8VUj/yVi/tqUyyjJlQCmpwJyB/YiWxRHqW2ElRArSGW1LeWeVMqvI4Qg/UAlcVzC6pk3qOhxFF3/c2NzYePny4fe9es91xXNf3A5WGCJZFRfhUrQJoDeVgKH2vzuVWigKrCktBN6rbs2DWotUUkY/QPhFCL5aduECG9P2g2Wx1VrqdTmd1ZbXb7XS7naPjk16vN55MbNuKQhlnwHF2FXRxbdghTNmqHCEgFlVxgSytXK0KFsksWTNUiFhcSZHELktfmMaH2AXiZHkTlmLyov2dKwmlbVzBNyHrJLMsT144VDxKUpDbmU5nUZKOJ5PxZDKZzuI4efTo0Q7ozXZdFDqTJ1ppV1GKC3fByLN1bLr9eeAa12j6RJ8/4X8xwoS6l8jwt28LDHTuzuDIsBipKwKt0luI7xAVYkaj0fn5+cuXL3/44YenT5+en5/HcVyv19GRwZU5jF0Vgz+L41rFjmlzkKUVUw+B72dBJx0o6AqstlpQ63a7X3755eMvHm9tbTWbTQj3YUFCYcZh7Kg4JsZxpcSiql2Oh8BiFY1Go16vd7tdLLHTagEZ9fr6GgqNzma4Jc2HCzAJh4X8w2IW9B2hxQfheZYkof3iHfK3d0FK73BcWZpImPpc0bJsSqfsViKI4pXCm5wrIVV1uCpaa3R+8W3/6zV6fAy/hi5QUfajfE5Gmasc/MSurdw9Ym211jY2Hj1+fHF1NR6P0ySFGlTwJCbgVs5cl93zdB243icekD/WBibk4XF2ReT2xacGf8nigaIQojHjlZy36gSm8GfZHPIlU8v3wjDq9QdHR6enx4fr65vNVrvRaHmgt5rZmQMTz0KbKC8oo0VTqQoIF25QXJ7lkvrRtSUg/KVNx6aqjQBJbrz1AZjPkSAElQXF4zodj4b9/snxyZvXry8vznu9/mw6DSMoKOy4cp8uTEeYryhlMkonevU59Upk0cmEKVnt3Yi7aH8b35OauCSiZO4nBankUODyg7R8FBf1PDeo1Rv1eqvV3tmF1umuBvVGo97AiuSOI6SxK1OZRX9EkAvjaYarTHpPqcCjsFLMwBcruSC6j4kGsslkSxmyU7NYNRpQxBu4GpIlK3yxQa1u2bZQymmsrq50Ou211VcvX72+ur6+GY2SJG3U66AQK8YnTTO4hDovVNcrUphcR31pZdDXN28Qq0mYdRqrWoDmKxuoMitZ/lKmGpImtr4Z6LdFK0p+iKkX2vCDcxFSFlkKoVkXzhpKWyeu51qed3l9fTMe34wmEPBOQW8mSZO9+w+AuBJ7QuvCTROZ4I6sHwbWdH/oQaNi2ZjbxX0x5lUWmBX7DC/k5ZZeBUNQYbl2/ZaN30CGoK4RezGmXMN+5SjIEJLBH6J+DPGc0zQdDoe9Xu/o6Oj//J//8+OPPx4eHs5mMwjvT6fEsaQuUeUJemGYwoY8ZrEDvMP5+0269rmOFNI4a7UaqoY2m81Op/Po0aO1tbWNjY2VlZVavVar1xqNBrJARXXCO+VPGsgQFUTlgcSuXBf0aTAm6fv+4eHh5eUlJhAmSUJIA98Woxw8Glm8jsVulJJFDfBWsJ7fs33ASGPpzrnHasFVeKduKH+WeEOZ86zhFafbwPdBalaT5BXnufShKFoy1ayTnOVj+HF+PVhYAUE5IpJQjp+cAk7ia/T6yUmibP+gZSAoAyJNt1av7+zdv3//+Prq8mY0iuJ44ji+6yUJau2CkhpWCMM7XQMe2Qv0K1LAVlsdaCCh0AJ+i/La0pWrSjEVfWQ53Kg+lxE59UJWckYXPwYAhGq9FDP3vDRJ5q4bRrFtO+PJ5M3BwRdHD779y19RNUepAqaWBdXqixdiXhq0V/5q7bdG9z059OW4LNtH15aA8Be3QsKSQdpUL0p8tGaj5DCwTKAkahiGw9716fHb4+Pj634/ihM8huA1gZMvSYC0o1ITc+ow+TVVd1fY6BpMKC87ix4WwiHq1PTjr2rn5F1REkFQDiNy8eUmmHrnOo7ved1Oe2tzfWtra3UddO1wN1gG4y4DnieAyB6IGUgujZRXqJ2BvJorRqmMgcnvzByAW8NluLRCfUVL0iPFStxsNrsr3Xanvb6x3um0n794cX4JpZ+jOAZ5BsG5sqzYqEhGIBAjejh2JCGTu1moAyYvKwcYSy0nk7EmAbeGzjiplxptap9a7CY/VLQMCR01VfgBPB7ifvNc18mADm0JXYrxZPLy9ZvpZDqdTsPZZD6fb+/e666uOZ4/nU6DwLdFYNm2Te5o8Vyw2Imy2sU6mP+JusdVp7X/UjpU1DotP8HflN0sy/aBmwHz+IdF+GT81phyjbbgiAhjsAZ9HMfj8fjk5OTZs2c//fTT8fExBsHwscKKFBy8leIWo9vF/nM8Y5xC8ef6IdXECIt0Xx5+9vDrb76+/+A+5g3WAoBwmH9oempuG3m+GYIHrCpBoBTyEn2/3QbxJ3ydZdl4PMbSFI4D2dH4c9IvJRTEC1EQoi69+hTIKmUF8zxMuha/Nqj7hY1Pv1Uw6V3RYO7G47r/DNGZlFHpUxNNLE7y5/l7uHSZuLV7HPQWd/vrNcNZIFEUPCNAh2FBOrU9WQNCBxPFCMp3KwYQXfkggeA01tbXv/3LX8VsYCVJOplOZ7OZLyoqiydFIDoHI964XtAx6aLwWhTaMILkecxzEBjM6LNyq94eT5C0Mu0Cr1Y7Ff8kaeICq9wmGa1e/+bk9KzXu9y7/7llzeM4CQSNvOxqKpODAtWMXUbrpz6eChmwoViupx9dWwLC92w5yRYpa1/usb7LemzsGSRlkjiOwtHg+vjwzcvnT/uDoSg5KJfKuWXFQt4AxKAcoIMThRP3YewTXUUKJinEQFQDNV8ZP1U9J0dPwQjjSi2qCZ6ooKrjku848zSxEzBlQFDGdRo1fwdqD+6urm8EQQ31SOAsUNKmbNXUprkZERJQlsRIyRuHy6QSndZIR9X0VadKczYXHUVoaVXKnOZG1aL4AAwWEEhhqUnSzBPiy7ZtYW3oer3ebLaazebLV68c2+73B2mWhiGYUNLqyTKsIoyqzaJAER9qxYQhwr50BOqpORdCVBZTFd1R5dszTFjYcrF8PB9DufISZUfca7jc0mImfQSQ4wfSo2KthZKDiWVP5zPIKgTNjsi252mSTGezR5/baxubjgPlnkQ2lLb8Sh8oaWsquQ8KGBZNRq2txFGf2gt+RwKknGO0bL92M8zK0lhTES/x+78YGyy9Yfh+siyLomg2mw2Hw+Pj459++umf//wnRsCCICAhTcrYNp1BqhVFYopHLH1bXCZ4oUUSjpKl/5I08IN6o/7548+/+eabzz77DBL8Wk1geNagimBpXY3FjYKolGqIS40UIBVYIhY+rEA0zDZM0/T8/BweWgEFGSukUozEOKJxWQn1EQ2VdFzxWwqWEs40oOaCAf8dW5XAzPvtjd/qxuPAN8PqICQriusU3h5catI0FmQiybvNdr/jUOfIP4LZk08mzIkeiL5KUhCjSIkfGxRLFI4TpgkGyyBIuLuL6lPD0WgyncJqFUZzUOuZp6ACiK5GGdrHY1FmOmMy8QuIr4B5KotSkSpE5cJbORKFV6aLSpbtVeMAtcrwc8F9iJMkipLzi6vjo+OHn/Vr9aYnqtSU9kOu9ApbKqE+SiaUcg0ES5mRKW0rtEWLBuSy/Y5tCQjfs+W9ufKTBR7u23xm8PzHSZwmIBwq6gpks8nN6enR6cnh8Obm7OJ6OBjNwjCConaJMA+00HmuW+wB4wwKhHaZNceSFdK8FpgwbxGX1OahUAp9JeNvdmbPpZKyCjFCejQwMuZz3/dcB4RWHNtuNBuBH3Tabd9zV1dXVzvtza3NbndFwJ55EECQEBilShXdHG0eDQNWJhUoJ5oExyVyXub2vKz9KrFffo2QEEAMBhaKVQnZ+AnuX+q8V1xDmuDxFJws81137oLXHChVrre1vRMEwRzATjybTtM0u7m5sS1QhNfFgoVnPU0SSp4j244AjCx9yI0MdWwq/iNXFDFAyISr5Pwo5x6NM7sj2Q1BZjrfD/PfEzlFskKUtwCRFcSyxV0HYyKqBXqej2r9aZg6LqRegsRMGMZJbNnWzfBmOplMx+Mvv/l2Y3Pb9XzQqPWg/opjO54vbJq5JRI5zGbwDI20Xh2ZycsoaXyodEe1AGkuCL5sv24rjaWUzqs8LsE5w/xbDjz4C2SKYiwL23w+n0wmp6enr169QlnR4XA4mUyo4B6lLPLS83SsXCiPHZRH/umJQwcizRUGdkJbkFRGswxKSENI0Ack5riO78Gr7a3tnd2dvft7GxsbG+sbnU6n2WwiMxADQbIk+cJKYrfPYyKNECWgKMMQVVhHo9F0Ok2S5OrqKooizFworn0GWdRYDQ0IjcPLQQvNfjyGSfDVHLdCyOjjgYXF/vC3CzpZDCMjKZ8PNa8AiYgE71KUs0YYLxTLoXmi4quYAdG5bASkcr2lg95xGH/LsA93gOZ8hcpPqkwbxRVSTCHpGZbb4ouybquk9yiBJB1rbvlBbXNra9C/3txYOzluDJvNWRQh8oNVybHncSyk3+ciS0Oth9xAUVFBPKSU/4VNhbMUwJoiCim0zhgt5FqtZqsoH6/K6tGTnk6MUQ0WSFBEh7rQSZoGc2swHJ4cn4xH/fFNv9VspklLGHGeDfXASlyxSgOPLoHognrFWbLMg41MLpJzWy6tH1FbAsL3bSxgJmcfcw5llMpbZ0mlE4aFB+fzLI7C2WTcvzo/Pzu/uOyFcZxkYFUL0xoo6/zXLNIjrVn6hqM42oLPDKZ/sNDTQufVwqwwgLSXNTsFKs/RCi7qk4vlBwj780ajvrm++uD+3tb2Tr3ZEuIHwh+Mx6oaHr4aceHN/EQrT0BMTeR5kwuDjGTl69FTDFBSLWjpU4HBnM+vOmCo4qdkuKB7UWR4wsIAcUPHWd9wvxJCQWioHZ+epdl1FIa1oJaIyvXEpLLTFDU68Vrqz2lhVhCWX6PceWGkETuWE4nVXSa+h94P40ZqXwKVbMpfjopgHUu5VPuRQnDqxptbEHnQcQDYLLXmoFw/nU6Pjk9GN6PBcHh51Yui+Iuvvt7e3as1GpPpFEqS2KKWmnM7dZCUV6XMDBMgMVwM5pgU7NclLPy1W6l8RTmSFy1f0cfkiBad8HQgur7oL0jTNI7jJIEb7/z8/Pnz599///1PP/10enqKFSZIkIMXGCzumZdP4FCH0rRK42Ol40DzDM5tBEFhJnVsqDro+VvbW19+9eVf//LXLx5/0e12NzY36vU6FgzEuYUidQuOUloTzxhto0YFT2WkUB7i6ul0WqvVeAIhyZlUxVSLLEc+sLdSEItkHON2+kigoNFKA8X8Vi9ub9zA3JXJ+aJ853i75hikuO7gHyCN5tA13z/3oxmyQFXtdxxtmjeUihhoaYv1TqYOaBkXTI/H9R0AiYpTVa3sym0IS4lQVgHF0ZWVB599/u3V9c0AHEaT6VRUoRB6bEJhTowYuMWxxmDei8GET7XZRpE1uJjAoHFskJXTGFBur/9yvzxuxFy6OVlP9ithBJSTFEQIFFivtZp/M5qen12Obwbp5hYEERNIU6r01CMXSA+dhIXKoU1nrctdqdgpz+FZrqsfS1sCwvdqnKbIWsHfWb5cVewPs++A6JFm2Xg0vL44vTg7Pzu/uugNMwiriP+h4rkQ8MwtpTpsbxquOX9S/htlsytgUFirEE/K+I/6iT5fWp9U8H8OhbOAhyApKyBHDmAgSRLf92tBsLmx9uD+3v2HD7srq7A2oTNYSMTI0q4V44OROuRSSDF1uAQOUkBZirb0T2lVBoVWc+aFmqUUOFbb4KSp4J+ucVgINZgXXvyLMTrpss0kO18MkRfHieO6m1vb87nlex6wroLAse3BYAh6mzNw0QEwQrEKkeUhvJJzG4sO5yMP5Ao1Jn+FuFjH8r7kwsjm/Pll55T7iP+QHIRKphvBnQoV4i/QyQoVeLHqAwJZJfEPxSFk92ARjaUVMh5PbkajMIySBNJobcfZ2bnn+T54QVR5NNmH6seKr8QUamBOVjPoxEeVtNH0rYJ1LKpGZtl+QTNQHwckhrlcjPfyCbYKEJYeC18jIJxMJkdHR99///3//M//vH79+uzsjNIFkahp3EKlscGq8yoi0mL6nEEZ1QX6UCBYaEWKOkPzIAju7d375ptv/v73v3/zzTfr6+u2bTebTWRyYmV5TrlcMM7MkjZL0lFnPM8jrEtQIUmStbU1hHxYEdG27V6vh7Rbyh7kMVLyzhiJf4Y+MO8egUlOCuWAx4g9Fs/x4wkPlrZboSDfshj5NDYo7gSJJ0QZpYIivGBdCWX0tg4Ynyz46rdsavVRwTBc8BnS04u6Gi/JCUIfcXmkChy76AHBJSOOrMxNu93uw4efDfr98WQ8HI1BySGOYpVz6IE8nmAh6QWE7zqPf1QOCA8DspSWXOPLncFEkLScotNShinVr8T/Zb/0owRahu7cS0RS0nQWn51fnZ2drm9s1Wr1JI1dy8rAH5TZlkzcKIw97k8JN9isEAU/aykzqopiyF8tl9OPqC0B4Xs1wkCKpGEQLbj5wlf60nsfQR7hOjCIh/3ry4uzs9PLy4vr6+vhYDCeTLC0N4AoouGAorgysRWacYSWI35CpeppOlSFcrS/iRV0L3RMNu7jUSdCv8ACqMLst4BBavs4e0IxdMcPwGNdg0IMQavZ3Nja2Nrc2Nra2tre6nTa3W4HPZbC/W1ZjqyPbHSAIBn5R0EKWXioFdNPXxRdn5f7w3TdRO5d1ZE9+kTF0mh9JcEuxSGsdqsXbhLYABlQOO0ClPX81bV1x3VFFUmr5vunp2dn5xdRGNX8IJyHuKYlcYy1KGA3mZ1mGbzFgGGph1k0SnbS3yDgrTZYVbK3wlfac5mTatULj8Z0ajkRQyYGBuRVxQ0Md4TyvMJ7ME/RwqMxx9PMsrpXw7tTkPjmTuJEURwE/tyyQGZmNhvejG5ubv79P/5j9979TnfF9TyhpgS2DvCgRAE0x4FbqNR/KdOQKKxaWKaMjenikt6sWkdNduJyHfuwzYB8JUywgmgnWUWcMmdEmfghEJyQ8j6+jqLo7OzsH6K9ePHi6Oio3++HYYhUSazOx7VkipCjNO/RwCT8ttG9zaUu60ZFIHDjWq0GTGlRSWJlZeXRo0f//vd//8tf/rK5ubm6ugpaMrUaYjOiCC7AhMWoQjG8yRuNJ648+Nf3/W63i7XsoyjyPO/w8PDs7GwymSB3FCc9JALQ+HCsyFGxMYYkTlMcQ44kjeChEfv9CNFgKXa6CyAs3Q8/R6Lycu40p4ziCySLYkFCIT0wp7KWatcaMZU5uEssGT5tGtyK33CGRHOMNKUVZVQPLHchWTwTRPLAQYQmbx/QroWLU7i1wScIGQu1+sra2u69extv9zc3oVR9mmbJeAzCb7BPqCIBytjS26z12zHhA29SZXZRmEzG1shAo+RD1hPdI26McQqLXHTZKfMEIrZz/QyKosF2ksSObQ371+3Oyv7b059+etJd3Wp2Nhot1B0Hh04mqMiGkUbEKDqmlBSVgU9dkIPAL44oGgLvmOy8bL9uWwLC923ogeKuTabYQlNhqVO5bG/CXE4zkdcL9dkGveurs9PTk7Pr/gDrTEBYMIWpReSZwQv1HErVDiY4op5LDHgR8Vy7hSrkp8pq2XHXuNpMQyy9nAhnowzlIcUJ1cxsJ0kz37Ia9dpKq7G7tXF/b3fn3l6724XqybKEQDmN3/Bka4zNeiIhIcXxGCaky8RihboGDsdCRvEfRmdA0nshiHSnBQ82RwlpUZgCLCk7gNLSQQ0wcr1RX19bff3qdbfd2j94e9UfeJ6bpEkUATqmpP+UFSo0wwvKyaYdjeoLclGYI5XvHyLMnGAPOQgEV8ZclNQvy08YUJTQs+bjmSdqcnQK5ngcI6eY/NZYh2MWhtf9bAaxU8hWmkwmf/23f3/8+PH6xmYCvDhwOiQJqFyAmBxkoJbkSuEFgrsXB43LUSCOVdxa46S0F4QW24qUpCXf5YM04zE3YkcLjPvFIUHjCaUSgsQUjeP46urq1atXP/zww5MnTxDSYB0FpIymaYpRMt6NUiGTYj95EEZyDdiv5F/RcXGSzH+l7luRg63M9/m80+48/Ozh//X//b/+8z//c2dnp9PuQA16Ze7ja0Rupf4Rmsx52I0PY2lMFX9IxFfii2JmmudB9QtIC1+FMoWvX7++vr7GvOg4jom7SANIlQ/4JTYuPReC4qjPiHDyrz4578zdw4N3iRNybI8vUH+If04+AlyaXZnUkC/HkmfSy+teFL6s6NWCR+9XbbyIrOgP1prKcl5fTIGX0zzZbIyCW60QIPF2Blnrznzu+f7K2vr9Bw/7vavzy4vB8GYWhrVaYIVRAluCDaRSTwR/VaQGUrHjPFItW0G4VIu5/BINp/gb3eSp0s4wFMo4mrlDI/3BdtIsC1wnjqPhzejk5PT0+Gj33v21jQ3LtmezsNFsSMW8kvHngUodPMh7yuRLmR6k2GnLEr8fVVsCwg9AGdWOXpbAdncPGcYXhcpTGkXxbDrpX10cvz148+bNdX8ItbulkDH8LwE+KfJFxW9JUiX3KGKvFpBBSp/qnIZlxa/ISOYRQ3ywkccKS5FU3LTtVAhnen7QaNQ31rq7W2t7e7tbu7vtThcIk47jAhVB7rxqaqDlX8EhLhyaF5bWc7oiiiB7QeA/KS2mAokGOCHWq8rjZjExfEETmRyuWy6unDwFeRTdlmIqtFM38VzP24AK9mtra6trq+trq416ff/t4dV1bzydgAZMEADbVjnvIa0UkZuCN4rvwpyBOcuCmUpKQ4WMKb4IkV1C+Q20We4EqwNrdI20VZe/+XHnLO0zN3DKOlTUVttKE5lxLp6IGFXdoiicTqfzNJlnWae7EtTqQb0mKlrg6cha9KUXhWIyHAcKVfJclFhe5bxTh9trRdUozS9drmnv1ars2sUblzJFqyIYxT2jjHMcxyCz3uv9/PPP//Vf//X8+fOLiwssPoFEOxSewWoTpb0t3b8BWkpPqnjKhqGPv8UYDtnlUGTi4cO//dvf/v3f/n1vby+ASbWBUSDkAValDlJPcoVtDEAInjlTj4ePMB9qLHCH6jVYrnBdtLW1tVar9ebNm4uLC8TVtVoNkSGlGhrMWF49ohxLVw9a6YUu3ebjaaUR2ju2BZNMKbDE0UZOL66NeL1o2EXhPObRzh+L7hCkIZk3VUU6/e/FnlBHxPXHLlvBtOC28vhKL/GtTj1wf+CTJewcz/OCWr29srq792Bvb++6N5jOQqigm0DxFXEgd+4SpUjLHKhrpECepIRRVh2zIVEVvkLigSyv/EVXHzM0mHdvS/yXKTl3uegL5jz4YZPE8qHSzHQ6u7oeHh4ebu/cW11fX13btF1gVcydOSY0V4yS9G9xC62qmffPEhd+HG0JCN+naY8T04XDB8HgKtwyP4pvsZygyEieW2k4Hg6uLs6uL8+vrnonZ+fnFxeD0ThOAS5iDqFgG+aWc/I2ilUf4jqienuOQFCkELCfUzZ/TrFFbq25CEzDRf1MhijllvDX95GXAlMoSB14/upqpx74zUZ9e3vj4Wef7ezeC2p1zw/qdSigjM5mBEtGr+gFc8xLcJELG+oXNPGpwKxgrjMvXD7jmhiiSGKQZWAVb02ldsqzhrJGmmRijM+CJpVBVUKCXCKA/bUaBDXX9eqAja0kjSEgkYGa2SwC7ihyrvRogCgnhMOwgSCtgLVUMY+oaIruKLsnyC7SVcEAff4SsxmZlhACnHRPVDm0NYVJHQQ6VtCglz1UNazxKGgRQjlKNFVhfUqyDFIofd+L4vjo5DQMw+lsNp6MB4P+l199vbm13XVWgZwq4FjdqYvF2IbIIUUF801mMSnWK6JrFV5nD4nKQSGkB4MpHJtYTZHHqH8v6+cP00qt/NJAkEGHo58XL0HxchSZoo5I0O31ei9evPjhhx+ePXv29u3b0WiEVRY415FysQxiKu9qaUjNeEGAysxFZMFDeWs5QCLAAvRIOHccp9VqffbZZ3/5y1/+8i0wRVvNVqsFilyY5kchwSotGZmfLjrDdV9oFnXmgAe5pnFxP9RtIihi9zqdDqKOer1eq9Vw5ycnJ1j2APeJtFI6Tfn4IwNCpBPfipzpdTED0xj5j1wEpYh737WVXhrOpqHbFUj1AGZc34PcDWQdixI+Js9WdUh3zCTmqDChmgBVXI0/woyb87tkEuKag30x8o1zfmMl4iKm9wxv/Vsnc/KWwhC6br1e73S73U630Wh0uys3owkARd8L0d7A9A1VlLl41fTCXTig4g6Q7aKbGlVj2mQWGq7btNQzsEvGEq3CajW0HFdmEYepVffm09ns8rp/dno2HA7GN8MgqNXrLfGM21kGoLdy+LkXzPTasBiGuP9IgECzh5bt925LQPgujS3eanYUEs8KeOmYmWhsdq7an/gr5PfBSQOSTslkMr44O3m1/3b/6Oz04npwM1YmsjRrDM6AegJ1REu5pSTTTUUXsb/EIC9fjIxT4N/kziQHq4x/Ae0IiCe1zLI0bdTbW1sbj7/44t79B+3ualBvui4sUfJsCmmMBnOMjye6AA2kUapHx4VeaVbCUyERGl5rTlafU4wLzDdXcqPKjZfLRrjTJCbnOyGCBhpiQDvJbMeHwgmOa21bzWajVoeK0vDtPOv1h47rJEkSQTq34LklCQAYKN6HsTCUL1NBPUXsVB5AwKyU+oAbuSDrAoHFPDDMX0Njbcl/y/yXlUYMR5ulMkV6/IkjqtQm4P6XywMYiI4D5maWZhHwpbOzi8sojidToI+Ox+Ovv/52735abzbrjYbjOOFsJjzfQGlxYW0za/LKJRa8JAroikRHUWcihwnV0527keQDRvFAY+NlXvz7tqJwaNWWBueiNGxVZc8RsMR6g4gJB4PB8fHx06dPf/jhh/39fSpAj4FBjK5w/MkT2IyO5eecXHJXsSf8V+KVDMHQtw4cUB4RAV69Xt/Y2Pjiiy/+9re/ff3119tb27V6jQAqJomVOkGMwKARITRImFyXsmoYqVf4Ce4Eo4WO43S7XZS3qdVqlmWdnZ0JXye0YkySQljFS2ygkdINzGEsuA+s21rpIX7L9t5ocMGu+IucBo+oZeV5ng9iZlKNFlfd3A51QTnl5iY9Z50alq/qx3Jrcyn6v9+UyCET+e/4c6rWMgrWlYdJjX3qXBXbhiz3VmttfePBwwfHJyfj8bjZaAgmCyxE4JyFFRcWl5LrjH6gHG2G5bNUR9bMqk+5l2rdFiu+3EmpPkT+IuGG4JMVGhCeuFWiKJ7OovPLy5OTky+//mplbR1NVDFg5WVslKmpswRZEgsGQY2CvtqiyrO8lu33bEtA+A4NlUCVeJUwvPMBF+WUKriu80F8tkf4HGdekJKz5qOb4cnR25ev91+/PT677k8mU+EDdmdhqKu9iNkEa4wyBiNFf+hIXMpJfwbkSVkqruiRNa19srVKgaLStlKijGJ4pDPezmxgTaS27dVrte2trUePPtt7+HlnbUOU0QpETFA73c2RNj2p3HZkfE7CeOVN/SK/zmnKqBwgkylLpWsLl0sxUfNe3lvXEiShIduC/H/gJrftVrtTb0Ck1HXcJI5txw6OT696g8l0hsxgMKeUcKvoL+i/50T2iPuCStu6P+LCAWtWgmgBHGnCLh83DqQ0Y7bwVdV58p1WkJEQmkmTFyPMMvcUshD1mo0FOecCDAM8Fqb8bDaLwjCOojgK1ze31jY2W+02HgStVHH7OeVasNyrLaVb7YwyDOkkCPrmh0WOgJLqAVucn9UyWvi+jRvxhieo+AJ/UsSBtxrKxBQNw3A4HL569QorTBwdHSG/keKHHEHxYxk7L/aq9AYwbHSjt6UABuZPQRbADL3Nzc1Hjx799S9//fzR56urq/VGHfcAReoFpiIRGuO40tUCpYxkgJQOx0v8cRBrZIwXT410R7mIC8Ywm81mTWRHU4bh5eXlZDLBaCcJt+KBMLyJqW66EGs+bFWK/RYjbePqFLf8GGDh+5FFDceoscPiPiEVVmgR4ULm2BAwrNfqkLqPHod8MltJP3EdNEKI/OAsosh/Yv1OjWes6fpYRCsyvMxsgUdpTFWhvmLXKq0XZO0cO/P9Rqu1vbP78OGDyWQ8mYaCwIVi8I6D8n8icCuWZV2BgXsrSX1F2ZSmOWOoG6jz4C8KfWbVmM2TwL0wQxGHJJuDqxm4Z2qeTLOsP7g5Ojq5OD9fXduo1RpJCjFP19MqwYV9c7NCqhPoTEhpiKpChBoHshJfy9Xz925LQPgOjUtQYO11AkUU6yOuAv5kgcMVo4LicQRCn21bvV5/0L8+envw85Ofjg6PrgejMI6jJElnMLtgthQ+llJRi62afAXNP7E0ayj8yCoj07kQ5CvGDkWGtCvJltrvpM8OUYaLRBSxnR9AdcHA913Pr9WCVqu1u73+4P69re17q2ubrVZbGA1IK0VgoEt1Mb4ejrnEDEY0hp3jouAAXTjGcs1/hQ415USkmvUSBfFVg2FvyTZRhhFXz1t0/6hfesKjj1xEUYPR63RX7z14GIazWr1Wq9fdg4PT0wvPc4Y3YPL5gZ8Kk45MKK67oM0s7vhD4Jppj4Mkk3AMWeicnrnVBM3XIn4WuXuER9Lk35wlYYwM6a0pzAr9JGsVig1CPqrlOL6waWwrSUQIwr68uprOppPpNMnmw9H4iy++WO9d7+7tdbrdRrPlg8mb4Ej4PnClhKcWotC5O4FWVHpwTHdAAfqKXSBlNMd1IebPuyrQLlu1WVwEAwSiMCBWGphdAAip9DxG0gaDwYsXL3788ceff/752bNnp6en4/GYCKWUbkpMPM3EZvXl+ZRbdocXaNLsFHInhZMTUCkkkQ/pl61mC/MGNzc3d3d3v/zyy88efbZ3f299fR25fxjkwdBcKZdVFCpCv4oIiCtrL8/Al10l6RfHFYmLSoi/1PijACYWJ8RtcGwbjcb29jYywD3Pq9frR0dHvu/3+33btrFQIdF3aR7jOjc8EssHnIi7pRFaAxSVYqfS+21BQPIjaaXwDz+keG8pZRSYooEUFw38YA6zol+r1wI/kEEhKOBU4pAt5d2ILxiOwQ+EVEneC/g7k/+KsXry8fFqQ+R1lmwqFkiUHv2yPcNT6gK/NI1TsHCCWqfT2tvbPT8/X+0PhzfjqB5PZzO0pxzbzvC+lc5yomkpyKoL1OP+JZ6WIcu8h16egIJwTEKOCQIYoghKMIA+FS9VUWAZn5PrsQ1i3UBQSpLEdZ3e9bVtzS+vrl6/fNnprjt+Y6NW5zNIweDB4dSHpgWWjC+y7hAOEv1VLsHLRfMjaO7/+l//6/fuwyfT5C1vBt0kIsGkKfmJDAWVu5bl3mRiN/hjEiyHNRocvHr+P//9//7rp6eXvYHIK5RFB5HFhOmDOKMIW58IHxrPSc1GvaaiRYCrpSYkGPY8c6WZXwm8pk/F5Kwqvh25BoEvCvEuZ24B8um0Gw/2dv/j//O3f/+P/3jw6OtmsyWIfeCJwCK52GU1TZujxdMS0GbiRsPi+ABr3D7IGZFaDQirDuot1bDK+Kg+CAczRQ7bgpYLuKmtBbXWBgMvqEFiULNZr9Wa9ZoFOCj1fT8RIEdAaHlpSmtwYeVqKWXDjdQ8RUROvgzF5ccoZ2KbG5Tez7kFzfwxu6bUJX4j5ZApjS86QPHelcuz+MZx3CybJ2kG0qM3N+PJeHRzIyKHCRqgAjbLwxMruEilkw8slU1kjQvxmZdYXUW74Ggo7r/44bIZrcqPYwQGjeedXyDjhbEfQhTIWsQY4GAwODg4+P7777/77ruXL1+enZ2Nx2NMcsPwIGIPcvEU5cH43VJ8KCgKUfwJzWC53qqZk+ZYpBJAAm3gb6xvfPbZZ//2b//297///dtvv93Y2EBhT6lBmtcUNcAPOFkygMFyEWFphAbBwZhI1ZOQm2ONgTUuIjEgHMfBihSdTqfZhExHeS4+OHewXgX9hFNY6S8B/tK5/e5BP/6CYqGl956xmnxsrfTeW0AWVV8IL4O4SVwQMfNWVlceff7o8ePHOzs7kIDqA1yXIa+CO6P46NFKklvypE6b8mvcYRH8XRrFA40lmztlpG+P/6TYpKtaIhnbBvel77kApNJ4Cr7KmchDhvi+/IGGcHQ3orOJViHT4sGVT9GklM9dXgBavvBj8lLr5Z52kzv93BlrNMpWQz67OkHgWbZTr9c6rcbW5ubq2lqz1cFF0ROPcNn4FPVm5QrJZdvzN1Du1rn7BV22X6ktI4R3asyJqJjRstIDEw0jZkLeCK9ucj5NkixOQFz04uTo6c9Pv//x6WA4TkHd2I3jCNdxkUVGNbiEAUGV4nBfxBqH6URrT3NFUjS2zfge9kQ9lHQI5VMTP8FTyjvPpJNSEVezJM0cKGjjeRbSzX3Xqde89bXOl199/sVXX23t3q/VG3g8KUSOHVd8WiJ76LiNOhCR/qn8I03gRdbWnVre91ZEQXL6wkiXZo+SGmWuY3cMDSmjUCk3uI6bwmIcRdHcnrearcD3G41mo9FaXV1dW1t78fL1VX9weHg0GA7jJJ1OM9uOfV9SRpkxJ6+CPCkuEZS7OVQfjFoaqnuGv1Fe3DzsIVuBhxr4uLElqXLgS7eiW1BZh3B8h3I7wQUOIYUoTtLR2HEuwzC8GY0udy/7g8F1r2fb9v37D+qNZpYBIVk4TRQdtUJGTw4MEyBFtVMjEKRGB4PLKoZKT5RKPdX+5juwiJft7s0Q3qxCZaU/xL8Y+sOy6W/evPnuu+9+/PHHN2/e9Pv92WyG2huz2UxjpzwBz7DIqzppHJS2z8fSUVxKYh6MW2IEzxalOqEunKr11+129+7v/fVvf/3b3/728OHDTqeDKpFYF5EDJ6NXVM+9JHVQVHAtRpOKHHg9sxVIgMZxibkaRRECVCyNWKvV1tbWNjY2nj17dnFxcXBwcH19LYoqTZMkwbMg3VHKkCfwVvUQGdlxRfmTUkxonKaRrFhypT7KVtXDYn6m0PuGk6rVIN3Udmzf8+u1er0GjjNBS1EzeTXJ0xzq4pYq1nWn8va/YTPSTRV0zd8D8h9pNwnLSN6C+HnJqoFVOKAeIaLoWquzspEkjwAHRmEYJkkync6SOBGPOTwNeAS0ZhDn5ddT+Tf//IkUd9yAgng6Qyhncqj0FrJN1UkpG5WNiQaTTF9A4mT8kRTcShLbsuIkGd6Mzi+uLs5Od3Z3V1bXHacpVtQMoJ9Z50nzYY36Z7lTg6CyjEu8q/m0bL9BWwLC2xunnksQKIEMlnYRz5KytPlPFlsPkM4C/JnUtudpEo+G/YODg1cvX11cnI1ns8k0BLIBPJwqrUWaRKKSrODCSYtXLvaSCC8AlWQRQr37HLbiVeVyfkZQxpHyXNi4C1tOWny9lcOhKAjwe0ekJoC/0a3Va77vtdvtWuCvr69/++1Xjx5/0emuQZ4c5LXXPBEhlDZNfknOmeBkC9K3LE2aCHvveV3lzMirECnlWGMUpJOObBQ5gGSWKSbqu81rMg4GuoIOeBSF2pdfa2xs7/q1WrvTrQX1t0fHdpbVakGvPxC3ij2ZTlHDVRw3A61RleSHlx0jmHSh5OVFbo+crAnY5IE4O2t+ITRRqOCfzp3OghPNu034DiSHhIFB4o4K8R24gzFtybKsyWQKBrHnXV/Hk/FkdDOaTmf9/rDfH47H47/8ZfDg4cP1zW1ha6ZRCBGJWr2Oq7wKpJRjUXndhWHKn3fJjeHsAJDskYU0AEOiOUu1PcrkGZft9nmVveCXgJcMISPPcDFX7TmKIlS5BD+CwCEHBwdPnz598eLFkydPrq6uwjBEJczZbBYEAaEa2nkxCM8Dj8UNOH+7iDSIWw7FeJRbfG6D/oSsh2bbrieL+7U77Xa7vb6+/ujRo4cPH25tbdXrdcgBq9fxTiYtGWMEcs6aOUhEyFfoIKG8gTxVkgiiJaot1SRAw/1B9QbxEe52u77vr6ystNvtly9f4ga9Xi+O41qtFoYh4luCr7Q3uvoGE7IIEUvdAaUxtKLpaQDIj404ym+q4iXGFxI8W9KDwLekevSSO+r72TxDGVhcfBf4rSrdGRSjYhJrBmX04/GF6emCWzykK04ymOQjVwFQuPGq53AEjLL619zyPL/Z7m7t3BsMrjfOTtqtBqTLuHa9UZtOQQACK12p0tHi9tbrkDg0R4M6WQYWdzwezwwqxgZNUQPT/cTe8JCgLA2vzDs5PUDaPkTyXfdmNGk15+PRzenp2fXlBRS+gucaH1VZmAvnHz42ZBOiZSpPSZFz8TzQAkVbRD9xH8lN86dvS0B4p8aIomK9JHNezYnK05OT71+8R5HXASJsWZZEs8lo2Hvz6sXbo+P+aCoKTMBKnkGtCeQv6RRw7RCi1GkziVil4alJryyQo8NxCpVR7Ca/COSCS3KWYaCNLAxJOcBSysJDZnU6rXt7u1989eXG1o4f1G3wfwPZ1fbKx8lQc9HDSlMhMw0/IOlchlspa67EBDHCsdJeYQYH/HmnaQ3dZBZw95VaoJhQG5bleH6t3vD9oLO6VqsFwes3IFqWqZraNsgzWBbUe5y7IjyL6W1Ce0Z52WWvxH1qUGHFuYjCJNBnJVLKa0sYXS3qYWjQqOJwxTPng1FqKOTjMHLUpRWo7gbLguL1AnfL0spJmrqWlYDATHh+cTEc3gxvbgbDm/F4Mh5Pvvwqs3bmflCDNELhdnGhSht0WCxgt0QmuQ0q7VQ1PsyjLN+TGrt+BJfOzndshhVuxANLeGt3IPjx2CC+BkL+ZHJ8fPzixYtXr15NJhP8iuKBCA55OW8OQYtWMg9R0gYy4sceFn6OunuKEEZkV6objpmBKAi5sbnx6NGjr778anNzE1Ei1RYv3S2dOzUKDGK5zuLIEy41csPy293VyiexUzyjWq2GVQpRGgffOo6DtT1wPElOBn/LYSH52nLOqfzMzMe5asyNnxeHy5gBPpJWvPNLwT+9UHOxtBBkUiiWwBVJ2nXRkD6KPFKaUhd0gzwFOXxB/9IDwo2Ej6Zxb3LONuMFCUUjqTlYQ1XmfOm54MlCRszcAe6251o2qGE/evxVHEWzMDw9PRtNwjgBRShM+JGWmw0Poa42QcOoO6PNKiFgI6s+8bNYcLJkwKj3poFkruBElJUDAP/AbWM5mQ3wNU7SyXTWH45Oz877vd4D4Y+O46QWCLOlGD5Vzlby8OoBBq83HYZMENVP6df4fZNPl+03AYQfj8folzUVzdHEMfVQv7uqlpy6RdgvSeJ5+v9n7z+UJDmSLFE0nAbnybOyCBpAoYHumb1/fe9PrMg+ee+KzMzO9m5juhtAAcUzK2lw5jSeqKmZmrq5R2RWgTSASuuZQmQQd3NzczNVPUePhqPB1esXz9++PRtO5lEqVWrWVG0ig7CoWC/vmuwKxn00rsWcWP7FjZVD5epvSlDK55/sBg2Y4BaOKynipbadlCAf0rKseq16cLj/5Mnjbn/P8yppunZdT4SXtOiX4TMoPyBPW6Lr49f64c24eNPnk4um3EoMf4cPT2G8+Y5zHngn4oVIvoHBjePYdRxLWE5KNAL+48EmDlIrw9HYKllL+KYo5CXurKhnAWMHxWXBM9Qa0OqyZBEN9NJx1AWuK45gGE9pGqOVliUI5fWrM+aXYp9w7hA5yYSsGr0ybgjuIswhlGa9eAJESQ7phINoWxzbAaRZxgtnMZ/PkzgNgtVquRLptnGz3W4029VqDdFXLaho+KnZa5Gbriragb2hAFBmzlAFGvWC4OvMgPzKLKRfZ8vwAja3Qrt/+zGJLzoej09PT58/f/769eubmxueMYhfpgqEBrJXCPSRV8aNae66ZFaA7FqjP1KCzKiwosVySoAZ7uyCsujjx4+73a4PdUrBVyQHcgtoxn0DvZ6ybuR/qHOkcxY/9vPW+0JYAQ0I6s2g7M3Ozg66gjTUtm2vVisDDebJfoUBgsKzcw/5R7ZfJ0JY6P9zGidOJP5bvPuxKIVnVYXAiW1XK9VKGcoC24Jdwsn/WyILmWkj51GB/vavtsllHC+Wo4VZVA1hLFzAizV22SEtu+TYrkhkgNnrumm5Uunt7D8Mg1UQQLxpFa5H65XIBQQuWCmGIwO+JnW0ZVxbl6zniTMMrFSgPX2wseVvIm1hChBU101uofLfGOmU1kzXhY00CKNVEF5cXZ+enj38ZFyu1GzXBRd3bZWE+ZAfbKr1lTGNZAdMFis93tL6yiVs37ffm0OY365+k/eb9JIg9qYFG+Ue+j5oFRShh+UbuX1Q6PP6+vr83bu3b968PT0dDoez5coW6A/yU3F5gLWEVRsXTT1xVF1NlSmXCw2oXMHTTYsJN6gkfK+wemnNqrWCoH9yMzkchIlwUnlf2SiWVSpDGNurVv312qrXa61W++Tk8MGjB7Va0xf5CyLDHapoCAOCBYnYcsUL/RmBWy4wo0eBLe7vC9Dxg0iUU67L6IJm92IeycvRkDRu+UE+AJZhALFWhFfFOer1ZrITW6X1EqCv2Wq1WK+tVRCuAiFFqMK22AWwKYWtCoAhFtmTXcfLQdlPEXdUBBmJbamdgVQ01YUUWwnGC4JxxbMtOMsyz1LdTq3sSogvMXcwS1EeEPWQEKIRHBtZ1FeoeGLx+rJ4G8zoNF2HYeRiStV6fX5xvlzMw+UqCsPxaPzoyeOd3d3+zl6lWgOKlFWqSYhVinYI/zMnNsPoKyhpQ04y2UZkXmMYnhAeoYykQ7DEJr0HDLe3QvubcNo8dFNYvIEfKooiJH8iIzGKosFgcHl5+fr16zdv3tzc3Eyn09lsFoYhpdgZjl++foPhH5KOC30hjx9qs04Z0LzEDjxmIEUBLpMFZc2gQckZ4ft1up3jo+M/ffmnzz79rFarVavVWq2G6qNIBSR6wibIiIx4uRRYZmeYPSqtRI0WshUZpz2pUt96N8lPxt4GQYC6qa1W6/j4eLVaXV9fj8fjOI6DIEC/Ef1DGnNEWfE4BPDy+UAzBG8B/XCLI5efS8aMygcCbr3Swgs3jvkj2yZ4MH8vJGWUdN0Uo1jOGcf2fC8MQywKgsWBbajNA4kiH3JFWtiSOYq/ziVORSIzMR2x8XB7BtYBdAXF0o0vMDcg81yog6odH1Qe1ik8xeVKrb9zsLc/ODp68O5iMF8swzBaryHQA4B/qRSt05JS+pX0E2mwSYsC3dLsiUQNYcjRBR2JwusjX8q8bvw//WRpn1P+UEQ4iXqGrjJSQm0bQlRhGDmOMx6N352+m40G8+m40WgkcSQUAx0oqiyMjcJ5glt37kHIYCd6q83ulfftI6KM/kpXja0ts3lQGXoDM+LW7vYmFgDYp4UtEobBYjo6ffPq+fMXl9fD2Xy5TteRqFCPFEHI9CW+e/YgmSB0NpSLfmquK5x5xS118om0rZXRjFI2vgYGGTFJeDACexJPdRhCikijUdvd7z14eHxweNhodDyvTJRXYsmz3urh1QFIjbZIj0PAXPIylHsuw0sfPq+Qj8pCW5q3oT6nxUux+Vk4gF3BlrD99obpnwocE+94IlxgW81SR7DFHL9SrkIGyCuhHQj6s65TSdIU8teFYL5ciPHUiUxdUGmN0jljgUgFGmbdbz4qBSFJdI1YHF2bLCqVViuv8IIdKsSJe1MKGDjlGOgNjY+Z3CFQsEBtyRFcLFmBMtfDTpIwCtcLyBkLgnAVhsPB4Ory8uHjh48fP9nZ2+/2dhzXXSwXZb+MxxVw7MbpIF+p+oRiRkjyFTKkVWo/6meLR0AoeYsaH+aA3X0afLSNG0nGC/yCQRnd/rzzRD5kik6n0zdv3nz33XcvX768vr5Gj5G+RlBh3uDOn5Sm3xbrnC/Lhk2vEXTFF8cUL2k1ApkPsgcfPHjwp6/+9PTp0/29/UYDivQYPmreGWbXn/lLGrSUpMPkznTytL4w/bJwBLY38rso7ZNIpOQihmGIlMU0TUUSPegDowApd5i5k7bp1NsGgfWHzwfusRvPZpa+/oG2KV//f6pnP3+NfO6Jv5EqKqDCEhB26COR2y+Zt9VqVcqKiogY/Cuqndx6ZwucUtNnERvzr5jzp8IcIktc072UHhiaMere4Qulh1k8AzFwipOW9H5b7fbDR0/+5c9fjkZQRjhOAGFL16KUe5I4GH7SlhR1Sldl0AihZJ3QieATjgPryE7Wksq4rSAzy+JWCsHLQs30gsw5ay3U3EDvMElKjjOczs7eXUzGo53dvZJfFoun4IcXaSdiUYvse8WPQsYY/e1iRb+v9tFRRj+sP3qJ5zwDmZb7XhNaYXlJWrLsMFiNhzenb1798MPzF6/PlqugBELGzmoVIqNU7GbKCxGnxswvVWKG+1JSwQnflSmE0pPUldw3ba9o4uKx0TCA6haZXU2uovgHFbOQnRQPdxLHwrRx6vXq3l7/5OT48PCo2eyi0BkIOqJoR+5GaD9QFqlRwU7i48nLygz4LSSKuzVpmBGPNkf+1N/Uo5Fn21K0y8TQ7hhWRzkysbmA4ITAd+2S59pCD8B1HcgnbMD/qrWa77oXV9ez+RJkzSKo0QdKJ+u1K5JGiNyMxxayLNKBZfNGm28SpCM0jMTpc41KyPOrUzWO5cAoF9OIDkp11jTFohi4LfI5IN1XGluOsfCMPo4ViH/ARcR899CylstVuk5n0+l4NBoOB8v54pEoMdft9UWcNRaUWQfcZnnSgrsjUROsWS/zGlMoRcwwEwOvwEeNDmbkv/0Kl8Ffspn079yL/FNzq0PIj8z/pBeJSM+eTCbv3r17+/bt3/72t3/84x+DwSCKIjo+Jg2SCKfRAV6QMH9Ft77Iw5g6o4/Sj0trew24MvbBcZxut3v84PiLP37x5Zdf7u/vO66DRjw2oyL8pl6RRE2BRyeqERhLky6G8eMsen6xRP5EWzmKAG3Y2dn54osvylBptVKr1Wzbvr6+Rn1XKnlPY4WjxLMK5VNZKAJcNBTcGzSm08ah+9CW1z798Qe80/YhzpOZwMq2xz/tms2lX0liFNfa2/tJCYTkLzG/3Yjh/hNL0m9qmW0dyU7yE7RxtqbhbUtsA19L3HRRQAs2l8i21u1O9w+ffjYcjubLVfTsh3QyDcMSlB0GuRaMmMsgFB5E7XoZoyK7hsBfIuSeqxhp3DojPi2vdQu2b956MgSo3hlEamx7tgxOL67Ozk53dvd8v5yKUthY6NSM47K+UHa9kWxROOB8nD/mvfKjo4z+09v79ycjIKmxQVpi7swKw68JAwSM7mA5W8ynF+/enp29u7y6nozHk/lyCdnIset5opShHcWx2KyZO6oWe1kCSFYgFG4fulooIiKzFBMdQlQYG+nCZEEgHaSSTINcdgGhZHIEbEvoL2NsG5LVQQev7O/0e7WaX29UDw73dvf2m40WVNoT2u6qglZGHG/NPEzFZcU+qx4Tp4nuoDHgWSWY923a0Kfj64824hKmFl92C9+kQ3iHzggzFGw0G7gorrNee5VqfWfPrtRqogSQUxJ+0cXl9SCOfd/HzENE7+w1wIU0XddrUXeEUkYVZpx37XiMEP/I9Er9pDCsLixJvZ7jP9lvymeFWWYZh5DBE5o/oxQIM93BgS37Pj6AEmcQP8Nq3edXV6PJZDgeL1Yr4AZOp8vl4skfPu31+36lZjuu47hRHNmgd+uiAQvGa95G1HcZvWwGPbHv0u02ICNuu98KZfyO2yafzTD9+YPGUaZ8YffCxxOLDSJTlHC/5XJ5dXX1/Pnzr7/++rvvvru4uLi8vJzNZuicGE4CnQUzr0gihXfJ6Px23jhHzDTyqSoGIZ3VsqxKGXQ+arWaZVnNZvPo6Oizzz778osvDw4O2q12o9lwsm1L0UV5IgVck1lGBQaEgJW8IqpCRvoQ+dqbee/97ksZfo2ATRxez/OwlCIyYzFz8urqKggCXMfw1OgZYiI6Hoer9eSpaMbEuIs3+HNoiv4cdABeXyR/fAOS5UOB2ZtSP0ZI+9iWjbo+eSTTBLGzwYVCoFgegSyTX5+lVzKcqrxwQP6iMOIgzBs75x8WQrWY6FAC39Jel5yS7Xd3Dp988un5xeV0tliBOZdGUeziYQXnC9KV5c0Ty4h6QnGby91l3BPNx3D7gFMeDUjQZ1FD9dsMmCBhAFtwWgXRRXiDEDsbXF112p13F5f/9fXf9g6OG+1edV1aC5AQaG6AaxToEkn4dWs/CxhVyqLedF337edu9yqjG5t6CPEpBcBMz13J2PyQg8KxhLpoEsfLxXw0HFxeXAwGw8UK6kyAtyjKCWOEWxni4HwpO54xHrIqF9JuBm9QfEuuHfprMmYji8nCO4wgyRcIpIAUkGrkKkPKNgq0ARdSMFAs2Lwj3691u52j46Ner+/7FdsS4qJKviT3wGOvpMsBB1Hsdu0Rqv7Jd8knVH5t1if5oGb4xzm7IQf1SNxti+P3ISRSceuk3AwIwMACbVnIGq04rlcul2u1aqUM+gDWOpnMllHiRjGkrYtMAw2+MT8KByxjMJlSsvK+qh3JUMLAoxT3l87BhrEoJsgeqC1xfSpHb4wnR7mhRBIZ3zADxW6GJQRcC7R5FqvVu/ML1B0NwwCSRpJkd//AK1cXy4UHbjZIdziiQkdhGJgCAGkJdNfQwBY0UpShY/W7VBxG64Nn9Xj0JPn1kqp+rlaoE2DY9BnQjN33PH2R1yHMHw2tf/QMwzCcTCZv3779TrTT01OeN4iiMuiQ8DgIdx4KbS8WMdGmM9XGKByBQvBQOoSqHn2apPVGfW9v7+nTp3/6058+/fTTo6OjarWKHiD/4d39MTVwGmNXC4G0QUUKkEySytccF/9h0tbvyYHk95Q7hKQ7itKj1WrVtu0wDOfzOfmBBA8at4b/W9gf4zZtch0JafxpuZ0/eduOOhqPAB8ZmjO4pqP0d6PRQFQWPUwgKhdRRqnW/JYQAOWUcv7trxnYUe5rdvnFKHnB1WnMjr1XfIHqIRP2T2q7ntft7z7+5NPZbB5E6XK5evvunSh7AzR1TK6DuyPrQyFhKrNdEpJpnIXf04Kry71LevhMPkcrvFACoZwj+BOuPwUZjg6YqnFpFQTjyeTd+cX5u7P9g8Nur29ZdhCsXLcu8y82DfjWJ0stMpnwKnb9JxSQv2/v1T46h/C9li1cMXLFVSRYR0/iFmsgfzj8Lfh9UTAeDt6dnY3G4/kyCGOoI4vfCsNgDbliKh+gtHZKosKpJgMwmVM8NiWLaOYB/4N3ATFFlUKiYkUZGwJ9QmOr0JvEWlTVkWIbQucDCtHj2LoeiCIcHB52uzvVSk1AMZ7AExW+aNS3VQaK/EMY6NoDkfllMlCpoM6fvtHAbjI1SD6LeaMF7UeGS4GJIl5gZqaMAaztdQn0wjvdnmuXfGCROkAeTpJ3l9eTZbBerqIYuKYiHx68cnLgBZkUJyvrX/bS6IWc2GA0K2cnww7S12gAYmwUVaZiURJiflTMgi65KVukqaj3MFlIVxQ5wp3JtqzIskqibH0AWYVBpezbJUFac53+zp7reQChuir/r1QSlTuKdjVNLZJPiYL9EJFWI0DxFooZZbTaM9dzq3r476xl5s9mA5cs+EJq362OEHfnoigKw3A6nZ6enn733XfffvvtYDBYrVZIEKXv4AvMXuO8RA6OGeclXDFfvH7L+k+XTKAo1ZmQxegdB4gVOzuPHz9++vTpo0ePOp0OMUURJ98yAoVeDWEOmQtBzgWyuUSKEdLyDaiwEDx530Yd5ugBXgsyYwHnh4o6UP4xCILLy0v0BkkeMz/Oxmtj8Dd11fBt3jtC92tq/Eo3TT+Exy0RF5M7sutWK9Vms1mulIEhIbK/iDK6DWgqghC57fGr9aUzjQGA2pZQ9k0+mGtsZwXad5ljW1ARShWhLZU827Janf6jJ58MRuPpbB7H8fVgmKZyzUGSVBpGpO2rzTWdeKEPrk9UghJTqeSa5uZ84XZbMAZm0Q28lbIWqLLuAPlLZLUMz3PjOFmuguF4cvr2zd7efq+302y1bceB7yCyaBqKmfHJBzIy7+Rj7h9f2PTjdQj/uQvx+yM2Om1M5b5llg/NESoqzJI5tUD+tOBGmkzn8/F0Mp0Hp0AZvRqOx2EYxVBnHIz6RNib8silUixLzEvNDroE7cYI6SzVa4r0FXO3ldmtjQYZhCIakUxo5jFIaamjwg3U4RGPMvJFQXXKsjzX83zfcys7O/3d3d1+b6/d7lfKVeDmgXqk7UBJ3NzzjuomclQBFJOxK63sL8NW2sLWMS29oPxkbUO2iSbRqPufj50bLzZlTN2lSXPKsV3Ls0pWEKzWIrhYrjV6e3tHi9lgcDObTaN0nV5dx1GU+j5oqwBrVMwTICcnwBgW45fJR1fLrrwYylxX/WTwMh+V4v2GeYakaErbk5qxGm8jt5/uHn4dJT/RISUIM/OgaWYUICoAhoITaNuJsHsq1epa0HLCOAY50TgOBQ8tjKIXL19DdNayFovF5198sbu/X601oD4KlEfB9AwfXbxNEvbo4GXIjVSAMTth8IE1SKR8h1TkvSLn+PfbDAiuEO7IPyDcJdsEM5JeCGa9YBh+uVxeXl4+f/78xYsXl5eX5+fnk8kkDEMs8BDHMfIVDUQFGzFFqYcI0xGAidY2+a4ZVw2qe2ZyRzknFo+Acww0RS0Lq8yXy+WDg4Ojo6OTk5NHjx4dHBx0Oh0UkhH5w0izl2Xo843S6vJmIlFAMUgBIsAy3gcTWipMKn8tD7qaoaLcPX2v1QwpsljvcQ0SyvXDw0O8U1itfjAY4MjgufiAk2dItzuj5ppFaDMPY67Pha9v7fz7/uQDfl688qhWaLqo5XoN+QVsQiL+jDka1Wo1TdKGaGDwiar0xp616T6q9Tbz5pbNrvQrb0o+nVRb2CfEQ5I+IELpVCBrGwNJCL1jdo5t2/E6dV2v0Wz3e/3dnZ2r68FiuQwC0FLCPUvIx0GcVmVzqGQODmWzVwoVKDnwM7nQ3WlC0pacuVK1TTEtopKWjpf0HnEqwSJwIHQaRdH1zeD09PTp0y+Cxaxc9stl0LSDZRFISQZlVAcsFHbCxjk78Sj0f59e8WtoH5fK6HvNuSxYIXEP0n3Khmd0qtuWU2PEZZ2W4jiJ4igIw5vrm3dnZ9c3w9l8kaaiZBak/Ul6qvwNP0RuCQCZGeyBzB2UX1WgplkySG9O8hxUK1U5hyQ+p3S09K+IaoCFDXQXpMg1MlAq1XKn29nZ3d3d3atV6/pbNFjmQGcijhi31qwB7BQDWwiZZTG/n7Rlt1vlPmUwTC58ssnxM+hn7xuZ1jQPEWyAqvU2MmMrEJI8eRRFsWNZLqzXQEQplRa2A2auFUbgDeJybwlta7BTcSbwjYY2DDnWqLcGR8N8eY6HZ3pm9JPps8ogBfmEOl0wc14mzyOfJulkFW9wnOglR08IXvONnDKO0G5OxBSCRLLV6vzqcrFczuaL4/PzxXL16dPPT04e2g64jbbtCms/cRyBrG4iq6Ava1t2CuRRKfmjKu2S+ZAZInVF9NjyC/8YgqBbJr/hE+adQ8MINu+++hp+AV27RPj3URQFQTAejy8vL1+9eoV1JlarFSGBHHQyOKhGMTfqBuX7EUPe+CZ9Hwn5XHMoz+WTQQcoHyp0/227Vqv1er1PPvnk888/f/ToUaPRIP+Tz/xNg5wfQ07nyxBx5WKCOlqZwdQ5h7n9sdB5eH+ijY7ppGmKXm6r1Xr48GEQQK4EDtQYoqIh5hMaUlKSqs3cHiNatKUVZMoVRSV+Dc1gXnCgFUucF/yG8jcUTVcGUkWLoqhcL9fr9WarWa0JErKoQ7gpGZX3RNa1p61Xvf/BUc5/YtNzgALNxnwW31JfBzsNo9NS04XW+YIjQ3FBxbm2PM+3LLvT7T98/Hi5XASrYLmYzRfL1WrlOm5SKjlJskZWi7RixI/NmUjmD81waWjx2btRraWUse3M91EOUUdldZyWTgQWBUipCUl8EMOPgiC6ur45Pz//7LNFs90R0bfYKrlAX9sw4PJ0TBJfY87qEnkPZS9+m+j976P9Eyij/8T7fceYlrL+5d5DmxCZyLyuHz20t1CfFUMjESUlwjAc3Nycnp6evTtbrIJ1CXgdS6G3JkpSyMAc4+jL55WHWyipLx/Do+9nA0/50eAeAso9keeT1XtUPiE3whRmCR/5vl8qrYEv2mntHxwcHh5XKjXLQrMbtnNuGGUwNBxnxRRVCjlEJcwmOupfMc/sZzOv2VKFe6fGZfHK72JR4HW/bwoZngVYasgdBcRAuCUR5LC3O93jk4eWVQIMwfMdx728GQwm01UQRFYEVaHjUmIJw8sSuYWEygliSDHNjG2NfLOga1A7DFxNVhaMbTDsaOoU3MThDjxhFdwukWiwPCz3GbNGqjLB5WkxHwx/hvfJWdtRDB0Yr9eLxXI2n8/m81UQLFcr4dGVqvWGC5t3Wbl1G/00fBP9QRtzP0pis8Qq9grk5qm6ebOJpotinBbTsX4fbZOzlwcJC3EP48WtHhF6g0EQrFar8Xj85s2bb7/9FmvQr1YrKjpPmqLcJ9yCfRVggJvjFBQ5kvuFysUSR5Tv026SJilksFpWtVrt9/uffvrpZ599dnx8XK/X0fnEhDrDMeaNO0iZ5ZS8gqxrV0iNY3kHGc+qcHG4Ky5RNFDItjX8N6i42Ok8fvyYkjkdx5lOp0EQ4JfxV6JMtiDaKZHh/AQwXKnCKEPpx7Vf2Hvkk2qT30t3n0coYHpHa8d24giYt0mSlMvlVquF9UsQxKZTbOkAokfcVdgyAr8JzxBHERdqgs0pzqsKw8svyy2OwjqYIVBs4sF1i0AkiCUk4huVaq3f33n46HEQhMPRcD5fgU8lcpgVoA33ChXgMjUkDIKqEuGkM+EjIBexbZe7rZKwCSsYRaDkjLLX6wTwekzMTtPRaHJ6enpxcV5vthzPwwkGIYYU1AXzg7Jtjc11ToABIOv9UXFnfm3t46KMUtveB0rGy81p2t/NWX4r6ghPlKCDltapZVvL+Ww6Hl5f30zG0+FoOpvPwyhSNSlQY5Jz5wiKkE3iEgqRJ+QwS/dDXgRWbDNDvLohammB/rl2btHS5na6Ggc0wlGhEV+gVECr1UiStFKt7O73Hz581Gn3sTBSpVIVOYRSKCUblhbXhjo3SnOG9iHmMWZQO3P7+UVmFHF9NSosN2l8TZAbM/voBilwGL/6vnunNjrlcumU7LXjlZud3qEIAAdhnKZrx/Mtx7kaDC3LWq0C2J+ELWXbwPUnVUQqa5k3MUA6TF1CjtpH5Tk02qACkPgm3U8zfm9YbGoc6D2ha6DPm7lwUUlJfE7HFz9VhZgZ6xT3MKiPJJg5gj0YJ7FtO0EY+p4Xp0n6dr1YruaL1Xy+mE2nDx897O3sua6XJGkURuB3+74owVSyhVFu3AjCJFV0AzkDGEAyRdVQqk6a0eIazd3xV6xm8eObcet5PKjwO8ZKyz2TTSgZLyuP3kUYhtfX12dnZ8+fP3/z5s33339/eXm5WCyw3h0CU/ksQTqRUf2cBB65tU30RcN9MnqITAecErKog8BjcNl0XReFVWqiHRwcPHr86MmTJ4eHhx6Q7n2/7CO1j8rQG+gWdwPyfnVeqZWPOfFOdKkAQ3Vmw03k/icXUuZfvnVKUK/wuhzH6fV6OLBYovACJNYGWJ8wCGAdw8xDZPlqj1pRsonmTb3NX/KmB+2OijI/8jm94895kK44AGGUdWA0BBxMfBsLWuJEQlew3qjX6rV2u63WbXAXC704Y/QKtXPvgk6XfqUtH3KSNa7EX+py5Ccy5iKCfpAkKKFALb7ALhMGSIwSaL1LXbRypbazuzcej/q9fr12Xq5UQkFjIRH3JJGxV5KnUqn+KttnQ4SSi8puvi/SVFO4KKUIqsuTA6KrT8tzpeZqjIvebDpxHfvs/OL7Z8/K1UZScnb6fRlfEylRhg1sUCR4l4wZYq5a739f79tP1T4uyugdm0p8kta88sxIo8k0Vu5yUbgLi5XFTiGNfnlzczUYDOaLpWCKokwLfCGR9ei1TW6ISGWWYVi3BDMd3iGNfnLebuuYXDowoxhLYzHcjTmWdE6Z5SWeW+AiqhaGkee6jXrt+Pj44OCo3mj7ftl1PMdxyaMpOr0yTUgwRrtcxn8zg4n9+GXmkxLOlMCO7hiu3Wxu6Bmu3qByt6qndMl3RwvlrBPy1nLv9yzfhpKVrm3Zvl+u10FBrlatOrY9GE1c214GYYi/FSpzuGQjooWbPHY0n5CpYsPMfOc7jiLFZe9LQbCSTz86qBCvVaYNOwj7sS5Dr7+kvEFjMsjdLHPWUhxHgrqMkjxA+kFAOwjCcToBmZkwXK2CWARsHdvxXA90XAUl144TEJvZYNZQAEDkTcjkS2EBCNs0qxiuws5qMwbpGukEKijpd84a3WQHaxslC+YU+ldbnm9yimLRVqvVbDa7ubnBGvQ//PDD9fX1fD7H8DalF6IFwz23QsRSI35M2oTnsOWNaf4awGqCGpAGrw5LDozrQp2ehw8ffvXVV3/+058fPHjQaECRCUEqlcXE804aN7Ny7JVMM36b8VpRC80CbmGm84a28N2M+7uvwRy6pGr16L2g69toNL7//vtKpXJ2djafz5HxiLeY4EG8EEJaeJ7krbgE77OG7n+VcZlNo8oW1UzqslT+Vv4KTiH4vm2Vy+VGo1Fv1CFn1ZWhLvpCvmUSJYrwZP1Obqh//QZe1sslHpKihDGyfyaiS1+SSjAFjxvKj2H8Qjzd1VKne3z88NNPr25ubkbjcbAK0iSNYQe3UBEA2KIqrMMsBBURzzJ1+Qv+OG+YwKpgbirKBWZdfaXWLv9CFxR3ZzJg6PpFmQkAPper1WA4vLi8eDAa9HZ3EaNM0sTbvFZnYxzZgC+LseIvMxbSfftntI+LMnq3bmSfLv1AmrXZdLxuO5WbfR8ixY4dhsEICmcPJ1OgEpDzhYLpIAWiEn55VBCfYB7mwZ8hOsEetffc3tRF4AFSC+rpZAYmq4mMC0uSQMVSQRhIYyhUuk5Tr1qt9Hf6BwdH7XbP98qe54PeNZjmkI1Q8KTjuidpEcohYRicpthtiUFK8byftWVuMOvPJiRZfZAjU+rrew9qhDDhRIomJXyW1m4MlqXd6e9YpVKlDEWHy+WK8BLPx5NJqTRPkwRBX+hADHsARByUW2KUpNgwaRQwiBcniDRKoZ57PZnfcOOAUFyFpWYiA5YJFav35HYls1xkJ4oC/7StEbMaDEeR/YDfAXBUiIiUYrAsozgWpcnBoEzS1Pc9x7Yb7a5fqVrlir5ZmyAFERSAjd8WJZgsCyrWwxsWoJNZcFhfmyoPXHgJ3EYp/fbbFkeFXyPZ4hmLM+uS8cPmg8r4AkViwjBcLBbn5+fPnj178eLF69evr6+vl8slq2YJ3ydx0bxAC/UkDz1xhzCPPokfSwCQHwoF5dFQF3VLgGEMdlXJwmTgcrn84MGDL0Tb39/HkgAoqYKnNtwVgyBaFIDXY8gxhEJUQcKEKobFYP/3hrPu3oz4KQ2v4zi7u7uWZYHfUq/XarX1en1xcbFcLpFcQ0ipYRlzFag7+id5OJGmx6+k5W3rTY8Jj1PQl4V4HUSY8bpcx202m51OB6uYMALLHS45u7P+CuvO/5gmpdYz25/et9nGJ2hWsPNJZ1slHBqHEwl+ItQKEUbxNTf2Go3G0dHx48cXNzeDxWoFVaaTOIpECNIRlB+zngQPtKoUmlzgCekzWCDXQPLZz+EtdDfpHUriV/lB/G0M25aIVyzUIkCmDtIFQbc2mc3m19c3V1cX/b29brcnZhQoSkAlXyuzqG6Cl3nsnDomSz4iB+q+/V4dwuJA++bF7hdrW06aMwjl3NWrsGLKGYXItpwsVdWx0jSZz2dBsLy8unz79u1gcDMcDII4iSLIoQevSqziSDFHFgJfDqTrKJcr0a/cQsCe/dsfLXQnlf2tMReFTELdVTJzlVUhkBesZSSq3wLHyfParXa15u/t7+4d7FerNc9zkVaerhPXKQsJjozBRB1QK4O2p2Xyo9i18t5KnnT3C0wfHUGXy5y8EFWOUtcg4QYxvws6HSMXyb5zHwSbUcCyEpa0bdfza812si6toA77dDIZL5bLJI5XQZjE/ny5RMABcr/X61iIN8hMdg6xZjg0aCxSQA8WajHV4ctYaxK5nJjuKhJeTY2NTbdMVS1SNBl5EkInZPxDmo2qAgeNY36kiOanSsbDHomy9dVqlVSIBMJgJ1bieV7kOOeXF3EcQtwzjlbL5Seffrazf+i7fpokURiCXV4uY+TFAQGGDIdFyd+WaD9mdWgY60jHWeRcNUvV56gyv4+Wj2QbKJx+IrJQ26aUOTJ3+JuyTKt6B8mil6I9f/789PR0MBggU3S1WjmOg2xDBAm5P0MuCvWKKndj5jP3BnmX+MMLELGiYNNF6Sp/4phIfsZiEp5ovV7v5OTkq6++evLkCcqNVqoV5PKR9kxh3J0Lq9I7xrDnfaeCW5WddPkv55HJ/AgUgqXbGwdLiYVrWVar1ULvfbFYjEajJWgzBugkc5ou3keO33InKg/zFqanGldRSL7d0vmfHFfkfnuhgbTJlMJuIBea+KJYj75cLlerVc/3dnZ2qrUqzjHXg9xUTjHll6M5GUWblO6DEdf9rS1fCv8kK0M0waJhVpb0xMTStIaotgqk4v646cgoIuqUhO66X643W/VGs9loggdoY9UPcKIsyO2HxDzkmkgojskUq8hpBg+khs9OnMbmReXuhXZf5Rd08J1qPJOCFe70itYkByMRJSjG03mr2VitVhdXV8v5TOqdSosC/qdKUptnz+nVZ9YNacXdU0Y/BofwpyWc/ITt1pNmovlKlk0n/uZi2NuoTewLKQTukuVyMZmMBoPRYrGUYeS1ENKnmocqiKNOrzvC8ZA7rMTbwDO9SaoFLiP5YV6DLpmBDfwMKCYBHCesKlGrVTqdTrfXqzeayGYkNyZzFdonQKhJ2vpUil4vYDJ/UA4F5xjoUf0FdyNWtBfPnrm5ectD7uVy8c0d7b09AekGol+FxpPnlUq1KsiCCrEieaI0DYIAiHTiTTB3UmudphCRtNMklU6XtpmyIZDM8o0nhFVaWs+UsgO9SUuJqHm4qbvGgCgXD/1RdVK5P6GpoU5hME6zt4GQjVJ+y1QBVxgNMcQpwQu2naRpGEFR8qsb2MwCqBcM42SVLA/Gs2o5zrpUSuLYcYE8WojjKrcVn5ZUQ/cgAwgDhcqume1ZYcUIMMopcadH+DfWCuUcjY8KPeG8ruYWf4aiAMgFDcNwNpu9evXq2bNnZ2dno9EIpz0HBtEO5mfnB6c35YLGTHDUwNxyseQuZh8cNvlpnVSZigI3OPqXf/mXzz//vNfr1Wo1kfSbObh2cpQMs4FVchOw0IsuxMoyX8tqyWzxIbdQMT9gB+e3gLij6NicnJwEQYCCscvlEi/Z8zzDD9yEUm5yC/N9MLysvMZs/qYbA/VTPbt8zA3P1rhSowM8ImAcE6WJLMuqVWuNJtScqDfq4B+6wM7l+rqZPihNJMyAlRENdU5GVkIjXo/hb2gZY5Egw1eRHEt1OTjaaiJZBtOraM5jONW2LQgQWa7nl4RP2On2d/f29nZ3zi8uVyLGIUrTyyKjJZVKyAsRSkV6otTwBAp2IZvCyhtvR9GTkHHxybhRuyzwjGwbw2lhFM3ni/Fkdn1zM5tOcPiw7FPhU6aGGpTX8HOi5iq5Y+Vg893hnjL6kRem/wVAwvc8ha4xLUxtHlcpeKjueGR8IpIkmk7Hg5ub5XKVrkuu62FJcZT3RRMmwf+uSw6t2iqqA8sNC1lzikPRVReY01ooUy5uJPPIjSR4TsmWIHoJIEJirRT1Eh3LEuVJQbrD8jyn1W71d/r1WsN1XGF+C63wW0Rclf4ecSPUkkSZe+o1gDJ3Knb+sza2XLGdW9c1uuPWaBjHdzs3fFHu9NpWcDCvodXuRPsh7WcCJbPSdWlVCqI4xgFdC5MLAp6K01IyiWJ65IUhC+6NMgWE9WYu/JvjIFkjRpk64BECspgtK6mOJGehMFnQU8yMJiVx0ARSIvpqhxbhByk3ImYw/kvyS6JO1Dp1S+lylcQ3KXBH4zRNYCpbpW5/z6/VKtVqATCdvxMwPnBIimumYnhAoUltfHosWPAi85mCZN8XZvn1tzwSaNiOt4Iwmw5LdjOul0EQTCaTly9f/vDDD6enp7PZzCgnSJLIHBgplK7hDuEWJmH+Erh7I6dfkgr2BTQqnJAkieM4zWbz5OTk6dOnn332WbfbFVL14A7hzzmMSS8QQ6MSZCokZ9+6kmz3hX6MHW8Qg99r6tI40wUSm7Hdbj948ADR3clkwn1gXProJ5ugP/KObgFIdZRKpibecfV+r3X+jkcrDIIUBlMKL4cLwGJD7rFlWc1Ws9vpdjvdKqi7gaZRHh5U55D/wg9FIopcYIVnCMgVq9WnfvGb8QPzLTOMZJSwL2jvRbkyt05xuckJnN914Q46rltrNLrd/v7+Qev12yCMgCqWLDGkm0D5QmDYrEVgUbveOu6oDpwDbI2t+JbHWX2Vx3352fRLXQlKhHxRNEKo0yUJ1J9YrYLr65vLi8sHD2eVCvKQYYWTjLbcaZVkgRDk1nCsxCfJgv097X2/3farcAh/galQGA8WbxTGIwgC4i+KwqKqmMSmqxB7eYKLLMhBx0kYBtPpeDyZ3QwG0+lsFUJqE5aYSSOoIAcPllzfIQNK1qGTtrQ2g+j4xovbxkE+9SxBGtVK6EPtExLBgIrRIYvPgsXOc13HdT3bsquVSrVWLVeqvX6vUq2Wy1WwsF0H5UwMh03lQKK4KBIzVMSRuQd6yVNXR3E7jSj9U7HlXC4HuSS5bZvFevPB+w+4CsJSxFpsJ07qeKVytd7qdtM0nc+mk8lkNpuFcbwMVmEYCMXCeL2Gpx1CfVYarwXdTizGUPmS4VhMdkzWy6XKH7pkECzuEqTZMvGKjEUZWMaD4DmIpCQ3Pb5r0IE0nCj9UjVZRCiXz1ug5wkNtzjGPvqeD26hgBeiKBL5hLErVFivri7D1SJcLYIgWixXnz/94uDBie95a9dZRZFtWb6oykg4xqYpgaMB/YEXYo6jQSXdaC0ZTHqqmybSb9otzPNCqSmKREHpAgMVLETwDNcIbCpBNYwgaD0/Pz9/8eLF+fn5eDyeTCbL5TKKIp49mCd85jNbjM7kLyp/a/IEP7VqWbYnWGYCEi/7ZeDyea5t261W6+jo6NNPP/3iiy/6/X6tVqvX64SPGUAiXTLXtqHOEFOU6II0tYzR4//mrzc/zvkbx4eOszcNX+W9PEPqFTIesbaE4zjdbjeKIiwfgu79arVC7ijqjhJYSmNyK6C3qW95MvCtmylfyX+kW2iMrTHVt5waG0UfCA90HAd1eur1OsCDtVq1Uu12u7U6QNApZE0D/9ZYyjIQN5AchIdM5RCQx5hV/qId4re4aqFdlxlLYp3w73Eqo6w1nRmGTSYf+oRJElpWCawkx+31e+1Wc3env1ytojgOAqg/AWovwlcSNerREc+EQTXLoCAGnUEIzZtoUDPoWoq6LDd9na4hjyyC+fIREzMtCYJg4TqDweD07CwIVkkcRFGwXifVSqUkgv+FlFH2IvucatqUNgI0A+6Xj/Xft1+JQ/iLtaLNb2s0mtIFKcGY8TbxKEaF3/wZ4YEHPwgylpIYaDCj4fD66ma5CgG6UeID6r/KjFS0gY194+vze2xL2kuBrqEWgiFdk+l/9qSw/Yi3FFaHqjGWVapUoPptvd6oVKqe5wsJFPJjN1yCwFWklFYmFpZZy6QspQQI88Gzf0IrcurMeAG7KRI/xJWXR9a116S+d6eGU0SE5EqW5Yhig6ILLdd1bdsCuXHI7ARHCAhvpbm3dqG4QhSVhAKQrm8rszcB1RITlfZG6XgrLU35bck3FQ1tsTv0VExWbTrjFJebq4bMpPG7TqEACkyz7GPFbFAd2iQ7NFusEj+ybZBUFaRRfExRncJerx3bTm0bQdTRdJ4CuPePBArDxI5je66zXjcsxwWKaZKgSO6mpkCGUgqKpkrYBp1D1HTFu8wGxGTI5NCJ367AzCboyTC7Cd2iXxkx77wDYxwN0TaUk5lOp1iG/urqarVaUWUIFKjkhM9CWiB3ZiiljaBFqpmeDwblXUe9LIgbbgvFUCTg2VCsK63Varu7u0+fPv3zn//86aef7u3tVSqVwiHib1KmHF5XIR5YCDTdOotu9QZv/cmPnKt57qjv+7Zt7+/vU/7nixcv4jgeDodxHJfLZYwC4K3hNrGRTEjHN17nHUjuaf+E0N+Pb7f6hJw/zBnXlmWFYVipVGq1Wq/fQ05ypVIR2f4wvHlwSVnhIo7F6mcW31xVPAChs9/iYsXi3VqVznCo2ChxTpX8e/ORYWdOhIpvYkGNMdfzmu3O0dHxq9dvLq+uHcjzdMRmZKW2JVRfMv2SXFX+ZN1GoyyMhhTMn2zMOhMKkadB/TZ6DSFODOXh94GKX7LGk+n19VWwWon0CDQhis1gbvaQ5WIZwvJGbFhrWdy3351DeBdq3C9pAN3pXEqCSWpAieiNWDgydvudt1DEYYBaGUXhaDi8OL+8vLhEAANzi7l4AfZA14ffcBW4HfBV7C47GQu9SGKAQu0RvtDBMNV3ZLOqX4uSM/gMg6llWX4ZIuGuY9fqtVa73Wq2PccXQS8wg/QumxPPktKopNFBb6MfohS91A/QEZQMxl9PKxSKzK6zvAahyXjlH8jiFXQjtmV/wmlEPQ9pAwH+4LigfyIgXNtxypVqpVq1Xb+0Lp1fXc+Wy1UQlGIhPyC4pK4NuBb2QlRZEucXrA6JkNMqLetqi2/q6Lg2R24dJTRpCdskL5CVcqdNQQRGhJ68Og8NIw1pdjB0rWH4i9JrkbuDgB1RRrVFaFsx/OukYTQcTy1b0qg833Vsu7+/X6m3KtWquiO3G9Y4NYVTrZBOrPNhDoV2bvMP729UbrRwCTLy6wyojX/HWJbvcvnoDyA8eHp6+u23315fX69WK36WWCS3cD4FF8ciX4L3CgmoZFgjRTNfcM+4IsUTk5mH8phAkJDLGsjQO65f9nd2dh4/fvzll18+efKk0+mUy2UCdrhGDjm95OpwpqgxvFt8Myrz8JNMqvfYYt7HvSQiKOGi+M7BwQHCvL7vV6tV27bRJ4xEMTdDJ/ZWTI+8/ULf+8OcwJ/PdTSmpdFoeLkri+4xTCQhCJmu02q12u/3d3d22+12tVr1fZ/EjQpDD2qhl56hYYVsuvvyO79N+10uAqpU/aZrzEcgbzks8mtRPcYF+q7vl9ud7t7e/rvzy/Fk6kGWbAzVbhPIcIdhhN0oM4Qs2inHt7hvUsI9u4S+r50knj/jJe2YWKIYOPDOOoriNC3N5ovLy6vRcNDr77guxJ3tzQR7XcJYXhf5m6TBJpM3DYLYfZH636FDeJeA4q/KG8SYl0ih0yZ8xqhnGYY5mMhsQlxUqHpAKCVdLeej4fDy4jJN4vFkvFoFsuapKAog+EIyvwqNdcJUqD4MF75THc5YXbcPgug9WkS6eLq+flUmHk8HOhkE3yAFVJB8HBck+13Xdz3bcT2/bJVKzVa7UgEbGnAVwQLCmhO02NAioAYzi4ooAq7sheoP80uzH/062maLFoOPwsXO5ttIAj0NAgIX3NBUqinbTy3xB3LwHdfx/fK60VqXbNdNkni2WC4Xc1ivb24QrQqCwLWdtSDT2bbAD1XNEsEd5csx9k5aBpReiJ9gNdpN9ko+MI8psnhEJXat77EyRuQPEsiiTR0bzBf+xBaw+ehnOMuY/y1TZVQZOljsHAc7AewpkeKVrJau61gl//r6JlhBE5Kk6dM//vHwwYnve+u1t1oKulrZh3oWip21aSbgk0m8UO4UKatXTxXyNDj3T8Xdf0t7oREHyWff5T0o4wv59BjjFPhpGIIgEKFJcRyfnZ29efPm6urq7OxsOByilpK83a6LerPcAubYPu8DJ5cWMq/y3eNwHP2KgBoILggpFBR+LJfLh4eHOzs7R0dHJycne3t7nU5H4PmAiRFZlKfVberYpn3HiEkZEYef8EZvuq38O++VW8gLDCrGnV2tVvf39xEPtG07CIL1ej0ej3FzQeSWHhxORaY3ueNEn/4YL+5n9QDzfxbCPnz2GhPbceF/5XIZNWyr1Wqr1To8PGw0Goi7ErKXIcAzHqRckVhcmPZcpQeeQQ6ZEMjWAPavuG15mth38J2C5WvD9BYS2RhoFYk2juv2d3e6nU7ZL0OccToVEcO1qDwhpDqVpSB3VQby05QttJzRm82vV5tWUfam3NPFSxmClieVl4vIIGCAGNdCVHMxn67T+Ozs9Or8bP/wpOSU6/UE6o+BlbtJhC2zfGWnt4RfOOyso8737ZdtH1dh+judXT182owj4QeWRpU5VDGDURrQWBtNmH1JEKxGw8FoNJ4vl4KaJMvQZ55kuRxghAaPovwH/iz/yF1KiWXpn0skn1+MFkuUzCWQbMTidvIbURx7PlAUO91Ou9WCgnh+WZQadkktko0TaWkIB5mWJyUeI8l//NuKM8oWx1/j3sNZZOq6MihbZqdhFYS5l5y3t7bPWHR4VFzdcoH76Zb8Ur2EWUkgKoOwoV1aQ0W+5coStwzocKUkI1nIoD/OVNH7jXyD0z3e83EWMyiT+8kjmjkbKEkTW1j+/Gvm5ZunyHysTqI8MfUbNDExrX+d2jGYmM4qCG9G42+++14og9tArkJhBtsRWmqJkB3deFMk7Q1zDtEnRFEllVCft9QLXygL7DfZCtPJCoFBskeJ5LbFG+SNwmFRFGHtwdevX5+enoYhpOUQzzMR4nhGN+idLf7qFmTGgATzTFfjI16bp1qtNpvNo6Ojhw8fHh4eYopXYUoeP1c+5TKfImj8yV/kj/nTtnweJo993B0q5O4NOXi+73e7XdRB8X0fUw3xLEEQID5MCGreey/05/Me7JbYxC/ZjPu4qRXMW+lJiGiyWOkJ3C6Xy+12e3d3t9PpVCoVCDqArKXMNtx0cBnXQG1wsgVQUJSWV7W5vReq/2tr+QBKoZSreiHf0Ts1RjE3BQeldwX/V/bL6zRtNlsHh4f7u7uT6WQ4HAV2gF9QpphIkzDyHjZ1fcOMvW3eFsC4GuZgnhlX+8PlSSr+CY6Q41hRHM1m8+l0HMcgeyGXKdcs7sqvA3fFPMFBupC0Xr0nxeC+/bTt4y1Mv6nhg5V5ztUjwR+pLEBfuLzKFxhAsx17tVoNbm6Gw9F4Mp3NlwTMx1EMYlNUShYl1zSuruAPGW5CpueHcyfJWuGmG1fZ4dpW5NPi+TAuiyz5WCQJup5TqZQ7ndbuzk6n3a1V6xj2RuUPDZJkRoY0N7gFjGVSVZcKvL5fOytlU7Cw+FaROI6k3MiFWccg1Y9vOaMoB0uYJHjseG9tp93txmGwFhB0CmKaa3s0mi9XpRWYUyLOoGOEhGvhcfWk5xkOcr02LzQbTFVrPPMwKcKZCyDSxmoOkTg9+o9M3FS62UynU3ZTHTnrhuP05XF0PJe4fBlfsR27lMSe6yZpslgsr25uvnn2vee6Zd93Hbe7s1utN+1KFdind5h/xB1FJ1DqVWLntpZIKfCXWDRaPoe/vpbPGORhYA6T3mqvbDeI+WFxFZpOp+gNvn379ubmJp/shzmEeUX+PHR2R9IKg3kLvk+GON50pPDZtl0uA3271WodHx+fnJygkAzKgWRmJnNT86H0TVC88fqX2Vg3sgdz4OodFUfMuKGyy5EXenh4GIYhgvOYBjybzRaLBceKjeLsBmpaeMY8OiSfXxY1+Fk9w8IgAnUsP2/zzxEJ0uJrWcdA1aNvt9v7+/tU1ISTbHkolteSosLrMmXjLoXpf+3b8p0aD6AUzRm2c8mdSQ6aLbNecuC52HnATrItF0IZruf7nW53/+BgNB5dDYZBEEZRJKpQSLlRrseicFcz0YY+5uHO/CzdgBMa92mbEZmiXhyKxon/JVCcCWcOSCgvV6vBcDCfTZutDugminwi4CIVrI2K9aUi49qeznaYQJffhKfwu2y/tEP427jHLE5vvihmFGTy7nTDcDXAgOl8PJtOp2dnZ6enb0fD4Wg4Wi7mGNVGQxkYpWjdFiiek03ICuN8EDaIvpztAOihUEi1Gqr/l3qPRO4UBckxf8/zPEfUH4Qiy+UKrHGdTqNeazVbu7u7vW6v2WxIGVKoPCGKZGhJEm7TyuthlroGSCnPOOMWUn7dr3v+5HAzbnPIIc+iwTjGwoNQkw3T3rC6HelNb7lw6YHblud6a2edhmvHXfvlSqPd7Qer4eCq3+tMp5MUhFWu4yj2vXK4DlBqDftCNb4QZNFUEubOyf9kEzn5Dpq5Ln39+qpzBqKaFIXzWTwUqrBGPiAj9ivFrNb2jeyK/BLvIemFgKiMwEcd103iZG2vF8kCbCk/ubqO0ziGMlHrdZysP3/6dP/Y8YQ0XxgGtiXKZNu3c0cz1jxqgRQG+MUhsFeMACydQL3Z/5rmPNlGm0xtosIagJtRfd7wHOjnG4j3MD8JEZpOpxcXF69fv764uBiPx/P5HFGjPPLDhUD5pwTi4QHR2djud+WdLsMaw6Mh+VMkDgEXtN1uVyqVvb29er2+uwsFyVAHUuZ0CbeHG+tGkXQ+mPkXG9CM7N70M6yZmzagTY7We3FH6a6FYWhZVqVS2d3dDYLg6upqZ2dnuVyiXDC6Q2EYohdE0GK+Y+SrG90uRFbJIdxSd+RHtrwRj26tMVENDSGuw4RfQHFa/Ajr0VuWVa6UqxVZj77X62ECYblcpss0joObrDyLyFeB7olyPSIsxS109tp48dt0C7c+Kbhtya2J7WlyO9Pr2CZoEd6xHccNg5UN07hqW6VOq7kuWTW/vPC9MPSCIIQkBZFVZHRAlqtFCED9l/mkmW4bAC9vRuQrG3wRxZLIOpPbDu44KpyqSn5ZNlgjjm0NBuNGszWezt9dXAXBCvc325HE0CINW604QA51ZpTVCzKk+Zy8b79k+7goo3dsHE8osMmMNWPzRaFhulaCePPZbDi4GQxGszlEN9c83qRUO5TRLV+yrUujQOrfrJr/HXcuIZNjkD0UbM/PTOY1/gi0RkAlGRUqLQsKJKpD1GrVnZ2dkwcPdvq7QmLUQxMnE/IU/yH1GtbQx83AkqpnqkS9goUkNPrrbnxT4PdIJ36AhLdyWTLF6hgypyzuO5Kv9KIvxtt1RVkzq1RrNmFzB2MajFT37dt1AnX4xG2sxEkSqfOLRR1kOW1UqiGdTFlQnZZ1eWOM/X8LzyofTGFI5B2yjNCTlIXddQxBMLE509V0wvPmqRH9tbK6o5ZtR1BeszSYTKHiC+zIotKm67mOC/V5Xbcksi6drTdF7+gIKqIwVTaZUG+N7HZLyEjdd7Y+qMP+OhILqSN5eZU8MIiGtVa11QfRi0P+BW90ZEC5haYIlqG/vLw8PT1Fh5DAQDL6C1MH6TXH+jYBWZvms0GLVYEJWWmQikZQvXXP89rt9uHh4aNHjw4PD1utVq1WK5fLSIDcArUVxlAM59mw8/if3Cv7BeKwW7jQd9/3iTuK99HzPBzbRqOxu7v75MkTDKFeXl6SliwOIzqHBLpuGre8p2o0vkrQD39yt9AYGeJ5GsOVx3nyXAxltyt+sitVvysVAKW7otVqNYJbc0AWRnwxbqVTspHraLp5W+7hP39Z+vCWXwRoBvLYp4xUi6GitYV26oLDwlYKn+IUdT2v0Wz1+jt7e3s3NzfD8VAuF6JCvdAlzXhu7FbJ25BfGbdP5u0XTclR2eNReihOMG2wJaB/A/86DsRWVkEwHA4nk1EofMJ1Cjuj63pOTlVeGhFqDAkhKLBtFKyi8IDf9LT6TbZ7yui2psEGFikiVtrtNrrcTMAlDEPgi56/O5/PF3GcSBV+cQDIKYZahVrAc8PznZHl1TCmbanSDbf7hSD3ryI1m5Z6tRQpdShVqk5vjaLofBzHruvWqpXd3b2TByc7u/u1Wl0kzICUAu6ttIhmVp9s1Zmcg5hL6uCF0387DUOEuXcUHx8bSVgaMT/tFN/xXPBFoTuakHkgU25KpZ19ANJQ2aJSrbmuOxiNJ7PFerWKSrIIWGJZnusiaVm6cNKUFEUydS4JCYJlC1PdgWHF0D0ZIjC8I/Pn2uxG6BRVHDNWOH3V8Ezyg8MNaPoG2JHqYKg76lj2KgivR2PxXMFIglKDZXd2+pV6A/QAkMx52wqmXXpVLIyKhhlwaD7cC+VYyOvlbAW2j/4Tm+pwZsyN+DQ3yg33Br9Q6NVsOhfd7jAMgyCYzWZnZ2fPRRuPx0EA0lx0BOKO5oFB45jUvUIsqNAfMFzW/NTlliLANeVyp9M5Pj5+9OjRyclJt9f1PK9ahRLhCCQakYK8LmuhP8N7WOhCFwaSfia00Di18eK9mgFh0YswDLFix2KxwARgzCqciGb8/O6dpD83TUsjjfMnTy+k8EG+5+SW8HcM/5YooxjbIt/Dtu1ms4lwdLUCAq0UsDCvRSmKCb4fI6kSUCTXsSwb//dorfOFiN1lnd5OkWn1p4Sy5dcKlFaxMpRVchw7XbuOU280O53e/t7B1eXVYDgcT6aIC4t/bYDr6BHIFH7UagNcrowUvzcmI6B1ITci0oPAU8ggr7EXy6/KX8u9V76VQvqgcIb9NAWptvFkenN9PTkcdbo9y7Y9YemmVgl1UzeOclYvNSOmYMyoX0cA9KNq/wSH8J9u0Gxp+e2fvK8MeS/3jnFdWP9KhlssO02S6XQ6uLkOwvjmZjAaTebzZRiFQIUSlFHbdtJSKq1A7EnGBSKXAbsnF3K5hNFjrEybTVdH1nCG6l3EMUBDFNiBYt2QTzhSUwRrtFKpgBBcpdrr9g8PDvb29nZ3d9udTr3WkMUPLCW4JxdReSbRdXkdZJxrETOSNSOWBK9Z/xuLJmRWs7x5qidb3nKlaGT2mOgRbRkAvGWkVIOcIiSCOo6dAFZox2nq+r7jDgcjKFCxWi7X6BMiK0/WyJXYNSa1YjUL7dartIlNTqDeYMzu6lW/iOIiCTjG9YoHCqatnuk0TeV3JBXRPAcz4As0RcS/8JwmiV8uA+RgrZN0BQU8Suur66soDKMVZHosV6vPnj49OjnxPC91nDBJrFKpXKmkSQI5nAJdLLwdaIRJHrg6sSyKTIwAkiMi7qi4C5R2iB9xbtI/fRXN+y38weT1EugF/y1XYOJvGmfBVZTKP6D5O5/Pz87OXrx4cXp6OhwOb25uJpNJGMJtQn1Rql5A3eNnN9xv8h63QEb51/R9onpi/5G2h+hfrQaRl1ar1ev19lXrdrqdTgcJFOgTGv4Ah1XzTiAHjvI1oOnnWyQT78g4uHvb4sbnJ8ZdTsqNciqK7XlevV7v9Xqj0Wh3d3c+n6/X68VikabpEuTZtO4o+UgcBObxgrxfZ4wt/0jmADOhV/rJj/F4ORS5KWyB35FSydlG76CMrRT9LgMDGcFArEB4cHDQaDQg+ytJgDIqwrhcBdcI1lB5Lb166+B3/kp+V25hnuyg7ks+XgctTWUNTKBNKW4tLWr8uLZtJ5FA/yyrXqv3d/uHe3tvu51Kreb5/nqxSIHBE0O+YQobNB5DKHuygkd4XpL2NkKiuShMttN0u6UfSz8i149C86rWk8Ynxc6v91txfTZUUAvj6XR+c3PluLDHwdor8PwEcjH0wiiHIf9CG3hKSopXICPEJWsg3befu31chem3NyNYm8E0tszp3Gu53AsrHC1OsCkXy+FwdH19M58vgjBEFRlED/HBFqR9bj1zdyBjRvOAFTI7NIcPGAgbMh+4B0jGtPENdp0s9g39Uw+weHJtO4oi3y9Xq5VOp7N/sL93sL+zsycQQmkcc8oDetWq4CkNV5YsgF62HDn8ld47KYz0W/EGtyxi3Kp7X20gNUW3rZBrLuMuggxQ+7pj+X7ZcdxyrVGtVquVN9UyVAoZTxel9ToMQ9glxLwQRZGg7IPQBMKMLxp2q7RW6YUkvbvBMEJZFEwitYRfJGy1TNoqj3oa15idsBh5zBewJUk06oYCXNUcQ1CNvEiTMaX2G8kdBc6Vu17D9rZ23cl8Zl1dWP+ADCXQbBC+X1qvO54HokpRBPH4zca1AeBI3VEDNWaRAxoCGa9RErLYdYzg/OTstR/TKLqcfVP7V4XUwTw7bpNTQRYPFqAHDYbVajweI1n03bt3g8FgMplgMXqqQ2AY7oW2fh69NCIUuahEAdSWB+44/Y90Mh8+fPjkyZPDw8Pd3d1ms1kul8ko59a5cXDD5Tbc0U0uVuH7m8pR/Pi1tDB1yvC4jHG740nxCOTA+L6fJAkqtfb7/TAMfd9HTGw6nVLuKN59ih3k5Y4+wJFDr4yXgnyvn286Jn8Wch9nKj/l+0w8HfL/adYlSeL7fr1e3xMN55sLKasuMB7yk42F16DEFPeZ87pum9zC30XLc4wVM4bFD2XgWu7COhVmA6lTkEYhj9AWWcrlSqXVbh8eHT04f/f27duzszPHce04QTwwKUGcUYdcGQknAwhLTEAvDrfOag4PokaBDEvq+lbC2aP8EV00noxNPIh2RIMwnM6Xg8FgOpkcHcGGFcWxX/ZtMA9vmRbSkRZZkrLEN/tI/ivhTQXA3LdfpN07hLLpiU/v6JVR7WQKt7lTE3M6SdMojoJA2DEXl5eXVyj6D483+IQyqIn4vbReVeyEiKDchcB1IGORoDOlnvhNPgZZClnBj42Xg8VtMWoogCVkgltCewQ2yWq10u/39vd3Dw4O+v0dyJmGzRvD8xKnzBx/XaBKUUKJEoYLsaTNzJX8OqtN3KVtUbpTuKl+i7FJi60nuTdtKPkg7Qsban7oELuAoIFQKooVYp3ccqUs9GxvRuIwqmRzyUrkjc5uDMoYLbgYVkyE2d9gSJGhYgMsCRiflqvRPy4cK7nR8sAonycsbqjHgQwlhTkXELHEDwgyUlrqQOrGqythuYIkcTw3SpLRbOpcXuBTB5O7VNo5OKi3WlUhFEk+6JZm9EEGSxA2zMV0ObJKH9DI66QRvlD8/K3QncBPjBUpj6Xwxr3B7TYx99OQKYpk0eFw+Pbt22fPnl1cXIAtMp0SX5ROzeVG8w5V4VNVCMIY/nxho/RI4yoQ1Op0OgcHB48ePUKsRkr/i2ZAeRxMKxTMLPQMt7+4i+vyk6PNW0byvRqvlYcOHmKqvu9XKpV2ux1F0e7ubhzHNzc3qAZEsq55h7lgHSgCCTf1hJjAPI7wvlfED5gPi2S+UBT6xAUtc15Yq6QnHCdxKYKPy+VyvV7f2dk5Pj7u9/oIVkNB19xkoxf6yYUiRdKiKAmdAbUWFSWd/V6wQd64B648PR64VVWYpK+I+xFF5wtdaGEr2U5qJw6Ua177vldvNvb39w/399+eni6WyziOgLyTJKB3LfTADdyYGX6ZFyrsiQFilIe5+0OvDoDvKNKPwhP1yfhaxFdawDnCaDAcXV9dHT+Yen7ZFVpEqZ3aa8yyLxhfHUQWI4UhFp0gw4NHYqwpveI3hAT8ptu9Q5htfMVkyVQMH8vGO0vFU5bq0Yv/JrPJdCT0ZOaz+XA0ms/nURiRIQWbDTIP5NnxhUZisk3iNWb8eOtiwI1mZVLnYCYV56Jlh3B8V1ZYBr+iLMTxOp2u69itZuPhw4eQG9PpiJwYh8QSiC+a6SG+sGW9A6IE8HibvgrmGf22sEGjFcV3jZVdf8Z/khG5Fe9rEsWWpiwYsZonkKgkXCDXdSr1eqfXX1vWYrGczqaj0XgRRKsgDILQdT0kOcONFjAvmGFCdlFA15JzhQmrBO+K2SvvMzm3MmitTR4onpsp4ImmlY54sAEoQJwyxTKzQdyMhI9OiKF4ClMfpRAPn0vkRQhuZ1ISXBcwsyxruVhCIXvPu7q6Wi2XoAkcRcsw/ONXX508fOh7XmrbcRiWRJ6YFC8VWWGFdwTpoLiYICmAR1zpi4QfyoCK+DIhThmrDh+ZXyRGwnB8vXMrl1bPZ8MbNNgWZOUY7+Sfa+7aYcPSczc3N2dnZ2/fvr28vHz58uX5+fl8Pl8sFlitHtOo8nUm8s6hQSY0vNw8nJiBTbJPH3kL3MR3HMfzPFBd7vWwyAQqfFQqFdQX5UzRvAvH73Kh+2GEXTj/tnDk85dfqLDyYQtsISZpnIJG771OgZAIzQTMGyyXy5iBSZdfr9fRIUQp2jiO+VDku1FIRsCWF3fhLS9X82EDxZVvi7GR3GDSwrjWBH5Y7iCDQ1SjdyA+C1KirVYLQNRe/+HJw1q9hpmWeBBjvhmAueiBqugodd5kpji+Y04SaUT83iz1rE2ihojRCPBrwJ2BxddGLTb8XeHMAcroWlYEiaPQ9fxOt9PqdJqNJm6CuOHijgATXrjl6J+j48TFsaiTGKVFr5XVqNoYrSjQJeDFoWha0+WjyKlVcmxVAk3o4YktDgvtWqPx+OL8PFgt4P+W89I6KfueVRLO7YYcCsy0krs/ZUyobmWionKPe99ix/ftR7V7h3BzY7W3KRzGV+v8ag4Ngx8irgaLha5HPxqPJ8sgiKI4gm0L9jAs9mIcxCohgzxzcLbvZuU88rv9tgsqeLKQB4HXppcKdTBcp4TcsG1BxpnwL0BRJqpVm91e78GDB/2dnUq1BtIb2dh//kRshMynnZuIrLcsLfo32/IEKu7JGNBQxqTj0dgCF2hbwxsHXBTIBRVMSHEH6o0GbD9pWkLNFMdJ4iQMw1h4g5DRGkUlobSC1QtFpIKY/FJaWljt8h2NtjGHQYol6C1ITwsOO2JQIBvXyDgPbIRuHeXNUJ3a1JWAt85sFAxrEYlAASWrlMTx2rGFFIwNLl8SlyxvvlpdDoZ//+YfaHTakLTjpM2W7bmaOyoYoZu6Jn1OUmvF90X2CRaekTisgWsJyqj8KH/jZbXgn/3pYDW4tCGo/GsNamEPaT7wULeBihRSJXnDgySJmJmCL7pcLqfTKbqCL1++vLi4mEwmVKSeaopwB08OUpG2JF9kuOWXN/eN18ZCS64dzXnKD/R9v9FotEVrNICnXeg7bWqFluUWqLAQBOMjUMifzPvJH2zib4KRyYchb+rux8cUXA7DooQ15mqia+15Hmm68ur2haNteET53Wr7SIJxX0RGvXvLBwLy99rokpFWKodRaXzh2qrWWxiERr3R3+nv7e+1220cri3Bl2LbAYg7BXHofPDpd2mrQ+RbLSPs2ckBauKlGgEdHSt4cgVx1LIsv1KxbAg47u3vHR4f7e3tXQ8GaFFBqkYC0Vt9O2RKHSbbbNrcyBSVRFAgn6Z3YwewAHThx6xEJV610hwV/yA5eT5fjkbDIFhi2hM8qlCcemNftROYGygNUUozgPbK3yMY/Wtt9w5hwU5WMmhd9I54NAyjz7TjcT1VxrHjOGEQjEej8Xg8my+WqwDjPgAeYt4Lk4GR3bhz1JaeVPo5ugGFX7a2vEZzOCNiKox+sQspPomo2ybwE8y26nRAS73X79eqUPfW83xDLyTbV1pP5XOuVGRovJVbmtX4Eivi76QZyTzG+wU/yDqO9HU2NzY6zBixBDcetUkQu4BqQeAFrXd2oRKuZbmQDgcENse5mUynYQjKHK6QG0XRApEjjkpj2E98aUxRo4Cx3CP5NWGJ21tzJol1o1IaNFS+8SekXkPnp//Qvq0nIBpSyjsVLiHOfTwWuMSwz0srNimtXdeLk2S6WFhX1zgaQMKyrIPDw3qnUxUqDndMzeLAlGH50V6oR1W5iOiRF0A6/PJ/3laYTF3AYuKFH7j3ZbRNljf3ItI0xQoT6A3e3Ny8efPm1atXr1+/vrq6ms1muBCRlAgXF82Dfnl4cOOl5p7Ewnek9oO6jwhnYTk4z/MqlUqz2ex2u+12u16vowTXFqQx37YIwxhfy/t+d/dYCkHC95pRhdmVec+ZI5ZbLmdTM4aO5hjV30PncL2GSrlGJCKvzbOpA1uGmg74Y4oTGo/AppYff1473nAIERsXdXHSklWqVqs7uztHh0foDWqqjuq8IaxlvMBANtMRgJCi9EtEzsjv2zLfqsaE4WuKhen4rAzc5tLh9GEpWmE5oPTm++1u5+Dw4OTkwctXr1arFf5IhsqUCJkjdia6+7yxgGHGZIVtHmHdIl+PmCVZpRrzS8bqnaGMQvIQFiED/RvLspcrIG4MBzeddtf3y/AxJGBAHr5gseaGghnSpNnKIU59ZfR9Gth70dGfv907hOZuysIhGSGZda5ouJzvxtohvpcoVth0Og2D4Pzi4uXL1zc3N1eXlyEINEWoG6GtQjwMM+/psczvo0WV6+nMCoTJXWBGMlruKNJzxStUASHREfEHbAbgQYCYNea+WLYtss/K1VptZ3e3v7PT7XZa7bZQSsAFTQijkVkvziZBTV1sEZ9/vfsoaFStstTPDSvsb67lQ+b8o9ytZFEJ5SPlby7xfCT2tWGvFqluMGNRKdT1fVGIEhZ024bSzwK0BpUzIFxFY9/34lhIqJVKsZjmcRLba0eK0OH/mckS2VMjwZREhJSrkPkBc9X4RSlvUDqguZHhNMXNA0guhzqD7Dcj1+GEEwFVrBUqbo04FoIA5XIFZEdL1nIBNes9z7uJwlUYLIMgLa3DKPoq/NNJqeTajl0pRQLKqwj/xELgqFBKXnSLlxrnNEt0/yimgo86SRnzCnvZa/2ZHxCdUKrtDI0YZ23KvE+yCSQs7DZJyKQs/DQej4fD4cXFxenp6Q8//HB6enpzczOdTrE0OXmD6A9QZ3h0X41oRnLGGP+848cvhCjBUgZWQYIYNcDp4fs+uoKu61arVdT2qNfrqCJDZQkRsTGK0RdCf4ZPa6Bt/Fd51Mv4FT8L/7JxEE5Lvsu8MkascCQNF+4ugU5qhPpS8hLxQlerVRRh2gU4gdhKpVIURbzgHv4QI1zG1RGYbIyeMUrGpwRa3sXrNi7ZCIhsGlLOd5XfTMEWz5AYBZMQow+e61WqwEau1+utZmtvd29nd6derzsuZHCQujKdOn/fMwg5MEfYRBLrJ0BYGrr5PTd+3w3yeWZGIF3fQgEw+DMtCRJp7jhynIW0TCSqaMJ64Tj9fr/Xafd7nTAKLdueTmegp7BObLWOJSKtfQNNPXMP2XfwFm8LvZJXRTHH7AdGaEmUrxQXi1wh4XXK3TwIg+Fo/PrliyePH7Ra3bXlVWt1aw32hrB+kX5sThi50zFau7Q8lVvIXVU1D7X5fd9+1nbvEOZXf9JkEmavcvO005ILxxoGLg9yJ0k8n88HNzfX19ez2RwY4kpVVEJwWTQs3zfiKrxvWFEeNPMlQ+OFrV8KpddwijLscSlEpjuIYgkySbnst1vtnZ2d3d3dWrUmLkfK6RdvGyQJIpYKpiDKTo7eMF/efl8rgLFJGGHvPI8oMwhKdjJby2KLJ6hOJAYW3cK15cgHvlJpd7p+uey4brVWr9Vq1Uql7HlvbWsym6X+Oo5BGnctNkVn7cgiVVYJURh1SkLmVH4LnVNMZelBotOK5pe8kIy6NB5J/Vo9fToWy4dEu0t6HHNjK4dLfihTFk1qHDKlEUU0S2PA31EcCXI0GPz2eh0niWs5YRhNptNvvvtOCZ+CqdRot/xyGWTWwlBEQyAkvGVh5TFdkAIQdqoJqvBtH4kJOt4kIyliUcqz2n/qlhtXMlY5ZEE1wXNW1F29Qbp2KWIu/l2tVtPpdDgcvnz58tmzZ69fQ1httVoRfY4zVI1Qi7ZxSR0v67vmozNGT/Jf5k4XPba8GD2KYTYajW632+/3qQw9kku3uEN5P4G7NIapavhsm6CtLX7dFsrorb/lPSwcvYy1x2Kad8ceDcwZdWVwSgSiIZeYfDxyAjGIkAeiDU+M/iVnKX8hxkbPPe18+GP7IN8FFcycK6swiY8ap4xmmLEWuMFQ78Qvt9vtnd2dXr/XarWqlSryaQt2lly8IDO72EpbODM/kpZP69WrMi3h7Ov8h8ZxII4AsjEOOJAORNV7/f7DR4963/z9ZjhcLJae54rgB4iuYZxLp9KxnJHCiffeiDXP2tC9l8AA9ji7T2UuBhW/4ziu1WphGI3Gk+ury5OH4063DyFUW8CIUtW2aM6wLE0NTqiTK9NbdhRhlw+F5O/be7d7h1A3vV3JQg5K1ZBWAuUbFdbuM6KJKNAUR9FwMBD6B4skTRzXjSMQy+Y0J/wJLttFT9CdTL07rdbaENVvSBtdf0FfHdYJEORZyUfAIuaWZbVb7YOD/aPDo2q1BiIxiQznk1yKGgo0YDWsgBs9O6HuE69K8btfA/geUxgFNMK3GWdSCWlq/HDzBJDWAFAjBayh7CfHth0XKKVQMw1cwlq9XnM95/zicjydLhYQgPeBMgpxSjuFLAjeNxaolj5Jxh9UeHDWogZPifBM+jAzYYQTKNVSZLLptqb8oiKFN/wCOS4s3yLvRlO1LfmMC0HU0hoTn4Q7nSSubSdxvFgur29u8MsYOD84Pm73evVGg3z47bYvbYRSlFxlHpq6o2rn5sRRHdcVmCRGbemcP69nyC6Nx7wMd4sjmbd6LIWHxYUR+aKj0ejs7Ozdu3dYeHAymchqmawDhl9XwLjLeYObUEHjV8Y7vK43HYe7uI4DEr4oLnpycrK/v99oNBAkzAsOFc6QfLSRsu8MUZM84LP9yFvG3IhM5X2GO7a8H2iMZB6L294xmlFxHON8WK1WqCQUiYY0XcwqxBdUoh37QINmjFh+Xd2E4NGf5PzzEduOENIRCkvPb7rwzGpGy6hIM+F+Mg0OCIY5Loivdtq7e7u7e7vtdrtSqRAWbcRoCnuYud35cO7vTjxme8uzGwq/VlRKvTgRF80nB0KL9jp1Pd+v1IDce3Cwf3l1s1gsozguxXEKNwu+QsaT2NwhKTBzqMyJsjusTHfc1ihZfdt3cHsXYKBx3jSRDiE8a0kynS0uLi5vrq863Z0w6EHZbdcVAeS0sEI9DmjhapMbS8JC5O8+tnn4y7eP3SHMk52UWQbCLmryZTBr4wU14BiIMKZSOJAu33gyns4X55eX4/EkCqM4FRWwxe8Vds8EOSUVoVjYoPAR0p/mL0/rNZFcB4vOSMNYfq7sd4zKwEsUc8PNDORDhZTZer2uViqNev3J48f9XheuVATFwcEQaIoZ5wakSHZG7btmlIu5hXowS7/3VmiX0EfSk0ZANccUVVArAolq8d7aIHVQRBoBaxJoBpgR1Vqn23McNxEmVxCF65LluE6aDiyrFASB+JoTQ1zTEYqXODeUeoeaP5IGQtR/tYJLXJPIvzLqoWGmTAFuNTkIKKRtCeey2pMKR3MDwRiprkgJxQbXwJxwVItTJyMOoSgMk66TdbUK9XZLpdIKAcD1eiiK4gVhmK7XURx9GccnJfCrSZQYkSJ0vDcJqECBQc4XVaUbZIZKpjSLyA0pCBlIScCs/kHpZ2nq5AYQx/PoeDk4A4e5i3WFqyV9PwzDwWBwJdrLly/Pzs5GoqEzgKcTuJEsP0iPEmVJbXHIOdaXB8cK3zHSsfDOlstlX6guIxcUaXuNRgN1/4+OjjqdDtJHfd/HVDeuQGP0yiDvbVI94cZZHnzLYzvmncw5xnSZnNh5K6hVeEB6x3hhfH+TCKHh51NowAYZs3g0Gs1ms7lo4/F4uVyKcrh+BJz3uNlsBkB/p7mR4ZqSX0TcUSR/4r88O5GL9xR67OhoyaJwW1vhhGfLHWfIGwORSUvD1QHJe8ThFOE8ICF7ntdqtUB/tVY9ODw4OjrqdruoCoMqo5jwsamIhVGoo/h+EWX0tinx260Otd1J5o+DXhkYP0XQqXD/Ko7IiU1BSoOCR1iu9vv9vb2DcuVlo9EMo3gtyodA1oBlJRTqYgYn4ZO5pYM+0klP2y6t+B3Vb3m98tBiy9OAIvReLoP2ZDJtNuvT2eLN6dWXs6k0gON47fsoRSiuusAnpG2C8AP+IakksGWtgEJ1336O9rE7hAqmVg8SBViU26JQu2yERn7VDFpIfSrxOknBU0JFmeur6zAMUF4Uz8MNVDquhkQ+CB4rMGK0r0jPEvUWgRLGgV3TPsGpKUqjTPwbxXHZ99rN5snx0YMHx+1Ox/N92Jpc16QZsE6oNGetg0FxSAmqSHTmY3naudRBIRUkY/+p+UgOTIkyPOWXVPbp1pPqGiei+jzeZr9UKtXqrmCSOo7r+5AKVYEShaXhaCzssCSMIolpIwtUGu0yjiDy3LRXSGQnlaKqrR/UstbunTJHDGVIhnvw2kjbR1TLX2a+yhwt+SnBcbTZU60VmsAsIAncUWGPUhO5l04UxePJ9Ltnz4Q2lIjq2lar20X5kGC1UpVaNniDFApS1idqjcpyMmSXq2vjF8QPgzfeoA/9tJsmhWwwAEEMXAOg4+hZniB6e6xdACBoZKOsaBAE8/n86urq7du3b968ISEZPDvmknHPExv1Z7uBa7xjOFEmrp39Jnl0JCiKzqHnec1mc3d397PPPvvyyy8/++yzbrcL8HuthlY7FSHcghcVAAtF38lHB7Z8v/AUW3DF/D6y/bA5yML0SA0cdXvD+4s3GmcCskPRD5xOp7PZbLFYBEGAlFEuLUNxAbxHmGRIjiXPAKQu5bVbjc5sGYFbTe+s5gdXzJDyLVjaoWAwZc0cqNijyhlAkTf5xAP3X1KU8ftpmlYr1d3d3UePHu3u7iJZlGZafuSVWgC7cWolMR5Y8h71drO1/T68QWpGlC1n8um9W1oy2oQrWIhpTD3Pq9VrvX7/5Ohwp9ueTia+74OMFlSMtNdxzLZFnbCtLFR+wMzh7zAls/3Z8A5ti+SF4qlkaFeU2oDVOnWiOJkvVqPx5OryejIe7x88ANGBKPZ934bdfoPstiK74EJr0IsymkYirsEZZ/eJhD9ru3cIpSMopyaUfIAmfRhLax1yKaRNNhfFw+FhFrnv4/H44uLy8uISA+vpWoqLIpCo3ELaddiiYTzY6onRyVdFOPum9UAt8JSZkFnzicGN+xBKKSIhhWCqMASvwPXcZqNxsL//6PGjXr8vhBR8BzQXpTWWXwZlJE2MM4GDOiIl+vSR+YPFnmEWS8ngYAVSq2iaM+7orWtl3igXuh0y/alT6pZAP9P1PNDGKAmF9+ub4Wq1TJK45IJ2H4DGJWGXiOPRZLNVmRS818z2kW/oDaYoy5w2P6O3WSNqu0Q2O2gW58nAPur6jQAwfQOldwzSpihEAegohOiBFw0YQpIky9VqMBx+v/5B6ues10cPjnd29+r1ekmBD1ughrwdT1oXeKt4r3g1Rg6FEaWUBbYyR/6pmi6KrRm4GmzhUJURSt/uB8qDs3uUpmkQBKvVajabXVxcvH79+u3bN6PRCB0ActXQGzTiCD+GUFQEwJoTLn9P0YlFr6/ZbO7v7//5z3/+8ssvP/nkk36/D7wJwapAjwUN9FvZg4X5gbem4eVduELqgfETDsptH4e7eLB5x4OjT3dxCDkNEouOYMbgfD4fijZCve7ZLIoiikGgN455dEgZ5ZquKCpD/FKcRdQxfIGiRBwqzBTUycbs7tjMkcmXi8IKrcab/KnhS7vQeCylGMiTCCdioa4LfNHdvd1HDx/t7+2DnIzj+J5Pqa23zoRbruKDwtO/g2aItRQGu9U2rMNyWpwv93VdG0RIcVYq1b39/ePD/dF4vFgugaTjAlUHHClaJQqiimhBZT18irgrS0F/u+jSCmwFpUZOf2nsg95CfxClAZLUFkpzURwFQXR5dfPu3cXR8UOvXLF0hXrg4hQOLd/Yt+oqGV+4xwh/3nbvEFIIRNq4+CBI8qQq1o7ELK4ogy1jzQPiD04gRakX8/lkNLo8P4/ieDafQQHlFFZ05R/pndLYlW0IFGXkGZiqhOzzls0pu5CpogMq4qgyBZUziJw+6bRJJ0HWzRZieK4Hu6yQRvA7rXa31TzY33385HGj2ahUyogxpmnqecCG0nunHD0GXbEAlnat5Rsg9vj7iy9uaQXwcrFTkxsWNVIKMFQ+gC4neUujDcZ1nfVaJC2U1uV1tdFspmm6XMyXq2UUxWlaSpL06ir0fX+1CvD7UZQiN1LIzECRBsST1SXgQyT0Z3RfpbdPzpiwhVjoXSnuGlM6ayrxEoaZyH0mVMt+kPkxvamClvgsY5EJTWFFPowySzWVTkBXVdclZQtX8APDMFgF4TII1wI8DyNIctrd26/Wap7SlkzixBLSu4VoIQX4ycGQVGG8AkbWQSqR4vXB1+mFAj55NOGny7VQq6OiD2RGl6s1GuYs+U7EDyzsEg4pQTfCXk/n8/nl5eW7d+/Oz89BnPnq6vr6erVa4fdF5Q+Ag4hlmnf+uXlNNjH/ZiEdNP8rekjxC3gfUd2RSsx3u929vb2Dg4MnT578+c9/fvToUafTqdfrxBQl8vAdgbJ8agCOT6Hjt8WdM76WdwILR4xjendnahVFtcwQhg70FB2QMzzRSYuiCOtPTqfTgWg3Nzfj8RgRQq4r4zigqOl5wO6u1+s4SbAEBb6YzWZBEKzXa/QMYS9WOfwcyTeA7kKHnKuM5od9E35bQGjPWeVym87dL3zf94HPgc33fMu2XM91bLjwarW6f7B/fHzc3+m3mi2MRIjYA3of2/x5oIOifB7kFBRb5x+WU/o7aBmvvsClp6oTYK4hEVyGjRjHkg4FVpztlNxSGITr0tqvVMuV6v7e3g/PX3q25blu1ffnoMvirCEPFp8asBh1N3QQk2O8lHCvxN94jDRnTPC6aJl9WnVUddoE+/HkYhUr4YaWAg8unYyFlbtahsEqCpaldeqXfSu1EwsS7zeNLdmofH8upIxqlBJN4PtMwp+tfbwOYVHMVYVZpGovBt1xQnOxXnO30M8KfirkB9MkicIQgprjySoIkKdCGS/wl+L5maJem/tsMHC2+YRYwc/YbyAeyU9inEpWmsZCOOS7yWCk8iEb9drO7s7h0VGr3UbR0UJeDfNhGCuGFjA6vRJMtMAnzAiQfgytyD2gJAE9rmo11OhqASP3zkOHy64NOXkQZMCi6mIKNj3Ae50KCMw0akI0H3DC62vX9VHn3XVLSRLDlifDoiA4xKwovZsI6wqzFlVoQFE4cQbo1Ajx27xPyDdgNKmY4BEfNT5KdIHsetn48iEw7oQeaDmsOlCE3YsAebBEsMYSNesTt+SEUTSdzb77/vsAnMPVfPZZFEW9fr+/s2uXy6vl0vM8LEu8KW+KTwNDOATjU5o2pE15SNGghwmVevhY3I4X36VRIhPigbKSJFg8pClq5BPSVXC38FYviBS2RG5mtFgAM/Dm5uZUtOvrm8lkEoYhL7dTjCdvOIVRXoIWz2zQQC7p3PViHrjpEGLpedd1W63WycnJw4cPnzx58uDBgy+//LLVanmeh8AgJnERxfTudkw+TkSgViHltcD6LMoq5NdFF76pDwT/3tGPzd+ILS+MxknIWIIyCAIkiI7H45ubG3QIR6PRFCSvFjhViAhKw4svcLh838d4QbVanU6nk8kkjmPMPESJGtSqweNQXOb9WHebB8F8neXCbRxMFb2lEC7a4HYKaw/5bAg0pUnquV6tVtvZ2Xny+Mmjx4/6PYlLU+bhLXC0tBOkXQG8UEVR5f3/yE1wCfAyfq/miLI/cerIwL36Ye44MBMgxSYBD39n7+D4wYMHD05H4/EqjFZB4NgOYGvQhCG2XQ9IbZDyXynrXbA2Zq/H+G/h5+J3meii3BghPwKKbMgHNorjtATi5IPBIFgtdRCtlFpWQQIh71jBs8a0ALImOl7gfSXCn7d9vA5hrjFOowzUycB4NolHMd+MH4t/6V3Lggpv08l4OBxNZ7Ml1B6VMxuCmioTRv2Wh043P6Y8zYmZNYVXwnuLrAaDYpC1fuXh0d9IEsrDKYEtGydlH4wkyypVKuXdvZ2j46Nmq+W63hpodLKIORqpW6xeWCulAqUuugjvbLAQPiqyOAd12WzCoAQ5AzmQkI2TBJPUL7efC+oLuZDvShPJg2rrUFbEcWzP90EZo9FotaCs9uvXry+vrobDEcjZuU4QwBy2bQfE0FK7ZCUSxVJbEYacyb8lNw4+LjK5ZKwBpwQeyeiw8Rgan6vahCa5pOjRkA+hLpCSDcSwMg5c1gUPJKI5sEujAQrugWWh7mhpAHUpACQMoyAIj4+PHcft7+7aAqPAeApeO2j75FYPbn5B4UFkrIm8OkG/0ahFERa0TlOZmykUf9QB8xkn79moACYHlCS3QdDXjCITxHTD8BH3Igq7kTmsUJFBiuBwCMqiP/zw/O3bt9fX1/P5PAgCdMYID+R0PgNMy5/FICSTd8cFcji/Tht8mrKBBprOPbMssOf6/f6DBw8+Fe34+LjVarVFUVbP88rlMvb5fe3pLezQvLvFi7Abg1A4zQwQz0DwDK0y/oVMnYMNbZNI6a2Xz2cCcobDMFwsFqPRaDgcoh+IlNH5fL5cLlerFSaR4pERqkXM1vf9Wq1GHjsOked5i8ViPB4HQbCYL5arJbxYLFarFR4N3UK6wC3V5/Ow6qbbt6VtH0NCYdA1g8cwtUo2qBIIgo++70hI7vV6n/zhk8dPHu/0d8qVshHX2NIlifkTe+MOBJ2P1zOUqJukTTJ+KBN1UzQTXlbBPIyIoDsCZnA9r9Xp7B0cnjx8eH11tQzCQJDIICnBcewkBaqWBTQc+VvmgmKTOy52JTM1N9Yh1B3T9id7F/c+aYjinqyBcD39oWJiAnD8GlK+16XSfLm6ElGbTm/HF9UvRXh3Uxcye0pm2ZH/mAE7uqL7CMXP2j5Sh9DgzGS3MU33Jy1HrYaiIyUFB42VuBnIYy+XF+cXp2/fjieT0XCwDIIoDOWWI7Rn2IQ2txgqJMs7TDKN+A49GNuuM9tTfiXqsdPmuhTEAcBB6kCiZILruD5o6ZXL5Uq1Vts/PNzZ2xWbrleGHbeE2TE5W4FCVRrrABtXW+9s0SIKxN3S4X6Xjd9Zesl1CGScTMC8yqHG70jTXw6vOZgbG5m/sEkB4QXut1+uNFtQRRfDy4ABrtd+2U/SxPPcyWRq26CtH0WxjHaie7AGNBA7YFwO/iHnQa4PmuWIbE3BvcHjqDmC05SxZPnP81elPL0iMFU/7IjDqlEW+zTuf0pqGCusAHglnSD4DToklWoFLddlEDhxjBlKoYjvRlE8mUzm88Vysfz088/39vc93wfDTXwH6hMKAmFeZ1KCUdxAJ+d5M69PTQC4eYwo9BNosuG6x4uh0QsxdNqb0p4fC1TRi01uIeUfUhl613Wn0+n19fX5+fnr1yAk8/333yNTFL8QirLORNjDsxuiIHn8sBDGxG5TzTp8H9E/CYcyl4DS//A1uhyO4/R6vf39/ZOTk+NjiPIfHByg3D96g4AMK0XK7S4xV2rNe4NbXnBeruENFhL8+BGKJlLB6Bkjtok6mO9h3i3c1MjNVsn1EEBZrVbIE768vBwMBpPJZDAYzOdzZH7GouEP8fue56ErXhUNOb2o8IShHEF3qKMyzXw+X61WeJtQN3h7aFVbxEVk48IL3CTdWQwebkBQyQhBYidRObC6ieM4zWbTduxOt/Pw0cODg4NavQbybgq7pnhEfhroy+EQ4ua7dCvA+ztuuWsXlowOQCpFNaB6ijDTOrVFtuCmyQ+JrCIDdp0CmXn34ODwcO/N3u7lYDybL4MQZHKRQUbqSoJriohhhjkpH1jsFu2/ZmiULqTo71xwlhgduc7jdUurTZBj13ESu2tnsVhcr9OL87Pzd297u/uOXylXEheSchMhYJd5grJmLHcLdSZkPpyUX1t+zD29b5vaR+oQFmbeM0IeMrXkdyjqvm0iqlUWeKEpKMcsF4vJeHwl6tHTc0vUFNInEA8/wz5ymsK3e313uVJ2MOPYCk4g4ERquOOSgFgpnt9x7HarubPb39npNVsd3y8rK7qwfiKtNxpp4RsgdovWCYx+qWjl/dOOk02BX0zoDGetiu+yBoXpCDSUscvtPiHeb0xxR98T1eRcEWu3ITul0mg0alWgJLmu+/btabpez2dzAdgI7wX1sQE4E+HsLF7EOa8YOi3y6TRiIzcHSUaEHRGdjq0DpeRWjKemMIIoXVjtGdobRznTPbU+SGpmFGrdUXpe4iReLpanZ2fz+XwymY4GA+h9mu4fHrq+v5jPBXdUEL9sBw9XoK/DYsDa1he5GiTkmrXpMYdUJutq8vBmoP7DEEJCb+Tgsl1ZWKvw/zlUUBXUKXJN1bjBYogJXWEYzoB3NHz79uy777794YcfBoPBYrEg/RjDyeRL9xanKE8Nzf/LDSAy5XmeGHcIK5WK7/soIfPw4cOTk5OdnZ29vT0Cpoi1SP3ctGvQiTZ5aHc0yu9or+e/Vmh4GWNFD6UBzBb+PH91W/rDv0n1BpHGKR6iyaVo4/F4MBhMp1OEDZHtaQQjyuVyp9NpNpvo+GE5ECrLjrNrsVhQ1YrlcjmZTKazKTqN8/kcxIFRuChdxyVZKzjfyXxkIT/IxCDg02+TK1h4awpCA2J9xalFCreWZTUajYODg0ePHvX7/bJf5mWfNoWEjIo7MoEww8+XdNX7lvPrCBPIaMdwv5qC2njXjIbIrYAEQOLI99x2u/3g5OTs9C3kSw8GkKgPFf5o0+Frgg6X87CmGcXJ/rIYK2QScPSGXMmz3qC0f1myhvQ6JUAKZegdxwmjeDKbDQc3gjUK+d1xUTwiNyF5ogf9WxD5uvcAf5n2UTuEvMnAN1lq2uyWHAD1cGz4OR0CngZIhwdv8OpqNp9jPfpSGOIXjHr0UNpbwY55ipdh3+R36+2ZhOoMGdRJMRzMB5UEQvgeZiUJbg+e69Rrld29/v7+Xre3UxaaGSIVzYYf3tYBSU2RjAvyA4vYrGo4P0630NAX5Z/Qf9jnUgAXF1KpWUcxBdotNqQXIinJITAa9zZXJpGWSlAuqSzM32qtBiXsPVdAQ2uY0g5sbIASig4gC5oWdDXjbMyB2EJloQQgdT3iX4EelSAJIU0TWccSgSn9JdbyU0g7JWrz5Juc9qVYEiMf4cJIJO1SBkJFxRJWpcCaTLB2dhLHAlFMXc/b2d21HQcjxyjbrU5dKPamLULtmeTE8Zm9qJYlLjwrB0vGWT74QVIxIs1IwnXR2KoRXyUjmKvIbA9vQYxZtDAMx+Px6enpt99+9+LFi+cvnt/cXC8WCyx/nMesuD9Q6MNsakVmlvkF7g1yTVf0BrHSYL/f393dPTo66vV6lUqFSrZy8ZhbBpY13pm8b8D//EmaoRazyWvNyv0VQKz8Ox8WteSDwL3B0Wh0fX09GAyGw+FkMkEVGXQFRakzcNhQvt+27Uql0mw2u91uu91uNBr1eh1rP1L9PYSXF4tFs9mciTafz+v1em1Sq5TBIUREEexakVhYinRVTCN2sP1KDfUgoyL8Fg8t8yKbxSc/AvVviWZTZUUoPHhwgKmDFaHu6LmAS2+bfmw5IAIUpCbKlHDZAZNbdJvI7UfjFmKqO77LMviQOipesmV5Y01CsXsKcNqFWddotA4ODg4Pdq9uBsvVKowiyCS0wGPkPHlph+aiqjzPXEb3uSVhRo5ll9Vv1T2XQLRY8TLbkDbXpJybuL50XUoTCHDGMUzLOEnm89X19fVkPOzv7CZJE2TPiqIhdKxbJhJL6+C2LhophcDJffvx7aN2CHM7sZRq0NXntVTUNqhaspioXHeSLpdLyIafza6urkAme7FI4hiyg8TPMzwfEZfJZIBtbrxw8Eb6Sja2JyVhRJKRrGGN1jL3KpCTYIFKMOw0rovrAkq3wYLVbJXWSafT+vyzRycnJ7VaAx0O1/Mh6awE0jLG0PLu6F4R1KoCQeTS5FzAj/Zpz/gg7K1MXIAqR+lYpY77kuwtLwm4DS2UpdXWaQmIRusgCG3b8ssgIWtBTmkSBuFyuRgOh9PpfDqdR1EIuqO2DUxIIbmZqEUadi8dQZQymKR8k6cyohKeoCnLC5Z1F7CmglBAVYOAhzWHi4aFl22hfyXJJjuycgc1hlw5gpxZqksFCjdV7v+CBVBaryuVCj6SsvyAAwar73tRFL949TKOwjRNwjB4+scvd/YBQcIi2lIoX+CpQNEp0hrRdKCiZzz7jn52JLYvzDvtC3/QxomuoJRZRqlxvSVnXD6kvnJQQqTJaBE7w3PATqKSh9A0duI4HgwG19fXL1++/P77Z8+eff/m9evRaCS/kwL0naQwr/DCZZQ9O5HyC2OhcozhE+a9TToyIjDYkIaHrSUauh/lctl1XfRA6vU6wk2IMRqurJGnR+9npKSzLi76FcglMVL4bnU4b725m3IvVVURvdrgiWQqbJH7nSeI3oXWRWehwoAYW5lOp+PxGLHB8/Pz0Wi0Wq2m0yk6hFhdEGstoLOHHN1KpVKr1TqdDqZxojeI7iJeQhzHQRAMAIGBRuMcBmG9XsdaFHiNKEaq2Xqs5YVejblEEYG8yVsIz+bQGDOqQkYwzkbP92xLKhXV6rV+v398cnxwcNDtdKvVaq1aI1+0kCwqTq8ND0HCYG4hfVnv1MXhqo+q5UKLlNePIIHeYKRSKyKuqojXpgr1cH9dJwzXtuM1251ao9loNkAmFzbQ1HEssX6oBVzPN/0fmBi0DmPkld8dwjew45m4p/5LMDtkryiLoTBAL2tSsFkCz4jwBi8urzvt1mg6Ozu/gmCorFsGuz9F01SQWs9AWmjy/qq2ZCQoW6Bg/OF39L5tbh+vQ5gJchMmZbxDwbOtK6FkjuFDkCRxksDeMxxeXAJCCBLDKClK2IJp2Cro4w4dNuK1Ba3AG9TZSplFn2/efIdOEgt2NfgHn70wDJqN2u5O/+TkpN/f8f2yA3sqFh6VtveGrijpfAPH4T6PWK2UHEbuGj7WxvRNiC4i7xS6fODAi9umnEPNHlGOtgrr3pZPSOwSVMZ2XZTpW0P+qLjRtm1jWlS1Wluv169ev3YcKM4ehSFouysitOQ3Cjap8E/orttSa7TgMpWfh3sbPZW4j2W4TASE8a6zyaJhSDm5s1spc07wRCwsahydTAA6GuKVGSSFatarDSoR/x/H9ioIbgaDUGljJEnyh/Czw6OjRrMpak15juvYSYx3EGpP59TYqLe89rq0AMR9xhGWsyK7OGnfmIblvbdPucio4JjhmiokQ4W30AlUtCNkit6Cr6KSJDoDq9VqMpm8fPnyL3/5yzfffPPu3bvRcIRpiuiiJLE0zY1SFoYHQn8ahjt3EY2V0LDaOQuRChJgKnWlUimXy61Wa2dnp9Fo9Hq9ZrNZrVbRIaGz09VxeS26ieT+kSBKvpYjdYy0IrEPZFf9eMyQzyheCFTEJu21YGwbu8yt5/oA7Ii8LEwIRPLwcrlECRkqORhCMZcVyooiFE8DhVZstVptt9vdbhdvCkZeuOOHbiSUKlmDwAzm16FLieI0WOICKaN8alEPt2+79CCQN5j/ND+GHMrjfn7+XGSswylsOIVf9tud9t7+3qOHjx4cP2i1WuVyGfEdmkibxlz8RwKC+DrDHlKy5/oLRZ3/+JokXMiYupKil5W8SIhQ7h3yxaYxA5xRfFSpVBAD3D88Oj46fvv2/N355SoIbDvB70iajfLPlSHAwEBax8iDUt1lc0h3RPFsMpvCdlA504ioI2oNwiwRi1ocx4v54mYwvLy8ePBwsru/XyqVwjB0XU8lFlG35IXI9ySXJTvWuXyTfC8++gn5s7SP1yHEJq0cFufDZsy2O5ZDQKAgCsPRePzu4uL8AioQlkTNlgjgAllv1wigStDOsG63tjwdhV9RoSlW+NTRKzEQMksfw9vrNWxvkpyzXnfbrePjoz7omNUAGXIc2keQvlLYl2J6n3Z3MEmJlqd7VWHeMjeMJX6YdH5FW9HvCFdKbOhim5Cs0i1nEh8Lo1OGpW07AWwQ4n+2xIr9suf78K/nlv3yD8+fz2azOI7KAvUSAqSQPQXTG0rV50wo0QmdIwdKKPoLMp1P/Y3wVP7SiyCdgkeTZ0/QV80UKTX7zX2QDakx7HzPxE4jWRqNfYgcCeqobVshVJlKgxXU1AbiwHq9CoMkSY6OjyrVquPG1WrNc0ug3Y3zv2jiG2wCiR4IVBH3ULWf6i6xgqrySqQw3Xtvn9YaamBLTE44n1iEkI4DGkA4HmpY6F8+uuZNIa+SrPAwDC8uLr799tv//M///K//+q+rq6vRcJSkSaVcicIIvEHGseehYo60GCfiGFehOZ5HFykplF6jUwdVWARruga1WOoIDLbbbTTBESFELyUIAg7LYNU4jixxXVOCxegFXQh5FCRygzXT6R3yhX58sDyL60pAMv+U5U+0nUN4R7eEgDgii06nU5QVRWXR1QoeIVQBRc8Nf86HqFqtdjqd3d3dTqfTboMqMrro6BDyxY1ykzEYgaeu1+oL0QhOVGig3A55yw8IvUl5fZsGeVPDsB3VezBOwV1fLP1qu3alWmm1gGT4hz/84eHJw06rg6UmuLhoIUgrbwp/ljmDIhsvJkXTDyMD/y4bjIbS7qIShBkbR0U2twdhxdMr1grHKVmlcrnc7fYODo8fPLj44cUr0BotrUXtX/D+4yRR4TbdD6JTEt5nwAxUqMHooAEBci6AKnJU8Kn8App0a3BmYV8QjnEcx47rwQIYBtP54t27dxfvzvb2D1rtjqhRlAj/19DWzvSaN7oKjQ1mwsSkGHBvJ/4s7eN1CPPyA+qDDDDNtTk2uYW4VxHXaLVazUQhXatUGo3Hi+WS5+KjeqG5ZMuHTfI58xkLGdg9b92yi8p3Ty/9he+rM0Hw0RY1FIXQqJQVEeqi9UbjYH/36PCg2eqJoHgVlbH53pw5Mp0Aw5GSksLwFxp5FZIkau7d3e/fd2O3WJm2vN4cr/XMl3UlBILf0sw04UPQqG5aT+l9aRuJ15isIh8K0Y0ogrTY5y9e2I4zm04tkcYThiFiGqgCmULSPAgmqTrykmAj/X62FaCcZiyyBjNPhHAZMXGCqapmUD510WzcCJkGl4bEodQFZrfEjJHLVD25MaVjNZg1Kx9I9GkhwIOBXhztNF2HUewkaRzFvu/bS+fVm7dhHK/CYDgafvbZp0fHR7t7+77nJp4L9V1AwbWEuUEwerkq0hr1Uha2sur4p+JX6gLFCAs5OBl2kZHjuz9RygfGkcUION56URVDhq1xcGTZLY52FB6QM0Wl1F4Miqw3NzfPnj37+uuv/+3f/u38/HyxWECt4yRZLBau6+LS6rku2gHcs+J+BT8XeY95Sl7emeQgJ+faESyDGGClAupKzWazUoFMLdQsUXnU0JnFYoFsw1IJzDuMjlPkjhBCYiGiF0Qv8LbyJDEMrwBLUCo8QZ5bIvQb8JFEYIHAw1vZpBtrDyhVmy0byibqIDlFJBNK3jWt6jTynH2KM4E7n+D7hcFYJN5fXl5eX19Pp1NUf0FgkPqGI4Apf+VyuVYD5mSv19vZ2UHMttlsyrLsrNy853lUExKLQoF4TByPrBE4Y2uAENEJRP9TzEGpZqRX2lw5DbpeIhhnnqDCyGwmzCQVXHTtB3Vkik3IVEnHrvnACPXLfrfbbbaah4eHhweHB/sHnW4HrxcnJOnN5O+17BsZ/aqGFpFINa9E9e69aMC/78Y3BJV6I3dkvGfwoa1dNWbS5AdNrtuhCBSWrJLner1+r1bxu+0WFCpbLol3xsKkqCcjq14YGmn6XwocG+FjdimGJ6YKCRVM10ztGRXjRx0zrD0knNp1EEbL5Wo4GL598+bP//KvSRwmcWSV1l4KxSnEgiZpFMqHLWikEsDr7mYWNCoEsDWH6759cPt4HcJ8moScfHnNqAzcXdD4Ii4SroL5Yj6ZTueLhVRJV6HNTcyTDFhX1Ellaul6GFuKvBQfOXNM7ofS+2Ceoh0OQojSJ7RLllXxvZbI2u90OtVqzbJdpJ5vexgZuUFWddWPO1+RCMJiK9FH7w1ml2OM9+lccmXn87RMtqnrkC9LFdDDuzVczSLfZBzbju2tIXcFjN1KuVZvVCpQ/KpSrb54+dL3/dFwGEVRWVQfIgPXti0qaKn4LIL8QjptLNcw80L9mdm3WNSALmPjA6DcYhnH4chqhq2iPuXxl42HzPBI1bFk/DKMQCscAqGoMCnWggSp4ynUJ1wFwfXNYDQefTb+w6dhaJVKcZKWy5VSaR2Gge/54MBZFhC1c7wyfCEUnEReJZ6T0bzVqiV/oQcO1GjItuNP2R3cQ6Ucg9u/PLLKQN7Uio/E2PKo94gchCAI5vP527dvvxbt+vp6uVxKGE1cmbDaUbkgo6mzJZNt02zKQ4X8TzS+DS/CsqxqtYpV5muieaoRUoeXsxINcTyZTSpWTuoDuhYYOsTvECZGtRaM1EEy60nvpFqromQIYl+8iCL3Azfdjk3eIC8/w9/HDhscXR6sJDwtbzuSL2GECw0eJrrE6/U6CILlcjmdTm9ubrDe4GQymc1mxBTFhYXSKUkGBsmi/X6/2+2CSEythvAgd4rwX6S6lMvlOI6x4EQcx5VypVqtIqoGykYRKMrgCpYRfiuY0vqq8Vz5K+VRiU2eYeZ+8TwKdV+IKgyl6YVbW6/X2+324yePv/zjl08/f3p4cAgTg83Jgt4qpTHlUmS5O1nKuXzAjcpb95a3aDIvfZ1liqr1lAgTOFibomN4JMe2hTabA8Wcbcfzy61W5/DwsNVswEoiQz/ADoAFBEMnOPFU5KC03RWkm8dtRWZomtM7w8qhy1T8IwXNqYmD24voDFWoj+IwjgfD0dXVVRCsiP4gHg1z7ZUZiWq3Uk8KqmVr+za3YYnsIvHhTyGkfd/M9pE6hGRIcWhFLZ0aN89FVTfiKtImW68jyBqaT6dToWo9w/y9NUMROcmE98fYw/lmj08jB0k0Cpe7rk0bT6a/7HNk7gmrRZQSlQHskp3YvicPWKtVe/3ezs5uBbxB3KKgyMy28ZXIDOW2IdSgSpZzsJBtV/faUYXNuKcSosp5g9j0ZCndntdZeCJpWFgWUEglBgLmUbVaBWjEAz13AE2EkMbLVy8tyxqPx7ZK7/FcV5TjBH3aGCh/UGtBui2WLfIhdFCDw6A6Oqj3VBU7x+0hJ+a+pRlOD23Y/F3Dl5DbHtu+8Etyf8rvrAqzhbRb24Yahgy8TRxnLS3+NBAJhcvVcrVaxnG0TpPdvYNuf7cMIocy5VKCpUU+odB8QhsduJr0pAvNHUanUU+TfsAQURNZnOTjoT1oWdINYLNFKRXRcfRSqTuDe7larmjd2uQNFjBF0Ru8ubl58eLFf/3Xf/3jH/949+7dYrFAMEQiQqlQ9RA/JeiM5gs5KpumAbk025dEIxuNe4m+75NgCfI/6SekjLparbA/CN+Vy+UoirBGHK/TIFMJBCaGPiQdgZxD2g5IsBT7g56P64I8PXovqG2DDg86DIRn8jxDAx3d3mhUCczMV9LLe32b7rhx0/n7BEiSJ4xxgclkcn19jbUHZ7MZVo1H/5lgVV50Ae9Os9nc2dnp9XooLop3iip/8OIfeBewOCSO4Wq1sh3b9SCxMAzDEB5RaBwYzMxhJipJkx3PYjBFeUV4YwbyF8ZrUn0rHF6IynlevVHf2d158smTL7744g9/+MPOzk61BnqqCH7SHMjdEjP8rQFbafEUQZeKWnG/JeuR0f8R+4KmvBhWFf1k2xEFYxSiSHbq+OWyBynKnV63V6uegdIYLHoQ+IAv0IPMFN1NvfHMyTEAKvy+tLCaUkGH8m9RQaYSgymFuBoJ2iHrQeYZpel6MptfXFzeXN80m+1qrQ5YiGC9o15jbk/O8Hc2NS1DIfxAESuGLXFDoaj79uHtI3UIjY1Nr6GS+i3hLJMikqMy4qfg7MH/ABuM4/jm5ub6+moynWBOPKWqUx6IyZ7mgLg6LgcedXCIndfgchReYDZUrFRJsugIxQsdUcIILUVRj96xrJLn+7Vq1XOdvd2eX65aJTuF+Dd4ioAiKuaYPqBiwYgxZOkoSgZTgjeqj7kwJC1t9w96phn3mId7DduFZg2nVehpzN7ZstPrwKe0peDLnufFseV6CRa/QnY0pBpGsWvbs9lsvU7L5XIQBK5liXIlGMyL1mvY9gwKtJ7Y2Y0CvKOM3yXLJOIfZNsliU4wwK/iAGTBc+UxIxBEhC76N48uSeMPXsD3UQRVfZ8/nsZtQQ1SUY1XmIOWFUYRYIb4vFvWlUDAVisgkCdx8ocQ3INOry/qeYaODRCQSBfR0hSMp6CeE9CTQSYtTgDmtDEMEyk9vECjoo6qlc0o/kuwvDoe7tU4x7JZq3hyfLrB+1A3qmjSKmAQqwWoPNX1fD4fDodv3rz57rvv/va3v7169er8/Bz9IkyZE76C9AaFpmsihJL1OThl1GhI0+DeoLFyGnw/gwSIHhEVNEdvBEEqx3FgbrsuIlr4E/T0oihCt60GBVoEll6uwH2OE9/3BRgYIgM2hCKWQFlETikiYAg2omPJH0B0CNGBGQ6HoCQpQDD0VLHyIcJl5JxgRjf+S07dXRION8mE5qk0bCZox9u473SbDNaoVORWZ0F+5mQyubi4EPvmNbKIF4sFfZ9uCh7Tdd1qtdrv9yuVSqfTwUEol8uo+oPaV3QH8QVyFnCUkOs7m85wnkCsATKd0slkgvRUhG3Jk9e5fIwpxAWHDH5mfjQ4gciAZEFWiqp9qoQRcu+xw9VqFTHhRrNRq0FJ2EePHz15/GR/f7/VbtWqNX3JAuHO53Hw8cdQiwx/FzFF+WUaKQYfd+4W4ldkMYl1ldTRmb6LGiZJbtxiyUB+YCxXG98vN1vtbqfT6/fK1WqjXsf8c8qbXa9LCdT2k3YdX/hkfJhAN0Im5QsMG+bQv+zCWMzyML6j3hRAHQfxhNSZbc3mC+faur48vzo/qzcazXZvb69s2w7GoGkTU8cke0Bij9YGy5yFTjIkpg+7kfdtS/voHELDINjYpJGqWXlyhdzwXRRbwuSExXw+FaWTgGNNs56JlamjSAq/4f1sKgll7M3GC6OHxuOtMARdfJasR+5XqC9LMxrqT4g9rNVqtNqtSq3mlyuu53uuK5BPKhZQPNDK01QymBR3pPSSbIfXdyADfoSNyBtqqlAeHuMPKyeFSCLcldAhzczkN7iTmUZLNv5JigW84DJAGbbVbDXRMLq+uppMJpEwcwEejMHGRZIXnQ5Ci+jIqYWeK4Fm3K0sjUnmxFF1CrUl6AISekMxvBM536QECvmBzP3TJ82Nvfaq1ZSWpoHiQ6PfRV9HLAusZIyMos8AWZcRlCJMZ2m6dl0vAbZgFIbBcRTBo9Vq27a9Wq5czwW7ER4tnadHN1L2H2Ok2Ug/wZsFi4OwNFGdVPZI6yZzUJ4J2OF/1JAqs5GvLaxo2TayqMkURX7gfD579+7dP/7xj7/97W/Pnj27vr6m/DrJsVfES82nAN2NTBTDWBIZGUmORn7NLCbUKQSSXwj1BHm/6DlQ4h9RXqFEpyh5h6UIUeMEJzyo74qfk+NBHianjBKJlK6CV3cg9BLdGCxugWgYpHYLTAy9UMd1rJKFdS/kDBQ6T3fjjJif8heF5Nst2yixSfk7BAySpmiSJJBsP5st5ovBzeDm5gbhwdFoNJlM5vM5jjAya/jdgZItouFoNJvNVqtVr9exEj0vCJm/p/QmFnBfl9ZRHM2X89l8JnVrhIw+96DyEQS6TVtYmpuG14zSqgeUDxd1ngsI4d0/fnD89OnTP331p4cPHjYajWoVyKIyswOfkQ0znDOhNDCYWWIVe4JWXw4/3Wv9U7RNq4zCngby2QrDUiske7F1wBQ3EmemXSlXmu1Or9upViouKBt7pVLs4D4i7EfaKhVFiMdDeRczJyYNYX3eoieaUGqzi5oiqs6hcUOhsCGn1zpNYMGJong6nY1Hw2C1qjcgIgZEBihOtiYxbZpKkHkkkiVAoGazTlXelNVQ4X37SdvvwSH8kYGrvGCa0PSXkCDIcDOOXSFIqG219Xq5XEwm4/liHoHpIOw68ZGkjIo4D5vicvWlQ2UcAH0KbcfmY7SZzqgoo7F8q6BV5sHmuwFIcEijRJ18vYbgK8hLeh0Q1WvX6k1yEWHLh1JsxtlZPxgdlEji2usTqxb7BJfaezGZOzSNFpluTF5OJguJiVc6UCf/LHx2CFUWREhJRkKLVk3RkgcWsO25nisYXN/+AxzU+WzmxG4USUUNPKcq1gdSokkJahYi30PUT4DMVX1dfIbrrD8I4nNn2Ji85M1o2qmeShSmVc+brLVO7k7xrmLEaYwqNXyMxH6mxU50BFdxhqS5JgzOKIrL5TJgR1EMHLXlcnf/YL1e93p9G0pRJCUXOikg2UzpAn5rMLlfgjPSP4MHWFsM2tSU0Z40hR/lo09q5BH4o1+Tryi/ZUD3MoFy88PKcWBqSJIcDAbPnz//9ttvv/766xcvXgyHw7Wo6IgoHNV/M4wYcj4LiRI0MnmYi3uMm4KAeYog9QS9QXT2MN6HjlwYhkhQxH9RbpSEPSgfRhwZ+VTyosgnpINzj5TCLkQnQawPOaJQba9eq1VrVdGw/mG5XO73+7VaDavtYVcJXyoEpm6lBmz6k8bHcDKNwIQBz6IwG107uF5JvFqtlovlZDIZDodIFsUEwslkQqmDSKlFpxojUAgGIkzaaDRQ8RXdY8qj49dLU4K/Rg8cjh+Ek8lkJFoUR5CuKmK4xqzIc4+5N1g4pMbM5DY3/5WmoaoNmbBHnCSIluM0e/To0eeff/70s6dHh0fNZhMzIUuiKGgxU5Q6o0KBFPzN33RNiWIdksWN7u1u3jAYBi2RG5GKE+LHtAVJp3qrQUOzwnHcxEn8crnf67VbTbGewK3Hoq4WbCvCA0IDitY0dRy53OS8QX4qI86edSR1KVkVDJRGglkVQk1bfqki0RsWH5i3aTqbL0SF+lG92Yqj0LKwxIsLbp+BXauESF4wg/d186KdK1V2336K9ntwCO/uDRomwhaqDLEpJLmCYj7s+dZ2g9o5gmAVLBfjyfj07dvJaDQVafFRBNRqaVKLNNyC/YN1D59peiY3YYPc+jGGIvcIUcgzNxZ4TeL8GFuFcvNKxqDsg7hZuex7ZafaaHqiPJ1llRysU0cVeDW0o9EF/Zd+uJU5oqpdk4dKbPusz3rfNt9WikXKv2Thd/KZlOWf4Y5y8MxgfG0KABtYAYnNoOGbrtd7+2vbsQH/SVLXcy8vLgeDmxK4iyAvhlapyAqz1muqvSZZokA3zQQ14fFQwKUoc4TzQdhR0s3DbFSTfJIzZMUl4hRTnq/Be1QI6Sa+ACufxO1dUm/jhe+BFyqOAExWMZ6+42CIhWy7JAFjfe37Vzc3y9UyWAWLxWI8Gj759LPpbPbkySe9bt/zy2m6dhwXAEYoV6Ni/0XFzfhihScFYShG0uOOsXRRCJnXYngyi5iLFil/Uxq1WUZ38cw0wk/oGCMOhl+L43g2m43H41evXv3973//z//8zxcvXg6Hg0BVa9RlkZU1TwekTDkDseFmN4LYhiFeiPAYdCnuOvJP0WGj4hO4KqI3GARw7xC0wZr11WpNOGLguWGqp5KQgZtPmFgcw3wXWFRcEhU1eP16ukySGCUPh7wdBAbROWy1W74H9TDG4zGI3tRrvgeeg9CFrpf9chiG1WqVlz0kSqpR0rCwZZLNiu4yvyn0E/4r8uqBACzeQXn65QKI09Pp9Orqajgcnp+fI0I4Ho9XwSoKYYSjOCMuilAYCr2Wy+WGaK1Wq9uFmuyIGaIzjNfISdfIWCZRVhIUXSwW787fXVxejMfj5WIZitJQyCDdAlPwCiXGiPE5yZmi/AgcgaTh4hmAWACDJENRzejg8ODRyaM/fvHHP3zyh2YDBgFK2AlY2ChTafQHVwH9WvIedbzIpA5y0ui9okxRUzNc24IohS3tLPmB0sPMcrLM44gb7zruIlgkcVJvNmuNRq/dLEGqgWvbsQWMEAjuYIYebuzqftIKroN2Bb2V/82jgrpkEdUtltk8mWCFnhz4ilF+VHS5BAJytm2PhoNGs3U1GL9+8/aTz78Q9afgScMfA/MfLkcn3MphzJqxxclc6kNFgLqnjP4s7ffgEL5v255VYnh9WwI8mqkloompoEVNp5PBYDCbzdGYoFOoDCq0ccXMxip80jDVmd8UGim2U1m786cQXtoWQMwIWuh9K04SCENWfIhatdsucHJ8WL6Enao56xrnY1h+piyacgK1Hapy1knh2sAr71uuSSCo6H2FBNEXWJ4mB2BzfCG0DfL+lXleNZ1IuIKMD3QOPc9rtZqNRuOH2g/lcvnq6hLKsrlQxxKFahED4Qk20CtBAiQIDzQxZeapnhnSn1F9waeERS8pMiqlidg2o7xCZf1g+SQKtWAn0KnLWLobMj+KHzcVzMDvU6FFcrNxBIRR6KRJGkVxqbRCT2AVRqDJdjN4/OSTOIqfPPlkf//Q863lclku++JyxDjrTmXuCIrKSGCVspKULgi8iUULhX4wSYZLtqeifEoIVnmOSuFJPc6cQsZOnYkg5KxFzhRFJRVEe+bz+dnZ2d///vf/83/++vz585ubG55RRnAQVL9hpET+r+GB0IkwB4++UygKsgn7ykcJOS5E6d8y30z0EyusIEEUPRAsdYCv8fylEiCiqLgQx0JlSZYcFJuF6CECgLTe8kuQ6oJCbBA/woAdMhvRtZtOp0QmBPCwVsO6C7V6rdVqtZqtSqWSppDWC993SBpa3rgNxWPNOVY4boW0GnxhVDKkf2U2piBLo4DLaAwF6JEpOhgAa3SxWBAAC/XNlIfMz+77PjJFu91uq9VCzxBvxCZXjU9aZC+HUXh1efXq1au3b9/eXN+EAfCZ1U4t79SmAFkhWdSAxPPDyB3C/P7Oq1/Sa8yWrDfqR0dHf/ryT//Xf/u/Pn/6ea/XQ3Is9IHBd3ehdGquryZUWGYEXJMb7l3BDU158qlAUCnqyqwhBR9kVu4CuBBna5qUXM+3rFK5UtnZ2zs42Nvb6c4EazqKHLmzCIlp2h0z+3VWkcLsrPId73Aj1YLJovrElTHcQtbgmRKi4pZjw363XCyub26uLy+Pjh/u7O6USlYURp4LQuWoVc4vgYKPfPs2Fmd+XUaE+vZrum8frUP4AdzRwlBERneLaHjZp5qHmUHmQVgMy8VCJENchxGkmgjzFpGJNQSHBTsO1w5Zk1rzC2Qn6ASG2Up949Hx97hAJKDzhD0CiJSvCk+1SNWirW69LpXLfrvV7PV6tXrDc6W0He4+QjYKBIVJOFS5F9JoJ5mKjCOj9iFDbvQ2a/y+6aZLCHDK0Sb3TznlXEggP3mM2HaeFYZxbtI7oX8RIfFBD73W7UBlkh+6nRcvqsK8my8WS9DV8LxY9BbdmwSpqNgHZvNZ6C6iHqacJHQB2RCDKk8IzpiEAkTtXsofQ5YX/jAVRU800UUPIxlnfDjk/NtsYGVGRoniaNCTuy4Y7lF+KJxIVZ+LoHq9hfqKi6X0hTzP393ddVxXav+qWyJ4uwU9sZkAKZnjsg9oOpC/r9xiSE8Uj6Mm3BBllOQl9JObqUcvY96m/8ei0FmzmNLkwPofjV6+fIlM0efPnw+HQ3G9oClKxfrkrcsudxtYi2S3yC/TCPAlPU+j2JJJyL9Al0CZb1SqHkP16KeHYYg4HorNEMiDPyVNGry4fOSbZDCNnDfyAxFexlOg+KptAxrPM83AC4WEIxd8wipwKSHPsNloC6L/g+MH3V7Xc8F/qJQrju0A8I7mLJPPuUszFoRCpzqDpXMSjSLKgpynqDU/GU9GA3AIR6PReDwmTRcMIhB2yp0oiYsKVBDL0JO4KDpImyYMOpYoDoSJi2dnZ998+80/vvnH4GawWq34RWkxcNzMshOG+5yFGa35pZU7gZjmR+MDDFUm+GFQUsvlcqfTefjw4dOnT7/845d/+MMf+r2+67nlCnj4VPR10x3U6K4KEhp7RQHD4j4Ye5e2YV9gGtXaSpROjxn15geDaeG6znrt2o7bbLV39/YOD3Yvr24iCIsAwdoWFYkULqfAwcxMM9028ywK9qMgHkFzFB+QUhL6eujAmcMSEUyKlsk1GxZGV2Q9hGEwnS3Oz88PL853d3e9jo9pI3Aw8eTwa1fnKPDu1Eoih45/vkX+4L591A5htozJneYIUSY2AdO01mstPvYhsRxp50BaDO5ks9k8jKLBcDhfLGWoUTzBsF2JjCljK6Uj885Q6RiOGfKvbY+OEC87O0r8+dbngiijsGEUSQm4CpUKYD7tdrtcdtvtRqvTxspPuLXhFaMBjEdH3wOTm3SskctgGrirGmjD572PR97S0ORlyW/yb8R7dCUhTQpSf1MoIltuiAR1BVGKn2qTHIWWyNOGyLpcrvR7/Wq56gLHqVKrVl++eHF+cQFpMLa9FOr8wpaNSq5LfESZAicOodhlaqZwU0YzYAn8hMPJoImQD83QO4Wpqx4Qc97xWCk+imiyGVssfzA5pVBnWmQ9TPkve3LxPw7mg8EKUMYVI4oi1wUjfjgc+J6/WgVrC1RnQFgzjp5+8ce9vYNEEEdtx4lWSwE7AToEam4ghpFFP7JOEYJT5NDoq0bxcYnAwjWnMt9YTSRJGVWah0UqtWo8KP4j4+KGV4ZYHwl+ivpyg7dv33z77beCKfri5uYGIaDlcokomWGY5lmjxszEmjeZNTMX6cijmvnj0OnQvDYK7nHqINnx6P7hC7wvrusuFgt8gUlf2HklmmqL2w6KCzQs2E+qZkHun6GJQr4HDYVt2yhwSnmGpCmCSWUgVytgpVq11u11B4PBwcEB1Gbo9iSrVsxakcgKN4tEMt/XM8xjsPSCVhLy8xF2i2JIEw1WwWg4ms/mkLo3HF1cXIxGo+VyiU4gyfZQ1Q1knjuOg1X4EAhtNpvtdrvb7bbbbSBPqmKAxlXgvSA/E2Wfbq5v/va3v33//fdnZ2fDwRBOHQNDGxBdXkuJMpyYR8exQe4N5rHBwsmsvUyMCIgaTnwGokYRYs6u6+7t7X366ad/+upPT548aXfbnu9Vqlo3iK56E3kVH3xp7SAz3Kjmml3hBUxjfufjFhc1m8E/z3/OYrREEMvMltwPLMd2hJpRyRFp+b1ux3G8StmrVisl25rPFkkJ6FoCdyBlaYOBlX2R67OyefUlyJ2KeDZy5Ze7KPMHmd0omshqVOieSulQ6IKVpskqCEfj8eD6IgqWASRHLOEX5QpF1vK+5WZqEhJENcGNilLdw4M/R/vNO4TatnufNQvsoSz4ng8S4/ItUL68DQYNhVXUFpgIkfF4sVhMpzOiCPFwpYQR7jCVeUlQ0yCjoEr+OOxM5K0xwUm5irDFoAAaEjr5FMVMy2W/1Wp1Op16vS4sDyg1Yeaf6JpFQvxQeiiZ8JXqs1nIbUt60n3b1KTXQXQL6RXKLUJBsLh2qjUbG8UD1ZQ2kkm2BEfUEUzuKH6hXLZ9z62CwIaHdLU6WKRV27aGw5EFxnEC9fcEX46sbZampimuJJGv6TG0NSncMPPYY0V4lpkDCCRGxzdETFUdYQXoyYfFrDRYOPQ82pq/L7yGYaYKlWUlcYwopjDl14mV2Ikd2/EqWF1f36xWkEuXxMBFLJVKOzt75WoNSqWJ3dexbQBCKb8yPx/0YKhgFqZbcs81Mx5UFJTKSCg4UzzMJOjDBkyfwoBusBH/E51e/He5XI3H4zdv3nz99V///ve///DDD4PBgGT9Kb+LQ3AGra4Q0N6SCmje683mbJ7yx18YrDmDpJr/iCrdkUOIijLIIEGUjL4m7SfFF8X0NuMdJFQTjkf4lXHtURwhdRDdJ2SHYm26q6ur8/Pz83fnR0dHDx8+PNg/aDQamJy2Wq14pmL2Jt+pmb4Eq2+BTggHzVKRSCmElCBfdD4HbxDhQdQUxRqAiCfjMQ1eOgq6YuFBbL1er9VqlaE0qqRQ5gFPclDR1UxiCE+cnZ09e/bs1atXo/EoTQRGJzQSRd6HzvLQoBkLBm1hZnJ0lM/hLdOM31nCHqnU5N7e3ueff/7f/tt/+/yzzzudTrUGCasUudjOEdV7OqH9fGVibPzMPc0VgrqP0ubbJo869zX5ZWQTbMJyhVgMqK0IETGnXKm2O539/b1Xr15P50tVqAyL8Yh1RDj3pffCc1Xkz7C7lCGB3VWHlD/Q2YpFh8uoHgr6g0hNEjUuwjAKwmg4Gg8HQyDCrNdoD0NWfClDU88zk3MLu1xgc/WN3nO1um8fiUP4vo3Ptq3Zq9Sygnt0HPkhPGopbPZpHAEzajKB8oP0iBFVBkwDpIwaO5YxrxmQX9ylzWC5DmdK61iap1RIml2Rvnae8CPCjVaa2HEEmTOOY7eajX6/12y2fR9oKmpFw5VEbZkqg03BUFm+okwV06ems2dVRe/ZKu/T+BRQsy3jXWv4iuF+TPtVZ4zRYdCFYDVI+OpM5hGmAUhzrWRFVkQGSJpCplOlDAghqC96IEAKWTpDQAAELgFheLGjAesuSRPLAthEzAVpUGUvLLNbCI9GkXAUt1MaVcrQERUmbJkwuHn8FKqKDwqm8hZ8Px/wJzyQsyfzCW865inLV4GRLKRSNQnNKomhEE34g4HvgXkYx/HTL9Z7+we+X04gsRKwUFabo+Dx59anJKki9V3cU1RKJysQg8xQh0Ln/KJ9iQ8zeshrLu2ddTkzTTPTmP2NaM9sNr+8vHj27Nl333339ddfv3nzZjSSTNFYSYbI5VEIKmaugsXO6OBbRB23OJAfZtrmc8uN4ofGJkIGOuUHEgFW1QFL8fp4uh2FVIihKhMLbctO7dRSorXZVD0aZ8l2URrRmsgNWIOLGp7DAfwzGo2mj6e7ojWaDduy41LsOu7aUaEZlsHwXq3AgVcZQTpGI+YD5JHOgCM9Ho+Hw+F4BExRVBVCxFhGUQXoz5U2schEp9N58ODB/v4+uoLo3JLcTuHNNTzV4XD4/Pnzr//r67dv306nUxg3AM7gLm2qRy+OYl4pP3h+2hSOjB4iBaoQYMLVd/D2VavVvb29P3z6h6dPnz558qTb67oOaBqRD8lTHAvgQQEGygPqaqJ6BVAVY5gbIB9zrYFy7wduanRHt0T2DeK0gajnxtZisQDYPzuCFT2ZLYIwCu3QTkXFSxv454K3IF0yiv7K2F9hb1Vw0Fg8lYfIr4r/VXxMCh1i1SvJ6RFXDHpq4hpF6CUdT2eX11fj0ajV7viej+Gw1EltmWqkD5hfS29tWqriHr7+Sdtv3iF830CBEYqQByla1rMWST6EAsppKYa6hacXBKvlfD6fzWzLni8WGPnWS4CohKYrSrOeUNqJguozxmWeiEKRPzLy8Ay5KCb+vxnjNxrlvQgGFCSj2LZdgQrI1Xq9sbMDcjKtdt8WGxLVmOIjB9upABz0LVHUFJbWpcx4iV1lYCEirt0/2XduEqqCpgqUy5Vav5HPGmEjn6GOwluEmQt6oTRYzYAiazyNELcBnNaVarVn98XdX/sepJKXSqWrOHEsey7IY37JA/IYpsmJAEaSxI4NinkidIIijRkTU/YRUmHpQZS7GpXDw8OBhSek9yCMSuwa5SBTuiAeBlRA1RganENGDZUDnZ+cEurRPaKd1nQP0AdGx7dSqeCfsXjPTuwwCD0frL0ffngZBlEQhOPx+Kuvvto/OGw0W57nC61KuBdCgRBFZDLlsNlFCFdBzQDcoYlCjCsG1v/ENOass8GPQyuVJidxe5jgLBo0qj6Ppjwa/d9///3XX//1L3/5y+vXr6FMZQQ6K4vFHGTWVXU+7UJn3b+8q6lnQtY7MkA845ubrHYD3jQs/nzckIv7E60R38EwBxn38jGSdjl1LDOl+WG5jCqJYSZQwJJVUED1S2HY4bihB4U+ITqeMJ2A4iFUoC2pNzMVLQzC6WR6fHw8Go6Ojo5AiaXZEDLxUn5TqUybbs+WJsXCcneNhwZooOIonk6ms9lsMp4MB8N3795dXV9Np1OEBzFDEr8JhRYcH/VjLMsq+2X0AB88eIAObafT6ff7WHKD+KL5bi9XyyiEw9ICdXEB4QkIUQkBG8xf5UzRPMSHF2lgg8beXbBubAhYyCJ26kopjxSlUzFJ0nGcTqdzdHT05R+/fPr0KVaYqFWh1CSmYdP1FiBOwsWlLRjfgRewHCoNagoIUnBL2hNZy+R+P97U6Mllq1be2csHjEyrUu0ZIq1AJAoKFnq702vUqr1+bzidLYNwuVyBbgvUrRF0AxUDQsY/rezqpFwGm3qFJzV0klTmuxaOyZJx9NeMq9e7nMzwUJFVrK/juul0Nj+/uLq5urw8P2u0umvbrdbr0rSgo+fid9nBJMO1IDbBcgvv5+hP2X7zDqH10+H+iG6xBZ1ZhMVReRvsTxHewaB4FIar5XIVBEgSIkECIfcnH9NNOy5u6/Ra7UYbr68Iz6ANLP9T+sPYqDSNm4KDKt5qeZ6Lem4g4yYqIFNCC9saqUJq9gyMo6IfWy3JyKRo6LN7hPB9m4bK2I6gtgSi/GXgBQkQMTRAcXz1jdP0DL1k50QU9GKN0rRrYdk4IlwA+W+7dtkv1+sgANhqNp6/eHF1deO67ngyidZRtVJBOX4L0ncgJR2BLJhaaymeiY6UvBT0TxJxVpTnVc6eMH8U+VH1FsneYD6rMKeqV5FpotyvypnbDCXpYkk0WtkwTf4p5aSXzMHWpTCM8DECnQCw8cCwSJJ0tVxd39ysVqv5fHF2dj4ej//45VdPPvlkdxesdvQA1aOnPSXjpBJ/yHjNBdUm1c8pUpO5FPYrKU6K5iMDOiCVURo3CtVBjigCXVEEmqIvX778z//8n3/9619fvXo9Ho+BfSCdJcgzRLEVihYzs4k6ULwgFBoB+QHJ+4cGyzRnNt3SOLue/tTZsKIxZWmzw8j+lRk4ynuk7aCw8wa/mlfGk0otKYTlqfY0VmqRBFQRHFEqONArVPK83L8cDoeHh4cPHjxotVuIRjowGaUn+R6NmZ75fQ27itgg1eoYDUdXl1cXlxdYgx6qEQq3jbSF6CDYH9/32+32zs7O8fHx48ePDw4OsOgi15IhByl3wySNGeVel8vlixcvvvvuu9PTU8wqJIYzOISyaGRB4nQ2zHpXmLTwhvJ5zj0EQbeQPnm323306NG//uu//vGPfzw8PKzX677n45pMm/5GE0Jed9aQQKedmQAIBmtKgNb65skpd5gAH2sjDkget+eNoiGFjIPM/ZCoLfiEjUZjf/+g23lbKZ87ju2CWDdOELsED4jMy9HufLH6uDq4KlJYGGNVh9DfVdOHjlgcnNWnzm4osHEngOqvgnA4Ho9HoygMsB4SSgbkdcmykQi9JW1c/jdd63370e037xDySNZdQlqZAtO5Z1jiWgpVE8r4mu9oNLZHSNnA1XIxnc1n8znVmZAlCsFsUrnd2Z9Tr/hHBT7hHUwWBWmokL5er9TF0Yn1tlRKRNYEGtAQhypZKFPuOHa1Wu502p1uryrClsaiUGiSEhdRZWRJe5dCYippiZnv91vPj2o6bKEsDApFZxoxiPg8U7WHpJeeEZm822QDcENYn5YNRiVoikSRZZfqQOiqCEH8aqvZ7HS6L16+HFzfnNn2dDZLS6UghKrcnudZViIoINBtIJGKnATwDyG9B2epVMQUGLswYBT1Vbh8wnVBOEaynoTPq7gy5LkScqriH1m3ioUcCUXM/KsfRElwVRZVsQNpDBQtNYI4IIPLrpBoQisY65YHq3CxWM5m8+VqtViuUjEgrXanXAa1CQ6e5R8dsaCoa1bd5ogosQ/U3dfAPOZp0BjgZVLAIYsd4b84sog/KjdFJWtdX988+/77//iP//g//+evp6en4/EYlYfCMFJOAiSUIoM+xws1PdhNLE3j2g0nsNDNyytDGlaasUFwTixRRunLnPO5qbIfM3dwGqNQCtxzRK5E2jYghIT58PMaOYfg84mB1mzbdWqnkmMCgQNL8wmdFLSLwCdMAMBcLBYz0RAzXKfrBycP6o2667mWp9xOgSa9b9x9k5tN3uBisZhMJjc3N+cX5+8u3l1dXc3mMySLJuCsSTlWrqPjui7qx+zt7T169OjBgwcHBwdAV2m1sMyG7/sbXUEFwSHemCTJZDJ5+fLlN9988+bNm/l8Tq61itgq/J659HwO6J2eOerG5Rvv5KFCPnNI+FSTbkpQgbDf7z958uSPf/zj559/vru767oubscSNBYZpJtASBnvY3EK6Qdmlwqi1uNaAc4IbgH3O/H7NL7n8neyKw/G+bNGJtti1JdQGQ02UKDTu16z2dzd3WmdtsrXA7/sR3Hsem6SQlKP+IGIjMronyxOaDROuNpoPJqBQ/ZrHRcoerqUmBh/T6RFQWgXV5sojkeT2c3N9Wwy6fZ3RFK0FN2gPZGPiVThVonuOYuYXZoI78qaVfdyoz9p+z04hDzAcfuX2WKaNy+MVI0MuJ9raPpA+UFBd5mOJ9din4ujcLVaJXG8TlMPFOSFGSEi6YXd5k13iQL7d4thY4wPI1EqRsjKvCuV/nzIXJSJgy9iqoaQMLdFKQFgsDSarVoNyv6i6S0yv3SZXQ5sig1WJuiL4ynKaInq0ZOcIXNORC/uN6If2dQ+lCWoaM+BYYMKoeUF+nRjEnOmrsCW5FXyFpAEBUYYLPyWbZdrtYPDw0q12u/vdjvdN2/eVCsVBAcmaeradhCGJQdOGcYRTC3kvgl8kHAPtJYwpo1TWcZZ1LVJkqSYVlLVmkLvlKBl9FmOmAqd05Wpy+T6MDplWHqhuqnLx7IXdDsykm55giIaoq7riHR8cAnAi46txBXPYBRdXkIhx+VisVquFovFZ599vndw6PsepOwvl1bJ8kElEtRzhASUFsZEaXsk/UqtEYkSSOiNSLNyQdC+H0jdIJCldnyqo6EjBcQANzRF8eqEzPJsMBi8evXqb//1X//v//v/np6ezmYzIDwl6XK5Qs0VUdwPMuV0AkrWhTNqdhsDaPiHhZ8W3XO9ZBHTj6YucTWxrDm+TzoQxO2kUoH0BfwtOSciwKFNdvUahpd0mLAzdGTOC9VrsloXaSiSOEFSN7JRcAOirIQ4EYqmNhBNSbLStu3FcgEaM2t/FI+grt2qmiQJoHLLZRgAMHd4fNjpdtA1DcOQ81c3JeZtWQSwkQfrum4QBNPpdLVcDQaDy6vLt2/fXl1dzUXDOhOuC+RhEvDE8yLZdW9vr91u7+/v9/v9TqeDijLIrkTeNa/VQWfHCsD8Ng0Gg5cvX3799dfff//9aDRaLBYk+Sb5dzoVIiMqa3iDNH8M2RjuwxtTlE9F6i0maFBtCRARFuybZrP54MGDL7/88osvvtjZ2cGiGvKbAsKltukuaGxQEvLlyq/cF5U1oNW/VUCQJFXv9+K7NGOLZFLL+ZWHcO+Ml8VmrJh7KazjUILVXttOf2e32WhW/bJXKZdGIqED2OCQUkxVViWJRhC0dAyLW1M88rveFMfX6nTqi9JwUAfksWYJUWjFQmJ74ZYmiNluyb25GXQ67cFw/Obs/F+T2HE8PJyMqSF72Qz56RAYHTsfCqRsV4I07ttP2H4PDuF7tY1Uq6LYsEIGNtrBaCAC4yuOgtVyAZvcKmb1hQ3DkezX/LH0C0oJ21CIfMN1Zbup4ivSL2QfMdMXvTkhWweJFo5knIlhcBy73W52Oq16vQ5a2CJ9X9AWslFwrV8igROqPYqLB++RMNYV/U9tS1ldmfv2QY1pZGY0qKVzJKxqybVkzooCj/JJ5wXsl9tCGPSvDapoUCABhcWsRsP1/XqjUa3V+v1+u9l89eLFdbX67upqHqxcx4X8IWHipGsQmSklCcB9LKtK/CuonRlvQJ5eQ+JKvwXHQzBZVXau4qsYlhpePiX20IFJszQfOAUnJvdQZ48rjpqDudhHEnREcB5NBaTdgg8MxeuBPjccj9HwFN5UYgvukA8QEDynSRzbEC3GygHgb9AmCvcTChfKTELJ0ZTgasZBRU9PVXCkB1A94IIfIaFIpDXZBZqiKOgvygmsAlF9/vz8/Jtvvvnb3/52dXWFNRKUcEwaBAALYw0Gcuj5yORROwPx2MTEu/XNLV/I00r52fmmQAgevYMN5R+R4mi4KOTkFFIKueQJfpNkRbEAg9CyVnGLVCb6SmhLQYUqMCfzx7jqDI5zyYI8ulKptFqt1uv1crVcBSusZ2jZFrhYlXIpkCAkhhLIFy29f0OgGH3s5XIJyOR0Np7A/ybTyXwhXUEqNsifJkLDsAB9v9/fg1LdUDlDlEGCbUjsRPJG5L0jTBfEw6Lu98XFxffff//dd9+dnZ0BNIq6F4JJi5V4UbqGjmC4gvymG5GLQrCucGplHjp2pZTDX69DAfo///nPf/rTn05OTvr9fqUiK0xIz23rufTTkUn7ZRusjKiJq5AJ11Itkp53fPO+3d5Y2BFfUPlZ6VepLxoYw6bj2ZadWFD7BADh9Tpstg6PDg8P9q6HN6PBcBXAPBCaVFpTDfsh+fyyU4W01Uyhiswn8gM9XXiM1bhW/afZd61ejVpxWBMojqLFcjkYDsfjURhCFhWWRBJrjvnMUq6+DgKqjulZLz1BxX+9swLNfbt7++gcQmos9rwVoSp8hlWsXYgFwwyNwnAJ/uB8FawiKGokqz3oKrdS6SFzSG1/qbJf8vC41rDXd7kipaIvozi8uwaMCsaiLP+8jhPIZhZddYC8B1VxbM9za7Vyv9ftdrqNRtMTaCHY11z/RqUlKDCTcrkUj0E9xKKMDO2LuV7fpw7+6MbkhVRCgkoO0cFs9AgZ2qOFRooUNvM7WZ4Vxl+RZYahbMuywE9IU6tcdgTxyfP8WrXWqNcbtdppo1H23KvRaDiZlpZLsMx8X/BFhSWH1TvRZ5IZWsKqlkigvFC+61JniPmJNaAzVdFUKIKLZspf8aHkBr0K+1L1MFwvuFsqY6g5l1CNokbYDHMu43KI/BAg/Nm2FSe2kyZpeDMciiL1wMXxhQJpp9MrV2qVSlUQZgTBTx5HJOMp71hk6wHeyrZYlaUpYzGA39L1ZhxCggQFmUzzXSnurCwHSVwUpMA4SWaz2Wg8Pj09/e7Zd998883r128WiwXWx8MC7orlKIu258ZKiRxkFmdtQxdaw5uiGHe0FQrNNcLH6OwIFfIKnHRSBBXxU6ZuAhLNhAvxAi2kccL7TKAcnEvUG8N3MBsHVMtEB8AzFNgvdSmF2AkWN2JysirnkMvP0GWma6gOL3I4IXjnuE6tXgNCSAXqN6hZLWMHdxlDPpjYJAc0SURC7FxMDCg6OJmCpmgcQf0H+hVukeSLoitYqVQajUa328XyEliDHmmilMq+6RaTtA8qG719+xbDEy9evJjP51j+kap38Fop5vqmloJ8KYs8NriFZ0Q7pqEpSt/BtLGTkxMoQP/ll8fHx8iJxcNK1dksIGn0R94zRQ6iCKBiDakrIgdRhWKxrLjK8rhv7904iUxjWzmgmOAstTuZrpmcaRYkkqaCoNXtdg8PDm4G1+eX16sgiEJYY1H7HXZVjo/xPWWLLWsUg5bOYMYDZNhiBgoxKj3py5QaEppKDVMpXruunaQgvD+Zzm8GN5PJuNvrQsxFLRHmCMjMSGaIsBGTQdf7UMXP337zDuEHRTF1yFn8ybcWnVHDMWszLC3mPjJ2kjhZrlZhGAyHo/OLi2UQzAQZBqqKsXJbsmp7Ps6Hf4o9JxH8LkLD39MVlGadjAjymJ/yYNUBBbMODFBQ5/dcT4gKQBNWu1tv1FzXrtfLu7uNTqdV9iuQIlaC6sAlqIeDIv80EBKckdlrRBDFq0BLZeP6aKRr3bcPb2pGaVDFGHCZwip3LwkJZgyIIr4TLzSkUxMZUlQEgUneJlgzrgtsGPEUVCrlbr8P1nCSIunTcj1beBSOZa1AarDkuqV1HFPgAY6WxEjtkvZa9vFhXWUOHD1T6BDidiucJL0XIUklN4gCAxd1DckREmcWj7EyuPhPCOPKeHo6gpyb7XpJoTryFWGI41HAgofCTYnnulbJv7q+jqJwDYn66Xw+//Szzw4OjkR1GEkKq9hWEoO3BjKtit+J91hQRpG6q6Oq8kKlSc3vISGXGb0EFdORdi1iUqhcgiiQZdlRFI/Ho/F4cnl18eLF82+/+fbly5dXV1er1UoEBUS0SN1QkamIq4QOYDEsUN8fek3wWlH8O7P+88oBhWTd3A3XNn3hFwi7Qy/OqBTveR7y/RoNUOx0XVDhwgNikYD1GhLDsEuYA0ZKY3Rezo8lkJDQV/lspsDnTD0hCQo1rCWEaPvQvSiOpIAKBA+kyCR5CHRG7NVyuYSl3ofC9OsUuoddPTw8FAVF4f0wDF0XZKWNKohbGneu8CrQ7cTswclkMp1Ol8vlbAapg0KfW5JdaZd0hR3sOA4KxqCYWbvd7nQ6vV6v0WjUajV0k4hcyntFNQzJ6ZpOp69evfr73//+17/+9dmzZ5eXl3h2KnXIZxT3yeV+Lcs36fBQHlg2EkcNZhDSMWgOU9+Q8iqVXW2rVqudnJx89dVXf/7zn4+OjjqdTqPRQIEZVM0hMfBtN4BxbRiVUW+weuWHBKwMZSCzCd8ncHywN0irmFqXOK9BzElZT89cl/DZt+y140ZhsC6VPL9c9r1et5Uk60bVn/veSubKCraF2t2RV8KfAua2wb/K/8x2W1MMcjs+yy1CgxIpJ3rzywoyozFgserBSDmxbCuOouUKyuuOR2MPQ2YKhN+0LOdDe7LOMpuiesDv4cGfof3mHcIP4rSg0YTT2oTH2WE3hqXVTFUhxiRZzBfTyXg+h7oxmI8npIQxk0HXhueHooVXfyaSbjndm755lxHQxYU2NXapUpRONHsN6J9IRkKTNK7VK91u5/DgoNfbKVdqnudDSQoHtigeqmSUL+1s5iPucpC18cdtuHuE8Jd+HDQwqAIiMgE1mxEhvqogJxUckQxJpd5ZGLWjehZkwSBdzVFMMPy32ag36/WdRqNaPrscjSDbdrEIo6giIuLCSgTXCBKjIE8ds/fkXqiImjJTUj1lbC5iN9DhlZRHWSt8Q5BWRVPwH+UN0saZkcHOjXruSLffHanOKvZRhdYDk02pN5WSFOR5knR9MxzFSRKEMUgyLpdBEJwkSb3RBJzQslarpeu46FtJVR9lXig01Nj1dQ0JZi5IC0BVLlUMXEkf1ckdKfjyIMmYJAnyP4GVt1yMJ5Pzi3fffPOPv//9H99+++35+QVyAjESITTTZdU17uypxUQL2Rm3pRCi4RZMHorZEte4SzOongYKRJ3Bf9FrQswKK6ejZ0heFhr9qnCzdH4ogQ09E4KMiCZKJSV0hTrBJQOgT+gQlkIx30VUAGtRYOogKPQmKLQkKuylMKMoHgRVQ0XOHlpv6RpC+ADL21DgwXGc3d1dmScpwimbSmlvalxYW1YdnEPVQSw8OJ1OF4tFEAJDHJ03wgYRVnVZq1ar7Xa71+vt7Ox0u91arYagWf428bPjfEPXPQiC8/Pzv/3tb3/5y1++/fbbq6srnnJJeCBdJkf58vOwcC5xPzCPMDOjVk91QpLp30ajcXR09NVXX/3rv/7rJ598cnh4WC6XORxN+r53uAFZJhBf59j7GkxWosSEIma+ed+2Nl6KVlo/W3N8tkMXtBQCJWRdcj2vWm/0d3YeHB1eXl5cXQ9FzV7pf6X5nZqgX3P95Du57omIFtHfmV5m5hFemFYQMy1Y/H+0p+EBxArygtKQJGkYgEDaaDyRMk6i2ueWAJyZMqCozXq4sw/d3TOq7tvH4hDmGRp3/Ak9J5zNKM3dLGFp02Gl1OEa+KLTyXg0HK1CSGdXm4sk9hC2YcRFskChPJpCx7NXp2JIGy4Gfy99rjvKLqUpmmgiVu2WSsByTaMImEWOY3c6bZG2cVBvQBk0F5QS5FUBPkDml0xOJ9ZKFlqQvcMShfeP7i/a+Lyl0B0pjGcpo2w/w98SKzLH38tshJoYbJ6aguIyJqKFMWKRbbXr+V6r1Wy32ze7u91u9/W7d6fn5+tSabZY2MA1jdfr0HZAn0M9DhYERrEzmvnJz8p4o3qGS4SQNkBA/iTYVzwhVWgfDi6eXQk5bXS1Nzxr8mnU98Lc7ZAmaiFdTaI661IiCQJknqYp+AZRGKXrUgTUTNBsjKNobx+CNbVavWSt4dmFChYSBQKdSRGbUSwkWiAUPV49pQrFz5oLRBrVRT9wWOCoIv4F4xKGURiCKslisRzc3Lx4+fzFCyj5/fLFy3fvzsMwEvxDMDmx0h2BVOSCMuDFvAWGD8bf33TvyBuhSZj//qaYNP+C4RDmEUJOAcW6YegHYoWeTgcEWtA5xC9Uq1Vye6j2upicmb7pEgjCTQLRF1GrPYkhRTNO4IeoBAOGlWggxxKDQw4RATHF3ZIbl0TGqWDpw7xSzFycVFhwD31RTKWDuqC+j+5rEid76V65UnZBWwycNEB37+ASGmTdMAyDIFitVsPhEGtdoLrpYrEgTVECS6kcH7qFOGKdTmdHtG63i4AhlunbRJskDA0tzuVyeXZ29pf//Zd/+7d/++abb4bDYRRFhNnSIN8lfMDnbeH1GlPLkI7jZgl3sNMUhr3b7R4dHX3++ef/+q//+uTJk06nU61WaTTocd4S2qDYCvn8as9V7DuNQpmwoZQk1cLg997g+7TsuqnpM9mVh1dswsiO+E7BQyWWasux4L6D2lC11mi19/b3+73u+dW1M5Kp3rbjiHwAhcgRfaOwEpnGLDMdztRgylYqkv1mWhNFl44xRy1SwITWrKSUgo6ACNCEYTQaT24Gg5PVyvN9t4RaYrL8Jj9kwQgTMmJ8XIh73refov0eHEKDsHFrM5ZXRuyWVnEm86ro59LNE4/Reg3R0Nl0Nl8tLy4vJ+NxEMWhSKqRiR+Y1Ztjm5BhSEsxZk8RuWs7i08fCsuyqYCKCLjny9Nl3GZt7lhrywM5BNeFaGW1CoHYVqtzcLC7v7e3t3/UbLZrtaaoMa4kCkRn0dpQ/FZpVRkxHjmGshvWB6em3LcPaIYYhvgPw5BJzkfrsShyiyjXTuwXPAIvQU6YkRFTL+wGCodatu0iKA8u0Nr13EarBSYPFOHtdLq9RqsFKoKvX18OBoPxOIpjoKslieU6JVEZxcHnDs9IVDoli0AEEuqetswYB1uOBtWRkR6v2kdV0DyFAaCZDa8zQRxjhxTxdYOvq74soyh0dEOckCIsEreEgbLSBCTFHdeNgRkIlqtA5kvXN9cgzzGfx3G6Woaffx6sFoud3b1ypeKXK1D4ETVawZrQkomZCaDuvWI3SLkZTizT8KD6FWqB0tGosATKdUyn0/F4cnr69ptvv/3//X//P6enZ9PpLAzBb53P54JzKKcBkQ/xSI5jb8L62BwuKEhYnILCmIf5+U/H566mUeaBjHXsJ6UFou2Cf6JDgrzKKIrSNG21WuWyLJuOBdMRy/J9v9FoIN+PPBmDlMi7Sv9ikfQkTlCEMwxDZFquVqtSqTQajiaTSbpOPd+LI/k/dK4Q/gIIMRROOEKya/De+T5i23ZUAski13GXy6Xv+6vV6vLqsmQBw3M4HJ48OIGF/2AffRLpNniCzyYeBHzT6LNMaBRzA1/j0S5FG6kGDqHC6Gh4SZKHHOler9ftdjudzu7uLkqaVatVQtU49QCZougEogFqWdZkMnnz5s3//t//+//5v/+ft2/fzuGRgYZ3HPFJruxauJRlmX6SI8fnEp+N3GM01I9IU5Q0h0iKttlqHh0dffHFF3/66k+PHz3e29trNBp4maRRdIumqN57te0s13VjOzaE5RQCY8hKv1dU/b4VDFR2GpiIgvS+hZlXENqA5QgFuqA4jV+pNdq7OwCS+6/OyuXyahVYELWJaUGG17iIFRuI2k/T25zKCMigi5ICxDc3JUyejdjBu6o8Ee5k6h9mW4oQBtIAJpPJ1eUVbOVCkSwGqo80obMT29TyYOwzlvMqvW695d/P1J+2/R4cwh/Z8k/SdsgR5z64g/BAwh68Wi3H4/HNYIA5M0mSKhtQPY9IGaJj5sIb8qFlIAw/3S3cJ5KPpD9lpFCh/5kQuwrJU4aDWg3QprRtq1z2Ws1Gt9vr93cbjSbIDiilBGYyoiXOYjh4RuVR59Y6/IdJYOql5/6h/unbJmtYv0MuekaTRqukSAES/ZYOyxXIzLBy9tRkmECAAKL+te2IOKbjAL/O98ue7zfb7V6/3+33Ds7Pe63Wi5cvL66uz66v5mG4ThPhFEVCeBQOHicxBkcFeVR0RiTSEb8FqaOZTU1i52wgxAOs/aVMZBXZm6q8E+JscqvEGSydYT2Kil+q/ixQKua+WfHdwYGlIRXKokJmHGxly0rjOPE8NwjCwXDy7bffrRag3PiHTx6FYdDt9Xv9HcuyFouF70FOJnJRsadU9p2dlGBXXT8GByTrN+rbqEiAYMrHMVQYD0FDC7yU2Wx2eXnxj3/8469//T+np+/GY5BwVJJAUtNS1knPeMLs0Ia1kYliKDJwrhlIICOLFi+VeWQp/4DQC87owzwudAjROSR73ff9Wq12cHDwSLT9/X10XaiQAP6QAB88OHkgBGdxF4InGSLOhlAbNkTbptPp5eXleDxGDU90BRFOJJ9THlmkenJdE813FQ9sEoPuy2g0QqnYyXQyGo1OTk6iKDpaH61LUE5DqBxZJVcsCDoPQhOqqSIilWKKo3g+nw+Hw4uLi6urq9FwNB6PZ/MZOmPgxSpmLCVk4qhi2b16vd4RrdVqNRqNarW6RVMUT0qXnKbpYDD4+9///u///u+np6eTyYS4lyQuSnh1YfUImga87GSeKGQA10XhjEwFC/IJ8R7VarX9vf2vvvzqX/7lX/7whz8cHx9DVqFwAPnSsdE346tWvsYgmQM86rf5aEj3KHwu7tuWxrN+eE1CUkgyGVNbx1bcBcuxndSCPc73vXqj0dvZ3dvpNapl4IrbdiwSH0TMUgY4aL4abht/QpneTfGipy6HNsTMG/oK8SVlbTB+aSYyItIC6JFcLBbj8RilR0UaiM4eynfFfNDkRek/YUdjX731Ht2392ofnUNYqABGKrdbCKKZg4gvy6q7wBedXl1dXV1eYbqvyP+RPDVkxpAcE/3cMLgKj/8+V6WeMfVY5a6a1iIZG0LJe82dLVlloHitHcdqNOr9/s7u3n6t1nBdHypSOC5chfy9Eq+XTiWpkugcQkkkzee4Z9p99uAv0TQ1lOY2rbFEHNp6IxQBSf2IBz7lVmRW3jP8HEdZfuCFkK0jqmv5vgd0u0aj1Wp1W612s/n67Ztq2TsfDGer1WK1itPE94AvKkpTYGHbtWU7SP1MITaKp8HUKdFPss3Ug02mEebxMIuW+HeSdKPLcmRmrLSnyOWj8KnMOGQrRiEBkkamIMAkIFnF0ZQ/URJNkBkGVW1AvwQww8VicX19LRK0oMzNarU6Pn5g2XavvyMYiTDUritkXzJPff6cpglbGG2lkUGWY5qmq1WwWoErOJ3OxuPx2dnZq1cvv/32mzdvXgtB/9TzvCgKeU4Xvsj7e8ZKm6/6k9cy2cKYoHWMVhXDaTQAc4MITYX7qOwBeYZUBYGET+r1uud5rVbrs88+e/z48dHREVaNw6MhMEieJAFEJLjCn6D8fiSJlJYNzGBRgAQ8wxDSNafT6fXV9WQy6Xa7FxcX8/l8PB4vFov1er1YLMIwRBkY9Hwg5VbVNUHjjF7gJdslielh4fir6yt0CwUXOERp0063AzIzdmoLHSBy7/EIxNGlGg9xHAdBMJlMzs/PX716dXV1dX19PZ1OQTFK1ZkgrqaQbdGeXkU0pN12u91WCyoeVSoVlFcpvOk0VRAmDcNwPB5/8803//Ef//E//+f/HI1GKOqDqAvhqLzbXAUn7xNuCchuChZLpajsneW/sh27WqkeHh5++umnf/rqT588+aTb7UqxHAi+Qv3xWx1CXUdex38zn9IaJV3ELOFI9oTSFO/bhzVaYVmg0Jww2cwLNfKbbiuUa7KghLvteb7n+dVavdfvd9qtiu/OhdqZ4hKLmoXqh3ymEZWDA8g4m/LzKcPHkMdipkFmYzA3Nnqp69+I8wldNJHuIb4DT+VoNJ/NBADuAjMltWAIeHiFe9Q61KIcXWlwYrBW8VnvIxc/Q/vNO4TvmTeocqhyWYKG3VAA96uGuwo9b0Djms3Go2GapqPxdLkKsCQ9buxilZdbqaaJ0jNq8EhzHab3Ny3cWQuKIifSVWMrgD45HkpIyMCfKIEAmTC1iuu41QrwRnd3dlvNtm27SQr8KMu2XNvFnyh6arbPxhgKe9+4rqK16P6R/iWadAKRH0QkDOkAKXBXJeFxCRH6Dx0ItiL1gqaanBVGBeR8HxT8UrJAgqy0XruOU/LLsWVXGo1uCWQzbHgTCjCsbbt0eRWFQQzkyRiMcmCcOp4rnEJxfBGkwD6vqYiB2JmxhB7uZ1TBULHUJOcVJy10nJK6VOlmeSQ5PnIvleOGAyWfHfnQKS87h0RyFMWgKfJvopqTAAYloQ53fcgT87xEiIzP5wsHShG6YL4vV7PZXFje0yUUlVs+fvJJt9f3y1UvhdSyOIJcTdeT2r+2bSRs4MAwm1gyx2RhDiITAEQrHIkkkTIhaZoEQTiZTG5ubm6ur9+8eflf//X1ixcvRMnBVZIki8XSESUoucBy3trmFF/DZyYwrSCGLZ3TjGe4yWQ3LHt+EHqHSzgil488unK5jL9tt9tpmpbL5UajUS6Xu6Lt7+8jNri3t8dRQe5Y5ssP0gQwth5umvPoPimOoqPVarU67c50NkWdldFoVKlUJhPQbEBBmtlsBsu1ZQVBAMQtC3xROosYOPgXpWVApSaBJ0sWJLSsiTOBE4UBSbM4IpUACtwvFnh1RP0loxMzErGTy+VyMBicnp6+ePHi7OxsMBjM5jNgtgoVGVBDVSuPGHEAKiEqBKKKZSwziHl0rXar1+uhN4hYK00MbOja0XDZtj2fz0ej0YsXL/7H//gf//mf//nq1Sv0/YIgQDcYki1B4EdCNwT5FvpdRsWI/NQy7heBvfQdXkS+UqngjLIsq1qp7u/vn5ycfP7Z548eP9rd2202m5ix6QrNWmetybHbWpYXquCaIp8k14y0Q00rvW/v04x4Fn9B8CC3vTg5udBqFXVoIQHYcdwgDB3XbXW69UarUS0nitChMkshSIorLMjMsBgHWz20f8iZGfI7+JotNzqUJj6hKyMAgF+gpN6IiyF1NH5V8PSt16PJpNloBvNlEsfBaiUqrIAOs0EZ5fYGT2DQQ4jvKM1wbXD+yFt4335nDuHdGQ4ZCeCStGgzkRsFaPBYfj6orx65FMQbEkAIl+ASzhYrsIfIEiIvbr2pqypuo49skt1uvSQ6csEZCMovHCLUgifVYlHqOvFcr1Ip97rtXr/XaLYq1XoZmq/iuLzivOwlgavMEyWZRuaSauiSsxDu28/fijBj4hSBZSaZFxmjnABzGY/joB9rWHVAq9SgD6XL5+qv4XFlEFQUr9efiefAKZXKvu86TrlWrVXKFd/HQmyl+TxynFi4JSBnAgn3tnIJ7HQty/HBR+KqFNVQ86+hfJvoC1eRl5cPT4Hc/lCIRXVKOpYbpmkG3Kb5rS++mLejozMGeE5jxR0DfAvznYhyKexOsL8Xi8Wb07OJqPf92WAQJ8njJ8nu3oFt2+AVCDgLWY9KL6AAzaCTZu88zocUqGcK3EtF2YMgCFer5Xw+Gw2HV1dQ7PvZs++fP39+fX0lkqYTxLdISJN7PpsAUqMndKU5s0nGjpNEZj9mh/T2ljfiOYyjJ4aSBiU8EBPbdnZ2sEj67u7u0dHR/v4+EhoR28FS6ehEUbogJ4huyrYtZKzwviGzFAG0KIoq5Qqo1zSgJMPNzc3F+cXF5QVkco7Gy9WSaj/4vo9ESvJ/5MakNNyFwlOS2jCSvuUTNmgH9nQ2PXt35npuuVJutVue5xEnEx0qPhsxXkCaotPp9Pz8/PXr16enp4PBALDBUBaZAKcRFVBF0SPhD0KGsOd6OMh+GRIvpbO9f9DtdrEMPfF1jaEjbi3Sa8fj8bNnz/7yl7+gN0hgIH4Zu2rUGyTPsBDrM8W0srN3izPAf2KQXX3fb7fbx8fHX/4R/nf84LhWrSkWuz7yllmNGzezyzP0DtNWoaTx3NUVFKa/bx/UjKmiNk39gvMhGRaQiTTqo0HhIxAK8zzfKpX8cqW3s9vtdevV8nTqOGI3EHWkM/nSCm4w4OhtvdV1JEyBC469bZ0YeARKwEANNGH+SYXkJKlUq3ESz+ezYLWCSC5y2ikGmusVCphjrkqeqq1lXSmf5b79pO037xB+WNvI0iSXZktTsEAqEmfBQpqBpsxsvqAMPbEVYaICiiOy36r/Focei2iURWii6rRaU7ZuIvzMsoki4EjMAoFg0PoQleLanXa/3+t0evV6CzPgcYVCbYmMca8K22URV01fYWe8Z4f+81sGAOcsI+2kSB+R3TD5GdOsEwfhRRiUO5kho+YYgPKF46BELYRC0Q7DXztOatmJi+qGtiiRXS6tU8cqeTc341WwFHW0U89Fz00ob1tg0AJeCOcFOqnwXCnaTVmARDsxB0RG2dGJFHW/jeLUG8m0Gycz/VrvthxkkGtLofXJqKdiXJACy8mWgjsK9yKOo2WpVBJ0wdlsJrQigbBnO04fuKMCzAdXBNYeG0qD3p1fY5i58Cflsy2Xy9FodAXFBgH/efbs2enpu8FgKFIcPdteobdGTFFuDRf2IQ8Pcscs913wS+WSsyFeVpjEZXyUp4yirB/xVJEgallWpVLpdDr7op2cnBwfH+/u7jZUc10Xq8nh95EaKo0VBQ3xlDDDMzRB2lz9CUTPEB4H3NIF3BJ9VFTdRGplp9sRN+VqPB5jt/Hnq+UKMTHiMSptQDsVyrvpGoiggggsQUjUs13Zq6k3vbi8qFQqdRHOJ+omL8ZIJEygySyXWGnw6vrq9O3paAgSMvP5fLWCPkjPTdBmML7k2A5StW0Lit9iNma71e73+wi9djod1D4lZVF+yyjtEA8+n8+vrq6+++67f//3f/9f/+t/nZ2dxXFcr9exDD15hjwEzKHF4sfgzrQjfEGxD6IOUT4nPQvoDR4eHn755ZefP/384OAAvEFR8RQEY5M7MEUxTAC2h9AlNj2OTP9VKE8uy/lpf2uywH27e1NevRD0ywk3c+Uzdi+Kl0RsjuMCWmi7jWar19vpddo3g+FKLiC4qMIL5SORluDGG5qZXUxdWiqO8kC9tA7kZnRL+hKafWraS8BcSf6KbXW9WMD60N/ZqWA+Q3afzfayYHfNqPKovZI+u+eO/oTtN+8Qvq8olv4yUxfN6AVnCd/5RqrZURgkaToaDG6ub2az+XI2Wy6XURiitLec1mtRt5PxBziJszBun5ck3fpIqpVFiQduigyp/c/Bq3RdlE0Ha6Ystt5up+d6pWrd39nd6XSgELAMLSdrT8jNEEKICwBSDjGBkLTy0T8Q4jPSa9BORiFWdd9+sUY+GzpOkpuf9VhYVFkRK/FWSkNEH4x+IqwsSqOXUvVSEKx4w8P/YITPdqC4RGm9DkslSIywrEqn2xUam3EYuoAiuMn5u8VygWxP+L4HgRhwLqFee2KtwbyFaS1INSDnL/FAQuklhAcWoZB34oCDVDcTGyw9egzPzvi0hinPSYB6lJk3SKxbJddpOSL0idxakV2cGRtmVsrNVdZOBHmPsthKS0ECIp6OE4VBAPlRcfzi1ZsYlCmTxXL56Wef93p9vMYkjiNxBM/zRW16wWAstoDJ0YJOCkkbGCisdB6LygdRFI1GIBPy4sXzZ8++/+GH5+/evZvNZkJWFBRNGAVDP+ZUeFDt3YY7JHxWMeDIa1Whbk2ypWQnFYOWqqeckJn39/h8yzMz0TTCM5LKJaJ8JGhZE+3Ro0dPnz799NNPDw4OsFQ6OipURZ00Y8gBNiQ0893gbxKiSD80aKX0AhPhkOGPfQaHTbTJZLK7u3t+fo4SLDc3N+QPLJdLg72MRSm0d4GVssVdCFaA5omJKModOHa1Vl2v1/1+nwo/IKsWOyAE1VaQKzEaoX7MYDCYTCbD4XA+n4ciiCNBPJGsi8QcTB20PZGq4LnNZtPzvE6nQ94g6m3SGclXx3Ej9RrJ9BaplV9//fV//+///W9/+9v5+fl8DmxqEj4lP5yOgN4a+f+Gs7QFJMyAFYwZyMlHVKcE75Tki9pO2S9jeuTjx48/++yzR48e9Xt9iH8JQixpioKrXFTLhzuxGzVFqbRstnQhX7sK4xEfYEfdN934JCHReD3O2sGSUb8sL8Akdol99v/P3n8/SXYcaaJoHp2ydLUWQAMNNBqCYsbuNdv3L9/3L7xru7Y/rO3OLDnkcMjlQLaq6tKVOo985u4RHh5xTmZVN0AS6M7gTCMr8+gTwt2/zz/HhPB5y/PCGPhZG4M+Lo9gsMVxlKatMPRgPkAWh05X4NeqDrVaEcPxvKSUDKWdNltqwlYwcymOIrXa4pcwH+LclWYgN/3q1cuTw9d37t8LiwQiuEEAS/YSX24FVdupyQTfvEmh1HV79x3CN53FrGCD/sryEq84rB51AEx42SKdTabTMYRCQVwUq0PTAUTinw4Pi0PwqiJPyqeuqc64ZAD7hgzHr/Zr47pSSeV3qGWNpjbWo+9sbm7cBLrODmTFgN69a9loB5W0MHSciZlX9LP7+NYI4c+gSX9cJJS6BoFWotWYoVUphLMQNQQn8ECyLKU1s2Jo6qIHYLThhgEXr/f9uN0Oo7jd6Qw2BkCQ63aTF8+PLodhGE7TtGq1IuLCgeYKlNAkrVHFiGMSFACZMEhN5rAmx0BWHkdMZcRCJCeoO/BWyvu5/qGUPWsw4NgaAJU4EP24AuZin5z8AVx68X86mbPw/fl8cXJyigBeOh6Psyz/4MNHvgd5SMgaDQMY6QUq+1CoekXnME5sUQDyU1Vw3vl8NhqNzs/Pvv/++xcvnv/xj//+3fc/nJ6A3CUrx4B4wGJBJTTQ2m6eu+Sj0OeV0SIr3Cy+sYi4wqlzscRlfzp2vIM1GXNc+3Xdbndra+vx48e/+c1vHj16dP/+/Xa73e12OUWQXCPGgpxJcrUcTr3CwbIO4KQ7yhtnh7DT6Wxvb9/AdnR0dHh4+PLly24XiIhnZ2dBEChiJxaEVECZGP4Y8ivzVu7nSlAnTVNFKwVhwwAww/mcnGECCbkGY5ZlEAPNspPjk4PDg9PTUxK5IZeMcTly29i/xaiEUt0MA7iLfr9PRNy7d+/u7u5ubm52u10lcFrz5cjHU4pueAHffvvtv/zLv/zxj38kbJBVc8gtJKarRAIdJc96x5D9x3k7kmMsIRH5L/cH2gzUX5Og1+/t7e09ffr0t7/97aeffrqzs0N+oAMguwUiRJ+nubeB5aEDfBy8o5wNx6hfJprQOHDW7Q2aTqR3Hy8refNr4rUG/1/Q0azXBGtiBbNoqwI9v25/sLO7d3N//9nLw8UiAK0onGDL0ic5F5mVhFfCOIE71TS3hqJoKrpg/hTLmWPH8g/SiytQ8bgoii7MWuVsPp9MxgVohqvAcdNTVNfN5gYd2bEdDbiqrm0dyPgp2y/eIby6u195BLaGmiIW3vJzlWUxnwFfFApGQYEVrNCCkzqshZBSSyr2lafqUDSf3dILppM6DiqRs5c0hwpSI6Zbc40uiKwC83AXITATKuCYtQaD/o39Gzvbu512B8CYUJkgIEXA0ljCIlalKwQEKLmEmuS9BgZ/Xo2S/YwMHZkOgoThtaDmmAYLOZKh69eaqIhppHVO/xMrxvLByVkEGMZXuVv4nwxXkiAM20kyGGz04f/AGv365cvXp6et4bDMMi+OsxwGGFX6Q8lczdMJ9CJBRBggV9HQ5rWL0g5VaNPUTiGzTAD4fKnODbn3blLRmkM25sHTGFGrp9ChkdXAzBNS+t56AsDiDcjeBRUBVbdQlTnNUBkSUMCqShdpq8i8Vmtja6ud9PwkUWMU1+srV1A2bUk8azwenZ2dnp2BN/jnP//52bPn33zz7Wg0Ho1GUNMcnCLYqywrklaWagHL8mTsMLb6LLwgRburm+mSK6ENeqX7ulpIw8nQczwxCSESU3RnZ+ezzz771a9+9cUXX5CLQlAPu3/kkjGAyU4LB7BXP966p1pvToCfBF3YYZN+abfbzbKMQbbd3d29vb1ut/vs2bOzs7PpdFqWULqwlSlyLB1WsZHLqvBIN6igU2Q5DME0TcejMRWoyLN8d293c2sziSGpjzw63wPG5nQ6nc1moLF9dDQajYAmuqDaS4pNyl6cGuPkDfpAsgVvsAM+7d7u3q1bt27fvg1irT3ABuFX7XnWjVpy8/Icils8f/78X//1X//n//yfr1+/zvM8jmNCJtkLlS9dGqPStVv2ChpfivOC7BlAEYalc+h5Xrfb3dvfe/r501999auPPvpoc3OTvEFOOr0OU5SmDiD6Yp03NafxVVW1vEEVbb5CYGbdfsLGcUax4qimEu21387BsgavBqc13w+A0u17UKF+sLm3f2PQ6y7mc69VLtKcNqiqotIhAAEbm1fv5Kuba2kyO61mdxrrr5oXyzRptcCwT4klT0HYCVJ8h/PZbGNzE6I5ZUlTZyPVmTP4ScVb0G0kxKJZaW/ydtbt3XcI39QVtCgT/I1mjUnK6BKwDlJkyNObzuZpuhiORienp6C3kEKFrizPID0P+Tatkgg/iq5mTByVt2SHkGvDkpWdpMTTct1j9xtxYA4Go6gxfhUiLQEW3cCPk6TdTlA4YWd3d3dnZy9pQ21lkgxB1FPIJKsqdSZIagUmLSKuJdq4bn+Hdp2AmVSWM1UWuDmmCa0qosaI6lB6rRHRAVU9FsBzuftVLH8iMYJ5G0KxM59YXr4fdTrd3d1bVRUFQb/dCaMoCaM5Rv3ni0UIPTlaZJnfAv6J8rRMmhCwSdEZNOFSvQSKR2R8AgVuK4aeBRIas2/lgzePTW/JD0uiCjAywJcFTqYqioFBJMW4piw53l6qF9JncEtoOJdlBZIzKvFsNps/f/4C1ByzfDwezebzDz78cHfvRhAGeRHOF/MwAPmOnFRqEBKT1gLS8KDYOon30MOczcanZyfff/vd999/99e//ucPPzz//ocfRiMoKIf2dkHCcYQzEUPP91XtOwa15NMTjpB6TfLx8XMjw9cypwz/Sr0Uelx1Or20+KUfSMqZ0r8ifIaQKCp2FwRBr9fr9/sPHz784osvnjx5cuPGDfIDib7IbENp+kvO8JWj763dD4a2GIAiEilJ2hBklyRJt9sl1VPqMFEUnZ6dZml2eXlJVw7FPLWmGkFS4Dt5RVCBN0jUX6BkI3F0Op2enp2SlzidTrvdLjwHrJreTtpYfQQaZTAOh0NKGqR6S3QKxgbpyoEhGUeQqRAGcRT3exDt2dmF6ttEyu10Or1ej5mi8saJKZqmKV0elWD5/e9//z/+x/949eoVhGXTdDqd0mtiyqj0A7kDNKrUNHYhZu3K2ARnJDLXl110jhR0u10/8MMAKyv2e3fu3Pno0UcffPDB/v4++brEPZYvtPF6JFxMkTtLD09QRiV31GRrLMGf17jKT9nEoknLh2HQYBMzmwmp1qnjvDUl4JHp1SrL7Z2drY3B9tbGPE1H41mYwtyLqeNsVZqVzimYRCQf+3XrssIN2KBY+PhLfSCNDmCUWLDSlAaMsJxD1J4Iw3A8GnX7/fPh5cHrwwLnlrIsQ1oX9HHcC0ATQljp1lqsr2gd5vibtF+8Q/imzU6qVrCCENhYhRByYx7MfDafgP47pNBQCB/TM6wgIh/VUFXlWchCFMO4cZw0Nnnw1dvIswm8HX5GrQJYxpJ2jEkOO9vbO91uj9NgGp6BlpPhpCCLimYq0y99gOv2N2rsma/aRqsQSQeSUwTV4oGQH2ymDAzjOMnj2Ap3mmtqBVTQV1sBmFBvZwYgxEVBTsX3oioMvTBs+aAxA8lR3c7WYKNVVV+/eA50taJIs6wE8hhqTmKaEumnULYe+bDO6LNQOAPGKbeXCKeKAc1jhR4K32hTUQ3W1tVvYUX4VS12NhHSGv38Kp1/6foVd5QTNwAvRN9ssbi4BN8Qyw9MQKC1VUVRGKNKJCg6tlp+rrFflNBBlq+uUYOxXch/rlR58cViPhoNX758/te//uXbb8AhPD45nU6mufYGFVM0RfME/8QXTsTb2jLf1HQ4WC3wHDhnM6CR0saPmk8kKYWND9DALJq8wMooMu+LSqJ/+umn//RP//TFF1/cvXuXUgrJytcer8ED69f2t2sOnkmiptLpoqQ1QvBkSmQYhpeXl3mRz6ZA73QekU5ShcbuE8FroDsKGtozSORF1ZM0S1WBjSCcRVCOcoxtNBqNx+PFYsEKLlLhU50I89VhV6y/HvhwhQTG3rp1i1RbO52OQiBF6Q75BqlmBqDhaToajc7Ozv7617+SN8idkKsd8qllhUn57uoJdaufvOWb1cIcTDnmU0AZp06n1+998sknv/7Nr59+/vTOnTvdbpf6kmSxrsAG+YNFBbKZ/PI4boxLzNL1pLK1W/iTN6KZIMClZbddnJbFuoh1ZYW6VIQUEn29gjpvEHR7/f0bN/q9bohSYZgHACVhKClY8vC5PwqGy6qCIoxDSBPU2UB9qP8oiDE8GOi8RVkGOq+BSr+MhkMSGqXJIQpDFc+rP72a8LJzwnWn/du1d8ohfCM+sc6Q4ig+NF55DE5Ys2zU+CnLLE0nY+BOAT8GKZjKFMIQu4YE6RxLGU2N45ANl7qVw01YQtJEtWwU/TQMRqEY56rIJ1xXksSk09DrdXd2d/f39rvdXhgEBZg+wAI3l6SJbZrshslQ9I0psahfAS1G69TBv3+7sr6jeC2G56ZpR9ybFGFDQ1g6Bm2cRnumVqNJVIM32zTSL/laaIj5pGdLoQSEpYGw2GolvV4cBEm7HQGLDLK2fN//+uDVaDYrUF4fIqk5aOgDgKDgNBh6GOZQipR0Fl14Xg8uhWiqK9ADCTcjFwUjr4hUCfz+WhOMO9wbpiYZFFruw0suIjm6YEag20VjrfKKVt4qfKjsiOQFcOfwoDCo2+0kCPxOp9/u9GLPKwPltgUtcKSBkRSQZgncKL10WL/nwPobT8YHB6++/vrrv/zl/xy8Ojg5OZvPF+D+2SWPOU9M3Ln7qus8PfGT9tvd+7Y2ll698AHFp+XGMW+mCgJVFQgSiesnhI10O7/88suvvvrq6dOnN2/eJBHRdrtNfqDEA9mV+vEGyjWXLel/spNDF8DyLfQr6YHJJEm4Qd+79C9nM/DiZN089or5Yri0OpeLgLgnlTos8m63yz7nYr6AekvT6WQ6mc1myhuE/kHQhc3VxAvnJMxOp9Pv93e2d27fvr2/v9/rQYkjLuTY+JToYggkHI1Gr1+//uabb16/fg1FF3WjayB31GQf6sdVzx5c5tXXLdHGN+J8TxmDnGAJeZ6d9pdffvnFl188+VShzQRKS2/cic3Jk9LMLIfbUmOghpMzbLhehP+eTVs/VETBFGJi76mGyVm6pKZDqhI8MHiDMOz3B9vb24fHp+F4qiSfgqCEOZwY9oTSqYXOin42jib974oa19e4VTfWZvHg0Ej2k4R+hajRcJguFkTmRopMs64Mg968JjZqO6379d+i/eIdwkZ1+2VbWlaCHhAOuE9OHX+WexFZlMhaEJJP0+lkWrZaFxfn4/EEdBFBiQHYVsAXBakLGCAtDzXxV158XX5dcc6FOnAjOUoE4zm47obG8TMiAyh5illX0EAqL4qSOAqjaLCxEUfR/t6NXq/vYXJIFMdeq4J4LtJFGQmUa5JtcinirRjj6wH7925mGl3tFloQtbIb+KXSC5ZV7OXkr3IQdVzAzP6aWUJLnBBSAh8GLTIjQNp8UdrqB/lHz2vlIHMRBUEGpd5a3b29u3meZulwPJrMZ7C0BOEEhK2hWj3Kh4YKaEJ7F9lcyo+yB7eKVUilEkK4db16zv8HR7UiHVXbsHI8jZpXYLnK9gtShVq4KIaJ4dp8dalfyhCEmn7wroIgVknKLW+RQh3AMAjpso6OjpEaCmbFYrG4c/feoL/R7fXnYdTudAKQGFGKNvCodXZLWYHBXQC6ko9Gl0cnR99++9133357dPT62bMXw9EoRXyJDG7f80mkhBIFHWk4maxYt3SplJbzfBRcqW+WnTfcXlLPTfRJzp+kYSBrPzgpXsQY5PdFFRo6nQ5RLjc3Nzc2Nh4/fkze4K1bt3q9HpXHI/oi8fpYT4VvpPVWzdF7sFUH34B3ShfA6Xbk7JEC6mAw2N3dvbi4AH2XHJ5MlgLTMi+wHqCw4chh4wInFCMgyfg8y1MPUhbn8zl1P2B8kShrGEElkjlUIplOp+SJ0b/kTNL8QA+NLolcU2JLttvtjY2NGzdv7O3tbW9vk5AMQYgCAFctTVNSKiWPazKZnJycvHz5kgoeTiaT6XQqa0sw5KvuyNb4cepDSitWOpAOOu1YGrKiPXOPKQGVdYna3fZHH3/06ZNPP3vy2d07UHKQbpz6IfeoRr6oALStLqEuRhaUt6k4ThDZkEhrMOPbdd11W9bIscNXo4WSdcUmWlGZsYLYIA78sqIaz04WERVB0rKicafb3d7Z2r9x6/uXh93udIFRORrF6tTaOMRaFKo/1F+w7BsyvXYZVsHTrvOz+lITR6n7SuErCpgBNRTqnUIEZ5Gmi/ks0qEQ4uWRI1s7r7EsaLZuROmlJ7nuzz9V+8U7hNfvB1IbWgskqoiNtVrAP0Y8UTqHBD2Q6EFZFHmWTaZTspNgla0wJMkDUUk/W7wmx0zhEDcPEtu8JvKeHgA1y5It2/rDkF6iQ3Eh0zwAFxEa1BCDmsDx5ubG1tZmr9trJ4DGxHFEyV0yPYYvQV2XAioULUIDLWbxuuarWbefqrnVBa+zi+d0daMuqnTtLF4okVGggJhjYagNNP6mqgVoUiPango4tCdz07TOnvq/IESz2/dbYdgK/Lbn7beTII6BiYWBiuevj4IIdEeBRYkiiuQBFlSSWyWi0ZKiY+j68rSHp4XbeRhqRrWmD6wAA8R/mgK/Szg46jXVC0Y5O0gEzD0rNjTlCX4BsdUSNFfBjAf8ZDzOyEBHRZ10ke7u7e3u7La7PfCFkriqoMIVuE9hANEiHeWiLGgsrDq6vLx8+fLlwavDs9OLNAOLXAl1YHQ3b+UiNG3wKLCE7KLJ4v4U15FJ5YJywXOUebC0jecpPWRyMp0gND8iu+ahG1HmXSR1kAClOAZC8t7e3mdPn/7Tb3/7q1/96vbt2+QKcuW9+kt5uyavWZpljcyo6xxNusT8EAjVpOcAteyxfkPShlD98fFxURZ5BvqcRB8l34+xQegSRVAGsJZxgSUSj6ETFSXkJQKO1/KoNOV0NoVuA9mr4GqipSoKUerQADdSwdnd3b137979+/dv3YIa9KrmraLIBfU7JVeTKKzD4ZDgwW+/+5Y8Xo5TkL/qLLh8HC7GaOEYNux2HVqafI9cdIQRvzCEWho7OzuffPrJP//zP3/++ecPHzwkNiz1qOuTNh0XTipYisW+YUdLd1R7JtcMna/bWzYlu0YEGV1ZFJcgkU9uZxMIBoR8JybQD0KjQbfT3dqGKbzb6YQYNMmLApjXJeiRutFKpvFcdb1aGnTp3dh3tuwoIsFCr2IlRFKx2+GUkqbpxeXlxfnZfDYbbGzoeJ+yIhrP2+yCqodT4xmt+/NP1H7xDuE1m7vE2mQKOXuSiaJjPA0yUCq/Is9ns9nlxcXF+Tlw25AtTTwZtbiqPCENwAhv0JqXbZtPMe6UTKJtYi5Jv2kgo9XsSFbtU0QaqBHgwW2AwHEIyf39/vb21tbmZq/XD7HsIC9verw3hK5FGpRL7mqENNftb92EOqgACesfGhpOswp9YZRPkYOvL1WnGDD6sxoNZBeS0sHyYAHjYMohhB4Iro6HLKzQ84t2sh9GXhC0PChN0el+e3B8fDocjlvTMghS0DYEHwlOmeeq9AEKnCjmFY1t9GHUOqrcEo3c1aYIfWGqOBPrNFzlDTbA4xweVr6ptfx7jpdYl4yXJ2IMjUxEOirsC9xRnwx9MM+hVH0I1XGy/O6dW7M7k62tnaqsNjY3ozDww4gooqhWB97AfD5Dbax0OByenJ68ePHi9dHx5eVoOpvnuoIATXFCVq6sVFTYIic4j0VftrwhyzYSLFT1iJjjp3nEqiq9diPVgZlxR45E3Rvk85FTwYxEzgbsdrs3b978DbbPPvvs9u3b/X6/qipi97FCSaN/fs3mkFMcP1BiWW90irozTJUw2PUaDAa3bt2iyu/AGtWFLqfTKbuCpACkiS/wTPhLTgUkT4w8maJUVRzKokzTdD6fkzcIvQ4pMcgzhUxUaCiM7yNMSA+TNGO2t7c//vjj+/fvU+oggWZODQbx+FR+AmGDh68PvwXk+rv//M//PDw45JKD/GA5u7WOKjQxls29S+TWYcE0Ain1KZF6V6/fu3379pdffvnrX//6s88+I7GcVgVyUEya5e7X6PwvCxaYjiScPRou9T62bn/3poomqLQDm7UrxSKYV89KbU4XgO+JzeWjRlFZdrrdG/v721ubJ0fHSRwDhyuMkDIKFA8qpMTmGDtOK6KSbJti6LM5QLlsGqpLLdIHjtZx702ChOKAs/n85Pj4/PRkc2sLRroGV+oIYYPgmDDENUKOSjbrrv5Tt/fFIbRmTA0LmAwHUrQTSs3KQPR1dXVaHTH6SQdczGZzLLhUed75xeUc5IANCm/SlmzaCZkwMuDsLP7GnIKzm/BJvesLb9BIV7GB6wTgkUjQ0olVsBKR/EAYRTvbu77fikJ/c2Oj14O1WfMBOOVDWRt1Spgwc5XzzJk/POWtccK/Z2O4y9gZFkJT216EmTVTlHNXCAtEz1AUyK4bSep7/TP3EkeswhR4YDrKMsNXRExUB8bOHQRh2els3rz5qNVq97pxkvR+6Hrffht4rQkUyK68tpdnOcxqkGtfguNnygJDvIY8TqUCR7UTtW2lDU9zhfLp4Y7GWLdsRFcbpglJxB/1Q4Ch4iyEDnFdobO2hL2eMNQ3Klew1UriGPYsq4K4ozl4heQbHIIWP+BB0+lsMktv3pxPJtP9/Ru9fi8CTCYMozCJEzDnYbMcKA/D4eXl5cnpyfHxydHR0fnFxeXFxWwOeiGQExKgsErlZZivSfY76B9AXp4pH8/3VfssHR54cET0k5iqFlrwyFogR0xw501znja7RnwZ5MTKtDRyZkhzhTRFB4P+7du3f/WrX33++efkPlVVRYAVXZKsjd76Ea1u1ku5yB/DHZUMUi7FTvzMfr9PGYOkCHo5hDRCPgszTqXTK1U0OXmVuJqLFLoBSFUj2436TJZCEj1dAOGDtMhKTVSCW6lw4o0bNz788MNPP/10f3+/i41wM0nCpH/TLM0zqF0BXOiqms/nFxcXz549w/Inz7777jtSNyWfkJE3tkrl2HFocpTp1/hI2SWWX/JTlVdIvYITULlHdbvdBw8efPXVV+AN3r6VxNCjKEOSd+Qe1egNIpvOPP96NAHfvb4pgf6ZbZpmoTWz7m/bZNSgoeqjiQmKn0qQojczm+FH4OoEBVpmqNU02NgabG7tbG5oeBjzcn3PLz0ursJX0ByMF6sqR/T0BLrUaWxsMkApIzg8Z9I2MNkigaUoy3SxOD87oxFIQSai2jnEe2u90CxbXgDYxZXWyDWnynW7TntfHEIZ+dMxBsUeUdYYBdod+hx7XWZKhSgryXNnYGZNx9MpBkZxBa1VWWjopvY5VgA26t+lURDDQJCoi9H41LmHyglV8fwK5AYrE09dLBa9fmcw6O/t7m1vbaGqONSjD3wgBTlRfZs9pQYpHUlSvCj7DP3IN3hH6/bTNMr/q8FQOhTpbEzzrHyVlkKRDGlKvVAr0mGteMJBUksNoXMWomzA+foA4WVT92ZlKRIB1fPardaNJO4O+km3t7G7k8TRN999fzqenI/HWIsPBbtbkIIINQlbrRI1ZsjB4iOTLo5QZBJRFWVsaf9arKOMXLGSCvrM4hk3jlfx6Egvp+Gl2SgEv5FaRMlcDC+KhbbdvQqURWmDoizSNBtV46Io0yyfzBaXl+PhcHzr5o08L3d2drq9ThDA/J+0wSFM02w2m89m0+FwNBwNn7948cMPz49eH0ORCcwsBP5pWbaUkCMUQzNR3Dqq0/AAGt41A41yM46dB4F21c1sZo4jg1MsHsk+gOPSsOVN3qCPXkoYhr1u9/79B0+ffv75F5/funWTrHbaxvG1fjww6C5A4o07bv9bn5G7KFtmvR7oRZMLRGvWAhtBf5SbxyEbviru3gQPsm4NwH0oEEoZ8kriZYF0YkwaxPK7Sj+G6zpybCiO4/39/Y8//vijjz5iBVeZnOl2IVRIIiG0qoSl6uWLl7///e//8Ic/HBwcnJycSGSPx2P9ubnEFrvLyV/rLJ762OTnzJqlTKhJkqTf6z/66NFvf/PbL7/88vbt2+12m26Q/MZr9ih5eQ563HhTdb+xaepYG83/mAr1TGowlp/lnakPDkwIqwzKjYZR3Gp5cdLe3dvfv7G/s705nk7nKNULlNEWDE/NLmlYXpuwBPIdTcD+rYG22lSsJ29IksSUYxw7WAupGI7Gw8sLekQ5CSPXA6NyomeQAUxrBQzWo2DOvLpuP6a9Fw5hw5AQ49NKj2Pr1k7Rk/vD4pplKaZPDLEpcIEqg8Hq5Z7O4Ysq+1AckK1sBeXTXk7MqXZMRlnqNisfgM6JwKayvUD4xq/KCOI0PjJ8epjRsbu714UCUFrnTU1eJSESzrAnANDxD8Uzwj8AiRFMu3X7e7YGt6RBzbLx3UgfT1excCkl1nRM8Uw6oMlANMVNVEVeEbh0FhIbq9QfOHJIugvg4qG5CcH4OIqTIIoC/BzHyXfPn1deazSZoFx+rrodlc8wi6LWloS7RtBRsMVV6ofxuEz4UzYyXrnsdYP62RJ9QmU4IiYptmmG0xprN0pgVmILDOfS6VsoRO77ftaCuoJQrTDPPT+gQqmLORD8RuPx3t4OoWFBEKboJ4xHoBh5gRXlnj97fvDyYDyeFAVgKTyVoM1NdqpOGK5PUMtNDDk7STixRsYzt+/MIXxC+qCDUMwvVUUUCOehXRzPkI5SVoAp3bl791Non+zt7kZgeLUIWSVT/5rpZM0gj+jhdJtOOTuHW7XsUG9k5Uj1FE6YLMuy2+1ubW2BtMMCdEHnAKeXsp4hzfkOLCY9QwWpecgUgOIumEeKqp8qa1DnDTpeEzvhpCLz4MGD+/fv7+3tsVrPMmEetBfVCy2rcjKdvHr16n/9r//1u//9uxcvX5yfnedFTgKwDPppc9Si6jQ+w0bnysnwdy6m8SLp4bBYaKfT+fDRh58//fzxJ4/39/eJIwoVfREvlUo2y25Z/avrqtJn2X/qDt6yZLHGROV1+zs0HXpVfpolBGF9QAqEEbuuHQdNO1ATxT42GGzsglO4d3x6PpvPoyiEyn5q0jNics4r57nSXfj/Bk1SRmnSIHYohGVbrclsenZ+PhmPknbbg/JSaqJuRE0syqhW3Vlj3X/r9l44hPUwhsDmcd4k6o7Uzbc5PESYoXgpxUovz8+HFxez2WwxnY7G4wUW5FXh1aqCdF835O8GKc1/2Da0dHtNOdHG1YgopR6s0GawW1FDsTJiwBiODRYpsNKDFtJHKb9/a3tzf39/d3eXqDvGI2C/sBYc1QauEc5iN1YUFuMLWbe/cWuoPKK/1x+clcIWr5PUUZqLTVSBtLOdcoI1/hIWaZDunEiYqDPiGJHQ26ri0ctmedA3QrcHalMErbTMilYr6vZu3r1blsV4Mr6cTi8nk6osJzPgjsbmFMR/A8kUD1fWkgh1qlYhVYvSNy4eGV+qpA7anV+VHatH4huun/EEIWHDZYFrREtKy2f6t9lGPkMLDcOdQedQR6bSLGtlwAakdffk9IQqd3s+qM6Mx6DTSEZ5u91Os3SOpNDRaHxxcXF2dvbq1cHp6en5+TmVE8AHCFx3JZFq3y89FHrKpse50SJy20SQALlD8hE5tjjjP+T7yS1tToTCxPixaBVWpTvKoF+rBXlcYRT1ut2W521vb9+8ceOTTz754IMPAPdCZUhyCNlXudIhlFN0Y5hDEkQdR4W35CIQzmFXgKurr4f4WjTQoijq9XpUreH09JSK19Of3I0ZXpNcLGoU+9CVsj1A3bETEDzIeYYyB09eOT1JUhnd3ISFZmdnh4pMqDr1ygM3SptwTJRFpXTEsizPz89Pjk6+/j9f/7//v//3h2c/jCdj8gCn0ykVSAT6tA5QwotDegpPKc6QkU+V3289h7BeJ5AnBOYeU3ImYYNRFO3v79+5c+eTTz+5f/8+UVhJS4aOJpMk6y/OQjlERK7OHXV6iPQm6vDg2nr++zVKRRJKEFywWZFl2MdB/hSJFKI/pGhodTkIHycxUNsGDdvW9sZGVZZx6MdBkBLTQdmcMABN3oEECRxPsGZLLid2NDc5FpwAh0MZ5SBIq6qGlxfHx8eLGciDL+azsija7QTKCJdlKENCbBfzKiC4TRx8dKNI6/79E7X3wiFswCJAS56So7yG2bYWxhNEUxjAsJrOESKcQcEuqqnC66LKca/erK82IgXsNy7ZSbA05d2pT4IejtC91mAAOX6QaUToz/e9bqezubmxCYoyPV0X2Cqb65prRh+ffuLzGfv1mkom6/bTtLo3yJOohptNlVz+QqNK7mG0/c3/sWZ/HXg2QwaXPiwbIMAd6i21xcOlNuEJNd1lqe3C5dQRivRD7INxu+UFwS3fyyF9Drb44cVzPwxHk2mWZjHLjaoGAAgg3nR75E1R3IPOoC+AzuiU1W605LT6yZXZ7WZ3m0dUrtzFq8n0mIuRDrbve3SxJG1FWygqIFrxWZbNoSgwvKcojmaz2WQ87va67aQdhEGSJBm4B1nVqsbjyXA4PD87H14O5yLIparLUa3CmmiR7Dm8ZtvPynoC9OSxWp1V0rDhvde4QDrYbT0QWXAcjG/CAN3oFW6DNkpRlr1eb39v7+OPP3748MEWUOVjzK+2MqVXtPo91gOOzpS+7LASWK4f8EdGxMlEo8BfWZZ3794dDuHNkvooJ8txgXt2eJg7StfA+BsruEBFSi05Y/wr9Y968pQZyNmMe3t7N27cGAwG5KyueCBUGwNyCLGNx+Nnz5798Y9/PHx9OJvNAj/IEbhGlWxwSsn4XmGqyp4gz8VfitCD+0Lln1IJhp1YKAzQ6dy9e/fLL7/853/+5ydPnnB0tY5/NuLJy0Bj8DE4hlLbvZEXav7kirJra/nv04QIhRD7wdifyhwXCJ5y/KlxWVzLWKLiE5C2DQmFfpy0N7e2bu7vv3z5CvuVieYaPXD+r7QD/xZSf8uBTTNLEGkOY0lRp5Nm2XA0ylIsRYizC6kbus+QkzvEQzXGZSONYh31+Inau+kQOmLNSxd4UzzPGi4srcH2rjLQNPCepSnIbU8h6Waephzh1wkPuI42xYnFqbVOAsfPmTZdu5nma9f6/I7HpXjX9l3Cmq0PheSfVhSFJZB8wigMNjYGuxC17QNpSuQmCbqB7a8yndUU+pZ+oEououqLjeS3dfupml0twvrABFGuhrTyOKqmkNFgMd6emfm5ZIsyOKS7SYPGuJHYq5vGntWXlPcoKIL1+AHWSaHi9axB2vK8MAi8IBj4O3cqqK4GhY/i6NXhoe/5E1DJb6XY8xXDE6RWwJgDFwk8KEhMwug7BUwMZEoTgCRouQEaxvSsXVY9XcGQ5G+uszCzXrn16CTxUiMf2q3igYnLMRTi8H0vz1uLFuk/ttsdkhgZ9PsAlwVBFMdFWYJKZKs1nc6gfvDlaDafU9VB5RCqSsJKfMtRQK37Oksde3b/6HPt1hxwTFU+xfKVNl6qtkHKA1JxtU/IIih8ZNbMxFLOBYA7YbizvX3v3r0HD8AbJIQnCFQFvBUOamNcQxr0cvdGUqjj/jVyCB1E/S1sHUnEYtZZVVVU7GGBMhXs7TvSmvIWlLOn6YuEdNHBFWVGFzBUJ8WsIHauGFIbDAY3bty4c+fOYDDguvZ8tY4bRm8QUes55WW8fPHy3/7t3/7lX//l8vKyLMukneQzE+thj1R6g/JlrXhQjTKejZ/rr5XKlkRR1G63Hz169Nlnn3355Zcff/zx9vY2Vf7gMoxOh3QuwHr+mthjukHDdGh1GwfVNJe9Xnb/7s1KylBVKDi6J+ZnchS1jwgvEFIimhpW5cV0Qj9udzrd/s7u7ka/f34x9IN5JcadD8WBm0MA2sA0X7hX/Ub3qCu31XumtjPh/yGCiOwMvMPS8/28KIZDqGa0ubUdoEQqHi2s24iUh2JAQjZOli8rb3QL6/Z+OYRmohRfuquyACZUdWdto0lri7hqGLMEewrE2ReLqiguR8ODVy/HI2iT2RTCpTqXQHmTdplp2Y8lO8Xq34Jfx1+tGK/6JFbusrLDxeBRlFEalmjpRhEozkdR1Om0wyju93rtTieKk5YXeFg/RnO0nKtjwJGMOUmW5wfOExJe1VWEq3X7kc08XeeDJRLjmpurcwIlCkRf4AAxdqHaQGfhtXwjkcnZuOpcKyduZopyeUOsXo/r2pJuo5eiVuB7ZSuI8MvB5uadhx94UVT6XtLthtHzi8vLs9Mz8H86nSxNSzRhKVdKHccHLpYH6jNwpqJlbEp232Twvj6BWI+i8Tptg5IpecssNRm7FdYeZmtZtWoo0sJHNhujZQzfRaAbSbAJ2KzEqcuheFV5enoynU43NwZ5liPfLWp32kVR5jmU0plOZ9PJ5PzifDwez+ZQ4hF2BqfaA6Ue3buothzPTnbSlmuLy2+McexxCFzhTnXcTyNUfssHPgfS47nUONnEECJg9M/pabwxsRPBMMeyB51u9+atm3du37l969aNGzc2N7cGg34YRnoTzkZ0sZ1lcQG+YDnbOwrs8r7qjoqjL1onp7zpLFrfPkkSekqUSTgcDsfYuBA8FwCk9UI8/1Yrb5UINsuUP/bcDBsTuyKp9ZDkZtJOAj/o9/ubm5u3b9++detWv9+nGo8xlqiWTFH2P1Vp+7IcT8bnZ+cvXrz485/+/Kd//9Ph4SEVUFykShSHxUVl9qN8I/IF2cPK6qjOW3b6MFd3ZH+YFFOZV7y/v//JJ5/8+le/fvTRo50dSM3tdDp0LiVipL1o56XwuYzerOZcu0yKJmBTfpaxjB+JKq/bWzfbYKKv+FUaURQTVMecBRF2dd8XTryw/HqeHwVBf3Nza2Njb3f36Owymc6m2DNR/1l1JXsVo/MLAFJEIWVo8k3vctn3XLVVAaRINcN50JsuFheXw9PDg9HJ8XBnr/CD/sbAawVgNgeBqfAmllu9uMATY1lyi5fUFK5d9/kf095Nh5CaAfd4uRW2pgG/zECBCZzMGzPJkruozR+Mk5fz2Xw0HI2GI0iwwXLYOJWDCUClunQtLUu8UTZn0WoJRMWYRddiLpkhrQ+gU/jYZWQXlHxCvCzmR7WTuNtFK6nTTRJY5HAcq1XQep74jwaI8Ox0Ug5AkZ3HOBUeYL0s/WPaykeuXmFjB2ui+lpiMJqaIpcSNTUrR9TafQVKL2pj6ITV1YAyHgWzZ8E4w3x13Ljd2r95q93tJZ3O1u7e5tbG82fP+93O4evj8WweYRlfAsaLAuI1KiREnHEaIKi8pJcTE8qpYxeO26McVFeAt+EWuCg213GRvIQlw13ptNlfke/kNqGxqZD5qkKAFIczbADVU4E7ShMV2OtJO4xAUQYZ72DxQ1m5dAFk0SLHPcDsrsoyR1MVbwFHNcQIKGVFPRfp/7CekIogsYmgy6+ZzfSnujaPjtqpd8XVCIUFrJw3yUSVU6u8JLTNAVJG+xxqTkDp8N3dm7dubWwMyBEC6VS/bLXCWjEg6y7q77eOMi2b9JxbqKM9y1LF3noWZSETcpzKsrx9+zYBhlMsMTKbzaIoUtwW2w+xC04aZ94aFGVFVSgoyEIfiCmKpSTAcdra2iIw9sb+Dcq1o4up+7osY0NdcTKZ/PDDD3/69z/92+//7c9/+fPJ2YkqceEB3I15wSCMZmpmLOdB1MHPFQhwHSdkbWFy8IgLSme8efPm06dP/8t/+S+ffvrpxsZGp9NhpqjV/Zb0KCfe1NhD+MOVSMgKEum6/QMZpEKkW7l+2vK0C9I7B1DFJ7B8Eg7hfq+/t7+/uTGIIqitpMvywCgvkJomqGfCI7QXEP0vu11v2izLQFp/9jlghaWBWRZFFEZ5UU6m0/FoWOQZ2NVQn6bwkD1u7SyERv0VSUe2eb/u8D9JexcdQpZjscmf0OyCVg3a90p2UB9JeD7agoPEpPF4NLy8nM1nYDbpEVGBSZEjD9NkCLNEJx/fMaMlY8S9DfmfFXdrY0Oy3ADL/sqEKFB/KooOJgoGgd9pg1J2v9ePMY6ubQgCTWtNhZsMK9Gcz3EDdCU15nqt2z+qNbI7WBqXfTxletpEU7WxqiqJ0CKyQ+Veqi6LqrCnE+uV+KhjyBo5TO4sHJpxFCka5neMVcBPAYjLEG+NemwUx/R/3V5ve2d7e2fn4OXLTrdzBIXrgQCJSYdQz1dFUTGy43nU1atAiaWAsCF5ijxg6qigwQa1Ec8Cko5b2Ag+sL/RkAuxPITkvlPLI1XRU/qsFlEVCargFhX6Cs8LYljo5wHK0cmiMJySO4SRrBTJ8JAXze4B7g3qLyrPHzkIukwiv1DrqlZ6U2hVW2pV9anGMVVqriAmCgocz8kWkxgd+xhgUUHl1SCOIaFud3d3f3+/3wdskGiNcpKsX78dtrZeQf2lyG9k2QDawGEjO9jOCo7oG7mFTNeU3jgI8iYJoeVHR0eUT1hV8N5BHT7LHP9TdniupS49cLhsqKRm3gIxUIIgiOO42+1ubm7evHnzwYMHe3t7oA2MOkZ1cRd5j3mez+fzy8vLZ8+e/eEPf/i33//b9z98fzm8hOfGPAXVcQBO5OtcIVjaSMqti8E2vkS68ToaHIbh9vb248ePv/zyy8ePH+/u7hJHjrYhTaPVTFHHD1Tcftk3bNCIn/wV8bV1+0c1icuxyigvo8KcUy4T9eYmbJA3ZEp8hILavf5ga2ur027rkEQrgCRDjDbyqqqnKNMfBEj4E9ylrgdB7B62nnUMjghFUAwYua4e2smtsixmWEp0Ohn3N7dA5q3AXcrSCyziDBNEWZpOkdbq1eOa+BQ/yT2+n+1ddAjZJK1JbLiw4ZLwoTmSIrKhHUMcFYijl5PJZLGYn1+eT6bTNMvn6SLLKMIKCyJR2lTwhJd5VoGWSz45XhwRESFzuuir4jeENsggjfbGNOJJhjybBaooMy5aURQmSTvL8l6vR7VuiiKPgU3a8n1Tytl6soqgpkhrKqOMnAEND6nQl2LJsze4lpb5u7T6Y3YWG4PiqFTABuqUXaBCb6MyB3hjhRNSrzMiMSRJqijZtXXOdpl46BFGJyCzFdO6pqiZLgdnR6M/juMbN291+/0ojjvtDjiNPqAVF8NhFMfT6ZT4zVmWwd3A+oml9UrMMwTTFpVOmPmsxd/lec0DEV605NdZOWbiAYi1ih6CV1VBPTBKyxx6qpZtWv9sPA3t2wdYCBgLCUB6GGTN+VjLD6+VuKOgeYi7XQ6H09ksCqOkDcUn0CvI0jTNgZI3B7Io5pgp9UllgTf2M/QWhD+8guXIhV3ZbtC5qFZiHmU+SguYrB9Hp7FOZJAOBtdbJ44fuChJDImmUdhOkps3b1LxA5SCbCOLXhVIcA5o34hlxF/pQzrR6zqvrw4ELYMir0SHljWuLUFc0KIo4jje2dn54IMPLi8vT05OLi4uyHUhBRpmbDr4mHRoHbeQGaeQlRqGhJJ1u92NjY3d3d3bt29vb293Op12G57zMgolZTYSKD2ZTE5PT//8H3/+y1/+8sOzH85OzxYLKJcSY0ynyIs0T+VzXuYNLsPoHFecPlBP59AAxx349hNspCLTarU6nc6DBw9+/etff/rpp/QNrKS4thKblIVqr3xHqreInGsdW1naE1bD1Ov2j2nG4lQqo9Ls04ChmrQ55Wa5NwiWWFHB2PR9L4OOFe7t7e/s7UdhECZt3x8TXxrLf6rMAlq6oGwvBewsvoYboHQv/zooNO7agqxHABWEbU0SVqTYr+4I0XIvDML5eNzqdg9Pz14dHX+qs5cVHweJBsw1k/gNm9/MUDK2urpeF2lftx/T3kWHUDfd2aBJT4tsJjBA2a4h8SLRj4WPhb+gvp6u1JvPZtPxeJRmeQYLWK5JWZrDrYt94wwgQkXqwHX7WzqCRkPiSm9QIPXGtrCiUGR2IZ1VzUN6ViBqaKvV6vcRHoyTOI7DMArDiNX4rIdpVewWOb7C5LWQSv307O/W7W/crnzMsn8odqSsxKesEJJFoyCg3tY6NIceTKCOCyo0oJFcmF5EvlVvty7aLGlXckex//k+YHtodal9oyiMQTEy7Pd6nW43jtvdTjs8fD0aT3zfn0ymXoaAXgmGLwGMpC4DlFFEIKnSnv00+LLNmiSDTLBXVUKum+Mh2NH9+m0s48JwYPT6i5wwMjRjHa+KBOgUbqirCGSeFywW9LkA0jvsnkHCICUcwpdK7JGYojzR6JlGpEgb7Kzu3iy5TOncmrRks4U9dyj/AfOfhR8F/0hunkPa5HehfUrAkzFxuoNlV3cHg0G73cbKAeAWrrzs5uaoyzQyh+uRbP5Qr/Egb7nxyD9SbpST4jY2Nu7fv39xcXF0dDQejyeTCf1E/hg/Rv7M8CBnGLJTx409PWQjJ71eb2dnB1M1b+3s7PT7fSrOvozfRdgg1hHNZrPZ+fn5119//f3335+enmI/hCtZLBZEFuXno+pfLylaQ984Ije1sK+LOfAt8y58X4xLt9vtGzdufPHFF59//vm9e/c2NjZkApXzouvNAQbVl3YYzokoNXqAy+IL6/YPbA5rht+SXCv1e62DF25jtnwcJ2VZdbrd7e2dbqcTRiHRZEi3qCh0UMD4bPoQ14vGy+Bm/UdHVEINDbuSL/0gvU5KAsd/sRhSuoBA5GRSAAmFori4r13ixawp9H0T80KZ3OpJNiM66/am7V12CI2YPTYLDBEWp6I9yflUqNEokjc5l7DyFIv5fHh5eXlxUVA9XsINywJzbGg1ZftLHlSClO7Mrr9/gxRfmQJpHVAQYk2pYB1ooegv1vwFOesw8DcGA6wKhZkPyo/1IOBPyc5XPmJj5djutzJi1oXpfwat6Q1QNNqYILLcj/qb/qOBRD3nOiUNzXrQlPDNCYccJhVjUAYudOdX4++qvoc+GC6WCkuizkYRyqAMt7fDBEIckLDUbneSduf45PTs/Bx2nXpFCa4gyfHnQDnLfdBSAmkZHAAq98wjP0iU61CQpLhl+Ryc+hyrY5Y0KPV8Y/6177L5+6sanV2BHuqrEoqjMke9KIoF6mDlWFhV281ga+u8QfIH4P9lzFbWlZQ3Y1+2sbybWJR8hfxQG+6Qn6EECRm+k5SHOi+XPjgYF/3WbidbW1t7u3tbm1tdiBfEnA+2Eu6z3il/cFLF6i6i81gcH6/xJ3nNtpP8luaOwx0l167T6ezs7Ny/f//k5IRwwvF4TPERKRwq2dEO67V+j+AvASIf9no9SNHc2bl37x7AgzvbvV6PK9HXe4X0oKqqms/nR0dH5A2en59zjUSueSjxQOfCGr2m+kh00GyJNDrby82oSkcQgEzO3t7eo0ePvvjii9u3b0dRlCQJnZ0LNi7z0CRTVH0AeESEmZzXZ9MO6x3jLbrEuv092oqcVvmW1cq45CCYc44Aod/yPYzYx5ubG4N+Lw6DIER90cBvYeqSCRuJJJ56j2LuybIpZVkGE2cjYXjNXLKI32njgPy8qgLV0aDKWlU7gnBJURSjyfjy4nw6GWd55uNsgNwckVsuTmklJGir0r0Z/cWPDJmt27vpEFoZSg7Li1lqwtqgferBNtqNnD7mTOVZni4W8/ms8lrnlxfz+QLyMYjngmIPZIqpCDZfk5JR1FwzCQ0uXTZW3aM20GmykMicWWZg2cZiXHBiPdhQcR1z4gHr99rtjgfUl14cg+4oTjsAubA8gLFFrMWH69GbKJcOiWm1SZOKuU75/Uc3e/nR/zU4mKM7WjdkNVTGCCAPEJJcUgdsiGZbuKE1GNX2xv9UfQkC8+jjrS5Vzy1AHWDfB2ywqoAa53mgmdRud3b39jFC48WddrvbA6s0ikaj8dn5eZ4BWATSm9jZ8yxHoQv0ItBDwdClFelnuW1+XOpBoVKTQ05zGINLGoeNG4xkxz0wr1LjaRIBUwXZ4RslXSPJjYoIhyNUwX1IkdBFBdQjJlNbMwbB9sUKWoZZoNVf6KTajxUXUfMU9U2qDw4nSAXCnJAAM/QYgwJrGwmxxMcjMIqsc4Bl0JGVKjL0CmBjje4CDBhHg41Bt9Pd3tze3ICaq51Oh0mS7Xa7nmorbHdLn0aaU8t8mxXeoPSZJWtR9h/pBErfuPXjGvm91Nrt9u3bt09PTw8ODkajUYpNPkCuOy/viD1zqrdO/9KfCdJM2h34H3ib9+4/fPhwd3e31+ttbm6SlgxJ5Ae+4eWmaUo5q+SylmU5HA6fP3/+pz/96fmL58PhcLFYsHsfxzGrzixj2zqvQ04jIkC61KHioAPdF/dAuuuiKPr9/t27d588efL5558/fPhwa2trY2ODtiRmMgOJ9efvdJj6LOGslRCMUjdpHcSaYmtxivVS+49t7oxdW0Y52V6EWXUI1WmYDUEU0AXUki0SjK30uh1IjEe/j7qUiuXzuVzCFk/dhv1fpzPU/6zzNXS1M/syzf9T9wtQW7EKQmAThEGYVa241Vpk2QRq089CpOjT1CoDVWaMaEkxt/iEFKLT19XEv1jjEG/T3kGH0O4ZJpNOOVESuNd+o/BsVLxD+IQkY6EMDlyJ8vlsNp5MkLkNDbfjGsv6eIoSLYccCQBaEfE3AQXt21QjWw5OO6jJ6x9enFgRUX6wLDzPj0Ftr9/t9Uh9z/dgqa6nW1ifxMwlzi59BDcytV6ffkZNdDibDiqFgqw9LOGZOh1UhQ1pKOmYiz6V7iSsQaItY6pc2NDMuayzL286D5cU19Ce81qBH0QhpOCjExFtbkE7P7/Y3tk5PDjs9rrHxyez+SwqYpCxzzN0RMHwhRCKV4Ad5gGqpkkGVJkQReEdD1a7Z/ppWJ7hap+QeTHWvGEeLEF8qvCNHS11nRA6C9ruyroQiId1hbSQKkolesDyOHVtSV6T9dtkC0YHtvk2+DiMA1q2r9W37DcsN1ZZW+wLkRcBCiWdHv1CUiKkgAI2uq58ilmhxuNkT8AYN2UVx3G/39/a2hpsDEw5CsK7mgwIRwJ0GSbTaIs7oJ8TnWR40wG46oTD1czD68+u0pyi0otbW1sPHz48PT2dzWbPnj0rigI0hxAn5J4gK9eLbgnPlpwf/cpRk8n320l7ZxewwXv3AR5E2Z6Q4EHyl+oPkHx74ovO5/ODg4O//J+/fP3115PxBNJ9cQNWBpK1LhwAUz5257Olgtv0ahqfNoPSLBy1s7Pz8ccff/XVV1988cWDBw8ePnzY6XSoC13HdXeuoR4OUNdARguR9k3umRuJaLzs9Wr7j2+2VUccM+SOYnycl1HFKfFWvzbseX4JGshA8QiCcGNre2Njs9tOhkMF1KtooDTIdP9hApoxQe2YSD1cZZ19tX/FXlnd2qObFVHUsirTNB1PpucXF5PpmLal6QVqV2HSuHGPRY6Gk49gWb2i7Jm91K5Hwdu0d9AhlE0rtkgD1d5AwtBNWmRcVQHIU7hoQREnEBm9pKxCkpqhKA6hCkpdU6cQqqEvm+1hsblxffqHXAzqFVzMH9qw45843Esyg91uZ2Ow0Wm3QY6CGGWYKtiwRMnLU4CnmSbUXs5VLitssG5/l2b0QpusRqH+wjkAAt1t4i81H0fau4ZgigfwuVqFlkmytWfkB8tJkGl7V9k3mj2KNDYEuYsi8HyvyIHcFWyGvh/0B4ONwcZwOLx16+bLFy8PD1+/ePH89AQESDGyU4RxAHZw1Sp9kMKG/+F/SRJTOxior4oXVrZg9WUmLVUPuw6Mo61/nnt0hXZr8JrcEFVCRrmdNMVo8QAxvKQLxIwg6amJ+KvwQWGCkJFgsraNuUAeYf2JG0dYEwEcW9sx0xtmNvvKlzwlcDCoqtugv4FpWlGFVsVsPvV9P01TuyyeJmgwgkomlw8k4aAEyx4QQjCnIHuQXUGgS6zs3vKSVthPDuFz2d0taw7IUz9F49mv7xOS00IlH0hmJoqizc3NBw8eTKdTcrAprMBQIXM1HTiaTwpInbZxSU5mc3Pzzu079+7e29/f7/V6ICQDNR6NvIpzR8r5wfNOJpODg4M//elPf/nzX169egUZg9Sl9WAhpvcyCZllz0HWhW/chv09uzyM1Ug09ZNPPvntb3/7m9/85sGDB/1+v9vtkmMchiGW6zTSO43vtzFq0JhfyhEKEnZe8VrXkODP3yPkFDzXIrreeyP0jwiWnuf1BjAdDnq9s3hIMYssy43YNe9mZM+Yy6JmfafSz/XuSB9VVp0QZoZKLMev1QJCsollq8hbOHWD2blIs7Pzi9PT0zt3p1GcQPdWq6xYFewH5c692lZvdFLd/JN1e5P2jjuEbmRXywY6ZoriTYllgHenwCWgB6CyUM7ns8kYyg8GYTieTBZpCtXqVQqiF4Qq/Cnqs2uH0hi+7iiseaGr3Kimqd8d1zx4SDBNhpyBtYNlg3u9vtequiD8Frcg8QOYPzAMFVPO4CC6ZJ22AOVsZ8e8G79hYGG9aP2dm6keIZ88G+KqXp121ShBgH4yfobLW6ubpM3OA40h5vcrBoi6DMLcOX5pUtI1lkUQhulRS9g07v1qmF95PsrRqiiEH4Vhr9/rD/pRFA8Ggw4S205PT8vDQx/ZOAEayos0DQJ8GH5VofFpO2xa9R6/o+oJ0jzlR+fU73aeqwoV2+PWhgfJgDaRXfWifN8rvQICUG41wvqcJgpfWb4ZvTnyY5uKKEICiJAX1bfPF6nhSjmXqresiQnOJdXT4RpZtUZNFPOZSbyk2+1tb21vbW33B32KGGRpiiUI4de8AOVy26/ImU3K4liQSpq04wjgwR6Qh/v81lBglktQNrTG9YLNr3oMsf5OnR35J+tlNUmS1vdyly3x5XUmWHZv+Ka63e7W1tbOzs5gMBiPx9MpeNq0JZMzJUDHPF6mnhZlEbUiz/eiEAR79vf2P/zgw5u3bm5tbg0GUOMxDMMkSZwrpMPK/nN5eQnY4F/+8rvf/e67774j7VMFD2LWhgQqZfamg/45fU/+KVdGO2gCriaLx5DbTNI41HlQrSq6d+/eU2z379+/ceNGv99XNW+iSErOXPkWljmBDQpezJYQaoor+sa6/Txa1RwhUsrcFEDRG65E4NRWOsuUog9l1ep0uzlWHgwC6HhW3+AV1gSYRAU19tXk8d8scO+kQ9lMVUYn8ZA0WeBMDjnqRVHOp9Pzk5Mqz8oiL/M8R2BQUUaDgK5PDkx0XxmbMSY6mwe1KZeva93euL3jDqFsejywkaQqRPPP2vJygr6+1yrQKQJQHqktQGuZqvrOOpMHe65Iu7XsCyueosMXb379DdHoxiZ4MmzRaUdXC+Tked7tJJ1OG4zjriK9kDFNCg7myuV5jGKNmsZUwEazyKzlzea/vfkdr9tP0FwiXL3zqRC0gvjqaLBEGqGT2CIgZjmzYXYKsqiqEHIb1V0sMNAciJtrQ6ugzbLb5OXBLJyYp+QHfhioxLMoirqdbjtp7+3tbW6BtXp8dBSGwcHB6zDwsc5CBnTEsvQL8DSEYAkX5TOWmSwnWLf4HdELdqzYw1Txl+aJQCXt24484gQQJ/Yq8FavnkJkCVZOBWkOh9UeJpHblQ8sQ7ZcG8oQhK2X5hyt8c/6v7KhoKjaOEbvfQc0QfcG/X6WZUVRLhbzDF9WlkHtgUqXiWPQlWdmMJVIVhqTQsHEj/F/bch2I4dTvqxlL6OOyC3rinXO5wpSXx0GXKFJ03iKt4MK6QhUaaMsy93d3Xv37g2Hw+l0enFx4UhMs1voHJ/lYdjFSpJkY2NjZ3dn/8b+5sZmuwMYbP058JWzQkwJ8oPpxcXFN9988+///u//8R//cXBwwCUo+IHLLCPJiCO+XL0/Oy+isStKSVU+BZee55BBHMdbW1tPnjz56quvPvnkk5s3b8ZxTH5jnVTc2MQkALXGOdbmQoJsKyjKHLINvaVdYr2w/gwbi4u6Y9mE0zjUZ/ZZoapNPRzIL6gaESVJt9fbGPQPXqP2MmCHCjxc5dvJ4N1yLSve9rpdS2Ef9hemrxKLRC2eeV5UXjCbL0bDYQkhGErOrqiEhRpCmpFuIsKE8MugmMleMc6tLr+0Sp583Va38L1Nn5J4iO26yF1UWIL6HSSuAFtpNhpPRmPQ6SZ+FYSkcUVChQ04Atg0JgNAG49GFXhpeGaZKBWHXiSd2smQkQfUqx2KRugvUSHNp2z8HKtRDaDoxCCJEx8C7mgEoEu8jDKKl6/AAedZXslsWbd/VFs9uS+XQqOd1UbiCxkRYABc0EJ5kjbrE21DKjLatdPIpPIuxKWSXW+tLtrV5A+1u9BXojPQQL2igM9kViplkQhqqwwGg1631+10NjcGiJdHr14dTiaTsiyTJIHaC3leF8KGAeVhfXbOVWtgSauBucQhJJ9Q3enyN0aPkxc88QQRlgRea2kQv2uu3Myfl3a8cSoouiOullmh/B9tpAqg2TVJl7IVahfT/KU04sEb3Njc3d29cePmzs42vJo8z9JsOg2gZl2R5XmmUSYqE8tBCWh5AQhvUFU+ej4trxWFUbvT7na7VA3vTT2oRihvmUt2TfO9vlkNsF2KW0qY6Po9QTpp5Iz1+/3d3d27d++enJycn59PkEQNQ6DGbGz8wBhgf9Df290jpiiWflEF6BvfNYf5qerg4eHhX//61//9v//3H/7wh5OTk7IsO53OdDpdBs/y95aU7vInuSwwIVVqpU9IYqF5ntPdDQaDW7duffHFFw8fPhwMBlEU8WYMnK54/s5D4/Rpq/+IbCjrvb+1zMC6/cyaWb8k4YIb+z+1RhO07/nYdTxIjo+TbrcfR7FJgcYoos4Zr+MHVrK6vKTGz3I+wWuW16UkrDmdik9hGQpi8iBkgvVvFmk+HI4mWJ7eR25aCT6hWPTlHKg/8VDRmS4qSow59s3PbI0Tvml7LxxCjp0I5850dWPlNMRZvRyLcpGGAQigXV6cn56MJ5Myz2bzeQoR60LjitBHIWJDQ1PLXOgjKyENbQa7WTRagbT5DmgE4q4mHCLWDI2h2Hcta0/RooUSo1EcR71ut53E/V5vc2NApwfVfphQyKpqXsLRFgejgk1+ZbvLsgTmiuT1rtvP0htU5I5myGjVBy5zpB0+3SNMZTlReFyjN8w5lj0E/xFHVsUN+CJJHlPWExNDRm/YsLApuJvYg5hokcVx5AdAH8UChmUA9hzI3Jdl+ergoOW1FukCzMQoSquqhVQxMvigzBNVPMMBQkgpUQ3lOeUgXWkdlrWALB8HIAodD+UtzONRQSffwzRGlw8svevGU0tnQNqpXPZdJ5tJcWU7GRXfdAOqRsY0FD+0/JN60KqRHukUsguCYHt7Z2t7e2Njo9/vbWxsJEmCCGGRJDEqCQFwNcbykj5w4+GyqIeQmR6F8PpoDoRcxBgkZJIkgfpdWsyAy6w3Pq66RJAMjblT91VgYONgbIRnGy/AMebq17NCGaLx1mhFo6c9GAz29vY2NjaogsJ4PJY1HuS/nILIj3owgKhKu93u9/q7e7t7e3tJOyEhGaJcOjUV6cnTq6TSgicnJ3/961//63/9r3/84x9fvHgxm80gTXQ24w7pMEUdZI/vSD5tfsU8aTi3Lw/IQDGdMY6hLiVdfBzHGxsbd+7c+fWvf/3hhx/eunVrc3OTHkKEjXrXav6wc5GWK8tBsjqbwwZX3xLAWbd/ULNGq1ZitwY1j9wV8p18BA9yGOAwvp/nOaRAt1pJHCVxnAJRwqSyK40HtRcrTdindg9uLcG8r754myLKZDOJ2KlEd7AKqC43Rz2gaAYOK5pPLi8uTjvtLE0Xi8V8NgF2a68HpQqLIkARaYc/omUqlPmuw8k6Rin8aPxJGyOrSnms2/vtECrTCjPkpDQeUJN0eTS9qTMpQ70+2hq06fN8MZ/PZ9P5Yo7J9GJHQ9MWpFO2TBWmxpCjgWVqcZDG62/q2TVjqz7aBRhAZBtgF+jMpCoOw26n2+tC3n+ok/5JX6E5smIOrtiADCxIH7e2qq2H5T+yiWndRQKdn5alCMp9ZaiAPUAu+MlgluJG41bsspG2qD63JSEDg1GcQnJCyBuprHXL5NQt87kkN1Km8yF6DwKkEBQBUaVeD5Uhtre32u3kxctXs/liOBxmWR4nSQEgSYvyp0C+U6dRKS9RuWQGB73SIq/jhLWXpWAbQBFsYEQeRTHPG08iH+GSa6gX3MPn6pee4l6qJ6e8+ibWsfhsBGZtZ9TxppzZqclWVtAuHTUMwqTd3tiAcnZ7e7tU+Ju8lDgCth4FGVBkBytkAM8UDkUMR6aMyrv2Md+G3W5UIVKX1/isrkkZdYAmxwlswHyWeIyNXmXj2esA7zKgcsUd8TVT+Y08zx88ePD69evZbEbFHpw8WKcrshhsnudJkuAg2t7Z3SH5VspVd04qux8dLc/z2Wz27bff/uu//uvvfve7Fy9ekJvKLis5kBKhlY+lkR1jABN7G5nry+Xs+ScOSZAbSTGFJEm2t7fv3bv3q1/96p//+Z8//PDDfr/PfDZ+5sv4oo18vDr86/ix9Xo9TqHXa/r86/aPbU7mBcuk1d/4lfonCoiG7CV0xXy/3elsbG5SHjU6YEgawR+xhiyW6L3mtanrczaweu+V99pylWxMT6dcc1q2StQyzIsCik/MZ2Wh8wO1l0e4I2veqECwk4diUUb1aU0yFpYBX7PV3qq98w6h0egzRqT6L/5Enxthem14cRfM0sV8Pp3OpotFmuYq+liWkI8H0jJamQZVEXA0Kqez6aLYfSJppqYIjbyShtCOAPL4FA60x1Fw/AzyhCCGVhZApWtVnXZ70O93OlCSXokbX8m/FlXvralOu4bmC8DyXa35dfuHNE65kV+yTeN7PmhmXutAOheeiyDwgsFxFpXRboaVGn4icCn9Ah1ZMCEG/kWRSyWr1OnyS7urivez+Ac7cqTUUhTgKgCIgYZsp9PZGKh2+PrI97zxeAzMlsUcBosPNiI8KExIgzR41vhejhE5JmC9ifu0nENNgFTEWHmLWp5U3WHdHF4RVJJXoji02h5R/22BiKrxBW13tB4gUARN0yXqt2YZuMvIe/Ku6S2hc+rHSay9wb0NLBuoYN40BYA38MAYQkMIpthRq5qVGRoTqox5WeagvQPHhWg6zcpBEAZwEHMlJlXyzdpqp8txEWVbDde/0feNV3I9YV7YgJ4DhwC63e6tW7fu3bs3Ho9PT0/n8znlWHKxddpRAeaipEfVqpIk2dzc3Nnd2dzc5GIevD2L3LIfzgeZTCZf/+fX/+N//I///t//+/PnzxeLRafTmUOBNaM6w1RgKUTkeMtSWsbBb3n15Auuu82Oa0dAaBiG29vb9+/f/6d/+qcvv/zyo48+6vf7rFFElNoVfqn8YO5CCz+ugJQ1fGSM2zVl9BfarEjr0sINVw9Y3VsgE4m49Fg+p5ckQBnlIJoaWTXlh+ZrWxKhE783ztVchMi+H2VNq/GlOaLQwO5sVX4A5DkijxRVNZ3NRuNxtliUPeJ6+A5NSR7Y8VzVrG3lTzGuIlUN1pbnG7d33iHkeVZDzOTcYcdVcLQRuqhFHqpWUeQovNmaz4BXdnFxcXJymqry9Asq3YtIo09hDBbK02dlT9SxhwyagrFt67er74pNRelyCRoMrUAUo9U4CciCAzwSRZ12O07afcj0aCedHv0qa/IuaxwUlRQXC18V4qI6vrMek//QtkSLhZYodhSteFsNtWalO1ONUBktQoeGVWPw0GRY6W6v4t1qcufIt4iTur6HAdWFN0KUGL0AXInI1Ylh1MMLDEySVkSr1drb34+iuD+AquVbz5512+3j09Pzs/MSvcF0sSA7Mc2ywA8qKM6Clq5xh4Fo7ZzR5b3UABa+RvnE9facEafGF4ExahNeJBV2Z1xG4afL41vnNZl2FIzVRjDR5ayQNl+VfXkSD5RPnpEfJ/4tGarkBkh/if0EKiXv+0GSxIEf9Hr9nZ3t/f09EJXZ2cHK4MAjLcsiaXfQsQC/o+VBSdX5fE64bp5nPPuR9qOqZe8DwQ+OHwAbVvaK6yvKSAejjnk27uX0ih8P7KyAB+VIkdXYlx2H/6XqDrAudDo3b978j//4jyQB0R2q6uEQPpnTS28tiqJet0fBlM3NzU6n0+lChFGNON8LPLUlHQSqfmIShud58/n89evX/8//9//5n//zf37//fdlCaKDo9GIUEeWNqWFTAZTZI5uPcgiqQFyfhCjyezLWY7UVaqq6vV6FC0CIaO9vU8++eTLL7/8+OOPd3Z2MAkZjHFHU7SRKcqXUWe31r1BWa/HekdmpFovbt1+5k2NU7lWmlnacsME//Gq5A4qudtqZYtFvz9oJwmIxLfbk8kkwEQ6iNrYo4Br1y7Dluts5NqvtQQimoFUAhGvSkpAznEUaQ6izTC+U87TbDSeXJydji7PF3m+yPKyrIIAFBB9X2VXMkGdjq0KoWnLU8jJqDvVlFxrBWSrem2CXr+98w6hQS4MnqyWcjH82J1yZnYtekFjChIbptPFYgH5DyWQlHgqp3Sb+sS9dIS73NQ3Ltwn2KpEwDOH46VIrEBlVYGaPq1ikBoRQdZHu91O2m0Q3ENJxtXmkamjQ1gozXe1G9TOKi9v6wH5D23e8rBlM8VXgr6iWiB9BC6GDJhoHTyuZ8gaaiYUooaerF+vRAI1LZS2bkDbRP8xCWy1HnUlXEMfGJqgFCAueo6eYbKxARJLu7u725ub33333UHSPjo+ns7nIbDpijyAAtm5l4OPi5VZCFWjeyFlE2mDyjFYdwuF5dfICbWADlpSzcBkl00Zi+Z7riR5rUapvwKrNGfUvztndJ7nss8mJRsnAUe3o76jhG58H5yBuAuvYwfb9vZWvz/A5E+s9pYXYRQVBeC0FKrL83w8Hp2fn9Mly2oZFnQGJRcNpMMJY6uN7GVlV5wN+J1eRyb0xzTpw6y+5isPxeA51dDDsrRQgmJ/f//w8JBdd4dX6R4Bu1+SJFDKo9+HwoNJm4YVOI1iduGXQvqwrVbr9evX//7v//6HP/zh1atX7P4xgi2ZmQ7J2bkqZ7Hj75c9HAkGMvGVHywxjdvt9s2bNz///PN//ud//uKLL7a2tshLlLGAZS637C3OB/no5IdlUqLrXMFfapPuvUgR0rWVFL9eYN2rQufcVysYFEB3SNoJ1HQJA8oqp6xvVUoa8xvw8FpiRg6FpkBV0ynN0HVHkibvkDlopPObTqFMBJ0GURZl4AOpdZGm09m0KABmp5FOczHyPUwtULpKVbNqmSktvlcQhGU4rIfPG7R31SE0kQJF04CmCBs+INfO9kundQODVNViPpvNphjhBGBQQyAVrV8y+m5YSSLAYoI0dhn31WQqCw/kP3lJc9xOHEYE15MsKuHpeJ1F7ntRFZHkEyQQdju9fo/inVcXKpWmOdJYSgefd7zZtRv4D2+y8614FxL3a/rJHE39l7018Y1VrNZa/Cg/gBw+pUgC/9WeoeaDKtWw2gyPA9a+ClFSqU7RbI5Q6A8MCpEhyMXH4jjudCDe2u12NjYVgTSOo5PTs/FkMlvM2V9CFfzKryxpbBWLXfEqavw0vpsVdHFRPErXdDSgO6fsajjPU6NytbdQvypZAEOZENo3IyL8mzZZTs2h1dXnOqIFwpxJZUKwbWxs3LhxY29vb3t7ezAYoNgJ+BhRFC/ShR94WdbDGseLflUN+oNutwvuBxgT8E6ZGUtHBk1RRHSoGAkoHOAF8qR9JTNi2XNzvmx4FD+1NS97UT2636hZuuJoXHOPFMgA3ut2Nzc3u90uB02cw3JSnwLKgIELO4JyL5ahl+KizpCkffM8T9P05OTk97///X/7b//t6OioLMter0cyv7LsIbO+l3lTy+7aaRIesVZPzWV1sF9KHXz69OlXX3314YcfUjVFhhDlQRqHtgQtGyhwjRUIVYWeK3rL2jn8ZTWdCCfiqk6o1Ur3WZoDQQYc6kvDJBZFkADfgRJKiU6EJlUw5KnV8+dsTmXjdVrnEgvtlQsAm9o6OoJGqUqpUHFkhiiJzV9VwAWYTKcg55YDBa9UleCw6qD2kM2qJG2CxudDxj0L2GkveD1a3rS9qw6hhCgM/kBMNg1bCSoaWVtN063mrhSLLJvNJrNFdnZ+kaWLvCjTVImecyFsylSxQLY6NZs21QW7VtK4re918MNqDXwVJlVXrTCKmGYdBkEYYflgpAa1fB/kZCDfQ1NnBb4hz62sT61HqQIwzNnT5xQXKeM66wjNP67V5lBlwQgeS92Pkj/x9GoWL/6Gi/I5YRfzQbiFagjqhYr2omxzSddWF8FMGw2i8eXUIMRGg/U6ZhMVu6NF1Pf9LE3LqgqjaAc0Etu+Fl8C/A1y9KvID6Z6uclB60Ij4JTwp5+grIe2zAUSnxtsXJoV6ou0hhgoVZeCrmp2UwNUecpoDwBySW+Iuaw8eBvAVbZjyU8mqWGmA9WfHutdcD/hOpZGftY8AXMLdeObxUWDIIDMmDje3d2FKpEbGwgSbu/s7OzubIfI/2y1vDiNA99P0xT8isV8NByhgAJkE5JcVgT4odIFCQJgyGuSakCQFqQRovPpgLqNrdl2d/HbBjbg3wIe5FMwO7fulNZ9ntWHYjVOWrY6nQ5hfcjRNZKeXCKCeghyd+EaSIWl1wMZWHIjaRd2t+gDvS8iplLmxTfffPOHP/zhL3/5y3Q6JU1Rvi+p2CmfZ+Mwd5zPOjWOfF3nxpm3zNFb4oISttnpdO7evXv//v0PP/zw5s2bdMtJklDlRsaWm9ffJg9w2U+yWe9LB7ycm10Dhr+YpudOmb0vBL31zE3zKBlsy8crzFtBgOsO6i21WkEY9bqdne3t568OO+32bDqrIL8JMXY6l07og2VXp+w6o4kP3jyZEKuiCSshy7r+i7o3FgKVNirEUoGkkS4WLc87Ob+8uBhi7KdotarAD4zTqkgBtIBZ41qFoR3UU1il9OTrceV1e88dQtVEMWvtFhJMb8nScmSjcX/6L+yeLlKIaiyghLUSfdJWq/pXoOwybKsORYaTWOeu7xPKNV6vHDzSNBQjEHY+mrgeDMOr8G3VTpJ2px0lSRTDOheERj/AObG5NivhiRWA6cmZX0xu2HpE/jzdQj0K7PQ/9ZPewhoSliaN2YRtL3FgTv+TCYoyTVcvVnZeOg5Hdob0OllTMGo2j8zy5tIgHeqLjVdIFfswpD+hohrahe2k3e10YJgk8dHR0Xg69YCQM21BdRa/KEsPJwHQH61IZEY4qPr40jytr7hW2QxzeS5Fx2ad0ZGNp2wSN9RkgIWAIaNEPXvhfBpPzO4iKjgrL0yGnIQgrOghkg2I7F9yBSWjWHcOPrIxoG2aKLSQWxT2ut3trc39/b3dHdApaaMMJvohoQe4ZZEk7UWaggkP9e7IiXVdAq5jTleINUKMD0BNOhUrmgNyLkOhr6xD+FO1es7tss2uPA5TqemxUNkJ8uuYfMvl6SX8xSXjqZhHHMfdbrfdblONR1FNW2XU59iKori8vHzx4sUf//jHP/3pT4eHh2maUlyV8wZlIZDVecJOAUCHX0rmsKkaaqN2DnGA+gNVJb179+6TJ08+//zzO3fukAQrcwquU2zwypfS6LFbV7WkJuHaG/yFtQY+pV1cyVo+rzqYCghCam6cJJ1er9tJQKtFhzxoSOZKSlCH+fWq6szwjR/qtih/YUH0V964vbNmqYEKAHwuqyzLJpNJupiXRV6UlV8WITojWKqN8gk9GMc1mK9xGnC30UvjGox40/ZOOoRu9F0nMEEE37YvLVOzsf+Qni8MtqKYTieT8Rj4ogVo9PHiUpZKAgIoW3qJlTO9c2k6hON6g6sbE0S15cHXb1nWdJN0UMIutHkKK1mnHfteK/T9TjvpdDqgCBeCWJ86LA3EJawFTSHA/5pioFIuVV3UWvL3FyQ3qn8T/ht6jMjVVNpfvI2RvBNooQSI8CfWmTXGjTqFiSZYiYKmxJDxFE0k0JY25bOrBc/xFU35Cufsej9pilHqBTsqHjAY8xLUBUPk5CCHrtfbGAxAZub8rOW1Jq1WUZZZBlYsJl95rSqnigi06OpxDfHQFVRJdT21oSYegvM9HVzLfwo3zZAC9JORFUaMvMEyxK9qtmjNldpunpGSslOXpd8oH7ht9VJFAVjyTXqhCZO3gjDY2Bjs39i7dfvWzs7OYGOj1+t1ux3yHEMo+1ZmWdbudGZzqFMXY61IlHMG/JBowOQVFHlBt9DpwO4sNEr2vUSQ3hp4We31/e3M99VZavxBusQrDsXKn8ofx8ZH4HVK4oRFUbCeChUhZFeQScLyUulzlmXD4fA///M/f/e73/35z39+/fo162BzAqHDxHZ8wiaD1f3XgdoITJfuljwaw55EVe10Og8ePHj69Cl5g91ul1RqBXh+tUO4+qWo62pEXpoqGa6dwF96sxc7IzOrrCWtxrbafwHWhiKueDRGO51Ov9dTqLXnQeKgSIht7j/6a7ouvkAOKNacRpMltIwm6lylBjzEWlChgDUUJoRYXgkDDibn2XQ6nYzTxQIyCX0vAqVRWEQx9YGvoa5UXzujqR4nLm7tD75VeycdQmpMOGPIQWe6aQfG6eeWvKhuujgvkJ5n80VZVePxCHLiPVhCSPYwoKVCpAjL86uD24ucAx1YwMUSC2NJnhKLPZlf0IWFw9BkQSKiQRDGUJEZjKp2u53nZbvTiTudMAhV+KiqvJr1QOYau3gahDRohsD5xV7807o86M+mSUinwciwOZ+cCs5J8PSTQzS18w/Jr+MTCHU1wy91MUYRVpBdxeyuVh6FKdIoM8pGpLpGF0T7qVrPOlW94TE4f6MqBuSnIUgIORiYItXudHf391utVrud7OxsP3vx/PXr12EcXl6Ozi8uQfgkjvM8D3y/Aq1LOCVnr6GBayCUxtDsFcEgXWYXH6yJI8P90s2bSoYVZF0oB5eDPxwU0i/KChlZrTE+5V6aNLBlXFnflJskI+xyYaZTIgx9riD9DOpoQe3vMIq6nU4YhVtbWzdu3Lhz586N/f3d3b0+tsGgHwaRH4DTAnig78/TBXAaA5/C4eTAkDeSxHFeFFmWhSrtEEqHK1ca/59cF4bFruMySUOfzSxn6v478/qcigt8qU7UfwW8Rs3HOte0GaXUkqQK8ycpz5Pvl51MAvRoRxAnw2oTCqPIc4IsGPcLgqCqqvl8/sMPP/zlL3/5P//n/3zzzTevX7+eTCas1MJYn4SOZc+s+1Rc1qIOblgQt96dMWEodAmrIfQZSoaMYyhuub+//9FHH/32t7998uQJ8WahZolOPOZQQv15SjS1UX/I2aUuA1vPAVkzRd+FxsaS4FboZUt5XLbEWnOD6kcwTtGyw44GnPrNrSSOO93ubDYrIUwJWk3CBNVZddwzNQOzgfJVH0FKgZ8u3jbkRAzXWtGIkcIdWa/kmjJahZ43S7N+GM/m8+k89T0viCGtiaVBwaL2CnnN+kGJC9N2pzq+uhYTjuYw6doEfdP2DjuEMmSufRTFcmRumyx4be8sfB0iNJcgbj6bTMZFDrxn4Ix5aAiKYUb9WoEeei6nw1kmRYNXZ4LkhjfX2EToBQEb2d+FS4mbsE3MqIIux+x1uyChQRSZIAwDXJVprWu4sNpTVdmDuvIFx7r0Tnocrkfiz681EN645+hxwVwX6fjJD85PRpNGAnuylwjuKKeZkZfi9Hc1CGhZkTn4+vxiIePkRUI+cfSJmve8Eqtz+kbeXd2vPjd8g64KVDKAokmoL59Awadut7u7t7e7t3d4eLC1ufHsxfN2Ozk6PpnNF2EI5bxbaZW3KD6rCh5Ic1D6SFc2wRq1UtTUA8X3Y27NPi48FYyv0tPTeKV4yVedGosr4ptFtEYVOG7cuHY4xwlRVkDDfAL/YKRb8TapEE4UxwFCspubG3t7UIl+c3Nzc2uTpEqiSAn9ExiYJVmv253PZ+12BxSS4Sho6NvkKL55Sq1Bb6eS7o0p4bXSYrimv/d35vU5mHOjv3RNX4J9Y8ngZVIoK39yqqFkjTLJk+imTK3ka6MnT9bqaDT65ptv/u3f/u2vf/3r8fHxbAYY7wIgAmhcysJlLC+Bzq58EfJP90vogaaiBoGit27d+uKLL/7L/+e//PpXv97f3ye81HFK64eyLdere4vkiy6LKTg3svYGf6HNZGfoBVH4WjKhqVl13j0aFR9CTD5O4na7vbGx0U5irK0a+gGIY1FMsyGqZ6ciSLOUBd7kemKu502k783xdW+20pcwjRDmjLJI03Q4Gk1GoyxN6XrU6gPGKQWGDN6gya8GarDXM/sbS1x0bYK+WXs3HUKRmWM0MdjDMziH6a9LNQLJuK2qIsvSyWg0Go5KLSuq5DypahhJmZtBpvdrdvIsrE+uWKa0g7wGuR7Ij+b4pudzcMVUeoYN/MIrIB6DxlOECuOdTodIPlJ6u/FxMkzTCLmQKS6TytbtZ94aDCyL82l31kYB0mUHZs6ngARtg4i4oyZmQJzQBoFEM05rsR3LP1X+KPt/dNF8O1RuXe2p9uJsfrUDAhrEOQS5S0pU8/xgMIBq6P3BRn8w2N7Z3tnd3tzafP7iRRgGJ2fn8zmIYeR5HgIZRrlgdAplRyKipwJRS1rTuBP+szX8dZhX3aLz2FmTjYiZDkVBviXbLdZHy4vC96CusdIpVqiiw6vXej+obmPNTDZPj/hLtrGrwmXKrkEXGjI2ozCJo06nvbW1eePG/s2bN/f2dvtQBKTf6YDLR+UiKc8wz3OYvjrdSTJJkliXQQfRLJrEsiwDo0NzHbMsI5DQrAtUKlPgOW9HL2rUGn2jva6D4F15NPkv0xSlj7f6FBJM43IR7AWRv0detARUyTkk9I8rE8orcUDFPM9PT0+//vrr3//+919//fX5+flsNiNcDpQGNV9UxkEkvHzlE2iOcwmvkuFEqVzKuydJcvv27adPn/7mN7/5/Onn+/v7lBgpd1wG3DUSRBvbagfP8fDXTuC70BrtSo0YiNSaphJ+drNUuEDutoygNj3MkCHVEvMwU0mXr6VpjcAz5xKa/jT/mCvXJ15+e7K3u1ES9Z/K2qwoOKJUzueLy8tL8gmDQFXMLssW1c5w1v5lBroecfhfnceEeS3aQNC+7/K7WLd33SGUUTaOe7C5qHURZZW8WmUzWqJK8PTAA8yzIlukWdry/Ml0nmU5pc/w+PRF9oJPdHBd+lAQ6Zi/xbUN1eWu7q2NQtWm4ASeDFXnVe8HGhtVHtRiaMSIi+KIPD+gx5RF3E40yElaCxifqZ2aToXnlVxzHudGbdKaFdYj8GfcGrzB5eKi1sZVs/lifWDqqYEQeTd19pokqWv5aQFbHUrV7qUb++SkOnSBzC/igODjUCuZsaNopfZzUANKcQiJlQroQVK1vI0tELrsdrtEhk3TRdVqnZycLRaLMIzSdEHUGIqtKN189Ksc3dFmk1Evd3X6Ig1MGVDSs5n1TqxwswWPuU0s/67DWFFqH6/AeFhGeXl/BfCqbxvoc5StV/MG4QOFnkikIwb8FVRh4ijuD/rb21s7O9u3bt3a3d0FZdG9vY2NAeY5t6MwIiFSlJNJgHy4WIDeTxsEP5SGJArx0eTGVEZycqALgE8CYtFFUeLRlM/Ds9n1pytZg+4tvMH60d7oCMterSYqKyKis2Ss9lIIoKNOS1tSJiHjhHmes19E/FLaLMuy+XwO/GrkVZJHlKZpCFGUIMsy0iAdj8eXl5c//PDD7373u3/5l385ODiYTqdUf2I+nxP1mpFbYvnSHdH3jMJJN77+APkC+L2wB8vpf/wZtfvhBimgsLm5ef/+/S+//PLp06dUZKLb7dIBydflHELn1Maxx+QRRzvqSv2hZbPomin6zrS65aYne5OWzQJ9K142jj7VNyCDPcsHG5txu42K8eAhhlAqFyijvu/hagifpG9mH86w/a9w+hrpc4K34mR70BeO1JNK4IZgK4wmQAizzGsV2WIW4gIHpjZr4WAOBF+0e/naqKAHpgkpVolsbXYYJHT57a3be+AQOs0skMxuVJ2YHBs3vIHoPMRauKgXbYbr34I9TDUqZIVA+yBCQ9GyqVxjoi6NeNXt8H91zTDNztMSHewDO9Y8sUYDP+h2Okm7Q0F3klgjrpC75jlYkX5mGlpRHECCBBo53+v28286rCBwN/29S3esUUalGIyTSCZopRyoY6xPsGhYkwa7rP7A1FNdI1PsZWP7tIV2G5eo3bAb4yis1uwwCtyCd4GU7EClReCvnG6EJi9MnnlB9jHAa8ozBQ8Q6aMFFbPRK+aSynXm4dtNDEZe9czutaOZmWblRLKUvkqMUzV1uAQmtmHEmxK3wJfkeDh2eJiTPtgnBFlH3/OjGDztDlaA3Nra2sGyE71eN0nacQwoILnpnu+HyqwP0BtMOpDqBmY9mBuKRotqPprrSO+IACgSucyyLM8zfdmrEJvGtlpW5Jq7v92+yw5SP+CbXqGkaNaS5zkn1oB45CDRNmmazufzNE3pz8ViISt5kJbgaDQ6PT39/vvvv/nmm+FwmGUZJy5WFegNMu+U+jwXiDciscJfaiy5UccJ2Tnk6ACHe1gElVzcwWBw+/btX//610+fPr1z585gMBCQsjpL4/PkK6GRYVjiopM0UkDlYLkOZXTd3pHGKXn1132Nl03FdbxWgRZcGUbhxsZGrwsciigKUwi/BBiFxKp+tmkqTi2JN+bkZow4WFwtWqbXJPWHQgrEoeSgYDYLLc44g8A1Znk+X6TT2WyxWOgZBupPoAKGqvdUlohScHVdAajwv1jsTcSy1U9syaxH0HvtECpkTvYEjt5x6FwWnloVOmVbDhYhCGdOJ7PJZKZVy0DDE6UFCUfEmLEqSNhw2LoV0CgGVY+Ayu0dDowajxR70QLzXHCGeTswYIIgV0BfN8Q0+i4UEU6guhdRrSxfUo5vhhM4Y0sNW6V0iKlXelunkPl6NP5MW50FuooXes036Sp+St7/yo1t/rTYRLFJSdtWStI4utJ1hEeXvDduDH80CZM2C1pDWD4NZQSxVBZsVZVYz1xlSUG+oe8jRxH8v9PgfDKdLRZQaS1oQWClqlph6GmTkUZ0g+7iCkEpkc/rxFlcB0w+Uz13NEwhV/shbmCLiAfOq9PLvNnMCgdI55ZZmvqzoelpu9zH5OWw02n3+r1+vwdZg5tb29tbg8Gg3WnHgN4AiVHPTyyjB0lfUJ4iDOM4ppMy8pPlQBmtSpj90CcBN572IhwMeY6quuy1noz9GOuMwTfaXX52oipX2oSrwUnn4A5ctoIySp4YQ2H0pSwQT66dpEPTG6QNQG5tNkvTlLahYUKdfzabTSaTi4uLH3744fvvvz88PCSPkU9EWYh0qaQuI8U8eaWWg5RXN8dnq7uIjnPIX9L3wD1GzP/OnTuffPLJkydPbty4EWCH5CqFjcJUKhtK6K9K9qllW9s+4TK51PrrW7d3rNlrmTtvXD+CQ1x7sNnAtPN7KMGMqe4RpLRHUVbkiqOmsTIdtlfTtJ2upI/Jl6nKybuRyybPyokYqmOpPegvKIgLViKKjHq+D/L8cDC0GbOiGE9n48l4sZhHSbtV0ZxQVhCEVZnyIgQsfTyN7wglHs5lECKI5p+1Z/h+OoTWzGtS33SAhAfklUORMl8xzxWjmGk6Ho/ni0UURbPZjIKaqiQFDE/B8LZD/g1zvF4SWB6Nr2TZqtBwfU70UUo4UnQFgypgCWl5NEzUgdq6PtKBMIMnSGK1BpPNTULitYvl5U19VkNS5Efq575cHXjdfk6NnSKuYGlAM/HiDOezhhrVkSZJGbUsUZYb5VxvHp5NdBomhoqa9Wo3vnyRN47rjcUmtWRXoKiRItCY29FCaCbtpyEwr5EKSFCL4qpVpbiotTxve2cPywSnc4xuhlH46tXBHLijkOHmtxSEgv8CSxWT+hTA4r4IHeZ01Dv1BSuDs7aHtY1G4Jo2v35zkT1VSpIeM+T7y1CP+llhrtrc0Us0at8QNVe4OvDfIOBKp0jbi8OtrY0u2TW9HujIbG1ubwM8OOj1oaQEvqMwjGQOGGTQtKooDBIoQqjQHgpNVbowfVVVkU/SoyGJgFUV+ABpCvAUY5XcUa/jjNU//Bgj/pq1BBv3WuGL1rmIV94apQISvleWJajBo/gnO4rkO8nC1iQois8zZaeOClf4vk9R/zRNJ5PJ+fn5wcHB6enpBNsMMQGCB1lLRjqEDv5MZ+TK8tJDk49C0kQdl4wDPXSQJEkI6iem640bNx4+fPj48eNbt25tbmz2B33ajFiv/AScSzJlGHXUySkw40BA9cBTnVMte8IaG3zXmlg9GxVoG/uP29C58n0vz0APIorjqtWKk7gFkCBGEHHWJacRwIkSq6NhJIziaSbDR5/X7pY2k81cfGNvFPIcbPjp2+DkIkpfovPQvAHkcNBlBKN6Op0A1JJlRZ5VYagip2XlBxqz4SiPkVJUinREJmKqEOKE2g9FN9TQktaj6X11CKGZedYMLQbLmzZrasR5psiESicsq8UipcoTADkyhYuVCvRxV0cjyHJdZQrUv1kFY7K5LC0MdQSVQ28ODBdO4Ean08WkeeUN6vh6gwK7EPxnTxTzDXkmMVPMeuD9kho7gcqSx1JBZMoz4MNOlFNwvC6eaZUcEIXp2duxqcXMArWk2CyP1FydCHDigUS4kBZRVkbF4k6mspOL50jv171+1xnTt441RX1A2SEbDYbKoJUkcRgGUdLu96FKHhQ4eHFwOZrEUURWMpw6hzx3z688COY2FCWzKKOCbCavQX+Qy5vzEs2WPwpkaEIDWalnOdFUYYbyFYMfSIma6k7V2g3JLRS5xrIckOCH9kEUhe120ut1QSMB1I877QTKGMCzE54554O1PA/yACGwBf+HRedR20tjR4RrkbOhbXjwXgooR5FC/qd5XKtWAetO3zZvULYVNUjetDk+huPZ1t2PFYcirI8+4yPKuIh8fWPWZaEnnIJVB424o0QBJXdxsVicnZ2dYhsOh+PxeDqd8quhf/U7ck/B75GvSt74ig7vgO1OHQu+3zzP2+325tbmg4cPvvjii6dPn966davdgXqDDobfRPbRdANtm8pzORfTGGyqK9Aso2Gv2zvbZA0n2QFWqHriclK2yKir/CDodHvdbrfbbl+GIQvnFjbSYPBJc2Aram/RyyxYTV9PUyPOjlBQNceyN1MWKawGIPqihhYWJGwtFjB7VGUBFYBVlSZIOBT09RZUCubSMtLQVENPidlryQ6yD7A04doeffP2DjqEbiKU+k6rI1wzsquKsIAFg6HQbJGm48l0PJlwuoDKsuD672S4YOLRCn4O/cf6s+nqnb2sA6pOXzMM+R71qCNSK3HfyqIsfIjjEmW00+0C/w05WNoeXRJOZiCARGfQnX1TJYZ1+zm2pnIR5hfRVKn61WiDSN6TRWnVTxxS1MEZmuS5FAQfQBQUUheG3xDCz2o0ejXgUxstFD6Z/rGRoFUnzdr9WWILLKBNfNEcuI7hHmQRhqg/OoCEtzh5efD6/HI0nc4Ip4KCvAXgFSWlTgjZ8fqF1U1D2+TlbGf3PiRJ9Mf5Ko1HZxrRdZug84E/TB/Za0WtKw/zQpRqqO97IKHe6XQ7aNsAiQG4oCikHlQQ5HYRPA/r11Pac4BxZXQYlKlNKqPkI4Iaiu9T8XqijGZZtsCmU8vwxVyPssVEQcer/5HiH2+X8sef5XHe9BQS8SO9UOkQct6gJ2psEgSXgjCgkhUFBfnhcIRtgSSaJEnKspzP5ye6ETY4n8+5EiAdXyrHyEviLFDn1hr9Pefh1KF4umb+1w/8KIw2Njbu3rn79LOnnzz+5MaNG512hzYOAqgls4qXK0Ycd/hlSOD1IeXGtMN1e2ea2zes0u0UyIRPVvC03hT65/kVhCk7nW67A/XDoigOMKuBDVEySvGQ1qkEq6vuFrJO9bXuRcEhdpelY1mAh747H21p9n4BYsny6XQ6m077G5tBpQrGiuVGB0s57ssXoIQUKUotRRzZzMAfMA67NlXfa4dQKIjSn6pHvYE3SKA2OHwFRC+81mw2HV0Op5NZGPqLdIE/lpAEg/2bSC96lTYVLlZ0xBXXoOlV8k91X2q+kBVMlf6nQPtF9kVA9ZrR8IpQz6/X7we+H1FB6BaYYi1Ve40nLBcp0MoiZBPrh+n4C+v2y2zsDRqyvmxiwbLWM9t35G3oN9N3tcqL1vU17GMKrptSESrOaMapOrLx+GRdX+ztRrzX8hXcekpX5e0Yy0/hlA2dmegGiBQC4qQEToJ4sLEFTksFGVZpmucl0LDBOamq2WxG0il5Dnm8JUwjkFLBCVD8GLWjaJ3ZnsHggckf+Xm/BedQrv81O5t5FYZV0GwdCAaU1gtwN6nRj8iXAOwIo1TExm8h4R48Z+RltILAbycJVRcERNGDiYqfDD+6Ii88YPICO1Q5AJjYCVRSBGlJ2o5ASPIYyXW5uLggb5Bo/9fPA1yR9/Wm7lz9CG/UnP7cyECTG6+4PHqeJPhJbTabTafT4XAI5GdSG0NfkXw81u2U1eTTND0/Px+PxxcXF4PBgLMKLy8vz85Ahrcsy8lkQh/m8zl5gLxISfFPeVV8Ojn51B3gOuWyXlaRNUWx4CUoQg02Bpubm7du3fr4o48fPny4vbVNIQaqwxRqvKXxyde9QTmTOFC/zl5x7fu11/e+tUYutBXagL9gBjPqFbXGniOK20NKAmluRSH07Xm6QNkZr7AkyBRGR7uZQvPauxRYpV2d6a0alypqOXKjRBn1AyCP4Iy9mM+Hl5eLxXyeLuazKU3U4CiSC4cHIAUajMWKnCh+FErThtxbWZle3aO2SdZj7T12CCUrw3xQ8BZucI0uD5izJkay1jaGTpm7QuaYPbA1+m6qynCEXxz8WvYHj2Ne9uwkLreP2zVAuRFllO1coOj4UGGp0+0mqBVOy55Qim9gyPhgkOokTOts65H2S26GpVJLIOTIgB0B5Jr11kGqJa4XJXcLeVCsEGQBgQ3mrLwGfX2YmM5+o0kQ0CEMAzFyfKSRnGlcIEkiLUvIuKhJaHKjgY6cR1DEJkZcGLU6foeqGpDFCWm6SVSWxfnFsNVqpRkSR5UX6MNpEMcCuB7jpOKCiQKjM/F0WXe2NvHu9ZMwq/fboIKa8229VvHTtQoRq0wVdWWCt87WuXUIrfWlqu3A7YNLhtzabJFnKSh/lmWhCMbCqqaykE7SC1j5EA8HTZpOpw2gk2JzGPSGdUEYbiKFLdK9zDJQxeTHeH3K6HV+eruMxOs3p7aBdIrsR9cc3agfSvpg8/kcSFy6cR6dfJi0LwFuVHlijK3f70PqJirKUKmJ0Wh0fHz8+vVrIo7mkC4EjQ8iL7VuIstLdVx3BypsvCPn+OzghVjH8t7de08+ffLJJ5/s7OzQ6mdViFlukTs9Ryr9NF6JPJok99bfxeqXtW7vQDMdQMfMWEJaAoPLdNxg7UBrrcQ8hBDR+G6n43sI1xsHiWOm9EGlHFjwnVxmXRXwVU134GY/y/mOUwCrEn06FQJSzPMiL2bTWZ4usHAslXjT1WtptMLKjNi+1iLgMGSDoSBk0gnEIELbur3XDqGkqRmbT2ckKSmUq0weUaUMSk7nlHoC0QwQSaPdEUEkFSWFg5tzCZ9QXtN1b6Bpa0oKVmWd9X/Mb8KUw2rYJvEdvgETVkkrxCjy3u32UFrGKKMKJ8B9nGTDs4oMede1eqfr9gtsS1YeSiZs+sEmml63SfEhWgVlJ7eXIemm0irHQ0kRRMTaIGil2s80ua4rKaOSwmoFU2pFFygcA0suoIRcybQKcshn8weDzRbkdQAeSGYllK0/8VpT4MW1qqCEiArEReHYQCJVHrhKfRejWOvu6BEu4kLWo2Fuz9twRM3z5WO5tuzK+UoJFzMfQoOcaglnmFcTMs31V63Sqwi/qaoyTaGKD1Qmny0WcxAaKYuiKkvyGeK4qDDPsOVBOqIv0puJ4kiKo0mShGFA8CA9OArbMeewghkPioVQdK4oCpS+nDIH8k0fY6M6qOOo/H0qyNVzCOuXWoe5nA3YayIa53Q6HY/HTBbl45OCKFNGi6JgKdE8z0lKtNvtLhYL+nU0GlEC4atXr87OzkhLRtauYPSvEfRbVoCBH+8Kf17GQ3kXinjSr3Ec37t375NPPvn4o4+3t7chvlOUFOVZ/TApYCGpwjqZwvQBWd+yES103uCPoXmv2y+14YvHsrhMaWEsgVOClvlbNP8CXyWK4wCVlpVCryZ6IPe7pDwPOp0+p1nyNdCo6yypOOp1e6PFZ2nEJ7BxSBOVZwDvk3XqibUxnU2BYINcj1arCMKA0g1x8IA+ohpEVuKEkbHRrCKoxK0RTssTXNfzfK8dQlnhU/t+Atq6XqcnUmhRQGZ8WeSj8eTs7CzNsqoEe2KBGtt0ghaYOEgZFWuAfT0N3REMRy1+WG+aTy6GnQpyGjV6FQxS59DjGz8S+A5luJDbFuFkATqjcdxDxnm33x8MeqjVHqiaL8gIZbKrrJZj4CNdlY5hmXX7xTev+YNTqr5OwNbb2uXs7Y2N66hJUzgWRZBSb+cYfJZHpvZuuuYl3xhHsdHkEhkV2uVQH2iZZuWbxmGL6y2VO4dZAsroRVG709ve2R2NhjfOzyfTSYoFS+fzGehhKgJMmKVZGIaFR8seDH9BFlKDGl1EODmNNHK7BHucn/CbhpiaGiOs9cWyFnxlC5zEp2Q0ilWI9PMhfTuqt6H25adXFDnkcAUgKQkqlOOJ70Fdx9lsukBJEqASpYt4ESdxUqCZXoFl41W+0foHwwInN3ieObwCfHSYbdiCI+PDwaIgFfD5FQnC99J0cXl5eX5+cQlUJaV1SYetS5s0vnrZozgtrc5d/JvaHw3ZEE1cVkUPaQKvqEl1UOZ5jsdjz/POz8+n0yndoCxYT/AaJdqRDie8gqK4uIBHGgTBxsYGFfG7vLx8/vz5Dz/8cHx8PB6Pq6oaj8csXiq7BJNFpey2jGaaLUHjt2H5lssuqZWyN0iU16qqOp1OgMnznuft7Ozcv3f/qy++evTRoyiOojhqI1mGt1/+6NXUpHw/TJGVPuQKxdpGt3DtDb5vzQDybJSqiB+poxBaCBYZMc5qgBuAhAX2I8xWKJM4KkuIcbSTZDqbocXn5bnuqZTsQMEXPpklac1JR7V11r7sRrO2Fjc1zictHkTjZ58T52pIoKiqajqdD4ej+XSymM2ns3mUwPxPMhx2GTaTJGFOLQD60kE+WU5ApIn92Nf23rR3zCGUBObltdVrAon1JnBFkD8CpksKxKY6j8XEDQWpUio6LZv3r76M2n1QIXp1fWyT85Z4GgQsNaungtouFDLSA6wMg7DdbiNlNAlCsJbI19R0csue1mFmCvkbBEM/y3V7t5pE59RQseRGm3VQyH+xuKO6u6isb/VBqWDLIoGryaJ6A+V1LPHQWBCGadvWAqZAPfWXoeVwXF/Lkuk75ahI3bbjJQfZjFj33PO9rteKQvBAgjCkLP84jjzfOzk5hyoIeZFmKYxHTC9U5ZLAxWG0gQmkgmGgwsQQIpX8HO1lqTt7U5PSvqlGq8N+tm5lV+MiSi6DrTNHljGF46T6pdoaGbPQirKcL+bTyXQ0HJ+dXZyfX2xtbaELUswX815vUJYIBmqXBulD6g+68hAEXsHI4HAVuosKgCLnldFCAq/m8/loNKIcOdrsSm/QeW4OG7nucf3tYtKS4SldUHlhEphagVjS7TOfNs/zxWIxGo2GwyGrgMrbcSipnH9YluV4PD4+Pq6qaj6fU/GV58+ff/fdd8fHx6PRqMKUWkodZK0a546uvAWZZOhEGSQ/1nHIyWWlV09H293dffz48f/9f/3fn3322c7uTpsoxwLuXvbY7dwQmNBKxC7UZWietzWP2UeQZRVXv5p1e2cb9RDsQ7oyIdYIY5+HF7SmvX3fw/iY+hNiHAnoM0PoH3sTmYiqt6tRZpYKWtaVArg9plQGEGsTLhmVTltRZ0yMVcgrINsUP5QtcFGBU1OWVZrli/ksz4mAoGYGUs6ho5D+nBrgNlFVrU9yoWefUEmOr0fWe+wQ2mahNdtaJLeV+BZP2SqpzvdK0qajyrtFzj1ScZxaEMImJAMwawbaxNG4XaOD8qpD24uvNXpnJ0CZX5WBVlWgO6woM2WrgtUuDEGvDynaVZLEvV6v0+kAZRQ13a91YZxh9TaMwXX75VBGWVR25VtmixBrA1SrmaJ+y4NCdqr/1Nj97IlRBVo2zuzwoyaNsoOq1j/G0pZdhpTJVJa0Fk0126jieUJIu/ne4UvSOwFNprgFGCHkuYHC1A6ghXF/MNjY2NjY3Oj1uz88e/nq1evpZNrKWnEUUeJaFAFiX0DmPyGCxkEiHjanL6OTaAKk+skvZ9ter12/+J52fd1ixXWIg512M3eJEm16Y3X9JDCjNC2RODqZADZ1dna+tbU1Go2SBHTztBIPvReTbImcBrCtQdnL92FeKwEnJKAyz6jovBGoJMyK3UJSxZxOp4Vgjf7IGoCNsNVPiBZaNEXhn8jrabyk63gdLL46HA7PsJHPxvRO2VsoFZMbOY2LxeL09JRSBz3PG41GL1++PDg4oDoTSZLM53NC4S4vL+X11+twOCReif7Vf+Umy9lzpXtCOKknlGUZx/HGxsbjx49/85vffPLpJzu7O37gY+0lBVQyENpMGVUcB92ZnXEnQ2m1F7fiza5t1veq6QR6CRPrTGw7j6/u/yj7TgwHqCgdQs0eWlNA1Rn3hRgZxl8MlUQMGSL8W2EUdXE6aHu9NGn3S7s307pFsqIm0AmmaaCF5mB6yZCYkC7SAszpkhg0SLmjQJtx66jMonySTc9XmN48Y6w9w/fSIeT4Jf5BTFEMUdPSo4Dma7H2q6KANJSqKmezeZ4Xo/Hk5PgErZBWlqWgPloB8wmz9Zg1ZElWWCOZfl66ntWvx+3A5AKWJYSI7KpfAiTRXiBYqxiKQYVRyDz2/QDyj0FnNGl3Okk76fZ6oKemyjqbY4rrJWsUKzESisJ8Bm2Wvdn7WbefYau/w5pl0ziZGnvOXgiYfsL5b7p2uQ6MUr9qpIxKqqhaA8z8zpEdQxrRZ6fRoC1H9T8umC7hFHMQwtmQKVrBOlVSBIjGGOmbETKxhADG1dWhThL6gzDCUHcUZGaCOIgSrJUXBz98/zwM/fF46vt+EseQZKhI3RQShUshArmIXqn4Fqck2Qy6ZsxWvoLVs1x9IqrdplzZaQNFVW08MDJj2SdXSJ28GIdmicShCuyWopgvFpPxeDoZTCfj+XxxdnYRR0kYRmmaRhE8gzAIUEpB82zxWaFPXs2mU8pnA88EL5koglwvxOhmocW/WCxOTk7Pzs6gygLr2oliEitafbNGx/in8gYbMcBG79RJfqtfoZNJSF8SKsj9isRFJ5NJEAREGaW8QTpgHMfkaBHgxrqgVIbe87yTkxPiZLZarfPz8+Pj45OTE9p4Pp8TJZWcQyo/SKUdpHfNd+H0T7kBPwqJtpl0f/yXSK20DeXJky8ax/He3t6nn3765NMnW9tbVOeEZh1YCP2gCpoLP8DYVLC8AcTrjp/zdur5hGum6LqxLccrI1FUUDVMUSpUDg+LFDq7Y3yOelCW5Umn7fteEscdKD4RQhIQUDLLBmk43t94WLoJuF1N9Kwpr39Ydjs6mVYhn4ZYQsuk7TdSpneFlNG8ak1ms4vT0+lkUrRaWCyoComMRiQaHT0WF2ldsr4RNkqN9jiRbq4fFFu3d88htDRRFBQhdFAggny9piXxVX9CLs2cajMVsIyRAilRrnks4I46oi/xhfoysCQsLQqyNVngyuxVnicmGolsYLUJ/ZeCMm4wW2WVxFHcTtrAakviMAgVYdQuSc+GvuK6UJ7VGhh8f5p8zzZa5tSsr/uE6qPiVVXWB97LAvQ0PXUlIOme3fY3OA6kQGw1OlRQvwEQk7MFIZbqg4HjyApFNZl6YzsbtBhxY/Bz4hjERn0/6HS7g42NXq+7t7+bJPGL56/CMBoNJ4s0VUw9bfIq+4DHqEh+8MkfxT9J9AK9RyPI4Twc54ld0+5shLwaAJKmLzXo53ogy06tZdNJOE5VcM2ybDabT8aT05Oz7e3T/b39zY2NdJHmeeH7he/loNaDVQ25Qocqaw7zcZ4uFmmagcAXaGZp4pF2Hri2AeNdWZYPh6PpFHRl5Dy5+ikJbtXS5FI5w/9UwOCyhUNCoHIwOpDasgRC3leKhc7n88lkQk+GSxHqMo/q7Pxg+V/ytOfz+XA4JGfs4uJiNpsxoVSekb5xvnSukE7nPPA6NrssUMVEOCqbwWO/0+l88MEHT548+eDDD0hLBjS3IapbBi3QJaqT0nmychL+lz1SR0JmRW9Z+4TvdWPnhcmNOne/QaBF7qeDlAXovkM4Jo7jbrcbhJDyQ0RTpH1B9VtbkMy2j2ky14sLX411GiUe0WCsmrEp3E1GQZRXyZkVtVFMKqOwZJZlhkJWWZqqyagoWxHuqJhr5vgmJ8tazeWVkEWsrlBaKev2HjqEyixszK5RhSzxI4MYzUNPLzzK9PA8khglyWxlQ6CxiLozio5CNqUuVOFKjJpFXcQtRNMMa/t67U0McMPoyRLXUdsK+kZ0KgjcC5T5are7vW4cJ2EQ0hrYNGZErJ9yJuiPdazl/WlNfuB19mNaKLmFSzZq/unqrsVSnFx3iO1glZevLl5UsVcR/aVyozbkrqO3dD3Nbg9toBRWwIRFv5Acw5bX72+EEWTqwmrd64WRnyTx68MT3/OHw3FR5sQ/ID0XdGSMgyeCS3ptxXiMH/heQekmVUNp4Dd5yI2P3eykp0fxKpZ5dw2nxJSP1eAkxqygBAecI8QJapGmhA0eHr7e3d0dDAa9bm82m1I5OAUqQmiZeJ9gOuR5gcrP6Ww+n82m+BM8RmYM0k1lGWj5oPWvS0BWJaJho8lksrOzI9mGq5/SapXIhq71k1JGVzBF3/QUjp/JcjLj8ZhyCPkBsvtHT1U6ooTEcmoc1fOgsAVBglI8hj+zk9noNTl+rBtckHJQNXiQG2C/+p3S5yAIut0uZQ/ev39/MBiQN0gFFVe48fLxrnjONrPBfF7RW9YL6PvcdLDSoIXaODWWq1rRHCRP/0TqLMgYDZN2TJK/PCdraLrmyNmLwrKoBs/sjFAudas05GL+T4xH4wHSlsil8csKNUSp0gTE9ebzdD6f5RkE9QIUmqa5R9Nwll6eKYomiE3qH5WyqB7aeri9dw6hYWRbfzrcNqVHgL8063HTb6iBC0vgfL7A6OniYjiixSpLU7Tn1IKHKyIVpteLgUEzlPdpPLQlxpVjatB2shObTGGTvE6BGGMCA3cIP0RhSAxtLNgVRBi1xUqmYVV5bdC8aAdhgGADXE7QUIFXjSI8kdKJUhdpVKnW7Z1uJl4I/3CBOEeA1ODStmVsKCcq7dQKhShMzE5WlJbftaBosQ2HMQ2KQgFDQTpx7TOG9NXo0zqo9KtnuTdMC3e53AqLCCAhF5OpWq0WDsCkrPo7O3vj6XA02T0/v0gX+Xg0QwWOSeW3ggCdSE4gJD9HrWNaBUoPe3ShKCQMTEtjPatgzU8ZBJVlprRUlnu/NbYqwHeUdm0HcClI5xr3xtNA/yHP8izITs/OwjDY2Nx49fJgMNjo9fp7e/sFoIRB5vllUBY5eNKtqkqzFDmH2Xw2Gw4vy7KKIqDpUjqrqqajT89l9DyvNV8s4hjy2ShrjpJYJOS1emarc3RX+GO14fCj5sxlCYTyeur+YaP7wdsQBojwLHiDxPOcYZtOp1RBXiGxmDfIj4igCdIL9X0/z3Oi7M5mM8pBoMgp47RE3aSz05eNzEz27ljjxziltABpjo8j0CIPwmKhmDkPQRmoDhonnU7n5s2bH3744c2bN8mMVrVD0SHUymoNlrfznI35LidAbX6rMSuoELzxGqxYt9Yq1hj8S71NwwlceN000rbISWvZa2VZAdKAgd/tdfr9bnIRQ9yw9MqMSM4MGmhKOR4fBJlNsrrIUHf6p5q8G3IQ6pOezEo0kR3hUyrED6dpWknLIpul+flwPJ7NfT+ETI0K7FW6LiLBmTSTJbMos2nsK1c/Ldtr3d59h5AtNsc8ksuk8NRWWp1SwACl0tM0RQ8Rl0Yl6ERuE5/FJbw15QM3XvDVGQUyiZ+BfvW9MYv5aLRYmaiMqhKGwyOG1ZFaEkWQ40QZxpiQUz+xstz5dteM0feuGWTaJnYakRfigxoPsJ7eJhmezjdGibTppNe6QH1h1kLVlOTDDq2PMQ7kh1oxF4YeJUNbc1HNTZsji1r2NN4BNoFqhT7UTfeDVtUCZwcYj14cgfriwSsoZpOmujA6eIVg2kLMiCFYQb41/9VPy8xivocL/U/vFDLVYpmKKdsWMhhsnop4oVqFyjWI0a2lJR++LQooPzgajU+OT/u9wdbm5tbm5nw+T5IkpVKEZRmCNIxpwBYtcnJDibsrooGKVUsvkoJ3iCCCg0NY1nA4ms3mtA1yKJCSuqQ5rgKHAuXtN3qMjbjim2YPrgAh6+Kf9htpAND4yCwummUZlR+cTCYg8KA7p1OKUJ7O8TnpUMzPZKYoe3TOVTV+thBCnFhMVqF93xJCZACTv+fkRm5RFO3s7Ny7d+/Ro0dbW1vcQwjkrD8iB4BtxPr0ppT9Rd9asS0rb1Mcfm2erpu7DhIFS+XN2a1uR6ouBLv7kKQAqhAYQ1FpiEAngeoTsDqoyUHJrukZWy/gq9dZhiytazZ6Z+pLfUsWSGh+0ja5NTeiLIUmeuSz6YzDT1SvCCuiefX12HFEHYO+cXnicbsed++PQ9jgB9o/NSBvtYFm76PD3VjUBZZMyIJFh5B6slr21GqB8RgJnYkr0jIY5vj1iMuKu7KaqABm4EKxPf2jOKJiJeu0O4pxHkXtpA0ifpjpROMX7gco6A1XoDxKPQEZaGg9uN6ftmR4scKn2OinPumbe60Gxqxpu7MqUv127KVF80YVkVvWNRI6qNodZpFDtkdbXivPMxhZ3Wo730NNUr8qYQKBsG5eVKMyy1IsCgN+CEL4VVEodRAzOTByxeEecd2+55dQhEn7AxZs8SMb3/XSdyAfoX62RnhGblXXdOWGAFQJQs55XgbBYpFeXg6Hw+Hh4eFgMLixfyOKom63B54GHBXqbqFbpzyZHIvBKjBVBceo1KEhJZLdT0hXEAZQQwjrK1xeQpWL+Xze6/XQXaw8D/zGKx9NgzFk/9p4p29H7KzzQhuZoitcrPox6QNDf1SH4/Ly8uzsjIDBLMt4X3C6da1Ch1ppCntoMU+VBITeoAHq9UklNuhcqvMA8T/6YYp6NnIDjgtIYirfmtGwRcLw1tbWgwcPHj9+vLu7G4bhYrGg8onL3pfsPE6KproGQUdXBXWWv3en2sSqV75u72GTULP5qBQiaqYWYxsw54HKKOQmdKDKkcpFhB3QtAPRJrWLTtOnv7XlWLMuV2V4qJS8+gXxvgaisCcfEVQEdQusGwiEUVLZLqHwbDqbThcg35jlRUTTh1eVvsjeb9ZOs63upWNwba6+Zw6hcvCwyUWIEWfDCOJOs3Ttx19pISxKiFunSICZTCZQugptC9oQ0G1eJjk8Yvoewxb2tdoRjhUrhLe8T0tsnjfhxRM0DClA4nsBkNmArhNghfqiLKMwQCJNhEOV9frkAwBSgfIvdQ1QxYZZo4TvYfOuIJEKM87q3GZrbTuZD3Iv44eJCpdv3sukpWiwC7xIi2Am6iWy8IwxtTG+o2KSeClVZfhytJc0heu3q+11+BwEYa/X9fwqzdPL0cXFaHh+PpqMZ0UGc0s1g1K8UHSvrIBRg9JwliWtzsXkF+tmVTyY5xCBtSo89tppn8uag3Q1k4U0b0HXzzDXjw/bxz9cFRx1mwTvYJ2pNMuCxWI2m52enHSS+GJ//9XBKz8IdnZ2dnf3vJaf50WWgxZdmqbTyXgyGc9mEFpuA2kK1CzJG4G3jdltdDGsMkqJN0VeLFIoITQcjgr9wDntcNW6YD8HN8xv8zmdYMT149OUaFN/BfIUUo2T1VNNKATPy7dc96BI8FM9EN/Psuzi4mI8hod5cHBwfn6+WCwmkwmSYlTeoLwjeWR516APgZ4kfYAKTehx0bXlusIH69M4MqHOB45GyirVDuxJz4Guhw6F9WDgTypD3+12q6ra2NjY29t78uTJ06dPSQR1c3OTCtA7ZegdJnAzNZeMa2R36wyRho5Rf3GNLNl1ez+bNSco6E4jBxxE0xnxtpgfyEDkmRpNZZGVld/tQCnCOOmQnjxQSjGpXe2gKotpz9AjsQvmmhBkpxet2oSv9mxaSZzpRaN/LuiPNqRekXSUx/P8vAAEczZP8yyLfHBugS7uB54GIBz2ex20lwPNBIYa87rX4+59cghlZRcRzld4oG+AQeNDLe8fsvQJhuEhtJ/BGNPZFJzKYBtM2h20aF1XUbmqNwrXC1hTRWLMNsr8s+SC6b9i5BBf1A8gAyQAqQVVvkZy5/jmaMFTWUD8cNbw4PvZam6h485Z/UK4RyqMZ1eob9y94cNbXKbjo0ppU/0NaympWKnYV/PT9Npj4EKsB4zLdoBTiko9UmOEjs8RS8yDwgIwQQCfAdcqckg2Kql0TU6PYbFIwa7NIQZDtiwa0JyrD9QaZS6oQc11Q3lkqolOPV4V/cIbfVs4YgW4tIxEyjUVbZIhq+ipb2par1p1QIvOpVm6SLPz84uDVwc7OzuDwUa73en153lRpICpVmVRZnm2WKRZmpVF4YGyQtxuJ/VrJt1X9knAESrysMghCbzIZ7PpaDQkp4I8H/Z2rvNkHPve8ZaXfXhreYNGFMupanAlTsgOIUt9LhaL6XR6eXn5+vXrw8NDKs+YIe4qKzdKVVvJEZX1PDjPkBxCKUwK5Bqdjuh4zs6DlXAcF4ypS87weaWZSJ4/Fx0hNbXBYHDv3r2vvvrqyy+/vH//fq/XA2Ft4UM2PuQ6JGt+9Vxpq2WjzIn8rl3BdeNmwgRQlgGRQD1PNhlYbs/RyQJeGIQJtHY7gUxCIKIo1XjIWcAiPfKMimGmvE59ZI7BOmjGlU3kmdtXKNRF9cHVIqZEv7EoGsAOVZnnGUT15vM8y6gMk6LhaME2vv465Uf+Sv/hpEGFiDRmGK7bu+4QLm3CgTKiFstC3bwTWHKcioByZBBSxZQG6q9kJuaoOsO7la0ScpO4EoQxd0Ve7JvA9FdTuHgYMC8AD6ZUT4VZDoRRvCN0CKMAF0WmnEIsnSpL1K9J1e5QnqaiMaxhwveq1WmhK9JvzS/u1nb9THsM1pIAf0plMOYTciqjBgYtF1EvO4JuwLIzOnSKgVzlseGKoyV2aGhjZKWyBEjzAiCyfrdf7d4si6rMW4tFli6AUEpJEURx9H0sH6qligXmY3ASJ1olcBWDEWpRCwY8awW0Rcy1+WnZj722mTVjiURos7kdPTLHrKdjMWTUAo1W4HNmKfgS0+ns+Pjk6Oik3x/EcQIk9zghsVACuBbz+WKxAL8ab1PlQuNjR6/DaLGCo4IXkOd5EICCCLlDi8V8OLwcjUaddieMVG29H9HrGibyZVzERkGUumZD3Xdaxjysu6n1bSRCyJUAR6PR0dHRwcHB8+fPX758OZvNGBWk5mQDSu9aQuXsEPLx+XvO8XOSCR0Cav256crVqvvTT3X1F/Y8+droMoIAiDB37tx58uTJ559/fu/evU6nkyQQOKClUItvizmHtR5Xeq3OK7gSh18zRdet3pSHZioz6T5kh0lJRVPuSOpi1MIwjGOqIpaEYUBOFIQjfR9GI+dPqE4u1FbEIa16f6tzx91Gy7YZ0YYxatmlalNeR6GSLNBiQrIu0zSbTueL+SJP0yJpayXpEkrB2OHaxtKsfJOQR25HG9/gfazbO+QQyi7C4JhcOxV39GrKqFqAQGUU1sKiyDCBMAWWM0hph2FA6qNUolfmIQhUUBMs6x6WCgFpArdVd9O+JRn/WGJ+m1GnP2PtZi8KIzWVgGJbGKG1RLpwkFMBvPPI8yEtR+Xpgr6TscgZ7dS6rDQHMRa/Lkb4nrU3QfDEJmpFY2PLhVOkjq63FN97CxKpGzsUwU8jlqtwb50awboV2vVSAIW0RpHZSNXzCP4qS/pgGan67oC5SPRrr/KiKEmizsZga2dntLW5ub2zNZlMoXxehsgJyMaBaQv1pUThxMY8MXqk4mtyhZRKqr0MriodumxllW0ZiiIiXuoElqisJjtxlJeNbz/AqYaKfetgGfwKauSgE1OG4dnZWbm52e32Xr9+3e4gD8oLev1ukiRxFBOKeHlxMcIaCWkGCYFQwh6k16PZfB7HUVFQGXQ1a5HCCJIDlTc4HA4vLs5RGHM+mU7gyHFM108E++t7hs5jbHTeVoS3l9SpU9lrDijHXpYzUiRltP7i2CWTqF2apqPR6OTk5Ojo6PDw8PT0dDweX15ejsfjFBtpkDrsrPop+GLIxWLirix5b9x+4Zeam1Wqg6IH6lFHf4I+BpJy6qmMRBPlfendgYZ2EMRxfPv27Xv37j18+PCDDz7Y3d2lZFHqCdScmyKVWpnHK2/feZXmxS0poPpGVOF1e98ay7CpSKMJRmjbUNPNXDTM9zH/DtkS8KG1tbnZ6w+CAEhf2MGhbKbGPshRghim3h//MXFPZKAQw0yHNmhUWJO//VH26XoHl6dSCbaqiiyPCJqSvQIlvsDQXqQRwvYw0NkWhUwKM086nHyHVsBgoGTnOR/W7f2ljPJow3CsMUyvmKPtNAbqt2XVAsoocWewyATVdzCrBcdINIZm7CV9WJFYy7apkYFpuKWVFol7fPpTEwTMkqkHPY4+uAYIJSVJC6W9wWKFe0GzTbCPNB6BBV5U2iD7pOvBtW5Xt5pb2MgvvUZf+ikmdckddb7Uy4h1LWoN1lIoRM5UyJeF8LDefEPxegr5VBiRKasqarW63W6rVaXZ4u7d4WKxKAsot5AuIFMLSXpVWQaQ2wVwvSnc7RQ5UDxM81BIq5Nwe3cpdGwLaXa4D6f2eTWmYVPXveapySSECuvfRMT1RZZli7h/OL/mRZFn+Ww+vxwOBxeX3ePjbqfbTrpFkUPFrSRB/iHIhM4gqrzI0HVhxSsOSZsbB7i1UE4zNtLDzLJsPB6l2UK6KNdaIxqehovjObO3ZDbWA4h1TdFGLRnnvTiUUefK61Ir7E3lOYhmLxYLKjVxcnJyfHx8dnY2mUxIUYYU1Bw4t47uOkdmDFD6bPUtG4IOsKY2fQ+JS7W3gD1YUljJx5O5hfRkOp3OjRs3Hj9+/Mknn9y5c6fdbqsy9DXpVOdG5KU6qqp2lFZ948K2tgxj44nWbd1YsFplCeL/dJiytqnzBQ92jG6EUdhpJ1EEBApMYlASu8RnqwVE5XEUsYx5JcRvW8ZEWHI5S29Q1eSW8oa4bkIaV1lh9KjK8mKR5RAbTTM1Q2lMgo1SDuwKTW/bntcRSnUK8QzXA+89dAihNXTdq1ICGqdpHgycqAAVr3KQbCLeM5sPJudeJdPWud4NvpvRs7/GHUkEvtbqHqGSz+FwrLF6cYKAukwdKJZNqYNqJwAV4Q6M5aGnECUQoX4iQcTrMVzXbd3qAcW/O9PYWtJEPSWIOzJ5Rm9qLtjEU7iEC4x75d7gYKEtIP+diKMsXipODUZ5qxWihGjpA/8lz/N+d7C7szebzvMMCvIuFmmFkBdQFovAK0qsNAhzD8012ps1XHetNKymBqUozvFkfeFuASsOXckcY+t63a+uy3MToWV5OF6n1en5mOaGzJlA/BMr+uRZlgdQn2M6m00mk7PTsyROojBK0+0oijqdNil+zaEYPbCMUiX6VbDeOjI4tFmjPWDQA4MJkEAh8KKLIp9MJ5eXlzvbO+Rntt6qNWKDy/iQdT+wtnszU7TuTzpP2/lQDyWww4MJO/PJZHJ6enpwcPDixYuLiwsqOFEXCJWul7xsrvzOl0dbLnMIV9MmreMTAI6dmrXN1A81kQlu5ACzgFC73d7Z2Xn8+PGjR4/29/eTJGEFGknqWfIKmt1vSS8yVXNqjQNJdZ983dbNbcInc9iVylO0ayPhz4YyGkBIP/CDMI6hpCZqKsHQDAIfBZ4wRVHDBGr5sOdqEchQ8heSMspAxmoOqcqbZ5OywWSFuBw6g2qWK7wirELaKCvy2SKdzedpmkGJ74iU/EsPKG52pNYAP/wwVMQW/sBV0/z0Nuyi9729Gw4hv3d7Ktd+TGMkr5EyqpYEjCLj6ljlYHBAEJrKGVOqOtfbpRVLRXn0FThsT1KGMOQADmlQMHL5UDPe4LISGbUwJCpIlVwFOEAnEAiiJZizcRyXeR7GcRiFYDwhNAg3op+Ttn8tUQoWj0I0f00ZXbc3awwT/agw+dtO6gI1M0YzS8YzdUdsr1MsjLCuGriamAeqmLQeY7kWNUDKVinVpIheQEPX9/wWfPSiMO50er1eb2MwSOK43+31+/0sy0fjcR4UUQiTCUFYWNKGlAPURfLF6xLw6hviA+G1UGF7tZDjRCTqHdsEm7d5lEsfMNoZ2gczQSibu6pJSeploLfsMiRIp2SxmNO3F5cXHhbaqqrWaDIe9PtRFAPDEALf5XyxmE1n0+msLFRmGiopgMYMUv0hi0xdWlX6PhCqICyNGZuopHJxdnb88uWL7a2dTqdDpyYQybm9xtuuu3YOlMdcyjoqKL8RPglH4azsO6cSiSSIygrvLKUrOY3sBPLZ6fvxeEwqMmdnZ6PR6PDw8OTkhHxCqikvUVO+nUbPti5/2hhKcG657tAaMX1+YsDgBCQBcx+gt/D44o3pe4q5UJX5IAhQZKN99+7dDz744MMPP9zf36fv4zimD0QWrUO4dUy18S7qHUM65HV7o7H/rNu61Qa+UrnW83fl+U0dyfOqkuqmtgpMX0o6bS9sQ2keImKqmaE2oAR/xFjMTGoDTMCYouwSmq10GmCt4HbVQkdMHd+Wu+CPgApiWQwPOeA0zQIfBErQ5rPJRKUrCxikHgBqDE7JsKnn3Kf9Yd3eE4dQp7qJbNjG8k3LgrXc1EIrgvG0ymYZyJ3T6OXOpxQU5XXYYgAkqdjcj9/g5pq8wZXLDIXh7RKFkCgY+H6SAEIITmBARFFcGmESsdxjlM5AMSvz6NSJ6ef1IFu3N2o/NorwI/dmOZklVC5hqevArAYldDFO5b0I/g2zcFYmVep5J4qSVtVK4nav29/c3Lp549ZitpiMJ1maddodyLGHKk1KMwBOV7YqXENpOhJmgTLE+RS+r4JLHMv5kcjE9ZENQc0xcjdCZE4/QmFaWFMT1fWmjVR9KsBHQakyzeaz2aUHMXDykBfzNIEKEyQRidIymO1GkzPQpQIfpzKuSq6ypJl/iyp2wJn0/WA6nZ+enp+cHM/mU2Y8kplyHSO+7uA5hMNGlKwODHLokoVk68CgG5vTu3EFiEZOo3ybxBSlZPgx5l5eYDs6Onr9+jXxRdMUYGpGCJf5M47HW19qmbDKEJmlHbqEdMp5hvKm8Fgtv9SyGlp4lDfgovB8riiK+v3+o0ePvvrqq88///zWrVugqu1wz5rOfh2pHuftN7qFb8c6Xrf3sOliuarOhMUD0VOrzj9yli0ghmqRaZgh2wlChCFQRlV0yPMLDihy3E5N1PSBFALhP0j8UrC8G6WzW2OflsNcW6y69qG5WdaVAeiPJxkMfbYyqA07B3IHMmNoFwmNNk6eZsRJNsq6vecOoVUQWXtgjRwVh/ixomnKKGyfZbCUIrUSSdmabSYT5YWtaJ3OWuA1WfSafbdON2oIiggOAFuCzIoBKVQku7aTJAygIGEHKaN+EHrIZ2P9fY28uxEgsVhyXtR1rn3d1u3n21QmG3124EH10SLvCboaKWIjLqhFPdVy5GBi+pBYFA+O5XtBVZZYI6GbJN1+f3Nra2d3ZzyfLS4HA4jptrwinxQY2VUGLgRfgUKqNOIME5N9UDXV6fRGDvAuHac/neahCQtJAMp9pnpDygcDHJVkWeX/aNYqi5bXKpDbCQ4hmAip5/nnrfMojLyWt0izbrcThgrBw0IekA5H+iXKB0TWBhA3gIGh2A5UySPPvSgCtBASwpE5eXZ69vLVq5Pjkxs3bna7XQKamIL4N6WMCgePijT6BPCyUKcMLNYtoWUpiLITOvge5Q0uFovhcHh8fPzy5UtSlDk5OZlOp05ZCKkH47im/CVfJBikLauENHVgiUzKW65fnvSlCRvkDD3422+Q2KEQAPNUSUWWRBc/+uijr7766osvvrhx4wYkzKOXKAVIV7/QOtwnf1oGsK+lRNftRzQLXeCYo9F3txuzOxEPBBgxjqMYxAMB/UYpQR908Zm6xokSancGG+UxRWRzlWyulZOoLtia9wjnpHJT4lZ0PQmqs1oUBUjg4JVQ6jhIg2FGPRDzlMSwTRldPdZQHHE9Bn9kexccQplBqhB3hzvqBjCWcjl0nzaUUcyxT7M8T1ENqcQvaVuZoS6lZfi0hFqqI2oZvmsGDq8fX5TCUDR3gMooWo0hKE/BGtlJEs/3wygCFZkgjKOQ69Gj9aM+KMdSXbMm1pmKbdqbXcdi1u2X1pxeK0v9yq8ZAjQMPaGHSdauQuBVyV0lBrBi0NLXWZaWVel7fhTGPSCL9oIgCsMojKJBfwCqxVhdHcUdgZqOFRTASueQsTya+GwQMOMHKqjTvSIp3lhvjg9w9RO173HVLhprVZ6z74ELgV8atwHR0dKrsjQtQeC5uLj02vN5WZSdTreoKswVzMIIw+C+R9tkORTNC4MgiUGDlIBBLEAIVpGt3QDPs1UVnhecn5/3er2Li8uXL16dnJxQ0Qt6LAwVOtzR+rOSBEiBqtGCozwo57HQKchBFUCuIYhS4qhknEpPaRk7se4W8k9UEpDuKM/z09PTY92eP39+eHh4iW2xWFC1euh8OieCX406i4Zy+QnwScugDFqqAGCjT+i4f428LwqCYHWQACQ2JC9Fc2hVtST8hsrQQ7gTZUWTJPF9/8aNGx988MEXX3zx4MGDCOp0g7oMvUp6p3WPrhGDXRZQbtyr/nbWbd2ubBQYo94s9ObNAkSBkbpbqGcLCBV6XhVF7SKHgKM6njI7zbE49kSBRU2daNWS4q1r0+lD/I3+w7JzrfxwBXawFS6aqhraqnwfBCxoSKLvV6XpYjye4LoH8sTsceJ6IQ+uYI+GoIzwBtcj8H13CCWHmIaNoeNwcZIaS3MFZVRieLCEtFpZriijtCYZOZkla4bG28SXy6yl5V9fs2fbm9Hto+FFN6QlbEBTwffbHSjpBfK+KEel9dlMJEbfka5eqrERBUqsR9u6vbON8x3MQqiDJCJmKicXg9KprRvBfwT5oOKCX4KZ3G53Op1Ft9vrDzb6/Y1BfzS6HIHAY5zFcUyMS+UYmBUQsxSXDL9lVmjD/LayZhpnC7fQB75uW86ac85o0jgt9RvVULanbBUtD632ArV2IONkOm6P2iA+mqaz+TSKIp0cqI6SgeYXAFye56ODHVZVXuWE8lEwS+TaYSY0BPkWQJ48OTl5/uL52dnZ/v4+pi8urskatRhY4rUrO6wJWNMbKCaHzXKSjpYVzVzheMgEwjpAzYwsotTmeT6bzcbj8XA4PDw8fPXqFeUQTiYTSROt+zzmstWK4l4Pl71Vrl3raqTa6hU196wesXUeiPQJZaLU5ubmo0ePfvOb3zx+/HhnZ0eSRR2aWf1ByeM7F9D4oe5Ayp/WnuG6XdFkSXddh1DnPtEGS80tLnKLkTHIBYLS9DHIjKqRoexgU0OJzkiThRMDZalq85WJhlxVkVDZ3QY0pLCfaiyXo9Yx+E5XfLWI4lAYNs10OQ11xfL+TbRL+c9Xozvr9p46hKucKOw4asancPo1JmtO0afPORRVyo1eE4aBKazLJ2FY0slT5OooznWKOPwyj/C6zFJDNldHq0hlAfF20MHxc1Q7DMIkjjtQ1yskD5D1J+TEhAekYW2v5VJIcZ1DuG7vXNNYkv5TrDfKslcgodqAS1NYB1mCESpCQVEGPmg+YYu73V6n2+t2+u12J5pOozAjARWuc1F4rSpXDmFRuIw761yahCku5G2GqCI1rKCc2hsr+6IJclm9F9wCkUfZIkd+LGCEaJ0UeZG2UrJpxvEYS8kv/DGoZJGkDhFEQSgLjAmQLYfyEiCjFRFZNMtwGlROGuBdAB5WEM4Ddm5ZLBaL2Wz2/PmLb7/99ubNmzs7O6C/pZ0NMlyufAJ6jlc3jWJhlltFjREw/XCQw2VVqJdrlFV2oo6nNby12ukUEVfXoJ/P55eXl8fHx+QNHh0djcdjAgaZKcqBTvkQpKNY9wbVAEE6mPmJk/3qdU44hLl03Wuuq0EfSPtHXhtZk2EYDgaDhw8fPnny5NGjR5ubmy0UUaPTrWDbNkZ1HQq0U4Gwnjco91qbp+v2Ns2QOzj8QouLA3aorcmro2pirVYLS7TGQAADVQil/kABMKJoYhWxFbOZZFLYaLmq1Wt0ZRp2FvEop+9rBg2pjLIbiLnKmpRBf2cZ8P+JFKMooy2olV0/17KJca3r++PbL94hdHtALaPD2XJ1AI/TJ6gqPcnJZBksmUgZVY0MDs5hICvK2DoiWKisJRFnMaUS2Y28zm0uccGUO4cfYXLAbN0wCEnHD/IGwyiO46TT8b1WgoVLq6qKkphRezZAmVGmVIT17KEHniCkXze/Zt3W7ZfTTF6/YuzQ15ZpK4JKJtsWnTEiQ4I/0+SMYfUaIoLCpBGGUbfba5HJ67VQFrGTZlmSxF6rleoAqmYHFc5qV1fpsHgRK/Ogrn4MDOM5HDlOWNSmiUCmlCJ4/Wh2eglZMFzKXsfWbKsH7xjqvjJnfTQZL7JFHIFKJJ2IWE+e12onbSALlWWO1fNASzmK4YEV4HjnRdHC8vT6HYKd4XngdkJ9izweDUcHB6/INSqLshW1ZrMZ+RJhCAxernHX+Kz0fVHinw5ua+Io+y10BCHUqaZT/oYSCPmDjEpYuQ813MxhpfJZiPbJ9hYkTJ6dnZ+fX1xcEFP07Ozs6Ojo4uJisViEYeiUrW/qFcaJqq+kJrCpkyS0E9ngEy6DqfkU5PIxesAEVKaMEjCYJAmK0MJatrGxcffu3c8+++zJkydbW1swnDodiB2gNH8YhlIWdZUO3FUyoY38UnmoZU77uq2b1Uj4z1J0p2ijCtMTv00H6KwOpSYdkBtVtIgCU2rhz6oKdGVpZGyDJahOhpiGSlZs6p7CSlWBQfpm9fohGQqauGF+4uUJZmmTtw/ZTFA5GyfNxSIdjcdZumA6Q+Pgsta7Jfm9b/cq1u3dcQhdSHtFFQezydLJWtBR1KAkepIInbb8IPCo1JUO5eodrTNrwL/m8fFgpr+ucYvy4t2bkWRwcQZD8cSfIQXfD+IoareTKAajU1+2KelLOcA8aO1VzejFqzOt17t1ezebgWjU35ZuMDIbpQoofEVBH3YCmo+Lsm/KtaP1GmBCSPFNwjCEuggQrglIIdNeZQ004bgH5qJttNCJUl1npRQWP9kMOjZkcFG1hesNNk2nZvKrXSrmrOiqWy7WxBKvaBChihcpx9C2hcmoVBeQZSAl4nkeBOxyDNWh+YSaygV4fn7plXoaBGyQ9EiANIFZc9XZ2enzF89PT08Hg0HLAwESKaF5vfVCBdd5KeC96z68USeiAs16WaGtnFD9ipM6fNG6z0ZrVpqmVHhwNpudn58fHR29fPny8PDw/Px8PB6naUreI0NtbhxEn7FOuTQfSJxQ48pUQ6zBG1RFMBswwxX+thX+wMfD6Z00iIqi6PV6e3t7n3766dOnTz/88MO9vT3SknHu6CqvvuF9LbvCxoBL/cms27pdK0FB/Y1zHNbI1RHGZuqoPfzB1wrjJE4SiCcSqC5JY6JWhDbcNK2zqSYth+bsC20I5DRQFZaw2tCuNGQQCu5wojIKgJVpllNteh1VcuF3vTaRLLUgka6H20/XfvEOYaOp0wgoX3OeFp6SMqfyHIqlkPKK7tONRXsdm+wKZsx171ALHqoLc86ljSfN24FlEwJDqLYKQSKIHcF6H0Vhu91O2m2S6avXwFE80RpqafRy1n7gur3T7UqaNgdNzTelEZgx61atWBPlaYi9wNchVQz6h0UyISeE/kHpcCq2hoWeLJ5MPQtL/sROYSMjbsm9mZ20A0g0IfzSDgWRMgGnsjhtyZfmuannw6wEcwloLoAKOtoJ4Fp5IECHDiGK0UFxCTAgkDpIUBJphxQlzNKUe4la7IGXK24peoTQAAOE8yJl1PfJzxyNRs+e/fDtt990u929vb2NjQ2CIq8J+DBkqukgzQBUw/MGhiy/Qbhl/MZdGVb488u8cUXJwjabzagM/dnZ2cHBwbNnz1+/fk0qMovFgnwqeg6kMipPWncIHbKl+hXrYhrnX9PCmqEFDjGIu6Dv61ioZJTxwUlflDxe0pLZ39//6NFHX3zxBZFF2+023VcQQMGSZSxriTnU3PXmV7BGIdbtJ2vK60P4TnL0OYqilLY0pNe0ODH7DPiiUQzEUYiOofQo7kwWIB3WKjIojuAMRk7h01aqjXI0T2V6qqxp1OtVBLgzavySyijN27gX8kfLvMgXqWawK65Es7O6gmKwHp7vu0OoGxfgcifu+ix/JWWUCtNjAKPMMlDCJRl0tDmg99LGFmXUbhyP0cuYw5lZhWQ6B3Sjv0gjsFFBFe0hlA9EiHGghUHgh0GI80S33U7CKOl0kjgCxTkUWPd9pIyqcJEO6AorzTxDLgqsioxe752s27r9ohoDcUS3oW8cJWE14vRKZj5gfj8NSPhQOzbUW6J4DbLOF2mWIssRBVQAuaIluwD9j6Iq1Prpewrhokuy5i4lemolONF12tErjVvaUR55146TprAcLCdlR9IMgUJREMxcp/JDaJZoymoz54W0EruCXI35L92Alu/naQZPJizDVitF/pHvedonVCWC9GRGSSrg2+BdaFFo0qCmY/ql18rBpz05Oen3+s+ePfv9v/2+3+93u50OVLYICwgCgtwlZxWyDGlTt1EUEulHrQad6Ok10RQtUqL84CwKzhung3MFDlKRwZycYjQaHR8fn52dYQLhwbNnzwgbJNurKIokSej6ZeVABzczfE4RnqArAXw7AOazWTvos4gtOndRB9wafW/HMyTknPx/KkNPVQd3d3cffvDw008/vXv37ubmJkGIVIMesfcG0q9zg41PmEnOy1i7a0hw3X5MY70VNc/qoCG5UDSY9PRueXFkUiqqPga/8iyDQL/nRaEXR8F8gUEav2qpEI9ipyprTx6Kj2hx++XYt6+5FmR08hcoM1wmWJgdCeH3A1rOWGU0K4rxdDqdjBfzeWHMWbsytphUnfG4THlr3d5nh1AFsJeVl12h0edsTEEXDcehtrXnE/hGp2GV0SYSs3M9qjXHh9+kNTuxohKY+Y8OohC2wCstGTdxEqOojGI6UWhX/an5ohyAoaVb36aeq9Zt3d7ZprMmarXdmnOQODgii603Hpe0w6n8OnLqiNGtFBox456tVKx2qiYYpf+kBTYYKnHomqszo/AreSnutandHfK9rZ8pflAyd9qTpD3VZWNNxFVsUnk9RnfUCeEBGxcdRWDoQpUq9qDoqDm6c4QCccqZrKrORo7IC+WnoWJ05DvN5vPT09Nvvv56e2ur2+t5gb+7s5tlGdcq4OMvg0P1a1KBQt5ev0H7mdqMLwfoEyTSpcls7OFI84gr8lHh2QLqekG7vLykSvSHh4fPnj179eoVFaKQYQ7K22G9liV4pr4G/XaVF4qWp8GoVXdofufLuqvzNOQZdYADGrwRiA4ghI42Zbvd3tvbe/r509/89jcffPBBv993XLgrOuGS1ui1Smt4daX7dVu3Kxsz+snaoh4Hpfco0KfqR+jVxd0XDbdCdW8aGhEkBHUoKR18MpyQ1IBlJ7CW6a08Nnf5oH+vhViYLfUiogiizvJRuUthWVUBTVyUKI+yYcDqB1ewybrWOqk6t5z1btYD8Cdr74ZDKMXiGywMzUhWHylRdxk5TAUjqdgzrtAFYoNqCdRQJOWiNO27jEddO9HyBMLGusN6Lyu6Y2pB6OwbvLCi5fll6YUQEsdkpwoA+qTdjuKYEzDoXswoxmwoQzPXajPmovhca+7our2TTcmMGvvbMtn1pCGzp2q7N4xZZXzr9CoyvjGoBGBghqgOfIn/EqIlZRtVjlarwTVttKT5Wpx46k/SBDZoGyuCKMjRqBXqU2Zdp73dZEIEXVte6YPf1sqB5AlPF2wgmL8JmyWkSOhjqbwU4Q/AU+NoID26sgQCCOUfJm0QKZ1OJq9fH/3pT3+Korgoi+pRNegPEpT6uc4DpCuhgpAUaCO/VZJTHHhwuUPobKy6VGMSBN+p47KWZUl5g/P5/OLi4vj4+MWLF6QlMxwOyf2TLlOGSLVczhyfyolBODfCtqaEBB1al3OD9dQ7x3OzfgWcQzE/afiQmRuGYb/f//TTTz9/+vmDBw86nQ5fPHePFc5t/e1I7mgjWlg/yNobXLe3bMzbkOPFDHcz3hXdo8no4t6LxXjCOIaiOyi5RUX/aAMlWMWWniV9r52/ehiHwcmrFxDldkpTnD6ZiyYKCacQkzdI1084YVlW6SLFcFWuNdVsn9Co4Iu5RZxBRdPW1mnrfXcIdca5IuEo/rX43eI8ragOb1RGyTyrqhzr0ZNyN8Q0YEXCvg3yZYZXZkW79anYfnK9VSZjLec912Xl1X/khashqFhY3BS1JgxJZjRMIkg3jgEb7HQSKuIpKKMqoqQLn2lAUF21MfjkiFy3dXsHWxMsw9Yzlb6V9qtdisWIjtrTi8b9SFEbE5LzPEdlS2D0ZWk2HA4nk+lsNl/MiUkKiyJMQUAzhZmIxCcVvIiHbARbnCjYCmemljciNMVX2LjMQGBagT6VvDql4NKCYuW8bUNCiP7fMpURPCoEzXFWLlo53bUSw6TNqJxxAqKgkaympbFWqjZBNdPZxqo8D9j+vu/NZ/MwBAri4etDlKxMZiC/Mnv04aMbN25QTYssy1DYHTQtZe272vMEQwz9fONQNb4mUU3BfbhiLzPVSjyQGjtI1CHJx6O+SkzRLMtms9np6enFxcXJycmrV6+eP39+fHw8HA4XC1Dz4yRDSsZzYg0O8XVFrQt0z82qpNk1hHroO2CRDBGubfQ5+flISirwUTHjiGrQg80bhf1ev91p379//8HDB/cf3N8YbNCOsEEEaRGcYtrY5DBvrD3YuLHjma/rTKzbWzfDVeAPWgHUsDOADq9HpRPuI3kVLaBVFHkUhS3PB5WIJB5PpvYKRZKmSq6KJ3ETGdERxJrK17WobKJEtXH/aObSXDMTNgLaGs2Bem31sADs8PJyvliAVY2b1gevxWBXFFgVWKS0ebn6rNv77BAqNw/tJKsEfUOAdqVwhFjp1UpMlV6QDaUQa6CMNlpaGkJoOIMu866u6k06rfQ2xYq6ahehQGPGISRURJB1EUah4hzh3fA2IiKtrTFXJmclrLlu6/ZLbhwklcaoTCmsuwE1UI7UfeuDXzFkVNGaokwX6SJNF4vFBNt8vpjj/2PmGvwfJTCjO6NppswibWpsYS+bW64EPZxw1bWhRc4Ss84lTyrqVSjjwNpVzY1qXefsZce1U3J0Cn8z51KVCcQTcErniesxkxd6gy16pa1Wlefggb9+fVRVrcvL4QLeTQq51mBpFVDrAiVJSWlGVc6wG56aVGEUxbf+HPgbx9Zh+Nl+LwaprocO2ZNhpiihfKjhvtAF6C9fvnx1cnLyn//5n99///2LFy/Ozs4InSZXUF684xBeB8Rb2iGUKWgJippYCQdQmmQ87UQm9T3Xb1TE0RCEZJJ2cvPGzUePHj158uTu3budTodR4tVOmuPr8peSLlsf5uw3Omj82hVct7drXOVPR35UhQehorkiDUHR0HzfQ+4aRKmAAhYnBMsRsqdrnqk4vyVrVvNL1cT7Y+7oematWqQoXIdFhtQiV5RpirV/VPHYskXxRD6+BjapvBOhoDyprNtP0t4Fh7AWv3QtGZUyIkqwG/2mWmOQDQhAFH+FGHQOeylLQ9G5CtxAj+1VV0iDUuIJVzZjDyk7iWVq5KqsRf+UCERV41zBnqSNH8VR3E4i8AZB+kLXHmTzS59M11izJ5ClpIV1W7dfaGNpXS0So7ECwdhZoRJpjoOJ9Jw9pWKirj8D3iCgN1k6Xywm0+l4NB4Oh+fnF+fnF/P5bDGfp2nKaCBxR9VsY/uBbGbbDAKYs1pFSYFT8jB0eRsj0m1ds1aMWXZfrDjn+HI2b3AVAuk4MIz7GXqRVbzYVhy1PTr2FHRpA3VH6Ngok4iRJcfhqcu9UJpKqwVZc2VZ5Tnox8yms4ODgyzFFDuU5vM8b2d7p9/vQ7VDp+xeg9sAx/SxGpjmproFteoMT+FmOIiiitfXcwfk0di7S+GyARucTqeXl5cXF+cHB4fffffd4eHhDz/8cIGtKIooiubzuYQBG/2cFeEA1wWSyjHcMzVCaMZF7Qh1eUPn1ctnRfeIldZAZqmdtG/fvv3Rxx998ukn9+7d63V7VVVBGXohs9R48c7drUA+G4Mm67ZuP1lTM6phAjC1Qw8lTi9str7URIpDmTSWgAUWBCqmj/9B+WWcCZd5g0u40G94K6trP6gllZFIyrfyZLlR/AljoWBs68uoX4mweOWpMW1RE2XXWYXvt0NoL/bmG2tOt/XyMHDSNEIwglpRGBWPOQdDbQHqfyCGq2hI1FGZMrokzq6SEOV1Oh+uM/zIFyRygOJh49fy0ErLgUTWVR0zP4pCTDf2gygMwB1EmnmS+Eh2JaU+NSfRebTOr2Ev6JwpfSkaQFwPt3X7hTc7TcuaNzi84siNNh1FpLarNHrNWjGV5WEyUZ9hPlmMR+PxaHw5HB4dHh8dHZ2enJxfnM9m0zzPM/j/DLxCnU/oMPdonpPZIDSz6VoLfmWEBGB5hFJ7TRPMNYEOOfxlChlVDnAQHlLbWvbA62qo/CJoXm3cXm5G16Nq64gcMChjnwN3lBxCgmFZ90uKZzI0pwm8wBHFLUE2zIvAhbu4uMjzfDEHEc75bP748eM7d+5UG1VURIRBdTodOhrVP5TQGVyMRpK5qLrzeB3GitiXJmFetqwK9dJDJidQOoTkB85mM5DqG48PDw9PTk6+/fbbZ8+eP38OJRZns1mFnYHcKgrJQxIEHpCqOMjqi0vT+Wzjjy/eDVhok5S9QfOlIqcJXig5k6Kf8/WQhCnVoAeTNwh7vV4URXfu3vnwww8/f/r5R48+2hhsRFHU7XaJyksSo40WqtNtrsMdbbzTNVN03X58U0Xo2S3Ug0zTLdRIwfoRjUACTGsFVFJFnYuyDMOwLMs4jjrtNrLAfIwtWoVbTSxpJRr4pj6hiqIqLNK2evXZ+DKo1IQmluM3vp9m2WQ6zdKUSAB4d0EDroOH1mCmXmrpGnjyXHuD77lDaGvJWPmxKCHjU4bLdfwYTMdFLpE+HGTiqbR7/AK7L4xCGsMyaVZFZbhsIJFXLQ7MatZW4y2ZWsW0V8N4Uz9QyIjRULTR1DLm+x6ocEMVCpDj9gPFetLkJxV0oXiuQhUUQat2ljVSuG6/5Ma9FxkrxtPQg9QS57y6Bh0hITpMIhmjCibSgBWkC2ZZukgnk8nFxeX52TkUAzg9G41H89lssYASTCp7WRVioqEs0DEm9tQQQq1rgkOdP+MERHR3nm2MoAgbCksflYGtmCcpQ2r1p8Fen0Fg7AXaYgPihHMd48N+Iy7ZD6mkkDtHnoCqZKWZSI7Rr+8Cng+L08AGQQAZ43iQyXRydHz0lz//JUuzxQLYvPfu3ev3+xsbG77vz+dzIpHKLDXHtbZ8BloJroabGvBG6YbJf8nbJIHQLMvG4/F8Ph+NRpeXFwQJHh0df/PNN6enp2dnZ7PZjOHKVqtF5FLpr9aJmo3+uXnLQjBfbS/BXXtXBn/tJCNzTOM0mspHBrQ0Ha/lRXHU6XTu3bv39POnT58+ffzJ453tna2trSRJmC9qLrIGidfHsnObde99BXu2+R2u27pdr6mlh6kcGmXHzqZp9GRRNvU1gsXAXsUAVOD7WIUlJqlSBj+omnZ93lFGZHOp0Os1sYjogkzK7JVsNUkRlwgh+sAoIa0zmSvgvadVZSo5kciFdcv6mAo/xf+tOaM/YXsXHELM3HAk3cSvOlbPS19dRkwfR8Q+8YiovwKx3lwvwFq7j0wrDIfL2Kh0DvUHh/HlLMOr7oqvUOYmukxtC5Ok9RcX+6ooghjy8Gm+gPJNcRIHIcCGlGwp4kTabtPhKb2CV82O4NojXLefcasHXywcAL9BkRZNHKBvwG9SLmIjDtBg02skUMMHdDL6h8F2RWIk12I2m11cXBwdHR0eHFxcnI8no9lsmkEOm/YDERckLoImBIga341wn16YMSGfxKI0aVQn7mNcFnCnnEiGQj9AU3eso6si6xRSEhxR+wmYv5ShjNE0/g2fI67Z9g6K+aklFBpnQochKQkgPAFJB0aAZgjJlmSXuN4jWUpBYPSBaF9ymciTzPN8NBq+fh3kSMKcTCaz2ez27dtVVW1tbfo+ROIZUyIE0qSY6pCk8hUl/GeYt812WCM/WfIn5S0TMEhtOBxeXl6iiOjl8+fPnz0DQdHXr18vFul8Pvd9P47j2WwmH5T0kOvPv3HBch0tXp0QHuf6ZqavOvcpoxgm/mKdguw8fpj0mZiinu91O937D+8/ffr086efP378eH9/nwrTc1EKrgu6LI4jH6bjItr0XfON3HeZbOm6rdubNIUbWI1V4vWET6Val4T/lY4Xk1yQMgo8MCWgpcUBFWvjzQ226/ZyG2jRQ0sMPjNLmARuujKwQkkuTPNKQBMLyR3XOjWq4rMvym7hVfzVdXvXHUKnsC91USGsrcMpZAuYRMKG43C4gpUJUPJhBqWHS8NBouFr7IAGoTz607Iprwk76IuxjkVrKxA9ZYzFbEkCMcgTg5gq/ANhbGSRAX8AJYmJdQMsUmUyYphcIBrmhOQeakacPpP5at3W7WfbnLQr6eBxkFK5IoSeMW6GlD/HOrSUhJtCOY4N6pibVBwcqaD5dDw5Ozs9Pz8fDi8vLi+ev3h+dnY6n89VaThIo8dLwqJMFotPAYXWeYkazlegJhr04mg+aKFAJ+1Onh0SJmDW4iw7RTTH++UvCZYB3nmTgAo/W0PI0M8BqsXrZ2iiwrb1L17BKqvDYeg5xjrbHvJEmkKpiuy5MJZ20tTdyeqFZdluqyzB8XgMsbM4Bh7vfDaZTEbj0enp6aeffjoajT744IOtrS3iMSIvtPQ8EMCkIn5+EChH2ocFB8vlKRDS6T9OLqJ5PsRARkqrCi8I5RhMvIEAJaHNtDyRlOjp6enBwcFLaC9QVvRgNptxPYnZbMYUTYmdqlRz4dza79e6YDt3VLwpzgmVLxQD+Nxz2d/jDB9aPR2XjP/FRcwL/KDdblNxkTiOt3e27965+/jjxx988MHm5mav1+t2u1R6Xv67DB50PqyI9UhCb/19rdu6/bimRgv/y0pZRjdF0MIY7pNuHQT+PL+oCpp387wIgtBvVe0k6XY6URRBGUJYvHAasYdsPeTUeImr+rrA+tQX0ia1sBn1gbBKdelIZKHlC6zRVisvyxkWnfC1qjBTJJxzGk6bbZ1y2uTaG3zfHUI5cngtoDQMswWNqVUFCKFZBhCaMiFmJpSg1qCtLYxt2KdnW0d9U9MadV3BK5eW+nXq8Wb7Y2L+sPmrlFKsHkcQ+IANIrEAkyxQLNxdOGsZzgKkNze2buv2s2+NChysRSzq03AslRwus00jQsiH4m/I8UAlbZO8p6EqyN8oiiJNISFtOgVB0RFqyRwdHR29fj0cXc7mM07lMnEoiqFq0RuuKMjYo1APVhRV5ZxxWgVfqq57wwYuVS42Y19b+Yq/RKu1SUVuuOU6lkWHNkipoIw6XMe3fpvOa9V/qpNIb6eOAjmvj71B6WpSJXr2Eqm8+2w2Izfs7Ozs9PT0+Ph4Mpk8fPhwf38/juPFYgFCJtq5LauKVlMkkoKoOgODjo1S71HmOet/FGdYBwXIJ6SuUpXlnKrOLxaoS3R+cnLyDNsxtul0CgJFKlGwoGNDNqlw7ZznuQIt5CfGFFl3CautCU7kgmWrVeUJXdyefUKne1BAk7IB6YPnef1+/9btW589/eyjjz7a398npmgja3dF52nsRQ4qWI/+rE3MdftJG9HUjMooLTM04HEqc7wt27gTX3LwgyijUIRQzRsUhMKh5GlxiPp1vHWAw5oomvHHlXrXhA4iDgqMGMJgoCQv8WLoFnAhkue0AUd2GNktXA/TH93eBYewlnzv+jeKuIXfCXdvKU7IDalWsNbjekzrllEZZZKSfRxlc9rE1J+oXIOQInZiM8LphFEmMzFwTQWNmSiMgNMFYhMGvTQHMNUShdmszrUeauv2822NxcEaiXYaElRrjnYJOJVDUy3FoHYkSZxzse2ottejnKEYKJQH8GA2Go3Ozs5ev359fAxaMmdnZ2kKtQ2g3HqJhj5KbxuFFc1zr92tHq+czYXrsxnFzqNhMS3GEfF/HBNSs6fnUX09yjyUOIss3MrzKAN9TIOU56x/dgCo67xUp/qFkOV0wcVGv4KbY/3X8iHxCCgrSvuyKgk5ii3PgyoOo+FsNpvP5+PJ+NNPPt3d3SU6VhRFtKM6rD2rKgbXVS6F48RqC8mgxMT7ovTILMvm8/l0Oh2ORmenp89fvDh6ffTs2Q9Hx0eXF5fTKagT0ZaUuyoBQKiloeso1l+N85Zl35YBgtXeo0IHOTah+jKHKkyuaX200vGLsvBKkIehGw+CoN/v37lz5+OPPv7o0Ue7u7uQC4+PvaEkTA0Mqccm6oTwxgmk4b7WuqPr9lOqW5sRghR6DqUYdQrWxaeNOWCvaKV6xCL5K4jCyA9ANlll49KapQvz6NNfnc8srdWrpS5WksaMmaqSNHhFIn4KSGTBoqezCnHeghjWNQeaSiasjeXr7Ltu76ZDWI+z6oC/+qjyVZbsJZuijHIlq7KazuaLNG15HmXeaGYZVJ0iyXIdt1BRnmUXZnXTaxSmXxJiqS16bDNRxU+MCFFwNQxh4ae/vJYP4SOcNbhAsOfT/OKCAGrSkUum43Sux9u6/ZyaO/Bt65absbC140ADhxjmyqETo7JOGa0z3OTB6Rvm4DHHL8vSs7Pzs7Oz4Wg4HF2+ePH84NWrk9OT4XBIZFEuoIckQwxBKZ8Qk/2avBxNjdPxYzIatGumRiz7JhBPxSPz30AuV/RGFi2lKJH0b1Uou+kCRAEtUxNPchGd12G/r4Zpp3E5dyr6aJuev9cuBGmGCk5jo39Yf3d8wTAZIqgb+H6WZaAchrKlQRBcXlzEcZxn2Q9BCNot4/Hwcnj/wf3dnd1OtzPoDyBJD8vWk1kG/mQY0rmxCAX0H1I9IYau6lG+X2plF8pd5G5Dd0QXxqKprVYrxdqVAAyOgMV6cXFxfHz8+vDw++9/ODp6PRqNLi4uISVVy8aw0A57QY5HJ8Fbo68jgEQHFZRe4iqLTVSYpPfsY3pCvTM45Ew+XTtp+xDEBGXXfr9/+/btDz744OOPP97b2xtgi+OYOKJcHLKxkvUywNMJFTlhnTqC6uy+9MbXbd2uanoe5qifNZeqNUlvAKamKLwu+h6YdllFjFAvz/Kq5YcBVGTpdjtJHE38oCwrCDXq0AxNuqqGGQ8BESWxMH8R2VxyF3oTORwcZAbpNqSQTyx6OdYA/SfrFE+dguRa5vsQCUKRr+bC9GaEotcsK9TL9Wrd3l+H0FaQ53WLec5+Q4rfkqaCoDrWj7LXoNQAYuKYnkd5MsKIcU2Wa13wNcHtJtYpD7B6XMZU8jLahGoT0hfFBT5QuS54nyoHie6FdKI8BcUbKEEOczYp15jhuv1s2oqgYB0WMIAgKlWAnq52MxzD1+GPMVTogAnOn2RbF2WZZsAUnU1n4/Hk8vLy7Ozshx++/+abb7777rujo6PFYsG4FotGMuzm3oT+wAoyCh6Uw1AqkOoYtDkkmxlus3xpdTY1vYgv+Unqz3Sf0umSMN1VzQXonPXevaTapdexXyLoWvl4NlVVWvnORcoYc4Z+IBUw4JPBe5zPz07P5rP5dDI9Oz199erV3bt3t7e3b9y40e/3B4NBhMItlNUGjFPfL8MwQqfeILFa5gdOCcI3KrOd8UByDukzl5cgyjFhg9Pp9Oz87Pz84uT4eDgcHqp2QMGFLAOmKBFEpWPpYLYrsDKHWNuIpl7ZjKLSNRo7oprMAhIyVEKtqqokSXZ3dx88ePDZk88+/vjjmzdvdrtdujCJ0jd6g/U+IN1d8/ZtTu8yNam3eA7rtm71xpx/2/VTP0LunO5/DByan7ihHwQIAPV/AABAQp4CW0SjUEO49AvP0pVZTVdTCqdvwGgTh3ZU9+UmIm1Kr09WK3KgjEpahJmB6cJ46OHqzTEmW+Vi3Vrvu0PI7p/tQKnlV9lI4jeGAtzJXanOcHodUkYtkxGT+/WC2kgZrWeM/IRNF2BpGH/q8kmlsIWieTr8DKtsCPNFgDIzxC/Tuvba8+V5Au9Hf0+T13qkrdvPrjUC7MuUXSw+HtS2plFc+iXWpFE7q5Vmheqg9cFmAkp/AzVF5+kC/nd5eXl6cvrs2bNXr159/fXXz58/Pzs7y7LM83wgiKqKg4ANEiJIZXz1ocyxnSBUbZKRBi8GwWTct2lG0geEM6pnxaIyfDABHvJDYqdX5zq6Bvd1GhP82BnTPxhThG67Ya/aiahOLCO6jk+4ekJWtUP0xo7SCT/Aqqqm3mSxWMxmUPEPMveOT27dunlxcb67u7u3v7+xsUm4YqfTgeS3IIg07kfHUj0TK5EYk4jOwjI/nlfoshmMDYKfh9jgdDY9Oz27uLg4w4TG6XR69Pr16cnJeDTKsoxVUutc0Drttvk5iA7XiLk5h6qju85mbq/QC6zcnh1CqiutohcI+rXb7b3dvYf3H3725LNHjx7t7u5SvUFHU7SxNc4A9XtfNrrX1NB1+5s2A8ZhVxNTHUXjmVhqCKOcYkz4mCJ6YLcFbgIwwKAwPXFfaFsF7/OaUq/aXuffW1e59Cf7B01wZYtUXbeqlItTnJ7raNTjyMeIVV5VMTmhmPOccWH66w9BujeZq3zdPdftnXQI3eg+06K0ZIStjauMKvcoWnlcE0bBPJjN5mmagvWGHZRV+MiGW7a+1sknzq/iYt5g4eFVDf+QIR91Q0QZVYxRKE5KoGBQlS34IgYGDvPMaFphbpgegNq3Nk40QZJikK2H27r9XJmijR/UNsrWp9J88L+iKoxMGSbW1etuN5ZTJ8qOc3Yf2YZslE9n09PT05OTk4NXBz98//2z589fvXx1dnZ+cX4xm5MCpCIEKmIqjGGoyasS5q3TacSf3Cg4N1O/Jb1H00bBy1PZgJwVLM0CRgOZeICZa0z4VPvwN0QlMN4glf/7EUazNLt16K1Bw8aO8Bk3GKco4/jRO4V8P+EIM61Um1xaWRT9L7oCmS7OYXVyCylLjUWnwdnLsjiOq1Z1enIym06nk+lkMj4/O7995/bZ2dnOzu5gc6PT7mxsbsZx3E6SIo7TNCXhmbAoSGeP9W9InAxKcWGQUSrH5HAj8IHKDFLG4HQ6vbi4OD8H7vHF+floNDo8PLy4uACpIlSRIdkY5l6Sv8Qa7kStlALajWBpHSp0FilijahO0AQjGNxDRFUUoIeviV8lCXdTUUf6kp45oqxRksS3bt3a3tq+eevmow8f3bt3b2dnJ47jMAzjKCYpQhKeab4GG4KoB48c6E9+42y8dg7X7Sdsrmw7K7pr9MJ4TsSD1NVclYAZxesxCRxTz+GPPMtbZUVV6TvdbhTFQeBDSVsqjWZX6mNIQ04B3MU5xrfCXWSUjxfPVTfMFjjOdbrsGaCavueFAaAU4AoWZV6UrbIKQvAPgyB0vE6D29PSxXOXNv6NbNW6vecOoey6mj2qiySoqd0G3Jc0CovyIgrEIVSy1qpN4G4JOZYVF/M365SWM+hQRlUKEI8XvpAwgqr0OBiRtw2GEVEKhAvtPEEyj5iiZs6/Hm/r9rNoy6qJNpp0zIfUaL+MZqpAZtUCmEImFMnjOyw1By2hFGMy4suynEwn4/GYsrxevHjx8uWrw8PDs7Oz8WhE5SVIPIO8Gpe0Jsag+A6dPLxOpRQqd8BCcGaF5JgRI4ZqQ/IJkYyksC91A7o8MPpRWDFYOYT0u9pfeInL2JxXNJ5F1R/ikUoC+5I9rRRB8Hk4lkz0jbpGCF+88YJKKMfh5EDq46tzUc13HTuDGZO2yYsiXSzCICjKIofytPn5+fn5xfnm5ubWNrRur7+zu7OliyJEUdTtdMj3TNqJEgak7EF8j5wrSKRQqM5MJUrwzzRNSclmMsHuBCc7H4/Ho+EQ/h2N5vN5KmIQWHFDPQfqrk7FdtmW4YROz28gW+J+pHzTGCuxrcvmkypxQYzbMgVUnbcC1cROp7O5sfnow0dAFn388e7uLqUU4lVescI2OrqWW1sDBnkbOcyvgzCv27q9UdN+C4vJWL+aiV/PzLwbU9u43LymjOIIAhMPy+EI8SYU7C2rQoUC3VQfsYBd58rFVOlKnmk0QTqIrDgj7924vBBShIsjsk6FzAiijMK8wKwZeXb9ydBzrACuiY+uB+z77RBikJXtAJcJrRijGsZeNtE71ZYocMuFqlWoGetqrqCMWle1ZNV5y3vUdNa6T6YD/woQJX0AErSgrEEgjKIClQqQY0gIUjV8AhGsQ2nTkiT4FWWUJgxML8RK0+sRt27/oNZYsnzFB8Z8DBCEk4HmljSYifiHBZWs0NJQswEwtRHVycGaH46GUA7u5avXr18fvT46Oz+fTqdZnhcYsqWjQfiWbGuUtAGEzPdhVCrBOauZuoC6VryOCZkAGNnm1hymlURFLFcXy+CbYqzNTHQaZxMsVE5Y1NOpNQfUdUqcVnezHQOdWRvKTW3yJVg5gG0CyaQVCeRXT0+ib9gTNZYOJMxWczGqlqcWSgCBPW+xWBCNs9VqoXs2Gmxu9I6OBhsblE+4vb29u7e3MRi0220okAC4YgtL6gW6IKSyn4h5C5F8yhJEoC/LssVikec5SchMZ9PRcASyopeXw9EoTVNABcdjQAV1wqHstPJ2SFRmmTtU/7LRIWzs8+SGm32Zpma9dROetGL8xk1XXF9Sn6fEId/3k3aytbX1wcMPHj9+/ODhg42NjRD1egjnXEHAaaQJrFAQlXe9RgLX7e/RhEQf89V192NxUeVT6SmP4nhaGMMkw6tDQkJQgP9HRdF0R0aVUfvkbuzGhErNv02taazh92LaUbwVs0+DnUjRO8UVb7WKvKhgdsRoI1JG8xz4EZKrco2nycHJdQDnR7V3xCHkWC/9qcp3aWfHJohqAmSt15ARwNFWcovm80Wa5b6HFZMoeIFBRFq62GhglF9kKhoL8sqcjWs2IXdD/7U8M2JrK7uRyjfRdxCQrjzfj4EySkKGbD1ywVC1vhtlOGUqKW+QbUERBlq3dfvHNMuybPqpThvTw03n4ykWDg2hBsAKM4eNcKUT3OFgkJHuoDiR11rMF+cXwOs7OTmlf0/PzobD4dkZ0P3m8zklTkDFggC0KEk7hERDASOD2uZGs5RbFEUNMVFtyMK4x/VfcY9wQ5VtiPUlbJ8ODsCuAiYNqqJPRJvUrpEmnVouBDw1RTZ3Hj1flZnVDP+IZhK6TXve0+mEbiTZuBj8i0IsiUjFXsnKTiLdRHjOngdZfOLxUq8wwK/KJPc5lUUVG0SvHcVagOUbgMg7rJ5hGLbb7UW6GMbx5XDY63bb7fbGxsbR0VGv193Y2Oj1+m1sSZIEoPwM2phVqyoKWEFACTTPSdqUMEkA/bSaaJpl89lsMplAuYvxGGrNp+l0Op3N51majtAnJJZyXTyG4+vsMZrIhX52zoNqrOrO29RTKwlaN/hqjTsjPVVeOoUPr3TaCPfrRJ04icMgbHfanU7nxv7+rdu3Pvzwwzt378RJHEVRBytuw3UG8L8rZwDnm7pb6NBi6wHctXW5bj954yQdJTXPcx2T+8n1E0YXOV06IVmxPHyUvkcvEgQjvBYUze6223G7g+lCYOfh2DfnVTI1dFht5FpAPq2OkinKXmhtWFlhNLXW8N/i0onEzmfRXAA0VL0wBFQTQUJkN1StOEYmharHaNm7eHQKWCJsoZ4YQa1rldGfoIXv0iAzzGbu2aojXlc0SVJGyTCg/koGhFIZReWAxt1p3FzZI1cXcWq4Od6xhgw60RMR0aehrkYyahyAmC9BDMg0UMaiQeARYoRtNH2Ug+4c+FlD8uv2j2rLIH05oBxYgAVCJOJtHVTAgNLxY/W2ZfYxj192CMkuJ6bocDi8OL84PDh8+fLlwcHB4eHBaATVCrI0DXw/BU6puiBnElCyk8RNsE/Ht7zCH2YaktSR0Xrjegv9jW1wQDUEx8+0PDn9E+jxlA3n5bOLk1H0TfmlDmNC3DhfiIXXmg3sTQ0fQs9vIq5tHsuy2dWkTzaG5DTsim6jumYwtnDer/IcaEy6gIfXahGOh6WzwEWczmajJI6C8LTTAb5oHHeh9drthBzCJEkgBS6JyQUKo4jIupD1iVUiyrJMBUhIXuJsNlP+Ibp/KRJKAW3GxkHMOprtwLYcO1AcabsjyQqN3BShS6DH2pw1VcW4G9URQnMB2gWl8cK/ktdKj5QW3zAK4zi+c+v2J48//fzzzx9+8HBrE2rQh5i7oW5kidnneLmNMd/6hxXRpbVxuW5/oyYpowxyQc6CVWzQYAyGra3i8yq6qaJpCAAAus7VhJSBB0PaDDnbDmbP0NXuEps1io4ymugsyK6FKH41k7WeAXAqpqVZiyqDyhrMZ7bKqFnJ5LlQDt8BRdaj9ce2d8QhJHqnW6Jd+4QaXtdY3jUpo6wpj2wWhaHJamY6O58rNTUe0zhpbx5ulMWcGMfTNCf6W92oBNnVQ9D+MfDI0SFEoV5emzHrBpJpTBCXJSdoZztmT3+LCWzd1u0f15YhgTwwuYRg3VLkD64LZOAqi3q37Oxs46a6naNmzMHhwfHR8fPnoCz6+vXhxcX5YpHO54sW4HJhBVRD40yqdYyOV0BdKaX1a58RFVPU1rr4jSoew8Y9gT80RPEAAh2VkgUcONNRHrQtSOXEMo4lscIi+iExvc5qZc9QPmHppDRZ7dbzNyzE2jQOTec00t7CFbxG43Ijto/Ep9NAqkorMJdErwlP7WMqZ14UYQuoWHmeg6OCHhqaYz7JOUDddEx4C8Ow1+3FcRzFAHC12wkhXWEU+Z6XtDtQ04hoGlStBN1C8gzJGyyKgl3BTLuClGbI3U92/qUMap316ZAqnRftpM9J/QYONZqClmJdW13ZiSVzxNtQ+Y1oAZZBCGmZZVnGUXz/3v0nT5589tlnDx482NjcCIKgnbQpHYq4ObJ3OcdcRhmtj/d6JQkHAl17g+v2t2hmBMlSQNoj1KJ+wvzSRp6e2DWhnwcU0j1U7WnFC1MrWOD7OR+bHb836dir51ctwGwuldEFVQdXTxYm1smyUrh93moRBYOmW+DOZLlOz2pugrniXGmzYb9u75dDaIJ8/I2Al3kb+A9iZNY39nGUyqhYYhdzCNOi/KBZZvRyQuYBr4vWuThLhJX6msysK5vle4Fivu/UCRNQgIYw6ROIOOnKiWRHIcWcVEbV49F3wf6hRhc1U4CoYVplVKUUrsfbuv3D3T/6UyZQsfHnQCKNbuEyuMByTpYsLZrkCUwBIou2Wq3ZbAbc0NPTo6Ojly9fvjp49fLFi+OTk5cvXwDTL88hb76ArDAoQYeJgqxnDOg93lOB1IM6DCgvg8JPJQ5rulbWFmczA0cx6iFjXWP6nsRsRBKyqUKucTzF69HcWiuRjN8EhZwpE9OcT+qm69nW5hQ1yHHpegNNcyMfUBsd0h01ueI6QuU0W1Tm/8/ef3ZHciRZwnCGTAWtC6VYiqLJ7tmdZ+fb/v+z552zs9PsJlmSpQU0kEgZKt9jZu7m5h6RCRRZZJOo8OkpJlJEeES4MHHtXnXJ5mLK8Cel32XGCYMbyZTxGo0ojojsT40B/A7o1+O2QdXaXjAB6jzgeAaHMG6COCG6NJDjghetZndhwQfXMWp3OgT9iuOYSH0a0ymJcYFfCBQL0wnRxmgdQpagABcR3yT0ivS4WLKinJQr+0vSO2JbzZlT1vepylw9KXX7qQ/ltJt1dvopZeBxxFK5IDCytlpEfx0Ewfr6+s0bN//yzV/u37+/vLzcbrU7XZCaYCWMWdKI5XXAuTr+joStftTEr1vdfn1TAA2l9mWxjHIKg5dKpoZmDQozVn0/09AA2gfjKG62WkEUkqCnp8VIeaqY6Y8W4UzgnJwdpW+UYOG8PCsNI+1/stHNqVBoVKqghOl9H7UTUSWJaul9P2rGcMyAyumFDWzVUTLIlj9Q36xn7ufuEKrluyq3LeWVFdJ5btPbjdnYFBHLFGBStGEA2pItDZ7V6vumS+aVCFLKdinUqIBPm7SgnScXiVHy6xSDhqp3xE2ZfEPAoSHLKNeKwNao+qKEYLTJqAJRevVRuPCaTKZuf4TmAERlFIZfVNU8cAGGHvGGdsXg5WR2aBYyjaXDkyTJ83w0GvX7/bPT0729vdevXwOt6Lu3BwcH532gAEEwjCnxoqjKFDFybuqSs/zmy26lPNbie2CUGxoW4+cJHlF7M9cRMlGzUr4/KlXGjJ2VIE8KCJv7oqNT6gziA71DA18OZygdk4JuvbTFrXwi4/BLyUA9BsyZnGck/zKlOeJj8XBJPd7JOio7hkcCsWKSlgPdJjw0eIwh/UkaEjoM4Xt+mmVxHMEL1J/wfX8MbeIHfhiEYL3h0kwFovIOyKAkee/k+1HIUoFF7dglN/paZfJQ3hapvsjeIN9/GQswqWzN7W5uM1y44sSfkxhUNT/aH2NVDKwGxDJCP2h4jc31zS8ffPm//uN//fVvf93e3u52IbnKaB2J9XVOVL5AxyecNZdrpGjd/kXC9JwGlLqzQoZe+YAiF+aVF1vC9uMmRrwR4AhiTZBeu+AvCazQAZILwBW203fBFZlg3SUu36ia4WKlbVYMYEFOQi1ExbShBGU4RGgq4DX03Wx+dSXTJ2lXwSFkVvYLh2Sl7Wg+5SmkDUIr6KgHvhIxY8SXdRwrNVHd00+02SgAlBJcpP5DXJtVs/Ic4vgebsDEQQWQUUPFoP/LDidbQ6Rcr5AJFnKBUgi19Gfd/oXNSRLKGeckNKhZ810wVjsFhOrLioJlpivIrxnUl6bp2dnZwcHBq9ev3r97//YNuIKnpyg2qDg/lIkuwAQmU2FZuoTadGB75UwIWRFOub/xivQXMAtI3Dn0j64VnrV/C/dPvdDrQAUkXgTCxH2uOqBaVvECG9PcejRSA93x4jS1AoAsDH7R9Fx8uSJW5XbP/tCbGeSWWA/CXbBDKBNNeGt0ZqzICcRLzDzYYVAGw5RXmiZQix6EcRyR+FZ/0EcIf4Ba0gpZGgbIA0H4fj4XOp/l5viBc6QFnbiJdceALhq3DxFr4JnCqTz3hxyjtPgwZsQ3Nactxx9M3oOcQw8EQEiNcHVl9csHX/71u79+8/U3W1tbURSBNyiQouwZOidxrr0cG7pMxaCsNC6Pl7rV7bdrJvElJpdJhSnX0HbRwAjVxdxeAzX91FQBk08XEdKfNJkZ/6B/dGkfzqrtnvWNC2aNWbV1kAvqIyja1WwqMkSg8gLQ/McXJtE6ZizYS/+wblfOIaQYiRVRpiYmgFzly8Jf6ji4I5L1xvF5AOakGWxgbNDpbUnl3JyjVDmCn2CPIXCnLHkxWC1dn6xZf+mLlPGgtabIgV4PlCeA95xAs1rqlJ08xrjqPqsKH+13YrkL7uK1N1i3f0WTGDDnHYl2q8SFssthqCkqkwOzvcEsg6otD6kmmcZjNBoBp+jR8T629++AQ+bo6Oj9h/enp6fj8Zi4iIsiR6VdaEhXaTT3FFybakLmkhJrAkxb3MnzgA2VauwBJ4pgUtx2KYYqGERwKiPH5CyRbic7pzwEZKuTeR7CNQmAueItFsuRdrnFvSTfUq1L2vgmshAF7kX9KSfXCMFjq69m37eem+DVFCE88TH/WoUDzD2RUQZ9EBP34sOS3gZX4xHqiU+XI0OC+lObYkWRpylkdHMfSgGJIZPuCRX8+D6osUdRBGE7cBpjQvlHUaRSo+gLMXkM5wllGnDOn2aMWSEG8AZBJoUIhexM9YVsnGiMwoXIPLN0O7nSDxEoerB5DUgDah8SKypb4BhjpHJhYeH27dvffvvtN998s7q22m63u90ukrKCUw0+cxAawZUZzUkyV3a+PLvLucTaLazbb9d0PotrAeFNFZzHpU1F34xFq1Yba32GoFGQ5bAlMcIBIktxHIRmpshFgGJv6st2XI1fl4Al/BX+hkCWWK6XElcE3aOq/VOz2asXtK4SZFTVzONG5vtBFDenDVAiZe7+kmco93e9B6ky5othgHW74g6hNPLcMU1Fg3bkz9QTloaOqFBQEWrYsamMRO1F1UFK7okzFz6hulEF5NUCExCs1JKTIRA23AOEjOZFjhen2EUlZFSXB6pAC1cKW4A0Ljisc/N1+1e0yjSg4wo6aE85HSvTAvSCeaHmlSdpzTTKDQKn6GAwHA7Pz8+Pjo5evnz587Of9z7s7R/sD4agE4dEI4ayGMnTKlYDw2hpZ2PMtWhYq/ZkNA+dzlNhHlCxR9IHME/J7jf4dl0GTN+9KEKsd2i1ouqaEziFxBbikkOBaikibJxKmdWhqjOqMWTeZioPUz+jqmWZ2MNrktSg5hOJ/lWro/rAJDTJ2jH2jvqqecrKf9WszBoHKsi8DJSWbyljSQjvBPzvJSeEGFN0haeHwh54MFCHhZBaTpp7kANEVpUgyENw9ghECqWJ5G1qAKrjEJaxoNIbdPPkOoPKgvU0FCrnhYO6dIaEgiVrKjJTXSAydZYZSjELBK0EfsAvICeKaVKv4XW73d1ru//j3/7Hv/3bv925e2dldQV4JuzK0lnMojIxOCsYND8me5mFom51+7RNLV8m+4czSQHXsf7bfNWaBS7onRYwLfyAeFEAYNNsUcr0iLCQZd5qmdRYsYruWbXZFu2oWKFFeoLrDVRiQvN06eYEp1hKUXcAIaMqopUT+AKX0MqZaKsH65WMN8a6fdYOoW6WkEvpQ6dopCrs4LKMqmoZ2mp1DMdwA+rw+W9bhyD7yQAsnowqAyBxn8ryUwF3r+GR5gSBCqZEx4rWCXwOlUjq4nWVjo6+a1NDz3Tt7NZzrm7/iuYg4pwXnOVw4j6WTTkDJyY9hMryJCVbR1s1eoPEKXp6dnpyfPLq1au3b9/+/Oznt2/fHh8fn/fPUVIcVMuDIMiyjI5J6gLllUH20901BYOx6JBJ5qtsI4rHyB/Kw8N2qQGNuEcrt1Nj+TifY8I9JLtqTqfWA50d0yBBTWjMIbiZ/jbH0rh3mlZEhbJ1lxTBpzoegWvp9IZ6wQr6uSEy4xMaZK06lr7RUkiDV9QKaSLtjOv1VowrjedUGwQ8CMspkn68fi7m94UHLnSB+kbgHekEcpgFWYC0pQgeBWdJacZiMd50Sh5hGSBabkCMbefuTCUO9o3zxvydskdUzq3xc0bIjBu8cJ6+6qS4b34AQUkwW8OAdOijKFpaWrqxe/2br7/529/+dvPWzXan3Ww12akuckNXMx/FzTekDP6shIyW4QZ1q9vv0KTBJoTpbVQmUyLrPcOuC1BUpPqQVIZN/zOKSfh20GgAdp2je4p3pQIILpqOM2oBMjfPUjYDTVU5rzNkQ5oFkK+Msg7TnGZroxE3Y4pUActolqdJqjlRq7cVt+PagjXM+3VA53N2CDWXuBmMBjDNw1knrK3Qu3scj4KwvOFOpw0UDStAhEqHYNmC4cKGqi7NHJF89kvuQ3JPVjEXDXZitkB1TkbUYNIe0aHqGNNp7vuK1Q1sMG1BGlyZwifhcqV3erOnatJBpQFVJwjr9ls2h/9d/lsmr2dszBwHj2M8NIBZ5JcOwkSdld1IkoSilaQHQB9NJpODg4N379+9e/vu5cuXr16+evPmzenJ6fHp8Xg8yRHJg4IBoEbAFjxNeglnsK1Ss+kGAcry4pJDoV5akHSeRGERpjJ9Z+K1SH+iy9zMcqRCOtrrguULyFEC4M1CB8H3wF5X/YJl0PN8krKQmdgiV1BDeKFXAkZWgGeO+CVy0dlD0xkq5RZK2XSxWuoElPY+C3QbVBBYmxT6u4yv0vAIuaLqRU19k5+07Q2ys4hBeVrzlX3GCTpLgJmj8hropf6jrByzMDKOl50TBZrC3QS+mCsQPm0sUDuDGTM/SZFyBtZqzjTSlXD2T+5fMjHolBeWYxwKrqazxBpuZQZ8eQowCtTx+iTQ1FQGasUOHDw4K/FZR2FEir7tpTbmhBVIeKHbvfvFnb9++913f/vr9RvXl1eXF7oLTLSjyPTxz8rpWX6TN1aufixTy8gX5Zx8+Zh1q9tvBBlVwTWdexDvSJJkeJvsNJ2LU4C1HMirlSIahfa8KGz4gUHm61y9xkzQqXBvsaqrKPZmu3kacSLXjwqEC3/DnjyOJ6fL0Y32tYKMRhHQ4mM8jYB4zWZs1j2VTXRzNwopyneMfOYaMvqr21VwCI0oghpxokpXp7UgOK+H1Zw6AdJtR4kpNRCh1h9j6kyFVw7wW9Uq4v1PstNY86pcNyMnna7sEfgh9QqcQyjYhWoWRZwh4EPGXBQJT8nLqqBepnS4Bo3W7TdssyQ9pQvB0Rke747Bx1S6bEBX2oizkhtSJ5AqBtnm7vf7R0dHL168ePP2zbMnz169fvXhw4ez0zPSE5dlXPRbOiQXp5WTnDpcRXpuvLsq2RcH98B6chxx5QykMsGR1ROVAqchcnw3ptMgDPELQD9APqbvB+AOYhpTZCMRNwBFg4yPZy4X7fOQ8dHA8jCtlozqEa7fxX/xu/QMuRrZsshNSE/dDcDZShulIoenmBiYAEzGsEpJLXUQ2TNxVLWyicShPSR0blAjKPQuI5x7J0NFhzYIWy7PxgdBRhFJeKjkJx0VYBzTbNoIAnLILY/FqQ+0soKVYNHqYnsFV2O3dtZPyg5V+VMR7zDfpMmHPPJQsKB0cHE/BU0OYFX1V1eW79258+//89//+re/3bx9a2t7O24CESsR03My88Lo6mXygfIdqSni3p+61e13aQbhr/07k1EHGL6TuzZ14zJQqnAKelXzfQ/rkkV8k+oGTRTVyjPKplc0u4+89stci9YBLK8XF9uFIpunwm9Ehk/C9ISCyCRktHJWCnFuYDrUEkS1Ufqr21VwCGkoQIk8xlEovyU55kzKa+545Tiu4mhCDxPF3EXo2BamL0W48YTCb3QALb9kyxGdlkl4PpKZGRhjwkWlaExxn1ZBfZZvoolGhIcSdMf1M9xbPi4n4l12irrV7TdqzqxxXkiBQWeWOXkA9gzLpyibj9wcTDi/Jonwfr+/t7f3/Pnzn376CZhFX706PT09PTlNsxRlBtICBLapHEKa8iS9YK7FzD4R6EEVUVQO1NEdq5sCtE0hYqOpyoa4+p4iS+U9NYxCWgbBFCbqOVoQGlNiu5kWRRDCCw+rvPD0ObiRucr24EIKoSW685jDhNcqU4QeL10GrZnaXLEeiOqvTtLyDZG4Is6BGqUphcdUJLEGDClur17ANXaivNhrHJUcaCrAbV5Z+UzzLekkWmaa0IQVQ7GCs8cJyWtcC3Ue2BTgX8AAa2MR4giA8UfTkM9cFpNw3EL5vhnbRntSXBFJEunCnTmIFXk5BsNssqll5x/HAOhlQ6Q/DEMw8hqAgqU51Ww2b16/fvvWra+//vp//vu/37h5s93ptDtt0uSE7yOYdg5S1DycKqSokx2ddYRZnmHd6vb7NFH4bTVLbcI2ubiOieELejHXdIJy7ysnw5m75uOaqEeaM1/cHKFZhN0YKK35+DqOVMGwh8xtaZLQMieW+UuYmzVk9FO0q+AQmii2Huc2ZNTaECjK68Sw+SMw+/R+S2+mWZqjhcQMbpRswLSbQtEYk27GQPzlhQqlLIl8KT1DraamciEockZBWfw2cb6hRA1iRsXiwiamNL6NgWU8QIF3r7Cw61a3T9Vm5QZ5O3GCMmynOtwwZPBZKMHZpiEdkKhEUbVFqc+TIHij0UiSpNfrvXv37tGjR48fP3716tXe3t7R0dFoOBqNRwQoVWsImbPYESiCgiCTodZkjLu7LIi9lvwuKgMm1APyl6isPsARSYyBkRFq7webG7J/nk8IPUzFwAGjKKL7g4A91LfQ+y3J6DB9KKE04zhG7fViWoS08oUhdAlRBuqXJBOFtCg5YTMKTIeSQd+YAiMXUqAwHoEcKJWtdZ4Ic98Zl0YXMMP14qX6yHCMNJdci2KeoHro+Be9p+6rNmX4jNreEp6Mcbr1s2AfT3+ZeihOocsybWQm3EGV28JRQJaPoT4QKWsA9HrTgi5KBTiIAcKHrTnHBKwEiLguH73pFBY6ee85Yx5jgybqYXtHXmVKTSGH8cKIY4mVpi29CtTvbTabSnG+Ba5gGIYLC4thEHzxxe0vv/zyu+++u3vv7s7OzuLSUqfboUOFYaSK3nGsVvZcTljpDcprr6wSlCuDjCXVucG6/c6N7EUp2aI8PL3uMdJTlQfYY5UifrBbYbkALYm+h2EkUtLmKeAA2EhPtRoRYMq051irbmWhM3fciiIOlxkst0JHgCnqh0CwbMgafd+nksIgCJn7nhd2kQQRl4PXJ6SS6rn8eTuEhu5E1Qc51pWOxdJmQLyjsyGjBvhERgzuZyp5qAWR3PkiUU+lcOllwpzzL8386R7FOaYBAKHRZCCjFDnKs5xEyUzQHilYde0H+YXaUrJMCgcyWre6/bZN1ibZ2Ww3CUBfkOEQGSItY7xnnUhjOwHkSa+TBBTksiwjIpnj4+N37949fPjw2c/Pnj19dnx8fHJyMhwOpYw4FRli2kV5azL+wqekHhtlPVNrpxJWmuVNacQzfwdObXV1nASBGgy9PNEkDqH+CjxScEUDoPYGMB6KGZAQeBAGJJkDF4gVjxidVZI7oLWT5eTSKuQ5XlFRTIMAat3MzSfEDvYsQCdWrkqkiWy7XSZ1o+o5dRmbY4LYZOgquadjUhCPK5siM5H5WBDICpOmh8LEENlL5bPx4JAhPwvgao6CG4qy5OgJchxfcwAK6VaRa1QpT8wQ+uRtgZ8IZ8wQhKuftcklVzTdsYo8eeWY59tF6cHydJN3pzo6o0WYKKdnHqhmVUX6UAgNEJuoB2C2cGlpaWlh6ebNG9999+1X33x9/8H95aXlTrdL5YLwQx15nN952Vvp4DlOqbwblfWEvypWW7e6/YompPZ4laENQcX/+FsGPSFHNStQ85BGLzHE5R2Xbn0exy2czk5OzqQMnJHn0D2hbkhAgl7tDNeM6Ln2OXUAkvw+tf8iaJTM18ALqOiw1Amm1sGJD3FGW4qpbp+zQ4gbslfY1TYWZJRFLucW8+m9RNUesT0Ax1XzsyI7MVPQ7KKMxGWvToaFtEqpukJxnQpIhRwGFKPW9cSUK1QBeV1noguRrW4QikvpoFr3l85VJ+Xr9tu0coxffuT4gbMYETn1JN+/8LzOkU3mpCiSJCHncDgcHh4evn///uHDhz/88MPp6en+/n6apqPRiAxivbVBblA5LeQFNEBxu9rgltVoZlfVSSTtYSolN42W5NAvvMAEJoEXSKiNgsSeD7TjlGaJwyCKo067vdBd8AO/2WyFUUCC6TjdQVA9S9M8y6eNaZZCDWQxLUbjZDyeoCc8TdMMBTPAXfS8AmV4PABNoB+qcrC4sERx5GeAL4XsEBKgkqsA3g5u6mVf3dwTHZYSwTVzq4y3bNJwZtio7yiNxAreUS0mxFw+fGiVf1UHV8dRPyvDld0/dcBRWid8Wm0UcRKR0St6U2GnF4saCsDcwm2kADolI8u+jfQDZVZQX2uFw1PdeR6AtmR8uTk/sbKstjNGt5ryw5Sdphhrs9VcWlxeXFjc2tq6e/fOvXt3b39x+/YXX6yurk6n02azScQzIeCT1ZCmd2b1x8wm5YzbI2HGi9rxq9sfrbGlxZUA9jqCCxq9ELqsokZIx+kRoW0wDRokrhhcsFGhkPo+8kpdBByd9bEpW9BF1+pdw+Gs3ygfi2EyrOULwvS0Snv+NC+ylIKqGjJaaW0S007pLcqW1tbpZ+0QCsio2dRNrFpukGJ/nQ0ZzRkyOm00sjxDuUxiVLMikcQfKLP5ss0Cg/2CqzMvqHJDxdWZBEZXFGlrUc1LX8GrsHAQZJOB0BxtQfqOJn6iahBeR/jE+g0laYZGEr6la4TqVrdP2cplt041VJlTVLoZ7EyKvMrM+A8dmfYkSJ7nOSX3iqIg3fk8z5MkOTsDqpi3b98+fvz46dOnL1++PD4GDfrJZEJpQ1gf0IqlnygYuQYTSkJRDiQxwE/6gTzJCfnZCKBLsrA+zzPEK2DZnpbwQ7xNEAFhDFzI5uYmdX6h2/W8RrfTjqKo2+10uwutZjMAwoEwiiPaykkjkWCxaZpkQIfTGI8nSZqEYdQ7H/QHwygMRsNRkqR4XYCfJz8wA+GNCYBFi2IySaaNaQ6nLYpYUZ6QM5CT2CDmjZgeU9sD9Gh07gvr6JSRbywXY8HgH4WnCiztt+mlyMExyJNhHeoG2y6cAX2KUkLh0nEppztyzLBEj0dGMaySNiopQJtMO/9qSJIjo4YomWYqOwgcrSh5T5IialWnszGsV7LL8ASRRLs601Aa/DovYNKDmiiIMrryenkSyVQkA0TJJKVNkO5zFEVNbduRjuLa+nocNXd3r6+vrd24ceP67u51+Ofa8spyp91pNBrtFpGOwt7EhKKzXEGnSZpTCXZ1Cgida3G+U3uJdfuXNA2LMLEkyhPKFUfFyjR7gxXrQRcwy4HDDO03kkSd5rRoKFgmasPwRgMMVoSW196gDCXZOy+deG4zpUbKNDVKuRVIMgkb4fkY4KKhmQsB9xEEYYyqM4pZiojL2OA1RzE9N9ha/c4vfSZ1uxIOoSZs0GWD9C4X6mhheokFndWELL0a6BzkluFtNuZmZdPdbcbeZX/BVmRt7SXwgDmpdu5wiVCkc1iBA59nec4VLAqGxSLFfBiFUDAUFiqGbl6J0FTd6vapm5OskxQy8h3+svQGnezTnCQhH438QM/zwLvT6NAkSUhx/s2bN4eHh//4xz+ePXt2dnZ2eno6nU7H4zEzjlI9BkhT4HyjzBtRpnBhmHQIy4kd2uQNrRNdgam14/kIr8nwxf+CcxiFkZYoiJvNZoT8je1Ws9tprSwvbW1tLS8vraysdhcWoziO42YYhYqAgNJ6Klo0zeDa00bDm0wmk2Ti+41+f9A776dZet47HwyGaZZOxpMkSSeTSZqkeRyFAB7NQ6yCw+JJPwxhhVE5UgITaiEEuiYAqQrlDxWeQ81kmR2UbpizRmJJpR1o0/8V8jkVyPZSuk/ddUnfp6LqPPDYSrMtIxUXvHQKWvhsouMCYor1P2hMFSqRCuFzlXo1Q1oySLPChCUBb1fHVaNXlB2oRb74/po4v1A/q8ooyj81ka+qTVUKijBEi3a7vba+sbKyevsWlAvevnXr+vXdhYWFRWgLYRQ2cTRCelAEeubPWRVqESuAfKxlmGj552VXs/YJ6/YvaapOh6I89AbNy4oRKVAQPKitJUjxHSt7VfpNlDzEdX5OV1zBiTnNoApcE9f0Z0aOrrymkyw2vYP15/ArUDNCTDpeioCMzohu4XaJy3itkv2r21VwCEX+eLYwvanPrdg4ZbNwTWB74XeV+VgiISwB2MzphEXrhCQ/qp7Q+j5fo30QHX7W5Hz4L1mousZYkaaauLIClsqMoNE6kzcVWRF8GaqpW90+SXOHcQmkx9OHBq30FR0n8JIVg9QkTyPPiNFoRHLzo9Ho9PS03++/e/fuyZMnP//887Nnz/r9/ng8nk6ncRyT30hJRbbOVccIwEbTEIXoqTRCrga8gKigMNP7El8l3hPBa6WuhzKCgQ8OZ6D4NmD7bzabrWaz02mvLMP/wYuV5S1om6tr6+12q9vt+n4IP4ZqLvQ4VBIGXRE0soE6K8uiKJok4PW1mtFkkgxHQ9/3h6Nh/7zf8KbD4XA0GPX7/eFgMB6N4cVwmCTpeDIZjoZpkvaHw9FwNEmSMAxTbHEcqxdRlPt+lmdAloMmgAYpgFNKySrLENLWUckZ0xIOoiG3KpGPU0Bc2Ss6roxEOGIFpdVN5ek0kbJeQtVp2PErj1jLRxKOU9kYKvdfe4Ia6lXyRXCQYxYWRz1GH5WCI2dPpd6g0bQo9dO8ELE8vgShuGjmiyXyORtrymgb5n2hWkGafVEUxc14fWPzizt3vvnqmwf37+/u7q6vrS0sdPM873a7cRyHYdjutOmHNCUu5BTldAHtbVLg8cL6wArSV5tppvKMdavbb9uYDtnOK8iRahiTLaS5JMhQsUJyCTntwUXmptSQiK9lsZ1avAxiQkeK5nW6qnumJEt1quQS8nTLNZBBZf2m00bcZCp8QuhYC06Ve+lUDPK24bKz1u0zdAgNR5MG/qggBofqS5vELMPRsu1wnKVItKBLSowxSilHinm7kVRhUnCrrGe4THjS2rCnRQPhqxwz5qJdNopFOQfAb4A8vphCiRCWM2maQa25rIPztNvazFds5XDeQsW0arewbr++OWH+SqSo8w6D4qQTWIkdnXVGOgJ5dLz9kJ7EYDA4OTkBDYnT04ODg5OTk+fPn7958+bnn38eDofENUqLQxiGJDnYbDblcgHATiy3M2IMdqqTYZMG8moyUWjraqdXIWo0XQcKSIDNDSRscUzk4u1mqyiKdru1vbm5tbV57druytrq+vra0vLyMjiHK81ms90ChzEMIRUD/FhoMvhYrG/uP0I0kW8SlgFM8mXTaQMd3rwocsicwrVnaZKORsMkScajUe/sbDQcDgaQSDw/P+/1epM029/fOz3rddrt8/N+MZ32ej3f85pxPJ5MSIMOFkxFfNMgmCs4zmipFKhDZXJUCHIoP0F+zYOHEqcK/44+rnLCNXdqeSTg+oiRsspRYtZu22orZcwqiiEtSwV+S0KCWg5DlIOSOq561rjuQp8QGZvDFeW5kkFiPCt5gzR6La/O3iYc8Kq8XdQpCliUZ1/FfNRAtQATwgSuxpGJooLoBLZaMMDIP8zzvNls3rp9+6uvv/nuu+/u3bl77dq1xYUuaA/GACiVAFG6qWEQNkIlUzFn5lowNgGfky/kRZUfjUwP1lnBuv1Rap108TS9VxkVdYxGGtkQbUyRCBpWBiKGaKQ4PQlkQos711vjvxRVUwhT9Y6IfJk5Ni/IVKIBY3dSL9+lAJxBweDEV+xTCHIJaTsjZEEA/Gct+JoGgVfi0YyRb8Xx6kn9a1t4dUhGDWUuNb0FUyJZV8FVQmu4UZSC+QYVXbz7HS/LxInKTh3Dkkp4G8cd/ZUjmOECzklRW5p16cHJpRg8UEeoXZM6riCjLO+lJ7AJHPE16jPWrmDdPllzuAEr0+mO2GA5MXjJ9KAD1+QwZJZl4/H48PDw9PR0b2/v9PT03bt3Hz586Pf7r169Ih5RTgnSb6mAMM9zyhlKcQszi/RJOWE4Z7LLnCEdR7GgYJ098ZSSlqCPZYTQwqANrbWzvX0fWDq+2NrZWV/fWFpeihAe2mo2PR+csSiKw4iyN3A4ggVQUZ8D0DVgeKyjpro+FOKBImSoEkR9RYLUNqZAugMQ00k6HgG8Nkkm79+/e//+/Xnv/M279yenp+Hqyvn5ObLRAOq+yAtAraNjo6HsBq1JN8CQfzVKRFaCNIW/qe0Kdf+JTQviZmwJVWUUKX87JdyDkx60coNmTdWfqQJFS7fQPrgx2viwxiZSITwVxTM/M8cmu4nz4UATpC06kxvEcexcnbPdyHiEbU1atYjmhyrxYLmR0qOmMUmRFHpNJX9RFCkHz2sstZau37jxv/7jP/7t3/7t7t27Wxub7VbL870oBEX6ZtwklQsKbRD42XAmXdR0nEVbngowpm64GimlOFHFo/9FUJ261e3TNi1apoMcYlTjGxXJDLnLQARJA9nUrmEYIvQZGPmlZs1sg9MGRLgRWfmX/tDN0enI16wqPsOYo11OjmpRhZOSxsWgKrKMQoFDddTOqiJk3u4a/v1r21VwCKnghsDItuqEoOAU4Ow5oBTHxORNlycIhkjVawXX4RKRMjxI7Dplp5G9048axJWlEbL/IG/sFV6BAXgVccf6FIwLUeUTKtNj8ZBtt3DHFE2ihkOV4UP1Vlq3T9UccHX5zUrDznECL+MNSp+QDOssy/r9/tHR0YcPH/b29l6/ft3r9fb29s7Oznq93vHxMYFIpSfJSFF2VtWpqd6BjFSEL5oVwCb4tm10tgaQaMT2b1npFAgYiyLwgziOyQTvtNu7165d29m5d/fOX777dufabhvp+4nNpdVqkdvYbMaM6+MlkOUB+N4yL4gCmftRjoUcvq+44DwPwmS0VZPi4nSqXgTASZOOR6NiWty8cfPdu7fn5+c7b9++fPW6f9778GGv3++nGeRXkxTJabBchBwDYCvVmVvnCSrrwXqH4AkWxgp9E7hSHeSC9BooOOTKyymvyWZ0FVpL0dZ9FpHy8pBUHzgHpH/UO1VnNPE19gWZ9MX6QKIgMcGIazjlAmnxJqDvBeFEIVBZ4fXZDqHJD+gNr7wryc0R4vpRRKlCwnyCunQcr62tXdvd/eqrr/73//7fd774YnlpqdVqEXVEDLWCIHYSTEHvRIlMaDKYC3aTilRFhSVNKpfz/cBKZGnd6vavbZbCniL5M4EwIxWNf9OSQVNXDWG9khDfvgz0CHU+kSNU29TMzlirZtlw5a+V1zpVtVi1GGo4g5p9DW8KsUG8HFwlUJYQCgryLLOSO7NZRsVpaz/w07Sr4BBSjITzV/RK2JdKbkt9dW74kMv0DeIZ0ZbIgFSCjKL9ZI6jaWwcO1USwcmTfdQ1WjBXYbtwgkXzEypudoKMYrgFMVTYh4CK/kOoPlLmK8GY6Gg6xIMrAh9V62hzphXvxsc+o7rVrdwcnJsDCJR+i8SAORK3cxDgfGTpBDK3xHA4PD09PTk5efv2LanMH2M7Ojoaj8cHBwej0SgF7k1VtUWoOXCBtM4EUSlKmXWqztXZnmpfV18dVIvRLom2rFqmyL8hEmMSkwCIZxAsLC5Mp41uu7uyvBwGwfbW1rff/uXLr766cfPG2vrG4iLQxihegTCgxAsIT4RwCuojXbhgqaFbh1NeiMJTD30f6u7AwvCVODh5lQonL4D6OaZPC4TUrq2ubWxu9ft9IJZcXds72G+323t7+weHh0VRNFHzEDXr/SJXXgEy8ZBWqr6BJPOjpZl1sZ9VHMOCzj7cHEDBcjQd2D3BLyQaTFNF4Oa+NKUBs33qw9NtYeEPHkTs3qsVmBx4/bEQeHUGtwJdSPtFUPLhSkzKzGLIGuwY90HXusK9osvQl2ZujNlrZll8whs0LJ2SfhML44Mo0uMTJ1qgdCA8zwPuIuC2pYKf3PeDpaWlALTmv7j/4MHf/va3e/fu7e5eW1leabehSpDygRH4jYgLhf9TJDTlRaA0dS3AmPTlTAkowW9LstRW+qKUJp15xrrV7fdqTAgsWF3MOqbChVrNVFc/KQA5bXjIMkphI4yv5XmSpbgMkaQn6RmKrVMzLFIHLpE3FK5kRXjN+GXKxi4lM/lrvp6hQMuMhQMBmKhBjBFMKmwHPv8QMKNTQJIToXQ1QU0F9YDFz1q3z9ghZNpMnlMqiCL/ZgzS3OYI0/sYAQXrSlfTEaMa4c0ubALN8mulUYQ/q/tR2tjYvFNUclQUBMU5in6AMhuQQqRj4sJhynBx1dEWDwsvm38kmnQGu2rd6vYpywidDGEZIDqfiIK9QUpzkbQgUmJ6o9Ho4ODg/fv3z549e/LkydnZ2f7+PlTE9XqkNT+ZTAg6PplMqDPM6yintlQ+tE+sOmzXNZlEEAmoyWCqTMLQbwMsAw6jsN1ud9vdhe7CzvbOzubW1vbWjZs3vrh759bt2wuLC3Eck3NF/UTlQ1jyFHyImJY1UanMkqlQGi5qVBStXAWxnSN/Gxa88WUiaJAqDwPPmwJWEJCsrU4nS7NWu7O0PFpdXVleXt7b319dWXn+888L3e7e/v5wOEKlwyxFpxrKE3MlOUX3sOAXUF6n7hPngkTojW+v8wb/RXF2AxqdNTZoeJWemzUMTXCd03b2l920Jr2iAL7lCBJkVI5eKJxTm5c8r91zihroSWE+1HiwKv69kgwGX5K8PPmCVn673EEnkz201bCBd4c68sgf01leXu50Ol988cVf//a3b7/99sGD+4uLiyQmofPSCKjGOIRURat8IpV9k4KHSvGodNN0ElZvk2yD1gDRuv2Rm9GZ4BiOxo4SCprxoCaOp6EEvCRqWw2S8DDRhItH84RgmbSQ8SfqKIqWvgr9YHXS/FW2/8wGzSubuiT+ikj4Qem0Cuqxd4qpC1wmvGmRe4iMQNiHHSkzB1Gl16peTAfs6kzhr2xXwSFUk4cho+wIWhu52Tdn1RCyoAq3KsCnRzLNFwrTu+3X+YTzfs2wH1xBCMsGVTS6zkRNGIiGE+ZI5Umo1lAQ+hk7Qx5dA7XQqVb1NrU/WLdf3iQqrtL9k5p1rMUnmwPtntUkMSkFRHTZ2+TDhw+PHj16+/btw4cPX716lWXZ+fl5URS9Xo+yc0QhQ84k940zMJIUkfah6ros1wS33mHNAKmixjZ04CMvaBi2262V5ZX11fVrO9e++OL2zs7O7vXdza3N7Z3t5eVlz/PiZrPABCbdOnYO+b4xMM94gHMfSiWOnVwngiyidGHm47nAMQSPEkocAx/AhFEcdbFtX9vZ3t7a3tp69+bN8xcv9vYP9g4Pz/t96GQcJUla5HkURToVqXxCdbpiCmFu21bilZDh/1To6IGwDt52YtJzG/sLVvRBDzBQhNfjSnMxiMOUj4fWh8FU0OHYLlGWkB06M+hQje/SIOMLyudsb5BPoPOn6l93pKnfKu/RSrwb9KiZdHTP5ZQ0X5ARCow1wIs4joG5aGVld3f33r17X3311d27d2/cuLG8vExkS6REEkVAv8QAUdYwnOOhWePQmUfMoqaUkoxAG2/qxqCu9anr9sduWhJQs7BweEkGpazyapKh1vYeZwqF4ihOGdxWdEJRGXcsKGrmkNWVOZlCs7DM1dPmycbTjtP7pDmklizYLxCDoT9qKsgoAGEaSHVhTNK5E7lqia5t08bn7hCK/YPhPFwtaFXpUJuFMVOQUU0dwWkBhUMSFmGZZdTZPst5j18WnnQArk7CRDUEnPGuTZx7RFJPaXp9NQXolWHawfQQtSSMJhUxMZhppoJQzi7OgPV65tXtks3xNMreoGxy+pApWYnFmz+tKJtH+XzKjRNfFNHGPHz48Mcff/zpp58ODg7G43GSJIwOJd7RIAjoh0QlCs4hCtBLg5V8MACjTmHR4ISk/I7EtcorJq+GVidWn1dZwcCPwqjVbsVRvLiwGEXx6vLq7u7u7Vu3b9++dfuL21s7W5CHQUheGIEk4NTm+eCbVoGQn2eFW9+sXCFDwKCqrBFdRoBVZL7nJ2mCOENIUeae1+4uNNvtbndhZWX13t27Dx7cf/rs2fMXL5+/eHF8cjocDZPpNIRSNNCiCMNGmqaMxVULnX1y6inb//Q3oCDSaY68nGYZawAvNOfOyt6FPcbAJdQgWGU4aUWhWYNL7Spa14futmC2FKBWrTZm5QuNN2g9EpEbVCE4ztfpLUnYZJb3xik+Ocj091hKXskz4dcUj5/ybnUCGeP3PLwp4QyUtu020lYDZHQ6na6urd69e+/Bg/v3792/exepRBcX/SBIkoTy1dTIddQoaB7z1aNLLgtOSlCB5pAEyBBQKXta3S0LLIAFFDoufAGIoG51+5c0JXqqYKFUMu06ZSJvKAMfagHBum4oUtBo8iKBEifMx8OUwXCXXhHUETH8U952lVJ9ecUTq4p6w70MvbGJ3KXwCdV/+SDAkUb4F2xxFJE96kNssYCtAKXqGV8gjm+hx0UHrdhrPc8/d4fQBpVZ4FBlOgiXZv6hCNzSYJZRRMio8nfcYwghpigK1RnnhdW5h7p7n3C4uodiSxtJRql4EFYEJZ8N4hPAtMD4VWXVmWmmCmHktGa0AoNwalewbr+mOdPEWP+C7tJJd8yBjFaegn7LAoOkGEF+2nA4PDw8fPz48f/9v//38ePHR0dHw+FQ6rkxpz9ozWNjUhn2giojPk6eU6YBJUZUbs28WMmEJ6JEiUoU0HkNsMVba2trN2/e/OKL29eu716/eb27sBBDIk4RzMhIDUNYL7PcOXdY4lfLiVzXjXeZ5TD/w7EzcCd83281m6242dza2tq9fn1nd/fO3buPHz/6+fmL90Djsz8aAS6XNDxIm5iEDfB5gO8nab2Ey6puqNJdpX7mhZ2YU/oWUp7VGSXGXTTCQuw5XqogRfn/6JUwr5Aeo8b3E4YM33GubJAoMH1YHacjaAut5IVz09WHSiO3nCFUEBAntUgQXOVGVeHB8J5wcEHXnYLMWRgErXar1WptbW9++dVXf/3ub18+eLC1tbW9vU3kMfSr2B6Ql0FsuhuoJ9L75tGRTKe8b+rOMejXnJc3qdoPrNsfuDGyXVBlGjooFfwSQ17lA7WP53teruEGtOJA/biKZYnFUgIJBCZ1Jq2o3WzHsSJJOM8gtFR7VLfVPFZMWSboRUFN0F7SLKNWXaIFQLWdQ7kx1O0zdwi5aVfHHsCKLNTouc+HjJL0k9pUiA9Ne0E0tomgRdqdH7HVffwVOQeXrq91Dg0TJ/XiAq0rneLDJYLIysE8huIdDRjlYLNCJKiwK+/LpnCfotzqjEyr4ASH6la3+U1muZ1sYdmo5faxdYPyXOxyjEajN2/e/PDDD3//+9+fPHlC3iBhLCk9SClBdiYNRsDuieMQVnbbgfbJCSvpxAmsSJlMihOrVQh4UgCE2el0NjY2dnd3b926tbWzvbC00G53IijjAm0JDLgqVQpJb/PrK6bmZ3JkDoe/wLWUsN6SYA9cht8NwyyZtFqtZqu1sLCw0O0uLCysra22W619QJAOR6NRnudxHOV54GGFZ2MK0StSOVBUNwYV6BgXJi2o2PP0rSaaLUqraQYZ2wASi7MsCiih5quUkeVvNaoe/0droQShWmujcdRVQaEFMNFTAkQxNJyT1m7VRzaeRNaQ3Gd2m4wPJr1BWYFJHir5maJY0ZQDsJIK/RA8Q5CxDRaXFm/fvnXv/v2vv/7622++3draiuO43Wp7PqBJiXE0wIyiGtLavZwZKtWGnQMNNdBfpcWheAf9hq+KWk2meAaMrYaM1u3P1ESsqMJf42Ywo2b8e6o6VyniQAQJFH1MgPLXldZdisTTJhe13qeMpp7OxC+Ni42eyCSYgdkX1L/NFR+bXhIvYhktgQDr9jk7hJbtYompKMwofsFEzS+AjOoCO3oHwGYUMcXvyKwg1s9otShxkPmm2Cx3dH4z33edMQU0IK46lffzA7DEYBdX8wr2/qIIQ0jOkzA9m7Q6SCWE6U2gmul5FIeevi3AHW9dlNPbenLWrao5aTRpCLIDNms2lZGi5YAOU79wuo+Rb/1+/8OHD0+fPn3y5Ml///d/Hx4ejsdjKhTMsZKNKgyZRp9Y9aX/KU3kMgLWkUysXF4oQOP7VEml3kQazympDYZR1Gq2QJw3jqMw7LQ721vb13auXYf02rXtazsrKyvtThuY2OKYCrpQK1UtbuyS/W4AucoTkSqd73tpkiplOADrFs1We3Nru91qRdh/KCYBtMX7FHGGaZZa0a6U1i5vihoVtFCRBgN9RTrdClqlFx5hQnBkz41Uz75FJd8eD2ni0xTfljgpHWyklRJfFcimaSgh3EXRc6079vI4lE+GnVYdlIqA0hm00tGzQpByHknWa4lqJtkGHueEFGX8Z7vVjpvx9etQMQhUonfvbWxsoHffZWQpzR0Gg82avE5XucbSrAna/bUImfAi4J4IcldxP/WeyKqSv2ifrVvdfs8mgoUEtTAEWtoGNcV9CBrgnBlMhzTLlGAsCscCy2iaooAPrB7kHOrFSofFiEDZ3Wfx+PorVrPx7LLnHMqyTV4RFuNrpD7gmz5K/SiGKoCMxgF+E+zVAoTpYRkBQLs2X3XUTCcWqVPqv9wxfQn1fG987g4h88hXxunLJtqcEaPhMarRvqgCnAKRxarWlw9Mzkr0XbIZC9gk0E34hf/GDuDFAmhUYYqg+imHf7M0Q9vCGASKZVT5zTIPqEt4ZCxbwd6M4TWztx91bXX7XJv0AB1OeUdnovLFrGMyDUySJOQf9nq99+/fP3369L/+678ePnx4dnYG0uqCOHQ8HvNrxwMsn921X20/1r4o9kmMC8FxT3k0pnAMwiCCNQeqttbX1kBp8N69u/fuXgfGjqVms0krkpMJvAxAtLwYygoN9Z1fMXl1mo7fgJgU9S3PYX+Hy2yDRrnv+81Wq9vttjst3/Peeu9654MwD/M8931YWvOsUaAWBd4sHxSrgHdUuXYaEljJfmf+tAMImoTGVN5dAGI0+4VzS2Q4rgK3r8HP5KDiOlzqTynCreGfwifEq8flmjCjCqVSRilX5hFETFOfkKAfTEgoLDwNLfGEIASNMRyTUbvdWuh2d6/v/uXbb7799q9fffXV2tr68tIShC2QNd5BLM8v0JBGHveNoWWVO7XJqWrb2Um66gSx/Fb5ptetbn+sZpSyVV0OZPaU76PhpHqWIgbBjHFGf+nP0GIDwKiV1GjIfPtsILwwH+f1c+YX3MPMgFQQfkRRqzK+Qa1JqLQE/NVqCdXQexEldM5GxxGTvJ7vv7JdBYeQ2iUxmZUuovxI1IAo5hghNqUwonNYRilE/KnAKheMb9ekwBeIBWqozLuOMRUFCoDBP0iZQZDRAuI1Ci9KBfqWgDZFerDgRAXA+YzlOuNPZVbW7ao2Z+o5FYOO8fexfqCzAkhO0bOzs9evX//0009Pnjx59OjR4eEhYRRZh42+zGQwMjFY7o+0tmXjS7M/0qYsJTfwQ1bQxg/YEza6cEEQLC+tbG1u3b59++uvv7595/bm1tbS0mKz2QScKCFFsXEs7AL7W3RbatMrd8I8FAj3FDZf/+XDrqqKRfAAQQ8DkJtCNxs+zDKAuK6urQchoGHbnTZIUTXjDx/2T8964/GkKIo4jlLk62qgRiDJhBSFyl/RobR/pA0jVWF4QScZ1OR47x8LstVntzCfIj/JOWTy4DgQoF/QisqmIMO6uKJGOXpKOEgjO2coSdjPmgZrxW4oeG7MtYtsGgc9iXtJUd0GQbMZLy8t3b139979ew++/PLevXvra+tRFHHdIH2fqYwu1JqnjtCeogYw+YFVm4ab6mTbmWXN9CHrLaduf64mxyx6e7LiTopsSqdR1EST/qYKgFC1LfDFAJF8AerZvGhMy5FIObOkMWc0vV3Pz/TLabjmqfrG2dOQ1GsVKTQsE6onmUaVA6F2BKK7ahGzw1XurXPeE1iRuv2adkUcwvmlR86L+ZBRSBToqoxGo5HmABm1NtFZwvSiCGR+4c2vuUxrr7WhUYYqRlECgBwZ4I3QpADiRHRtgWtU6ZJJDnptHeJxZWGJ8QF1YF5Wm8glYmbYvG51K2XVpLPhoNcq5+l8n4fye2SbEk0oHerk5OTp06c//PDD48ePX758+eHDh8FgkGKj73NWkFUuONFBBzf63WL682QsY/aYWJILqCzZ+gaULAaAkoEfESko6X2HYdhstoLAX1xcvLZ7bXfn2p07X9x7cG93d3dpaWlxcTGOoXBQ1QryLJ5xW5yu2u+jlrEqzJPekaJQllzK8oou/6DlHyB0jllBMhgg5RdOOwuLnudnOTh7kCpsPX3x6tWH93vAUIrPLopCULbAHC11mcVyoHecMdL/RTZzt5CFXUehVGH10Hlxuaii9E94X+A7SXgttZDSmELzxzeQJ0KKMrJDCks4mGrGiWpbzLHqdLLA/C2TCgyjkjPLeIa2JiKNK+Ioajab9Hp1daXZbN7+4ot7D+5/9dXXt27eXF9f73S73U6HEMswCjWx7SXZjCxWGK0SJeMU/ETk4FQeq5JZo6csApRVsd1LPMq61e1f1oTTpRTqhT+mWD+5+E4uLxx9y1OC0yMoZtrIsmySpBR3IqJk0kjjLCIdwBIZI2+uKu+nwlfyLeFb8kKrJektD9cqcaI1n5Zxbwos9xqJACyjCErHBQiIwUhtCTnJACIyK7sgV7baG/yE7Yo4hOVQIjVy2xi+ZebSRZBRCkD6wJkWhyTnVYKMzmmzDAsHxnNhczNvorKiOjOpgtIFYEEVkQxUUqGVnKcIGdWqUybOKlPumv5YE9GxfSWQOhi6rxAkrGdk3bhVZuDlR46XJXNxlf/OORH7hOQWgvY5jnkgFH30+O/f//3//b//9/bt27Ozs36/D1FJVKGYTqekPp/nOVVMkT8pHVQubpTlgpKxo1z3qNN+wtbWJjLquTMmFmYUmdMeFFBA9URjOm01W+vr6zdv3PjywZf37sP/LSwuUFVhGASgMKFOoc/1yxKD7AtK5Xc7e8boO70xf7yRrUhysJPo2vlBGECO1A8j8H6jZnNxaXl1dXVpaWlldeVh89H79x/iOBoOx0lCGUU4e5bhSj71kDtF+wlcyKddB6d83FmD6YHMQm/M4lOdfV/VHybryCYU12Wj88olCPASMGGeBxQtfAj8R1OIKieQq7r1V0ypN1+M8dVnhe75AYoFnI9KziYl65D8B4t2VAUg5mnjpaWltdW121988Zdv//LF3btf3L69vATagy3MVOtEpnEoZ9wx68a5OWcx/Mx8Z5+RQ5DEJSowofK/5Z2n9gbr9qdobvZPBJZ0mY7K+WsLlpMBFG/SG41e6GGFwdIHlf4nXfrKFULXFbLPeammVycOtGlZCst/VMupmIcmrKXI7KmDxH+vfgWl5+QHIqDG81TFQUUvpBqtSVTU7de2K+IQclS73ITFxjOrujmAMdprFcuojN3OgYxqHSvqk3qnlFv4iCbsF8sSLQq1ATMVjCgJRrwAatRE+Hw9Ly+KlLgWkUcxR4OY1CnYeDFzm7mQ6byUHDBqVQZkRPeevqQUrmpqt7pdQoZ+FmS0lCKw0Juzjs+HZaToYDjonfUePnz4n//5nz/++OPPP/88mUxGo9F0Oo2iiCUH+UV59XBQhfL9WX6g02TihXBxIKUQEOiRanH5i/CfMAjanc7m1iYhRe/du7ezswOJwVYTWVigWAszJMqTvNAbFNrrivuKC/CUH0iLEiVdYPYrJXh+FqRnxbUqlaGoeU0/O1YvJBYcz2tkoPRYYH1aZ3l5ZXFpeXl5eXFh4aeHj/f3Phw2TiC2HQaen2LNM/wkb+Qeir82GlOkeqYlWks+YPEJr2cKSyoRDtI5Kg2qspM/48ZWvKOOpBGjdCt5NaU6A9oZ1NXr9DOvo/qkckaIrgncmEzbGkNSo/rl5TgvTDKCkg/A0INjHlOvEKrQ38DYPaSpd7a3H3z55Vdff3337t2t7e3V1bU4jNqtFnwMUQybStTep2bcPTeYUg4SURf5YsUT0vdCRyLFfXCMz7rV7U8LGeVmLCwpt8Ni82rw6yw/8PxRuB8NvYzDNcRKJfctc1LWdb24rzxVy182YHjj4Oq4nTBfkTiZ5WQwoJfDsp1R5j8MgihC6WxaOC/olFkBqm5n3T5jh3COqEPFvlj1pwMZ5Y0KeJzShNTn2YbgM0nIqIpq8KFKkWT934+LslciYZjUhYtnGjYAiDBq6MqCHQYY2DzPUmDRmNpZUHVYjtwYM1fnBHQ8Xl+mCMzQUmUFf0ScqJ6bn3eTGDwnyVaRUrN5O+WwnzWF6WuUEqQX9Dov8vFofLB38PjJ47///e8//fTT06dP+/0+fZpl2Wg0iuOYXvN5OefPAFGOMQmIgVXENeuqlW67/hWHjZhAnzh+gVY08Jtx0/d9gs20O52dazubm1vXr1+/e/fuzZs3V1dXW+1WEAaCUxSEHKxQcVXjFYy5W8skrmx8TzF+hHZ1YWOTQPRBpkudJ/gLljLEuhJilcjHvSCMmu3u9vYuOIetNqaq/P5gWGT5cDTyPSDaKfLE9/zcgzpChY8iBj0dIfahMJPXIZWSE5AlOjtT0dBK7nafYb1SaOQyIFLOE8oUI8fo9D2ELxQFOE5Q241jxMK36lXXxOCF5JgsHrJmB5p0JN5VUSsoQWnSk8Q3gTxG+1EEXUbQcjOKoqWlpW63s7m5dePGzRs3bmxubm6srS0AULRDmFIYheQ4kui8jSjmEzH22HH5LICAcqAtHXkrPWhuskmW1N5g3a4aZFQuvnrLwMbLiw0ZbYBpRxyBeZZOizwFyGhCVqFSc81xX9NJRzqeSsqxz4ankHkLd8kTO0bFRzIQZK1nZlLj20owBmRpNGQUlHYjINTW+L3pNADPkLDofCAjpsggARHe+4W5lrpdVYfwwpAkvXZoISp/okrkxU+g0DWwwDBcjFFh3RoXy+7GL74017HiBB3/YX1dY6qLKbqCxFlOVZE5rBepghOY2JMNGWWcKBmvguVXXp9GhKs1hbGlhtOhnpt1E60SIFr+zqzE4JzZzeY7iw0Oh8O9/b2nz57+4x//+Pvf//769evxeMwK9WShEqcooUPnR5Sc0zkZzkof1YG5Ym2bYaJqiPIJNqmBdRMReutr6/fv3fvmm2/u3LmzvLxMfiBZ3wb4Nzfc4mRiyS/lswvApYbqIYTV9mpMIdz8O/NROzHFfXG5AAcGKpynDXD+goBMgVar1el04rjZaXca0+mzn39ueF6SpHD3cl3ajU6V4pRWRDLG+VFrmR41rO0hlmf1aGZFHPiOMVHtZS6tUfVM6Ox6QYZiQs1W7ftQwAlerPB5TDJRmz4qUGdnLN2Nxqy1xmYSiOUSQ6oMFtDXmAOGhyWlozc2Nm7dunX37t1r16CEdWFhodVqAVJUO9MWqNv2BnW20wRQlJbvjFiPzN7aw8n4ifblyuPY/DJ1q9uf0ydkyKgmRNZcfvxlsW5RGTLJhxHsGxEykO6nrY3moCrS5WpkCzEvp80M1GXlAijzfsYfrDRVJXBCMT9B6EqtjAzrAZ4wv0HGdohSGXp7rVwuLEiR2qsufcvrdtUdQm4z5L8MKZwMJV7IMqrFBg0nRDlGfqHRwCf4hQNW9JKWAw5vyy/hP6YSI8/hZe7ljSikXAJaw0A0mmZQX6Ugo2RakXgjQYnKU0vweRs4VrkQp84N1u0j6Xwrf3VJV9BpBP4cj8fkDT56+Oj7v3//5OmTt2/fDgaDJEmIRJSyZPRlei2zf043nADkrE+dL1RcmtzC8Q8G2pGPikSOzaXl5e3t7S+/+vLrr76+efPm4uJiFEdhFEZxPJ3S9wFl6oMbMe+GO53hbL/I/LPynaxK07UY+oW+LfSZuiYd9DUy8aau+KKEIQMLKb+pBD28RpaB7eI1WtN4GoaR7wfg/qHR8PPPLzC1m03jmDw0oqTL2FtTjqAO0tmrrXA3LI/XWruqkoS/oOk0l3VEBjfSX5gqbBTwf4gZ5fQrHUCkzFSGkP9fP1Pj+zlVCdxz8fhlsEMX26AVKHLFHC9QewH+Loyi9fWNGzdu3rx5c3Nzc3GhG8dxs9lkAiS1UQIK2sxxKCzHlLJJicvtUk80FohSqXhJacupEGu35RdysDr7T73l1O1P0yptJTsdLuHnFQdQRXg6Aq8CbTSRAQsGhUE8B4l1xuDR9VwjBIN1hkoICX8kSpotC5Bpf7V1yklMDhWp09NixsJOuQepzcwvYDWAbGEcRbgsXDbGY9Djcpeq22fuEFaajypAYhwcNYY54T5TmJ4hozjCqMqIPDDF56b3V4aMWtOMzk4HlFbJL41hOPHSWV8hL5EsNdCE1nUqZAZDYdVkPEU9LzLFGJ5AUWoCbQtrwlyGROXw7k51wI4KMJtDn053o25/yiaTaY6vYizIKker/DXDjigauVISKRoEQZ7nB4cHjx89/v4f3z96/OjZs2dHR0fj8ZhE5xlZSkhR3kH51A6YjTMnF6aJ5Kzk4JFzIYiBAS41Qn4SRpQoQ+M4XltdXVpevnHjxp0v7ty+fXt7e7vdBh1wssIR0AfWOExuI5Lq3nCnIktci3lHJwDdAgz9Hd7e1ZcVV7i4Uu1XlCz+y4NI9RJMvKOelysV+zTzfL/bXbxx89Z4PD49OT0/Px+PRmEQ0EdRFAEBqaafIz/GC8xz1OugzB3xzeF3HE/CDVXMGpyXaSW8lVgzYXEuvCnCO/XGAZU/RvdV4bjQdtJOlvVsBFpMmFzmxA6Lg1Wpq584FIrS7+GLxO8Xx3Gr1QrDsAVUt9Ha2trm5ubtW7dv3rq1tra2iC2OY5o1CrqsOUXNtRfTTAmrYLEQ9iQX/L1ydquERml+VW52pcxhhZxmbQvW7U/R3BI+/Z6AjNJ/jVwE/87UHGhfK81TWhlAYhp1dydJgtgDH6TqCzMBceKrEnFer2cSjJbDoGzp2TBv1Vd1DtE3K1rKRe/oU2r+tgAx6hBsiiL0CWFvK6aNMIoa0ylp2Kp+isisPdONB1uvAJ+khVc3MQgeoOJF0HslC7DPajAofb9BNSRAVACbZUjULHrQBSxML3pQPpRVpPKLvcGq63K9WeEF0wQp7NAv4QeAVyYF6kUkoBJHY+NbuYW0bdPHTrhZ86aLlAFhwEqd/GWXW7cr1eYUDZZdJstmL6FGncZEKZDuS9IMtGGmh0eHT58+/f4f3/+///p/7969Oz8/T5IkCILJBNTt6PjsPdKeJPUVHAPU6XAp2FR9vdJKLufrWDzQ86HElyQHlxYX19bW7t+//9e//e3b777bIW8QPUbqp3YMTI5xvu9N73MKlH5b6qlMOMkXis9R2Sclf4k80lkkQJW3pdxddpNQlTGg1BFT5e1c2+U4se/5b96+DcJoMpmkaRrHcV5AYBkWNGWBNPK8kDQktMRr3nYV2RK8YOXNwugH/hpvsPJq+YkR2SrEx/EPPUpIQEM/OJnSVc6h5CMFqL8Wl1dm14WADJEV0PylOrEKkF0qZgWSGIjQB36wuLBwbXvn3p27d+7c2dzcWFlZbrfbZgesBnaq+UhpUEUCxGTWJHBpe4/mECXop0p6zBtUleO2bnX7EzTJyKn/ZCY/hnSCljQ5WyoNqBxFa0dUtM8E2lKQ0QIgo8CwDRsipxA12bNAeelVRQRj5m3W3JyUgXtt6kgCyiBwKGofIzACxykLME2JhTqEhhTMcuucPc0/Vj+2bp+FQyjj+pWDQ1plVINfeRBmTJHGaBQBrFll1dCYMdNGYGPc/mgTQ0R6rU8/VWM6Jo0Y1dYjQnf4zFg5iPRT4BSCW0iaFL5vV/PL6WsYDtRipW6tNnJkOTH9/tNdVt3+lM2J1ZXTg7NVEEybv75Lt4eIYbI8m0wmJ6cnP/z4w//5P//n4U8PX758OcFGHPqTyYSDI1y14JyuDBmVnXferIxKOuuGTthhPa8GFGiEI/wPvL0QvMHtre2vv/r6L999++DBg62trW63S9wenG9U6UrmebLrtdgxlkQ4MmeoOmLt1naxnesJOzu6nTXU+3jZn79kepC+xGIMVEzZ8Lw0S8mjjuN427tGx2w2m51u99WrV6enZ0WeN5vNJEnyvCDELSoWwitJA8Z00szsxV01VAoz+iWjEp/ELZTPy+LY5E+Nx2jsNBYQMvr12osS0X3dW3sQmtfqHWN6kTdYEAIZ6QfzoggpdJjnQbO1vLxy4/r1+/fv33/wYHt7O45jYpEBfxHjF95F2WmU8CX1RXXtPEQUn5Kq/0Rhah2ONLd91l2sQaF1uxJNrimOZ2jp0iu6dq7YMQg0Pa14KcNdhWYxFdWj5JLO5pEdCJsCrZKqsPAS3bvwQrS3KZ3KUpQQ/386xbCdtlB5688Bs5PlReF7fgQEMwQZNUSJF/ThY8EpdfscHMIyOssBgMlNU3Jmlo5DAEtlXtDvEmBtovAJDGcCZDuQUWOnlsZwRWKkfF6x6/Nriw9AY4Sk0+uSiyIYVNLoAdhM2R9FBmQbA5JfawAHcSGdVULTgg+pgtCG745Ooc0aM8nZSNG5RE4g1u2zbpUC0443WM7DlJGHlTOU3R4UT4HBTEjRk5OTf/7zn//3P//vo4ePXrx4MRwOpbBEHMf05TIulNVv5Xll32RPnPfLboMEzOiQrfIDeUr6nt9sNeMmiMwvLy91Op2t7S3UG7x3bXe3024TlJSAeSRAr7L2Tk4GXU12jJUBLnQm+I5hz7R7oQ4ivUFzOeLSdNpKeIPKEClFkaud5Eujxo2Hj4cBPGMQNFuttfWNB19+1Wy1gjDsdtpPnz4Nw+D8vJ8HQbvVAoxGEOTgJyPHHsKAqbN6/ZQADRbfm5kDtJZx9YVfJW/lVWoV8gPioKFYN3XAzb4t8t4KVZ/pRQAZ8xIv2wx1T6GXSYA+DMN2qx2G4cry8vXd3Vs3bt3YvbGzvbO2tra0tBRjA5+QqP+wlZ+g6i1WEMK4xEipujKMv8JGqaMb9JRV4rI8/mbcSzkNa+OvblegMW8U2VGaUIacQYhyuVuMxj4o/j7PAzII1JpO0wSqIXKQXELWKj/DSmxww1SoSVcEYUhIW3YmWyIjTfP67BQwm4mpIA4ycWfgpRqyB/yiqFiDoARiGY2a7RbiQ6YocjQNgFcGtmZn9XVM+svkM+v2OTqETn1COdiv4DZqV563l5AiAx/B9z2kVkMFMJ089IMAlJLtDvArU01X/nR2M1Fk/pUNBdURo6qfmv+iIY6hIAy0wC7MkFEyjjEco0VLbcioWWvYNlLJBPY4lVEpfEI97Wvm77rNCNpVeg7lCet4U5VWIrs6eZ7DYMaB3e/39w/2f3r408NHD9++fZskCTlIpE1fFAWpz0vNtHJGqCpRZvl+ZRt9TnaRX9BrLrhCRLrKk0Rx1Gq1ru/ufvXVV999992Nmze73S5Z3oAU1WAhnWGxvUHbr9bweAxOGaShvRhaGUJovs9l1a6uBkMKFYWMhg+YmyMYPq0LL+F8LtXwhxQbZoqRbrcb37ixsLDQ6XQ3Njba7fazZ8/2D45OTs+SNAEtimkBT7iAMYDKBziu0Nxht5Yl7HWQbSYfnY7ogdNbiRn+2Gb9eFaorAoEbCcKrFv0yzwhHdvT0H5E4pJPqHhuPa/b7mxtbN++8cX9e/dvfgFSEwuLC2EUAcmt1tKcNSVFPlxZnmqIaCiJFLI0dqQIdH7URdX7TN3+vK0UZKI3lKuH/JrwruRssKN1ZrrAgi9UQDH+iMJLsO9p4RydVJRJ+Bmr0WWXO0bYy9I+s9jyH6qTkkOHUpa0yCuILPEdQnEyVolDAaFKKrqrnVO1MYsQrm6fu0NIY0KWA5WC92JUzqCpECYs/IPWEhwB98QQSA/wG+Ru0fclnZrqxiWXAAHb4iCK2kNld+TmKcCs8qrlt2lH1nxO0zxv4F7vCcioMqMBYo7JTcvoYQJB977Yq0gl6bB7D+v2WTTH6ytPvSrXpeRFlJCZlSeSBySFCRKZePPmzQ///OHnZz8f7B+Mx2NIBuocP9PPlJN7lX+WfTkDcpsBJnR+wr+SAoD0PnikkCCESeZ7fqvVunbt2oMHXz748svtnZ1Ot0O5QfYbMYaFVgI6eLKfUlQQvgYVGRj2VXX7VkTZ9FN4dPgCv13yhI0YoyD3d/K9LHlaviEf2/imMYlllqbFdBo3m6hRFUdAcRl3u53FhYVHjx/7gd87O88QLKzuBgA1igDxGtIh5UpIRmhWpPxsF5G9wU8be6ZHxTlMd82s3jg015f5w/5WyZWqnjga7gGFOlxbiZsbDS3f9zud7tbm9u1bt+/fv3/z9q3VtVXwxrF4nh1Cruq0Di6mlXuvSoanIiMUvZ2FQa1b3T6TJsTnFQyUwNTa5jJiXrRS8890lg4T8JBxM5wRWZbmeUaTEzcL3COE4VoubuelxhXQntFUeI3zH1WbIL9jAkbKfgZRNFzw/bwoAuxzgN5gBCxrCE13OXWq+qB3wLqS8BO2q+AQzqpQsr9ifXlWGQkVGHF23fO8yRgYKTBkrv5XCRnlQ5h/+ZiViXhT4qIi0/x7wYWgvyu20lKKU0WYycuk85Bd5fsB2455lo2GoxSTJwVazMDVLi1jhIxKU5I1kVXVsgI2GPvEXJ3uA0ezKtkv6nbFWjkHWE4JOgDRctSG/aU50QRODFLSjzJCRVH0er29vb2ff/75+fPnL1++PD4+JgF65hR1/MCy+8pRxvKuRn6g7A/Nd4kSL/eWL1ASzJCWN1UGwr/tVhD4a6urN2/c/O677x48eICVWnG71SI8Hoiza++oAizq3FUEuqsKMeB3lCEe/V+GANgOXjkrK9uFnrl5lBKOy8vdx+/QhCSkZcQPAhJQjpvN3d3rURimSZKkoCASBuHZeQ++5vvJJMFyaaCc9Xy/yHL2vwpIHjKYvdSUQ6UXKkHhJyOM5WDBLENFpbzKKKzyHXQAu87+IN1XfUALOVKVMuB+250kaBlIlYADqF27KAqJ5z2MwoWFhZ1rOzvbO9vbO7s7u1ubm6vrq81mk6QmlAw9I2dmDwmmaMKHqIMJmoZMXZeQva2BXnX7PJucQsp8MkumATNQKKci3CbEWBDwBV8EXMy0mCTJeDwGKzUICQmmpG18YKmh1ZVNNzgpQUdNnGzmnDRGLG+XdipB/aty/ra0DzaqfYAX0BGsnsDKZICMhqHvNbCMIiwK4JEmiVq3DzaeSNyMeiX5ZO0qOISyzYkTzIGiWd9hllEMosewKSrGbZ9ZRmf81phEpc6YUVsZxuVvWe9UmWhm81dfUbaeaISOU76tElmGDALlBlWRsdaxoVA6HZ2dUYoXcWhKnKKUMRB69G6n6na1m8B1SIW6ObJ48iN6LWGcsyZpGSmaZdlgMDg6Onrx4sU///nPJ0+eHB8f414IOjEEEFUqMhyyKWfqxYnkZiNtX3l10seThY6V4FjpTzLozvd9yLoEwdbW1pdfffX//a//9fU3f9nc3IBsDBKKKjePK4pLrqCDSnDKNa3K4+llPcA5L5x7Va7DNMAhEV1m3sz5fr7b9FVh9YhiIQdeGXx3C+gHCuDhAU/m5zCMjk+PoWDG8xpj8sPheTcAzk/0euw2m5Vr6rKPKn+KYaXqscrY1uU6z9k65ZWVahAvuyCWrBvlFgrEl/7AuPvqgdrdVsejFR40ZoFwm2R1CSja8Lw4ihcXFleXV3e2rl3b2bl2bWd1daXdhioJchdxGFsj3+msOpEuH7LCgqCSQoloPd6sjauuOK/b59iqEAGKfkkk4U08SGYzROCJ9Nv5gBDQhypC/H+k3bZO6cJyNEJ+jjdlBcIqvye7x5EpteCYg6jrEfE1XxwPjFHgBvMRD0IRKMxPlLYhxySoU4K/RbsKDqFRuZ1BZSG/OjdubQjquMYpjKIATDjkf6dMGn9bG2cWenpGmxPJmDcjK7IDtHQgUEDt9ebidLZRsQ/Sro+WNDLGFEWGyhM5iEHDF5g9wRg0TCqqLH6zgNFZNcZVMJ5Xe681xczVbbMYN7RdWIkULVNTVgb8ZmH2KLSRppAoGgwGb9++ffz48aNHj548eXJwcDAajVQlOjZ2INlz43K4+c1xUOXZ2V206qbssCX/VqYKKUBD3mkURTvb219++dW//fVvDx58ub6+FmDmUKXFyqADcfY5d5VuPgBN2Vtz4KAcOrJXyDLCR/p7bjKnbMgI9888sl8WtSXNeiq5ROchRWYFfBN6sr1zrSjyxrQR+GG38y4Mw955L8vzvten7HGhzp4Ddae5BNVxreRl7imd1HRbvyhjSxyQcPXVyWKZ2R/OefMy49PiduaEJBmIuo5cfFdfEqaRUfcQsaNogbXi5tLi0tbm1rWda7u719Y31heXF5vtVtQEmC7IhLFKyqxNkxDLnkYsq8tHR5ACimqDEt6gsG756dStbp9nM7uoofHSVYXaDNNYLYXqVJ4SfpkBJLhxQCA018XzAjKKSjCMHecspGmO8zivlcNVlaa1vaxBkzxnoDLRaIRBAOWDEL3NwyBoNuOoGQMwBLKaBj13oUX8cWHHul15h7CybrBcn0CWijdv6DBk1Jh6eZYBQzcXo2ieQ5Tk8oGxUwTIzalZO5hPXerMHNgqv3Z/Rf9goNs2JiiqgpQKXsNvBMjVh8L0aBNnWdbv9yej8bRAVhmExRrOQG3DWSU3Ytng8g/yR4VQobw0B4tbT86r28SzpTI2qXlSRoqWU20MM3NYcx1vkL6GSgOQtCd/6fz8/O3bt0+fPn348OHjx4/fvXvX6/VGoxF9jfg5OTdI6BQJWDU1csJBlX6jvFBZGzkHslImyGEuGd/3SV++0+l4nreyvHL9+o3vvvvuL3/5dm0NsHnwPmbDlPz8DHgeEyDLvsmbyd6gG9xlb1BEj+ZgJaoThmTWu3Pc/gmDz0vdKEOF52/eXGBGlCcFKWosFGvrm1mWD4bDcZJOJkkcxb3z8/F4rEq8Md5MxYQC8CkXYCb24/g08n2i8THLh71sUY3wiq03xXFsl8gcer5iJ9Wu63SnXnPZXiTaUm0gyrtIzNOU20aVE4hsQn4wDNqt9srqyury6ubG5s7WzvbW9ubGRmeh2+m0290O8KjNAE5bfcfRh3sJJAKnaOlBOZMqSfBFJYS6IQrgUnuDdftcW1UMiEGgpqhQl46b79BKLrhm/KwAwFcxnU7SJE9BkXc4HkH8EVhGFXEE/Ua5lISE0PsZZ/J18YF2NKtwPe5rUSas8UE2TMD+DfW7gaUTvuej6GkQUJl4C7i1oyjqtFr4SyhXDqAq0rpvTsrHsflnMYPU7bNzCGdZZjJu7cCl5hwEjDOsSKFyCBqxBOiCj2CX06qa87NgXMbhWAliHEuLWVppCsJUcTCGPZn4q95v+XJhh6bMBDIu+IplNC9SpOIocjIe1BrgWIcse6NjUxSfYtgd0w/yXk83/IIbW7cr2crFomW7loTgy/wTDnyx0kkgs570BsnKT5Lk/Pz85cuXP/744+PHj9+/f396eirVYrIUlAnzHIvKhL9U3thkEowLpWZdSHmeltccxwFWyDzdiqJYXFzc3d39H//jf/z1u79ev3FjcXEhQlI1s0lXhoHsWzd/+eJJyrEb9REm3So7P/8Rqy9jdo3JRd0f2jdXMCXAdzCaZmW/zE2bcXoKDsPtQ/gHQPbRQlpcWiqm0yRJPc9vxs29vb0oDCeTcTKZQC1Nlk19P7fEVOl0swPf+iOzvjohjEtk7aqP+lHfn+0NipXfBO/Mn9V5egMd0cBh/NvHQR74UQgMt93Owvbm9vVr17e3ttfW1hYWFlptEERpNmOKHxAlbvWYxEioFfqBdzRGQGcENWsrHIs2KjH8PvIe1a1uV6I5oXxa7UyQXb+pQVuME1Xoax0LUhwtdEjf86eI/yrygiCjZs7Swm0sRvixOjCvfr/sQsQyLpd9GZqSRzZmpw8ljfQe5i8BQQMCFDGwjCI+BL5J/5VNeoO8WRvD9RddRd2umkPI/C6Vn9pCLvMgozrirh1DdCmBZg0L8FWEgwmeqixF51DqjLNPNy/2bArzK35JRrS6Pr2AUJJdH3YKsSEFwkLIKGK1tbkMBH04FaeNwFTOiMAPznDc0fV8V9XCSk1ZEdzPIRyt25VtVn2gUjpQpIVlTCP/6SC6y1Vtzin4aJo8DcIZh4eHz549e/jw4bNnz/b29vr9PgEy+VeZqpI1jY85BwuqxB5m8KOW/YRKmKVj2cvXgNBDWtEvv3zw9ddfb++A6ncYRRzdBA92Rj+tu6o9cBcqM6Ni0HBzy9wglwV/rFVemuUyNizgT/KGKPMA+66+bLjsZizInDrmXCutdDQG1jY2JkniA8qo6XkeJocnwK5A0szAoAlhOwmeFN7TJWJ58s5UrtCzFQovMK1sJMmszYifKbuj8w6r/V1pnCl4rIrmqfdotQ/DMI7jbqe7ubqxs7Wzsba+vLLcXeg2W00iPSI2Mvq5vtpS/xScBu+2HqNijOn7pKAy7J/yXSVMSjmrWbe6XfkmapjLU1vNXwMZLa0SsgRaOUO+D5qEWQqsgWDhQU2QWvQEXEKfjTMIuu7HIrvX5/iFKAm5wonNUUJG1WYRhqRcWhRFGIUtZOvwNb32HOO4vCMr37heSX51uwoOoWuQcRFLCehF5ud8uCZEmnXA3ms00gQYZFBJmAPeCBOd64XOD/pe5orKb/GBiWnYohvViqXIQF+g8ifB0EiZZgqVNoPhaNRP0wnKaWAAXvPpc0pBcSvQ4sBYBSNMr64FjS19x0SHjZFae4dXt5GlWE73sU668lts6YWyT1X5QrqCyIEESNEgCJIkGY1Gh4eHr1+/fv78+cOHIDlISFFikWG1etlVHpZkWpfrwWQqb+b1lrrtZDgdgXsiFG00Gs1mExkdI9/32+327vXr9+/fe/Dgy62trQVoXeL0hyyiSCTOOrvJ2Zdca/xPhTeoQzsmictZr4+lfar0k90Xws1T4Ah8LWIHaHgQZ4BdoDgLhsrMz5BkAlhR3Ol08jzvn/eHo9HJyUm722m1W91OZzAcUlTcB1gD88SYzKuMX5e9HPlwHW/fugl8Sz8+su4ILXBeUpyiIgChfluZCXSSmbqaXXcVV2cNpgWSGKxWbbVarWZraWFpcREGYRCF7U6n1Wy12yBPj9M2x+DIDFpRhRBXp6EMsLMmyOslCh8Kb0IJuoK4SIxc3er2GTW59nJlnwMEYOCVKX23kR30GnGhMMmS8XiSTPJpYzAaZXnm+x58BNYfVDYpfSH6OU5CtCOtg1owiapWtmNnTl5OVujzTnETpyNQ4DWCLZJSLWEENcuQG2x2Or5eVqsgoLyNiPX5FxnYdbvKDqEL36I/GXdEAWzAVVeYg+WDYF5eQUY93wujMEYtQlYC5PklLTPHjLiAvMZ8zeqMPkgVlkpnBZnHSXVY/Efu0OgLoi8HUIKcsoF5UUySSZanWAmJcSONDWILUmV6tO2mEKMGvaCow/EX/La5e1av6nYVmyk95SZTGcolUPrgnB+j12UCz1mVe5TBlkjR4XB4dHT0888/P3r06MOHD+fn54CF1rlAqqQnz1BSvzCKkuGOUuuCIZ2XQe5Vuq8uBgFPTaoY9FFRFM1mc2V15datm19+9dXde3d3dnZarRa7yhzdrASLOslGecZyN7SFIWai3v5JovDC4r1yk7DYWT2kVxbvpSmAwcSUWiTxtiOWwd3v58aQfDAm4AvAvjMF6Hu3211eWlrf2EiSpHd2NhgO4jgWxd/q+IWgALMxTbOvVwC1nLg5lW5r6q55t0zdkPK9mpEM52KeT9wUclMl6rQMvd9utRcWFtqtdrvVBnmJuIlgrZB8QJTBVKS41VfHdpmoJlcJSfUU3UtUlhsGE+lvfeg6eFi3ujH7caNsAarybTt+quwzheGCqZdnWZIktAtmmdoHefcQcDNWtsCP+YgfX9Rr4eDINOX9hZEBelEjYhvSRYQy7+k0xNWU+AeonDACBkfU6tWdcm9SqWah9gU/bbu6kFGaQrK2Rc+B+SaRUXbAOReEgRf4CKSRcxIdLjR5Ky2zywYtqkwUDrLbgRBtRusOqp/rFYSjTWRLk+sWhoEyxODmwNxL0yRLU2AlxoJjeEtDRu17oAtBdIhX3UIDLCWvWAX8a+HBz6FVKkmo6jLtuii9B1z9yxru0v2bVTfImxjJS1A7OTl5+/bts2fPHj9+/Pr168FgwCeSrqPjmFU6VHJbJYfQ8QAvM3lZSYKTn3wWrfgCpG9UK7+ysnL9+vW//OUvd+/eXVtda7Xa5FQHQcAe7KybIANPDhC38orY62PzQr0o5Ql/RcRNpVt1tZgGBZRRjqp4kFCF7Erp/hAwSqWwqhcQOjhlXP0pkJSA5RCGrXarhV7N0vLyxsZGf3B+hqWkjQJCA6pWDei19L6g8VHWrZvtIeoBSnuIDuGjE0MUpuYh2d294B7Oxi1XHu/XNYX00CAOHPAQko9arTYAtJA9GyMi2ghV3+SwY/XlsL4Fw0NkBt4KFSqHUVOSqacvrM/LRU5/5V2od6a6/XGaFVtkOXrPjQ2ZeWGWdz2ltRUqOGaAem0yGUMNoVbrpalXQJpQQAk4a2IthDgfHYLoS8wcphs0/ZzBCFDkEjIKKw5ARhHI3mhMoX6w2fQBoeATHI/qnirPWKcEf7t2FRzCaoo2A1Ki2hXz/TlUCpSYIB+KkupZCkAksD4pfS+CE1DIK+LxNn2FifHM8Q85LCQ7oLdY96vyW3rbFsQBNB9RRrGBBbu0raONDC9Go3Hv7HgyGtL7JkivVg7jV2qwrcba8Tk1jAFw3iL9Mpsbom5Xp1ljWGwVVLLuODA0Mo3ovKhwk3yezrZBPyfXjlk60zQ9Pj7e29t78eIFcYqeYxuPx7Ttkd9ImM9yMk0C6iQYD6rYESA3Z3eRmcxKP4rdM/JYqJGWNzGLhmG4uLi4tLx0+/btO3fu3Lp5a2NjIwgARwrRUNFm3fAKaG7phdNnEzmyxSd+cdRGYjt5SdAQVvfGKk+PliPzPPRVYLbQ89A+UKNE9ZWoKSsvh5ZfiIIjWQLoVbVanU6n0+6AgnozbrVaS8tLOT6OSZLAkAw9wBtjxov5TuiQ1BH6p2Iv0LFtR6iD7DY12jVq1Ch+SCCF7Rkq4IYIln/yVpYP4UvUPBT6ghDPXBT5ZDJJgXsC5loymQByJE1pHiHtu3GeK4Y9vuvEX0p4bPyWhgRAzpbrNTAMIA5u3blP3uqdqW5/qGZteTJsp6NsnPrTa7j+FRlaIDJPU28Krh4I0+cTZF2eFsVoNIQgox8oNvmiUHXkQhrXLIS0RDRgDRbdU6TL1L/5ARuZslRRJL5Au146CEJaHigGFYURVAHALhwF8L8gCiHW50GCEMTS4F9pcahEp7ZN55rxdfusHUK5G8l6FVGhYafgZw8jQsw0wJAFrBVhnKnanmhm4H9V4ObKI19oA8z60FxC1Uea2UZPVp5+zJmgpqKaRIqBsSjyLB9PxlmWMiSPziL4mhQNARl4OuTvoBfgU3kP6ln5OTQr7MLKJ8gwpKgFtfxlOeemvJOqVj4RHYTGbJqmg8Hg5OTkxYsXjx49evHiBRHJMJSUYKI6IKoaHZYhA45fJwUh+IxOlq984U5v+U/+vgOLJa+43Wqvr6//9bu//sd//Mc3X3+zuroaYlpGHqHyDjgvnP4411Ve2ZwJy/bEr7GO5+++JnlIp1WhbPUZ5OpU9SlDikTHBCPlzFOj2UJQRg8V1YGuvNnqdhdWVlYGw8FwOEzStNGYTsC9aaA+vYblYtU0l9dZ2c6pe3UiUabun0ZjICoE4oRMuML6zjIzVrpdHO2fPeYvzA3O/dR9rlZ6QYkUmhlK6tVJlp73z/uD/uJoKc+AmpBUW8AnhCFKSpCzHwedUwsv+UVDAcLsPU0/f1WHQG9RIaZ41vX+UbfPmmWUlj5F4Ac1Thyh1waZPRvhK0girzD5+GaapZAhhD0RioPMUqMLfmc3zRYoYmWXgbm55q44VsVVUwkJ1JLgxWqKexTJAOQClROqxYeOI6xMjXO1tmDn1HX79e2KOIQXt480hmDKIZAGDDg/iEExU+UDzSEtxgL1jknkmxP/0i4b1lN9IFsw0Lkq9abi2cM1JkDnjiRLkYEvS5M0mUBgWFndBWVFmdGYQ+RkvwgImIPvMSqpv/gC6/anbCJ7rJMmCikqAw2X4RQtVd4qx4w8PZIc3Nvbe/ny5ZMnT37++efT09PJZJKhrc9yFHzSSneOO+A4b9Jr5Z/b/sBM811qVFixFfyIZDbAaWnGq2ur33333b//+79/+eDL5eXlKASCmQjJRZkCtFxR5iBdrZKJqlLGeRgEB7X76WYr6/qw98uQUV1XYu/YJsaF/h1/aBTL58bpsPYQ7jlBH7GFUdiMQchxeWnpfGV5hBpcQCykk1EkjgD6CZprzKmAc6AYpncc6cZAoI7lQ2pTeVY6fk+XKoJxmtlltu83x/+/fMxb/0rDQ+w9iCxKE+TQI7yYFinolSWTZNLv909PT7udhfPz8+5Cp5U08zTLfUyoGmBIBaZTZ/wAjosUZx5MftEzi2ZWJ1QNVFhgSkR5am3X1e3zaHpOsZSf/IywBiY6xmF/A7rQYDD4GN8BK66YTMZjWgAhQKool6fTBorVE0RHgd0Z5K/apWqr5zV2AnkNUlEowckvIaONAGZ9FIUMHIEygBjTg8xKOp1C4bjZJjT5quY/FEHP2gz9ZO2KOIQMc6wwjEwuTbM2zd13iXxAMyZCqW4YKooIrhrigG8leYwtxjAzPDOdPR2dij7nuBaSU3zLh24TGx+ZP9poA4hnPkmK07P+cDjy/bDhw1wj64rC3A6klk1ROg6vR/RNxvlU4N3rdkWbcU4E3E77gxaY0GiCA3ZZp8vmJrLoV1RQx0fr9/uHh4dv37598uTJ27dv+/3+/v7+2dnZZDIhZCkV6dGvKEnImTrHu5ON2TJkUlGmB+VxHCdW1vKxD8z+oSNDH4bhxsbG/Xv37927t7G+AXXIAXxK2oPsUs5Kk5bdwnK60ikpLOMtJervEwJsTLWY7d5LzwRRoIBnElVlyvT3Gj4VYIOnNgOXWHnSKS5wsD4XQD9LLinFlrsLiwsL/SRNcwwm+B7wsJvaNVRD1E+exC3NEzfpQX5NF0S4fJk8tBCRys5CN1F9QyfEzMpYdWmmKlsQdrrwS/PteaF69mHN41bwMCVYq6+xAXMkSRLf90ejURgEkRec93rni729vQ/tTrvdaWV5FhZhnmWjIvc9P2rGmJBtgHZh4MudSFZPKBdZXRc9bnZxxSUI5xngN1zsagdVP3GrN6e6/cGa5cmUKgJYJFCRjempwr/2PfTxeP0qpnmWAp0MRPm9wXCEwG9EdONXIF6jzqHJZGSI311edDJ/BlKm4ip0AkEfQMiU0b9oDwQhsowyZBQLK3yk5wAgXhAAYpTqPnApoESpyKtodIdeXcWGWLuDn6xdEYewFK4WQ5/j1SWypsoGuvSAu/bgYGi0xXGz024r2wC1fXNDbl85GJ00Wrm33OcZusfOFjmjvxp1Zf1Io0o1BIEgo1rJbYyaXcQ7mucFWKYVDL8E0AIxL0PDoPpc0Zt6w/18GhuC8IfyBTVQU7DLSG9QJ9ouAIuyS5bneYqNwKIH2I6Pj3u93mQyISEK8gYloUv5gNKOd1KUjOqUyZPKjKWT0pxlqTM/DWWu6PhLS0s3b978+puvd3d3W+1WGEDFPM41xZY23xUs546kN+i8lp2fQ4j6SZo8tTERFLjJ9q9MYpAycTqrZpCs86CzToNqGUrncqaX8oRAUBe32+1OpzNJJtMp4B6LaQF8YCjuiMQyxDumOi5RnLQGSxFk1UVEQ0vwLYdCGnZujgUu1Be1Qmvl3sAOPv/pfOqOsSoQZuVDcY8jmHUh2oKTJU2hXoAQ115DWY1+w2sDSU+8vrEWhuFoNGy22yAeneewHZbyqLyNcoobizSN0Adn/1zCVcOjTWg3SwzmwljtL2n15lS3P3JjoBU2gowScYraNBVq3fK6eMlUkXmcTRoySrWDHKBS+zMH8Wdn0zjcU+EN8onlXL4kk776L/YJY3mUUDGVHeAKEliU/hdADSGtL6JzgBAR8TiVmpAdr9uvb1fEIXQaU96hJJWpXrhM/Tp9GULXmGGH4ekD+itAthZjZwmCQbGHXXI7MxJh1ig3/bdj7RwG5pObcl5O4BkIERkcwOWEiHTw/AgwOp2mSToZDbNkjEhzAJvLui99fEUbahk3eEzPZhmtw6+fQ3Mk4/S7ZJqDWUlxSpDAFL6Z4bt3hu4ML4hfAKQNCNMmp6ene3t77969I73B8RgKJOgIjvT8ZYhhyGeT7lM56SfnskN+49wK508KuJB9nOe57/vdbvc6CA/ev7ZzDUQmCiBS471c5JCsM5Zzg3McXQcy+lv4fpdp8wGrgnfU8hVnkeJUNDJjEOMOAw1XLVy9csoT0mof+KBT32630zTpdMHhGY/HWQO+AKOUtAzpSLhs07EdeRLVN/5/+azLV1d9zQZTLZ+Lk+l1v823i84ln6Zz4qobKDPYpsM6kEczVN0rFO2khtn1rMjzZguEJ8IwWFpa2GrgZheGMZbNq4wuEkRxLENySXCOskAFSKgl1OfXQphWh9z8ROkm1lwRdbvazYIHCAg78cToKJrmgdD2HkXTaO5IkDbQdKKmWDImyOgUlkUuoADIqIrR+IE7r8TSY8W5nH6atWU6c+66e738V9d3TAV2NMuyOI51LNUH2Zu46SNkVK+fBZEjmkVYIkYViwEXW9bt07Qr4hA6m7pKKBtPRm6jF5O9IQQIplTDa2RFHkcRhZQxsR02kpSizcSQqyPlLLvCIC49Ye00oWB/ZxdVz3w5yziAXdE74lYQ9bs4EwEy6oETOEWYAZTcoOfo+0GGptRolEzSIgi9MIrxckxYvEI8gzpv9YEu02zr9Uy88q2cbtIJDiU7pr7gqwROOZNWzmU5I40CKyQvQWIMpDNxcHBwcnLS7/f39vYODw+HwyFQI2ouRPptkiTOiRyz24F0lt0wmstSt4Y7yZBOxwmU0RMWtSekKHGHLi0t7ezsfP3111999VV3oQv0J60WI0VDpNt2bkWlH2jlY0uTtAwQrc4T/gaIGmskVKD0RX2MCYHT2gt3z/MR/HlhblCVwaiaUmQNhcMQJWaapiNo48kE/jccDqi+FNboIIzjaHFxcTwaw6BCmykIGlnWgDMD+oM3CPgH02UIKuVVWPLoqoykMrAs99tU7FXZTALQOyNsUU4PVpM229U09qelLKt5jTcf/GHfm2bTwkenLgfsaFEUJyfH41Yry/P2YTsIvDiO8jy9dXa2vrW51diCWw4EM6BQz7sRJsE1V6EoZNcev+u8WlfNuUGfhOmtMNMfJLpRt7r91o1j6m7CTU8RPQvYRDTIc/otTl9CamOILMuS8SjNkoYfjBOI+HjTXB3fawSBinmRtWfNLAFVUESFXHv18VekDq7sYPJf9dogibhDQI2a3TAKi2kDGcJigI9q0x2sa14zSr1B29tsKrUl+qnan94hlDF+9Q6HReEvVZurIgmXGDaUfsNSeZW1j+Oo2+0osBmaiWCawMam6xP1T0UOjTP01R6oWRSsdyxvsKpv4gqt5hrB/I5CDOACkmUZZVrSNCFSGV59ykYGe6r6OjSnjAMZr9vnlyE0FDIaxYfBThohJiPnOIFzHAAGi5KpOplMhsNhr9c7ODjY398/OTkZjaA0gsHPRtLdTq9Jd24W4LO8vczReS9ntPjy+aLYbwxAP33abDbX19fv3r371Vdf3bx5c2lpieolnFNfFksgHFfn/XKSzXlh0AO/TXMyYOIDhhOTxQL8AIruk34ipfxmN/45wd2hTLQAEtFkDMOjf34+GAyGw8FoPJokSaq/QLD/ELQKYwjYJZBPTrN0WkzDICz8KUJHgRRTJ5eBTRowD6ROUbIw7BwnXbhgZZ9hO1UqRv7ipgPuVTNIM/2yyci09e53QKZRgUGgzNIvkiwbjoanZ2f0CMeTUZ5nk8nYnxbLa6ths7mwuBSGQTKZYPQQbivtgs4AJkCNnBqYD3ADGep2abUPvU/Z2GP7J3Wr25Vs7OjQDiqieEzIrL5WweqEKUL1h4Zu5TkI06Otp1cDFY5RiQaO31jhTfOKRXV09+b337UYtSvIl6dPQJPcAS8QSp/ygc04jqPYB+x/SFUAtrVgBd9Mb51sZN0+RfvTO4SyUQUtYSadOIgKVSsX7cJ9eoo1hDBiwwioIFqtZjOOBhrvhUk6j9LyeNbAmT5qa1YYgKoTXPqixMQz6DYDNzDMTuZLbKfDT4sG2EmRetBpkg4HQwBTpWkexWhVwybuKKFx9aVYMPQntABpqFXdrmSTC65j2spcloGMljhFy97grEEvvUGqHiSw6IcPH969e3dwcMBgUUcFvtyxWVdBL6j+sPwFbnwKeSFGvql0B/gj8k6JUWZjY+P27dtfffXVjRs3FhYWWq0WZSYpkGQ82JLKglMo6PS/nNu82GL+1BulvOEVWFZRRCqphhCxaQYJsFNqYKFMt7oHpLUTsO5KYCTLMogUDAZIj3lycnJ8enpy3ge3cDQeZSCeAFzKNFQgII0WEVSkNKaNCTx9sKKAgM8LvAB8wsI8u8APIDw21Sub2EKqgP3K3NIWiTLvZkUcZr055047sEz92j6gRkxpw9KE9mUpLydpwRHXrjjeeS9L07HnjybjcBA09hte6Gd5NhqP0sn42vj6wvKS53kLCwt+2MinhR8ExdT3CqgWUOU9LnZABmI0l41xC/WeZBl2GlaD08kJP1UCeutWtz91K5GLMpyMjDoTauL/mnCK+o/Bh6lgP0RRk/FkQqZhMYUCYAx7KZCF5zUUYlSnE4Rlp/YzB8Qwf8pZ0diLvgyC3jnWc3OqIc3azabvgVsYgyx9HEDYFGv7ccIbIJI6gdNnFXX8hLzZdbsiDqEVxbffMXrBVi5+PtyRquSJzLeRpoB1Jp6IIAyyDHLxNAqRfgbz8EyzpmcGhnkMosY6utZwM4HnKm3eysgQH6EoprBXYtmGvA/EIqCUSFVOFP9EazhNMzCC8jQKoTASExqVtUwSDGYQBdrogUuvvcEr2Sp1INhodrxBezYJx89OZZQr8eTBFRSwocjHSIb++Pj44ODg5cuXe3t7p6eng4FCA5LzQJ4V9USL7rrpBT41/1mZnSu/ybBSiS/lL7AfyFdE6vaECG02m9vb2+vr69vb2/fu3btx48bKygphSkl+ENWW1G+dDqs7b0es5BnLvms5Jfhbz0on0SrLL3nzdmiHCM8oXfGiAVm6cuZWDj+UwwEyPWI9oUUpBfXlpN/vHx0dnRyfHJ+cnJ6d9s57Z2dnA8CLjlMqkEO+IfbP4yhCcte4yKdplhZ5kYEee0bkCw3Po5JEDzDDCBsWqx4H2Xh1d+65qovRRd4aU8rwjI9Lc+l4N1VoV9x5bi6QWMXgre+ztUQGHwo9g3dNYwn06FF4cDqdngJzL9w9PwzGo1GWJMPh8Hw42NrZTpNJurbWbreb7XYQgGhKASWySNiDiULyDLkug8G13FPusf4vyKdZISdmz9YVwg5lUe0N1u3KNBHB5xC7iqnqxVO9y56f9oc4PkULY45VdmijZgkiaPIwCEBUDBdBmpEGGKcCWMbKLOcApb3HH3kzAsQfdbFTJOPQxoAfhggZxSKsOI7zPIvjqAk1hOiP0MqpCKuUIU2sqiYMphme9XXVS8SnaVfBIXQ1SRzoF/7D0E6J2a4cRTQEcdeE0otGw4uiqNVuU9UeVt5hAaEGR+uDi5MZJ216qQ5/XCwfN/qpDPmK09n7MZkkikcRYVdgU2EhFoWVVATZL8ehLeFm/alaUOhG1C7hlWyzllcnP1ZZ/yPdv3KqsPKwrEFP5Ifj8bjf77979+7nn39++fLl/v7+aDQiHCmzIzK1jOMIsS8xx3rmTvLZHbek3HPn8ulTFo3g0kTEEbQWFxdv3br14MGDu3fvkjcos44YAK24CSb9KGC3lR1241+zLeZPtUeWT1Gm3nFEceRHzG2gVi5cPHDNsZ6g02eV/0WUOxJfAYp4NB6fnZ2BI3h8vH8IQOLz/vlZ76w/6CdIP5tmaUZxcYgvqDJrz2u0OnGW5mmSZVCACh4jFqIqhDK8ghWwUXhejv4JjUj0sQT/jNpclM4EXWUQELs1fUpSPyrY/rFAphlfv+AxauQL3mqH5sHAtuQ9hVQ8D2CYU3lOU4z0rMG97vVWgdT3rNc7S5G3cGl5xfODMG7kgwxi+SgjBrAYAo8KBWkdoIG5VdLAJN+1FBWiFKEwPSuHxG9SC1u3uv2+rTqvZZKGAlxtAJiu2Dtl0ugVV9xRxF9JQbGxS2XSs2cOO2xO/bP89JeYDUJrkZcfzbWhFiLNXzxttlpAYYXqQRIyqsEjGtagVgm1XpitpPYGP127Cg6haYLn2lBl0+4tS/0ucGamCjIK2T/wBgOINMdxHIN156t91/f9jKTP7NlWSsiXG4dsEIkkRXztTki5TyeTb0wO5ZC6dG7aCIMdGAjlwpAw6WmaDccTjAcnEEqP0BYvpnCQinklCa9cnE+9Q1/J5qATy+k1znKXvSwntzYf3ChPREVig8Hg6OiIhAefPHlyfHxMYFFGilYmKmc5RSw26FCzyJyhwTFqAv3KDCe9YMeV811alRTyhO1We2VlZXd3986dOwQWpQ6EYUjfn7VvOR6UGzCa/cLyJH/LVi6Hq0DniqoYdW9Ldo9gUZ95IvoiUiUAkQwQDaVZkibDwfDs7Oz46Pjw8GB/b+/k9OSsdzYAtOhgMp5A6g+lFYhClJz0IIT/BGHQbkfAXptkySRJkzRL8ywr4HUKVTcTeAGeJJDPaDA8QoEbxZTgo0ZfWZdlqmegbou6co1CqbpLFz6pShdSvlNZjM7dcK03i4WGYWG42FMBsC7spOg7obWLIh9Ece/8fDQeI2HPCADcWbq5td3w/YXFJVIjnEZTeAH6hMpFdihvkJUUrldqfVwGSSvHjM6Zo7XLsiW18Ve3P3sTCFFdAlTpIhp30GkiWon8WIhnSybJeIyQUYQtqEgrogJoXhEirHoSGbFYQxnhnFGDPtTWWY4COz+QB59SoFYdR++wQC7mhT4VZDXBG/SRb0pLqnKci7QZGaWh6hFU9Va9IHzK9ud3CGWEQI8eYMGWqUAxwMXO5MJydIOhmmUpRZqTNAGRlBBo65rNeDJJaUYpujxlPiq6UQdcpOL9tpVQCuKardsglMwLd1GgGAlh1qpyenA4IrdgsFkQhH6jAVRUaZalyWTcB6Y5Unkha6aUdjc6UcL44b7pkG7drmBzuDodh1AXBlnZOTlyHD33WflGlqGn7F+e55PJ5OzsbH9///Hjxy9evNjf3//w4cNgMAAkG2JE6WsWYJUkm2THtB4gd0N5cQUwmZRThRq05vpgss/szkl3l6KYwFzSaoVhuLCwEMfx4uLi1tbWrVu3Njc36fvtdjuKIsKLltQ+rRs+64XppP2Cr/p32BHt+kllUlRARkuDhK+CgrkyATsn4UxlL/R9Uo8YjceQFTw4OESSodPTk9Ozk8FgkKTAtZ4mIEY/nRZZDvKD/HRg0W6GnU672WxOG1OIf2VFBhCJJMtydAjT0Xg87I+SNJ0kidcAxlrsSAAjzWiwuuE9ugb6xCFsr0pHX8xrzfd2rpEjNzorxsHj1d1otKNIBpkbQ/Fh9kGSECt8wjBM0zQKw2Ycp0lydnra750hfz38NJkkG9vbnW53YXEpbrRQsqIAvtwQrDpOm1P/2bFXZfalEIY1mHRvVW6fqGhpf9L8iuo7tfFXtz9/q4B4NDBAg+9xFoyTAkoCTFiOKpsPITOIYo1Ho0G/l6Z5EELNBW6UgAyHKGcOahOUma9CZBiwtyC7MOl6ucvLFb68V5bB/+abiPpk1aUAebaBaA0xo3EzTpM0iuMwBup7AmBwbbk+q7opKleIzqTKEurEYb02fJL253cItTNjSM4dm0MPdrGLU6tOcLHZp2ZRoxGFUB3EflHgB8SZTnYkvmehinieKS1jYRGYQK6ZgmUstyUhKjxCDkvL1YFnoLwyy9jCaDsQ/2K0vZhM0iSZkKwG79xSA5RXCgHR5qMyVOH3SE3U7Xdr5ZjfrMI8acHLaKVKAZXwopWWHOcrmEgmSZLT09O3b98SWPTo6IhqnCSmVHYPj6K3CTRa2SpVNX4ayw0/1zSMvL1Z+a7ZtenG2wFRJMUNw0hRCmqS+7GwsLC9vX3//v0bN24Qsyh1g690zp0vv5ifISyrVvwWrUzvoeOyF2Q1ufFTkFhZJUuv1hHzHWl2gK1T5JAbnCSDweD45OTw8JD8wcOD/bPe6VmvNx6P8zzHQQJqJXhboD7ND+AZBYDgjbvd9sJCt9PpkNBFlhZpmk5G4zwHttLxaNRNk/PovN8fKDUFtDOYFk+X57nEYE42TyhLVDiEpbK6y9x5wklZ87F8b/X9FJ86dYQaHOM8Vuq9csCoXEcHaKClaV+reWTFtH/e652dbW9vD4eDza2dEBOvw6KIIsi7wvcJ4mVYcChzDlk9vCEq967vDAFvlStodEmEs0pF742iIJoZzA/U5BF1u4o6hPotlQwH61VbYtrM0xQypvkAbjcQlQJI7wtYLZNUrz5mNrG6mZWzsxtv1hyP/CgAWHkzsmJ8VUlFvAy1VbfarWYce40GVtjD4i2NB8xymPtFF+Mup/Xi8Inan98hlG06hS1kxtarkocXOTMak002DEBGwyiAnHYcY4pbR0MDPwPEtkmYqCb2aXb3jJqvNWmszqkv243MXpbQqEIVUSBbv8QXpAGKcXZwBDOg2gOH1vO8DFIxyWg0TrD4WFXqIkeNPV2VA8qerA728zln3b+6/fmagwZ08j/SfyvDLy90XWadjo4DQYoU6loPDg6ePXv2z3/+89WrV8fHx8Qiw9WD7PJVlrTx6XSagncNJ1dTkV6TdU1OblCCSJ1uM+spvVhYWNjd3b179+6tW7eWlpaIzsTssnNXm1lcqXNc9N8hHOr0R9guMsFjxQgqgwXkbPtYpMfeoHsJMsumwKJQ7pckyfn5+dHx0cEhtoPDs7PTM6hyOxuMhskE4gWY40KaUHRLgsADFcIAAs/dbmdpaWFxabHT6QTo0ObZNEmS0RAIGPBFK0kmoMgehmF/iGaZTwLuCnM1nXqAfSRUpMYr2ddOLhclodmZZPTsLw2csfDyvFJEGykqbqIYNRUd1vugkt/EjAP9ItOlRznOteFoNG00hsN+//z89PR0OBwOB0PP9zYb23HcUvYoxkToVLK3SNOtDFb0tP0GbEo4awRVmd5gDGrOmrb8wog41SqFdfuTN4vBmKw2vQe5QtTVDe1QWFFxvQJkRJpmEMEZJ1RZAYxcuHUiHhwVtTHrZqO9VG/4dPyumZ0KeFa+guqIsOkhR6hUNTawOxNGFBhHswyY2IBTxo/CsN1uY0EWU4waDJoOxlk8rMrJ5Npj0H9TBeof+STqdhUdQm3/lZyxUnGfk6afeUDfn2LmHXylPEMIEgBpWq1mfwDaE1BeUkBglXY5ZQVo1gSxVU/9qQez09ScSKdK7n7sruqvqS9pb9CpVDQ5STFZ1HWCUUxlgRRr8YMA3ELgZc+Tyfi8d1ZkOQTTeWeuYGoii6ECDMaonl/wpOr2R25swpbRZbzuM6ELE6Xo/LyCeTAwkiUZnFPQAUmGvigAdTZGspBXr149ffr0BbZer5emKXOQBkFAeFHuSbnzUhzCcVRcKKPIW/J4lsAYesG4a4TEmcQgFr0HJEOP6kn+8vLyxsbGrdu37ty5s7Ky0ul0FhYWCCPqIZcv+6jlG149v4Qv+q9lXOSOSTUObhzndgYJmR5cHI0qf8B+JYGjZZdeedeYLSwwUjAajU5OT/b29o+Oj/f3906Oj4+ODnu9HslUUgJZPRdgVYdH5vseiFpFYbfbXl1bXVwAbxBUZIEes0iTNAAElZdlRRhEvhd4DS+Ns263gMJCTJGNJhMQsFeXwx0UMWrbT8E1HE0w7Q3KxfFj10npU2kO+lJ9TkVTZYL2s9FhQuy+oZ7mXunJAshPoC7EEokp3B3U4QBbbf/w8Oy8d3zWOx8Oz3rng+GgP+jfu/9gfXNrbX2d5giqFAbTkKZM1fxikkBtzJnEoKmT10OdgboGaEMVVQifq/edul0Ze5VtNrm8a2gWTX+Okkh7leOkSTL2GkW/d356cpoBZXID9VgBT6oL9mg+mjRjeSmxaM9K2UMRBKvefWQQ0MRYKctI1U34+wDKAxsBbqAoMxE3I4jchXGzUeQRrNnA102bJUDw4He8O7Iohlnl9N6tqL5qb/CTtKvgEJpKA85i6RpZ4UaZXPz8ocMIZgwPw+iMcPxSpQSaNz68D5oTxu1U6FJ3yqkJTUEWFSJX3aF/ZLBUXI+moNclhoorykYGSV0aPUnMBBaWCWk7T4G3Y9rw0iQdDUckX6rlg8vTiVnrDFTbKnSuIaNXrpWzf9RkYpCXaCkRpjacyuRPqbGsPIkETKdTsPtPTp48efLDDz88f/4cRDLRJGUZegaXzopHyk465+JuS4fKHKQEByx7xaCZx7h0DUklz3A6nbbb7c3NzXv373399de3b9/e2Nhot9t0FsjAFMpNreyw7Hnli8q862/dHBeUz27gfAZLaeUPLafaKiwh6uZ512LAolPFJZMkABY9g5zg6enJ8dnpKfBenvdAgySZTCYTrAnMGwjkBTmPEFboMArbnWa7015eWlxdXV1aWuq0O+1OJwzCxrSRYBsPx6MRHKHZHLdabbBMohiiE2jCZMhvRIOtgOs15Cait2qt5aSgNO8+3VPQjt3cnBit/8pa4rdkdF1sFsbgA6sLTUgK2NM7EMKgSkCvQDiJ53tZlo/G4/d7e4PhcDAa9s77WL+Ud9rtZqs9nkzAyEOHE5K0bpGS8Qy5PEG9puyG3hZVEb5RrsD/16aztWvWrW5/5iZLnOQ7VshPuXDYXMA0rc8KaFpAzUUC8PoM9lOddaDlSTHRw49UFl+7Tva2N0+G3mgjfsTVcXpPoOM0Q7MJs8GiEQZBGxdhOI8PfPcqjcHcMrhNiy4r015tLXwBdfsU7Uo4hE4TxJ86TCL3cib2rS4c0mkBsAQAMhoDJ0Sz2QxBN9OMRVRkArNVxzAFpFLtarKqUYUyCEPlEBHoDVuOa8EhqohfHJimuaaqoI6aOwAF9Rq5VygSdjBxiiwvRqMxVuCQuYy0VL5T+m8YDgzoiFE9H82pXrc/aCvxebgzhS05yRY4CzJqJtSM4cFnYRn6yWTy/v37n3766ccff3z58iXlf8hRlK5gGYt44XXxC+kWkkcXaE2kkuC4+bk8QlkGkN5st9tbW1tffPHFN19/c/vW7eXlZZKhp1OwAEbZoHdymE5+0gm1lv/87Vq5Ywb6KN4ng97pPD9c5zHJ8O08xwYb6eMh+efkrHd2ihBRIBMdDUFrC+LfGTKFggMHBhA4bRBWBm2rOGq3W0tLi4vgDa4sLiwtLS212512qx2FoHpcFMAlMxqO+v3haDiK42aSJCAzG4aA+AAoFgwMoipN00RrOhcSsqFDbQTHAlmf38gesRDCc9bcaYPzk6ZOQSR0Ob2pv47HtP15dQq0G3Xk3ctVaADcxfMCVD2SNIUJhMivVrsdxXGr2wUBMR7AVZFF6RPqdAS8XSCQlDhJefdkyWkV2rWRtwb7o/hd642obn/K5uxo6s0yOUT5ZyrCiL4Tqk1kKZZdJEmCsBoKDWEWMZ9OG4WHmG0ivyA2DQLwW4ACIrNSpyiftuy+Wp9K01FeARA1K/4OXCrBBAZ1H4z5NTyg4G42m0C9FkPJvU66KPCCKoXSMHxar9RCJZas2hj9hO1KOIRsM7nUnMbMqtR6nnEwMBkJzwbGKCbXojBcXlyIm51mfD6A7ZDK9AQ2Rg9idRDsiN7bKIOoRJsYAyDOaMwwfo8zf47bqgLSMkCP+hU8w4HVCSpDwEQgwaggUML0RVEM+4PTk9M8TZFoPJnGMfeg7G7KihjqFZklNcvo1WvzeSOZsoWcHGKTl5hGJ01UrjKlT5MkoUNRem00Gu3v7z958uTHH3/8/vvv9/b2hsOhhMSQOhrsZLbvwQQY5Qspj0yT69P+YWXPHa+YnEaasOTg+UCQDf4e4UXb7fb29vbOtZ2bt27eunVre3t7ZWUFSo6DMIojEqNnCftZd9u585VfqxSm/43arKpFiRBWd0mJsouPdMbJ/FxFhSsOzk1GHIggwfO8yXhyiOjQXu/s/Lx3enrSAxYZEEIYj8aTJCFVVYITUwO12Ga8tLy4urbW6XTarc7yyvLiwkKr1VlaXArDsNHwUIEwbbe7QXDWbLbiwXA4GgZQdt4YjybpJEXG9inQj6ZpClnNnKPcBg6KGFFRoyCNoeqFkSOJnPG7zP0vf9OK/Vk2mkKc6AKbigPS46C1XiVt7Qph9QyRXhV5WeEDJG6Ff9M8RN5V//2H977XaLWa9Kvrt277S0HD96MC6jOJenf+sNcvkA7fnn58NzUuXaVJjbgopT8uyprWrW5/zFaGVJi5qSXq1QtGZDluIsLpMZpfjMaTLEv7/eHJ6dkUuO4bKLQKKXzaMpAdAhD7vgdGoPb43OCmyN+z6ao/FctaZdmCOw3VNOW4jcoLAl+M5wVhEAFpf4Q13l0SqQ+j0PNAoV6RNtMKRhKnuhOo0KZAsOoETHtY5yg+XbsSDiE2DhiYAWpH3CUh/oVHA58Pvxb4kCSEmleoN4HhTpsdTDMCXJbi4qZLOlAr0XRCOFS4f26mwjiIUpiCJrYqAFbqMvg+H0wRHBgsE27y0wIktXxaJiBDCMTrKW7JBCwohXwwHqMdP5id5H9SjOfyD6Vuf5ZWdoo4M1aZ6WLUpcRwzsJzOrlBVpkfDAYvX778+9///s9//vPk5GQymfi+T06jgYzmBY55c5CK48+GvJQzV44n5mIdy5sfRlikEn2jASTai0uLW9tbD7DdvHVzaXFJaUvomT7/bs+CjJYzgeVUYeO3bLNO4dwf+xUuPRDxUrdLZoxnDQl5ZGrk46VpOhwBg8n5+Xmv1+v3+4NBfziEDOFojFjPBLkTzHNUhlQUR1TAubS4uNBdWOgsLC4st9vwThhEFI+DaHqSdjpdyBMOBue93mg8brZaGQ4zFEVuTAA/MQ6I+kCpH/NFXhAL0wER8yVx7W6a9DJOvgwyOpk+cxwLGlrRJV07IIrYCYjlRm3UnpOmCbGqhXA/vMJrkCzkZJKcnJ7lBcRJkyRtdzqtTqeJyivjyRirgHySN6z0BlVQSSGxVQU+bdwqaaiTz14lKlYdR9WI1D5h3f7UTazqprDQ7LAcSpODXKXEODwCkNEkAQI21FJVZfa2FahntfarZk+a2R9cYrqVwQHWxeqyKi4ugZIKqMOP2u1Os9kC5D/xi3I4SeBqKQ2hYpB0PDvWOKdjdfscHcKqtAS0mZDR2eMb6hnQIwTdTFBMiWLUzaTwMB0z8P3cTYJoU7AUyZVzeGarMGp1eaAu02VAuIDW4E9VMlJZBqS8RvsufjQNfSjY1aCs6SRJsVILTXP1fZtKSs5E2S3NC/C7pSzq9ts1BxboeIPSUi9nsS7jBDon4j2D8KJHR0dPnz79/vvvf/rpJ8oNSioXVh2UQvAzHa3SSJwlpH55b0fqWMgUlud5zWZzaWlpe2v7q6++evDgwc7OTrfTJW+Qwah8cy7zCCp74lzvb121OwvX6tyZMgOtVbxtJwMvY6+z6UI8Q+ANAqSzj+nB3vn5ORQNgg+YTMaTHMpkwDXhNC/dQt/34zjuLiwsLy8vdBcXF5a60BYXuovtVmehuwBarNhSPEd3YWE4GDZbzSiKhoNhGARJmoFcfZ5PsxSIU8IB1MbhLsBrONfhzXkOxrCzH6W8FR/7HMlHksR6l7y3FX0TD8YSe7Y6PM3zqe8pf1HNWQ8qNpNG4jWmOdKQhhGoMcXwv9bOThg3IWfIKdM52ytmJhtADTjFQn3E8lLSknvCvWIvV+Y3pEftTJDaRazbn7ApSKSV6XL/q76HlF0+cB/j3kSA0SwrYGXL1I6J9BAkTK+9KL/wEA8vi6XshchNU1idm9117bmZN+S3RU1VowBckV8IcoAIhXw7nQ7IEgpGOk6DqJSpdmdNNEwbxES5+jG3um6fjUPI0Vk5QCuy8zabfLn5fgDC9JinIBRTu91cXVnxPD+Om2QmoJFqa0mw5WARgAtWe+yOO+lmJTcYXqTpZHRZoUraKdfUkjhULUAycZpJxPOkIaPT/iQ56w8mg14yHGRFA3xa0qFyTq4iynRJBm/ObIEU0r3cY6nbH7dJYQk5O4zuXMkVkXNH5tYqaUWpMUsHH+3o6Oj58+c//PDDP/7xj1evXh0eHjKVSBiCYCanJR2Ck1ldsq8K/iE5+7Kn5/hg9CeV/ElPRlLIxFHs+V6rBXrcJEC/tLR04+aNW7dv3bh5Y3NzEzjTUJkmJKo0bJU33PGy5NVVZixlCdZvZ+yWS0nNXeK8DTaHXVYmNvVrFBS+RMGncrPBuYNaF+TxKgbDwWQ86ff7Z2dnR0dHp6en56B5cNbv9yeThOPjbDoQO4nn+wvd5U6n22oBh0yr3e50upsbm+1Opxk3ESMK7p0f+KxpEcfNVqsdhlGr3QrCoNfrARI4BPSjF8KXUUfCKrlTIrfIoUo+CuM6yg7wZZ6XSPGZuGGlx8hj1/wr4uJaPUUWEepflY7loz6HBP0GFdjRBjySBhT5wBP3GtMM5EDCMEyyrAl2Z+PNu/ee78ftNuh+FMXOtV0s5wQtsSwDF10lzKuqM7j8B6svVFZQdVbTSGhQrnAvqULCvCO4SWuSs7r9CZuMvcLfmkpQwRI0PYyzvQF/DHpUCaqqjtP09HwwBW5koICiCUVrJNFhaAiYSBuohcSd9TN7OQcHT8V+M7DuUrbXB4BoGEOCJWo1m512Jw4hkBRHUQO4G2O1OgmnVdX/yxIrdZ/UfdGUjbVO6adpV8ohVK0EcZ4VdJ97DNiqkFM0iCKw9tqtJlGzUIGEUq7PsRCChHZnHNXUPthNVm7MYLao+CEZKeIHInRsvkQOo/IdYb4UjSnUfeUgaTotkiyDOpwpiAfTQd1kvyY5NZEaXrFMBLxuf9Y2i9ByFnNM2VOqfF15IvqXHcI8z0ej0d7e3k8//fSPf/zjxYsXx8fHkvqF2EepSpDPS/vKrFCOy9KG459yjGVRe6c5jpB8n0Xn0eMA9zIMw06ns7q6+uVXX/7bv/3b119/vbW51Wq2gJgEiwbn50sr/b0Kijn7bst3frs204Ex2COTGATTv6r0USN95g2J8rExVAXY4GSSjMdj9AChcYZwOByOx2OSXYZEFYwlRYcZhuh8+34Uh+gNdrvdhaVFqh5sd1qduAlpQHyUYRSH6H8WreZ0PBmTCwo+T150uwtnp2e+D3EBpC8FL0hdlLZCVAifVkGIjFkKlrNc+gturz5FGSTs3CmnvId8J+uYqg8WQ2ExxRSn/XzMX7JvAhKiDkRhRN8LieYlaDTyLPQaWZaPJ5Oj42Mg/0nTZJK0mq0ojLa2d3zfH4/HpFk/J0Ik30fkKNqs+FBRz8mthFRDRSQJ0SevSHTUxUR1+4M3dynQsiomlqMTDFSkVLYceQ57MBmz8XiSAmg0KwqgBRbpc0oJaM597WeV46GVW6SOMV1uOs34lgnlYIGz2RcwqUAB1larBQJOuMvSIkB7rloJdVrEIl5U1mlVFrVuv6JdRYfw0oComXabxiNBsDgMC4j/t1qtVgiCfipxAQYihk5NJpsPKKeW9AYlTIfhp/bX5/ffAu/hbEWaRG0/KFNYaZES8g4qQKbTKMBgESY9i2Ka4I5OeRgFMa1A3VV3hGCrliVRtz95KyfN6EWlo1LpB15mGJCPNxgM3r59+9NPP/3www8kOUh4v/Pzczod8zmVj1wJFdOd5v9qFxSSQTO9Qeo5jP9pReKLKydRSVDp0Hie1261NzY2vv766+/++t39+/c31jY67Q5RpRH3jIoTzb4bDv62DMStdHorncZf3yoPWO4h0ULynVSrSwk0bkoHL9dDxgaT607qgv1+//jo+Ojo6Pj4uN+H0sHhcJSAupYSrkS8KJJ8TqcNdMLDMIibzU63A/SiS8vd7sLiwmK32201laREHDeJz6DZbIKrh88aOPiyvNPuFDks8EQXVACXJgTLEkCIKIvKirRx09JeuiL8gic+K84unEmR2avSUJF/OCcz0UFV9Cr8vgIoJcyJ9MeKl0yxC2qGBkKSAjuFmg6g9Dj1c6uOz/P9bDKBXqI/mIZBCAER3w+jcHNrO4xCoBfSERzn0pwLR/IIxTJK8xGZ5yEWW1Gzqi4W9h8CqFTNHXhZb0x1+4M3s/KrEJMIyFgBdzv4To4VEsXQd4GOeQTlP5AbRFQDrVsqGKr5IKC8G5dnJp6gQ5tZJk1SOeksa9bqSaWvaCJLfBwAiza8PAdsBcbgyAxtTKdRFLVb7WazFQQghUrqi3RhYgqbrV3u8rT26vBj3T5Nu+IOoVLTq0pnz2IZhV+BpESOVXhgVGZ5Dgzmy6th4EdNgIySSiGxk+uKQV1dZ3Z4fGnFMOi7SLB2OXwL91tegBvRYeFevUYgEIdOhWsAw76wh6Px+Pj4cDgaqlzKDFZ9FQcvgwq0PTH/Htbtj9wqK5oc32mWN+j4LXMcQk70Mc9nv9/f29t78eLF3//+95cvX56dnaVpmiTJcDiUY4ljLk6+pRKqSugRIteGBgRKqkZBJRPs4S39Pa3gJmxivEpCu1HGrxnD/1FusNvtbm1t3b59+4vbX2xvbUOQCKsg6JsO8cysOy9ZT51kYPlZVKaePlUrZ6Usl09kTXnJ4s47KVz574WYfCaS5ZMCjyVyyRwfH5+entK/+/sHZ2dnk8lYZ3oxTgfSEPB0oihE+Aa0dgesioXu0vLiyvraxsLCQrvd7nS76BCGURSTFIiHbECgPj8aBUHYarfzvFhYXPI8f+/9ngdSE2mv3x8DegIYcQHqDHBWHWGTQul001Aty7iNMpFYirCYG6LdsPJTkM/CvWXl4oDquIjO0qJlhvUC7mBjNSERbacv84xTgGdOszebTfouueVhAM+rCbth8Or1G6Cf8YNkknz97V+2rl2LIlDyCIIgTVN4UmGI8X6lLWZdKd8cTdKmBr8aZXoE6svkacuDrDzqauxo3f7grVz4IOEthBQVwEnxQ/yXQ2NZlo4nkzTLiRIClLO1lpjC1PBBlBSayiCYU2oUmQM3sHIbl9l09GpSaTMAkzP+i2CNAIhFo6jT7cLWGUWdVhuE3ELgY/MD3z0aXQOnXfBtuh5aAGpQwCdsV9khJI5ajlh8lFEF+QCU8EPpzDCK44WFhWYch7jRpVCN4hdBAAUQMj5LqW1rColPrXdE2GN2M6wyVT4hu5g60KQAnsYkMcsNVO8XBYZ6IQkD+m9FTtlOsHc8u+TJ3CJYQBTNo8Jq292o4zN/xjZL5KAMZZQfVWaB5mfDHL6Qfr//4cOH58+fv3nz5vj4eDKZ8BAlclHWkyhTbjrbZ9kS1mESYNXVBLouENTJ2PB4Vt/R8RzIB1KtGmDG4f8ipNDY2dl58ODBN998c+PGjcWlxTgCR5G8wQvvRvk+V3657HX/FhOtfGRtGBhroZyi0TIArnMuZQbmg2bl8cjRooEBMvTDAQgPnoE3eHJycnbWGwz6IxCZwIwdUiYQaB9hvCT2CE57E9ODKyurq6trS0tAKrPQ7TZbTarrDEGBEJ4i/RY7BvUqtDVEqLsTYSVhw/OSLAX+ZSDsy9SAwsFEofc5fDJl9tE56zrfpjkPaE5S0dpR7HIB3ioU6Ew/olmnUL6Wjojwb3gR4EepNa/Vs1bbSa6wowDzTrPRcEiKTFvXrrX8zmg8Dn0fynNB+Gjm5Uo/mcis8QXsrBLe5lrPglTcLFkzii/qVrc/LEhN1OJYoVX1pz15CZEmkeo5sIwmkL6g3RMXOVqolP9kE8NT4kLEWoyZaK02HxNVqYC0lLhwWNsei7kR2DpthGHQwlpuUnKiCiYMG5UioaRDqK6dSrr1hdUW6KdrV9khxDaz2m0uy6jJfgRBkAcQ7Gy32iA+4cGAJq0/C5lD5xJZQR18dZYA7ajZefg5s68y/uE4l7rSTxtaNMeNS4jIUVw7mChnMpmA8nKRc8Fh5dnlhOPYTB2CvUqtssjWCZ1IyZZLuoL8mqXGR6PR+/fvnz59+ujRo7OzM0CjaUdCqs873ZAMN84ZzfTzGqCzhErlFFMsJ6kqf84+ZHn4q/01JMnRaRRG169ff/Dgwb3794BWtNsNfIAgaq/xYqSok4yVH3FmRiZFPwrl/lGtnId0qrCcL8tQsqTR4lSUBthbGd3ZZzeRAh4b48n49PT06Ojo6BCIZM7Ozvrn51hNmmHNoCIHyrIcqAmo0g9e+512Z3FpaW1tbWtza3VlrQOcMu1WG9ZqFMQLkKUAtFhxsKlhTKw/VMSS4oLmB2EOqyJgIOH/s4yHhMiX6nFC0Eo7V8fwEOtiZ9wE9p5Lz+Qj9wMBomZEDLOhqjM5Py8FKVUokXEtVl/Um3IMQCE6fuqjMQrS9QhZA0Ek38+gkMnfvnYtjuNsOo2Ehzlr+PJwEpr1+lGx3SxqLdSt0xpL1u0mAAtlQetgZd3+YK1yIwM5sQZAu13keWn8quUHdjsFb5nA4jmZThtEvkwhLAjy41+y0I6zBipfIDGiBv+lFh836jQjTzgz9qfT+ooOmlKUYHtOyRmkVEQzbnY6HSL30qgG451WLF1MN2pYqGqW0U/ZrrhDOAsaNz+GrWRzceNJs2xaZO1ON4igjjAvkEgNlbJpg1OKnwKaKo6sdQIdM0uwqPHWXan2XrZoVc9NBo9NNH0K1Bz2Paz1UyemshDk8Usnk8A/Ou2f93oUii2AYhE+rWykl6o6o09YT8A/e3MKb5x3eKF3ZkoZEFg5iRhVSOSi0+k0DMNer/fhw4eXL1++efOGMIHn5+cQ2kRyUawdUmL3fC4+Cxf4yf4rJ8TTun8NL2/kMORBP7u6Y+yx8K6sgTFKhp52rigEDhLgQ4PKqCBuwr9r62u713f/8u1fHtx/0O12ISvVgepBjGhC+onrDMvnlVkOJwc7i1GmvHD9blEYXkloz65MF5eTgZdhb+asIGt4gLJ8GKSD9Pjo+PTk9OT45PTk9P379yBKmUzG4xGOkEyPOjgCMcSQv9dqNVdWVxaXFjc2NpaWlhYXF5dXVhYXl5C4DrSCYKnGnJb0BhuNBobDUh0tK6BOcTiEJJjnnff7VF+dZkBuVORYZYr/00Tn7Fbpf2U8wV4fFaNDhfgXyjYad87WXJiVHlRpSv09/YSkXafqANSO5IREET5STgfQE2RDUHdLIjBV2n06bbVaNBwz2BmLADmBYwTiPn/9OkUZycFg8O1f/7pz/Xqn0/WDgG6jj+lcoj4k3oiqiwNsjsRUl2sW1CQiYxf2NSuEJObXpcITdavb79DkGl6BFOWqV8UCwXRJrk9IEwHqBbGWCZAVSLXV7/fTNAthG1J1D0B+QfsLLRVgEZpz0bH4X646ckJRvNSoxZffn7378xdoxrKELxjNQRDFQCiKBGxREEbNOG41W52FxSAMeEuxdGXEhavliL1BDYWocWqfsF1xh7CyXQ7WBVYEmJiwbQND3eLiQrvdwuoIJTgGCQRFVT+zwpb/YxVy6P9nU2JWj6Syk/uBvhaa1iJWrKLwaBeAGCGEZooigLC6WpXSNJ2Mx0WWkfFQ5EWAasKz+yBMnHrqXa1Whg7OygFeMj3ILlxRFEQZOplMer3e4eHhmzdvyNwnV5BcAnox50QzoZUKXGKDbWwaEPVlvcNKXJldI2fcOToyvUCK7Hhza/Orr7/6n//zf3791debm5tLS0sAFrALBSv7OQvz6Wyo5Y+cIzd+4ya1bzgjWGA0t+zQOt6gbPPPYoqfpwBBxDwctNEIhAePj48P9g8ODg5Pjk96vfM0TUajMYJFUw3+B0QhoxajCKs6FxZW1zY2N7fX1zbWADK61Go2oxgcQkoDEk+s0xNDWttoIKco/G8CRYwjzEdCo4GktLww7g7Viyr2rdmWeQjNdNdVuKJ0K8oL6aWeMtf+CVtR9UEPf0EO7fxMx/TIwnPD785k57VevV+QJCOBuvEGYrgTIz65748nk8MjAIGPxuOTs5MkmXwzGd/+4g5o1mO4J5iCUThjP2s440qm3GWtqXu3ALpaDa6uwaN1+6M1MhQrKaN0Fk1RUszSUYAfYhJd58a9NE1H4zHxtEARIWULGC+qnUu9wos4YwkNUp4wJZG0yzYZiRHl1VioDDFc+CzwfdQEgtZsgtA3hu6MpJC1MWkPk5deXkhqi/QTts/OIfwIvj69M4FAfcPrtDuddpsoCoJgEoRhIwVLBTiyVTF85U5noux4erGN2zjNWRkAB2tjgElspel/JPkndIlxWUDSDb/Is0ZRRECvB0gtKCPMs4yqrlQSs8oYdTKrddj1CrRq+GVJEK/yowuPzFZyii1JkrOzs7dv3z579mxvb+/k5GQ4HHKCiLxBdiD5IPKAlWfR5RQmQ0MZjLIhqGFvFb6NoSRFu1bRhAIoDtKV0+k0bsbXdq89ePDgr3/96zdffbO5uQn1Zq0Wi1LIrOacW1FpBMgeVt55eajfdMYpdRprsltX4VjbrAQoX1yYG5Q+IY+N8Xh8cnKy92Fvb29vf3//6OiwD0r04xSq+cBTy7KcwsBUe0LuXLPZ7HYXlldWl5fXNje3AC+KqcJOpw0ZXQD5q0qVWbliSuoip+hkPB73znu9Xu/svKckkymWhg1kEhVTgw5bqDD1L1S/kpTRDjxErvMVg4HeIcOoYqiogD6v5UzNoNmtLQ/RgpmYWh11Iv6C2lN0dt1yz0I61zTz/WmS5KAjCg5hkkyA8SLPQ4ieBi3YNyMvipQNOjexQE+HRUF1QS/eel06KAepo6RKxUYmWlrvVnX7YzRnDZ+5F3DscvbaomKhmCocDoeDwbAg8R5au2DuKF41vc0Rs6B6rU9k+Om5TzMDWzjViNF+5urkfl87pVAQjHT3HvJGKcQorMDtVrvbgXrvMELFJp3GdOD3ihhDLX1sUeuP6tn96dpn5xB+lGnbgKoGCIiGcQxMa3EEbEi+F8DAhXgpZq451MJ5dSfwL06kGUk1S8HHtfk/MXl/gV6lWUT6Lp7vDyfZYjQdj5Oz/tBrAPwVLa1gTjyVwvPl5ayeh3/eNgfZWEaDXJJUlqk7iR6GVK1Ho9HpKYAA3759++7du7dv3x4eHp6dnQ0GA0oesoA7ZR5MEkn0gfM5xuZrQBTGQPj02aF8wraV2SWgzczR/cNajGngKcAnIUUhWhmEcRNygKurq7du3vrmm28ePHiwsbFBegaEEaCIplI8L90Z7i2btlL4fo4TWE4b/kZzrUpzUq1gBCVgNA4wVeLn7GLxXZVp1Tnn4lOo5BuOjcl4fN4DmcGDg8P9/f2XL18eHR4OBoN+/3yCoM0wDPIc2LuobrDRAIKSJrbNzc1Wq72ysrq0tLS+tr6+tr62tt5qtSGhi5yi9FycXhGGmWreIB4B/DHZ+Xl//+CARuag3x/0+wmefYr3QTtfFbE+IUNov0+XPPtusFFFDo4GmJjb6IgMOb8tV6KyRwRJVC1fRp2gPmo7qqJT9BQtO0zxOuiJo9+k8AeVfk4bjQh3QxlMAcRaFE2S5O2791mOAh4TwP3eunVreXUNsKNFkSaJHwQR2H+Kj7c6r640CYnHWwUsmMibHFxzrxARR8RpMNFURUUFMVXd6vavakzbVDbkaCOj9UQWAztDFmceaEsUYECCIms6HiWTScP3h+NxBmulwSNwqI7eqNzQ1R/2SuKYgsKBdNWq1b42nZbNArl302pMOr1E8gzY0TCcNqbtVqvdbkdYeUELkJIiNCukKt5mRJygkqLF06Bt6/br22fnEPIIv3CT8H2QToEB50HGoNMFpeMYuM4p5Y37pcZrWiYRvm8dW5wJK/ILpSL4i+qC9JLh7u/W/q0iyeo/eQ62FO7jkB6cJAlY5MmY4kgNoO+bNxJ4f6W/ZrMD1O3P1Co9/MtgR2c1XsFZS3AymZyfnx8eHr7E9uHDh9PTU/IYWYOOyUWlK+i+lhAwyNQo/UDO+5kmyt4cyTiZTHBShVwKCKp2yCvaaDRWlldu3bz1t7/+7dtvvr22e21tbQ159i33r9KcLVf9Vd7MsnN44WP6hK10WIzl2raBrrpUQCQGis6/A5UNEm7oPFDx3nQ6HU8mw9HwCJCi0I6Pj896veFwSOp2WQaKBZidK6aI1eRTg8R8FHe7CysrK9euXbu+u7uxudHpdtrtFj2gcidNN0iMpJjmGRCinJ/3Dg4O3r9/9+bNm6Ojo8l4wklj8nzg++zh8YVq7r5fL3IgUnEmISe9wRK0swKvYR2QOcDMRkB/6zw5ZQ6r3HjmHZ3dTxNnxMytScCSWDxiTwANPt3bRy3QAv3yRhTFYRQjVgWiL8pbn3NPdLgBnz5af/haacZwIkXkCuXhGFbj3K7LPZO61e3TN6k6KJuaUqKoQfzH+SbbnAhlxz0U2drGJCWNEoXAjS+nhoUFcE5s71B6xZjRfz6auBwlZzqbMVv+lnquQnW+j/yirSiOwhhUakLE9tPC7fTQrHUaNCoX4zL4rm6/uH12DqGzgc7dJ+ATyiFMG41Wu92ECHQYBpDdhswGZb5RtNA6UhmPZ9mdEPtxtMguNArtforEoywmFKY8oYZYn14RBqASKL0DMtDgEwLvP4mEzrkVejYyS4Hbu3ou/tmbU7bniHpdxpaSvhb5eEmSHB8fv379+vnz5y9evNjf3x8MBpQg4qHO7oEkWanIm9mVEDriYWgG5X5Wmn0m1+HUDZLPozhO/CJoBJS9j7xoeWn55o2bDx48uP/g/tbWVrPZjKKII6+KPM22qvmwElY3pybQyWQ2/hVNLBoMGzRxH/u7lpd1IbGqcxaMaysBEmIS6vXAGdvfP/iw9+Hw8HA4HI4nY5DDwW9CCDzNEPvOsFUiJ4Ak4eLi4vr6+ubW1rWdnbW1VYg0t1pAAhQGyPJVvZCSM49JSkCK9s7PX71+/fjRo8dPHmEHBhmRi+I1aU5m6oJ9I37lcmfcF2WtKQ51279idXh1UoH+4tHLW46sIlcbg/oH5okSwFVJTaZrrzYT2fG3zktxAfTKNI28mn68egBvcBCkEAyaDobD93v7IMmC9l8cN/0wbLc7IaYIOJA6fwjhBozZS2Q/A3lrJC7k7InKayvqRJVeYSwZ30kcq8ZFrD3Duv3ufqAa8bRh2UAAHJmU3NPr7uwBqtbqqd5h+4NhfzBQuw6hZBDtrjc7hUBw3UJbq4bn0eVbOVAlMyIOeAESiQ0vhxUCpIMoZ9iB7GA7RsEJdoNlrFakNlC9W906k4GRN7Nun6RdfYdQWIHumJ8f3GWCJoSHBcClFgPQxfMA74QVKsq8AFSTjU5xS/5455/NxXcBHNTK+ItflfAAZk9vANu68vfQDiB4XgaVHunU89MsD6GuA9L0akWYMbt4beEOcN6A05V1+7O3cnaO2oULLmVdoCRVqAgOhyAy/uHDB5KaePfu3enpKRUQpmkKHGg6XMEK8k5+UnqJNOOMx4W2MrEmyX7KASwTRM5hVRIJjVqI72ApO9aeqba0vHTz5s07d+7cunlrZWWl3WkvrywTkUwYgZXL3oU8hbxvXA/JruMsH/tfsJ/RrdAQVu428aeIkaDIh8uu7yU5Rfk+SKQoscgMhsMTIJs9effu7d6HvV6vd947Hw6HGswJZXt5nuF6C/wx6FkE7Xa71Wqtrq6trKzt7Oxev767ubm5uLjU6XTo6ZBsrHNX0f+kmB1irooizbLeee/Fy5ePHj589PjRq1cvD/b3D4+OBgPoQAaOqBlX/JTN6NKWygXOzKxVXTx5CTUpbRzWaGE1BfkI7KCJ9oXIqlSFkBoMrA7ieyDDIXohmknKl66O3qNcO8FPixyyt43ptIlajjCNfT9LUz8ICpClgFTAh729RmMaRhFw9iTJ7S++WFhcDoIASBKThNhiaRyCOsiMPZHg1qp+SV2yRo8aNTKs5MdDaKIZdQmaVtHczLrV7XdrMqnODKLWFqAGq/6yjpWUpydp0edFjs4RbLj9/mA8HkdROByNJkmSpZmCLsCqhbafvdiYzKGVD9RKaCKI8qsumdEO+l9ii1GQUSoCj+M8z9rtTtRu+yGWjWAv1GKr/FVtA2D0SaEbZGGLvq+1T/ip2tV3CHnjxEqYCs6kWeMJNHZNFN+LYlA6bjWblNHmtIN9LHVGpwO881OU0tnUy6/Lze3knPCM6AubqMAPjgsEqRAmadI7Pweq4iRB3WUqRJ5nm8pCl3IX6jl59bCjl08MsmHKenFpmgJRR6/3+vXrp0+fvnz58vDwkLj+yUOgNBE5S+zpOTaxfIdSQ1x56zf8Agy/i0rbZ12s3ifJQta82Kig7YG03eb65q1bt+7cvXNt99rGxkan0wl8QAQ4JrhzH9izrfyOc1crMXu/X5sBamUPUPoh5T7zfy9xHnI1QYCebI4kSYbD4cnJyfv371+/eb23t3d4dNjr9fqDPsUUEGoIDiGlBKGEG1sUxa1We3l5ZWtr+8bNm7du3lxfX9/YWO92uzEKQuL5qkC80A0VfciyPE2T8/P+mzdvf3r48PGTJy9fvjw5OT4+OR0OR8RzRIsk/9Yv+fCa+twqea1s85PAlX6ZKiiqcrbtHHnFrcaHqNBjXCPq3owyJpQvQ6cuK+1R66nTaagIgRAomCFUdxtz6IgMR8mJHIQ96KPbt78Agu4sC4JwiisGhSnn59KZZoaoZin8auVINcsqhXHJwiUwDiVIJcFjLZ1Ut9+taRVNzomb4gcOWMxCwTiNoPCEBcBCCw0ZHSPOSzt1BHQXkvdm1SIlMplaZ+YX2QUZePq1rWxLAJ8MEA4DuWirRXUaFIelC6RpK2+gjOc6R6/BaZ+2XXGHsLTNuKmPCxFxGFeET2NkMwc+8zDy2YpFhfoMN0JxErHVCw4Gs3VxxPcXzzre0vQhuLRXmikFWldUrTX1oaKj2WyS4tRoPDk9O+v3z5dWViBDiMsIKQtX3gSZX9Xl/QqE8wsvoW5/yFaJ2JzfhD0JmMA8z3u93vv371+8ePHo0aOnT5+CrBxCAVl9ntwD18521n2eRyqfJ/CiYiKT/Wdh7bS97rg07EAS6RkdlCQQIR9V5KEXLi8vb21t3blz58GDB9d3r3e7XfAGQSUJEuxkblbWIjKrGwm28YVcUq7992lsEDtVjgJGoWRLufP0BedmfmywgDKEJF9+dna2v7//Ye/Dy5ev3rx50z/v98/7g8EgSxWUVKWDYCmCB4+AIlhx4zheXV3b2dm5efPWrZs3trY2NWV5HEZRoMlOy90gO4NYZJLJpAfe4Ot//OMf//Vf/3V6cnx6djYeT5IkoQTmeJJQv1V0QziHF167wYaV3694s+RTm1V93inmTkwVAGTYmH0+15tljEc5Suq6TILOgd7gga3IDAGHogcXzikoGYVAwDnSR1FKX6VDOp0uyPr64MbTNjq/SSEKiNJagqUWOpTymHQ98E12cZXxrZxJKJbVR77g3HWr2y9uPK8oGKF3Lj2LNXWnmu/wnka8V3k6OrGAi1KepUAUD5DR/gAnHW6sDHRX8R0IntLB+YCGpEXvlfr4hqF35gWJtICMDs5q/Blclypz9ALfjwBADnAP0JUlhVhcD+VO5MQrtWdIX9WKGLBZ1VP4k7Ur7hA6VH7OVirRXOW9QVFa6+0oTdIWMhaEgQ/VRP4YwteFn00zTpELUTT1QjlpVbZUeV+fT0xvOkYLCm7A9DddzJR9Ob3FA5EMhm8JJIexWGWcTafFaDTkwn6qVyEDaAZ0h1Gl5vZUdq9uV6BdJuXLuT7agSjSPxqNTk5Ojo6Onj9//sMPPzx58uTw8PDg4GA8His0ILYYaXsdnQmZbyG/jgUGyUBnbkyAjIptDDcb415asoTyiiD2iHZwQChR+G4T5MsDiPIE/vLy8vXd6zs7O7du3trc2FxdW11dXQWF+ihuNpuBj24hUowaNJruNStnqDit9glhkUHSxn+ZWyhsYokVchYikQNUrgJb/GV2lguvgn5I/CJceTgBt2tygqyzT54+3d/f752eHRweDPqDNEvpThZTTBrTs/E8tBjC5eWVKIq6ne7m1iawyFy/vr29vby8TO46IZHIe5RdlXIm7Gqe9wdv3779r//33//45z/evX37/v2Hs1NQxaRYe5oCkw1XhNPA44h1eXFmwDwrvuuAGht8lNPi9d8YY7whGJY/vZ6T36KzhR8RraeRJ/smu8qP2wam2mhnMRis3KZ+TaOCgwXsOdMKkOeF1ygaYQhOIBZUANY3TT/s7ZHEzHA4Ou/1bn9xe3NrOw7DIs9TGCGNuOn5OMHB/5/BZqywoyI9qEOTyoBW969QFVOKkEY+Tb0X195g3X6HpjWR1HArEZ4pUpYGg/N9W5jebhhRo8ha2mh4w37/BFDug9BrjMdAjIyLrQG/mG7oAh9m7LWMOo0jvYzkoHXYGdk5B2Sksn++F8FOGsGCDhwyoT/1AN8Pkmgm4kMWqWMJaMtUoeu0T6irh2t42qdrV9whdMgqZnF2z4jgWomFAPjoW51OV9scCgiqzCYZODEDVk/DEgrul12IvCL6Q32KyCbzHT3lWYwQDCMijycRwjQdIwB9OByS/Ur6ywqTULoTStNKdb7Csq3n5BVrl7H4eWgxEHQ8HhOn6M8///zo0aPHjx+/f/8ekMn4BVZ4YyOyLOLn1AEyDtCoavJWQaXmuq6AZ7e2rSscQrmDQS1VANVUhBZtNBqddmdrc+vm9Zt37t65efvmjRs3VlZX2q02UZUQiZR7E2jiOBFNF9Vidvd/yRyx2DHVvXWjsI6JPwfmernEYEN6YvRmCvHs8dnZ2ft374hv9ujwkNKDFCwgypk0S9F8QMY5XI+Q+RXCycvLyzs7127fun39+u7q6gogRdGZ19XcFQIGTGYLiocoe3h4ePj8+YsnT5++evny6OhwPB7yUGS0M6KxCjJNVFDevUD3GZNMApeVEhjSqP+pSzGOovC1TE4b/kQfRj02+oJI7s1ujPNyiyIkSxO/IymR7Oi75SiKCWgShpVxTMvMRewoLQ0NLBVOEpKUBCGK8WSSjMej4aBIM3+3UXS7PjjzXp6mHpbmFtOpEqKpPIsPomYywosvlPvMxrfxosXAVquNSWaSl0skHvXmVbffpHFY0wZY6Q+Z4Um/ITCkblMhJRzzSNecpEkySZI0y5VIHw13JZZTYZWp983K/4lwodbh9SauT6T2fR1IglJf3Hy7IOzdBkGhQAk4acSoRg2YzD8dVq1DHEerIzqfvF1xh9BpTpLQyQ1WzB9hA8VxDBplcRyFwJOGYWOq1PenU1U6xQFdJdYsDuVdWoR6TudNP2UCU2+Aws5QG6KmnCKCYvhvs9kiqHaW5eeDQe+sNx6PgzBqBISjawQ84UR/ycHVssAkOyGi43oV+PgHUrc/cWOHkLQEsiw7Pj5+8eLFu3fvHj169OzZs+Pj4/F4LNXn2T0AOkcNSpReh2uJkuSgLgEz3LwCO+q4K5x1tIxg3JXhI20lQlLRRwRaUYSNsNVubWxs3Lx58/6D+zdv3VxdW11cWmy32s1WM4oj8E/Q6XAyKpT3czhFHR45hYe5BODwt2tOsaWUoZcso2Uz4qP8QD6XEy8gGfrhcHh6evru/bsXL168evUKigb7/cGgnwGeEDzBXFN6AoIK+SSpdBDCcO3OysrKxubm9es3tra3FhcXOp0OyEUi1ZAqvZnRQ4BRgekERa2Hh0dPnjz5+/d///D+Xa93NhlPgD8GrTAnVEEjjq9dCgZWNVCmJbEtCp3BwbBymyBOqg5WlxJx/ML0Wd38adFA/JPKJepHwFBLeqfMAyuAkhfuKPx4SjmE6rtXKYnmBg5sAAnOQbz0HGZNhtN8gIxBitUsTYo0bRT5xtZ2e3Gp3elguPKCEK3i6GbsqKl7Vw+IeTHK2VEnokp1oRgDVTek3r/q9ts1RkuKocgVu/C5QDE3HDJhqxpQmWdelmdJkoxH4zGEWADgQLZeDphRytgboAcd01lADEW3CFn+giszpmGjIiVpAWdoN2hMA9+Po6iDtd9QQIhCbqo8C9ZAKyLGZ9FpF747KvmhYG51NeGnaFfcIXRSgrJyxuH9qzR6uJbd87w0yzq4bzVbzXa7PRwOfc8vIKKLA5gyduKklWp9YJVq7exyDz82YCNXFISVT32/kNyAWPVEVwe5eMqEgMVTTMfDYe/0FOYq2Op5lgct0sPQWXvZJb2KWVYjnUPGhGq38HNo9KAZKUrvjMfjk5OTDx8+vHr16ocffnj16hVRjPb7/SRJSAo8yzIGfXGOQm5XTo7CTA1BklFhuRI7meeTF2FjWkjrV/0hVdQjqDqD/4uiqN1q7+7ubm5sbmxsrK6uLi0urSyvLIGdirzYUQwl8Mg6QzXDjJrjWkSzpOCGJwGiziLzL9m03GVQbNIM/eUQjw0fdY8z5yyMm82zjFmXiX42y7Lz8/P9/b0Xz1+8e/vuvHd+cHDQ7/exqhCiCSmwjIDuOXk+JAjZarVaAMroLC0vra2t7+xcu3ZtZ3V1ZXFxod1uE1KUtEAculf0/FG4AilNpghePT4+fvLkycOHD1+/fvX8+c8nJ4AUTSaQOMwygjdC4zXf1jOEe1MUACYViqxqgFFJOQpYUpUpaJf4sNTrjUFhLKxknXUzRa0BXYPth2PigL8P5XkY2tAgVB2rk4+KGc7UgzO3iKOGbLVVPWI1gMWeJMvgpf2nENSCUwrFjcAf9n3I+pIDFoZhXuT7B/uT8XA07I9Gw8Fo+M3X39y8dbsZR0UQpHnaaDRaDS9vZA3PA10yVKkup+9MLANusqIahgckUq96e4TfGiQCu4WyWgQzuHMGdt3q9suamGgGj62p5vWSi6VFgPTGajiV5C5FDz3ac8F4KybjUZ5lp6e9o+PjBANqkzEQtmU5BmAKYFzDsT03kMesopULwWWbXC6MDysr5xU3GGYCwzDotIGhLfBowfTiOMaiD4H0MffN3DK+G7owklOv/8qN9eq1K+4QluFP5TBkZXGFFR1XGyroX3W7C76PrGgaTQRuIWBQCkybNZxYhRu2EBssI4hExy5R1asP62QgOVCjbXRzB5SFRPsfmrJZnk0B4DcZDAb0U7B1dOjU6q8tbyjOhjsobbnK5vhkxFR1+43ap0L2ci6FTEDijaT04KNHj169erW/v08K42Rb0wuythmd6CZJ9IyTAndS66yyG+Y1TRxt/upEuj6I4NKg6kGNMoQqBgrxLK8sr62vbWxsLK8sdxDNAg4J0KCpb8ridQds6XiqkiVSvqDPfv+ti5FCxiCWyPkSX4jzaC6fIdSrDa4wuOyMx+PhcDgajQ4PD9+//7C3t3dweADqI4MhcYpivgjSy3QENTD08IDSwW53dXXt2jUlMrG8vETq89y3cjfYIQQjCXKDk1MsXHzx4sXzFz/v7X0YDYfgtWpSUXrBQ1Qs/laGkHxFORjV5xQuwEFCNH6Y7GPUk+qiPGYJqGIhPZV7yLNVjyB1i+D7eCI+iA7MiSchDlY1GPTvTK1D5Z2syJ5pzKvukfktTwM+Ba0PsKcEoCOYQj7WO+sPi8ZBPgWEeZJMUHPC7y4uByhRmCQTkHXxGoXvBRjjcbrEnaEnBRQcXOzagBCt7iYjZ0yAxlTdy2WHvlVLFNbtkzfhJ8k3zSJs5jVFjGDEV24Q2uBUL/IsTyYTgFeAl4hl6sqV0np9F20z9kwtW5RzmlmWTN/UC8ZAmLSBg0PJ0sxrtZrNZmeh22q3wTnEAgE2CYQpKbxoZpLR3xGucj1nP1m74g7hrCQhNyeQz29aeCoFGQUxLCI5oCJYGqMaHWr0fvW/AvejrSq7P4y9pD8IgzrfIywtL1Z1h8PCO0UGddUICBWEIKVI15gkyaDfH41GbfByQUoRwK5zVwXReWH+Tg3mod5T/xRN5t9m4aUvgxSl0qB+v7+3t/fy5ctnz569fv367OyMkkLMNsEvJGGj43LIjvG55HRwzGinGFhdC5qpbod1gZY6O+RuAHLj+V4TuA5bi4uLK6srKj24vNTtdpvNZtwEiDgnBk0+QQZZIKOumEushUVJZWsZcH0xv3PViiwqNl4g412ZWqPEuOg6sRee0b4tOdB5ZlCrPJkMh4Ozs97J6cmb129evHhxcnJy3jvvDzA3iOMHv4nagEjoQlSuRZ57uNguLS2tr29cu7a7u7u7vr6+sLDQbDYj1CWc1T3qfE51g5MJIUVfv3798NHDFy9+3t/bGw4GQHliiloVmLk8RK1CFVheFeWBxoAQvS1YMloOj6sGKXZNx5H300Du7WyhgoXqTQS3Hd/3iDnMmhRYRtcAcXaqgoMLcHJ5VTdl/hOULmvlR7OPqzczXU4vsaNGiAKlKLJG5gdBkqSnZz0A3UByIw/9wGtMt67tLq6utdsdmlNqAFPp+4ynzC+0IgX8ksOspFwmSo3ZOK+wMh2E3vx7Vbe6XdgEp6eKuEmrUn9JDUiIryPDQ5V9Z4RVcB2BqKTngeBnCmXREE1LM+Q1pK0WV1NYx3AuOjxbpd3WOdEFFyVDWrMuWmPmFQ4OuSkaeQ6hNFzn4X9RFHU6nU63G2nxWD4+ITHcaK9abPXd0BEc3S3njtftl7cr7hCWWWScd7juSBp8/NvA91Mdus6yrLu46AcBZA3aLbIXYTNOU3YFbYtKR27tqjy9fVo+Fb7FnE/VPmE56ch2nji+nBZeGAYkNo3zU/UJ2Q4avbPe0dExMihAjQ2vEEVREF2kvGmz/tRzFSwlxlld8Ejq9i9qzrCfNS/m20OEFGXkZ57nxCLz/v3758+fv379+vj4GNgjez1ibqTawiiKyDRk5XrOw/DO4TiHDrqbv1PpEzrf53fMz/HY7OABuWizGcfx8vJyGIXdbndxYXF9bX1jfWNlZWVxcXFhcQFygyR7gLK5xBTqbDmsi2h1Q6eAWNRJa2p/RKrtk3iD/CbzWMrSNMo1Ufmcw8HoWMYXIkXp4IpbCNkmoWhwMEiSpNc739vbe/369ft37w8PDz98+HB6dpoCD4JyCImR3AvhjgF5jx+AuE8TaF2Xl5a73cW1tfXd3d2dne3V1dXFxQX4FMu5OZ3IPaELYYlLWJ+L4vj4+M2b148eP3ry5Mnr15C7PgcqG0AyZxmMRhJildUBdDQu/mRIrYIHk0OI1lTgw4iiXhRQuqOyTSphhdILUqOZbpiVA0c7TCOsOEyC/wf8tCRuJAN9BFL1ldej3hOku6Wnw9NGRjTchzvnEcvgjS7RI/YXJ70YYFQRCHW0qAw9AogzIgFpATVOQ8T6hgeHR4PBcDQae543TpK//GV8bTxe3dhsttoBzlMA8U7hAcGf6u5bmwvdJcNUDM+RTGzlD8q7QB47+s6lYlBx3NobrNsnacYIU2KYwvLUkFHlDOLU0naiuwub3ZAA8OjtjcajPM3OB4ODw8OG52V5Dqr0WtcXIkZadruMUpHBu4+7IlonGK5QmilyAybwK5IGk9Bg6Ht+BBj/uLuIxfnt9sJCF5HkGG+lpVInYKiA2wBbFJu3djdJkJ7vc4map26/uF1xh7Bs6Va7NNpncwBsVLFKvpQfBO12Z2l5GUDPQrKCti4JJbLiwaWdVtT+W0Hdi+fnDCCB84kT9aG5b7jrisILoFqm1WymaXp+fo4UxorlvDzPSyUmVXFoRwmq3lP/kK3sBFaQc16icdIPY5TJYDA4Pj7e29t79+7d4eHh+fk5QQHJ/SO/kdxIqZTtmKRyzJRBmBV7T9UsnuUQOpdPbCXEhQ01S63WyvLK5iYUEC4tLi0sLHS6xH6GsxvosgHFQ0II7i3VHKdllIGck7Pyn79F06Ciagi3SQw6+mziGZTBrhc2Zg7geAGhiM/Ozih1/O7tu729vbOzs6PjI4BrYj6QggXGxdIaj7SixlHc6XS3t7dv3bp148aN9fVVqhskWtHKbnCKj498gjDmhw8f/v3771+/fn16enJ+fo6OKFDY0Jgk15QGg7R1yhETNom01jlBLYBCBpi3lPw5/gQ/UHuA/LF4CparpQGitKXo54MWkr3iwhfJPYSaWLxpgPYnOIo0N+3QCQM5BNTZMTqrn3R5AAif0Fyd3i7pxjEXKPchyzJynGmvzLI8jCBDeHZ+/vDxE0rl9s/Pb03Gy6vrK2trXhSPR6MIQKQA7gbSHpUkkPPKdJ5DHJRdBGFRIWmjk73igVpkaMrwdKdw3erW+ARC0conFEaSlfTD98y+MWP4CeEI+FaapqMREMqkaYarhPKMxNapqn9mHfDjSQ1VIfSFM4XCRXQO3R0oDid9xTyHcvFWu9XudlvtFkVpVYzYWWRtdlZ9p9S+yytn7Qp+wnbFHcJZxLsVH5WkeGlW8Z5NkemFhYVutwvxab37qdEMlYTK0ZOAaWga8zy/n/qVFAp1vsPIIjc7ri0AjoQqE0BCRukUYQhU+9MpgM7zogBB6H5/ZXU1CEOctY1Kym99GaqDzPWkLTkFo5LZp3pb/Z3brFLYcmLc+VXlz+dMHDL90YabkOrg+/fv37x5cwYC32OimHeCkQo5VvLWHEDLrKo8rexycdCEgXzO0axL89WcBfnBKFpeWt7cgv9bW13rdrogdB4DfSV7CKp0UJiUnHKs9B+ocfki1S/9nj6hRp5bt0UvaEbBQwKZVJ8/0g90nhdDiPM8Pzs7A2GJo6OXL1++ePGi1+sdHx8PB8PxaAzOGOAqAC5IvK+wegLflYInRFHUagKOd3194/r169d3ry0vA8EPPRfqGyfZ5MNlmGKe50mSnPd6Dx8+/P/9538+efr0+fPno9FoMBgwsxH5g6B/SILOmvYWnrsdci57UBoKQeelMAfeQJFtEqEBkWCzUwdajsJYQUijQrS6SFgkiwpEI3AqO2IeUqsoV7BkAlYm1WcF+CtCG/qXDGthn1KasbISVQVYhYgirgCqxB2eXaMRBn6WZ6Ph6ODomEbOaDQejUa71683PG9tfd1rhHmW+UFIjxb7UDEwJZjW84DLxypr5OiINixVooFJ0njCQIrCqryqt7C6VbbLreEVEEappKCtRQxyKBaZCsyotWKI2M1kMhmPRikE4AiVTXMEhOlRobqBnPHVi/mv3INcSJFTFoFuHMIHMNVHqxyxi+PXp0URN8GQhgBfFBHWHH9bnbDRoG/1WkF1Zt3Xuv26Fn5uBYRl1NksBwZNRh8glbQhTadhHG9srK+trrSAfRCIRjM/nxZoUqiNUm1GdgyYh6ww02f1c+7Y1vuXnltuNk9/jcIzmK9X3TdVIlgr6PnD8aTXH5weHo4HoAMG0qiIUCo0rULFyUvJR5lh4AupKbz/Ja0MMql8CpWzwEmglS1ISu4xEyNB7CaTyeHh4f7+/tHRUa/Xe/PmDRj9QxB2IwuPsgEyCcloZAe4Iv2lcnqQ/UkpKVHp5RJik7ZH6a1RH0LSE0Rl+TAMu53uysrK1tbW5sbmyvJKu93uLHRarVYYhcA+iuoyKh9VoqshVIxRfEK8S/n+m+vSE/a3DpeImhNzPzXPiti8Ubbb5Aal3TADEeQ0JimlrCA7aSMIXI8JOfzzzz/TqDhCAWWSGYSQQQ4oYvUrxBRRqhagonG8tLTUajXX1tZWVlZ2drY3tzaXlhaBcBRRvqRd7njjBFglzGoQhlmW9Xq9p0+e/Nd///c///nDs5+fnZycZBms5eSIgoR6BkNUZefkCiZukRyOuvzPzUrxOKV1F8dKQwwShELpX1GPySPi3hsEtfInsY5GDSiHPFQ/V+6lgHA5D6g8kR2kjGFxsGeRtSdyMo2OpvRfzJ6q2CD4jHiswAdFF3KzNXrWy3PQomiFLWCgLYrheBIGQRHlCQhUJqPROJlMzk9P++e9/qB/5+69tY2NZqsTFPC40zQBsDcCz5DpF1DfzsUy4ldrWGNgiBYMgz1Tt0uT4rD4hAHzuLTAdaub3S4eFZTY1yh9ln0nlLUKq+CRcGZpi7FyFovXVJiNwawG1EZPxqeAx0ny6TSnwd8A8Xd8zehUNxw5q/8fO9TduLMumTYTCq8Hs/uw6eL8DcIojFutTrfTbEGGMAwjDMBBJTaC1wIO0XD0RoAyaMJC7MauG6zLBz9Zu+IOoWPplkOklUge2VirPYrCdqvVXVhcXFqMo4jsGEUvVwBSRR2Wc9kuUKhqyAr9qN+iGZUILCWkXZPM+larlcOuDFHZKehVYIAUAjpzh4QBvBLxrwU8w1NqK6neSn/f5uTB5gBFpD82ywN0jsz+GMECgRkyScbjcb/fJ7zowcHBcDhM01RSyLBWhOObVSYkncCNtF/lF+ZsafPuDNN16Fw9ZKLiCLjOulDfTpn/dqvto0onqdsZ8Tf7bNghY47zjsW6AoYIW/CvyXrC39DWZDIb+yZzFJmwr+QNmsuxPKKLb69xMvFfeu5FUXDS+N27d69evXr79u3e3l6v1yPKWfDB8owKL8HJx9o5Pjt46iGK0Idhp9NdX1u/fRvAomtrq6ARgnL18hE4nSH3g3KDk8nk/Pz84aNH33///ZOnT4dD8EUpJ0g/gc7ouEb5gAZCafYOps5SoFY+NWnx6NsmQnb04O0ErPRJuIyTuZ31UIeCRH1XVFGqgY2YUnMzoxx8sN3zGXF3+TTtO1kRJ9WKQ2RpcoSRkW8y2yYPqFKF4p4kSB2kt02Qww0CqDkcjEav3n3o94fn5/2zs1Mgx8jSrWvXo7gxGED4AHxM3yccXCUfuK4CNUgWNSvZOWROR07T6FukR4LSipoJI6pb3S7TBGxbocy4iNcylqjIT0d3LgSRmS9MJ8lkMBhmiH7PMIjPxYqcOZgzdH/lqC4XR1gzi9RkcaaiID0svbzF+FjA3+m0Ox0Iv+LUVszS5h4gAF8DalVS3wQsnQ2rnqGfrl19h7DcHEXmOUMKi0OUBRCFYRbHRHzXbrcwzUD7kNrROXmhK0wu7IZOHPzSVrVdKfQBrQgs3WZsemD1aORAsQjh/MkkOT8/T5JJt7GIJp6dBqzqtU6EGsSD1M0hVgXqXC1O+C9slXe+MkMunTFqlsy6GDxkc5M3OJkoKv/9/f2Dg4PT01PKBjBbDGX2yt7drGykY+HJfGBlfWAlCNbOVGtcTjEt/AJ06EFkE96jDGGz2Wy1WwQTBaQoiOTirNagtzm3t1K81O0PLARCk1ApY6hEiqrE0M7bp2x2wJSBPbzYzAqKXR4pKh1+xRSa55PJpN/vU9L45cuXWLN3OhgMKFKguF40iB1GC1ropD0IipBw64FRZnFxcWtra/f69Rs3b6yurgARQRxjVpAtK7c/mjFUlSYeHR09ffr0nz/88OLlq/PzHmtm0neo/JX7Twfh/BJxhprBaQ9Pqg8gJWXt1mrWO1HxMp2SwDz+Uh9AO4xWvXo5SQv/FB5ArbjZMUPBCot/IRmpnlDoMOkkGBpmFz9N02n7fXla+gIdjs1cTkOUD6ouDeOMXN6IVQy0JhQoT+3noC4BqY/JeNLD8uPxaEibSJZlYRiurm/6mF6gTihWmCpwHdOcCisSfsGcpe4zUnX8Fs2GyKVYZV31Rla3X9PYVaPmzCwiq7jwILxE5EUxgNbX1J0UZGPiGU6VoyCgnZSYtR7M2lIv7pWK+1hbDDiE5MYVRa4ho7SkRFEIEdjFRSog5FWCu0GXKm+dnOzCD3XEW+v2CdrVdwil6ekA1ahViEfrhkFH8KB830tBSm26trbWbHewxCiCFHigdNVg79HeIxa1YwLNjkZy1Fb3Q2//KuD60bOxCuZqoG2E0BP2OPxfiFpPURhlaTocDt+9e7f/4cODv3xL5Ot+EFxgQfCd09a2KuL3cAlQp9bRonoT/b2akwuq/ILjVpXnhfyy8xHTw9BZkiQ5xHZ0dMRIUc4XMVKUf2Ko4fXxOcdiy76xNaYsdadKrdzJy9wHrtNS4oMoRk+y5oGPpMHNFqEQoZYNaNFE1qhq8Epv2QKRlk9tC43SARkHY1Din64xz437uLUGhsMkVF70Lqs+j0OCEQfn/f6YCko/fHj18uW7d+9OT0/39/f7/T6hNFmGhH6SJEkQIN1rC2QkgiCg2uzl5eWNjY1bt27dvn17Y32dYKJxHBMVEKVxZAdJ4pKuhZxSorH58ccf//HPf+7vfej3+6poEAsUqSfEfknOoc5PQmeQWRprCBuNHJV6ZMUlKCkjMQoVYuo5QmXbFIQTKEv1OExBItT2EP+eAfCrK/Fh+E2BOVSOJRvopV+bJ41LLj5Evd9oq5EBw0KfXlO3G+PPqmHQbqF4E01VNYxMklSnByU5LU0Y9EqNFJnCv6qyQ/LlkDwVuBIbQSuEm49PLcihmHOSJM04TpIkfv22mIK/OB6N7n755drG1uK0aLY7XkJ4W8+LmxqJamFH9VKDEksYCTJlgdgPhQJmoJnAcrN4vZ4g5k7UecK6fWyr5PEmxl02jajIlva/eRwtFNhhbrYsm+YgQphPp/1+P8OUu9qekdKCRrkMjphDub203ppvf1bGDTmzp5YLBYKYhijWTV8AWzkKEX3mRXE0bXjdLsBy4ijizZQY2wxJmwzFIQlpqUiKgqoybzj3edTtci383PKB0tgtQ+wqIKNoAQA4G4temq3mxtraErCfgxFDlHiUjqAm7C17URCbOY14LT6sMwU2WOUy1zXzM/batGFIbp6HZhzoQeV5G+2SJE37570sScCfJZNdaE5c3Dip79QWC+ho3X6H5gQ1LuOHV86L8kcOgSTL0J+fn3/48OHNmzeHh4ckMsFFZRytJ2evospUW5PyHZYQkEjRC3cp2dAyNscspz0Z3plDlAccDGpcKwhlgcrQ1OL1NtN95T10XriyMWYLo17+5vUOZcCbBRllFW+Ry5Uv5h9ZOoScGxyNRue9HtELvXz58sOHD6DucA7qDqxIyTSzdC8UbhAZyYMwiCPQmVhYWNzZ2b5z5869e3d3iUum3Y6E3VDuIdtJE2y9Xu/t27c//PjjDz/+eHR4OJmAyjkNThZKQY/U9SLUa8Y/kXoIPU90jDiJRwk5Vf6jfC/1XeoQx/jk8zDAaQEZldV3FEak+wv2EfHSl3xCM7A1vZiKLch33EQ1v3A+4OCeeS1NRKa0kTJ9xj+sHC0c4qCBpy/AcT9BHSQFIVAaBoCvQeRKlmfj8WT/4HAMApKTW4dHo/H49p1713d3l9fW8ziOmq2wEeZ55qPpgrepHBWlIk0TSKqAPOjaB3UvNehVThAnRKVf1wVLdbu42WFBNdY4tQ3zW60VvPLMbFx9wEv5tChGI6jX0CuqzWKoV/v5PSTFnY+9LmMnkwsnPDS17OH0ghIqbREyPAh2U9+P46jdaWMYtgUCQpFiGQXHklMkzJslzsynV1kXF/1U+4SfoF19h1A2J89wOfY/BR8jnvowCJeXl9ZWVxY6nWYcj8CmCT0vxRitxjpbvqUzaitSlPytMrjr13iDCjKqo/oqSKrThh6wpRdplp2d9Qb9fp6mZOhx0cWsM6tAMFN3GA6G6klZh1f/CK2yUNBxCCsZmNiMZtW44XB4dHS0t7f39u3b9+/fE4tMpUdBabfKovZK1OisPKecUBWWsWzaWpuFL+UcHbFZUqoQ+onxSYW8KdT8U2WBLu1bxdw0+AKDDNUfqWwEoUeta3RefJLmPEHO6bEp7Hj+l/ED5ZHZJyTRkRQYQQA8/O7t24PDwzevX799+7Y/GJyfnw9Q/53AojKJR4EC8sApTxuGYbvdXllZ2d7evnnz5r17d3d2ri0sdFutNoFFZyFFuT9Iwj46ODggkYkff/zx1atXw8EAa7+jJEmk64jdKCpHpjJn8P/UYGDaZxX4QofNSjIJkw7pPqlPVnWiDnnQHWdqJYCeYiM9Bk5wNSBzpjcee8zICKOo2dHPGgCVKjrHPEfsx+gbV3UPS1+zPEM5QjS1jlVDqD+qGDe24cjfzYvcbyh8DaHaNI1N4wyU1saj4SgZg1vY7w/zyeh6li4srzTzvLOwGClFQUiEVJ6QA2ScxnREJvF7xhuUV8yThXMsfPOVengl22nd6qabWawYXWBWGBN+sMTr5wo4S1Q5xGQnk97Z6dnp2bSApQzlCVWOkINuvgegAxPkmnHYinV19kXxvHDtWg6WqBUTyE7pPQZl0CIQhAEwcYAqfSeKYgTjMKRBL2IcNbPkYZSvKOPIVVGsuv2qdvUdQpkwKScJK7OFzu9BcjcIJuNJw2vEgC4LlxYXAZdS5LiRc9hYh35FRYqu5uDDeXmOpHyyEF9+w6V8c9t81DSvPjSvVMjZ8wLNZwAgV8yN9MfjxW7nfDg6PDlNJ2Ou6NXIVeB9co5s2NWZmA7+qyTvwYxWdggDJEibq5aq/z3aHDejMl3GOwe/kC4EI0XZjqfKq8lkcnJycnBw8O7du5OTE6KWYQkBWbPKNIZObJ4P7kw0B1PqeC+UcnSsull+gnNklXsUtmsURdPGNM1SVTOGiUHuZxAG9I5zfE4wSofPXVL0riZ3UJU2FMChSoD6J2zlx+2g4p0owIVuoRokKPsuKWfPz8+Hg8H+/v779+9fPH9+gEKUh0dHw8Eg1RIUxOrJEoVEDxOGUBlIlZxRFC0tLW1ubd64cf3WrRtbW1tra6vd7gJRDpDH7vSQkpOEAm0gCfvp6emLFy/+8f33Pz18+PTp0/39fXJHJ5MJWTAEEHUyjZIehmwZim5oN0l8edog24vShLzWcjUdMqJDMST5Kpwe5xGoE4x+iJfTaEwxmAh7Rwgv8Ek1Ghl4g6mXYxoBkBvohFLm0H4ohsmFdw82MA3RoF1/qMawte/QlajUHw8YelH5EdOtivFv7F2H8AY/CHwoRsCwiJkg4PpOG1G7DRgWqIaC//lpOkkmzThGp/1tfzgajsa9s7MHJ6c3bt2+duNGs9ksoiibgPxaHDcpjBn4MGeJMdYZ886O76xyNKyYmFQqDDsoBqYMqr3Bul22ceZOqMJIwieVQ5DbVimqDlMjy5S4jeflaToeDkbDYRhF/eEgSZIpVjLz8kLrlooI0aTTHznTwWHtLm8cznXwd9zNSxccK0XuxhRxN7RrBxGs9VGEkDoA5DcaLVSUBXjEFJjwUblUcbjROkPBOHU39DJiZwV5jVHeoFmyPtWz+yxb+BlSyFC7zDvq9+jtQWINdPzC7sLi8vLSyvLS+w97aqZpRhkV6TD7rkr1C5gPq1i48VTpE86Ld+hZUTl1LXi3PLheaOhGALkGBpUmk8nxycnp8fF4NGx4640GGHxhFHoQXpp1fp0JVT3QmFHOnahZ6roodfsdmoPDrDSMnBdlT1K6ZGRDU5AvSZLRaNTr9U5PTykFNBqN2Ogv96TS8St3oPw1TkM51zIrWzjr4FZGEW1Res2OAeW4+BrhBVrfNM8I0TbrJs+v+nBMyfKjkUmkT9sq07/8SeUIucwBGSlK6g5FUYwnk8FgcHR09P7du7dv3uwfHBwfH9OoSDAxyJhS526Q/B5BRoMA0oPLy8s3b9y4e/fOtWu7Ozs7nU4X3cBAYo+dLnFdK2FW9/b2/vnPf/733//+/Pnzg4MDUkfh/CHXEMrBVhUdt/x555QQ8kKLRSESSWhCm3xE74rlBWDdMGyRXlOwnNhr1Qt0CIlLh2rhtGMyLYIAfSPCLlJgzRIk5NA5ZRm4o/Sntit1U9F7Fbi0/EC+zNJmpCxXlQm1jFT1NElpkLcVmW7Vyktm61FJQGRRMm4rHD1NUqryJQAtxhdhmIGqzcnJeDIZjkbHp2e9s975+XmjMUUIsReEET7ZJPKaFL6ELL89kuWoU0UTOlsug7Yyc1P96M0BeXuud7S6zWvWxqrfcjLwclrJ2eUcCrwsXaIMRlueZ0k6HA0HwyFydMEypxZ8ZNmtnNGV7aNqlC425FSBLqq9YMWgpoIyu3wQ+IuLi4sLC3HcjKIYSaUjSqoo+Ly+Ui7u5VPbm4hzFTVk9NO0q+8QXgY+N3+gk4PjA4FM4Xl+u9MhnxBoCYGBgkSxwLzB3RHGv8KIm3PQJqNVnOb26jKQUfoFLy+OxclN4Ze07IS2N2DliKIYYFFFMRiNjo4OT4+P1zc2W+2OUldrgCZh+WS0YTPZgA4MKbZugYLQ4XNjgNab6L+4yUwdvyM/ki/IgGbuEGYWperBs7MzMPpRg74yufSxQMSyFycrEstfuOR+pniPhLqA40sglcUkzVL6HzkwkMPJw0YAPiSh2i68lkq4QeVEluFVmf+c4zxfslVSyNrP3fRWuqnzTyqztUzjCYqCado7Ozs4ONjf23uHZLP9fn80Gg1HI5anZ8ebwMYyOE1OURRFCwvdtbW1a9d2vvjii2vXdpHDGeoGNYNLdd84Y5zn+QBTlN9///0//vGPV69enZycQLF3symRonKdV7iJyoCalWWznrt2qXXuUL9Jt1XhIEREkClV1MUSXw0mskiuiMLn8BohGxhoK8CXJDbUIFAZM+wujWGRJGTEqFLArbpDZj0mXjSRQ0BiwtIUs567tV6bG8FD1niaYvWofl7qTWt4mrwrYkfVo/E8SHdMpxlM2JTCCuPJOMmy0XicJEkIak/+1rV0aXU9AlFKgfsspuUwpkkF6z2JSwTLSQ8nlyhmpaU2+akmbN2ufOO0uWQZ/f+z959dkiTHmSgcOiK1Kl3VukcBBEhw9+5+2HPf37tn79d79sOe93AJgkuQMxjIAQYY2T0tSmRWahnyHnNzN/fwiKyuHgXR6SB7slJEeES4MLPnscdI0knOoBuJnepsgb0Y5AAXk+l0MpvyUzD1eFwccPHA8JO+Iwj2+9djWGpDXfPQ8AUIcWHWBZcegPUGpbswTcP3/VarWavXfd8HkJB2IqRYEPNMkFnonhHRrMgP4lALe28HEn7D9rfvEN5g9eo0KvG14ioPQixAg8b0D7PZqFtGVqsEyyBYrlZ8Txa1/njxdzW3XiqtbfMH9SDlzVckWNeyle5M6JfCB44jyEuAe0ACleMYmREzuarhaGwzAhgWicpcFkZV+FSKPcTl9Sj4LTX02J8ULReWEv5WUox27XtuKg5Q5ECqA1KlTRKlBF+jA4B1BZbLZRzHKCuKIwQxHPSy6N+if6J16YYOl7qs246wzTKj76h+Bb7pOKBwuFgs6vV6HMVpAh4vOQ/4KfmTav6G1kP1RYmDqmTVl+ZMfrveYPF2FVOnikzRVx5W0xQF8jwDBtfr9Wg0Gl5fn5+f9/v9+WIxHo/nLG8QRwuOASoQh08BJUMtywoC0BzHKj77+/v37t07Ozvb39+r1erVag3FZlDvR12FKJE1TVOMR2w2m+vr66urq1/84hefffZZv99H1HexWHieRxxmkgeDUnaCe0wwkcoLRTW8gsoR/EMsUI7+KVJ3qEwLxEjIIwDAj1Xag6A3KOyxsdDptJFUXfF9PDtwYh3YgmG8QeJNzCiptmFaHOtjHF2o1sxqT2M/2DFyYXLhe5JnCG9gvF2wOHhqgxi0cpDchJfKpaDwfj72IVFBOqACfSAjtDC4RGlQUR8S6tTj10wTy5RAgXv2SC4vLufT6WoxN20oRwgVS0yr2Wpnbspq1ttmpQJWJyMnq8LFufPllca1uYM1DNX8QAVLzJWgQKARF4abp8+uvcmtdELx8LnCHRVTKTUNPmm1BkseW05hKiTpcrEYD4ez6dR17NUawrIRC2LCDBc2Hs7FXAcgYJJiEdqiyyRWs+3hIcUq0FE7JcvJMll1pzSlpdu2oZKQ6zq1Ws0wMt/zarUqwINsFyDUAZen4rn42mXAOsAlvoq3VyxjYq275fPZtTfSIdTsrWIgX77YElrA7ZYBgCzc67jVWq3T7QD7mdF1UFAG5hrXIxCxjqKRKmA6rYcUe3416LHFzr4p0q8wXVDdAhW50wzi/aswnEwmwMZhyf1RHPus+2r5mtyhoGwyS7vnUubiuoRJwlYIoW0g3tkB+n/eVtQUVd2/4gv6DmUGUgE3bPSRegr9Nas8rqXlaBBNbtCSgEe+3UANvY0rpXm8eCGIeS6Xy/Fk3J61V+sVXhfUdYrhUxVJ0CiLOSpaPvWxyL8t8tJL71jxIF+vaRe7rfD6bU6hAoNUNyKO49VqtVgsJpPJxcXFi5cv+/3+9fU1gMaA4UTMGYygXrK4M2rUABMCUdGHeYOtk5OTx48fP3r08PDwkFWe4HWKS5mi5KPiUEySZL0Gh/CLL7548uTJeDxWE2Kx+jzK2IgO5Bzjm0tZKg4hK7OclxLhsTBRS5YFueUBwEMELMumF1haA2squgwPhNdQBIifC+HpcBPCkdIk81wjArYoerS8rhe4izznSMEgqUdmZiI7V1p9CrszF1nXvMFtd0PbE/n+VRYBoZPlh5ZwEcU5crcawyViosUsCsnjp0KJPk3SyAQ90tlqnV2P/E8/Z4Q0I4rik9Ozaq1erdVM0wo3a0jIRH0aTCbc8ljxpqkzl8rk8GBmYcKWiQmX3p5d2zXZSmJ/zBjK8fbRLeSrxpbj8FAOVJeJ44il7S/X603M85nFz9RAam5cIlEAC/NuOQmlCm+/lvItPk+EURlGLGom18wwjGq1SrVWbbfb9XodNwJL1Psha1M5BY/OEG8uPzEFhMgTD0viVrv2NdrfuEO4LVFQiS7IKXuzkYSMHRNkcz3P8+sNKE/PckI4WYjvK2xoMt9QPy/Ca9m3cVH0+hWmML0QXCNmWJhRBlm/JLQwnk77g8F8NnV937Vtzk/K6ysirF+8JJ75Iog1QJlFV5DA/F01p7+YlhNeL0O66GtE2qSS3yr6hyFAMtxxWyLlDwJScL0mD5BsryJfi78SGbfFwM1t5o1m5UtKSeFiSSMHYa56vd7pdur1elAJNuEGpIQTuTCWcwvzZvQNMpilQajiPVcP+/Vminq60p8XOT83H02NCKC3jBpC0+l0MBiAsBCTmZ1Np/P5fLFYgMcI8gc8b5BVnJdmhOok27bdaDQQG3znnXfu3bu3v79fq9U8z+f1P0rsA2gkU4T9Wa/X5+cv//CHP/zqV78aDodJkriuG0URcZ5xDJOqZ9GT0QaJenOUUDofl/IOY90JcslE5SAIDgIv1LJFgBx1bP3Ab9TrzWYjCIJ6reZ7nm3ZvucGvk+e9mq9Wm/C+Wy+WC4csJSsNM0iM2ZUDkbZgGNi1WlK0JOhRbToCNAre7hqWUF9vt80DsjZkwSt3J28aVApm6v6hVLSmkqIhQpJeOsty4hj27HjNIrnc6/fTwEsTTZMgXTv4LC3t9/udIGhEMeWY2eGgzmXpQFNKoItoD9eLhW9aGXDkldJdzu/exN3lHY/eii7PW7XtiUTUjFP/qGQS9k+Ztiv6AhxFK5Xq/liAR5hGLLQBzRccEXsiPl/Ui5LFMQhrIKiRHoA99X7bAkTR5nKEL8SunJgRWawGCYJ4H9JEnu+12w2mq2WX4HCvzJYma/W+8oOqOZvriMKCrFrX6/9jTuE27hSGtGLvr8NcIABHXNGqJGl9WbL9916o1qpVoP5fLMGhk+WxiJoLFLYeW0WtUOvIHDni9nf7tq2f0oMmAwI5YISY5iQt8IKBGdZNp1MLi8vVot5uF6F61XGai1aqZEkpuPkI/SaLyEllBULXoE6lYvS4f5d+57bbfiKpQRIcuHwU8RbkPgHJd2DYL1eq1Q65I7mjE6FUqIytIvTTa8PUYaHbzPo6fhFUoAm64L/oiE+mUxc163Vai+ev2g1W61WC90edG5dxwUOTJYlccIIgNz15WOfjelSymi5u1vmGuWeRT6T/ms06h5Bsurp6M2izk1xtGDf1OrzcRzPZrMwDMfj8eXl5bNnz66urqbT6fX1NdRHxm8KRA4r/aEzRgMGNUVt265Wq91u9+jo6N69+3fv3j04OGg0Gr4PmqLYSKKWusQ0J4HQSwpA6/Uaa9B/9tlnX3755Ww2W61WavyC0Gn1zmwLgqiPg26XeC78XaOQYmA7NksYx9HBWFuMFotgYJalnucd7B9Uq0G322kyOYVqpVKrVl0X9J5dG+o1J3G8XG1Wq/VyuRhPZsi8NcaThCnWrFaAfWUZ0LYVsivoRyCgrjohSqi9+Ex5aXiVRnsD5YSGlHavyuOnefFrybokOkx+JoqdIjfaqWOODfntkK1uiRzmecy4Z25/cL1Zr8P1arGYDwfXD996+/h4cnb3XrPd9vyAab85CUtstlnECoOzecMRY5gsWpXnRAiHNLdhi5uDniR3+egFcz7VfKfdHrdrWzZWxgulkIcYiEJ0oXTosEOwhGww1pIIKA+D/tXLFy/WUbhaLFbrdcR4EJwNzwrPUNg+Bx6qE0FGYPM6xXrmXu44W/ksoq4SSIZadgYaFCmLlYF4MqxyrhcEfqPRqNVqTVBjbCKVlGTwMeCUv2iiI+jmCn6V90WWpeDe4E5b5hu2v3GHkJqWLljuDSpZ8sXRDxsC47SYlgmyeO12EIC+GQQmYa8wQBoO0ztEzAOxsrzRcZvO3s4lVCtM4K6m7LvqsUi4iU98DHayc8RJbDkVkHG7vl6vlrxcITN4y41FdC/FWsYZ8flucSKVIgwlbIVd+ObP0zQGo2YOai/UzYwqcYny0fwF5ndRHbkwDDVhfTTHUV4SYvBchZcfnCij5X5R3j+8jU97+/ugop1Yr3w0GgFabhr1er1aq9brdSyd1Gq1gMgXQWkKSO5gbENpzubJh6X3WTt1yZ+iygv/FSdXv55P+MpzFf3hm71BOgipyODtQkmhyWTy8uXLZ8+eXV5eDgaD+Xw+m83W6zUCg5hAqFI9aUgITVG7Uqn0er179+49ePDwzp2zs7MzYhCpfdNuLD06fHBYgP6TTz75+OOPf/WrX3311VebzUZFsDUqL76g0IZ2mcU3c/dCWFFq3zgqjleKsjFCE5VdimNaZuBVu5328fHR0eHByclxo9loNZtBEFQrVWYpgRvJLiyZjMZIxJ3Nl4i+VoLgwjQnk2kG9MiQl8RMILSH1yGEGHJ6tnJtLsOr1aY+INUyLB1eZK9pg1hJFFSdQzGpCVPLh3hU95CjFuIoiLUC2ZhNDUyOYg63bYEEVJwZxmSxTLJsEyfD0Xhwff3o0VtRGJ7dvXdwfGw77nK5DFiKJlIXitYhXQ1mGm7L7y2uTmmaYWqIYYC2XBnHaMeC2TWjbGPlVZvzKHTOeSkdNIpuH8rGJKvFYjaZzOaLzQYUs9Q0PApyoIgDbSXs6DIKQ1+ml8ymVarvlF0MT3fUtmM8CzcERbqUaJZhGXZGWYuGYXiuW6tWsZ4Q1HYSWwMZrqKzwlLVWPrIqlX6R0gnN351zHDXXrv9jTuEr1ygc+bX9ugCRhNx+rkOFFWp1epox2CMxGRi4iQxTBYe/vpm/y5nAd/aHyyxmLf7W+Qx0iaXZpmNcXfTDKNoOB6NhsNOb9/1A/jMgkqJWidVnzN3cHnrBIdU7SH/yW6v/DO3UsO3NHWwiLPR2k0YThAEhPlsNhueEiDsftXUzuXg8RRW/qai/F4O95UCbrccRttsYsgStMBT3Ww2WZYtl8t+v+84jgfpXZ4DaEwWBAFiWagMDKa/YUPk0+DiKGont51OuwrZf0ICsYa9tnmXgYq3udhiOmjOgy28uPlQ2Kh0xGazmTBN0cFg8OLFi4uLiyljis7nc3QCiSaK8J16InIFPVAUqPV6vdPT07fffvvs7Kzd7lSrVRxIqEOQx1v0jmFPxuPxV1999dvf/vbXv/71c9bWwhtUO09ItVoPU7u9ZWInuUcgCzEr3iAPf7AkAgF28fUXp4DrAezc63ROT04fPrx/enqyt7dfqVRrtRq6gjyXkhWfyNK00+kBE2w+32w2+/v7rXZrNBz5gX9+fnk9Gi8WaRTFruMmTMyGsRzxcpRr4SswJd7IS9GebOnuoilF6/dCHTOqH1jKTc27nWT/4q1nVp2yw5E/CHOA+5W8NLwwB/HsqUDq0hTEhAzDWq7W88UiDCFgEUWR63ndvT2LhWVVX650vVCnA7JwBWx4E3osZNToskD8EL/LFD3kIrbb6nYNSzHT4JfUTeJ7UxrtFhkLPsNx28qyKNzMppPRaLSCBEJWe1DEYWH1wyGK0oZlAtelI5KbZ+RsYadJB1WB96lLCvCoG6tIOqNJZJqGA+VheA3FSqXSaDZZEUKoHIPFfsmA1MnndGClRijPKBFwZn6S7vCGb6G9cZTRbcv9ttA+Nma8ctE8phjgtDvdVrsb+H6j0VyvB5lhIIcbvx8nkAHBE0vICtmCxZf25DaXVs7eKWusxnEuSgTvsP6sNuFwPLl88fzy5Yve4YnlV6q11DABJLFZniFOtNxVEPkKNfZEgg1C+bl9kZ1JiQrv2p+nFf2NYiyc7F0VTsc34zj2PK9Sqczn8yoE+Wr4YsOa7/uIpNnMGiPFTjqjnH2CZlkEqbYxVUqv4jZfVmuOq0dIMy5Q6TgO2JGum6bpYDCwbTsIAkyTOzw4NFlNzkqlggxA4ExmIG5B1XUpMbLY1L2K19hVdjIdLQGGOYdEdN3jWzhv2m0pvbfFhWUb/0dliqJ2OWmKjsfj6+vrly9fXlxcTCYTLDmI3iB+X4XO0M5GDRV0BR0H6g3u7e0dHx8/fPjw7Oxsb28PUNlqFXFmVl+O1SlW6OXYbUL/DMNYr9fD4fCXrKGs6HQ6Xa/X6MBjtXrNPVYVI7UrVWmiRRcaD4KjWrvhHB5E/09A5dzxta1qtXp6fHJyfPTg/r37Dx+eHB9Xa7VGvYH3wfN9ou0i9AnYahhu2E2uVKq2ZXqevwnDTQjlUKAsdZpuNpAyxKlW4BdBMh3Rq5B4xQ6J8BfdQHmNApnPXQt6QnjB2vC4QYIC/WHxuergyeJKJXAiXjT/iIjXXIYbZRKxSJJ4XlkSMwHSIEBUNA1D2JUyezKdrDd+lMSW7UaQu5ps1uvH77y7d3iYVTLH9WyWJMy4u464JyWhHCFzhfdTX15oIKmka1QZVV9ou962Sbdrb1Sj4ItIBFAGCec9sorQ6jv5n6O5xeWas2y13qyWy+lidXnVXy+XkHMchhgGQ5VjUApUaG5qZyjbgR+82F3EInIZj7nap3m2F/UyRx5AUATdPyhJDxWtoaYOpgzUqnXfD3w/sFjpHShkj1Xp9a2Kh7YEGTWXakGbpu4Ncns4p3yxa6/b/sYdwvIqYRS2FFGQ26zarOQwhJwd2/J9v1qpNRsN13NNy4BK7jFLJ+A1rzlFAH6mDNrsVflCtxTPUCYnf13MC5IWlQgaC7I410mHpSMDS9QBgly6XK1nk3HEKnelKSsyTkoMHJdX+DNKsEt0RK4ctB5h1GlH6v7zNs7fyHsvamREs4BLsUFM63Jdt1KpbDabSqWCCKHP2mq1QkMY88e0Mg8SCVTGPL6+ecDf4MSWNm0qFTMJuUOI+IN4gfDCaDTCQovz+RxIiRsoXXCQHMRx3Gw20Q8BCAsKxVmgy1QA3LTqdtz9E7w+DneUgf+EqoMseOExvRJwKPXnb7g5t2FMoFePtygMw9VqNR6Pr66ukCY6HA7HE6A4ol/NoTkB9qraQqQp6rmeH/itVuv4+PjRo0cPHtxn1eerqL2ZHzO57qnPiL025vP58+fPP/roo48//rjf72MH0HFFm76UdHpz01bOLeEG6WSqDx3xT1Zg2UWcs1IN9np7jx7ef/Tw0b379+/cuVNvNGzLrtZqruu4joOxfD5gWC0JPwjCTejAh04NIFO3Wm847E4mzFnEQs8QakHJHDECsyxRO4n17ilBT2hdayA2vxqa3iy5gVmvIq+uYDLmfEMVJiXqqizRKKdBiUdJDDqaICVbpHh4HCfEACu7ChgtbBzAEE3i9Xp9NRhsNpv1ZjOdTpMExsnRyWmtbq3FNIeEefKPC03Vu9KgY3ynIDmjGqYcIRTe9A4b3LWbmuBIK5K8IvhVCmJT2WdS9prPFuPxBHYnWPcgV5Z9N5eaRHw3KQelHjbPGRD/3RLZLAbytY7m/1TkBrhCDSuzCl9ybKdSCYAyWq2x4B0XpdPqXeeRDj1SlwukqhLHVF9t5w1+s/ZGOITY5ACipHLRCBzf5iLyiCDmjTiOk6ae7zebzWql4thAAqLCwVx37pW0z3y05WaopHgh6mvNISy6mLk9nrPZszhODMc0Ig7mbDbhcDiaz6bdCBKrsMJWcXvjRq1y26gioYxIy8mJbHbuEe42y++5FW3BGx7BDV4EWvlo9VarVVR3rNfrCBxVq9X1eo1QG6p3kmeoKXAyuiiNeD76pYUtQxUlHlEpsF8kaJVenWboS7BIME8wmRC9IMQV4yhezBdRGPX2epZl1et1poMP/8Ofo1uYO4twcfHIxIchGUP4iVD+lhCEwp3LPSYLcvM1oEx7WDe409qXb3AUi01Iw0ALw3A2mw2Hw8vLy3NWfX42my0Wi+ViiVUfEJHD3Gk8Kfr/xLREXZlmCxRV9vf3Hz9+fPfunU6nK6rPy9TBLT3k76GqzWKx+PLLL3/1q1/96U9/Qm8QHVckTWl0WY28RNqS2lmo23T5xbmjxEfwJ/JX6PdaNowN13O6nW6v1z07PX3vvR8w9dSDeqMRBBWPkUhNEzIM4xi6ytLigMDMsmwYF9QywWN0XUhKdFw8ccS8bsu2J9PZegNUMbb/QNFC5umgV5liAqoYiRipE/KnOaxeKVWoCgIzRWEpnakbVrm/8IdMYZuVMBLUEeEOFn9VUr1Ca9ykE7YsjWDxyCB8iT9D2Rx4BLG5YX0FVH+zSWBAppswNEzz5PTMDwI5R25c/dT1obiY0MYqYqESQmFMUX5k4Yrrh93tem9405MytNoPtxgarEQYrMnr1Xo0Ho+GI5CYYWRUEWyUnA55ImH7SYhPrFyqXDyq6NKcVKJyW0DEsj9omU1SKJZIDZcIfA3ibdVaAxZDKElPUgKvvHX8bMLJLee2qCjFrn2D9kY4hEViVZFQRRXkYXoILQ36nAUCmVVnmWEIZlCr1a4E1VqlYkNKoQOxySxiOSQAFSaCQHWTna3Eh24DgJQepIgQ4lva9dMeTxskbmCmZU5Ho1qz2Z/MroajMAoxuEO0d3EfBPeV03yELo2aIiLr0ef5txyV5ZTxLeGwXfv2m2bZlMyC/Av6slq/DrNkUXjTZyr5pC+yYm0+nwdBEMfxfD7Hku5kZVKWOS393GWSTpDi2BRS6fh3mFLhttlBF0WqNtq1F5FGdFGY6ggAW4RqInf05flLvC7gQwJfL0ripNvrBkFQq9fA9DdBLIdlvPHFk7u+aJGL/bTkPnMbUsqysbnBzHdRxYCIl+QNKki7TiggN6bo8mnQqMYa2HYbKQ0PnxdigOPx+OLi4vz8/PLyEjVFF4uFWpmQitdHUYR30vdhy8fq85YF/Mlut4tCMsfHx91ur9FooEOInFK1VqHaH/L3sD9YI+Szzz775S9/eX5+vl6v6exYcAIHp1YbEx1yYiwWgwva4lnKs8CGybHMDQNUkwW5TSgm6LjVatV2nGazcXBwcHRwcP/e/fv37x8dHTebzXqj7tgOfM312JOyfM8WukRcBiaJI9P3DdfbhBsLBGnAqQ43m+H18ODgYLPZWJbJSpCFvu+FYQzhCBMywE02Grl+tMrEVOEIxclSrSZ2FfAHsy55RfhXhg0A0GUVp5UbyrxCnkKAQ11rbHYou648CSGGUg+Dl4YQZjR8DA+Q5SdVKxUATLIsBJ4olAzdbDau58Zx8sQ0VpvNcr2azmY/+vGPT87O6o2m47qgf8sI7Z7nERF621wQo6VEfEu8mZtfaoVVCbcq/NKdN/gGtnwIpsC7EV8iLKxUoCFNkhiDXGw+ReEm3GyWi3lmGoPhcLlaQehN0FJRmkXSwdUAhiw7YeDyqo5ts9wtZJiGZhgouxtdptzO2JcdG/ZEnAIiLdxwHVAcSJK0Vq/Va5AgACb2VuaL7DAyGfCUtIDTip1bqF6V87Vrt2xvhEOoIRUq5b9cW60s2IC0piRhJnKa+p63v7/fabcqvj93XMvm2EKSJejnbVFt27rnvoYvqFoq2xllfKqTOUATXhh/rIov4DkZmPjr0Wg8GY02qyXFnBSrRfK54b9MD50fNn8NuDwo9qhgIclw9S6O8z21V2bGYitmrKluBi3u+CmKcCKYhshQGAK7MoqiSqVCFjkOnjRJDRAnUtw5ET/geBpHM3LbJ3Wev9juDRYvpNQCU30AAgnVa1er7c2mM15wD8oALNer9Wq5SpKk2Wq6HiS5LdMlYDgQNRIuqChBoZGrpVnJfFpJERSOAIjKUPJ/HiBVHxzGU4o+/G0EV2+/O5JnhQYxlRwkbPD6+no6nWJ1B7xF6LCpm7TkTwqyaKVS6Xa7Jycnd+/evXPnzsnJSavVorRMWYpqy1NDn5PVNQas8uOPP/7ggw/++Mc/Yh9Iw0atmXnLyy+EBMvvZJ6NT3F2hMiQKg+vkyStVNxWq3V4cHD//v179+6dHJ80mk3P96F4CdwTF4+DXiXGFuWSDG+amZV5ps84JkazGdsW1LWvNxo1SNqtVQL/2YsXo/HUcdwIvEPU4wROGU8BYGYTA/oEN5unGkIvsf5e3kIVQT4lfW4rOiA+wrEuFHHZ9Bb1HvmdLP9h2cTM501RkSTspXK75UcUdGAfOIYRg3caW+vNun+dLJar+WJ5PRytVqsfLpcPHj5CtgIOtgTqGUqDdduQUDWQBWUU0T/cS3PRJbEH5lba0rjMrr3Bm68MlKv0R4rRS/hOabBAMCo+hhuSOA7D9Xw+m0ynosJPqs83WqnyRGzMWCgi9fxj8a+EDcsELxQRHH4yXUGfIkLIkMPYq2WjIneFldupVECtDbghot6sKkktLiJ3QZqmlXZ76Se3zLrftZvbG+EQbm0KkwRf8Tm8FcOCeQx7DOhKOK1Wa2+v1241JpPxei0MB2CGWZkJKhGIFKjHU2XZdBtXRqy3+ZL4qY7+8dyP/JqS22WV43LjVOQrR2nqBlaSpnEUT+fzQb8/GQ73Dg6DSpVlPKcmU1VUz0KcB8EU573I6cjpQbIccrjTg/oe2m2Ix6UMzFIXkUp7uy7Ytej44adIHUQFSLXEGZnmoJhCxhP5P7p+tBwzvA+Wic7kNiRT6zY5JNsQUfUdzW3AiwVD0ADvIo7jkIl6h+D1QGLhZrM5ODiwbbvb7XJhYdN0UkALwaezOdBXeifBKAfNXjFzCxWwSzxeFsvVWItFBVGVyogvCIl9XalD8orxyUZRhBUmLi4uUEUGy0uQpqiqJaN6g1SSBPFk8gYfPnx4enra7Xbr9brv+6itool8aI2KTGw2mziOr6+vP/vss3/7t3/7wx/+MJvNCJxU/VhK/VIftwqQasOpaLtvYV6oxbrgizbCY2xe2DZIJjiO02w1Dw8Ozs7OTk5O2u0OQaCugEBRcUFUQ8hdu2VaqQ2DJLZik4GQWZqwvQTw1Vaz2W63ut12rVZ9/vL8+no0XyxYuSM3gfK4qWszPUMmmAQrsULfFG5nLsgpM/3EDdR2EHUroayn3PShNARGZxP4nhzVtNAjPw2fQcHVVDaCwnk5n4VgCfawkjQBCX48JvNIUdceuLWMyr5arUBqIwo3zGM2TROGHCQ8+1R3W6OGak0dADic2FbIwqBi38sHbkTQUwOCxHi7Ieqxa29IoyG3dWUuhG4pVpKyvTUKN4v5bDgajcZjnDlYiwImozKFtQPiuTW3Ud2B9T2VA/aF3pUYbTzkpLqCEALGz0BOA/dxKHltW1atWq3XaxWQGHXYClhC0qYuFI3cYmg7vyHKPu3m2Ddpb5xDWGIHK3g9Lu3Wltge1paIww3g4J5v2W6n0/E9sGyYlJm/3oRmaoYp5P2rsIQE2WWWRM5xylsqN3WeXmtIAvy/bfO9k3ZlKfUp+JososzsbXgbUvSBn5Zsws1ssRwO+ox5gHlEcZa5GZDCMxBYV7npuXsot0NMAiHbQrwhFeZEsEePCe3at96K5i99VGr7au+TZ0VkQjSMMEJfq9WQTYrQDSKE6DihZ6hqtxgwggp2YKGr2vC2DAurFxYtreKV8p8U9Gy2+UtqIxYZXFoC/8N3BteD5XKJQprL5XKz2Uwn0/sP7nd73Xqj7npumqRxBgAFE/lArUJ+dvVfTg1l80+a1ACtiGqlSpewpC8D4SWOWrx2jZNWtERvb30SsMYNbuaApWk6m82urq6QKTqZTMbjMValp7xBlskmhWQMw0BPDzVFgS9aCXrd3v7+/unp6dHR0d7eXqPRaDabSBOlNJJiWJegP2xRFF1eXv7hD3/4xS9+8fOf//zZs2fz+RwlSUsHtoJvyzFQ/Fdbe5VRxNOuaVChW8Uuk1efQxTUMCCf3AMuqLu/f9DutNrtVr1ea7VavW6vUgPrJwgCnCYOcyLxUoFvWRjDULbLNMwE+KiOY4DWKINaoQSfbaPKPHperuM+f3luGCC+ahg2yLqD38JqCElnD8U+ZQ1aNc5YIoAk7ojq3ks1abxRcHodPRBOEg8F8tif0Itht5ICI0Aa5c4qJc+KTGJ5NNWNV2w9no/ETF/DSDwPitezaQQ3BeV/AYwNo4vLi3ADXuEmjObz+YMHDw8OD2G4skgHDlSwXNluvg1VUNZPU0FQ5R6d493x2hWSRFq0YktXuV3722uF1Vim7JQu1GpT3wHRGGTcgCWWLeazyXA4nU2NFLIzQHg5RkEpYWYVDqSRKlWgrSQWLLGI0t1WmrDiP7l4Me5oFPvA+BcIL1tQRNT3gyxLGvWaBawHZnmi4gaLjpXdQsnNxltV9PTKb+aOgfbN2pvlEIrRQ8nzmqCapGaVrtoQxzVTsH4ysIZrtXq709nb6z57cY6FsMh6wDpRWjBGJwbknapXITr4PT4tSItC/kyEYFVLVF4yhyFk9hbeBkZJyOIkXW/C1WYzHI8nk4nBFe3YRovqqjT7y/KR+Es1UMMXjHynxaqy43n/edu2DYmebBG6ITlp1PZAgzgIAlQf5YwspkESJ3EQBujqoGeoInLSWFWM0SJbTw3+aSlhxc2M7C2NMlq0dzXrjbxBSpskPwdBQnD5EnB+rq+vr66uet3edDp9+Ojh3Xt3Pc9bZ2uhk8Y9IhUNyPUZoUE8L1sLLAPQSGalSzFSQbfJqCxbajD/sKxpEaWv11SEDT0xRERRVnQEpUmH4/F4Op2igBABg0mc8GWBKe3gVfOaC7btQKlWr1Fv7O3t3b9//8GDB2dnZ+gKqkIyKnynXpRKSN5sNoPB4De/+c2//Mu/fPTRRy9evFgsFo7jYOiBvl+mpcm9G1rq81Rhbp9p8eb8eJFPUEGgCQuFJ854sQwSde16rdput/f39tutDgmoss2C62zxdbQwQnhv2b8IU+M5+DtM1NpxHOCO1qpB4Ddq1SSOLvvXlmVFcWSaBl+rWVahck/UVBw+uEqZjbQxYTISGnOc1aZAiPhSGz9kG6pH4lae2GnJuxOYoRSUkvCriCzS46G7r6pikKuOtW3Y5GPPkcVGkjQJoyjN0v71NdjTaRqFm816nSaAuwbVqut5GNUCL50dC911rRXI89yBFpXlSNufQNCc6EWpqfpN5umu/bW0suxTLuOiaO3laaJy3yrEJtjcs0wrjqLNarVYzueLxToM0WnDgkY4P7XiEMUu8Vfq+8praZdu44uL/krDUrHruIWZi6zJ0BtzCe16vc6qsGKQC0j0tJqWnE04d4XFYEvshgKvO8Pym7U3xyFUQ3T5EKcMGzMrTFGH0F0XjoFbqQXScH4lqNXrnW630aivNxvgsWwiyzSxkAOhc7IAoKqTq5UB5jr8N+VvYG959Do3m5XJqu7MublBHqFYQ7BAdpY5Gdj0cZxESTKezvqD/mw29fzAglRJyHNiFexltwu3Vd5MHt+V+5+EB9ElZZv3LoLzfTR1ddaFzljbloGmuVX0QiJ+gkGKXiJihmmartdrZPchb4SYkMQgVaFyFcEuxBekNaaeVPuC5u+pWFOx81pAsWic0acY1uHOLaRthFmazWaz0XC0v7+/mC+gxgZUWHJr9RpLD2OooxJouWFPou5Jz0SSaAVyUkBQNfdPzfDUHuXtpUTpsIQQove1XkPm5HA4HAwG19fXqCmKCXskPcpdeuZ7AGmWNeFCYKSsVq1We73eo0eP7t+/f3h42Gw2EStDpii2rZJxrCFz9eXLl7/+9a//6Z/+6de//vV4PF4ul5iXiA6hKqzHc57lHZAlAejmFNmk6hlLnxR5BSqBEO8Z5cC4rtdsgPd7sH/QarehvARgpZ6tiOmhwUcBtdKRAf/HSpsg+QrnERyEKbi4nu/5jGprGgwbNPrD8Wptwl7DhgzUvjWTIvKpCJCqUcrcyfkuRO6gbcNaLY7Cr10UGMz9sOwhSqMQjTQSBsU3Zf5wHpmkn/MwijSaZTiVBgnLxcXO8ZkbA8nWyKIM3MUkigeQXcjozYCxpElv/6DWaFarVe5DijtyS+6oWBvzdrDojrY3buMy7EDCN6epMSaVSKVFwdRXuYCCmDKQ0b1ZL2bT+Ww+h7z2Df0eU/ZRZumGfhC6LaMXZTg/dYNLPihvkOsqpcKVIUyE1XwuBgMwoWi3HYAmf4MV1AHyCM+4F2W6b9gFSsF2ui4MLCMYqnVp175ee1McQsX3KnnBv0HTVVCmCyMVWEMpZHdwIf69Xs9xnE67sVqvozi1oGpwFkcR2zpxkmypxMe9Oh40FTWXbszoL/iy0nARZDnKUc6FaHjLiBDF8kzAYILaymI+j4eji4uL1Xodrpeb1cJyXN/3oT9J4joOENZB+RAtLV7vGIUwcvFmNjspkCu0BzibqBjy2bXvrt1Au9ds4qI/Rml19D7XTGIKDViXDyuP1+v1OI6Xy+X19XWj0VitVuv1GhQ7E1nFgXYXtIjhzxzSIM+r/okdwGRFzf3T7CoN0lQJomorGmR0KxAoSFPA/zEhDYVVsda567jzAPbiyWSCZdDDKLx//36r3apUK2mSruO1ZVqe7xEVrQgVsvMhLC8YaKz2oBRjpfr1THeUbbzSgCh1+UqgnlvPLlWChVJA8TmiQzgejweDARZmRP0YXiIZ7W9RqA1xP9uy/cBHpmiz1ex1e3fv3n306NHR0VGj0ajX6/nq8zybTu0Pco/xffQ85/P5xx9//POf//zXv/711dUVlrtMkmQ6nXqehxgR/ivGZ24gq2OG85QEMqkNjNIgAib7kTdIQRDUq8SxUYPSgm6r1eh0OycnJ0fHxwcHh612q1FvMLoUoqcADUJdirJYuPbgTCY+hIEJVpXQ3mxCKGSPC3WWNNutZrvdbLVa09lytY7C0HXsmI0X0O7LMtOB3+JFcCeZjzxMXMQxw77MhKaxBiGv1IeyQKLAoMUNTb4jchexbIOi8B+/89Kcxf1USqpS3BV/RtNCzAiJpGg5h9wzFD+BicOuGTYpDFdZAKQklmVGsePYpmlcXl0tl4vlfLZaLeeL+dvvvHt6dofzxtmNqFSrKePiQslHJf1YfSysU5JHgOOlWIleZR+o+HPJzH3N/N5d+2tppYx0wryFol5JsJWa5D2C9i/TjknT5WKxWS0Hg8GzZ0+nk8loMgHBUaxGIyJr7F84C1IDJBdHjdGnKbDXlLyJskAYYYFoyfFeIUSCRqtWb0ndaiERAGkjrCq947iVwM8yA8JjrgMhLc8XeYUUJlPvVc4O0aLYSt0ODqaoFvFuQn0r7U1xCLdBIrkgn3TciJqZ8+XY91nAk5FGLBtoPIcHB8+ePXPsocFKS6Up4OEJRGpxM81Zb2Xd4l8RA7o8yo+riYh9C046UYIUVIeCPWw3FlQhZamSeSDCw+NJYnZluV6Px6P1eoXycTxJCQTwoKAGCouQOJ7MyFLQHtRVpxxkSQ1SWOA7kPD7bJpFUgoraX8WoTbVy8I/0bI3TbNWqyG4NBwOp9MpFqIIN2HsALM0iVnyIcsvl+opCp62bWJqCOHNm6iGamqf4nFUSIr+RYtZ5Y7yXRZLDoKokhjAG3OSTpYr0B2FWhSsPXjwAH7ixI7rGLaBREoA/Tjdr9AZK1epj39ZJX8yK5hkRYlNWgQGi//evtFqQCqdmAKKyjGTyQSrz08mk/l8jsDvZrNBvqgMcosgFFJAYfP33CCodJlrdO/uvXt37925cweZooXq83IgqY3UifDfZ8+e/epXv/rNb34zmUzCMMT7RiKo6LfnbYhyzIruUtEhJDIkKr1w00rYZJiJR5FBTTsHcybbnfbp2Skqi+7v73e73Wq16vmgvZQfn7dKnKZFHu4Pe/oOm2iQqsrDFmjDwTUmLOYCPGeoe5RErKhsamIpDkg55DdZVIkW4QMINoicQ0E3UWJ1EkkQnZJXYVkZnzJ6qXr1InLF1kTqOf+m0JwRIRFplubNvuLOqyshp2liMBlVfh6gssPmZIFXZkFwwTAms3mSZnGawdiez1fr9YMkabU79Xod5vR67TCVrJQxgMvWFtFr0WgZoTTp4vKFY6eUMkqG7M4n/Jtv0mfhA0COaBXmopVF/aVYolFZK16vVrPJ5Ho0XixXClFUVoEXY5VrLSk6EjmjViUJaIoyIulayVFQTNLc/luyudGaAesORYHYkp66ruX7XqvZrLGwIARrRNSJChWWbuvloTpZ/kLe5x04+G21N8IhLAbRVToN2mGCu0XY4BbPRTGGXNdzPb/Zanfa7YtKnzLUQQaAbUzoE1Iun+YTbvH6ZIpjIWSi6/7yd+UBcyxUtqzw9+lfVQfSEpXHIGkniQ3DXG/C6+FoeH3d6fRqDVCUyZAShnXSFKsIDs6Y6xSz0e6S1lXONNhN2++33ZzQojkV2oviodQBSQ4hijRUq9UmaCG2EUZD7ii4AbZlpwCy4aCBMhRqKisdPD+uNWOaRjR5FMVac8b2QGNRrpOuBX0MdY7w+8MqQoDNnSVYEhBclDQG/HMFgsKY7I+7cr1R9wOflR2H+oEomXQzFU291drXckuEJPvlrq744L5ehhL2X80bHAwGFxcXCBKiG4aKQVxTlMEpIjOEO7dYlM/zvFar1el2j44OHz54eOfsbK+3j5qiavX5bT1Bjx0zVLMs22w2/av+Bx988Ktf/er58+cIRyM8iB6sWoa++MTl/WNvlFJCtB2BACINM+SCWMpCy64F/q1UK0fHR6enpw8fPnz86NHx8TFUh6jVmGQOhMfBYXhNd13xXR0TEuMw3M7qUlpY/QW+ZsFrF89y2e+zmvVrgLJdJ46MxExd9k2SmcnnT/IS6lKTloxF9l0eHKH4HVE6xcqP2mulIU4VPRPPQFC7cg9FeQzK48H+SVbbNgiFv4CO55YCfNpE07XsOEmjeJqmCczbzTqM4jCKzk7vHB0fN1stNmFTqMhRtnSUnpQiR6VTr0wysWB4INaqBuny+/iu/dW1/HPPq0gXGw4b9jvalnIqo8S/guqbSRpH0/Ho6upqvljFELgHegVOFqnszfP6SDxU1d5UfEJFSD8f9KFeSL6qWgWm7Cr4xVEWt4yrWilRe7BmL5gHLcgaYLVbQYOjuDUXb2lpRq4KiKgSNzun8Ftpb4RDqC/KipIE7YQYVqGUBATPkEejNosVYRNbsuUH1b1up9PpVquNIJis1us4RlUojsDx2KdKjynHCRnoqL5RcP3UEU914/nMZ8rfyE2SE6W4WzO03hCoC3c9mYSDZVnL5TzNkqdPnnz19Emnt286XlCrw9eVlBQUQeZ7WI5wK7vLyfJ0Rr7noXzGzin8XlspQVSrT0BfLsVVio1+i1Z+GIaQUMfsYN8H0mCtVluv1uEmZKYsAzpkh1iXRIxTnQ4YL+B54cKmJMESorAWgztUzq7A1clHFpV7QpdAHqZql+IEl1Q0G9KTEjMxY7DI0yy9uLhAh2S5BCYP1lu3TRuFIhEJROyRuKOlEdBc9TZttoqva2Ll1FsV8LzBli027DlKa2A8yLbtMAwHg8HV1dXLly+vrq4Q7F2zht4gOmMJ0vlYSTuQh2HlpFAytFav7e/vHx4d3rlz587ZnYODg3qtTqUXkJFbqilKFSPojg2Hw4uLi9///vf/7//7/37yySfD4RBLfVAZelIAovvAkhi5BCgfZ4JyqPqNuriRwF1JVUgdXWr5csSR8FJs20HY8+j4mNFiH969e/fk5LTX6wpvkKdKIq20nDx8K58Q5g6r/GOnRuo4rmGYfma0O5ntAFsjiuPMyFjJ+/5lf2BZ9nq9tmzbM404gjKGAuEsOCoCJVCbWjshEeUliSaqAoV8pywfcspA5kdjExsrVbCBrfiGRBXgoVZ6E2/BNgde1ZKlpcQGLTcgYNuen7A9LmEcY9uxJ9N5GEbrdZimxmq1WiyWi8X8zp27rXYbnyzar6iczBMe9aeGE01KiRZXG+0m5+BrodSNLAGNTbrzBv/aW2nIQA+LMD4nLn9yxRaznQ4DqcMsPZuZqYDnb6J4Np1OFgsoOTMcbSBhIcKa9SKiyEL2Ytfgc0fIUvCOUWrujTlJYjyKdH+RoidyGZRgDTHAqcQuiGwx3M+0QEqaLZe1Wt0BWSyvWgWJUdwITMtKmTSFFsnV0IsccqNsceK2KeDJjnX2LbU3wiHUwwxCXVfUxVa/KX9yQ4Af/gPy3xD5aHe6B3vdRr2ClZgFEm4CnwWbdAm3R1w4lJc/BZ2xdM9Qp5CSW08KAWVn4b/hrFHUB2e3gtmFVhRG0+nsejBYLedJ0kN1/CSJsfocN5u4I81tMrob/PaJJBA1BZMYQztv8PtvqqVS5F5qWJz60c3HJGwNhUZd161UKtVqtdFojMdj2wGpSbB9BNBAiil5SKAQUxDfl/wQ0TESPyzWH1fwHHlwFX/TLl+biaUOVRjyOmYkHwLi2kkagR0e96/7aZauoVLwfDqZrldrmCzdNKgEpmWG6xBIpOJGlXqDuXtuMt3RMtc996TUO7Pd470NUxQdMMT9MAUUa9BjAfrxeLxYLBA5RIhQdgyxQZFsxjRF4dG3Wu3jk+P79++fnUAhvlq1BmNASMioT0TrFXYA1YkQG3z27NlHH3304YcfPn36dDabeZ4H0j5K5ymRtRA/VmErNQjO3yOGMN0QDRkuxkSwoV+Hp/B9LwiCw6Ojtx6/9fgxqOZ0Ou3j4+MgqGiqObd5KDc+L/iX1bXlBhCL2XuOAzLujKPrNRp1ELtutT3Pux6OXNddLldRGGKxBFapAqxLwQ0R2hOYE8TqfCoXK0eIDI6otwIfPbriKvC6tf9ymnO5NJVvlosHif2PDES2J92AtqlNhEl4wUSQuUKz1LIBL0xSy0yjOF4sl59/8cViuZzN5pO3HsdReHbn7v7Bge24q9XK88Dfhtlq47KlnYL/F/+jFq8vhma0DvMdGV1iE8oZEkIob8XOnP1rbjfot1GmHGbqlizdeiSQj+VMrI3r9XI4Gl5eXi3X600YxXFEp0VTTh6R1xUr6V9ugMkoyrbLEVNSVq2RH2gZH/gez1yELEXYyoSihZHEkV2t1Oq1VrsNlFFWRKdYcEisbyV4YM5lzi3R/N4pdU937Zu2N8Ih3NpAvIHCyaUv9MYzf9h+w2QSnEq12u31Ou1mteLP5k7INHYhmM42CmG5avGP0qNv3e1Ku1H+ZlmOrQTaMUYuOgHVzqDsBCD7cRyZhhklyWK5uur3h8Nhu7sXhhvX81kB1BQ2MdMWBHVuKEv/Uz21ON3NduouieJ7aKVkQu22l6KFr2xk8lJ6WADVn8FWRpAE31eVaTT2I+LzaMOpKUaaL6Q6degQ0qarGfFqZkVpllqRPnrDXVLriannwhVgtV71B33TMuMIlEixRsVpeHpwcFCpVjh3lMdYS+4tQVJUezCDskwCui/TvykuS687fbTEOdSJiaJotVqNRqPLy8vr6+vRaDSZTDBvMAxD+KbIM1R7xRMCWSpdo9FotVoHhwf37z+4c3rW6bCa7B6gglhskIzmYn/oerEzk8nk+fPnf/jDH95///3f/va34/HYYpXZR6MRdVuFE9VDafcjvxoJcybTIWLycslWo49oIDkAx/GuYrWh4+PjR48ev/32248ePdzr9WzHrlaqqJlDnmqph/lajR+B6Z2IEQhU0iwDULfT6VqmCYUOg6BerzmOHQQvRuOJYRiLDCDEJE7wpliiLEeawoJPFDKUzJGmYV7jWsPh6V8+aJl7o0B8r3IOUV0sn3e4VeewrA/bYHb5HQFlpCKRCXsLaGGSmJG5MdbjLAujaAO4N+SgRmHoOE5vbw+JP1I2xmDyPFviOBp2oZJIRSKW4ujK11JrMtsmFLzbEf8K2w1xCm6S0Tvi/RxSh1gXAYfi66wAYRyGm/F4dH5+fn5xyVDBBJZAkemD/835dsKF082/LX9uaQWyK5Fa6RjKOQkwpy3GTbMkTcwUgPcgCNqtdqPZ9Jk4FmpZ0YqsbMeydgvd2NKtmYJaEv/cTZtvqb1ZDmF+bKlFCPkYI3JjngWes1DRJbQtewVWYNZqdf1KrRIElgWxYU5JFSYF1cgitEzWoVDcTzVek+lrh7rBlBuvkpUqdKzUj1QsESlAbC7xlESgdIPFZo9ns3qttliunp9fLmZTA1JQYiu2Dc8DFQKwLuDLEuehWyrsLCKyIrtAjY+iLaDoyuy8we+2FcmEmqOlheJe93HQHqByI2HFN01MG1OdRqxWx4rNct0UPsdMkBuV3qDSVMoojhaVwqfZ3JrWHxn0aJ1rt6XU3YLuMaNfJYNRzXqmaMjzIkBnhuV2xVZ8dXW1WCzm8zmPjJpwnN5ez/f90Aod27EqkBSHGiQad5RSsSxDaMwUZX6U9ONtKO4rH5wGDOKGjQkeURRNp9PhcPjixQssQz8ejzGfEFVbiogrq7kH+pme69mOXamy4nuHB/fv3btzdmd/b6/GCrKjpqjKFNX8c0xNxBuO5NUoip49e/Y+a3/4wx9evnyJn85mM1QlVZ8OvqMt6Uh2ILsay04oQ0PePXKEuPsHRTRY8QaRFI3VFankoMNkVJEU3Ww2Dw8PHz169PDhg16v1+60mdYoyKnbtoUF6OXI3x7O26b2VGxECwPXNDPWrOSGbTmVaq3dTdcb4EDO5/PlasXknULLNJeLpcn29jAMDVY22gQ2ZZaCFjyOKxlVEcRFDJHmhhz50KZwdA3TtNHDR+cSaanlAUrdUCvB3Xid+tzFKhULXxHMUicLjQ0QxmZ/uG4VLwAqTzBgGVNiY6a+s4ZiKmEcR4/feqe3t2e7LgjkW3YUgbyw43BZIBDiLsD1NC9UU5jNL15qSl4xZVQq6VmqGk1ur9w2AnbtL77l8HC1opL4Qj4LTuBvhXkSx4wxgWVnkngJBenH/at+FG0W8wVjbDBGKYTqeIxMII1s5IkZq/PEWDhJC5JtdQ7VhCXNeJBZiBnLBlRWUdZwswOCPaiKQmp9s1FvQnr5nqg/w1bm/FzW8MBSb1DeJ8Fjpe5tBXB27TXbm+UQFhKQhBeDe6HCy8LPlX9lAzqoZRoJ6mpkru+3O91er9tpN4cjCGkLkhgcunjGnB66HpbVzyemh2b0lF1aWZykdE/NHw/2TlCXYT+P42QJcMHk8urq3mS6t3dgmsaGhVGBSMOE8jj/gWnSoMB2WW/EDVXECdS3d97g99CKOdmlt/3rSZLgHoDkPazd54lGrDnptKgAYG6CCZ9HFOhFnwqBQm6ypxaKdpJTsY2EWeohvNLO5t9kKYxFD9OQGhuQFkgkMXBj4siyrfVmPZ6Ov/jyC6wfgcGderNer9ctCz5Fp5R4p1oHMO1QrUxY2n/KcHvdx0TH0TRFscTiEuhzs8Fg0O/3r6+vJ5PJYrFAxVEqMkGpenjhgP06jg2P2w0qlVa7fXxycu/e3bt37h4eHNTrdUTJkEahOvnFLsmCIiy75vr6+o9//OOvf/3r3//+95eXl5ReiKY8vs4NKoWRJd5RBzPTYpGqDTeNcCQoAsFSwMJA0xQsZZYJwCmj1Wr18PDw3Xffffz48cHBYa/X8X2fXzLTE1OrF9zwtCQOzHhWgq5Z/oTpipgphc5wyoi7VZY5mRqZ5XlAV6kGrpFlg+tRlmZxEochsHA5z5Z5ScilFH5LSahIvSm5DKQiys18cugbhx1L72vOvMt9yPORFAZafsctNViJBaMNKk7aISs4S63MiJgyLbHT8LhxnKzX66t+n4HgmzjcMF3ZtNvbdz1zsVy6rGa9bdmw06vlt3N952sRQSJ81GQIM/LQqLr9ysqHZfG43Z7419i25SBocmD8I00cnm97WmIe34RAEgKg/SQKN7PpdDqbrVila0mUYAKkyrL2KtYkm2tbqMliohf2J+pPibwT2rEUhCPuG1NjY3Vc4DdMUabSbDYatboQlSmJD76qBAAhC9QvsQzwzuzat9PeLIfQyMNusmmr/isCDnwzAlM4BUOhDuXpe3t7ey8v+svlynGcEILfYBOnzOihH2rHyf1V2P10MOGV16VSo8RCpV2NHqPKuMhECupVTpplURyvNpuLy6uX5y/3QEXdtW0nYQmRlpWCG4jUpQJbryRFvvhCYXft1NW+/1ZadqL40Ws1svjRLMa2FcsyFT8wR/kQZhuEHXI9TK2UVy0ry2As7Y/6YhvtRBvA2gs5sEXIlaFICtIOsv3gxsRxvFgsrq+vCdmP4mhvf+/o+KjdaZPY2g0+YbGrpRhm6YvbLAvSJRD1FTE5EPMGr1gbDAaj0QiBQcQGSclTZcRxejB71q12u9Vq7e/vP7j/4Oz0ZK8Lkio+q8bOlQMUK7zYsFIFN26SdDqd/u53v/vggw9+//vfDwYDwzBqtdp8Psf7hj1Xbwi9zoeZSW+A3yFFCSXXj9zgUSjB8iiC34FQJAY+6vX6ycnJ48dvPXr0eH9/z/c93w9YUgxcC/Ivcg9UXeKV2g86nsBWVT7cpPSDPkhoWrkuK5JhsOKBptlqwfTwPccHwrbnuI7ve89eXKxWqyRJfM9DEWk5rVjBRlRA1Sa+elsoUqOWkKB7KkFsJr9W2FBlt7XBqMol0R0oHyLbFi6lA+pDZ1JHFEiCT3kER5RfMxJg7sQxQ/IBbNlsNmuPieAnSfLW22a3B9xRVM1n3FNIlNiW4Kcik2KMsTIenAJY4tLmIKTC4bAiJL+MnX/4V9hy+6kBHl3+HdnUwUyzQiJeohB2FG4WC+YPLpbLNeS0syrzQLBP4oQpPBA99CYrMz/aMHCpvFc6/8RKKmNb+eiIXMmwwiFNZyOzoHIvFMJJ7dR17Uaj0W63g0rFthlhxDRLCQXqbSxjMCF4o8VQbjjMrn2d9qY4hCJIw/4RI4znzeKeJ0p+YRSWtW1l5RmZDSpWb1iGCXCjOu1WmiS+a/ues9lAPDmzLBAb1X+oBjXFeylkHBVrdUuueTnKJwjnWveIzK31GI8JOxw/uMplZXVhQOEqYRytly9fLmbTxWzq+0GQJK7nmqbFSsrYue1ZKdCrwp70EbxAQ4THwOSplVuwa99+0zjGpb7fzWofrzy+yuJDURC0KbHIhNoHBAyZDcpDgyyXFcYK+BgMEoSQvJCQUfcDRNjyMLuML2oBDo1dqQYsKGar7iiKFr/MjtN4m+SKYFEEwzCCIMAfrpYr27E91xuloyiOQB3OyJbr5YMHD+az+cnZSafTCSrwZZhfCbtM1jSDD43vYjLnDbzQm7AdpZEAD68uw+Rb1uv1cDiczWbX19f9fh+FZJasITZI6JyGDSIr2Lbtaq2KNfdOjk+ODg86nU4NK0y4LkLEKmFYbaCTngBLGNMXUZFoOp1++umn//2///ePP/54MBgIdh8vPKg9enUAawALDXMRkdddDvoVunn8OED5SJlCM3dhTSgp5FABes8DOmitVjs6Orp//8GjR49OTo673S7CoVSJUV5ywaDnHSCOZf5fwzATQPzgPqO69TY8n2ioFgCD8Ghs2/G8oF5rAIc5jk0D1VZhb3v27HmW+etsk6SZ47gZu9uYU0djQ6TySiSQc7lFLhxVlueOX3HRzs+0bTEmNT5JeMltnEGN4FD0XfFNUoil8oB8a2XCaIEL7npqGCmo9MMIj8LI87wsMz7/8kkMQz2ZzafAHe3tNZpNtrnDTIEx4HomUxoAiZoyoFtbJZAlID6lm0Aa5rmFkSijWOCY+9U7X/CvodEU1uZykRCO31fHcC62xV/wtQHX3SRJNxsQeb7u98+fP5tMp+PReB1GmxCS1TFqRKqImI3DvCx9qdQ6jC7eVrmK4tgrQpqKPqIQZxQlqlmwybFBYtSy7cAPqtUqaDI3IFDIMrH5Hkd6+NRUgkwxdUJbB3hXykjpu/YN25viEPImS6iLyQmEHc2O1H5SHHGYQZFBygjIndueH7Ra7f2D/WfPnxumCTsud5dgk09y5ghmqPAhjtNJsdfz+0R+WdE3T9TilVCGIgOsAHHKqeUZcgYHd5L5ghSFoGg8Go2vLi+Xy3k77bEk5tQ0E0iPUY5G3FE+NYUlRCcjPF+aEdsN3F37dluxPINmUWmP4HURQjyUmpbGAT2F40dj2yxr6nE4NkjjSnxK+4dW/kurM6F1TDsIgeFFtErbbGhnKr0b9DWQMRTVyc3UjOLIMI35Ys4YrtliuZhMJifHJ1DM/W4EFSlse7PeeK6HaYolOCE4IWqoSLcat1Vyv73JgoJ1URSt1+vpdDoej69ZGwwGqCWzWCyoyATWj0LDmhRWsTmOEwRBq9k62N8/OTk5Ojo+PDxsNrHGFJcRUq+i2CUYGMwhRC2Z2Wz22Wef/cd//AdWmEBMFfuMqjYIsZZyipTXuUvWjJ78N+Uwo1WXllLkr0KIAgYeH2mAs/l+p9O5f//hD3/4w3feeefw8DCApHF+sSqZmc6hXTWCVsxpoIfCOiYW6hTigpyMzwdswdwRIxB1XjMecQf31Q0qVd8Pms1mp9tpt9pHR4e1WvXp0+fL1WY8mURR7Ac+3MnYtEDWHp5syu8zlDjEYpsYk8RgvEi/VAA9pUMcQyNQA/eCfCHc4k3I/VejU25ZfG4eTmXHp61JvDZgU5PEURwdLEN+BdzR6/UmZC+u5vP5w4eP794563T30iS2HY+FcRLbYDEpSB0uyUnGF2KNwlWR735o5eK+r+ln4G6tCpDKI2pV6XbtL7cVBeTzXpmCZpMTJYcNgW/yuzj7GCciiVbLxWwyHlwP54sl0wiGf2B5BO13vj6Lk26vhCnf3x6AeeUoUw5KoVUlrorKcEKWAxjXEOAyjKxaCWrVaqVS8T3fdRlflFOBdMroDZegLeC0Du0mx7fe3jCHsLwVTMWcSlNpg+EPNbdZCU6A0SrVTqfbbDT6gxGvCI869bprp6txgoQnD9LmLJii4VJMOMTJpxu+FKQschTysSElnM6J6eAQxlGaZtPZ/OLiYtDvd7p7vh8kSQx5PqDExkPp4i4IkFA4h/xUZGFLgyJ31lfqKOzat9u2Qc3FAgxf76HgkdEPRMVI2LHY0FbBt6JPWPpOzvdjajTFHaIEgVGulL6gMfToO6W4k3o0iSAVjFHU0eH5hKaVGJwUikV44wjq189nc7wJvu8fHh5argVQhTjstpxA7brU3t5eg4SuQk0dRBEX9AZHoxH6gcPhcDQaLZfL9XqNDEO15jtdOE+lY44Hlhje39s/PT09PDxstZrVStX3fModLb0E7QKZeCmY6cvl8osvv/jZz372T//0T1dXV1mW1Wo1tHUogZDEgVRAW3uh3aubecIUaGA9wXhdKYmPc4Nd1+10Omdnd957771Hjx7t7fXQG8SIAKo0bwNs1YgJRtxQnxNJViZkOfKz0O+Bn8LLlenXqHFHMSsBjppClUKs/9Fud1utzsHRdbvTabf++PL8wn5hTadT07I3m02SJGCWQYAP/BtGP2MV/IDuSBKCWK2WiF1In1G6Ib1VghYxtigCgqr5qOO00m3Lf86Pqe56pZ68NjiLt510FslYxjx5IY/N85Zjy8rC0GS6OwyMAW3dxWKRRJs0TRvNtl+tBkFFksZ5rLVkyKlrCBHacaRrq43YshUYUWl83ArAcOcT/oU3iiIpg1xlTanCLpmmoVC2F+MCgQmCkAEM3mC/P5svYlwDBX6AOwtG4dU4b04lWPmvGiYrH04SdVO8wzzdQoRZEJLEzvIeQYay+CaWo8cEQiBWVCv1OriEbA3n9Q25wXtjSLoUXxWvX/tJ7dot2xvnEOb8FpFhQum+fAqw2AafGKXAAiOQJDFgIKZpObZTazQb9Uq73arUapX5bLVaQ84RM63wJ0gXks6b6AvX3mcKNNvoM5JawDrHd6ciMYn+I44lYUIloRl/x7Z8sp/4izgGdZD5bJZl2YuX50+/fNLuHVhepVKtgfI6O6hKatLuKgW4sNP8X3X6bkM7d+07aOpiSpSMbal32wC3bU1T0EWREvQ6JpPJcrkMN5CKpupnkrZeKULIdSMRbMiUrjJx/JurR2gsUO0UpXotPKgjUs7IfdLvHuy5uRIFGB9F3o7jOnEaWxmASHEM5ToH14P5Yj6dT6MY1AxZ0YY0iZP9g33PB/6hbdsrVi+bSVJxcOkGeER1b7b5OcVG10KlGkzT3Gw2WGBwOBwOWENgEH1CYvyiu0uuINImUTK0Uql0Op1up3N8dNzt9lqtdrPZaLaaJCZEJfu0/qCfaRomJCimiQs11o3ZbPbJJ5/8r/////o///Z//vSnPxkpfG0ymSCKKAmNyq2gA5JMKI2EYtGOUochVy6cfcgE+zIQk8QydIwCimK5nue5rtdutzud7unp6cOHD8/OztrtDpJIRZEJqrWoL8hY4wcvAx8KC5FI7mgWcy5JlqAjYYK+Kct50/GDcu4o0F2NzIwNOJFlWl5QMy27Z9mVar1RrwW+1+50q5XqBbCCR0mSVEwzjCIQfLDMCLZ/4VxhVqHIEqLqhUypVVGFEus89wnxyywviOGLTJBTcd0McSjFGyR3Uk0y4D6nFtwsOsPqQ1epB+qwpzInCbvPuFfiqA4CH3dd1qnIskBgyfM8wzSevXi5gqjIarlYLpbLe/ceHBwdu46bOg6UJDVMz/cRq9ZypLUO5yasRIP5Liu/zH7PRyNdCz5WZYnbeYN/4U1j/6oonPqiJKKXPw4Sa6hISZom8/l8MZ9P5qvL/mAymcyW6ySOkX0GovDK8WUFUSXKj+uRygfHL6QZ08sqNik5kzd58cB8HCpBINwZ2ebquC6uVbZls43CcVgVUN/z4zhptZqu66FOMmIkXGz0xru6bX698ons2jdpb5xDmDemeAxRBPm4gcqNRaGAUdJ49Qm+/0FSDUMI67WqYwNz0rYYdGjbWF2UT1ohpohmiJjN5QptrB+KQSNy56X3pQVUlPhO3mSU+7nIoSJnLR+P4SsRWCNhGE6n88FgsJhNkxh0jm3Ae2ROUe7nWFhCOLh5p5d/IQeK7qKe33vbJlLyTZ4F2etovkcRAD5Y0BzF3ckbUc04zYbTYEPRXdlD8kxKGbAlPhIv/ZXfldmb+pWa5UdT9/Ji7QfKo4BAaAwWYmpK6READJmMYX/QX61W6806yzJ0BXv7PdM0l8slptiVmpXaI9Pgltd6UuQQYjg5DEOEASesTadT/BcsYJE6SLFnqvBBCYRASgyCRqPR7XaPWTs4OGi1WkEQoK+oFQUpdgYdQpSnipN4Ppt/+smnP//5z3/6Lz/94rMvog3QbqnPpClaHLEatpzTQbmF0VCKBmPpA2SKEvSGX/Y8r16v37t3791333v06GGr1VTDYZwEwbukWzBa428yehXqxstAGvs1FzERzFWi9297uFzG3TRsto/DfsOXd9N1vUq16nl+q9Wt12rVzyuu7Vz1+6s1yN6yUYHBSo4iYzJDkrBkOWCTEtmtwEpToqfaxMDTF1N8M8ScseZo3sXjrBmFh1Z6xZrLp525iO3LSBN7RShtFAEdGvMN6dhYqyNNZ1EUhWG0XK03m3UUhlBExLFjwFRZCn0c2SAdBEfFhKjSHuYqE0KitIzm5Nzp/NMk7ij6hNx7Lsandu0vpqkwl9g+CgamaMpeJm3NwhfAZUKLMYmBzzwaj/uD69liud6EIIPMF1Ih6ZlToMqfl6SWWNiBOkxf1SKjW7EI/nWlt3Jdwl2WV50RQU0RlmXBNde1IWbYbEB6uQfyhMxVZDPwxgyIbdSPG36ya99Ke+McQrFVlJVS18TUbmysDAsb2KYFdB0HKtTXGzD0uUkBtQo5dYSxgywjZYUo8OfKufP/oR5KlzBvtct9U8PoJAAoKikKI1ho+ivfpdARzTRILLHMJImxjtNytRpcD4fXg/3Do6jbA35UmkFuvsbkUaavGrCSfuz2BWfnGX7/7XWZh69slJy2WEDu3GQyQYdQZR5qTCrKAFRdwWJP6Pvqm6q1V+rF8RLYykDl+9brXyj/OYMZlB7IxQGdlhy70rQgpXBjzOdzUDEMNxVQV2Nlry2z2+s6thNnMfXw6yUH3qbh8an6/HIJpepms9l4PCZXEEsOohMIci9CgQZ/S96RbYNSHGgpdzqMKXqEkirVatX3ARjk6qPbK+9x6i97InEcL+fLP378x5/97Gf/8rN/+erJV3EUNxvN+XJO2afErSgVXC2ifxpMpH4k3pSBv+J9kpXu2RfwcsBFtO1arXrv3t233nrr/v179XoDrxEfqIgXlMRW6DaSoo/EyVmpWzlUWR+IiIUv4AM+issvR71qlPrEvQKkBx2I1juOC/UwHNfz/EoQVILAA4PMGg5Hyw3MT8MM2RYGj5hlaSYmBDd4si5cvXS0ERbAjUV5CvkO0V7ADT60OxmfBI8E1yNDMCUjll+MAh9oJuDNFqE6YPgBWVo7AcgKjMyJmfh1fPRxkkRxFIYhs7lhLniea1pms9WpN9tBUGE3J7NYPAiFS4v9xxe0JsAKplabEAORd5h3W8g3Kg56MQxUxL137c/eSLiBkmaUFzmRMIW0ubXhlEkSCOGFYTibzfr9wdVVP44hPGNbJlQg5I0B+AVNWl2OJRfGYQsKzmMevdL3NR7Yp7FXgA14P0U4iCk2sXgSp+Xgj+A/FUhpdhv1oNsFjzAIAl6Igk1wdXcuuatb7JPdyP8e2hvnEPI5wxmV9I4M/GN7pX6RZdnSujVty/FazWa703Vcx/MDy1owFyvBfVUEknkcCM9Q6JniUSneoOw375gwbombif8Puy3nEeUAQWk2qGEero4tDsxjRlB22zBHs2WjDhXq+9fD9XJJ1b0l8UkE7/FvXJty94sWRUXqRvUBMMWZ5Fx37Xto2tpaZLbccsFF0wpdPjTckSY6m80QHpzNZpitpB1fkV6QtQSJt6lliKnOZLGTmqOofko/TwDmUK4IrWw1jkmscIWTqTmxRD/jL5AvCuAOR5bA/cu47ihOjSiOHMdZr9ee54Vh+OTpE1gHrGw2n7399tu9Xq9arcLWGEqy6A31FV+3qZgtui7r9RqfCNagRy0ZzCSczWZoAatYLl4pMkUrlQrmDbbbsK8fstbrdZvNVq/XRUYl2M3wE9AR0PqPriY6gajE41jOOly/ePHi//kf/8+/f/DvT54+QcNiMpuwaBTvNj4OTB9loidq3Ck3ULXzqk8wP8453pVfi2AJgkIDrDkOVFzHq3ZAPNpzHLfX6929e/edd945OTmBy2VIKS6JSAAuJpqWDl0AjkAmHr0rzBHg4LPKmeSsabasin2DXujXLv8UYrwWCIpCeXWoQGgYrh+02x3bsuMwzJLUgmQI8/KqH0eh5ziM8YGgZcokwcCBMw2QIQXpX3ZG/g3h9yqpFPqUJNwjX+WIBwNMVKnJj1LtMophoSIsoN3bXCRIIY3jR4wGLCcyblZII/VBYhTdVbhXlhWDQk+abUzz8rIfbjYpSB+Z63Bz//7D/STKWp3Ur6DQKLi7KVTuZfU2+dDUpiF73MzqpcEnXvALkc4hcwYxf0OphKm5gjuE5C+qabsn6QPTO6wIKn6kjFVE/ssW+SThlSQyZjQuF/P5dHo9HIUhiEIt12vOuxY5iizZmGUPsUaQt/kqz0p8TVl5+CFEpjBx4ySWCSulmGX8yBnTU2TTGl7grmHbtu97ruu02i0rS6uVoNOqVap13w9EuMcGV1nM86IRsm2d37Xvp71xDiHPlxNUH833w/lQUgqqrJEB53pukAZBtdZqNQPfg7LNrNls9EOmCNt4lMxBPBn7B4XZZLhJ0lVLJUYVM4Ky5/HCSsNP231LxZzGaY7lxRNwK804ipfL1Wg8veoPFkw+EWXZ6MJFZ6RDSVOc2w1KejW/YqzedjOLb9e+m6YJ9Bejia/bkASILQxDkFGBLWw6m83QDeDGfU5Elzt+ak4F+UJqWJ3z2ETARdLtFLaYCgAW0SFE9hBnUW9C7hIEllhuZOPksaAkDMo6coyDLxF8UrH3AIgjMA0hF3SHVqvV+fk53pmjw6PRaPT48eM7d+70er0kTTwXUtFIMb8UJv0azwVfkCILkkUJG0R4cMYawoPo0lO9REprxL75vt9oNDqdzuHh4fHx0cHBQbvdrlSqyBTF8gw8wrS9+jx1JrOyZ8+f/fu///sHv/zg2fNnXC4P/BAzCiOSkOEWMC2YhAmzR6YJDGgcRXW8lcY+8gOJ0GZ+HHYo8G9t2z4+PnzvvXd/8pOfPH78qN1uo5OM6ghq9K541eSFEmotlb64uGg+BMkXaXWx1jmo2543kbewehCut7YDKzYSszwPoMJarV6v1yqVwPf8y8vLBSSyWqtNyL7GcAmTCUExghmbOkxwlVl8xEahOwWvc0ULSwYhp4PSs1BtQPFav4HbA7HaY5VDYotNWWpW0utYSNcqSX8gvxpFcH3pcAyj0jCjKFwtl4v5vdOzO41Wp95oObYThhuHJcGalmlj2mS+8SiPYaQiJxCzRiH8wF6IDEP9duF6WLzMV6Kju/b9NrVwIPtbx7JyBpn8aPvyjvOeaddDzDRk8bvxZDpfLGF9TJjYMrMXcaCQuSW9QTZR9YrahVmjrixS2KjYL+kT4sXk+BrK6kZUcPguCyRBi6OwGniNZn1vr9dqtyFpwnFxUcWQSp5blgPGixr7u/a9tTfOISw2JXuBz4NX1KXHXymEN8dxEoiUB81mq1qpAuPItg1Q+LYgGwOhBU4x53YloBWquSPydiUth1B7XY6My89QzFhEjnnMm65Cbbl0RDquGrUU7KYsTV0PgsRg5a/Xl1f9y8vL49M7nu+DlcHC1ZIxTsfMh0IL0SdhHaiR+1vZO7v2LTQtpv5N/EA6IDpsSG6ZTCZXV1dD1iaTCWceQkklSHdQ3Qw6QqnvofZQotAq81OgWIQ0Fr1BukCRtaSDh9pH23YdwV+zUosBDrgysJ2XDHpCGjGYotl2mCqWZdlyuQR/bDSeAWcTUpWyLGu1WlklQy0Wupav/US0p0NVBzebzXw+n0wmo9FoOByOx2PQKmAtDEMii1LOnipyY9t2EEAlg263e3R0dHh42Ol0kCkaBIAcvjINknxd7A+kVl71f/rTn/7P//k/nz17liRJvV6fTWeqpijRLHNrLAW2xB3i94rUFAoYr4ralTqESiyfh+pY2I7/3HUd9AZ//OMfP3jwoNVqs+A3TwcgB7JoC/IBwU8ng18c+cEomPBpVUtRQmR5sExxbMoMN3yXTR72TUhTwF/ElmW4mW2bAGtCXYpKs91utlrNZvPJk0a/PxiNx6PZnBmhVhiBN26yaZUksZ0BgRSzHLEuUxLDXFZFrVXMQUwhPtsQC+V3XGxPpbqaCmTBiLUsblrqYxeum48L8u+1gvXF76v+JklPyYHGHwqIbMdxEkWx7TgRi+lMp9PNenV8cpplRrvTRXkMlKC7YS2FqSSGB3FHwUXEe4ieoTo4xdDULpwYCt/K0r1r37jh0s5KyBChndYjUcOGLSxchxNdN7lxlOsU8tFommYYbmazKcbt5ssVbj5caguEknJ4OLdgC1OrxBGkc/HJQCQz7Yf8Smh1LZJxBLuVqeAI4Swjy8AShq3QTNO4Wm32et1ut1er1RwH9bfYFnoj8zl3XTuC9Pfe3jiHML8F684S0cpeORaRJIB78Wq9SpOk3gS1vWatCnkcTKY9CmGDQ41xA3MyeAVbYf8hEVxxnHigXe52QiMDwTe1B3ldUlolBGKXu0Y6PJ1F5LHzbZLsSLRrwdCPo9Fo9OLl8ySOsGhVlG2ySoCUNBTGkOcWMTE19CuMBBFRVvZjLe9rN+2/9Va8saU3/PZ3Hn+ImWboLTiOs9lsRqwNh8Nnz56NRiPQcGcKJZheQP4bHoTsMCrOTk6IaqDjr7CIOYk0yNLPwsHQFES5oa9ucdwM5fQ8mNqCyaMKz2iWFtlw3DViZyCOKDcclWgOYeZkvSUpr70BFQg3G8/z0iS9yC5QwzDcwC16cP/BweEB7qAhKFhAAXS6t18vsZBuC3YGHcLZbDYYDObz+Zi16+trckq5EI7CicXSES5jglar1W6322q1ut0uUkbROfRZw5rsWu1B6gYCg5sNKPhj9fk0TS8vL//X//pf//t//++Pfv9RGEGi6Xg0Vp8sPQ58BxcZJRyeG4oIAmO9BOqD6hOqgxeFjWhoES7NXgMe6Di2D1R/uHbHcdvt9unp6Xvvvff48VtNWNiBN6sEL0DkT2OKykeQdzhxMZRmvcwiV4BoImZhBp30XkQYUSkTX/ro8zM64+AV6Po5CBxU6o09FqRvNJtHR0dffPHFy5cvnn31bOI4syVUHAl8fxMCj9k0HJCbBm+fMUYZYM/6z8RR2d1UsQ68ubSBqqQADhIqKYQ8U1L0le9r+WdHXvcNF6t6g2qKZvG3alEkLpoqyiwZAJ8C1ofnRZw/jmImM5tdXl4t5vPZdDKbTmfj0dvvzKIwskyj2eqwwiGZVa2ylHvTZrOmJB9YnJijgkx1lqo8qXdHSIgLyijPC4VGa+a3GNHbta/fuN4TBt/zmupcGkKSpATZix4cflePH0E9erZwMH0j2D37V/3+1RWT/pouFnOsyArgIYPuGUDNYlhoQOaI8fw/NKPU04gUXRKZyNmeeVNOpugX2Su4/dks0Rp+CdRpC/VFfd8PfK/ZbDeb9UajfnCwjyRSllRJM1S5cjq9qr1Ulka7a99De+McQrUVxxmP05TRn4qNWyEAlDtGZriu1+mAFLvPRMkZugD7A+OPySgq7gM8YqqYr4JhjrgEBXGg4RS5xQUpsdryWUSZIARv0Bl0IwYkjjNjOp2PRkNg0pgYEoOtSsun5+uR2NVpqy7Ge0oT8XesgD9Xe611lrYHzBu0bRvUQZbL0Wj09OnTLz7/YjAAdWxkIRLaQz+3TEvl/qE7Qc4PGlKU/IM/B+PMjA3I5clhgEW4T/q6eAqC33PWlpjbDMHgvqMy9LSD64gifiQ5fjR/MilWYQD3smjLpkkaRuFyuUQsDuVVjMzwYKd0sXohEk3RT/56M4IQVPTbmWRiSEo/KCuKeZ5Yc42yQEkMRqU8uC6okkDVwWaz0+n0er1Op9No8AoT+Pi2We1UuwKHCnbjq6++ev+D93/605/+9re/HY1GWPAdrxptIduyiQ8vPXOk5pbF1CmfU/PJS1lS+E5R8BZdHcYDdYjkX61WDg+P/u7v/u69935wenpar9d5TRSprCnj7MWz4BKfU04qiXYLTpQADGU0MAcXvG7shvMwmMsKP3KYzwH7EVhqFdf3m+3O3t5+t9d78fy4Was9ffJ0uFgNh6MoimzbZohxYpoQLyCeLzsSK6CIPgxtT8WBmpUgsSxsSmUYOOmNeCVoWWs7hbxNBfKYEslVzqXSXfJjgPpASnKiP4bC5QQSKaKsDN9IQY/UsObLdTYYJZkFYM10HkWJzRzsRqttGOZqufR8D904WfW++IxpHWI4Id8i2f2VOkNKIFV9UYyc7rbLP28T+wrHh5Xwe06kUKWEFyd+7oA8ZQdHBFSeX6+WMwYPLlermOWyCvyAB0BMk8s6iDVCuqY0kPhCoI4WohxIXcKtdmU+40dbvnIaHGKhhgPzUCak75qVis9kNTr1RoOR7YWkjMJ0oBCS6gTugME/Y3sTHUI57ArJDyLQQyP2FcRG5Pcw0Tkwbqr1erPZatTq48mEFYmCgDTYfyz7V5RVE9qhQg4Yj5SbsFjQQvaiDNlXkD1x0FfOImXTUmsVKjuosM+yBJKLjMVq1e8PptNxs9VyXQ/dxmJvcsEcmUat399tmMyufT/t9oXsij9Ul2y0+Gez2YsXL7744otPPvnkyy+/3IQgWYmxTG55s39YaJw/a1XWH//1fR8tctVeR3iNvEQVjqbcQhWRw49EDEVDCdmvULZRHKEIJmrjUPNz5L4l1geccCTdRn0AyEpp6K4kdmJEkN8Vg7Ed4yWbphkEkGrfaDQYCTP4JnuhioxhTiBCtUgWnUwmyBQlTVFVvgV9QryTyBGosNZoNNrtdpe1ZrNZr9dRY4YxRXkp9dKG144+IStgM3327Nl//Md//PRffvrHP/5xOptWKhXIGJSphRLsRW9ZBqdouWLRdmJd4lMQWXelvpkEseTTEXwrkodl76CACrx2HKder52cnLz11uP33nvv6OgY+Zb4c+Yq3DR3RPxBi4URbbKk9AuVMJHun1CMp++8zoSVN0PMNVqSDctKbKfp+3690ajV6hC+bED93OcvLz3Lms5mizDabDZw65hThHMQZzM8UAN1cSTgrwUqcyHFfONzGRXI4B5yvoxGe9k2DTXSWvGJK7tazubW8A2RVcGddKXPvDgFew0XbSRGbCVZaCRJZjnuZr3erNeOF1gm0GvvPnjcaDThNwnwbFFCBsiuW3IgkY0D40xojzDLgBGqaTVToe8y/eQdSPgX0kqJTiqYLwmi7FsK+Fb6vGS40TCyOIpmTPFruVqHESR4i7pMRhghtx8DC0JakLY2qUVxc+eJT09oJ2GY0pRTovq8c8pVK4diEwoGtWFYEFFhClVZ5rlOu9Xc6/UwhiiUmQna0Ms70TylF9/4Ke3a12lvlkOoL6+FLwhJXh5LhCwAjJGUj0+YDI5tpyy077hekmbVWg1dQQiWIBfO5iFzQgbxv8AlZbOSQSAUxZRGM+6g/AP9zIwtoMaky9hElI0iPE4WEM1rL8KnyAdi2uX4CzTNZ/OZ51pXF+eT636r3XW9oFqtQZ6JgDLUE9FSpEFDpU+BAueoJ3HDl3ftm7Q8dwuaquJ4e5MC/QeUi2RVkpLlatnv91+8ePG73/3uxcsX8/l8uVyu1quEfQ5uIcuDZ0K7cCIGl7Oq3zb8z/d9JJ1WKhWCCsk9QIcwDEM0xwl2Q2oluT0qDlmsPk/wizrxiWCWg/tE01h8ajpibn5hxEMEgRmhWu+GH/jk0lCZdSRk9gd9w4QvQHrhann//v39/X0+6w0TVDMtC2phq7TVVz1l8qkInQvDEFM6ERjEf8MQgEp02tVyCAhRIjDoeV6j0QiCgEGCjf39/cPDw729PfRahQNfUmQCx4b6wrKs6XT68ccf/+xnP/vlr375+Wefz+dz27IjKHvAbzK5/SQmBKV8BEeUyrjhXw7gM9IBhy8zdA+9UxzsZIeJhy6tN1UUFIPZkPnNXHEMOtRqtePj47feeusHP/jB6elZq9WqVqt0c1BRZtsTwQhjWhCLYf8KinHOM9G9HfQG+Qjj79BuxU9y+8xrcXDLduBFHIMkGBMntE07q7c7tutVAt82Tcf1TcO46A+t4dDMDNd2wjgOo8g0zDiJWRotQ7EsmJhQ1Z1lMqk7qciG00A8UwY92VuImULRQwMEe7XIYsn+lfP2ed6WhldQ/Tex0oE3S6VxxSiS3jqanVhWRNmtgEsO4m9ZxhSDM1D2T9dsiYqH17Hvg2JwpfoFzH3TDDebs7v3G60OFFhzXdSHtC0LKnSjv0cqAHQtYuNHyihPd1TriuQXZHXF1lDiHZby5205zxyygXJPgVuOCkGUjLiyPRdjJFCJHnfMMIoW8/lyvbm8ugQ56Nk8Yux6VvNWghm4f4kI1E19zXG10ONiVhf/KaGYSnSNjqqiEjTtqAMsMsh+ZpmuA/+D5vk+rKjWXm+v0Wy7XjXLbMdx2TCGZVobsSrNG61Bcfzd0P4ztDfLIYSWK2yVG+65nHRl5VWkPLXGPEYTuN2ZAdZGtQb67L1u53IwsJllh9YrWDgpC4zSfsaFf2kuSyOmgE2I1UT8gG995Xyd3E/JAOFpDDlyDR1AgUwEYc8yzSRNK6CbH43H0/lslsSx55sAhLL6XKW3lkvj6IF5RFGU79AOmCOz72b/t9C2JWeqloT6zi2PiUxR9AwTVrBrPp+/ePHi008/ff78+fXwer1aRzHsXOjLYfofbj3oDSINGtSWmEeIGpWe51UqFYyeOFD0mQ9CqGsfRYg3hmFI7DvXdRG1UDVI1foWJVenjEgNOVT9vZsRQtV75OmIhPPjvBR/k9oN1qzn9QZt0I5jdd7Ap0WfLY7jyXSyWkNd+IcPHyI1EfzkzAYWOgrca/rANzbVl47jeL1eL5fLyWRC4qLoEEJxRCYng5dJFRTQ58HUwVqt1mw29/b2Dg8Pj46Oer1epVJBb/CG8UODhBzv1Wr1xRdfvP/++//xH//x2WefLZdL8sYjpmJCdFl6FtzPpGUBdX2weA/Hugyo3y7wHEyIYblhuHzLaJQWfqYZwU12zAUUjGXTNNEbfO+9937yk3949913T09PgyCgcXIbmE5DeETxDJMjygULHuBQVW0i5xO+ApS4ZU9IaoVn7YotB8rkOq7PdFODaq1WrVWrTxvV4GpwvVhDXXZjuQISqQNxfZz1Ahtkt4KpmaYpn3rsqJAeocEgRN6WBbm5IA/vFt2vW1xU7r6o6xv+kyOGy++wUI64F0JBXDV5maQQ/pL1noJfhgFZlCkUaITZulyuvnr+YrNZrVerQf9yNpudnt09Oj2r1eprDGfgWGJlTEqvR77HlglpbmBOJq9RybumRqC0sVeonqKv7bv2nTbFgNHUPvFtHGBK/JCMuJJlU02FhVm2YZSK6+FwOpuv1xvllOL/BTVCFnyWohGvAAhlPi2bFcp3aXGVE0r8ZqtWUz6TAtcvjPma9Xq13W41W616o+kHFVaUm60/23klhUF+04Xs2nfU3jyHUEHXxcKa81g4PVwN+WyPyvLQJYa6TbMSAM9qr9erBs+WiwW4VWy2wPoPOwaLJondUHhjebhGsURh9pJTJeKv3BkU31A7U0pXoZ/LehW5mQd/CKoe5jKAsYpum2VZURyPJ9N+v39nMQ8qNcYu46sX0w7O3w1RblFjLoizsj7k7isPm+VrQO7aa7SiQbAtgerrWQ+qGU0ux2K5ePHixZ/+9KePP/54Mp1gQhrUUWJ+DncIFRVQ9AbBWHLA8fM8z/d99Abr9TpXQQwCcgnQIUQxTCxogc4Gkk8w9wzRHjTl04Ql3INdJTA6AeLlvESlHDx/R5lr25xD+WV1jNIOyIxeaeuL6UxxfRzxbJrxjyjBb7PZYDrfer1OkuTw8JBVdKhglQt+jaIK3ysfU5byI0cREP9QRQalX4GAtFyqyqLkuZGDhPX3kCnaarV6vd7BwcH+/n6n06lWawFUNgfn4YY+kKYoXv58Pv/iiy9+9rOf/fM///Nnn322mC8q1QowEhljU9UUzT0RpayOBvAKiSDlIXB6FvkGcEFi4OVWmCKbUc2JdV231WohNvhf/+t/feutt/b396FcJDs+Cv+oXuvWRyC6LUeIYhmW+NIoOc0Fvshm5N/hgKclmVsibQmv+qYlU57LtrEQO3NWFHjBcVIWYTl0HD+oNJrNZrt1cXHZefHyejwZjseWOVosV6ZlhqwcCGJf0qzlSDjnd4l7TtfMEdxcVhVPN6DA5k2t9Hmpjr24UzrkUsAflHsi3HLlzgHfBb0w4pCrisHAiWAjCOBSYz2aGFDDZbUG+cf5YjqdGqZ5cnLmBwFWmMgc0E8C53jLMkIjgeRGQbObSKfoGTIGHq022pDT0lN3PuH33UTVZSKJ5B+BCuaLSmOFA5QF07hq93w+6w8GV/3+ZhNicVSoFMtGATBzmHw3hjkFCp0f8OJFHoXMzyOygHGCyPBIDlnnhynULMth18L/TdLESizLMxzLqPpOt9ve29vrdHs+VO+Eoc43aOqPWPp0GaqcAA+v1rYb2N9be/McQmFWsOGIf4sAh9wmFPo+ty+3DEdGt0xiiJ6yjIKk2+u0GrVmrbparTPDms1m4L/FYruXQuTSs1N4Q7g1ybdwC6X/k9ov2+v2UoSHf8QikQpnhl+NGpMW5j7/0zAAHjQtazgcNpuNq8HwT5989u4P/763j4nUAqXMKXfzs/PcZop2CyOG+728ZA1+mYeqRPB4V4fitZvmBJa6gkX/J0c72TKw8cgULKesM9M01+v15cXln/70p6dPn85BhW+2XC6BBMhoitycEpYr5wQKErUjGvIP6/V6u90G2hVTJ8POIAyIlFHEuBaLRb/fn7OGrMv1eo0H5I4NqfEmHJNU6oDnmJ8ll8xj9GpCb4klmruBAr8SB+DipdxWE/Mbj4lVJTihdMNLOyAcen5xPpuBfAD6aeBUx3Gn26kkFdu2XdeFtEOmfMhET+wc/s4a+VR4H9A0By1TJvZzfX399OnTwWAwA/t1vtlsyA/En1Nn0D/f29sDnWTWUEjm8PCwWq16HgjMEKRW7ANeKV4FcOyYuun5+fn/+B//4/3333/y5AkWIFksFuBSUg2G/A2nTFGClUCIyABTg+5zLEqhqg+Us/GFE8gsatXJzMmBEiroMekvVMdpNpunp6c/+tGP/uEf/uGdd945Pj6u1+t42zFnUpU+0meK6nbwAcYTIfGVHpUogs9qlb88KIQhNjX192skkgl3mnVGlFM3QAAJAn+u5zfaHQsYX163t7d/sP/y/GJwPXz58nw0mYwn4ziKPM8DlxiwXCOOE8YQQels4dDzOKDiCRMky/5WBx5hhlzlcLuPrY6TMpA2V+pNgQHVjZb/gTueZfExJnpiWKbNVw4YRLzrYuYCiZ2FDOIoSqLIXq83q5W33kSrMBxNpqMJOIY/+tGPTk7vNFptxotLogjI3qCsi7qjhfkiusnhbB2CFrt8zstV7gZyEErX8B2J9PtoBdJNwRsU1g55Xoo5pNmSuLGi7LxlWTHUvVyMx6M4TobD0XyxwEUb5xooRbFseCoYoZf4IoGH7WNA/4B7g+TdKkaw9GxpDsI/QHlgtptpYj16E3SZPc91nFarmaZGpVo93KsfHR3W6w1GEkpcz2dVCqEgGz+8dAMB98jVaMVhDDIa3KPeDenvrb2BDiFtUjLUSvOWsHJBKpGx2fJlncVvWZUhFoC17FqtdnCw32zUhuOJYWS2Y2dxBuJ1EOvn01UVwxCLuOgY/4dNQoVaqf7fzY1TQ7niBfmhfL2glUtBHYiByrHLJI4t20piYMFGYTifz6+u+qPh8ODoOMtaAHFEEdjlWywbIuQoNAmxQcvgtvyl6BiXZX+tB/mGt9L67KW3sfSjm+82MUU5asxakiTD4fAr1i4vL7kzw7BBdEv4C8jAAeeHEmIpIw7rK1CBu3a7zVwOeAc/9X2foEgsArZYLBqNxosXL3zfH4/HYRgGQYD9EX1l1lJmMtoavzSSIYE5mm6X1VG5Afy+cGUaDGHefPP1myZT9PntJaOW9EXRpMPEyOVyORwOP/nkE0rnQ/nWWq0GSGkYMbItV3zRYHTC4uRtZ9mbq9WKCg9i7UFI71wBAxDddfLt1YbuerVaBY7D3t7x8fHBwQHUMq8BPHgbpiiWskBo99mzZx988MGvfvWrZ8+ekeqsYRjCvpFnLz2s5nLT0rTtcWj+vPxV4ZGRQ4j/JklSq9UODw//03/6T//5P//nt99+++joyPch/1MVX71psiBXVSyjup0ulG9ymoPbb6bUWVWQ0m1wEH12G34VORzoUkCNdCuFStLM6Q0qVShU2OnsHx4cHB4Orke9vd7z58+Hw8bLi8v5YpVmMB9ZXiEvhMANWZ7ZB7mTIEQtoFrOCBUiLiXuHH6Ux123BWL4O2CMKj65LgZeGBvqgBE7u+K/4/lp0lIdJn7jwzDCJQvXMGSmJ0m6Xm+u+tfzxWq+WI4n0024+bvN5uHjtxwXEqWYGWBYKfcDt21qPDzBpEd57EzBsbUbogYdKNtWjh8x8F7Jcdi1b9JkApE644iZkPP3VGbyTfusZcG4Yj+HtSiMuC70dDYLoyiGCGFCmhFkqMkuCbgQ/5DemyLHpU0LciCLHynjjfMSyB5WLk2ORmLM0hyJwtD3g1arfnxy1Ns78IOa6/rAC7J5XkAO6hCXQDEc8k51y3LXvq/2ZjqEvCk7l6L0RCEWctS2SLZgw4R0k4mNQZlp1200mt1O52ownC6WkIUA2RoQa4R9GHIUON9ABnV4Z1jQRXQtf448qeqVfBssVIr7Gw/eEkCZu0pEEOU6IzL9gdaVpJ4Jlmscx6Px+PLy8vD4uNlqB5UKAqcpCza/6h7LOqxlNetFOXsW8tptZq/btrFD1YypbT+8zX0mBAYxH3TPPvnkk48++ghL22GhOQgCpmmcyGoTstob6yC5gljMoFartVqtfdZarVa9XkcSKaIxCNrgqVGjcr1ed7vder1+dXVlO/Z0MkWyJZL9iHSHqCBduDToURGUApDbLpamFdRtk2qWPIjJCDqqa6295vsc03yDIC4TZtSwLMM2zJSXOsA3gSO0mF9fXyOfFl2RTqfDJbxty2IJmGzG5YVtxANCfwzd4yiC3M7xeDwYDPr9Pj4j1Rsk3UhFhRLQDHTIq9UqVh08ODjo9aCgcLVaRfz2hrqINEjQHV0sFufn5x988ME///M/v3jxIoqiSqWyWCyoHAU6hKTvko+LUURMPBLhCnIXkdsKXOJVjdBrULA6BbaJ6yJCeHh4+Pjx45/85CdvvfVWr9fDapAoIUNBjRvmSw6az3eJjwlelYcLqGrRGQ3uQ9VAbuMValjn4YhbcUepKcmT8tSoYAZZrkxQyHbcVqvdand6+5O9/b1et3t+cV6pVC6u+tPZYrlaJknie14M1UEBuGbdiW1QTYORD2ravONWZoLYYG5nlWIY7FooIsAtathTyA3WKA9F4BRV2bjzmZu96rDk94dpdkuVFyrDq3aNFaJQFG4FOQiBfyYvB1eUWFbIYh+bTbhZr1mIDKx2z/Md26lUa67nOSbI+LwydKuBe2rRHfVi6bXGdFBHID7EbYG/XfsWm2LQCOhe/4p25+XQLT4dEUDBSifRGmN5UC92ghrdvB59muCeKuKGhB2UA3780PSW0sXtwyK/0GwFnIUQKOenANMZOhknOAjr9erBwd7e/lGt3nJcD1LEuQoXSDTbNrdJcXYKmjbey9RErakcOFlOu92176i9uQ4h0pS5Nyj8Momc0+5M8gBb5pIN3GhIFTRNy/e9er3R7QB/un45qC5WUGaUmUF8SnOejcwr0TOTaIcT2cbYV5mZIqo3lfoD1HAeYzIkMrXpEov3QZxOWszMHnVcz82AspWNxpPLiwuWSwNEPuDSMEq7wSyJ4snzPVPqsaoLjYhs4bYuFoLdNvbarSSUrlmZOZM191HpDacygLw4AcPfwjDs9/t/+tOfPv/885cvX15eXi4WC3wfYR9u6zOiJsXVITjIIEEsXoe+X71e73Q6R0dHBwcHWM/A87xarYb6IsgdJT+n0+nM53NEzBCq8lyv3+8j2LVZb3ANi2IAL4yEVwDHbihGs6z2Jq1hlNFnTboTcn/K1bSAwcp0XorWqmqOokwIkkjZcbm6I1Jh0dTzPA+vbrVaIXf0+vo6joFWDmUJ0+Tu3btJCso9tVqtwnIwoAxAyGvWU4epJiR6wuixozc4HA6vrq76/f5wOFwsFtgH1HEhsU30vTGlEx9KvV7v9XpHR0eHh4fNZrNarVYqFaT4IlNUHS1UfZ4Oa1kW1hv81a9+9f7770Pe4GKB2ZLqoCJnGI9DV0TejkZyxjwT/Ai0eVSbR5ZA0GQn5dgmvwMrDXqeh2PMsuwg8Pf2enfvnr399uN79+71QCS9Qb0C1h87/s3OsJoQLgoHcQHAXP4g/qdAOZMdztU6osUaCfrk2pRM6q9RhIDi+uhcx0zd3jTNSrUaua4FBDC/Wqu6jhNUQDCQAQaXSRJnzGx14Ck4WQZuM3VGMHtZdEBoC6uUTqLh5DAUNh7wglPwhcAvLPqB/E969ED+JCpmDkxWk0dpWeRbi/Qq5QAs20PJKcUawkaFxUAZeTTbAHCTOA4Ytuswury8TOKIMU6T9Xp9/8HDdqeLSadIAfB8P2Wl5Ipca2oUoyHuKHkaRZ9QFmgRw1IUr+fVU26TEbBrr91wpudgeZ4Fp9LH8i+klCwVktFUl5IYxkkKOx2slCABNhqOx5PlYr5cQsp3msDc5IsnClGzR0/ChIrzJCnbspNl4YOysqgydVkNHimfSlCBVlRYFyzIOMB1FeSpm612p97b6x0dHVcqge+73HhNU8tFQ1GN9hG8yg1EtgbwYSwWy503+L22N9QhpLoSfGrIbUUksEguhth3twufsEEMO4fNSnhBMc5WM/B91CnH4hOQtoGRP75h4UhXsyCkx6aA9LnTqN3NIX/FJuwR5e/cp5itqOb1KmsHGEKwQzPyXxhu5osllB0fTw4Oj5gJGHsem7plhebhX5YJLFNFSGYGXT9dUzRHg9rtYa/bdApZ3kYsWgavvMOU/4YOIarIXF5efsra06dPQQ57OsXUQVSUUWVCJAsRSyhYFsAPDmCDrutWq6DEe3Z2dufOHSxwh14HapYgcZHDfcz6rFQqyGOsVCrIL0UYbTAYbDYgwhZHHKxITDBDeR+wPGCejgKZfgy4kzpG+WmRUzQpyVm64Zbp95Zh9JoZyg8YRRFP3nMhvRC9NciTvOp/EXwBvl+WrtdryL2IE6cLq8hysQTHSRh89C+vdM+SKjHfEmmiCA+Ox2MsQ492LT4gFOYh8iR6PrVaDV30s7Oz/f19xGMxy45MkNJBgo8JuxFF0fn5+UcfffT+++//5je/ubq6ovoTvLopAwbJYFXZmOpARXEg4usiioSPkhiDtGQQhysfuFfTPrEEH1yp8oxM13XqdUh0+eEPf/DjH//92dlZpVKJ4xh8cqFbW2IYKZefe6yC4UD0UHL/yCNUiwupx9+m/SsqjVFtrlfoK9wW9id3U9x8SyrNIqgOtZQq1arnBw1Rf9J3APUajiEnNoZnjapRcZqikHYKqKBYN/izE5A6o5Xy66OpIuSmYI3gWXPwNoCyMJVv1O8hgXzxIBSdNfUy6ftkw0oPUXBISYKUB2ARoMMxjyl+MGHlmsY2R9bxJArDBcO84yRZg6cYbTbrh48eHxwcuZ5nMUM5iWOWN8vp4CXXIp6C+icvjsmcADX4q8pxc3oqKtmypFAVjLoFkWjXXq+pvNxc0T/tCRbfUUP+qkUmXqOaHwhrL5dzrBbLYm0CQ8MJltmQ6FOOnBNRuwSvvGEqKQsV/bfczC2JOJuAmbMoKRXjsW2zWg3a7Va73a3XGx7wRbmgXCmeIhZqsUfnv7MzBL//9oY6hBp7USJw6jLKh6pI6pBLQW6goonJdwsGiASVCli6jToINbheFMWODSFDrFCfMOxC3QmUYCp5nvlTCDwTwzPkv914eUKgT90X8tWahfmUC6vi32mSxkbspG7G9ADiOB5cX5+fnx8eHfU833Rd0HUEn/FGyqi4reIeFkBWnh0tJX22A7G7dlMrDSRrNvdtYsbacZAEuFxCOOCTTz757W9/OxgMrq+v5/N5GIIBhCoylMCmIjyAHrAFnzuEHuiIIiPx+Pj47OwMBUvA3AwqLmSkg/2E3iDiV2maIsU0CIJKpYIVEcA2ZSRG27ax3vraXDMVRMeEkig8Q0/WOhe5ZyrVkEQd5eaXn1TkVKgB+1c8A2VrVtwVBoAocSXKuOOfiqzCKIpms1m/30fZlfkM7vDqcGVZVqPRgDuTwp3h5ElmEasFG9frNf4cgcHxeDybzRAbTNj/6OnjY0KQED20Tqezv79/enp6//79g4MDLDsRBAEyeLeV3aNLw0e/Xq+fP3/+4Ycf/tu//dvHH388GAwwGVKtjljM9BOkwdwIJOKoLPUhja2cdy24S/zGUtU+lS/KKoFnrIQAR7wdB+oWVipBt9v50Y/+7gc/+OHZ2Vm1WkXTi7ismqVenCk02kW0XuVzElgocgEU31JHqgWILQeSUk2R3il2IBf3yY3BV41TdnC6UghnMqvNMMIsg2mYAcYF6Q8VmHrVwK84OIm98+F4vILi9VAFxoxhQILyoQmFDrFmA3TJ5l1CtQy2/nPnSlPQ4Xq6eEWC9suvd7tLoznqwifUw6NZmTcolziMCEljWDwdtrGpt1MqBovDmEaMBLkE5iDUjoOACJTI2aQx4KjtTteDO1eFlEs1PWTLcNICdmA+k8+rxH0xequljmseQo6RuOOOfotNLc3OlXSVFUDxzcQPbtxqBUSGLYEg4Gq+mEMIbxPGMYT5cHYAu0zwdHjiQAl4XjJjuFRGDt8TJ+chNqI2KJ6hnppbvA18dQXoW9SjxwJCvue0263e3n6t3nBcH5F8BWaQS58IAPFomtij+d3ldWUVLvSufT/tjXUIlW1I7sYygqgwxdCzQsMinwjB0TDLTBMWZrWZwEba6nRBts+1HA+mBFYYQjmmOOHhTFrhRWfw9IUmnFGegq+AePi7G8KAmjiUPE3+4FQXCpUSWa1VSIjkyTMQKLWni8XFxeX4+noxnVYqFZCNchxUFyjWp1Z3KaLgCbOA90NJmOHPYsd1+dqtSCErR11e5RYSvkckQNM0N5vN1dXVH//4x08++eTi4uLq6gqFZNBRxNg5wVykKYpFapEm6rput9t1IbcWqpwfHBycnp7u7+83m81ardZoNBAVROyI8rVAco3BNfgR1kzHMYlqlqZpXl5eIvpk2/ZiscBChRGTghApUlCRQgZiFfFJwZCWyWnsDvJv4v0B6xaVoJjbQygZ7mfISuXH4giRkcpK3PxoaHYTvRPRNvQJUZATHRWkmV1eXm5YA7NgBQL3q9Xq5PikVq85jPGIN0G9RSGokmeTyeTq6gpTB4fD4fX19WQygRoPynZLdxg96maz6TiAku3v799j7fj4GAHber2uMkU1eBDHEqYsGobh+36WZdPp9MMPP3z//ff/+Mc/DgYDUhzVvCCqyaFyUAFeKo5HEL5i5FItA0Yz+hXfT/U0sNv0r+u6WHceubuNRqPX67377jvvvPPuo0ePe709lDml8UZM0eJMKRooskTElvmFdn3R7s99R0mMVIaiwBe5v5mz/vUXBePplauokiAgy1Fi7q6AzHhlBiPLPA9kb7Ms3Vz1HRuGLsQpXDdjw8BwmPCoZaUAWUOpCyFpj2MexDzhQYs4IfaWTbFUv2JGHrvBG8RSSZxdVr4VilxM0k0UDjR7zb1TieRw8g18ZgNEz3vNcwnBHodO+kD2ZgQ40wyjyEosIwuRN3t1eblZLjerxWK+HI7Gb739zunZHVBnZYEtqHfPRMiJO7otyKJxRynYoT1ZHJwkzqTL9oq02902+h3Bg7SN4DPK0b9zI+6miJJaPBYyvUEaevL8+Yv5fD6dTiO2wGJpB8mrF3EL2koKkRGlsZpIIKlW/IBeKS+5M0iXK79I3FciX0NjxB+oKWzbVhD41WrFcb12p1Op1BwX6tFbJkwNSp8gC1ayKoS5zY1cQWsjPZudN/g9tzfXITT0eCwf7ZK/nIvoFSqn57Z2Thn1PCCzBZXqwfHJ/v7+5WA4GrlrxhdlujPwPYhXy9gSoWfarBaTh7+lnpXAPOr9lsvSfqrQhNSmWRVqviHsyikYnVW/OpvPLy8uZpNxu9NJ/QBqFTJqUanZIVl5Iu9FuNbCAZchK26O85jQbvq/ftMAhxyiUvbODYfirg7jaiKqs1gshsMhJg0Oh8PlconeIElHquCPKH4tzXFQDQ183/PrDXA8jo6OTk9PDw8P9/b2arUaCckQTRSBQfq5Jn/SbDYRucLK6c1ms9FsnL88n06nlmXNZ3MopV2xucJNwrmj4LmJGoBSsMHIQAuQ2XlqblIRHqQ7Q1aXTkpEdVMy6snJVIp/5urpiQeBOXh0pajSiVYCqOlMppPJ5OT6ZLVc7e/vY8FGyEpSOJ8I0kZRNBwOB6yhrCiSRTebDWrJYH6XiltiqYlarba/v//gwYOHDx8eHh62Wi1UfEWnCP2i4gihCpNUbXI8Hn/xxRcffvjhb3/72/Pzc3IaUXOoGDbC61XLqZV7WXnMlls4oryk5h1RHFzE63DYS7/ONI0w3Hie32g0z87OfvzjH/3n//yf/v7v//7g4AizOtVTbzPZC8AgvalB8rw/ItBHOtLyFNoLpQCXHiwTwXVuIWm3iz7juUwiY8m4TRMV1bg7K24WZobjxPSCwHG9aqXabIL+Uxvm4Ofnl33XdefLZZZFvgcghqAHx+zpgA8E/efeDXQmzYD/SOkXdAlcfFu53SSsk+spRRW5T5ayvZT/qd5a8R+m7iSJxCLfK6cSma/CJiOzPHNEQ4mRyIcj08o4vppmbLXMjHgyi9NsFabz+WI+B3DeNM1Gq+V6nsl8bIhKsJ84t+COUqoYFz0WlNEynk0BBkRC36tktHbttZqcaPnK1XqirI5gb8OEOR2UbaBxGG5m8+loPBqPJ+vVmvwzxhXlOYQsb1ZyIpSFZjsuIOJM+rUQZbrwHr4UISxSYJLMfIJGwJrFyJ3wSyvVoAGp6M1arREEFUwZQSbAls7l4jlitdwFMv5s7U13CEWwkhMX84xRPasQdyOIWxd2dwqZpCkoH3a6vaPjo6vB9dVguN5swihM4hjyJWyQY8FUDcn/JNeT9jLZAYmw4XvlF1BoXOBN/ZlmWZT8JGdkgBUJvFAw+yzbXm82l1dXF+cvO92uHwQIDthAviollZFDy8NOYifTjLw8gxUTTxT3ZttT2zWt6QaiaEXP8IYjkJHNqkgAT3i1WvX7/SdPngyHw9kM6g1SWXPKCkOvQLWI8YAIZ/m+D4XO26Apenx8fHJycnBw0Gg0QC6lUkF9y3wSgnQIKQSOqiT4HXQgkX3aarX29vc67c7FxcVgMDBNcz6fm4YJ040JkKJnCERtLh/I3a0cBVHsgzjPaY8qav1xwFvxRhS7U6kroN18UYGziKKjU4RJgORlmQZ3FFEkZr1abzab6XS6v7/faDRMywx8qM9BojJQg34xHw1HmDQ4nU7nc3CMVViSng7lDWIRyF6vd3Jycvfu3cPDw0ajQZqihBRtm4MUBdhsNqPR6OOPP/7Xf/3Xjz766PLykswXYhFTDbqbB6EK9JX4PGXIWPFui4Aev3bsrG1DoNqy7DSFIhMnJyf/5b/8l3/8R5AV3d8/9DzfsmDg4YNQNUWLq5B6M9E1zKM3qKEnNSTQthGe403tFlNVpuKpfeOnzCXSCU/1lSAhkVywaiKVQDAMgPkgZgG1sG3bgQHTaNbq9WYDith/8vnnl1d9c3A9yxbgaSOUwQ25GOR0WTFbTFHnHhQokcrHRxxOPtGgA6gxiPeMTUcRRVTuLn4XwTbBOJYbGt9uhAPJpzLOQhFJZSog/No1kFZ8Tfwt3EN+EwUsiUY5H6hA/IGO2UmSRvEkzcD3A+oEW1uOT0/b3W6VaWKpzM9tz0UbBljPI7NYFIY9f1WFNXcoJZAsorFcHX1Huvk2Gw+e8NcFi5EJMEne4w3LHfwf0+eGzXa1WgyH15eXF6vVKs0yx3XQxILtgNVwwnEreqBKU9Fozzc5KYQU6tZVhU8LZgFrO5WYKIqhmQIhDt4DFShRkB7QAcdqNurtdqfZ6vh+hRXOhYprpNxGawvdA0mz5z1QM7mw54qu26599+1NdwhxpSTwTAZnKX7J5gitqoxFWQy88QJi4QboW7br+Z5zdHj40e//UPFs33OjyGdBxCwS1hL7FRwBAyiF6ad0T/1M6/mNeeP6RCLkc0uaHlkDqi4IOIW2tZjOsnr27OXLP33ySau3V2m0KvUGKEryiBEwZkvABB7XFNYKEdrF2qaU9sDbi5ZJPsy+a9ubmkZSfOKlgoTFgxDmQ4CP4zqbEJyQq6urp0+f9vv9y8vL+XyOwiFYP53vYywKTiAMVkrwwMvjwpWoBIM0UZSvRMESxLuQAEkoGXZPjS8QbKhdAg3USlCpBJUgCNrtdhAEWH/PWAEbc7PZgP+TcQ+TPC5CQYVVCieSUjSiSG7RkNJT4EQY3swAJcA4kTBQ5X3OgIIt4dOcNKgoKB9UAno/MiPDNEajEXiD6zVSZNfr9Xg8brVbtWoNXGIHHLYgCPCjJE6w9DzWbEQSKTnYJMWJsj3o9TUajXa7jZhtr9cLggBzNalQZHG00CDBPuPxF4vF73//+3/7t397//33X758iTmN9CjRvVfhVtKlJCat5u8RBKdSTCUvFLWCRIopDWBVrJ9OjV9DiqyQLHLq9cadO3d+9KMfvfPOuwcHB2zRS20bQFHMYqXMuuIdKE60fNSAHDS4PWrC0es2cm61s/MQYREdJZOtwJ69rTOgMXuhBjYcMUm4kiFsarVs/+jY9f1Gs+kHfr3+NEvBhV6uVkma+r7PZhzU3M2AOsoekKC6phiYUO6eNP2ETqweyWKFHgjA0+ItSgQKVwnGTBMIDd9hUO46MxKDSXRIAEQySRnFHZ8TI4oKmiuJTmVQjheL18PgzzJO9mazIPM8HxK7II9yDZEUy70eQY7lmuldMfx+wyl/vs+YtUaFxYAoClZ8OhxQxSgbZHAwdjrFhglj5f6+oBNjwECpWc+WIgbMsq/pWdO79rpNGIgy1I7cZvaK/cszbnAbYEha+cwT9eg5iTqKoulsNp6MN+vN1VV/Mp1CHIY/VNgdHdtIM2Z5srMpCwtXscqFz5QOSTc1RxZjsn+SmyBtQilEqEQ4OQjP8H1IEBZ5BCwrBEj2KAyOSQbNZqcSVFF7ArIJRNEpvhzx2yZN7Jz1m1Napo3+23h2u3a79qY7hLSsio1TqGOypum/ESGnCIgxuXlIjElBjBsk2rp7vdOT44uL8+vxBOxFLFzP/hXg++3FoMRKxOhp6hS/WUtMy3VWOy3/UmwZyV8SNhYkkCSp6UC9aWCNXl31ry6PTk56+3uGaUSMBlPMMlL6LZIzRdazSPrgKwJG0YSGnrLNFw2iXdvSNB9JdadvxnmwqT4SIkuoETKfz4mFuFiCWCUyRVWEkBwPjCYwlqFUFnUcp1av7fX27t69e3Z21ul0jo+PazVwaRDo4xTTfNJXsXsqAp9BLhOY71THotkC7uhoNKpUKs+fP3cc5/r6OgxDwDfSJI6gw3gQtMO0cEMuIipMwG03qpSahegit0t5xTP5E/Ux0RG0K4XtHxjl3BDE2xvHMfqBTMYwns1mnVmn2QLSLOp/+r6POYRhGE4mE4RwEZ1Apx2fETEzqRYIOoTdbpcqf6CKzA2BgyJTNMuy4XD4+eef//KXv/zwww+fPHnCi1Ky2vTEFJVQqkaSFNaA+gXVz6HIN/d/0EvnMnuaD5lzJygDkKBm0Ppiw9IP/Lt37/7oRz969913u90uAoPFwMoNZFHyV7VPNTKwunrdpAX9iqaIPqgrM74obBn55KUcwnlbAVL1DrD/o9xCW8gyeYFfq9eDaqXd6bqO8+lnX4ynszGro81GMs+JZUezszRLhDq+5LoJWhhlsZMbxvE42CKRLE7wXu4B5W+ICoVSqXl+OQIVpD2Ffkv/Jw9BHqv2DAhuYbsVH72IXcZxxBxRYIGmKaycoKUUxdPZ/NPPP09A0gk0ZjIja7U7QbUK8Z3NhglugWAGxoNLnwUMYPDljBSo7RbSEPKZzCo1UR0GPGCtRdBoC961r9l4jAd8QA1D46/k6Mq9KDZ8JhgxgQUzjmaz6fXguj+43mzCGHj+oNeEJ+OMc1LG1iK/Jar02U2oAfVOeUNbn5RxJdVqGHmVh6WolikuFFEUsxzC6t5er9frVas1KMsJOgKuiPSKs6IXzTRyuESael38K4pbujMCv9/2pjuEuHDmfC5OvdE5S1RDqXyEYlwVAHKwRTwvqNbqe/v7vW6nfz2azhfc5LUti1HYFKn0sgPl/+RTVP2b+neDqSG3X73PWdlrDQBBzpfY3SHEC+bpZHpxfnF0fNnbP2g2W4bDxK+xrG/BSSaHNQ+95s+us60UHtT2K9s1apqppzHubqiVoiEean3zTbgZXg9fvHiB1QtGoxG6VeQEyuoOpkkgIfcBbA6UOa7TbDWPDqGSwd27d/f3930f9gxMAsQ4AuXKbxPwILSH/CgMz1PFcKxjUalUBoMB1yOtQuE+1NhkdZy4W4KEQIzOUhCd7gB8h0mblPqD21BrUoGnf0tveLEynnaxKuGWyJYk8UplG5I4Wa1XjUbD90DOGzmxmEY4n0EB+ijk4C35LerFYr31SqWCsqLHx8d7e3t496jmxyt5xThIwjAcDUd/+uRPv/zlL3/7299iAXqqO6LyRVWoipiu3GzdTv6kAAF8x2LYKXmGyoiVz0GEk7HEM/GN6camWera7r27995777233nrcarUYWTf1fX7J+YeiLz+qP6whmYU5WH6Eb96UtGtZlpbOpXDyeSf09Djh+dywwOZsWXYPec0kNs1hgoDCNNaPcVzXsx3bdb3Pv3ySZtlssXCZrJqw+pgAqZlwXV9GMIOkQl6Xomi85j1CRFjAWkRnkWt1vJI/Rg+QbzRI8EMzVBQj5WYsr3hGgGIOKeFupfJY2V+8LAeHamFiphYyiAzDAtax4TBZnfV6PRyNmDwkDN0kSU7v3Nk7PGo0G3wKsC7cjN9ijpbFKKMCKrE05WT1+8S+U6oyQqwaHEsFR+IM9t0G+5pNITnxsmEixiFC3biB3NaHQUcPCCDz2eT6+vri4qp/NcA1NIW4G2Tt8OU0gTdxIxNTQA/wC+1T0dstM0V57spixwe9WtCFIiz8K5iTz/ScEihLBqM6Rj2pwPdqter+Xo8loreDAJJBBOsHKBgKXUJZM4UysxTSyPmNr/2Adu2btzfeIeRBCklnYf/hWxoVRGaGGm6R24LozCaOOZnK9bxGo9nrMgXei2t/MsVE4TTmSoNiYnC7Rw/0svMDw1ymn/A5IniffHe8qRYhZxOUgESqs0ufkDlIxgRLYjYs21rHSdXJVqvV9XA0Ho3CcMOQl9hOILkhMYFa5BQq1MuNEykHapaL+IrsrGDkar3atZubFo/U6HNqQXatkUoKuRCO42D1gslk0u/3Ly4unj9/fn19jclslJamUvgIHkSuHYrEVCqQP9BoNPb2ABt8+PDh0dERlhCs1WpY+I6k9mh43vzEycRHHxIBQHRj0LdE52c6naI293A4xPxGEPoTCGEURaTSiV6W3Dgx5M+RaX1YlsMsDK/H4niE+PF8QuW3eHD1gDpEqdxPzGQj/xzv+Xq9juPY931w/2Lwu3zPtx0Q/AD3LAJ91zVrYRSS34IgLeJ+SZIgiRe9wU6n0+12W61WgzV0CIteusYURSFZ7MZgMPjs889QRebLL78cj8er1YruEt1h9b6pKJyqpkheIvlvlFBKZS3Ip6WhjgEIqhKhupFZZrguaBQFQYCLkufBdfV6vfv37/3jP/7kwYMHKJdCXyBnuBB2y0GR2iPTQip5Z1I9gvENmn4c6iHuTvhadkPB3LTTkgfI7+fWaKHeUDeYDQx4LGGUGonpV6qHxyeGCbpBUKo9imzbHo0nhmE6noseCHQhAalYeFLsLJBVKJICub/Ges+xcXKz+C7HAiyAjYn0AnGry7qZq0bIX4s7hIekEYJ2Ku2rbHdSnig6VcAARzyIczLZhsgJLszGZcPPslhBAAhTARhoWbAt2gCOhJvNagk5wEmWrRmJNAzD49PTar2O8rmoEmwxCR/OdtWJNtL1xynDrWe8VypYJKQ/1Pkl7BYphYUDU7jIu/ZaTRamJ2UjIQyTC74ry11p1IVNCxBoAOJHGC7n89nF5fnV1dX19fVsxqv7wrNmowx2M3idV8lGt1+Jj+G+xaSc5FluxUETghakuItuobp1yXo8rEvIwGCbhVWBXAOv3e60W/X9/e6dszPME8EplaYAmDMzkhZ/4sFyXgAvr5onM+PSQGWEdtbg99Z2DiEB8sIVUznX2TbuaOEokMTAFnS22biuU6vV9vYP9nudejWAGSQKdMJOxMQOcMVQrcPctBCliwRgyU/Dvse2BPbqleVniyVr+HHyS4NOMmSvwWLOrMRMLNuBJIlNOFsssdBZuNlAXVIWM9Jz8/P3VrwoRTNVpnjOXtyJyrxW21be+jZkUSosnqZQD302m11eXr548QK9Qaxoh3xRooxqBehJqoQnYtlWtVrt7fXu3bv36NGjs9OzXrcHEjIep4lqyTOv9AZVpwIbRR8oTwyxr0ql0u/3m83mixcvgiC4uLiYzWaotEk18TQ7Xo46lbai3MBi5ljuVuPvqPulCKOIvKpXURpaQhhTzWHbsGQk9H4RDNysN0EFUFYKGJumiQ4h1qCnp4NPhBwe3/fr9ToyRZEsSgXosdyCmsmJDYE+7DkGDizLGo1GX3zxxS9+8YsPPvjg+fPns9ksZtW3V6sVApsq0qjFo8hOVR89VVZULzy/3paI5WrqL8pveXgO30E3eG9v79133/1v/+2//fjHP+71elRbYttJtSdeEg5Qrk79Mx9cV7knX79JHXZtbMmkJqEXJgugqElEMswn35GbjqJNmr9yFfaEghPsAE7m4oXi6LJMi5UqrH7x5Zeu6/QhfhRWggqIOZlWYjGYI4lTlmbHbg3Yf6JKYYHdQPqNos/ikrNX5lbIsCOzX3Fvos/owaijDz/iSo6q765sgnrlALFrK/cL7nkcRZh+Clu8mcZJ4tj2Jo4n88Wnn32+XCxAeHSxSJP04Pio1elYlr1aLkHeFjxmK4MA2banzz/AfFcKUFOZE064FRVWaZbhRznaNq8+J1Kfd37hLRrX51ODenyUcpcmb53J8mCl25pCT86YbF+y3qyms8mgP5hMpswV5JuyGPS6nSbZZdxFlW5niTSvPKmMzksakfAC9YVaYSPQ4OGKEdxXg+/YNlizuPhUK0Gn0zk4OGi12q7nObC6IgifW8kLtXmwTwLiUKaa6MhuiH6vbecQYtPqt7MJL4yMMn5F6TCl6n0QPoldt1oDqf1uq1UN/NmcoW3cK8RNEekx6o5Y2N9YnIjCgBrWgP+56aqKJk7ZybQeyHmPO2WcOC4EqsII0pP619fgKgwGzVbLdT1mI+a0Q19/qc0Z3Ln1Ynsl310rbcWaxaWNZ2UJiz+O4H+b9WZwPXj69OnFxcWLFy+urq7W6/VisVgul1R6Hh1C1dynjQRAPwsYZfVaff9g/+7du48fPcYaepVqBX1FLC+haTneZtFXuaPkhaqVG1A5MwiCbre7x9rLly/b7fbV1dXFBZNuY7oX6BwSB1W6YbYFYRqI9SsFG2nDyuNdOfeAe5Hsf0xFgKaTWllOzfsvRQipJ/gFvC4UEcUveJ6HWYXL5RK8awekZVjqMrjEURStViuqBUL4LYqvoJYMhKj29u7cuYN1INvtNsGDauW9ovNDLFBMVvzoo4/+z//5Px9++OGXX36JnFVVModYo+p1aQNSc7QER0OCNGr+oaYWk/cncz/EGvQ0BZgESBYEwf37D9555+0f//jvf/zjH+/tQclBVoaeJ1WqEEoJKzgvebqNKVr2QjUi0QX7hkuZqJ2p1MIVJmP+yCTZLL0eqTTIAS+WxJa3c5UuEhCJ5YC4MgRCx0xnE0po8kqVfqXSarXbrfbTZ19VvvpqOBotV8ApiKPYdT3DBLjDde2MyY9SBTdFXJTjmTxBFGXIiLLD+yp6WPZ0BGqXsdJOrEqhKDDB9zSOCSJjRv4af8iZcCVxHOFn8/sotPqFdhSv7s0OkzBxERhUwhmz2AhcsJWHxWo2cQJRleV6dd80252OaVmg4AqcUF7H0rLKw6A08tFNAI+T1UhkNeb0e0PTiP7U3AAKzwqUZmd2b23K05f3EF0wZSngs1uJJyg+eF61kyIPuMolSTyZjM/PL8YTqDYRA8VMroGKYk1uzSnu7LlpwvtA3S4WKKX0HObyKQOAvF/+cyn9AJsRB/j4kIkdwWfxXKfT6SBf1PcDAL0hNkKXDNq8/Oi5JiUmlD7zF0WW6a59D23nELLxKLcOPQ7Nuc4KeC0WAmR5yIZJKRarUA9WnGE1W51mp1OvV5Axw/BBZsjCKAdWOBo2SA8g65KrozGziqXWs9kLCU6CTCq3S7mLaZQqepemXS6UpH6qREPxRS4pn5lNaZyEWWiZ5ngysSzz8vz85bOnrXY7hcoTjmM4wC9nhALCT/PECZ15pRh/4jpUM0vJNdqtBLdsxQ1j2zKKphh5DoDtJKvJBNIYzi/OX7x48eTJk8l4slqtRqMRMliwCjmJ45ExTaUgeFFv16lWqp0u7A13zu6cnJx0e4BBAYmUcTsJg1LN+tdqBC2q7GKEv4gHiEKavV5vb2/vq6++6nQ6X331FepwJkkSsKIp6MBQyQfVj8LwuUpEpLMXWaOcVZ4oeIvAu4AYRhQwpaycMj050F+0GNDRwoL1+M50Ol2v15An6QeLxcLzPKg/wXgHWZqBeAVL5qQpRrAtS2kGlKzdbp+xBlGqbhezOrGpbG1hekLPCFnFezuZTH7729/+67/+64cffvjVV1/N53NSkUGQkPL3SGSIXFMNzcthswLWwHcw+qDeKNVTlU9fgLEa19S2Hd/3TNPCMvSHh4c//OF7//iP/+nx48edTgcpzcLD4beodDTewAuli9K+r+wOuQN+c1dQ3ZEo1k7xfOpjCT4tWGQKjVw4iSkjd+QDcDelyQtJNUAL08yy4T9+tbq/f1CpVL3Ab7abzWb9+fMXl/3+xWXfsszNemPbjuEZcQRV7DnYS3ON26rA8eYa04J0rSbxU8fEbdbvi8ihlCAhXQh+11KxaLHJcuNWeIPkPgpNgRxEQVsl/hBGWgYMPRHQgGAQRHOSxA8CBuMBi5vJGdkozRwzSG+xWKyWq+V8/vCtt7p7eyBS6jgWE54BMUkWLyuKTqlXDjJvfMDDxBeuPX824lHKmSLllGkAifG58wZv0eR8L1Xt3vIOcMWKt1dNRcb35/P5cDScTRf9qz7wcSaTEJjFkZBwZ0mkIjTGFjsYszjh6cBySpDiYP6pKgGC/Pv4Vm5KqfCHeMWmCc/oZv1xBBuoAuSAqh9U9g8OOp1uvdH2/Irng2i2wjfR11WpA6bGYeTIlNS5G4Lau/ZdtJ1DyBrV3eQODBd0LsSAX7HBg3FppUZieF5gmGYQhXv7h/v7+61mfTQeo8oopAmxokzMWBT7Tj5+wxd6vlERdwAZCflvK1WuygkKgpzD35C/kzQDfhwqoSWXD2m6gYA1WGnGYrG8GgwG/f56tTTSbpKkhhEDwJJPgVDpRuo+pNLzyHhRLS0y9XYb1ddot8Tc8LHGoF4JHD9gik6BKfqctevr6/lsvtls1us1oMKxVK1Utz1iJKrAOK91/vDB48ePz87OqkxYjwT9Cdz72oaIhiviMVWx0yAIarVatVpdLpcHBwd7e3uDwaDVaj19+nTIGniDlg0CpMzV4X6LIOpw4p0y69WSFUWCouYzyB01M1KovFbiaUjXHYQLWWWbPNdLdQtJ/ZWKvMdx7IbggS+dpZoSqbFqSRnctm1MHcQ6kL1er9PpNBoNNW+w+DjIbcPnjt7gkydPPvjgg3//939/8uSJrJMRy7FBuqZFX+4Gpt825FDzA/XGVas4O5TSJoUhAqc+PDz88Y9//H//3/+/d999t9Vq1Wo1HLFaZ7YNRQ0Z1nIjtR+S9UOexHdizYgURaHEJyU6RbxfxNFIvITCnXiXFBqIaiS+WpKUfRvpLVATgn3T903XBlVtn5V+2ev1up3Oy5cvPNe5uBy4jrPeAM8ZfhmjHAX4oXAQ5k4BDC5qnxEawfcFZWvD6cf4ppKNwisaCT0dvaP58AFL1kC5Xf5TdW9VAZ3cfS7Ahip+ksMxxB2Loojyqk0lT3u1Wr1kVIXFYjEaXofh5v6jR8cnp0Glul6vHds2hVDWtkeA/izcH8kCZcxR/DLIYjFwklfQyN0B1T/UdtgceLhresutSPRalFYuWUNwGbghTxOJV7D9RNF6vR5dD68u+ywCu4blk6WnIjyI+fD5ISqKqQjXT41D5RccMvBompfzuLTgiwIbCL9QzBaKeuK18g3dMKoVv9VqttudVqtTqVRx7S2J9wpjl+VocQGsXPYg2dgC+MjnY+zad952DiFvHJXnA1at0aIOR+R1WFsPgrQUy7Id00kT23EazWYXkIrey4vL1Rpiq0aSANHLZpIxnH8iy1LTadQ5T2JoYr6IXion3tYlbiaqV6Lgh7pdI+ahuiehxpWVWnEMAFEYRePx9Pz8Ynh93en2qrU65JXwhA1ePULpV5lVJBgXuRd8/vPQl+Bi7DzDb78h9AyIUgRykVEcDYfDr55/dc5av99fLpeYkAbfQZdRZKaJYt96+BO9jnqjvre/9/Dhw0cPHx0fHdfrdTTQXdclv7EIu71Wowg6nRdxSyQuov+DcGW9XkfdlMFggJUPnz9/bts2FHKIkzAKSamPCzawkUYBdfUCFUZNDoTn3qNqk9KfbECjQ1jqcshIkHkTGEVFFJE7ig4hIpymCQRdwmkJLMV3wGhnDhKmDh6w1m63a7VapVLBAvQStFFcSuoeiYVuNpvr6+vPP//8g1988P7773/55ZeY2YicTKhNrIwQlfiqmaTq3VMd+4IpIweqNtjoJ3QEVUpUPbjjOL293jvvvINFJpApykgc4NzSsNnmtuULDOpu/w3QX55v8R00bm8KbUPpichhhrxSjbEqx3B+7yhlmJcTFxmCxxB1dPixrp6dOW6SJF3X9fygwYrXt5oNx7FdxxkOR+PZgrEcmWYms4MNG0BCUwlkoFwbXoD61OUVK2fn+6MwrLGoQ66jAuUk0M+CyQLSOCoYqFwvj3hyrWCCErXLz4MsqMPKaHTQsJoUHIu5XAak3zNyDa4nlmls4AibTbhcraJwE8XRer2xLfvo5ASEr0CklFWuF2Z+qSQJ9ZDeYd65ss9KOQT5cIvRKy0L5hWBgDeyafERXKKIo07QdPF3yBspdWSIfgVU0QQ23/FodHF+cXF+sVlDvA/mCK5nTGVULG4aKk4z46Z4kyqRJcxa4dFxzytfLUy6hKruBEn/oiIUqUukhgmK4rC5O06r2dzr7fX29ioVkPjOoMqarBNbaFwkV87RfChSjk1FPXo3Mr+ftnMIc41oI2L1zC2mimx6QQ9M/B5tsiTegLnmBaZhNuq1LIkdx/JcF5S4IbnehLnOTU9RFJuFVbSYNPfkiPGCWRZsarBEAh0wyUWSlM5zfFML/2ybYgKyV7cQxm43RpNpo1qdzRdffvXsh6MR0wmALRkWKYz4WjmHWbV0c7uwQB3JjBZZ7nxjQ+tBiBDs2rfW0HDnaHaaLpfL/qB//vL84uLi2fNnCKDNprPVGlKAtOrz5JygK0LeF9JBK5VKrVY7PDx88OABCMn0evAdm5UjUoDEItdOa8Wo9s1XRKXS8Jsg3MdIkng67Abk9DJOIwq4TSdTI4JC7RL6M0yomibItNQTdXJx0csMZAWpyeRA0U0cyTyQIfKEVR9YclML2FcRHyAn0ABrcoNXQU6g+i9q7SAHslKpmKzIXr1eD4Kg2YTqhVi8sdlsUqkJzTOn18hWZalf4HAuF8svvvjiA9Y++eQTTFbEFEdtecR3CDG+wZGmT0lKlGINRbKlijdSLJyceTodXJEB9U4Mw6hWq3fO7vzDP/zDu+++i9on1TqA1RQ12MYUVU1AzV8tHZkqAU+jh2kHNL6lJvqjhNXzvg2FJDhUIV7wLuXdby0Igrdbo+xqDUFCyzIdB+IOUQaD0zSteqPuuC4mRcQxJLWCBlIYmVk2T1M7y1yoP5ZBwfkEoC0MOJAdSmJIuP7zvQAfGTqEokN4BxAcwxmrTSQ1gsBymxkZlX6pPxqdEcAJLJrZLQxlJVYrb5HK6cvYbHUrFegkWP9AF03sNIwi8P3S5PMnT1YiPftHf//3p2dnHlTMCaDSTBQZgLv6MB2U4vXFpo5Mhe4uYSs1yqPOF6Ih0NPccUe1pkFtON1Iu1edX8U1QUQJSwJDMdtMCQNcrpaz2ex6OFzMp4PB9WQyWTO3EMpXKlOS+qLBBqXPSxvb2x8r13vJvSWUfdXBjzKgaZa5joOfs5UWdvYaqIlmvu90O/WDg/1qtcY0URPPC6AeMXMXt/VQc1Y5ziHNQhHd2H6lu/ZdtJ1DKBqHpWSmhAqvFQdl+R7PEodSI7WgQr1hW3ZQrbU7nYP9vc+fPGVVu1ObsSuFnIHcyIVoVUEqSkDo6NNJHovE0cqvR8so4aaVjCLnz1AUqOKLIDdJTeD4gPMaxvF8segPrs9fvnw4me7vH6AWouOwCvXaEpNbdAgQVC4aPD/iCLEFiGV8qHJzu+XgW2k0GtiiDWH1KI6Wq+VoOMIC9OMRCIouF0z2msE+iBGpizgZ+uh+UCIWeh2nJ6cP7j+4e+dup91BqRJWzVma/jc/yuJm9kpjWkvZIuNG7SfWcHddt9VsITL27Nmz5Bqq/Hk+KLUwOhuUB+XKKOyo6OmpOz12wzbtJJPU2VIYHL1BPI5GodSa6vBsUzTV/CU8IGY/khgM6ceg740FNrD/ruui3A6mVmLuB35ZTShSz4tMUbwzo9Ho088//eD9D376059++umnKCUKbkAUMUV0zoijMo90z4tukhpjUmnDhPVpWFzxh2QB093Aa4erVvxDzCD9u7/7ux/+8IdnZ2ftdttxee1KDagsDif1XNtwMxWoLHiteiL6t2jQIDaoeIIS9MsXINSJl8XjFOeXUBxRkMYtU48hTDyL3jRZRCaDycMeh20aey6ghR7gcuxQ16NxkmXhJsRnBAEOMzZZWTO6h2wfyN1VPBPfs5DzySXqmSvINEvV2sHa5dFrMsw5oqgOALG76g+Rq2nkHj0dSAWBYURhLrAoDyi0QGGC0ETA7+O0XW8218MROITL5Ww6A17+anV6dma2OzBtWZgGo1rIOOLVroojQd9exfVuRWbKHnfZi13LN/6EKYguWUtEJeNBBDHx8eHkyWU0iJj2GCxE4WYzHA77V/3xeLJcraAkfRwzbTKeZCuWQc6rpIe+DXwrLlnbGk/cUCeaHP8UR6JUKh50wEujdQ430Hq1cnR40Nvbr1TrHuwvEAcWOGPZ0GVLExmXfL6Kz1Q2/K59/23nEGpNFVXBxlXw5Dc4bLdlyIogimWlpmX6QaVWq/d6vWajvlpv0ixbrbg9xMKWHKu5zRQWM+f2ip4iJTjPvaHDkQWhv6VeO5a4SEA0I8syF7e0MJwvFs+fv3j+7CsQGm53TNNmifTMmSv2g2/QuTC2ADGF/Y08KL4d7+rSfweNansz/YPMyJbL5XA4HI1G8O9wBEJ4LG+QRFYoaVAz0AnVQWwQSYnHx8f37t07Oz1rNBqILKEgyha7OddUnXSyVm8TupZ+mkDJyAhDEil6SlSFr1av1Wo1/MlkMsH8SYmHMHvOSnJYqNaZ209DhBNhEqY3FYQsBpjVf8mlVNFLulJCuqieB/7Qtm3kc2LdBZCiYQ2B06Lno0Fb2KIomk6nv/vd737+85//4sNffPzxx1jWgjNFWYKL2uhaXjkSVXNWo3qWGqZFVEf9E+9AFMdmHONo7PV6d+/d/dGPfnR6eorqO1gZDy3ybdiXhrfk6nmyfm1zCPNPsKjcaXybzdw2YKhjfNHOOYglizDvq6xffws9Knn5pmnzcYi7HfwXIgimWa3VXN93XAg6gAKh73/17MXLi8uZkcVJZJousNDT1HHBlZJMFoZCkNuFTwIrs4udi9dVEOigUFRRGJLijutbm1DM56CidjHKdxVneMud117JX4oxwQYPXIFaQobPZZG/B5XrWZVCptsdbcJNHEV37iZBtRpUKgFkYUE1edCkwqy/vDqq/iw0J6EAW5FPU7LIKDmZO7dQbXlkVb6Dn4r7JsR7uduWX7UUv0ZOPfaOZVmbzWY8Hl1eXg4G19PZnC2qQPliwTUsPihXOdaJnAmah39z3b75uthwkUEKWr/0r8kwPm8YpECpfMYQgahcJfC7vc7+wWGj2fJciLqy78DxwTwoXf4UbdF8GJWUkHXrbzcmv7e2cwiNwjST8k34trZBvmp0QqIgBrAhXJpljVan3WrsdTuL5SqKQPLeMJIo5qs808hW6QHqtId/OHVdUkBx3aFv4maqIOxb6l6xbJ+EZMTVyxbXyfcGVhgJ9DCImIVkdoehCkwyLRqNJ0+++uony8Vms46iMMtSh60FQJUBZqysjJRbDakSEoWxVUaTIue6S3Mvtm9yQ1RjF/42jcV8MRqN+ld9LIk7X8xn09lyuURoCEmDNBrxV+hy0AvPhf/VajXXc/d6e+12++gQqtuB4KcDPphjA8mEHJVthuY2Pp5WW/mV1676q/gvQmH0216vVwlA79Q0zVar9eTpk5cvX87nczS/wI9y7Czm2pj4Ey1nEhscIZXZa0ZhD1MBNyY5CBW6VYKiaofRT7QxrxromvYmwXEcSRARX8/zNpsN8mNJsRA/9X2flD9VdR+SBkWcH509/EISJ7/73e/+5Wf/8otf/OLJl0/m83kYhgA8plBBC86bcLgS74D6lNVq8prjp3mh+GV1sGlEI8JXpdId+y1PlYS6855lWn7NzwwoMtFsNu/evftf/6//+uDBg73eXqPZgCdrQuSCZFeLXCaViapCkWr0XMU21aeTf+asfDkvr/AdrmAq3KqeXfNn5AvFcZL0QuEnIAOl9PHd4B/SE8SKFLC5MH/bc51ms316di/LjFq9EVSg1uWTJ09Mw1wsl0kK2RMwRPlEYxWsxUTjrEs8r9it2PrDy1RwLxCz1vlfap/y7iHTsZFXTUfWjWCipHDKn36lAk1UMRP1zrB7Bf4mA15wt+U4T+D7vMuWBepcZmxbULretu2XF5dhFK3Wm/li8c51/+zsbG9vv93ppiDLzGn2mCwKZd228+3zw5UbAzyJQ9wVpZ9KSiHmPO9AwkLbSgdVvWjFgeGqoPkgkTpP2Roew6hI0sVivl6tLi4uPv30k+vrwfXgesNCAyydKGc2ydWSJF60KZlXQdMAAPVaeBxTzHhuOOZnQu447FgstRVQS89jFDARYPU9r95o1Cr+4cF+r9fxXBApw4GWpgmy8kvD+pIHV6CB0NDdUUb/XG3nEOYaG5TcZeGIthJGufURWAgGEutg/lRr1f2Dg2az7gGSDm5VxtikKd/4lHCu6jMJiTXNO9VcLD3oe2MjOan8tBeValUxK6nHDW9xjELEZmFXS5LB9fXLly8W81mr1c6YSIPBTEm8C3Q3+DWhhcRXIApbSupFrswv3sPdKpBv3/CGSNcihcKDm81mNptNJhOsx7CYL6D6PNuX0CsopYniO7wGPUsOdF232Wju7+/fvXP3+Pi42Wz6HvAS+UgQY7PUo9MAGfWkpZHOsoqguUOpjTwlPCzuZLVaLaiADOne3l670261Wp9//vn14Np1QRgjjEKVu6hVqCN/gC5ElA8usSBpHqlOHd0HjU94Q+KHStdR4VYt2E/fQSzRtm2sIYmJSdr91ywG1ZSkSoZhGPYH/d/89jcf/vLDTz/9NAIldHACUeyUADRyTVGFuPSiSqzVfPxLda01vRntdsmP2NJKxFeE/oIg2OuBptH/xdr9e/er1SrVW0OjCjj9W5KyimBp0UQuWnsEDOZytrlV852vYHkIQsKAyrjNdSznOpX5ezfA+FrTWNMsUAI3lscFTKvZ7tx33UajWa81Op227/tPnz71fH8ynYEUp2VFkE/FUGbDQJ4lr3LEcgLx8eccb8VTz7nsuW7pPVTDOrmLF/ePB1ZZEVLY/HkqFR0Kv0PTrXg+jrDSO/zILOEfsGvGr8HIFl9LDZg7YRgyzS6Ivq1CwIuGg8G9e/fu3LnX6vYarZZpWavVyvU8uBsswJMr0KZehyh0gCw9vuCwLZs7GMKS2QYIF9eTN7xpXHd5f8Q7uW8LRSKOGZYMTF4pEPjS7InPZrNB/+ry4mI6nbEKZDyfhlcbU9ZSJexYwpwiD684IZRL4N4gyDRgd/lh+fJQbuKyg4mSntAvGwjhjESD3NEsDQKv2Wq2W516ve66EJjDSOMNNjPNFmX34cwGfnu34+G79l23nUOYa3yX0Kw0CrmJvVZZPcuGLmTGMdzcMh3XcxynVq93u91a7cIZT20bytFaNhTqZVTR1EjJA+S/F6ouaEfK8I34l7uCr2IHlLTi1C8w3eXioq1KJCQYJ3GWGdPZ7PmL5+fnL1utdrPdSdEhVIQB5E3ltpFKUFGcYJQSVbohimVwNxW5fDsO6TeP4KI3mCQJZA8ul9PpdDqZrlc6U7RYVRy9O2JA2Q7HWzzPq1ar+3v7pyenR0dHrVYLlEt8GPPM8LY4Z7KsqX4FWSeq4IHqDyh1kLZCFpotS0AfXQim1fm+X6lU9vb2ut1ut9et1WroEyI6CqoPDOXAwR8nMYmRqmlvlK+oAxT8RufueenlF92zoluoPTvNWdrmPqGtuVxCUYp6vY7gGzWEf9EBVo+g/fzy8vKjjz76zW9/8+zZsw3U1OYEVG6tKGRaOrJ2/2+wMvNRc6Elk1sBcnmhmMJDQ4UPQoNHHCAnx4ZUyW6ve//+/Z/85Cc//vGP7965W2GaByAzA1XUQQWn3OwRQ117oXKYtUeG9kvRo1af3fdlVZcQ/W/4AmkfZiUfYmqT6mTeBBxpgDw6hJAoAWzt0M4s36+4DjB4Xc/3g0oA/x989eylYRiz+SJlAp1JEgN8yw4F58YTsQLt2lnwj5zNKzrHK5htuxEI0gsHEO+AWh6EYEOcy+DI8XujB4NLpyqFNLUhzypkQIPJkp/vLCsS1zRYjqMoYnULV4v5fDqdbtab07M7mWE0mk3TttI0AYQQKbVbQGcKmcAcoesS51VXI55vmo+/qMd5wz1DuWWImbBt8OcoAAKjKy72xOpkUQxeRmizXvX7l1999XQ2m6dp5rhuzDYdoIxCsJ2TQXTnk9gl2y2/0o0DjyGdVrkM8D+0l+Lpw2yAecqtQUgdz4wM87HZ6DUbjXqv163VG67rsaAEAtr8zOVGmxxyItKCUrnKbS1kbb2JQ/HP0nYOIW9FgCKP2wvPTCNBlQ1TcPay1DINGwT3PT+o9Vjzg1qjXl+vQyjdF4KYGLiDYGAxGWjp4IkApRLUw41MsT9yYenXvVJh0Nw0x1TVU9qG6Z3lYmYY6dMnTz/+/e+rlfpd2+26HqUsoqo4RafERpYLo9KOmyOIyupP/Pai3GjBcX2D2rfC56EsL9uyowzKHy0Wi/l0vl6v+4P+bD7DygF4q9GVokJzZJozvT4ThEOZXiVEOmq1TrtzcHAAtc573UoVytS6DviKEA+xLSY6W15kWUWHZA1ApRafCsdpXmLxAm94k2oVUrm8arWKb1agAkPFMgFfCqPQjcFNwl/xlImEjztSYlTTdbZhntvyCzVizzbfqfgd1T/X/FLVo0O3h67Xtu12u60mH4KSQRj6vo9Xp3qJAKSwMnFxHD99+vTLL7/89W9+/cc//HE5XyL/zTSAqooyPFx7VgBuqntMwR3VeiZWqiLUnPO72IVBlY5i+UHpfArWAEmqQtlJP3Bc+F+HtbPTsx/84AcPHz5stVtMacdSmaIctS5rxfuvVZ4oCPDojEqiIqr24ncfx9ILIykrrVxyyWzFdVUZYXT56q6nDUvJYrt5/VFoHfBf2zZBKdOym632ySksL7PZfLUOV6u1Yzuj8ZjlGPubEGB5Uyw7qZBBlkNIQcXlMKOtQUSplLgtli/K5UGpXaQDqqgpj+yge8gGo1KIQumMzsqh0ACvD0d7KyrG4UBHPqHnefBXmma2BROQ9cR1nNgyLy8vZ7PpZDwG2DAEjsZmszk5u1NrNBwP0kwAUI0iKAjOSvgAUAN4bN6sJ4cZ+aICVlVqLHMBR9qYNd9PtW3ezA1XtesEQVQPBJQgq2rwWhyHjhnFEXOroEgJJN2Em9l0Or6G2oP9wXA6naK4KNo74A3iCETIV0Q6Sn0kdfLfvIPku0R7h055UA/FYWabmXwAUcMgZKsuBIIrQeD7wM+v1upeUDeYIG6qrN7blj6a1NzgJU1RZZ5qnvDOG/ze2s4h1BoroEAqoyoeV2qdbwuCCAUn13UqlWqj2d7f6zbqldEIjBc7ilGTjUUuNSdQklV4OJAD+0Sd4jVucjpygnP5Oq5hod8KJMq/wJIb6duopWZZsNXZNuxPk8n04vz8enC1f3SUdTqGAUoeju0gcUDcUG4iYL+pIjHazbxsW85kUbZhnSDzRrdvErUlVmHG1A7Q4ACfcAEF6KMQikersqIq4kTGE9ol6BCCkKDrVSvVvd7ewf5Bp9PBegYg/c9C7OoPtc6ogBU5q2U5tJrBrYtevPJuqCxNtXw5/rDX62EJe9d1IX8jTq6vr1UaJLmpGndUvaU8Kk9YOk2dbcCgCOsUN2DtqrWPVEdFQxdVOit+AUuB27aNlGCUC4IaAOzfMAzxUWpEI0wPns/nl5eXX331FWCDgiCKTiAWSk5YdhTV+aDjaHL2RSeKoGbV3ZL9L7thsoeCR1CsZgkJhL7fbDYfPXr0ox/96O23326321RVUh0D2waJ2m4YY9pBtKVJieOb3xtlVHXeiIelDj2ybPlupXaUeqlsHWUxC/JzXjnjePU84I6Cq2Yw5wUMv05vz4DcV66q8uLleQxq1RBrYJrH7DHhOsBRBjgRlDtD4fsCDY8/CnharBQ7PjLxBNlQlL0q7XKJBczZ3xoqmfuxOl/EzdHvuao7AJumuHVc0IgHm+wUqc5pasKf7moTDSezT794Mp8vF6vV23BzjP3Dw1a34/nBarWC8BrL6YI6xgV2kgyiYT8ZX5Q/XHjBmRrUdeHX8jgLrY30JLEMlPGGNUlOLlCBlRJ68kaJp4xjlFcbEh41/62oEMYL+cZxPJuO+/3+5VUfazvh+/iRjDHkrTH+Si4yvDu3b2I85hxC9WjyIgmO4DXpc8EZrt/GjNtatVqvNyFPOKg4DirK6FLzejdE/iBKkHJTN3+7eQgqyzgRete+r7ZzCHON7S+5zJ983EJUnGYBSipuVNwzFLoTRLK9IOj19rrd1uD6uhL4cRR7ibNh6mEgRarI8CKvkp+LkHvpDcrlokAFuu0FSngz34phY4xrqhYn2MqmGRuRaQVJki6Xq/5gcP7y5f7BYbPZajSbUIMxTSxYA3PGE55STQ7kbrbIKlSCbQSx4JPgLuObTBsoKFi85s8pSowFDGKouLBareaL+Xw+V2midDp8ZBoYhamDGCYMgqASVJqN5uHBYbfbrVarWOlOFqAThpVmVUjTG5wLDluVQkakMSSy4QWkTN9HEvJ27IIQQsqBxAYcrSwDeDCoeC6Ux5gDdQdqNsxms9VqRX0k+igRL+m2II+RTsR7pfZCyw0We/htnFjtojRXWftCkUaHlxmG4WKxmE6n8/l8yZrjOMvlkuAyFXLBopSLxaLf75+fQ13K4XCoAZ5ioIBqquu6qqdddFO1B0HlMUr9iuKF6Ca7GDh0q/mjyaA+crVWvf/g/rvvvvvg4YNGs4EJjbbDEpu3R1K0MAQd/9YzjsvHK78qdxG/34ZUL3EVnGGi6IjI722PW8gPuJlWeoGFE3NTkJQGsXg9M5chEJAkaRSGWZoBdMtxNwa8s3ADbXLSnubb4papTYHDwtTIb9+3ehIld6JE7bBkkCjfkzmGVL8D6u4YQiKYSXkwx5Ur6+MEjA3DTuw0i+fZyhqNMWiTZXBXFovF3ex+p9dzHCexGPIPLHywGlC3uOS20AvEKPl9FvmH2EvlGtVIDF0dQl4qtfBN2HwF94rn6vAbokGCqqPGjROx7GsheTkyUUMBWhSFy8W8f9U/v7jsD66FSC6PuGHxSbnKCTOobJyXPPpXLlnCJxQB99yb4ih4ccJWIwpPxiijpgmKUNjDwPcazVar3QlAqs1BVBP29ZvusBKLQKoovkP3T3REvnOjdsCufbtt5xDKRgwZWGyFcyIVz9hXGGwGcQs2rNEGKonVwUJvWrZjb9arJIlrtabjBe1mHZWXmDWGhScsw+ACHrgFKpxJbojxXDqx/5GYFVQLVdcIMa1v4zaUbX65gra4FtqsyBL2BK8fPFhmRU1my1olWK7Wl/3B8HqwmM3jMIyjyAbZHAftZCyJhg29DVILF2sAX5ggyZ5H5qjyhFDqpwD1G7AhbWvf8Npxd8cBBCoGWTKfc01RhIxIVJBvKmIL0LFB5u9BDl4AzlSj1uh1e1DSoBI0W02s9YdKMyxMuLUurQg2sueeq8CrOzYycU5xDgXkwX+u0iZfeQPVZEg8XVAJ9vf3/+En/wCIp+d9+umn6/U6CALUvfA8YEjymqEiJkLGQZE7mptZ+UmmIa6ljlwefNDvm/pa/b6G3uDVoXmxXq+Hw+He3t50Oq3VarZtt1otAgmRw4ZstNVqNZvNLi4uzs/P+/0+mKQpyEcxhQ+UtODWBibv+b5vyBQpMHvpllJ/6B2tVL0acVDvIX6fGMt6GF649zggsaZipVJxXffw8PDOnTtvvf3WyekJFloMggBGIxuxqmwsNWno5DEf1T9UY2FkKak9QvQJy239BUg1ih7y/QuzgPhHuVLaKnusNDgoY6GpcC50yV9ik5Z3RfFMHNfB7anT6RyfnsZxstps0iSJwhBcxvE4NgxgTsYxCmmCXqdgsHNqgyIQqvSSI3q5R1bc2iT+KccePW9tAOC32L4jnKE89xT/Q6uW4gXmql8IeRd2PCYOKiq1sBlkWQnDgjzfx3G4Wq1t23JcZxSFq+VyE4Y2i90sV+vr0fD+gwfdvV671XYdG7OagWvqGqjqq3HyFTII9yJ4oCof+JDjhT9v+XD5TVBybt+gzZdzETI1IC5ZjuQtY+0GsFug/qRGG8lrpPGk6yRJ4yhczGZXlxcD0JO5Wi6Wa0bBYKA6C89lWYLZzmiFiZJnmELDznyTy0ebS+k+Qr/jy6ryeJXLlzEYHNC2Y2P6o2lBMXpGHDU9z/WDIM2MZrMZBFXU9HJtcBS5atLWHvIgP2d1C5qduPe8XyWM3F37XtrOIZRN5lEo0VNc83k+N0lasI2Sss+LDQvUm6nhuB7EVPygt3dweHR8eHA1Gk9X67XIj2MUGlhVkEbJeZVyyxJbjawhpWpeF1LMaRm4AWfXrMmcrZkPQQkQT2ZTcFlkw7AcJ0nT9Xo9nc3Pzy+uLs4fPHzUaDaxNhnIqEEavGzImhC95l5grvvSSVC/J8JwckN/E9s315LhdgCzgREhhMY0RXOBYQH42IbNZdGEwYEOHlftty3PZWX9arVGq1Fv1BEeVEsalMwOUXOS+kOJbarNLXFFwhgLoI1med98f4qkQZW46Hlep9MJeKG+oF6vf/LJJ1eXV4ZhIHyKMjN4CsQxJFQlqgtuKxmsbsxqrXath6o9UWad5wxWVV1Ge19qfgo3Dymgo9GoXodnZNv2arXCaoS4i+NT22w2y+VyMBgMh8PZdLZarjasRTGkM8nCg6LwvZotw/qtUH0K8GaRm1c0WRTbugT51IRz6E4CddlzT45P3nvvvZ/8w08eP37c6XQwaZB8fvX4r2zbEjvzxhYWlsiHsBUg689tPefgBMWPlT6hzFbnnPycBVZEwNTvqG7V9iRJjO5x/BmrgcKhGo3TsztBUPGDoN1sBZ739KuvsiwbTiaQ2opS1UznFk7NSKT8zqvep6jDxC5J6H8o3uB2/1ZeF9jg+aAFYXyKeS8sAGUcIjyePyweWTtpiSEuB7a4c3EU4Wi2HcfMgCKL5RyXy+WzF+ez+WI8mXT39kaj8f0H9+8/eMASugz4MswC0zJdoXhVhheJVxbLYcyxGPBndA/4xYn7Y2RQApF2X1Wg8m99C5bOSdlYQlhbpknTiMpDWOpqhqGMFOigUbjZrBbzyWgE/IvROGS1nVKm88ZtHIE98IfEHTP+GFTYYduWVwhgqb/ALwByzN1aMc5zyaj5HwrAD0SScG7YNkTZTMOo1arNRqNWq1cqVdfzXJZkyJbmchnnnHwgKzPKEUI5rnTOXc5f3LXvvu0cQrWV5GDI2ulypgHPJTMNS7DESyMiaEAAkg4Vupx2u3NweHR0fHV5NVhCYCiMIkAewHaJYpYZz/YVdkJe9FRUPII5jNJkAkBXLUS+//O+ctKDtnbo15mLgm/JPeTJlCw4JI4GScMgvZg4YCBmYRRvwuhqMHj27Pmjfr/RbDmOy618UFEt3hBUPmOmswi36esXiXwLwBMF2d6cQFHR89E+et2jEfEPFSKjCDIGwVeIYUPilq6pDFrIbwG7BymdYHigaC4DCVm9CRd9p3q93qg3AKVhyKBanaI4pohsozqoFODX94AitVJIPlAYV3VCbmj0BdVZQsd1s9kgdxQcWhcSI6vVaqvV+uSTTy5Zm0wm5Onh1SELkXNHucq27p4Vob/cnSl8p9hbzdMroljacTQ323FACA5BwjAMJ5NJo9FAkmcQBHg5+CjpPiwWC6xIOZ6MV+sVph2SZ0WVSDiGgIpTCrG99FqoS5qErIrO0f3Rrlc+ZWTWmXA6ExKY4SB4BNd1j4+P33333R/+4If3799vNUFIxvd9Yqiq8iQaMFvm+ZQ/i9KP+HItOIJ/8QiKhA62KRhpTT4E5SAcdVQgxi23jlcQxMfAZg1LjgLqKAgUe65bCYJ6tVqrVr0vv8wMYzKdZlm2CUODldDEQ0PCuhKlog7xBYK5KRmjcqs9VpeaG69OmaT5i9SwROFSl7LhNHBR/r74VW0EgkoTpFewe4paVpj1Z1nGZj2ZTjab9Xw+P5hOgcm9WDAH2+x0On5QcT0fLRMd3lTOhYQ8NlnEME5LFL61n/MkTBAr5RsDf8TiLvy54x3fSZOZoEK0VsGcuSQsEnzx+ypvhf3+BleZVdlkpZ6icDO8Hjx79tVwNF6BkAzhtFkcswxtJV+PLFGECfGs/PuEFtziWWibjsLOkDqFdAGED9MI4ax75XRBAAusbdvNRqPZatcbTdeDtAs8Jgady9dM4dtSEE1G/EvSoG6+q7v2nbSdQyibCPZQVJS1QtwxhRQIiBWxOCOJ5ulTAPQPbDuBZADIHrcd9+jwqFH9Q7tVn0xnq9Vmvd5kmRFFohaTWA1QXUrsRVxVJktTRPrJkFJNTomnsV6oqtLiIkTnWeSV8E/yH9XIsUjkZXW6eXK/YO+IeK/BuA2xbc+ms+emeXp0ef7saa3R6GTZnts1BcUu56zmmEjSaaUFifZ6eeeFPPdfg8n1LbX8jqv5GNvjf1sbbuvg+LEYI1acXy2BH2gC78hdrVYM87OjNEI6R8KMLELSyEu0LAucJgeolZ7n1Wo19Al9z3c9Dsuov9oeg+AbrcoC1TEiNcTOxYfAQaWotiplefvi9VqXIOVVSOk4jnN4eGhZVqVSQXdiMplEEdTnwP2PS3EKh1DWSzDBsCO1mCI4pvVKcx1L+a6aFKfmWWlOIwGtquOKf4IWhW3P5/PhcGgzWxyBQUSIsVq9ZVmIIk6n0xVr6/V6MpkAnXgDUkMcNmHp0MVswGJ9mqKFqj0dDRNWnyNdGqeMirsCw88G5kEQBABQM5FboCAeHb/zzjtvvfVWs9n0fBiTJGdKuaPaIyAgdxvyrH25DJS+ibL7F9KUbQFaaUwB77c6GmlbkAuy+Ej8qeMJN1w4hUswAoCgruf5rXY7SzPHsqDczWazWi4s0xxPp+gKRlGE2x6TIeXQdPEq+CkoB1+5UlFuvbwz8ns5KpAIieVjE3rkRlMvFYZ6Ph1eDgn11xT1oIRkcHTZxo8RnMw04ySJYXra69Xa9/0Vqwa0Wi7X6zXA9Un88OHD/cND1/UySPrdmKbpez7UfBLywvnFR9WJFWuvmhHAGZLc6EHsSAa8lBxyvKtaOvffRpMrLUkbiA/gX4Uvre7ClMWwbTtm6B/PYQbCWJKMhsPRaDSZzq+u+tfX19PpFMXMMMKiqivzaKlqHDHggaxR+qaEzZVryfdHuF7K9GfPGmeEKErBDyMeLq5yIlmAiQbbmBES+B6EdQAStNrtroMKUkZmOy5znrdSRkWgWNxDJDWTxoyaSsh/oPRn176XtnMI9SZBawkI5orS0OxSgytlMVLTSFjMhJlorueB+vbJyYuXVxeXAyzqwGYkt95wOcpFJvOOE+3JhAHi27kgDwWueScKroUIgBUvnPtvudVGRkRxd6HYDr6F9Z2Wq9X1cDS8vl6vVohLSDlB3czNEZkUjoriLiosJZ5qKFa8vyRz6ztrio9UGsX/Ggih+poLnSXAy6J6R2oYHgIZGZCMEBskQ4rngLFiErZtVyvVWhWKvEM2YaWCrgUdaptDqMNfivf7Sltc3RiKQjVb9sKtjQxZgpKwHMXJyUmlUgFZ7UolDMNPP/3UMIyQKeOTD1lyLUIXsXj2XK8E5qVaikU4MWejbJuqZYCkzLnCIooM1kPvDr1cFNRBlBi5o/j91Wo1mUzG4zGyRvHFer0mcVFSjlUVem64saU3oegGa84zjQFtfWDIEsjbSrM+hYd1fHz8dz/8u3ffeffo6KjZaqL/gJevKZGqPVF9bBXg1Zy6UkiWFl3tef1FtpJOqhci/AH+ifIdxnkpG3moppZbumWWb8k2SMeA7YDnF+H0Sbv7kAUKf7tOksTZl18mabpYrSieySVtM05h0MY87hJ8w5SWuZoXp2h6KOuSvCxF3QK9QnWsaHFXPBu/TboDzM1ZrkYi+JXcmSwjLUvnU/yNBWMExgLpFSbzKADeh7IE6w1TgcbtF4JyjhMnjPjNChVgrITd4PyGi6OXvYTeCFQfoULeMSLxyZVMbNApSMWqfS4ECv52GrdAhOyJvrrmV3iiXApho5LbwflcjK+L1SbX68319fXF5cVoNFoulyCuy0esxGDFaE9jDFrlD8mVTLFjec0IsiHFnzfZS3SVlHgkcGD6kbJWK1OIlYswofKE63ba7WazyYQDXDAKLFsUG9tyYq1GocJCp4r0gkCq8ttv9/x27dtoO4dQNnWVYzNPLpM091D1U/FqRKXXLZOAoumMJuM3W529/b3m+VV/MHJsOzJZrTMeHOJ54HyqyP1HdKksUILrkxolIrdQ/VLeK1CgueKaIaLD0iujqUvLBatLltk8ZylOkslsPugPpuNxZ28vSZpKtXF9TcsDQYyRwlmpdJmqlfIXFnX/M7VS8cNb3hgdaMoMTFrgNRWEy49RTNhtTANy29WUGJEnB86gbWOx6WoV+F5BEPgBwIOOzcmHN/VKxDhU4VB5EvFDJAdqb25rN3jON/8Kf4gIIbpJKCGDLEp0AlerVRzHT548IZYjD5MIfEkDvjTLm9IylRtQ7imV5gRq3ykyu9TX6m/R1UeHEPGW1WqFOCeSP1F9tN1uu1jTjAGJI9YGgwFWqlgsFpvNhhxCGTjAHBEFhKQyHsWHonav6BBq16sBxeo950o5rHI5mr/guh+fPH70+J233znYP8A6KPRNAm+L6jsaUq2FKrRBUuzbFl83b0r9BTfN2dZIv2Vwn7oPQMs9MnHQbT5CcXaw4eRkHggCsdgKlEgJN6BrxRARNAn5eAYOCpPoNFkUBs8PyIb0zrSdjq1Vtgi+iGVMv+ryEFvJk1UQmNe4x5KYUzig7hyKF0phG2Dno0ColSRmGKZZhgm9tmOnTJ2NOdJmvdH0g4rvB4xHDWzSbRsmPmgAqZhAFDJCZbBbv2xlmcrfGCHzlg8E/DUM+1c3zAniiakcoEN2kkwX16QuhRG1dWhwAxG2iSiON+vVcDR8eQ4SzsgOY6wT0Ltm9ai54pDYXwryCnRWVKjli1jOcyM3Vixx+iImI6viDS06QR8wFJn3hl0/H51GmpnVmu+5zXqt0+1WazXX9W3LpvKepUNC3EP5QnVYlQo9Qmf0NUuo7dq31XYOoWw5bzCvV6ZCbqo1w0MmZZ4P5lGA9gyE1YEyGlTr+6AV1gyCwHM9KAnHABtTaK7wjJSC/ce4JQLdp37Q7C1YKsWplP+CAOjzAVH6qvozwYkhZ5QtmqycHWr3X/b73VZruph/dX7+d6sll4kTKB+jJRRNJQV8ZfeA2daKvipX8OG9/NvZdW7RKB5Jf94gdHGbpiEwCA+ilY+aHOaaD2YqTUEbCyCEJscJ0UrAIoS2badp6jqQcQeVwVnlSQ0h1Lshivdy/gySP/Ph59xX1UGrxP7VUhPqb0uFN29zt6UjytpmAyysWq12dHQ0HA6fPHnSaDQ2mw3ndDGEUEXhKDWuiFJq1rCeJ5kvfV7cSosuX2n/NXeFusEI3RzMNAyj3++jj5emKUrIzGYzfJT/H3v/oSbHkWSJwqFT66wsDUGCIJtkd8/szN69+3b7fv+9u3fFtCIhC6VT6wz5f+bmbmEhMlEAyW4Anc4ZdFZmCA+PCHc7ZseOBQGo208mk+FwOBgM5vP5er3G6oUYO6UrlQmlyYuSxQ9VBRGkBXJEx8NxqbAbJ0rxG4ogMw5FRppTcHRNx/zAcrnc6/UenT169tWz4+PjVrtVq0OGJOa4St2jZBgzJWO7DSjugIXZ1Dt2OZ9TxISWNh5+znVq8AgE94uy3zGOlCbU5Z4X67AHvg+3p+C4nmdHUaVWOzjozSaTm9ub5ni8FAxJ13NJGxZWPqjULWpfwqwlER6K4MteyPKBopo8RiOJISmDIArZhOkZNRUyxXVLXjD9JHfmg6jwQApMJqe/VJgxdoUg+Y89fihDGWlaqVSS+pYiPAhvsefZlhVG0c3NDVAVAFT78/nsydOnnW5Pq0P2hgFVPXSVLigL2XOlE5wzEf3DqixjnvF0kVjoFZMU9sZgZSxxot6dLwkN4hOlPsbGSRzAA3CY8inQOGw7pFhqAyjz5PuB781ns9GgPx6Pp5PJcDSaz+euu0Fvm8gyhE8J91+MyhPGGn6GtCWCg2k6iSydpi5HRiAl7z9hqdI6lfZmCiK2OJmYScW8CunZjmPXaxVd02u1SrNRN4UjWCoP4ZhkByLpW1bzD+ldxLS2WDuCHka5/5fymH3ybQ8ItzfluIirz8JMTY4WSZ7ZaX3SfKEXHFuLKo1m5/T05PDNu5vrq8HQgnVP1yOQDoOJXErx5kT44ig8vsFMJi6xkJO9k3c1OWb0tl/l5XPfajLrNxSxQaDIG4breYvFot/v9+9ul4t52O2GUeQHga0mr5xRJacyQj5eh1D5rXFnxcf9p5kUKEknyieRfkRLm79iwk0zPJXrV+zA0jnRNapuk0QFIpnQKUA8DcX9SVEmt9SE8tfHk37aAGVu6axtKurAqG/oQwYmcXv0g0aMyvFpUGwXlFeiKDo5OfF9fzqdYrodl92nlVtWjspEkHJxYL7nnjzQW2KDO4zsHRFRyifEf33fXwtTG79Zr9dYn5CEYfHPkTRT3NlshizZrCgLj0PyC8foMQFC6gkvK5LFhLtviiLRyQgk6qaWSqVmo/no7NGPP/z4u9/97vTstFwupyBf1ivBoXI2Qsj7s+M2kbRJ6iH/XMziGAUpN6KWijLwfB5hJEtpEjb9sixfPJby9O/kqNGgw6ohVlV4zYRRe3B8BPXZfB/gXBjd3N3D4yrUntAf4WteCCEtRemU2bpAnsPlRfgilHNJqWLG+jexTkdcSGB7P2ky2r1paj3KrHGZ15OmAorIpH4FjQDhx0ksu2KXQHC85/PQ8yC8P1ssZrP5eDx5+tXTs/NHtXqjUq2ZhuG6G9t20LYW5NH0KQwN6khhhj9cgXD1wWcSxJRBLSWXwlYBzuITa4K8rZ/Lw7+rEZBSkEbm0VJwWBlg3NPHdbBzDxq7CzUt8P3Vatnv3/f7/dl8AcWeQNMN1ZsxjVTsgzJ+0LiHlIBfbBgkyKLpU0twm3kvs+7a/M4ntiGdeayzoemBHxSLxXKlVK/XS6UyeB/ETyKhJAchp7pH4X2QZVT9RFFhenPR+KPebBnhffv12x4Q5jZmorFFlB5WWYCapovtB0JftUieAPnNYqnc6RwcHx/dXL27vh2tIDiTZOxR5T8VGpG/y38zofTMMixXcvYBkyzS+nLJbqdXL/k/sTtJBm3UUOAqEvm+CckMYG5OZrPr66v+7c1Br2eaNfQch1BgJ2k8cfo4JjTuuA2MSvqFrD3vbWw4KO8//c2HjEYc8lNYjoIwuAGtbiziHO+Lq5SSWZPnhQr1tuXYAAhp+139kS+PfKYl/mfJKimDiXvxMa0RMyeyXgw+LNkAzgdxR/nI4L+nJ6fz7+aoRHpxcTEajXh+LIIrJChyQUsOSrcBDD68v/ypzrJJOWzDsDDVF8HKius1CBhiVK1QKCyXy+l0ijgQd8f0QiSa7sCB2Svdzd3l9zf3p8QTG8KtD0XCExSaF7oyjXrj7OTs97///Xe/++7k9KRcLqPzHip3k2Ru3hBxedJsSDD1+L33Qvhe2ufWEt3Gu6YY/HzRo88kwcgbOfkf4san+4Lld+GDyPM0he6oFmlCyCq0TLPgFIzr68l0qoXgVfR8T4ObKwpeh2FcUhLBOZ4aJJHjGYDi0piLJdYZERlUfimpY5HppNok36OavfZMlIyRRZn3IcXRyIam42+UE4cgN9/M833X84RAub9aLheL+WwG7qrj07ODKKrVG1AEmBXU2DLzSN6NJmAgUd7JKSLxhHLTqZpPgn0bB9FU3Coz92qfYSMqI19zeX36+AbnB9IzB2SxZfRrrFfLQf++f98fT6ar9YZ4+Fh0QmguqR3k/1LYm+oQkgCQpPLgmWRv0kkH/CnG68pOjHQtZDamnWjiX5iAoZOGgayTMApLpUKj0ahUq4KoL0kceKy8B4/ERansRCK6kNP2lNF/UNsDwtwWvyKYspCIbCiXiYQrlESSPQq8HsLyNs21SJMolKq6bjRqJSgmZOoF29Si0moNuFBMEVLdkVLD6aAqFq8kYbJcn2SQMDFvkQnO39WkIRM7feOQkTq28hrS0o8mJig3mKDz4LrucrkcDvpvXr/+v/7v/9swoQyx77mR44gLUjLi8kRkdlC9Gha3TLrw1RwNvwiWzWe86nxQSwRLk9/gnw8fBMQ5CFoIt/CwXmy7CDuKzCniB6bqg8dHRmqe0DPggbvca+FEUHB9EDpVD2dq9xTkyMrPbIvwZBXhHj7g/FCWZVVr1cePH69A6ALE1kzTRLxEGjNSDjEp5ZKCZKkr4n/yevf8+xT7NHUhKdbltp8ohokphb7ve56HFQiXy2WpVKrVakEA7DLXdefz+Xg8Xi6XrtCu8EUtOPxVVVWWWIs+0A1CeMz9Dty6ksiOVZ9P2cQ8nsldFXhYZJ+ahukUHKAoV8q1Wu3w8PCH73949uxZu9uG+2KBeio4KRR1OXtzOVTImuOpDMzso7jtvfsc0SC0LCRWFybcknJOxvAgA33Zw0j+ghxMFd/AJ2PbyXFLWFjFUINeca12eHwSBqFpWlCRTdM8d6Np0WKxDKPQsZ0gkMn2FKKnJwo1uuMrgOo6mIuPKFBFstIuNpGekcHz2Rsq42bboT+LqMZO2EjU7E2wcmHCxOzG/McGTQt6VjEnFt8dz3UxmoqySTc3t7PpdDKegkIrJGC6uh5ZlqmXq54HAcZisUSuKxm1oQeYsL9IVOSppCT4mM0VjJXLVWFxZeZ/mAPu02x8OoLkHRwB/X0x3u2XjE+gzIrV9Plsvlourq6uX795A1ILs9l8MQeVIF9WtcUooqxErcii+JxCFxhZVxwdc3YSEyjv1XaDNJcEFnvpmdKMnIdFigQsfDZMsxZUZyoWK9VatVoul0qNZp1iJ0IvN/G0Z0MOhDDjK2VDq6xuAoz/NKSwT6ntAeF2yp6omideEVmBmsh7bA3N8azwJl4qOIhtFzTNsH2/0Tro9Y6Ojw5fvHyzWJiaHijTx9RAMiEuFcTXIPaekXp0foyIf8ndfimvZz5FjUc9cw4eG3BYkBCTCcF56flrPxgMB8P+feh7kHogfgLJypTumQLUdI2pXtE6lNwxXna/7JZy9aWIOqkCuA9pidVaMEWRJYh2M9UPEOeOd8EbEWoh1iOmdQvzDyF0Q15JmeYu6qwIzc7ci+LAj5wWkncjjyGvNFVSnK8LuYgxFTilS/igpyW+HNGIAdtqtb799ltIlSwWC4VCGIZ3d3cg8eeDhZoCgfxDCralbIj3htH4r9kr3bZvCkzyvbAFQbDZgH8akyERR6GCDkYRkQFLDmyCczzLkftr8JhU3SELhrl/QfYnAUByXur4oVKAEyWLDNMoFotnp2fffffdN8+/abQaZLWo6887GoaIWBXE3QHA7DO2Y5w/0wghpQOov9ijlVxZMoAxOSb8J5ar936Wl1Cxl5hTGL6VsHb26BEK/NbKFV3T3l6+Mw1jvlp5rut70rvB2arb3gUWOuHfsCUvlrPPv3fJaA2/WqY3nlmCEy+ASsdOHpf+TtCPcv1HAtFJuxlD28i2hVwMW3c9bzKb/fzi5XoNBaw0PTItq9OJyuBx1l137dgO8H2VlHniMhQPGHysihYaU/q5Q4cqsCuqDmoi5PI1PjsLnr/CWfcitze4/4u7tN5zdJhyIGPf3awn4/H93e14PFkslz48zSKhVSTShyI/VnhJME6ouoBniKdCOqxSqt56bvke05+pS+aefb4Nv6a4lJFmaOC2pdGITKjMVKzVa7VavVgqgc8OnzK2CqReH3IxkIYVL+Ka2XzbN/v2m7c9IMw0giyqNoowd1OPr9jwoceDZppWGIC7pVprNJrdXu+o2WgslhsviNwNBByEukOINQhzlNAYM4de39TcFMsQZwPutES9r6vpK2OuRZkHBtQdOYNCjr/wpwFOiKLRdHZ1fT0Zj0rlim1baIoZkag/kRk5LtaqnNA4QWM3Y9ZMcvL9wpEhF6JMoxocLiZ99uAjqhigBjAALGwMD4oIbVodVEn38ULMmMUnkt+FM96QZQnlaiqfhxyzJt0LlBGSTmZmlcpkIC3HTk1UUSFoKDP+E6eIeWIJ0YgHDhReDkFlLM9QLBa73S4GVDF0ZhjGYDDAlDzbtqksIZkXWe7oQ2BedvtsS22c+iaV8scdvRQ4xUIUWFMRCAuFAhWmh0JnQiYKNyZAyIc3N5CLJ+XAjIPSlOiO+Fk+w2loESVjvGgK42cLvrctG5RFnz37+uuvq7Uq1qU0TBn0zqryKNeVtGziSHjW8N3JHX3IHfwyGgapeHIArnq8sF6azpUkg6nSCzGZLXuWOClU2K1hEJiGAQnJoFVsgYkcQJFbTdfu7u+At6zprngYMGXXNAwhwijPIByuyatI5F/L6+Iy98nb/WDCmkp255ulPtDSJZL0tk+GMS5MnkFRRlXpFNFtAQXlgUMjgBcBhKBWq9V4PBFCO6FTLOq64W7c4+PTarUmoGOIKV25qZ3q0dVCMPZlkBBXVsB8VBQu8fqr/1XkRQN8wvnvjvaZtJQDkaLhuXfuQTgQjyaeCVBiFwnci9n0/vbm+vpaFKMXExq4TuFYUI8eNJNkREwFHhLCaYTExB8UPUtfCMYnxH1NzVIx2UsB3bTHQ0mEMqKEkDjCPYwQk07RTawVC06j0Wi12pVK1bIgjp30Am8nFJDTgfKQuLWDCz2aH+ix2Le/e9sDwkzDrGJh37J1DRdJ4nSj3okq1bpzEtQhj870XA/deMVCsd3pVivlTqc9nS02rrcxTS3UfM9X730U+HE9U6UzHJcOVX2RL3oSsolNyI7HWSZj22W6mIl1svlD+QbRPhDnB14FljUFjgWsDVDbejF2rOHt1Xo2XszqhgkFiEERWyzhdCLxT5x+gjCCTpCJuMotud32Ga03H9OiLcHepLX98EFAyhAlvGH4q1KpQIDIAZyTytwLIwgDyi/x8UZ1PjWbQyjJ9bAAAFUyRGyZo3+jSC74KyHBxFUoczMFb3Jja3Sc1PbZx/sjStWnMBUudThcnU7n0aNHmGiH9Rgcx0GJTqi8IqQgODVxW6ZcCv6lMMa2oEf2QnLnHF7aODVoFOWj+pNQ8FqUrUcSKcqrcjIeP9QO2Ruq5cgfUc4UzQInfplxQFiVOoyr9ehGoQiQFZmuzXbz6PDo+++/P390jtC9VCrZlo0QV1S6y3c0E5eJw8LU8NJknr3GzyIq+HGGOI8LKIOYhVsViwztSPLQsbPSqaUdim+3gvTbz0vxFk3zxfyPUXfLcaqNRrd3MBwOm3et+WKxWm90gII+OF8oC9T3dVE3J3Z8cMEYOXFJ32E88agHMxX0pMc1PTLb+p33BZ+JcCzoLYpLgG+ZqdTyi68DEIVAukPUBkKHHfpxSqUSrubr9cYUoseT8djdrH2gghchFOUHnuceHZ9WKzXh6MG3UnJHeZV5CW9RM0+SJJOxMhXgTF0wLSXJojuSVft5oUG+grC3O2HypVDuQy7QFw2dqWEYbdar1WoxGg09zxtPJkuIeHuu64GoDFSuF7MxxICVamhc3zBli6moX2yOEUqkvqXkkAgN0iPPr1vNt+iAULou+AwAvVn8jtWYTMtyhNyaAQR9p9Xu1uoNp1ABvhE8ikLnNhF+THgi2AcMq9DrQtry8qmTB0gj1n37O7U9IMw0McGhrJKcEUWYUE58LJ1avkkiTXDHwwvucJDlMEQGN9SfqNWbJ6dnzeZfHOdW14EsGvkRRFwiocCG55KixiyXjx0yl7uQsizpwzbDlK43W2c6l4TO+S6xbSTIo0EYloqljesNx+PFbNoJAtOywzAAcolQJU6OT2z54fwrZwal2cM9XiruiZGFzz5d4b1tB5Ptl9ijNGKO4xREKxaLpNGfa6agdQiPmqgQIbydsHph4QoXZNK8QCSJErsVWaPJEydSIBJxSPk748TSBSb1ZugSEpgwOTJZ+cqPfkgoKYLSlgzD6Ha7lJKHYgDz2RwFPEmRPIumskg+9yfe7ew2O8KMu/fdhpPRasHq7WjYYTg0hWl54l8qPJj6N5XBwm2p7N3hu6TIpXxHquCKnYRCIAINfv31161Wyy7YEABB5Vv2MGUvn7xj3H/HA9Sxs2/LqKZMw08TE37k084cgGnmheSKJ8iNKS8MjSrNz3LaUEvnjj7RmgThLFGuXrdtmGzq4fHpmed6G3fjeZ7nulEQbAoFKFmh+MyCXBevQbgEg49S5cHJikay/rrMykeTdxeLYec9zc4w2/bNgMvE27EdVDBDmPnIsCSVeGc9WfTFtHQxFRu6vvH8yXz++tXrzWa1Xi9ns4nneYeHx+1217KM1WrlOI70CiYZfTEYgBoDagnWRRFY+Ea4aTBlJnm76SrEwkEwSumwfFaYMC/XYNsM8NA1RR5O5MwANPS8hcjQHo7h1kDGBVZJJUYNU2ShQyjfKXcPx3F36r76fz4ppR9ivMm843w9kT1h/n9q+NgSkgQfqGkWi4VGvdpqNhr1RrVaLZVKFiiTCZJRJjkoq1SqkjPlBjIWIKtRJ6HgpzW//rO0PSDc0SRfUdJGE9/LxhwZOwj0MJtI/Q0jtCyo7N1otg8OevX69XA03mzcACXXDDMElVFVBJUwkzzZe3S9+Qfl52Nsvu3TmVQVZt6apGUQpVYCRgbTAlilNM+NqrW67/ujyezu7rZ7fNYQCVfSTwt4OMdeSzmQlOBznHxBxptMWsi6kD6ftefjWpzxn2wftO5yjwAWinAcpwqJ4WVHNOB/MiDHb7GsUWGCOyMMAP8gKJKAUKxv+CVGFw2oYLS9YzJmvWvql7yRJORLDEiepmjqej/62aBIF0EFpIlWKhU0Rkmh5+7ubj6fr1YruHYLEkF8HfSTUM6BI6tcvJq65J2WYvrSsmOSPRrfPsWhxS4hIESUi3thnJNv897+bMuo4Vhx20/8wlNOKxo6z/dM06xWq6cnp988++b5N8/b7bama6I2t2BPqDkie5n835ixLIux5d8C3oFEdmJmqD+1mecXe8qIsU82vXw/t71oUgA2UZkg4dkXI761MlMMxdUHGXEqlfVW5Ptnvu+tV6sw8A3dgABZFPmK0hwEgcUkjuRdpqhHLLsP6AZ9ssqih8J6fHZ5OLDftSWLDeYPa94DlhiTePhpeDDHOxZlhEiSKBshSkfoPlKvfT1cRcPR0PU2G3ezdje+7202G8MwO52upoEoFJL0cp8QChLJBHXw8LIS7GDipycTfgmKfyg5wMlA0Kfuuo22zJDy17R66oMyJPlY+VAjZLNer0bj0V1/cD8YojEGMkiYaRNp4FqU7C02sSt+TjJPKPk/Cagov8kYCnTMeKvcG6JgGbyEuFvIFJt1DRSqTccuFpxWo9btdLrdbrPVLpbKguOtmcDbz7FSkj1BS4YbsbGWqnxP1Qd2Vfv2d217QJjb5HvItT3YeyUeYWa17jD1sAmFTHBiWqbpW7Zp2Z3uQa/XKzi2UyyZy5UhXj/DNCzN9DxR0UHYbMrBg4TzTJCOmWMJuMb4UfGGar8cuVFVyJSkxZmmaDzdcH5XfMmglBiZpj4ZjyqV6uXd4M9//svxo6e1ZkfkSEc2zHpgOSAm3jXoshxNbH+Q7JVCrAqfyxDmlzlnpMl1TGDj4yw/Ts9DZmC9XodSQgIQQoKcDaFCvK2oGSNXLBzlKBZDx4ASFObzQDVXOuzJ+BZ5hqaWyBqVNZGTnD35QypKk3eB2z6k/syFhR83YrFvXomy4hEKhUK3291sNrPZDB5s2765uYHKeOXSYr6Al1eo6SKywnrDKeG1rM2Rm/SY6sy2C9xx2PQjlESDdIHSV82+TwReGAd1RxiQR5hTnaSfUgZiCijSuYjVjBzRUqlkGEa1Wu0d9M5Oz5599ax32CtXQWjUMkH1xxQCSSSMlB2H+BQsBChrqLAnJ9WrbVTe3NH+RNov79WWxywtMhy/yyqpKSZtCpVRtGilK0vooaBgBg+UJZpkc4INKl63yCkU2p1O4Pnz6SwKAkMzAqhW70HW+nxuCLFNPwgge5C0RoVOYzzXiT4J15SEmugflReSYdDQBWbBT/ZhyPfHZUNLah9+BH46RoigvWjvBP0bncSGJqwCkQceBH6oG97SM03DtizPdZfr9WoNVPblYrmBiudQEr3ZbNk21I9BcjvmC6jIT3otTnjZhPkhnco4TSUtdKG4hzMJ0GPlupzUw/w035T8XFM29aVmKtqAZxfnHE4GBYEtFUDFlDAK/NVi3u/f39zc3vUHUCdkuXQFrUaV0hSVIIXcK56W0CBQzmKTjTLw1Tfxv3QpeW5j5qlgmJAjw1gtI84dFVsIfVoDqtELCRnHdjqdjmOb5XL5+LB3dHhUrzdgAMPQLBSiSDNVORl2amm8YTCCR0HxtZTPNZdSx7lgjwX/cW0PCLc3ooxiITQpNyr4c/g2s+Jt722GrqOgNhT40qJ6o/XkyZPT0+PRZLpcLLDyLEt8wg4wijirA5Xwaal0+RQCzDrd1TWx/lJRmDgMx31SSb8Ut/mY1QhqMmakB7qtW57vTefz6+vr4f1d7/C40WzpmrbZrG2rIsua7hpsSXhQTmXk/3CpHLV2gtkhr/iLnzuyobCPW2XJoMf6cr7v1+v1Vqs1n89ns5nMoSJznz1K+I0BvmLdN3yI2LjmerOeTWfz+Xy9WcdxsG1ZWDwdgqR6ySedYAgnLjkXDe4eqK2r9QfGVGnEEGyg8ootGn5Tq9Vq1Vqz1Xz9+nW/39d10BbH9wh1d0QCUFpoZxvq+9C2g7KYtVx3eMFpm9SMkSu/kR0cwm/ZU/Moa7aMexZb4vax+K0YeM/zKuVKs9E8Pzv//nfff/vtt8cnxxCqFdMuQu4svMwxu5mfPRWf3O13SD2Hn7iB+1s0ovQrh2Qy1k1mn5qhYzFhPmOr3/JppFILA9KWkDgKglc21C7StKhaqVTK5XKpaBrGbb+vRdra3biep7tuQKHsMNSU70YH+Xu5dsS3Eo1q2fJWjQwmTN1x5TTle+TNxsmlmzBq9kTxtcsvyRCWO8WhFJl3FeNG5CwYYJPAWAdBqOuh7wer9frm9m692YhpWbMdWzf0dqtrGKbgjhYEipOzWeZGS6cjAAMx42shMEIhDiwoqzRR03VItwB0QXJH0TXN804/l8TCrMQuS62PRZXkhWyxO0hPCHiiEBxcLRfzyXh0eXU1GAw3LrhQeWGnhC4am6ViT7w0yBJhgJxJXjLYtg2y3ByvgM/wcTRSHTFeBsIQkwiBHCSu3/e9arnYarbOzs4OeoeVStUpFIQ8nS0zK1LB5+RlxESvHAErooBhLve+/cPaHhDuaspqwCdXPc8xFkmoNWUd4YlDCV0pkOyFLa1CoXDQ652fn/cHw8lk6nmuZ5m+D46WEJZFeXDlAY0ZPLLx0F9CwS/HTCTfHf8mdvKS8SfXA3lJqXkdjyyqYiSMLVB0AEeRZ0Pue7DebG7u+5eXFzBl1Orlas3SzRCqFAgP50OtW+lVYkQCZdlJIeQvnzL6HqOfhzy4szkv9EEHRFdxGIaWZdXr9YVoo9FoMplgsAUy4phzgSuswPe+5rlA4fNcb7FcTGdTwITrdbValdGwJP5RnWNLVV5uAF3Ojs4/ZJS20UdT4bIHwmwcK6QOIpcSXez1eh1T2qrVaqMFeRSvX78eDAemYc5mM6DRgo8YlnwzMgOh6JDChLno9z2+m0yfd//Kh5FfeG4j+JQqzLDj1AQFs6G5bRFO/g0XocHHjPiryjKDLCbLtBqNxsnJyTfPvvnqq6+6B91SqYSudYp45N7l9O3O8B53Oxqy2/xCAP93br/EBN9ysTkmsKCMyqLZCtMkZm25ViprFO/2jheN3AEB5OUalVrVMs+g3Iuo+GKDrIVzO7gfzWZwgVHkimgMpNiJUD7SnfHRVAIzCZHkGJnKNZFV0lNLJ3l6RQhNvguyGkDeCKddBupTUk0xcbXJNVrhR7Zd2k2RmC+gH5K2gGIDhqGJF8H3/c1GW8zBjeJ6Xk0UDY8izTLtZqOl1FhlxH5bgifhCmCCGFRzCNChHE4SlVWhJwZ+KcwV20Sp4fpE2lY/l1JPSC8K/FYqAar0MdXI+r7n+wIPLuf9u5vXr17d3ffni6WvqDQA6UUwHAw8cS+4h4WOBgHh2ONCyYF5K2zsl8nrWOzYjy8o+XzGF8chq5RYA9JQaFuRZRjNJszGB4dHtVrDdgq27WCmSSLKnRpSVdKEsDQRNNjkkMgf+fLd/J9w2wPC7U0F6NGGwTdSLSSqOgLOfeKxBhFt6RXNORZGRQzDcF0X6k8IP2i30xIaelahWIigDu8qlPU9hdtTEAlwX6hym+hVzGElKb8dDiJOkpFWnUKzLHEw4R7DPekQjPuaMBpQ2Vo3zTDSLBCoDK7vBz///NNXX38deqsoKBq27XmuYZqRrtsWYN1cCzLDKmQRUQULQYxLaGZinz8X7+NHtx3WKiVEZfHGts9oeGFpdcuyyuVyp9NZLBa1Wq1YLNqOHc7UYqBWN55shkcIQqhW53ruer0eDUfdbne+mJfLZcuyisVistosnTvRecmAUSvIe0323W0H+Ek9Y7l8MP4h11RFXiVPJ4N8QqiTJvKXDN3UTSzfN5/OgUYLXt/ICKThlUbU6gh8NBLifslebWvbona7990WytuNwHmsjxM7eWyQjr+NlUA/EYmUmMa8HiZybuFZKhQdx+l2u416o91un5+dn5yctFuyDH3BKUBpQiaJlHuxuYOffkF4ecy8kfzs0OCHulS27b7tp/iVIZIazRcqZCjfbyrkG7P9d/lfIlWeG4GFruuFYrHR6QRh6LsgMjNfLNfuZrNxtTBchIEdWZqoy6eFoc8cCrGJTTcuAbHU75LqIyEXTURcsk3md+Wb4OkLSQWclXq2uh1xf2JEQYu4gtIEouTBoJtCcUe9MvLc4KKKtFIZ/CORpnm+jyUKXdcrFAthGP3008+GETmACYNHj75qNtq+72OtIAwwInc0UzNA9lYgAXmZAklKO4RuOsmEqKGIawUQdzTOhvvEUgpTM1VuUrpKTqaop0JUAtIkDie298UqIFWXdd333MFweHvfv765u7i4vL27m8xmQLAR8l2gyyZC2+oWJNya8t6TtAw+G9Idrs6ZuSiFsrIXK/9X7ceiieR+Q89OJIxYdX5Z/dUwQIKuVCqVywfd7kHv4Oj4pN09gARCEyoQilwnUVM0D8ehM4XNtPwa4keCVVv80ELL+/Zrtj0g3NqYuH3sUUOoknzFpHMmBK82USbyjEtD1wIUVZMFCbvdg5Pjo9vb2+VyvZa5uUJ6JsIsbcwiVO5JUnHLdjXXktv2OQ4O5m1ADCu1fsX+vpQpiXkjoEgmlwoQWd64i+Xq3eXl27evHz95XKpUfSELoem69RA5B5htJcZOcXQUwyHuOS64XzYmzMVIWfDwEDSFv5IzvlAo1Gq1brfbF208Htu2jRFCXI1iQRRQ6IPd0ZLAsnVeCYKEs9kMapqLzHjAjZm8lNyWZYp+RI7WDncA0XuyyCcFIFPFErYdDb+ngCGWrcfPtgVi3FEUrVYrPwArbbPZaJEmCnPGkTfuuKH7xWNivJ8SISfzgrNXtC0ul8IzqUvLE9bL9zpzlhTniPLYYG4HshG21MCmzhgfXIgoIurDapmNRuP46PjR40fNVtO0Ffx7gNVAtGQyR2RQhe3I5d13O1Y+O0z4y41vHsqiG8jIIvgDCw4Rm46/3SyJ9P1ztWLmwQKIW5pgoraijmkYEO8C5OOt1/CiBWHRM0BjhkI6KP6rggzAR0FMIwFJ8jzC2Rrf97hTKjwo/zMgKTp3bNMT7/vCGkxdJu0ko0/JwBoPCuJVyEAn7eB5nngVZbge71Lg+6vV+uryxvddP/CXK6Cy+6d+p901HNAdhRLBQkRZcEe33Qo9KZMunOK6AWIAcW+5YSC/iRNIVTA2OTl8KuGfLLVky0pEMAWjx7vc7qTMHATBerUaDQavX7588fLF7e3dbDYT9Qals1/tI7GlsnUSR1d/UI0udufTceZdLSmhJF7PlCNMuWGwqIlaoGXoTyqI6prj2I1m4+DgoHd4XKlUVSx4J85n0A8KqInLTE2s6nPqqd+3f0zbA8L3NEkiZ468xMsYe8zw13iKyT0UGlKmGVlQRKtSb7QOe4e9g+5qBWVpfCHjj6Q+ZFT7oY9oUwTGhHNRrU9UAhiDZqo/ULA3hQAT2k1bm5y/lUcqwV6g46dCK7QYSzX+CFQo/SC8ux+8ePHi6ZMnxVKl0bJ03TZEQgK4xMQkkzs4ynUajypNEQnPmEozlDQzFT/Uvty2w4riK1nWss/uSElxjuNAjlal0m61W63WaDRaLBaeJxihvidNOukgjn0EiAmFHLy3Wq2mU2CNIiaEiJmmmyE8vTviNrujcx8B77PL+TbAnELOPCi9w2ClUBhJsODCXyqXGmFDMNyCxXyxmC9EKVFpnLm6i09mqrBhbgg3e/nbwobb/ClZD3dqm/eGVXNRZapLHBCm3BPbUFP2ennQQMiOyD+RAgrOI9Esy2o1W8cnx2fnZ7VGzbIhoAFlM2OaX37cJt/9zxJWmZNva7e/eDfTh+qO8ghDKvNI/o07UGZQZlC3eSji8+k6QEHMNkdsI2JipXIFXTBhFM0W8/VmA+blfLZarySLBh0uINYhyqKCSgdmmzOrV2VCovFNa5CCi+zJj0Nfarl5SNuiAa4uM2dEUrQdGl6W/yiRLP4P0nPwfiCPA/6FOKYGafx4RRA8NDRtE0Wa57m+70YRTM2bzcY09G63Z0E5KGKGw8xubOHxxh/A1S3hnxyXvLi6eiTQ0SYBDFCrEvMDPSz/sGhh7nOYpvGrD2onil/lQBaqRUYV35eL+d3t9csXP/3008/vLm8Wy6Vg5Zie54oHhTsjZEZhfKI8Dxrr+EOfR2q7TSPxtEn5CPBjYgF6oe6ncKADs7Fp1mrVw8PDk9PTUqks6kuDU4EKXOfJtKJvCDQfKM9RIEPpnttBNN23f1Qz/9t/+2//sJN/8i1jXHJKdGJqUCaO5JtsmfJiYwW9SaZpToaDwWgync/9IFguV0EI5WWjOGFP7KbQUcoGoslDvdjsTHGf3/fSZd3tST86XngqlIGrtswgEr2wTAvwgGH63lrXrWLBNi29UCqVStVCsSQWCchTw+kvARjUhJKKjSSALbuI2DxVB3lgYOpzb9mcQP6IZiNmqXWFM/cQ2uGX8/l8uVwOh8PlcikKJUESBGJ7LJuLue+kQkl4T9f1YrFYqVRqjVqhALcaAzu8csO2a4njkGpt4Bf1QHMhCwK3wa3U97SMZTP6toEuDopQRJQgoq7ps/lsOp0uFov5fI7ARtbhSBb323IZ8AArjhBFyxIgP4uis/3ku2gf2LKEpRQIxNuKchR8g9Q4ZwOe226KBAAC/qG57zhOqVQqOPAg2bbdbrfPHp39+OOP3333XafTqVRBWwRKpIjIoWnF4qLZq8i7QnWvk6PMr3rHc7jFRPvCWzaSnPopvb36Lf4q45/i72nOQcRXyA7RdQP8jIKvKMLyEIr3N24AyXKbxXKxcT1BYhfRK6ysjSVBQQAL3Q3ixkmFw8Qbxh/1GASq54Sul/Q/6HIIKmx7yHeAK37oeITUgfmJEN0pH7R4p+i88gf4P6L026KEI0BoIdUKJFtgMIauG2zWmyUAksB1N1hkSIA03TSBO4ruGMHRRV9t8lVl4E3yRWWfY1ctH0nsPnsrc4pp7Hh+/m4tN5c4Z1qjbeghYb4CbFibNxKVaSECGATL2XQ47L959fq///f/8fPLl7d39/PFfLXebDZrDRIN/BAC3DDy8QPGwnhUowzMG4xlhyDeHWfXyVck56ISCJZ9n/pVrr2C/ap8PPKRNFWzbbtQKFiWXatVTdOolIpnJ0f//u///vSrZ9Vq1TStYqFg2zZunHodYpIZe1ti7xI9M9RRClR+QiHkf9K2B4S72pYMY5UqwVYdZZjGyCx3zQBxbSUxpYWRbdme67rL5Xw2hwSJzQZmc2llkkdoa/gC3yUZwaC1hq3MDzUN4+Nuiy/tOg4GKXFeEKU1QDPZcaxSqdCs11qdTq3eBPG3KBSrURxyodPw+Kq62PS8EDvzkvbEVtvii2t5j1PaVuOyH9uGhfiKiNxE8Wd3tVpNppP1eg05rskmM0do/AU+BMehDqZ8uVxutVu1Wq1cLqeKib//EtRCnAtFPmhYUrDkIUAli/R2nxe9IoSr6Uo1TcMBdDcu6srw1PzUsPPPWLkRxzMh7M6Sc7ahwV2jugWAvXcMtwEhfk8To8SkgLR8uzZtZvHN6Dg4daAVgmCv0Wg8evzoD3/4w/fff39yctJoNAqgYQASr/jo5iol7gg9xR8Y7YtfCziV8ubtf4aJZXdLTbMc3lBmIDOXxRqY9zh9wKStXIP4WeaX2o5TKJSKRce0DE33PBDuEPm9ooqqOIOcdBiMwagjrZVYv0nKxfAupToC0bfYXk+MxRbXQO5DriVN3uxuCg2ma4VvQco07ozIo2xt9dap7EQxHFEUue4GrIv5wvU2ug5ZheVyxTQtkR0A2+OLTXNx4qQsok7vTqolb668cHa56XlVAK3UFf0DGs1U3LiiBzjnOtWP6SdFuPYjLQKQJ+R83PX63cWbP/3v//3//a//dX1zg7VAIHIt/j9Q+RVxhjlX4ca5CGdaPD5sKf5PbiEciIzzxR6LBN7L+zL1Wb23JCehXA/w1kCStqToW5bVbjV++N23//af//PRyXm5XLYtqGWMr1teMrnUpeCkYfkA0dDylyJhDf4qt3ffPrLtAeHOJucLmGslYSPxBqKNKB/9mAmQWDgyS43cV87j7mYTBcFmtVoul4sVhGgw+ygmr7M1iLxW9C7Rux0fWvIX4vAL9Zf9f7LJl5Icf3yL/Bc0YfOpD1BFV9OKBUfTDcsyC8ViueTU6/Vao+U4RcMAgw/or1m0QOg6kygo1VOSjC+11rBefukCM6mW5u5mIFCujcK3wbkeIZ/nSf4noBoQPZIrFtagZ1Gq+N+CU9AizbRMx3aazWa9Xi+Xy+Rf3GE2YW95hbpUxz4a4afWvOwlZ7FiCuTsPinZBTxQhqOEgHDjbqbTKQJCzqXhd0p+FmOIpQoTCIr5n9moJ6gBD/HypMy1bZvtJpe+Bw2qy8g9JhcjxX15IBcHJ34GDGAW4MYFp9BqtR4/efzDDz/84Q9/OAWGUqler8vAoErjNEwjm5DMOcCcO5oGhEk3hPzJ+NWewy+vpZ6K9Gyj/idhhzLTNlXQUq5c22vSxuVeRJwEeMJRZJiG7QCYKZXLhULBgCAaGLLAqBHNNA3hbw0t00J/KkTBKNkVjVeJauS6haZwqqC3eDORxRPLJmcnh/e+hvEopfYl65spbGTnq9QZk48lmdnye6COksdK4EBFMY2CMFivN/P5AoRMAk/T9WqlUipDhU+scAzSIBIf5HjxyPUj9BH4PZXLPX8ksikzOQdkuZTKlvk7vWLZhAK+JKVQFPoX6FnJSfKjuU4k+EBevedt1qu7m8v/9T//x//v//l/rq5vF8sVSv4EYvTFsyqTa2JLMGm9yPRswtYABkVFZ0JvcceYKjzb973PUhzCVSifFhtRLQmuiG6uZVq1WvX09ORf/uWPv/v+9/VGEzy/uMqrXN/MsKh/qRZh4pEQ/7Ls7V/n7u7br9H2OYS7mjIp8ANyPkE4jWwecs3hbCmVUAQ1XIeM+nTtPfEuC+0Z+D94ddud7uDurtVslovFggmcu0KxGCwWMJ0rxInLE8/miRcGtTSIf8gekmkQsCTgbILbyIpR2BX14qqq9sSaoSPinJRnUuNUoM6JM6MOYsq6rs9Wm3JRW8xX19e3R732ar2KoiAC/X1Z1SDyNds2EtMEkyNLr89xbVPI74+1t/BamPWs/TO1jE9OkjlxDClLJH9JFssG8h5RQ6zVghBfs9GcTCZLEDha8yw7woRGKHUgIU1itQyjcLlYjsfj+WwO7CMGbND3mZtJmMvw3J0C9wtbCpLxc8UKvWrQHoIJZQxf7GIYRrFYtCwLam+EYb1eX6/XYRi6rotlPPipOUoku5PCU5C2Qfp18Rode0ZiNce8IU31M7Hv9svZNuzckuD3kfc/u30ikq8umb6nW5/C1cViEZJabUc39Hqjfn5+/u233z7/9vnh4WGj0agCZ0lqzIj/MQE9Znjusj98BstcGt8mFtjbMiC7h+6ftuWH3/kWypaNTe3sQ4ul6t/nhaF9dd2A6EoY2sVC+7AH5DxNA4JxCUpSXFxfO7a9XK1gfTUhw1kotwHggVru+F7jARXBAWXDVSBeBRWJqEI9Skpq8webXUtCQWDbxtKZi65jJTpKijzZEeZTU+JXtnYLxjVsLqCGrwUwJnhVwkul+YbAIIXIMNYXF5dBEHiev1qtfv/jH0/PzirluqND+RaQAReyPQrppUEFSHyr/qgXOZ+/oABqvBLlzPPoSpP1hP9Ob1x8dxTDK2Xg8U3jXXD80apLzi14QM911UpqBsF6Np389NNf//rXv9zd3vQHw9l84YklALQV/ACdajjhM228xAROYTpJyxEhQnpipOtf2JUG5MrGeApVf3h4PDUC7BsKXUjrTXgH4IMk4gsKBtZ6aTSbxYLdabcfP3pcrzcKhQLuJ4jKVpRx7idfAskfBd+N7JXUAqT48a9yc/ft12p7QPieRhFCnCvVVJip1SveX7bubF3nDEMHeW1dt0W2bhAEp+ePViDYOO/3+1MgjrqWZQtKuigA4AsHoKwEpJKblTZa4iwU95BOWPiA5pjChIrvmtyeJsiE7kJe59WLLotUqGUOvkR1fvjXtEBu1HWn89XN7d3d/a3nrqGajR9aFiR6CPsyMQfzBQNwrAbTJZm/WR/e3lxLBUC2Wee5jTvvMXerWq12D7rVy6rjOFBp1rICH2oqABcLMD4U/IghjQai57j7crmcTCcgSDNfYE8wd04mxeV1ifiWOxBIKrDzq7fcfMuHP1dkpWHsAtfOcrncaDRGoxGNIRqm+FJkj8wvP4xCA15W5idGUlBO/CIfM3MjgP+7G2bnGnNZNMiNFYK1icCm2jJ1HNo+BVC5P5taGIX1cv3k+OSH73/44ccfHj95DOHBIiSmckSaq5EgHWaZIlb5xAE1hcpxVqgw+wzs55lsS83G26Zletq2zQMPPJmM7EGwS7dBUkgrVSrdo55tW5VKpVgqNms10zCu7+5My1yuIUqDmVrcBwFyM6E4GobSkDSajAryHmanJno2eJU25RPN7/vWGSxeRJN7JwMpZGmkBgQGQgaIJLaUJFjB+wOXK16ffGvBEYuiMpNx5Puh5wWr5Qpy3gL/0aOnpmluNvB6mibWgQSEmZvIJbzLzJmlRoBkxtOjx4RnEk4iuYWwNDhw+M3Ygulnlc2nqug8jXMqTMjnxOxhZX44QD1o4Xq1mIz7r169uLi4GIymUAtElA/DPKAg8CNQYUEPRdw3/inWWdnid2MsNPqbdTg2CGP1wW1sEWasqji4mr3R+4aBSsvUq5XqYa93cnpWq9fjRy01XonxlhYlZifi0McMYlza9jPrJ9n2gPAhjeTTaLZQry0v+4mhQfFZvDOxCzJxLDCzpf4uVAi3nXqrfXL2aDZbvHn7drpY+eD/jPRAmFBhpJnKn6re2pzJOrMk0wfZEyAC7L5E7Hqqv3lqceJ7KcbNNkeCTaAFlmDVe2KavB+MLi7e3ffvy5VGuWxR5CoMI8rsoA6nfPz5Re3odDsjG192y/pls7zE944DGeK2aNVKtdlsVqvV8XjsOI7v+5ZvBUYQmEocRQSkAbqEEF00LXAtuy4UJBwOh4PBYLValcolyXPRAOFkT8rWW3l/Uxqhv8r4pAiKuWZBFpc+/MmhchFQHt0HP0ihUHAcp1gslgWfTcayFHsWt88PgKtT8xZXSEOWFlloH2g0fXS4NUtAynKlsgAv/lV6s2MSFP0kCwOog9AH0zQrlcrZ2dm33377/Q/fP378uF6rF4tFIUQFLZebxDsjT8wMqdzJAXM1kwqZsqu/XYz6y2ipkUnfC7U6JulhOaPKvQbbFKFSskOG0D7RhJ6TaZqlSsU0TNspWELXAp4fyxoOR7oxXa1XOpD04I2jci8giiicGAEsXclTsHdrW+N86VSoP3eU+LRMFJgHjW/e14idUiUpcHMhMip6aALBgFv2MmkLNgMnLahbAlwMPNcLwwClRyH58pEBBeUMUALn5RuzXaEgGfoHsWY9bB9rliaFOlVSdCpETIQkVbaQNkYj5Ff2AyafOsVmSvyUYztR/PC9B8fsAKhEv1n3765e/vzXy8ur4Xi2dn185JDyiZ89z0dDCVzectaS4xq77FnbBrdIZCh3e0Rsoqin/JLPnBzy0ooixc80kIuX4F9JapeKpV7v4OzsrFar68K5aYK/GB0ucDV53G9ZjFTV/pHnkyuDrD+xb59i2wPCBzVOGZWrV4K+kZjOMGCYkepMHA61+6MwNA3DKRSanU6n2+32Dqu3d4vV0nW9KNJ8PbAsMCjBrSfr1ONkreoSJcIpKE2Ws7ICP0EQNESjilGJghmcEoHXIr/Nf3WlwHQiT1H6jYAlImIj+mQ8tgzt7v727ZuX5XLl4OCkIgrjQnV6IwoCOEjs+1fuzjRTLs+tpYgf6XoD/wyML25gZdFg7lhlnfQolYn2FgYJ6/V6qViyQbrBoe+RhRJoUhUNaFgmkFLAQA8h3wDqXC2X/X5/vVlDW63DACTvMFRI/FLeH9lVsUDy5JOka/yX3r782gNJUPHReaeS52kYrgu1JXCgoHpvEcqpk/ZavgamLq+dKLWx9KWoJ8bVHRL80rzSGqkwIL/8bBg50Q22GX99SCYnhb62DRTNQrQXEaLIIyCTIPEI4HSW20MmmPBHGIZRLpfPzs6++eab77777uzsrNPt1Ko19FJjuJXETrfelJiCFZMLeAdSl8NRSqoc5Qc8Cv9kLfXuJMYKxSpjOQnRMqOaGvkdIsm8wXqKb5Mk1Ol2wanUa93D3nq1hOK363UYBGvPtU1zEk5DIWAmooWEN0LIaCAeO+u6DLiJML5a3CVnhsgUMuNa+GrTU9mWb7hjhWpCwBDhlsnHLPfapclB1ZiS7zCVwsJZGp94yvouFou4mAbQZ880Q9/zbQdm5uur29APoyBar93lanF+/rhebxmm4Qd+6IaGrjtOIdADmOdVDToelpLBPXBnx5HSxP0lpiW/74o7GtKvSBmliNJv+erF2C/PQ8TRNfsmP8cVf8WoIJA3RZ6q565vbq4u3725uHhz8fZtvz+YQDK5VJOhOTwMg4Q/XR4v39rBaCE89rIUhLDGEFWBLZh2YsTzfBLNkpeR87+wzL0SLIWrQKhvWyAXZ1mWA2V+jHKlbNv2o/NHx8cnDmjFC4UI4b8T1820DNNvQWwSx6bajhDDvn0abQ8IH9rQOyYtJxXfR14XaRGTDbW7crJEjGhwm6al2bV64+zRo989fz4aDheLxXrjahuRkideNNMwQgB1OImoojcyfMAresqZIHM++XWMZKmTAoLFG1H/5Gye1H9inxGXUlkn7gjE6Q0WC12fzZfXN/3r66vT0/NWqysIO5Hne6YAugmLGXMqYVIGWgXPTElbunkCpGRba19628YUzcLC3WgHiwihXqiu67VarXfQa7fak8lkPpsT3VEpihihLjzB4oFHBqmIA0Nt6MVyMR6PN+sNV2nfceqYf4XmTsZ++uWoni3zskgGz6tMbfmhJ8JHF4+Mqy1GWbEowo7AGr9Mfr0yGGKYKJuPfDYw8kSmSahBzykZb1uX6APHclyrIAUmUyNAXoDdVUOytkvWA03nih0W7IQpKVo0Xg8ODr755pvf/+H3z799fn5+LmODhilFFBjaTHSGC00xTCitH44x1GRJEzWPTlCs+CEvzr7lgze2WnAvRaLEQoYLkHVz7B55cAkIRrq4Y6bW7ULFI9uxbLterjiOczcYQExmPovcTdEsiuiND+V9NQjKxOuUmBHo9OC/EKULZU0atRwRPlTknJzil1vjY3wGUNyeGCFznmJ61d46ArRUp6Rc8ZWTVf/EYZGmLl4cX4vAjQKjFhibjRuGge/5nuctFhuhjek/fvKVyCr3bMuJDECGphBtggMCiTTpT1SGAxEliElL32BfWVKmvECRTZCsZaGOiXYUmVjar9nITUFgPCHEnYoHkk7BzvuAcb9AiyLX2ywXi/Hw7u3rVy9fvr65G8zmS8kVRQ1SjBRKlzxzW6thSczJaRuGepWiWaYfxNTKmxMSTBCyEruIeyfSR9W+nu8XnEKlVGo3myfHR71er1wVGSUmpIOkLMn05CyDDugaYOdO1Ubbt0+v7QHh+1ty6qZIVI67Q5ke70GE4uUxTFMU/xEmYBQGtUbj0ZPH/UF/tlhshPS/53q+ZhrArhSucXFSMdHzurnxjEazTFwJQ0wvSJJC9xI352g62l5tIh6BzBUo3Ss8ptQChWRFmAZNINbrur7euPf90Zu3F8cnp41m23ZK5XLViL1xOXXzlD0s12Y2XSoKSsoKZJbEF2/SZa/ro5MJKVCDQibFQrHdafd6vcl0ArXmPReNBpkuCOnq0nyHxS0IQwtYQ5hPv1qtRqPRZDpptpq2LQsfpwJT/LzxzVIulFSoc8f1PrxxEMXjkNmHZDdv7YG0WwxkYXiQAAxG/DhMyj2FSuRH3T/h71e0WygUlomEZwOqueOcin2lLQ/2JU/nezgUTB2BdykVEaJHggh4KMHuOE65XD48PPz6q6//+Mc/Pn/+/ODgoFKpYH8sG0jmu9C1YGJIKUgls5jPFBWTRlzjlA1d9kq/yKnjt2gJbrZEVvKHjF276x1P/Zn7giDeJLlbMS+FRrUinhPbduxquVKtVl9dXNzc3hqGMZvPwjDyPChNATUMARcJ16p6IBVikRFlCMXgBwybUDRJ2PJ4YSlRqOxQZB8eejJV7FptL5dV6S1JwEG2KL+nqjjzyKiYoXgNhdpqHLuz4LEXbxLMBkFgeJ7vghhyLEWmaVG5XC2XK4UC0P7Fl1A+Kpc+ys/O/W6JOYozkAiEx6aGQOjqBOqmCzW+DNPh4xqbM2VZSnTjoy1BRbloG7z/6t6kzYzkgQXLQ/gaojCaTsbXlxevX738+cWri8vb5XIdaZElkjNxM5FDKJUBE0mjSY8+P0H8mLFhTAA7JlGb6JkaN3yIkhsoKy3228QPM8rTagbIEBlC9rlULLZbrdOT4+Pjo0az6ThA6BAvI2SLbB/2WGGCxpDSBzhVeN8+wbYHhA9psamD1AKaRrisiwRmIFIg+NNAmpLps3mZhII/JdxvgR7qpmUVS41W8/jkuPP2zWjUdF0oLLtcraj0VhRpHuTKIymDMoaJeIZEcOgFs8zwbSd3jvSQ0b60pmTWbAKc8ZysWKnyL5zcaAQoOhRC7SPPsszhcFIuF4eD0V//+urw6Oj45LzTOQLREdvyfagpHEURFKJggqY0feQZoAnhcsWg4GZx3L0v1aTLTcVJcUc5N3I3yMEl3JXlvIxSqXR0dHR5eVmr1Varled6m83Gsiw/ENqwwvJGoVeZnxOBJrXruvP5fDgc3t3ddbtdx3FA+V2QRbedPUWvyg0F/8J477bURPwyJSj6EWiQcA754ykOSS8sHs00zBCs0DiIzdERheYkgIQanvItkNubMJ+QSZq617tYdltGNTVEBFyzhUD4oVLjwzfjO/LYIKSbUmU48j4AIQ0i0uLF18rl8vHx8ddff/2HP/7h+fPnJycntZpkiiLG5oS93McjS5zmQZvEUHA5CVnOSx02x7jat10tMcIsr0CgkWTAJdmyOCqljbztZZR/kXWPzscwdAqFWrOha1qhUKw26sVypVarO7ZzPxyMpuMgDAqFAnBHRaohhgeVSjD8fwTJGCS9HafKxbOH4EY+ZLLa+iaK7PrUZmrjLByIV176K4GRWMALa5dL0XKx2MuXETJE5HJswYWHYaAbpu55nuAkmXakua5/e3uLGmCu681ni/NH591uT6vLxDAmiCUqhcpCBPkOPnoHOUNS8qikuIKE2gjIxSsXS2Si7aQWcfJp/xKqSMLUoUeSQpJYVCTJWJbGDH3IHhTrz4tcevmUzKbju9ub12/fvHnz+ub2bjyZLparNYgb+YZpmZJQA/clVDFq+RKQD0XV81SnwMK/uAlDhHF8WCW9ZsrAMuFSRIz4nYShsZ4OSl8ouXsZW0YtGdsqFoq2bTUbDceySsXCyfFh96BXLJUxJmqJeVtKzvDhjruhZmO1YCFhVd3SNEjdt0+q7QHhA1vszUnNU/gip/gGCgHmeO6piXcQ9KYsSKqLHNvp9A4fQ7BlOJ3OpvPFerNxbFvRmYB5zubNmCmatHuk64vCmGz9olRkYnBIiS3K+2BeJ6I3UG8zK4HkiccbKCsZjGPI5DfMMAhX601/MH7z5u2TJ+/Ozp4UimXP8y0LCkSphCA6x9awRnwH1JVyzoyytn8Ltsmn1bYxRXP1HnbHS8n2QsUO0zLLpXKr1To+Op7P55PJhBLhsGJVbA/JYijwcCFWBPaRYI1ixQVkK6E1/97bkQp8/RaiAjtMtx1Ru90tlZGIiI6jRN5ol9TjLU05gQNl5qASPyT72DRN+BAlgsC5YjxZ5u22EUjNYDvqRqaOnHuobIRQfpNMP4YIqGWKUAz8F4ZhqVQ6ODh4/u3zf/njv/zwww9Pnz4tlaA8mtQRYSXsdoBe5R5SqVaZC+FDhBNzuqKpctntMeGHNhXGwvlZrh+5gHzbRPThnA4ZDQM6cRQZtiPJnbpuFwq1er1SrXUODqqVysvXrwr3hbv+3XqzMYEPCSBQpr1pWiD+T+b/q6w3dQIJXqQsnFKhzfqVFCdT6YJk1HdTV5q4BgUIRVZd/CN3v6Y+JGJtsb0hj66S8KVwLj3hAaqLiNMgH1zIroYiQhiG9/dCG8xz3c1qvXRd9zgMy5VqqVTRTM11N5DRImwViyriJG9GyitE1GuljM6eDRkvZR/EdStqrgwSUsRS+0UNp8d4DHHw6F6oqGo8tlCyQVl0OwKzeH8DER50XXexWNzd3Vy9e/vu3dX9/WCxWEKpQQE3AzHC+OCpm434TEqAspKMbI5S2q1KiQfhHP6ZsJUQHEqwnWDOk8KFtOvwqc7w63URJRfnCEMdZ13pUtc916uUSq1mU2R0dx3I9xbmmiAUbQPMaohUSpN08ceeBCKT7tun2faA8IFNzhQqI5qQoQwbyo2IJP2ApU0sJ0JCVGTNgW+mXGkf9M6fPLm6vp1M5+vNBjiiYQiepigyIxPmaEgslBNXUqV621nkB8njiDtHMyTxYBProto3Br25g0JOrPg8IlMw8CPLBFF+z/PcjXt1dfvi5cvz86eOU6xUarT6C4pIOnubeU/jKkawyJHpQPSOeHIhF6T848tGhtmWDYg9BIwh5EBYWCwWS+VSs9VstVvD0XA+n9u27QcgNyoKE0NCWwg6o7KiemgA9kMzaL1aj0aj6XTabDaRLYxBsx03Yrec4y9n/25TGeXf8LH6oBNx9iPao7nFGEgkJh4KtNdEk1BHBPnlvTDQpyx3T8XBYje8CBimwsX8zx34P/WOZLFc6mi57Dh+TJWKnBlDEVohBAuwU6gpgDqRDYoyBwcHT58+/dd/+dff/e53x8fH5XKZFM9xx93PT4JY9TAaMCcqE0SUanj/ZNPFr9M4NZSCew8YydTdyX0N891Yhm5G8I7oJtSiAA1N3w9F8V7LtIrFol1wSpVyuVIulcul1680TRtNRuvNZr3ZQPEJcUAZ8SMeYUyb1FK5zZTbRtEkDoEoD5YOi/PhQ8gNbI3DhzzjAFUDHIM+Waoh8Vu8JePr6nBMSeqTdwQl6cTfgShKAWxHwWYE6Utd9wOAN+56Hfhet3vYbEWVas2MDOJw7p7J0Z4AaAdzE0Z6Y0ezuusqtoU5mvhVMsaVOsuvpRInQZWKWalzwT8y7zFpsuH2+ecUoU3Qa/W81WrZv7959+b1m9dvxuPpeuOCiAxaRFHkgeQYCsCIYoKYYymuP551t78vanLDcyZ7IIeSUoFiozOuZJscfDbm6lclCwQEY5G7ROmOQEwxzVazeXJy3D3olcTMDB5eKXwNd5nssUSv1KiSOiBxBpgAIfZ/Nxt63/4xbQ8IP6ARfFJTlZZnbYgtESVuLxJKDaZmD1KTMVJQLJVbzVazUatVy/VafTZfqHqjcAyYbLEgrFK9FmnfqthF1lZTEw68vmw3lviBIZ9EQxIK+5O5lfKWcMzuIyFuwbERq7VwT4ZhtFgs7u+H11dXP//8J8syT06eVKs104wsyxbrFKW/p8ebhh1nlnjloLPTwsLKQuKoal9iywU5uSGjB6IpqXYr1kXLtqA8fbNZKpZQM3MymaCaKIrKyIcHs2oEZdQ0zPl8XiqXFguhK7PZiIJLAYJMolDujj7lcv8+OnaXOv42Si2P1KFCzMNPhJYfaM1BiqXvblxItvT8jbuZz+eYV0n40DIt9MOiZB+/OoSLUO5RhM5Q1o+MVNwGw60ptM9z4XLRWjaSnAob8rAeh4j0E4eaOeF6diKooiOsCqSf0QFjBqyYCQtOAVJVi0VUZO31eqenp99+++0333xzenrabDZJ8JYihO9NaMwVq8y9/OxFpY7zwFu/b6mWXR12PDN8sx13EJHYVntRxXNJ7x5CzqaIcoRmqVrpCEqb57ogfbxaaYY2GA5dz7NtG3VHAboIsiUkIgqWTkoqUzhtVPIHkouVHU+eRwxl88Q5sejAoysEtLeOWCYNWJnMLPCXv7vk4cUvMidpS8AliIacPkOTleNAdgZ4awUIFLv6lgUdvrm9WSxns/lkAXzHzbNnLrj7DD0qlmSWeUkWU+UJ0qm7AkWPBfjB8CByMhHAKo4jC7QmEgzZfZeHpZRCmk8+uE6hulnxefDI8VjGT13sIVLDm1034bZjxUFB2Qh9bzOdjG+uLu/vbieTyfXt3e3dYLFcaTqUZRJ+cSEkI+nH8MzRpI02G3fJMSp03H/RM4SX6a5wEhqqS8gOK9Us3I47FMhMkgaVWL7xYLZumaaFjzMkwltOqVTqdNq9w97h0XGz1SqWyvCki8d9i9Qz6yJ7sHGgEy+1/OaDbua+/Z3aHhB+QOOMmCT3gUUIVcsaKNkDCllN+UobulFwHKNW7x2fPP3669FovFguR5Oyp8oDAENGUPtVRi93dOWsrKxL3DeT7AwjUiRMRpyP8+IGW8dGOqTk1CaRA8pea9F8vry9vb++uTw8PGq3D0qlimGYnucaRjEXDSZOBMMtxJezxkdc1SjV1S9zxskGgnh+y4fcL7l7TPEXcqOVSqXVarU77fpdfTQa2ba92WwSpclFPoyU8RDWBhgcfrBeryfjyXg8Xq1WuKXv+1hRYLdfOYtDUh6WXzBa+UGklE2WRUrvPSZ+EJgPKw5Dda/lcrlcLFGOnAf00KEDzE9dMj85WRcDjCSnKWYWOao8MJiQ76PBiZ3+OVj6vUOXAoQpR0PqA/8zl3PLcayK/gtTWoiF8qRN27YbjcbZ2dnvf//7f/3Xf/3qq6+q1SrBv1zsmnsLEh1m5ogMAOZVQczFjfzX3SO2b9vatgB7FpPnDjLeDCosoapZ72ryYRPibOIcIk8X+uDoVc3G7FPLtCxIi0JvBcrlo+4onEVQGIDUyHIXxYMVaqJYJlRgEJhQCDtRySn57FBVnjiRgWnO5b6AapToEhJOzjhfUAZ+0rsrUMNduoSdlD1AaRehKvoiC1IIKCg2xAlKaTuBuKj4ch4Eke9Hy8ViuVy47kbTtEazVa3WdUPfbNZYTGibj4ZZDeJmAINH+IlwVHGmQm5uOmzFyhXG4xbDQrY6fBgmJF6oOiASjlLUy4TJwyF65mg4wpCOGfhQyNH3vOVyMejfXd/c3vZHw8l8uYZBCwLpEATqk3i+GNlCEj2zpEmee8scExT1lfeWPQnqCAoH4pPDZ2RVXDqxIXMnimiuOqDMXhB0LV3XK6XSQbdzfHzUOzoqlyviYMnK0dsHXvHoFHClACZ1gILF+/aJtT0g/KCWziHEaTnhXlJljiUeEtPxVmtDfGuYhhWZIRwEHDa1Wv3k7Bxt69liBQJVgb9abzADwIyAKCNICLIKUO5Rya+mZpnku8zcNuobXNHikGIKUWXWJ+mHSvZBuToFCSEIQtMU8SUIQ/nD0eT6+u6wd9VqHRQKpWq1YZqo3a8LMersGpOgdWUjk9JhmgwPqnjpP2PLRngewoTE+Bi6foMgKJVKgAnb7cFgUCgU1uu1DPeJJRXDgyBaIKwohEO+D3qk88W83+8Ph8NOp4OF44iLta0Dqb7lmlC/fEyoJ9naJLsRQu7RaG2XivY+XP5isZiK5kGw0FOqFVJGBSCfLkOmHINRiqbEQsjLFX0wTVO4mWVX6YCJyCqD5Slsltpyx6XlQr7ce8GfLo61crEoh7I0/qgTU6vVjo6O/vCHP/z444/n5+fVikSDtm1jFCIOn+68BSn/SDw5xPV3fh2+2b49pPEh3sZTyH2oILCG9iEXQeRBkNzTwVIorVSJygQ+tCzbFLG77mEPvA+WXXAKlmUbuj4aj5brjeu5UhtD5iIa9H6hsysEyiOmGiruqDLo40eL0ThJPIOeOtGpfOIogTeWcRn/y/0zfIhSn5HOqoimMgEvYfpTGqFQTmJOMfw9oJsiqk1Eum4GgSuoDdFmvREyY7BwH5+cHZ/otVoDrgfmzzhTepvhQR9oUpLZcgKOYQJkAgbjTc/zZStJSnnAJPp9aJPxydgUkoOVpBJgSJDOlXcctSXaNroWLZbz+7vb65u72/5wPJuvN66u6aZpuK5IzkQMLBERjF8cqiQnfm6H8xxz8hlLvhDxMyQTEYjRqS6DM3T5pam6lvjYC/aKMMBAZNSIwtC2zIODzunZycnJaalUgpsYBIZphkGQNrkyQ8Sn5aTjVZmd8n3fc0Y/xbYHhB/WmJFBr6uakdUG8pVQPATyPm5xrcm6soameb4Pr6Rlt9rt09PT/v397WA8nkwty46itZwTxHITiEzl9Esoj4acz9jXpTxkzGJTc1K+gzzjutwecFBrt2Lci7VKcAuFMw5KKRr6ZDKtViuz6eLq8vb46P7kZHhwcBgEXhSBfrEQv4a4gZo/Mz4wnL6E1zG2OJXPMLGZrGH4xU40u4lw1PhTtxvq4GZofK/XawCE5ZJlQTZOHGyJIsuyoJaXqIACaYSiAjI+uWjro9bo/f39crkklIhOZVLRzHaS+pD6kJsA9tEjRtiMo9Pc8dkBXCkciuucYA4FlmWt1+vZdDaZTCbjie/59/378Xi8XC7p1KQ3Q+OMABuZk5IboBRKieKFhiZUcOHKBxwNZkBRKgSa+jdrye3eJTUU2fBdColRGJPqW1JZeU3TKpUKxgbr9Xqn0/nmm2+eP3/+9OnTbrdrWiaWcMS6HSQqsw2+piKlWVOSX1f20cIJMnWEL3jG+Pu1pGcn5XZJfaDNKPOCwFVyhc3ZK3tGYWIK0rsFWeuRJsFe+6Br2RbMT7pm2dbl9fXN7Y07BuXk0PUAClqW7/v4vMGERmZ70oGK/EH+xCiCQATiabi96q7SIMfkQBnnT11F7NJRX6cmdVoG+bsrY1SYTi9rlUeC+ooZggnJEXphyQsWW//CD6tpkW2DInQYaoG/hHrIljUajVer9XK1ijRjAxmFm/VqeXJ23mi0bNtRuqO+pukWVBKWcsrJewJ9gKHBBZrCg9j7tLeZ7BNoKZlZ6X9HqPI+Oyrv6WAuY0x3UE4GdNerqQCTBdByyD+ymJJBhEgRN7TxeDQdj/v3dy9fvby6vun3B6vV2vM8AE4KNkvAlhgYJWukzDC6zdmZLfse0cCRvCF/nmDQAdcxPwrL2+MeAXDSCSvNti3c2IRK9EDnadRqnufXa9Xjo96TJ4+b7Q7uW65UTBNmZihQuQU0b6V/M2cQL0L53ju4b3//tgeEH9yUAZSe4tEhw4NaQv4E53vJwdx2QIRxuJ7ZjtPqHARBsHHd5cadzqaL5dLZbDQoqQSlqyNfynXkcrf4WZIhNXKe58RkEmYiFu3dSdzK9fhy0IleJVhig9DXQMdssVj0+8M3b94eHvYePXpSq7VECBHiTXKW4Wuw6nFizWSp97G0VpL9r+yMbQ64z7ttE2PIbpOydHfMvxSzAnwign7NZrPVajUajZubm1g3BShdRsqnixmGQQCU0fUadGUGg8Fms6nVajwot+282y7kvaTB945SNjDIa4jx7MGHnItHBfE4WKtDFHdeLOaLyXgyGoOmzhrNArUZN5gwDEsntW27Uq4AOwCt2DASTnmJpYGVFEZGAGkn2NuU9j03IFLgkG/GL4Ej3hSW41+mNuAhTR4ezMYD+XlTYqFYYAZjg99///1//s//+Xe/+x0WKUmp0e64ERwMcyHirFdL/pusOhhfb7Jm/d40+RXb7kzmXNoC81kqfSL66WFzuDwsltbWNIgcalpB103dAJkZqH5bqdfq1Wq1WqlcvHs3mU4d21+5a80FtiQUEmCABF40BFiYfK+i8Uo1l3Qd4WOg4mCsz7hywYxJx3xf3+Ndk7/xEKT8Dv+RCABgIR/8hIijHFjpr42ZkeoLTRR/gtcTuOvKx+f5/ny+/Omnn5eLxWw6+/rrJ67nnp6dHxwc2nZhtVqJXERRpcCiKno5bm6k0oq4G87GikQaX3bM0s0sbcwXEL/DW5zSO5oqh8dOAVXwFBIneb54JtjuE5TOOsGGcd3NejDoX1y8vby5ncxmgXiEMBqnJn+4OzJKpyZIRctM2E58cYnPloCB6ctW81v8UEgRJFKMSCioctkL5k/EzcXyDhFCkSPouhvbclqt1pMnj49PTqu1uu0UIMfdEtDxPeKiCR+QsoRTG8Ug+MvM6vnM2x4Qfkyj+SP5ruboU0vWOquuk3s0cNrJ6THUIsc0jHqzfXL+aDgaD0ej6RwUR5F7GYYahltopcla1UmjLfVW4qogE8ESy1gq/sBCng8w18Qyw0piIKkVKwijzvVm4y6X68vL65cvXj598qxSaYjI5678e44MSdIHW3Yok+Ys0Vm/QGSY1QvJ2vTcD7c7BkIWPwo8YooXYsJyqTybzeIqear+BF+/MaKFJewnk8nt3e1wOKzVaraomEK4aEfLujY+fOV/z8E5GswNU2Q/p45AxwlBksFzXeCGLhfL0Wh0c3PT7/cH/cFwNJQ8T9R/EmzwKJC0SRKisEzLKTjlUrnZatqWbdogv+mBnQHSNHBk19usN9gTkPxhzNvs4BAYyw208i1JtzO1Y+po/CCpqGnulykHP91NZCBjqiTKyXS73X/5l3/5/e9//+zZs1arZds2lEQTz8nDNUVTNyXtVhAmDhMwyL/R+/bbtdQDk8toyJjFUqI+rZr/sNsVl+plfkyIYZkwnYlnzKrVa7VarVFvlEvlq+vr8XgcTaPADyzT9HwIyCMUhKCfAEaojyJhSWRAYiH2jirWy3igRIyIRsX/wyfcD4NzJPD5voabJcu7MZs/tTFiDxxFDNbJot/sBsT+U64ioFoQhCLAKPCreFsNXfc9b61pw+HI87z1erVerxAAmabV7faEDpx4zYU3UKCQ3HQPtXTD4KG6jNCai3ufUKjl4TROaEpO2qpG5MPeZdxGQGbJ/lVnVmeXVgups+w6GoZhcd7frFeD/t3r169+evFiNl+GIbAhXNfFQ+ASkFj3YhAuH3uG/WRX0wulcpFk7jvTFMpO8Wi2Ja+E7gUNmuS5gCsE5N9w6Q98H2p1hma9Xj85Pj45Oa03mmANwBskwtA6FW/cMUoJrgphwpxl98szy76ItgeEH99iQ4S9zAnDRUqTQakiwm9bJjJYPHwflBuFJLTmOIVms9U5OOh0IGovjXVBVAsCCOOQ8oTcnxKW0gZc7IFVab5qkomnZEzzlZNW0mknOep4JLUOpoAWMcNxRpCuTVFLG4gWEEFarcXQBJZl3t7dvX37ulptappZrzew/IZhAKElrUGCZ6Th5WtI8i4kZ5gU7eTLaVlyYK4HMcuE3M3TkMkkHqxkpmmWSqVut1sug3p7oVBwHAcDYhsfkuZpRcHHj+z+zWYzHA7v7+6vr6+r1So9tFnEkup27ve/MDzIyTkPRIO5PeF4kqCvpmmu604n0+lkOhgM7u7u+oN+f9ifTqdArBVpllAdDRGOLcU2LROqKZgmrLjlcrnVhhis4zhoQwjzCyhakMOzcdGTAtF1aV7khwd3hAFTrgGsKknfpNxJfNx4MbFshJAGikZVVkoUzxi+v6Zp4nWVSiXBRzKLhWKj0Xgm2tOnTw8ODiyw181CoYDppti93cTd1K1J9UdNEcqIjEM66W32sPDv07LrXWrWYjcxh/gAims7M5BzzghpBSomD89SAORJy6zU67oJ2fxQkEEc0LastbvRIm25WiF31HU92FEltat3QaIqovzEFeQw5qUCcvT46bLKN/wK8FRUG97t4UrOQg81ldHvqlAOyOAAkxQeerWGJuUp1UsNJRPoNUfuqGUV8aeN60IWB1QmFMjHhToKi8VyDYmFm2+e/657cGhboANsGKbruqYJqb8a1JnQDKGinLrXEnlgoYKEgYE5LvLyaWVDP842Zzefl3YPDrEAKMwo740yClJH3u6HAitGeDtBONQwTR8q7g6vr68vL9+Nx+PZDIRZ3Q0kpiI5FldDyFOVa5+86CQOTDirstM4XUWOV0Vdv8oQZJiWO9BzHhjF7RcKhbCZaYpIr5iKnQJQ+mu1drPZ6x30jo4qlVqxUMTSaFEYWo4TaYlbnO1/ykknvfJ56H0/CX+abQ8IP77BTI8vpAyKJQL4AskAze4hsXEyp2A10iLHcXQDcNTp2dmg3z89eQEeOyFyj/4tUO4DBZpdHn1OIsU1jjyxAqqJVYq2UYVtU6En9UkemqX9J93A6cuBf0VFIlwOYR4XpXuC0Wj67uLm8t3l6cnjducAT+f7oAmeJWzIaY6HNfBfcripP1VGeDxJJg/15TikUkgPv+SPQZYp+t5FVObXKQl2x3Hq9frh0WH1ZRUZfVSrEK3/1OkwaIZZiJPJZDAYnJ2dSQFS4YPMXQBSMe3cWPeHttSylDomj9Sl3pcdgSkUj6FUyc1mA0zR+QKutD+4v7+/H9z3B4AG12tMI0GJOaEILB5dxDyYIFcqldrtdqfT6R32arUavOm6vlqtNpvNarVagO77cr1a245t6MZMn2HMMHWjORrMhotztXP4VXMJU/6EZI2krJspy3TioycFcoRRjkxjy7QqFSDs/e53v/sv/+W//O77350cn5RKJQwPphxAO55SfrG5lNEc6SnU1uACpNvB/779pi13pqIPUfbuMJbjw0O7/LmlCqtY3hNmIR0q65TLlWKp1Kw3NU2/vL6CSoZQgk+KlAp3KwBR+WQCFTCK9IDqEMadlykMsmY4nl8RatAU1oQyALSHECV+aRMuENmZGHop3i0LzAqTBMvISQ+v5wEYpig9ZhsGgb9er+/u++io8vy1cGxFnU7PcQqLxQKWBrEmyPhk3m0C4izCc0MLIdAq+qfSudFxLAPCWf8tM0f4ZP4gtw5RbcXMQVUPBWNUfFaugRhO5R2Tzii5/CJqOp9NLi/fXV/djMczgH8imCzp/pLGxXnC9CDHHDEV8IxPsetSshskD5e7P/fY4wEIdEosjsOIpBXLAp+8oTtA7K92Op1O96AC4s9WXNhwVykY3jX5+sizJF9qflH7GfgTbHtA+JFNxd4k/yAZ7lcldyRdQTz976uMB1W7wHEjjB6xPDmFQqvVPj07f/r0qzdv3yIgxGxtKwQp7USValV6jxm4aVtLeTz5CoZTQ2xivqeTOf4nmnk4QItHIAhDA6gpwL6PInu12tzfj96+fXd6+q7V7pRK5RKUuEHzbusQEc6JbVbF90gFM3m35MVKTP7lYEJqKdUiHrfJhnTeezS05pHFVygUmg3BGi2Xp9MpeECN0DIt3/BDkNKOQQXO/ugW9XzMFO2Px2PclxtDv3ABeKAEaDYKQYwyshS5RMqOYxKmxbw+3/c3m816vZ7P5+Px+P4e9GPu7+/7/f50Nl1v1liBkBZFrCeBUUHLsqq1arFQrDfqPdE6nY7jOJi36fv+arWaz+cL8d98PofQmQkAEuocuigAmJASTZlH/HLIsOMCBqkL53cw+36lDkgIMyvzK680+b2oUgmaooZI4mq1Wn8Q7bvvvusd9IrFomFAYXp65Hbf2XzfeY6RtNVe+XVJyPv2QY07XB5kBZLTUS2sHxAhFFtKR4P6DrGNpms1vWaaRqFQdAqFUrGEIjRvLy+Wq1UQBAUHFFZ8qM8NUxk9/FLqSfhP4+lCPU255rjsr3rtUjnM+Red8OKxyKQSTst5hnOyJtIrMclcxr5hgZMFoR1PEwe1Yq+0uGQRSHQNYw4+MHfjQCKLGQTh8+dap31gQAYhOWiEH3vnTYF/kTsrCrsTBVQqZEpvtdSflC84/JXDCco9PhuDZB0LIlEidlcQPR6dnThHTrFw72AJcN31aHh/8eb19dX1YDheLNey4xHo5+FSQUORR40hGy29zQc3nipKjysb7uQQxTUqY1Vq9QFfBPxcrZQPDnpHx8eVckU4f6F8rmQmk35+cgDpBuWsIFw+6Evyyn+5bQ8IP6aJ10PpMShyfIK2JDkK6J6KqZa7VzjKpfE8AH7CbCp1Dw5OTg5PT05d1/P90BcJD2SpAfMbkaFKn9gSoMfjKwaopJMIdpualtJmVt77n9tnmpno8sUfwmWPs6mohBtF0WKxLhbC+Xzx08+vDg4Ozs4eHx+focrqZrPWdZiYbBufyXh+w+o/qRkWx5HsQMSg8sbI+KT01n6p3FG61ynmMP+cDZRtOyD5NXF5wIwvTPRyHGdpgGxmEAIFS1QgjiU3bduG+s6GMZ1Oq9XqYrG4ubkB8qQqx8ejOtsIJ6n+b/PUPnxwUB2HRwkSEQnGh+SnSK3TRD1FDlXgB5A0OB6Bnmr//u7uDvMGl0vIJFyv1hhE9TwPg2O2BSKrTgHU+UpQ1umgXCk36o1OF/6rVCoYKMNTVMqVaqXaN/vgcQeKTrQpboqirVar9XpNsJ+zWFO3lcsG8O0JtpEQ6DaglQql8pHhA8LHmVNSMeApxbFEMmqj3vjuu+9+/OHH5988Pzg4KJfLtm0Xi0WMmnLtmdxbmb3vKaZr6tmW0uvKBubMsYfGFvbt12i5Me3cDXhLLF6/4MbJLZW+cRD4OkxrdrFUAr+VCwQ/PwyX6+XG3VxcvkM6t64btq2HLvgy5CyB1EpYg+L4My5qqmPiPBrQYFgZCXXJahdglooJdts8Rma8yrmIN6T4HjsfodKc6SsbTONnwakJVmcpfyJeEVXFqlgsikvTgwBSAJDKXnCcKIrevLnE9342m3/zzfNOp1ur1Utgq0BGjK5rjiNXIkxLy95ZHAuWX6NuLnNPJwaEcUfTl5CZ8YSdIKvbxQxGgSgNtExUUR/KXwwxX5OUXjJ99n1RQEh42w3DCoLlYDC4vbm9fPfu6upqOBwul8DsQP6ICdQuKKAFJploYgGCE4RBwMwZ8hbkuOAfuMyhscfflNjnlzlUkvEBVw8SMqKAJyxPgqkB/1pWuViyLPvw6LBeq+sA/oGqBqpmQCwVyaY5XYl22BukA89JZPtJ+FNue0D4cS2R34yvglgSmK9LzEeYjavyq/ON3fig6o3FxAPDMJ2C0253nj59+vPPLwaDwWK59DwHtCd0PxKWLtJW8ZXjGlY5kbxEo7lY/Je3eJDHPV7a31M6JqbNJP6UVZzk9BeE4Xq9HgxHr1+/ubh4+/jJk2Kx5ArCoagrESde87HmrFEaLCmFSssw61ysbZPg634hc1BW1jk7yaaQ1UPmX9oGE8BardbZ2dmrV6+m0+lyuZRl91SlOLodaElgUqvneavVCjIJ7+9nsxmmv3qeh2zJXNbor7I2pBAL/5ANA9Kf2e/paBT8pLxB13WXy+V0Oh2NRsPh8Pbu9u7+bjAYzGfzjbuZz+ebNVgGknllGnoI/2KDjMFWq3vQ7XQ6rSb816hD9iBqbCJa8zxPWGMRFWBAk2KxWGTBUm5WJH9BOKOSft3hjU5hv9wR5qfmiJo0RamsYhiGjuO0W+3j4+Nvv/32j3/847fffnt0fOQ4DpYiRIP7Ibd+m/WQfbBjAQZJmou9APvswX9ge68PCLeICWZyyk6rleLDuyMSlTqBAhURwUKsTwgyM5ZZrlYq1Wq5VKrX6o5tX1y+23jucrXyPL/gOFShAYs7AYk0gvw8w9BxzQk1TJmnND1Y6OWCJ4EGBfnEqiP2xFdjm48DP6bxcx5QUYTBZBI/i0vSl+xHRMgSaNF55USBZE6gKoDuKJJH0bUKOYdBsFpv7u77kOC8Xt9c382m06+++vr09LTT6QXFkgOZZsBlELMWVPnI1hmKL0OMAt5aLPwIdx8+CeyH180siPfmEfCZUGFwtZesnBvzfdFIigedczczB0bMLNCX4fvearmcjgdvX7988fOL25u7yXTqCcSI2eWywyocqQRfxRkSvFfq9QfHBpVbP8OSoAeC7ndm8NUoyR3jq8cwuKbZulF0nFaz2e126o1GsVR2Co4NBTxlqfptvUqAQHWxCUuY6qFlRmHfPrW2B4S/QoOnP/GyS1Un8Zv8RlU9fU+D18+ApCNcRKIoKBQKne7B0ydP7u7uF8sllsKGRc4wQBVKJOfBbrKkdXwotSKxGYkVwpVKMypOmDszpV/dmJe/460WJ0OTUa6RURiiq0zqT7ggWuZeXl3/9NNPjx8/tm2nVmtYtmXI9QkW1B0mIJ935J/ysiggwG9Dpirrl9JSuV65d+SDJl/O37Msq1Ao9Hq9o6Oj4XC4Wq0QHaFmLBoWFKpC0iO29XqNQcKbm5tut0sRsCwAe2iLk0zy89w4/AszVhcFxPiC9BAcQioymDe4Wq0mk8loOLq7v0PE2+/3Z9PZcrlEXVBEy7gj0GxEOqZt2+VyudPuHB0dHZ8cdzqdaqUKaj3lsmM7hWIBQRTWsUCYZJmyDEPgB5vNBrZ0QMUhe6+59AJ9SETRGXTnUqW7bREeIcweJHUK+kyoFa7INNqt9qNHj/7lj//y/ffff/XVVwc9iA2i1ijVpaRbs6MnKbS/7QEQ91WwEljL1ejbt39sy7mDBF1YzdyEUotoFHSj4+w+jcx8xidZg4CHrsE0Ben3plEslsplCNGLUhTlaq1yfXPTHwzni4Wu6xsXNL3jLAyJmiJNN4VuJUR9yMYXxR8gDqX4eBGkYit8SJ3BDhMhc3foG5EShQd5zhjVGY/xH7lE2BoXDx9ziRIaxHhamv4Hfj3QHRV83VDXLQVwfE2LFvPI3bir9WoJac6r+Wy+Wi5832+2OtVqvVyuqBu69Y1D4C/ghyyNADVtkbsIldshjCoXckr3UNdCBChOf0gtCuqK4+pfFC1UzFtZspJuCn3I1WlD80hUFokWi1n/7ub1yxd/+9tPr96+my3mglKrTsBkQlUpeGaiSBJ0LOuemEY/BBnyK6UwOJKrSe6P6VmQuxzHRAr7cDd54Pu6ptmOUywUmvXa8cnxQa9XrdedgmOaksSBitmJbrD+8KVBsH/j+y05aV+a5fUlN/O//bf/9o/uw+fZUg6PRLFV+kVOwNmo3bb1TLn6kG8iAi/izZ/OZpPRaDSezKbTMIwsy/QEMwHYCLgjm1aIf0J9lfMAoaZkbDDDOJe8klyksY1yj1uBgSd2zTX1sGYrTDEBlAN2HCuKglK5XK3VTKFnjVx29LflHiFLFUuENzNeKKECB38D0v6C0gizSID/xG/cDriYbXhA1BQNw3Ap2uXl5Xw+V4klQI8JfPiVwxJELOhZRyB0enra6/UwVQxDjrvvaUoOh11q4pJTu2Q9pqklM6Ufg6B3x5hgUq4upHEJAy8Wi+FwOJvN7vsgInN5ednv9xcL0JVZLVco+kJdAukFXXOAaes4Bafb7XbancOjQ0jUB55VrdPplMvlYqkI/xaLGCqEjDsl0anr+mKxwEIUqDy6XC0RcGIyYRYd8eGVyi6iUZYIh3bJmlfphyo1YqlT0DDG0seCAor/Imu02+0+On/0xz/+8d/+0799/fXXnW6n4BQMw6DLRFoyBhXf+3DmRnHzN1MFfn4V/8i+/UYtFZ+nh5m9vLyiLd8zPgB6M9+rcxHPkxIeiIAPptwbME2VyqVKpQJha8vyPY/UQUxBe44Xd/XKKDs+gWmxWGiiM1tcEfTupBwu/N3kA0LXwFd0goLomZOQMf3Y8xCjeGdF/F4NOvwEQ8DecWxCLBMi/LilJEoEoevBzBNGoee6q+VyvVqu1htRt8AqCWa7ZVmCPwkxRpw5mR0i/19lCUoUQ+qiwnxKhEbpMrI+rNwJPxtlZXMXVHNFNAboTsK1OHYlMH8cOYUrDlAnBqfacLmcjQb9169f/sf//l+vXr/pD0bjyWQ6X6xWG3iexEpB/VOTbfKW4UlEbRJRL0TK1WbX7l1Pc2az+FWic5GkKv8fYf6RXWdgPRYga5jlcrlUKtWq1XK52Ov1vvv2u6+ff9PtHlQqFbGRA1F1wf/IhAdia5MNuPJAkGdH1UXMUkL2s/En2PYRwl+hycQ1yYPg5f3S4QhebGebyYKamboO3DxbzMt+tfrk8eMB0PAW8+nMHw2DNRRQCjQtkAnr4KxSqxSLUUqWREI9VPRWTIakPbrFW5nLRkMkmek8x1qxwxePzcr8QvRPrC/hZDK7urputZpHx0fdg26pVNYte71eFwrOw9Vl4nOgh0yNb2xhUGahFBf7cjAhHw3+gYfjPmjOpdpxGMDBSuKgh9nrDYdDrDSIES3TNGXBPVbNGSNdngcsGtQa3WygTMVDil6kPvCWYo6lfiIbgpQbchHyhw2IeMQlRdaHCCEqvmBRjbvbO4wNrtbwH+I0qUAThQa8VNIhYghN9mq12uv1Tk9Oj46OGo0GxgwRDmFIEBuiSuye53nVatXduIviwnEcsuSy8wl/HdKOm52gNzdAkdWnTe3CyaJo+lAZK4R5tm03m82vvvrqD3/4w7/+y78+f/68Uq0g/COd1VSyU/4dSNp8uWZE9slXpn9abnSrr2Hf/u7tITeFCsLjn7GvNVmaEKNJD1Q+FDrUumZC1AsMYiHzput6oVisVmtI6i6XSj+/eAmvd9h3XddwCsiQx7cb6S1yeoDMMlym6Y1A/UpQVKIwV6oPCl5qhmUk+TtyIpWPferdTCpzEMCKwUyGTslCUwpb8VkRv1YrIU0TENkU8iGoO8q9aVgeMQgDd+NOovlm46437nwJqsir1doUL3gQhJYFfBDPQ81waGIp0fNq1sOoSWkAMSeIsJWceOWgKMbTDkZDdnWgeGAk/HoMm7M5BzPhaQxTfgWUVgC7BXRFfSg8uJmMh7fXl8IVCJk7643ngVcUoCD+v+oOygeqm5pzD2XIUz0A7EblxY0fdNWxSSTlmND1nXoxZM1McStF0Dz22kdRVC6VDw4OHj953O0eFApQggKXMDE+2XWEIvnJuVr5LvChxH3pvtOH/Wz8ybY9IPxljfwfaIkk1PbSm6pXRsbrdN2kb1LboTmJgS0tgmhDu9159OjxbLa4v+/7YTDWppTArXqhaQGXysi+bwnvIRLHwWcVBLGjLr2dervRxtrFMqNLJu0yLEgQhzKQgIfJBgXHdl1vMBxfXd28fvmy3W47TqHTOTAVXw5WjYfU68DTs3+V5aCyy1H5OnY8f4Fyo7/iVEurOEIspFR1Op1arYbZ82LhhzhVKhxH7nMMrC0WCxTh7HQ6WHn84/qTCgin2EEc+6VcyFlllAe6JOk4eJmu6y4WC0wdvL8HPNgf9CFsKopDIBokjT5St4O31zId26lUKgfdg6Ojo8PDw2azWa1WIShRKiGCQj4taavgwhsEwWq1QnkeVPfBCg2pC9lBGOa1IihmixCUXAZZjJ1FgxlnVoLlxLdETdFyudxoNE5OTv793//9xx9/fPrkab1RBzQLWh3wDOBVx5r+W8Y/ZeAmrNjkreQ95NzR7Ey1tz/+4W3rEsM2yHvNifCGTzt3YD50tovrzUTgriFdTVgaQk2UWrVtB17MYqn0888vQvBXTiIN3FsKm8SuEHSzUpq6OkkGAbKvKCyY3z9Z7T4B4zIbSMzG0aAsb5FAHvH/cJdp7olpRRcqMwp0x24+I4pgvaYAXRAYrqb5AVTfWW82oSC6e76P8K97cNhstYrFsmHE/PbtEnfwj+CnClMEnLmA30KQThBhNAY6UnM+9wDS95Q4LRIiZQa1bvCCWDiIOIA7VwU1rCAqA1V/NvPJ8Ord2xc//zwcT1brjQd+QoHeRZkSNOeAy6XYrhLeKgU/FZFMzVtpQvTDW4KvwYIAwiUhK7DG2lrqPJIVgpjVCCGpVSwQtgUx3l6v9+jx497hYblSAQUmAQjjI6QptfGyixQ23EbIL8khlM8qycnkFZHet0+t7QHhL2oSYaQpCnyG4WkPFEtnG2eXNfUigdyo60PYAVLhgYhVKhZ6h73JbOp63nq1Yo52AxSzheuNbDY6mHAMKXNVuSXjJP50uQaZ1k/uTHWl+a5YcmrGCdUJD2TMaRdhTAur4i6Wq2KhsFwAHbFRr0DRm3LVNIx6vYV12zRNaBWKOUskuKdPmuLfZ1ZTFTfIiBN8eWiQuJHZX1MCmw9pGCQklNJqtUqlUqPRWEL+qr9cLgnecxCI+6KTe7lcRlHU7/dvb28PDg6w/jgeNpXOl9vbrKGXYkjmjkAKq2QjXQ8cBFJPRfi0Xq8he3A8ubu7e/funVCWW45H49Vq5QvOtud5OBoyA1A0wzAqlQpk/3Y63W735OSk1+u1Wi1hekohGV4UETES4MOZfPFHoxHqr+DolUql5XKJgdlYCoKND10g3jU8RRAEjhDTJ9GXLNZK2eip0eOComTIUM8xIRD5wEVhUpydn/3www//6T/9p/Pz81qtRrgXdUexD7kihPxCUhJBWS9A9knISSnMiy7u2z+27bgXGWBPkEZN81IoX5I/lb37PsJ55viSSiB4EIZhuK4LiriOc9DrWaYJ6cJrYASEYThfzCNNs4SKMng0xF4QFcI8agwHibcBeih7Ftf8xVCM/EZsj/kLGVdHDBSzTHhuJxB3lGCAutpULCpxbFTi4dvGP2EZCFwg5AhjdB3JtTCrC+cgJElGui44IjBuoWVqun7f7y9XK9dzsUj9s2+ee+6m1ekWiyXTMAUDieUVZ2Z+iRwQDQrnd7IWIU3msmO4F6/rk3rf43CuyEzkpaFplDFlEYCiwGp4X4QguXLYaxomhKtip+F6NR/0+/07SB2/eHc9HE3XGzeApwAadACCwrL6V7wCMTtMErUgIkfwDU0UyXyWArUfiJekC1K57ONUUvVeYN0Wepz4igN56WJmNk2zWCq1Ou3Dw97R4WG7263X6+UyVAITvBSZfZB6JhHlxncLr1CMKnHS8MmLU2FTRua+fZJtDwh/hSbdIUzzUwGjuM6fVKYWS4gKDML0gG9YzjFxhQN1MkiDdxyn2Wo9fvx4vlhOJpPlcuUUCpHI6VLV54TADBO/Jv9l4vBMaUEWmBeK2CANRttl+xNP0XmN+OKZjdTCGc/mhqFhCfQgCNYbdzKev375plout+r1eq1eKlVErkMYiCRDnL3yR1zFZrEDMSynfHRja7L4F2Yjvldl9OFhQ25XYagQNFFEzhsuHghREPNwqMYhhA6mAxQkHI1GyBpFN+q2CvWpPme3yQ0dpGKDKfZgboRwd6OjKacvgL31ej2dToEoens7HA5Ho9FCtM0GZCcoGY+YkHK5LTjFUrFerx/2Ds/Ozo6PjlvNFqYLYlIlzLxCOEqIH5qaBS+ypmm4EgdBUK/XF4tFqVRCDIkwEutHx65ZBcj5vaYYL1044nCOxBCCckhPI5AyrHmqIT1jMkdRmFOIUSuVSq/Xe/bs2Y8//vj9999//fXX5XI5W/PjIRHsFBpM3Xdya0mVefZ47NKb2bfPjDUa8+DiSFdqLdPfwyfPb2qugCgWew0RacFnXbeEhpNhmLf3t4PRyHPdQqHgCYQAay3UIYDlBoVIqbsCMwnvsFjm8548Mthpt4wS6PYgaryIpvg7PASWO9rpn7ldTnhC2SvsG9wkCIBEirBNJWDDCo6GRxDMwyA0TWuzWS+Xi9ls8mjzuNXqNlptyzTX65XjyHKjObM6+bAIXQjbCFO4xeWq2Slv5ucQJTVi8UWxgBUfDYxl4ZaJKo3KMgpCKCqo6ZHvuZv1atC/e/P24t3l9WK1cSGLG54B7BhCQeImyNgj0/dD/ijvpDKXpNtgKx12S0sNYmat5H/JUDY19F6QWwEFwGu12uFB7/HjJ2fn5xB1KEGJTrKssrEKfvC4G/gsyjxu8TNmMwqCVmrfL8r8+rLaHhD+Go2BMPKIUJQOQ/hUWwiktcRv4EkkaJOhfItFS8rxQZGfQqFYKnW6B+fnMwCEq9UcdK5ExTOxJchiiwLRYm90uqVfvbhLcYtP9555SXoOk98lyP2p35PIVEx/MpQUwSyBUvue5/UH45c/vzw+PGrUG6VSpd4Euh2KYokFKsHvUBHPxEqYcJBSV1iVjJTn9YsBhDss7F9ymRSzQsmQSqVSr9dRMoQAIbfy+RlJe2a5hKpN0+kUY4wcue049bYqGrmXhnc4GyyK3d7sm/c2fmpMIMQa9Le3tzc3N3d3dyJhZrVcLgNBFEXpHTyRbYMkEoIuIE+Wys1GEyJmp2dHh5A6CBBRDCBRsCioi9/g7ljU0bKscrmMiRz4L0ULQfpC8XV50IPbkdwTnEXssjCGwoTJWHt8g1KYiqAjnQvfLVSROTo6evbs2R//+Mfvvvvu9PSUHMy2ZQehZJ3tvhEpbJ+L/9MuA1WNlV/7tu337ZNtGcVgiiskpBPjDHG1EvEJXgkqvmd6wVdCOjVCJSIqpH1Ra6N3dGSIR7pQKPzlb7am69PpFJw163Xg+xbohwpnkyI/Q39BABNeLIw5hWJ9Z0qXqvEMCM7hUcEklk7C98I4Y/J48ZWrsgrJTLkESSc+pzJHMp4UNXBYdxE/oSsXHXyJSZ6jGt8PPN+3bAtIpKvVbDZbLVdn54803Wi3O7puBDIpMY725z4AFAINtQjuC9La8f7gcLLL2kbISnm0E14i6jzzIGdNlngahPQWPwrD+Wx6f3fz6vWbNxeX94OxUNYJhPAQkiVBg1Qkj8eTVY7QaiyUnTS+5I2P4eFDGu8zTex8KBiNFP4f8aq4KBWNFKrgYvnRq9XqofDlPX7ypNM9QNIHxDYk/1YOCrPBpG0lObHs4nBClt9I7VMFE6WQ4b596m0PCH+NlnJIy7eCT9/xXyT+LjN5RGq1+JDOq0F/GfpyhIgfFKnv39/Xa7VqpVIsFNfrdbmsr1arKILSPqhoLYP2Sc+h0laRkXxM3cYXPmlOMUdibEdKNoMSKhUbq23YPEYBSZUugXLdclfkpYjLNzQfErJBoywMfF0LR+PJn/70l1q1Xqs3K7UGpGgLdj6ewhKpVnyoc1cXAuFKP0Y56qS3Lq2/on0pLX80klf68NAoVajHCI9lW5j8hoUoqJJ4oQCKC1BExHUpsIbMyeVyWa1WZ/PZ7e0tVlSnLuFmO1LIcpFDCrTEG6MhpmKVFJLKhcq7rx07j9E5ygyEAvT399fX11hWcTSCkvRwvWioCFFcOhHG8ZrNZqFQaLVa7Xb78fnjJ0+edDodpwD/YZo+l9akHsqzC3U+yi2kihQIy6nQH6ZxpiAcx+d0LfzCU5U/SAkmZZ3gtIAHIfjH69rjXKTpGgmH9nq9k5OTr7766ttvvz0/P280GgSM4X+g/Jt8Zt7LFE2FJbPkz62PcWwKvgd57tun0FLhHT5FMKs+DhQzfBjHuZD1pzZOCkptfwJ4HAlLL8CkoUe2bcFTHRXaXUh7hiMbMMvB69+/d13XKTjuxtVEmrvnQcVRseYCJwj0S4ROJTRYseOlR/ZWfBAFDBKBQjWpyctJWcxqwVYkzvhQcphEnF6OhmrcP8sRKFaykOLieHjYPUYPShJEYEzTAGVO9OFivxwxKQlZONP3A8MIPc+3TNN27Lu7+/lsNp1O5/PFaDyeiZSWKAqarTbQHzTNLJvoOyPuaCrBQc5RgnWpQ8lG0tdRvRXgAj/DpCT5urFnOOkqUmaYkLPDS43RoCI3ouQm9QGuVGD7ANC2EYbBbDwcDu5vrq4u3r6FlHioxwuVKlVxI4aYZO1TGRhLPMCUPIP61SJ47MO52KSXH9uVR5L8zC3iYXxb9vyL4VJRQZmhCopnpmnB6oOp6bVaDQoPdrqPzx8/On+MZaLQC4kztrxNOcuxAoHJbNXE/EwRWjByDdxOeXL3QcJPtO0B4a/RyGPGY1AMB8oXSPpVxC6JFzsnsY1ob/CvFhULRUM3giB89OjRZr3ebDYwCy8WnufbtgXzniyYA5OamoNYpWbgzsfwj8cHWXxfZUDLPnEhZqLEJ1qWxcEgpZoN4qCpYIMg1oB1BVgofhBtPH86X15d37x69er07PT00WNNq7i+X0Aej7FtOc/QQeNxpOrGKnuS3xTpb/6iMCHpfL4XWT3kqmnEQNSkUKxUKo1Go1Qq8bIBBELkI5qs5QB84NUahVhOT08bjYamaa7rUojsQ65Nrm1kw/Evc4mCKeTz3tNxLIRl6FFOZj6fTyaT8XiM9QahAsRmA/KDKrxG5Ew8AuT7FQtYdfCwd/jo8aPeQU/WlgDtXJaDkbw7Eh+ieL2C4ijCxONmMV1TdZtXXMyNj/EYGjcpUt/jcXgVx6Q5LrtN0UU01UzLrFarJycnP/744x/+8AdkilI1y1xYvm3w+ef3Wjyc5ib/3JsYn3/LkgD5K8JChfTA51BGH8wdlUhDmbzSnodXz4KsKhtY35A7XauBIv+7d5eT2dw0TD+AmBhyKeODiZ3JdSIRqTIJKPyHtE8lnYk7SsSXohyy66dtEr3H78JIMAC3X67wjcZvWPL9Ul+qpM2Y2cf04yjQJGJ9sCvUcgTMJpRJDOSOWhs3mM5gEZ8vFov5AhRHTcgzbLU6hq4vl0ukygvG4tb5XxxQMfARIGNnWPxNDhMXl+XxMnqKVPU7ImhKmc0dDwnmAUIdCZh4vc1muVzcXl+9evni1as3d/2B63pwc8V86QfCAQq0UuH9x6/xLEptns9I8kcR7cRgXQyktrSEkCzSZ3eGWJP7xt8oCi4GxqF+tZjGcaEx6nWQAXv69Gmn23GKBUM5K7d61pRFSQ+LAOtsKuanF0lP+G6g0m/qju3bp9b2gPBXaiqljQfW4omVT8e4fgDSyeb4pYM8UH0eJy/I8gsLhUK70zk7P1+t169ev54v5khnDzF10fOEgxLIluhkR6pqqqexVUq+K5Z6R8l4HKXK2Y7Dv63jIAeDfwWF6bEIoApWoM/I9wPdMH0/BA3rxeLi3buXL16cP/mqWCybRpkPXFYVjBVAjQcuZYTGDuS8mhlfDCZ8YDTsgdfLAQOFeoRhVJtOp4VCYbVa2ZZN8ACTSahxpZn1en13B9l3rVarVquRGs1DQJq6EuXbUKracm1jNcez9RI+SEonFR8jNIiVMzA2uFgu1us1oSYMwdG+pONSLBZbzdbh0eERIMKjVrNlO3axBKmDFEvM7YMEyeI1gxCl4KSino3vQzlCoIkq+5UScnDkc8YsyaJMDQi/v9wEJ2oowV3+E2F+ykg0dKNcKne73T/8/g8//PDD+fk55g2isg6/yzsCgxx55n6gq9hxjYljPqwOwb59Cm2HTFQqxkZEP94Sf6rF9qEhCB3gBydEaB7sIsLvlm2Htg1h+UajUW9Adrtj25fX15MZzgORBn4xkaEhqsnBgganR91uGQxJz7cx4TNRKl7Ri+QihrEUCoVuJxKqqGHCrZyRUqH4Wtr5knKl0u/Z+0CmARkIAWA3TY+MSIeK8oFpGL7ur1ab2Wy+AVWeDQopB0FofmM1Gg2oTBiJwvOYCbITE8pEAEPWgwWJGOFFjq8aSU5MTyUuuCU+YYV77Dt5uXF+h44jCBZlI7mPjAKwQHvZrGeT0e3NzU8//fQff/7bYDTGmDANB9aDxScHlw6UhEje6PTwJkaZV1bJNJr46DaI7Mp481heiLn22IQZC/QIcyvO3oH0WSEUpOt6tVI9OT558vhJQxBbxCIG69TWd1Oha2TAYWVn2ZsEUIwj2vQNv3/79sm2PSD81Rp7LVVWAJmbBKkU9xoLFiFlgyguWWsGQZSBtcJDkJdxCsVGs1mv17qdzu1gAIJX4KgCExU1fymwoDyOikKQJVwxTgJOjRRw4PZ0anrb0WLlUrVaqaPhIoezLWxjFkRU0wBi6HqzgfnfMOxbqPs9vL2u12pxEECIc/F62TRKasxYUBJ7wTj5zNOZpoyiCf65z0879BWzWz4kYsMz3BAFEV+UzH3dAIYksitJOARPShlxmqatVqt+v49RNRREISE4klR5z9UxX6e8XzEVJwcwPDyLjAfHeJDQNM3lEnSbbm9v7+7uxuPx7c3tdDp1XReNAERNngfeYtOS6ZSY6VetVZutZrPerNfrjUajXC6j1igVb8yKweLQrddQwQLUDm0byx7OZhCTXC6X19fXs9kMEgtBCRyKNyBlFAmrPELI1WUQWFJQkZfD5kFIHjkkoiYOAv8GP2OtakwyMQyjXCnX6/Vnz5598803T58+7fV6iIoR/ZKm6I5bwO9RJpEsEZkkX0A8bsz6Tzwkn/v7/E/Wks9GyqhNOf2SbM/MXEfhNcrFeGAf4lfDNNWMAEtMowmpvyDpZoqMd+AOXLnuBsilsBdkx6EWFC5EQYhsZ5mwIKJJqttKc07S7GQPVWUAZjnQaozCpTs7nhCaUUEpEYcRMFUdMy7eoDiqMsOew2xIF0TsRNRU8T+mKaP9LPKpBaGvRVGpVEaQtXFdU8huDjwhwOMFL1++FCKWThj4j5581Wy1gyAQUmSm58H0QsAjK44taznimiIrGCdCxxhwJUa8/B485yg5IMc8EaajmUQoikqV0fiJgrEhjBe46+VsOhj0L968fvP6LawD/SFgXdcVdFbYFadrWvhAcYdzfmO6WFwxhN+4xP9sv73y1qorQjVCOrSK8qXxm6R0is01TZeKr4JcgjR+kBg1zWIRZM/Oz8+Pjo9r9Vq5UgEmi+1AtU7RsqYCXghGSVElUYYHKRNSmmBKy4fP6oiBvwgX/Bfc9oDw12mq2oyeKaQrifvgmopfG0anVtJPpFKdOCzG2ZXAF8iNFpxGo3EKYhW9d9fXk/F4s3EEjU2wzCgbmDuTFGslHTrgHkUu2okt7uqHpwMzhycdjR9bxBlQ8RnmHcgoDKPReHpxeX17c907Oi7XGnAtuhb4vs0kTMjmg4UEVl9wJSqrljugYrkRJenM6YXMu7wr3+TzaPxB2u5RTmRk7b5k9JoTbLNtuy5arVabTCap4gG4NKaCThRqm81m4/EY4RMm5iFI+IhGpF/MM+GpI9xH8EERQs6WRMgHNegXwBTF2Gb/vj+ZTlarled5uIEf+KCKJJplyuJ+hmHg+tputbsH3Xaz3Ww0a7UaKbalqjxnbwoODgYGF/PFoD+4u4US2UhVhQEkLTuF61IjQwZK6oyccZqFiGTt8eAhN9QQOiKep/yfSqXS6XR+/P2P//W//tfvf/j+4OAAjQxuoOwY/1wpUb5BniGS8N3wEPG+fe6NSy8mF470fKas7K3RRWxp1+fOhotjXCMBS6vZmL5r66d6sVgoFAqWDUXtwyiaz6FAKE5lwlcCdSik51eRg+KwHVavZ1FOMpsVkJSbZeq0xT6RHX3HvRNxQumK5kOhXEUx1xL7STGtnNPwFzhJP8GFVxeadjCTgL8LJe10zQ/85Wp1dXXjghvQHY+HruednT8+OOiZ5fJ6vUaESXnFuQ2md3EKHYhRCUybpQ9wr1Z2vBAGi8AjGTrKRCPbBCEyeKeBmgHi0qvleDR4+/btm4t394MRFqEHQ8UD7zswS1MdFoeh4hE8Sk02Ydyf3PSbxKESF8DjyRS0xeIZfGNOoZcviTojBMOTC7RpmMVCsdNunxyfHB72qrUaJoPIIoaZmy4PRdFN9SSox1kNJiI/Vc9DuXEph+nzNrT+GdoeEP5KjQGqmLFISlcxcYMwYgp8SdHq7IHFXAs+G3LY+45Xr9dPT04ur66nk4m7cVEUUdMg7BYZCeVAdooM54YChEQpiLcUfNOMUtqDBoLzxOLZTNqayvSE+GgQhaYBqtWBD9GM9WZzez948+bioHdUrFQtyy4Ie1oGVXNOJc4ikvplLrwEBkkyUZJ7A3dHzaRfGHeUWjZamLrSh1wyZbIZhlGtVpuijUaj5XJJFdURGcbFCYRoEO6CDtfFYtHv94fDYalUIjWUXO/jL7lSdLPzL9+7I7ctUDIUhPLW6/F4PBgMri6vbm5vUE8C8RhWnRLCA3I8ETajKGipVGq1Wr1e77B32G61S+US5g3aDqspn+kUGQeEotfr9WAwePfu3cXFxeXlJcZXOT2Jv1x0ZGIEENJLZRtyNEiwjUcIqT+4MSpJpKxqjIhCcLjgNFvNP/7LH//t3/7t+x++b7fbGDzEACblEO6+CynDiMhXKb9ych8lUZ+8idwjsG+faUsEOmIiZcI2jR9UdbvTExpbrh4+w2AEz+TVEeRr5YeRVqvVCwXHsi3TtnwAgdbd3f1sPl+v11EUOY7teRA1kr3woW4FZvIjdzTGeYyXKBBPymMamw1xyPNBLg+xXyz1KP9NZniwi41HOvZaS7CUopPGBCJV4jzmjyC5HYpIpV9DD/xlkygCYshmA3nXrrdYLjVNOz4+dhzH9yPLQg4VWgI5nqO4+AVzWqEhlGFFMgKTVMyhaUI6BwXfHT1/goMqkDCDbGoYhVho4Pub1eL+7ublixeoLLpcuz4wMuD3QHg/+WSVKh+Y9VNgODb+4723lgUT+DYUR5YFM/AGZhxnuBqqUC/8F4RCHkyFBLBmLCxYzdYZhAePavU6TOCyRqKom8IxtjIdldKvypflMVDyz3JfCC2y4hBqk337pNseEP5qLbN6sZ+I7S5y39A3l8qJArY3fMCXMOH6ES5GKRni+55lO6VKpdnuHB/2Li4vRc0kw3accL0xLTMIRLFUOQGC9crIn4RMMQuL9Zabp8wVFDMXkmyshItO/SPpLwkGF51CQWTJZFBagrYD/lVN6w9HtUplNBr/x1/+1my1G612o97QQqApbjYbEMeybchTZxM99hJ5C0nSmKxHr2bXOB+D0zhSIZHPvaVokynqb8pyei93NEaDOvBMHMc5ODh4+/YtSKSUQN5WLO0CICUzVngkdrPZDAaDu7u76+trFBUQ+SRqkd4++FvIKvHlxFWJhXheKvT93rEifEXl+EwTaiujpuj19fXNzQ1SRmez2WazQUAocaAJ2S0Iq5AeiTXZ222IClar1XK5DNC5BVkZgAlFwXpU26OzY28x5Igx2DAMkap6cXHx888/v3z1cjAYLFdLBIQcvlLWE5JC0deOx+RgLxUDpPhktjwjDZ2s2c3IqHgo7CEESSyrWCraln12evbNN988e/as2wFhOpQbxXgy0Y2EWzpn8HNR6I4gYeIDzUWpqMUeDX4Rbbf/MfeRyDw/MZyJ/a4qkLa70SSDz7yozS6IErbTbnefPAk81yuXyz///PLi4uL+3jXLpcViaegB6LqBYxMee+G9jTwQXZHVM8QUFTtasbNSxya2n1kUKHbNyO+T2Q+pEYNiDbLCscqvY+Au3pAHrBITQJzcAolw+J2qV4ddEszD2H8URy+FhAF6qyMtEvE1PzAtCzIJC44fhF4QTmdzECCdzX/88fcnJyelUtkEN3Dgep5pGqL0Yzwvpe4FGDDiwlDSM65ggXFP0QvCosygkjmHyLklpR8c2CjUxBQeu+ECMQkLOwt4LP3+/fXN9eX17avXb+7u7+fzhQ/JEUBywbJAcGok5Gs6KPmp7BQcx7TzL85dkWYIla3Ofwrpe4bwiYDGHdnZhZLovhhCN5XfUGiLxuKi1Wq1WCg0W80nTx73er1KuSyYLiAYy8VF4yPL0VZAUfwm+Ks4bFSIKH4icR+uOyoH4Iuwtb7gtgeEv34jj1rW+JYVUcnfJmnXCfiX89ZAJh2SMjTHKQi50fLp2dlsOr0bDOeLmef7nutZlgnyLYahKQc/cxOmrS6gPWAfyMuX0RJNpmdsYRHIPAbG01Nbx+WDKErKPWNyOg40XZizmub6/myxuLq+/fnnF72Dg4PegVMsbdyNPIZpaaBbJhcqGlicmKhjyM9R2YyxF5ADFebJonz0L2GeymI//D557XHbgQkx3w+NANM0K5VKu90+PDwcDoeWCVXp0fpH8MBhIUWlcA1erVaoNdput2u1GkIvzDzcAcVT0fO0JYe3m9hSMnE1ccm7G6XYIUHI87wgCCaTyfX19evXry/eXtze3fb7/fl8DlRSzw2g3JaHRoc4oaQ8oeJOqVSqVquddqfb7SK3tlKpQNlAscpKXJS8BAK0mA2IDNvlcnl5efnTTz+9ePHi/v5+Op2u12tM1KTagxSc5Ng+JgIxVfdshJDfoFSqHo89cmsglXNo2aA6i7Kif/zjHx89elStVnlYMgHLt7xSqVzBbch/KwCQmlxfwgu7b6mWihLH4Cgpf00JcHkzW4JeqB7uBwXb+Asl3hRT5KqB/8WqWEdHhmWZtXqtWq21282XL17e3fcLTmE8GXuuq1uWB8GxyI+0UBdlGyjIic5LWMJVWIkuhOeJSU9smjjABiQFEOJeI7CMUwTjSKEM6Kk1OfViyf2pIoVyXPM7ImmBbOd4hLEnvuehVIl86QNfM0BRBkTF7u8Xy+V8vhiPp5uNu95snjx5Ylrmer1R8tQwaW0D66hhjRmbIQjYYH+E51z2XQ6GRIOQCUk6MSAdQ8hEav6oeUlOfFhcXmQORiImvF6t7u/ufv75xU8vXt31h4vlEpCunKUDQSuFovXkWKdxYeHrOLGOYTSqRLZricLxzX8u3//80uayb2SyxXkCkpqslcuV3sHBo0ePOt2OLfgdWSdyfMBcoyLxkCh9o3hPuTnz4rGKHPv2qbY9IPyVWww1Eg7sFJGRyZlwT9z2wwoDFPn68KfjFJqt9unZ2VfD4WA0EJEGWSlbqHsJA13XwfUlX8tY4iXOGkJMRdIRiRPSqpLmjaQ8UvTCC+65wrkZP5Y6hJKfUr4+FLP2odigA0vIxp0tFi9fv2k2G52Drmk55XrDcSC4JFLlQSUslxzI+EJMEjlBIEp75cTyoLZVJPfP1M7ckVGzLWMhhR5zN5CZq6ZZKpUQEzabzf6gD2JklhVpkR2Bx5RCbbgjxa80KNjlTafTu7u7TqdTq9XK5TJCCKSVPmSlk9Z/qgIuv/APoaKkXgHU8NxsNrPZ7O3bt3/961+vLq+urq/Apb2Yg8C6bngu5O8BgBRp/LCwCvImDkuxWGw2m51Op3vQbbVagAarlWKpaNkAmzku4qIvvNoepg6ORqNXr1799a9//emnn66urxbzxWq9cl2X3Nu4fWrQeHV7Hv1DZMid7rgjOrn5CGQT+Sg2mAoeGoZRcArHx8ffPv/222+/PT46LpdAVtRxHNIgRT/7A8f/4fGfBNRMSst8rm/svm1reu6KGnvumHj39qYobQiJpIjKlqSM+EwqVEVvk1hzDSy1Wq3WbNuqQKu2261Ws/Xi5cvZbGpdGtPJBErnRms/8E0LX5wQ2CxK5iQGfsjZUfKXaknk8I4WKTShUUyEX5hk7bHkfoKZDCahGSJNERVtzKBBOmxm+InrqkYxjjGC4KVYyFHKHKJk2EVEnmhoGIGvuZHn+4ADV2sXSBZQscO2bPMRFPYQfB8+JchywXk3BaEdhFrFEBJxXMJAyq9OjkMsLyr7L+cLdhqUuYMgIXjSF/P59eXlzz///NPPL6+ub1ertYh/WlG4wW3RMUfRxaSRAzUl4gyZWK89rv+YurAUNoz3ZLAwywvlj0JeN+RzpdZj8QiFws4yTKjwbEN1zYODg3NAg11k7gBFRdzNreKidJMSWgzS104lJXhOLO6kwrfvefX27RNpe0D4KzcOQfADvDbSjKO3XswWakoHanvsWMk66eTh8EgYzYiAa2k3W+1Oq91pd+/uB+XVyvU8GTQDsooWeC55GkNfUi9SMBUnMllKnryv6iISxhaaw3SEDAmHEQzSfc+KncTRCeF2M0wzDHx3A1Jdg8Gw6Nhv3777f//f/x7q5tfPn+s1M4w0UZ4eZl2xTuNzS0uUmvUVZYZNYjgh8zuSkJaR7mNWxPBLaqls0lSweneMDvMAcTMsYnt4ePj27dtSsYTcEvQ7kE89lXWGJMxqtbpeQ0HCfr/fBjOqZds2l8fcrTHDs4ZS36gtZG+p2zuOlqqwh8FP3/eHw+GbN2/+9re/vX379t3lO1DBcWXxCT+AFMHQDZESZhqCiukANIJltXvgFJxWq4WlGlugMdosl8vwmxBlTems4EkRPItPUmJ0OBi+fvP6r3/765/+9Ke7u7v5fL5arTabDaJQ13PBKQ0F0DwoPcbIn9QIB1KcEL/kw4snRTROQV0q582PibUlUFFWaANCQNg0zWazCYDwu2+ffvW0WCyiVB2xjFBc9CEc7N3YL2vrpGgL8U9f3hv7T9/onqYeAPQ8xv4LzIliO+YzIDCkpaDLR3QHXxkRIwoMwyqVqsfHJ6ViqVarOo51eXXpbtaGYUynU88zC05hvV7zHF0oVSfWe7nSCxIjLIgJXALgiixqcb2oDKfCO0K7RSyX4j8gOPj8cpnTKbY6MEak3m624KdmUBpRZdwTN5F5WdlQQzaYUHQTGiS4uKJXq1QqidHWQsjK1nxDcExsbeN611fXngc8JnfjrlbrJ0+e1Ou1ogVpmaHr6ZrmFAqYCk00h9RdYDNoDE5wTBBw0VSmKKN6FMERSQhUDgPZBaIgA6RChkEUBrPp5Pbm9vXr1y9fvrq7u5tOJ6LwrIs5eDhn4+MpxeFVzmLS4S1jbOo8kqeV48LIokGFr+goHMFnn93Uw8+106GjYhBxPkfFL4DillkqlprNZq/XOz46borywoVCAWwqSfaP1wuJsJOLV/K1ij9gj6nrCcTIf9q3T7vtAeFvTXpRH0RSbVw9R0YJmcoMC3PlrFxKxIIIWo4NcqPn54/u7+6G/cFsNnds2/dkUThipbKcQHXydB3ReOHFxUj4UmOiAwOojL0nv5WK8AkfFSf3xA6veCrm3ixRfELNZyA3GkTr9V1/4NhOseh0u51Ot1Ou1izdXq/XpVIR8wNpUNQ4gwi1EvhS0SR1DiqJI8O0Ge0fmvRiUuvnbGdmh5qtlGlwuANEcXmSQqEQRVFHtEqlghXqpaSKCTAgUdFLHA9Rh+vJIgrD4XA0Gp2dnaEwKcmOv/9a1GKLWtb8MeO86wc2fMyQKYpGzGKxGA6HFxcXb9++vQbZXtAUBY8qmgBhhBKpaJXhgNiiQakJB/IxWq3W0dHR8fFxu9MuV6AMPbpd+e2QZ4ekJDAv/MD3Xd/13Nlsdn11fXFx8ac//+nVq1e3d7fz+Rw4rK7sHhQlVBLnOBQIMrmgKGbxUUOLKqVrSkCUPxWpCC3H9mgccEBYLpcPDw+///77b775pnfQq1QqZD2kYrY7Bp8+bMOEHD/nQIL3Yf59+yIblR5JZRzQrzwikyeSJv/3Qx8d8pIIWAjZUuLrmm07pVJJ8HRa8J68fCVAEfxqO46hpEdk+XFRilfXDKioJyCaUkqjbkpnJHWajHBEg/g241XKWUlwFrYMVIwMYZJM5OblxudjBLItHsWd1BK6YOBOlRfGldQTLmmJh+VrroUBhFhhNbi9RfkuMa15T7962jYNMzDxAiGPAJnwwoGecyMk+SoyjDhUCNgPUv94SnxiDqHdsWielJSR/gSRJQokEd9zYSru391ev3t3e30zGo3X6w3aEWGEyZHQhCC8RNqSUcT0CHiITI6UvAlp/zlPIySaEkdfuPoyzxe/XfFTwl2NtMRLDCo5ODgIsKUvKn+USqV2u31+dn52dtZqtZyCg/0LtdCA/JucpgRa8eTSZRAPbzLGIOMeXOFpC6Ddt0+w7QHhr9/iGJpEZQG+NzKRnG0o/lWsFjLXRU2dXOoMaUjAO+/YnmvV6rXjo+NHZwAI1+s1cMzE/IibCb0WmmIUlkoemCQmFDBKcHJoJdgGHpQnUpnlslJRvoGo9K9wQ6RwwAyD4AFDUpplrtabu8GgedN4+eJFuwOAsN05sCxbFBGKNC0dU0qfAj2awLVjIDi2J+j0qaRC2AJTEN9LLvoEG18bttnNucmE2yxsghwUJCyXywcHB+12u9/vr1dQolCWIozicnO4yoa6LDIB2XeCkzmZTPr9/mQyQTyJ1ky2CNX2y0tHnj8IGPD1LIrAcMHqiJv15urq6ucXP19dXfX7fZSQCXzAbJAqIo06eHIA7gZhoMOaWgTMV6yK1u60wdt6fNxut+H7IpShJ/1PkqSTGCwCblIYhZv1Zj6fTyfTi4uLn3766e3bt69ev5pMJ8vl0nUhsC/KW6j/hOYBpfZhI+zHm+M4CN4ww5MDPyr7QaqklIioxDCk14AcTxjxwzTRRqPR6/WePXv27bffdg+6cK6CQ8kptO/uW5DLEE6FBFM4MPvhgWmi+/ZltHhCS9TOk66ilKAUNWIO4lwvvXwSNErM8N5T0+xEEXjU+8US3siSsCwT4mXiPQjDaDab67rukuBTFAUCyYmiBUC0pPQMcqyqGhGxLa0uPH7dFflc9F43tBA1BYLcVyE1U1L58lRgLT4Lwxdqj5iPwb9kJCCiOAn0JeVzYB1nbzH86mOteRGgC4Kl593IiUhpdFWrNdMyCwWobkraO1Cnkava0JiJMcBqU5gwiEaNNG8UqCZkmCTAcle40pcJcXlyV8vF4P7+3buLN29fz2YzzwOBWTVumkghhGHDeK94rtA3EDsp1K2LHyxepT2d2CBvpawRwmv4ERqMSfi0FyK95LObgr6UBcBSEjTD8A1B9wA02Go/fvT4/Py83WkXiuC4BGeHCTFwOglxQeMnZjdllBIZGA92P01/jm0PCH+rlhDr5LMEYRDxIktHnniXoBSDmINQxjotBSmWFiH8CHQUXzcsx6nUatVardlo1Kq1SqG0NJeO7Sy9pZwRpNxmPBvx3HFaK2SKhajsl6ThZC4qD2ykmKXxNwproVK//I46IPICpKMuAJIHyI4JH6xh+KvN5ub2tlYpPXn6ZDS4LxYLpVJFiJLZmh7YyjWV7Al0HadDlaKo+qcLokvs1FMJ6IKzp6KmQhVDrAOfHRqklsoHS0UFKVqYUjzaCvVVeS4sQ1cul2u1WqfTQQxAnE8MFYIbNQSKI5kFmAJn2/ZoNCqVStPpdDAYYGVzjDulWKb5jTkakmkgHzAmvBIGpkysVqvhcHh7e/vu3bury6u3b98iU1TWJhb2HD63iIig3IIFZSRs2240Go7jNOqNVrt1fHR8enp6eHiIleiLxaIoVo+lq2NZF4iLAhYENOi53nKxvLu9+9Of/vTixYur66u7+7vpdAqVu4BPtXI9FyOTmJ+Jh4KERhYA1DStUqmg5dBoNpDOCmcXoVfHccg4QNAunPQyZxId+XhPURMI00yCUJZWsywLSxgjJqxWq0dHR0+fPv3uu++63S7MOLUaaQuJM0P45L1k0VyCKH8AtlF/Uw/JPkj4T9RiodAkRVIFZMgOZ3VzlZh2jCTlRh/tTSDVTWGm22LZsqu1+uHhcRQGi/l8PputV0vDgNdK03XbcTx3g4tpoGkW6MBBllos689oNDFTSHHraNlXNrYKISmLAnGipMKmVf4T3tgEQwFz7WILBFGJPJXaXnKWcA9VUUOgPuwfQg6l3xa7uhkOEXnFUHxDNwyYZ0zT8z2xdmu3t7ee63qeu1wtx5PRs2ffdDodyNVUV1cqlXBGEhOdtFH4VSL6gxNhuhzeINTuUl6AxD6KbCwHDQuri6FAFuhmvby/hQLIo9Fotd6AoNdsJuiiru/5YRBA5wCCxgZFfPdQ51rhP6h5qOZ84kapvD41yiqsmhY2kHkrCQEY7h5AjrSKGiR2IrTG3XxCWxT+xIrztVoN68eenJ6ePzrvdDpCrFASSmlZYRwcFeTdwYATQx+/VkpiMIGOU5UZ9+0TbntA+Fu1WCkYaW/kXGMU0RiyiMkQKxcJj8tW00e6DIWCMKTeheHp+RkUs16sxuPJZDpdQjldC6xzZPAjQFKJvXhCWcpGZpvzmQpjmlKdbNul5eR/573oSoyM/a02TshR0TGVLyqAKuHeeLF68+7q559+Ojk/63Q6jlMUoRLQ/Ye9sh5EsT4B/1TNsarcMZxN6JFiMn9c2CPpSVQhUpWvoH2GjcdbduQNPrAgISV/Ik6wbbvdAa3R3kFvMpn4HqAL4m2KNDcRehLMEzLxV6tVsVicTqf39/ej0ajb7WIEjDLcHjTU6iH9iLQxnrlHNf3m8/mgP7i4uHj9+vXl1eVwOJzP577nuxvIG0SzhgiWuiEqLgqoV3AKxSKEB7sH3bOzs0fnj3q9XrfbLZfLgI4MqNSXWs1liksQ4oht1pvRaHTx9uLVq1cX7y76g/58Nl8tV57vYfwQ0SAJkPKagRQxII3TQqFQr0EhqWKhWCwVKVRI5Fg4qe+tViuEgqvVivqGyVFSE8iA/9AmILIohkOPjo5ARubbb58+fXp8fFwS1UETWaNpoy09/tmHLRsYTD2ftBlP+3wv5ty3L63xGA9bO2VsSzwRyqcqsxcov4sI5+ogH2mR4mOuC21hlYOA7Am91e7YIB9lwstXKr15+1bXtfv7/nq9sQDYwISjw5yDzAkN2I6CTIk18WJBbF7zHTFPrFMpu4BXSpevTIt4nU6RRFjnVfKlwEIKwan4ajobDVdLCQhj2fO01qvqsQQ1MrKFX0OJQjFtSjeWINxCOM6FKe7O77tiIprPZ/P57Jtn30A5inK5XKlilSnTskDMB/bLt4DwzII7Ki9Z1hjEoeUsLRYgxQ+huH9QVBAFnD13tVzOZ7P5bDYBE2oCDjlQwBENFjVR6ViWTYx9xbEhocyKLYzc5LO05QuyFeMpjt1ouvTcJ5jfcRwRdbHCf6EOjEng5+fn3zx7dnR0VCwV0ZTix8l2OMluTfrvVNd1woSqDL1I8ZDbJKLM+/Zptz0g/A0bvd7gXkpY6nKiTk0fMv94Zx4brEmmKfnluh6USu1Od7PeLJer27u7yXSyWq/IjgTDEQqgico8YdrSiruXJAbwtzjuHmMRxBLY1Me8OVD4zmhdS0TdUmsYeiJFErgAsWHoQY5VcDecvHj5+uvn76DcmVOwbSc0oIRQGEUG0GZSQ6TyIzmfReVnIFjMzNXS94y5AHFShPZ5t1x5Rs73yE7925AhT0UzTbNer3e73aOjI+HoRYgBgSZcEgh60cNjGAaSM5fL5WAwuL29PTg4aLVaECc0dCuU+Ye/nZXPLx+XeABFy9X19TUyRa+urwaDARR4ECYAokFKtxMhOVhTTdOEuoIQk6/U6/WD7sHR8dHjx4+PDo+g9mCpXHAKJuBB5ttlJU+iMPKhOAwAztlsdnl5+bef/jYYDmaz2Wq5kjBVAEBIa1H6MRTbxHIdvMBgoQC4FGO2BwcHpTL8V6lUsMPFYlGmGmkRBB5dCDwuFov1ej2ZTObzOd5ToKcq8UYC/8RHhShoo3FwcPDkyZPvv//+0aNH7XYb0SAPLe6mcWYfv1xkmHoG9tTQfdvW4urb6ek8RZZkIUPmCPyICYdxR81Q1kiAd0RUxgWnjGlaxWJJVJypXVxeOrY5GI7Wa2+9hiKitm0LHbjI0ET9O3wRRL0kRbMA0qmK2jGqK/0/hTwVxKEAaSzAmhknWtSFeAr+gWBJutbU9IRohHmB43LF0m3MSmHR66wk3GS3Y6iGVEwlPalrFn6DIU3PMExY3EUmIai2rNcbENBad7vdTrdXq9c1QwsDH6pMCXSHSS25N0VyR5HKIUTTheMNK6yLvsmPwoMucbfotZLFhlRudzOfTcej4Xw+m0wAEgoBPkmylwMo/kNaLGWhsBA0Bv2UsZN4KlMU3dhLESNuumEZPyL9kLipbPscQBgEqKIEYFAXOQ4mSLjpul6r1c/Pzr/++uve4WG5XBYPsM2PkLUByFWe/ibuWM6jlw5/7Nvn0/aA8LdqcUpVSjFPEi60rMiHMP6w4iBkn6fmh9ShA/BhQUl3u2A3O62jo8ODg27hJejda1LnTM78pGpIdIv08UieOemYx0+cnMMFaOQkiInziTdfLStqQcPSi0Tul4x/IYEGyRWC+yHqfYMJDuFBkPGIpuNxp9UYjCZ/+/OfDw+PKo12pQaux0iLfN9DG90U3Dw2MDFRVUltKzehjCiykY/rU0jyA6Aa6ap7T+jss2jbUrB4iXPaeEc6nyFoP7ioFJxCt9vFEgvLJZRN11c66cTgB4wTEgBDMIMFDy4uLs7OzpBKSmGl3wgT0quHxgeiKVeIB1xfX7969erq6uri3cVoOALtO9cFv7DnWVBPTF4s8SclFKxWisUiqIm2WsfHx48ePTo7PWs2QFa0XIH11TKBWUovLr4Q6IcWhDGgk03Gk4t3FxcXF9Pp9ObmRogTgtccWxRF2BfUUuel54nbg4mCxWKxd9jrdrrtdhuE8KvVQrFQLpcdG361HbnSaxHcEc/z1uv1fD4fDoeVSuUeqi1DyrFlWRQyRQCMJ0KVmkql0uv1zs/Pnz179uj8UbfbrVarFJkkltFDEkGzRdWycWzcctuHz/1l3Ldf2mJ9M8H4kBN1Wq+DW6vxchYz2hK6iO8V1so2olmCAwXWa5jbKtVaT9dLZRBsLFertm2V3l3d3/cFpaXg+56mQYQfJwEpNYPuGmjIOUzCBlrH5AKLeyQulgoIk3M5NV641Cfze+PlmyJ6qcU6AVLkwWOvrvLdSs+wOpjsP2hVYgqIglIW6IfDcmCLvHGRGxjCqq3rw+EIkvdWa8/1xuPxV19/dTgen56d1RtNxy4YIewLOQi6AUXV47I67CoEzIvFk6WSqMxalMu/+FO6fYWJBZ0glYAomE4ms9lsNl/0+/3BcDSdL4BmtV5DVUmZzqcD61dYO0hsFWxYORxE0YSyDbEsQeKGZP+Q5hMztzggTN2FtOlFCZwkxCCqWyN7GC0iXUiG4jReKpY0XSsWC81G4+zs/PT0tNlslMqlShmK5RLZJP9pVzRl6hIh4dizLEtVsocs1hRN0KH37dNve0D427YUQ0/M0xiPkiiLatqgjpl63yUpIhcMStUHExKBReCi2GjoRyfHX3/91ZuLt/f9u42zAQeXaQLDUuQcisKuOInF7sGU1ZUCgQSTcviTYrrFwjtURzfuYeyylDNyKprIHF0iK1LwcGh9kSBZAyXG5dodTeeXVzdXl++Ojk873QPDMNerdakMc1zueBMsjGvDykxKllAuPH1SZoecncwPirfgs8aEqRjLjsgMtm0XSxIjaFhYllWr1Y6OjhqNRr/fx2Llnu/hosvtGin2jVqjIkI1m83u7u5ub2+fPHmCG3ieh07K3wgNYp+RKYrfbzabxWJxf39/d3d3f38/mUwWywXQRAUuguhcJOsxUGg0lmyxnXK53Gw0T09Onzx5cnJyghEzxGCwvcBHKeMM+bEIMpfL5Ww+GwwG/UF/NB6tweyAREEgdSqOEn5AoIWHIslQEpQql8vHR8dfffXV+TmkgkCIslzGGCamO0q8bYD7CY+5Wq+Wy2W73Z5NZ6Vi6e7ubrWCb7BvfuDTqo1o07btZrP57Nmzp0+fPnr06OT0BBMUeSGNh98LHn7MMkWpfb6v27795o2DmjhZTsa4EmsZ8T7iFQ0TCdKkkmzS3Xsbsi+lE0SkeIC+G1T2NorFkmU7lWq1Vq9WquVqtWQY+mSy8DzLhzJ3uu4JHBKEGtQ5EOgCs+upi9hhInSS+qRcEmO6qKoJDGwacaiEl5lWQfmNZMvwEZTcc/GnQJrxoeNT4s6MG0RrfRzjUmUOErYKUQppYZdEEk0HGR4xIduWtXHd0WTyl7/9NAbJscHjR+eLxfzs7NHh0ZHtFOeLhW1bmNsPNCcZqYzdT4h447wGXSbIiNSb2AZJWztiiFVCte9uNrPpdDwa3d31h5PJcrNRCtPorEY/HX8OE44t6VlWZk/KFtrGIOXwm+wNgoN8fJmBwjpANGPm6SBusMxARFkakXzuOHa5XDnsHT46Pzs6Omw0IQceu43u2q1POz9jxk3OuaxMGkfdevWo7dHgZ9T2gPA3bynThwQ5BPE9jhDipM2lxpheVvqAMEUaMkcQoxClSuXo5Pjxkye3t7cbDwQkMC5oGmZkRjpQCGQYkMgdONVyE01KSkrhFQVcWRdo2ZCZ5RnWa7Kj9I/6M15v8DDCzynYonR0OLJIbTI1zfP95Xo9ms4u3l70ekeNVrvR6pgWlP6V9q4qopg3SPG1qtKpaipXLizOOpKUUcUqekiK3affdjP6Uh7KHY3wCcqN1Gq1drt9e3srBNkAzti2vd6sU48KHl+mavg+Bqlubm6ur6+Pjo6azSbhzF93nOmx5NmDaAFMp9O7u7s+eIMBkkGlQdFSG0tfsnC4UNCsUq20W+2D3sGj80dHR0e1Wg2AkyjuRFEyfhUk6IKippvNZjAYXF5e9gd9KMIxHiEaRASIZ4cPwkakKCsdjbpRLpdPT0+fPXv2+x9/f3JyUqmCo1fWksLeCtqqqJEhi9ELpVJ/tVo1Go3VclWpVirVynw2n06n2DGQsVGXj6kmkCTZ7T5//vzk5AT1cqgQBdHRH37XaHhTrHUetf617v6+ffEtxS6OP3AOX3LloUhFTkhQqZU+5NT0pqeI8aKiqd2B1ckqlooFKD1T0DXt+uZ+NJqtVmvw8jgQxQp0+E9qPonKgmo5VNBLdUrhQNXFFMKB2BesaqEIDhGqI+4+D0elFgBEgyr1A327ijKz1UeDcCNMLN9sq1Q2ShKAQbk/adAEMraJnPPFcmkMhpv1ZjFfzGfzzQaUn03TbHcPUFQGFnnTBAakEPbUd/rc07xHrn6uVnx0AUBlH9fdbNbTyfju7u7y6nowmcxX643nSTIVcCs8UedDYmCYmc08ewzzUVSMbpdFtKWh6z+RPciCcqkaybmHVkxkmMApW9JHkotplsuVg+7B40ewbFWgfqYT26KBZC2/hynKpEfTYQrJccZIR5xV9EEjsG+fSNsDwr9HS5X1zDXBmWEU5xBKTcVME29ygBYikvGANFar9bpdwEu6oUw3gJfg6QKxCqkABn46gaOwC5SNjUR7coIK36CYBDOgj3kUM3kcktEjD84XZ1ys+FLNDUMxkUHIUdOg4jkQ8ODSIJnqfjh+++7yyVdfzScgVlmt1tabDeRGClSsQYhRqvzzJgFe3HVY/CjzgoaV1izG4mCmxec8r6UyCenxw4vCuB/feNtxCLZRhbpWq1Wr1zRNK5fLy+XSsi3LhmxAjHG5rosABmsV4l5YW2+1Wt3e3k6nUwyOoYAnnmV3hfqHNLpAfM6p9jr2f7lcgpCMyGO8vLwcDobuxl0ulqsVpPBhJC2ApBJZydO2bay6Xi6XbRvqDdZrkD95dnJ2cnrSarYq1Qom1GHcjFeGwP7Q2hwEwXg8nk1nl1eXb9++vbu7AywqUvswCZPXRcQwLF0OMkUxaRA/n5ycPPv62fNvnn/zDQj0lUolWPVR9iYp0kM3GsfE9dx6vT6bzjDWNx6Na/UaitmABmkQAm0bwh1OsVjsdDrHoiEllfIGOVN0B5BLaA9kcl2+DG/Lvn0KLZGkumUew9LguQTRj57n8WU3DN224W0F8rwOc2O5Uu1Eh+vNejFfrNebIMQovadpzsb1oFCCBSsy8CGFuABwYaB+OoIyxDNUYgFWMKheCFgIaIHy3IptnyiTyOQHsp4+zFyTIjw8oUSxaCSLJw75xJwa8uKmuKlqvOXvWYUCAQMFQ1ZwR+UaZFmYm7dcLtFK8T1vuVouV0tYOzZu4Afr9ebp11/DKlOrO1DTFQKDsMgo8ZZkcUV5RtIAg9wTyYelTBVZxlawISAEaFvmau6OBv3haDSeTMbT2eXN7fX1zQykxVwf1iYoK4klH+MSDqj5k9RmA9AKJCfRA9E9UKFhz1ZWuiDnAdXf/0AqDwHBLrWy04BDyDiC2VnM0sVCwRLe23Kx2G42Hz06PzzsVcplmMSVjjTO5rk94nc08+4ksLlyvbNeyed03z6ztgeEv3kj+X4yEOm1YZ8xPJXEUUk3Z/awmAuBjHxQgOx2T87Ozs7Pbu/vUF7eNA0ItwmumdA442+1stWI7q0ik0gQoMUpguUqraAVU0ZUQ+wK7FQxQ+YtutsvR03fkVhCYK0FLAoxms3GXa7dq9v7t2/fPjo/r9bqNpT+tXQ9CgLfMBxDpaLljI+UklHVn+KuKrlVJkhNGRHaF9R2muAfYJ3TT+hcLFfKR0dHrVbL9dxiseh6LkIFDK8RxZF7QLAaexRF8/m8P+ivViuE/fjvrzjq5CUlTVEMjmEG3e3t7c3NzWg0ms6m8wXk0QlFObkZ5exR2h6umMVisV6vHx4ePn78GAW7K5WKbdsEeFJQEGGYzAsMgtVqNZlM7u/vb25u+v0+gsP5Yo5yOzJO6EFRCm5RoWApxQYRYDcaja+efvXD9z88++bZ6empKIkmOZyQPCwuH28ER/L4GY4DdpXtFBzLskaN0Ww2WywWGLylLQuFQrPZPDg46HQ6qJ6KpgOXF/qgvL6stm3qodrDwn37iBZnYaRs6FQog5nO6PLMEc/4cN+EOim4V8EQF4AHXxFR+gXoqVCuFKR/QW5qNJpaFsw1nodxpyDyoTChKBpMXmCZpRGvy0IWU11dosQ5UwlILHDcDZQcr5z1l0L33MDnKjKEG3N8v7IjcXoGf8dxSYV0EARRCkIgdxQbOssw83y1Xt/3+4Ku4K43G0h+fvwI7lcU+Z7nFAow//gGuLy23KqYpgHOYnYxeJki8zEEAj+43iIwLSB94Pb29s3bi7eXV5hZDUzRbBZg6pqTD5i411CyCzqAlaxAFkEO6UOihUrW7sPiiuQE4egQBx2XDITNhm5UK9XDXu/s9LTZasKylXIEp94FdehU1xMpRdI0JXe/fDjFgqWc7h96Mfv2CbQ9IPz7NU6RyhDNcYMPORqqMqvD2iB6UT08Onzy9Omr168lD034tAwRPYBlJoDaAOQfzLXq2EpAoPVBU1UsgiMmIumc2zovJCxDpRoOHzA5G3K5QAk/hDhSFA3H01dv3oLkfaVimFbNNK1yRQioJimt2U6xRG8K/MWln1gHE3meD6vK8Om3lM3Nven4dUpJaMdxKCKEpRcODg66ve5yBRG2jYh2IZkQU+Yo4sfsDUmD3Gw2w8FwOBw2m03ThGgwbAae1V861JwpingMsdZisZhMJ/d398Ph8Pr6+ubmZjafQWxQyHsSoxXRLFbeI4yHEcJWq9Xr9Z48eXJ2dtZqtUqlkiUEBndENUnRNPCD6WR6e3s7HA4Hg8F4PIYRA2oUsFWJU4poOSaKiT8MqHYtmauFQgGyNw+Pnj9//vTp04ODAyg8A4F0WdGRBhytgUgDurgUAhVSN3hkGX4MIzzgYrEIhG2EyBzRb7vdbjabWF2DHMmg/JQEhB9xd6jtmaL79ms1JmIh/hT/JqskyMb/TKSBqZjYw1dhfHRZSi28rZquSbzTbBuGXiwUS6VytVIrlytXVzfX1zfzJTjCCgUHS54aRmyAYR4gxKBkN2SJC5nFICiiOEHIC1ShvVRcNFM6LjE0VMY9hoLIBkqQRRPvJSd+bhmK9LDQvxSIJFtA1A+UczSdBpeMaaSB7qjrAttW1CXWoqh7cOA4BajWYZihZelCl0YHaL/9PmV/QborDJ3oQxCuV8vhoH/x9u2Ll69fv3133x+sVmtd1xzL8lxXmi6iq2xUWTmTTIxMsnzV1K2mu20jlpY1SpNdk50nFZn4apIfxPqp/lDiz0EQWJZVKZWODw8fP3oEaBBSB2EFT509Z7TIP5Eh4koUyGOfKl7AFCMyQ7Rvn0PbA8K/t11O7Dv6Jtdhie+bctvnTRTKQxkGnsgsDwuO0+l2v3n29csXL6bTmVB03ig9NIhRBj7E+gS1D1RM4Ttl+HLNK84SR9yYnyuYXG8lGJQ6YDHIjXPl2Rqc4qKgh9EAkU+TO3TRFB70+61W4+rm7v/73/9HeFxLtgMtcpzNeqMLJptt29vKlClOhbqe+Cqkd5P5OGNoxGfMz9ds5cg2u4qIxgo0JZ/M7HFQbhQzCR3HOT05vb66LpVKxWJxs9kUgNsjn1gK09EHBH4oNT4ej99dvms0G3jjeK8+GmmQR5ykTVG0ZjweY97g9fU1FEIcjibTyaA/WCwBCBEaJPiHZeuxvp/jgIoMyIq2QVb06Oio3W7X6/VSqYTbEFOU00ThSkEbEOq8e543m4Ga+WK+6N/3R6PRYrEYDKDahMhgkRHC2K8fgZuZQoL0L0TtGs1Ou/PNs2/OTs96h71GA0bPMCWNEzkI3A7DD4RvXddF49UPfICXxcJ6vUZI6boQ5sXdS6VSpQJ1NcrlMoUfCfqSpujDY4O53+yrSuzbr9toNY2/4YwX9U2K8ahEQRBypfHhA08t3ggRGxSkSGQYmJZdrdRhdg0jy7KLxYJTKJRKpXfv3s2X9ny+8A3fcRwXZI3hzYJJA4JpKBeJuEMQIKUbEyOGKplNAQ0x6cEf9FYyil9iGcZVmIQDsCAN99YlJ+C0JU+rJHcmqnmG7ACZwMgXERLh5AsQgN4wLBQKlLMtFnpYXAqeE2na24t3wrFlzefzx49B37jd6QK9wTQ8TQf2qS2PLLIM04xHbsBgHgqWFYRBEEG8zWp+d3v3ThShffny5e3t7WQyAXln8N9BFJIXT+KxR4kpk0+RzDnna17G459tKRctqfPxhzZG/kCC5c82RCJTDyHqSsBiIcSobdtGNFivVo8Pj46Pjqq1GphPYqrPiovGyA5Ta5LOcf5o0Yf4picvJwkd9+1zantA+HdteZRRpQGtWBZ8Khehti2uFtSVEUQF0GYWeo/1ev3Ro8c//PDDbD578TNEJ5bLlaf7IoQQQY6QkMxiQMxQf6rJKDnvYHCIVarlF8P7IqAg1pdQtHYxI8S7sfOyjI4EGUVUjMV0CNXEPK7P58ub2/soiopFWFbLpXK1WsUkNAyOyNzI5Cgl/abZWGga6W2lnn6Gni6eZ58XB45viwLG76GMEuBH7FGpVNptKFK/2WzG43GKPJmLBCi1b71eD0dDJCtiYOoXZmySYYEfMDCIeYNY3eHq6urm5mY4HGIVvvl8joXaSdsz97CYs1ev10+OgYuN2qqYy0cDkr5SWLsVYVWUoV8tV+PxWArJjEYToXK+WC48F5RmgNgtNFrJnKAMPVqwMYOx2wGJl9///vdPnj5pNBqgHEPlgNkN4oCQ5BM5j8uxHewkckEdx0GQT4o1lQpU13AcoJXioRAWptz/H/T4ZffaY8J9+9UbCYI9pC4rvhdi8olFZT6OtqdeOlj/TFOUdxJvk1OA2rmVarXZbNYbjcPD+0qldPHu0nGc4RAUrQqOw9Ozoyj0/QBT0LDaRNJnyktpkPJIOvCemcxFKoeasdBDK4CkqK239WrogPJ7OqkaaTXDqD6kHY4K0vAu8eF1XVdOdIhmNS3QhR7yanV3f+d67nK9PjjorpbLx4/ODS0qCCqEZTtCSU43RGWdLTIz/HoEKITZGKwFqMvquovFvH939/Pf/vbXv/7tzcW7wXDoCV0xPCBuiQSr3NHhf+KqJgGhWuM+5ilSrFEMd8fVkFV4kF+mYqMmxhxWXnbfgyCwbatSLh92O08enZ+endaaDadQQIc9iIcBwSrbDWl75dmblFYq+xO7XNg2/BHZt8+u7QHh37UlqBTKpNz97uA0lW+EKXONvFm+6VdrtadPn4xGw/V6FUBmVADUC3UEtvxQN3Z0FfqGyfP5QULKRBRu0eSaqjRkslcklXJkvWD8EosbSYenNPGB+UCFfWdQTVv/819+KhaKtWq1VC4D49AC9WQILW5HFLmojw16HMOM8anS8skSRT7Tlmt/p3x+uy+QUtEQtJTLgMnb7fZ0OoWUvOmUdEco2YxWR8L2CNs8H8rxjcfjTruDFXIJFn7EIPOMQaleIxpwU4fDy8vL29vb65triAouFvP5nIAolf4jiR16PdHDWipBsenDw8OTk5ODg4NKpVIAC08m1OXCbPTzhmG4AeqTu16t+/3+zTUIq47Go/EEwpUSBwooCHmDYRRoAa+5gvrsQqIdGmSAHBw+f/78+++/f/zkcbVaNUBJVGn2CDlRLmnDHLTSaMMr4tFUvDrTAlEHjCIiK7VcLqNKDQYe6cj8ej/iNm2zyPdt33679hCMp9Y1+ddHPOTEHVUvoHRNRiLaLwWKy9VyudJotCoVcLhc3dxqmjaZTMIQ5qswiiyZNA9HCAJRkVjGaZC7QVXVqbeSQ5RSnaNZmnRQ1GSM67hIoYSfhOc1gZ1prHKDhImK6AS6CC0KXMj23mLTJEqoE3YCvzS4tiMh6KVpGii7YNl6waFw3Y0egQxPpEWVegP2tSSx9n2NSmWgyjTMt6PR4M2r1z/97a9//stfX729mEynvtDn85CLG0GWI7KoONxlj0SsVatOEpM+H/7gcZeZPGxcaTMxfJSLGIcKVKco1xH4tyKVFMqLqapF1VK51+k8ffzk7Py80WoJVybmGAo9C4X+EsE9YlSpiKXkY8uSg3HXpTRqkjNKA/Jh6U/79sm0PSD8+zWCZImoenL5iWkDeSH4HWXicGPTNCvQyu12qwLGXXGxsAu+s1h4yGGjWASeXMAwTq6JyZxIL8E5AQ8u0huY+4dcgCpBPJO0gU4vNc0luRapSURQWIWnTXjmkHkTRb5lmm4I4o9CowOu9M9/+WuxUDTt4nc/OI1mJ4w0GwizriZK1ZNqJQ0vDWnChZkIkSVALFrSKabE54gGU0Y8fkcAjS3cUqXsvTYQIjeiDrZEGwwGxELhFeqJZUrFD3RdX61W1Wp1s96shQ57ALWeYg23DxpqnnpBDfmfKCiKZQ+xykW/35/P55PJZLlckp4ncVnDCNyl2H8ki2JQrlQqNRqNbrd7eHjY6/Xq9bqgKju2ZWP9q5QMPXUDKsvruud6g8Hg6urq4vLi7vbu9l4Qk1zQVV9v1iBnKhhluDajEBNyaKkGParIlEvlo+Ojr7/++vHjx+12GyJ7DvwHoJAJfvLOpB6D1JQiRBBgX0dzLBPYv4gYkQqLEBHvXYqM+pCbwp83DgKzIYJ927dfvaWy6bIhndQHSVehxQiz3TBRAg/4gacW3FH40/Og0IJpmKVSBWsjiaB/tN4sDctwN2tDNybTaRBArsdms4FCejqIkOqa74GjB0FdJOoHIwgRU4VcSbGDsv4r5zcqTGgRaFTUTmG+w1GU3HbOtcmpGlM/4g1kscZUbqF0YmEwU/mfECqkB5y/+ylMaFtSjJqKA6GuzMZ1NV1brZa+5wZBaMGMBx6sUqUS+MYCyus5jqFDTFUs/dk5yvOAJ6LqF+phGAwH/at3Fy9f/Pw//uf//NuLF7d398vV2gUECGNLFYDQPc0DYGgGocM6RaeKoXMy+BwPlHzQ0gOdGEYxxKqgSAz8lKAsPZAI2ySvWLgOxR4WDA2uBZBTY9v1WrVeqXbb7Ufn5yenJ/V61RTBWMcpCJYybJwyROX7goZaympKFqlOPzRKSIaLYXyGtKp92wPCfzRlNIuOeCIvGmSkGLG7oSFeKBR6vcP5fDbs3y8kO25tWXYQII0eMqolTpPnVXN4+i1OZAIIJ6Uisidmu7jR1KC8TarmL/6TWZuT9FQ1LwLzQeZPGoYehELADbMsPG8ynV/f3DdqL3uHvcOjw1q9aZnmer0uFBxxmnyDOF5Ck33ILiEYD6TSw5+1ukyqDH1qbVYiCnLQ3uvUSyFGhEydTmc4HFarUNqI57wRxuOn5nXqZ7PZbDpzN7L8HcaBdwWst1wgkUV93xe+ZBcFRafT6WAwuL+/HwwGGMBcLoX+jVBPwS2l4IrQ80Q8Rp5+DHXWarWDg4Ozs7Ner1etVqnoQhxcZr2laoebzWa9XvuePxYVrt69e3dzfTMYgpzMcrGEoo1Q5wFUZGBdx9RHAS9JnRWgoChvWC6Va9XayfHJN8+++frrr3uHvXKlbFpCx0KV2OZkg4cMF+6LAUa6UxQURTRInFi6cR8ULUn5v7PfP/wW79u+fUTLZ4UkH0hl4Cr3n4rRx3qPXG3zAU2quYgSBzImD2ka4KNU/lWzAOa402q1YS6xXumGNh7PXXdTcABWQUpz5MO6Z1Jiv2Ajikq9qr9Uil3mMihZUqkYw64YA4hqcRWfMCFtyzsYpw88/LoxNkhDENdSFEdKrBpU3zzZPN+TUnSi7A1lFribzXgyBVwImlthwQFXXbFcsoAxFNo2rDiKsBltXx0A4IHrEaSz1ovZ9M3r13/6819++vnl7d39xoUFSBgb4Mqkwj8AsyHkxu9sIm6Xj3biIh7J/iir6T3am/lB1dTHxEaAXKXcJwgaobIobmTpRrtePz85efbs2UGvB2RRYVlRh3KmdIV21aOsTqvqktFUHocTs/dUXeFnZi3tm2h7QPj3bmRpJQNQ6TmEyF34pySNxDN+3AwsxycJ3CA3Wq3Vj46Ov/rqq+FovFgsXRdmOleknsskxZAV7cE1Y1fDGT9/KktkPcqe025icaVjqOuKGSeZQ+HloAYMyI2GhhZBEV8D6tlqpmX5vjeZzW5u73/+6aeDg16l1uge9AQSRlYMrBDZOAlFwZIYb2t6Q9a1+fnCQtX0JN0lln1TDYKy7z0KRaRRVQU1V5rNZrlcppSz1ChxfzDG5bASw3g8nkwmBwcHFFHEqugfigZxFV+v14gGJ5MJslhHoxGiQYSCFBvkfFGK8lGdBoq012q1Xq93enra7XZRbBORUgriUthf+rYFGsTyhpeXlz/99NPdPVQdnM6mm/UGOKJ4cojWC0e9cPlDnBDKaQJNDJVOnYJjixJSJycnT548OX903mw1C8UCAjacBx5Isk3FSRSBDMXxY/sYMTBeI0FTenQeeFOyb9NuBPhFvFn79tm0XF2Z1MoWU+n4NrHoxq6DC5kTEwWTZel3EHuEwBIulBDaF2ztQsEpFqWqymwWhrbp+6BBpax1eV6sYqCH0oEr6sKTM1dSNbEqOkmIqs7EC7FEg5LOHhM7ky9mAgSqXH7KYVQzHv5BCYTJpgg2yVeZgq/cCy41zKCTgvgj6gQK0EzEDdfzwsUCq7Uitd20LKdY0HS9WCpFJdA2w8lNzdtQXZn3R8jpGVBiAhaI1Wg0fPP69Z//8te//vRyNB5D1NGyPR8isKRtI1Y3QPI5kxgf0/ch5uwTg/l124wfZdwlxi49JaoClcizVexfXLEiPTAMiDBrUKHacTqN+uPzs6+//rp72CuWSroGlcminfkjRJClWy2BIdWvTGaHps3WZHB43z7HtgeE//ha4anoGZ+GxKSJ6VjCcZVR8cLtMFFAcN9hgigUCvVG8+Dw8Piwd3N9PRiMJjISYogYn5xDia2nJF44yZA8ieCEUiSK2GnKZxT4leJNzPhUvHhyPDFsKBa21MiwDzhEBpbNMC0LEgxEGjpMfYZxfXdfKBaPT05a7aZpGe32gaDcQIPSi0FgqIyOHZYxDWFc3TXuX/p+ZSOcn37LhmWSdS+1j6CM0uq7Xq+jKGo0GogMCVPhuo3AhhOZCHVAhXTgTUJ+HcbrcJVDnJmL57ONdEQJiWGl48FggLHB0Wg0Ho9Ho9F8Ph+Px/P5HLP2XBeKPfAsR4SgqKGCtEnLskBZtNU6Fa3VaiFTFMXQCS9lo5Roymw2m9F4dH93/+7y3d393eXlJTJFRY1jsE1io0j8h0ej6BxyVhEnt5qtdrt9cnxyeHhYKkPHgLAqdFmJz/nAsCpaG2Q/WaYVGnDtdEPxgBwHbuOgPpyovM3bks3A3KPBffvtGp/5U09ddnpX4SxFJcWK7h/OHWUOJkA+lmUVi5Cdi1DRcSAxPggix7YuL28GgzHoW0LBJkOzLJA28QMocaiDZLE8iJq4wwCWcdKii61zxh3l4SjB6JT+ZTglUnfwy/g9TTtolNxAggyo8tcEwGWeZEm8VQp5FBLDIlJ8vcFFhKYdXcfJHA4LM5sIhkYikU/x+qEbd3d3uqYVHMcPwuVqfXRy3Ol0ccZGdzny3vH4YoaXtCZQFwt839tMJ+Pbm5v/8x9//ttPL25ubyZChh0GGfIgwEnI7xfPRyDkg8tkMuEifsBiEJghi9LA7ZjlEoUlt22mkhrhIQEFmUgDbgu6HiDLwDCMUqmoaXqtUul1u7979uz511+Xq9VCsVgql03hATTVoFHP6brwMvCa9SQSJqU4GblmaBCB7q73Yd8+n7YHhH/vtoUympPeoEAKVxvbekxgpxgGFDayrEKx2NRbp2ePVovFYrFcr9dziFnIYgA82YnY8Jz+zb/hW8YbsSZnQIUsE7gpeXHJPOw4dkiBysTl0MGF9Y8pDbDAAJzwVqvVxbur//jTX9qdVqPVqlSqxWJFZG25RrGwhc2R+lIRbVgfM/vkRDA+u1BGVu+RuB7obE4ln7z3aLgZoiPf9xui1et1DC4hqVKuW6rR7kQZXa/XEMqbTMEpHmlBGFiRLJDwkIvizCJEesgUHY/HVO5vOp1CCXhRex0K0KvGdU3pongx+nK53Ol0Hj9+/PTp0+Pj43K5jKqb8cKf6SSCUs/zIDy4XE4mE4CCV5fXN9ez2QyoqutN4IN+jMjFlbmTEltKyQfJU4VaFyU4Y60KVQcfnT9CUFosFskA4sbr+0dMMoASRqq49wk+Z8z6/lU9IHECTF7Ifd/27e/Q4jhX3mSesOapodsTQmO/MCdK6jmJuUUWLTQMs1yuFAqlWq1Rq1ZKULrn5vb2br3Z2HYRquCglkwQQulgyFwTUpNUsh7jjaLcBXUerzPJalSfJBrE1V+hwwQFUr2VyV24jAq7IPqHfye/lUQUSj8jFmJiYzWkKs8cTR3fDxjKlb6qIICSObPpLPAD3/PniyUqkcIoCTTkOBBo9X1PFMKV58M8ySAM3c0G4OBmNR6Prq6uXr58dXt3t1qtsWIHyroioZTci/EQbJkJ+aMSs4szHKr005IJKiYWZeafTg4roUR+JCniI9zm4OgnGVl341Yq5V6n/eO33z5//rx3fFJrNCyBliWs38HXyOtqwoGiMkwkoZTHDPeY8Itoe0D4D2ucMkotFTaU3P8IKOK0F/7IJxyAgsAal5+Rj1Gr145Pz54Lhf2buz5SInzf49Q4woc4ozPGiMgixmxxhgljk1FNAajqTMYlX5t4eQt2gfiTdFPKpHiajZRrUX2QApIEjw0DNCrDsDCdzV6+fnN0dNBoNIvF8sHBYaVaM0VNp+2kDG6McpkVTuxgMgPEyMnQTT/HxojKiYA0zyP9IMooFiSs1+tN0crlMlbV42gwkV/K8/08dzKZ3PfvJ5MJpufRXd49wjzZnTRFN5sNwj+MCiJrFJmiVF6CV5/n0A4VVvDgIOlZrfZ6vfPz88ePHx8cHBRE9TAMgW5l2igxm81ms1qtBoPBxcXF7e3t3e3deDRGCEplEtHOU3ww0Ag1NRPNKaE/ASVVGvVGs97sdrtHR0cnpyeNFoRhi4Ui1qD/0CcwxeyiO0L5ydwjwF3UNNQfQRndcStzOHv7tm+/Tcs4wnZtykrnqrdGST/maKq8rwmcI180wwx0DcqiRhGUzrMsOwxKhUKhUq22WjB5/tT8qVwq9PuDxcpdCrTj2E5ggFyKDrQeTQt8pfGmjg8MGqLuxBcRN3UN6I1NoEF5BOmUTbB6aO8tKlAIJLPLRWrqoOiT2pRFlZS6ANslsVdytYJOCm1qWDWANCRm2o27AXrkYVCtQTUFUyBe7r6OtAgqMQs6yqB/9/Lli//405/7g4HrepCAjUcOIz/wUdkrDgkS2qFLyzpT2dxIUUEc6NyHIfU1d+Qpv7/K8uTwmui3cagWDgQRVcH+1aLQEGp8hgkkMsCFptlttZ4+fvz8+fPD4xNbFG3GQ6dy+9UzInN7cl0eifk5xZhlMDhpPe3bZ9z2gPAf0Li9lZHBTETZYiNSKKyIJYGpPrMmfGnS36YLf6RwQIKxXi4Xu502kNbCcL3RDKX+r8dzqGBqqBx2pZpNGE2WLM/WJ0C2nExPkB1hGXpqYuPOJ4Y5lbabmn8lwx4Fy+TBEZGC8ihelO/7mmZNZ/NSsTgcjv7P//kLVNKu1ovFou3YplkWCjqmpjmGAbvAxWTcclxeXLkw0zMZSQ6khBM/Oys2xZJVM7lMK2Hr7kOviyrUI9OyWCw2m01R9QhaGIbFYhGhGooYMVXb2D4Lw3A0Gg0HUBiwXq+TbBJ6arO2FweBvNSEkJLzptPpYrGYTKCUxUQ0VBmdz+ebzYaSQ/gxqRI9lpFArma1Wj0W7ezsrNvt1mo11MuJ5WSSHcOMRDryZrMZDAY3Nze3t7evX78ej8eoMSMeWo0XSCTAjGFVDAwWCoV2s10sFVutVqfTATR4ctLtdKuVKmrJyOrDqkb8/5+9/1yT40iyRdHQkVqW1gUNgs2e2Xufe15vHu5899edffbI7iYJQqMKpUXKkPczN3dzC5FZBTbJBokwdheysiJDeES6+TJbtuz+DyE2sSBMi4em0yjSenWp4ec/57mE8539LX93X6jKfl+Wo+HkqAG5P8l5MBsvU5RR7v4y0c+7Dg3t5pGL4TgWaHXDf4njeL1u3/N823aajXqn0/rpp9dHH49PTmPbNOcB6I4apjGfzQW2lLFO6XChOER0j1ATes41I/ajRBcB2tSEzuzINxWsG3EqYjrN5oKyxWC8iXA+CalnCR74ky2klKnJR36OuE8KHSHNSDYBAjqGALGo+WlZVoCEUiP98OHDeDSC/00ms+ns8dP55uZWr9+LHdAkI+q78D5REifTyfj09OTNmzff/+2HDx8+np6eXV/fjKdjoe0VJUIGNjagm3GkutHSkkxHxNipUoi8EG7Ijw4fvdyaTVWY5uRhaeg1SM7AaJHgk5RRmNBhM2S1OJbliGqCTru9Phzu72zvHhwMt7aanbbjeib0bwQ3ZzmODsHjfRFpcPkAqCUov159TXwoKHDPKKNycCo5md+zVYDwC1KXwRkTK/IysXaVogfSuCoQL37thNuAZR5yJ0CUotPZ2Np+8ODh67fvL6+uprOZl6ZRGMa6fhqBYdZHFnZOlE4+mzAvkmWD6iwh28VdgSM2YyrRMN3oRiJGWTYWg8xMFMeTyfTDx6PWX/7S7XZ63Y7oaGeDvHRs2rYoRVu4os3jH4oI569BT4Z5ltHvZQmbpYzKyhOlIkatZuWW99khJQnR6vV6r9fDZBq5ZP6E5PrjUUPCeTAfT8agNRoEpcrpOeNQEHmn+BMFYxAKgnip4IhibhA7WSEkw9JBqh6kJhMI9qBXWLM5GAy2t7f39/e3tqBsr91uYxv60roRuhbkoCKR6fTs9PXr169evbq4uBiNRhCdFq20SNCc5+hoDLF6EDBhze90OsPhcHtne3sL9GwGK4NWE0Dpzyjnk4MJGuUJr0Dmg1xEfXTLfiW7j9hvZZX9spabtNlkrrbQDf0ygiy0B9m8XrepuK9R3sgW2qGasw0vHM+vuQ6EojqdLvwEusTr0/MLx3XCMIaG6QlQHy1sfS40ZuJYwELJtJEV4OxwFLiUQqSUK8TlvRK4gWwSOW+iMODmPISrB4ANps5j5S9WJswQOOkTY1X6mZQmtftgJZFxDFWXcMtgyhQFh0JsJghCwzAxDBdEEdQCzOfTyWRjc7MGvNuGksM0BH8/nE5nt7fXR0cff/zh5Zu3by8vr8YT0HlGaVMUF5NiCgsAXi4WXBzne+OffFRa4EESjNU5RF5MyJKFMhdH91aMl4zf2WSW1fD9jZWV/Z3dje3tWqMRJ6mjJBIkysyerng21U6VaChxQhn4U08PTwOqRiZUglhN5b93qwDhP8wyX/sMf0AbsREU60LpQ0JBQf6rh8UJoj2p4ThJmrqe77c73c3tna2trcvLq3kQWNPpTFEOQH8FHI1O2tCOclMhriYzJ6pmONR9zngLujrK+0nQmAOIBb5Bbt/ZsSBBDtiRBbAwCILRePL6zTvofzAY1Or11TWjVm86tmOqVvX3vRck3sUzt9J5Zuobf49pDV7HxR+50lrWexoV3dVqtWazORwOu93u7e0tltKho0KtF/C4QuuI7giV/81ms6trUHxptVpUxbFkYEm7BftGhGGImUCqG7y9vUW5UQSBpCbKM4p4FE6cpp6Km5ugzbu5udlutxuNBuUGl7Mfcc/j8fj4+Pj1q9evX78+OjoKw3AygXIX0q/LEEdFvg5LdFF7EPhjjWa3111fW9/c3Nzd211ZWWnUG81GE08DJfVKeeZ33X5VEJWt4qO1SG7Rwy/t/rGPRUzR38t3pLKv0fjDycQwc4IsWD4g/6aclvQO92hUyyZYrO3QytwgapUkTs9xPQ/Y4uJ/rufV3rz7dHI6Gk/TNPV9H/CP6Dme2pJDoWaSFARIWSGbBhdSfCC/hhccVHlK2Gswlw1Tl5kLCdO/eDE5xmPGZE4yx7jJnAQhTi6bLrs9IEEUsYuSaY0TE9j1AkXDryFwLkwkhE7BiQDNZGUVZGaQtRQEwWQ8vrkdnZ2dvn///uTTKdBxx+MogqbzCqXDvI30DVnDUmCzF/PJOG3GIo6eue+01MkWz1Br4/xTQYsk6O6McVk1soq0Knernzl6KBNxvmaUwsljrCFNU9ext1ZWDvb2tnd3/XpDdLGE0C2u9/iNYJepnhlVa06PDwURiNKqMT09/NkHpKKM/t6tAoT/AMthrRyxO7M+4419MEsG0TKYl0oXasQURy6B79fa7U63B3UKzVaz2+lMJlPLNF0xb2IoDhMXgjKKhYOaGJlZQSo/ljvR0ikgA+x0bioXGWRXqqo0RNRM7x6NltHQllCE9KDhrDjzMIxsy/zpp9eNesNxXNuyV9eB/pcmXhDPTdOCbk+gXSZmr2J4D68xi0PBC+mSyLKSBnkymfX0l2+5Cg01wj8H2fJnrFarDQaDVWHX19cQmI3CNAHKKErqwf7lyMnbDRSgILBtezQaXVxcoEIA3WVEUDklT1JCIhceBMGNsOvr63NhV1dX4/EYM4SYl0OKJt1oIqZSD4lms2nbdrPZXF1dXV9fPzg42NzcHA6HLWFIgi1qbyK6490mZrPZ6enp0dHRjz/+eHl5idlCBKUIjIk9qwI3MjHo+z527/AhdtPu9/obmxu7e7vr6+v9Xr/RBHUZ3hswJ9JzTyvtB0gp2dJ4QWm8fPkh+IsiniyixN+vUFNlv0fLzv/inbJNeB5GIyv6Pd99QGZF6MVd50B8bFh6oW52mhg1v271h6kQPXY9T1RuGMfHp77n3NyOUyOt2RZ2bcWkjoUFwNAtD4uiVemH/N4JZw5RUZ7dUu3sJW9TxpRl3khBs1wYNiM8g5ktoN7I0cPCEApssdSR3E2iwsCZPKNmGOILVIwD/444C+d7wDmiUl1WxEDtNVws9su5vLqcBxj1Sz59Ollbw+ZAjgUNddzpFAT1bm5uhYe4OT4+uri8Qqop8jXofis1HTMvrIDqKdkJUGtT53rt4jWTGGkZSi6p0VclQjwULp840XcLd6VU0IF4rFZi0n2Yplmv1RzbhipK01zp9TZWVx49eby6tZWifxGi2bZAjFa2pVP2Ngs8jM+xak2v4h3yCnkiMRNhVNlLWuFVU/nv1ypA+I8xvthVvFCJuOQ7XNVXfga+iIq0uaAzKjTeEVk/MXFDu3DL2tjcfP78m8vr61Ck1G5vb+M4dmwb3Y8UpIY4VUYZOfOFJ0QoT0RuaYkevEooRnMeCMzRr8u5FZTtLN2I1UUIJomag8SMHI0n07Pzix9/fNkDsctuu92p1ZtBGIqZNE2Qr1jsTJibnWkGBKlv0QIxa6Vyo8bvykr5yXcK2C7ZD/6KDdw3Nzc3NjZOTk5Go5HvQUibV8bGiSzPACNJWqHFgjxPbGKB7yhl9kz7R1I/ou4RKOZ5pmw0Gl1fXyNZFGmihAkp5Ut8UWrwAPJ+NajZQ6bozs7OxsYG1Q0WVVLJKOUIwfsguL29PTmBDhPY4oIgLiUzkbBKKUrZiFlojGIRCJZibu1s7e/vb2xurK+to5gNCsnQmPxs4JQjPOfwXi5MUFg9/5yHJPfi521TWWW/mufFX/VfcDlMJW1S/KRgShdNYCoT5f/ZHxa7OsUxpFAqTERYyQxhMtsZDO16o9lstuv1xnCl/+MPLz8enbied3UFgTbbqmNyzLJgdoXCegSv2F1YUgpzRZKSESiTnJmEqAld7OQkUE6YzKBBlbXiEVT5TkbXJnNonkaTUFDuh48s1a/JbCbdFejPKt7DMCLsx4a9RWFomeZ0Or24vPA/1m4hsHhZq/kICF3Xw36wcRyPx6LkUPQzJJpGgg3rRaEjPxy/WI5jJSuX/H6J6zfzj1TuNpQ8DOSCC3+iutXsPRX3GxdLutGlvHFJ3Gg214bDZ08eHzx40On3Hc8zbBulaPkSK3ccfCFpUITT2e3WRGqhS00vMoqA5DWqDOHv3CpA+A82xH6pqIuTk07pV0vPTJJ7uShPgOtXR80jtmV1Op2Dw8OLq8tgPovT9NMn6/ranM3n0OIPmAZiisXVajFFgIdVrIL81IYek7eq0CfLefCa+lpq0g3rT6PnzNBQBZPEEIBXdGGyLAP6DVpxHI/Gk9Pz87/+7fsO5EM7nl9rtjuODfWEMBpUPLdg/LMaAnL2leNd1mM9FxH+HeU3CudZutz5DGkZBDOGYXQ6nZ2dnePjY9Jx4egFPQf1toIikBjwUhRF2DZwOBx2Op12u833z0Ow+DBj9ch8Ph+Px+fn5+/fvz87Ozs/P7++vo6iaDQaIUuTa4piAhx3RXIsiPfq9Xq73cYCSKwb7PV6zWYTm0zgpZVSNInuhX0mRqPR0dHRmzdv3r59i6KmYRhSrSOdjG3bePmyqNJS6NR2Go1Gv99fX1/f3d1dW19rtwRhVfSwRuFcypf+vCeNQ687wxk50PgzDle6wyolWNkXZVRWrR5I/Sf95cimR1j5gIwgKq3trP72As1mCpCKxjygdAkBIfHVBulL02o2WyJC1awBIBysDFd++PHl+fnFx49HNze3k8l8OgWQ43gedLEXzh0plKZhxqLGkAgR2IVP9alQ1eLygiV4jJneMp8PllADMCupIHEOGMp/KH2YBaAF11NcTmTvDjurDMq1TBMIo8DQMZIEtMQiUU/o+75w+hCjxKChbVvz+Xwymcznc0EWkb5AyK0LAr9Oacrbl+PV57KlXIxUb6k5xsVhK5/nctxUejQEm0a8yQIL+mCskkXqjArNVde2a663Nlw53N9/+Phxf2XFEDlDqBEVsFH2r89ei969hPmSIya5WqrNpA71cwH2zF00IDGQ3Xk1uf9Ozf6Xf/mXf/Q5fPVGgTEVK9NfOYzQYP0wT8orR0Q+prBLZIQCowKcBPStSGez6c3N6OrqGtU4qOk8+AYhhZ8pJ1CIB5eQdHQZOVNhRWmswYBkn4CrQsVTeYmlPoaTUamsQV4r24YmaMy6uK6UFMMLMIw0CiBkiHyfer3ebLUs240FvURwS4GJUrqkptJwignL98sgLAetJBz3u1va5qRNiq/v3APfGHGXZVmz2QxCthcXNzc3UM8gFEe5ZCVBLMA5oiUXKqk0hQ0GA9/3Pc+bTqdU+0d1d0j+tCxrOp1eXV2dnZ29efPm/fv3nz59uri4gHab4/FkMsHNeGKQa2kKErVfq9UaDYjDQ9nJygoisZ2dHQSlvV4P29DnMCFeuAwwM2EbLB386aef3oJoARiCUqxjxHJKKj4htVLf813PReTZaDZWVlfWVtd2dnYePni4urra6/VqtRpqn2KGkPfw+NzbTZiW52z5Tc8lDDNfZLWHn/GMFT9epQQr+3KMBT4A2qDj0Y5XrpFlb/qSRe4id6ZEOrKsmsKWaq2v67PkfAUfhoriZrvf7zdbrXrNF/MEhIeCeeB5Hn6NMcAkXCy1/8PzFiwMwa/kKA+vVGXthGa4LpTM8LpV8knXOvIrLM4kmUmDfcsFassw/+mT/HPqj9zlS36q7JWhqP74QqX4ZAMhMQ/PE5DbAQpuEECQDnvPgs60aAMr8oSj8XiMWjKQYMSAeiYWnP216P35JWQ/WHgvNyo4dbMdlT8S8hMYgcjDcjY5u+A3oeyhXqv5dehaOxwMtlZXnz5+9OKf/nllC3oPuq5jW8KFSLkZqBxlR5O3TyUGVW6T4oA62ym6cUqJP0pZoKaNrE5XO1QLxfLrq+x3YBUg/Edabgmuw+cKR6k1IF+301SrUFMZ4YGIDUDnMMHBiKyIHUfhdDKBmTEk2olqclqoMpIzgC6MVsfG1+p0ck5Dz4LKF8gesBkORTa4SJPM4iHiLkeWPAuGJ9H6xVI99j2v3W71eoNWq2WadhiFpO1WqtSvea3EDFGwPL+lKMFnHMtMKvXLj4vlUp25pNPnAgDCGJzQi434sN0CHYWcK4FDSi2apukLq9fr/X4fdUpJjZPWEJiLw6Av7v/Dhw/v3r07OjrCDhMYA0YciJshIMQMIV2dhFgiNwid39vtlZWVtbW1zc1NTA9iD3rajEsCSu6rAqhYN4i5wZcvX75+/frjx483NzdIf0VlHV46SC2Y5eULLw3dBcVpbGxuHOwfHB4e7u/vt9ttXPwBm1RsRkzXvwdHabwnH+OS/DbHrn8nfqsgX2VfuCFhTz6o8EI88yyPl3WFau2rIrKZxCClTeTOqN5epxP5DlkIRu1ffFJ8zSl0VWs0oZK52+21W61ardbttlMjgbJ5245FcgtW/Cimje5T0mEyyTR1CcRWVZdDX1A52WpSvZieHcvCKVpM4HeNJG85m51O9O8lPMtMVlb1K5Q3IOvz2WacWSpEEzA6LaTmBOsEvQBE5WZz8CZGOh5PhLh6GoH6gJzEkfQvzyMbF16aIL1vtUjmAvKwOv+WXocwPK1zo+JsoSBT3DzSFE3Fo9Ku1zdWVr55/PDPf/7u4bffNtsdaKeBPGRZagjzfvZKZCEg4lkW6ZZLPrXqZOclIg88aM7Xo3Kb+4xLZV+wVZTRf7wtic2rLTKYRTIbFUu/9EsIkifia438/sS2W+321tb2zdXVdDIOg3AeQJs4cChKLwvCjTIEiJyQbP0ErhRzEFZMOTLPqMOGtLmyxQ1baVPtnlQojsaBKq9k8zRRtJBA3aMQHbWhg5Bt29PZ/OTs4sPH459evuxAt/patz8wQXZV6jMvIaqpynLN1M1QgBRjloj9uQo3VS9xv+bu/1D7bI3KxYayOrhD27ZB63U43NzcfP/+fZqms9kM82MZAVtWEEh0ytFodHp6enJy4rpuHMcYAucjTBhvNptdX1+/f//+48ePnz59urq6wlpBPBB1BSQYydmPBMaww0S7DQF4BIT9fr/VatXr0CoaK/WX4Bk8+el0enlxefzp+Pvvv//rX/86Go0uLy+xdJCuC5EtNmwkDi0H0vV6HcXxDg8OD/YPNtY32q22aKcphJGyoP3vh1i00sqp5n4W7K+ssj+M8WWwNJnnuPMLogky0i3IuggqJpPUPinlz9CjOqKOvCCJVHzZYa6T5HbRmdTz/Uaz1el2253u+flpvV5r1F+dn18axvl4PAFqTBwbQQjSMlAWJ8JweBq2mZhi1gVaq3Sg8sSzk4C6VJMDQtlTTkyl8LlYVNYvchzZZYtmGGZkB2SOsji4etGgdG74LhmjVS4xYBkQJ0CNFRsAo0TwoOIElgFwskh3ghfSAYUBtNoSgTwZbcQCGcaalGcpe9r/Qk6TM514PFyH2ou7VWs66uMoTxUBoRjHJIGFEEZb67bdbzYOd7cfPnywubtTq9dh6xjkIQQY5rtkB8FyWbY0Y5RUWXQqgx/q60B1hqJsVg+XvsGV/f6tAoT/YOORIV23owmZYs7SfHvZQc40LEB6i3tT49yexCBlYdlWEsaO47ba7ZW11ZUT0OOq+95kYnmuG0dRKoAWziBcoRgNCud5khJ3LsRX5CSNq0Zs5qMilPh/nG4URYQKGDJ4T58zHVFeuZyzskcWTeHElIe8xDhKUssIzMiy7CAI33340Go3B8OVdquRpkmz3ROXZtVMUyiDxRj4zA0X58DgRKwpIIUpGzkvKsCMDYvloBtftuVqw+iSebLos3RHsUM9AkLbtrvdrmmaw+EQRWUQE1IhH26mx1k8aaPRCKHRx48fsaFwTRiGqTHciw0qRsLOz8/Pzs7evn17fX09E4YbGIZBPeIxxE6AEDVFUVwUk3JIGR0OhyiOCu3+BgOkiSIgzPWgR0DLcSwwRT8d/+u//uvr169PTk5ugZw0QhCIEjJ45jw3aNu253nQZEI0FcTcYL/f39vd29vdA87qYOj5kBv0XM9SaW3bsmUDtF/uAVBEoTyDNPeQ8E/9IkevrLIv1Tg0ZIDGyEQCFRlU40GITFLPcOnEVZ4QVSIz+UAd9i2eAREoMKODyNBx3G6373vQq7BerxlGMg8C24F50ve90WiSzGee54KImhBcA5ek9AOEk0QsIS9DdldS63vF+qMe8jL1pOO9phHHcvoS4KIEFAFC0xFr+kEjRozbjNMp+iB8B8eTPD7WZaRQ0iIWJkJpE6/NMkA+AGZkyJdCUXoQzOmTqBZDRZKwgWxFq47I+LSKOqH0gVTalhJlOrCox+pepvJwbL9iEcdkFgragQrA0VwNmUCxjSMiBXiDgEXiOO1Wq+463X7/YHf3wZMng/UNkK+1bK/RcATNZVE3ZjX48pFXwkL0iAqBVfVtyCQAdVobPUjlHf5QVgHCL8N0vz7xTRRzkwqbIShDNKj1zYAymvdcGZNfaNipBa0XTLORtDY3tyeT6c316PzsDKW3MC2D1Qi4ni5ZIGoOjM4zSC9I04EQjdZLSVmqTOtPTjfXLFPiSBA9geKB+li6aQR30vALxERtWTIRRfF0Nru8unn16k2zUW81a55fMyy73enZthWGgel5UEpZMvbyBOTavSSEWcJ2kepuvMh6Yb72i8aEBSSQf3/5rmgz27YbjcZwOPz48SNiMNkVShAsed95InOGYYhFgzc3N6enp/V6HVET1YgivkKmKBYKYp3ezc3NZDJBciY1J6SqEnyBuI5TLrFksdFodDqdjY2NHWErK6hXLjvU607BbIhot5irnM/np6enr15Bz8EPHz5cX18HQYAng9WD+IUitqrkYAn3zDVFse3h40ePHz9+DIjU91zHFcqjuFDAr94vk86lkZc52zThwfhcGnAJOKyssj+YUbpMET1yHemUviL1pC37k3AG8i3u7agAhKr3uB8sYUIKHgzMXSlEgjAyZUNnXcvzao0GVBSurAxqtdr7d0eWZSfXaRgGNQtAUQzpLyFFLiYxnMxRgUR85ZWbY6WD4oRNS2AtXC6wAkiimGoiYelsgJOHlKqUTSgUylrQxZd/WB6grAiPRpTOSF6VQHTY6SGGPvSwAXZoFNxRiwN4Ke6Fc7JKDNJ5sBULnjD0cZaLk2wBJJ7FMq5TYWBwxFRgOdvDg9Bgbo4lSoj6VX1eMp0wCyqn8TBsdtrbW5tPX7zY3NuvtVqWAys9IQqjxy57TlJiSIkiaZwqf9KB1T+ygEaK51DGgtZulf1xrAKEX5Dp7Ayt2nXsUU9JqjxcvlpCg8S5Q2wMU77n+a1Od3Nr6/Zm/Pbtu9FkEsfJOJ3gMTF7Q8fiDTC4OjKPeubBkg5raR+HXH3e05RvrC/8LtaBqtbQOUbBCYmRQSrKCAFgzIPg7OLix5c/gTqIXzdgBW53e31btqpfPJsX+meUGpeRk3gc2aLs5vyWMbNf6nD8huaERpbvn3fVcxwQzGy329Q9D9N0vCYNHwsES5hDQ3Hwq6sr3/fTNG00GlT/gFAQC/bGIn5xLQxpopR+5Fov1BOCaKKYn0QY1mq1BoPB5ubmzs7O5ubmYDDodDq1Wg37DeYkEHJJQlKsOTs7++mnn/7rv/7r/Px8NBqhvjnVDaJxaVMaUmyi1Wg0EA1+8803jx4+2tra6vf7tbocMVzPER3377+zd9733FEqgmhlX5Vl8J0SWqTCKlqOa+lpFQOU3xSVf8vukDU616moxYIirHxX98gR1JwoTkzTajXbjuPWaqCK1Rv028Levv1gWubodpSmxnw+T5PU9VwzRKqn0OIG/yirsnMrCQrpSglucYGCnSjKjAnE6jNUuT/GK1H93AWgTLAHFeHBTFit+FqBZLnfUqdLwydhCfh6qHBJRZc+bF8IsT9sqcwRuPgk+h3pGNBBqOKF0iPy+5OhT2TG4b4xskxWMHu3M2Rl3qpRwTHOvqWCfFzzYQ8iiOC7bqPmb29tPXnyZPPgoNHpGoYJTSylCKHWN8qMJ6FUfCQkx4sJpyvkqZQUspRRtjOpMX+fsajsd2IVIPxSrEge4MLHOowFIjEQAlMS9rLB9BLyKFBHRHTMSFPHdjrt3vr62u7uztHx8fXNzXQ2owUo6BSLBhi0qubFATp5VKDByEMpXZYsBzN/UVmtDvkXff6cxyhzg6oTrkxW6mMKIbLUhA4U8RykxpIInF9yfHL2n//9V8txXL/mCjUdo9kyrdi2IWfluq6qoWeNdIqxOnaKzL2JhKTUZFZviZuy6OO/qn3u2r30xpVusyA1mjHKKmNtXq1WQ70WlOikhBt1qCfAJqMPaToej5FIiTjQMAzsv4fPJJJCUatmOp1OJhNqM0j9hRGA0dkWISiejOd6vX6vXq8Ph8Otra3NzU3ki6LeEuYk6VNotJBAwGmaZhiGl5eXPwpD8urt7S2eCT+fMAwJYeIJABFU/KzVaisrK71eb3d398mTJzs7O51Ox6/5gKiFhgxh7J9xc++00rRwcdHG+1X+sidQWWVfmhWhTkm2nPqvqzWxkt3mU6VWJVNt9RgslHw7SZxZ8u0m9gx2EjdRJ9kGlqBhtFfXLL9Wb7U6tRroJLc7rePjk/OLy9lsBuGkEEonPA/0NkFvBkk0+isvQQp5dHLR+BIQE/S652qrGrHI8g/1PgfGgptBixCVncxGeUvQ4AJfQ3CI0V3VLZBLAHgTaU2CESrnfDllKTIKSo/qJYiYWOVeCT3qMkX2E/mrVPqePdXPw4RcbkgPo+xzwhhTZTFxcSSxXEEhQdNzwVfWfN9ybN/1Ou3244P9R48etro9v9Go1xvIEQXX6zhltYMZWVGWGBeFSFllBDyD3CXjjSHoWqHBP5hVgPALMqnjQqsxhTpY4kpXQVONOEmSlu4QNxPaMcBXA5X/dmt1bf3ho0cnp6eTyTgIwokpolCmkYZAtxAIUnXWyVqGX1GWPuJV4Ao55mUM2Rq0fFbVMUj1DyPxyHlKUgoTwRIxbAu6MJlxAtX1QRiOxpP3Hz64rlPz/Xa71e1Ac0IkA6oQbGE2E0MMJQr8TFR5CE2XYstMm1cRkrT+UamVzz0ohwQ5r1Za3cHfWb5D27ZrtRq2E+Q5Nwo35I5FJE9sLXh7e4ukTaQxIzRCKIgiLviacoNEy8QXuVPigEq2offcRqMxGAy2tra2t7fX19c7nQ5RW4tsST4mVBN4fX19fHz87t27jx8/Xl7CIgyzgng+1PMQjZeqkmADttnY2tp68ODB3t5ep9PBExBSDj+n2eDP6xpPUaTScsGKMlrZV2u5qYDSgLKUlzijKmnFVtWKRKecp4IwylPnFufZlm7yTRCAyXwHxUwofBxovQhZLMdrt7utVnt1bX1tfeP1mzefTk/fvHp7cXYZx/FkAq1QPU/gpTiOzNiIpL/DZBrOlbB/VuIho8DoshVxVKBSiXpF6QnEoXWlGUPR8tyL+ajsqJZyZQvbqtCeWvfQmgP/hq9keYsQUTcscVECk8pSGSoxkUIGsgkH0ZZyJ53jPVFGLsdl/TnevTSJpmFwJiJOWQH5N5nHgxbwyoPAjzhNbMNp+P7e1uaTZ0/3Hz/uDIa266ZJnOI9QtdTHG2FUeVt5olBdpvkZ3OVO7hgU891lRv8Q1oFCL8Iy5VdK345RhP1Zirio7/DpU6Fm1iLJ6YpmmKLT8dxXG80NtY3Dg4OR7c3o9EYqPW4lrVTO4mJDJAKUj5PP6LwcZFQJ68Co3fU3InRLmhOySYzy1fhjJGir432IHfOqhQwrGmZVmxEtqAIzubz25H17v37eq22srrahmW3V2+2LCshp2BZiuVJJ1+IqJmMTcGOLmtN5IlyKKXXB/8YZLg89rzks0tw4BLIwXPIWCaHmBDbu7uuizorKJCAxYSy+EHgpVjIw+L7iPew7ND3IWOWpilSRrGhBU8MkpQo9YHgTwixWGUbetdzXAdaHQ4HG+sbG+sb/T5wrvAMc93ncxdLOuaz2ezq6urdu3fff/89okHSFOX9Egmd8qg0Do7nefV6vd1ur66uImG10WggGkTNGzztewK8HKS//33nDwmxAPjtrqyyr9PuH/4g8g5PgDE1GvknBjUY41SLBeDSXIMrte8cIAQehmUBPUHkwWqe69aThphMesPhynBl5ej4qN/rvX715uzkDGchx/GjODJUG1RRX2ehlyfqDSaqZKZIIxSVCZSnq7AV6k+C7otsi14yLkrk4D46WNrhFpiNuimCAm8yQF4EjUZig+olqvzQLUDoiBWeCAmVNkHhtIkbuSg4rbf7WUlC3Lx8z2opRLccHQYtfnRdDDSYEFAwTmzLsA2n6blrve7jJ493Hz7sDFc8zxWLM9AZjIWoLB1CjShV2qg4u2Y5FdApf5qlxKFaemLP+goM/kGtAoRfhrHSJck8LHDXUVpGTBay854itsl0/+J9W2kK/sCyTSOKbNup1eq1RqPf66WG2Ww25kEAPEuxxo5CIVZmQItCmv9kBoYYIYzkQFBJnyX9r5B8wBCXrsWQn9CmaRvK3eYci14BizQdrNeTyExM3/OSNLFSK4B2Q1DRlcDUab//ePQf//6fLcAndb9eT1PbSI25YMkKgp5IDcl8rNIZ00rMmkFEzBpV1UmNpzTzREzlgjijFgC/way5iAT4M4wxdEqog6W71Uo8ot4viqJ2u42sUfZESwKnbMoHfkv3vEIlAMuyJpMJedn5fI5ZO+w2gdWD1GAKARj1deDpOFJwQU1RpK026g3Hdfr9frfb3djY2NzahJo9UY7j+z5vu5eDgoTuwjA8Ozv78ccff/rpp3fv3p2cnNzc3PCKQTw3qmOkq0ONU2xoAdRQ3+/3+8hZXVlZwfwk4lIcpXsyRYu5XGoTfOdSjHOGS9Oh/M0qPVjZV2VLHn6EJEo9M/NN4YkdTiuVYtQkN6o2Fl2TMOZLbNKSEyCjacFx7DQ1oggSXrbtdjpd1Ebu93vtdtN1HN9zZ/N5miZBEBiGY5nWbD53TJe6LEaiJASnet0uCl9wETspa6d9mzxNy7KxJx6PkjIiqQxSZyno+koIoqhgLo94y3kMDi8DvrmYFw8Ts7sjO7knqW45S73T+WdZ6i1/i5cVUCiMX4SS9xSYUTnIwlCIpZuiShH/iCjFBnBGxDU4gjziiO6Ujus2fL9Vr62trz15/mxzZ8f3fVtopzuua8MjAr/R7WAHRGgtcbGIpMtwRHYRpwZE3SiqA1I6ZzJpcZ9rr+z3ZRUg/MKMQJf+wklshLRJHVykT4gfdyUW0PtAlaCVpo7rtDvd1bW1ra2tm5vr0Xgym89tB9pOSIEymJOFJ+NIgx0R8R4/x8zRFjQe5Gvust7vbAdUkZh9i5o9oBYoBVOBO5paaWqAjI6YaaMomkxnl5fXb9+921hf39jYGAxXbduZTKeuK6Q7Egi1aQqrOkXYc2Gup/6P7BJl5wnp9cnJyXij0if4TexnoEEO2Eo3yLWjuHM/WOrg+36v10P0dX19HYYhlzKnbF7uQAjwUKsTtUApc4jZOcSBQRCQPCkBQsoHUi6OkBgmLf2a3+601zfW9/f39/b3VlZXsMoR83J0FbkBoXaCURRdXl6+ffv2hx9+ePXq1enp6Wg0Go/HeGLUZILQI29Aj+gUT8O27WazubICXQexdBDP8Od51vIQAIbE72dL8skVZbSyynhEjMOVskiMhgdIGWX8Umk8Q0hcSzbBUny0hCyjahZARUX0YYdtcepwHde2nWaz1Wq3G/XmcNi3Levly1ezWQDk+igE8CYKK+SnhD5nBEG5TLhTLxFkrorprorDw8IAvRtGonmRGfPTHGIV3YcUuFSvKXeqLzafL2V/4Qyd8pSbdri5IDIRUxX+1qheXXvJgkXH6Mvyh/fpVslWFiUTqRQqx50RxRWr/FTrSBWvRl/iQBsiy/IcZ9CFKvQHjx/3VlYN0zZM6LFhKQeUGyAC+oQK9X3JCRMyVRteLsv/JlMTlf0RrQKEX5YV0zIqKEZdX3TwhryL+p4uNNCeAXa5YUOGLHViyFp0e/3Nza2rq4vJRJHfIgkIZXAICfq0QORxUFUunw96FcFh9vrYlZZvyGqXMfRHR89/kCh2qnxcJGcMM5VcRCuC5NLk6vLm1avXq2tr7W5/bX0DiskcB91rqR4PMWq0jykDryq4CoenCkLZsqKMnf/lq4wWKaNky5OEKIhnOLCN4zjtdnswGAyHw4uLC0ro4cYE4VSIWqoCIDOTMCGmywiSzedzzswkTVFqZcEBDKJBxGCO49Tr9ZVV6D6/tb21v7c/HA6RuklNJqABg1Q0z5Bm8UBBENzc3Lx+/frf//3f379//+nTp9vbW4SpCAXxrDA9yMcEP059JjzPa7fbGxsbu7u7u3u73W4XSy7phH92ajef1BWhnOyCSMfscWA/C+NVkeDKKkPjCIcKFhSG4fL9GYao4pQUorg8VVXS/pAOCjhQ1EKTACkwA5U4jdkUgl5+reZ7fqNZhwZ0rvvq1Zub61GSJL7vC7GrAJlEcFDkayQJgEPMExqinERId8rTEEoCC115bk4oq/hYREagNF1xzJagrLK6P9oRNVjX7xZZoNn2D/qw9+wrWNqEfXm8rGRdkT0fAQFlHFOvOqDWEVlKwjmqaknDNKM4skPLs+1Bp72/t/voyZPe6prtuFEQOo4TRdLJFsjM9J7CxpJGKyuD+OUV53rdj17HNyqP8Ie1ChB+cZYT/cf3iCPPydy57+WSOiLVXskyYOoHd+LXav3BYHtn9/3bN77nNZqNm5sbwzQcx4YlcoJEFzkxYTv4PGDIRuHkWanqrsIJUICqpGCw1A3K1Bth0bsIbKjz7zgOtqMNw8g0Atu2z87PW63Wxw9H7dbf0jRdWVs3TctxbJBUNQUmsW1XlK4pPo/Ud9aXtvQ2YWMNPFFgAglfzUPLv6qVuZm7D7oE+xXB4R2liVIL24plJ2Voq7CysvLhw4dGozEejcIw5OzQ3LBwuia2dsB8IG5PCJDygaTdQhLtuAdq9Eft/hD1bWyKfoO7O2ura2tra81mE2VFiVkKUFb9NAwDe0igNCiqyLx69epvf/vbx48fj46OsOUgVjbideG50XWhuA5qrvq+77puu922bbvdbg+Hw4ODg4cPHyJhFVVVieNKKnlL7hrH0iV6MBk9w+wflExFaZfRRfnGCgpW9nVaKeMxlzbPBS41tUf7EdGzPoOBlDcXEm7oa6TjkORBzNcsSIExRoztgNJMGAaG6FLjOMA573UHwv/YURTZjvP61euba/vm5tY0TM8DWJgkFkrLwMlEYQJFEhYwLRV8w9xSRocT/yLcurwKBRQ1RqJlCpthyMqjxuRepHyr3lkpdaUw17Hsm9ITgCWSkrzOHxVPTMXsyoOeBRUcYlLye126sfoI7pzOLnM5/HPa64lPoCoBFmeSVqoputDjlrV63bHtuu+ZptXvddc31r998fzFi288r2YaZqfTEdKySEYBp5YZfw0DifopG1NgHlLVKKkRJd4uBt8VUixb9lX2R7MKEH6JxtdtGS1g9VfdLSnPfMgTLel90aBC0gks267X6kbf3Nvbv72+CqPIePlyfHsb3cCK3LGd2IgTR4hkJDGwS6jMnHrEKyZJhpmvc2YlxqoKM9PpAkaG3E5vtGh5qtpG4W7Fah7nMuCRzoX69sejo7/+7ftazWt3OvVG0/NqhmHP53MsISOOBO5PCo1iYlDDQtLopnm/BPQqmpDs0bSA/fIr2mct4j+LELhwz9hKWXWSgMRXvd7r9dY3No6Ojq6urizBAoU1imo1QYre3PcTsiI2FM8Klnaf5yCKulxImqio2QN+5oPD/f19VHBpNVtIRsXaDM0Wzq4cCHkGQTCZTD5+/Pjhw4eTTyfj8Zj3PyS9mRwg5JRRvJBms7m+vv7kyZNnT59t72wjINQi6eq497l3nJFFuT5ZxVPsqL3443dCwYopWlllOSv5yqj1dDHIqVyArjZQLlwy+FTHPE3y0QCyPPKWyVEJHoQjqYYQz4Ipbc2v1evg4DrdfqvV+umnV36thkwN163DTGWZcQTqAIkFZKHYVGrDbLEhk1eyXl6UO6qTE/0GM9qk5CuXjFvRxSufK/4qy58/w1eynpASSVG8WQLYVBSQsHdwXXJHrWD5aC/cOAsgF3Lv5S1SGV3aUpU7ZtZDUj0V/Yhp2paNcQWBco1uu7W/vf3dC4CD6zu7zVZbSmSr4HT52Wp2mXohkqqyAIfhV8lGIxeQfxTZY1/ZH9EqQPiFGseBucAbffdzPIvlmRwxvcCqHV6LpWqSJr1e7/DhIxCBTFMhLQPzUTAPhKAoKDVjFFMu31lYTroBMj7rLsKEiiJY9hc9lxVL+UvfV3+m3qjy2iENhTsUyqqwXnfdm5vbN2/f9XuddqdTqzccx+0PBjZ4RIlvc2KtBL+BDioF5TJ8lVyWptDAR9BI0cWJ4nxepfgPt3z3yNLC/cKDtCxJKIwgEPROFphwMBhcXlygdigLNMv945OgXbgwzCKiU4xiUAYiAU9SFi2V8SSmKKrFtFqtzc3N3b3dg4ODjY2NXq9nWZbv+44owygV8yQKq2VZyAg9Pz9//fr1hw8fTk9Pb25veLkgMUXx9Kh/oA7hCyiInNX19fWDg4PHjx9vbW21Wi3UUMWxWtT+IXdipYvR8pubiaJkyniK+d5cHjsHUJc+RJVV9lVYeU/OvAhjpq6e2KTo2qDqT9AAZf88PvdCsBVq3i0sO9Bs7/KoLr6gLBBUlMVYhBwYBqQN0zT1PGBANJvtXq/f7XU/vj9+8+bN5dVVFMYojGy5sncfSXZTP3cK2MqGGWKtoLsvFKLPvAuWHC76U4Y1qj7HitX0KwuKU8SFK+US3q5jAUmHhlrgpcwigdwEzX6svGMxL0axXTLvLKYIFUcjmyTO3Dj1CEmxG2pkpXJ1opWxuBNw2lDgKcKmEIyHP4CLscxOq3mws/3i2dPnL15s7Ox6jaZfq1ki1m/ZNqgA5koH9bpKaopm/DuXOZULKRVUZNeo0sT3qpms7Pdu9r/8y7/8o8+hsnLj1BRuLM9GJWvZmNNCTCixDepzYi9ZEOcKw5vr65vb0c0NrHrnQqYMmr3CfyA3SmpkesbXhAf5uw5xqXDpojUlj6dS5K6IUnJ5myIHBDCAqnHkfggnOywPQ+4obhXHiee6zWajXqt5rud6niCXStXWIuCRidClxlYAMoMqq8BVdQBdjfElWY4ySldRHHMe5iwF8/QnQm7on+Mkubq8vDg/n4rO8phzo9tKGjD4gmrt8KASb0UyN8iRJD9/3F62GRSGMp6tVmttbW1vb29/f399bb3b7UJfeN+r1+pAqFJETc5fpdwjUI7jeDQanZ+fv3379tWrVy9fvry4uMBOidR4EOVPaUAoK0iaovV6HVsOrq+DmM2jR48ODw8Hg0G73cYsJRYxkuLOnU8I3YUlPF4Z2lAB/UXkz+KXK3eIJSWjlVX2R7OlLdWWJNLlpxWxkG+Q8d3Z8jYim3B3LD+oM/x6oX7HmQuDKg/oVgfwAaJaplWr1zvdbr1elzgLo22JKK2PYlzlIws0jmWJGmb/VORXoh3sfCfzWEhAYlEklePKrD0Kk1LmJc26mZ2I3asjZaKnd1IVin/nuTLyIHwptShgbfwdppoEqqRndhDIzYl/2OWr+lK8Ixg+EBUY4BDRU8CCxfOb9cbu7s7h7s6TR48ef/vt2tZ2p9N1gO1iO65j2w7SYzIPp+IycT4WDS8lA7FEVT6HUgtP3hK6FTIZ8BuIIlT2D7UqQ/j7UJdBVp5mRjJZL0Rj4BKUVPTyNA4sr0Wq0HZs13V7w0GSQp+388vL09PT65sbz3PDSCi0YKQNWxkyjh+f+Hn3Uo3KFkzoFIRD0JgtEhDzaBbNLkoP5he46l3tgWWlhJXE4B3jGDqbn5ye/vjyZbPZwObpnshkYfPeRYtyfJPrheTYL/wq8rqj+ooYgP8iw95MwYjfkcx13ZmeIojluW7aaPR6vbX19f6H99c3N9PpVCZvmZwMPyLl/TKhXwYF6RB0OI4nMWruum6tVms2m/1+f3t7e29vb3NzE9EgQEZsMYLlgoWLSNOU9G9ub2+Pj49fv37917/+9e3bt/CluL6ez+eoKYrb4AvXdXlyEtEpz5S22+2tra2HDx8eHh6urq6iiszPcKmlI5/L7OU3kC1qSoBfaRlhSTSkssq+BuMONddbsPAVy/Wal1HZsgw837+sKsdyOVVQwCpBVNlWJqtWHn1TljlRYLuog4nd+pbgSriiorvVatbrtXdv3yZGMh6N0yQNAyBUoouXPAXFBtJXJ5CkQgvlYyL/USFR5M7k5vb8WkDmxWg/YglhQbKUT1CManR3akq7WkpmQmdiVAvL+OjFe/hFsl8yDaiUhjJ/4cCaCvMkYVjo92GOWXSVl64NLY4SzzFbzcbW6sqjR48ePH26tbtXbzYRummcW+JZZLknIP0U4gX4nkbddNVqpGgVJ08vRweunMIf3SpA+EUbB0i8gyo5L5SLkURwrEwXU/wigp/M84hvvh1LHY5er7ezt7v3fu/09PR2NAKm6HwOpQJJig9Ivh+92lWOX4G/UGlTCRTE12WSGLmacv5zUWBPDwt2SpSV8FL1G7mjkTgfWMGH4WQ6PTr+1GjUh8Nhs9WyHReiazY0a1rkD3IAVRZXsEotdQskG0RmCUXPjpxo85c5l+ZGeDnqu7P/hLr1pmPHtZo/GPRX19aurq5nsxkGa0V3rPKDctTN+aX0fimvkjNFa7Ua1g1urG9sbm6urKy0223IDQoJmUXpTTwEVjBi4/t379795S9/wSYT2G9wJpKchBjxBXbF4CWRvEgST2Ztbe3J4yf7B/u9fg/QoPL0uSj7fVRkyHIs0EJw5O7nbAlDtaoerOyrs/s97yXf06VftVJkWHIsBZp4DwvhSDC2uVBfhrtgmN0SmFxCA5rXG0ZqJ3aapMMhcCdqIKPl2raVpOmZfT6xp1NzinE5PEmsglarC5VbU43LWQhUIV52eJFFlGX8COJEGTa2KtSf0nUT+GEWUsY3YSe0sMkEYe8zIbH1RnF1oYKyvBXkrzDL8dhB9qlCOqy6W3oJxbZQTCnRrVclCqW8meu2W82NtdUHDx7sHz4YrK17fg19gW1DsJvBtmyjLiyvzJZQ4iIJbwPPAOL9USlLPkTyHamgXtkf2ipA+OVaKYtPoDQdf4JvKjaHwESi4HjwwqSiGxOLUjuKQ8u0XMeN4qhWq3e7vZ2dnbPT03cfPpydXxgGtHGLEWAmokk9QCyi7cnd54qO8DUHhJqqUVJ3r61AyMkRH0rwQ+6FUoJBp5TEqeGKcbBEV/E4SSKxjk/T9OPHo//87/+uNeqg012vuZ7nm/58PidNlBzW5UVrRQYvBtt4uQLOrBDnE7RRFVfWYNL4AiyD5BdnX3Pw4w65UeiRBaALUZ/neqBk2++7npvrt45oKleuxjOHvN6DjkhJcqKYYkaOyKKobrq6urq1vbW2ttbv9z3Pw79S4Y1k6ShDaIcHiqLo9vb2zZs333///cuXL9++fXt1dTWfzyeTCWqKYmIwiiNFqpGpe5Q2RdiJJB8sYlxdXX306NHu/i4WMdqCIgp9w0AhUJZcLrlH2XTBomrVkrtQeitLaW9VbrCyP7YtYzeUafPn4VeRTVomAcpoIJkPZ75WvKyCeI30pZZOHGAgOh8pQJppDbjMcDJB1jrsOZhHBrBj2s2OtWlFcTyZTIIQeA3T6TQ1U9u1rciyrdQRraikQLhlIU2f+luoJggyXUTEyhTSkoLhr2kzcmgE49GMYlkJkgucsjGlUcswg3J1Crxi/GcY7lGiNNZQipNT/l5wyEokF/Av5CPDW1ywzWDRIF0kymXbNpZnQNG743a7nWajOewP9nZ39w72V1ZXXGgt4rie7wD3BZXVZP5P7pwqHOWdgT/Ko5OmqKWBvcwHoyKeBIXyivQjKnb8G4vkVfYbWwUIv2grkYkX3gGrz2VMCafRREiW3ZXG0XuGSuTEMkzXgiRhp9c7PHwwGU+Ojj+JcsLb+XzuuS5IaCQxJj4sSyTislUBJWIwxAVh/ECxRclpUNE5ZXvw10X0xSXjg0FVVGBF98bil/BrGEXj6fTs4tJ787bT7Xa63W6/32y2giDAnRTRYEkiVNF3ZTqSMV25GCwJdqsZnxyT8YU/Y7lKTrrkO/cDiVbhNVBCxnXdVrPZHwxWVlbOTs8ww4bBAqwSpBtEeqGUbSvWe9ByBzoesoJDrMGjar29vT1UkWm1Wth93vO8nGYvP2fK8iUJsKZHo9EHYUdHRzc3N5PJJJcYhHMTVTp8yULnQ50Pe73e9vb206dPnz179uDBg263ixWDsv0D+7nIOBJetK79XBRXIb3KvjYr/bKovxXfyKuL3bFnRhnFT6v6cYUusSyMeKEiiEq1WSUno1rUqx5xSttbZ9YWGp/iUIA0TYFKKmJVGJJLa3UQ3DJN8+jj0Xg8MVJRYC/mVd7flQ4j2PUw2cmUnuI5ygxmdopmFRNFxU7+Qi4Jchim1Mur4vzPNNaaS2NCfM0okcvCave3TDBAg/dMhnLZmcoOldgKUqbtMNwpoLVlmq5pDntdaDz49Mlwfd3xapZlS3FQzT1l++TnI1dDglqSPWf+GfHsijRgJvKotlW8MN3/urI/qFWA8PeJDNl0o0ijpA+VaUJdvi/DgLigInlYZgz9u9dWHzx8eHJ2dnR8ZH0yrmFSDYR7MG3HMUwjjrPnoAjx6jQysz4dSlA41TyiWt5nTwfdmKy4ztJNiQaSRym5fag6bkkYMVIoh7CEtIkBlWuWEUWmwLe3k8n5+cXLly9brVa72/V9v9vpuZ5XXHyTcaxSQtPPehTCgex9HIPfqFX9/S2nM1kk0hSrYpafPBXUwbMHnQAbHdF/r9VqoRwLYu9cdLZ40IXJWNRtFYbHwtRcq9na2NiQKjLrUkUG2wAiyC+2heRHodLBo6Ojs7Ozy8vL0Wgk2nbpRRLqiwqVJamOoxtGqcfGcZxOp9Pv97e2tr755pvHjx9v72x3Oh3ICorcIKqY3ocpyl8QU3T52mWRlOiSj1RW2R/eisEUjfqyICsjvqEcicyvqGZC/AWZxIHZ5vNFSTJdPFZ6hrqzE6tONFKseL7Tb+CfKVJGAVbRr9zu9/uW/ajZBKdXrzWazebJ8afT04vxaByYpuO6cQyTm2tDdlFMdJqXQUnBHFQQ3lD+USWdqJu9zASWTlnKjcokJD9/eRfUPkk34bNMFvHheiiraEAx7GU1n59jzKOUtKTSlyc1W/VvFEqQA6iC5iB5YAJpRVCWEse2+u32/u7u48ePB2sbbq1uiPsln5ly3TuZ1JWyt2pZKKGxIH+q+kDmJvK7kbvO5b7vCEtU9ju3ChB+6bYwjqVCnyT9BKx9SIdJ3MK7vRWdiaruNiJQcwQlfd/zV1ZWHj84fPv6wWQ8mgfBdD43BQUljCLLsuMIqvKoC4XaM9Uq5+sMQeRGdW4QFX5asIpfHdVP0/SUQPPD3Oo2PyaF0C/PSopRSVJBcQX5HOAoWlYSBKIwMjlLEtd1m62XjueapvXo4aNef4BJLaymwHxObvCzPEY1jJpOI39FkEwdh5UjyEv8fyHG1fAW+cUcK/jOMkKk5pqC8dLtdJsNUPEZjUbEyyWWJh0XoRc/Hx51JskffI04ELmg2GRiOBzu7u4eHh4iGsTEIOYGeR6PzpO62+OegyC4ubk5PT29uLg4Pz+/vb2NomgqjJii0JpFPM0I6oS4G0bfPfrZaDRWV1c3NzcfPXr04sWLra0t0C5ygUSK0JQ6JS4v1KTBzI0Svp/rVJFb7C5LiVRW2VdmJWiQvnp84tbpL5agk44M52/VRoLirZwRSs3cs7l9rH6Q/YeYpqgq5ZKHo3ekxKPuaKGcOGeekBDkgkvOzXiWZSJDv9VsWRvbtmX7nt/rdn/4/gfXefPmzbs0TYHkbzumYaKjt6zEFsUpIDWOvl5wRykyRaMrCKWEP6SvYyNA+TkZE5YN8YhkmmXCFukbPx+qUTFmYelAP4mN8jMPgfuXe1URBh4GZlOx7Gmk0GlWYBZZwuCJbAsaD0IW1zCgBsE0243G6srK8+fPDh8+rNUbnufV6w3HtoGyi23oIWJQ9ixkHAfVpLIVEqtspDUbGzyxETWm13+q7I9sFSD8fVix6EuXn9O8o17dkz8mMzliMoOVsed1+729w8PvvvtuPpsa3/8QJ+loPE7iGFv2AX8hTc04zvSj53EvWpVqfyg2sW0gRABAkxvSWQAHUDSGQwCGqRiYpYEVqzMl+rIWtIJgl0z5S6yCBviBYU7bcVIBgKfT6enZmeO6fs0fDsBa7bZlWZPJJMcwzO2crbmh3gJmTSqYVAFeNioyH0hp2y82acNVRnWktozAsxwTckVcwNW23Wg2hsOVRqNB8psE0igATK14ac/Y8IRGm0SS6FeXGVbrYff5dgcAGMqK0sdLz1Y2toii2Ww2Ho+vr6+PPx0fHR1dX19PJhMUFMUOE/iTJFLlYgsQoYSpeFGe57Xb7d3d3SdPnmCTiUajgdiVq6HemR7k41y6WMmtM3J38B53u7LKvhYjYmeO4SlX8DlxUQUFKYsoRUGZk9MtIrhTYF3nGQTiWCjz9eQ7ySgCZKijTJuEXD6elCInlrJbJdRUJpRFLMd1BdMHuKP1eqPX7bVb7X6va1v2u3cfAs8LxURnGGZsAjMCrilWdeMKtxSoHMrtIRpcyPlk27O/qDcXioj+vWTOBXuSHMjFbu7vP9rCv+BPtlaRAWXxUxQCysJy0YY3btXqw17v2eNHT548WdvcqjebFsjJomMQyeMcpFbH52cgLpcoVNL95KBdxpWw2Do9dOpPlf3BrQKEvwOTi1ridC8g+C2yRStFqmNOoLWEGZmmFUftdnt//2A8GkEXOOQcxHEIfxRFyUo7m/eUyx1LniM2TNUaZWJLkfqjaJQIgUqN/pwUjeY9cILq4iW+Jj6oIbEsE+KXsv+EgalSocoV25Y1m83Pz88/HXdfvnzZ7fbq9frq6prjuLwtYe4oPN0kg79cQE3H4CQ0FI40ozdqaMaG3KHxBViuxO4+rNH79J+gmrpGo9Fut+v1+u3trW3b0BnZsrByj0pMc4CQ/iTxoej8jlBQ9I+wXQ8gn+dD6SCqyKysrLRaLVckDrH1/KLTw9wgSp7O5rOba8gNHh0dvX379ujoaDweT6fT+XyOZFEEjfgR3jaDn54N5FioG9zY2ABZ8AcPNjY26vU6PtiO4+AFEvF4+e3gBNF7NvyorLLK8pbFeNkoqtxAl+rRn4r9J/h+1KReVJpR/+jmB7wbew4kZHKMYo+UpCTZFgQKGWIqp7AuZu9JJyWwBYcAwhsazUaLeqXWfCiUsB370/HZeDxGJBGGsncffVwqlAjXxbyDcuzsHNUcVUoWLQV++ZSg8asYZbzkUdQA/hKHU1Qg8p6lywZJ71RITPJqFchGmXRYiYkPQ5tI26553rDf29/ZEWhw06nVXCA0oR4orG3oegqYkKA7JqIp/a3SzNnNufYBtP9QyzV9W3+BYars92EVIPzSTfoMImFokJTnqS8qtFu+do8hpYM1yrFl255f63U7a6srvW5vOBiMJpMwDMPRCA+AWo+ixIDVNbEJEZmi+K8NHoVFSYXCGO8ugE5LpPL0JeRYHAoNatMONTOhUxZR1ksj75TrlIBuKrBIjdAwLNsOguDjx6NGow4N4nw/iZPhcAUrwSjHRalLGi4ABniGQldbkGYESV/CdZp3ETqb0A+JB5VVd7gvLWFY5I7y4eXFb3c+UUi7xaHzXK8rDMEhPsmkMrqoZTD/iaOHe7Md0I+p1WqtVsuyrXq9PhwM94VBqZ6oG0RJG0SPxVPFxw/Tg+Px+OTkBFVkTk5OLi8vb29vz87ORqMRljtS10EEh3iecCaigSeqiWJbi3a73ev2drZ3dnZ3Njc3B4MBl5khMdL7MEX5rxwWLseEfAArDFlZZVSDl5l+GZyRf2JMUSXeQlIu+drdzJe0DI8pKiBtTFkXESHUkiPyoHwb9in+QvcpkHIv2QbF9/EgOHXHcSgKGQzHdmp+fWVlbT6fj6fT65vbIABivGmZt7cj23Fc0ZQVvVWCdRcx0EfxhJQHV+sRxT6k8nid2MyfGveOBDRKOg0uLJPJDzcbuHuYTuD+/bVwbPTFSkY3m+fFDplMMpvW1SWntgNKY4i6XZG/xXIVx3G6rVa/293d3d09OBiurbU6HWiRBd4HahUsUojI8WwzcE6tE5WyDLWh57GRrDKffDTVt8D8Bcaqst+PVYDw92BUwCAmdLU6lDr8pes/XGPjjCHWo3aWKKG3k5OTKJxLDQNaBays7M7no5vbOElAq1p0ZxPEOajyimOQM4VIUppPLmVL+zI0ToH+sPcstoZQl0XTYxka1AOguHm5N8XHsuUcGkOqVhTqyqlKLRGYZD6f397evn3zDuQoXbfZbHq+j+oyQTD3PH+Br4X9JqBcKvmR8oSpDzh3OzTKFKVkgyb/9sXMtjzGWUr+obDxnRlCXDS4ova92WwOh8NOp3N9fe16bhiFmIPley6uuvQhGP0JK/dc37VdAGPdbndnZ2dvb29tba3RgPoKkpApZVSRfkwURZPJ5OLi4s2bN+/fvz8+Pr64uLi5vZmMJ7e3t+PxeC4sCEBUCdVleIDAxhSk0DzFko9up7uzu3P44HB7a7vdbmM+Mze291m6lYrr5hLjRehYujqs0GBllfEJOTc/I3dDxlsRHKr5hjChrPGzcjN2OVuTYpdcelq3RJKflUenBbtkligPyGK+ki2K/8fiDpwZPzfig1vB3CXWBCq0l1p7+ypaClDz8vI6SRLoGSujqLERiTMV3FFZ/KB9BFZkEJVUbkLDrnAjb35ezMlJFJw/4/vocX/u9EZxc3Vaf1d+UK97QAYGhjSLzTg9WGUIVbUg7SNzE+UKB3fsu+6g2314cPDs2dO9g4Nmqx3FiStE8iwYWFwHFk6Kdpt5T2rPyOwkJ4Wqx0sln+G2qny1ToRXjuTrsQoQ/s5MLKaxTVA5/34Ba59RxHO7syzkgiTQsF4wFlqtwerq/uHhLAin0yk07A4CgQbF0lOs9w1wLvnVKs1Q+CfWnY8pzegzZonNJE1MbEUAuaMlaJClQxUWzAi7SXAJ0yVgVuYDGOUP3VUQho7jXF1fv/rpda/XazZbrue7rtfv97nsR6EVpKhOTETfXvSmSs+MdAmon5UkjUrlHyzuUDCd3RnzfmTC38xywCOnC8q3WfRxul/YE6LX7/X7/cvLS8Ratm1FceYoi5KEfPyhy58P6cFGHVTyup3uysoKokFkQGG1noZehROMhUiCyPeBpujHjx9PPp2cnZ1dXFxA3eB0hioyURRhASGxRkV0XKfpECUiOvV8SA/u7OxgEWOz2URQiolBfj73TwiXPgzLkd6vxraqrLLfpWVkyXI9AHEDXvWNTH4JYfKbkR/JyIQWApFyP8oF6V0rgmJuYy0uCu2SyHvIijzNalR0x1LPeOc4CIwhJ2SEgpj9My0Qq8TdRsIVfnh/5J2dX11fp2kSxVYYGKYRicJ700gjkLzMlHAI7TRBm8j7BcUY0heqBodly3RpZfGcf5Eg6SKXiqf7dwXMGGFDjisC+6W71Cou9OwJKQLDwqUEBKzhZiWJ7brNev3J4eE3z58fPnzYbLdTGOoY5fHkzogNyq+LKk7lo0WMUUUZzTauR1lYVjebqYT9UpYjlf2GVgHC35PlhTfpa5/lQ/DiK1ySxjGUiVN31szMJQvHjQSJfIbhe36n21vb3Lq8uDxdXTk7Ozs/Pw+CwDTqs/lc9mEXyA3LEviCnuFCaGQvJxbRCRC2VgwZuQX0kBeFisLPivW6LurgSKDoSuWLgp+nDUUdmy2axokSNVlHATkuTA9i2ieOY8dxfvzxZa1Wa7Za9UYDdErarSSJLctOhB5pXoBbRXxlaJTpd8mrUmfJqkCA8iNXJnhTlNDrlyAHwrFZTs4kl6+7D1sJt7EsC5tMgNyn662srLx58wbJMI7jzOdzStlR62H6IOfb4AtUVGu1WthrvubXhsPhwf7B9vZ2t9ut1+uYlKNu7zyZrNVrhGheFEU3Nzfn5+fXV9do48n45voGdVCn0ymKykjoKIIIjiuhpixitO2aX/N8r9vp+jV/bXVtMBxsbW2tra0hibRWq1GbRAr63hMKFr7m8kbkFINz48NvYkUZrayy5XETVOXAdbV+gX8iIRm1bOckUr1ULskSqr9oqKOKgUXfefkx8n8KWcmAYSboQ85FB1CLk0OuDdKi77uqEMvE9UzDdB2n0+psbm3Pg5lfq9XqDd93ozgwjPTmdgQl96L+GXRKTQN62Iv4GPEvcg1jM3E9RmcgZFI4Jdq2pJrv7gjX0r8XA5c8F6kzm/ePo7HW9pLnoyQQ1OpCz8O5WHn+zIR4TGqJx0wJyZim6fu+bdvNdss2rc3V1Ye7u08eP1rb3ILbYNvNVgudpyV8yuJrVusrXlvEnjFaI9LihJiieeXqKjf49VkFCH8/hjlBXopANFBVmJ6NjOqloWA00IfKkg9pilKihuOYjmNaVn84PHz0KIqjMIouLi8ms1kURa7rmrFQIZMHUpOqEsxmczEVSIhuvBopEYaVfhZL8sT/gbuizlP+5LqUi/Of8jp05pAxf2ieBrRpJuRHkzhOoOAtnkynR0fHQtC53u50Ol1Y5QO73wZc4YoejMqRs8U30G9MS6QKRSm2iubSqbBuGTRGgrMjsHqha9w/dvm+pIudGDe9zZ27IkRHubJms9nr9YbD4eXlJTkzWprg/onQSweiIkDu/1xPyYru7u/s7AwGA5Qw1QStbCaZ7xOby4dhOJ/NR7ej29vb0WiE8I8ERSkxSOzlXPNA+RrK/m3HdXq93tb21sOHD7HlIPafIOYqncDn3txckrZ02bf8zQoNVlZZzriEjKbGKaUWCi9K2ucCYQ1efLhgyUykAHlQySBRyaHcLqVjJsooEf10wJFHUcvaZqgzW7KEx/2IeVWHzEzT6vf61uGjVqvdarX6vZ7ve2/fvjNN8+ZmNA/MNME6EZgSMSNWDsWw418h8kUKO6UQb4Fk+C9pueoMMvC/ZWuIRUb3KBOKQ19eeAxyUFCTRORZqLi4uNtYNygD35aVRlGn093b3Pzm+fOdvX0oHXRd07ZFmWJpI2d9dbqPhQ40wIKKsuDsmVNniBWGcmP5zON+Kv/xFVoFCH83VpJT0kCCermKTdVv1Fx0OSdfEOEtR/SzgbW8EHX0a7WVNag7n83n796+GU0mkFgTOR/bBha7ndqgUg1dKHRaj0/BkPyTKiq8wFqRYnC1jbosUkiZGi3JxCChwc9hxOWShwA1uROjjkARlAPacRIH8/loNHr//n2t5g9XoNoNQqcdkOSWk7gYPaqgkxciTiwxEy46p7bPFsWxnrTEns2Ov1aQNb4My56JVo0jZVBRQ3LHx5F5K4TO67Da6PebzeZoNMql7+gRkHcNO/SKD5KOC0q5gHxLqz0YDLa3tre2tvr9vu/7JGpKbrqk+zPkolPkgs7n85vbG8wNTmdTYIcGIaWLST8GlW94VwyOOYG/6gJZdGt76+AQEpWddgdlZqjPRC5+/0sxRXNKM8XcYGWVVVb+dRBEjUxn+ZJNoAWfzvfJ3WUybDqpQvqlRA8pPahglRBBlEVsFX2Air0KDe6VKiUrd5Rabvmj5zpk5M9C9e8RGSaYmsIwBIXkWt2ybM/3fc+v1erQ2LXm//TTKyCIjow4jiBoC2QfSVYU2U44HtWKE47lcVuVQOXZppzrU6KsOL6/gi2ok1F//cx90eXheilbJFOCCYuAkNYhotBEEKSgdAKG0baBzWSbTt1xN1dXHxw+WNvarrfb0Aja80SZybKFEEFNmcjGIk9B8lU1rbzrCVsO8eg58KatXAOtyr4qqwDh78dUTAvRksw6iTCk7DzDORDIWklAAAbBDMWzqC0TN9ILtUwzCGF9bFu26/ndXr/X662srn08OQmCeXyTxGliRRHm2gSBBCadxBSOQbAQ1PJUhkZJUw1fSaFNODWRFRT4rCTZJxRE+IlyOcpsykUVNdDGzKFyPEkKk77v48QZhkGSQNYoioAZ+OH9h//8j/9sNhq1eq3ZbMEcLZoWIsuRmuypC9FECyLkqPAfAj8JJTFBKm8Xop8s8Q/f4KSgX+fxWVDEwgdxKWWUebS7O9Tbto3N3AE7eSAAg7AQKJrjMWIqzMNRLo4rwSAalCIuqNgpNNZardb62vqDBw+GK8NmswlNJsQ2rutC9xQBU3OrIjxInMaOC1TV2+vb87Pzq6srVBm9vrmGhKFIFWKGkBoP0m1FgCeWTJ7rgKwoQNNOezAc7O+Bxmm/328Iwz6WUnJG6zfcy5bcC8475e0ofoPHprLKfo/Gvw58Nss1GJTvZON3cg7JrJrlBFXcIT9GEY/p05DEyUwSkh00uw1LJdKHMnQSfapKrUQFX5fPAyq2pQ+Nylie6/d7A8GhCM7Pzy/OL8ajSZrEo9EEJ2Dhri3RE0GUPah5O7PoyNI0lOPgf8qnXH+b4ue/8xhacEg5A/xF7FqubjIrkwKdmF2mwF2oRSObM4ELw965vu93Bv39nd3dre32cOA3m7V6XeYPBSfFslGVvXiF5JcBa+L58A4T2VhGNqNLNS+56EZlX59VgPD3Y0wnVOp9yfcx0ZYvIOQl7/wLvoBuoiJYiHlglW35vtfpQo3B+vpa501zPBq5rhth6XNqC61NS7gm1UmCcyYZG0TS7YXMC2Y5BawVjXdELDY3X+OMStkealFQ9B+KyV/i+2nuyzFOsXobl9lE7YviaDqdXlxevX3zdmU4XFldXV1Zs217KioMpUSbGBa1EJenmUBADQGfCs+l5HERFWs0yEeomOFh9qsE6JZknzIjVlbGxnJQ1n3OkMCzrMFzoFOf4CNBQo/vn5A+H5O8jFAKvrBWq3XanZXhysrKymAwAFVYgb70QeUjnLUUACEqixqpMZ9BehCKY09PT89OAQeOJ6QpSlCQYBh6diodFO3owWq1Wq/XO9g/ODg4WF9b73a7tVqNWtVz+3sSg7laFIKCue0/M4VeWWVfl5X13TZ0uCdVAb7cNjr8pSVJF37RJMYq72JPp6HCXpgyLFA+RXGHbsxEMV+ZVsxiDHkIyAOBDipvUXiX4UXIMJNl+qgdnaQrK/AiDILJ6GYyHodhEIaxYRpxRHQJUCoFpXGldp65vAyTggrrUEZARa7ZqgADi7wT1ZdpkkLJKlg4vMvl37QnYunibAmASA4LlQMULbcs6NEFBBPX7bc7UIy+ttbu9RzPw/3rUHjB7RIzDHvV00IHcanC4/ocuOloPf9ReZKv2CpA+HvmjopJAlRHVYiHKuikpqXuqGvJTkGK9F6+Z5F4hMUvynuYput5rU5na3NrbXVtPJ7M5oFYWtupkdoJkBwMWGaDF4HXWYeEvgD11qjTgOI2qNZFxboC+UNi2lxuEK2sVqH8uqSsFyY/hYQXsUb1TqB+0gpDaEVweXH108uf+oN+vzfY2t72PR88mSi6kAzArCIoSr4KsAvQUCRjKaIoWhRmuwvLu6KRj6SiZGHYbxehyyUJl4ia5D5E1RNLjByoyLC69Ua90ahjTo824DvNx/LVTRexCb/ZbA4Gg+FwCFIuov6e63SXPgMYXEc0GIahZVrX19cf3n84OT05OT05PTudzWdIIkUcyPsNJkISCdOYcQwKbyBIE0eO4wC4HfQ3NjYODw/X19dR41TyWpU+ba6MpGTkWb9snvpedFOW3LjKKqvsPsZzg/Qml4pJoSDcWrRN3oRD5RUBZdsUyIQsXMq/71q3EqEluk4pWM0STLixdPbCubB0333UjKk8W6SbYENozyvmPZiZh2tRGF6cn04mYzEjpkmahEGYpg7KiipWiyy7IESniDrFo+nMmYiWZt23KrX8ckNaxBRVmJCi6sUmUqUfzIa8EbylguKVJnEcmoaTOpZreLbdqtX3Nre2Nrc6g4Hr+waTwVMLu+K0T0UxUu1GySSpckUSw6PzIqlVtR5TlYcAIosPf2Vfj1WA8Hdli9fuVJvHs4LEAsXv/J0qJkQKxCU7KHC6XqPR6PR6G+trH4+OHWDu2b5fi2NgkkDWBQmp2aImUrSimZQkV6iVbQLNJmhK0qamKsRZWnG0MAaErfTUm9cNo3p2hQyxbSBWrSWiyA08ngUsWWz0dH5x0Wg23rx6Y9vOn4Jgb28fT8CxoUljnCR2kvCOAvippKhyTpXjudVANuGm3b/8k9TU+W1m5JwnK1WUKcI2gQbvBiRUYYJIyYf2DJ1erwfVpwI18ZVETn+FmKKu64LST7tdr9cbjQb0nGg02p02arcAyhQasKXMzCiM4iRG0IWJ5Kurq4vzi7Ozs3fv3p2fn0/Gk/FoPJ1OgzBIJB7Uwjau51KWErrPA13U930f0WC/319fX9/Y2Oj3+91u1/M86ilMWql3jzzP26tHotgHkt+IUvRekXwqq+w+xhVEVVBSviiySXPblBFEsYJDs+8YhRAPlxEikYYbM15J8SssUzdyna4iuzrDJHyi1r3EmK+ICGPd/j2b3Oj6jsSwTBGqg+XCMFzZ2dmZQIugMAiiIAiTWjqdTg3TdETPesdxoigC35ckEdOIJg0A0UtJ5wnpRW40JD2W9XhXa5lfX23mHiaXTfKMMKbN02jSd8uIMzc1FKKGD5ZgMMIyHC8bVwnCCdSh1OsQJAUBbdteGw7X+iv91dVGrwuBVMv2ocITS+iFcBoNnT6SXEQRZ5iKSxU+xAaDzHGwdK66XfgntQao0ODXahUg/B0ahtosC7JRqOIJ9EudNeRxxxzNBMmYcieLdi9oK6ZpimWuHcftvcMHN9dXF1c3s+l0FoTzeYCgCIoPBIiRACu7eGWrXk2e0ELe8seCeR/jXaKtRQG35DAhIT69RR6IUaMI/Q78gp1/MM8XQ2fCIBknHz58tExzOpsBQ9A09/b2fb82DwJQHcUYKlua40/o0VsAAICIRFUbZ8UUuwJkX8izRwz/G1d2Zx8bTd3MgZMsF+aOHUpwJToxNJuNdruNsiukBEOSpHIk1fvUoAKRoedBB8KmsFqtRu/rJHDBRE8TWTUahSAnMxlPri6vzs7Obm6hycRkMpGJwQhSiDo9yOoGZRMLW1YwWrbleRAiWVlZ2dzYXF1dbbVaSCrmNSTL0WD+PLNE2dy94IPJqwcrEFhZZT/DWPt5yQKVItjYinvBNlQHn2bXzoTUWKx2+eEVPUQeCEyuyjMIjZRj5O+MDo+olX2eg0RG3Lj//ADTLUQ2RUcD2057g0ePnzq27aJgcpqenV+aphGEIVJ3IkGqB+aEmrKY9qkGxEwsjTKjWgWTxgPbMPHwKG76j80Z4imTME6eqM+GeVFXQ3n+sJJRmmlAtRUPHDC2NMIEdx8nrVZ7Y3Xt4PBgbWuz3mxajgPJPex4X1wKsMdPkpkx3KH+mgswUHpc4lK1NFMAnMPFfzwUr+wfZRUg/D0bpf6Eh8jMwdwkaFT6wqwUrHSfluqfppTEQG50//Dw8up6fHM7BwWWOBV9/AAP2qSbArOenoXIt8pzI4Y7RqzyLFB+tkiDgdX8HdC1nGpIF42/Fy+Q9M4kE0MlsiDhaRigOPrhA/TtBRhg+0JBpN6oY0tHOmrutIqFXqI5h1BuLVvf83vDKrzxgrVqwK+66L+LGlpuJa0syzeTCAcpo3Ece57fbrcbDaiSd103CAJSkSVNzkyHCVFnjz8xN4hJQvlwLi7So8AzruSCIAB90XlwdXklmaKzGUiLirQwUYhzn9UFe1hRa9uu5/qeYK72B+tr6yurK9iGHi/wszRF+bDzR3cJfbd0eO95uMoq+9qsnALD5WSyetQ5ocXcNssOJPdcokTKQpZq3tRlijLJJOZ72pVWEKW8JVeulhWImWirqg3hBFcVuFxupDtKka84jmBqbTYta9MEEW4QErdBFcw9PjlLR5MojBxXkGXiGFgzMoCmeKTZtKS6dr0UQA0biZOUeDV6AKrL+xJmNb6IyTmafJloduT5HjjLV4qK4mpN5PBQVc+0zVSQb2uet7GycrC3t7m70+52LRtkZiDor2KyRSKVrOqkJGFOelqfIX9YVKmCRIakTahPt0oPfs1WAcLfp2UXjvrLj9EmNZNJNgFFFCHzJ8rBVZf08slXRUNRYyOJY9e2V9fW93d3P7x7/+HoyPf96WyGsqW2UJeB0vNsNZSo2ZMQlWug4f5xhhQFeDmCvZ6w4LrkXMUZNZwfq9tpSBp9gSvPY1/yCIrbglxXBIGWkMRMBIPUMIzJdHp8/MlxnFaz2ahBm7uNra1GvQEY2HGCIDANw8Y0FxZe5m8OaXyJa84WzeuSdDUXC5qPZpNqluOv359wUSaqkOzVTSaz+czFeWZ18rZtz+fzNE3b7ZbnAQUUHipRGkE6nNQCngCk53m2A5RR3xc9kwWvhhrQUx0L/xXPihJ9SZJgU0HP9YJZcHl5eXF5cX5xPp1NLy8vR7ejKIpQS4anByUoTSEriClBSG/6Nd/3G81Gza+129Cwa2VlpdfruY6L2Uub2ZJbVuTo5nhixKGlk8l9Np9AYDexssoqIyt+d4gyiq/k2pdeqE9JNFjIw+e6UOT3vPgFnRC5pKzP40psmaIDnVJTkzBCRbX01zvGiCKKTEqKj3CI95kZ6KC4W6gnhNYUTrfX3wy2RzegLjOZzOBtIJaa09kU1dUC0bUCG/ZAFiyOEaXkKO4yJYqdGhjHhI0jJs148cs/3pCfKX+Kd/R8yxdgBQClK/S4J1UEYITZtpAVBXEy33ddt1Grr6ytrq6vr66vD1ZWmu12s9MGBq8NvBRkoOAyQ4cOhCX0OJM2rQxoyiWWHFUKNTN3XyIZ8BuWq1T2ZVoFCH/HpqEOxeKkdpkqOpedZImRomrRDQBjmfhldr+ov4JZGJEb8brd7u7+/rPLi9ubqxkwR2fCeUSwh8RIoKm9DBCqSKecK6kFMJmccUSsDOdKmsNy8ysnTerSbgUF9Waq0yBv4KSGQvdJyGFK7uwRn0CSR7QDCsPwdjT68OGjbdktaHzX73S6Nb9mmOZsOvVrNQDeSQIurgwN4gvgkcrhF8IneIHIj2FxXXmRKrpcLFX/DXJBucRUkTJKI8e4snd7biojRJfmut5gMOz1eo1G/eZG4GrRJRkvlDKEuozQyrBGsUgP6KYCqlF1YvG41FZeNpGYh5PJ5Pbm9ujo6OPHjxeXF6PRaDabcRUZCoLwkDC1u5BQDyo6IMm5Iazb7TquZq4WB3OJFSt8SrIZhZuS+9NvEC+orLI/gOUURHHtnKeMCtPM7UJ3psxCWXf/1s2H7kWyWPBtzX+LM56P3tGXwK6L9ir9o5wc7jMu7OiKu4gtCh3EQclwNX4Y4jTrOFYUhpdixIA7qorTYiDyCPxpWQKPorIay5FSLSRjPpKUDJ48Iccvha2onBBHUFRlmlDYnfA64yLp4hT9KY0mYckgM6JgoqjEbNTrK73B3vbO7s72YHWl1miAX2P8EfZ4yGHDdl/srPShSZdPhmx5z0yqfVRXqR0fgcYKDX7FVgHC37NRQYKYX2U0C2GVigrxcjoKK7Im8OXRIAzoiWapAmuJVEyr3d7Z2bm5uppNpzfTaRxHQWjZlpCxwjpycUxYYbPdqvlRq9oQzBDyNQJGgv8odwaFCTEfuM2cdlbQk0Nl3pGHUnbkxRGNQE0EvIaKecu2ARN+/Li+ugpd5potzwcwYODqPxvnLB9AebomVMmh11QfpEp00p3hoLi4n9943c9QXybmUHoj7rMrSgZ2Ot3BYNjtdq+ubkCrQAh4osyMVKABgqbcnpcRSiiIGcXsM6DTZakRQ2NMyA3GEQjnIVN0PpufnZ29fv365auXH48+3tzezOfzDBpUtDELxGZDLV4KN0/Be9uqNxr9Xn91dXVnZ6ff74PSjMgNcui76GZllYTkOyU8nzKmaO5FhQArq+xOW6SaRsmQImVUbqMEZoA7qiqKFx7m58r08/ItzuiTEVIMlSqGqPDTKErMcoySX6Ir9fmlC3T2GWdGtdxqQABx1BvNldU1cUArBKHmyDTNq+tbazoVGUGYY23B7ABkiFeUICUImlWgPh1DKJmrJ9xKNdtSdPsLMIkGAfbJoC0llmUCGao1pSdawurHF5hBFRM93DALtHjAoP2g47YbzdXh8HB3d3dnpzccQrgZ7p28I7gLXIaJOhqdG8T9CaUF2FVGpE6tse5xqfgDwiOVX6msAoS/c5M9/WBO1fXu2TAVT4ixuSJhCK1kfS9DhjAn2rFlOq5Xbzb73c6w3220W4N2czadhJ43S2awcWLajm2Ihbjg/gncpUKDnNGn9i5IELYFEyuciqCdlFfZ6Xcx4sjZo/kaD1YfSOlBVYch0Jf4E/UqIDxgCdYiugHgjop51zSNeRC8ef+u0+sNhivNRsNIknqjgU0IrEYjiiJTyK6KWouyJA8xVDHax7ij8kaos8JbQC3rC8pAsrDkN4jelYKTXErwvip2YgOqDxQkGWtjY8P3a0A2Fs0kUK0OYZj4gPyI4ziyuZYJxYSYiENyKRJ9Pc8joikCOTpiFEWz2SwMwtFodHtze3V59ebtmx9f/vjDjz9cXFwgGtSt51UPErwizAoiHEXaaq1WAyEZaJlRb7VawyEkOTuddqfbIYxKVjomixi5mcJFlvcrHckiZfTn3+PKKvsD2ZJOnmoLvSUpcHDfkaeMIvrKcUezrepph6oMXGuT0qeKymGl56eKDNULsyyZkyEq0qe0ighzfuRYPmO4aGqyRI8l1A8XrdIb3W6/37taXVu/vR1h8XUSx9BzIoySxE1dmL0NwQGJoWwesIoEMyoHKOpTgHJEIt/5akqdJOQkn58Jtn+m8TQrm8xlSWf21gsQloDkCxFuaYpWN4GeDbhsgYzBCQqXAdoE9RqIi7Zb9UZjOBhsrK1ubW8N19ZcYb4QToMCTtuGRZg+R5UZFCZew7EAMaqDqp5dOswhC3byWUF5OUxIpvIpX7tVgPD3b6z3gpwICBOq8nRhMJWg6CV2L2Q0mAUTAdazGanjeqlh+kk8XF/fn02vRqOry/Ob0WgehL7vYaJFrq2xCYNY1fOOEBRL0/smzHaXrgltlkv1lTuMYhlh7oKYITNWp+kENkA+RyKkKSfT6cnp6cuXL1vNpid0n3vQoXBg2/ZsNnNcF9CscB0LVySyNaE6nBT0Ue0WEK8qIgipjIjK+8Kw/Fayoxy0yFWCgtBZyujdyITolwjbfL8+GAy3traOj48mkwn198OfPBUmNWY5AVi+J+sDIYuLxFExVvBx8Z9hQPf56RQKBaeT6dXl1fv37398+ePrN6/Pzs7woKgnhA3oMc7Nr46Sk0CWdlzXgUxgo9nodrubG5vb29sbGxudTtd1oC8Fh2pLhoIvDSk3WKxTyr2/qJS09IOVVfZ12t3fAt5inmUCcx8vlgtSOTclsjI17Cq1Qq/yh/ic72lumxwmXOAcuRYpP3qm2cNnD5fQHbWs1HGMWt2wbQvmZlNMhq7ru+7x8afb23EUxel0KrTfwF0SQ9KME6FTnmTOQJ2ICs/y61TVdZAk/MfhQXqhiKDsecjqk+PDoHJq2dFU9QeEhxVXi2iiQHIBjGc5lu1a9upgcLi79/DBw9X1Db/ecISWjChFkXc1q08jk8YZTT7FDsuejG6OoR4kFYk32eoOm1BoYaPKvmqrAOEfijuqwkIUDZIzCG4loAZG66BsXDa95bN11mSQzILeEuLzSdJqr2xsPphMPh0f3Y4nUZLejsZzKAYT9eWwe6lgqiedMvcj1vpi6sSFPGsf8fNsOZiUg1RWPUhtW3EPmHGKMNEUx/P5fGSaHz5+9D3PddwkSTa3tmzHGQwGCBpN2+aYtngCOAEjpmINfOXocPzKLyGBPiLY5FDQcfkOfxMMwJPJ2epNvcn994Z40oYOll673V5fXx8OV8bjSZIkqDWKpYPcySHxGA+CTwiCN2wggVhONoIXvgxJOEmSzKaz+Xw+noxvbyE3+PHjx/fv3x8dH11eXs7mUDdILRDJsLsJnSphQtH9ya7X66gsur29vbe/t7m52el0qPFgrl1EqXF2KK8o+Sxx1+Kt+dwPVlbZH96WfzVIrgyjSLoNvU5q6Rf3kuDPFhPyBoZKRE0Xx6lM4B1Ne3BX+XRZKXcjJ8hGyUWq1ygcijW5KZnDxbXDm46DuMjFCsL+YGg7Tq3eaDQbrRZIrX36dOqciXY7cRLFZmgYZhzbYqexmkWhm7CAhVpHrbDSkAwiRDkgNUrJLa4A8JuaEl5gQQEF8fXtkNp3bHzlGikDHWV5vEiopiY8bJBEFQ4mNRLXcdb6wwf7Bw8fPVrd3Ky3WqCj5nkmtLvSpF/dgFL2lgAwympi2NAK5VCqzGRqg+pCyuIZRUZvZV+tVYDwD2KiQJlmDfEvzlFyvpBTgVQZxQAedEWgLnDljEdEaSAKCUFCw3HcVqe7vr6xs7t/enZ+czsajUamYfieN5sHGMwSAUUoMJDl5JRTYso2aSxTimKv6Eml86QGt/xsaO4rc/YZH5NbYVPkjGg+uUwLLdNRmdL3PNxLKJQw4TKiyEjTN8LDBcEcmhVAs96wN+gja1F2txdsQ6A1LtYdVS8Q3mQ6LVGBuLyVMlFpITKkAeQR61/bllBG+TZ37oTX1/m+32q1trd3NjffnZ2dzefz2WyGoqNECqWaQ1kgIYYiBjJyBE3kg2AuzPd9pI/KgYpBCgjpvrPZ9Pr6ejabXV1dnZ6evnn75uj46Ob6BjsOxhE0n4wTTTfFc0uN1LZkDwnsdQECp/XaYDio1+rD4XB7e3tnZ2dlZcX3fSSU4roHoeOiEShCviJllA8XL+AsJZ59OcoLlVX2pdkdaJAmYZY8oa+VflFWN1j61cvX92Ypo8Ws/n1mbySsliYb6bPYpUFCAC4tU6j9Lq1bzpxzNp5FvBbYbZKIfJZtO26n27cdFzuke37N8WqmZU1ncyM1bidjXCjEERTh6wOpQBs1uqLImD4iQVh5XOBE/jY4kAoZybGpU8DJnKus5FLHVL2pFVqFVIBYuTBpANwdCJILn2Y70MXKtu26X7Mdp9vqrK6sPNo/PNw7aPV69Waz0ZQZQqhCsWxcgTHBPJ5+zN9KKdNH18TKTUk+NHv1uhthZZWh2f/yL/8iX1b2O7clLkdX3cmcnaRFZBefhZlB5bLIFwoqnYt0uhgUO+a3o1EYAesOlVFAc4y3GWTt4FQ/JQSCNJ/pbqr6YAtSbdmElWbfLRmQnB9lhInC4EgqCFVhAFaQtX+iFe90MgF1yuk0TRLP86AbQqNuGGYUR5CnEsjERjZIjvzDzpkn3LI3Ba+I/IyOE+uTY9ze3xgTUkFF7hbc/zSoj4KoA4zG4/Hl5dVkMqbaUXog8XBQQ6iKCWs1KLeAbpC1Olb0+b6fpinWH2I1INYNzmaz8WR8c3t7cXFxfn6OTNHjT8ej29skicMwQjAexVECWDIhzRiJQm1gStmgK+o4QBWFRhf9Xq8/6G9vbT9//nxra6vT6dREgQfIgqMmqtDBWX75RTV2vsjLvch9l3Nv3pmQrKyyyriht+NSZ0WoRsv+Uu9JLiz38dIXuZzLko3LzzZ7qtIYCZTNWuTTcE6QrMTcyRfLj3PtT7PxrIwWKO7MtmwPGvLWfMgSNqAZk+/XPD+Gzj2BokNSmykZhyX5UBRnkZoF6tJK50NOaFIn8ysanqOFNE5aG+ket+zoOL6Kxcmjo8QjRsun9cQW6FZEDQL8Y1lWs17fXlv7p2/+9Kc/fbd9sN8e9DzfxzoF2B48ETSBxEHN0ohot7JJlT5zdYL65NXgG/rh0NdGlNQKFVaGVmUI/xCmBMqYanZGg0zNUKpBvUzGYSxz2VoWdmXBzIRdKJIE6q/qjcbm1vZ0Mg6D4PLyIjWMq5vbQMRG4ziJUujsJyRSIu1c8IXMCxaPwaCarhbTWLF4VnfmSRaj4pI/UeMK1P6SjETThCynA6Kj4wnwG2dzKE4LQ+DRQM2953Z7PTOF1nN4NoI0C1HVRbCT+vBidFK1xlC6r8qJ6Lsm9MVMxSDVApi/CXUQn6VSfiOPqd9nP6RiJ4ijtZWVlfX1tZuba+wDmabpfD5HB0e1FxhRQMgHeqFBMJ1OR6MRdiaENJ1l1+o19GgicQvJQ4CClxfQX+Lo45vXb66vr29vb6MoNk1IVGIVYhzFuRi2PEm5rhFM0Rr81261O53uxvoG5gZbrZbneQgFieZ6p9IPxUeKmqKLnslFuqMVFKyssiW2TMdFOcrMG1mRz1ypG98tSxDd4zQ0ovt7K78LU8GiMgi5NT9n+rNKKMEUqJYH4PoLleEqA6nCmkkMIE2AFJgaO+0uJLjqjVqtXvNrIgbqvP/48WY0mkJlCfirGBmSolAeyuXFaSj6kkiAMgWB3JUKnqQpCDfyathF/NJmsj4Q6ubz0csPKQVrs0xcYvfo0gD5PnhtZNUmJi6i4AY4tlOv+auD4cHO7uPHT9a2ttxG3fM8LB20bIuNlSRLyeSg4KhiwFocQEexqbAk82RQtld8lBqu8CHQ7SYqq6wChH8M423fqSt6FnpJ2WLKtGEjhMyLZeJjAHJs1HiEgKJdb7ZWVtdAdHRl9fJmFEJlVyiTYwqR4j6TOEG0im1pNZFC/Cv7+cjluAy9SUllZKlSLLMQtFu0OKYWF+z85UxdmnjhO1SNEAyggyJZMQjiKLIBFobzIAjjSKhCx5BBsm1jf7/ZbocRlFA2hO4o6pGwyGjJQh/Ph4lbktooc0mC35+kcA5Cu1teL5Ikl5RN/iLGD4Hx4xzRiG92564oCD2bgSZtq9VsNBqe5+mBYpJuMhwQQ4kFHi6KAQ0GQTCbz0ajEXJ0G/WG7/vOyEkTQVUyjelsdnp6+un05P3798fHxxcX5zfXN/NgDkTSADrUI9QHzqi4xaYlpGWFpJxsb2jCCx+SkG6703bhZ6vf721vbW1vb7fbbdeF5KTruoRylz2HlPousJSLn8rRQTPf5QoHVlbZYsvrvpShQaLakSgofbZIGaX2D59LGVVH4lTJkv4xmTMsW5BnmvEqeKALyfQEQm6ddijwgoIxfN/kSBl0EcLaUP0Hc6PcoQoQS4ioGqOHYQh14JZZr9WhiiSKZpPp7c3t+fnleDpN0hRIQyAtI/aLrlPUAuA6RBZtciSlKyxlaQkbaUJZEtn8sphQZ1YzyVB9hwhLy1NRH9Bcptzd4QFfpUpgiVpAHFjf8y3L8nwfQo2+v9ofbPQHO1s7u4cHg421Zqft+R4JcdtCgJ1TpVCITvac0OF+3lBec1TZqZKuhEKDxf6WlVXGrAKEfxxbHBnFWZ64kOwPSs1FCJBqwbKSfeOUg4r8sGiuD1bXHjx8dH5+MR6NgiCYzOZJmoZ26KQ2pmNQh1rnBIvJEJitgGJqsI7kAB4wuIj4h3Hx77x2ItPn4p3LP8hHjPJvmCSUqS0xGcdQxxbNprOPn07CCLyjIwi0axvrrW7XsqzJZIK+U4T5RJKwgAbVUfBUtcxMkkjp0Ux6kM3jVAZQWOj8ihN76RP1M4AolhGirgz2qW+3251Op91uX11dYeGf4zgyg6fGRGgOATKMoziMQigcnM2m06njuphRRJ3POI5Rmebs7Ozt+3cnJydHR0e3t1DeGoDcka4dkg1FRJiWsByCQODziIb3onpQcKIdu9loDPqDne2dre3tlZUVYIq6IBr+s9E4f9gW5QmLicHc7aisssq46a9PGSM0syXJKvJW9dwxCUKmRHQMhuS+s/zQeQLFPT6VdYJ3Xl2mByzXfMbOu5y/qHJd0njkEcOdRfRrGrL+rTBy2rcgs8MwhI6XaJwAEl9RFIXRfBYEIYTbbm07kpJdiRUDn8gU9RTQTEkylMT5lsL4AkmVrl0NkW5k//cbxmCpZkZO6epQEotSik72dub3aVEkWo053TChToafgOfKAt/XaTRXe/1HBw+ePXu6ubvdaDfRwctWKLhsKCzhCKvS+kArLUg4rfKBauikqIyS9JGq5sq3Lr+Wyr5OqwDhH9CAd56wlgfCZbCZWM3LqvydaViJ8uiy1Bl0oE9Tx3CgL6Ftm6lRbzRX1zcfPngwGY8jqCUIoarQtFIAUEYsQJFwQZDlkt14dLmgbsZeGm8juVTSTqaCRkaAEZOjrNm4Y7Wsg7UyV5m5Op6TwdcMlsgBgeSSZRpzIzFMCJcmSafTtSx7Hsy3d3e7/b5t25Hop4fYBlmhi5irslBQrRgIjCORkTghqh8xtBmi9kFYeZnpnaUFY39TyxEg78SEUGwpFjSiEAWsVqsFQUDaMClkrBMMh/MOEyguOplMHQeyc2EQOKBwAF40DMPJdJLEydHx0fsP7y8vr25ubpI4ns2myGginJnrRI9dpKh/IHSWMoAsirCwCe2hhhvrGxsbm/1+H0pofB9gI6sRvbPf15IwzWcpxFRQsLLKPoMpypRdCpuKn2Y5oqN5ddEX9mefWD7hT2eogQg/sUwqh88TymUo18fezFyYvtQMm5EIJhQUAzk0mTvKXR38SoFamvewm26j0Yh7g2AjmE2hbDsKgRqD8T7LsubzGR0+AbU7rAGBdQBT0tLjzKdKdS35rOAv1bVe7V8uMEgQVb6L+qtcgCUrzLpon0o0AYs85IfkCAtNPsdxPNvp1OrrvcGTw4ePnzzZ3N9rtFoCjYNnBP0FDd+0pZk7SE84rQZodNSY6uGV16gyrDrrXfmTykqtAoR/MJN0Tfmbmix45YFEEyqwJPmTiou4aH2vyt4kLd7x3JqRdgfDrZ0daP89mUxmwXQ+j+J4MpnCBthZzjRTqMNLIREIRBJ5CMxGEiEf4RYdSxdkyzOhkygE4SS0WlQYLavQuFMEU06ulPJBnxTaoSkwZOjXNI3tJIyiOPJPzqz//MtfBBsxvLm62tnf7/b7rXbbAI6NHUOk2XLSxLZsoPiXKM1Qe8J8iX/m1pHSjGg9KxxqXnImS8T55a1Y3pZbgd0TsSDVE4kxlmXV63XUaHVElabneaAUKsi36jmWIxMEoZFO0iR1bCdNQE20Vq+LEn3YEoRkxuOLi4ujo6Pzi4vxGEpbozh2BSzH5CGqzvBLQKaojOE6tudCZaBQgfMd12m3Wv1eb211dX1tvdfrNhqNRr2BegAYLCcSbOmF56BgKfZbFCn43FGtrLKv3Ip1g/mG8vyFhgPys/xFhjJaOETuWylfaDmafIpyCQ9c75lONTvL8oNnWTWM2qj7y+GftJtTKSNNONexMBUAlmE4aMYLnE6GiEqJLfL9CPYDAMaFEvru+vr6ycnJaDQG4XDTDERIVJBFRcGipTXFsS6cDWPu9mVytr9CQYQC0lpNVAA2NVAkzyO3LSbRWHJV1DrKk2dbwWupNC4WOSAZahgeUEvAwQwHg3atvrm1ubu7u/vwcLC2ajrQ38jz644gFwltUZFRLKBBlSCVlYSab4x577IaV6WFpJ9HupgS1aLKKqsA4R/MyFXRJIu5QjmRIZhQLqbo5yhDuGiqQIV/C1THQAKr1mzu7B9io1UjNeaz2fvj41T0bMA+fkYcgU9QHcOz/ibbdD0LhJDEr6YvnR4U82MixWkUrXTxujwTHJVbMiLN3ZjHMKlRHpdii6JoMp28efduDmhksru1NZlOd/f3d/f2bMeZzmae45rS3Yr5PYvZKMqrar8xQwVnBT2A9Y1kSwH9hq6+0L7/18SEi0LjyzNgyxsb+r7fbDa73e7JyQkFoeHhUuRSCmaT6gz6WgEaof8E1R/OhNLM5dXVaDQS5YKiS2ECm2GoVzJFyxQ7ZfZbpgktAHxCTqbT6ayurG5v76xvbAwGw2az6bouL3FcPly5F0vWiDkQmFMM+swbVVllX6OVfqmLaLC8s3xJcz/Va75wCJ7i02iQoquq7VtZ4q78WPJM7r6+bDGH9qDFEYCfvFaQV62z/KT2hgo53HkeMliM4TDHMZuNpinIGlvb2zDZYiQ0gg710+lU6aDIzwq6B3bmy7hjtFz67VeaA3GWFaFA1NyE/0kcX+g4qUT3ynelaw0VUJOUT2FCcAwC6OjYIJZrmo1arddsPdzb//O3333z3Z92Hhy0ez3HdWERAy2WCn0DM8fjSWPM8eITKXXjSVZQDZqMFauvAH+wcdlRocHKSqwChH9Mk+tvEAblcS+ha6kpo3q6VRkPOZWUVqZhbkS0GhRR1CR1Pd/p9daTJIrT8WQCyZkoOjo9S6bTyIqF+CYQR7HOQdJxTKgvlyI41Lq1JGKrD4oXgKplSD0hSgePnWYyowwE0k8dJStUj/BVfq5eLk4gMZikiWNA7QRmMgUrZg56J2E4n82ngjQbRVHN99cdG2rH0SWQeGiZvxWMWnl3TPVLYlmQOpScokwJvuwyRKOp/iC03PLcJOMXtTvj3LmNl+wH/+oJazQatVptPB5TB0Kg3SoEKDsQxjGRaycToIYGYeCJbk54I6bT6a2w+XwumguKhhJJAnJ1LEeXA4QkE4pMJ/zVdb1WE1RkNjY2Dg8Ot7a3O51uo9kotqFfyhSVD2buzucKCO+/4qnyhJVV9tlJwmyJ2t0t5slgFlYv5L+6XaHeRsAF2deevZB0UBb34bUSZafOuaPIBlEvFp6g7jBeIBhqYVE1MIRbMkgMZbTVh2RscmksWCpFQyWI0KKzRLSuXm8MhoPJdBoBCyOez4AldDsaIQIUQigC7MVGisPAzjcfq8248l84IIb7FiovqPKtm26hq+XHYxlD7WnL9YEorEvgUIxMKp4hXFaZpuG77qDTfXxw+OLZN4+fPlnb2W60247reL4nJRRMEyP3udNmIXMVEpd3XqzjCkWzucoRuYRgI1n5ksqWWAUI/5gml60KcEiygej6KmdlGUrE0BFsI4sKZM/6skb1as+GYcZRKF1Canj1en84XF1bX11deXt07Jxfuo5rmQCZDFOos4BMqSCFihMBLolIGGLtn3ZFmqiPE6tozMCcnkxycr4NBsNUXyYsl1Q+MD/Fy+3vqkXIfEq4Z/Bsceo6RpIA4zHElvUREB0TUF0Flx9GESAYkaFa294CYqTnJWmCuSzQQREwT4rNZG8Tq/UXV5fxhwqyyuQtJEdNtQnRXRTUodDgL2l3yuuxe7fs6Ai6SFqm0+nYtt1sNqfTaRzH0ykwjZFTytcKqF4galGhdyBoybhurVajoRPN7aHbxGQyCaC20EERIFrEYJsQ3B55v0JBRhp2mcdO9K7rNhr1wWCwu7O7vbO7urbabDTrdcHnEQlJgo6lF6jLOsQLbG1FiWiuF1qsLFq44Kisssr+PjRIzLpypmhBdxS31vsnNEj0O1XFTWWHuv4wW75Y+qWmg8pt6FOstDH/r3KLhahfeRCQhaUom0UnLwvpkzTFOJycbEvUUzImp1xV3BEEQZqmXs13HbcG2stevdHwRC8K13ECUCWPbMc2IiPC2DTo12A9GxXllWibE9m19AQ+d2LkfRUsEDLAuj5iioqRkWQiFb/TGI/fgjzIRwl01ctBjiO6Bkc4OM91fdGx1ve8Rq2+urKyvbm59/BgfXcHZUVr9TrVIIBnKd5EdVxVQcPpyTxiwR7szLgpLcEqqljZ/awChH9kk7k+mOVRxFLhQOUX0IgpKrRLtM8s9w3ik5D4A9kUwzQ9w7TavXh3/+Dm+vrT+eXF5VWcpvNgbouMilj9CyAqafdYtK0oDrRXxeBHjKfSmUgKVQihzBko0KjfKaf1scwMbcYHKveaCvPIb4QRtFeSNeiAtWMzAVrsfD4/v7wUhYVxEseQTRJdzU3TiiOokQP/YYMCdbH5Eh4LvAjKc5u2gJ8CumOtglDrpruk7pfKHgroa0JwmqKBjKbzC/mAReutRSix9LgI3uhX0cyq3uv1Pn36hN14sZcDa8Uh12ES2on3HVHJiZ3o6XDzGfyH/SGllKhinFKrQAKr6LCBGCrEYwjgITLsdDpbW1uPHj1+8ODB3v5eo9GwbBvbY0BfClZ6WjZKGA+WraKUklsJa7T4HHKm6N93ryqr7KuzuymjjNhZwhRVQCv3jt6/7pakE3p5puhS7ij9WspKzewwk5ksLTUo2TM38gWydp9q1JlfpLlb8mV4bu6uKQh7BaZKO822nTpUWDfq9Xqr1azVa44NhXGShW9aiZmgaAAjLWbQYPnUVxa3/ZlhMt2RASv7ABBSJwuKOxL+WkynzE/+GLemtRI0sIWSB6gBMS0oIBQlCLZrWau97oPd3ecvXuwdHnYG/Ua75biuUunBhU2hz4n+U35IkCNK3SZ4EST5HUoMapp0xRSt7C6rAOEf2ljaSArJWCJtKEEX5KM0fhA/4a8LEiBslwbIe0DbBAsb1/r1en8w2N3fP728Ojo6TpL0diznS6GdFcGHQIBa0iKAUCG7kJP3kupn+kDYMRanMw5T86CqiAb/XjkyXBNIly2kLGXNofJhwB1NEiOKYssKTHMiyujjKGr4nuO4iWHYjr22vu56XgpimMAdxS69pTBbNbdILQN4I5kSR901gcnHKF0gOTCgzYmIh5KGepWTH66fPSCFqg+ODHN5wiX7QUOI1Wg0Wq1WrVabTqeuaCaBQE5eu7hM4o6ScnqsmoIgLBTtKOZINKWaQ8kaRWoTA3LyJFV9Cz3MrVar0+msra09ffrs8PBwfX291Wp7Hnh0lMBB6Lj06nReWtJ7izW696uNqRoPVlbZZ1mhGF4Lw3DK6GcsiIvTJpNlk3NIGWW0yB0toYwu6KvHNE5L8cF9z1wWY2B5Bb5S0s1U8ya3FaqYUhBbvbUcExJ31FI8f9DjghgoMCw8QbVAWQHJpJD1EKroLRuHzbHo84Ha7Dj9jAwhp6NiSBC7uGs8qLK27JiLrptnfTNlJnI/ondgnERWajmmI+KSiWNZ64PBw4ODR0+ebB/ut/s9xxE+RQUodWPhsicuXRSW1b3m1eUxYM9OqxKRqewzrAKEf3zT5e+Iu2Q7W8o8yTgStiLUilVi8V2aEpFkVNEmAFoPQfG0VW+1V1bXNlZX19bXbkZQTDiZzqBdBdSgi+o4cApYGyZhjZpSSc5Gr9FlHwmc98S5IWmQuBO0uCf5Ti74sZwWWup7uPHUHOtJJdTS0rReB91R7LI4D8MojsMoCqIoNc33nz6ltu147mg8fvz4ydrGOrSjsKxQpEkhtArwTXJO8gCYyY3yE5P8Iq0UoN4XPlbKw2qPJ+KvikT6i0CLHOspl37liTheMFM8Ljk/jB03mo1ut9vpdOr1+ng8pr2pzk+yBgU1WoEFmqYBkJDhjlOGMI7jMAyjCETPsbEE1nlipjEMw1ihQceR4qWI7rAKEYsDa/Vat9tdW1t78ODB4eHhxsZGp9NBNIg8UhKmLd41Piw8pEuV/YtAIF8GFeszK1hYWWX3tJLyaY4GebawlDJa+oLl4nIdvXmDCv5Cz+FZ7uiSY3Eua66dvVLY/pkzANFssHmP8BcqTyivQpEk1UUVtGsW7xz5LGLmd103TlMbNDJTIe8cQV2EYORj00KhNir9QqIqAop0kkx1tw0LCwyq0cl8HhQkBpIAx+oCsTmw2oSYocT8zB4rOzmLHKIKVAoZPWrvJzXYXccxTKvV9CH7Z5k1zzMNc9Dt7u7vv/jTn55+87w3HDZbrYaSKENNUcym5ov/Ckg4pzeG10Rpb322lNGmZ7ZAga6sskVWAcI/uFGGELvj6EbnMsapJZWlCFc2lISL3BIfwUvWTGpVv/rw0WPgTwbh67fvAmgQN4WSA8dNTFFsByWFAO4kxiH9qxwthhJdmCvDpFGBA8qxLgEVHhHkr35GTobWFkgbBfYL0G5N1FAl+miCbeujaDabnZydTefzyXS6uro6Ho8fPny4v79vb2wYhmm7jgXBYuKJZI6Y84uKYIlUG9RBp9Av3kFFdRGJRwwlWrlsau7SflaqcFFQNtNTq1BSuGRv+EI0+gOV0X6/f3Z2dnNzAwsL0YVCPCHQrySFWAMsO3TTFNGsAwdclhcqFRlMJHJqKInTYJAeJNAtIDBjAJu6Znme1+12Nzc3Hwjb3t5utVoIFwkBUuRh+WKJXbtUjjWWPORlg7xkm8oqq6zUMqkbVC7Ts7/0aDmVUT2tLZYbZdFJzfDU0dUCU5T0SzVlVCk6lrBS9dGzH9eH+OwcYa6JIgbRVC4LvInskicr+WWmCyJ6Qjj0/hEoKNqPoZ09rhmgJFsNVBwnURyxwkbVZ105tmKkllweH3aKC/MGwp/B/FFROTmUSki6NPnJ8m1LvR4LzIr94h2COC/4lxhC5CI1atq2VfM833WH3e6jw4N/+ud//vbP323v7XcHA+lZBGlIyooucSuFsnOdUF3gINijpdrPL9cvrawyZhUg/MObXo/SdFui98yrwu6BoDC+JVrVw2tcPSdpc2Vj/dmz57AWF0SRs4vLJIktCBsaNvJFARLCDIVtWBHFMOK7nMAVYRD+A4Qgk4sY/5LEeeU2pFdj/Ro0OTB32veJMub8k9ZcVTE8CHNCri9TAgEKIoFxM0rnQTCZTsfTCRa2xUFgGUZ/dbXWbHq+TzCuqGyeCwRSPk0vJijox4PJLJQoM7riR77LAq6HSroP38uWZLq4F1+e4OJozXGcOI6xjLDX611fX49GI0R3URiB+gCFqlXxoYzTsjQl9ZqXG5TlV3kylsoFJVPUcXzf7/f7Gxsbjx8/3t/fX11dbTQaVNOISJKYoourB3MHlb8yjYbCE/U5y6/KKqus1Eop2aQQoyGVzJeUWF6ANJsJBPEzSjYq8udypqh+YYqNhZ7KUmSHYdncVEmNh+7bT4jXXauUoODU4MRI3FFxNB2/EwQP1LVGWeb7FDMT4sCNLNtGCo+Ii4IhUQJpQApA6oIBqZhdyOtyZi8l95AVib9+Hj6mXcu4nhBt4X9R/+iK78J1ZxlJtDKRjledEXSNwO0tGwbTMoyG72+vrx/u7z1//s23//Tnrb39WhP0yWCxJHyQTJYu8imaGKSeZ81Y5mq3Op6RQcuMcryAnlxZZSVWAcI/vukcIPtVgic2s2g0KMoIaTZZNGcxqglMWbbjeKnX7vZ29veCMBiNJ7PZ/Or6BtqOh5BSc2wJdRC6UUJvsaApnajMj2n/oc4U5+ckAWohcWGg/49qKqAuPc8Gyb0uIii9meLpC8YJOnuM7iXQS1ZsFsVRMk/sKArmwdwLQHE0TaaT8Xw2DcPAsMwHhrEiuhokSTqZT4Bp40FCjLB0LjWUp1+iC0cErQ6v2xJBFbvqXS+CoVjMkCs8yGvv3M842ilyR+k1H8BF8In+hE07oihqt9tYRuj7PgFFxwWtgkikYfFTou8HPDPIj81pz6ARGRW170D+zvMId+GekeAEYM9xLRvewbrBBw8e7O7uIlO0Vqu5wihDuKQBfXZ8dBglF9MtBYF8hxVTtLLKfoaVTDILVDfvzxTNTGua+5n5Cmem5SxTNPOirDF98dx13lKfvIz6lcbUlgxISVBMsdhlY3rk59D5SIyr0oiK/7901OXOQWRbKD9LNa8ourm9mc1ncZLM5rMwDED7S2xA07VeY5TPhDqRRXFYuAef0TNEflr9Iyd/IUcAos8cX1NCF4Olws1nbhF3nRpjiycBhg0oJwAyUTCu6dddzwe1MstxbWtjdfXBg8Pvvvvu0dOn61vbnV6v2WxKGq1wLksEqzUKZYcWdTpKK57OUK2f1OrOLKrmVniwsvtbBQj/6KapLCoUxjW+5Dass7lwEjkAUO4hZNbFTBOBQCyASL5fW9/cBDI9TJT2bD579fo1tK+NohCLvuBQDqQNSTlEn6hyjoogSX+VrHgG0rCkC2dARSrMGCdn4juLclzLBg9nWuam5RCJl1EUYVMjcDegB5OYNvjdIAxux+MgDIMwisFtwFD4tZrn+zF4XFFJGMc2yGCXc0d5cFqI2SAlVKHixEoN0VBEEUS1aDnAxsQCmQA2mjhkuuHVZ3SxL5Z8FOsrctjmPpRR3/cxBdrpdAaDwXBleHJyMp/NQzNEJEaxA7lTtcrBd1BUpih2mkmKMnSK3pckbUzLdF233W5vbm4+e/rsydMnBwcH7XYbE4NIK82dcNEKdFlcX0m9AQ4jizzmYnlnCde5ssoq+xxTTk1Wwme+SiqkWJzHFr5QTFGuO5rnNxaZogWV0SJlNBdlVYpgEpfwEy7y/IvzBiFV/ZaijCoQJn/InBZBXDFHFdHWnbUFen5G7ytExaez6XQ+n86n0KEX04WKvpEHhNldFfaeKYpTuPCz0oNytEUPegoN0zSNO1dLDrzNeItKRkKOKA4ZspDQUGdMTPUidOiAcrXvurZhbq2tPn/65H/+r//17MU3/dX1/nCITFFLFClQv8eFQUaVNsY7WIacJVspxwCSkuP00CrXX7mUyu5pFSD8CkzPGmoOJIJ+IQEoCSVZBoKaoUpqn0zTNhzDTGBmjO0E+i147nBt/VGSTCZj4ExG0fujI9FSHIrDLCHKHEUitqXIftmFsgqBoVNG98SChJS3YY4wG3olbgpbduNCAVFlSfasZMzIMcsPkv/ATB3iasG1ScDxmIhw09iKjRAqNEKBCB1oyWjall1vNGzbbrTbfq3uei50UkglciuvYCTJdFFvQG0b1MqhUDeCsVTxH9FtAXBKD0QCBovrQu94iDI5QHn0pSqapUlCREqoE+O6bqvV6na7w8Gw0+nM53No3BHHcL/tjLgo6tCySlHGjMquM1BdRoNJZRSLRS2ZTqezvr7+4sWLp0+fbm9vd7tdVBP1PI9KBwnXlVru6OqMbBnezY5Mbtxy+6k8dmWV/QzLf3fYrFjY9PP3XiDbya8wk25EzgityDVlVElBwrS8gDKah3b3KAvkn6UXbKpRjQfljKSaDivFGrGFSnqKFlNYO4fVhoZoS4jQ8a4ZiYrYIQEYhMF4PL69vZ1MJ5PJBJy+TAzCdK4KvMun68xgU/xVMksl91HGZD8HEkpImW0UpHgcOkCuajjVlJ35tFA0o2if4mGiW0tAPtS2LDOKwenLsgLD8F1va2X45PHDF9++ePbti7XNTcvx0KdgVjAW9CsKKxSGle6p5GxJTRzVyojGSV5BZvjYC6pyqdKDlX2OVYDwa7LckpQ4l2oNm5mX2YJYFEyXpDXUbiDyFYah4IU6ETSgtxqt9s7e3tXV9dHx8fX19Ww2Eyv1NBUoEEJrYuGO87zoUy93TGEtKoogRWVeCcaxXIY8jz1wGcIUO8+8WIRbNJmEOBty5lVycVrBC9J1GP/EfBd4PDhRKzBCM4qgRA40x4yTk5M0jl3HMW17HgT7+wedXr/RaiZxbIte55hhRK4Ohx94VrD/LAVI1RaoOgP5rpJPEO5eKlkDdk2z8j9KR+5+tSJF4+uP0li1DngvfFpks/gUelhBN0LUlRkOh9PpNJgHk3Qim9Cr0DIpxyAqpjwhg2GZd3J8JGSKgjy6cMyOA00mVldXnz179u23325tbbfboCIjCasiN8jlZBaNg/qpUwfikpP7KBXlEPVn3YLKKqsMLc+olCt7/XvOioS6O14UNi6ljJb8SRab5SmjjIjDmSdmMTOXc2rcdxcBFXea+EqIciMalOJxODWJc5YH1QgNnZeCiyTlUnoUVSUIAl2WZQfz+eh2NJ5Moig6/vTp/Pz85uZmNpuB+HMMgBA31pzV/HDxeHVROQaBk6bsGneZTplRyaIeT4LNMswsODeKKSqAu+wiq1YDCAlF03iFsUADFdQThKao2azVRPdBq1mvW6a50u89eHj43T999+zFi25/UG80BVMUHD3AQSF1vYgpygdZ3gJxGkjxzT5aRCmWD44S6VP6MSQhWzmXyj7HKkD4dVlupV6MULLSZebegH6/bPGq5TdMwxWTXaPZ2tnbC8NwDHnCySwIoCWAbUdhhLwLcEO2leJ8pzrOsVMC/j8XDS89qGoCno8e6jBkGVOlbJ9KSzSzXe6VrGwn1iXtB6sBxQScpAaUFCSCDwmXn4jWCHE0hW55s/F4vL2zu76xAa6i1XIcOwwCbGxQeqXAq0RHLpC04i8BLZT3leLnrPtuKXlZ0QKR6vXlANFA3d9ncLrUkuQq7XnRTnAxgb09PM9rNpvDwbDdbtf8muhjJTvUm7GK1ApMSH0Ic9k/yefJLshQcxUr+FHXG0/YdV3sPv/8+fNvv/324OCgITK3yFNFZmlpU5Di1dGCpvTpylPL2Ad5trC0pLCyyiq7v+WFYSTXUxYe0JviDcYCvYsyKj+Vp3pmvte5L3iu62BZPIhe5L/4BfZN1qkpmc3c3EtuDukTFDJTTRBV2og+rqvlODSVh8BSjDsnI2wgYZhmGASz2Ww8Hl1cnJ+en13fXE8AGYYYz4tFkSGJfnE2EJ28pm6W8DV1P4/757mUI9csodxf5fDK8jxylXgstpmiKrHKQvgp1MVNrNsXnRghjFiv+e16fW3QfXy4/0//8398+913q5vb7W7fhTijbGBLC4YlTFHly9SqRh25+KzIdKVWotVVp0T8qrRFK/tcqwDh12jFJSmGo4ixQJvJbTCCtmAiI+lI/JUW645t7ezuTafT6+urUKDB8Xg8TadhaNoO4AFwXTANy6qwnK8Vf8Kyirw/yCWIcueDM2o2ZSRDaPISVLd3Hj7kxBI+Mphq41oFcnLPlFIkWDcio7NKAhVOwk7CKJqLCvvZfDaZTK6vruaz2eraemKk3W7XFpB4SZUE9jii0hQBESFuKJc7Uh+O6kYYa0rWRuD1SQcsWlNIUHInw3PJk1Mar81DI8ELNZc8M7blQp8/t9FodDqdRrPh3Xiu58JiwoJOg5SFgxsqiioJ/umDQihca8zkCjKxTiZJEpSKQabo8+fPnz17tr29Xa/XEQS6Lhx0SWJz0TXi80JfomLo97NqViurrLLPtbIquGJycFlhXqkVv7laM+auqTI3J5Six7JPLSzulg46S9Dg3oqa7pA2jJgUoZxBI0OV/+LMmiJk4mm73DnQawjShdF4Mrm6vvp0cvLh48ej46PpdAr8ICb6xdW/Sq5dMW+pwTptKc4d1abVWuDesyhW9VPpoHyPtSTMnADRbWTmUD4fSpUdhl2yf8StJJCZgk415A5rrt1vNw93tg73dx8/fvLiz9+tb207Xr1WrxtCtcd2oJeSdScgzHJ9RcdiMQjZ1r6ykyKv+snePTYO9xywyiqTVgHCr8VKC+dk6Tlto8JUchskkiBikXXZ0iGV8kmUo5LMEMuyWp3O9u7uo7MnQRimaXpychoEgee58yAABqnI/FipFceREDeVjo0AQy7slXOB6Jvzrl9FPeM0zpWJI15S+1VSAdwpSvAhtdjg0lEaJCdpQzsU/gFPCPN4nuviuYK0TBAAPAgDZCF+OjmZTiaj29vb29HtePzo0eP9NPFc12q1IjE4tVoNMQlkq9QQUJCahl1otAItlhhN2atXmFCctNiheGEk0ChDdE2kW/l5aJA9ALknij9O+hkD2VNkrub3TE0CUf7N87xWq1Wv1V3Xc2wxI4lBxSwi9qCXhTQC+6nQt+QRxUmcC8wbSrsVlEVNU4RpAfL1+/1er3cgbHt7u9frYW4QhWSkBJw46J1MUfZCv1+aN+CBah50yH0fK6ussp9tXF1Dv0MTofqTTrjorFj6GS8wMJdliuZOozgT5jYuOGKt5kZeqFguqKN+ZdxL6SZECBI3TgSlQslOimwY6jQXHRlN0Qu6IBBTFN2Tag4UTmfT05OT9+/fHR8fnZ+fj0ejm+ubyWQShmEcxSAxGmP/CTDiSWZzXipuyTA21QAg7NR8yOwILzKqKGFjqPNq1F8CnQdVT4C7QQ+STfjKfdpQxo/7Rc/SajYd13Ucp9mo11znYHfr2eNHz1682Dt8uLK22Wh1UTIAfdAdmqJ84aEPTkF4Kf7HACrhQ4YLNZUULzjzaFVW2T2tAoRfkeX65mEKTYmkqA0yvBb1L2uTtDxPqKb+1HEckNe0rJWV1efffOO4oOTxsvFTHEcXl1dCVwZLC0SLJAN0R3H+z7lAEo7LeTK1EmdXRxJt1MGQFuUk0LI4MlwWyMSGtUrIk7tq5pD1T+g/AXlOcc6xEJyEjFyapGEEBZa34zFQZM0fxpPxZDIBBqPnGaZZr9cNw5gHQc33EfZRrzw+vPhCIh/hSIUsgJY4zxWUayGBFLRrUAUHzqeM4ngnMslhyAL40QMjK0Oyt7L4tOBfXdf1Pb9eq3c73U67fVmvO44TBmHmU7iqUJoyqnMJ5q7ltfMVUlZQFF6D5242+/3+o0ePXrx48ejRo5WVFeo+vzztWXxO6MUSwif/E4VRSv+6/HCVVVbZcpPYj/E4itKdOgiYxYTLKKPFbVijvDLhUOn+7sMvLRau85kgFzDKOT4CD5KEwnKGBGlUqZx2WNAtj2dHxQsEOYIGKV8sivZibM4UPm4+nwdBcHV1dXl5cXV5eXZ2dn11NRlPUDqGaKIitpuZnzOQmDQ88wnAfPJTbYYQZ9mTgBcCc37G2dMtY88MbxDLeEDguETPRtDrpnpCA8gsSlNU6I0JR1yv+Z1m43Bv+5+/+/abb/+0/+hxu9tvtTqu50HhA3lG3PWS5C+7XnyY9QNAxYFa1C77QCI5WlyxvrjCE1VZZfexChB+daYkRqDSjbiSvHQwtz21zaWm6ItglSJpALEe/Ad0mjDq9cbGxqZpGrYNRdjQs8g0b25up7NZFEV2ahuWYSVJGMlwphJEYSUUzDGXHVZuh3oqrEqO+xK5JsjvgYGWEqeVjdJiBC7vorIvkPxpgtuAH5CnBMJHYkRG7KRpGN3cjoBAIgKorudbjhNG0cbmJlay5RBX/sbR8kIETlnMWPWoUEp3ujBCBrVJwI0Xb9BCAcKf3Hsswfz8s2UFcriZUOiGFchCj0QwTJTa244LQi+9Xu/q8urq6gpUC2IZkMbuFHgTkRrKS4ZotcEZwhIQil9RKqbRaAwGg6fCDg4O+v0+qshg93nZV+oupmhBH2LhPbpPJLuyyir7ZYxqwNTSf9FWSwKCd5cm8ugpqpGwWbPI+f87Z4A8jsKSNtWOVYfGlMck11mYmjTPUDpKLYSlyz1YCC0/RJyzkyZpMJ+HQTCfzc7Pzo6Pjz98+HB7ezudTmfzQAUgUSUOTjAR9A3FG9JcRz1VloyQ9DIFvq4KcJYZoi4I8Fm20uXM1okoYqpcwyiIhS8gdydOWwydUI5VRafI97FM6BiBTYihz4SROrbVaTWfPNj/9ptnL759cfD4aX9lDXSqfR/bXZiWlcTQZQrRmij9WHijET1mkaGM5qqyQFblQf/PiMvAHyHge19OdGWV5a0ChF+RqQo6wIIqCCrCZrqGLZvPwdkRW79T+Z3OnJUfQvoPwbyPRQ89x/W63f7q6urmxsbl5eXodjwajUH10ffm8zlO3ja06IF25LragXtxTU4EU910pYOTjoUoQsL76HOS9fQIB4kxWo4DM2t6NgXnM4eSeirdE/EM4fxlxBqoNWlq1Ov1NDXiNJnPZkJjLL28uJxOptDB3quh3rdpGKtra7V6PcS2hgqckMZJlkEkzyxHJZKJNLk4yjJtWMsKVHbFGCeOBxA7VZeFUr0Tbuyg+Fp2g1APkRx+YqVyHkvO8NLgAUgN0JJx3WajaTugOxoEQRiGs9mM+UvxEdNKRO8r3q2LF3ni+UMDCcUURU3RTqdzcHDw9OnThw8frqys1Go1bD6BbN57dp/PjXapMEwxFfDZ1NzKKqvsc4xaKcg1Mr1gIDCfhqJ/S3ih+k8lYSASDtUqLVp9RP1Jr+/J5+LX/ud//XGH4iWm4QgNyl7zijqRn4gymUw1IQN0kAFc5MkX0SDuIQxDrEgEaTTggkamac7n87PT05NPJ+dnZ5cXlxcXF9fX1+PRSPi1IIZYXko9CBUyBFISlllk7l0mDUZDnUeDagxUli/zVyyvFw3iLdBa476a3JDuFcL3BmFLHd8UEfIEuwoLd4PVB6JDEvhus1av2VDXYHue3/C9rbWVB/u7T54+29l/2Gi2HcetN5rCyxtCixQWNQIYCjBZsMw1KqQno73iBftThiHFHlGVIM8ntysvU9nPsQoQfqWW8UzIhVA5OYl0VL0d692TKXugcGNxz8SpwBV56qdts7O1tY3dA9IkHY8nSZLMZnPf85ToKABIEaiTBMRipFNUwAn+hmBjylI/BQtp9r8jKqsurkhlkQRRRjGiuTcbXS73VQqpgg8QAyfEcqIIgoTwVXOSBNyqZVlBGN3cjN68fQNlFnEczIMwilaGw3a36zjObDaDNgkKMhW4oyWjThgSlgrQs14ySfLcG8wH8giiUp9TvxWAdOEycZespp3ShmoPpqUrP2lYy4ZLKA85SBxtNBrdbndlZQULURzb8VwPeUrQvkmMW5pAmy/DNKIkyhWFUqibCLegiS6YosPh8MGDB999993Tp09XVlZ838eiDtzsnlV8pdwtXhWziB5WsUMrq+xXNV0PUGwNjy2DsFU9bwKxhDLKi+oLVAiVWVJqpXRMHUakPnGZN+9vGV4lyxCS3CVJtaC/k5walWjCXdAZYBF85iLUtE2AsLTFDvlHLBpEcBgGwXQ6vbq6Ojn5dHr66ej46PTs9Pz8YjQaQ5sJ1X2Q+P25YSBcTO4npwar/H52QJYPoOJjquAjOW4Vs9R+KFOPyE6Oot1qxaOkZgAtWxY0D0Q6LQjE2HXfr3ne3ubqiycPv/vznx8+edobrtWaLVGLblHcIVc3XrzLlOOVxNTMlWdiqWpNlctYE80nxzyu1EUr+5lWAcKvznLlUsAclYRI7FCgVT0VT5SaMXHBEr2/4v5VFBDBhnzG2p3u+vqmEBa1rq5vUsO4urqazeZRFMZxhNkzNY/rpJYMIrLEFCaEJNNedPDjcV+V5sycEP1RB4kZIsxdCi0veBw555QWrfKlFI7Ms8F5x0kCGFEY9LGNDNuyIyOaTKcXFxdRGIVRFEBFxny6v79jGIPBAO4IcFSUj1/gVEqr1Egqk+oQMkQUVC5DHTnE3sSnyVbEEUe27LhalJUqBqnEQ76mhdmC89clfrZlQz9Cu9FotNvtQX9w0b+YTCdBEMhlj4gXSIGZVEqP6jCz0k3gdzBJEseBfsC1en04HD55+vSZyA0OBgPMDRJTdLnPzlkuk7zoXpTusBKPqayyX89ymUA927OI3ufuU2aQVD9y2QoP94R96XLwUX2MeavPOGgu2JRjrxAUlL+j10ONMZF9w+Cojp5iIYCEhJpwqAgsGUCIpdbcw2EhIF1FkgB5Zz6bTcbj09PTo6OPP7366fTs9OPHj5eXV5PJOBTUHtkkFnpSQOiXkSngh3otKwk07KKDalCUHzcdlS4MKUROxTKGlbYUxrYUUuraEPg/nLskBOsxp/bLaZo6tp3EsZmmdc99sLv57MnDb158s/fgUac/tB2n5vuiPxfkW5MkZt3nlzJF8Z6qlHJCMuDM/XLKkmqawoYh9zzKXhqlx6yssjusAoRfo2XTFzIsqqOSOe+p+p3zfrUSeLDa+tz+cf7CAjDbdpIkdVy32+uZpjGdTJ48eSJUZNKz07MwSB3HDaPQtuwYGvhhVBKcitgX5v3US4FOUdKTFwkIR6m8Z9kly14U5DKzUJCmXKpCQRemjiI/wUevNAWE3pd4s0rnBY5lm04UxZaVhmHoCEwSBsFoNB5PJrPp9ObmejKeREGYJmm317WRymjbwLmF5KJsYV86znQahI3JNxepsFSiKSRAYVVAPRUpmLq8s3wRgnKHi1BUNeFQ+1mQSYbHI4YLtC270YQyv/EIFhyXl5dQlDKbYR4vjEJctWAEWrFkSP9NhrdRys0WUNB1nE6n49dqW1vb+3tgw+HQE+3pXaEOh6hSEJWXBXFziJrezy34ciFhDgtz67wKFlZW2W+BBsvW0/wzPGJVDPTomkBafYuZTUET9qls1/h7o8FcG/oCBFK80EyBNPspY6YKFtKn5PSOpdHo39mMBPwKyeqH/qxU+Y+dFei0gxD6BmNaDGgsUTifzUe3tx8/fnj95vW79+8+fvx4enp6dnY2Go2vrq6n01kYhFJbFHw3okHpBClzWSxRzHhsgW7lxzmyU8V/eA0aTJriGmXLWYvutO7GV8zQKn4lLV2wYgKGAzV3IMgshkWMheM6hmE2mw3HASXqZr3u2dbu5trDhw+++dN3D54+7Q1Xao1mA5iisCW4IC0pWqYpmsXB3OfiQbPOheKtYELTXMsjYVxXBSUUhvzsuEdllWmrAOFXamwaknMkOT5Zl0x97WRptebiC+0yCRTl3FsqsAE7kiUKSZJ4HhRb27Z9+ACOY9uW47q2ZZ2cnE5nM9N0QyO0QMYMMCSKoOLErYOxss67HPMR61P9TudBG2DJnvwrK7GTYUKBAWXnQ3YZ5YXsWTyp4RAn6ChyP7wTRZEgPYL7SdIU9UjDKBqNRx+PjsaT8Wg8iqIQnLS51+/3TcuaTia+7xvQkENClyW3UrYolCsDcGqZTozsBePiCl6r8ls5ShEtdJbkJwvtE6SvzS29SmOkkmRrW1YCvJxardZut1dWVzZuNsaTcSC4SThokES0II1oifWM2i2ueOAdYoriw4ZqMX6ttrGx8fDhg0ePHm1ubrZaLehCwfz0PZmi9KLYT6wUnxc3ziHGyiqr7Be05a0mtOYGp/1Tk9uyut+8H6FqChY61UVfOVopKxdcggkV8b682FjSOLLzj1aTRpSosAVW+JcMiyKraM5hNtKHM6GSgpNHEYFaKN+gzkCiuGN2fXX97t3bv/zlv99/eP/m7duLi8vbm5vxeBzHSQAVDzEmBrFuEM9Ote/TQyEvjA2BqvFA/Ki72JckDxkZVHgOpYaj8njFx4KgM1Nmyd/fDCJVIwa7VdM4QE1xCTXfa9f9va2NP714/s13f376zfP+cLXR6nq+7ziy+kA9DuJTpfddxd/xDuY6Oek1i35+MxLviK8hjCvufCbYgfHrnJpqZZV9jlWA8Ks2CrmpybBYB2EUarTxXwyw6ZhU0SOJWmqKZqVioQ6zba8/2NsLDdOwXZhIDdM4P7uYBQFmw6ieAVvVM3aE9uXaNRSiulpATZ2ovgoqMNT5RvlCEjykWl0+jLdo8HI+KCccoNKtahbHcClySZXTMKNoNjNu7dFsPp/N5g3RJz2GnKrd7XYROnJFnUWIopiSkhlceWgJTcsXKOSYFSVX9frQB5O3gR09t5DKnxeuZ9ApLmiHhI8QuHTbclLHNKAhYbPZXF1ZHY/HcxiQGa4wsAVWakMvEyHVQ2215EKHnhmsWfVct9Fsrqys7O2Dra6uNhsNJJFi1PxOTVE2NllJ91JubYG+e+duK6ussl/AcmBPyY2y8KVkfJR99I7vqUy80Mexj6uYxvXUkWHvle8kf9z7tTmlGVvPP7nCM4EDJc+QBkMlyQSMkeFe7pbMMuNHF3BOHgjm3jge3Y4+HR8dHx//53/+x7//x39cX1+fnZ2HYTiZTKANfWpEUSzOIoHmh4ZmtpbTdag9ki7dF+QdwX3V/YQwJZvlluiVBuY3keiqOKZsVHNHxb2QmFxmGzkChFxJFkixiAByJoljmp1G/cnh3vOnT56/+Obw+TeDtXXXceq1GlZhmpadxLLUkI16/jxoLSVvJePa5GIE2RQ3vpMfz0zbYQp3VFHHyn6uVYDw6zaGBuVsyyYyVgOgfAa06EGioC4joxmrOAliDFJk/AAcWlZiO7bne612Z21t9fLy/PJy9er6Kgzj2ckny7R835e6o0JgBgrUBaUwE3vV6EPiOZERw5YLqAuOeI6mUQWT8kFHZMIikUa4VHIYWb3xBat8Ge3EwG2ueEx2KxIV+Yo+ChHU1DAaDeg6mKbpPAgioZgShoHn+XEc/fDjj8gUTZNk/+Cw2+uFUYQpr0jQJh0HSI+ZIrrsCeE5Mb4oE8+RDijDHZVJS0ZzlEOAEU7Bn+GgPHvxRNbN3XrcWKZDF66BTFANjaMYqMW2FYYhVhI26o1mvel5XqPRmEwms9lMpvUipFHJvhqysBDzhLblOq7rubKHhet2Op3V1dWHDx4cHBy0223P92u1mhTpYd3n78SEOfecu9Gav5r9SC6BXDFFK6vsV7Fs6i8PC/kcnlOfpH8LlFHCF9LnZHmhvCMuvlJHWAALs1/80qbz3NUW05V6MheYiTZG9IZuF7OFed0YVa4ncpyEBmUJH3kovFjhDgDaJXEsrhQ8bxDMb29vL84vXr169b//979+/8P3x8efrq+vZ7MZpvLCMBSJRJDXxowiKtDkYmcFikpmQLDZAxsBfWdpXHPTp+ydqHC6bCnBJ2dKn9LIyF700sEBTRSHUFyvZEUJPVUkmxhGWnMc1/Ntx7ZMu+a5G6vDg73dpy9e7D9+2uv1a7Vms9m0hDKZZTvoVYSnWsjloYhs6YscaM8U9agaSsaKlRelk593ie9UVtmdVgHCr9dYHog3CCCZDuKH6vkUTXUBUFKSeuuScmZshg6hM8kddVw3rTebg3T14HAeJ3EUQrvC8XiUpONkDnIgUk1EeEC2EJeejDgRvCmiKpw30tTGXJxKeKrWCMq18JOUAnQ8Sip+MJYoz/yUeX2lxqoOlHddyteocG+ahmGEtQAYWEwTM0nMOI6m09mHoyPZcWE6TdJ0Z3cXNGYsazabimGBDkii8GNhnhDvoiDc6twsL5ws3p0i3MWtoalwFgryo+rKGuGORSgVD0aYc1nf9hyv2EwgPYhVgq1WazAYrN+uX19fE8kTuKGiMCOxYP1AbGQozhQgENTfIGgM7rnZbK6trT1//hyaTAyHfq1GRZi5VVfpKZVTyBiALH68ZAzLmlBXVlllvzpllNFBcxP2vVRGUZYjLyPGhU30gVQaqzxsWJ4mWowJ6QVPFRZfcO5o7kDF1J+W71Ka1UXUofKBEL4MgyCBOGYUhuF4PL68uPzh++//z7/9n//+y39//PhxNgMBNGopgWchpLJ13JM1Vc/MpbmYGr8u/GXxHS7TqdavCuqhigbEhkgXgmALKvo0rjEADYvzFERUpVbtQLW56wDm217tP3t0+Of/8T8ePf+mP1xrd7rY1kg9Y0T6WSQhg+cgA7Ry1UT9mSS/NxOI1nvWWjJqQZP1PGo4Ki9T2d9rFSCsTLo7FfvM6aYwIIVTuUy/qRJ7BqVwZi4mTGTAjbJ5kFaCSvX+YLgxHodhYJjGzc0tckaygiiUhNHdn2je5IJp3PkK2JUhMYq8JgCJkjBunpGiMLAGjXQh2OsQo8XFXVCCjfOJSOxNHwKuCBU+Zd+COI3UvD4yQgCEAdQcxvFsNnv0+PHq2qpluaL7AjbJlWyiJaV9orWuuGyGEg0jwWFkad1sEDfrpaQSKT0fbP/Un1JK+UkFdtRoy5XS3GGWacHHLdFjME2g/0RTyI0OBr1u7+b6ZjqZQi+sNAFukgNadjKxKeimOIbYQALVd1qt1vb29sOHDx8+eDAYDFBjhtTVSYV1ObEzU7pTFuPPLXT4YFaU0coq+40tlxsspYOWxCsLQEP5OPgOi0geNoLPkFHxU5mM0/Jyc77nwiyxBBCiH8wrRVM4Njs1LWGEclID54JwFgkCvAhgYCikr8Pb2xH0nX/3/v/3r//6b//2b+cXZ6Px2LYcJPCjiii+wO7BPNa2sDxBXmAmtFoEt3xXJbeLsmTF8Kz2+7rnkvqQXKuw1Jy6g2w8Ra1KYpoJaIqKC3Rsd3dt+OzJo29evDh49LQ/XIXEIVUfgPQo+pSlnWwztZIq4szix7p8RT1J2NxS3arCMMh2xFTKWlllv4BVgPCrtgJPXUvL8IgpbaNTc5QeUj3rJQVRdizIl21I7mgsq7xcz62n9Tju9Ae9m9urRqO5urY2Gk2QgpKmIDkDwqSOEccSExJKJMVT7TMy9FV5qnRpEgPwDrg6OahZK7iMQEai3IKVGSqOUIkynMAkUBioQrDSxS4aanSihmHUajWsBEkSaP5rR9CQMPA9ccJ/uR2NRuPR7ej2+TffrK+v+5hAEyV1QjQFUl4CsmlJAE5lREeSJDGv6ZcpYOUosXaCMJLuWU8KdaqdMD0HmimqSFNI+JF/yl61kry7qwDSMu3UDsLAgPtu1+q1bq97c3PTaDT8mu96rjEBGdLESlzHBSlaoWpO3B7R/Uk2FazX65ubm8+ePfvmm28Gw2GtVqvX65gelLpvC5puLV+dLFrDcYScyxGUEk0rq6yyX9woCpnrUJ/J8CtWof4uq25KHHTp3gyqgBA/nI3zMffH/kBMDIKZ+bRY2SyR8xScPIkmpETln9jH84Xe6IaKqUL8VbkJLSoj9iGCkqYZiO7zuP8wDG5ub8aj8afj4+9/+OFf//V///jjj6enJ7ejEZJCDQPK+7FbPTJFSeAaTlX61OIEmL9YKmdQowoeR2rRyDeUuyWqhfqpMmUa3clLVltJLqXSC6dPa40BFdEmZR1oh+s4pmX5tu24nmWaDd8zDGO13z98+PBP33339JtveoNhvdFqNpu2A0XvluMAPUUyRZdqiir9GCLtCMeHcWHGaNXrLdZYURXJiOdS91nSj3rlWyr7hawChJVJy2GqLJtUTet6a/xHCoegkiTj2SykyuDSvObXAQWk6crKOvxJ4I4wDN6+fZ+kaQAmHQ9+SgAAgDfigGamHCDDHtG0DKFHSUlDXZAukaFyKUBMNeC/EulRdiFFAmGmIEU5bJIxyA6sgpSq3hzfR1eqXLVgnFjQuX46nX369Gk8Ho+gfuNsNps+e/58d2enZdtYUIfkyCW1CuQZRW2kxG6oQVBk9fAMIV4VcnN1T6QF1Qn3LZOTscwFf1VMGaSDmpbp+36j2egP+isrKxcXF7e3t9PpdG7OoSAzia3UsmIN6hANQojBdWu12tra2rfffvvixYvd3V0oHVSsnlyFRvlpll0O76qypFawtB89jXOFBiur7NczjYJozlZclRwmpGW0iBAqvoli7WW8XtatUE6GSC60QQZwZF/kwGExTiS3wZU+S7JJHqN4pUrFtCl/kZlbcrxQmiG1gd/MzEWSjCPcK7AwEqjfCAJoL3H08eg/hP3lr389OzsDWWyRBhRuK0SuKJYLovYbpTQ1Ms/WC2Qxob5MlajLAOxcHaEsFpRdFhhIV6wWfUGasCTep/Z8nPOflxHHoZOvYAAFNK35nu+5q4Pu40cH//N//NOfvvtubXuv1R36vi/0rlXLB+nSy5mi6GzxaSnpPi9LbXSgWecD5R3GFRYPzashUk8lrmcqq+wXsQoQVpYjHvDQo2Y3qC11dEo3ZVJgS3U8L1n/EqOPcIiAHxSUNcRqP7ZM86dXb25vgbviOA4eCz9FJQpyBtWelbWbN7SPAeyojizjwVmiin5FHc91sBIZ/eXDRTFc7oyU1yttCksxPyo3gVeY5uJS4GmaRJGVpvMkjqez6WQymc9nITjpwLbM7V27Bt7IMU2HJSHL6ivIGQvQSN0XqXMgem69IqEQpvqVt7nHYCV3qDzCqj5AQfX800J4eGGGkORGsTGga3iuh20JV1dXx5PxbDbDkw+jEEcYfSRvMjEcDkFWdG/vm2++2d7ebjab0LFDrY1opXJPK8bpS8VFK6ussi/B7tQURQNGgwj+ZfilWSLMwgNA0BOY6mpXZVsV32ddCjkOzLFA0UlJHJhVkbGwZzprUcA0U2SgKgP7VOsEfEEBR+7RlF+Xs5zgrGCzwdn5+flPL3/68ccf/9//9//8+OOPJyenURz5fi1JpiJ7hwRRTduh5kas9Twl8PStofGIY0wzSsqPnkexCCHPv9CZMu5wJYDOTsR5AiZjWqo/accujy6SkTYoq8kP2SJr51hGq+5trA0eHu4/f/7N82+/Xd3acf1GvV7DIbVtJ05QBb08yEgxYnUrRVdGdXNlwYVI6jJ/Kkk7VIJR8DFy3YMKevq9yir7hawChJXxOVySExSHITPRZXg1FNJTzAyBOmCmE+11sNFr/hj02TiKQdHLtGq1OjqkyWR0e3sDHcmh2QD4xel0hrO4+BUyXXg07ISuoRWYmnZLSjiUBHZ2fmW+kf2kzxCOKe5OlYUzJgstLDT4ysmuSiQltkeJS3T/xB3F3YmEaGBZZmTHXuLOrNm79++DIJhNppPJ+J/+ebK3t9fu9MAbxXEQwJau65mm6O2u6uj0EQ0jFk2lcu1uS1QNhJtUp463Ul2tacGShBAg3m6SX0fKqCyuVLCbtOBVMPsOzqSQG8XFkG3ZQRLYDsiNttqtTqfTajahAweU+EMmEOsJU6ATO5Zt+Z5vWVa71V7fWH/w4MHh4eH6+nqz2azVajggDrB6ZKvgOzAhBuqVgy+SP0uJr8UKw9yn7kifVlZZZX+fLfp+lZTnKcSIRJLyb6UKjmaDPioCpnxHSXUx547mJhA1efLiQPorDz8pmKQL6UUnBjCSEhUS3wr0MBxI2A9EuGSqEDvqZbBoHEOuz7Ks+TxI4hiCa4YRBPPJeHx5eXF0dPzmzdv/5//5/7558/ri8nIezAVpZeq4LkDGMHQc6CpMGst857yDsao84VFCrCrQMDgzwCkEZdm4kUgb5t+otFPTRPPdsRRFE2EfuC4RNxS95mUhRxxL94wl6+jLFMazQX7Msho133Gcbq+7s73z7OnTp8+eD1Y3W51+s9kCpihIirpA0jFE34vFTFF2T6VnhH9lPhpOI0MnwYJ/XtSoucjyF1ROYCWylU+p7Be2ChBWRpZJgPCAYnFdq/VmFGU0m1MrqLSpT6FfhUQQTMeOrIVLkt2dAyghEKhgPp+fnZ2bphkEoZhcI+EMUCead+yBfeoAoY7dIh2Iqc2QJIBy6hnL7EKCotIBKnFj2aHTDis7YrliDx7WRe6oHhy5rRUn8TwIkgSqNeI4ngdzEZ0NHzx4CPXuMsVn2XZsW7Z2w1mj9uhs/SErAKk3rtKSyacKpeYNQHChLqNTmaronxdkKk0/+eSUyQstN9q3lBuN4263u7K6ItKkAWRTbcuxHSg1lI1MoBi1Xq97njccDp8/e374ANBgv9/3PA8R4Gfl8XKbLugHpf9amiosveQKDVZW2a9nC6kHZU3ncT2NQKAwZyppfxUb0sVaJnuH0lC5w2Un/ExUSAcR9bRZzBBmwWFm3s7xdCjfpVKA2KZd4kCBCbWmaBYYS7YnJvewcjsIgzAIZrPZ5cXVTy9/+q//+u8PHz9c39yQkmiSpLPpDBOJBFlltk2uFjKnyEebgoPKOcqrY5QUGskM9UbFprHHhMiaYXqNHUt/UlUUimJ+NQJqRYIuWacfgZECLxBAIzUFIodSeCxtNOpbG+t/evHsxbffbuw+GK5t+n4NOkyAH9SPXCHoLY8lL1DdUtkTUnFMGWVIk2B1flt3yNDMWckqxe1ZA+XKKvtlrQKElWnLKcpklbgzYldsnqUf2mvKd8omLNkqQIAGS8yZXpJEtXoPVGSSMIymk+l0OjGM9PLiemxOsYwQRVLwXMir8RwdBeV0vk6dCR5RNZ7AGTonVK2vSsrmyNGQeT3qCHwHHNTnImPMxLTMuna9d769AlxwFrEJyjFGCqHcZDRGxIidDB1oeWQ1my1RN+epflmLbqhUIsOCEhWwlKFXQJVIxOVRbVJqYz4cnKSqcRfdG+WlyfNXXNni+OiUMgmbLjDCb+hlYz9utpr9fn82m43GoziJHdcJ/ADbVEJAwTRcx2132t1Od319HdEg6ND4kDNUPU6kXs49UVlO04/GkNN670MZrVKClVX2m1mZ4Odiec8sHsvvif9DtrD5TuYQOQY+PwT2es+8o9JrkkMoclnE5M9iRelPWcJIzmkSC0pFEwGbqDmT9i/MM5LuF0T5EqEPCh0jptPJ6HZ09PHo5cuX//Xf//3jyx9vb29Tw3A9LwKGJxQQYukgtq3nMyrnCulbkGFysjiyzu+V3qwcrsyETdlnyydhvDC6fPJglKDl+USpuyZuDVTLKzdm23az2dja3Hj88MGTp0/XNnf8esvzfcTedkZTtGSSJ7Cbq5nUt5LdU9VCUJJ8qXQwp0PA31C1jmWDV1llf7dVgLAybnqKyy5/5XuMTsMgFYYJVZpQxvDKqBRsz8ACtU0jCII0NTzXNdK01er0ev1urwf/ux7N5/MojiA4KSKaikgDqTMqAMBMF/NDWr8ERMCUgBhGBGX/W+DzC5ajLKNgZ8aoGHqqp4qNcjAor0hhOy0wTT6SQ2Od3kSRMWEUdkXuKO4B1L0tK4qjxHUtyzr+dCyqL9J5AO2hDg4fDPoDx3HiOAoC4NpQyRxSJbkP5kUsOe6ojmgqeT3E3OiKheJAahnIrsFSQsSsakyoAYiGwaySJ4eu73r2cGUTir6Utm23mq2gF1xdXvV7/SiKPN+bTCa1Ws20TNdxLdtqNBrNRnMwHGysb/R6vXq93mg0MDeIP8mWHLUU+5VuUEwYlj4QpWnhyiqr7NeyBWgQZ/synnyWMC9fZP7E5k9yfxRwzIQ8eWlABnQpQzSoWRW8ZZ7iVaJvKp1ttK6VousTUEIcqCmj0EFPpw5zu0JEhzScAFpLhCYIuUU319fX11efjj/99PLl9z/8+NNPP11eXo7H4/l8HovqDCEcgx3bkbAKUBZDbnilsWhEgTO4rqbIEisyPlp6JF2Djg47UwRYQOXksHI1imTZAKtIAIIQHc7DUHIitoEGWDg4mFi1LQtiiKaFCmStRn13a+PJwc7jhwdrW3vd4Vq73XFd17Qs0Lh2HGOppqhK+PFHS7RBZi6STh7Jo0ypSI6C6qgsR4LnmWm7yir7NawChJUtNFTj4PXhCBYAXlFdu+Trax+n2ZPLZi454wuWi2kYju+botXE1nQ6lQkxIxHhy6QGaiKyEh1cVKRIiVZqQI2c9I7gLgQPhORDZRhVdLoTVeMqxYfiXeI0srxHfXJk2cTg4ryQjEzSkBRIHRyhleEKKtA3TSOKYuFtwWnFFnBHRfPfkyiKJpMZKMHNg0cPH4HMpud5rmcKHAUC2FpFIHd2EpFhNFTeSFWXAg0KVX9DdZLZULpM/3HFM8UrpoAo1KLgRmo8acCzl7xo/HBDdLeO40D/iW53c3MTg7Ke59VqNVE5aXk+kELrjXqv21tdXV1bXRsMBkgf5fJ6xmeauArVOLIgK5SjjObSAsspppVVVtmvZAu/aEyDUcanpKYxfkq+kS331dL/+oVq06vwXrZGWvFL+ZF1gi/XSJBChgq0qApBNYuWXYTcOSeKarIo/iMnPayay5+MOEaSpFEUohecg4EfmUwmJ5+Oj48//e2vf/vb375/9+7dydkpZAMj0frVSMMwEsSUREi7IVlE9JeiFrVK9QWvoZjjKwi5aWjDquFosEucBc+XMiioGzDkngbag6irBJeCpYsQhgYaqaSXmpZlWzasQKB2HaBszfNWh/2HBzvffPP80dPnG1u7tXpD/F3ElGn/Cyf2TGqXgsg8yI7PmNLdk/5TjU4m8apDyXpbZDtXVtmvZRUgrOxO7qjmtedidyQtyWkZrGx64dxFHsVxXGRfiMbrVqfT29rajeMEegm4rmXbp6fn5+dXyWRqmobtOGkYxobhuvDckrqMgJRSpVNQWpA6opN2qg5CFj8wDKhNMmkoYKcueDlZVA5W6djJ0SrdnGXwmAwm9NXIVnJCe0TwVWEcW2EUBYAMkcAj+jOmSafTbbXbdfBbggIqRnVJbgrq/jGOq3ihhqrJQ9TMSUrK8QJLVAxNBiIykVEVAxd6LxKuK1132FQsHjAtvOiRIFdIjeahz5UfdXvdKIxMy/R8bx7MQXHUNHwf6v7r9Xq/3x8MBt1ut9FooH4MitPiAumeObpMTo9Xv7AbkQu6V1ZZZV+KLahYluIxrIWMKWVCVf2DWoNTA15Mv+lUDH3fl84i2fKKQh/58hbzqBkj35F1DQXKuizkxlPIG8W+sA0PYVieKAPDButgMbiM+Xw+hbIM6HJ7cvLpxx9+ePf23d++//7j0fHl5WUI+t4uukqsNKS29blQJnONeoRYRJbJqxbIuJwzqccYaxJoWZFlYbAiERVz5eWaGjfJoUI1HTyEimsDNlZSnXKswGMl0OG26XsbK/0Hezsvvv328PHT/upGvdGUzecdB9R3VJF/KVNUJj2F3g+jjKqiermJfKz0IypYRPQqoyCqgrJyPUUBjgoRVvarWQUIKys1orvLGZ5SX3x+VxvRbKb+irqjYvKVZXGlB5DhNukCRY7K6nZ7OAOGIeQHLdsxLfvs5My27clkajiCoyIYLEKiE46MrFIFUOTh6HyoAI/QIEOEhRdMfRSRpE6aFd2AGhlyCRlSB10hPwSpaCsfji7fcRyVIYSTtG28Omi5odoVmo7tRFZ8enYaBHNIEc6D65vbw8PDjfW1/mAQ1+pCAw0SrXgopE2WnrkJqp4xOhsueYd/U5hZRtQ1xUXcUwmNSLtVjpqEkzriLjg6uC+p+HaX3KgGouK1iBHY9Xq91W4ZplGr165vrueBrCF0XbfZhCLDTrsDnYKV8QzhErJoTiGJ8tUllK3sO7mz5cuviilaWWW/vZGilfyVfWELDVeJfcf/RV5fLtbDQkOLv9Q0S+heEUU0qObTrLgoKZCBB8HZXm7MzgQFojUGlFAH5lKEgUpTNH9uCP5M04zCCOKM2GwwCjE3OLodXZyfnZ+dvfzxh799/8O//ft/nJ6dTUE2Joli6P8EsVfg38S28LMC0MCMn6aGY8v+t4hpBQ2VkA+/KVTDl4nP6plTaYDSTSFaB40BHwo11Hl0nqNmiBPBlKhsoyujnaLoAXwrRBzBSYB6mSF+mmajXttcW93fXn/69NHDx4+29va7vSFEGKFSH9gohmj+a9tCVCZfUyB+StIv4VNZjK9rKLQYHisbAZavvtc6zEq9NNlqi35UVtmvZBUgrGyhZWrxaS6TxdkqXCfQQZZhl8kvLeeOKh+AkzQoTIom40D8sx2n2WrVG816oy40Zq4M0wjmgdg+NETnOpjsZU0jNXooa1BU8C50fPqXsAgRHlmvP36qelhy7Yt1dUkpgyhHIF04FBkQEkWgLoOs2sRKwihKDePy6hqrDkej25vrq9sHB/v7B/3BUHSksGcgEe7lXGzxtsJ6AoPTINCiQKCIl8pgJ1as0J1EwpCOtavoOwW5ZT9JJF1JHhW2CYEkJ7rlQsnNokcCXLV4DLAqxq/5fs2vN+rz+VzsEBw51BA2m+12u9kAQIhcU86rWn6UAoRDUF8+XLn7UrrD3IvKKqvsNzCig1IsiUUn8U/SSeEfcyiiGPrhFEgK7vGu5xwl6jlBJa/4LCFb+GRby7OyRuqUwGOJTKObur+yIJeUkGG9JfhoEBxFvkmcQNN50eE2nM+D6WR6eXVxfXl5fPTh/fv3//7v//HTq9en5+eT6RSxE55EIAoIISQHXgJPS9W4Scql1KiGOCA1k2AnkSfg8JlTDKXoUaFXDVT9zntvlH6a7npmGleKQUhmUa9USFYUO+AJAU/UdrBFFtBq0rThe6uD/uHe1p/+9O3z7/788MnzRrtn265lO4qxixp1nDjCrgYpMvKRwNwzqiRksBwrGSGVHHpXy91QH8KcuGjlVCr7DawChJXdx8ihgmUDV+Id2X6CbyGn40JALbdfEHNm8Vcb45q93sAw0lrNhxYCjhPFkCW7uRmNb8eq1gKSVLFohIfARaE+RIh8XV5sQUhzM12V7K0uk2siu4XhTdZ8Qw4EuZaCp6ItS3KJGTS4CKRpDoxq7aB5MojgYuhIEQdheGkaRjCH7vWj25v5fL67u7dpmCK/KgioFKJGTm3hiOALmWuSTFvRthk+CxUkgvxJActc7w6xpJFAUa1uMDqb0WyAPYo+icoTMt5RuRCtiJmKyg/o84TjDRlU24Fs4TyYg9xOmnieV6/V/ZrfqDcwypsDhMU9Z+5ISRpB5TzJiUttHV0tWVlllX1BJsvBVESSE90hRCWKx4wUaHg5EmjptzlT8CbfyB9MgR2eCVR/Jg1PxavBlKAQUdMbI99eflzHofDUGJdSKTMrMMa4D9R9viTsRXkq6iMfhmEcR9PpZDKZXF1dnZ2cfDo+ei3sx5c/XVxeTyaABh3bnkcxeFDIJYLANWJKfeasXFD7TZX/ysmoFs9KoiIefsuyjXIh16z7K7/1HBMSKMVUm+yJITaBJvLQJlmAV8MWtCK4PNtxa56z1u8d7G7/+c//9Ozbb7f2D5utru1AVtB1HVyNoMdf6FNkxQydbCYiINc/OlShRjH3QJKrVZzRbISi/MiVVfbLWgUIK7vDVDgTf8Mm5HpVTwwH4hDKcjPd7onJZC3Yv+RyABcljeIAOZONRmswSCbT6cXl5cXF+ehmNJtNZ47puMCiNOw0Fh3TUwscmKRvSrII7lZhGVrTM4hIrke9g75ElL2J2jylp5o9Z+RN4quMKhq5HkaMkcOhahEVWQS9usBjWVUy4jCZwCDCFYPjwJgkSWrb8CYQKaMIWtu7zqez85vR+OLqejoZzSY3wXwahsHO7n6r07XC2LKshmVFYWjZtus4eH6WDaHlzOFU42MpH0e0Hwn8tJOjyLUA+tr7CgRoaEJUJmQuwqRqTFDylTDkkudBPAkGyI2mhm3ZiZW4rls36rZte76HkW/bsV3HrdfrQu1ARpfvDwhzg6CFIWTfDemwuZRu5kYXrGKKVlbZb2osoEQzklRlVIBKysaIeU2LSjPqaJasvvArnGWY64PyDTgRhWfM1F8krVRhIcYqlDks1TJCESx1wznBEMUDKViIm+fPNgpDkA2zLNBjE8IwSRLP59ORsPHo9tPx8fn56etXr968efuf//WX07Pz6XQmJGfAXNeN4XORbUGgNVESMpp+T+0UKN7IEZuqh8sLrarbpUe4DDiWdust3ZZKKzklGIVh5AjCZ8R4QxNdycsEVyioJaZhuPW6ZVm+6670uhsrg4eHh8++eb7/4EF3sOK4nu3YIhLt2mK3lgX+qPTZEIFUifApPqGeDeK4ykQjStmRkoxOC7Pstr7wpaumyir7NawChJUtM1Vqr5vushifLJhWzAyNbFCqO1dRtVRmhigToPeVQE2dW68DgEmSOJgHURjEEOiEwrkoij3PjUIzFuKTQHEUvdNFfz0ZjJPeSy8TKN6m2Td8HlYQVjmyGMJ8uWixPlf6YSxHg4XgJuIllY5UIFYnNIXGqDxrAdN0xSNyR7GY0EytOIptxwijaDSe/Pjq3c3t7e1oNJtOTcPY2NrpdPuG44wnExcAJSBt0TUpz97Fl2oVAilIqdKDoqOQepWeX9aB8lURxt6Lqu6skoTWChhsTgQmTIWMZ35tlRthsTcoEzViy7BcE5pMCKqPTVAZ9WNQSIYLq97fg+bKCKUikgoX0BObu8BFwK/y3JVV9psaZ1YqEruSZ5RhSkYUTQt8PLWb+00dxRkAA4iEAFX2TzZm0ByNzCYSo+IuZYE9OiMWu8xwMko0ZCQczJ0efiLRTefDKApnM1CQub29uby8OD76+NNPL8/Pzr//4eWnT6fnl1fzACKG8/kcTy0IAtSeMaA9g4SdlJikqnJ0Y5nUoMrIqZPh/2jHUZo/5CWXOHTFau1iopDz+zWvN1O6ifKqqQlaZqIAUESc6Wpcx+m0Wttrq999++Kf/6//z6On37R6A0v0lhCji/xVStKWPhLyp4TJ+CRi8y1o0GTl2Cb4IX5Ngjcr3mQsUqbQUFllv6lVgLCy5Zal0LG5l4WyKFrL0ohiK+mkZExsmeyoCMLpDUQIECbibre3sbEZRgE00oX/Usu6vL0ZGSnAISM2UmCcGo5pJgIqsFyPym+pHTL3oamLKIUpsQzhOn1RJUaFc1km6jKnkUkyYW0+cw9pYQ8C0IoKDbWJSIvhIgNESeMktRLIFk5nsyQ1JpPJbDa1bFCmmc1m+wcPuv2BZdnYlAPL/4V7L6nnVM2MZXQVByoR7FFVH6gZw5rHInhQNCAlqyUqnCciKTp7UAGX8V1JIio+DeJNkoQhyIdyrBhoRzFSMpmR/nwfqk8+u3bkmvWVVVbZl2P0hc0FGRULUUdzFna1W7jnO+h5Rc0YgnkYwyNMgu12sfUfbULKKIo6qnmPcirOyo0yZqhEZoTPcmelOt0LjkuchGEwn8/m89nNzdX19fXx8cez07PXr1+9evX608nZ0dGnIAin05lhGK5jz+fKx8jqPcMSiidI6SDDUgb0X9zzCdjNQqKsG4c8PaLGLjaa1fV+7ne3iOojY6hYzS7/TNRd0C03LVNo5kAi1DaMlu+tD3p//vOfv/3znw8eP2l1eza0/LUd10sT0KnGqnhGks2NuaxP0TBfqa2rcaEAoxgS+UpmC3ODwamzC0PRlVX2K1sFCCu7wzIB1GzhhEKHMqxFbA2Vb1MpO7Wt4J/geyUzPjqDxEws24YZ2UwsK3XdWr8/TI1kOh3f3NyMR+MoioNgHgah53qhEco4paiawzQagqhYICiis+ruUXAaot6NXSJNyBxD5tcRskaEESbZIJRcD+MOSRiItEnGJFLFHig4xsiOglqJcuG0PkAlOl/ov6VpOgtC24rtKAqDIPT9NE28//7bdDydTaZXl5eHDx/3B8NWu205DiBncRqu51nCa4ruS7roE8dFNJ4ihrBO7CqHmPdSGAHlmumysp/V5+GoS81ucUQg39g2lcfo2pKyB08+EmKtg6RQfm65FZJu2HU/U1U6mV5kVNmSGZrPTz9WVlllv5JRgk7Osmo1zvWlpZyMMKKJqDcUZ0/+VbfguRMN0guZy6I3SWtbpQeRgU+c/EywTFZsyxQbw1y68TxFpBQ9VGqLUhaRzsQ0TZHZi23LjpMkBFlR+Dkej8/PT87PTk9Oj96+effqp1dv3n64uLi6uLiYzqASWzSWiGezmeu4UQxa3IRHBdsG/gc8THUk5dFQS4a7StiU+c3yDhz5W0jF5wpDwvkIP66cOJP0oYtVBfwyt6qVq2GMBF0oNYUsATlSy4KiQWgub5r1VsswTNexu83GSrf99PHjJ0+fPHj0aHV11XZcx3F8z3dcVxBZgJHCDs7iDiweIMRpJH0mFyjHm0ywUHk5VReCZaOqrIVKW5fX11RW2a9qFSCs7HOMk0czRf1YWaC69MjEoPS7mpQoJsQlfldyBYEUaTqOeDhNKAFwXcc0oWmh77u+75lmGkcnxmRmO8AhhKL5KBbiKZZsFIGkDSmUic17Mhk5BtMKwb+lgUxSVOPvlMBBKr4rxEXFWkKgL6U8Lj0/BiPLejNxcBoGAcqnKNor/A8a1k9nH44+TSbT0e1oe+v95fnFwYOH+3t7/eFK7PuOK2RXwtAQo5qYQAnKGS4G6C7IchcpbcDD3rQUUMlDhIKsmRd5RRlBwL1hr0VR3AHnz0hWCwdbeUfl3W2UZ+DYOQNfP8eknjsGvTl3lCIaWlCnssoq+1KMf3MlC5RzR3W2n4t5yAmJUCKjjPI9L/xVz34MeeogKSrHJIpvjx/hQIh4oJj3U6fKaKBiohOMesSJbPaT1M0cVOAcSygaFJOrUJEJLi4uLi/Pjj6+Ozs7efnyp1c/vfnw4ej84iqM4nkQilRggpjQMIx5AJTROI6hHps8pzgaNV7SVY8lHq3AptFqKOVM0UySk0VO8f7kKaOatiNdEhOG0zeRwDPBSxxGKLkXrscW4UVAg+3W5rD/4vk3/+v//r9ffPfd6ua2X6+LVhSyg4dU+Sl99rJUWBVL0E9bNnoooR9uLcdWbYsd6qXmgt74jgVIZZX9elYBwso+wxRioYlepVBULTdtWSBYSNC4AD/p/ZP2NLpKG2rEgOyxurJhmlatVqvX657rp4lxdnoxg4Z8EOy0HVswOBTVUpis5dCVBXRozXXk55s7LdJVYVeRBZJqiZHzThovFahK2NkBS0+o1RVEfrVYDT+BLKlSbB0nCawUBKayLDMWuBL9341pzufzyXhyc3M7uhndXl+nwTyNo2a3V2u2/FotNUVqTvn1nM8jPWwogyH4BynKDCDEHk88Ni8fBF0Hj9emrlftXOqUK2VzIL9St5DFz0NuVZEkkqrKtYI+Cw1mZd9Zzwx1JqXM5kozprLKvijTCjE4BxbKvrPvaABYui+VNdRpGuU48pkujDMWuaNI5kBmR+ncws9MptV0Z0Gk0MsUnSgMgCyXrDOkKa4AonBOxXegUUQUT6bj66vL46Ojo6N3r169vLi4ePXq7adPZ2dnZ0EYmZYd/v/Z+w/2RpIcWwBNnzSivEql8t62m53dd9/P27/47u7dnZme7vKypCjRM+37AEQgEElSVe2mq7oTu9NF0aSJzIzAAQ4O0pQKBdWiCFWHuTwRCU7MWkcEGQGFxFK4HCNK4CdxVKXkTyJ2q3uDNWJquofSCfIllH4NEou06A4Fm+V1Icid4bFDzs9z1prx/s72X/7y3Tff/eXJi5fb1/ajRsPzUK6M+uUCJqemEUtvu8oN4JqMqr1MSE1R4XuoULkeCzU0kkRarzO1/V5WA8LaPslMSlAz9o26irXmCl1NjoUZEqkBDlfMesgYKd3CLJiB7zfi1vbWju87aTYbj8eDwWWW5t1eP8vyOAbOjO/Dkgy/xwZKnKLL80xXvan9LlcHWbY+yYCfbGhvbOFMJF9yaaxPlwaapTZHpwEXNkVd0vhVKacTX5TXOUiGOk4zDPGIgI9ZlqmPEd80itAvOZ6Op5PReDqZDgeDuw8eXLtxMwigjUNSpK4DTd6zPIfCeZTorJA26bBABxXHE6k4wjHScVBMvaooLDGNyH/hGLICc8LPwDbGQAdSucGPsbQkFKSfs+CeBIRXNKBfuFzisq7uRbaICSvtj2urrbbfxSrgQ6bsRDdZvRDJPCH/pvIEW9E9mug581de3bFQSSvzhC2ikEoVjNCg4H0orREZ69L4iHkfyIbHmV+csqKhum6WpUTUR/kYakSUZ6i6NpuMLy7679+/e/vmxw/v35+cnr59++70rDscjgfDSQppRBCgpu/b+uHWzOb70IDJsD010KoyRXVM+IoSQZn6sybPBVqpNL3oqgFktITNh02dAkVIXaARoSiaLlugb0L3eeB/Ou32mud5YeCvtZqbnfajhw+ev3zx6Mnj3b29KI59z49jaIAMmnYoXYatKZaHBXVElQs/EJDr1LPqhWjfJIaPxJRR4ZBo12jJjVlbbf9iqwFhbT/J1Pqlg2D2hxTjMyQe9Z7Iuhgd7SuMop8EM9zSh8YSqvFAJwgCaJCXldCMLodG7Y4DaBD6VWQkzonCYqXrlbDs6cAbxVlRa9P0Arb6BVl0HBWgFYdTjTd/xDjeufCBpjYxMmE3hsk52qEhIqkaOI3blP/hgCIceRDEJQKBUA9w43w+v8SqknmSzNJ0Ph7PJ5Myz5yyiFtrjVYLqKPzxAsCyvfB+rciVQihUtJMw6VWrXe46hJ/ic+WWhqC/4Q+FPXtgAHXQVQ+dcqROrBls9xfPZKavWmTae2Snk/FaXILS7XvtBzC4uZqKFhbbb+/LW0rK5YdluWwNEX5kV6eINQsD8r+6NLuKk9+MTHI35Ft6DXhhKJddn5PdUnnkBZ3T1V/urDmUedBWRJJk6VOCZY5EkQdx0kS6NKUZVmeZZPJpHt28v7dm+//8Y/T05MPHw57/YuTk9PReIyrJfQUdMqSNEWpn4TKYVIs0oqWrk6gWm9z1chy+6g48+K1veJNVSThFR5qhdKFg9WkdAoPyjDoulGiFdrYqha88NXA99fa7d3N9efPn/6f/+//+fqb767duBU3miHIioJktV7fVx4kXXhNEFY9mUy42PhE8j6zuTOGVspnpDqiKKZRbbX9rlYDwtp+mnEDXfjDnu41LVSvx3btuw6O6TKPq3YB8z7iFNcWHYX/bG3t3bw1TdKkyIv5HADhaDxxZ/BpUcDSiD+AdYPgEwY71XwtSh/tNU/0ooDe7Ko1Ai0AlUDqL7JlvTeM2g19bELcqp+TrjHB2hPtiEAZCKEvarOBfzq5l6cADl3o0DFPXNfL5kmaJE5ZZGm6sbu3ube/1lkHvTUUIXANmluSZDNirLqgBX0ZIpEaJpPC/KS3Tj8RRFY+NU4HCl/LEL2uuiVES8lfyt5cvIziCC2p3JXXq7baavvdjKONuvpXstIrX60+zKvQoH7yNc1Bi4sxXlItBFWLefiVeEchA4MedWqLKIOcy9IYxsiHWdqhesJdQVmnw6GEpKoeLPIM+zClaZoMh8Pjw8MPH9798M/vf/jhx8l01js/n0xn48k0hy5KGJTDaB4SRBVZhyAt5sR4BVD1jUszsXpYTXxPzMQrxVwrxRcfn8CrpBuqquA1gts5wL/Yhh4+wFAwHjhK0rigNIeaokHoOmUjDre3Nr755qtvv/v22cuXO9cP4lbLd70ojol3CoyY1UxRzo3qy00ZVNVKqdKRWFTQm14cPDTcx4u/bsavttp+V6sBYW0/1UxRgIwmEpYBFKX6TAhxDvmCKPXA1v94ykVVVoDAjE/TfFkGcdTY3dmfTidnZyfbO1vj8dRxQWol99wwDCF5BUJlUAfnOLD4Mbcwz7mkkEySQuH/FaFUrTfcipBBjdV1/QopGTlSi0BSvkNrDIWLdQBRexwqVI0eEBTE+xaHR8co87L0g4BO0w8CCBUXhZ/nRRC6nnva686n0zyZZ0VxORjeefBgbzi6dvN2Z2MjCILMK6BeIsPtA3eUx7x6ZprigjJu5rxEvYS8M+w6CsOrVdlAyByqdKiUJxJyo5KpxR8BI4iLQoXg+M/L3amoe/VvvVlWe7OC9D9zX7XVVtuvZRxPrMzOVaboIolxRSBO/UrwIXnLzAKVdFBJO2dNUc1c1VMazXUIM0z3W/0rAgE6d2UF16wDpJ1isYDruiAemucukiTTNMnSzHGK+Xze7/cGFxfv37754ccfX79+fXJyOhyNer2z0WSaZfl0lmRpCgUCHgiw5VmmdS8xSUjJNGrprtk0sHDqU7YqGMTxi3yrSqpSIR99U1TvMyvWmkgLrIGvEErN9jl3pmoB9LeUmJBCYLQvQLMA0EA9nOXWQIXOcaNmE3zcIFhvtztrrUcP7z19/vTRk6d7165D33nHi+NGGIIP7HkgXuCVoCyzZPkTMQdeoQTJSFUS6pM17avobPRCohm2ml/LftSSG7K22n4PqwFhbT/PzBzOZRCEYyo6jZYmG+mNGsHvj8yANNuiEhesNoEf0D4838PauYyWgA8fjvM8v7gYFEXRiBuYJEywsg5WJl7tqCKOQrGWFqboqcva2kvFvuTiZQgiXPhnjvmTB5GXTO1DqN3oRVT1RpfhUQm38FAADaLzUaapIiAFQV6A+OrEcbI8T7M0KYqL8/Pe2enNO3cnw+H+7TvX9q8HcTydTaMA9LhBnBtWXxXkXjhOi1Sr4+KqhI+VDVQj4BIpo5gspL4ZpBWuU3zwfX0jKFEZM6zMucJkoynakZUYQkjmZ8MzlmtYfsnE7VGDwNpq+3xsMQwkOP2KakHUA0sSTIYB3WX9DEnoA+evCi+UuA9LxagM1V/qFQvsZ1U820fOb1HLu8UzZXRKoi9FWaZpgjnCYj5PZrNZkswGlxfv3rw+Ojz6n//5n9dv3w5AT2xUFOVgPE/SHDRYsozUbrj7vD4+6gtlgIvYsX0MXMOgFW70EiDrAAysJTKqaTa1eKXs1zS9CxLlYkmJ5OFqlIVMURa34VwuaIrC+oI61o4ThsHGWmd3e/Pps8d//Y+/vvzqq5u37rXXOlgqGEDdoKY8Wc3hF67CopYML9T6XhPRBfOCcaOiCut+vqpfBZfBW7+rrbbfyWpAWNvPNNMKXC+oUnZFLcnWkqFDryQb/Ql8PM0dVQUDOMt7II6SepsbO+VtACBRGDUazc56O/hwfHk5yJKsLIs0hYAfrUxBAO3aLdoqK8KpQoASs4J02Ep7jWvJ2EwRQKWCRSf6KomkK0/K+lNTQk3Em+sXZeyYAJVqusRKqRBChtN0S/gHFkNRrJ+XZZpl8/nc8bzxeHR5edG7uJhMJuPx2Pe8nf39IAyLPENdtYCGApU/V0q9UPoMSapIEMWMYqH1QiG0TPye3CmwtzEheX3trc0SdOTyGxk45bKcCuXYGuOPdg272rAtJvN1ltOba6utts/eqtR0XZtg2QLbkVcrI4JG4UuNCCUvVLVNdz1qFwQl0DYyVN3nLeyiYSHxXFDuUh2cnlsU3XEFGtTVAQ60syjKPIeWs0WezZME1cIuR6PR+3dv//a///v27ZsfX78ZjMbpfJbBOuDN5ynokGEjdlAfzY2UqB4cHQHVgtAEFE3xu/WH+lcSZPh/8kJw+yIr4yeQ8NJpVn6BEWc1SqdbdECM2PEyB3pmKN4mTObqcnium6se90HgeZ1mc39359u/fPPVN189efb0+sGtVnvN9/xGo0EZXBTvQQS7bL6v8oF1G3oaG6tbL/ZRWqQFGYKoYTfTJfj59JbaavuNrAaEtf1cE60SmD7CBeZmfhXsO34B+SOxbH90TtQ1bCok6PtBFMYb69u3bxdhGHm+12jEeZaFgT8cDIsyd10nSdKy9ItC822g5xJHPBUfhtdoWFTYKyBjIqypfrTyRfg/7Rcs8F7EIFVOpJprY8YqvCYpUbGesOQAeyyyQYKmliq/gRTVAAZ7XpqmsHimaeD7RRgc97r9UXw+nkzTdDQaDweDyXj89Kuv92/egML6KAY1miRxyzKK49zJHd3/Y0m8Fi+tENMrKlFiymEi71YzhAXDUymwaTxYhd2SRCT4RdZ4at+LnDA5sB8187VKmN/+TkVTtO45UVttn7OxX87SMJbuqICCKgq5wC+lECHNpapJrCh1ptkAdFlwF0Vu2vLxNEjHoQoRieuoMAyhQk+CQAsiCqNmhq7nJgk0h/CxODxLoRAgnc9m00mazMej0XA06p6dnhwf/+Pv//jx9esfXr8ZjSdZliVJmgFxBjAh/pkEQYhgsvB94MiY7JZT+koYjDsNmjMyE6PuqSiOkN63g6W6AlFSSKz5lpa5hTCrdfnE30umX9N0Eb7i+z6sUwqeu57vBZ4XRaHruI1mE1RkgmCz09ne7Dx7/virr188fvL02rWDVrMd+EHcaJCmKGUUHWcFU1TUaFAmUp+1FgUV3Q5lgECeF5cLImKU0Yg6I1jbZ2c1IKztVzCpi8I5Q9Z9k+JaMlBrrd+f4HAb8icCijgur+1ebzVbcdRYX9tsxNGPP7469f00zXDipkwgRUYL31cdCrGFg9ogURkxVyQK5k12UKMh5V1Q3b9miRI9BoW/dfpTjohaMSykQf8lP8Ccr+Gccs26HA2FnfTnrNNKJY9UoUKrFujK4CdAE8LDgzQpgOHcddwc6klmR2fdwWh8ORoNhsN0Pp9PX9y4dWttcwvEyH2YDaDIBPXZqJ/DqiycKDtRMVSsSsF1E50DTRxyClcxiBTVU0ur255a5X5a4N8uzdr9wiQhY11dvqjPgwf4J7B/a6uttt/ZzJxiMxE0V4X/zxBbdJhSz8A2HBJqnPxja4cSsehYGL1rlEN183me/1X3+SVoEAxgJ+qF5TBxwzbnCQiDDftdxHjzbu+8d3by4d27w6Pjv/3j+yPQEZ0QgCTIirqjKRYfFkkyB/kZgFI6MYgrmyp3VKuJiYXy1KuOyD68paOulXjkOl5lwZj1caEYY+nSL4GlYJyqiC7+BV2USh9eQ4NBHwTSiEPkOlBDCN3n93devHj+1//4j+cvXl67fhDF0ME4CAKQmRHIdDVfUyNkricxlSLWy8ox0291YtB0uRe1HisFeGqr7Xe0GhDW9osNgZ9aYl2WQtEqcIpgo0gpVIDNLWR1bknNodIjX8ZFCSjzlGWw1MG070QBTO6e6wCVFP7PC5IkdRw3TVOK+xZFiYsFBfYEX0WTBdU5WLVsksHC4msKxyDowma4jps7GbTKZf7MxxALy8pVUY/moJjFUjT3UE0XtHfDaFAdvy7mM8kurKYgXTkiw7i546KawLAoptPpeDLJM+CSTieTMstu3C0arbYXRlHcoK6DFMREFXXg5yzFXVYBJLFYPbq2boEsXLxmahDgeqnGknrYxaKqh1zdANK3YG/DGlX9I5kk/EmmXA1xaYkIpPfAXCBLvaa22mr7woxSMjbjw6A+6oyjsZCpE8M5EOgP1COHGYO4oknhUC5pZoqETv+xcKilGmP4ILZx+sv0loC95/N5MoUpe3hx3p3NoGiw2+0dfvjw/t37o9PTw+OT8XQ+TxIkiKq0Zp5DT1q1EWxAr8iwukgSJmeGp9VYpjQrpbe0rp4+EWlFFbjkQa6AuupG5YVaokamtstUFeU16GQdiYu6PnXNJaaoFwZep9062N/7y799+8133z199nz/+kGztea5bhzHrgtdFuGYQV9g5cxuFZFyCSFHskU8VxdGWG2WZdCbFymhuyAV2Wqr7XOxGhDW9iuYKMZDJWsFjyhfJMRY9HQoEj86c2hSQMvJFBoTqhyY5/tAjEySoijjqLm3t5/n2eXFxcnJ2Vq7XRZlr9f3fT+KQgibKlhIEV+9I2BokiCpQjV0FAYq6IoIPkfxjz54iv8qwunyZBev/9xwSm3QUrm0FlK9tKioM8M8yahU/y1BGY1+C3Fg/DTwPHIE/EaDfIKidPKiTCFJOI+iMC2Kdx8Op5PJaDwejIbPu89u3bu3sbXtbWw5eQhNHMuy0fSKPEWFmpAQq+ctb9drGJ663obUwNWhUjgc1FuFt6RPTtermJIMGZ6XENfARh2Jl97YT79nrdBDRe1AVCXVi3ZttX3JSqSigh2M6RhMfVRQUX3KpXuqnJw63enNVviQViGcjI7JiU4f1apiQew1n5WYiiyKIoOesbCnNMtmk8l4NBgNh73u2WQyAjR41ut1u+/fvTs96716934wniRpSnRK5Jo62JIww0UBjhg60SM61fFPpbaDZW+o86nGwwyd/hDQkpyN1ZoOo1HFcyaHRyyRFdOpgXkLQ0HNk/gn9KICvA0yJH4KfMEPIz8KQRctxIqJMAy2Nja2t9afPn/yzbdfP3nyZHfvWhTGIDoaxaQpisIEPuBCi6ojrwmvOcotoN3qJdpQRheqDaxGuVKcTNURamWcemGp7TO0GhDW9ktN5Xo0K8dz3EKrvdFbmkNB0Ig5PDIN86nta3WgDriekAMLApp/1zob1x1YVtMkKYv87bv383kyGk9BdSaKqOGEZs4o2Rgu/NDrEBwXliTgJI4ql7yCrjpzHfAtP5FQK1dOdTKCuCgXExswLeHrSGKK/ImUf03TBBTsEMk5UCwBJYh57s3myXmej6fT4XhydnF5fHz07OnTew8e3rxzd21js9XpOK43GY/CMKIuXLS1Esif/vJhEHtXogJ8TQvV17EaABbhclUIQnI1+nRl8Fpmb80o6WtkDdrPskVN0Tp+W1ttX6gREVQz04WaB1NGNSGB6pk5+6fhDKOg6pJUSWGpxkh6DjcAULQWZOUYd9nCoHZIOBC3mqYZWprMZ4Pz3mm3e3p89OH9uzRNPrw/PDnrTkYj+O88GY4naZo5oD4KdBinLDOQkoEyhsLzq1Xoev1laGpNqvKgkHuJtBolGcr9FUEuM1DROVWRKDZLytAsslYNrokxXM77WBihJTE7BpMlMkWDwHPhWCnVF4Xhxub6wfVrz188+/d//4+XX73c3bsexc3A96EiAvW0rQu6YpKnoDaHDjggqYE/6yfQXVTNB+qCExZXUGFuzAvW7edr+3ytBoS1/dqm6RMsJWo0R9iZp6IF7jqga9BEz9YVmShcXmmJU737HOhSiMrd3s2bd7Jk7oDqDMqHdS+oYwWU2mcZyKu4Lq26EgpqLIpoVmul6l5CuFcZ7mRlUQNlqocqwQzjP6urhA0IaWWprJmSqbiEX7OQZlRVjXIX0IexUI1z9QdUWwj+R+ZNZ7PReDKazc775/3++UX/fDIa7N+4uXvjVnt9A4mt0J8wCALE+R6ySAsA46uuzjKfidrel0IRx8QItAgNAUS1Bosoq1qKl3FHVW5Qv6h0f/50+y2KBj89wFFbbbX96iZK/RTYU2RRzWTBLg4U/bOyhfCmLB2kn4tnuUJJqCQCLUDIgmGEDO3jox2RUopSS8O9g7jXbDafTWfT6cX52dvXPx6fnH14//bo6Hg0mhyfdsfwyWQym3u+P5snZVl4DvwMtlWUWZYRIUYTTOzZGJcvkkfhdguag2ENhercYSuL8uJNnTR81VTIEHEricHFJKp6RzJc5KgYaqgsuqTqbg3o2augwLAOPvpBEIXBxvr6jRs3vvvu66++/ubJs6c7e/txs+W7fhzHyCYlhguEkletFFYiFFrVwwuSALcaygtAzWRhSyhBEZXhG9TXWHs59XJQ2+drNSCs7dc0FnATs7nh2ojAmyqC4xQZq1ZCsZkQrVy5IyVqQv0PXCgTd9z19c3bd+57vl86hQcBTigSgH6FWR7HcZqmEE3UzMY8z6hnkZYXV1u2qwWwtMM+DinKtvChde4cP6QlDZwMWZxGG6OhkNBOoMEKeVISk0wCTa9UKtWJI8hSL1iQUgRRBP2s4HC9IoVqQgyZ+o7rnZxfDKezwWQKacPe+cPHj/fPzm7fvdvZ2Gx31l23qfRKizKOYzoG4NsIBm/l9JWSnRYgtWg/+ow815ckW119rxLH9G1O2PHpm4sk2Ee/nDu6eOF+iRmpBvsgf/mWa6uttk8xfu70vKHbrItyBvqm+qh0CkeRRwk3up6H1HdEBTBtyqyj2sUieiFyJr+p8kVoNLkRzsQCP6BeIH4DPa+iKOZJgkg0T2bT3tnph/dvX/34w+s3r48Pj45PT0fj6Xn/cjqbY1d6iG+imjTIaGdZFoUhpAXLAg4g8D1oA6Sks5mHSQeN+8WFWEik6PlXyXhiLgykSVXVh16CeILkzBcducCBPMwKMlUkN82/lmo3qZGpQ5WLHZdWklQMQStomAtyAkEcRVAxGEaO48RRsLO1tbOz9ezZk5dfffXoyePd3b0ojH3Xi+MINUXhxIPAh7rRFTFNsWNsLEHw01Prjg4/mn70UiNcRpZNpECEemsoWNvnb/5//ud//t7HUNsfxVRslGKQzJM0YixySdCZIfVL8RVrer3SOKCoGxV6XrPVbq+tNZvNRiP2PCfP07IECW8IIqqaAc6r6VXc81SFOnWHV/DKCmJieNXkOiWhiFmfcm0QY0KZTI3/xOrKY4Y5NzGEdoDUquLQ4ecKl7KyRyGQql4U3GCRyihVeg2uFPkHRVkmaTocDseDweDycjYZA34mr6UofB+6FBZ5big3allfUoNRUVFwl5lS1rGD7XS2FoiihZfj1la8WZ1dZfd84r+X0f2/lGZWW221/UtsSbLfakNP9WCit4QJPPG0a8CLkhbTpc/AqDRTGc5mBAWVhLI1/5ndE8+S0AV0BsS5OE2Q5Ukc0SQdj0a905Mf//n99//4x//9r//7/T9/PDw67vYuZrP5ZD4HIAjfVh0FsxSURbFKnIiiDFHMNCw12/ShaDC2EHPkkn423LzqVmHkd+g7cg/LdiNDw3JIFLGnukQg6rPxNk/4OLww1CWGI2kpD4IAxEU9L47Crc3NW7cOvvr667/+x3+8/Orr69cPms02tqTywyCklCBunxK3AiSL24MlZHTOUwFlvcpUT8SWGODgppANMviZF+Paavt8rc4Q1varmRJh0y8qlFGL42gChAphUSSt4klftS+Y17ErAk7uWZZxwirAuoIwDFutRqvVbDbeFEXZ719meQ7a3LDfHJceaNmr4Ac2dK8cgAxuWv/Y9BhSW4GO7sREoojpQtW9XE3FOZjiE5PrWxgBUzinwteVgRPjqhk9Ov+qsoTQO15n2JQwj96/7+aZ406ns/7l5XQ6HY6G/cvhRf+i1zufDAa37txpb27lWzvNVtvxvFxjQhR3gz2Qo7TqGpn6E11DKF/wz3jtFdlCFcyvkpGM9Du8Ry6CWnkJMGO94u8OCxes7jtVW22/idEEYWu9GIKoCSRJ+CeFQzUMMOLGSvtDF4NJqRgb3miZMPO+lZHjI8QUGJAmMB5H9BYAh0hfKSDpl8xms9FoNLjov/7xh//+7/96//796zdvR5PpaDjKchBRw2aEwClVIJBK4g2BgqolGbiqXVO/CdX+gNcwzeHXh7eMKm84LOoLoB2NjWMdSAzCRMthXmC+rLo6C/wIKwJoTBFJmOsha7lR71pvDSKoHvJgnCDwozDa3Ojcvnnw7V++e/HV1w8ePd7Z3Yvjpu/7cRTDwUIBCfRgXIoDVW2FzcRRdB5YSuTxy3vMeDSVAaPVV4YvVXF8Pf3X9tlbDQhr+zVtMb8nFgNBDLT1U8SatFzAbfm+8IeU4CLuqOtCE0LQHW20ru0feG45m4yHF8P++XlRFJeDEdYFuPP5HMibRen4yAfC9n1UCoHyM7RfJW6iCS64HOoUKKb8uFGBoYcQ7iLJN1NJUB0HZdS/WEdNlXKmlJlRtSX0XbPgGGopE0MFoxT+UGFYZOGo30BEGlbQCGTW8MjRKcmLYpoUvg+exnk/iaJoOk/y0h1OJqPpdDSZnl9cHNy+vTsa7lw7aK11Imj65LsgcQ5bC6OImL7UBmpVdwrBB64E43H1JBdMV+Gb81/Q0zGMJl1ACI4CVXhoP8j0BPudbNEBqimjtdX2G5qJGRED39IMM0E6wjRE7NCUEOKFKqimMCR80dQ2K5FkgwJl1osPYfEdNmgIgbtQPE/HydI0hz6BRZJgh8F5MhmPZvPZ2cnJ61c/fv+Pf7x5+/aHV68HwzH0BkrmlBZ0PT/PszRNozAsNCCkuU7nBlXpoqpfQzosjY+Owanc1yKrgxUwmXrCax3Pwlw8T4KoSqUUP6skB+W46F9rOg99LsiqXCIItR64rFYPToDwCGBe5HoeKYtGYbS9tbm7u/Xo6eOXX3/98PHjnZ29KIx8SBsSUxT6FUJG0bPZswv3Dx+Nig0LzKyF7KwicxYMtTkupvs8uzTLd1rbH9jKL/Wy14Cwtl/fpJaX6QssJ1498y5X6PwpzxIFgyFkCPoxsKYURRGFkdPe8Pa9HGo0nCxJy/xVUZTj6TwBGVJs4AuioiX2ncDUWQ7d27mJkGrjxwBV14qL+HGlXSFq0kAXdpI6J5roJ5zJAnox5fwVLF09ccFYFcPKcWyTgcVGkfSTHFwHOMIkSYDpBMFTAFSp4wQ+JABn86R7MRiOJ8PJZDCedrtnZ2dnN2/duDkYbO/t717bb7TaRZb5QeBiF3tYZXHglKrelV3s+TiV8JAJBihirWz+q07Triqx4gWiznKRaLrY/+pfY8tqSv/Fh1BbbX8OY96ABjwlymaZtn7UZUjPIdwUB7qt0qwi2P/0WvMnbE+fGfIrOPBLASGnm5jkmabQL54Yosk86ffP8zybTibjyeTk6PCHH344Pjr88cdX5xeXo/EkxV4UiCeB8p/MofChyPOZ6lioZjmIgwKDkjKWCnQZCRQTaZWjVk3ZqTVCxdYQXuKcjM0roLzS9HLk8SQ8ymRKcUEMs7SyO41Wzac8bhouyqYWlf5PsF75PoiLIrSLwnBzc+PgYP/5y+f/9te/Pn/5cmtrNwwBCOLCBhIyNEjLFEz5OGWYUhRBaraO1Ai3WzHqI+c8oBJFwwiDzlRrAu8n3tC1/SHMdb5QqwFhbb+NmUnfVAIwRKwgHCU3iqunKfNYwJPL96PrD9zCM/gQStChYGD/+i2IsGK9vvPqrecNx27pFHmaucgXxZm7dAKcwDFubEEsBQapra/BM2KFEMANl1RaCoTU2MesXPbarOGmMkEnKFf8ltZU0jDg8HbltypHR2t7kfvElPWUpDhJkAL/Ni/GnjuaTNK8uBwMLi4uLvrnl+f9/Rs3izzb2z8I4zjPsjCOqCgGfu7BC9ZUWHqZKi6WdlTIZ9CULcXGEaxQQeaRPZ1UBFeeo5Cu4aGrdMH6aNr5t7Evdn2orbbPzyrNDIx4DMnAcNsb3WKIBa6U719C5E4XCdC0L0j7mnNuVUqjSUBIL1inegkBRGuWEmW0KAAWJvM5sENRKXRweTm4vJhMxt3u2XA0evXjj69evRoOx93z8ywHjZkiN6XfeQ7qMRS7VIQLFZwEk4chElO8NtFMqA5mlekFV/2la/4BO1slC9qIDqO3rstFHLHCW0HRah2dAUr6be77yJdVrWKq2gLEZADhF6UX+HEcbW5s3Lh545tvv/4KcoNPNzd3oqjhe14UKU1R0rzRlYmLq2e5pPu8brOBUWa1NhERlxcXPVZCQcdUcBCqNuUktdX2BVkNCGv7TUyiOE6ylSTQrCdPnRPSPHudNrSyPQZ3fWRy1Qox0G9W5/ecZrtzcONWnqbj0XiWQHQ28P0MqjHyOI4S1B2F7+VFEDhZBhoqOvGmWEbqGHTpGiuM6Z6zQmnG+CYyWLjygKlhERR56AbBcjlUKE6CHH2epqrQUgIg3iaAQpM9U2NXEhsHYSB4FKiFjU5SWfhBXBRAaipLLy8TF8bECwI/D8PTk5PLKBxc9Iej0Wm3e6vbvbi4uHf/wf7BjY3tbc/tzKGk0CvKstlqUjNjxR2lHOvq2kLqvqV0vfVirBqGcXsrffDVBKAuKeF8LoBDKvmgtofCMfoM0GBttdX2q1ml3Mu8Q3kz3SDPsEDNAmQShsSfZ5hEk4NqZaTKtBWTn1JvdjBLvaCc1eIRUowszUDxhaRESVa0LIrpdNI/Px8OLi8uL09OTvrnvdPTk36/DzSM0+54PL4YDOcJSsUg/yLLMtfzsrzI8txHZj/Vt2ltlurezbAofGPK4ujUBXbV3EZlon8tlrzp+CzJe5IaDnM6uOYbEbUeFguLCr4kF1ti1bdevKhCj6Vq8ISoxhIaHSnMXxCuA5gXR7gwgcvaiOPdvZ29vd1nz588f/niwcOHOzs7URgFvhdHcRAGTglugFafWVbVSSfIQ+BSgb2pv1iE1kZURt8HcC764MUJm8oO3YW+ttq+DKsBYW2/oVVoe9wOmHvVi4WEK9/tEKJ655OmVdwXUP1daFkfOK7TcBpBeN33A8f1Wu1Oq9l8+/69H/i93nmSJH7gZ1nuJlDWwXFWOpiiANkU03PQVIorMEgNnHRoUwkWmDWV1j2T57JwLVMl1fID/FU9MrIVY1WGVb1azhfVYyDzhkrxEtZsEfmlbBwBVtdNE2wr4XmB70PneWhhD/zZxEmBSlqUaTFK87x33u/2zo9Ozo6Ojh/cf3Dn/v39GzearXZrreN63mwyDcKQJRZIImAp9FKfVpo3yS84boG1PjQkdLTLI67kVZAPZ3tmMqzA78iP6rq+2mr7wqwyjWqJESEPg1E8NanqroNCy8oiHcgN67I61SiC6JeaqbgKEC4tCzds1RK6AtKukSQKCqIX/fPD9+97vfN3795++PBhnsxPT0+Hw/H5+floNC6dktAglAgCnoTTSObUbD73PdUkiUmrDHSLZXOawMJ27ZuOJZo/KNeow2skQ1Ng0JC4o8Akpe5B6lca6/CaaBfi0YfcvV2vC3rYuBGtXuLN9dAnSD8ocgjREqoDDigmbxuNxs7u9u07t549f/bVV18/e/58Z3s3ihshiMlRBYRa71ZN8lJfiLtNEqqz2szrxKJwYCq3DUoY8HcrDRaNj1BbbV+G1YCwtn+diYyOKdQXnjq+IzOKnyw6yqskBm1xDvcy13MhH5gX3s41B/oRNdfW1tY6ayfd3ps47PcvZrN0Op1lXhqG0MaQhMgoP0XrEXsQhi9E5RYiMoqLCKUTFatGBGKVa2I0X7Tsp1mMF0K1hqgqMqSLWMhaa6QfYP3JaFBoomn+jE6OItXTgbZTWHfBhwb1K16Qz9K0yJLh2L+ErhTTHraxHwwHk/F4e+/azrVr6xsbnufnWVb60Mde+GQqa7fqei3+ifQc1y2UdrdikopMsnBsqqlko8ejiUZ8unRtqqoANSasrbYvxMyiIF7Y2UKcaFVDeXy6sZuOIZFqTU7ubaN0vNSUy92SFBpkHuaS1gLL5g2WrjGZOVISLaDX/HA46J6dfXj/7p/f/7Pf7x8efjjv9yeT6eVgkKZZ/6KfA0vFx24U+CPEhTnqkFKLCqhOr1BlTJWFwrQClTE0kd1bV6VYccIViT1aGwAZallrnJWpVt7Mq2ZCVt3u9d6pqtxAa6VtZsX/BLjlA1M6asSawS8AFERhAOo+H0fRzu723bt3v/u3754+fXb7zp3tre04bgRKU7SkLoWYWuQekPbpc4TWkFPg1lG3jfBJzNLFa4oUnlUHy/tQ+E8LaAvEW9sf3crFyqYvU1emBoS1/bZmr528EKs/rcDtcj/f1IZ98h4plsm5OJCcWVtb3z+4GceRF3jxqzd5ngVB0O9fFGXueu50Ovd8Lyj9LM/d0gUKJa0TqrhRNlGno9RvWKxOIC7qroKmWZ+SOMfiB0WMocVPLISVsWLOpzV2QnazesqEgIqi9KGSXh6tJrKAd+Q4ZYDcUXSeaISJJVuUeRkGoWJcgkh3kYP75HhF4XveBUjbBXFWZMUZwMLRaDyZnXV79x482O/17ty/t7m1HcZxCPAbBEhB1yeOKe8putjbSTy78E9JArrgV0Htjc4AyNvDQDjKBdtosJIS5CFlh4ji6PyjmkRaW21flvHTvQR9cYKOSwo5o8Uqo1I3Um1QVLcJfRgO/8n6wFU4EAiiKSi+eL5fZFCP4Log0AVMUeg4Px8Nh0eHH77//p9vXr0+Ojo6Pj467/dns9nlcDifJxlIn8G0N5/PgyCg3hKYeqLDBkTKyjREhqSklsp80vv2EVJjRDGFygSWGTQzsDQkhqhvtuarUnvEhAsTrFYAwCXPvKmAoCqM4G/qnCGrf8lSexptEoyh11EM5oFMKGiYNRuN69f3bt668eLly5dfvbx9++7mxiagQQCKMbFJQXLG93G/S5miqnSUwRs1iUKNONVyUJQY6EFQ0jRaEYFCCVSqYEC6YT7p1GhtfxZzF6/3l3kD1ICwtn+FyUygqWGokBtt73wRFvIPP/a0wcpGiyhWtEHqL4ritfWtKIo9P2w022EchkBxdPMsd5xZWTgpluyTtAztBxKGElEpp0GtKirayVKXQmdacV6oma5uDlFiQbxTIhnS6KDTtq3El6SJLpBQ1OlVBpf/y/Xx6kjlCGuMpc6GDl2QebMiVznOLNUtPbwSmtNjgWXuukgunafZPM2SvDg6PX1/dHzz+v7Z6cm9Bw8ODm6sb22lvh9FMbS5T+YBIEzHiN/ZWm/uQkGOqr50HQ97UpFWjXJGXC8voQWi0cvRZ20pBhgRAnP/WAMrsog1nae22j5/k5n8SumgpIwuxo/4GRdJHC2vpadSM3vr+V03mTcyLasCRpWdUodAx3GSBOVAEdcl8/nl5eWHD+///re/vXnz9vWrV0CvuLycTKeOU2KTJFgM0jQl3eo56p9B6KqgjkgmdKVL9iotfxm8WU5oUcCCw22ZJBGyMvMZUetlJwgolEZAJ1eXf9MMs1oRgbuJBfk241JcCHEZtQiNSsziagkGrecD0AQoS6fRgLrBh4/uv/jqq+cvvnr8+PFae933YLkBNilEQlX551VCdFpN1lN1ktYYykGkV+pjvRIbcLikvF/cJl8mGKitthoQ1vZ7GZMiF+ZlNIkPCSrIVfCq7SJXhfsOuS4U9MMq7wGhcQ/bJPg+lsx5XpEX/sVg5E5daE5IsgQ+tV9n2boS8AkpcOJKg/k4w3wR/0h4Y5wJpT2D+bgCeZDLevUy33SV9yEFOUVY1aBB5nqqdavqx5DrY6i6jHJZQo54UwBatSaBoPIaDsx0Ns8dt9e/OOv2Tk7Pzrrn3d75N1+9vHXnbqPdzpt5FMeOq4axRMIPRJev7GJvRs/DFCqRtVQ3ERw4GQ+w0aAZJB7JZQWWFSVSZo6ZcLUK+tZpw9pq+yzMAl2M8gzjjxKA8H8KNSEvlHGO5CVy81KzrBAM1LxLrhXkuXvVPLCIS5kgCiAwSYDlmWXjyaTbPTs9Pvnb3/73v//f/xsMhqenp0mSjMdj0mTOIJ0I8qHcYh66JJGAJ/FcOFe5jP7AZ2LUXhayW6iVAysPI2W7zlDQ7FeMf44F4abt7cIRmPVL4ykKhtpLuuTTWNdWf4gTMlZ8ZBnKnmmirxcErWZjb3fn/oO7//bXvz558uzg5u31zkbgR0EAbQmRFAwNlJApSno7y87FUqyW9aUIEdWiIEoj9WZYD0+eM6+K7keGsLY/vpV/lPKTGhDW9i+yxQdGlpnLxFclwletHrEyQFcZ96zHvrQeZOU8L44bm5s7ZVlOxqPRcDCfTlzXS9IsydIwCnmxSKCiI4B27rgJxdbRYVpSjSm0RHnhYFLRrAdE9hQBUS609zyQFSU6k1lwGJXRYkSFdFbrCAVgNDnFLLDCZVDlMQ4cjWgQpd0oeznn/oH0h2Jh4ZcLqB6EpbjZaKgWFUWZZJlX5LP53Adc7XfPzsIwHMXxZDY77/d7/f54PHncO791587G1tYGMkjjOCLnitZ1yBxiphApPauvn+r/5KqGzpRZ1R4bsz0XfqTqM9nlYaaUvJGkV6K3pihMS9PUtdVW2+9rsqWteksk+JGIj0+/ltEUEtCKt0/fVPFBm4RC31a9kXRKUOerls0z3MRC9pp3nRyzfATwkvn84uIiz7Ljo6N/fv/93//x99dv3p6f909PT+fzGXQjRPlQqUEKTH7caAZkUZwzReE6nTt0VsL4ZGUmp7wYvadomNh0QRfxyXBr9YQ4FrYqSciYkPsYmtb1urOP7P2jh1VxKaF8QxE0leyaloGFmKxU7wT455S4UrutVhRGoCkaheCgtlutmzeu37t/5+VXX718+fXBjVvr6+tRFPleEIYh8lBgcHBZwYqJFWehg6HSl+BFU5eScqhX41wufMRfqfMzqwQjanXqq+/j2r5oK69KRPAExbqJ1VD1F4IYa0BY27/UeJ22Y40iymgTspeVFH6iv67WTSQsgty1qjFwXWdtPYC+6mUQhHEUNaK3vusen3bH06nvQV4LVcJJLA7qOGCXPmhkk2Y5FZNjIFkvC6rcUK3GtHdaKlVSkU9eNf1dOH6jBqDBoVYJkJUfPFaLw2q2pGPFixqeFqBSBf8mV2ZUc7C2wnG8FHii+MMcfBfwVNDHyDKQaeDrMh6Px5PJZDY7Pjl5eHh8++7tg5s3N7a2tra242Yzz/MwBO5olmeB45NXslSuXQwSGHWRImeB4v/qqspSVNYewBfcT0wGzK3OE4oHJG8wlrw1tTa6HOTLmMRrq+2PZwuamTKfQ03ngVq5mK+jyc0EyqwsGxcI6nmOWScV3LiCKcp4TPaap9xgkiTT2Ww6mQwHg/fv352ddf/ff//XP//5w3kfrHSc2XxGQS6qLSzLcj6fo3ZXkSCqrAIKycrQK4xcAasyWoIhwdlA81qMT5U1+pOuizk6+a9hW+rVhZd1K9xLuNeSoMHwKsJdODakf/qBHwDW87xWs3n9+v6zZ49ffv3yydPnDx4+bjSaEJT0Q9Yv1SvCanqNwsumFWV1ADnAKsGtUuQ2wBFlanRQUX1PwekaDdbmipDIqo8+c6sBYW2fBTKUyITm7iVJQkub1FSArN4DfA64AnVHaf1wSqNkHQRhu9XqrK2tr2+0W41ur396PphOYdmOoyhNQQE8DNzcc/McwKFXAIkFCztgcVEkEyA5YhwUt5xT8JiVraU3wlFckjFYRtfhLJZplSuqGuQJS9ijtsNnzhxISUVVqzIvePr79AW9C7XC4SvSS6Dhpz6GTgFNKSDVivF40sLLi2IymWR5ftG/OO/1Tk6Ob98+3r9+cP/Ro71r18I4yrMsbjQ87FhI50hbvgIWii4g2G1Lh+SFX0ignBR7lEYch7Er9YrSKJ7O1FN11zkkKQtqexzbZi7Z6o3VVlttv75VCJn2C1V/jXhQtJ2wwl+GG6k6SeDkRrXMVNWsGBnUtbWSNrwSDTLxkAiilBhM0nQynlxc9EfD4YcP7//x93/88MMP3//zn5eDwXQ6BZEtXFCQEwrCoWXh4L+ZEqlWzVMNXYHJrRZT9CroRrDEHjdqnqRh7JKxFbFIRnR25blEPmb7kt2zZKy4rX1lQ2L5gnNWANXziRGDmw0Cnw4gCsPtzY39a3sPH97/5rvvHj56tLd/0G63PdfzAS5GmGLFn2L7h9XFFuL+0YQXuv5CpQxAKcejdWWKWsZtngmfv0681mvDn8BKIRjBt4RxU+2bxPryF5UkrAFhbf9Ss9oSLhRpmIZRamUSLExTFwGugCIFLXvwFg2de4o+QhjS9/0wDMtWe8spgiD0PD+Om41Go/nhsNXsfTg8TuJgPJ7lRdnwPGhXCAXrXpHnJfbnBYSJfkGOa63qVMHpK1PiolCbhnjqlFSrrMUqRDMmLPnGK7cucJdMUT2aahs0OPRVDiyTu4Gi5bQx7havRUZVg2batuJKAR1W8XnoQHwPSJ4Aj6MIhUBzzwc1vKIogO8UBI7nnZ+fTyBXOBoMh4fHxzdu3DgCZHjnxsGNvWt7vuM6EYxEXuTNRpNkA1SPCtHsa/FWcQGNg94PcUfN/cMxXh5o/BVtyB49243SuqMmeA5FNnoE1PZdEiK32xPXVltt/zpbRIOqPbp4oglX2O2L6MmF1/YLAimqRtDoUS38Vx4Ac9c9XAuKoqAG8ZTlQxw4ns3mg+Hw4qJ/cnzcOzv7xz/+8erVqx9evx6NRsQIzfN8PB6HYZhlWZpCl6McKgcz1RihdOksNJOfJyPmnYhZTrNhdSCM1jeMnSmIZ9o1UmHjEpap/tj6Uwh92Ssvv8L/6YQYv7e4oOs2gFS1IcEVDCMUTbhQsAB/InOU5v9Wq0mSoVEUuq67tbFx987tR48ePHn69NGTZ/sHB2tra4Efer4fhSH0FsY+ScAUXeEDCE1RM91rd0Cwe/AF5S11dlOcEQ+KiJsyYvzYLVzbH8RckWxf4KwtSkIs3BpfiPKs/5//+Z+/9zHU9iey6pNjryX4iukminviqcWDpUTM166QgKuYpg5S3gk360GJQtxsNpvtVquJq1G0vtEBcmOWex51UAD06EMYUvSk4qpzdZSkpaZkyGQ7CZO94yVagl57HAwksiKpdgJQuzVWTk+vTGLUsIcSqRRguwtxhAosUXNECkbrgzG5QiuhqHfHKUHllsGWCxOG97zCcTIUTx8MwfoXF/3++Xg8pmF0nDICPOlmWUrJVZUhXFEWKCXgCRmScqv+Sw8F/4m/WsSW1j22ovaf/RU+HXdlTLy22mr7rWyR02hnCxkdWTBFZvZY0As57ro3LRtOJLLHIP9waUyKCaL0gtAdMEWTZJ4k/fP+dDoZDkfHJycf3r97+/r1u7dv//H994dHh8PhMEGOCZNLob88KpHSm7wGcM5pEY7qGKNBdGZkFFF0EcdWY4YcDVwSHbONZ0rVy5cplGJJsrYux64yjGZu1oexEOIlqg60msBVNiIDqqi/vd65f+f2d9998/W33zx49Pj23ftra50AVOGgY3AQgCgAU0ZXzs6UzVVpZNVskI7G3DlihVHgGusicBQMs1gtLlQyoU9OJUivGNDa/nDmLrisfyTPoM4Q1vY72bIydlmbazV4laZDpKA/+WmzsQKWmD3SEzlCFOikDhHHMArba5322trZ2Vmj2Wi1W6enZ6VTDoYjF4rfcifJ3ADVVorSAfpoVubAGSV2pdbXrngzopxD/21K+6nvAyuo0JEpmKaTh6axkek/oWmiciBN8R8jGCZXEXTTB7GEDaRZk8o50VwY9eaij2L8M3sxzjDImiFKnEwmw9FoOB71znu9Xm8wGIxGo4MbN67fvLGxuen6HkBuv6SqTkMi5ZFZcvnU6stVH5JSKwO4mnK8jIsrBRaqfQuVywVUIj3yhJU1rfQPNe/XVtvnYJUoeyUfyK8rQTSpnoIfWWx6A0i0J8/wRrj97k8lrFIUDIBcUaRZNptOJ5PJ+Xl/Mpn0ut2T09Pj46PT4+Pjk+Oz7tl0OpsnCXWZl/xSeqE2LsoiZBhLzks6kLfU7OQnpblIKLsKvmzFs4Uawis2zvwU+Yl5aTNsl6cKLRqvWYIgmBgEpD4NqQkgocDPoijc3dq8c+vms+dPv/72m5u377Y7G+1Wm3BjGIZI+KTu84oDvOQK8sogr2BZYgNHbEirwn3oZnBDeSElg+WDKtWp3rHG8ApB8Nr+mFYqZ0BnklUCX7y4Mm0oMvef751TA8Lafh+TKfSVBRs0MetFRYo4qayOXf7xkd2xYIDn+nDnl0mSl6UTeEGrvYaraV66ZZolk+k0iIKsyMMoGo8m5XzuNfz5fO5CVXmhlTNhs1hAp+sKgUvJS60mzmiwhsLihsiJ1Y2qbxJ1X0Kmo4uy4yxlyiFMoSujuabaGXBQLVSNj0Fy+B1mC4lhrb4CIKZIrBqE81rJZ4KLNq6C2EcR1m+l+OJ7HijjYdib1uk8TYH2Az228kuEgpPp9Oys++jhw7sX/fsPH27tbIdR5Aeg35NneZqljUaDdkQQsVJeKClQdECoOyqC1lxbaNf5GHBo3yQ8UOqb8DV15XJqPqm4o1hYogbny6gBqK22LzQZKLHf4jft72j6gmqnqmgasp7NfiGyWyvYoYsEUa0gCrMNtJFASJekaTKfj9C63S42FRz0+/3z897R0eF57/zVq1cXl5fT2YwIrqrEgFOCmvjKU5zhqFcmN3HWyGa0pvEKzZXPhWCS7iSv1kpanwgrGqi2DBPyIVCqjOvWKwhT7lfDQV01yFLP+vu0Xw/Cr1ChDX2ecL0ryzIKgRoaNpuUzO1gfeDO1uaDB/dfvHj25OnTG7fubu/sra2tQSLR88IgxFwinKaHVQwrJ2Qr96rWQVqg2RnQot4M+Sy5GKlqrhtAmu7zqs78s/Xra/tlVl4hE2qKk4368Uo0yNWGC+98nlYDwtp+ZzMgBI0jiordqLS+MCqz+CRZk/XHTU/xhOtQqBr1vKH7rR9AdXsYtlqtZrPZ7fXiOH7z9n3PD8qLyyRN4zimdR01SEvfh6UXjxwEOV03l2ekEKNeS3WhBZ+aKE1nvihsqAAEQt0QdeLKypixJ0TJRTG3mBVQdmDXrJmrR0cirkVvSbgekGcVFwjeTrOMzjfA0hrVXx7N89wkSecJyC6cnXVPTk/ef/hwcnp6/+HDgxsHG5sbvh/Ecew6znw+j8IQhpI4qBhXZ0xoyGGC0mTdBcwFRU+uQq9SuqOiHYW+b/R3uHMjJZ/xS+K7+iKKG9V0sKitttp+iskoXgVpVIoGZWJQhrZ0/IoUSRTkUzQC/kObzF9dnR5kZiYIv6BBv3jcWYI2m86yPBsOBt1e7/Tk5OjwaDafn52dnfd648m42+1OJpPBaJSkqed5U2g9D0brBSwZSJGkN5dVTUvCgj0yNnqrnJ21CbXKVL/Awb5P08diLA1TrcJ4ujpAfkuz9VV4V2Fv0RSEA20MnzDKRvk9TPRBU3kvCMJWo9FZa+9ubz24d/fFyxdPXzw7uHFr79p1qir0fVCa4St4hRoZq7mxhAyfs5Ym0JlBAf900s/V6jIGN2pMKHRypPprbX9Ec5fSlOiF1imXL3SP04W2WIs5j8/7rqkBYW2/v/E8y6hPEE3QuARCzNRKYo61UD55R1S3wEsLkUJhYetA73ooKmy2Nre222tg3//wpnTK4XBUlk6aJIm1uELQEStEoFGhLvnAdYhaVjAbUQez9cKIkFSHZGXtCK1ZKiG6YJwfpGaJtDlCyyrlVdWFY6i8kiNUEWPQ+FHU14umWDzayLrBPRaFgme4wKv6QoqO57njOuMxBGb7br/b615cXnTPu91e9+VXX92+fbvZarXba9iuEJpSQC9mWPhR/kcrkV6dlDOhcRpPu1az8h1NQl4YKy0ChJEFdd0IFUqqEOcbrQb3Cy8+ehPWVtuf0CpPytKUIL8DaSVkBHLHPxsZVhOAAuyZaJEJJJGm5JWTiWQWEOcDYn9pShHA2Ww2BvGY2WAweP/hQ7d7dnR4fHp6mibJ+fn5aDyaIoM0L4rZbAbCMyJLJrNzXrXBz0dGTBd/G+olTz6VwVwgwJs3K1lEQdtctV/msoiNLCQVCQ8yadMs4oIeo3sxQTGEWb5J5bWA1SEMgjgIms3G9tbm7Vs3b9+6de/+vWcvXxzcuNlotZutFlQMQrQ2yHXroyvUxekSEiAsMCGpmKJ6NPHegAVTBBkZQJtu8+pfDqvy4l3HAP+EQSun2l3QMNdYfYB+ZfmpVkpwqUjpZ2g1IKztszGxhtFjVsn7GXdcVw9qvsenyo2ySVEB3EaOCcOg1WoRWgyjuNVqBr4fN1qdtfbh0cnZWTdJkjAKsxS6FEaRM58ntLYRKCqhp7CmkqqT0OQS3SLZuB0YWTVOg17MWIRGraSCNSq0jg1khKEo+AP8r4iRqxlruZCKGlLOm2mkBPxW8jVMT2dKeFKnDR2cLRD5EqWqdGBpV+wmjKxnjjuD5CuEgM96vSAMG3Gc58XF5aB/cTEej48Pj27evrW1ubl77VrciJvNluO7aZp4rpemWaPZUDOUj60LSehg2fWlN9nlUm0/FnIL8IK0cESLagCxmBIkMC+RnspV6gA5E7045WtaPuuIuD68z3i+r62239UWk4FcU1dNi+n+7/I7HFuTMR8WL2ECY6VaR3227HhQcwtmb2oyBJkrLBEk2ZjpdJLOk/FkMh5Put3uWbd7dHR0cnpyenraP+/PZ7N+vz+dTfM8n06naZblKDlT5Pk8z6Mogr4SEGoEKooktMsTWJodVe/oI+QvIH9BTe+yHHExFCXjVnLj+svwnxVgUiVa5aYWd8AIU7J7aEXj6CflACkASsLgPiQDgzAIHdcJgqbrOHEc7W5tNeLo7t079+/fe/Do0c07d65dP1jf2Gy313xYPTy/yhRdDgiVwLfJ+Cmo51FjEuo+YtehUEiYiTZKTUb7IRoMSmbPFf2MavsDVjSVFidIxD40ea36O5tEaoINMjL/Gd8/NSCs7XM0nrUtWKijMag6ar5KH1UWp49sX1chkq8Q+D6Uw8GyDV0oPC+Io+Z6Z6O9tr6ze21nZ2fzx1dHmxvvPxwNh6M8yuczoAVBHizPPdSOc7GgTq+7JqtEBSGanaL1cCQGWyY6an7CMXDqdQGBc80MladvM4r0v7TsWw2q1KQknQNr2DUNQgylxqlyA3I/ytIMmkMQ5cZ4ZsjAooOZO86gLMfQm2I0mUzevH596+bNGzdv3Lx5a3dvb3t7u7Ox7gdhu912XGc2nUZRZHN7rrq4xEEihG/C4xX+FbpXlgOkiab8NayckYx/9R0jV8PcX93mUfaJFvHm2mqr7eOJQYZBsstoBSBVMvD6iVP+fEXXBCJH9gywMp2E/8kL6NYHQcEsQ7aHm6Jd9vt5ns1m836/f3J88vbt2/7Fxdt3b3vnveFgNJ1OiqKcTicJZRFRbEY1nccpJUkSbrhq6BW4Z36TQml0qDxJ8QTP/1Emga5dVSgr2z7dKjhQvrnqBzwJWwWEVlGDpmmKQm4k10G3QazLUDxTqCGMws31zs7W5p07t54+f37vwYPbd+921te3t3cbcRyGsBbLVCdNvUsPUJNk6P6BNCB78JVqE4TUSipUO/cqrsdnIOokNLwVzNLa/oQt5l1OUTApe+FpYxKpyAGYz6ovPkurAWFtn4tVK90XHjkrO4+rZYU7+umPm1pgfJ8SXr7vecBvdIsMZGY8z4ujKC/azVZ7c3N7b+/a7u7u27fvNrc2P3w4Oj/vX5aDPM8bcQwoKEmgSyEwjHJTQ+9Chz1Qunaw7ZKipuhlhvHJYiBWH59KYOrMGCXichR1qaz7lRMnYUxapUkrTYmmMQ1GDeDCZvTBLKhhafVSO6JszgWvXIGxcMy2opemU5NA2Cmh/zIr3GAX++z09OTo8HD/7bX9a9du3Lz54MGDm7durXU6eZo228AUguA69EDEDCGm8q4mkVYKhGSnR/WO4xRIHqt0sCa4p51R44eJdCDdbRo9aqTMo2pdOE0X+fTS1tpq+zMUCq5M3VewohZ8WkaPVDE0BoQLsETHj/TPVh0hTUe8U0KGlNMD/udodHFxMZtOe73zfr//9u3bN2/fXg4uT09Pp7PZbDrNstx1nWQ+z/AnpD5K9AQ6aO42sWReYmKnGC8zahzu479WBO8kctQbU1PZUrC3Cu9d9TUT3zICPkzS5dHn7/Kp8Za1W1x6HpYCorgakEA9b7OzdvP6tadPnz56/OjO/QfXb97a2tr2fa/ZbEFQFloEe8QUVfUdqhq8elVpqTXtZ1UcskTZNqts0l651JAucewVt0Z+VFcD/LkFkB2bDqpjDXKJX96dcpEy+hlbDQhr+1zM5NltRZllNRUmRmOT935yTRc/80QjzAGAeJ4X5p7nYMqrsx5GcSOM4p3dne2drXa7/fbtO+gp7Hvz+Rx+GMfJfO66wDQti4J0tKmIDrCl6xS4jLH/YfhCeilG1iIiESVtCVugan36fzpQkDdFGJJXCyzVmIjR47rKksRtqMFxxUWzPCeFbazOVhI02gNrPmDoSKfsgNyOX4Deehk3Gpw1pQZcSZIEvh8GYbfbi6JoOBoPRqPjk9Ojk5Ner/fuzZtbt29f29+/fvNmu93xfM/x/AxFa/IsixoNIHc5jr9MiVTeJPSp6j5PjFasHsH8quiqrAhGPCAEb0l8zlwjleHEcL7YMqFBMSZUbEmC5jTUNRqs7U9sBvvZ0zIbfY2BIhMguWueeoQXo/U4ES6lDl493/O+0iSB0jKt/0mBvCzLkvl8MIAuqr1uFzqp9vvds+7p6dm7d+96572T05P5fJ7nOXWop1MAQJhlIRS5wSs9r5gTtJYYLGmjyaQSEDSASkfuuOaZphfF/l84JXl2i4qgiyNQGbTFPkn2F3ReROXNVNGgUe7RXQ4JGNIIK8ls38MWEb7rOthdMHScMgwbjuOGYbC5vra7tfHg/r0nT57cf/x4b//6xsZmq9VuNZthAIlEbFII//Fcal+//PIqpiiNhNa/ofuGKf3iTBdvG8ofqtp8lRWkhCtDxjox+Ie2pcwyd4ERbYFA9HhEban5VSUWpolaCzjxsxQtrwFhbZ+LcVLeknNUhEdW5bZqLxQgkJQ/6A2oo8sfe+oYF3Hih/Rm1OFg5tB1vSiMgyDc2NhYX19vr63tXNsJ4+jN67fRLBo74zRNUc+6oECxajlFHoA+WNMjEM1UfuhTUbCWixkQJXqEMqn4kEogUMiqqEjucIDWOlkOYumTMYu2kmBZWkMi04NWpF+v9np7el92tSEdKn0pgdwpvF942AsaW/5CXD1LC8d3UteZTrM8719enl9c9Pr99Vb7+v7+g3t37969d3ALeKRrGxte4IO+a1nOp1PVt1AJ26G66wImlAUt5i19qJqcBjhdVqIKSfHluQWdnJDFlgpjK5KSbEa0hIhbW21/xsQgESMFnX4ZZdR0fyk5ESRz/tU53Ew9nK8ilHilj4V74U59EGnCCQR6zWcZFAEmyXAwOD07Ozk5OTz8kMyTDx8Ou93uYDA463aTNJnNZhDYwvAWnleZ5dB4tSyKeZKoToU6Q+h7UFNQZS5UZsulh0m/kpk5Ee+z+IsLI78KB161O1k6qFN+5lB4OjTamrJjlOKImu1whTxk9bzSzbHHBGC7IKAe9EEYBuudzo39nadPnnz97bcPHz3Zu37QbLXbrXYYhXEcm/WFODJiRV4YK4W+9f2jp2VBNOUTUUCWYq4sCsKpQvWxIZfY51nbH9aumDRcXQQivVMp5yAxoSGH6ylOuBM/Yae/o9WAsLbPyFZMwCJyqaUgFzNX+u+ftDv6R+m7UFQSpAXgQQaYp5Zvz1vzO41Go9lsxo3G+uZ6o9loNBuHH45cx5lOJmnuZ2nmlAmHnInlArWFkHVETU4hDmAYidUDsmPhoks7L4ngxCCkrP6W12PZDEoykcxyR2qlVT6SNaAi1mU6E4q6R1m0sxTwKAFShmcI6tViXZbAfS2Ao5WgsPtgOIDej6737t37d2/e3rrxz3v374MS6d27rU4nbTSiRuy5UK2JjS/8HIPQ0OtDD/VVV1nEF5TPKJpWm+6y3JZYCYxSoICJyiYlKOXntOtBoyPC7Tp/zSrsn+cCUFttv9zEJMy4QD1PatojJwnogoIyKjmSPIcIJS2W3dIpQUloqGBCq13r4uExTlPKUqQjiq9ns9lkPB6NRhf9/vv378/Ozg6xO850Oj3rdifTKemLep43TxLVSAFzUFglACUGJK0s6ZJKT6XKwtDFfguYWX9sH7fOVqkTW1Eo+FNBoNXkyV49l9QE0vumq0Ql4WYWMnWEchd6qcAWTWBhGLRbzbV2e39/7y/ffvPk2bM79x5cu7bf7qyHqDWKyUDoUF+WqCmK152URVdeVqUUQ16BKR200KwQylajKRAti69x99+fDqtr+6NZqd0eqSkqsgjLwhPLWGlfSgdCshoQ1vbZc0fpxUINhqwwqRBmhF8u3HHlo8hKXxno1NAFk04e1jC4Lmil6AXcD/x4e3svDONGoxlG4Vqn87b59rx33u+eF2kWhRFyhmAJzJFEhPRR7Eef5QXLBij/xswdMmGo1jbtLpCAqCFaaZDK5y5KPHTSipr4oe9lqlBEAF4i4QpiXBQn0L6TUAJ0HA95oRWfhp0FpsaKjCK29nKcKI6VEk9ZZhikZ+m509PTIAiG48ZwNDo6PX1/dHTe7997++buvXs7165t7+1FcSOKYxdkBhKqJ4zjhuOUueonSWHpZeBQyPrRmFMiV7WaoE70OvgtBlbzSYXgmNqe8nFNHJo7TUP2ljsU4YfmPqzc44KVWlttX67Z5E9+YU04BMMsNChJlfQdDe8Uq0K8MGF6/KJYC6qVw5UDo0UBhF5QSpSKBB2EcKCEnGXJbDYaDQ8PD9+/fff+/fuj4+Ozs7Pu+flsNjvv9SbYQyJJEmK8c7zPDwKNBhEfmumZOv1oSWQbIPEpa5VLiIjRvKGPn3Er92uAFkbVseYU2C+7ZEYpdPUspGo19dBzZXh1zNX06xdlAfFKtfo4URQ2Gw3UCIU6grW1tVs3bxxc33v46OHTp09u3763sbXTXltrRFGj0UQCCKkC+ZhhpSYT8h7ReyOhcesgF4sFTCUA9+xQmR5z00hMq6q89IRdT8x/XislQ23RF5UFTasooyxvsUA9/ZytBoS1fXZWib6YJ0r49FXgp1+Twhzz+qiZFT+QqnlCRTNFmFnXdezZ90CAFA1JMKA3E7darbjR3Fjf3tzcfP369XpnrXvSnU2AUDSZzbMs8z1KD5Y54kHH16xLE6I2HFGqbTOHxUxExwGPQQc0dZ2E4tSq7CV5DRz41F/jJofy3OwpyWqypwfEROhXBZ5XybqYnK0g9sp9gXwf9HEE8xEtazInsn/xy0DKKorBZDyE/5+8efPm/rt39+/fv3Xn9tbO7sbmZrO95np+u90qoZ39DHwIqYDuAMt28Yj5+ql0g1YihYYT6AnovvQ6LahyqEv4b1rzgWvEsShIeiS4RS6wUV8GoGjHuYmwWquY1/YFWkW2xDwpIhlOcROJlOSTsiwNpV9UVWJUtzvJvmLq5XI3Sx8WE0TzIofGd6WTzKH8D9FcNptOB5eDt29e/89///fh0dGrN2/P+/3RaDSZTl3HGWMnCSwAyOm5BToDbi7B6nEJaLmZja57XD5/Kiio+GdL0nEygsdvLCQSJQL/FZJZ1qqgSgHlO+r9KjqkY8ArTYeN3Yrgu9htiAiivudBhtBxyo2Nzt27t588efTg4f3bt+/cu3e/s74dhlGz2QzDKAKmKIcFVoJ8HXDkmAI0G+Q6RvpY4WWdMpYHzNJu6iVcBB2cVQJsug19bX9icytcLVHQZCTYDbnI/NCEfphfam/nM7caENb2BemOCk6SeFMIrC3iG2LziZQX465lrjiv0EhcAfN8r8h9KDpzEhe6JwWOUzZiiGl21tb3dnf39nZPjo7fv33bO+0NLwfuBbAffTeYJ0mRF2Hg50XuOqiVprssk9C56HRkJFKNioAiOKn+eKZUTq1XBg6a7nmco7NHycoH6oLGBbPesz02Q7m8glYkf1xx7zRSAqao2nuelegxwB8BCtJQRhSHCPp6TSZplvV6ve75ObT/Ojy8fuPg7t17e9f2o2YrS5N2B7pUIYnUhNhdyEQCm5SbUy9eX3JYuG8hqd5J3r9OJFfe0ZeHHAqK8NNIy+3rZYNwJg+mHmFBSdLdPZRTUukGXVttn6tV9GA4sQV95PWLxUygIYiaoJsOG4lwmJmEBSC0qgpFmGbVJEQhN6lhg83hyyxL57M5iMCk6WQyOTs9PTs7/e//+r//9//3X71+/7Tby/JsMpkUZRn6fpplII4F3AaYKwhG0gFQbpDDWFxevOqArM5JrHYi3ESBq/XMT5lGJlwsuwy/bixJYnBOw8rYKP+PdqwrEmTxIHTiBUFRLBeHLoKI5qMwaq8179y5/fzF8xcvnt+4cbPT2eisb8WNZhiGzWaLigwJwpvJfBUg1EOCV7XEuRNeqmVUMPRQUADmVW6QSHOuOkUxhKQ+sFDCUdufzsoFsMea4fobv2yDn7fVgLC2z9cqOES+WMzbqGVJZKjopXLdtfhYFWR+zFB4ADVdfGp/WGbQgTgP/XBnazeOGnHc2INOhRvv3ry96HabH46Gk9blcJjnhdtwk/kcCiF8iFFDCBlWMNAUzYUEHyvKgdNCS5pe8XS0uDTVeKSJgmQXkDOQg8BfYWxJlFQdoYdfKgSJ0dDKMNiQRBVjiL72qoOUYPIwY8pyDYQ4BDMq2fmjs/bgQOB8wzAkBysIoFFHhpoNASq9DgaD+QwaPqZ5dtbrHZyeHB8f7+7sXj842NrZvX7z5vrmRhTHvh/kRQ4CD1nWaEA7e4pM0xEuJZEijxfMwEL2IDUXRPC71H1giLAmnqwD0drBKzi2XCwGILRIKdwCXNmoX6h7jSMDtdX2ZaBBZXhj6xdAeVgkiFaYHWZ6FzWCmrxRwmzLcIQ+VMEwBooLx4ZMRSKIej4IFKsqblAQTYu8mM9mk8l4Op4MhoPL/sXbt2/+33//9//+7e9Hx8fDCXQUJD3kLMvGRRFGUQ7IMY3CMCcxUlSlMXxLg9awYpCKJHXZZHXaYea4BnoLMvQKutIGqYZZtylUny/G7X7eRVyst6wcLc3wslCcf8grkxLGhnkeer+TjLPveY7rhmEYhSFhQt/3m60GoMHnT168eH779t3dvf12GyRkggAkZIIAigZhnYVJG2b+q6EgU/o1o1YR+ClWp4kzuEXMGxpqPw0sfWZS2bQI29y/egL+s5prM0UXc4CL0+CqFxaT4ktAgzUgrO2ztsojJOlGC5RRKTzDD6RgijDN6CcaK7PAsodOSukjpIk8WPaCMPSDTntts7Ox0elcdHudVuvo8CgK/d55fz5PqKAiyzzHgYbFBWhjQpEDLHua6KLoncvmCyOIwkxWkw2DUhjwUPiHrFjAB19xGnTr9CpzVL/SZEn9dR3ZpkW6AsUJDZrKIeO3yb1V/Qn6HBhceGgJkkhh7cbou+u6QRjSKh0GQZbn49nstNu7HAwuLi+PTs/W261re9cOrh/cPj29AUqku52NDdf3G42m5wL8JiVSVnZdiglJqwDywMQd1f6pbj1PKT51juTqYZUghRsUyRSvG7ORjZ+kuiaSxiDp6S+jnloUVBV05yDGT7xHa6vtN7NFcr6i7JlEl4X3mMcOwS/JJtWPgy6RE1WCtBWeLLTmk3nDZp8vPUpF18QjAEIopozSNAXxmDxL0yxJ5r2z7nw2HQ0Gl4PBqx9//Nvf//7q1ev3h0ezZJ6kKcW2VPZP80KLooD2QngiKhAmspMl9UrVI1DxBXUnd0pTKYa4OUXdL0GcgZa0UhXMekrncf7VrupVaFByQPi/dhJXNGrH/1GUEAggMNl6YQBG3WjX2s3r+9devnz21ddf3733cH//II4bvudFEcTywiCq7GjV5FcJLmA+T8kUqXHSmVix2HAPD5v/L2k5XG+hmwb9amNc2xdrLkuJulVMyHTvysS4qo6Jf/VFrOw1IKztyzNmGfGfywq99HogwoGCUqLjgkY8Sm95YV/0JgED9ROKREKqx93obPh+0Go0m43GxfpZp9Fcb7XWDo/DsrwYDCZJNk9TSIVhBgylCUDGBPwVzAQWJQBMSvSZ5XCB8Cni4poPSW0tcCNLfQXJc+CzFeOjty7HrLIFPSQVmiizsKRHqIZbXhXpC6pKDoWYsBkXZi9Jkp6KcCDzCRoQ5Cu5bg6p1PncdZzJ1B2Nx4PxOA7D45PTDx8+vH/37tadO8+ePbtx+1ZrbS1tJq12G0XkobGFR5o3RNDNQfqceWhL7iV9ma1pXSf5tAa55hixz2aUXEUYWg81O4iLLTEF643qoFQ2gJzkL6WDbW1/VLNo0pXIN96vKgOmta5Upr3CFDWAyKTZlYtF4Q9dQW0BQpppBQ78lAM2+s26L3xRFmUOdYPz+TxL02Q2n0K54OXZ6eloODg76/b759//85+v370/7/VmydyFBugQooL5GTeidKfUXMdMAFEdrcnnpl5dmy4i0q1dDZrT+U5mZuLErxjo9gpVyb7+isKXGnEvL3M0BZxWdrZCzFFt+oh9Q9+kGwNTgkDIR/ZHtNFZu3Gw/+jRg2+//e7O3fudzmar2fQ8PwiCKIphKQMyCG5QxRyXZH6R4aJpwIy9xe1n2kbx+KvIpikHtIZQkUGq79d9JmorbXFRfMsCcpWeX5+6QVrgP/vbqwaEtX0BJj0Ds9zKdoVLEoaqYm5x1WMBSRKHxLdo9fjI48oVaIETuq47zyFy7Pleq9kMUBktKF2vKJLJNPBD33HDKD45PUuSNAhCKG6DBoB56rhR4KDAZolNrLjpASvLqSlHr1hWhJjXatBMxz8hCck/l9OX1v42/oypkuCQF1S76dTgkvNnNChHQNfk4AEskCXUmBuNlhJqSdQX1DZJWIeIlDnyoiKfcLFbOsD1giq/snCzjPJ+vu+HYTCbz8MgGDRbg9HotNs7Oj3rdXvX9q7dun1r/+aNg5s31zodorRmSUJQMI5jciNYfsaHHanmGeaWsFUuJJuUtOn1jUPeLZaME2OKmcqiMgg8SxBVxRPEtAUBTJUVwYHB8hblS6mlgnoZXhUlr62239ZMQZj8E59T9VKiL/UGokEJzPiB0aENM5WhKcgnUvkyhWgd0Er6oJKoAeRmFEQhX1egfHGe5clc4cDhYDAaDM+6Z8OLi5PT07Ne7/D4+PD4eDAYXFxcQK0gKogSL9QTsJB2nhcQUYJHlqkZIuJTyVzx4VGkR0/lKlGI4syaby9DSPpEfcctfKhuUBOFyKj+KvoxkuuhpkHR/VaH5AwalMFTCfYpK6hL2EEp2nGcdrvt++BShoFfFPlmp/340YOXL58/efb8zt0HOzt77XY7jps4mYdhCJqiqkMtbW3Z+ssFlXTHMNMTaP8mJscrvkJ6jCvtxYspMJoqZNbbL8Zlr+03tFJQRjUatKREzfNdXv2iqjJaU0Zrq+3XN+k9LEnTU5Uc5+sV7XH5QqpiuLrrANfMrTbzqONKGfioaOn7gR9gpBPqINrYYLd3erq5ttZpv235weHp6eV0VkDvCahOcdwM5O4UmIB6QlWYQosZq7yJtU2n1vTapZiJ6h1aulmFddkJVKEPYxvxhU91NyxylD6AK35r+jfgjtR7lXytAIvcMNrTKVMoL6QRAfJtnuX5LJn3vIveBfx/K25cv3bt0eNH9+/fv3nr9sb2Znt93ff9Rhw7ZTmfzXzkoHp5DuH8haoYff7uIuyXZ6caEmIKBD7UdC9BpjI8Oj02xqekIlCTBHYdqDZUTrDmoVCPETFMUu7VlBqu4Khw2txs9gtYgGr7LMwi1NldTEWuTxMBRDyO73UrS76wcSuiZIeX4D8YL+K7lVvMrwaDBoBRNo9gapokSD0o0yybTaa9Xg8Q4PHxeDQ6PDw8PDrKsvTw+ORiODw9ORmORo4DgTna2nQ6rWzZ02Bloce0tfpokGQdn4ZbS46/MtVWYR4tV3YVQGUrPxsZchG43pWae9j9XUwPquwf67hgyw4Fq/DQsPQBx0rPq3EcxaG/t7P17Mmjr7/++tmLF9cObu7s7iNHlJo5kd4MVBvCD9WxrLjWuGuVkMSmPiLgwEFPri3VOUbN99GXUrVqUm0nNH1GauRcEXyo7c9iLv8rpig5tYleU1dTRqsqo1/IYlwDwtq+JBPdYw0EWs16Ur+h9zibpbsPKf6nah2nVhdmBSpZc2vvFMSlFJNKN+Wu62VZ6rhQkOa6XqPZajZbmxubu9s721vb2+319UbjqNfrjieT+bzI8ziMUjeF1upwBKBiR0QrqZ4H2SUDlJhzhcefA5GSg1Ey+q74SVJRx3rJOUETy/oULKgRne7MINZjM99VimfsSybxqP3CLMeUgKByPUD10KiBRfygGX1RlMk8oZZWUZyWRTkYDMfTqVs6796//3B8/OM/f7x//97jR48Obt5orrVbnU6704Hm9UUeBCEwk6AZpBKTI2WepSRSfdicVcU2g/ZtINMCdI6URlS3kUGGxr/USF/9C+sFRdipZJE7OePNqxpjLJD3lqZk5S5M3aNpq1VNh9b2JzFRgPapRS+L+a7KrSV0ofCe50iEpowujdPJcm66G9WjDc8f6peImYhZ3EtPinN3TFmnTvF5nkPDQAB4xWg0Ojs5BTs6evf+3Wg0Oj4+7l9cjKezi8Egy/Pu+TmwEqKI6wYhVCcXCU3prsRVFh89JkRU3rcuw+pLZHKysmJA9yKiHcjf/5I8od3zUMevqAOOQYNWuThLUzMVghcYJIjyIgvMizzL/cjttJq3bl5//Ojhi5cvXrx4uX9www8brVbbdV2oLQwjyMf6AAm5FdAiEtNpQayUx7USrzY0mVD3Icd5RS2FekOjvmVDUFH34cRhPT3WBia15Uybyl9we3xZrQhrQFjbl2QVjqhcSWiK10hPvGnivobRpPVWICnj8gulAKkY5LSBpYdhx7jJe4AFLo5j6GgPFfNRo70WBOF6FG81m+tv3nROTt+dngZRNMuyLAhiTBhCC4sS9FUAtyDRkGVIlZCb1oXRO4ITVARROhd1SkRoUnFeEldQ5WjCpZGsI0Z1pmuvQGn2t2hLGsksXBJ1GMIlYkYY/a1iygpvqzlWXSmdiOPBRmcod0uQqmOmGvHByPlLsyxJExQq97u9XhiG8zTJyqJ/0T/pnh0fH+1s79y8eXNrb+f6wcHG1lar1fJb3rwswzDM0txxQhoYRSJV6nYGAZqrjP9VzFhbpdZymvUJW2PA/aotYhiSnZAPBteKbjbd1cMFOKwcG/UdoVi4qpTLSiGixIJ6IXKJtqpebX9AW/Q2RFCMn1mdRbYB2hI0qLGWuoHRKafvcFO+fBmbVJZsa6IUuP0GCfJxMAQR72hK/JKJl44H8R5Q0NM0K7DlDMwMWQY00TSZTWez6fTy8qLf675/++bHV6+Pj48uLwdn3e7lYJik6Wg8macp9iDM8qKYTiZhBPgkz/MoirD0sMiot4Q6IawpUFkshwsL1RCJQZN9YvWp6SOnUCPSxHXLBHwB2wChaCYUWHE9fq4XM5ArzCC9hSpELs5cmAFwAlJZOl5BrC/QKUJn+bKg46ZOg6St6jpuGAao9uzT62t7Ow8e3P/2L989fvJsZ3ev3dmAGdgPYWUMAuKUYn9CvCv02FrXWqRqFfjUE6m+1TSeI/6t1RyIl0oTedBOPcc+TQGh3lptfz5b7EhdLlkiGRaqb9K/qwNA8p2aMlpbbb+hLZJFxZ+q2TdHxBd/a8rQ7WcVP6cYt8W7XBrU4eiR2qpqWggxUvLvfddrRmGz2WzE8fbGxvbGxuba2v76Rsv333a7kyzrZ1kKHdTdlIT4UPWEiusFbVDRFUyAXacMLekWmsTw9xBrx6/4dKakQSp8O176rJDz4gv7rE1BkJLslmDYYG57KrRyggqf4PvCZVoQ8lH9/1ROkZw/Cv+bJoo6SYtpWnBTsiybzmal44DqzGh0cXnRbDR2trd393YP9vdv3Lhx4/bt69evt9bW3Ha79LzpbAbOX1m6QCJVcghYxbJ8via9UOyupVSFKoCQ23loLlUFGxPbSWFGyTAz9UHoIBYONlnG76g0pnCM5E0rMxJVfVpxhzMf95dkFWr7UmwRAcoHn1NfnOqhZ5Rbt/NPTOBG3csmIUMOunxsVesUJj7TnjTPsPJC5J00b4CTUCZ3uII6qE+MFESBIAq6oPB/SZpmaToaXGZpMhpcnHV7P37//d//8Y/eeb93fj5L0n6/P53Py6JIsFyQECAFSOazWVlClaAsq2PigHpTYD+RQzCjqTi19B2uZrNPRcFCZAaImUNcEQHIrRP/KfdAhfouj2IJBdesNCZBSAhx8TqYkgRFjfEKbKTkuh4qbQcBpAud/b3tp08e/H/+z/958dVX2zt77bV1kOIOfCyxd6BfPU65H3OOaRxwXrVWall5wGEDvO0IBvLlY+0f9XUjQk7BCn6ntj+vuatfaNOUYtmL2FlFr+CfLKFQ1SqjtdX2mxo7EMv8XX7yqpQf9Q/LkkkQww3hNJu0EvPVm1YvKEqKUUrf83Jm/MFfjgMqKH7QbDbbrVar0dhotdYCvx1FJ+fnzmQyyLIyDCkjSTkxgD0IKUk4VB+KyuwIqKH4rHLKASyKvxW1J6qEpSjcAkQSaAP6R1pF5srhNQRdFkHnATX1JZrwaYQQrk7qmlq7lReUqUQq8YB1QeghAJtUDTLNXThQBHrLshyNR7PZzPPc90dHW5ubG+vrB/v7d+/cfnD/3rX96/u3bm1sb3ueRyo1pe+VOaJpbKgNadkVLbCMm6tPebGBYVF4roe4F4LYWlVeDILg5lLbesB96opCHy9zQ8JVE4lTGjdFIhVuqBREXRW8sMaWk4S/dkvr2sj+haQg5erzDWBQH5WvVOW1SJTEuqOgalX3uavQQSlrTQ+qLnbWNYQ28OGklovuO7vd+hN+Ue1rJ6ZTkalZjQYRlan7H3vFQzeIPM+SJJ3NZtPxaDS4HA0ujg4Pj09O/v6P79+8P0yTZDyZFmU5ns4oukS5RJCx4qyc6Zxj1dHJQ1l05ExIqHLYgn/PClISGZtCTIOu9SX42feCOAaZJDTDK47H+gkXIjAaJDioO+OqwlE17RPdRM1FrusVZeahXhi8B20bw2u720+fPvzq66+fvni5u7fveX4cxZgFBMBYFJBRRGSoevksCbaa/LVIUdvnafGKtcsuz18NuEpTK6YNE0TNSNdzYG0LVlZuSyk3+ss2+EVIFtWAsLYv2+wFYxGQWJku7QZwI/WFrRCtVOiXqtV8tadN/5BImg9pusgFeYO543p+FBauEzrOZp75SRIm83w2K7N0NJ+XgT/KIEMVel7hek4QQhMLzBBmFL1Wx2Vpj2iKDCIKTjQBGgT9A3ZjFDYDCiIknaCknvmFfNimJ8XCKalllTdHc5k+IJl+Jd+BajxkuZq91C+SGxmYswgQu7ZEIpJ5MKVoWpZRBCRS2EsYEkOtBEgN30nSFKLQntftn4dBEEez2WzW7fW63e7J6cmPP766e/f2oydPHj54sLW7G0ZR3GwVee75PrDCmk3sgugEsFmlu3AFMuQKUoaFKg1rJweVr6z1VDULlMlO1HsDN0p5YVChV79yF0aMGLMr+wHoj9T4c9xAo3cVO7du+tp+ZfvXkYLsVqJiGhM6n6rYi+nxVUBIqUF+pi2cozuiC0KjSg7pm00Lk6iHVYBAochg/aN3zQmcj48YNpBwHNVOEKvOQPUXOknM5+PJZDQczqaT+Xx2fn4+Hl5+eP/+/YfDV6/fnJ6djccTKBfM4KmhDvV5ngdhSHxRetYKgMQKZyrEw8WNFi+iWjMsx6oKcTnWKAdFMBUx3qdws8QnnMP6eU9oVblHvGO0ZEwyly8MB/XwD80dJZish4K+i6JaAOScIAB26BpqikJlYBg6rru1tfnw0cPvvvvuxcuvNtY3G41mq6VER7ErYQCRUiCKWqEBc/wcd6OSBzUSumZRv6iiQT5hOlPuJ6Gjazo5o/KCRpC0tj+9CSpNtcbZMXlmIp0tX3MX/E96C39uInEfiXZ9VlYDwtq+bGPxGNZa1Ou0wodVrp0OaWsZTxWRNCsMxkGJO8pheFWAsGItUc4BVWO44PfDQlhC43OokfOhVg0qKOLYDcLYcfw8//G89LO8zLK5m4R5Af6J71NzQhCOQRyh5iNuuUtzl9LAUasmHzUn6xTgYDcDQYHnuYWBmeJUV42q4ad+ErVGHIqpAWKPqnK9xLjxm5w809yySjCbMrb6nLM0JcFynsaDALpWoNMI3RvUpDyfT5P5cDx6f3j47vDDm3fvXv3ww8OHD67fuLm3vx83W81Wy3Hd8WgUxTFcOahK0sLrq0PIi1M8BbyV1wGRcPCm4GDB6VY6CEDnZYYT3kvqHc6X0i2Ep8n5wOVZVvtGtO5wvunx1lHLEhPZ9HX5Mvgrta0wk/tTf+mH1fJCrHgXh7d0qS73jzdpQHmPcfmW9q7dq58CfuqFipR7xZc/wT2Cx13FksoyyzMnh74IWZZOJuOzs7PxcHje686T5PTk+MP797PZ7NWbN2e9fvfsbDKdQe+ZNCMAluUZwr9yNpspToEeG2J58CxXRSm2P3cF9ZoglyRucN8DCbt5xK0NySKAXxCvsS6EPFoW0NLkBPW2Tg6KX1qhT8Pp0KDS96FhI3SnwC16vheHURhFO9sbjx/d+/d//7dvvvnm4Oad9tpGFEUoJYphL2MqjlAxpt3qHCRPpmpENGFHxR+r6WXOk9O8anoMojKc+o6eebV0d21/chOJ/ZUfufoZqRJEF7ij1q90/PyKXXyeVgPC2r54k4QdU8GxDMksvsXPtfrXFBRaXzMBoWWOjAFBvu9gINZTvBoodCk9z3fXQHE7irwg9PMs8NwwCl+d94vpbJjnXhQ6aZmhRgIdB4qqYX9kLsBTa54LnbY4cKUPljhVLoAOJpeaY1MrKvK5FhlKy0PSIim5ONZG34bHZzFUtjLUbedm2TtBr8V0kJf70rQrznHA3gk86zk3yx0PBqAockBiZVmkWUoOxLzZcByne37ePe+9//D+w+GHZ0+f3rt/f2tnZws0DzrkCIVh5DsBQDgXIuE5uh2UdV12FuqY+YXpackBApFkIK+I6Xx0DsZD01eRFhJTXaSHCKtbbQlH8Y51PIwG1C7I8TdqkzrwzhzSJaudfFFFH7X9SrYgXwn/XeTQ2WDPFIVp9qZypDkKxpksi1ds3ZDMlDCor1IWq7fMt5IFNa27zioGVBOD7ZHDS8RK6p2PBsv1wcB/qMgaaaJFngPAGw4Gp8dg572z46Pj0Xh8+OH96dnZYDg67Z1neXHZ77ue14hjmFGxqWCeFyBDqhsVGtALITtfD7E5sMoMtfQIV73LGNrMBvzfys8sDv0vsqVZCPmmCNJZ0twGA9qXRIt/igXRgYQhDxSMW1n6rttsNQ72r92/f+f5s6egKXr9Rhg1GnGDcpJ+EDhAvsCpnW8D++LTBS7KAojzumurAoRWus9wKypnZ0D4sgWfVcO/MN+8ts9AlMtZQfVcxbCqiJSuykN+tlYDwtr+MGaVtdBCU41Mi9KsqiS6zpuItds8z1qAdEUkGben/9V7VNRHL3CL0veduOmuO2vX0/3ZFKLXICXpuLPjsyDsZlnielEUJknqolgKpLpQxw8WZpV9UgemynRKUCDR0Ay8HUATlDy0mUjqdJH9AyVz8nBNGKzq4Cg2o9qClf/jc9TrtnB1pLiCyDNIX5DpVPSx0vAsQbUcHA5O+pm2IeidoLLLIn8yDIFqW5QF0JawHTxE/DNVLAT8JNdN0wS07YJgNpv1+xfn/f5kMj0+Pr59+87O7u6NGzc6m5udjXW3DeftuX6W581GgyAcMp3KlSRS7Z0zGtQkUg+yvHgP0DH7PGIYrmchVjVKXKpJ0WuhIGquiKCnVgKTdK96nvoOdU7TX8aguYh3Snmbql8l6K4yWVRNLtW2zJaoVS02h1Tf5HvBemdhnCUIZOynnil4ofNc/IBqARj1YwHwWKxfJBZN0MEwRcXxqPuTsy98JzDrj3kLMoijcvwcNjJlgx/BgQVwGOBQM5B+KX2s7M2yDIMyQKRHBdHB6cnR29ev3r9/f3x0dN6/ODk87Pb709l8NJnOk4To5UWakoIo9ZMIfB8a+WgOJFdFVuCTJnpY06FFaBdEcfn0Wc8OTWiaty8HWlQs4B7FZq/IPV5ti6jPBOz0+Fe+L89ZC7GJmxXJwiC8rJSE4J6BzCDJnjlOq9mAjoIB6HoFvn9td+fevbtfvXzx+PHj7Z1rzVanDfLagQuaoqHngxg0KELjBF45nMoKgbezWXyx+zyNj24JW+ldy/MUhyIM9FWuPAfe6OOfN8i1/eFtgcBcGjS4zNczzc8ELFxKEP2ykoQ1IKztD2OVB44fSPivIX/y8ymkTXSUkeT1bKIproK2DAc79wvGcU0P8B6vrNChy/Mhf+g6m2EQt9thq9nurHfi6MeT0yAMjsfjaTL3ojAH+iiWEeJhEWkKj1z1PMAehUzhEsFU2DfkGA1bSRwvaGhCBo1+rn7JB615OILkSavqgpvCMFJpDFRPHVdrgRjljsSoyu2R/2hwpPRJZdZC7MjKM5B3lySJRO/sugGo8/1MM+JG02nRc4Iffjw5Ozs6Odne3rl5cP3gxo3rNw729q8319bWOuuO40ymU6hX1KLoojF1dWDJuNezhXgXDt72/4x0h6V/a8ZVM5Z1R0GZ2bC6iehbtTLOghsqiYJGhtegBU1FXtqaUstOKgdykaNYGxnfftYEIj6S0SfVJtv8li+KeSEbjioWqA68qOsuqJ5k5p6oAH7+gt6OmBgV9pM7ZQIy7d+Q/ZgPKqGeDfiUZIi+1WXsadW4UdIbsBaW4KGSKDy8VD1YONBVYji4OPrw7vu//e/f//73i8vBycnpcDzpdnvj6RSalKYKDWZZRk/qfD6nDoXEttDtXoiwrQYfti3jIwLpSe7lInRcRHEG1YgHRr1vHlv1XVKH1tVtP8cqiT4ZgzAaK9XfaNC+8B6fgT4LuBB0o1F5uuLEEm3U98Ig8Fxnf3fr8cP7f/nLd0+fPd3Z29/euRY3GlBYqOdDm4u6GFAzcVdruNSnJnYh3GtzuupzfUMTnpVLNfFK5JHUVtunmGulFuyPqBpDd46RqcKlifovy2pAWNsfzWQZoV7ljQcsvreYHrFza+ofSqkwg8aUtptEmdw3/gtaalD8h8V7xDvMMgAn7bUgDIM4Bv21RnOz2Vxv/7h2chqU5WmeTwNnjpIyAbYidNGX0X2gdBdzxaISUItIgVrSnLpcKf0AK3qK5TIELY3zI90RzlCQjIxxWE3fC0FHZBdKD6dFjqLt0T/cWUHsS3m4vMBzPtaCkQwLxYGy56kr9ypxeRJDxy+g45A5DgjblfB+WTpplvtB92Jw2Ts/393dOTk5Pjg+vtu7c3c03N67tnstW+usUxISrwC2KIS7w8tzgzZX3XtM45R8zmqWRtQhEEVKac/QC6HCisqNMHi6I4XF9RQNq5cmpvgKsn9KBTZWQsl6odt4VuipNJacPtEcQvL57NLcL6H37m9tVZwgwQb42ubJg7CRBf+tF5xJknRQiegka1tiuOXBaP1wqyIqfrpxplEqRMa1ljL9/M7ylJSkjBppkE/1jYgXqnrNU3kfxYXKAlj0yXyeZWlR5Bf981c/fP/qhx/+9j//+/rt+yRJLgbDNC8Go3FWQFVblkGCkVoFqtJB6jUPWyYVYlFcYF5a83cFnF1dP714w9vxGpMLrkTW5DT7Kbb8METYRgakTBpwsRWhOFYZ9OElQp2FicThp56k/qrkcByFe9tbjx7ef/H8xdOnz/eu7fthFMcNag8LGs4FxFJZXXbpeSk8SJ411QXoAIedM5enYB2zqf7UR25INKtHrrbaKnbFylVWnnFTkr8kIvpFSIleYTUgrO0PaJKdKOtkKt+oOujiw2pWh3wvauQgKhkkP2fxIPTGlOusWvkGgddqx7t7O3nWcEFBr3Sc+WiU5lk6nSWeF4fhPElK5I6CLE1ZUt8tIiphzpDxHCWPdG0FH7FizJBQqH6Be4fzAPFRyMTpxKIZMXtsmEOLohMi6VcpAZSYUH1aifVSBnJhdLhmkAGmKhgSkEVeBWo+yAcpUm30HXQrHTfP8tIpG3EDmvsBuga/GyQl5nPsh1X0er0oiiaTyTxJ+v3+xeXF5eDy+OT47r2712/eun333sbGltto+GGYQSGik2d53GgA1HQdPwhpqEhXdmXhgUkWAQKAzhaYoIBELTTP0AfPgXMRu+fbj4RmFHdLyYSadgIij0sOu2k7xr4v7BTHmvKuRCK1qKeWpp/6FqSp0XtkKqzpmm2w3+I7Mov7J0WGC7BOGUdflMSQSseqATeIkdQ9TXpZPXNwBa0WEeYFfiQ0aSlsRO+Ibt30kUGMgoanaqxMzIcPWUaBlhCitHKj9o60pu1HRghy0RBwgbJnF0RKMFjjQ4kfioJili9FRJemSXI5uDg/77364Z//+Nvf//4//3PW7U6ms25/MEsSYITm0Jg+y7IwjgtoSEFxHNWIhnYpVSspg0eQg0SY8SpUp3CRiLKQlRlGkYCtoJZFxml1CJyfbOx/8rHxAUpkbqZHjdysumsGi/iW56tELo2V60K/JIoqUskf/Kcsgf/punEcE6QMQWK03FhrP3rw4Juvv3n09OnG1na73Wm122EYYNlg6Aeq66APwrBLAhQSJOsMquEn802rR1T8XK9WNPFrEqk9EekhszsG11bbSlu1jjvyIwECVSyHXljCytWp8ssCijUgrO0Pa0yQ0Sw+ua5Y2a1KkUxFkpR+wExRGY//pNUdlyhAIj78U/o+cUBBoq3R9OI4WO9Am4HXrzPXLbI8SZIIuU/QnL0oAEGUWEGHkpXKt9d+iIiGapFKds3wlNWSKHKc5Ath03ru+WTGZTkTVo+R+XM100lmCHlwF91EpiDRn6qTIOFGG1tQWHoRtC+JPdPfOEJpntFhJE7ClCdyooMgyPNsNp9fjkaj6WQ0mYxms/dHh+8PD2/dunl6fHTr7r1r1/Y3Nrf8IGw0GmVZzqaTIAwJ29lJEoCFlf3LmL3rQnqSvquQm+YkV9ikqG2r1EqlrozyQSsxyZLKQrnIQSdj6ZJqn4rpxC4m9BZ6QgI3jOSGRNHiYqbK1OzwR5qftaRwTnzHMAYNWP2j00xXIWTW0ScXlvRnTardpH+XBZ5lc2SRPBQkUpOEVLxPOwQjUYR5YZASJ7sq3rh8+vkaijtd/ruUpmiPDIfhQEs5L7BbjYvNIaDmdp7MUTwmLfIiTdPhaDgcXh5+eH98dPj//uu/X7160z07G0+npePoFvNllgJ0xCd0aurQ8ClgpgDxLFTW3fRSNHO5okQsnDPPrhXRTqkZUzEJIH82HXSV8byj/wWDXu+LGUL9Hb4fbPRowmrwHeqag19XVxNHD+gtOCkBMgTpbD+OojgKr+/uPH346Nu/fPf0+Yvtvf3Nra0ojgkN6oVW9zFcsZqoO0G/wHfpIGkJYHpLFc7xtKOEi+BCeKTLJdjRMMVaZYR/8Cmntt/eXOvFwj1mf/eLDYbWgLC2P7AtASGW52pXJiyu38LvEtH2BZdZcqWqhsJqpFdZUEVangEUazahzDCKNsPQATpo4Xru+NXrYjIZ5HkSRVmROxloKeBucxIYxTovH5I62IVvsUe9OAUdEdanrrli+B7UE7JHSB9UMLKa06qcmwqlc+GsP9EDwpmUUhPKPbF0F+xiHgsa6YOzRRRcSttKFhGlX+AXeQ5dREj6FbMHmEaAnWKuwhmPJxl6GCen3ZPTsw8fDu+9//D0+dPbt++uddabrXar1dbBBdKpMTFDkI5QwXgCaEvvgkq+YUlWjQEhZnsYLcJFQ9Ec46ybblqKX0puFB0ek9bMK32nK8C3yHCrIBf4sdaElKNNny4LlAhnVLueMsfLHEmTOl42CB8TO63ap3znZ5rMqn3aEcrj4dfyO9h3xCQJtX4GRiisnep+eLqFgRTqJAlGwT2GXL91GDojpFN2phOJUd5f2tobbxRNFV7RqgeRlGQd0n9sYLhqRBUIRPqm6W1Ix58DKRS6C86TJIW8XzqdzvoX/cuLi8PDDz/++MPRh8PXr98MhuPxaJSXpe/70E4QywWpkSATRBUOoUHQWTLVT0+PslRbMfDXLlTW01+F6mA+leC4cvV/FShoh3+sffMXALZRXE13SaqmcLU+M/fyqTB7+dZSdRHWY68AGriJ0EWpCPyw0249uHPn4b37j588fvbVV7vX9l0vaDSbSHwJfJTgQgB5FVNUp7b1XaFfGKBqUjKLSUJLa9SuR6921DD3aG21/RRzl5Y/LDBFF+OhKzeo9Jk+91uxBoS1/fGtsk6vQnGVpI1eSbQCJIfg9dbAryFIRuw7FFJb8sRr15n8Eq8oQ8ctg6BoNAFGrK+v3b51kKXj4WV/OinfvDsM/F6WpS6otEEGJ4A2hqrKH3rcQSEcamCKmg86Fb38M98T/9FRVk22oVpokkAFUU59xswmW/RmZLyZx8IAHT22tmtr2KiLQ6K0xTWEYOYSqZtaPxC4nQU2gyBQCVumGWn9AIWZFCVMebREJAOxQU2lK9LSTTPHRRJp4M+PjoMgaDYb82Tev7jonfcvBoM3r9/eun1rd3f3+sGNVrsdx3EQRvksjaJGnhdhCLsqChI4Be/c9yEZSLzQRX2/RSxRYW9qNIiuP6iDkuuGL3w6Nb1NUe5q+knIDJ7hEBruqNxXBefLBBR8H8X5NXytHDzhVbgTVWZSMmAFkpfvyOdrFY5a9Q4ziitsHPP+rx6OFRuUHvZCgs5CufyOzOuyygjlrRXCB9Y5fVlXvqprILasCKL8EBnKqCCIqhcV4VkmDdPBq9YpoI8lLpOdYJeJI1kHKxH+QjYe8zOKg1g1/URjLMPzsizTCXBoAgH3Tw7/5zhuksyTJMmzdDIaTSbji4uLNMsuL/rHx8cfDg/fvXvX650ffjgcT6ZpmqbYYh5Tg06aZnmWBmFQ5EgW59pH7BzDipSE3OiJYEa6mh8q8SvxDvAIfN2Rgp+xRcS4+s9FoeBPMAazVXZoZeBNUEzHp1Y9BYvNaRQ2pxsDX8J38DmCVQZbSpAss+M6rVbL9UArtNmI4iC8f/v28ydPn718cfvuvc3tnWar1Wy2AAr6XhCGPmYIUVZ0JSAU3U90R1YxY+uErcHtle2oMxW5blN0jWdWmS5qNFjbzzN3GadpRZHMJ4UjP380WAPC2v6MJgORnHJaqPvHdQUVF6y0m3AiiN8lFVqurJ+h+CXgBtT7gGKL0vNCx/EaDT+OHwa+02pEgRe//RCG0elsNk/TIIoyXRWTQ54QoALktYBFqlr+Yr7BWkcpJ6MOWMvLcACV27aLGY5+rbaxpIOgzH1Z6aQlKUTrhVDbqxoK/wGHtorAq3Fx9q3pgAUCXYzEc4tjDYQxP0DeD/Ul40FxHBRS1y6R4zjT2cxxnNF4MhyNR5Ppj51XB2+u3zzYv3Xr1v71g62tzY3N7TCKyzbAvzRNoiiGhodpiaUyipaGnFDywi13ZLEmgfqSSH6pcqQghavAA3dqVrVn6sTRX8dyRKE/qQUaFL+U0DWllQxktFKvinNlEozKuTLaqhoRaNdNgm51YKoYrdL0xWTJKumIRce6GoUh2q8pX+SjXfJz+X7FViX0PgrUrYSpkAld/iseKYm/pUKonfbQ8rxaOVam3PUVF4dhRPPlU8nAT448jBjGnBQgknFr88vq+DDvXedSbKFUxWG1MKHZ7BXTnUrQI1hFJc8ig0aAKByakKRtluVZll5eXJZFNpuMu73eRf+82z3L8uLdu3fvPxz2+/1er5ck2Wg8SdMUfo/tZIqiSJJUIUNdLggCJvAYohyUDhepY9GNIha5Btb9sEyCRF0d+4eLZec8pM4vMFmuKRzQhfnTHPDKGkJr4pUkUT5TtWk1OSgOCxSte0EAiA7mNPxh4PutZhNzg7f/8s23z15+dffhg7W1TqPVjqKImKIUBWM50uXzvboi8qT0xK7vcC53t8dTbG5hTDR5zxqZL8L5ru0LMlekrSvv/JFuthoQ1vYnMsmtYvbQUqaNgSbqX1ypTO9wjTzoVzo9tcB5EaYLWlwvVCUfIGEJLkBSNN0w3PY9Nw4bjbjdaq0fnjTO+93RaO64kyTJUTkT0GCW009zJIzqRKAOe2OKidttIU0Q2tDpgkK1/ipUQb0oECsp19Mwu8xCTXwzRSq10aAeGoEu+Cf2p0uj3eqYK00kFjoeSO9taby86pnJv7hrNuVY9MkrvQT0FH3fhzoZF5QtiK5ZlsV4MknzPAj8k9OT9++3//nDDzdu3Lhz+9b16/ud9c2dvf319Y3ScbMsDUA01gfwIqLWnk8ADi45XnGrwmfR7DQUbMgD5R/ycqCE1HA1cXBJZ9YDKEYeLTP9wPdW0kdUS8WVfqbFhUJpWnDCeFNG3QR6RBtxfpYtpRPUYXs11i7q4OoMEx4Ni5RqgG7SFIKvKHxrjXiVzL2NOlZDu1Uvqo6+DQAWmZCL35E/5GqlRRLpkmyhfsF+vXDxzZmqykHxJfqZekjtwjb9eLL0K++X0iOsIaukhisFh3oMgVlAmqJWSIufrIVb0TxFKz9aMP28c8qOdFyU0AvMTsV8nkCL+bKczWaj4XA8Gk3Gw+7pyfnFRa/b7Z6fT8bjD4dH5/3L0Wg4m89d14fEIDK9KTdI3QVprrOFc3iMq9PUUvx2xUechrJCG/rFIjW0QrK9YnerTWf8MFImAyTWl/R/l8KuynWXX6Cwjqrrk1EIjmgoxgEwHYjVG3hAeYjCYGuj8+zhwxfPnz9/8eL2g0eb21tlWTYaDUgeBiFI0VDT148xRfkf0+2GX4Domp6K9KSgwhGV8+IYk4ljKTY010DWVtsvtHKhofxV71zxc36npozWVtvnZnbIXNPPeF0Rq371BYc42emhJIZRzjC0zOWwUO+afGcXus+jvp7jlmEcbu1ulKUfhgAd19rO9z+Enns+mRaF73pxkqQB/joDcAgaNGpN1GkfXl/hYLD5oV4jlduoS+y0W6+yPeC+yxWX4+g68r4kY7jc5frYyEugKFd3DmNTUo+Yc1zEVtks9YinfIjldcncLV4xnW3jeiF2m4kiBTkMInkWeQ5lnFmRu0WKbayDMLi46AdBMJ/PZ/Okd94/651/+HC0sd65fn3/4MbN/f1r2zu7zWazs76ZeH4ErFEvSZM4ho72kQOqQE5ZhmGIPj36WEitJG3S6sho4FBBQaqzPGVsiEQKl576mFD9GOU/FRo0AXMt2oq6QaghBIKKYLmSqCWJIrV3uhM0ioPWJgxbdCJLfblYnXMj2IlipZqXqy+Qoc/pXxH2psYbdPGJrrZqF5XbxtLVFAy9JV/WdMGrvrNAqZVWOR5D7LQYnpr8acCJDjiZj/gEKa+r+Yz0EZO8GQziW/rArA6dKqajqkzVEdJxmGwhQxqdjeHJSj1uv5KpE1TCofBwEXLzPQ/4nUhwAAgHcsrldDJJkmQ2m85m8/Fk3D07O/7w4fKiPxyNeufnF5eX09ns7ORkMBrNE6gkhMgXQkHYYp57HlQPYueYwEP2KZFRSYLY0KF1zpCRvHXpxUzEasB8Dy8EmKxZcVWCkW+bJfSKTzK6OBBCokpN2CIRyBf6yoqUpp06q/ig9GyCUqg+FUU0QMUyppsSTsTi6DjyoigCTdF2g6bQVjNeazbv3br17NnTZy+/unHnbqvd9n2Q2iL1UewxAZozHqQVr2CKmviria1UQjO8SJjgkQlKiQVPxZ70CJg2rTrLXVttv9RcSRyw0WAl5rgUFi5550u4M2tAWNuf10SZE7d5w/cFeGOgaJG45JLPcFG8aROxqntVDjjod0PBBiy9rgt90PfDsL3mNZrR5nYzDOJ//viqf5lcjoo09RwXAIvrOWnmwC8cq2e9OTzYM3lCpndEhRRINEVdAChEUriaSQNCdMYU8FoR9bYTcuqd6okLL7lKydNAhEPDEjXKbSoPhjKlGqwuXkqmXypeI/W3sGuBwHPFLxR5QjvwC2A9kX+jT0rtIS/KwXB0ORh1u/0wDDdfv93d+WFne+Pg+v7+/vVr169vbO60261Gs+16UNkIqolJEkaxC6S4lCirvDow+qrch6tekA4RvuLmANhOEnVqDYTTQQrIJ7oQa8dGJaq3iEg4qTgIsUm5rbn5kvIaZbdCLRwjbvCFnocqxUDCa+pS0tNisnY6c6VDGNiJXJc4itaaFaboEv/SFMhWNqjyQ+J+rGLLq5NFCJtXphzN3isv9JhIsRx6S2M4ppVb3+d6J3WwAs4TgpOVqIbQq5i8PDiKIcxMaDNopKeCr+mFiVX9WoBQX2U1aeiG8nmWARB03RRTeclsSi3ju2fd2WwyuLyczZMP79+/fftmNp1eXF6MJtPxeDSB+FdxfjmYzRNqJkF7SJIEC6eLMkXKaA7keR2DqJ6MAfky6mR9xB1bJOlSbIOfhxVocGlMwd7VJ1mFz6ugGaVVl3zZTufa2I/XrGpy2Ca74EUyMyep0WDdoIJzOtHnBoHfbja3NtYeP7j/b99+++Lrb27de9BaWwujOABeBPFcMDGIxan43+V4bMlILa1N5ZAWV0lzzk8/hLz2ikS3lfP+5LGvrbafYO7qNfpXm0s/A6sBYW21KV+N0zSsxafqp7SrpdCVEYEQLqMQLqffLZQ68L6oRTyEtBV6ASen9F3HC8M8ijaDwIUFN/DjKP/+x6R03NF4HvhJnrtexl5fTlxB6D9ArELGqmZ5ZD0bBrFMwiFEyAk3feRiSFzP9TFdB/BJOak6NfIT8oEWOKy4LLrUSk6oBo0Ln0wJKOijXEzjLPXPWPGCwKS+HEQt0wBAs+xIZp0jeUWR+76fpuDZlk45coHd5jrO8fFpq9FoNsLd7a29vZ39a3v712/cvnN7Z2e30WyvbWy1QZIUlPSjOHKDsHQyQLHoPGnfzCr7+dhAOosQkWXkl2S6iDioRwUryighQAVDiOz0nVDhRoqD0R6xkrVZ2UEbx83Uvyn1WEGRvZLhiUdoOolZpVNW6b4g6sjtSDKqjAgsQL5lyFAEKbRTaTQ8F76sNqN2Qc+dpIjrjAfVxFZZqXSDqVyuGWF9Vlb6EVE1ZnIQsuuLAg87fVkFGKr6GWq2qtwtJk+oyIILgOHnGubA1YnIhC2lnonSWZTlfD6fT6dzSAnOLvr9y8uLy/7F6enJeDJ98+bNycmJ63vD8Rj1RefYXN6ZQPV0CkpQVPuHAKZAaSgtKapSoyqgxTCZh1ZgeOvG1jOAeQaWAUJ+qH7FPOoK49lOka7l8VTuZH4ujKYXT26VjQraKqfmOFUIEUOtDGyI3h7EwqBQ3XEA73lusxHtbW9++9WLr1++ePrs+f7tu52NLdd1ms2GU8J3UIRGaYqqCdY2XWGuDkE+X9zjhG5sFbzTS6uhJHCoUoc77bKMGgfWVtuvaTUgrO1PatUKJfbhBDZS1BRV2rOok6Z8OPblyEWCDTADTfA5K7iIeiih114GQLoJcuip5bpRs3X9YNcpJpPR+WA0HI3TIj+fzOYFEEoDpGDBboA6WOZl7gYBaPaB/ii4i8oLYBeQeJjKEWKmqAVFtK/IAhbwh+dh3oa+wHJw8icLfuWqPxnE2v5oJcPC73DAWBy3dpWknyekMMzhVQ4MkLavsn8EF4gyhV4mVTrBlQqBgFbkCAuzPHOhl4SXZ4XjpvP5nKLmk8nU9/0wDMejYeD7/YvLo5Oztfbbvd3Xt17f2NzcvH79+vrWzu7O7sbmZqvV6mxspdC2K8qdvCxyB6h0RRxHqLvo+j5ItINzhoU65AF+yn0rQGCVu0LAD5p9A4iloYZ3SN1RwQ2NZMSl17VqdkgAeapEd1SVjebmENl0o5XKbQlQvGcp8JBprKp00Aq3ruruClhYEdiskPcWt2OhwYWQzRWmbjCdz8xLdYJUHYegRTeC13tnPVvuNa/7xOgbVYFCnTw1aT3R7V3fEure0OkjjXthzyRpq3KA5oD1hnjmUdxvDb4/zXhUc0jWgeefYtaOGj/Qw0Uqvvi85HkBL5LZLM3SPM1Gk/F4Mj7vdqcXl5eXF71+/7zfPzk5uRwM+hf984uLBPrOD4D2iXl72ibIx0DH+RwY1xjOQDkoBQZMw1I8Mm7dyam8SpIWedPmPlSZUj35VNCgBQsXwJg1+fwCqyQG5R7xOQV9nErj3KXRHwvH6klcFrfTlylnG3gBhYropqVxo/BNHIE6DPAjgqZTlnEUbXTWdjbXXz5/9u9//euDR0929w+a7TXf86JGA1pQUCIR2RRcOrjEzC2nKtll0EergwotYn1aBhEa6KeWY0XSkYl03FONCWv7Ta38WGOJn/3lz8pqQFjbn9Eqj6spBeSeDQazWfkKq+DK3oj4DjX7/vi8oHuOYfC29EB+VEVzQem7KJ0sCEvfc3545YRhdjmep2kcg+4oLJqgs1C4hZNjEkg5k4oCpM5BqwWQuozwgyqHYWkiWjHYal9gCeMEQ+gTPCSL4MSKPkvHrxIIlwU/XD24SjVkEZcuS8QpD584eURZJCXNJEkJNrKXEwQBgm0jVFj4XpplaZ6Pp7Pueb973j8968WNeGd7a293d2d769q1a7u7u/vXDza2dzudThQ3Zo7barXKspzPZr4fuPpy2Yw34Ct+1Fm3OIT2O1QbCcPqY9BdaYGq0SIpGuUfay1+KYNhbnU70Y2JOI0pLEYlNVOgWx3RkmhVr/nM8C2CMVpAAtMCOo9tnrilZGN5gpxx0Ao0nM6lU61m9irpO70v1TeDAwpMu11I+hlZF91InhNLlLkyOxXiHOrWVS3mcRDwDtMbpFOh1D7JaVjXUl1Ki1hguf1MB6Uzt+4XpQtSifWYwRPb/MlGVE26DbgykJK0ituZA708LYrL/kWWpuPh4LzfPz46/PDu/XQyOT47611czKeT/sVFkmWXUC44hScuS2lU0xSqAWELaUq4b4aqv5TllnJEnutCr3mW6arAOUHuZRghB8BM4ObUrNeLJYK/Sk61YpUliHeuNFbEGcn/VmCqAbScTLPPSCJYtcyJwBzBujAMgiCgQoMoina2tm7f2H/29Mm33/3lydOn29euh3ETOktgOIzSeAyjVy1wRE+3us/bgyi7z+u/dcpUNU8SBZlSZkZvgKZvsYnaavutzP0pAO8LRYM1IKztz25L8hj4ltWRgl09mShhggsbt0S3xc5M3d7ivl2oWIMUVq4YnOAI+n4KfZ2CLc8rwsCNoqDRiN69990zKLXJ0tk8ybI8DD1IC2ZYNec6eQY5KARLQHekI1QSFUBXI16oCM2aAhmzVusUgnVadid0WZBTcUivYpIu9h4wY8u/tj82gXD9Tcq6LAo/CDkZ86nhU8m9VA+QPXmEhKYskxlKlI3x4Z2i9HwY4SSBzfpeGkXQi3AynU6mc9/3j05O1zsf1tfauzvbezvbB6g/c+/Bg53dPT+MsjSJG03fAzcahYTULcAhcdXN2cKElQTAR0xvDZEhwRU6NTxFDAtQIhtxIOiDolaNKEMlrEhUZJPO1Y3sFi4yfahuIO38IYmUWWJaNEYAQvM0Kawony/h+DIO1DBSo0fu244v6EBkddzS7TC/1CKaakhHh2EpkdB3uH5S63NA5MZQRjlapKRM9C4gt6ePUPH2VIsTcYR8H6vzYlaoeR44bahVIGmOUNsBXUb1HBmP337eFuyKZArzMGXelTv4qafPcQoswQVeNEI4zOklwFHI8yRJRsPhaDS67Pc/fHh3fn7+7u3b4+OTJM16FxfT+WwyHs2TxPP9/vl5UZRBAL3+8NEuszSluugccCe8yPIcMR+XyKp4FyW4GI/YU4oRs5T/UpdHxv8mgajpHlX2QSVt+5uYxO10NCoDRoGdJXvmnrK6GwqDQnO9eIv2zaYNfkhpvRJBdQDd5JFJEQTNONra2Lh969Z3333z9Pnzu/cf7l7bj5EDH0VRSUsVMu1p/JcCQg6zqDlBPQ9CocrwnGleolyl5HHzMbNmzLIwX40Da6vtV7UaENb2ZzfpCrD7JXEIe2w6XM+5CqXeCabYL/oLKg8hkhUin7ZoSPcCRQuV5AlCz3H81trG/k03DPPAL9bWglbz5KzX7Z33stxrNpMscTM4riRJlBRKCZ31UNqd0IVbIEJkQQG1Upssh0q58WHIBIj6hU6VKJ9DOfsEnCy39SNB9NUf81gzD3Txp4JoJBFp5XDRHURMw3Qy/glma7QwKehoLsAbzUpShTR+jPkKxZzMcnCYyrLM0gxLAr0kTZM0wcJDdz5PgiCI43A8HnfD8KzX625vfzg8Prh+3Ov1IG24u9dstbd2tuNmq9FohFEzSeaNZhMOyfddqN4poyhK0xT4w0GoOkQTrdRxEIiq3MgKV1EMJr1A0pnqyeYhmkVvuihL6L6ILjiUEoEeLbHUCA6pqjXCpUYCVmQOORNIY8kUTaZEYrrIJN+gSJYvGX+iX5jvrqKMIq6Uzh9cIyAwYu4IkuXqstHxKZ1NYm+q9K96SLMs0wRIzLGLoA/UruEP9QuX0mH4QrFti1yJCUNHdZHJEGQ3yFypM4Vf4cSSq8PIQSeWDsxiGdDsQ569ZorSi2oy2CSC8OrSzWl/ZeE+YNPXssDkHuX36Bmh/pzEAq3QQUmBSWVWy9Lz/TxNixzKayejUZbnZZ4nWTafzUeDQeB6g8Hg5PT47bt3h4cfej3oItG/uEyS9PyiP08S0pVBYinkEouimM5mURRRGwnfB051lueBB6EumGFMrxSlGEznxkzdyrQiufyszsKMUYpQqP/xm1q9pUIK5de/HBDaXHdDkBRfkCenSJ4Q5rMnQyZ4yLpZ65iJZclpfxHKpFgPvU8qyp7rNZtNpNN7cRQWRdFqNm/vX7t35+bTZ8+fvnx5887dzvpmEIaklgx96vHnkCksfU7PVsyAcFpaDJvXnB0rY9FbMpxnrpIqRzbPh1mo64RgbbX9NlYDwtpqs2yp3r1ct1UUXnEy1Sc60g//xaSC7mzPkOmqfYoAOP7XhxbBTuQ6QRjFrVYYNxubW5u7m29ev948aUfvT84HkzgPpkkO9Cpw2iCvRdivoIwEJRBQa5Lrtip6kmLf9EI59AvMUEt4hpMtlpLEp3GrKp9W+T8arjGnrno5KEdR8UQ48WSoR0qTgeu7ZF9qhp7aRTERd9O6wXHA2RU/Ic+Yxg69KDo28MwK10XZV5WATdIszfI0zc96/W6vf3Ta3Vzv7O7ubm9v7+5ub+1sb2xurm9ux3Ezz9Z8P5g7TrPZLpxyPgPtREoUobtfum6uClORqgepG+4lduUNxeVk0F2aAAZjCupwgBvTnpvyLwXwlqDbPAu6wZ1qMyAztawSwY+F4pdqaVOdptHBEvxV5UXl1qEx1klu2yXUbzEuUOxWHhfJrFu43youuMw2WAwAdTu6y0luVgLX+lcNonbH9XskZ6L3rjUueTv8h3lHb7JCFNVX2fl5pi40XoiS7mrNAqUEnWobmEN3B9XaFHuf5lk2m06pCUr/ol9k2WwC5YEX5+e90+5sPn9/+OHw5CiZz8+63el8NhgMptO56zqz+Zw6R8BjhcowxDJ1HCdJ5thaAvZLB5ZAl0IzZBgSKKr5XpHcl7eMLlYzp2khRiVGwxQJO9ltv1j65882oQJlVzmKi8hgiJPvnDm37pNF/K9+rmZNhsU8M+OEAAuChy1wsFMExLKCIIyjIArDVhzduLb34smjp8+f3Xn4+Na9+612Bz+P4IuYGNTNRq+MSHFiVjyVmiKuBNt4SMyTaBLd9IHKCi+yvsViW1tttf3KVgPC2mojq6Kg5cQzk7PgCKwhVTLFRTihlp+7IrpJVNHSB/VvImtl8DXfK0rHj+LtMPKbrfWtzc7W1uG7t812+/3h2cXFpTuaTIHA5iRZ5iROgeoSlFxiT4hcP8wsyfTn0j6CJCgp6gm18ptmnDKqtMQbtONB3dXcn+pLSZUQ+o/qSKiciqqjZnrZ68FT4yzRoGBSkTKKGQ6xXQv/ksemi5U4WalaumnFIIVnFEKm3Jryryn94rjebJbkoLrvXFwOzi+HzThe77S3trbWO2s7O9v7+7u7u3tr6xvXD2521jc8P0iSJIpipP6itIxJWqqbCUoC0R+DCwEHCXCXW6jxyCyqOxgIpD9yAf6pYWO+nA0Iq6r6SHeUF11JJWmIaCICOArMHRXVifY7kIZUrq+KmMgcoIB4EkrZp6Pz21o7UbTBIDlZfnL5V3YLGdqwALHmHaaDWiS3xXJiG2FqXq7KQLEkkugHYyFT4qla8A8FgeSZCkD408mLFUyvycOMBumSU1CHO/ip5BsJ+bqukyZZmlFL+DzLQC0mhcz4YHA5HA5HgyF2ku93T896vfPZfHZ8djIYj9I0mU6nrucPBgPKNFLGDzaDqI+6C1L4A+IsqhWCChxQSpYzohwcsqkA5sGtnPJVbAUD4KsZxqsnq58vzcpQ3zRQReUYFviR3115kc1NUjkaSw1MpOYqBw/TBbY4oqyv63pBCCSU0HPXGo1ru9vXd3ce3rv7zXff3bx7v729017b8IMgDIIoBqIEAEgfWOhIMjBhi6W5QVV2SzMJv8cUVp7kLUKNZsqbItuF1dI0Q/1YfLW22mr7WVYDwtpqA2MHTEITrsownp/+tkaHyoPkdU7HMFUTClOKpnkwvJAvHgJ7ukCpQRXBMs/KInc9f317J2g23TCM2i0nilLXdwOvcL0oTkejCTiXnofdukq39EvsS59jS/uyRAKY7QcKuMtpQzMMev0WByVOerHEy7Q0r/g3yxX8lzhWYsjpRdVPMlDcMEytIVQ0UQ2qSGZB41SGcuof0xYZigM1IqJqMRmDB2KTm2c5SPII6AUJ3AL82iiKCW8it9MBpRmqz3GzJJ37ng+t7ZMsCIPL0ah/cdmIoo31zuGH7bW19s7OzrVr7zY21re2d5pra2ud9SiOwwA6PhelE/iBF0Cj7Sb+CW0qo8hFhRtCVmEUgfCj62IJEByVDzKPkHXxUPiRD3jRxaSLjr3cII2a5wX5eapdNefeBIyqNB7UZXFqVDW1lJuqmxon/o51rRhuWbq25nLTtxFqy0fMdCjTPFKD5jVDlYiXipzJsFJEa+iFVZQoj2LxO/w7I/6p+QFWFmTZXc2O+uITv8j2pDuW+3aoK4hFnkt3wZV+WQZFd4pJiEq5OXaghEYCiL3Qm4doBdXgFdjRlFJ2nu9nKTT9831/Npvl0Oe9yArIkGPVaysv8tFg4JVFmqTD4XAMrSMuz/uXbw8/nJ11x5PJCKDhMM3yi8uL2WxWlMV0PsemFADzKMHo+z62FcyiENiJJCjKZyESeWaO0mNYspbpwvAqRKWSTHKYDKVZTlNm3lCVomIX8vZeta+fY3q2YZKF71OJsnUSVqiA4k+2ZE6VFaG/rEZN00RltI7gZaEZDVEYeb7vuG4UQuVzEPjra2uh596+cf3+vbvPnjy59/Dhwa07G1vbrVYriCLPAwkZ3w8cF+YW3/NhNlwhKKpXSbqJDVzV9YNG18c8XBzfE+/osJB6OvkCy9BMbbXV9htZDQhrq80ygf2M7qjAgLqBEjYLszChppkJOpPwH3EltRzKZXvXwIlSQdiRAD08xy39IHLdoNleazTbYdxY3+zEbz/0epegJXNZJmmKWAIj7inwu1T1FNAMYXuqb9gCIluyyorALZOv5JctsIEZRFQoUJnJysYX49VSAsRZCQKFayCQIiVxLJSod0StkbXinvYC7YGtHomE5ib4TE3g1NlquhVsXuBb+Jz4ukRKVfuFY8CyQsLz6A/5qZ+m2Xw+9z3vYjjsXlyGQbDWbq93Os1GY2NjY2d3p7O+vtbptNvtzvp6A7Tdw0arGYRRsxGjT+a2W20gboG6QwyHmsypP6C+FirDA8enNT+WEsyMT0wFlqWDW5UXl8fKIPzFRErFheefSeF7ESUxAQh1d5EqjIFgsuBWYbsKINQfWYdWTehx9k1oFBq9mWWAkJVUZPCCG5lUXiw8wFWwuUykyv6KIZ7qMddMOiY+m1pBah+31OykLmbgSh84BUWZg/4NTQUwhjAXlJ7rQ6Ve7gS+B13+SvhNXuRlUc6mY6Lmnvd6dDePJtM8TWbT6TzNBpeX/V43TdLLi8uLy0toLn9+PhiNp9BKfuy4znA0SpPU89zJbJYB27OExi14tinpLznOLEnxAAEM0rGr0kTd/4AK56zZSI6GfIoFoVm9Je5fuvfULck5YPl021MYIils5PNpqcKfajaVwWIIW3uTOzXsBnMjWBOmplTqUJYC1Yg2feuXcPXhHgA8B0qigQ80UD/wAQ1ubazfOth/9uTxg0dP7j98uLm9s7a5FYVREPiuBxgStkazH8rhXoHGOP9v6jgFU4ZLFqzlVS+fuvm8IYDrS6kfOv0Dc/611Vbbb2A1IKytttVm07yUGBqT3Didhl+QyqILmQv2ST9SEq961mOJnqocwt0g5Cg765txI4riRhjF7fVOa63z4f3x6WnPdd3xeJznAAvLsgjDyMvzzMmw8qOU2QbmlLLZVf/WSav0CfnEFeYrD4jF4lMbrIzDUkd5ySgsS56KRM2y4eLcjcKmC5tc4t4J548zt8qJkldbO+QiXaMdGPUVlaIANEb84ZJqR1VSAH3cLE0930+SADsQeLPZbDKbu8AC7YWNOPT9ZhyvtVvQt7DTabXba5AtXNve2Gy3281ma2trq9Vueb4/Wes0mi3P96C1YRxDY2g9ZvQCkij4Qh2wvpeIacq97Dl1os/LXDhMH6nywMpVurraSr0QEkok2SE7fOI7qM9JH2lAaMNsK4285CNDEEUUITeo+r8vaVVvUrtC2pSO0OiOar4r59nMBhf2ZdCvBrhLCo+XyjwK4G2uns5601xB9/LiXWs2IpAAARr1Aj5DESktLkLbIRWZokxAxhMRIHaNhxxdlmXJfJYkSTKfD4fDJJnnWTYeTyaT8XQ8GQwGo9G4f35+cXGZZOlgMBxPxllRDsfjJMuyeVLAVBMOBkOQRg6C2XwG+UjQxoJTLAqAojRAABQRtVDkhKY1Ogsj2SqePitVKxCcGjOerqyBJC1LhQZ1+rAaOeKkob7XfwEd9GNmAz8dELGO21BX+TyWQMfKzxSh3VbW1Z8ozTO9CXhUfB8Ts/CVOAo3YIJp7+/uPnr04P69u7du37lx78HW9jbKzLRgJgkCZBmAsA2JnKmml8sSdKYcUzNQCmq1oh8ia1q3FIONTBtFXEg9d7HlKY/Vr3FNaquttpVWA8Laaltui9BNLG8i8qzKODRMVBLbJodg2qZrHiMv4VcscUwbU1p/sJwXrlOGQdRZ2zq46QRRs72+1exsrG+dtjvtbrc/GAwu+heeF6cpUgeRRArIAVqi517h5hgSx3PTHpjrFqi4yD2vhbKI8ZM0FrJKzhZ9NYzxa2ddYMVKtdsy5g/50EwxrBSPVCuF0OuxuHrC/zNN6pn9W5GW4M3wG8TPUgfJ6SW1NSjqkx6ayHWRiKsD3hPC7MCPwDnXkqTExixAOzFJ0hRwvue5o7Hve2EQeENQ/Iuj6KLZDPyg1Wo2m40oDNfW1jbXNxqNeKOzvr6x0Ww2O+uduNFstlprnfVmI15rr4VRFDUaURznk0moeaSYIi6Ibkr8UsrDhEGYZikIDAYBySsGQOFLCe6qMAciNCrawr6LVO+Eaof6kpDWiNK80a59oTmNVL9HMRLIL/A1wn9hpdGpNtUDDZLgykfk4IKVnxfVpEpQU6N3/kgVInJajzBVZYP6FQUD6NJ6UAOsvqMGAVxSr5KeVqdPjVusSkCZWdY7RflKJPuR5qo+DCwWtDKQauiUVC+yDXCglCSpl2cp5ZszfKawKymSJ/FQ9eCD3iloyWLuzfW8+WxWwC3nTScTkFQFfVfIxWV5FsdxnudTuFu8Is/Ho3GazLI0G43H49ElNJCfTPoXg/F4nCTJZDK9vLiczeeXl5eT6TQvisvLyzm06CwnSh4G0o8qMeXBBvM8j6Ioy7MsxX1l8H8kiaRYoGKGIWxv8j86wKTOEbtoQs2bpnFyMpTT2rqppmpzgv+jJx0/MsRTi/CvJg8TvJBZ1o+Yvn2WaFrZX1s6qTOTE1jpFd6DRHQsB8UiSSg3iqOnvwy4Gg8e+SNmqQGqMJCHMfnvOAHS59vtNt2HURi6TnltZ+fOrVv37ty6ffv2wc2b12/cWN/caq91fCAjgOgoEER93w98vOl8UiS2YmXLzl0pP+koiY6JMFNA8UzEsGOCUKZtdamtnkKMMpDOLtbyorXV9ttaDQhrq225rVp8TLWU9hE0CDH1bfg9s6oZ8oyorVpejUGmxTlwoYQvBr6fu1geVgS+F/gQ9I03N7e2Nre7N3vXDw4/fDjs9Xrv3r7r9/pRXIzH0yzNojgCnz7DkG0BTSjImSO6K7kOhQc+Gznay89avLWYHRJOPOVdSF1GEpo029YU6lRC9ho/mz8sDY9l46Oi0CJpoHiJUMCCvv7iSfARc3sNcX66A6PgkVb8ENuB47MX/6A2qb58KQFRJHEhnxNc+cLDsDviR3B8sxyKvFLEXdPZrNFseK4bX172zvu+7zcbzVazGYZBu9Vqt1pxo7HW6WxsbKx31tfaa41Wc63TAX4paAFGXhBAGwx0tBvNpuu6aQpEPiiExCwmCuAABgNSoRo31VoORkzlciwNP1apYXeU3yHhQfxM3aikNIMvkPsn+ZU60WzFGkQpIKWv7WJdo+kimiKqBA+J0qociHW1FQJkWSIF9E0DDX1pie+8jJcoFEcrl/kKh5S/qcdHZ6wXU+jyhQgxcSktRBLo4uSUbC7KrMjw2YfSVXhmkRUMqD6FXJ9OvhWT0ZCegsvBEBvJZ7MkzfM0SRJAg9PJaDgoS2c0AHOccjQaDQbDvChH49F0Oi+ydD6H5hDD0Wg6nTlOOZ5MqDJ5MgMciHRQFIgpIc1IJ5JlKT3xcywdpIbynDDSF8SgfR12MSxcnh+4GyQ9pfJhkz1zls0JxNknuKGSptwkVTUgkZOwoMJ/Ghq0rt0iJryivM1OCGsxFdGHXd5AJojG7xj1Yx0uE+JP1l7wscIWttBlnhjmdJ80oddNeLC/9/zJk6dPH9+9e29je3tre6e9seEHUSOOgzBsxDHMSupKIdeBL9MKM0Ru6jqor6NYJKlnkcmDyydOrA6Els2pc47cyhvXVlttv6XVgLC22j5ilaIV5oGa6LYtUKpdXpGM4opDEmmjBt6rfQhePz3Xx5YBLqQGcihPSxNI9fh+2/d8JBh2dnev3bhxcP3g4OzsbHd3592bd71ez3XOR+Ox70cpNI9OQjeASiLMF6keXzpTQTkH6W+JzJ4CRRWthQU0CP9BgEDaD9z5UPkuuEODEhl4Xu2KfcRRM/Fm6d25BeRRq4F8k49dtlGTyl36vtyj5Hox5cxkOMxFJyEbxKcFtPvDvCFQSrGPY4G6C1kB6Y4sz+dJgv6bP5vPIfDvg8IfzM4BKMJ7EN0PGnEchkGz0Ww0m+1WG2lfLRSjWd/a2myvrcWNRmdzo9VqeZ4XTxpRFEF4H0qHQByCx4juZqKXQlRCe+0QmGdaqenqV5HHlHeoGVu3+kLVvcnv8M+EtAf9T7vaJjlS+W6lJwS/Jd+0fXT1PVmAtBAgMEf029inbFfjG0p10awgmwdQR1GEgXjbYAGe67jEwJwVRZokkJJL0wwaQkzms3maZuPxaD6fJ/PZYDicjEez2XQynV4OhpPxeDqdzebJaDRKknnpAM98Pk/iOJ7O5lmWeySB6TiT0TgvoNngeDzJYNJwcsyGU0oTAgoQx1BzCD/aKl1OZEER1qFcqGolzyrAVUBkvs8MAB5INT9JYKU/VMhBgD0FRFWAx2xa/vAncUSX3/9c2qeqHz+yBZn9ZqZ7JQRnndayN2nR0fk09UUVf9Gbx0c+IJ4wTCNFEQXB5vr604cPHj988OTJk/sPH2xsbZee11lfD6NG4PuNZtNzXT/wvRKErAhJcuZ86RmpSgkVs2EaLyf3NKVXFwhqNrR4x9qaOkObWFtbbbX9S60GhLXV9lGzE0EcnVUvxHe0e21oSKahnvoaNjvHPtf0N+/j6n3r5APXhkDLYMdpNtohtClsxXFjd293c2uj2Wp2T8+i6O35+cVoNC6LMmg2p7Mp+vzAHXVc0CRkfMT0TuXWWVVYziITjw5GNiFETw8oS0pWxQyIripRmvOQniT5k4qbsbRQcLExXeVTbRKnWQ6M1GPgFmAyy2lE4Tn3xP27lSfKV5CgFMvyU8sDlWlVEXDUe1SSs/Rd1GyhsfIDmGyLosAWz9A60sMcGzjcSGHL8mIGyBBIwuCWgYsWkGsWgdwfKL/HcQyw2/dbzVYMEDHsrK2tr683W83Nzc2dnZ1Op7O5tdlqr7Xb7Uaz4TpOs9X0/SCKoyiMxuNxGAbQIL0sms1WUebIYoUD8wMfmK4oPpGlGbQewwbl1IqabgPITdn6pSYdJ8ZzscED5xkkaFt1ZW22mL2dqz76hBfc5WLhoyWdDH+WUZEcdKg3/d8hk0aqnlTYSc0fqJMnlSYq+igeITVkJ/SF6UFI2XmuO53OkSDqzGbzLM/TNCndIE2S4eDSd5w0mQ8Gl6PL/uDy8nIwwDYQvfF0Np/Px5NJXpTTCWA/SA+Ox8QfTiB5CAgTlUhhUgJBXcWoVG/iFcdsNtKP8ywLUSYUuwiW0FMQKwY5WUSPbAEEd8ND1nlyo9YkZodqkZ8MNtloRFbG8bQqJyV5CB/Be58OCK+K2unZgytRKx9VwKQuXXQ8xyPCpC7xtrZpNMk0GCb05ZVKBxhZuHDi1NQRC2uBluyB9FQrjCJ4nOM4y7LAc7e3dq/v7T57+vTZ0ycPHz++dv2gvb7ebLcbcQOaEbqQTgx8n5YoePwxjLT0+Kujp5Y1O+1vEn2O/I74skn38ubkZnXCcBX5trbaavutrAaEtdX2E032oecFT7khxuvVfo1ZMvFdHVgFJp/e3lU7U0ujLspQrcZdFwTEya1s+o0ojMIg3FjfJDLh2elZq9V+9eOr7tn5+Xk/TdNGDNVlRV4kSYLkQGRdan4VIRbPBaRoHCxbXnVhDCxHB3GgcdekO2GzxZw8hzTEp+g4rPp80WVfSGyafCYH4a2+VyIlaOW/uGWe8nEVy2vZTnUSiuPfaNivD7YILyjfo8+D+q0p6Vf6Mrjj2NyCugHoYSJCoIs/gRoe1wF6HnI1g+mU9h4Elz4oAboxSMzEUILYbjXgdWN9vbO3t7fWbq2vdyCB2Gm32q0oBropEMcCPwgi1w/mqAzpOm6jEYPrngDig+QkaE8Wno8qtZCS0teSdS0tF3yJ/Im8MfRvPxr3qIys/XPz4oqPPuHFKi6ovGU/enwfOXr8r6l6g1sAczjkLYMzT/CPmtEB7nIKwN5ZSmo3wMDEn6cpuPt5BoxNoHEOLymgMJnOk2Q+gXZ/ef+82zs9dcrirNvtdnt5kXV7/eF4kszmo8m4LKEjfJJAOSLkEpHzqWRoXCcD7oC5pEj+xFARFUAivkqAFwpnlc1mdMxZnhHy4ruUNZkIVVJqienclC3WjRAU0beSHF1WUCdbn5j3dX7McQoQXhYKo9bwXwHsV3JOf4rxfolBvZgklPxYA3EFoOWD5jNUsjgaKqn8JscWdZcVXmZUIS4COEzAwiulJIqhw0Yc721v37t58/nzZ89evLj34P7ewY24AYJkRD2gUacicxXPu/L+N5WBWotLFXEazifRVmX63QTMhK4vf2g1uBF89aWySrXVVttvazUgrK22n2KiWZmok2CnR38NoRCt3NWVTReCVIrZVngwTAQCLT7M0gB5lGo8aPceZJog0ZNlzUYD/n9ra3ttba291v7hnz86bjkcDIvCgX7SKDZDKSkI/6MfEwSQzRDCDQJcGTIgU4T42I2PrhhgEg/KTJAmjJUggkBGEo8GfuH3Pu6nXe3tfaSSR2xeyWvKFCL7c1VcL2i/2mfRgE4ck8lemKHANABT3QywVIKQKDyi3tFCFyrhoF12z3UTOmBs64E408OehyiFgs3ZPA/0aeg7QQg00SgM3LJsNZudztrGxnq7DS86nXans7a+AaVD7XY7ihprnY1Gs+l7fqPZiiJOF4RhCNsHYBhBAkj1eaebEKimolEeJzRMplAiNzGIugPnx3zOf5kZiuEqTcNP2op+5CntT8RPTRbWYir6f9qlJs9f5cmp4DZLnRwbNkDZH6Z9siwHIihU/82zNJvOJgDs0mw0Gs1nk+Hg8vy8PxoOu6en/X5/Np+fnZ+PxlPP80fjKabhgdLpB8FoNKLavASqDeHGozpSCDcg6lMZ/hKYh4RqsJAMvkB1iYQTSLcGPtIPDWfEdNmkIj6gNo8qSF4i8ENm2pRz1xARZNNFZ3p6FDRjvQWEnPb1ZNOIipNsFeb3leUAV88cduxIzCHUKVG2wGCmBPeEUOBoyRylNG+rrRUY62p2KJ8ALQNZnkM1OWbyoYu8H9ByFEfRxtra7tb2g7t3vvv3vz56/PjajYPNzc1Gsw3SU80m9qgMIH9bQDCCYK3sX1o5Pj3tq06BeIOYF1iXbEaTwarWy1Uv9FmoLeoVkkOlNKHIYa+tttr+pVYDwtpq+ykmMwk6a6dxlBXxVUwZu/BOZKdWdHO/Ys96jfSgPSG0pnCDyHEdrCp0qNjMdZ3N9a3AD+K44bheFDUbjdbh+8Nut0tRZFj7U0AZeZYp+iMeTYH5q5JobErCXsEcz3WgN7rS92PcaFCxRkESZCmXUW+GdkItHCgnyYo7Sn3ebs9mO+jCZTM1Qfp9K8NnAJoWsayOoXUR9XUU8nfmYPmiKddeOb7o5JidykPTo8Q5SdM9HB1fluBTp6xIg0rYE2QVQUwyz8i/BCkRqOfB1I0S8CjLzPPgNZHHSIGQOtdjThIcZdAvxdLBxkUjOgnDwG+3W2utZtwINzbWt7e2mi1oftjpbLSh18VG1ICixGZrLQr9uNEEhxLIqNDtsBHHJfQw84CfXJaB75OcI/qgcABBYF5QuAGFTBVFFpNIZeAHkCID8qxPmpPQLg+7YpJQCkJffIde4PAQo5JfcCnaT3uBjrl8R28QsDqNP7XCg7NAhUPqlEDCvDTCxKtUBFr0m5Ewqd7B8/KQXwl1vgpEIVUSRwauLBR04WHQR5iCzTzXS1No3+CUZZpmoPtSgCxnmqbz2dT1fGwFMSiKbD6bjcfjyfByMLgcDEbnl5e9bg+FQM9H40meFxeXQ2j0V5awPQjuAGwrUP3FD0Jia5PKKLSGjyJibweBT2KheLNhfaCmPtLNRkebYTUpoRrzuDB5GuqaVdjI5yAVyV/CdKJgklfJCqIyrcw4aWFQS+VYcBfNc8+1c5X8Gz/WIOKEaKWC2SpU4YWpZZWtjBTosdL4h6NB9qTEMqEqBABBFg60CSEhOmtE5vK2p+mSWKk54nPgiaBecQOKjUFhuNVqoZxV2W60PMe5uX/94b17X3311eOnj2/cvbu9s9NqNbFa3A2xzSDdtMRkoDpja9ZbOM3FC6BoL8hvoAPWbY3U0FubMKer94PrgH5PrwWUB62ZorXV9jtZDQhrq+2nm10nYbMOxRe44EwgDN03+2fWLHFJCW1SOeXIAsWoNOaQfL/d7rRa7c2N7Y0N7Dv1fu309HQ2myVpUo5h4Q1DLApCH1e1CyNwAt0tDPBT6gJ2qYz2w3QbKY2AdNaTDsawJXnMhMg/gFADiZfAYuUIsq/wqaOjKnUUC0mS0ZYIxOsUjygBIgctp3yESSAJkXw7AWr+tThu6myVx6PGQ/3esFHJsLQS9k/YA+E6QCnwpPU7nI4mIXhZUEWuuSdaVnqel6aYQJiBwzeeTC5RY6bV6q+tdaMwbINuaTuOI8gjt5uddrvTWW+11zqdThw34zhuttphFLeaTd8PXc9rNZt0e4VRrI4BzyXP1QpSFgEJB+nzKx2kH0LxKDKRSelR9WPgG5lODtxAvBn0C7gndTkuUROJnWqka1kfUr/FL6xcNwIXoT3JdE38Dt3wWhaFCgBVaEcLpfCNocrtEOcR4VoJysILPE5kVGKZLmi+wCVIoCko0DWhOyhAUCgxhSRgiiMFdX2EEseTaQFkzDRJ0mQ+m03GpeNeXvT75728KC8vBxeXA88pzvuXw/F0PBwMR6OiLEbD8RwlQJM0TSG8gxKgNK4U3wGoOaf7GjpS4DvT6ZTOKMsgJ4mFr+pFiUBX8mlTECiGCBTjMOwciDBbFQ/DnGN7+3ALStZ41cVnCKSvPT+eV/DIZaEaY3sZbVOUVFWYuPCc2rZYZbrqm1ccj0JrGCmqsJEru9YzQzVxznOBPHd5k6vks/g2U1V9nOiB8IkWBqA71Y7j2wc3v3758pt//+vTZ083drbXOp0AygwADwJoD0Jo/OhihxjF6UW8Wl3U5MHjSeLYUo9B7q5UmbzVqYvQHicGBVVUrYgGDXPh5EJQsLbaavtXWg0Ia6vt55tWDuU/qwwo/hqYeMsE21evxMv3yA6Wr5wScA5QWiBxUkzRgJfglE6z0eysre/s7mxv77zdf/v2zZtutzscDLpebzKZlE6ZJElRlNCxAOlpru8DeTTPPQQVVOmn9qjQhkqzUO8v5bEzpVKhQaP/YSQ3Rdxf1RhBhNhxVIZshaiMApDl1d3pq0zRinyrZuktzQWYA6yUMRn6L6VIjeClheKXXD59Yav7XNg96RMSpKD9Yy6gcmrU5puJdBV5d2xrCMAPUlKqmR6VaSENsCwLqCfysjSbzeau647Gk4vLIXS3D6NGHAUBqNRAdrDZWAPF2jXQommvrXfWWq1Wo9Ha3tlpNlue67da0PkQ/M4o8nzwMClQ4CvVGzcMQ7rAhYaImLuA98iJhGyVOl1IHNGFAViBX6Z+A5Ve2yqHoMmBV/ax/LjZj2T1CprYhP2Ougz23nW/TRKFIUEm7AQI3D8QXKGishQawasG8JAUzHMQA8WsYJ5DShD+StPpdJImszSZT8Cm89lkOpnNk+Si3x+Nx2XpgkAoIMZ8NJ4kaT4aDrIsQzromGAqsY+hRBgzsfgvHhkeFp0uFQzrlLWdSgWhKVQMIkUcfqa0iq9hh3IUChWGOImn9GL0d6i74tUmHg+VG9RAkT5VT4Shp2qURLhdPrOVu0JRERf3uOQRrKLBhVtLyN5UfysViVZWrlob10E8swl9YDxn4nb1xCdBNSb/AQZil9fAB+ngHFVnAQpGYDtbW1+9ePn0yZPHT58+ePJ4a3s7LfJG3KAkcIBqQNCkFNPX+sIZQu/yC0QkFx0vKTDkoWIr2DDQnAhSHkz+Vp+3YUzILS8M55L3aquttn+tfYK2Q2211fYxW+U+2j6ByuvoBk3V8vnK2vmJiyQ7U+h3gkeYZqAfSJWB8/m8d9477/WODo9ev3p1cnJ6eHh4ObgcDgagQVqC25qm8MM59DzA7mckBoqEMUo5cFiahO/pGHUpHBNlleiDODCuFWQvj/6kvIhKi+kEjnVO+oX+jn571WwlHRpTzEfubxXtfaoREgMfzNq6uUx8VFw4uLgRZqLqpKDgifEgcqEZZbQcI/RK1YPUoxypgIrxCE5hoPh4hP8LfIcwow9un6qUZM8PW5NRYsGLwjCMIPUXR1EQhH7gt5vN9U4ziiBn2FnvxFHUbrc7bdChabfacbMdR3EUN+B3+JMoDn0/cFw3iiMSsQjjBvAhiyJEKFgURYTpxKIoYuyHWeR5o9Eg+BtFMWVQPTx4UiGh3CMhGeCX4lcD1FzFs4MkJFQ90QvUrlQf4ZeLAl7Q7YU/h1e+eAdr9HIiyKGXDP4rkCcVLxfegRdF7nsQbsmLwsfkGH0ZziDLfKSMZllKbFJQacIzSZO0yLMwbqYpVP6FYYCtIKae72VZPplMPBAHSsfjSVlkaTqfTqeTCTQCHI/HFxfABp3PkzRNoNNDls+mgA3zAhqKJthpZjqdJphpTJELSlRhAIF5ESEdNE1TPkgadln3W8mnLdyi1YdIvaPuIgrh8EPB2EbXj6qP9KMu0Nuq/BsTEXWUQ7Uvld9hyqiutdSldpVNVWiKywgFsiUMT1lLt2bTPZbPG+LUGRK7S9FgRbSZfqHKhvFLNGNTKhuBPdz1RPUAbSfk2oJGq+dioA/YnmEUoTCV22zEZVlc29nd2965dXBw7969xy+e3757d2tnJ242IlCbiulhBByINzlSRLFi0NR5Ljc91hRW4BS7YsmavN/ibaBKijl4ZooJ1f0jhpeJM3Wvidpq+92tzhDWVtuvYBxnxYi6VYKmv6A7F2ppygVd9Z8ixUhb59wZbgYTL6pw0QUNcQgngwApNifYgi72G6cnp9tbm+8/vB9cXp6ddadTkCycTGdUy0SkICeF9IEW0DPkKFPOI2LcTIk09E59cJK+tzBa4OIYXQidIVvI6pmz+9hYGKdWH/DSXS/5DeM7ESmnywjXSQfSFWtRXx2L3EQ/Y8kQa+vsImuZTrl/u5aJRCjR9yL2JTqIquoKGmFgwo08/RIAjOBC0kaoXpF0XBUIBCiJicQCXNGycPMsg5I57C8HvQeiKHRdbzabzeYzuGGiy2azCc0MoVFFHPgeQEGQsfXjuNFqNqM4jqKo2WrFkGMMGw34MwSkCL8AtzUE71Px2ZDYNscWKah7lKC6vQ/Sl+Tp4p0DiqmYuMD+BFCShy+QcQqwE2AbFvUBvdZHuiDlPYjxWIgXHhAdAbahYieCPCDQpj6/wB+maYp9PfEFCPR4SYodPj0/SRO86B4oamLnB0zEoco/ZjuJ+QmjN4cO7NAKIplDzR6EUvoJkD6BnzmbTifjMQq9jEbDoet6gwH0hHCcYjSCpF+WpsMRdIPIsmQ+m0MDwMmUekLMpvM0g/OdzSHN6LpOmqkQDzS0xHssS1O6JWbTKaHfNFV5eYQZVBmr8oHV5KqoZiZxI/6MEp7aiVfBDjEpgUCyyACZWI51K3/8kaWnSP9yISYkH1De8KptW3PEUtC4ZONLZmDaGzUC4RaLEtgsfNlEwiol1JWkpch/mocWx1GzL1VASONMJHYi2qR6Py+MQopTQJmA5zXiuBmGezs7jx4+fPrk6b179/YOru/tX+9sbYZRFGAP0jiOMdKkUsGCm/Ep3ExdAkCUUbGgqTSgXZJNs6K+YEyoMF0HuexwcXzqBGFttX0OVgPC2mr7ta265ilXzJTj26hAi3iaJffTSHHqS1I9RYWrNaGLOGDtoO37fhOssbm5tb6xsb6+3ut12+12v9+/6F8URTktS78B5CLQL0Hmm3aGsGMeZH4wn6NJQeRtyqNhyqgeAuMfLmH6oaCBHhkDCDmUbvAdumF6qx8HhxLUXU1/EJkT6c2at1XG06RHDAuKz4Fgm+1wyp2aeiCSzlhEhDwiZitYXomnS665SktWUiDc6oQTrEb+QbMBVX0TubPYCSPF/ENeQAMSKCwC7hnEEXzfn07ndOeQ0CjIlgZABKXKVJKr8X0/CoMIiaOQgIAX4JuCAWKM4XUDE4nQECMKwwB0LMIQ9UtDQIvKAgCMmPTAgiiQzMfkpYf5EQBmivvqIzeahRxVFhHeUy9QDYWLJ50lL9yiyPkFdcukzt2u62RYgEtNPuiCQVEg3s2AMLHLAnE7SaE3wzRdlqVzAIGAAefJPAUt0HQ+nw8HF9PZdDabDceT2WwGCjFJMplMIAuf5aPRcD5PXBjqWZblge9h8R9UF1LudzoZE3tzOp2jMJKbJPCRyqpj5xjdQkURjDHzqoIFVAzMxckKbMgcjJH3VHcSf18+n0iT5ro3nfwxAiDm/nZ/LvWIZGY45VctOK4+StYt/8vsIwlAJrXrQVYtJZYWHBoqgsCE1mxvt51YcUjY05R3jhEcjKhAPh+T2/CgYFE2REziEB69rc3Np4+f3L1z+969B3fv3d3Z2wubzY3NjTCKfQ+o4MQdoKw4PliK4quJwcsPhsVZ9ayiS96phFewZB04ZDU58VmTPJg460+8ZDUirK22399qQFhbbb+OVSvZBHKQb5g8ku4BbVZOiSqUIA1/9kmLJjsnlDxhiUsILQfh+vqmj36877ntdisMwgiCySALGUfReDpxUzcIg2SeEGU0w2QFSicS75E80cI+TkpBqBCybu1OiiyQ2cAMhH3oRnnGekMGoVUalfo3q37yBioKicLlzRJXtaCQQqnyHdkmi7eAVW4gzae0W7itudmN3qxOzMpdcUJvqVpGpVmiSu4pxXylaEq5GpmC4CwOUfl0yY4Kw9OuCLdTo3OiWQKNMwzLosxLbFhCoiN4rgXQFwEjea43Hk89bEWoalSRUUnqoHScwE3F3WETM/h9GIb05TgC9Oc4ThRFDWSKhmHQaDSoqDVWL4J2q+ED4AS9U0wmBu1WG3Gm12q1wzAE7cRmO4DNep4PMNJxoa+GB+zQMgwBNOaI7rDnex6EkesBciOtHWjGHYau46RZBkRQ7LYX6ndC2JoDfE7gqZaQLcRfgU4v9oJH/qejy/8gOjJPktlslmm5F+RXp5PJeDafJUk6HA/n2CYeIOB8luUF9H9PQMV3NBqlSCudAREUhGEBEqJqC9GliSXIOSilSePD9crzPIxCkCLN4ZhzYIEqUVDqNEA9IKhboOn24YIWkhZpUY44XzsOklSShLqljV3Aac8n/Mio97UukHpuQWHIIkSIyI6hQvA7hiWoIYRK6FclQ83kSZvxPLrDK4ztK6idS02M2ArjGBBT5RcYsOovXUCppgVVY6lmJj5rfIr1+enGjJCwR9KvuvqE1qmXIDxQceygFmcchXkGEkHrGxtOke9sb7cajYOD67du3X70+MmtO3e2d3exydAadJHBaR8iL7qHBGFLwoJ8ua86d5Xlo9lXaSPTamVCBHgyhB6hHSQxJMQUJa6+uQ0kor4q6VpbbbX9TlYDwtpq+zWtEiKuLnfgECgmJPfv0igAEgKVhBFLNn5KiUWVgEqwEGU5igLE6KgbASQKG41OZ31zY3Nrc3M0Gr15/frw6GgwjC8Gl1mWxY2Y0g5UEkZENSgmBOUK7R8QRLK09VSFJOf9tJ5qlZpFjgPLNWi/T0M89XtVwidOZ0nNz2L8+YpuhAKyMsJkwU/h7Wn4TXxYbo9hEpTaazbJxGq6jxN1VOC5LBFRKTpiKRqZbhDlWpQEM0kaFeOXND2WpTFZCy4Eop4QunaI/XJM1GLqzHUBveegSIKaIJq6xkRocv1p90hBVb4y7Qp18OkduMcocR2EAe0D8hvY1MFDTQtiikJakJQPMROCtysgw8BzAnoRQJki5DCDCP7xfOitgt8M8IUHWDEkRzvQaUMoI8SRh/whStr4WLWVl8AnzRBluVg6mOWZB0m/Is1SQMtQgwuG9zzmArMMynFLqM7NctDxpK+UjpOkCbjpiDMxr45Cn4gkqQSXpGUcRK3ctZzVg+h+0qVZDiiX4o2AiBHeVD8vHVIoRSlRvJmKItHxFYXLdAYZryJcfdITsnQ+HRdjASKbxZ0SxCN5daaGP7JY0YYKb+tHVejjy+5/hTO5Ecuy51bQv/mpWfyu0ep0fplZCT09XJViSNZYMRlCUUXJg2jo8Oai48Zp1iROOhUHw3OKnWOwNYRPxX5wvwOQ830v9IN2s9mIwv1ruw8fPnz06PHt27c3d3bX1je2dnaCMGw0GpCI18JOBAvF1PpJy4c6WlPuzPlAFQpkoCtY83qWFNcBc4c0veqaBrM08Bb0BmqrrbbPxmpAWFttv6qZdvOmFbd2jwTfSpfd0Tf5PVOQo5wl/UJuf+We1UfgUuD2IVOkUoWqqAxzRZAYbDSaOzu7165dm89mN2/c+PHHH9+/f4+wcDQHntucNCqUYj7+NMvSwAf/G+q4IG9IWSmGhXK9JyfEI40UjgdL9LagHKpZY6bsRBHWLFfP1ndZOggVL61Spyde014XnEh99ei3KsvK/qtwP80vsGTLJA5MSeGSHUhSsI2TNQNVXmz8C0mUjBSVhA3nezR9V4kxKiBnp3f0iZe5iuazgr1KkFr5Ii35KBTitQyGBovYXY2xp+xn7QYozYL9BsG1pcpAc2eqx4Drp8B9JOCKEA4S0JCcxOJJqC3EThWQJMRehZpHB3Q46HCYZZQDoV5/vg/ND1GN0Uf+JGQ88ywjcmyWAqiCtCEIcZaeC83ZEaQhn1ZpJ0JaBvU8vAwFWqIwBICXQ10ikkVz6rWoW/lhxKQABRqtx8TiJyoXZAIN6pqTfIhpWk9asqJACwRtVLGZUh1SX1U3m0pMCXCEl5D1QugYGBO4y6DLook2nubo+U4037HpgOryc0zECAprOLfIfTBlgzA6pJGzeFTV6mWLWGp1cZGpyCuAoa31RRNsBViap1IOV2Uz2JamerwWoIabm5kUalw4N6ofG6yeJUToOEiYxl6X0EkIRKFC32804r2tzXazubezc+/B/Xv37t26c2dnd29ja9vx/QZQtmMH+xCCMwcpcVWIq+4ErTz80RoEnRXklhKqO6RKffLw6PmJpxfZdF5eGR0KtC5VbbXV9jlbrTJaW22/jWlsQD6KUX+RmS7tvzMdy6ydUrvFXoq10sMnHgXsDBIO6EcCQRBTFlkGwvez6ZT07g8PD48PD9+9e/f23bvBaHRycjJPs9l0AtIjjjObz6GeChMgrLVAypY5CG8QocuI1BMa1NKBBo3YMExAInYlba0K9S6p5xt3mX9sxkyWQVVonxVn9FMGTcTUIWbPUXB9GnyFlKmedPxzuyjrk3dqmMEqf0f95oU7Xomy27RZMz4aJarGCHwYVD5HqDMA0AXD6/vQ25qkPmnj1B0eROpRyFT1LscsMb1Dop2k7KIzcuodKlhy5DvA8EQcWBT0EXAjUR4Dko1ETAVhVSK5cQoXRp5aLFLPa6qBgrJAKoUCRGdKB5HZDB9puQ7P8aD5IYhzIKzCrWH7dcyjYc9AqKVUIq7adcYCQqDzYWtBpGBSp0ccGRJr8ZG9SbWLzMilZwraviOMVO/kOb0AFiiiRzwAxL2627jMaZNrLWIlAsBoEU6aRmTC3GyH0RimRukIDYNThyKs/KF9E1ZydVUgweRUXaBLpERmIaIYkoaL4rcymCJiISiUyhnFFblE/WyYnZp3+R/mK+rU1s/za+jYSBhJ4CgxcdnZQk7E8SnztcN6TxUsy4scePt4A9D4q7pc4IjCExHHMaV42604y7JGGLbW1tfbzRs3Dm5c379569b+wcH+jRt7+9db7TXSCYuimCRnIDISAFtb4UAManAI5mqzk71K90WzDcwMWjl3a9miekt9kfgqiAtU48HaavsyrAaEtdX2G5mCbgoQohdopQq1S6coXhVapEqeYHkP1wVJAumnkUhpywThQHcRSXH0KdQ2JQlVlI1Gw2Q+Oz09ffv2zdnp6Y8//nB4dDQcTS8Hl0Cey7LZPIF/MMeCiRBUv3RU020ChMrbRrRI+JDJclbl3kLbN2ZhLc5GkofG1M0FrqhmeclUhu5uYe36k+1qAl01z2h+ZTx7hnZyBFZ9X25aMPuoCaKo+rKQpn08Jr1kbg0qM9O5EUp10h2l7jq6Urx1AeZh5LCMEKELYRjQccGyolKDEBA+QciBiI6zOnRQ+u5dOj7cZlA02FD+pTqMCiBUsA3vKCHljy3vHceHrJ1p1Uj+serCp7KgcEFUvlc34+ZblGuu+IYhzGmp9bBzrImL4g08Zv6auOIagKkPVGmZwf+0I6XqSUcLI6CTL7pmFi+lctVVyprkZnEL1HqP+pJwGEQnCUWCcakwi0i/L2HxVd5TMEmn+1l/hTdlJb1XvC+fax7k6i2tE4mGcqHTTZUTUMETUobVFXo5DpcAp8Q7teRhVt2ZJJBbacwgo1kLBcPWdugTxIMk30qdYwBnUk9OiFMAZoMuMdTpJGo0sWQWSKKtOL6xf+32we6du3dv371/8+7d/YMbrXY7jBuNRhP418gmjaKI5swAes3DcVK0xSJIrFgjFlPBxF6mSJDWpzUROlllzb/n6msPT0H3mVATiL2f2mqr7QuwmjJaW22/kXE1nGleT9ps2pcQjX2lrybUHXg9Zi1OTWWsdF9fpD/RhpVjwN42Fq0gART35Xte4IHKf7PZzIscigq3ti76/evXr//wz+/7F5fYtHAwGo+dcjQtikajkYHOouMWSmiBfDp03NFFQPeUi9yYScZFhpXjU0ev4v9W3oLFDaUWosiMacUG2920/HR7KH568EvgPuNH64sjNmYcX1smgaUWFnZtaJ/VHRp1hmUVqNI7F669otmqCkT7pO30IruAnDYiGEUiQPqHlLZRDi3y+pQ0DkpyygFHHRNHbscMSOEA/42yJZjM04lL9vTRcVa7VAJI8BtVgQl40nRudEUqTANCDEOgYofKMxlvXSENTpwRBubmhBLmFQthCVWLiENgSI/6U74bqWJTtlOTspksvGtiH5Ubx5TwETOYr6689dXdQKeO21F6J6z0S03eUIdJAUl1K8rbg/PbfDMt4qIqq1tTF2iW0khYIr5KpKOK+uzkEucJ1f/U7Fa9xSU+lJTFVY+vLgkmTIjaxTBaAJc1LILkm+c6ABKFKI0tf8LnLJ4XAWjFd0Si1TZOn6rZmORX+JGkhhaYDYekXhjmWUpkZqcsQ9/rtJsHu9s3r1979PDBoydPbt29u7mzFzfXmq1WWZYNBI0oOAqtO6kXhe7UAjsg0V0RQFk2ViK9q0jb4rLina3/1fN2RW3L3GaapWJCHsslRXnKqa222j5rqwFhbbX9ZiZ4hqzSJlMKpn+fdH1kfz7J0tG5taXuyEerRBQyxAoV+HmaBr7vYtUKtl/3CwxU71+/sb6+sb29s7G5dXz0YWO98/7DYe/83HW9Vqs5nkydBDyPGXSxV3sEpxk3oppH6z54rKC4mDTgyhZqcoz+O2qZIOlMHapiYGnwZEfrzSYV0NV1MBpgWOOGr37KlVs2tMx0M+hcA1p9VMKDNFI0VrJRQ5xKrk/jB6PTQB6r8Y8ZRnGKmNGF8Lvt41aZEf190RRMjgl65qroCbdNNENs0qAIfZjVwByCqrXjGxi1WxBR+QGVAuIxKjKqb/BbpjJ7lOqCdCK9QNRHKUe6sMQmxUpCBewgBaHykwjSUB6GKJTcd54O1TSgL0rMx2CeE6l6wBrVpE2W6cS8Ihb/YY/7ygbVl32fSMuUsWQ4KsMbLAdlcKAOaXD0h+4CWQyqL6tKqEjRl2qGGe8tAqV6xFT+Vlx8AOskB0y6VcRxtWIl5srjBnV9bAXLyQpXA4OoF8GyejSL8LBgjAPNzSwgZAVEqNueoeOnm4iDUJUrwX+ZMwMog6lvFosyF0oltRCzUcbNzvCbI5ZZYE0nprgY9S+kIAISKeEogC9KYTggSAN4i6PQ8wMgiDabaZZGgb+xvr693n5w/96Th/ceP3l6cOvOxvZuZ2MzbjRQdsaHPi3QYt7B5CXcoioxiw8O5QblGKg2FssukyjqNg1UaTQqzHxGg3h7c1SAZj4imJo7x1rIOIa5cG1qq622z9ZqQFhbbb+tCdqXxgyq7F4hP1ZxtFOGzkIQF0z5naIfFC3bRg1ymZa3yk5oGQ/ipXn8EyHpiV0BgvZau9Fsbm9tbaxvrK11Li77b96+O+v2PM+/HBRpkjQaDUJxc61VCDjQK1zVCK0KVivaBv9/9t60vXEcyRqVRFG7vDv32rq6Z7n3ff//L7lfZp6Z7qrKrEzvi/b9PsABDoMASMtO27kUomeyaIkiQRAE4+CciJC6JoOKbW53ne6SSFC7ZnkXOpd0NeNOM0VTQJ/GjPlb37Li78xpxX/CkUW8UEGFWshnv5Nt5NXJ4ha5C2Hdw3w6nmzPDHxQESZaYuBkAdLNYRTgWJlAxHjpNiSNnWGILbLFkmkzaETDMzRTy5XxMKyM0ynir+yfJiGqqoiJK0DqzUplUV2gB/CN2t8qlqu1JQaD0jDjK7WTVjUvsY/6BMyJKiqInXUyT3Vi/StUt8dYFRu6zdXqarlCapClFl1T6a0iCUW6RfRJ1SbaMe6zBgrmE66GGEyiO9piw6wr2B/o5CwXixCyAoFvgpSxvbVSoe3d++BSQm7IOWM0G+HZIwidbvAAOWQneEIz5hxO8gHPKn9khbIF12EEpZpIhHA0I/DzdfO4AsUbkVuKMot6fAb1f6mVsMJpLFSZyUln1tX5dU02XVWQU4lF15tuu/3y6OCX1we//v3Xv//bf/746z9ev/up3e22W238RKWlVpUkGngVaD5QDT3osaH38KadfOeI/zrVbpwlx6zOkSkomL1KhC5Bzz9C4CDeRJxzZFsiGowW7duwCAijRXtq85Q01uHz9VHGfRL+PGFi5lkZ6OgWuM+29YteBv+AG1JvaVu9QIRs1dYrlZNjM5+rT1SFAMW+NBrNdqfT7fe7/f7g9vrgYP+3P95/+PBntVoZDAZwlBc6i4YiWFQCD3r8yt0nM2MuxPERJOmXzy/DCmC2/p+HzzLgnH0ifU12iAHSQtF3961ijwmeNn8vhS7szoPJhpucDWwePswF5thKj5aZEWhM5Ht0MLH1ZYVLm5V2MwsLUirqqlhtjYlMBCaAIpPcaB7YeIG6PpkWe7KHdbG13PCl+DJDz1Sg2WURiNMICFHJJOsbo0LLmMysB4Qw0pxw7V5XGRwKp7LM+dZgfnK1Im1TzE9sdhZbyDJD/lK/TaBrake6NKBQ8pKWwnnwGGdXzoiubAAZLOYCL3EgWxYiWPnd+SSgOwh0F65Ofl8Iw3Kf+6Sfg16zZ6OyvbnCASuVlBICnsZ2vlPHIvu1/EA+Cx6Jaga2UajqBYmNLtySjU2dmEjnflVZQ9M0XS6XSopRV7lAk1qt02oe7O28PNr/+88//p//+//+/Os/jl697e3sdzrdzXrVbLXBTid1VUyirmQdYMuZQVRlewZPGOx/ez2m2AlTsFYqJv5Wzjk2o6h5ckU0oKyVmumGcZFGTYoNgxSjRYv2rVpMKhMt2jNZRv6I2m6uH+aSTnxVsyRBPhgPhZ3d4CNns7RVWt4nKBFVuVtnz1dZE2fT2XBwc3t7e3NzpVOQ/vb7779/eP/ncDy5uRmsN9hZFSqcazyJXIt2qZ6aQ+MysoQDqD+T28OGY0EE6BBV0heXPWOOmWelTDyYOKNMbCNhEYGL/MSe1+mfYKeVTZv2AiUnan8iQby5aXlAF7xt+SwR7iI8VvpRlc6OKBkAZdw2C0qlVyfTx+dXJlwRoO1P04u4W7ITSQNmr5Usci47lPAvt3/1bIW/H8Xg3crHiA+ceLIA7biwQeff3hRDbedupxzYeZBZXJ4bd8bCbOvQOwVU7PhnJKVAicwJ7IHGsDlhvrYme26BRbD7GTUcOJQd1uJa8jeSw9L+YSG36JDcE+sCWBne5mpxHSWqrsKKtJxy7hUQNxPz8/rshkF9ECbjilcrrI/UVJplZMRdqUBZ9XlFwzadQbRaraWNVGfQrXQ6reVimdaT3f5up13/4d3bv/389j/+4z9++uVvRy/f7e0ftNptSDfSeiNNIRBN9CRZqena8jYEvKyyfFgh7HyeFRh05ruNV0aXyzX8puCRsQs0sbpgtGjfqEVAGC3aF7NMuiMjA7Msdpp4kFySzd4ZzBZIlif3QdmprZdp08ohFf5isVB1FPSPVXWK2Ww8GS8X85ub6+vryz8//PHPf/7z999/+9e/3l9e3Ww2ldFotFyu1Iq1Tq+vfm7iubRY0EQIAh8qoSD9LSRyZEp5ZAfJmm4dtKzN0v20ST5IQ0koyIylEhzyICUOi4jdQi85OTRywtTwEYxTaQChS4pI7Jd9VdjAjHIQi/b8iqAjOzQ+z05uXV+uGQjXzjkFHcasrphgUjLsbUSLpt9tPQAkKjRYUvCeeRDCoVvK2tmOfK53Uy7Uz9xAB54balTyRhZII17LyJxtNhHmiAnmtCxIi5Kdkb8SS0W+TJg/J3Pp3jcAdebNydZfxOJUoD35FQeUmBHPZo5qYy4iYrfgMXOcYu4Kqne7JChrwZUduYckK/OTn3sMlZBFhfD51QglJ0ZIaNK36hg+jGidONQuPK21bLhmKgdiWlbSiNVKIzpF6AEQ1tNU0Xz6k0ZaPz48eHXU//GnH/7+b//x93/7jx9//lt/Z7fd7uoMo9WNBntp2tCZY3UBT722YASiziJT/pbZK8oy6xLa+bHcdh3JLjrw3lnCU6qJbTEY3Y1MMyMYwnxDIiCMFu2btCgZjRbty1nmiYbcX63yzORkmWdoHEaHbGFMSCiErOD0effCVq/SCTRqiYqV0lWS62l9s6n0d3Zfvnr95s3bV6/f/PDjD2/e/PNf//rj4uLy5PRsPBrXkgQkoSrFtlqvVkuVZUSlXlciUl3eLfNXTOEyS6QYSKx8TpV/P9c/8tLz7J+sXSaxorOmvc2aF7MsiNOG93HUi77l8nBkzcm0exLSOrlhJVDM8BxAmhQOYkMzHbx/2Xml25iJwRwYk0k9pa4Yg840TvZCIfrNeDCEHOZITB7EQnvJ95gjyKWQXG9vo/D9bLOpWR02ySbhyUW9csXFZt03YltklMl2zn6TOxVLX0iIl2F2m59jC0BY0C8yDE5ejo4445jzI+L8ZyRj5jkgJRi1IIqPXa4V3ClPPdllLdLW2Ve21yzHKkSwGRzRswYWlrJmesx+XtXo9o+4OfKeuwgLN0NLfK0INJMmm4NQQqmWA7JFLtVjqkhgmi5XS50UVLlY9aTW63WOD/deHB38/NMPf/v1l59++dvL128PDl70+v31et1sNtcrVaUzqauqlSh6oUplqgm5KitwFlaSEAy8ZfeV6TS8ahspm7ICSBQF2EJI5lr5qGbLExb15UOXvW7kJ9GiRfsmLTKE0aJ9ecuyu1sfPaNQDAIxHp0pH5eHSepfkQMBbp/wS++n4lHgTbsCKEavChWqUtuK/9sojehsNBqMR6PT04///d//9cfv73/7/ffz84vb28F0Ol2vN/P5cr6Yr9dr4MPNZqPSctirQA1DVQxdr/cjBR8WpLUjk+G5vANnuymHCmXlN0Nb6QKJGdQ05AirEZoOMVIpJHkhRJLZOcxqeYEcrowhNDdBeZOZCC7/w+1n3QJwkTuT5RCtV4q4IgsT0TdZPcNStsqOQLHCYCgf9h+ZV96NrDkZzBXLHGE+m78T5xAA1SwRUA7tQp3gz/M95n9S0r3Z2AAuyTxj1Z353wjaNgcwirs2T5MSZeXp4uzbUIOJ+sNXYeYAZ3dxmhzRzbxWAkUUsoW5r+7B/4iQUdlUZ6fsI5M200oZOcJQf1I/rio3rAE8uEiuZZD3sx3BLFnieVdrW5wYM6BtTmLkAAR4aB1qPGoaUGX4RBFXyuzxuU7zWasn9WqtqplAJXzodNrLxaKW1HZ3er1u65dffvz5hx/+/o9/vPvhx8Pjl/v7R+1OR/0oSTR+TDcKNyZVlZNGZaZBQUVw/eWdbJAwNBg2UFBKGyyY5ZNiVpN8pQF2z1a+bFigJBFlxEJkA6NF+54sMoTRon15g4tm08w4FJ/DSWU1++RyjiyGZqPySM9sFdeRj2tSpiVP+owrnQJEV77Sec/Tbrff6/e73d7LV6/3D/b++c9/XlxcXlxczmbzyWReGVWWWjqF/P3VytJqrpQ/V9Nu1tok4cjKqZlFa+tnm1SAXJVHLoucX0veIes45qShw6PWwy23IKGYrmtnPVDXe3q4cXne3g2Whnf0olseLSublh1dfGer4GXqrYwfNFlb8mUci4P3pMg2fykS+2Vghqrj3M9zgy0bniXX6A1NN7FH5qsKxtF+EhZkFhU7kV85+ULoFBseNVRiIYPU7jktqypWFvLxchxfuRHgQDJ/W0wFYuw7Kj1HKRqsL+9eiflH3hh/bHhDJYsWcy4+qI0OP0y2kcSYNuMyUUqOispuUpbBxV6R1mqamDqs+0jQKXGMs34idNYuF80FOGigs8I4lUrCh9qowmuKb6smqiyEShuK9ZgkSRo6Q2ij3drd7b043v3l55//4z/+n19+/ccPP/yk0nR1+2naUCKMmlKEpqmqLK+qhhipt/qCqV3uNiSPysmAxe2zc4MtFY/Zwrn9WZ+Y7Na22CBji2WMMVsV0WC0aN+TRUAYLdpXZmKd34I/4auFYgcFnLG72IpT2y/i0v1AKTar0sqSo+jSguoMSdJerdNWq9VsNvf2D/Z293Z3d09OTz68f391fXN9fVutVaaT2XqzXiyWy8Wi2WzocEK1wK/yLiyXyLioSsOh2BwQoFaTZtW0hSeYSRClSebBrmwHw2ygncpFGAIQcjcdIQU6Q7iTpTDG0DLuPs6ZHR73AeaK78RdFr64Djc1ImOrA8ReAaHXHVBQsNMZNGTwoPhFNsxysERnpc/CU23HOHfQ+qT4wxaG89WcgjV28IvwTA389V3oIrgY7AebKMUKRjO+0m2X7Te37VLXaUaSM0pCcLxkjcD7xuIV2wVO0QnQqf4tL4LH+SWALZpkD54xsfy3aIISH2Z8siNnxvMn9LFuL5AJt5cA9ITKfnqKUDUfcrhaXAtXQ8Tly8BYs5HF2tlLMb1s9AJmHtbnVf9b6tkSKUCrNcX3bVQEYL3bbR8f7fd3um9ev/z3f/+Pv/3y66vXPxwdv+h2e+v1ut3u6MryST1t6AyiKYqS6MwxQLhKIGr50uBNEJ1qV83ApxstCTYqGwXtgkspYvAEkjZbROgPsGjRon2vFgFhtGhfh0lWJOfVGG8kIwAZb+SIdqR/ahxzE9wkuBGzyx1tkaFTYNKqaVUXeVPlsyqV9VwlEWk0Wrt7SaPRbLSaL89fHR8f//77H2enZ61m4/Z2uFgsx+PparWazlQm0kpls1Q/T1ZJfbFcaBmYWYWH96PLRpukoFa4l3kzueV92zj0BvvPoTsKL89Gc2W7qTOpWJtMK3i392MQaHHnBQ7wQIm+IMIk6UaWzLbHjg/FNoDbM+VAqIO0CuTMm6QrD05EaEAzSlPs5bJcusy3QU1EiSH4G8SlJjmq9NfB9GTxeOaumAu0N9usG5CddFgx02G2TZISzN0he2litBiNq1UyV5wLJ0eGoWfrVQRYplwvyy6zwb5BelCYq5bN62TzfWovI1dlRHZHwV8lYlGvyWE+Nrd+ZVsl5eoMnmTfENrJ28jcJ+FmmB2tutGk27QqU94x2easXe5958PEjdUKeWKqnI6SxBTmWa9UmUklalgvMSqURqKRVquVbre9WioR/PGL49Vy2WzVm43WjsKBr968ffXjjz+8fv321cvX+wfHnU630Wiq8hONRj1J1bKakosmFR3mB4BpLkebK1S2XSevKz8acO1WG6/fDchJZllBAxx5E/ic58uV2rBJI7zISqdGgWi0aN+3RUAYLdpXZJnLAjhnQjZkWKFwwOAKc73fkYxm7JFMHXGPd3peiqZ+myQ1YLckUbBNiaOajXa73Wq1d3d29/f3Dw4OhsPRx49/npycXF/fnJ1eDAajZnMxHo9V/j2dGqFaWyVJbaUTziBvH90y1sRirAr1eXldpGgh8x6ExIfCa3I5Q5kyJCuHl9ekleK3op60lcQtkfJAEOgcsSC+K4c+TfJDyEyRXdDcdFU1z+pJs9Gi3UbrNfqwIX+tQZI2B66yfS0yuSszDENnBULLXZqHIiUqvnso34Vzcp/kADdEduv8SVBu0Jb5zB6oPGNm+FVLyDjtz2OSEBx1Ljb3vGetu+vitwCchb0R3CmoNxZctN0tsG6TwTRgZ/mlxNtCAZ3RxVkyHgtiLBrU+V0NhwtGWmI8t5HOYQWGx2MCKKXhfrZsguUBxbOhcKtSTNRqDRX0p8IRK5VNPa13e41atdrb7b56dfjq1Yt3P7x7+/bHt+9+fPXqTafT67Q7jUazVqvV66lKQJo2cEbGTIoo4NI7YB8KGeMrN3TTVeihSVZkch6ZrD0yP5I5XTa15gaq0JnnGhXRYLRo37dFQBgt2ldp8iVtU+3lI+hMXezs7/wvrOpNCTG52izlUnc3Ibdcrf5iOXuVAU+5Rip9QmWzaerF7729g6Oj4/Wmcn19+enjx8vL80+fTk4+nZ2dnp6fX4zH48ViPZnOKot5tVpfLBaL+SJtpDolqQo4XK9V4YoKMiJqV3uTnV23GIpV1roXudRz2UGyy9saiWV0q0mjkPmmntyOn4t6ztK3Mv+IrBjUyz0cGeZ8buMg5+4iekzLclWiCysas52hyA8jqc3wPa7IXBi4gjJi1cl0yw7xcAwSqt5dpVpCyAK2KneMvNca8v3LTyeWD0I8lGiD2kElvJWyVCNhlXdUKCi9GLpMDZnXU/JYwXUK58FkLKj5WckiRF66KpPZbof38otNzmNlliQ47vMtd7i4TUCJSo4qcJk2x428OO9CrTrZSNht3qQ7Sjj6yuT8wfXjTL05rtTS3LxcowtVWZe1zlOlAK1Wq41G2mwk7VZz/2Dv3Q/vXr08fPvu3bt3P7589XZnZ7/d7rXbnfV61e321ApaLWk0Wygxj7IVpATV1KeS0+jEOeGbYzhr4NZqTZWgMHnI9FeIrZTJRZEaJ7tEJtEyx0Ev2FVHp8Q8NyInGC3aX8liltFo0b5Gc9CIn5LE+FuUn7lBZcoyfs0qqiiHy7t/9zZbxb66XC3XKyW21NKp5Wq5XK6Ws9l0PB5Op9PhcPDnn39++vOD4gw/nY7G07Oz8/liNR6NZvN5pVKZq6KFiiecLxZovmENda50xSGqJDRGprdCkKHeD9iQOA55CbNqC/mi786/fuYMJCPN1KfWe83/k+nSRKU/jUvVunzOS2biU1MW3P75ObBQ4ott7t82FfAc9FH0pVVFuoyTPD61vhy3uf3zTXEBpI2Cqnw1ViBSJqoGyjP3oTAoUf+bv6ps39LQQac+hPmvv1sGVW1uVOCNbD3iMSzrCwbpUo8gL8zT4sp25v717rjb1eKM9hP71PHhM0UCDepjcGM28EywoiokaJEhsK2RVup1KFTEUcmQq3q5aaPLsSoFhEofqqBgI02ritxLl8vVZrPZ39/brFeHBzuHh3s/vHv97scff/jp57fv3u3vH7Zb3U63pyhBVay+Vk8bCCzU+lAFBXW5QVS12KLEvFzmE50lLzD3DacpEn12gytZXBBhgQ/D2mYjKEcPxlrz0aL9RSwCwmjRvmoTS/VWyZT3y3U6FgOHKMyCOwi3RpbygjH47b6YUESO6XyhtaoqIqFLRygguFxWKipPzGKxmM1U9OBytRwObsej4enJxw8f3l9fXf/rn//89Ol0PJld39wulqv5fL5QSHK1WMzhwepaFyt19NV6qf6rJKoIKtOuG+poaX9OpWJAZS30AJ3VYJszD9lhTmSyGcpryXWg8AZ9dC39qtuOdf0x56T4VyFenW7183lCx3wcYp1tdwcRx2X9+NC9x5VL9bFDCAUVgw4AgBaOGNsVCNr95VFk6782Cwkgwx+WHCP/24c0o3CQ5dthRjKKrzwuIMQJdPYU1IHgepVZchIIxwGEco0ACwdFTfPWDrI/NM+Wy3Fl17YyrAfa2HksoWuwJ4DUQD2RFV1JQk9laqiuVdlVs9KkYFtFQ7okaTYbqWIFTYBfu93sdTvHR3t//9tP//n//MfPv/xycPyq293dOzhM00az2VLQL6lh8UoLRFVL1EeWD0Tq4DtLSiC+uobJTV4RC2zkFmmy/zdgzyS9tTjQAMIsXygqGOHGmcDpkOAiWrRofxGLktFo0b6l4vUyuwNf3kbNxa/03sYrMv84eWVwnG04JKct1XwJe+XW6PV0eKLKYUsSFV2D9KHr9arT6Szmi93dvZ3dvdFwuL9/+M///Z/RcPTx06fbwfDmZjiaTGabdavZUoUOV0udhlQv26uc7EvlpCkv05Szt/4ns+PQFzUL43n0Yh1AG+tlvCIRnih1UQYJqUCcaq2msxdWqxqbGs9Me8JWjZrdAqe+QEZT4BQ6ibyFndurWO9vvpNNetkOAgEXPZWg1DbKI+W3Tc/lwhfzhEwg8BB/hvNPftVoMNeHjBvMyop4eDijWOB2C3ZFp02yVULdk5AwE+rj7Dl2b0FW4TLAFHHdyKuo8BmdgCvA42LyWdrUMRwTstkoICNDB+3sRNl51iv6C8XTCRhpj5WlpUHqFZs6JuMrs9hW/Qmf6HxcMGYCcl+m8SzGrovQaLKxqsrr1OsKKKr8obpGfFVBu3ojVQLRo8ODf//3X3/56cef//bLjz/9cnD0Mmm0W81mo9mqbjbNZnuzWauCPXU1AerKPRDYoyiFFogiDrtIICruHZa7MphM+G2l4LgbtRzXx0dekKwihlBleDYHzghAk4BMvm2iRYv2F7MICKNF+7otrx2VK7iuUyW2sZMU7eFLL+VJEBfcw5COr1Kp1uupLr5VXSyWGjgpv2e1UviwnqT1uipTMRwOd3d3+v3OxdlFr9f9+Omk2by6uLxZLJeTyXSxXKZ1FVu4riUrXdcepb0UDWgAJzxGFdylFvXXWWZC61/VNJeIUCNclIqv8TsQpmskZvl6ZPcynT24QHOxonYC+rlQBsn+0f+rVWrrqlLBblUF4q4uN+1xw88kQjNtBiyR8uNsHYG7Ej2XDQJfAJh1vlSsySIoTqNFhGv+83vEen4BI2uaGwYeGQtD0lQi43wkYYmnbbpBRO2q2LZCsOwz0/ltfUizJPGIjLQ57XotV6B4AbXcifis5faz2mP3t1j1MSVhLPzLuEfOc3b3LAlnLjmMgX3mSdcMtSofr0ToKkivniqYp3SheujWarWlimBW8Awy0Vq12khVlGC1Wm2mjdVKSRL29vY36/XhXvfwcPfHd69++vnnX379+w8//rJ3cNzu9JqtbrPZTGqqtXVVjDDRB1bLR2inLjGv4q25NFCSQVTWEMzCAQDDwV3yubNRysz0lH8SbU8JKEglvRnS9luGC8a4wWjR/soWAWG0aF+1SdRnPgq5og4zY5xSkUjAfJSXZZHgyiv47iEcstE4mcunGQA4ISrOUOukEq32ShqNVq/X63Z7Zyen+/t7e3t7t7c3v//x8fT8ctQYDQaD5XJZazWVhHSl0N5K5ZnRHpuCUxr/4fokDZjvKpKmWQk5+uTWFc0QUS2gcDNytLwfm5M7ZgGdssuVi2ZUoW5yzKwb7Zkf7qNLYqrYSI3kxWYeKpHV33LMp+VWRcvDQ8I5cq4GnmR7cid1L/9rLnHmMnR5EhifyBUHuQ+3RP6h4O3Lr0fo5EDAh6HdM16uMLjQb8YjWQ57uWsQhviSwY8G3+ko26AK1PKdlvIT7H0eDfJDFIgkODRcbZYqSQxIncGYE5yWXlqO0zRU1wNEJCEknSp/aF1Viq9WK2m9rri/tHF80P31l7f/7//z7z//7W9HL97uHx7v7B/X06aqL5/UG426Wp5SfKASk6tJT9WT0OtKSIjFSqpF/YmlBNvUrPCsTaUTqkepg6vNnOawygYE2nBAoHdRbUf0qd3gzbnviIgWLdp3YhEQRov2rVneS5Tkj9QI+oUKZB0qfil+FCATgPUKEzNaqZjEkJSEISup/nOp624pz6nZbLVa7V5v7+j4+Pj4xWQ8evPmz3/99uHTyadPn05Ho+FitZnOZovF0qZ5qKrko5vaarVCBNFqhZQPK00V1nTdikqSGCdRp3fR7UHbtZ4quxjdTsYUZVE0KlBHoTnrZzIyye1A/wPBe+GcuV5kJXc24vNJsSA2c2JEi5CAECBnEacCV2QQbusGuiXFH0KBfoMytS2xlmV1oGbMD6oSkJA9n8xrav7Kk62BSiA+G/zo5tXANMShiO7LdrTpkAMBvsA++QFj1OwCuYjiMRYREv3kKWn9AGr5eE5Ya5ukRrrFRyoYOFGJQ+tawzCbKXlnPalrxXilmdZ77Ua72Tw82Pv1159+/vH1Tz///OMvfz84fp00ut1OO222a9Vqs9na6Kjpar22Xq2TegKmU88wJpj2DoGo5jFBWqJhYAIxR2U3UUzv2UpYdvPdIjcinlx2W6T/okWLVmgxqUy0aN+q2UwhIqte0YaNnbPxhi6r5rsrWRScrSJwX1+CiWcWiwUOtVgslAprvV6ulvPZbDoZzmaz0XD4/v37Pz+8f//HH+/ffxiOpqfnl4vVej6daMnWejKbKx3pSiWtgZO01FIuvSqvM7ZkGM8kTtD1MEygl8pDiALTqkafDWfS3YKwJVPFK4eyDM4NszkCBlpaDAv7JqEogSXpQtXK9VoxnjJfi01VyS531K2e1Ct3Z+X6/j1ncVKn0mcu8fUNxxHfFY9jgTitjNSXe5ENNyPA/i+MHUNgi9sckOSdTOIfDVf8X/CQhQLgEMLJAgizS8h0i1geEtfA/MAW2WbDXkT2mmo3QjCqZyXmxYQ0VD3OK/WA68Qwa81JqkdeITSddNUkglL1HmpJolKG6pQxShm+3lRazcZyqaap3d39WmXz5sXR0W7vhzcv3/3w9t3Pf3vzww+7B8ft7k6z3W22lEC0WlEC1Ho9ZVUebGj9/N1Emy0bqNethEo0mxgsGnSYWK5CESp7NQM1ZrSMrJSXRDgYLVq0EouAMFq0b9gcHkByPtaJR1gI8BI9DAQpZavL+U/yAXIGFG7rTWCFG6kU4Hkij1+1WlsuFSDE8RYK5c11tYrlYDAYj0ennz7+/ttvZyef/vd//vnx5Gy6WA4GQ5W7dLWaTKcq4Ttw1XqtMpFqv3a5RGUKVfgBmit9TuSHQD5DFeJoAKH2F2XidQ3QNE9o43MKEhyKvvX+tGiQ1SuykvdQqPGrtbqCTOBmSnSL3B+Oj50V0cg4S1zUHZN28aTu0orO7+RO+boRhts0uVLiW+OpLENB+U/NGNCwg8BImxi4rl7TuU1W52n2t4DQL8TCn2cBZmyJrGOZa6Xz6LgXBUAIABYEn7lcOPlVEGA5IYI0IBNbTGaL/KUKGWqUW1NFcVZ6PUg93aruX1WlElWJQxtpva6UojUt8kxUSQlVE6LTbnfb7Xcvj//jH7/+2z9+fadw4EG3v9vfP6qravQtLXNIkXm4riElMmyRAtWxy4VzJav8aYUpEiYjP4z6TglcuZutiyrZP3EcIZvNrRwZQGmkqqAcIw6MFi3aFhYlo9GifVHbskj8FpYtJ2eIAa4VZYqZttOeHEEoxsmXciMT+WR+BuiyTVBh5puiAEFWWV67K8i3oDK+b1S+mZpCi+tWp7terQ8Ojw4Oj4a31+9+ePc///2/1zeDTycng+FwMp5cV6rT2Wyj6xYul8tGo6H5NhX2g7oXtSSBa1tJLBYG7lpvklqi5KCVSi1R2T6t5s6mosH11moV603m2Y+AdjLoZ2PL7QmxhVR+nqNPBsWNhpTOPXMIwe8MxZBuaSwwHvzKbZuVO+LGC6fzQeeOtr1hWSGjhcEm2UUeWyAuH5zKEWMXI2RMrc1KaaklAy2hwVYLJW48pJWKG1bSoQqzEN2AGNL9wM0sIy+ThLmQ1hp5ZKaxRRVBc4l8mghs9Y/Vsg5L7UHUoJEeWqRYQZW1WGU/1kGD6st6va6yYSW6uPxOv91qHB0c/P3XX3/96acff/zx+M2bnb39Ta3e7XbTZiupVRqNlvKZaslGzzYIPrTZj6X0oHiWNIiQZW5MHY5MpGAjBlka3sBgywkyJ5hfR94KYy3f6qiNo0WLFq3UIkMYLdqXM58YehA+zDGENjcdP7HZyaX7mJMAwgsT7oXQH4EfpFOYX5m+rynR5kaJuZaL5VoXGFQUn9Z/rhTvt5jPppPxZDi8+eO3364uLj59/Pjnx0+T0fj07GwwmY3H4/lisVqvprP5SpUrVAhwqRhEhQlxOazZValWDFas1lb6vKyBltRU5CFrqZtKX3CBs1LRNo9isL6CJFuyv0A0akI2/xOt0lNnX+kqFnCRvbuYfYboI6EdxW0xDCFcSTl8cvFE25p7GzO300YpoWKcFCfzomJ6+qcxmVQlbxb/ZLyR/Jk07O5EGttjYMxzX+AQpNMUiLKI4IL60oBM55x8HFAkxuCaDDcamjAL58vAqiDaNQNqkK+m7VFSxlYBNTHA4NPM6hIAFZIGK3yrIpZNcheF+xQnWa/Xq5VKs6ESh67W6+Ojw/V63UhqrU6nndZfvDg+2Nt99/bNm9dv3rx99/L1m97ObkvjwGazVU+UzLWuFKKpihjUwPJ+AtG8DNtW7qCAl0VQ5Q3lcTXYsylweKqcUhQbZuY3j7DzKomwMFq0aOUWGcJo0b6c+W71g7BWSX4R84n6R3IF+Z2Z3NAWo9Jw0SxJZ26FzZYXrKRWYq7yUEmllKZTF3cwme9qSktZ0yn7mr1+r9PpXl5cHBwc7O3vL+bz9+/fn56dD0fjwWA4WyxGo/Fkqgrfr3SyeO3OKsUXgGWG1vSFGq9XpgQVkYKGCjX0XZZTRmRkyLnIJQl4Mm+eB7c0i3JrK0rXWtkoPZvoThkSFo4FE/cgR0UKNzr33X3uix+FaJYKnEILaJZ7tbIudrTHtOxJy5chFTGr/k80RWQoJibUxS/ztdr9pEQS1wUf7Qzy6fqiGTdok37qTyhzNGPeTCvZERyeMF/Ak9eRbUBEKv7aYHHLyETNCNYnNIUKdcShmllQwl5H06lkMTrr1KqiMsC0ms1NpdJupMd7u/s7vdevX7/98ecffvjx9Zs3vR1lnf5Okqoi83UlEG1A+p7U69CD6vA8mztnSzmmXajLJP34NB9DaBahnBssakVAUWrOyw22RNzqrNDiFq2LFi1atAgIo0X7nhFmLt+gAHIyXUHFSeOnogmli+nEElG6da9GGZmijQXKMpGqBf7aqlqrzefLJFFeV5qqEJ1Gs9nu9HZ2dnd299br1ctXLz/++edgMDo/P78dDK+ur29ubmfz+Wy+mEwmi+WyUq1oqnCVJKkKWLQ0iApZ1DzCeqUjGxWFqLReoAeTWk0zHpVaoknCnBQua75/ReF0rCxIYYMuJaWjU+/rSCeRRsMSsMZjNN1uve3COCuRSGTLW+A5rnlhbGD/3Knd+50RT5Eo/HyTuEh2plUfZqi9+I5m8CmThjrJSMhN5ZBh/vblMKE3/vK1Abkv10qyNRER+CrSU4mr4QAmOQaqLJdiiZdsdZNYUsk9pdVqUlEIsFqtJLVqUqvOFyqoT1eWVxllELWYJHqxKaml9fruTv/HN2+O9nbfvH6l+MA3b3cOjnb397vd3rqy6fe6dQUFk2arpcurJpWKLlKv9O2GGAQ5aa4rOD8wMtv0jIHKnIStJj/j5a0g2Ig9M9SXLdO5M4IpKM/1LLsOEJWi0aJFe4BFyWi0aN+hBbWj0qmgQyhpHpm/XZlMacLYnXwyA0dMeO922gw0OoOoKhM/n881y7derVaLxXw+nY5Gw+l0en11NZuOBzfXpycn5xfXFxcXl5dXq0rl8vLqdjhsNZuj8VSVMawZ9DqdzJB+ZrFQslQt11RFLHQ2QshNTQN0sTJT+U3RdyYTQ8aiAJ6ZHIZ2Yd74r6LfbP5Gi6szaZy8L0Y1SiielUnL5fswPc48GRmfmaUAcSdv4TF6gX7WDWdWIXr+JJ1sYJIDSkg9SKa5sLaEkxrxu3+/OClSMnREhCTxkkgE6bns2ZrAXSsu4SjOnJZbBBM6x2JTWR5dptgVpJ9HVOV/HqQTxe3OJaXKKHlx2dmuMiuMlpQrsTJWi9brqlo8UklYdMieCt7TkcnqW50PRtf6q1Z1chhVNKJZr6tEVavVy5cvFotFReVxStJq5WB/v9/pvDw+evXixc+//Pzy5avd/YNmt7uzt99stdJGI20oU6UjKlUFKNN6RQE/kwVHZ6DZNoOoudYc7Z6hcZmwKaN8xVqPpB8pMbDJsGyfi0k4KzZY3rJo0aJFK7bIEEaL9h2adA0lMSh2EJ6H78erXbJ8mDauzixy6+CcnIDtvo6ISNFpNhWJp+SfKtVDVWUirW9SFbeTps12u71cLnf39hW4m81++PF6OpvdXF1dXlys1uvz8/OLi8vpbHx+cXU7GI7Hk9lstt6sG43GYj7XXmSCchepyhGvEGii61BrWKZ80Jr2PhFIaNbIjDzLZsPIlVbT3F2W5CODYTmFnkvTmsuGmA0VszNYZaCTCBATbKHfad7NFjtmbBKBqdkF3wqkn/sJ0WClWkmYksekvs+ynUo8ai7Ibji5ECU75PfFdwwUSa+5vWwCS7XwkeAwFCzor8/gCGUnxQ/ETpkiwOSHcmeAgtOooS3QvrtP6A46hGLpnc23T6rRCZFYaNDOOJZE1KMN4YSqpoQ+sZaDqvlJVZOvq3oQ1cqmXq13Ou31at2o1/d7vd1u9+WLF+9+VMLQ12/e9Hd3G/2dnb19lTC0VkubTYUtk6SmM4hutJSgXq/Xqip0UGvbmTCmPF+MvBG6Ey0yJB1oE15lEaFmgqXk084iKjmqEf8KgaidkjjPZL3KQqfRokWL9iCLgDBatO8276gHFqq+iNTb3+YmkK6jRRZ0dwgSHTx5v7aJTKQqCagScqpTqAr0tdpypXCawocblQqi3e0t5vP1er27t7fZbKbj0eD2Nknqg+Hg6vJquZxfXV+fn19cXV7c3tyMJ5PJdDYYjqbT2Wg8Ho5Gs9m8Xq8rWelyVU9qy1VttVRqUhWIuFLaUbCIKiJR56fRAFXHDoFIUfUMARnz9TjshgVKtr9zGNK7aNV7VmBn67pbuVeeU8r/0oUIkmxxQoboRnpEj8mtaq5LkkimSXQ9Nyqwk7Um4J2bJP86/MkEcEl6M3jB3yv8K4vdFQkn9f8jAYr+SjHhVnOZY+SM2WoQljwzn4qv7ZY5FXWGPLX5PHdM514EbgrXQhjkZnG+vusi9FZoVHMcuAV1fBAyGJN9ji1zec5ckzVSU4Wo4gCAqOCfigjUeWl0vlCdJhSxxzVVVD5JWmnaazUbaWNvd+fw8Gh/d+fli+M37354/fbdwdFxt9ft9nfUTJPU6mla2WxarRbKIyZpWkUBiUTXKkwSlcFG3zdMC4DWJYiQ+Z/MVKDz3+iVo5qLDC2iE9ds8qY66ylIeWVSgkF4b6KU7ezBkM2IB6NFi/Z59t2+qqNFi1ZAyuVEikEfsSh1ivRXqFTKIl4eUL3eM4b/oQx9rVpRkk+dJtTkOFS6S52vc7VQQYTLxWw6my/m8/l8OByMRqPxeHRzdXV7c311eXVxcTFbbv789On65raZ1OYqN+lmNBpBNbreqLOsTMl7dXxkLNX141XJMrWHFrApPdtqZaCeVn7KXpJq0lyQlUVN8i54vS3FY67HaetT5zR7KB0n60bKUC64yGQene5VJbQFDnF4H8H0ZEfmYW1RRXCrXB4gGA6DQlnI7jtjCIMCUdO98qohf2TqWbt6oiBHQR4XICIhMjSLBRqkqyJ4NvmPGY5Om1wGKd9mmVSm6AGXDbED29S1c/aUB0SBPrPWoGEkL8/U56ypVRXDW2rIl1RrK/s0Keilew/5QpEvStWIqGxMslCFAdW6UaPRUE/jZvPicH+1Wtar1Uan16zVDvf3D3rdl0fHL16+eP3DDy9evuzv7rXand7eXrPZStJ6kiplKBqPEhTqpLqChMzuC5S4zRiwYoEsMNiVdIuJ1zJ+gIXyS3Ylkm5h6kCaIBO8TUAqgT9VHrHYYLRo0T7TIkMYLdpfwjJXT4A9v4yYzSQjRaS5OEMrW7JbUiz1GV6JoD3Mlk0cX60nFVXMXiG0daWiVuvVf1aryiZttjur5WqxXKgAwdVqNpstl8v5fD4Zj+ezyej25uriYjZf/PH+j48fP93e3l7fDmbzZbNRn+pK98vVRhc2XNXrdUPKLBao62BcW+1orXXChrVqgSqgqLsuo8YC+FmnxTd9kut8mYORfcYqcVWNM43nZzPxSNWm0fKhhQZtqh+YpBpg75i+NLvZVthp0Urm6Waas+xyjHspwKaIGyS3YSpfyDtYdGuL7/V3Y+4VZbJLpPrAv1mlABlZ50EsWZDc4X11ulqbgDR/RiZ9gjC46EH0glr9qvQO7ZkPd5V75blLEQ5nP9A0py17o54m9SyZ4WkWQCCMzI4D2YDuHDMDaA0BoFqaprbSQ6We1Bpputls2o3G0e7Ofrf3+vj47Q8//PDjTy9fvert7aXdXn93L2mkrUYzbTQU+6fJxFRzgypPTL2OsyAKEZDdPIpe2QbHsueb5QKN5NyI6qVAlMsuWWZUW3smC64UKN3kMrVJkqVk1K7ycOdsJokWLVq0z7EICKNF+2uZSPrnpRu1klEDQkwJrOxXUoFqOCiixzyMfEir4NZAqSWah1QS1Vp1sVhUV1WV2mG12dQqKp+8ihBcJfW0pqoOrtqdzkIBvEWv11utN/OD0cHB4XqzPjw+evHiw3A4OD09u74ZjEfDm+ubyWw2mc5H4/GsuqhUlJp0uVo2q01VGFEzfhpjKh6iulZYq16prqpKTaoKkakWKCYE/WaSpub8ff6/JIFMNngI5exHpGlRg03/xupo2T3qA3NwhvLhoKRqbXxfRvAZra+8Uxmxw+yF4h7Qic2BhJyPj/OIL23+/5Lgse+7ln1Ie5lbEDBoMC/olWGbLuazOMyJ7rTf6mdFcroyK8ldj18upDWjpnkVRtppvwGftwkCIXuUnLJAPwhi3GW/E5OKZcrylShqSU09U/hTxfXVVbmIeqLU3epRTxKFDLVYtJmqghB7O/23L18c7e2+e/Xq7du3b9683T9+0dnZ6+zsVJKk2WgoXWil0mq1lfpUlaZP1DOmDUmG8QhDlgnMCXLS8nHejaX4E9meRHwgr9A8IRYZZmDPrqJkleXzbK3tlUy27WTwsiGEpIvvvNvRokWLtq1FyWi0aH9Rc559Ke2TYUrBfJLCOwm7JkG5qeP93KutcMKwrg7RJLSaSkFnhZRwxvReG51ocLlazKeTyWw6ubq8GE8mt1dXnz6d3FzfXFyoXDSL1eb84nIwGtcqG1Xwfr2mmnS1WiNX4UorVzcbhQ8hmFybQt6KETBaVojlrGrO4jRwdyadCORzkpK1rmemD8x3r9fhWSpBwi/6jfa2SR+fnwmRsH9wiSV4EAJLSxoz7Uf2P6JBRhE6SwzZGBDudVCpGBwnX785Vxp8FkzFESV4tLlSTByZrdIuSEPn+AJm54q/G9Bg4njz1H2ohVlTBBKlIb9ujul35wE5EqpSJ2n3UuNhrVg3PAUKbgHUAVDiuUBeUKQJxXBCqB6C9JSGU0M1xAcqXWiaAlZ1G42lUgSsu3t7tcrmcG+312zqfKEv//bzj69fv9o/POx2d/r7B812O0mbSVpXlKDOB6MQZV0VKdWRguqwWdSyBoT31NvjWSB/aGhZzXaaPgxGafL+5jeMFoCigNzObk5gyziK0j8PXoCLFi1aNMciQxgt2l/aMpzmUUZMp0nfVIC6bJWaJhxKI3QMRivxmHcaSBIIzyToYCoUxRZq/KWX+RW9sFouK7W1Sj+RJNVVPamnrXZ7tVx2+/3RaKxCi16+Go2nN1eXF+dni+Xi48ePp6fnw+HoejCczudpUhtPJqvlarleVZfL6rJWT1RBM53+XgFRhTq1mnRj8ggq9KkYBsuj5pLsW19fC16Ry1SW/xbZ5EXFx6J7JKOH6FXyHPrnWXrTLfJJZtwQ/8zfTRYGJyzI40EZHCVZJh/P5TWKd970yrdjkl7Lbh+TSRreO2PQgRisl6/HrigsoH7rRfHZE2V/mocg0/hmdys7jvi9pBHxC/n8YSBZlXAQmVqxYjb+TGXR/OiyCwtWTwxFAQfF2iRTUs8M22SQsc4fg/QuyoAP64mSeGqdZzNJ+p1Wr9N+fXz8t59/+vsvP795+3Znb7+zf7C7f5A2G816Wm801YRQq1tdqIK6+mBGemp0obr6qMHnd2Xw8isKGhGsneLsPc3IQ9MXtpQoj55TEPBvPr68+aYPpZaYdyrbcj+JFi1atM+zCAijRfuLWq5eQkhEmt+wii/r7tpSykJbZdkoR0IGh8xVRuUsHPRkA2oy6ZQHmRIp06rWqnMF1BTDsFjqeDyVP14FHzaarUarvVqtdvcONpXKdDy6vb6qVKtXlxefPn68ubo+PTu7vL65vbm9vLqaTCbj6Ww4mcyr82q1Np/PF4tFI1XJTlerpXIxqyoZKUgflfeinlSWigNBFWzdJJNHVDm0uvFQwuY7oebkWcnnscgJLUklmd4SvSjUZUaQKgEn92fhxOxfJi604jYvHlSkwAkGrgkCSWYt4hXJFn9D1N+WVn45BmIBEzLuD2sIzMUk0/kYSlk+KbIDs3GCDTFyspNa9JIVDpFHscAuq3IQbHWelswkxCK3SSnzrxZx1H8TlULGrlvox1dJNzWxqVOuas13XZX7UwF+G1X8HdxgrWbyx9STervZfHFw0G+3Xhwe/O3XX3/5+ac3737YPTzc2d+vJPVUrfk0Npt1u91RlJ/OPaqSA6sSFGmWINRmWlJQs1pV0HQLbtBk1EV6YVQrVRl9zCVrlalZgWGUtZkqAX2d4SFwnSEWnSkYSDsmiIkWLdqXsO/tDR0tWrT7mh9JyM+d7XxKUpMMXmap8Y+MDXN85M2z8XGWTvEzZzzkIlzpplZ4VqvVxUIVq8D3Oh2LqXqvUouqyvez0XAwHo1Go8Gnj5/OTk9PT05OT8/G8+XZ2flwPK4n1fFkttpsRsMR5KOQjCpZ6VInQNVHY8l4yjaRlgZyNZOA0SDDmv0EEZKmlEMG7WzaUuzM3nbqCjjg0u6UN7JU9nZYJkNnzSFk9+59/mJEfJkEfUYqqLSCFhm6WEUWKCRcKSpOGIRYkrgOLlW4Y0z8CZB7r8y3DqedO2aoPoR/CQ6SI2mMJKMmS2v2M+YjJbeXC/bU2I1ZnDKqT6oPeXPutCwmza7xqE27XsO9VEITs4iQv1gUX1H0mg0d1Je1Utme1B5qlaSi4NNKlRJFmtAlCvptdDJPpIfRJKDCe9WaTgyj1yVaaap/VTk4OtqsVv12q56kvU77xfGLH16+eP3m9YtXr168fnP48mWn260rRjBtNKELVcAyrau1IVVHPkl0QfmayOQqKqzcZwyYZ8Tyf+JZIGazd42ZQPkUOMhZygYoB/XiA+UQihYtWrTntMgQRov2V7ei8L9wzoPMNkX5QhwkmYOR2r0vVLVtbaaCWf6MWK6ndgtlxFTKGe3Cwm2t1hKd735Vrzc63dpiuex0ewttRy/eTCbjq4vz05OTyWTy4cP709Oz0Wh8dnk1HE+aaToej1Wk4WqjMpOuVpt6stDIUFWt0LUY1Hdr04albleS1FYr5NA3dcaI+jTWE9lDzVcee5qJCsEtCLzAgMICqV/+CGZT14kQwMAtoWg+Rq0NIv9M/8rTGS9ZpWFdbVayzIJ7fnHV4FjkV8GdiVKljNnRvhJqOaky/eHKsxftyQ8FAre5WT3Iyj9zO8s97Zmkx58lfjX4wi6MZAGkjNbMnpgsio+cITPJWjIKJ3C6MYgSwVzJk6pPMthj/qty6ZrrMsfOFhJsl/Ao+bIqWUE8JAtd6UtP6slquaypNKE6safJF6rqyCOMsFattRrpprJpNZudNN3Z3X376uWL/f1Xr14dv35z/Pr1kcaBnW631W6rn+jKg41Gir7UfKB6vowuVAlQzbIL5eWVu0yAPMHpmlS/WaUZ+azoUWWz/+ivs6rxdikmqxaI8vPIZWoIYVuCInCvokWLFu1ZLQLCaNG+K/ucNANBEalPmOQWs534QI+9YRSN1ZuZQlvZRr75NoXh3XGGOVLDePwBOsgycpXKfK6c1Fp1sd7UdPPSNFUlqevpajlfLVftdmexXO3tHewfHK6Xyzev3/z58c/JeHx6dnZ2eXV7e3N5eaUK3s/nk8lksahWKvXNfL5cLpuNhiqLuF4lWsJqClOrmofrusqAigKGCXLh1Ot11I3IRGuqTIXR1rLN2XXZi5KOZu7fXBxUjtlBP9ufUUfoRZpRsZbDMCqToqYxTXZIcTjhMCMryVIn3dE31JAzKuOOzvOjC75pnkZdlKJTNQLBnYaiz5Ri1z9n0Jep7ihWC1xqUVNDIGNJ5uCAoHeyih0COuJzHDZ3dpvSlgM4SACakiT6QyiEcXYDsi30NfVDLClHshf9afWCYK4M8JXaSj5oubvHBRXbkuy2Fkh9Aos15heEoBbCWZWoXOWxAa7ZWgGywqCZ67Wp3Wcec32BpqK85hLr9VRVGtScYF3fVpszBglEkxQpX+pJq9HY2+2labq3s/v29auXR8ev3rw+PHpx+OJFe2en2+21Op3KptLtdqpq/3o91brQmkoUul7r5DT6PqrGQI9ara1XKxVSuBXQyindDROoC8qbqcPiQKshtbSuSQrKLhJEsciohBsuJyeODcySW7QwWrRo0Z7WIiCMFu37MUKszyn/EKD1tIckPik7shQhOiFMlPApqAFqzDB7FAWSeLyj8fe6THhfST1N6iqUqLZabdJ6rVpbLBeq2rUqdd2o1tb1RrOxWjUbjW6vOxmPu/3+zu7ubDZ/c33x4c8/J5OJ0pKeny9Wq+vrwWy2qKyXc1UFcTkeDY2IdKUzLep/1utUF06srOGtIpljvsEmGWOtpvbUH0Nrx3wzFlFbfJ6VmGNpEE09WMIOGCOXHMiFiqxVmO9KKtwAnDJwuALxAvYyx6PYc9sE+7qweK2Wpqkq27jZKCmhXg5Afn/Sahtcpr5wpRu0SSnxcxX1aVEHQCbHAzCVzOBCSIYaIYpx0sXlpEyXEDFHPCLtpAWETA9btz/PoKPtoQz5GDKqmiR1cKeGUK2aEDWm2DEgk8Xu1IUoqIjhz/C2tarOt9ZhbgaOCnGwk3/Wrg7k12uydRz0MUeOjWXVQ8ikAMVxMsALkGMDRhWtJ4qUoqMguq5pXI9zrjcr9Uzpr9YrlTgU6UNrtUT1Q0MlCE2TpFJtbSqVdkPJQVer1YuXxwrnK06vmdaTnV6vntS6nfbOTn+n0znQ9urtu+MXL3o7O+12u9vfabXa9TRN6koiqlLFoKC8jjw0uUkTU0nCoQGRU7TIZMFVh0GUn6sbpuuS6vtgyG2lArATEMW7wPg2QZS5Izok1KSMkpORbIiV00eKMFq0aF/SIiCMFu37MRFl9lnehZTY0fORxIWBbrbIFn1HR4PHPHuOvlOV186TEwzEMfCimCH0096Um8VUwv+1XVWrJZvqWqvLoIpUPr5Wmdbbrfa81+92+5PJ5PDo8Oj4xWQ6PT8/Pzk9WS0XJyenl1fX6+VyMBpPZ/OhrXQ/m2sxqY5UVIxhbZXUEi0mJTFlwq6AlLSstGLkbUrfymguyxAigamiYzRdZrxOJhd1M5rmkJ2EfVnnh2gjc2RbdFLq3IRZVtDcwxwxi1IBChEpIkj1rb7sqq3qRswKWKmZHNQcV3CpUjNokGbur758mbvVZDixcEUiOvO3NhCMHMbyCLl4P/Ghs5ujOHU4RpseU35llbU4oF37YKk9AzOsKthpkb7/8lhci8kJCqmU9mXevHH5qxPg0sqKTfISK3oMc/RiGNinCJJIcz0oqEIcprC0XuFRtK0G1bjLAN2A061mo7KpNNN0Z6fXbbePDg9evny52+8fHhz0dvZ29g/2Dw6arbZekenrZ7CVNhtpva6AZ1JL0wamCKwCAFLz1lfua2b+ydImZ4mWCKExI4kpQ2Wssmwfpe/m+iGFsKDc6EIzMtDcVrsvy5AGbly0aNGiPb9FQBgt2ndlj1uZqiB6MOMvrDubiznkT0Q2jiwuh4W7bL4+7OyJ3nKJ+7Lru/clWNdYwT60ynqQis2w9cSQ82K+WFUS5XHWazVVy6zZbE7G69XO7v7+crl+9frt64vzNK1fqDjD08V8dnV1fTscXt8om06n1ze34/FkuVyuN5XZbLZcLuv1+lJlnlknSQ3UoeJbaoo8Qxk0JStN6lVNsChPF/UJkwQAUmVfBE2lZKUmLhJevLoMs2VJnuxmoau0v+vG4Bk2z+a6lFFgNvsMfH+dK8aJ1RR5Mph8Mkuko9Gdxroizi0nKrYt4M5UuDLUKxflZ5EtYLCsiCgZv9AQtS44OT3R+KDCWX7lhBq6X3lKadnn2RjNwLPNVOlm91QXJOq6ixMZbW/IgmG7XlOpV7S8u/kk4wy9dFBK87leG8Cq75Mu64IIWAS8KvVn3XSsWjmBZDdZK+oQpVmA/0AVaq2oCg7c6TTTNNnp9w+PX+7v7bx4cfTm7Y8vXrzs7+410rTX36kmutJ8o7leK4pexQRWqt1uB2JTdc5Kta7Lym82a3Vki/+VLtTjBst7hsOMnYmnJ0eZArlb0KieSl1dRt8ve/f1E5jdfAvwzOg3yFLU6sgJriMAjBYt2tdlMctotGjfoT1nwWLpTDsZK7ONbGnc5iaVzAfZrTzDQfbJORWX2EOI8d5NR0pSOMTLxQJHni8WSteq4RnkoOq/y6VKSzqfz2ez8Xg8nU6m0+lgcHt1dYl/bwbDy4vL6+ubdqdzcXFxe3vbbLYHo/F6tW41Gyrp4no9m00VfbhazecLZD1FgvvNerNc6eQ02m0EILTUoobHOl0NU1NsTJJSzSVSi6uZK1WMEf2EnVGRTdwjmSKkJAOQA1WcCE0BnbIbL9W8JIEz3tjLI5oFy1lZci2pq0yVWohoKBpLUELvKkP7dLkCnc7HJpWl5lMKPh3Np4lO1OJDQfqZT7DBn/PKeRUyXjHUT3mzVFIuEDH7JstEIpmoLNGnvVJeNllO5+r029yELpL4MjUQBaMOOrpWq2oe23yCGioKbK3VV+giFAXc6HUKw/SpgMBEA/laPVHpPTebSrfdhBz08OhApd1dLStJs1pZ9zrtpFrpdVp7u7sHu73Dw4P9w8N3P/x0dHzc7e20Op1ubydNG7q4RB0FJwAxcYFqUUYjQBQnrGg+GSNQp4zZqqC80DKwdg67ngNWbpAotLuY585mksnfZ+ojmDKKJxWUPblEEzO4XcujRYsW7VktMoTRon2H9vxuhy8ZNdtZBessAMrwPNInZi6Z/HGKyBFf/vcAsxXvrW+IxBiqxn011alfqtXqksrDWk3lj2m1+tXqcrGczWfr9Wa5XM5ms/VqNZvPEEk4uL25vrparlYXF+cX5+eL+fT07Pz6ZjieTOaz+UoxMM35QsUuJvX6YrlE/BUgZ7I2xKCJQwRQscTCumJQK6DgxrrEVooGHJALi3KRXVWXiLBhY7mv7LbN65kxXfSDRUITlkIX8aLaeUbeFOfIQizsAifVyfZeALas10uXabOpRn0wmYNteofFcimAl67+jirkOnDROchyuXRG7HK5FBeXO5fUUsqFD0HDBkCfJA4z5WG+W8iX2/J04tRMzuTrtvNhhKokJmW+bI1dOODDZau0o7ae2q2W1BSSNIyr6isVCamfhTRJVlr92GikOEg9VRsEZkgVU61W261WrVprNNJup9/ttA/2d16/VGTg4eHh7t6BIgYPjlrtdi1JO92+CgdU9QNTDTFBJKqRr+WmCVqlqtLrjlCVJMwV6lbdR1yJRDBZ1CXXgGxCYpuZWN41S85mIvZMKks224m3zfGuWQItcy6z6mWk89GiRYv2NVoEhNGiRfss83OTZoE9dguul1uby8o1c0vzufhAG9XzmUxgYctFPBbW+bmpuRFFAc1nOgxOQTHd/npar68aq0arZcsZKiZrvVqpFDWVymI+G49HtVoyGg+vr642q/nV5dXJ6dng9vrm5nYymQzGk+FwOJvNp7PZaDSez+ebSmU2U9lK07S+1AUtdCZSRUwCxiBb52pVW6vi3QCNqHxt0tkrX9p0neE8fZ1olmtG6CGLGF35h4BmznfZb+VRHNiW8S8MOc0fKEtTA9yroiUFg6xRSpCB8+Elk/eIvzP+MrBzJq0MgUCRv5OXmc8JhBrvxH7+aSQXSJo0Ew4KEpKLHVSM2p/aq801PjucSe9pssBm/7U4URdi0M1VJ9EiZKXtTFSOFFWOxZCiOkdLUtODnXygJu5qiQJsAH4gYNVHervTbu7udNN60ut2d/b2et324eHem7fvXr58uX9w2Gg0e/3detpqNFvNZguRdYlKGlRtNpt6cUNVhUGGUmijdRuSTWWT6OQ0OmWpGulgTVHBxfY0M6C644HrI2YpwQQQq4UeK5xlyh9mGMoFEzrjRE5NkuWzvF+ux81TaVcQcpR7xIPRokX7Wi1KRqNFi/YIRt9aOEA5MamMNhTOcxaFI1yuQPhiLnjMuub3B4pkADLyyohW88dgAhjUl1c6TF1jEBsEHaYCgUq6qJWfJteohnXr1ULLS+fz+fD2ZjQajEejm5vrwWB4c3N1eXGxWK5PTk+vrm9ardZwNF0sl7OpEpeu1+vpfLFa6VKHCnTi/1TGTh3ZpxuW8WNqA5kbWdF+kzXMbNi0+Vo8Shc5R+5lN0xm43SUojJJfgZs8uq7ouHhhPwJ+tGFOqTbjGdvgZoTEpkdOaPivJvoLVi4RB6/sklWpCx5iw2nUkPeWKpDl2EgimHMHoeZMyBVoKnpfPWJScmTK6NiUvWilJ9JlKp/olWXyA6qnhUdtpqg/KMu/6HwlWHkTCReFttmkKAKbVW65p1+H0N67/BIRb2qqDnVlnZLJXvpdzt7ezv7O+3d3d2d3d2Xr14dHBwoOWi7u7O332g000azXm+k9VSXnlDhgOh5DTBVkyD+RFNV/XpDBOrVDXUek8AlCKTykabZqBG32A5tofU0XLeTu1WQ6uLeZSe261MUL0h8aBZlMiWEHRLEpX7l1WjRokX72iwyhNGiRXsEc/CblIwaH4oL6kh2YhEgvX2bViS8SiVlh3AZ/dQgdxpAS0jWZUWJtkgfQ+3ob+pkmLrUgXaz4ZEjN6nyudeGYKyu10k9abZqOs1oZ71W6HBnZ2c2V/8bj0fz+WwyUsLS1Wp9cnJyeno6nYxOz69uB+PFsjOdTFerZV1XO1yullqVuqol60QDQmR6MRhPqGeBE7V+DYXRhISRPePwJ3YHExFnN3KJWAR7JiPZrNA3F1ZFQOXetuI7E/5G0GlWbOdE3eV3t6RukDCUYY3y88DOVrTsX4HT2IxIyvGwfu7PrNC8rSavs1SyD7mGYj8xTCignUDY/vOgbpyDaxj0xsaKtKmaJlRIr57Ukd+1Xldvf/VVoko4ANObShyV6iapJLWmZgdrjUajXq102o2dnV6v19vd6R0e7B8oOehBf2dn9+BgZ2ev0WwmSaPT69VVcph6s9FSv0waKiFMWkfG10TlhlEtrunQzdpGoUDdUFSuNA227TczA5lvJ5eP7iumCQXXZ8qySPZP74N8UkyDZG9ITo+AVEoZVcs7yeWGqptcVK5eScmo3TCnupfKNVq0aNG+jEVAGC1atEcyQXRk+RX0ir8u0mYBmC1ggHyf8NOKcGAYW8C9A3Jz64lt7XxlVJdxJO2Rs/bntHfi+MBLisFT6rvaYjFXdelULBaqBSpvW5XFTjY1JfVcNZqt7lKVpOj1eovlcjGbHh4e15LkxavX52dn68Xk7Pz89PxyPJ5cX19PJtPBYDAYDhW3uFhNp7PFclWpJ0vFO6oM/CBtFLWiktSYqtxIt6iKyK0V8YJkGLYYutK+rnTmGoVahagyQNzJ4E/7CZkS5mfM0YGGdsnufV4YnB3Z0XkKCOUBxwzsCBRoz+NTfN69RaaWEEYNiFoDkWmZYFZ0Ay7A2dXkYUUSUYExxHVZDahGhDbZDkaUGcam5xhSq6s1Mt+MjSPNjXBbUTCrVoJwO5Q9NCl21BDU1dtVZGxNZexETpiaDX3TWEyTkKgyr4SgrUaa1GqtVmun32820n6vd3iwt7uzc3B4sHd0dHhw0O/3Gs1mr9dXcK/ZSlMl+0x1xfhardZotrTws1avN0CE6vYo+jHRz4hJDwO1s26YZTJtuRHibdvXJtUucCABYTZ6swLvhI9UgVqCXD2MGeltE/PK8MxsJAhkSIUqyV6OPpWhJx/VLId/ZAWjRYv2DVmUjEaLFu2RLZtVrHzK6Pq8/CJ+0TzrorneFPCZTQAovqNUK2QSb2SAxcvnIX9gBYT2pAVXSBZRUGqoYW1gD1I+IvslPkH9Os0cKlnpfDZdLObT6Xg6namSFdeXw8Ht4Pb6/Pz89nZ4fnZ2fnmZ1JuXV9ej0bTVbk5VGYvVZj3XJ1pPp/PKZrNSDCRyoKpIRvWvyPup2URdPqKy0UJXnbEG+SX1J/CAITQFmMT1gdJhuXa66VkZdwm/hehREowu9LKueq7/Xa87IwNdkJZTAdqbxXvKhJ/2EqQS0nxl0Z2henSF8YyetmjTjDGVjVORcGZA5hN7OspnISLVv9LISpcvp8xVrYug2qSpzKGvFOUoVegeEgUhnk3jNBC2yEyLKgvYSBK1NGDyo+oUoPU0VcsBQHe22gPGsUkPaog/dY3NVhMtPDzY1/rmdbPdMSBNHbzWabdTFRzY2u33Xxzu7e3u9nd2Dl+83NvbbbbbST3t7/Sbqh5LI6k36romhE4Ko8oQbiqqeQr1rRWmRVkXzZyr3jJtQF9sS+mbW8jsQTJmNb/ykIl4hd4TlVekICCLFw0yd5ahZCYYw+5CCyAWIwxEfM58ztGiRYv2dBYZwmjRoj2yZZkbc39aLWZ+NT3byCushJOtM4Bmi/cZT5VL3B+KE7OALUdUSe5Amgyly+Vl4Q5SpApiIgd+3NwSaAV8/fVqZRPAJOvaKknqrXZnuVx0F73VUv3v8OhYcYez6fD2ZrFcXV2en52dLpfLk9OTi4vL2WxyczMaTWaTyWQ2m1er1WazoZJkrqv1pKLEpSoDjYJ2SEyqYwUVHNRSU7W9UoBCtWq5WerGq49NjbWsTGSWID/Dw5TiiVjETMInqRtIGRn8ZtJ1WGwjcBRgm46UM0GYHCqMbTPjQTOapJczaTHPlRVeUP9ZGfI5G0jZeMDIyUZYln2EI49BoS7SC6be8T5xo2YtlUpFIZGKOpeAp6rCHc5lr8h8xRBE241JLVlVFYBXYXh6l3qSrMAHqrydytKGouY2m4oCbDoaD7RgvVZrtprVarWRqiKblWql1Wy22+1ms9Htdrud7s7Ozt7u7k6vu7e72+31u/1+b6ffbDaTer3ZatVqtTRNVZ3ARNF/KiNMUl+rxKRaiQokDKRaBQ6s2hLtWE3Q6WHuCZ+y9RQsJVjErj42CVQFhZ0978xXZdektHaUlK+hKHPThVzjECtSAjhaQIspJ/skWrRo0b51i4AwWrRoT2V5OaLN0W5xoCz3JaiiYHoOK9cz3nmWwSboizu6RRcrskE29kiEMjpndUmEXOBQXlmaKdBIhVlOq1qtzeezmi6pvVjoIni1Sqoca5WBv1rZrFbrbrevqritVgcHx7VabTQa3Fxf1pLk+vrq/OxstZre3NxeXd9eXV3f3N5OJtPZVNVCnC8W8/liMpkuF8tNpTabKRoxSeoq+elKV7pXOHClORl1dHBFyNZYrSpuUdf1VqhVZ5tUfndNp51cbzZJPdks1QWor9arig7eROiaFy3nSuaAARyFZ64GuhXvWUbOZOUnfcecmabyIm43Mvfbbs+4XLtB+CFvn43+smpAjQuAzyWJbW6qHHRIjSvjMn1NbG54SLmglnGqYD9TyBDqUkA7wCP9lQJR5nJqNfVJzeSJUW/oeh3xq/W6AlqVSkVXgFA7J/X6RmeJSdMUys9EkXXK6kgcqqunoIxEPVEfKhXoTr+Rpp1OZ2d3p9Vq9Xf6R0dHvV6/1+11et2d/o7i/hqNTrerKkzUkkajUa1VG/W6Zh5raarRoMKCdZ35paYCEFkt0CQFrVYSk4UFTbVy0G35NPnAZpS7XukAVWjDWTcqrtfodQ3mtkeQiYJsJqRs+UnoBRjMvHEkvhlE5D3lPvkqJNGiRYv2zVuUjEaLFu35zNeO5r4SrrlTIV39m2UpzT7JL/AHNWDuh7m69paQyYUgFoQBPUweZjSWOlup8GiVLBO9obWeRuho2DzF+K2WK6Uonc1nE52KZjafDYfDyWQ0Hg+vr69vbwdXlxeXV9ebTf3i8mo0nHS77cFQIcPVagZucD6boXwFoOZquapUNgogatNyUnVClUAVIlfVSNXg5XJp6vKtVFXAasUU6KvVlF4RQAUbST3Rh60kdYVCIVOEBjVJksINZ2dd/GC1XJnckvrUia69kRWRU4FnNnuqxVS4g9BJah1mlhrHkI26V3WgmsX8uoAeUhNBNGu4Sn1A4g1N6urqfCKnZGBkihElP2GoZpLUVPmQqmb2tBC3ntaXiyXknYj8VFVG9AbwExOH4kqNFtTKYlNVCVD/rYmxTWXTajYBm/q9rh5D1c7ujuqW9RqcYSNVxd/bKuqv12s3e/1ev98/Ojru7/TbnW5X/91I03ra6HQ6igNsNtNGWq+n6jxaD4oUqRr06SBArQdFH0IPKku22GfkgU8KngEcjEpRbJhET0BlAuM5DB6BqGyGzFZKtpgY1UPy5irw/4ZaziWVjRYtWrTvyiJDGC1atOezjCwKILpsDwkODfnjxJ4F8B+9vLsX7+kqSvpSZiKpeGpJ+8F2FEdW0loUeLDqVpwuqRmgUlWiO4VSNERTWKKWpOvVsr5pdDvdxWIx6+3oUhbL2Xy2XC4Wi/lkMppO54Pb6+ury02lcn52dnV1tVjOLy5uB7djtcd8vlqtZ7Opql6xVplp1O81LAQ21HGHxs3WNS3WFY0MVQChjnUU2WFVc41eUSG6JXAKrlThnIoOQVR5a0ymyiwo0bnpzkaWwEZI9bSeV7N8JqyvVtU1GPSRSQPyPqKqRpZQ1E8vJNYRkOcTDKG8oVna1VzdAo2uqslmo4A0QsgcnaHN5mIvWcT+6YKK+AolH5K13qeu+FuNDOum7LuqbKlBCTJ/KmYvrWtkrjhlpK9lecE0TYHQ1ippkPoJ+MB6PVXZQKu1ZqPRarXqtWqn1Wx3Op12s6+AYG9vb7+/s9Pr7/R3dlqtdqvdanU6iqHW/wP712w0VeIZFRJYr9dT3Ou64plBwumO1/cI3WpVoECDEHUTNT2EQ3N4fkbnyvQ+MhI5U51TY5xVRvF16YFPDA1dNESZ8TQTBESLFi3ad2gREEaLFu1LWM7xyjCYrBXvUnSWWzTqvyx3ozEnlMjfyPz4DEXksoyK5JA5/ZlMee8rIQMXl0VC8nI9NaktH6eIOVWTrVpZLIC1VNDcJkFQWJKkicrWqCoSLlfLxWK+XK4Wi/l6XZlMRqPj26Se3FxfXV5eVCurq+vri4ubyXgyHAwVpThVtlgsR+PRZDJdLBbj6Xw2nWner7pYLExeGUVXVlQ9jRVQsdJzrlXCEgUwVGeblCQbJSPU+UsbTRWKVtls0kYDXnsjTSHlbTRSkDzqK32xjUYKXKzSUerv0roudbDZaAikAh7TeopeTevpcrW0X6mKGko2qdhUXVRd720kkQorJkiEk9Tr6hosebjR1GVlqVCEDroz+W5RnyOpJevqWqGARBUQUfskqgy6EsfWE4WKzdnVJzphrDpOPVGkKK5isVhsKrqp+KReN53QaMzncyXsTBubzXyz2TQbTQwApb3Ug6qhA/yqVQXhVjWVDCZtNGoozKBhts3GqeG2ZhIVANSZOZX4U2fyTOv1VrOhMoI2W61WM6klLb3VaKhowIOdXrvZ7HQ73d29Xq/banfa7U6331fgUQUPNjQJWVPDq1ZrNpuaBQQIRCX6xCSo0eBctwdj1awCaLqVeZ4UagW5bXfYGgrakph5mG3LRYjYY6sw5weGIeX5UL1eKtLF3MCaEK6gV0qOswnHZJHJWhYSsUeLFi3ad2VRMhotWrSvyywn4MQHImGgKBjIHDOWabQealY82peM+vFsgagwh78KhY252Ws+T0aWyUo137LWGk4l1FSlCJXuUeE2nbRDy+cAixTbt1wup9Oxqm04Hk2nM5WTZjAYT0aT8Xg4GAwH4/FoOBwMV5vNlbKbRqt1fX07GA6bzeZkOl8sFvWktt5UFouFJnwqOpGpEk8u1JGnUOtpeac6r26GJm3QbKQqtYBZQYJKFblMwSNp1aXR/kGYZ3SYtepmhRIdRgWa1JPlYolCCCutFOUnEJriq8VSBTUmWrBaxa+0YDVNFTYDhFIQcaMiIZcKYCsYqa5O82/6MlXQ3WKpPgGzx68MoaeVq9xZnV0FYZqdUWF9tVJnZ9l3hZdsUUokqqklusy6kXxSSan3AMir1hQO1t2o+EB96m6ng8HV7nRA4CoYaUSkdcUHqlJ+Csu1ms2mQoPNTkflhGm32u1O++jgoNPtNFut7s5Op9NWXGI9bbfbijpM6o1WK03rumBgXaFlHbOo4gFVmxEEqDf0p1qIK4rFAwFmctDPHeqlEnHGDZoHHxllzGaWLNYSwnnyjpyfVH1Kyai3IfOFuqGDcp/PvPBo0aJF+5otMoTRokX7usxJT0JeUKcAsUloKA/zfuIIQovq7Mks9i6ok9UykP5EQFNWSzMnsSe7j5H0yMLeqCzNhHAaC2k4oBAVtI0KUOnsNOt1HdFn7U5XKUS70+VqoWSl0+lqtVosFlNVzmK+mM8mk3E1SUaj4fXV9aayvrq8urq8qmzWt7fD4WiynM+ns5mChovFQpewWCwWq/W6oRjCmk5eWpnPF/DHlwi6s0GPwI1Zj7E8o70pm0QBQk3LGcplbdKNVDZ6A9lOKzpVJurRqXC7NTSQdVs0T0EuUbdAgT3cZ81hqk1TZh37QL2po920RDMBqFadpTYU1ARATXSmFgBCVImAGlOLNlOIfhUSW2fNUBlfaskS2Tw1vYUou4rixzLeDLF1EgFqhae+AETlgQzUIYUa8un677o9jUZD86WbRtpoN5uaDGy2O922ZvoazWa302l3O61ms9vrthRB2FSxf41GAryH/J/1erVWVYhQS0yrtZqGharT1fnryUaRwhhghgbEoGONCNwvgsCnkEsWMPk5gt6SdCZNEVaFBHVodvc1BTrO0nwmvlI/0syn3FkEDArFaT6BVLRo0aJ9zxYBYbRo0b5aEz62SOOfZfrQO+VFDkzsSXBngJ9UirqlKSway+1jSQqnAoFs3IOvSx6B/4ZkqEZWqjlDlapxPl9UN4ojWi7RKi30035/paISyWSxgsuV5tbWi+W8UW8slovxeJjWk7FGhvVadTwe3dwMV6vlSNlkOhlPJpP5YjEeT2bz+WK5HAwHs9lsvVovFrPFYrlZb4bD4Xyx2Kw3KkJRpyrV2WtUVhhV9EIzaRtd/RAMDYLlkA8EaUiywoaqVJ1y5lF5AsjEfqUgIkAgkqngK1u4QgFCyG+106/eYmZnprY0gFDdwaReT23GTjBMQI8WnWkpZt30sz2RqqgAkhZ0XlJLVOzheg3eTMV82uLvOI6+vhqCIQ0rqAuXGyRZB2OocG+iM3+m9bSlwFvS0oXdk3rSVsiuWa/X2612t9VqpGm71d7Z22s1m62WSv7S7iiur5mmLVUPMKml9UZDiT8VvlPwT0VaItGoIhP1eSEKhWktaA3ZVVW7MnmqvlIbFGrwoUbFLBb/SMZ1ECUutXG2JmrXcM9GRWrgnyQPcWel6rtqKshkj1L+qeR0UfFXi/B85+Fflnc0WrRo0f5qFiWj0aJF+9otqwVn0V++VIXYx4NtzlflEYAGBLICex71ZeI0SyE+EXPiNcpWe9flzm1xP1Py3tQe1FJSZjSByK5WM8kqdXYQddVqZ4UVF6vFfLVazVX20tlysVRVLKbT+Ww+n881LFRZTUej4WQ6mc2mo+FoPpst5vPlaj0aDmfT+bpanUymq/U6TevTyXS1WtaSZDqbrVYKhc4XC7VRr8/n8/VaBQHqlKoVJNhcrxGYpyBuI22oKoyrldJ8ahjbbDTX6/VysWw0G+vNZrFYNNK0oqjIRaOuNxYLVcFAF89AFkydJEdjUZ0AU6tGV6u5CsjMsCgqamgUpwoyol6fColUlCbGyFq3B7pZ3NbVWl0OcK/CkxXVHs0HVnQxD4WaNuuVgpw6yDPV7BwlokrUiug8jQN1EflGTUUP1lUil3q90UhbrVa33Wk0G61ma293t9VUcYC93Z12q62qBar0Lwox1utps6XgYl1lA23UVKCfLgWh8CmyfmrkprMTIfsoITQgKuErU7aa0QvezUIjxAc+cGALkj0L+c1vYGGHhUQNBsQe9qm2z7t5loEVhVY8e+yz6pLeeoorIs39iYozNjQxQsBo0aL95S0CwmjRon39ZvI8CGRok8HkS5ZVSz/xs8vk5GoCYWZZK23FvKIoxKfxJt3yiplCNcugyKtTWVSAlnWBQfW1+sTmOEXhQWxUayrXpVJpEhyq/6nUpZtKZaGVo+o46rNlReMfVcdis14uFigUoRLVTKabtfpqMZ9XqxUFIuezzWaj/rOY63Q1y8VS4bHlUv0agApZMVdLSy0qHLuq1mqa0Vxu1msDI3XuFt001QbAcrWvukzNS67Xqk6Ggr4mH6kqUb5cWZysaEGF5ZS8dV2p1lQkoS6YsVJhhwoSIUiyjkyeGj+DsYSClMBJkZkaaqF6hEpFo6lLBa4qCtO2ms26ZudQsgM8barydqrUOwrD6SQ6qrJfs5lqZk+Vg99UWq2Wzu2i0oHq3euq+Lu2hi77rljNelrTxQPTVEk9leZTwUIFSpNUYUt1izUe1oSqukCD8QTXl98wiVJNTKAY1Y440vx5V8SgE+srnp0sd0swL6tNCiMDgnWEsBjk+MQZ/1mJS1MuIjstgK48l/7EXLWlCrnhqkmjRYsW7S9uUTIaLVq0r9/yAYEsJi2iAZn9Qn5yp/yLmWdc1Gdr1mefeN7tMxhPkzn3oHZyrrqhAVVcnipkgAwuKlgOBQZlnTaVQaSmynkr08iwqTnG5VKFxWn8pjAYKlPoGnoKgOk0KgqIqYydaxWg2Gyo2nfz2UxFM25UwUMVn7ZZz2ZzJbZcK3AIemq+WCjXXANIla1kvZkv5qqSxHq9WC40WF3N5vPKeq1woU7oomMgFURcKDpRcZ4rFdyoUOpcE5vIpmMxom6Zohd1WpeKouzWupTiUld6BDmpq1nocE07lOppvVFvKCilc3luNG9pkrgosaXiMJXIU5F+6t9mU+ULrWn5aK1WTRs6X4vO+akGi1KipklqgFyzofLDIsmNrvCu4Vyaatip4ByWHzJZrMEqit9U5J8GogCGCh+as6r/qVIloAStyNnSgCZJKQrcG4GlN3RVKCoGvC3kmAum1WU8DLDUlQedQp3I+6r/y+Qvsv67TewkomTNSBYb4AhNcRGJAzNpt1j+IOrTYcR2w+TxlbVA7JPior58TDIDjKNFixYtWmaRIYwWLdq3Zz42czb8r5hSwt8npwsF6UeG0IOUDjHIfIV+C+8kDy0NYnPqy1JrGf3C88rgw8JuMf40L13lSlF7a5QIzlDnsLGRftjY6HJ/KOFg0sBsVNkJVgY3hKT2/kFI4iNTz32zVvX99A+VIFNLWy2Pq/ZB3TxQc/qEiD/cLHX+TwUydd4aJRbVWWo2a4Xo0H7zyWY9X+p9Nirtjdl5oeCrLtuBi1BnRy5UYEWToFKn81REompEpVZXZJoq6NFIoZhECpZE52JhgXjIL3UVBpXyBgyehltK86lqvev/x5BgqF69niARKJJ2qlIWiTo4Ss5XdHn3TLFpCvqJTJ6ImbQjTUYqGqmnzfUCHSwObIGQGRv6NrlD1xLgpjfM4BfiZ7DKTqYlJ8Fm0WqIYAX5mywUUA51NoM/lYNfRgWbRDIit7BdD+KBpHw7K1jDMjH5r2Li0GjRokUrtMgQRosW7duzjPMqiAwMAjksgQWLUNMHdT8x2WVkefOcGQc3r0E1Xwl5Kl1QoXaz0jh7Cn6U5Ti16XO0TFG72MKLNSkZNznxnkm2w7gsBlxm4VKAFuAaVZV26CyRw9Rk0qmuKxUNfvQPbSSebsx6U6sbFx9EX158q8IXJd5gGlWV9QSlAvmJ5iRxTVCHVipqAxQQ4JzWi+oNvbMK9BMZWXXNCfV7dUB9dl1i0ZxdIxzDaGmlqK5cB8loTSWtMcSaTlGjEn7qahYyz0qSJMulChqsJ/X1Zg2ObqPyryZpmiLnCvOF6gIV+pNEJapRwExd8lqDRVS317CNnJvtFtwd1b2I4ss+UZDSj+ujqlNDzHzdTou95PAwHYLuMN+YnyB3LSP5cvpkMcYA9UV4qrOYYg5oAaaCcBn7pztXn2Ct4hvJRXoBhg6hiZKA9hm05zIlJU0dUplTtCi7TEwcGi1atGh3WgSE0aJFe6D5MXt5bPCULhcLD+Y9v2CJM34bTDthPiyKqcoIjTzfIsFewIf2+ElBdDC1hsFtloFDCn0L/CR5YyOpiE+tQ+85wVq+CL/ZFskoSO4vb5yGShrrKVSpeTS4+RqyABEqb16xb4oK1P2v6zSoWDuVNNKQmZqvUtrRLAxPSxlzNJfK6qnIOgWiUApC11pQ1KLuDGQZBauZQXF9dE0Egm8E8we+C99b6aPuXFMOEd1nAKHBvYZhU9DOpgnVYyepqfL0XDvQiM4kXWEdQQ4zC9JMJlJcoH6hIomLAk76K402FbGnAKSBpqYBCfoZwA9NwomBCQ1RyaFrhz0aFVgHESNGjOW8LhqwzYJq3V2qk/WtzuCkSeZiNESZsBNjw2I8hGDabDQi2Famh9FHMcexqUR1cQv3oQLq29QsMBQPoMB4OBzZVBENKEl9kYuUNzSKoaJFixat0KJkNFq0aA+xooC6bZJ5PlF7fBDo/+ns7Jr0JS3qyoBu5nDnCgkGzxEQo0I1B1Bh8aHNroEPiQdtwFaue7ODlRChW5u9PpvkwzKNWTIe/ytzyYBtRRXGNRiTO8tYzQykaTwJsMlfEX6S1DK/MnUsDCEJAGY5KK0CtTlFSB7yk0yC6MmAnVUMEVOHUnW5C8yylYgq7UCz2SfsVvsUZBuWjuNAkhmMiojrz77L7v1G/hv2qgwgZFcJaWWmugyufdA4jDnCRbPtheZ4zIzZJLQLzCRGMmrawWhJ0c2uZPTzOypatGjR/oIWGcJo0aI9xNwqYaH678+Zz116m6aiYCDrYAC75jZkLpl8eQl84tQztJjHhXJu+BajpEykHbAgvmKifpzLpTIYN0VW0ef6HtBdOSCQZfXPcTsGE2bOPADtHejFQCb467b+QQ5mo6NsITgIDRUCUwSh5seYAUVzhk4uWbKaVqurWE32T4Zm8/3vg0AlX+RlosS5Kh+vMJKsxl4UbiohX46aZnCbuIPsFsn7SdkitaDBZhOEfy441DSdWZvQgzCLYs0WQ7J9jUg4A4cZvJc5Rc3TgK+yWEE12A2JailvRFEapltTzRwbcslF/G27mmXj3U7NvoxoMFq0aNEebBEQRosW7bOsRGUQREdPbnn4URBMGNjI02Jiw34FekpfWMUNssoS5TtfWZxsg7QybjDLryjlcwKLyjYrnVwZA3JfcoQZF4FPpOwwqC+9z4YhlHK0YUGO1qCSL7fQIIEHdKFZzJvZ0OyiiVe0VQ0E8hS0nuwsoQE1EEX9KhGEof4MbKeMe0S1Q8Hjonl5RtTTTt9ZASW4kfWhIKu3NEa3yiLvXI4gTafC+gxWtGlpxNi0R7LUq+WLHarcRtmKeypF0WJoixtvBLh21GUVBZ3rzGBzmFONODBatGjRPteiZDRatGiPKRn1LSebfEY1aTluKdG7+sfZ/qvgKbLMnzlFnXSRWZvNlWjm9pDiRpGQ/wugbqbDCeIZCxgy+GYVgDYjiGlzCRwquYN2HxORJjWE8uwZyC4ZdRYc+p/cDwmL3EIBPC9GyPPcqcDI1AjMRABmjTXhlxaGyXLtZnjxJprAQov2shFoJdBSxuleqf5Djl781NHWijuQ4/6krPT55ejRokWL9t1bBITRon0/9sxOUnGSkrDK7mu2QurGeLomO0t+ZyO8ZDE0xxEHlZSVgGCmRLrDGaOCr4SoVZNN6ueW2HHjsJxelVDzm7K8MNLWoAuZRydaZisAwcQud2JC3nfCD6R1vWux4Gse4flnkOlhnLITugBJRucZta1Ny8mBLbhGgyAts2dj/LJVDJs1J0zFo6JGximKyMzc86XT336bM0m0aNGifYsWJaPRoj2J3cuDKVGLbbmz/PbrxGYl7MrXYL52UQTv5fqNyTbuzGNhNInwqFEuOxOGyshDARHtf7Wrnjt2fheiTEo9v1XpnAMbTARawdjwLtUwW5aYKqOCA58w2s0N6gs/LMFEtV/JomqRJJUwz2JnSlAtFETApwB5sqafHWK2EgR+LyJtOcINJsz1odeB/De0riG612NTCxF/tGjRokV7BPtaXmbRon0l9jkoxQdd5TAsHFV1V/0GP4NL+bmeGg0Wpfcs13d9VWgwaHfqS7OYMfmVZazyUj0DPAzlmOkMGXboe89eoQv9rwNMjQLPfPBV92e0ZzD/YXQYQhJ98icWV6s/JUCzB7Q/A+pDElj9mfeYy+USDk6TWIiiUbkEYOHfNzY5RIsWLdp3ZpEhjPZXt4dhlSARZ92mMggXJPQcB+7OdBRIdl90QG7nSgg8mZvlHNMBUcF9vgn0km88LyfzrbMrsEkuEfWExJeoq0aBKDZyqlHNGYqbkrnFNuOLEKPK5CqWnbQnjxbNmFfBQv0r6xTKsECRXiaXQDQg9VQbyKmDcctqEPJBziI5s9xIloC1axZ2ISP3+H97k0O0aNGifWcWAWG0v7Q5oV8lgswi+Ff+85JzEa3RtvkVMSc3TE02DzQ6v3LsiZDhvRQHT8cDPMGRHdArQZl1jqXmtFzh5qUktb61LUiB/Cu5jBrUnmbRbhgEuZHpt/W7sSxRTa4SHZKiVFEe3RYF8RZBCFRKPnGlqOzeB7RVoqPymYTHz/1GLqmQwrujezASnGYgcWg2XmQLERwrQmHlekQu1w7IPdseXRMS6Uq9RhUtPyHha5bI9KuR2kaLFi1atCgZjfaXti1Vl9uLNpmYPnPyPPEnf+hziU4ewpJoKOfnDivotEoeDcb8Dc+2Ev+9acBM9UBkypdMS6bAy26Txn7uOoJI7e+GYxk0kulLLeciMpFmTTH9WkLGfvW2hVxW1PYQMNl/hLMcKneeNfcI22fEZba9nYtIe1NC/Y6zSxI4D+MLIwAfRTKq/qvzi+bzhRrOMFfkjyfVaXUsJM4qQRgEDtSd0YL2aQh1s17o0GXl0c+1WgYL73uB0aJFixbtKSwyhNH+iuZwdNKFkrSb3N9Z1y+XjCZJ4jN7RXSfc3ZHdel85bQzmEmCp3OcVwemPqd9b55fThQnKrBZ517syOJswqsmqsu0qAYkmhybKDvIn+XoP0MDyQ9Yd/F5eyGHzSQK8nWwsj6hFN9aSswIcQU3lltzETXwLOLKYxr5gSm/nuUmwZFzGxRJZk0V0XIohyeq7Zm9yT3KR8+WFbHwX95Rp7/sGfwZIKgR4EmDYHVL/XamU7ZrCt69I/rN6jIacSfSzZgeM1/Jm00W2+6Xw8MyJYykGCNDGC1atGhfm0VAGO2vZUH4R4fM+XwbgaiPHoMQbpukoP7xt5Gn+ttBZ6u8rtp3Zs9yXaV+ucgik+1uQWNW+86WqDeyU/rPCg/a4vXW685IRItVMoHgU15scd5awDauYuRIJP1cGMbMhFhazMTDEvWJSncuDvQ3JDI0JenJzmkO1WGurKrUKCr1hqmm4CK6fCAdQKp/7bVaDXlVdDCd2uKGc135HsvKS+YBqrv6w6qA6m85txjoG04d7I15u9hgYZ6jUAiLmm29P3sIphu1jRTZZ2xBwpwWVeSV8XK3bipVQw1+sylxo0WLFu07tbhKF+0vZEHVpfPJlhky/QNKR7YEjUiarojZk3s6iJHngjw1eHyfSaAYzN+ofNuBZDkP1PnqGXGvuHtWMmp5LO3fQzJqPGiLE/1KF8w7KoWhtpx9ph3NiKtgHpHHuNJ8rxa8JiTFl/3I2df7RMazOYRTfh/0ZF7ayH9MJ2a9KYnDe53La6tMkyJ61en2/IUBp1Myanqj4CRhUbf5jffY5vYMgf9glZoiqCk3uHBluTutDbXMdFWXDLQnzKN0IRnl4bLh7F2FPrAyhQeFov7bm3+iRYsW7Tu1yBBG+4taUNC1zUYQY9ypgCoqCRgUo8o8MT5p6TCQwVDDYAuDnfCN+WS+K+lt0D924jOf8kqF9NNQLFmBdSuSswUnyP5ZOZ8MQstYRLbcSux4mdjJX4BwJND3MJ96Al0mFLBBvktnnlTXvl6b7sdGBooVdjDnYEeJWnPEETn4a0k2Q6nlEalkCG3bbdJMne6EkYbBUxQmAcaWusC1Ktweeqzy/aMz/RqMX6sZ7jJr4T2iGbO7kFf/UjJKHFgWnnjn807itJKpkqWIFrLOPKkH+FcBOCR1yTUAJifFKfGVIAYNwMyPXg4EN7VStGjRokX7UhYBYbS/lt3pLgfZPz+ZZ1AO6p/iYaEyvng1GLYkz16s6wujUJ5ry9ikr8jojBJDhOpz3Hm7nxAiCrc9fAuUI5yrim7abDFRphT1+LUQrRhuxDYpLh3454w9CiBdgkg3RLBhhiKyNF6GhSx2kDAyDO3cDYsDMxhHNGLOLthLA5wMDsVXInmmuyEgcCB4L/jAijGmdY/5nTE1kEgUfRjOPuWMjewU/l0WQz34LAfuetGqkzmQqB+f/Rc/Nv1KMbNdqhC3IAuktEtU9jblus7cCn2nMsmojRbNMjBlmZi+mfknWrRo0b5Hi5LRaN+/FWXe83Gd7xBvY0EFlBexU+i9+W5ckJz0W1UO5HxRaIlk9NvzxkqVos71PGfMpAUsGZATVQ0sCPRud/ZzkZI0KEKmRtJPH+JfoPx52ZDOM4QZOBFoNE8M2rbon/lgz96TXFqXkHz0DqArAQZosgw553BpUXsq5RtFdsdoMVkzAxLOO4HlHZJR2xU8uuGcJW/nMeHO2UskAxg9lDFnOI6hhiafDupouhNabs6UIDB0qXKqCU47gks3lxZIdBMtWrRo0Z7FTIh3tGjft5V7aRK53YkGJYgKmg+9tvnK38f5RP7W2SfYsKJPgoDhATD4C1tQKcpvHVbN4+uevHXGnYdTbXueORwlE4TbhJ3tPiWInRI756vypYSgZUFlEozx56T/Qkgtv2/gE4saRPSfbVGoYbmfmYZJnjx/S01/ZULHDJ7Z3rP9aoLXnHLoVsZb/KS4Iwqnzf5j6DKyo373iiM7394BdkwWF9l68YmvCw1q13NDPfuv81yI8Wf/p3/MW2HhozV7l/KS0fwIz882HOO8X15H2ZPlFnHK+yhatGjRoj2qRUAY7Xu2EsAjv/It5y57wXsOVKvVaiVwLojoqg8y/3Qw/5NteLASElJe8tdv2c0taHOQw3imC5T3weBB69dLB1p/aDiZPOPk3ksLbra3EmI8t0++m0Ao+SCCrdjmmp2ItODihbsriSnxYwngRB+gth0+Vo+AfML8Z0J+Utnygc09szk0jq/tsXgRuZ/n0Slvd7azv+E8v9wqx4G+5R5qEaoXWFDgZ+J4+q4XLDE4D5roqAz8ZVeBUc0TsfpExgnLIeef4puZhqJFixbtW7YoGY32nVsRCAwivRIKsShhie+oOT8s0gdKWaBfJDBYdN6/HCkP8xOKlIjT7mz/1y4idXM+uj1WLJ9Tm/4+9zy5l+M02IwsO2i2oXcqPnKoij3Gm/m5LV2Qizx0mCyP7s7GIUsdysZ7ktG8ELfoTSFD29yyE/JX28TRFRXus0eusPGitl5O/Jk7jql04VwfdaZZCZCso/ye94JUHS1jBlM5sAKND99KX0wuMxLxE5Z9cHosOGiDnZl9gsr0hPq2E/zMRswvir3lcbIt51nKN8OgS72BevRi2mT0bMZJ8rGQG+yQaNGiRYv21BaTykT7Di0YEOhjAwcQ+ilJ/F859KDj0smChCW4UX6yJR7bNjtI/kprNSUBkFcUzLniQynnkr9GK8a6/id5PH/Hr7Y7uctrhb7KPsnKzdtEMmH3nfXobVPl4c19sdlo5Lmy/B/28ooWIHJYKGteTpEppZKl45A7yGFzx6JDUVfKfXyklJ1Cn7RWrWVJdzSXZbO5kKMziMdiE71zzeQ/4R0RpzA1CHNkX14MGvqVRSziKvIPUeBDiSQx7+A5lRRdxk/q/KWSWHQWp+QDG1y6wvgw9F2WzMWNaxX1CuXygU5yS7jI8oy2Pebai6tlkPjmzGkxuckdxKjaoKpBBhZGixYtWrSnswgIo/3lzBeIoqyfX+9BmoOyJKIrX793/P5gtQDntz7dp2ph68KDztGC6U+JS32WzMfJkpAsR5hfv20HYl0P8zOhb1kZg7zZJP+F58rRd6Gm+vuwbmFROpmST7KmBsPgNptq6HEI5T112J1CCwwt7wcZUPGI1hKoKZ4UPAXV/CeqzQoPujvXdI0JlsHg2e2zE1pIkm3O4UA8uQYIAkjl6EOHSw1eu9NCOUv4aH9LOYBUhJorzVc9CVS/zMZG6EYK3J+BW++8Gb/pPCAmbtDe5fxiXDYgs4USrwhktGjRokV7VIuS0WjfmxWJpnw+0OcJJejyQ4zk9v1oEHvSIvItiMeC5qNK/9qdDV9ImSOXCjzL7a/r67fyst2Pe4EBnapXbC37RKgSnVypWzU+U98V5i915LLm/F6jc4rPe6be8YZWTsZJJqmoowJfmcwmriY2tNoSzoNqiDEv2WleBRm+0mxXoR01JQoFogs+II7iFEk7xb0wv3ZMPnHby9G3NOI66kV98XBQI5BJRll7sHjeKGRB830iNRTyOL6V4dto0aJFi/bYFhnCaH8Jc/zjzWaz1nWlseHsw68kMehDwft6KiUQ614YzNlZXmORwM/5bTAlfbh22TfFEBZZyS179EsLOMRBlg+3gMxe6dhwISUKGZrEHPggTCfmQJSFMeSZyImReJJQSUKgu9hj0GNcYcwIM9EGLXctCJxzzuXW1eB/871kh7F7Lnt22QPyV4ZFdE6ByDpINGVVxozasyfD45f/uahoQQLNxTqGwq9WXVCELzcItyu6fQ81y+BloDr73GsfNjKJQb4cIr6SaFDeNT8GUh42KGbO9UMeLn/tkvVo0aJF+74sAsJo34mVQBd/TTqYQRQ4MEjy+LrQrxAmlSzSy32ClGmQXeSfvuq18u3bo5OEkoqRejyfJAwVcjCALjyMi+OocGSSWo5VqxUtiTTtc75CVlFzLgGhhLox29kewHxJjGd/wZg9EyfG5JsCtjnclwVyVmzpfJWdXXBZUj9pUa4CU/lVDJ6dclD/KzcweL1ZmyyvdvknC5azTXcZVIsDXQoyLAfN3QErm8zkpOxoqfrOev+zzReQ+53gPv6eWDd3F/J3RF/V3Y9SNveKhQA5DkuCor+PmSdatGjRvkKLgDDad2IBb0abIxOVgXOIGwzmGuUx72QFvyofxVev+aFlW0aXFbllX9X1fo497h3MyTiNaxtGg7mv5MCz7biTgubR8uUEcq3J/zfXToARDIQctrHn8kFp3i33ib5gQhBfVehh0hyJJ3FIdriSUQf4LbBJ7lwCmimr2cyZResmvGvkTHMIsBJqKiPc7HfOhmw1NZc62aftc4sz0YIsu6bojUd83vKcbUDz6crRLam4Cf5cTox6y1vIyK8yOOri0LKUP2M7x4zBhNGiRYv2FBYBYbTvysqD64LEoO+s+CX+JEnoJJX5Os1pc3CNH6l05IcOYegE/MQV+vspRUskoyU736eH88XlcoBKYC8hDTXhYDxRDvA7/NsWVHOmoyzYOfCVVG96G+QMQ9UdxIceqVV4wOC5ZNal3HEsyMxQPVFdcaIp7pNrNbPLCHo0A+oyCjG/2kKE/XTh/Ww2oy7zqVJDt9syrS4TyMxD63VVJL6Satvgqct5P0nksjdsFz16f0SLFi1atAgIo337VpadQvCBMqeoXHuWulAiJZZ6B/wrLyDx9dudGUTLUXRedPe9aUcfy54uUc1WZw9LRjOU5d1i7J5lmglwgyEVnzhyYMORIOZUqd4+Hn0d0HNmoy7L2OkizAw8BJBhYW5SN8pR06ZBEkyGxrH0Qq5bBMtnekx0rk20mYdJklvL1g6ybn+GISSYz7vAp500nQhAFfe4CYgvnKnDWW7zD+zNSNkKRZ7AjhYtWrRoT2Ixy2i0b9uCue+cbYcYhFKUOUV9L5asIGEh0yd8PizkQRCyCJruzo3y3B7leDjvcwf0sf4kIJ1Xf1H/u0k2841iv2CLREhaDv6Jpqo/8zUm3CEUUOgJESPhZWgo+kFzgeF6xzW4KUlz5wq20H6FvZ1PtsqIE0iwxJP7Twob51XeA3qU7XCEu/l0o+Lx8Ri6Z1t+KspXXLRmxNkTrfXxnjT2LTYwl65WK2dCcy7TfuUUgHzyrogWLVq0v7hFQBjtm7eiCmykAYkAuZLt4yKHHgxuP1ZrnY0iIyD0Py9SgW7fANKkPooOUj3YoFz2Lw4Iv1qTHIuoQu9ARHxiYriq1ZqD5aRoM3SjC1PcbAOPS9KEiJFJWaVpoSXistLwj18vxK82QaQrNgLAEpNDDhZboCWLvHvZNZVyNS9GLRG1PoUF4TpRooOTGXG91pYkyWq1qlQq2ADkc8r2cH2NgHC9XnO5raJSurpcaFCwEOeZaNGiRXtqi5LRaN+nFXk5LCnhAB5SgvLPx8WBQSh4JywM7lDkNknta5H57pfsHz/BgzxX0bd/ZdumcuDzN8PcqHAQl9Q55qIKs/sr6BnvVIWXts1VB4eft49M3in2ETTko/ewbBaL71EFCmWqxISyEWyojZozFUEYi1j0mFc9WemXGjzOdnBZDZPnarUCOMQnK21y6U3OQjVtwI1EjIlGwswvW3TJTxpIGS1atGjRpEVAGO2bNz/CjevZjl7UX70u+tfBh9s3hmJUCbFwHNJ9JRtM5RJMEA+PSqZ7kQh2tVrB/YIuSza+IHNDAATKfihCsBEESiuPi3vmZjifhNSA+MpQcFIkQoFm7iCV57MgVpShds9HFgkxZ4aofcpOdq8U1JoNGa4sD5yXYaPyYaAJz9T3TryfMycAwgH7VSqVxWKxXq+XyyU+XC6Xm81mtVrN53McZLFYkBVMtVWr1WazmST1JDHT4KZeB1WYJAllpWAOi7jBrR6rmIE0WrRo0R5qERBG+07MCW8rEacF2b8gQ3gvt8zBV/CfAOGgsAKWo9SqWq3CryKEk0GDQHd+PCGOzPLQMtxRntq5xqIF+CK6xoHNPmKM5tjzBH1tb8F7F+QD3Y3imofPbw4afKaTGrmtRYPkK/0eE1pbphLNC18dZFstm5HscWhPt7hQFjXqQUFMLCAGV6vVcrmcz+fr9XqxWMznc/w7m83wLQBhvV7H4lSr1UrTtNVqNZvNurY0TTHv1et15BzS3KGavoLhhbKLokWLFi3aE1kEhNG+H/NzJASzJviBOrKSxMOICOankQyeZAvhLWEFXfpYfoI+yc75YIxuk6PLwlq79rHUuZIkYQ9wGd5ps0MGBv3UbaKM/uK0oV+X7xvvja8JEQrM9Wy96gcTOnl4XHFptku5ZSGHTromKzTVX1W+gDnpl50JDbZcLokGp9Mp/qVNJpPFYrFcLheLxWw2S5IkTdNKpdLS1uv1ut1us9nc3d1ptzuUj6YpzlZnCRxZ6ob5ira87TIg8xt/BqNFixbtuS0CwmjfifmhLw7TRexHzs0nA7dMJeoEzMBhkrpQIL1KpQIvqlKpTKfT5XKJPeEzARxOp9N6vY6VdcC51WoFCLdarfDJcrms19Wjul6vsQE5Fj5J0xRL7/v7+4CdaECqvS2ZnYI6Ut9k6p2inIHy2n3gWvlLWklNhS9lRQSUc5vyYCf75Cu7lcye+twNMyShrZ+ei7wsfkzuSp4pPgklQZW/Ci4SPUonOFp6qa4HKnPSMmMugi4U2G88Hi8Wi6G22Ww2GAwmk8loNMIsBy6xXq8n2trtdq/X63Q6u7u7Ghh2W612v99P07TRaDabTSxhYb7iYpaAhabN/tJVIZEYYeGXtm+o57+hpkaL9qQWAWG078ecRe5g1UFZY9AhA/1gwvJzcR2dmDBJEgTVAJKtVisAv/V6fXV1Bb9qOBxCZDWZTCC1gtoKzGGQJwSuA5ZrNBpJkuAqsAFFVqvVmkwmcLM6HbUGv1wusc82aND504+0dJbtfU/3r2l5iOVW6fiC7SmIwcv4LZszBWXx8NEzxwxuY+5VPOOZvXw8+ZStRc+F/MRXijqY0Pmk6Pl60qHFsorycZZwEQAP7N90Oh2Px4PBAP8Oh8PRaKT/nEynk9lshgkQC2QQjjYajevr61ar1e/39/f3d3Z2er3uYrFot9uNRqPb7a7XSlaKCQqGTivRNQSn6OwT76l8in6LVmLfUJ9/Q02NFu1JLQLCaN+YBZeKHRwIms5XbwYJQD9wZZvMn7KcIAMFQfQBCi6Xy9lsNp1OF4vFaDSCpGo8Ho9GI2quQBXOZjPsj9Aatp9QECeFzipJErhZ+ATcYLvd7nQ6Nzc3x8fHvV5vd3cXmBBwkZ5WeQ7DEkKpCPV98UwqX9x8muKLU6YlWU9Lkm6ofJg6leaXQV/blVh8pl7Vt1DV4nByOxVkf+Gv5AGE9JHZXN2n786con5S38caWs6TyzSnsioP1qcwNWFmm81m4/F4OBwOtN3e3g4GAwDCyWQ6n890bKHCjzgsZiotYUibzSb4w9lMrYItl8ter99ut/UUumk2Vcg0GEWu1m0/t3jRm9+obOGrUmt/ln1bt+Av+/6KFk1aBITRviWTYi25du6UFpQxMMzg4qTllHGD/iK9f2qmVpdFt4AGF9o2m814PAb1BygIb2k8HsORmkwmy+USfy6XS+wG4SiW1ak4lZwA6UFEA+K8kGNtNpuGtiRJut3u4eHhYDA4Pj4ejUaHh4etVqvdbtdqteVy6STxw3GCPexk5XF4wiJpbrSvxxP1zi6JEwfq25so6hB+fX7RHfrtJzplOONOqIRMMJFVySflNFduRhKxhRQjlCyKyYNkn8iSknYnn4HkFCcZTn6yWCwmk8lgcDsej6+vr6+urm60TSaT21v1IcQO8/l8tVpuNmYew7SjJQztNE2n0+l6vZlOZ/O5WgLj/Fmv15vNxmKx4EkpiJAB3o7d3bHf3sz01T17n2PfCsSKaDBaNFgEhNG+eZ87qBT1cQsTct43c4yfaAEcILKDgveDz3R+fj4ajW5ubqbT6fX19c3NDZDh3BpkV0zdTn9L1u9y2oxtwD9sw9liuWcswzebzevr63a7vb+/f3R09OrVq6Ojo4ODg16vt1gsdNp3IyItkY/e2S0OJbv1ffurDMhvoltKqeAv16yvybKHMQQ5giqD8sjb7bXoeSx3R7BicI3MOY5C+0SCliO+M3cUU16RIQS5NxwOb29vb25ugAkn2qbTyWJh9tG/UvMZ5xlGU2Piwnxo8a2Ci+12azYzQgY5O3HSDj5TJZSg2ZBJYKM9r31DEOsbamq0aE9qERBG+wasaN3d2cGRjEqCS9q9qkpQOiUZM1blYoqFyWRycXFxpe3y8nKxWNzc3IxGo81mg4VzRAkydbtDaRahCN/XcTCk1JEis9/JycnBwcHZ2dmbN29+/PHH4+PjVqu1Xq/b7TbiCelsPdaLMCjH/avZd5Rl9C9svqbW+8RRJ5K4K0plLD+512KBI3nwQWARkMt9EpozXSms11QWnWfoIGtLjLQhhhCGpa7FQuG95XKxXKopzkJpZUlSX63WabpiJUOkvILgvaETy9RqRinKNlA7WtSfRZ32LT+DTi7bLLT3m7Mn1Uo8+s39NkdLtGiPbBEQRntWe9jM66uhuBGkByWbR6Wo4yqRMCxqJ2VUhJdMGLNcLpFsfTQanZ6efvjw4fLycjgcXl1d3d7eLhaL29tbrY9aQx3K3Aw4OD6hIgsbjEjEArlTh5BfEU9S+4rfagdLuVCgCk9PTwFQ3759++LFi8PDw729vXZbCbccOVaRIqu8Wxxe4i+rHd1eBxjta7c89gtOMj76kjed+FCmm5LE4JYDQ05oPox0ZrbgMlm2IYSm/q+cZ1nug1kItB6SYyGPKBQQIAlHo9FsNkOmGXCDWPmSUdCoN6jXrZJGo7Fer+fz2XKpMioDN3IxizGEFDJAFiGFEn5HyY1vXMfuxMpKhe83A3K2ydH9+fboR/6qZuyITqN9KYuAMNqz2oNnOj+FjK8O9SvC8aT4E34GhUkl5yIFhzVyfM6V8uVyeXNzc3l5+eeff/722283NzfX19dIGDOZTLTToxLGsJqz01RZ8TkYkhTEsTwOcClFpMCZi8UCedshUq3X6xcXF+fn558+fXr79u1PP/309u3bg4ODvb29Wq02m82azeY2t6MkA40v0/o2/bDPskK5WrRvzjyK25Ff+h+Kn96xJnJfJ88fTn7bfBFEEVEZnF78MEK5MydAqkZtbuRME4EoaDCH3Idzp4xbXq3WtZpZWUtTVWUnSZL1elWpbNradP16xRYCH0qkun2/lYtgv3pz7vjnTiRfZCKK0+DnW+y6aF/KIiCM9kz2OWKeoDfmOA1BWCVty0V64i5ZUB7/IuX6bDa7ubn5448/rq6ufvvttw8fPsznKrQGeRfgEkldqGy21LKyVmGJy+ITmwSZxJPz+Rx74tRI7lepVAaDwXQ6Re4HNHs2m9Vqtf39/TRN5RL+nZ1fri4L7hwt2uMa8qA+4fGLFZXBJ9QviFcS6XfnzBMsrxeEbT5RXyIZZe0MJwXXnV1ByShzJltMOJvPzaKYVZOaDXzCeYmAUNfjQXXBzXxe22zUBDuZTEAJDgbDTqfTbDZTZQ00D2IHToB/mSnlbsnovXrjC5KETyqh3yap0jdt3+t1RfvKLQLCaN/MBOdUTqeuiWF+PLKsPn+vZWap4cQ2Yv9QKGI8Hl9eXl5cXHz69Onk5OSf//zn1dUVwgh1ej21Pzbq9TpCZdASIkAKsaj2RGv5FSWjsv0UkbKROIXsELhi2J7NZlBeffr0CTGNk8kEJaQhyur1eihHId3NO7WjReTJX/k19he85O+7n/0FJkeiSXNoKL8IofNzfwnGRzucx/iwO+mmnIKEFJM77RcHlPjQTYhaInjmLIQGsIjOfD5bLJT8gbZaGTQI3OiTe2D8GECIjfl8jpjn0Wh4e9vWaUgVPZgkNe6PjQdQfN+sjl2iQUiYw8uaXzMa5PbTPbARDUaL9hQWAWG0r1pJEsy96fOBMuSGIIprzNLLkRWunBORf8MGEB3En5PJBMnWP378eHFx8f79+7Ozs+vraxCDpOzgFUEySl7RgZrO6j4ZPxZOlBvYAWiQ14tt6XvBQAzC0BgcYTAYfPjwAai13W73er1Go4HowcViIfun/N45H/rshC9pq3zvFiVSz2TVZ/KT/LnF/Kvdc1+hECxSLzXnsiAqhon8CdAR12KCIVjOfFVERXp9YphBRa2ab1XG0VqVBRLDRyiKSCRtCD5Q0obyEzkbwFYrg4ShFEUM9nw+1xmS09Fo3OtNdSwikjAvm02sc2Uz9n2fr2/8YXy0KeXLTsLO4sWj2/c6936v1xXt67cICKM9rT1M3RGs7iVdE189VRRX46DBonlWHpAl5qEFHY/HSB96cnLy4cMHbAyHQ5teT5XPonsEdEePkMeX234kpCMMC3pmRUv77A15+VzdR/6b4XAIaHp8fNzv95MkOT4+bjabknkoui9xwbLctumf2HUPE4hmRJMHYXw89iTNkFNKsZpUOr7cB1MBVnO0bNLk+HUAIf1mSc05ijupHpeXXzL8rFI0dzH6ozuul+YEP9tpxwXMUlzqiDV4aeu1uVisfLFAxWqlkCFK1VvNKafQbML86z07pp+LEgJ9PVNKUdy+3OHp7uD3+m56BtlttGi+RUAY7WntYeqOoDoxSAkGZV2SJCznBvlzJ7pvsViMRqPr6+vz83OoLs+13d7eAg0CaEmBKDPy8SBMBkPnD+4glaI8qTw7RbDsMZ2AwZAMwscyriS5CAbwIGEMdKQgHwaDwXK5TJLkv//7vxGu0+/3VdL3en08HmODR96+Zr3fk19JcfavbYQ/UQjNd2wKDVoUqIeawYdFS0WPZf4IlwHAckM1Y70hvpIPrDRUY1+vjUAAyTOppSQmxDY25GNer9cldPSDAAsSqIgAQvzEEIb2urwB5ChFCUE5mxEfJkktTeujUVaUVWrXnSfC70aUlKCWXs+HSo8KepAi1TtTf33Xz477knJYo23ep89zmXe+qeW3T60d/T7gZcntjhbtSS0CwmhfowqieNk7AEKKImEcKBjURhIQUtuJLOooK39ycgIceHFxgVrM4/H45uYGOBDxMJvNZjKZOIleZAPICdDFoV/IPRkoCLeSLiPxJDAhfCmn9BmviLgRYlHUrGf2muVyOZlMzs7OPnz4cHx8/Pbt20ajwdaic4KlONiSYJRUUbrRv+A7rIg7evQTfccdm6PHc+yW5gyf0T0KpjIOUnNO422RUoVzKBxA2DAOU6/nqinY3JuqbEylUmk0GnhsEe7LVSRJRRKzBfUF3ASwQD+aFCVZ1pJwfUXfm8+HLFZqtTtmYznFcVrDvzLJMyc3SxWCM1Qd5cznn3Ovv6kso9J4n+4Q2nzlU0FRQMGjn+WxDvU1YMKgaPyLtCTaX80iIIz23PaAqdYJuitxux2lqAMLg4eFEc5BIHpycoICg4PB4OrqCok6UY4ZRbeYfRTxMHlVVdYMibjoAqLlQH1yf8YKwjUEXcAC9FJ4Jq9dFhXEVwC3EjcyO850Oj07O3v//v2rV6+q1Wq329VVoXOJeeCDlt+RrQOZtr25D2OSvwYLNrUo2OxreLv77flKWphj5yqb6kY0TCNCH4Q8+mgpX87wJaPODhRPYmlJVnWvVFT1BVlNVHBuiU2zma5Wq0ajUalUkPaJO9zZZtsbWQ9Z0AdGsGazVrpX5GTQkTCYDbAoDrOWCobk8haRnlxfkxMd653KFTHBRgIPKkjILRlE/Tl3NshQPTqh9FiWf6MFkHnwJyVd9EQtDH7yZVWORc241wYPJQ/7RebDb/E9GO07sAgIoz2HBZMllOwclGzx53LBXjoi27+QsBtWoxluB9ft8vLyjz/++O23305PT8EKIlwQuTqZOwFOD6hC6Qk5ZZSZzBPSL1kInm0joee3ULJzQmGVuZLwLLEDLoc0BXdgFtPFYjEcDm9ubj59+vT//X//33q9fvv2LX8CRhFKNuY4dV6xjpWk2r8T4PkO32O9BZ/ZEfF1hr5k7nGx1uNeYJHQ68vCQgYQmk/yaPDpoGxIfpmzIr/T4bWYkmo6nSBGToNDFXSMhFWo4U5hQqPR6HQ6vV6v0+m02+1ut4vjgMbnSpCcGAsan/UBNvwZsoBUzHYmWpMdjrlrvd7U6yo7qFR+ch+J9KjIgCKdH8Lq9RQbOJTuLrW4ZvlVo6d9rNFeMond+auiT0q+enAL5Z/eCF9D6ht8Tp9BqV70tnVeVUUP0dNNyw65XaJcLd+4E0xWnssiNxjti1gEhNGewx4wrxWVS/YP60ib8hqnsFKULwAuSCOvOmrN//777x8+fLi4uBgMBsPhEPk5p9MpECNxF/OL+rQkTwqfCY4dNvwSW8RjPILMKSoxHrk+coCobEGIiM/pZUqsBcQ7mUwuLi7AN8LFfPfuHU5Np80RI0lQWnRnfZ/AaUDR8vYTIcBnwITli+X+J4+44vt0l8Zb/wWFduU1RYuc4Mdqc4lHKPfxk9mw2Yy4AwKczWYo4z6dznSFminruXM5qdFoNJvNbrd7fHwMUIR5A5X6KAqQp2bUsWxDrVbV+VAxq6gfmU6rVGo6nrBkZMoell/Jh9rCvBzes6fOCEC2HzASl4D1JmywvAQX4/RMZtLJyLQ0jyUZ3eYgwT19JOnDhsd6HoPThWxbcMw/v3Y0GMUaXCIJvgueoj1+8/yFuZIB77zIgrcgWrTv3iIgjPYk9mD1YHDW9h1Eqc903pHSgyl6U/LndEYQHAg0+Pvvv99qGw6HU206CV6WXR1H4Ho2fSN5UoArOkBwhrDsLf08FOOiKAt+HoKO0ELE2KCuIOAfyxiSx2PNQ8eZltUs4KcikvDi4gJr82hVpVJpt9tIOsogn2DXBf2VcpJwm5t+5wAo+lVRfpGnc9qCLSlxGb8GIVCRo1nOq38pxZe/Wq+BTMBp+yLitKCJ586s1yDGeDabTSaqfulgMByPR6PRGMpz5KOazWag7lvaer0eaUCEFGKikAtbPJ2zZGNpOlYzz8z0qP7KySZTwjRaDXkOcoDuA/TD1MFAR+pafQApQKDZIE+I367XCgeymCHTliaJCrZ8rHtU8lQ6k9WdU4r/lb/PwzbulMZso8t4LLvvbPwFLbhsJGcSuQ9e2SVsoWPPzxZ+8Qkt2l/TIiCM9iT2sOlMru3JaBZ8u83KPdVNPlvFI5DWY85PlBn8888///nPf378+PHm5ubs7Aw1Bm9vbxE0yJqEMncLyT2uagtNlPKcWq0WPuz3+2jYzs4OXKV6vY6oIbpfDBSs1WqAoP1+fzQazWazer3OShiS1ZSFBJFHFMhQ+tZy2Z5+6ng8vri4+P3335GS9PDwcH9/H8FLPIIPdJ3XYbB7H2blb+WSmC5u+IvWj0gcBc/r4JagM1cOXJ/BnPMG3d9yZ/cZXBM/HWXuxvG/Ibnj41KaRW5idorQtMN9Vqt1RWVeUWLyyWQyHI60SPv65kYtMCEU+fb2luJz4CgwhJPJpNFAcXYVUgjjao7TyBJc5xEm5vs8GgwMWv6cKa8WiwW7l+tZDWUq8JiY0BEQ8ghEfVQfaKBrMCFnS5mc+XHZ/iBUK+/D8o3gk1KUWMu5I0UozsmSfedbz08q9kQopXyev7PHnk21UX4rxXLJ3bey3M2IaDDa920REEb7Gs1XbjifS8/DWTJ3tu/MKToejy8vLz9+/Pj7779/+vTp9PT06uoKOBDYCa4bF7D5W4pFZeo8OECSHqzX6wgQStO01Wr1+33Iw/r9Png5UHNEmOADZ7PZdDrdbDbX19e3t7czbcxRIQFq0F/EBg7L1VAcGWJXMKLNZnNvb6/f73e7XRwWrluRK+BkjQuKgp70rV+0nL+9evMRzZEkbSPDe34r0XdtQwI8T7ODLeRXwaY6Y+DzqUKO5yLiVDrI/IncwTjK60wyOp/PQQ/e3t5eXl5eX19DPjqZTFgkBngpTdPlconUMpgl+Jgzms4PP3Yu2esoXIVqLxpa7uX7Ulgnc0ytlikdwGESJTIbKidGToOSDxQyWEMYyljl4JrFE0lGnSv1dY9O9xbRgHdCoyAnX0Q5Br9yUErRatczTzJBXai0LyUZdc4exOElQgnu4wySZ5NORDQY7UtZBITRntvKdTVyH8fb5lfBOLcgICwyKkWHw+H5+TmUor/99tt0Or3Ri/mQic7nc/hkjpxJZtVzMCHXxYED4d71er3j4+Nut7uzs7O/v7+zs7O3t7e/v9/pdBqNRrvdxqGw1g5Pcblcjsfj+Xx+c3NzcXEx1Ab96mg0QqELpDxdLBbyqv13mAxWlJePWouDweD6+npnZ6fX6yHQUXbp9u+n7VmaoldsOdgrd62K3uuPvpQeXKGQvuyWy+RfBCI6T1MRZVEecvMU7Sn6pIS09Jv6pGZOGgJg0jlmiK/h85VkdDLWatHhcDjSJicWRtlBKdDpdLrdbq/X293dRZAhOEOWkPEXaILYyXZLDs2awvSeBcGSc+ttGxR1qRnCRrfbxQLWbDaj9p4rUBIKEv4BTEIWwQ2pn8cDhP+QGn3E+1tC1DvLakHmP4gZnCOXMEv3Opf/VdHZS1YxPtPupRQtmsO3P9rnWImEJNg/7OSgYP55XiXRon1tFgFhtGe1oDt1p3ZUfl5ETGGCDtZLID8mE8Agi8zV1dX79+//67/+C0rRy8vL4XA4m80GgwEYOSzz44fw89AwnIiODhqGqDxsoGhEr9fr9/vv3r178+bN0dHR/v4+/m1rg6wUXpGkHHEWhPxB3nl1dTUajZD1FGUwbm5uiIrhO0qW0vdX+Dl5Qhwf4UzT6XQ4HALBSp/MyXbjeyRbgkD/5pa8X4OgK7ggXeJ7OQDysV7hRXy1Y0Ww8FF4j/uagxOKruJOR/bpGiY/KYKpQbwq9/nM1Bol41mu+5gWijOxPZBk45FBiZeR5gMHgwHzFU91YhkwhNSHYwbodDrYhlC82+1iOYkKArkUFexDnTZGfWavohD8F4FArh8Bp0GFjjkNutYkSdrtNgIgIShdrVZMuEWdv+QVpXaUsZGY+jBVEjqiwaQZH+UxKbrSIpMQIgj5itYp/K/8RaKSfYqOXPR4lkyDj4ifnWb7M0mQ2pV7PpvmfJuv/GfhznvhrI5FNBjtO7YICKM9qzlhPyVqE24UxQpKFssnCYPHlPlgkFP0/fv3//M///P+/fvT01OZUxRBPiwqzcVv30ug9olpWvAh0ODLly9/+eWXX3/99c2bNwcHB8CBgIKMJMShkCyU9eXhDzUaDfhe+/v7QIYQnl1eXn7Sdn19De8TmWYI9nDMIqeK8YdMgUj0C9CLVskSGuxYHvy+npa8EXcutZaoLou+Knd5SSw/LuFwX9T0BYnB8o1gC58oAnObpjrmk5ZBcuzzuzd4yZlUT5/DObvi3iq6bJzdB7hI5JWZkCeE9ACPG6vUMMtFs9m8vLzsdru7u7v9fr/T6XA3Z7rzW+h8UHKBJRusbcM4QApE0zSF1h0SeixaARAiRzHinCX34lCFMr0WDogVKHKGEu76k+2j2J1jO+j6Fz3mWz4gQamnU5a2hGAMtjyoXHVorsedajz+2V0fdIpPFtHXz2zBftjmxjlI0hkYT9fP0aJ9KYuAMNqXsZKV+KJF1qAH42PConNR17Rer5FS5cOHD/+jbTAY3N7eDgYDoC9quogGyd3J9wFdHEI7fAI9VbfbPTo6+r//9//++uuvr1+/brVaYABarRZzyfg4k44CrpfwstlsttttSEy73W6r1SJmq1QqCCZkbgYnht4pSwgfjlJYUhY4yHw+RzgTziuL1H/ma688PqccGd75q+BXz7k+fd9mfFVuRNHS/pM3VZXNK2xS8C4/D0Atv2TzVW7mUZeSn2dUGXoG/TIAWE4veCqxEoRHHnTixcXFixcvEGPc6XQWi4WcLra5F0UI4U5A6AjvmRe02WwixLHf77PZTDparVZns1mSJEh5xSRblE4wnpDYEswngqixDUxILpTGybDySBZ8GOVqkTNt+pxS0dKSL10JrlU9uKlFevXtr/QzrWTK9Vsiw9efqD3BFjondc5efi9KHplyWjjShtG+A4uAMNpzWLnEn9vYkHKdcveFxykhBlmjD7Zer6fTKarP//d///fvv/+O/KLD4RBhe3DdoClFDk8nmgU+EP6FH8P6DTs7O+v1GsTgT9p+/fXXo6OjdrsNZRQCCxmTw3V02WC5AIzV9zRN4Rg1Go3d3d1Wq9Vut3Eh19fXo9GIfCPjGHGlKDGP00k9LbWjCEREUOJ4PAbURI9B/MYmsabFg9958h75uix/GMi7Jr9yVMTOVyV4rEjG+WC7U4/n0xFfxF1wnEhHyVbk6Dz10n7Ryn2wx/zGlIOcz2mVSw3ZQ5sGU+Mg26yhWr1eVypK/XypB2i9mmrsh4dL8fBano1lF4T+ksOHJhPbrVbr/PwcogApT7gvHeF0y90QNz8d4XTAoqvVCnMOuUGZWjlJElyUDLSWTBGJQXCDzWaTSba63S6QIaIliUgl7HzEZ8efE4oIOn+Skd1SQuL5HHtQMurMfkHxRcn6Zom48Ylmm6Kr8NvsXOAzk4RFXKuPpcsnvXKkfecpokX75iwCwmjPYffSbJSQLY4WxdkIHodKUaRRAYhCTtGPHz+enJxcXFxAysU0D0w5A1go39lsPINkGBLTbrdBDL569erf//3ff/nll2NtCAGCr5OmKdlF5xJkgx08DC8KPQa/ar1e7+7uDgaDnZ2d29tbma+PZTDker/jcPACoTWFcBSr+/g8mOz+c6yE/XMWmO8V0+/wWsHg0qdAZcGTbknIPL/5Ppkje35EkLy9OedymlGiiAse5BHRgisLt5gwG6v6P7mHt1ZTAEKv2iggoR9C9RDZp2wBHKhREwyrTjBMDgjGQ6jw5eXl1dXV4eEhdiM4ufMynWckyC8VYWznOJi10BuMY8QkRp1Cq9UajUYopIFIQlwvJlIeBzMk5q5GowG5BIISgQybzSZrosoJgVNiMDj8AVYEkouwnPNV0YAMHtaZ30roxDuHetHO/rvy0Ze9yi0YABIcZs9m29+vojtY0qtBe2ZBSrRoT2QREEZ7ErtzZrxzhi0/viMWLTkOAR5rLXz8+PGf2m5ubhA3KIvOEyzxtziULF1IKAioBsdod3f34ODgzZs3P//887/927+9ePECVB4jZwDncDS6Pj6ACfYeASEC/NI0pUPG8Bt0GtEgl/DlMQkUsdJPGRvCCOGq4nOZEV6uOt/rtVfkURXtc18Lur9BOOHs/wxWEqT0bG0osW2iLp/ayykP73FctCD1USQPe6zmZS1Eok7bHgkIs/bkJZdGPqrnkKWYWBgWKOvW8KTI8DQYDK6urq6vr4+OjuT+flKZLS3o7xaNAXzOkDACQkxEqJQzm80QDo38N0igimU1BGA7oY/Ae91uF4AQGzgUjtloNLAPVaNO8tLHwvzlSwxOV8i+Cg7IbRaAnH72fy5PETyyvC8ll+aQcnJp44mIVv65PWStPKX571PZh8FPnB4r6fkg+VnCFkbaMNq3ZREQRvtCETjFvw1+wmmaLqAzyzvGvCxM8LBcLm9ubv7444/ffvvtjz/+uLq6+vPPP6+vr5FgE6lEN5sNEBGPgBV6ZkcgCIT4Ew5Nr9dDQb/Xr1//+7//+08//cQQIPg3UiDKFpaseQe9ZBalqFarSPfXarXgI8rENvIlx8vnSr/sVYYRouwEIgk7nQ5T7zjyQl/RVHITfeYzGAkmN4qixYp8oG3cjjthz8OsyBWQpyjSSj0zGvQ9UV/mKj8puYpHN9+nzDWjAE47l/PI7ckrBtUpeC7duGqt5oDDTN8ouhfP6VrPJ2q9abGY2tRNJoJXo0P8sNVqcSoDY4+QZqzRzGYzRNkx/czdV5G/p37vldCD+IRhcpjBOAUhoDFN08lkgjkHc2C73d7d3cW6EjWxxHWMHgQORF1WcIZQioJ1xIzKlMtojy/QeLAF16eCtHDwcdimM33uXW4Hl/+CLO42D6PfZhnr7iygPBY4CfaYQxIGn8qSO/gUk0zJJfs978fJ+6tj8vNt3lYRDUb75iwCwmiPb9tMgv77tXz6lt/eKRY1a/PapQAJNp/Pka3h5OQE1ecvLi4Gg8F4PJbEINNsEgFKNlJmWWDyPSxs7+zsvHr16j//8z///ve/7+/v7+7u4nMHtZb4YXd2F5ftmYCUp8A+Int7zvV3XAe57s4C99PplPGT+BDC1OAt26bxJekHHL+/SJ8TpAUcx6hk5xJP7lEs6FCWuICPyHLcy8r7M9hRwW586kb6DWbpvHL08vk31+UH8LDYDfUJug6PIRqWn4UUfFIl6TWDp+cOxvFiVlmuVsg6w1wpG6vKJm+PqF1UgsEqFRaquBxzryvdxg++0+QyFua9RqOxWq2QbhThkbPZbCoMgBDy0dlsBqkFJ0ym1EJaLK5kARyy6r0UwG8pBgla0VKUg1u2Z6q33yi34LQmmy2p76AgsygY0rn2J5p5/CnlTllveTMeECJbdAq/YZ95B4OvEucFVNKYaNG+FYuAMNrjWzlsCEIF56stZ/PyBsD9ggxyMplcXl5+/PgR3CCqz4MMdJSiwfA56ZcQasKDabVae3t7UIr+9NNP+/v7kD8RnmFRHy9LZsx7wGuPgJD5/VgizHEZ/Y6Sy+3UiwItUzWKdKPw55BNh1lt0OyMM9nitR0U2Dh3R/7JfaQnVCTCCXaOsxH89tGtiMYMNtX3IZ4fIhbF1TgLLnd2+OM2yWmb/7nf+C356gf3MEMH1UEKWiwbhq1aktQ0riMnz1L15NllkipcBVagWHIGTyWCCbFi9egxvXdfvljO4LTDWEdI35fLZavV4oobZxJUq59Op5VKBWp8W3e+IhEgRQ2yfr3M0RWkzra0EgInOMlsQ+kUiZllj93X/AUjR9woA8KDP/EvPPikBDnGLS2oqHRCEpyL2kbmGpw8H3FK9DVEnwMIfQTuN/6xOjxatC9iERBGe1YLvhuKHD5/5pWTbNE8S6UoebDpdHp6evrx48dPnz5BKXp5eTmdTm9ubrCSLTESI2dwHATvwTuBwAn/pmm6s7OTpunu7u67d+/+8z//E1lkpFJUFmV2ssg8zKhkq9VqcLyYsAEuF8Sx0t10upHvSBaimM1m9XodZCkDC9l7zDVKlmB750mGXzogMAiNgiu7d2IAf7HfZ+ce3dgYPwG9g6+CzsGDieIHt7ZoDT7YQieFyXM6NHcKce/bqu0Xj/wNuYPzm6qN5cO/a0tprjUTaFBTkizm8+lkgsdqqpdaMMk4DWBOTgi51+v1aDS6vr6+ublBGuFOp9Ptdp06b1vawyGxfeTZA6iQgZlwvV6jHAWE61xKA6DFBlWjSKmK2cnRd8ipkktswISScbrvJZer+ErWHfyv/EWTIu3oZ1oR5Cua7oJNDXbFg7WjwSstEoje2T/+2pM8mrzkxwLY5ctbd6JBf6r0sat8BZSISCMsjPb1WwSE0b6Y+Z5KUWy3TxWWO4VclceiNfRXV1dXZ9qurq6gxSLycZbtg8iNFZbhGEGxeXBw8OOPP/6f//N//vGPfxweHu7s7CBdHn/CQ33++0AuIWOBlslF/ReVzMogHQi0hKEmsk7aYDCYTCYUzRLFyT4POpdFuqzg0q/PDG+zpO2v65cLvZ5uXbZIlyXPXuRhfCnVqGxJ0N8qUtt+kTYXdZ3/YYlt32bftS255KJpRyq6qxryVfU6yMrOQs4iSyYczaN0pr9CrdTr6+uLi4t3797Jn5Bt29IeZeZxZl2oQAnYOHlytkFP8k+mVMXqGwAz5y7OkACBWHST89v2qXTK3yByn+2RUhHGeKLlkiL4F3wciuZMpzec429PNftQbRs8vH2fBH2AyiNZOcAuR4NF2LVconJnh0fCMNrXbBEQRntau6+8sGRl1/lJ8MVDUAc/DCkZbm5uTk9Pz8/Pz87OLi4uproaGLPIMP2MPCzlkTwyw1qwjN3pdA4ODpBQ9Ndff33x4gWy50H4JJcPy/PHbG8yLSFT1UtA6LAcPunhuF/QqlE1Oh6Ph8MhK9SDdaTfJtMVlMA2B5Jtgwz9jaIlfH8AOAd8tnetxJwOrPUXL+TisfTkviw+vNNtwvZzyhSfwoIrSiW2DbHgnsCjO0yy380GZfvwiMmpSeIlZwWHJCFSy1xcXFxfXx8cHABKQVP64Fyjn6+7q9frIDnl5EPaU6rK5eNAZEjFAbPjMKExsK6jJn3Yapo/9RUtSJVjxZK1kmfo/3LE4lNSJVa+wFq0c9G35aD6ATernJh9XNtyErjzKzlmnMYXLZs+6XVFi/b5FgFhtCe0O+e+EoFWcINTalHBYio/sdtsNkPE4GAw+OOPP05OTm5vb6+uriZWxwVfDQE/0qEhGUWxKPRRaZqiynyv13v16tW//du//eMf/3jx4kWv10OFCbykiQMfq3wW20auAIW/4D6iOJh0K0t6WL6DGVKIcEpsILdho9GQye4d2o1Hc7B0EWHotEHWrXYCR30FZrlfHoSXT0cPBl0B55NtkJWzSv0MXkJROG6Q5PTX0Z/Nofn8Oxjs83IKyBl+wWGsPtTUH3/F/3BnPJ4VDQWrGu1g4YlCSnBreATUhlafSm02mjGbzZIkGQ6Hl5eXEIcH160qz2KEuPjTpyhlgQpn/DjALE1TeQlIjsWzOJPnfaFg8GGUH/po0C/MUzSPPScU3MaKAhrvlF3cOXiCCgh/lmBkowxxvBc36MP1r6d7i7QS5fCb3evs5i80RIv2FVoEhNGe0O6c+4Kk050HKXo3S0REvehkMjk/P//zzz8RQIgK7FiDN96bzdYtlVHyTya+IwptNpsHBwf/+Mc//va3vx0fH+/s7CB5Olv1FO82GfgnrxEXIkMHpQ4Wv3X4Pek34LdICwE0iEgnqRotwgDOC9KXLQUpSrm/dIJlp5UnUShZO3+elfsi98Vphu9PlBzzKZscaFtRI4sa88yU1FMcqlzx5a/0c+2J/p0zOAuHX7VaE1lGncczd6I8tcjnl1p3LGANh8MXL16AT0MeqS/lVvodKJ9Kf/z4/Ll/HBmRK3vyAatp5Vpf/8/yDdlsh0v8GoxN5YJd+c5bApIi3WMRsPnMoVh0nK8KOHEM+Kzylu2MDGG0r98iIIz2TGGB/p7cKIpMCIKHklNzGx7VbDYbDoenp6d//PHH77//zhQyEg3SA5PBKlKKw7LIbEOr1To6Onr37t3PP/98dHQE2pCL6L4P8VjGVz4aD25QhvyRQ5B+p/xEOli4ZBnRRECIjfl8nqapFHTJqve+b1dOCZa4hvcFe0U6pef01ZyTljf++/AAfL3r5xyLQOgLWkl8sjuidAmKbS5ZElxcmpFPKEl+Ki3l0yQXdDiJXV5enp+fv379GmTana7/k5rsBM4nd2Z/2eZR5QQll4ceq81OA7afZIIrJl+J+RjVh21B256qeqJ5tXyl7Jkn83uZv5pW0viidZDPFNlGi/ZEFgFhtMe0cgpIfi43nK986U5JRhMYE4rKTHfj8fji4uLTp09//vnn2dnZ6ekpC9Cz2KA8glS/cBkeakyZLb3Vah0eHv74448vXrzY3d3t9/vYGfvI0MFHNOkFop0za0zYgM4BVpRIT3a4XEuWAk4muwdbiLQW8tYQYQbf1lJ8VSTTchbag9ygE3EXXLB3UsY/pxrH8cD8iKlge3yH0vcGHuYWPJvQ1CGKP/ekd/388y/Kp6lLrsKZW/whis9LxphcrIGhXES1WkUhQayk8KkkYeggHzn+MZWhgCqkp1id4SrPfbPLPLrlSNS7RqPD//Nzpx8+Ewr697QIDfoLl8GNr9Zld7Cfo8Vw9rxXVHDJap3/JnpAz7Dl24i0v0KTLaSIJrjYEZxAvqErjfZXswgIoz2yyWmuRA3C98E2GhUnG4qUdMqdmaMPAsjb29uTk5Pff//9w4cPV1dXCJOTIXYygAQojmv2PB2ZQ3zSbDb39/d/+umnX3755ejoqNVq4edSFfl03oPjdCL7i6xRJt0CKU7jvzJIUu7JYzppV2X/+E6bPF0JhCsnZJyb6C/BliznB/98aiuXn93pE5czive1p0694Gulvmb4CitBeiWig+DoDbJDwflHKrpxKKytSAm3PJE0/zniGk2lUpnP58PhEId6CgLtc0z69I4+Qlr5Q/GI11KSPSUIBe9UEX8l/ewYW+UkXn5AChnfgsO+KNfOg9fjSqa+r7PPg/Oh9GTk9LjNJOMseT/7pUSL5loEhNEewR5RH1+SVkTuU9QMQEHUGPz999//67/+C2gQBRWkrlJmSw/CD2b1xE9Yg/5nbcfHx61WC21jid77+hD3EpBI5AYqD4CQENHZ09kgZib5wB/Sf5WnIMFY5HDIpeLy++WsK/s+hJSz3pco2Ga3ImHnZ1r5Jd/ZjM9BVj5F8LiOVHmiPL8Zdx5qK55Nf212fkYXybl3/vzjb5S0jospeDwZpusAPxnZK38on0oeZzgcDgaD3d1d5o4qv5bn4czlhTiLYs/D2MuWFDG326xabhl5+HVa+VB0divvqPLr5ZzvLDUSlMqNLVvutPAbgkbbzPklApagSORbGXLRvleLgDDaI1jRy6ZcMurLRYLLk452MeinMkoH2Gw4HP7P//zP//7v/56cnHz48AHRg2AIHQkcjkDxFZLgkQGATBRl6DudTrPZPDw8/Omnn969e7e7u4v6E6iahffiw5SivjjNN+kjAhAC91arVco7JZCTy5ZIbCi1rEidKmMm8aF0SR1lnXQCHHN0WbK6muNby32KqL8gT/gwc1ZqHVTsX8WDT+T/vOR9z2v/TL1Q0QHveyHl/HxwjSa4T8nBXXIsD/mwrTaYxMgiQ4eT9F1GXDtXZHySqmRqcjbkdcnOBJajRiB4pUwbgz+Xy+V0Op3NZpVKZTqdYjmJLCIbDHSHR1LqzDlKN5sNaqiiJMxwOMScg/nKLz7hj4HgStO9RojTURTnS42cs4GuYLwxqtewZoYUXFQey+yRgtpIn9UJahNKrt0/oHPwoDzVeTxLKvf46pKiEbvlYy7veLCFJT1Q9BKXn8jodBksgD1xu6XIv6Sdfpc+lvkrFEVrl048QhG/6s+HjgNTMkP6ZWa2XCaLFu3ZLALCaI9m5U52uU9WvkDrbDiHhTHl5nw+v7m5Qejgp0+frq+vR6MRKDXCKoltgsckJpReV6fTOTo6+uGHHw4PD5vNpozhuVfcoP8acHi8O38IAx0qK5j55nSmH7zn6D9lbxASUzfLQxU5GSV3TZrjlvl/fj4UlK9tGenht+2xXsP+O17e1uBKxMNOIf8s+uq+h72TRngAHSrHVa7//ePnwQbulxpvej+J9xw0wjWg8vjG4OUEQXv5hQePJn+OiYhLNqgYIZ9Q/qRIPCaNV4f8WJADEKDKeg/OrXT8ez+ZygOeLykr2Gw2KEiIxSZUviHwk3XnZQzznbfp4Wbrgchnzb/S+z7s/iKXXJ2U10KizNdSSlrYv1NBQFKEEu/VdUXT8n2tCA1yqMsSTXI51cHhd57iETEhu1rOG1LL40htnZnZebvddyA5s33RdX2msjdatEe3CAijPYLda0ZznHX5udwtGGflT8TydYv3083NzR9//HF6enp2dnZ1dQUCTS7OUb7lEzg0vjbYDJSaeP369d7eXrPZROIZQsEtXWRuBGNvnJeQs8zPbdKASCojA/8cvBEsO8FupCZWhkqSr3C6JbiyLpsXXPD272nRNT6MvijqZ+mAMi8rj+wUvJaO130DtHw6IniXHWgUXEi+7zVyo2jVv+gn3DPYZunF3qluLfrWd3zdBti9pZuM24RQXqcNREEOtyw72Rm6QbuXuDffUndbNoCGzEyLxWI2m020OWjQyUhB7giXBuremdawyDUYDIbDIVJYsRCrxM9FI4Ed4uQC3d775JFlamIQoVDpS+UFj0l4gB9SgACydPthb465Uf8L/iTI8QYn9ns918787CxVsMPlUCzp1aIH1nlS5GvRWSwrojfLL9m38kjaO7uFLyCMdmbhZoFNvEewkugvNZbbw+B68CtZPtdfzpBrE0XMnnwp0BMIQsRt4F/RV/cifqNFe1KLgDDaI5iPBoP40EEsQckof+7408EDspAgqy9cXl6enp5eXl7+9ttv5+fn4/F4MpnMZjO+wKiolMeRkXJS0cR3W0vb27dvX716hUgeKdyiIDPYOeViFSdZJXbgJ9xNZqKHu4mCisg5QVJCphV18otKRA3gx9Sp2G6322ma1mo1/Ouwo8G7s81lOoNEjo3gcrj/w3KjSs3pWBLCTLsKF4HMJ71k6XjJdDvBpXEyBs4odZb8JVbBt+RMnEV0f5G4yF+XIMGhLzhUip442R7ngI67KZcJnHUE54BF9yJ4ducur1crkDpVOwYodGYddj6J9Mhxa7Ajnj5sAKWgWCjwUgksDHa47FWfK5CLBfJKuTOL2QC8XV9f397ezmazer2OyUeuLkkr8kT5ABINQjU6GAw6nQ5uDR5/h7ThoRwlqiyj6gz+ImmDbKez6LZarVDCZz6fgyocDAatVguHms1mnU6n0WisViuI8HFT6vV6mqYAh5DLFukJA3NIVf8vBAv9Bye43rGlz823A/hYmbeZvSGfOOehZpOCiynhxZF8h8v5h/eOpKtcs3N+HpQyFk3gfu/duaTr6Gsw4LEogFcwnj6cvdlsYmCgii/v9eenxg1OKcEHAW2TAJ5okO9ZVpziPZULpuht7EMCXMaGyJ2LboHfcrlP0VrqZ/ZStGgPsAgIoz2aOb6g70XJr7ZZyPQPG3QF6PcvFovxeIwy9KjmDG/MT6EpW+KzGU4LgZG63e7u7u7Ozg7AIWsPBhvmXC83SjCDkxXGaZ4kBvkvslYACUuvxcG3/uqyhCIOPSjNefn5N9c5hdP+4A4+cSEbc18oyJ4hACa/BIeAbjrVTTgFwAPDKbEhX/OOGlb6xDwFXASHMWCiWnqWcgWdmPNOgrS8H4podpokh3HhsqkS1gbpDqKRYKBaSfO2WRmRf1eB1fX9w2IHbhZUiHTiJAmGX+MOcv0CB6/X636dzKDdSQ74Q1qiQWdIMIwZlQOxCDWZTBDlK4+PNsulLpmSyj81VzfAECIWOkmSxWIBhYKcHBxAKAcbPFqcFHMXh30R9ysRYLVaXQqbzWaDwQDzLTJ4XV5ejsdj7Nlut/v9frfb3dvb6/f7rVYLgda1Wg2rTvJZKL877oiqIsC08Cdy55Ksp0GTl4w/gSjwUMt1JRmE7PRzCUhg6REpcuZczeEtj4NewpgBuJInDXYCfysByZ2zyjbTDlvIuk3QRcsNrJMmSYIVAYbl30ndP8yc9ynf73LQYgGCESW8iXJdUq6eyLuJW8DlJ9yC4KByJs+iVdHglFLiI0WL9pwWAWG0h9udIviiNdryRbISMi2IJ4mOJpPJ2dnZhw8fPn78CAKNVRn4AvMX7YJrtzIeBvlFd7V1Oh0pedqSGHTcdxnPIOFE8DUjl6X5JkZpDUpGyZT6LIezVu17DFLhg3e5dGiCy5ySLCqXyjjX7qTN+JylUH8hVrprZIOJCfGvBIS4UvipoC9IQDkZRBzHTtIFUiwX1CaxM5FEhCiUAsgi367oqn1eSz4yEuxJXxYOJXsAJoefA1fkmJRW8pyWN9V3hnABsm77XBtgIZXeLI/J9sNLAwWRpik25KnLwcaW/SwvtnwJiY3EIwkeb6RtMpkEuSP2v79QIk8kY/Amk8nNzU2v1+t0Ou12G/VRyeg6kwC6SBKDZG9wXnxLZ527OdfF5wjSUOpgwViOx+Pb29vr6+vLy0tsYM80TXu9Xr/f393dPTw83NnZOTg4gNJ+vV53u10MSzayvP/dtQ9LEvrj0J+Itg9Lkw+1fLq5+iZXK5zAOYm3nUxdPLicE3gWh3bDfaHYEtwabhzeR84DWIQJg6/jbTSN2/QSw/XxtE6n08lkgo3xeIwZtdvt9vt9gH8Q2pLJ//wivc6UwrFByIcNrAki0y9GL6YXuAGcip13H9+G2MDcglUMudhXRK0HNU3lDsw202m0aM9gERBGe7htqTbxPcKiDRlbL1dh/QVX/orez3K5ZNzgYDC4uLgYDAZAifBppPCM3AibTUaFx0cGUSxvw+nkm0M60EWX7Ph5/IQQQhJZsj8lZuPnbB5exnj7wjtBbXqWrgZnKD0PqQOEU4iXHy6Qbz4Sg1zldVJWOPDGuQVFnKHDtsmrk7hrmxehv5ouIStXfwGYpY8udcL0TnCBvFjpBASj0ZyzO3QB3AWMDbBbuLMYbzgsg8TwK6yg0zvf0pyYNDnS/KcJLqxExbx91KFJtipNUzSGOJlDwjmyL5r172AJG+/j58ViwYyajL6DDwddNBw7epZ4NtvaWq1Wp9OhlyZnj3s5WA6v4kAOSbricxJHuHzwZjfarq+voX2lzExeuBxLxGOSmWc4VqPRQK7R5XI5GAwuLy9xsYTBMo2N7FjJdUiSEP8CSONhaTabzlWzH6i0Xy6Xw+Hw5uZmMplcXV1dX18DDQ6HQyTuwr1bLBbVarXVaoEj2t3d7ff7x8fHR0dHx8fHBwcHx8fHGGN4WCQ8KGIpTYdX9Q5aZ1yiML+v+JzPL2djwgmCQGIJbENKiptInUij0UBvE6VDHEtBAaMugUZwcH6FDgHDhjuFlw4AFXqMzyAXa6SgVI7h8kdvm27xTb5ncSGTyQQy5tFohBS4LLxZrVbBD7969Wq5XOI5lSGvJWsBJQ3gLXMmf2cmQU+CsURsBRKPX19fY2KBlhs/hM4ZUSFUHOB1wFvQ7/dByHMBxY8W8W+BnKKD3pEf9hklo9G+rEVAGO1zLRhsXWJF5IaPPfxfBQ+Ct+xkMrm9vb3SBscFb3GZXNRR+8jkk45fK2P2IBDt9XrtdlsihyIk48gLncTc8h1WRJ5IpCrhhyNb4qWRQuGSNpefJZaWbp+UPOFaUF0Drz2iX5838K+3qAecnwRlq9sMGAeDOcpMLgbTgaNyD70hMz2yJQA8eOvD2eInTtIL4jdZ75HsASEBN3i72e04BTx7epD3fWpKusWPxWWb0SHSl808bHGnSJYidy4TnKCjyJo63VJyFT7A8D0kGeqzWCwm4/GtRlPQRkKLiKeYfjluOry3ZrPZ6XQODg5AmqGFpHkZ4ru9FQES9IOjxOZ4AOSuVqvT6XQ0Gt3c3FxoAz3IKCbn+D56D+bAoMHVxikGgwGgMtxTKX+QlCO6IigFT7Xx4NxTNokzyWw2w424ubm5urq6vb29vLxE6ubb29vRaMSlN6zCANvXajVAxE6nA5A8Go1msxmwAVW+MuCzKE41RwxWyl4T91oCkFMKPqFAlAtJeHZub2+h1MVQJBOLyRPTBftQKg5k3VfcHXSRlKswQw/nFs5LWOzY3d3tdrug3XBfuGrj9FtwJAeB8cPmHLlAgNE4GAzADN/c3AyHQzytuIRms7m7u4tX897eHtYgqJL4TJLQeUbkBrqagu3xeIyBd35+fnZ2hs9l8C1fc3zx4elA/3e73Xa7jUkmTdOdnR3+kARj0bWU3JTyl+mD+dto0T7TIiCM9phWHjHoRz1JdLTNu8r3oiihvL29PTk5udU2GAykFM15bbANPk7j+itXEOHEt9vtXq+Hle8ilZc8lKQUJInkY0XnumBS+uUsfHLpWm44EZJOlzphLc7aqmQMiAmpqHSuq0j9Iq8iuEjv3GKfBS03p1cBCKWkDZ4WnFf8CTEt+Tqn/bjAer2+XC7BlIJDplTYoYYIxXleCnelNlXeDjKQQC/tdhs/Z/AbMe3nwD/ndsvRQhHmVBsVU06pdNAa9XodVBv8IeRokXdNJo0MLtYECUB/g2Ndrrko53I4xGoOACGYB3h1BBvAG2Cf8Eiibvt8PmfiByr3OIAfTBJKL5PPsuxn9uRisRjq9p+dnZ2cnJyenqLPURWGR3ZY9ODcyJMCy3Hg4fKn0+nt7a1EvDKgS2oN4Hk7EkQ+7GC0sDMOJRXdGD9YTQMKhd9/cXGBRbfr62soY4fD4e3t7Xg8Js5h/iQcFtJ9ruNgWU1WpJD6Xmd4VyvV9UZEVlc2tWoNMYRFbxnWn3jAlMKehK4ESxJklijEcKTgnCrZvRx+vBe8QVyUoRCajwDaA9qQYXjg2fb29trt9mq16na7XAUoF5w7mprKY5hcYwKyQucAEGIwYMCD4ZxMJnI9tNfrUZ/ysAbwpS/vl6MNIRqkchs8NlLNAcfyqZT5gTgN4nXQbDZbrVZP2+3t7dHREaTOOzs7TvR1eWRmUNLvX9SWYqto0Z7UIiCM9rl2pzRFvnqDn9xXRCFpIhwKa9U3Nzenp6dI8TcajSgz41tcus7BWCBqBSmWQ553Lv06S7NyZT0YNOKwRrLHHJamiDCESdcBK824NEl+svQzZbF+tSVJ0OHlR5ES/gUyxKux5E45XScHQLD8rjM25I0uCUJzRLYS9zK5BQzIAZkPsbRP0OgEBEqepNFoLJdLcHdMiAefjM0gxiP2k0UvqdRlPCdBF1xtAC0E1SDBBrRJAF1o0pZZav3eDla3k+wl5Jej0YiYEP4urpGUCFb0wbm1221sExkiIwiOzFHha6H9ZQh+4iTAdCItFxqygnq6uLiAf0lFIlgagAr8FkO02Wz2+30gFqaOwD0FDcusjPd1rRxGXeaikI3Hv4rbnEwWi8X19fX5+fnp6enV1RUazyUJ52ZRg+CLIyTMwCXQewbXDaZusVgAuuMrKWXEPSVEAUoh5880wo6S2amhxwkW4YJwrK+uri4vL8/PzwGQLi8vkbULuB2sIElCGQU3m82YBrbX6zWbTTYJg5CPZPAdkX1YqYIkLAof2Ab8ENjLKQW4Au8LQEGIfjECB4MBLpCdTK0mF30AsNHD+KrRaBDxsjIHJiiZi0VmvZK3D/er2+0eHh7u7e3t7+8PBoPDw0MEZzLNrGTCHaK+/N1634eCKxSc9AaDwdXV1cXFxfn5OVIKkSEEE9jv96V0Yr1e9/t93miZSfteLQnmj5EVX8hmY9BeX1/zqQTI5yRJUIengJgQehmw2fv7+5iRjo6OMIXu7OyAs5WJBoIoNyjf8DeidjTaV2IREEZ7NJMqMn4YpJXu/Ep+4pcBcHJ44G1KDxKaEAcsOTFFcgHVd2oJkLhk2+l08BqgayWTrzgNdpb5HbFisOucZUK/3rTTb3ylyQvk5wSrTlIZnsWRvEKhBHlMwxqESTIAyYGUQUTnZHfg/XKUouWSUd+HJvVBdwr/Xl5eAurAK4WsC86W1ENSzUUvGWiHcF2uZKNh+ERyL3AHMbSYYcJBpGThcKg0TeFV9Hq9w8PD1WrV7/fxOSCr7NiCpyrraumyO06GBM+SwATXMRqN6AyhtSTc2EVAg5Bf9vt9RKkxuoxn4XjwW1L+QMmmSnpQtVPDaXBNIByur66GOjAJ/BJ7m3LQ6XTaaDRwL7Dkj0qh6GrcMkp/72uy8aS8HF0f3VwEKQEgXVxcwAEdDAYkNqVOwb+t8qlx7qbE9jKHB1zP5XJJ2SclwTyRXPXgaIehGAC+kupH3ilJfjqZcjDBcjjhiWOiDifhCoNUobrEjet2u4A0/X6/0WgsFgvpSZv7pVOJWj45qzNhJKNQj+b7bUvXWc7MXGbiigMIWCxJnJ+fQ+lKJaSU4jssNJE208DIFD4AvUAOePSA5aTQV8od5WPSaDSur697vd6+tuFweHx8zMETLAQfnDe276Iik1oVrI6BPgX0ury8BGYGIEQXMWI5TdPd3d1er0f+c5uSocF7J98LjlyfS4RgBQHpcTdhk8kEo1EiSZnyV0a24/alaXp+fr63twfQ+8MPPzDCEzgfa09FnKejNHFuzTbT/j3vUrRon2UREEZ7TNsy6+A2ulBJQQShFF1kvF/hUOJFK4/AN66ksKRIyRHaMakGtqvVaqfT2dvbQ4pRxm/4y9hsrTSHOZGdUJTIMXg0pyuckLYi3jWo7pNeEXiVVqvV1YbwHi7eS9xY1DyHhCy53T4g376ehKy0gYgmcEpIbjEejyEW5bq7LENPWMvcDAiWI6fK0gXcmaOCelS4jACc/IQiVbAK+JdhqwB+HW2TyYRqKyZnl7XmtvGNSgSZ0ldjihE2GJgQfjyljCDWcASsCEAi1e12x+Pxzs4OiE16XRIQSk/UbxjT5/punE9jSgUaAuRUN2rFF+4s9aI8C28iWCmcC8QmLgEcVImvXN69kq5xAkRl4VO2HA7omTZAiNFo5ORHdZxyuURSNPjxp+wlnhFAC843pcuc+uRtIiDEEg/WegBRfJ25I4WlFprJRRmYLZkuGcDMZ1ZObgBaaZrCTb+4uNjZ2en3+wS0vHZ7q8S8qgGh3CGbWGxIoe9tF91fBxBKSI/n9+LiAizo5eUlcCxAL+NXuVwoV8pkth6ZkYsrPgTqjHCWmn92OHYg34VuvL297XQ6MrYWR+t2u61WS5amuNeL9V4koXyEORrn8/l4PEa+WTy8mJ/lWgDI/FardXR0hLcnNRr3SrDsrCVxmQa9xFmaMBXOADewXDgej3kLuEzjCHZkQmz822q1uKbGHfB+ZDzkliGRd0pG5YdROxrt+S0CwmifaxK5BWWTPl/EDbmPQygFf4WvyMBgNxBEw+GwWq0iowxjWqRrIp0Ph7Kjf8bwOawCwicGGkQe7U6nI9VNMhjGCcIpj6bLhcrkHWvfyXbcaLpistt9x1e+VGSJBSpF8aqGJ418OYiWZJo1iQZ96k8SRP7itEwYWzRgHJMCUfIz9L9BbYEHRnILpj1EPTRoaEnmMJcmGgCyDlRYq9Wih8dS5kXAnlkKgKaIA3EX8OHl5SVT2iKHDdP6j0YjFLGcz+eQbkKECVeJnlxJzzgPkcR+XBGQrZX0IDw2OG3EKlBT4xKo7iOD1Ov1UG9zb28P/2KlH0OCkMNJryd7zwnWdbI3OVdB55Je1+XlJSWjuK24HPBaMgNnq9WiD43INKxuUN0dnH+Kxp4zF9FlZ6ZWrkrAB0VQGZTqt7e3yK1yeXk5Go14UcQS9PvlvXNmPOIHmFwQIZyASpB1wPEV7yb35KoWfFbgwCRJ2u02pilwv8EJFs8gkQzgnyw4AVjCAFonHJTraBhUdL45IDUBfIWIst3dXfn0SV+8SDCSn0rcKWUbAT93w90ZjUYAgUCDkMJSfYDnC3OLUzGSTJcMIwTmwQSLPeVTQzTCDZ8h5IIOwWe9Xu90OrPZDNgGazrHx8eHh4dM1oLHk5cs+9BP8HtfthCPA4durVYDcQrSGLMftRIcPBxjaZp++vQJyzRYe+I6DsdqyYPp3ES2hwsWnCIoYMakB9EvFKRYWqJsHiQnc8D6SaT55oKaA5w/6xni5vZ6PQxyPtpFa0/B8RwsneJfeLRoz2YREEZ7TPM1PCVslbQi5U+Qg5JQhBUX8HLCgi7lPXLRuiTqyV+tJxyCN7+zswPRC9xNKRl1Wuu8uvwLLLpkn0kLKvEc6szPLy+rYtB9kYvZFDuROms0GkhgAKEgSUJHMlokTAquaPoJAB3VqD8GJOjFJcDjxMt7PB4D7SOzBdJagBskmyE9IXleIhDEimw2G/jHdFgl0epsEBXA7YaRZMPqOJIoQowEv1wm/MBZkIgSzgR6e7FYINCICMfvE6ernbSxftdJNlViLUj+4M2jqUQppEYxKrAnUim8ePECXwHBykSjFHA6Hhu9T+qlg08HW+s0Fc4ucgPCe5NhwPKYiFi7vb3Fvet2u1C9YoHAEWpuw5zI5CJO1QF68L5UGKsSyChzc3MD6kwaPVfpzvrxcv6tlIQMW4JHkvUJCAhJovIJYi4TglvGQrMiQtHzKP8kM0+xMa+dhV75BMkCGxwGkgQG7AecYJpNR37vjHD/neIsnzkwsmRukelbuFxycXHx559/np+fn5ycADngOeXV+QBeyrxZU5EokZ/w1JJz9vOBSfKZUxlHL0MQa7Ua+HNcLKYRFksgevRHVFGH3BcTkp5l6SPqDtBpMukumo1VWsSOwnZ3d7mcseWp/Ug8GUDIbF5cgsEcQk4bUJDiDvatQ487xWBkggBU1KhUKp1OB5Ph0dHR7u5uq9WiCLZc9hKU795X8Bwt2lNbBITR7m3BxFklC2NFavjyBFxFsYhch5NOG9bpURkZL2wnVMBvku8IOmfHQm+n09nf3z88PGRVermiKd9Svog0eF2O4xJkhxzWyHl504dwVHxYv4TY9U7FJpNMtFotlJBGyhMZOiihpoOZS+6pvxrqR4EGx4mDE+B2QwUE4ogL+VgsBw/MiEGYU6McZ+TSPlAN1u99vZwMkHN0jzKUi+GCVCIBFkroAlaNdK6k1CDLhEAXZR5YUO5eISXS/3DktWQhJNCCL87GcxRJYIBqAZSVsl4lUITDZzqUOAGA03WOiMDHrsENmb7VCd/CMeFxYtkeTCxgJJGkDPctH3uSxpRJO2V0GQEeoRG6FJo01Lxh9QWG8/kBhLxr0G0GHwRHMkpMhX+ZkwMdTrEc76aUDPAeMUtNML2WAwudaZlut4xQlXjGuUA/JJL3FL3HiF+siRStJN65iObfxCDNItEggT0KZlxdXf3555/v37/HShOYT0wpMvaPw4+d70yJ2N/ZkIiRx5H5iuVcJ9Ggk4CU6YXQMER6Q+kAbE/tqJ+pZctwtaKv2I1yhDAzMGY/mSYHzZbvwTRNkX7m7Oys3+/v7OxAO1pS292/szIRAPtKLtk4mmo+ESyNKAetBIRSMurI2pmVajKZ4NYPh8NWq4Vo4d3dXeavYqXWe6lw+XxFNBjtK7EICKPdz5yXPSyIE/wNx4L5J51kFUE/mMvScHewSI9SE1D7OEvIXMDjS12ySVKsxQQM7XYbBQNarRYiXqBxwguALp1/LbyKIrRc7tY7nelUtANpBqdqOp0C1znJTuXxoWaR5CHrLCGgCKQKwAkSiuDCnVqLzs0Npg8pGgB85zl+p7MbPQlZWR5L+FAloZAUSJirqytE5TEQiLeYsR8scUb1JpfwZZk1utFMioj9KXyiJ0FZIxaesUAuwxeltpDn4vIEtpMkubm52dvbGw6He3t7slJzyQJzcG3F9+nlPrg0ON98QFjzHa1l6k6ZggiUOJwq4FWZjwTuqQx69MGeFLXKPCU+++1k7JT5WqXkUnJQy+WSEBouO+LTBoMBwiARiIjq7X7vyU/kGpMj2yP8c9gwZuWRVc6QzBDlzuiMciTIynWSX5U12bn+IktEOOS2zGQDv5aDk5fgcFkUK1JcKh8ZTgjORMQHlkPCDxSUKwjwmxn25ogzWRFRHgpHc5I/OaHdPiwsmX/8LEfy5+x/LCLgKbi+vj45OfnXv/4FYhBokKs5VIqCWZUDmIwciw2y/bKGJ2ODqdSQq3iyl+TCAeE9Hw1AQfBUyId8cXHBdND1ev3g4ICP/3Q65UCSnF5JapkS+C33kck8kyTBI8DoQRb3g46aMdvIozOdTm9ubi4vL1lCA0OCawFBKOVrTBjWywmZDylLI2Kpi7ohiQDlqoGzMiXXp9AqMuoMWEiS5OzsrFKptFqtk5MTrJ9CU8MFx2CIRNEsVPSujIRhtC9lERBGu58FV21LOMNtpPBF2glfySlPgdctA7eYUZorf4736fig8oDOMjnef8BLO9qQGoSUjk+aSRLSectKuUjwxcxXiHMQx5l2squR3XJoRunJUUEkWUSmSke2dOSWRN4/YEInL0Iwr4xfe8DXcbF/inLKyQukmosxUVCEIuPfx48fUWRyOBwCKGLdlw493BRJjLBvuZzPZAayn4Odw9vBozGzKMVvMrUpYwvpTTr8DNxQfN7pdCCZI49E1WjQ/OfLucvOIxbENlJJJbPvyFIKvClMwn51dYX0s3t7ezgOxgZVYf4Kjr8qUS4ndqhvOnMUW5KJks8pPWyZaggIDTUSUBSbXqCfvkISg7KgJTaoMUOPARCytAnTq3BRgPs4oU2y8RKo+HScY744XKZ7kayXJJqcZQKn2L0z4B0I6qwp+CJzp/y3M0SlcJGPHpEJ2+PU8HBk5E5LnBVDv8ecHF3Oh5LqISTAEsnl5eXHjx//+OOPk5OTi4sLsMpS3CuRsyRyZdtKaEznukoyRjpPCnG7kwsNtxLIZDgcQriIVxKRIZYIuTTmPJ5Bxcr2wEOOWIm4qNiX+V0Id1FxJEkSSNBR+4GPthyHfrdIdQZZVkdVy6VDyWDL+kAU6zolB51h5owWPxYXbyVVLlXHCe/u7h4cHBweHnLO53NU3ofOa6UoV0K0aF/EIiCMdm97xOjn7SWj/rkwxeMFj6X68XjMSdlBTdKP9LODygAYLt63Wi0UgNrd3UWEEqmzYJMcD0ZehXybUnQna3/JT3wsLf17mZtOXhpLiuHaZQdKN4vcJrjBnZ0dCGIPDg6QNQdcUDCZpHNTHOjup5zxpary0uQCLa+Ozj2UeDc3NycnJ/Dezs/P4ZRLvw1r5/Ts6cUSBvidT+BHJSSzLzK9KhCaFDVJTRe1STK7I9etpbMrYcB8Pq/VakynCWoRR5CFPbZ5XmSfy3HoK9Bkx5J8YCCcBITSK2JeHJAAFGGiIKETTVpOzviX4OOTqnDoJc3F3pMpRpltRUIUB6uje4lgyRX7fYX4Ovr9DFgF2OPRmNCIOBAbwPlMhcpqN9J5lWhWXkIwybDTsUEI5OMo+XP5eDorHRQIsKiMIwSQ4ApziNwh2BJ/KY3NcI7MGViyNE7qTueKyjfKZcDy6ZORZtfX1x8/fjw7O/vjjz8+fPhAgotSUocvkvHn8uw+ZnY2HL29XMHhRM1IY/a8jAF26hUBF7E8BnLzgG1DJhsgQ2epkTNhUJyyJR8lH08+gOxVqSOVOb2wwYTMyGuFvDjIYca+8ok1XjsP6DynDg50UGLwxSdzAjkPjrytTtFRAEICReYzv7i4ODo6Ojw8RK4yXvU2iO6xaoFEi/a4FgFhtK1s+wDoIjFhiZVIK4MaVHoV4Gdubm6AFuCfSSGcg/p8oRFNxtSh5jW0lAcHB4geLHKe5GvAwXXOknkJQPI7hOyWhKkow43EFVDGUuYKXEF5JAM5uA8uED49NLGtVgsrna9evTo6OkIieNKDXNqXLzlfxuNwg0WpHbibQ0kRveBND5iETA8IF7y6uvr06RPCtFCmnDtTzUU6glCWUi5Wm5BKPF4gK7AjXRC6Ba4JFFDwwEhGoeoxtVIUE8r1aWpfKU+FFwWs22g0gCgAenu9HhI/Omiq/Pny4XeQanOKTxC0AMkwRzz9PBlsRkCI1O3D4RDUMXqMHpsMEHVCtnxVcJDwV96bEDfKiu0ybYnU1sL9JW5ZLpeNRgN0BAVjskK65FicRvKxkiBf3iAMSAqDMeGAKlwul4SFTOsi3WL6r34qi6IZ1SHo5MQipyw5RcBX5oKCZPVlSmGJBqF9wCKX5NU5X7FIJk7EQCmZUVmmzHFyqPpzAocrU6SyZ/hUFmHg7fGhM72Tq0eFEmC/09PTT58+/fOf/0QtdYjP6eszYE/KTHhYtpNVeRhBgEkGBc1Z6dTHGLgF6F5OMvLRdtabUOEdXcT1r8lkAr3l+fk5Z+zVarWzs7PZbBBPyGVNiTl92baz8lhksk8YKc0CPNCiy0hCpi+C/LJer19fX6dpilDw3d1dBEDiyHhzyXUHPqfyCZWLcVIvigmNRQjx9pePQ5qmk8kE419mFpATDgcPu467MU8sAlKSJOl2u8juA0lCp9OBlFdOMkVTt5MgJ7hP8O5E3BjtGSwCwmhb2fbrXsFIjy2PXxQx4iz6StKMFdVkqSg/8b2zjVM4Ci4KqPBmarfbe3t7x8fH+/v7rECIV52UjBZdhfNtiQcvuQKHFXTW0Z2Sys6FSHKMmIH4hzUnAHq73e7+/v7r16/fvXv36tWr/f19FLaSmlgZ4+RoXfzrkqf2V9OdnaUWjmvzgIJX2s7Pz/EvCh+DpXFydcjXKr0QqtRktkPCM14XOgFZ7/r9Pp1juF+bzQb+HA9LUauT0Y5+CXGLXHcgvQCqChE1xBsyDUP5kxJkgaTL7vvTchTJ2CR6UdKPlxozno4iTCQmnUwmKEtIXzM47IMX4swJzrK9gS7Wt5ZkHRvPQDg/57BTi4VZc/wkK/IRw90Eg0FEJxPGAAYziaJMs8kOlElEJUscBIF+XntHeOkrPHlbJdcnq94FF2ikRJazFlhBDHssBrVaLSaPdWThXIoCdMSiCQsb+Cyf1LU64NaZeP1UNHIEFs2oRQ+C/yEnSd5i8vOj0ej8/Pz9+/e//fbb6ekpKtYAS8jbJ0XXziCX7J+cVAEI8TkAIQt+UGIts9pg3uC9Jvh0VKO8Cnl1UMTggFSsEOdz9ZDxb/K3RbLtO81/L3O9SYpW5KIYmgGAjaljNBpB/49IQuQTms1mfKXKaRMHYUZTqQ71BRoyexbfESwHgrsA2MkaJ5SWyHywvEA+PgxqgJSA6pXhcHh9fX1zcwOEyRr35V3qZMUrmir9UR0t2vNYBITRtrWHvUtKkGHJCmUQU/n7gBaAjBDvDF/RVMQ90heReg96n61W6/Dw8NWrV8fHx6DOmHa/pEzWnTDJwYFyEdoJm6HJBIzSv3S8aic/BJeEZZgQGZ5+v//y5ctXr1798MMPQIMIkuRlknNzsL2zIcVIvjjWIYV8cO6URhgMBmdnZ1dXV6AHsX4PbpBLv46f7TAbMuu6kxkP3i3yjnS73d3d3f39/YODg/39fUROojqWs6COKhFStSURKaPFZAJGh4hmG0ALYJWaikS4hji1o80LDipuSATosHPkcOQG/VE2m3kp2Y2SVWabmaEUQAu+F1N3Si/TecyDOSH8p5tQJLXF3GQeXblO7xxcRtZJXk7ibZbFcxS8lJTLgiJISoHBRmqUiWSJGEkDSq2axK5OGkPncQ6uSTlA0VmrkvADrj8XdwgbnEwkvIPQs9XrdcQ/I2CYBWZ4KGfg8bFi6ikI5sn10eQYcxL2ynGFhRUCQhZgYB/SUy8a/9sw57JVfFpxg25ubj59+oS4wY8fP4L7BTforD4405Tz0MnJltQrFpJYBhOsHTYw4bBVrIuAs8v+xPIEnyMHLTOkDYtKuGWDwYC6D9xK5oVyBL1FWcdg/iKLb07pXclnsv8puJVproHGcdUoF3R+fo5lOLScIFb+RCpFZVAul2D84i4yBxUOJQEhnyAZV+zXAuW1yOeR8w9z5ECyi+hTuUx55xwuh2uRa+S/ah/gdEWL9gCLgDDatlai2IEFdWIlItIipaj0d/m5TOTFNyXcvtlsdnl5iTcB2EJOzT5jKYvRsS45Yurg+iDL4u7u7uHh4fHxMbSUvV7PiXbgm9uPSg/GQ/r/Ov3jFD7ma9IpUc01bwpjqImiSInvObqSIL7SNN3Z2Wm1Wi9evHjz5g24waOjIziIVD1JH8IZA74YjD6rL3Fx0KBEKfS94C6gjh/UoScnJ1dXV1iChRIJ2fyx2MxIEtnzjJ9k7XKYdNdYX7HT6ezu7uLOvnz5EjwJMsXxcpIkWS6X8KtGoxGqBZJnY+ZJ+iLOsJQPgoxCxD1CeS6AK/gW3W5XYuaiF3/R88WzMDOqzEvJUFs6Uk4MKskQgmrGj6GFoGdJKko9tvNEO00KUjrMsqO2baAROhweLT1UEuMsNeGkoHCGIu4OnEhiVzYSqEMiN1ydrF0mgwaRn0YW4XCSZ0hIQ+LCWTKQ/IbEKnKQSNoTP5QZhvBISu03sRnGJy4HHCBXSUhbARC2221w4NAFYEKTSz/+08pJpl6vd7td+bDLOGpJQfOWybHEeZIsCkA7CR8ZP/Zgr9eRAdPjx/M7mUzOzs4+fvz4+++/n52dIcUo0KBMreSk55GvOSfqGMJyLp8B+KHDe70ecA6KQ2DCIV3JBFS4iXL5QwZe+hMmm4cMn2g5S6JD2UGJBNLPOBl65GKZXL7ZRsjjSEbR4NFoxLBGhkTKDMMSmKE8TKvVwnwCZFir1eTUxz6n0p5LV6QBqRORUFBq4PEJqFrWpMG9kyShLAoiVaMyZbfkadmHk8mEIup3797hWiqVSrvdlkMxOIx9iVDRanVQxxQt2lNbBITRHmhBeU+5ZNThA4NTXnDukyDKYZnwPqAH5riqcqFUinB8aEqXCP7T/v7+y5cvX7x4cXh42O12SQ/65Ey5isnRhW6Dq2nOQjVPLZ0tvOqAXmShNjrfDDKs1WoQwR4eHr59+/bdu3evX7/e1QZQ5ChFpTMRfHVJP2PL9QJHKQo3GmzMxcXFe22Q4uBDeOEy6z1vosOpylPIHqNKFk4b8ugcHx+/fv0aeXToSDnr6KznITV19H2DAMDPRuB4+QC0khSVQtPyweB0uzNo5bb8k/yMzCgjmRmZuIL7S4kUXFjklZFyLOfB9NsWfKg5gM3ahxBDsp990kbe3OAkgJA2mW3CIe4YcMg75dSWAGMD6oZxg7xqCgslK+jUQJOyQ4cklNSxX/9ajhkAJKe0Ax9zrFyADmKUGpl23k0ZUttqtUAPYqijACbKzFAF6gweCRGpTeVqkVT0OZcs3Wu5tsV1CpaaIEHt1CPZvli5bxL5k6rC0L28vPzw4cMff/xxdnZ2cXHh5/h1uH0/Xaq8CyzBAlIOG7gjjUaj1+uBFURZgmaz2W63cSi8qli+D0G5nAlns5lE43LwyBvEui+YOdE8rOihnCyGKysSBXU99wUYRNf8EzcRAMzJweNn0cSCVL1ex8M1HA4Rg4cPueQhYxOknMHRuktAyLlUPvu8RplOyV/ilP1cFGYSfIthdCEDNrJes/5kCRqURwi+WEu8pogJoz2PRUAY7UlsyymsSGZWjjSkEA4+q9Tx03d3pHQ+bHB8MkRlADW91HZwcIDXNsP6eYSiK/UDEuSG81am9yaJQd/Z9RknmTwwTVOyFjIMiV2BdWvQgz/99BOA7osXL/b39xFQBBeHSNJ3EP2b69/BIjDg/JARX7hxk8nk8vLy/fv3yPt3cnKCIA3QNYwLpXPA3nDGicyawF7CXYPgrd1u7+7uIij0xYsXR0dHvV6PmWPxKwkI+SddFinlcpSrjl7Uz2mJ3XCjZQFlXiNHb7lqrghlOePZ+crx4P02BwGhxL1wYUm/S42fdHHICfidoD7EmM/7TNQzM8Wrk2pI3nH5pz+osCGjOmH0OEk74C5IL5MFOVhbguShAy8d6k/KRB0Q6ABC/4mWWNcRXrLTyG/jUYVh3EqKicQIbwGVhGCrOp0OyqYhgBBgJogGnWUsbDMzU5AJd+YoTmsS2PA2kY5zwDMFEZUHGe+vhOu3t7fIIvP+/ftPnz6haCRyUzm5cGTSZkdFKZeWmJKHMlrAP8rRYYBn6HPcKVwyZjzgIpCK5NxAwktBJo0Uq5MvCgbQi3qt+/v7YC8l1C/S8nB7S8koxxX7mbHTaCdV6OxGrFnINSly76PRqNvtYlAhZltmgpFrDTJk19Fsy7UYWagDl4wphcpeJ/urI13hr+T87yw+yjE8n89vtY3H436/j1UPahyC4zPIBG4/vLfPChst2sMsAsJoW9n2+Q/lnOX46EXOnKObl+tnPnySFB9WGTebDWoKI+aeryV5fAm06HPIVCt4ix8cHEBVdXh4eHR0tLu7ixcJorxkwegg9gtygCUUYhFlKiWXMmepk9wcr7pOp4N6BuRAKBvD+6nRaCBnzMuXL9+8efPq1StAI2SRYWiQDB30r8u/TY7G1ZcLyrtMwMZ39nw+v9Z2enr6559//utf/7q8vETiB5npAcOACQNlUAdVwaRM4QmxgIRcqu/3+9QAv3jxAuna6VL7Ke/5gnfCKeG6kWVyJKzOVcveAGKHhwQmioCkqIqa/3wFI0x4u6VklFchhWfU3DrciBxykudkwXH6f5IhlHRQsGEOs13jv9XqStODbDzkqVzIZ/EPhyH0HSn2PDXDuEZJXEhgg0/gfIOuAdDlBvGknIjoglMb6Zzdn5qK7p1zE2W5M5nXij8kQQccgghYAkIHCPHZZ85k1qnDrzDL8ZEvci45Wnh3HI09I0gl7elz9Y76FF1HFCF5xc8RyPl5I1erFWheJKZ6//79yckJchcj6Is4nxDal4nKCV9WpmEfolfRvb1ej5+gnw8ODhBGCDk6IdN0OgWYxJ/kovEymkwmhBySeuVaCXoeigNqIEej0c3Nzc7Ozs3NDXAm7j729JG2/PNOySi+5YIIFx9xdhSjlyIO/gqn5tOHb/nQDQYDyCypD2f6Lj6nTnygjwCdzL24awhyxtGICdM0lTldi6YR9gnfcZL6Y8nBwWCwWq1QfEKmQfa7l+bLKIJzmr/W7M+rWz8Z0aLdzyIgjLaVbTkNlWQa9FPIOHDxzhMFJYh4p9K1lQSXgyeDJ+XqLz3RTqfjJxeVS+lFolYnwaZDZJW05M5wDgY2yPQSMkBO5m+gcwZoBEHRixcvjo+PX7169ebNm/39fUqbuPBf7iAW3YISRtS/BJlFBm7Q7e3tycnJb7/99vvvv5+eng4GA7gLUk7mJFZ1hpBzXpkGEE4AXLR+v4+Uqi9evAASRkihI44tgu5ONUKn1LUvAnQu3HGL/agzxxcp6Xx/uYRtkwFI8isJWpwF76B34nQ7tWES/Qav1HkK/Bbi2ogratXqOv/o8YcOTJU8iU+ey1y15FskBUonVepRZfJ6luXgn4y0dNC+v+HcYseCYzX4iX8jyBASCqIQDkhCAkL2mBxIFDdSYgrmCsOehEnRI+9P1CWKdyf7lExH7F+mzDsinxrJUVfuaextxjFihrm5uTk7O/vzzz+hFEUFPAbTcmzjIFhKCDaA06NU7Upw3m63qRRFhipSsg72RhQxtOtc9UB25eFwKDP9OmPDH2AERcxSgxxI0AY3Gg1cphOG6uj8tzH+RD7R8hHzR5EzV/s6bWYDbrVas9kM/c8Mz4Recn+Z11cu0MhVLZwU6xfQhiCXKZXPSCDnxyFzXUBepp/9m8sNTGh3fX2NEHeZBCvYvSUp9FwlRem7IMpHoz2dRUAYrbK9wuFhM1EJzik5aXCD21zTJSDkii/XtmXabr4LnVJ4LDTEBfX9/f2joyOKRSUUdF4PQbDnEKQOUCyiEOU7VV6jPBffdiwdwWwoIBmcWuppmoIc293dffPmDSAuUG6SJPLqqNwrf9n4aN+/X8Ej0ImhTnI8Hp+fnyPj3++//w41F6u6Uc0lJVJSD1zSTq7rI29qv98/ODg4PDw8ODhgRCiVolhud3Lu+2DGGQB+3Wonzs0Z3jIjP/0YGfbmwMsttda+A+0o/SRWlDytc1McT0WWfSfGcJqKBDBBbjCYmFF9Ihoq+5yEGNNdSuAtEZ28Bb6LzKbKJPUwrpjUajV8EmQYpFSMbAzrvzELBXvJyWDkj3Y5GOQ98tOKyseWnSmVC91ut9frIRkMMKF8eH20D/RCnpzIkAUJpXauZJg5peH8MYY5h0yysyjgO7tc2ZEOtJxXH/aKkSwuKkxcX1+fnJwgLBn10AeDAYcE8UzQTXe6hZkqkZuHQZhAffyXYlF8S02pUwwdehMU6AO6mE6nkFDOZjMnWF0+rVL27KTJxbyKEimj0YirAM4CDa9I1ki4s8/5xPGO87biISr5FV/BTnJm8vPT6ZQFfmStUZnDmWs0fHglHHVekZJgx+Dk6Zh4CSwfHgE5JQZHu6y9yYvC2aEavby8xPsFjxtXY7cZt1JrU7RytOVtihbt8y0CwmhhK2J+ghNTkQAyqDOUv3KO5iSrlIBKhgXSTWQ1Agjw8HaUifvkmh9bgjKyeGGAIoOD1Wg0dnZ29vf3QSLhnSpZF7kW7v/ryFzl67xoTve9eXkQIj2+wuGhUrzUbreRWFX2LS4KVGez2US61FevXu3t7cFxoafIN6j0V4KDIfiuYqymf6U0+i5cOl0sFtfX15eXl58+ffrzzz//93//9/LyEuIu5P0j/OCqrRxRXMiXHgDYEob0MOCq2+0eHh6+fv0aKlnETDLVvvS6/PsikQZPjWsByeA4/T7hJtspfX04DaiVIrlf+dQU3YgiVZ7PM5M3kzlpqf2TCUj4TMn6jc5Dh3vhkJnOkHYWO5xlchKD5k8wM/b4gBPsLhnzg8+dg/udwNAmORdJhadT2FOiQRyK+ZkgtJ5Op5KCY+GQJEnm8zl2dgqfOhVHfA+SrSXrIp8g9D8VbjJIGBGwWOPY29uj0F12rxQ9ytIIeNjJDUrgXWRO9QX6/Ty43HBuAUY4XXMnEX+r1VqtVhBGShl8cESVG+kayTSCSoL04P3793/88cfFxcXZ2dloNGLuWeZM4gIiHy45/hkyh55k7tB+v7+zswNAuLOzQ/IWcwtrFMkoA3Yd5m1wYru7uzjvYrG4uLhot9sQUjoMm8wOKscV6e56vQ40eHt7OxwOsQjINlNKLWck5y1c3s/YgXSc5OikQF1mEuLSpBxRfEGTkEfILqStyALK5km4S1EJ07fIFRw5sVDJ7GhEWbwe9WBxRxyG3NcN+dM7uxHEI8JBpUApmMLHOYjsWH+B2F9PjBbt2SwCwmj3syAaLGHJ/HePnPLKGSeHMZOf8FdyxVc6uE7bnBBEvvvpdELGg2V4pgTAS12ePQjtyltYBJYcCx7T0WXJyvKdTmc+nyMcnxtILYjFaVzF/v4+sBCiiZiwHi9FkgzlxKB8q8n0aHcyDHKpmNXnkVMUgPD8/ByVBpl+UEa44QgSBPoomrdSem/Qbh0cHLx8+fLdu3eHh4dw4Lg277ihvvmkmZPvlESfE+fm3HfHFZCFJSW7uL1qTmbkc9Dj/9/emzC3kWRJwiQlXrh5q1Tq6u7Znt0d2/3/f+czm55SSeIBEDcv8bOR7/h4+4sMJMBDkDqelZVBYCIzMs53+PNnYZyIejKxBquHnjwWCkdUg8ea9A8Oo//6im3Y3NrafHzEl/9vFm1tbWxubshbm1UQG8klrOFWviCjPba9qMUSvVq8GKYglH58r0VcLA+Kj4PbwpC6VZukvZ2Z0GoTchSwlhGDarVa3W631WoRiGgGoZmaVi6P5oHxaiQnW3LrtrCtzrqo79qd+U8rVWfDUWc/UeHQc3kCfnlxcfH58+c//vjjy5cv/X4f5UOIIlGuaSvCqc2wLkLVhGaz2el0MBCMDcImhEGI/5MiRcG0MOEeHx8B69jc3Gy32/CRwZYDBNG2XPM8UmDN0mSiTdhut5EcrvVR6Q+KFkjNDtd1SkeGemCV6Fu9JBrM1Og9C7ESMmo5hFrllWmKihmJRyT+Sd8QzXIFhMMmhDdHazvZrLYT39YvU5HB6DOdTnVSJXeAGAasCgkmLy5S5BWkGIRF6kr0fkVvbhXJtWmuVXfOP93+Sdwdy04o3UVyX2bcgM5XOolBLtrtdjudDjzxDA9WufqSDNHJzwsleeroQ3kBdUS8L+w6uEIZ56TTGvYtPpNqRSkKIhKszijUmQmGiCNSCNXnz8/PP3/+DM89ip4bl6NGe5I+BVXBqZQDKQql7fDw8N036fV67Xab1PAE82TUdzXwSCvCVJYqUpbYUYb1wjekOVE0rDm885LU55JQVTbeZm/Suo6qp1YOUOvXaDM9ZyyoaCCSAcvof36AqRYGNPrmkzaehfv4T1qVXOZGecI3VXuJFJdM2Hv79i1igPP5XH1GCGLgA1accpnggzEGJ42uiJhQUhYIMqBarVan0+G+hMAU4j/YCmyUdTFqvJHggsiymJlg1rYYIlabh5azGlemUkde5Wj51982zQ5BWtpwOETe4H/8x3/0+33wQLKMJPciC7UpajfGdmB7IxsZdXowHHCxYWuFKUjuGcNsm3WhMcOvX7+22+3T09PBYDCZTM7Pz2G6g7JFscoUxWEy1Ems7Gg0gkEIAKqxKOsAsQ/zrjF2Ai5WvLES+SiER7N2Dc+s1juswd3dXSUoxg+VgVb3Wy5nTkIe0Iz7cV1APdja2uKz6NTb3t7WlWuzVEdNy7pqp0Fub2/H4zF8ms1mk9zLSRc5+zOjGilCVVd35pwtUuS5pBiERXJSZeAlveyRrCI6wuP9I2QiaWyoVoodmT4/1qNX3ZfHvGYUaPvJSLmzs3N4eNjtdhFBwqnParZG4a0BQOuBp/CAVUUM+CJkToOjmll2KPULHZFZhSyBBdQoUkr4cw3ILGQXiOFWfq/pfMkpQd0L38ARfvVNPn36dHFxwerzpPcwGJhNAKsPwRFE1JSkDq1W6/ibvHv37uTkpNPpAMRFRUFRssm35nsB+4Rq8vP5nM1TvcRCfDrHYtyDRY2pSGnx7ppqcXRD4I0wKPxM/70CFKPVFBe46sqqNMfsGitrHl/5v+cGm/rtB4CH/adH5r90ekW3ctHhTwCVRS+J2hJk9teqfQr25ruTGh4qHTRIYMCAKtzZ2QGeDR+gWCO2sLOzg6biTygEp/tMfPHo1NBX4PCRvZPIQy5nuDaOj48RjGo0GnyXuNlyFGj0KuiRXDILJxjag20HkRD1EegcoNJPwJ6WfdPHYb/CVsCYleFXa6q8amMgVHt/fz8ajUBZ/Pvvv4NcdDAYAJdoOcnKG6lvYfy6nEiEXQBzAcQBTER07P7+PgdRV4q5nGgVY5He3d3t7u72er3Ly8tutwtDhRWAtH46u0Wj4iTnZKIdavaAwJNZo0TIR0x4ndOKoV1sy4RuEq4yHo+xTpXdyiKuygHD0CXjfkZKxHC0AX/U/2LnF1mplJ6KEBg8CDFYLHOivrER2SlmmSaG92FqMbYClCJkAFPNbL1hUk+ICkM8RwqItMirSTEIi+QkGUmIf7LdvAorn7x/hFYmpYqki6pk9LRRz45t4MlBMhWagswPgU2V4Y3g59WMwNgP9hS2nzAYHMAPDw97e3tfv36FVtpsNqFhsMIYtAHlGKQBXFMJ0DfVz0mywcwk4SmOIxMWYL/fR/V5Ou+pbUQcI4Iz8YnUd/kBqVaoHYLS82dnZ71eD/oczLD8lI6NV5ixElfa6OfPbPYYVTrFAG+mJN+w5IKqaoMFIaPlUBXMVFxf1Ie05UZhH9/lP///j6bLf6u5MqZsXpIxWCMP9iLM8NRS1KwhztZqQUKNvcMmxCTEmrq9vd3Z2UEaIcI10LkJFYMWyyQuhk202TGybfNB/8qepM0AUijUv+n1egCLwvGh3R6XjNrA5FeM6XyZJcCJqmQtkdTRHhc9OPGeupaTDpQ6W5NOEmUtHo1GYBYFrShibsx5i2VC1SanfahOEDYGTDAI2HY6HeBFsdOywocWQDfvgL0mYYp7e3v4jJryBwcHnz59smt0umqeHi0lsnHCbuf/OY1hRFlS3LIHlr6L+sJo+VhU2UaK1zPWp4hQ+ls1YVIJfqv2Lp3kPAh0gWCdYg6AxXo2m2HB4rnKiqQebXucfa+4cdq6fOXYvZpnkdSdktcUC7DIK0sxCIs8p2SQEgt/FU2szM7Io4VJCHbaaY6K3jbJsfb27dtms9n7JgyvGfuCbdyqPVta18q9pxagKUl62uFABagM2YNwZpNWfmtrCx8IE8VNzCCsqRPom1ZBRpO/Ym+TGx1lwS4uLkiIR/pKjbZVpXMkuwvvBeb3breLwCAIRdvtNiF21NdNJ0623NzbVojZSERUxVS9IZnPRvoWrfQdVag6Q6PXqMplBCf6TfK3Gf4DBfgZ4Sqti1i9gG+qajFv+v/aJvY2NL6tf0S3aldUlTHQ18HIMrBPAhVV05V/n08hbpxFJshgAZsQqwx/xXTd2dlB2U9NdmIRkbxtXwWU0HHHMu90OpjMx8fHnU4HJe+Y5ciwsMZPdMpp2dIq70NVS7RJWjMgppKqKVg1XraUWGcyOeuWMggB5IaWjzKDnz59grPp+vraaqWoKRufYqBi3SSZk9zpdJBbDo8hNljmc6qXRMODURjGZzwc5LGdTod4YJ3YtuXquNAgNPZOkDkjIHZ7e6vWuOFja+ZrcJQ1c9XKAJpdhNfUX/Fc1rIZirVmSwyUbh4T3lPrSTBCCwwqFgirCN7f33c6HfCaanYlKL74CtEuVecOW66HNctpMIWyvkO86pokTqr+eBUpspoUg7BILamTAZi06/JQB1NAkxUFDDJKdzXS6AGzISLI1PFIuUEliZ5dMFLiSAaxe7fb3d3dxcGs+R5R66I7P1mqaymJ7kPClqCzKpM18iLg/WX/ECBEgGikEs1rKpmG6QuaHzRWXqI5wRN9Pp+fn59fXV0hsefz58+DwUCrDjKnzkyXyMWPDiFSFFAu8PIfHR2dnZ29f//+6JtAaUtG4Ra+MpUbTlHTfixaYraf1QNk/0OhNzSysTXWlPhEBtDwJZaJGWxqGNgCUZULgrCq4q7JS6Reeeu6f4gK8ubfvsI3/9nU/4IH/2cHfv16//Bw91+xI8I+8RT131MZtdHc2toCZo8QU6QBUw2lP0WdLIwNYmRRnQIRPxA14YOWQaPmh0EErSVMQbBHQudW9xCHRvM5tbsY39ZZAbTC0dHRhw8fTk5OsDtp2Xq1upMap46mWu86Z5IzH5Nf1Xfi9HQtxDgzg1exGCb/yVoI2NkwwTKQuapprwr67e1tv98Hm+jV1dXvv//e7/dxOqCMDS0ovr5SECnQWvPr4LjBLoriPQcHB7AJWcQVKHROLTODM2+BbkEmKuYSkMCYt7u7u9PplCFx7n5cC2pyK7XM7e0tHG2YsXDD0fwmB5JuNckz1zocvJrkg8G+t7m5CX4jWqeGYeasoyOGpNPYXbVuBOeVbk0WBtSh54rGSc0PXCM8mjEtu90uMtj39vbQM1j4ujFat/D8skKv2FUYoFYUiakxlltb5fLWrHUdlKpYYn3XSZEiS0kxCIvUkrx7Xj8sBRm13dN066oghsY9oKKpsqI7qfkdtZHY2amBgXmFPmAovhFnGJtk+KiF52u+E/SfepxYmjv5BhRcpyERJe7XlLn6bYt2fhKRm3ETECyK1KzJZHJ9fQ286HA4BGG3OYx1HNXgVKNU/886HNDYTk5O3r9/f3Z2hkEEgDbOz5ojgg9q/NgkTPZV7IcYIcTcg06pcKma9qoOQTI0x3/G2spRTVetyHw0Rq7DrCEC5LRb4pv+J5WotOr/9dK36/5hUL6xzhjLDsnrVRFUBlSdKoyWcDKAV4lpVKqYqlWsbggKpyKiT/hA1CiDMFp2/O7ujmEKJlNZiTOLm2k/c1DwGejE4+Pjs7Ozd+/etVotYp6ZH2UDrctThyASitaZY9pszhYdheRWYO6buDoYpIqJ2dq2/LTXYeLeAiw60AfX19ej0QiZyQZEV4IWLkbLpFWnA+H6rDYBDk+eDooRjZw0+R5mijJGHKTQWjxQ169S+1inoR9QDYVEmgoZxbxlXmJEMi/sdlr7BibXwJrhlm15EnJvYj61eB/tLvU9oc+ZHA6DkOuR6x2OVHy+u7s7OjoCvRC6iLRSygWlC9M+GM+ZvawtnKgRxeQafcH4yhlnerEGi7yEFIOwyHNKRDjoX5M7o/nGeB+7oZ4xCtyHfhaBTPZDc0ITdUnVHIidVqtFazBpACTxk/aCK0cI+cGOClWYtGyaka9QR2eowQr1LtswvuZCkz75W5KL3t3dge+h3+8jSGh5g0ZDH1/c7B+e+tD7Afc9Ozv75Zdfjo6OgLxi9flkfubCF+fTOUnoHcif0zYrYsQAkTdWRLR3rNnC2GDTXSBGIBExUXkAsKkv6msghYMGrvF0r35hnYP/pJ//88N/zW2NsEFdBomuKYv6mbqa1lxhrU54Sejdt+GjQWhlaWA5YPYyAgMWEKDOptMpMvrQDwjFQNdUcDLiYHhcLOFtODTMajDKHB8fIwkWwShMP4Ph2axLjiOH26yIzERK/pAlAVTy97Qv2TYSQXHmZOAhVY0khBthH1BVXVxcXF5ezmYzoCV5UkS+4pjhqccQpzF6G0UgkcZJumb1hhgct85CNscEZix8WDET1Sa8lk/EW8CqwU4LYYSQxfeYNWfZiepuy3Q4JwM5mQia4AX8p57vXGKELWg+tsIujO80ie5hg3lwQ4gSVy8DXxlb9+3t7eHhIUP9wI4yx5KNtGHS1AC+HYAnOlLEvmqv2sxP9qpek7y4ZBUWeTUpBmGRF08gjI60zJ9sT4w5P1DLHh8fZ7PZZDKx9INoQOp+qr5DetzBRohCUqw2Qf8xy5GpO5kHM89sbepTvHcxmGnUEWoZUjWkWqA2TNRRlrKIbCzwcw3RJJEtqiVA7u/vkdUzGo3+/d///eLiYjqdovAgWTr0HKUCzQ5Plu2GKdhqtXZ3d7vd7uHhIQrQHx0dNZtNUD4oTG6p11eaOwCxdnZ2FDiqbdPXV3NdR5BeapiCMFaBcSKo1SzwhS2Ms077jXUySMwTI4QsgME2m/HAeBTzHkGzZCFisxvVL47313llEX5y0BOdCFVeTVYWcKMWG2d4s9mEi4SQUUwAktGr9saXNQuHLdTSZPol5gNsQjBMom+RxjaZTKIHh2YPmoeBMBsbEOjt7W0UOu90Or/99ttf/vKX09NTGreYgRqs06id7pAGEjYrJW+xcLipIqM/WbPB2q9348bIfUldBvTgaFSN9fo4x/LTPu4tIP0fDAa///77ly9fwCuD5GTN6kzWTox2Neubo21E8wKRDr5i5RCKa2GjtihdFiYAICp4HCKclsxs+5iuJqYRklWVoUJMHpo9ccQXbjgKoaeRSU5UXIPhw90Y+eQcYCUJcH6yLCSzx7nEbAOxAoPEDvAgYG4tp5YuAaSTzGaz/f39jY2N8Xjc6XRQ66jRaOBPGgY3jC6PHj6Xk5ZOK6WNpVSlzyQ7vOrKpLKUPHOLFHkWKQZhkWeTiHuMjjGj0kpK3O90TzSONS0Rrtpb0ua0XZhqJSr7gdIdH5ShO7bEvLZ6zyf3YuJWpsjSYrHXzJBGrBy01LFImrtJNYinO7z4s9ns6uqKRaJpDWrVwaQTVHUgFa243Wg0er3e+/fvf/31V1iDZNYx1Xypt05imI2yxULQC5UqXoAgCcuBKOfHQs4ba6f2uQ4T/6mgLOtV5iPFAiTmEbcCBpHI3nDFVdGh+EE7RxmDI15RZztjehwO6NZI90LuKGeImo5sEuv+JXcMNT71e6jUjUYDRSlo/Dw8PEynU7Dm3t/fxxmrRhqBi+rKYSrg3t4evBvHx8cAi/IttNaLegE0Fy5OEhv0mlMLH5TWn9asxoXir/T/0cGBd6c2z26pUwzDbov2zGazwWAA3AG8TrPZbD6fk7AkD7rLoFthCcM+73a7zWaTp4Py9NDdsLG80JUJwlKIFe2I4JQIVFE4BoTYUSa+ko1shQPLQpT04uHmvEY3RlqqutZouMLvw3REXWjJrYNeQnYL1gV9JQw7M32RwUmEDcGs0+l0QEjLTEtkC2MElcQ147/WPUE3dnMQZILk0W+eDANWUSqsNtmKFFkoxSAs8uKSwTwkwU5Vaq6p5jjsWZFPdZQqK4UnE716UHChRCKqYOSiGgsym1PfIg+9e2Lv8YPeFm5LUxfMglpWEUxKxvTNvylTNfr9/udvMplMwICn0SHTBmKGkr0RtQFU7j46Onr37t379+8PDg6UZ/UfKC6XGZHI2WBcjvkjPPmNBVWQ54agkJoKNZtqsWidmZYOR4+JLQ32j8Wc4wpSU5BwLKNo0jdNfojdq53JYCxCmra4LI0q4kX5mvDsgJNDwWM2E6w8d5WLRzuEf8JWQ9wdiY7n8/lwOGw0GuPxmMol229hGb0/n4JX297eBvj54OAA2HU1PzQoHTdPmyHJz3VE6UA0koYBMp+IPiKJ/7fRhPXL6u22QOpDRkmqidKmKGoK6AFxB5EEuCrYop2p0wyFB1GlFvOK2bP8VR07NtPP+Dl2MxxDBGMzUTxCaaI1SEAmzC2FjFIUG0njZ2H7+UQufD6XJrdBRpmWrDUqrYVEt7LyBMP42rf8zA+aOo4RYUqnZtgSMkqAxsPDQ6vVmkwmjUaj2WyihC8Yg5FhqKOpZ70eUviS8BMuFp3nzwLstLAht6+n37lIkSopBmGR55QYTKvCjsZroslnpc95mIHxDPk8hpyJAB5Dd+BkwvmBv4JIEGYhEnWSIUrVgfg4a+HTIaOZXlWomCFpDVpjTsqV25MZHTs7LfbCkbq9vb2+vr66ukJZsKurq/F4zARCw+NpN6q2ZJxywFaBl7/X6/3666+//fbb6ekp2YCSaK5lO5zQOFhTs9lsOp0aktBeXykWIsqLCWBAjfL/Gh2qrxBHu4JUlrBbsDpub28Vk6nVI5SuUG1gHW6qcSDbYEjTcFlV1qCtI20qwmgkzWdUR5lsmC+H/1vna3lxugkYLtAkHxsR/UnSi68X6LigJZgMGxsbe3t7AJ51Op1+v69uCCtfyVA5IyrGcY+aoo1Go9VqvXv37uTkpNfrYZIbbUkMvul6jB0enRF1Jj/XJjT16XSK4uPKy4K+VW5JmiWWPa5LmImdINXMbCNJURoSVJbDrnJ9ff3lyxeUoafJwTsbultnkSbjcfhgY5B3GkUCu92uBcY1PXsFIUCRHd7r9ZrNpq6sZIQzHrK8Eq8GoDhjpIagWUGYI0cWNwbk6ZdkBqAWptfNikmDgIxymIzPmZu/QqA5cBDsRRgmLpPoXONYAze7ubl5fX1NNxxj7zTylaVZ/W4oTUHAtlLNadK+HcocJj09Y0Q6ObK6CdvFBTJa5OWkGIRFXkqq4oHJkJr91vZT+5N+sFxwY3zR7+NnKgHQdMlahoPfVEbF6kSlvL42/0SxlEjtz2iEPPEpydhXjNbGkSI06Pb2djKZXH6T4XAIvgfm9qjzOzoL9FDHB6061Wq1Dg8PP3z48Ntvv52dnR0eHtIaNHfAyp1A4wSxCGa8mLEd0/l0cqoxQ/gTTRdOtiSsceHoaP+zG2mBKHhM2TvjnNGeV2p7JhkqTDRPUqL2gC0604oM/g1Hj/rp7efG+0KvPFP74NwBqYxxt6riHmcyWx6NQ/3A92IS0d7e3t3dHQDnMO/5Xhr5pCrMDxo/0bgHcqJghCAkFTeuGNhJNjtvHNYRhl7JsJpEimZ+G8edFLskh7QZlb8n7kYOWOBFwVqMxDD4CpUFxHbL2GmmZ2sZQNC99no9RAhZ16dq8i8rvAMTdJkRp3Q1McIcnZW662LjtRCcIfPrHxNWWFLBBSTsUas+eWRDSC6KtFulFiOpUhKKQjucoB5W2eVEShqEXG5wjZHNKOZLq+RVDgvcqU2ohN5VSy9P4pXcM22vLqHCIi8kxSAs8pySwS9VbWGGtYg8jUmIppblpV1BwGH0oKtSzrgHlV0wyiidjFF0xAYn9/cnliLMSwz9JXW+TNDmKY+uOhQ1oKcmOk794XD45csXuPDH47F5rC2hxZ4VH0T6jXa7fXp6+uHDhz//+c/v3r1DAXqllHyKQajTBi0ElJEed1NeGe/S59odqCIoE2Yks31KLFdVLsIvwcELHGbUCI0lX7VnGjPM2GQ8JIaLdezsg61iM1lpy6ntqnewSKa9Lzjl1fZGx1Jlt40l9lvSlIpaGv+Kz6y9xm5RU0FBlUa1z2ZznmBSwfDb3t7e39/vfBPUtFBCi2jPJD1u8b0UjbnQIDSHHTH5MC2400a4RHThWSIuRSl263vTNHyER89mMxQ1HQ6Ho9GIXg/2cwyLRZXaLmDAE+dCu90+ODhAAqHWL3m6Kag4QMSgHh4e3r59ixxFJT/jiqATREdHHRCMwiFIqGmEscDDwqVhxzGbqiFr8zElWUY5UTX5EHFCCH1t5rWxSkvRGlSDkIWFdaC1NCsWHYHK1AGULCDCGax72WmIN2rxqmTYNj/6y+bXxFVWgoRFnleKQVjkOSW5Q8VTmRpAREEkI0VErfC0g44ym83UDjR3mh3b0cuI40HrR1ulI3uFyOOi5adfAcsRbULrq+T1Kz/L4p/RfxkBvfgTdAVUi764uPj9998BFp1Op/DUUjthnEerWitFIZQwHP8oNQ6Q3vHx8bt371BnAlyjdBI/heZBwztoGPQqxCKAdILqqSEgNQ5tgBgPwT9Zf5x6TBK4WHN0mLqjmL2vX78iUZO1uSFRKbT6JRGju7u7yytZPJ3LIfZwMnRsoQO95uHhAbhWlKlUzhJl1GQOEkvPE0LM3iYMDMT9/FMdY0Nbm/9efUAAkmFLQcu1PlssgofG8104w9GxVGeRS0Y7UMvJ5AMXVfuP6dkL9yi8Ba6BETiZTIbDIVCCLFBu0ylpi5rfAXlfTACmJm0Y+GSTDDgwHo9ns9n5+fmnT59AKwqXjZqs1gNV5wK/Z1U6UpXAOCdVlQb5Iw/TsqL50thYwCizs7ODOLmFgtmZVuuCvceGMTeVJ2ayttNC00V7ibbcbDajRwOTVpEFGkvn5sZWwb9AyCgTHW9vb4nKifun0iDDUfL27Vtw/MKZGzOc1SYktQysOPCOkkEAb4HdgxspEf6aFaLeMc1KIPjf6Aa0k5P9nHSd66KuWu9VPy9S5IlSDMIiLy4RBZEHUZiGEYNRFmewRIsIZbTv+U8ek9BRuPsbvWEMNaiW+fqOughNXA0SVvNBpu1ldEoODaym6XTa7/dRKhqWibrwSWygv42QUR69GAsYhEdHR6jSdnJyAuf9MyJFo/UCi4WTLYaVTCNPuj9o4TCKRfc233SplkcAtnouECFkiECN8KSCYkoMMZywr0jYYOjWZISt6hsLudPqJuMFjA01SmMZbnwwqnrOJRrbpi4/7wplEhp7g1yjjHZqtNYKqyAYolAFvCZCUu12m9xIdHBUBf+T/awIgprgNP3eInscF+Z6xcBvHGULEmpQiwFnhYwmp5O+kQ43IJHj8fj6+hq+D7iZOBmqVPBkI2muW++Bswr16NUgfJYdBoLJwzn/5s0b7Ga0QPSw071X30Jfx6LuBDUYA1CEfC98HV6swE7idGwXipsSG09GGUaeje1GYQiW0KsLnMkdhIDGlY5/Akeg6dN6+psfORmai//kxUxBZEt0M9euiP2ZvyC2pM5PihR5ihSDsMjzSxXGPR8SVMkEDBkSxBGiKen6IH6uAnwyvgffIT2USVCN/SrpvdM2v9p+nTwkqtqwghEbkwnjc+1iHPM3NzfX19fn5+dfvnxhbo9ajMpHx58nsalUWZBhdXBw8Msvv4BFBg5j8v5FGOSyYqotphkYZSI9A/UPmxWEGymTJCMkQIWRyUBd4Cs02+xA2iQoR8Y8IrXDLZDO5aOKKeNdCM8yydbsuqVsLbXf2E4o9/P5nBas6WcKw1aVF3/V8l+wMWhmWEDyeR0lbBtuzuL1eAvyHqsdrulSnKt8F8Q6ut1uq9VC0KOq8ED8HHXZKtx1nTlm/Y9IjtYYMKRi8g4WB2Y1c5Z+VVNwIcTOrEFMb4BFaVHQHrDAbJWLMNM/OBSazSa4ZKym5bP7F7DiMCtQQJXdkoRpaJurglG0smhr2YmmP1m4Z5LiS6vdalczSIg9gbnHcaVwRXCx0GmFI1iTCfXnDKRzjXPn16qk5hs1RwO3C62eogOhTD+asRzdHMT/K5Y4dm9GLNlExyKjGhUp8nJSDMIiLyJV7ufMh+i1tdOXxI+wLoA8Md4I7PhajNg0V3XqMzhDnYw5EuZoz7xF3lv/QqJ2SDJ6kPdKLtVCxYVajSYdHfXyglwUgcHZbHZ5eQlfPrU3U254TwvPEp+DvLvWN+n1egff5OjoCAg0zUfKhxoWinnlSdd5c3MzHA4BvGT7tSvop4gGA14EnDeEPiKNSt3/qx3/RnJLxk60HEQ+5JVJ5oCpJmcjyxw5/EkjbyvMc2WnIEsweIZub2+vrq5gdSuRvWVmElfMpaqFMdA2Cw9uvIAw4sp/0rKlQYv+NwscQwAgriqUrVaLoQ+tomngQO1JneT0bcUpFI3JhUzICv+GZ+fu7g5JesinNYtLx5R34Cuz8YyikL6LOFg1X5MNs7TMu7u7yWQyHo8fHx+xsYBJUklKkr4ADUBZ/7BX9/f3iVTvdDoYGvxw2UqhC0Vz/7AtoFye8i0pgtGQ8Bozxzc8vDRP3l7QJk8dD+bW1hZisGRnQYMBrOVlQNkkLSLm8JOcltbgfD5HSJzFJ2xL1MkDgxnZtkmkqL6srgv6X8gDbG44i3DqtNTiK2gJXRtfv37lml02admGIO94LSHBIq8gpcBlke8gye07qWWqbxjfaEAj+vkM3BiPTN2y6QuEfqnkNDFgVaVGZJSwl5bYaTWPjfotpCKuH2itWXSLw0RMF/hFgRe1ymBqU1XNBwgeBHW50Wh0u92jo6NutwudwBCMT7EGddA1nIVaxkoNEpFpMfjAxuMDiGd2dnaa3wSlCLVq4mrNVr2c6wW5ebDAIfpG2n7DXuoMZ7V3EjaoYbZCV2sYgXFC5GfSLGQyXnKesKsjMk2npRqxq6Vo5iXp14eLSjPrlF+UBqQ6qtiBKI29v7+PCCE5XTWMlvH12P6WxDgkv8kMk44XvQlaxc7WiM0um1oaX2KcR+tw5pG9qqxrkBD5bFoePcI34hEQu047Get0d3f34OAAdSAQHmfC+TPOpQh0B5hc+z/GBmPP8Ho6UxQlbjmEyQ0z7yCI3NrKEKN3yMeiLdHDJlXchThA6sZlYJDLpIr02OAwFmA3Jh59NVsv1vPqhyWuW63TOEniMZ35po5vt0iRl5ASISzygpLEvcQL+M8kXND0GFUrecDgrwq30EpTehzq45h3RMek3tDyGZIBTG3VUris7yIxH3KFaKF9sM/ouvl8PhgMLi4uzs/P+/0+Cevt7I85EhGxCRcs1MdGo3F4eHh8fAxrkNlidr4+HTKqGs/Nzc14PJ5MJqq+VOnT2qVRn4A1iPpmJFokFG1lyGjEYcKCBU2LYcZUQTRFk4NCKCMhozQI469qitpIzBiENTiZTEajEcIFMAj11ZJOIvKLEsCGqAgTHfUOz7sYrUImZwWCacqjiM/qKGHwkFoj8glBZIJ0NfDlGqIyGT2IDYsWQuT5XJb7SiHHGts3n0gSpakrnZBpIJDNxZAXTjzOn9vbW8xwDoE1KbkVxFiQBW/xAXQyh4eHoHtVTOCzO/u0SWA6MdvYKKMYGIeoZ0QjWlzyES9qUpPfVVcZu84S+FnpNFJPx61GS1Awxm7FRdXLo+mCy/oBeQFPeW180n0QVRGdzxwIzGdlGV12ktTfnQqItMhLSzEIi7ygVKFAkx+S1qDejec9dEcoYcrxoN5r3orHgKLIiNdSZ2GkvIuHWYQ4Jn3Sa0gJbWNRXztUAKRBItXwpsN7NBohNvj3v//9/Px8OByCXFQTkDRrxchFedayDD1qcyGe1m63URYMf1Kmk2dxqTLgjDEFrgmBiNlsBr97xDSqQqz9BpWXsEAol41GY29vDyx5xhm4VFNV8WVwAxbsdDpFhBCQUSIYWRXdEmy0kDRhruDvASwKfcKKWwsxfiZqLRDaen9/P/0miBAikqy11KJ7nvQtSuXC7EFd5somv4Ljo+broJGY8KgGTrYMjQpSUQaJJa0j0qLCwYGJwcrXClSLe1F+21Eb0kYqQ4nMi9WcYDiOdR3MJoxAO52TisxH7ItrmRGthZgFgzfPZjP4aLa2tgaDwc3NDXqeRp2q9XGi6mclJUbEEuu02+0eHBygHBFBhnyRmvNk4epgf/LcAUCX+6raV1x9BiTW3RhbyuPjI+mILANiBbOWU4L1bFjqiWV+8CJ8lq5EqzKvZhU2JWW+MfIb7k4MKXPbt+B5vvG6YNEYgiaSBATcVYhy59nHLAb0NtQGDeaz9mzEjOhszB++0WfxEvtYkSImxSAs8oISme6i+zY6L5NYfPvGzL8IvbBsN2YS0oyB6qmbLOFqqiub/pTZx3WXX8NdO4JmlzKfqrCpimiC5342m6HUxOfPnweDgRIAJi1/QzyarkZlaH9///Dw8OTk5PDwsNVqIZmkqnlP7CWdY4+Pj4SMxri0ndk0mJNV/pAD0+12EQiyUoTPAhlFeBAFJ2DHQt+yi02nZzxQW8sfao0vvlodbSzZVEIo5/M5rEEo90S36vXaTovex73FQGX0+6zct8lXUEcGcOaMyjJpUAO2al/xe6qMnGYglYFNSH3Xot+2GSaDYPonxTjUDMTZUzCHaQpGYka1VG0J20YNGxh2L4h2CRldOEa6pdN+gMuDoWbOK80vSBrDSYADYX4w/FqtFuC74L+p08iqZmckMpHQ+NQ7mEcyugN0CNQHEYNaXL8ZruDkW5idj3sqZNRaorVD8U8mBzLSy5tUIUW1tYwNaoSwzszRskCmOUSQkTl88cFSUjnBAPEFCZA2rCp7OS7YOn5Y/aZECIu8qBSDsMhryMKNLOo0ZjHGL2MOoR5aVTx7BKVQTTE4nHrBY1GEqlCbuuRf0yx84lOMF36hZFhhyb/S7/f/4z/+4//7//6/6+trlETnNQo5S2JEk158hKp6vR7qTMCFz/Ba9B08izCJ7vb2FgwWlhIWkXJRRVMVeXNzc29vD5XNtM71U7KSqJ1oJGcymUynU8JcLWweGUFopRDfyAAFIaMsOxFV0pqWhjaVoNbxNxl9E4MTqx6mvUolEt9oLUeagupKeHYVym6IaQ+iVBZW0X3J/AjaeJJwoPxgs9kEXlSnRJ3ujbtTjCjGIiXJO5vlAFCrVtHQK83RZg/S0ov4vLu722g0zBWyMMlT3455p+jw6XSaRIVYC6vuafFMXozdhnSvdC7U32Rih1eJ7oE6YSJpqjqbrLfNZWCEanVisPl30SxQUhAzbKj/jF4/m4r80rwkukDoylE70Eh9zEDNNF47jZQ2dCvE1cF+5l/ZNmLp8RncNkpRrj1mTodkEDIOH++QfK81dDQX+ZmkGIRFXlCSmIcMdsLEtCJs0GAZpWbAnAojZ1OYWWSdIRBFDySYhYp70ZM1qvvJ9zUv+0vLs1iD9S+OT+Sxij4E9u/Lly/T6RTF6BE5IcmBOsKjcsOXQucDXYZqYKAVPTo6Ojg4oBkAENozRoE0swXwS3Cl7uzsDAYDyyFUhwXdzIZ6ZeG1t2/fgiUVRPYoa8bEoRUaH1V/xEwwBNPpFIyjCFsxkBUtWB0UZbaEBk/Uq1L1LqtcKlkiGoMEsMlkMhgMMEmm0+nd3R3Sn2iEGAsRFUESOeCfRNOhn18OXmVK9s3Nzf39/fX1Neq2b21tWfG3ZEFwNh46JfNjoV+qjZR/i6SbTJVaSoymZt5OVwERfYjFka1E57wV4+b9SfoKLig+1GpFLuxzfR0EkOFHwAwhykM7vKrfrIVqdWCdApQIq7XdbrPwep1iNhHMsnD6MVDGO2BGaRKEHijxcLE35U7CNFQCEJ7CvAW/AA9fgrrBGWtBSDtkzcVAoCy8IQpi50RiU2kKsupgFWtLXjQPk47L6IGKb02/hubBItDNWQGXWQyiZjqzSu2xSGb87XqCj4r8NFJYRou8oCTRJnn3XvJPajBocCOZNG8XmPGpN+QhxxhXPqQQNTD7q31Yf1kqNlj1cyoutKD6/f5wOFSaEPX72qzQu5kblTpls9ns9Xqgk0FWj56dz3hGRnARQZhJZsWIJrJ/MgwCWlGmipG08Im8hRbrY6iKFPxqB0aWVxV7Kbw7C8cZum9ZtdLQYqCTmU6n6FsYHmhtXMgRuxWXNk0skk+shmtdquehKKOrWWkzdqlFP8wCR6gQBSqRXGdKfNXTa36w7TSPUjNNFJaJstRq/Meut/mvL4jgMxYyTF+MkaZt1+xwGlFK+WvuqqUGnc5BWKcwyxnJXArRvezOb7cl37X2obrM9EHJbcfmmG1QtnJrrg5Diqpbh7CCZMOsbYa0N9qbDGTU2IMji1idfubsZapI5BrQ22bWC0u2olhlo9Fg2xZmNtZZjMlrlnrfIkVWkxIhLLIWRshC56uh1FS51KBN3MpNCdYaTQB+MBFfmeL513j6JlGjUQl7oRhF7JmllHLzYT8Fb2mgIDAiDIdDVCAcDoemB5uiwN/G2zJgC599o9FAeBCpd9D4FWbzjH5TnT9QhWFiodaZ5ZyYh4LwOVY3ppVCvBxY7Mka8pQZYjhMWlmTyYTlni1hRlGsFiRUSszt7W1+j9w2pMoQjUmp0/NqstJARSQTbENMHTT1kRPGzFRd0eqbp4Fh8ZNnnB42h1GSJJb3MDQdFWhzXYFYBQYhk+uoU+Y9U/FzFUxR7YE6L2iheywBzrGFv+UHwvNgVeIdwa+rVlY+SBg7wQzCpNVRtQnb3GCpIRKEsDBMq9XCWCyrixt2wMKzdqUZNgw60cpiujvnm7KM2jLRUDyN5CQlsk3jjNMhbrCacEF2GWIs2Qyjc9O8X22hFmXhu3BiGGR0NVeUDY0x2dg1uvQsPxapv0zV3traAsxbKXNrQli1e4uNV2R9pBiERV5WjOot7piRaSZerJBRFobmCcoTQndYIFJUTefj8AGhJ3CWMhKikNGk4ZQp22AMNK+w0UeSifxzIyKlTtwg/3Se6yAyOT8///z5c7/fR51xFpxQ3cVOQXxJvZBBnmazyQhhu93ufhMt3KfZYst3XvqNaDtBv59MJldXV8ZtyyFWPcbgauRXBOIIyUgsaMbHJYuJ1xRj2IeVdftNCNYFAi0mw5g1qOA0Ja+nEQjlWL3gaEN9a1BXMaxB9Cd4UNFsK3OncQOzahQwrJUqEcmkTfUSRQg1D5MMtCBPQsBQwyZUJRXORzWXpuDW1la73cYHvA6mjfVkMmpkoRv7U3ST5QdLZwULPPD/BoKNXgZNNiPqGz4d8kNubW1hOWgVx3xEha1iiYL5fI5eYrRHJ08SdGe9Z6Xt0NT9/f2NjQ1arUvZ0nZ+8dAxZma93joQIGTbV7kk2Utmc+oSIwMwA54WLY/RzprnBVEGWKd0eGmaPXNio2nEKB93TrgJYFnFQx/XYzkznmz1NhbOarstObfgODNCYE772C06pdGS3d3djY2Nvb09tI1wj/qTJNPzFildeM8iRZ5LikFY5MXFVJaqa8wTufCGGR9whObbzYmIw0lAUn49Enhl5p/RuE1+/0ISH7fwgIwRQh2dZZ+uwZC7u7vxeDwYDK6vr5HAxriT6o5VCRJqtENub29B+97r9Q4PD0H6hyT+l+5nap/AXrJgAzU8hibUDlQtXJUDqBFgVmRhboUFPleDQd2J8hgmGie0BpMph80mMI/6qPLdL5W0qeaccUjA5CZSlLMlolujiWjRD2P+tOoyG88tuogQQKZmqcOhbx1hDmqT7O7uAqC4kHg2MjMnmVHiorboSjKaYQE03Ir1FTWSrOUiNCqlQXLFgsJa2N/fRxFOGO31qTvNf2T8mREDYt3FmyjA2LqFkajGNyEJKmPO9We7PiIfiLOBQHzSHAERoqJbpRbWy+CTlYY3WbJi4XsxFT9ysLF/LDYbmY10C1LIqI2dVaKnAyU5hzPCVul8hndDp40FUW2dJq/RCCFAKyvP5+Rfn+6uLVJkBSkGYZFXFaOBri8afFNOefUxg9Qh+dvog4Qlgwtgz8Qq3nrcmrYRyaOfAr98RkkmN2ZYBynLBjb1jAd/yfX19dXVFWImeiWDVPG04z+17DINlZ2dnW63e3R0dHh4aGCzzPuuNgSmZMMXrgYhlS0lttXr1fPNt2ARLZIragx55fCgRSSYmBfr0VuqrdknZiiyzapHKhtkEsVX1Z+2KDTviNUCzMxL+vVNM9NX2N3dNa3aWD3r5KettmCVHYcGYVSO+TqxEA4CZZq0BkvJrJdoEcU2J9EK0TJcanXDaEeVSGXK0feKm4buMATabW5ugqal3W5reHDhtmMRTmMO0xzC5A6fvK21FqOGGDjwotTya3ZaMlhXZ5lE84bpDHy04Vy4e9iiwA2NITPGile2LvhoTFHW6Iu0wEYSoyhTjdjzhwalZvCfjjMzt+pvQSrcJIGb0BxUXmDrjl3N7ZGw2Pv7e2BYAC0m33VNr8FSy7BYg0VeTYpBWOSVpCoGaKe42V0G6KdXHqcLMwCjt4+HpVbi0gOV3Iks10aWwkhgo5LMNNDbvibL6MJAn1mDMZKgTOX122xG0cPDw3A4RO27q6srlJUjWQiTSdi3Bg2CBcVvMBBQy5rNZrvdhpZGy4RcFEn9JoNPzvehqhokkByNRsRkMgqkgTJkDGJuqOICsByMWLw4/et84lPiV7R8MHtnsxnMV1jmBhlVk89mhS0QNg+vQEYQaqvqJcnjzThDGITErJhMJjc3N/hyMpkgwsZood5cW0iFEoK4AVtu5QH0//l2RnsmY5zo7gSY9Gw229jYGI1GLI9OilS2k71HXJ9mRgF+BiwxYYoarTXbmP+34mmR2j4fYYhf0lbHfUD9Op1OkR4cyT/UNjPzhjhMBAb39vYODg5QcwXrIhkJqWqkJgsgrRGOP41QYfRZ41FtIT161LYk3ynYjLFaHx8f6XhSJsnksaUBVZvzcUbFqaUGFe4wn8/VI6NV0TW4p/NKZwgpdrUwvUZrdfOp6vPkKLCpKGajo6yRYVyPXDsWpuc+rzn53EaII+VlWAtgfIUTjeulZmwQQqcYHor9EOFBZC8rekIrUeHnirPlnzBhABZFxNtK5la1LeKkFk77Yg0WeWUpBmGR74wdTZbfMQUoGZGjQqB2mhaZSEbwNCRFBQgpTEh4U33U8hKrEFaGy3p9jIdFBjImt9nbK6craJeyXh9qyilNSEa31gCXasDKTAizkJXcoRlkQFxPPEEVlIUIIdGAFnmOSEh+bzENBgkRIazPR7fUaiKdOkomkuOERqwZM+bFp6uerm4NhBJvxtbWQUbF+BjNQpYiZD6ShXrirdjVFkygqcAujbrjwklILTCvh9FvokEDYHSVc6XKixTNNpJagasQyUiE5JlFF3smAy2rQifmO4RkSDQAWNlS+z8ZWjGwKL7nWIBDFaRKQH1r/YA6E0l3G22GuTli+DQzmjqTyabb6XRarZbVOYiNjP+M9vlC5xSWm/KywJDTwzE59MlXI/wyGTFWos6aPR87SlNhOQpcO4rPrHL18l1YRIrN00ZqbDBJKlPnwLJDihFCMoTBGqwKFVpiodq0SgSFiDdNx/xus5R6UKzBIq8sxSAs8p3FogH8Ml7Dz+rmtLQifK+2nLlgFUXG71la4Pb2FggQswmTqgafZU39Lvv4wudGNQUSSdWWiqpBuQe0bDQaXV9fc0R4Hy17EO9A88Mwupubm6gQjcJ9lltlI27qYDIKWqfHqAEABDudTq1ygzbP8JaaQsNmsOBEo9GICUJa3G8pMYsaBvl0Or2+vh4MBpnUQUWXqZZPoiakx2i/GUw3yVtoDVMTTnlQWVUcxjZMKYs7xWit2gCq9VKnpBJpVd3jJEkOt7EpLlwFCj+DE8RSLmNlcCW0RCfjViBxRXKsUowaZDTZvTYTLOAf/xRjp1H4Q4zUfD4fjUYo+qe5pgY2Ns2bd4NOz1gKc4DroL51JqglUFVwqCpMWjWa6qfA/MFAYLehyUp0Q1Ujk9aatcpGxzpcxwv7g3ooOJHgr9GfJ0uAEHVPDEWsFrNUDEqPQsIEIMbvbchVW8IEVXKBWFO1lKgWJiHswqoN5ZttXjk6oVD+1NhNdVtTPxEpBvDPnZ0dOn0AgcbBtFSucs0+L9ZgkdeXYhAW+Q6SDAAazse0+a2tLWQcMfcPqgmScHCEEHnIk1WzXNSRyedC70G2jBW9TVqDulmrKm9q/VPIWlaTqshqpp+thUuBiOiehykyGo1Q8GBjYwP8omRcVOWASVax8QzvwCwELAcED8ge1ErupJc0Q9d0nfjuVVEUnv20W5A6tbW1hVfT5DfezdzhRr6COQkXMr3IZP9j8LB+n9toUoPBuri+vr68vETNbrRZi6RrFE47SoNsxs+pzB+aT6XtT8ai1dDS7xmKZ8EJfMYC5Iwyw0OV5jdv3mAKaVEyqLwoao8wsvFtZvpQJ4Dqqcmojlp9AK6PRqPpdPr27VsQ6mp8RmFmuA8nLQPdKNeOYJSGcRSsGN/CvowOHUpca/m9CE4E7ofj8RgzamNjA0ywYGO2SJ1a5lZZkbFxYjJRtE0nf75JpppjqmNWc/TNu1fzZWl+7O7u7u3tAZfOyh9MDLP4mIkdWxlTMLnSLeL99etXeKAUEs9sPTu8kkcM7UkuXhpUCD5rmKu+KwruDDqMuAoA6ZxOp/gTqzJog+kXs5ApuMFIiEquYFjmhIyi2ZbGXFO4+2Fij8fj6+trOKGw/8QIs27pmtaOKY1dEQ3Drr63t6eGd74P7UOdi4sUeU0pBmGRtZMIv0me9DxgYgaLXRwtBHVyE8NWVZg+Ij2qlIOkqfOa3r4YK0gGE5ay/RZi7TRISEaTGAxU4kdFSWmURuNRCJ4ge7DZbGol9yqXf4SKxXTQKkCdTTbwhYzHY1SZ09wS1XWSmrqmF0IVQzIkdE31dq8WHtSmQptBuhesQQVEaaiQcz6pu9AWYtusr6wedFLHTdJd6CpD0AnlMZBiquwOSWXa4gw61vgtzS3MHIWM5pXIKp+IWqH2dgY4h4nCt4hz3mag7lHocMIpYYHQLcIeNjeTvr4+xWb1Utqn9gZnCGx1JAYD/q2hUTXX9QNTu3lbOOzg0OEHjb/VbJj2p9IjsaOItIybQISfaESO63F7exvFQpU3sk47LU/bYALJcYFYNJuQUV1idp8kPYwuN65ubbySdi677cSzj8scQ2CxuypnnLUWYTeuU858GuoM+/PL+tumDje2CGQvs6gsd4+IUKhCKmmhI5xNSI5lbZ4X4jQuUuTVpBiERV5JDJdl+rcee8lzXfdrPTL1T3ZaRCXP2sM/wZ4h0ahRvWVeJ/+n5HH40hKBlOY+Z4eb4lKzJp6NF4OE8/kcsSlemamJXKXKgFmUpRrAKIMIA0lEoqYVvQZJJ3odY5hvNJ/Ph8Ph9fU13ATGj4eLI1KOdqPG1mANIvhgqKfVLHMdTSjowOtOp1NQy5gZprFB/krLf2l0FDQnqnspaZNNpCoknoFFsb5gBIKWcz6f0yA0LHHSI6O1ubUGKWuHUnGsitIk+7DmxfG3rNEH4KuZAda3jLFwYnD0MT00sKkvuOz0UPsz+sXsQ+wNjgVnFPwLmkCrQE21CngBFwLMXVIrwRRkVt6yu02yYy35kz/JIGPNqOY6RWAK1iBUfC01npnq8UOVUyMDGWXXxZMxrty472nns281Me8pBTltCJT9K6ZjWGBQfSusWqFbEEN/mj2oNuHK7jN1gaH2KbZH8CQZzj+5rdlbkEEa06bRaLRaLWYBLGxYQYEWWX8pBmGRVxI7oWMAp0qtj8oNWEZ5flBN10iIPjdzrkNVhZ6qLkDV8OK5m/T7VsWdXhMBkox1aHv4UlryeFnjhNotaRUHg8HV1RUiP/P5HFoj3fbKI2c+ewUistQ4cFybm5vwvwJQp69g+p+OeBXLH9pcpVIQr4gLkGoCsNxgMIDGT/uKuqwFJfCZOo1ag/Al472UbU8ZPusPMR5EnB4sq8lk8vnzZ0DOJpMJ+Vo0ezDGFmh7K20vvkfjcX9trY5mbJv9E0+HNQh6Episw+EQxJUEbhHaGi1PThh9NCvRM5mTGDlyLSZnS2yhqrwRh8n/a7FEEBUyegY2V8W78v6kZiVgj8WsYQoi9E0qS+te3QwtNTci4Q0QEfefqpw69jZaCEDd1dXV58+fsTcq55Y5RyzvF28BIxBR8bdv38Krgs9qNteEz3FWEJeLZWglOjif474Xh55THTF8QLvxAQHnPKagKkKr9ehpCFVRInMu4Xus3Pv7e0CjOf/JMsqEQI02a1SKtMA0VEjRiWkWu6X+boPJj6nOsDx3MCUB1rfWKK7GJwG2BD4W94EFSHQxk8aN/6amWagnCxDdg8Hg4uKCcULMZ0tDRbNtn8Q8IfJ2b29va2sL/1dK2zjxVjhbixT5jlIMwiKvJFUZR9ERvpAYIAYA+T3OzqhRGZcpfYcKZru9vcUFmmdFDSNSivNss5hkFV7oFaTK/Y8PdtqtLBqbovMVMR/Y6kn+mIhxsmib+uyRoAI7irGFfKqGnut6TwXC8RH6IhrtROojNIbRNyGiOD7IvA9KT092B2SbINlGwUXqaF+q82MM4evXr2CUQVYeprFasEoBj3fU3lDaTLMbVU/S16/ygOg1GiGkM57sTUp/qmpZDEUa3Z8VpmfantYJ0O7Nz5akXVRlRlpAmJBR5VkxD0USMqoQO1iGYLFX7kd+Vl9DnAlx20lulXWcU/peSCAEXhT+HYVjWAxTyYpsDWIgQCqDdyR7Z/2YVXx3q6hp75XRwhWlYqBTtBOoUeV6zWQPKoSVRqAO/cKwM2YC3AcMoOkT1TsZF6PGDHEBzUvDYVp59/o+yjjHLMQdN3DrparwKSaV8oiSDoC1QNS5FoGpGYlHPCrExB3SVmsyMMtHswE8lWi4RuPc1mOxCYusvxSDsMirSlIP07/quWKHLq8hpDNJDhY966ap8PDmjo9IBUwaejqjkz6D9ln41itweD4vRld74CntsYMWpghCUggjcBSqiqFHg1AHhfAhxE/gLVZy0TgiydhyrKwYI89R10e1iclkMhwO+/3+YDCIrIYZHYhhAbwCvN3IEEMOVYSMWnm9+qOgIThmb8I+0ZubcWXvrmw6fC9CW3UBmhpd5e9Q8Jgl6BI1yizHaJfailb9TDMSNWzImJuF95NUtFWdaQ6jvA5HEk74DhBBtQBs3H/Yw2S2BDoXsSkiHfLrtOq9MpZhHU2U5gTzPIGX5nTSBcuQkcFH9X1pjYOBg9UmNOZTv2FqIFlBc9v5DTRrt4qTVpcq9Hus03wJAbthnKi8QAO2SYCD+hNpGSL+iQvUU5NMhrTFAitL669Y8YzVDiB1YXBQbPRj8Qb1RWpFKH6DKUFPgVb70FITmiRS04mgWxBSAMCzRT8Um5F0e1l0lGWQ0Bigi1mvUjfJKvfBd9EBihRZSopBWOT1xGJ0+W/0AMDZAMVL8TOIwCDwApZRfZDuwuak56bMGNdoNAKuCfu+HT/mfmbz8kG5qiDDS0vU/vX84wfTn+qYuDZMm5ubCEyhA8lPqNV+9eexMIMCe+AbRht2d3fv7+8RVdBgQpVlqC3UF9RDmqMfE12o2cCmvfwmoB8A3Ij2FZUJuw8sE2pgmJOsLEfVhy/Im6xmkCuIC+18eHgYj8dwfgMQpcyokaA/KqmmrwMyqkhs/KpOYXr2M7ltgBcFqPj+/h69quhKY3cwu4IRV42+QnHEZRgjXmBKef35HPOZOUXZNoTBJ5PJ9fU1HB8MjFsvkfeY+DqWa4eZhAoHu7u7yCc0ldeWsG1HZvLZB1timf2H3U4FmoFBlBVlLXgrF6lRFKZeQ7Ahgx8YwGO4eNS7V2fyq6XEwvQQBtMUqahclzEkqFgAOx1QzB3uJ/gcMyDApLcimkBcBUq0o69soG5Aqe/u7ra3t9kqEofqeOl5pFMCpixZRjEKrMiCuYoP+W6Po8CyNNhbkHiP+xOY8/btW/VGGVbCcho1EktrHBmn/J6/Wqq16rPAZ1Kd9ft94P+xC6llaFRJhgBCYzAldnd3v379irlNbSRJGW3aQlynS71XkSIvLcUgLPJ6Eh2c+Wtsx7SEBBYhSJ7ZVTc3JYlKG7KwaBPqocszye5pPtf4IT76NaUqKGdqzQoNU3WQBBuxFBvVqbxGHruLpPxwwZJmYKGJHt89+b1Zg9QR6R0AlwZVn+g8VqNOv2HzaB9Cy1FYlPq8V5sY0R5GVIecoqr4ajwzwp4jRpTGLbU3+sUVb1alzWcihIinMRtN7RBjGeWtLERvoWZYm2gPYgtKVLiQZbSq8dbVyWs455PAV7VALEzNFqID0WyCok0Pts3QcghtwzFL0lZ3HZSvhgrhCuHA6WVVpDJmGqE9MHeZQ7tsVXQz6vQplm6ah4ya2c/7YMOnyaS17+iBSjZJ7Uk7UPTRyhMT31dRwZg//GBGZnwXy8rm44jqZG13DbgtW3BCh0BXtzqb4lZcFZ3WuCspdgGq1w+2CuKcyTeem7P2PDYfUMeRNVfnc4zymR5CgOvW1hYi3pwz0TfBHyYjwwVBWmQ9pRiERV5bkqQg8bJ4DdMt1EIwnUDTCKvUAnqp9Q4oMzCZTLrdLnyBSmLByKRaAna4Jl37SZDPs3dmXgdSHT15SC/ruaQiqAah8f7po5OxyqQyB2H8BOyL9jr6zypUWOwWPebV8W8Gxu3tLbhSSYNpb20o3NgzGr6Gt1vr+1nPrDAlzB5g2QkUS9TqKaagW//zPhr2waKgrsPUHVypbIcZZBRNNVJxshg9DULTd+NYJMeUN9e/sjgYa6/FIbNGRsdQcl3EaziIjHwidGb9HE0CYh1RLJHBZBpLSWbLZMN01Zg/pSpamNdB1YtBXR98jBa21aebM4WpdGy/viACoREvXXOr0aZqx1qgL/pK7BBRs41zibaTAY+r2mYbl/ZGnM9JQ9HurDOKlLxKvByZ0tjtaq4wosioIN9L95/6UOrYSPzKSobyAtv/Fd2N49KKi8IVwmQ87pYxZy/pCsyIDTG4cBD0tvIwOpT8xj5wCPb399GxPJvUTM30an4CFCmyJlIMwiKvJxnHYRUHjOkNZJbDmYHzgyeH0WOYWqDeelXsHh8fUXGLzNTE+Zj/u+pkiv+MpsgLeQRN47EPmT9RlYw6ZeZxpv0ge+329nZzcxMGCaJV1BWiHhMHVItEA2am/mwNDGZCRlX4HNU/4itr3hp+CA5MMHZCgSCBpD5F4ySck8SLAgGVfAstNBcViDrqQgT4wdy6u7u7vr6+ubl58+YNYjuGjFVzTjUhJgVpMt7m5ibLIfAnbDxTgKLXRkec1VyQwDOZTNCZaLOSkahdGslC+BRNHmZX04xhwQzWds/o9NFPYSaWOn10shFvdnNzMx6PoR+TgZP/Z2F6UlmiY0GLCiwxqZLIPBRpP8zGsA5PVjFJBiIy+48hdZV4Yzwe393dvXnzBq9sjrYkFkCRgcwbBKWkEvRb4LRKuE51kmiglRu72kjJRMHYCUy3U3YTJnNm7Em+stGPVe1CVW/KIBsgx6icjplMiwsPYlahdjVpgRnAx/zXHZWYTMallzJIuKJpy5E5jAQ2alrrb9VhquQxnPxaxI9l6M3KisHMhaasHlKsIQROY4DqNzc3dT6jnQS7msdNzybskI1G4/7+nkVlI4Wsnf7Rb1uz84sUeWUpBmGR9cKORu+pWQIWeDEkW2QCiCZZDJ3hAIbaCgyMOhGT5Oba2mSEML7Rs4cHM6Jvncym42XxdTJiSirBTsrIX1WzTp9oJ6X2HjX7VquFJA09dG18daSUtCBpEmciqGTUgPZgYDmzc7Rv7R3VdoWupu55SyWKus6yKjKbBKOLeYOKw8T/+VybBtFiZxotyd+pxrEiRRXkT7tIUaMwMBhPi6lo0ZhMSuSIJ5oRGqfhY5ONTDqeYvuTwWdticGk7ZoYsNJRYMwEHUvOoWT1bbtt0g8VARExBJeJEPKvavQyoqJ5nuqF4RDbdML4MoeNUgdybKI6tHG0ZE6N5H34E80HRixOl23VTp70fdigJLf6aGPEZsOtQBCy5lhGjiXdz2O3KFhUK/txC6rZY1Wvr35SDQtnbqjWnU5v+s7gGeE8MVpRxYvWOUPZb2qsIkKI/YebRtIDlRE6m5DOwNcxQto4xFXfFymyVlIMwiIvK3UgWyrmSKMvFhoGdnnCS5TuWVXAZCIiT3FTKajEgBkFrkRF0CVVBAtzZQBaUaepD+vKhDiSfRjjP0bZr5WdjdZ8WRcmHeTEOFF3NH3IuGQitw0HF/eEF5YGoQVaranJXBrrDe00c9maNQjSVIDlCC6KiCCbDEz+0ZAydB3zzeugbKwkNtxoNgF+SQ695LP03e3+b968aTab7XabNiHeQt3e+XIOjG8QVwlJUlMmwX5m2Oh81kFBz1P95VsnJ0CVVBHJVLn2WfHCMLrah/yGQR42XrcssmgwVGIWWtypYuN1LPJ6edX3Ojl1RnEo2e2Gv4j+JtyKJQRs/uSt7qrRSQad2BLr+WSQUG+lPYbGG3lJsoJIMqSc7Mz8kRftdjUIuVL0e13RZhnq8LHoK/mrNC638WTRojUk3tQdxtamzlvCX7UGPQquWEmeTKLjsh5Vmv1086nLsmqH5FOUFkhbvrOzA0YZUoxWjftCbadIkbWSYhAWeVlJhqQy9o/leqlZCHsGZxsoEOlcNNRojD8k20OtAlSN5+fnV1dX0+m01Wrd398zHmJgmOTWnwk7xCfGi2MMM3nDfJZgVf8bp3/+lFqIxuEHUDKwwi+CqyzorPmWMWePfahgSyjHjUaDaCLy5in7gvVqfUSuPVq1AeoNSMbb2NhAGiFiCMkokFbopsObKj5pQsidYHFsszDriyo0iOQw1xFF3kkKamlvOk9UHyWmkcCt4+PjVqtFpa3VaqHCOEOdVRamzXAY2Fr+i5FkjcBz5VrbtG/R+MgyCk5IKs3IOLX5lo9kRh+NLT3+nKg59DNoqNCBVptBCySwSTRc1SBUmC7JjZOZgeZXyqziKtdV1WSzgh9QnW9ubkDsnAwva3uYcU3zA36cjY0NVmkj34+y1C4VD6d1TcRmdFIkjTedrnwRdj7mz/39vZWaSIIAqzbbGDy0mG3sf3zPtQyuZkBGsRIZf45PYTdy2+T6RfYvS3Gy/7WCvHbUwiGw8xT7POxV7DnaUYZ21u2dwXB8TyIlbDg0tLA6ostPO61Om9XkI8AbkNG7uzsAgui+NGcQO0qLN8K7ByMQU4V49Qj+twlQ5VcqUmTdpBiERV5WLCdnoe5u2oz+Vgnx9ZxT1j5TmPS2Sec6P4NQ5Pr6GgceDj9y2WvsMd4zKgQaSLFvMiwRmuhSleZehQqLj6DnPqZWWgBWb54fTete9hKySqDBZOAxEbPKIdYYGrkoNBMvWSdafQd0TierqMc+1LewyooslKccetFpHQ1UJW9QF7iW2LKY9saSQkvDwlAoD2CguKiJ2ovznqrPPT4+wjJvNputVgsfMBx5lkjek1Yfu5ExQ0s9Sq7WfNxb5x6ic3AcwPwmtDgCjHUck3H7zNZkf+Kj6SyoihdFkILOEGxiVqbSwg7WDI2KJzXmZBvyEcIYdyL3TzKaHbV2nRJYNZrDBhxjHi+d6XZ9Bf4wViipigknASO4GM6sZP65Xh+7Ot9g8/Tl34vAe2ZfW/0DM3TjfNPAGjP0kttOPFXzEnH4Gh43ghYTta/4dO7naCeTCbWpeprbyV5HdD5zC4LjjC3XgYje2+hH4PfQPbAZxrezm8TbFimyzlIMwiKvJ2YW5mM7pvdYKIbaBq1EvcD0leSxqt/jAL67uxt8k16vN5vNWGXIVIHo4c5Ym+aRTca4IsAm6VZc6F9UdZz2ANULO7yZ/8DH0RxdGCSkOo573nwTjcom2xN1bnYj+pmlzFCtG6FCyxGtCmmqrkM+2JjdVPVGsYSxOfu3tragH/MnavNrPQB+ybcAtYZW+dMA48qinJAYAs2ZoaGo6Fz7bbJnoLQ1Go1Op9Nut7vdbrvdJkTKggD5zjQ2Qg3axwVbpc3rszS6SKuAyiW1Xv4qOVuii4otj8EcQzRwpZitazEBRHhwW1hHSn/CsAOj4syvS1KkVsUzMxNjBQWU/QkQLELlWlqGu4rhDhQQzkgpfDoEiyoaNh+8Tb4OP2g8SmeUja+9FIUbAtcgoIAMctqYWp2Pqk5b6H6q2sz1Dth8IgiZs0t9bdx2tM4hQ/owsQCy0NllwIqlpgr7nOhWw1tqWRTz2qgRS4IWOMuUZTSW5DFYRzw086LQD5Ba2V4Ur9fphKmui52xzUajgThh0j+YdDYt2/giRV5fikFY5GWlKnpWheqxX2lEgo5nMiLSY6dEjpavxUerrageRKgFOzs74Brt9/tnZ2fz+RzqGundMqihvCfY3NjJd4+aX1K5qfpVMuRCQKyWP1ZdnGqQxSUyJ5YBcREbhDWIqBpBfREBqAqWaTawlHDWgqQeEUIcwGrhVwV8kv2THA4tKK/6AZQGvg6ySQEnU8ioFajkfMNswVvAPU+WThC0EN6ct04XilYAg/l6fX19f3+/t7eHOK0ZWiQFtQms4RqG2RleQJ0AtLzT6TQaDU3SS3Ysn8v+5PRAWhR6UgOSWnCsakBZ9JmMnYSMQv1VQwUw4zphnMxGpJmEOlG5jkiQAypOegR0biBcSZirovhwAXGtMJwUB6FN0uWWTFd+uq7JxsMOoUMEMSvOFo2FkrII48gPDHhqPXRyQS/leOJMgHXNqcVZoQ5BHdm4bapbRycqKqwA/Ujfn/anTfiqnd8arJ9j1MhmFGmuYYEDMqrG29u3bzEuagyTXxTdyw6BBYiAGxEKmsDJELpO74yrkacGjxIQBQM4jXx+7PzYq9VfoJQwWgAD/wTG2CKZWv5RY4NJWyszn7kFsZoUznGwhenOz+lBTxO5qeh3ph0I1x7MV+S6WzHJuCSTsyLT+CJFvqMUg7DIy0rMb8n4SmM80HQdHuR0MZK9XbUNe1ymeXwKIl3D4fDi4uLq6ur4+Hh/fx+U6ywgVgVfsaCEuhjtG4tOaP+YpRG9yzGEYv2TrwyuROE0hxipgD5Uh3tANWb0DNLDqLbSvCT5fvIOFkRVNSiJo1PO+vyAxl5i2yJYlN1CHYJks5rDo/ChmE/IVikvws7ODoxbZkUad0JNEFp8QbVs4SWBfWLUSqYNx4C5mV60zdByNB6QUQxEVf1lm3UxSMjoB+3SWG9aJWktxFgZzPVkuJuaaGaGJOHW8b34vfm2NMQa38K2Bf2G/6RJzFwvY7HPbBc28RYmCi6cUWalwIDXtYNrjFFGb6KBXAX2M36lGXr1Z358ZTOZopEWf2sLgU8npSfmpzG46M/xjaanxg3fnquOwgy2Hx+wRpSaK75OHDjOc0t1Q3FLUndm6lvmRyFOZqI5uP8rHxjXoE5jYw01Zl1Wm6B7yFaTbZU1XWnckdBUQkYNFRxJXONNdOqyk9XHYZOqSJEfVIpBWOT1JKqkEVaR/zk+kEINxx71bA0SJhN7VBGMyBYApc7Pzz9+/Hh4eAg78/7+nh7NKgRa0g5RwyNJTJ8JElaBXavUvhhMgFAXV4JH6mQ4mJP1o5JqpaEiqT8Br6jQUKWBYfzEAEvmCFDVQVPvFBKc13eroojWJ1FlJKwISsNkMhmPx8oyamplZoxo7GFyNr8JDCqFjJqOVVNMgeOkRctvb2+pSFHp0X62SaKsP/oioKZgy1l/WeeGNSxy80DMGtTMKO0oo5hX5U/p5pOQUdaBxH2izV81jatg3pmIvcZnaBASS6b2HoJabDO/RyeooqzQ9zgcOmTWwjglVrYJtdsZ2kW5OZ0txg0bZ6auMuW6VJh01R2qRIcSt9XyLdFgs/fiB+scCleBTleaZMk9P4b7bCysN2xEkq/PapbKkKS+lbjtKGIcAXxsm/BAoS7Czs5OBCEb7jfOn8zkYYkmZNfbdmrYaS5Peg8J8FZQKx0H0fjkTWpG2OLTefzNvknsT+1YuzMXuLppECqEvmFnd37pPcVlU6TI60gxCIu8rFRFz+Kf4l5PDYmQUVVJ2+02IG2Ex0CPiQhPfAC0yVzFVnphPB5fXl622+3Dw0MYSwcHB2/evGGxYABd4gva0VjlUM/gQvVPdmBXxQZjwobp5SQxB2EmlVfCeIB7IQNHngCQQwCHOrnpEaWZTqfgnWMbovKnBiEHRVnRSR1JcJ2+4MKkO+tM6nymnPE+1GDQV5PJBEhRVC5WLKJ2MmcyC7WTJY81x7e2tqDxtFotZvVE9qOlBD/hEAC4OPomoElksqiZLnxrazzNEvXN7+/vt1oteEOQw0mzXDU8tiramdAXYVHAWQDUKOYMumg+n6Ojbm9v0Y1aQjCpanMJa5wB2C0q07u7u6R7XRgAyWDXk2FVqpKkS2V8Uutw2gqiDYMeRpeyaiL4e2A1MWdJW2LJTlUBcG2qAiPrzCutPfjw8DCZTAaDAe4JfKBa9XyoTWNGmDltdHbF+t01W4hfMQ+TFQ610IiiFeL2pS6GSDe1v78P652BLw0uJd0f1vMRJqBjYdOYf2IZBjwUYHV0PiYVt2v+nOsXcwlGFOOBCLhhgnHbYZ133ZbjDKHNk5wb5u4hQJQ51bzAuouDjpFSok5MfpYUVvKhfDwwb7Jq3+p8xg7JGCz9SuqsSZ7jZEaljw8Osv39/ZiPalMinn2ZrIciRdZBikFY5JWkKpIWQaT8Xi9QxjMqBDgLob9Op1Njl6lCbUU/ItkywUx9eXl5dXV1cHDQ7XZ5ZlOtybyj+Qv1xfk5aQYn+6QKExU93xavAJQOpiBiRyDdZoQQKgUDeoSMJjWq2HhzUYOQkEesqdRmFesxbFqX4uiUjt8o4PPCJ1rXGS6Ig67wJygN6DHNuszUzbOxY7CLUCiCRTWFZjWzUBvA3FcW+tP4WzTFYxcpCpoLhKkyyJaBTavsl8lm6/R7qBZ1zGuEUAOncYlpn+vsgpC7BTfUMphVkNHYFfYs+6YK8qdqZZweOqW1x3RxsQoF2XpUxdSf5GdFVQvz7x5/jhmF5UyjV+lhjdfEXpDth/uMWr6CBi2UumwLNRqsTgrrKIvImR9Kh4M1WlhdRv0pSR9lDKnFpsYQmR1JWi8RV8KHYvRLVW+n65fM27u7u61vAuAMVq7aWtE6TYaa7X3NS4KTgv0WdwNL1ISosYcR5K5oeFHbIeOZnp8q6vPSCCEPKdv8jdk7ntcaUlbdQ0OaEf+fPNmLKVhkzaUYhEVeVqpMoKfck0qG5UuoWhm346giq+MTbn4czKPRqN/vDwaDg4MDxCEBGY3oSoolQy40EaO2V+XYzluDamWpy5l8HjBvmBTHQsxqEKLfoMbRlR4VCNPFaY0g6U6tQZyRVvE8stKpBUu9Ab5kqgikglhqziTz5aLWbqQyUILRY5YnU6Ve2/c0cmgH2ruoXrjsKjCDkG2GKonwrE25zNyjzYzXhKq9u7tLpCgJAI30xe6pKCxapzCtFagcwx0cccNM6iAme4Dxc5aPU8eB8l5m8H4xUzE5YaznrYeVFyRqk3YrpVvU2Z5caBnsaBLpF7+pMaH+Qd/FN0oFxFoy5uuhPRMNUV6AJaCmiGEZalLsWs9rRTvFpdtPiCtZeE/OSa3eqTV78jahMVSxoqa+r5nNSTMSGezAcahnB6AMncw63FrKEmDRTqcDg5AZetEDFQfLmpoBNzLfUsEgyW4xJ6w2gOhWttCYpeIOGU+9hSOLD9iFOKU5jbVXo6NTu1oxNcivZrP1ockeS/qCC2S0yNpKMQiLvKwYiAJfRiNH84L0ewotFthsVDiAxGs2m5PJBNSgb968oXKcNAgVzoSbQxvY3NwcjUZfv37d29vr9/vD4XA0Gh0cHOzu7uJoYSZhVWxBC4JHldTCleZErIocJo3YeKgzbYkpQCgwPZ/PodsB4aOFHAkfohlW9XZsMyB/ZNUHZFRjRNpO2oRJSB6fThOU/ARbW1vNZlPBTvUjHlVCVU/vRvt5Pp9rngnVBZ2WSaXBDDzOVQCiyMVCzUx/sqzYEEBfByCTXnl8AMyJUbtkXpOSEyKeCTuw0+lAoVQ0FwaCKq9Nb7wOsxnhIJjNZrQuSN2h/Yl67tp7DCDwztT4MWHIHUUQFyYtzU5SemaCHpwPSf+9mbs6dbm6mSTJeDusu/v7e3qOyFWoLVFEHAqZvH37ttFoaHiwThjEbhsT5GouFg4cfggzHlsHboL1y8IGajIRxkmzhKaamSKGBqwzOhTcHLsNHUOAlCvdFJeVre642ZqlQaQoLTE8xaplJtsZt4XkZh6DigotBmntbDabz+cbGxuTyQTsnfTZ7ezsYG5rsVAtj76zswMnDvbMRqPRbreZXQ+HTpJ5O9KY2WczRxE9hm+RjiSWUVEIDweCoHoeNIQT40oahOY7MKkCyyRHhI5IAJ5vbm5wSCWdtozT8k11L9X6t0huR5c2Gg09eavcIsmc82INFllbKQZhkReRlQljqr7RU9mAec1mE1lbpmpHp77dlnoDcpOQSXJ7e4ssmqurq5OTE6h9pBut4rpMmrJVHk3T/Kp42E1xqYIkxZDR/JvMZrPxeDyfzwkZhcVFLhme2cYAWaUDmSeV4TX8PFPWuQoSHI98flZVmwr0xtPEsE/2soaOsxdPFsJW+0r/T40NOgSChKperGwTVlG2as/bDFFFWftBgXyK1OI3iMDTpmVYJhnf0K5jhJB2mg4BbT9LX9SBTkbGTDhk7HAmCZuFmZkMyXWaHJro2bGe18kQzTZerLsBaydmSEoz7qeqWbRCOF1HhzhqS6hTb5e+ILtarQ6tKaJzLK70hWLDpNNVS6pY/0fjQRvPaC3nLSOEVqBloQYfN+3IImZTkUtS921jPck/BaJGOCKE7XYbEUIGCTX8bkdknf43Lxj9NTRodXrHnrcNkwE3Zg+SYtdChQbC1GbndQnbh2npabqEug+qdBU9WPV1OPHUzI7z2dSezGFapMj6SDEIizy/LAR1JPUbSJWKo595Dc4SoEZjJlIVPgcfCAXhP+EeBgXLZDK5vLw8Pz8/OztDHjmrICYzndh41dXMEDIvtf0qTwuRPMV5DLM8GqxB2IGz2Ww0GiH2hWgSEXpqDSJModC+JLVMPPu1poXCnGI740AwPBj1JLVvow1WX5Kmiyno+r1qh5reY0p8jDnbfbQgmFblXpiAmpEkhpCRNCtAn0QbxvbTl688kKoYkbhC+Xt1WlrqIBmMaA0quyx+wuWpdgKtTTJzRhOFUSkaKtT2OKsZQcpDRmsqvhl8FxeIWkrRTaOfLTBOpB9jnpHvh2vQcr2i3mmTxL7JzysNdCsKTsuj63pk8D++IKNYSEZFbEqDn5Y1V0ds29Fpoxl0MaKbVO7jWuAsjQlm5n3It1MbwEB69N/pxcoSjBMHgSwIJ5WldmvSNYv7IWbVbrc7nU6z2dRCDpaMV2c5JH247BaWQo1XsoczM5AMtFqBkIh67Z8q2zXzClFPMH+NHsrJTVInDzc33cTIeaZ8XfrbyCtTheguNmGRdZNiEBZ5QYnafBL4kdF4eIGmhSCmh1MEagdLA5mtwqy5qDGomx8k2opqGwwGu7u7p6en5+fngIySCZDg1apqbAY0SuoEaibpORqxRjHMaFo7q1fd3d1Np9PRaARTcDKZwLglBSKuJxoKYU9Yg0aMEU8sVemYcoOHKmWioqHshrxbdKxCOeZtwemi/t08diuKmtaKejILkxYgcvCglgHIZGUbDCDKpzBMoZ+1FJtGRXRkV4jhaD0DTFok0TE4RvtclRg0wCLJmu5ItRJAUwSWNzc3wa4OzRLNIGY7RkfRh9PpFHyJpHCI3g2GSeGY0DmAyRzNKrNYiGAkyyhHFk3VV870s/lf1ImTdMTQKMKawsUks9F6G0afY4hK3JCQUTCjRpucEym6ReLyVGV32RAQFyySrEgBAnA+cL/sZFvIGAVOdUI29vb2OPcYWE4y9S9sHmcFfk7+Ye1SzkZ6RtT/kjxfeBmQkEx5JWS0ZgdqU9UrFKcfm8GiLHgQiIInk8nbt28xBNp+5iXy9VmGlzAZJtIjNthqtWJUP9pUFuxNuix5NGCG397egk16e3tb/QVJ96WRCeFLrFBOafrLkueCZWPWHA6uU8xejiYOKRjhUQOJDjttP5pHHx8D+3E+J43M5DQo1mCRdZNiEBZ5fqkyYJIXJJEVUa2xZHoIqDvgE+XGrc452oeqyCaPQ+WcRFTt+vr68+fPJycnoJZBghBs0SqFXu8cSxgn3ZwZBS7jY+a70HFLIpn5fA4NYzqdKmEmbkWCHAL2Iq4v2Rj73hRlbY9FqPJRUzU1ldkcGWhGsVBTTP+zD9pU7UMrl5eEKiVvovch1lS1HMVBrWANmvAmtOJU59MS7ewN04yZ0qORFho89/f34/EY1URMmTNrkGxMihRVo0hBhto2FvZkENJCGTQyk4Ol9i2zEOmVUAW3DsuoEb3on2ys9S1s9POLVANoaiuyzaYHJwNK9s+k7adLrM5copeNmwPDSvGyWH+Fb6QAPzX7ObJaXWbZJaBvSsQ7rR0jMY4Wst7HvlRQAAmQknQj9YXXq02Y3I7IwwTvCbD9di5oMRIa1Qo30HIOiBMin7BqWUWzTbcIGxcD6/JiWIY8i6uOsGTX0dJW3K/935q0mmWukXz9JgnW0LWs9+E85181B9iM9irFpsoXXP+NihR5HSkGYZHvJlq1nJuvYQjtet3fwS4A8Emj0aDH1EJPSlxh94yQD+zsUA5msxnqTxweHrbbbXA/sKxWRldIqnSGHbVv9H2T2UqZbmR0AqmDCHOBYkcLQmg0gCg7I4GMmrd1Pr9hKEwDrcZDmB991QvVsgUjzmQyoU1omJ/8bc1yW2gHWgkHrbdmAEItSwhhJpIC/1RttTCFtWEFs1DNEtP5dIbHHohGeBJxh+tvbm7G4zH6X3tMTZcMuWhyRlnKIsKDyii7vb19e3ur1mzU52iF8p9IziQjRVzRmUVaNVejMmoeDcRjldfXhkYXGu0l7HUankXjY5ujIyli8+rPlvwFNqOYzWVMmxmuXQuhY0YhhEU6JcZsl1WF7WKaQ1qrQK+ssqVN44/faw6hEjKtYBZmeMLM88hSrrPZzCCjEBqE3G0InUC0jS5R2IGoR28VbpJG4EKJewjtZySlG1VV3KLpZ9EdUqETxqWUNJyW3SfN/DOlIvaGvWNcfbyDMtwqva11VP0ZXiCjRdZNikFY5PmlKv0sKtnRv55BPVHb4KHy9u3bVqvV6XToNuajoSiAWlOVHp6vetbynCAd4tXVVavVmkwmFxcXJycnh4eHvV4PhzGAXmxSlf8+xjSSp4W9u/ZS/hTXsB5KZczn8+vr636/jwgP2B1ZoY51valMWCQnP6Z4U63ErZaPRpAWVvuNUQIODZCHV1dXNzc3eCNgAtnyKma8TLMN/GnDxNchH4+aGZg/SZoHUy8Y89HElciYYsroUuoOcz4xkWAXgT1Cb0juBCvDjQ/KiqRObkLyMK9QRwTvAp8C/grwHn5CFJnyGAHzpmahvSmNDRKEEm3Ib2K0Bx8409AGLHkGwJMso/lYt5IiLvTlqwHMhzL2hZbQoKWrS11UFgPBTrK/v698qvbWVRHIJPByhRmlkFGYKLu7u/v7+xgRc2Bx+JTchW4yXKM0IWDCxDdwASwbHtHFzmgkMsZ3dnbQkp2dnZubGzTg9vaWv42I5eRmy5g2ouJq+fC3mYJDmWYnR0e3OyyZ62+C7Xo0GoE0mB1FQCxjrYAZ7+zstNtt5LMhnb7ZbPZ6PVQQjWCESF1WlWCvvcSzA74hGK7KVg34KJH5eoQpWJqPA9wXMw3N5uSxaakjuNSUZksA7YarlGhVncbqWoreB014Zghd2Yz01IujnHHJlfBgkfWUYhAWeX6pspFUvTDdJaoyGeWMoYa9vb37+/t2u93r9ZA4oUwbVMKU882QnNoYOjJZb30ymcDEOj09JSf77u5uhm5UGx/Bk1HBss6p070asQHGD2DRyWQyHo/x/9lsRgif4hiJtqJSa0nzGX+toW2jvUeygSoLk+EOfRH6y2GYPT4+IlMFySpKHGIBk6X6SoW9p9gts16iDWlmYfJcpy5CVVtJ+ZVdc2NVUbQYBhRqd5XnxWwJVWJslGkVMCGQ5QQ1L46NVyIZCEF3xjOksUFzlzw8PDBTkRaFxaOUVIahG2YEaezR9pZ8P8e8wdhdEQJtazY51S0EYY4D2kXYrxjz4ZpKLj29uTWVP1ktHKQ2AwO2MaqWjIfoP1Vx14iKFhVYqmGxhcx3RTQMe77FJ80VEpeqBZyVrIjY0fhqSzW46jXV8IYHajweD4dDbHeIySudD3+ooXWd7W/fvm02m51Op91uM1QIez7J0px0Ryb/mQxyomfQQn6fBEHE08RcirSKqzALxglUU7hgGVBVp6e5ILVOhrnPFDphNbF0h9cXt96rQgAVKbK2UgzCIq8nEXyF7/OsIVHz1hzCu7u7/f39w29ycXGxu7s7nU7tFFSwStLsVM2VeirJ3/r9/uXl5dHREUq3KXVNxj6Jinj0vyaxKwtFATzIuIOAmQBgS6RB8hqi1xhcMpXdFCB9BT5U/6osf/ECG98kWkxHn1wORFKRHYfKh9UVyNiE8aWUd0TBYAprJC95dBjrwPHmSUPL7J9op/GGqykHagbQto9oydjPCnI2T4RxukLhI+1hq9V6+/YtsptguvCHGCkyi9LFEB0NyqdCVQw32d3dvb293fsmKHGmr2AkgZwealypohwHLt/PVbqacrTEqRWZFdnJqkTqotNwHO0lgjPNVWGTPBlYiJtYcmOpM6M04goUItMIdbAg6kZRtkaGDZkjqtmDFpRbSmzbgSBZrtVqIV+OwFHdkapwgNHjw6gvkc8wyVagq616Bd2IWCp2PB73+/2rqyvu21w4ynkTkwnRnu3t7Xa7fXh4eHR01O12gRplzC2Zyp6Mh1dN/uj7UPIkdjjXuGZfG9gnonsMzhpdMCtYUNFbQUokbu9W0yIzJzV70LYvjmYsR7TwKI9eaev5pV65SJFnlGIQFnlBiRinqgMpcwCoIoutHHQX29vbiNf1er2rq6uDgwO4SOfz+dbWVr/f1ztTfeEHK3qOy1je+vb29s2bN8TzDIfDy8vL7e3tw8NDnLXKd2qO+TxKJGlmqNWU71JqzLgegD0oFtfX14PBADUnWHiQ5bP5E1PZeUYm6xebS9W0E4WMsvFUrSJsz6LEqlCy2OPt7S16+/z8/LffflP/LhJXCGbL+OCTdmBEfipsjIEaYoQYfY0Wjqo4Ro6nVKuIeqmdEFWHpTQAWhQci729PSjELAipiXxESamTu8rOIQoUqF14GW5vb7e3tzE0ejEZ8zEDka0KsladYBrcQAMQE7u/v6epsL+/f3NzA5sQDWC8S80MvI4FSOGd4fiSibFO1H1hWq+uBZ1C8LZQt6PxrxowiGpJ4UO+TdYeJGQUhJw2NGqr5HfIpDa/1Izi3MaoIfimWVI0Yi1REDsG8dUGaNRwljIJLyucDMA1gFl6e3sbBfe63S4AEdPpVNe4xXA0lsUAFBpGI+f6+no6nQJeiPtg/domtrKweSw8COqvm5ubT58+ASyKfZtoVXKYqZmNWbS3t9fr9brdLvLbe73e6ekpXJa2pScN4KrNU3tJTWKQk02n08lkYr4kTfpVmK4S4bAbARklbkVhyUlPVn08hW5i+HBzcwPU6HA4BJE4wTLR4RJdKjqfcRmxGGpYcrcxr0c86NU3Z32uDShS5HtJMQiLvJ7EVLqooSY932Y1QV/H6YJd/vj4GMYbvK0PDw+7u7tkl0462jNwFPLOAcbT7/fPz8+BSkUSP62XqhMrvs5CTW7heaAoO6ZhzOfz4TcZjUbD4RCQUWjnWpCXahmBdkYAY/UbKZn30uK8TMnIM9PE1yFRIRE+eLX5fA4T9+TkhFo4nN9JbY/3NN9tkuAk+pJNSWKQx4xJNatixpd6lDmxaQ5Rw4hYo6VEqe1YeoH0CfpSkeTTtBb+n5VUiOm6u7tDQiAMcoRNGOrRGvSAK9MmhKVkRQh1peC3qDrICMbt7W2z2QTOGWhtjqD6a9QZD6GHAlPRjIH6qmTS4kqGAU1pVtNCjR8tlhhtNnwAOJMXRP9CDHXa3UyFXU2htDAOK61xuPFeNAtNadZ+SHaIdc7K7dQI4c7OTqPRODg4aDabMDvJW6suIevGGIzitoM6LjAsYZUp4+hT2mxbN6PcOF+Gw+H19TUJwLSApy5n9iT3E3g/e73e4eEhstxbrRZKxRB9rS+rqRPsjaRlYmFVzmGuenQLw7+KulTrqMr8th2JZpWVTIwNy4s1Hts10puVKkxHRH+YEaM71lnBvrUGZCZeckMopmCRdZBiEBZ5WanSYCICKiJb7IP+ydLuO53O0dHR+/fvP378OB6PwRHK6kOEulU9QjVOLTaIQ3o4HH7+/BlJGm/evAGlge37dIhuvJgoiA46OvSJq6urwWBwfX0N0BFwR5qIotlfcDmbnVCzZrGqp5FyzWoo668sfcUIDHl4k9QHfACDweDi4uLo6AhlPx4fHxlLUbe0ai20ImJqUOQ8SFqtSXJ2mzxmTbEOtWkDOruey/tr9B6kdkhS3inAz8gYeSstLIk7M8wIEPJsNgMwmywRmvappSa0arwFnzVzkteA/wNcI7e3t61WCwYhZ5FVEKWdqZBREtJYucWaSL8Mas6uUeSqwuTMj6CzRbEJeFMuRiVf4ROTbY4mpTXV/At5uFoU3QdobrE/6e5BgIWQv5hsqUEVZdk17PRCP1FS4mJklYVOpwNeTcQPNYcwOm7MC6mBOExmsLzAPMPdtHLDUh0b+5mrBiydWF+AdZChl82j4UQ4Pfc3xKza7fbx8fHZ2dnp6enh4WGn0wG/FEO1sZNtntiWxXaa65Y/IQYBhitniN6zirSGA4fX0eIZJtaY5N3y/az4BVYwIsw1GcFL3lkfzS7VN1XIaIYzxno78xbFMizyfaUYhEVeVpLmXBVkVBUU0kVUQSuhpugB2el0YDywwjgKeaMGtAZMTI3j0w2u8/XrV0BP9/b2Pn78iON2b29va2ur3W4jSAhiG6gOytxIvXCFLT7aLbCU2DCEZa6vry8uLgaDQb/fR3iQWShMESSGx+CUbCTZ2xfqPbQfCB5DVyTVd83ZIJEAX0fp+/AT8rsOh8NGozEajZrN5uXlJRgXwJ2ADxp544CqfagKAa0UA3waUJBBVC0rwkfwiRZ5sIgHb0XIKPqHoGKdfisHc+ieR5vBtcgMTAJWGYvQ1WTGLX0EVD1hZ04mk/v7+36/D+V4PB7v7e2pgxxaHeKB8E1QozViHhqiGrpBw2AzIBiI4ocoIaPVIBWmCNPX6pgBman4upitunChJRHdOkloPDNYzY4lXpchIJ35CAOqZcW6kQSc6wXWMKt8kNcpV8u84oziP1HTFXsCt1mCfhUmpy4hBQsAFqvkuoByoJTrxkpCBmO0DZDRRqOxv7+PxDkW0dEILX8bQ+LsTIzCdDrd2tqCf01nGq9JuvyqcC4qnA8YR6Csp9MpNm1QN00mEw1LckoDpsiETJjB7XYbafPdbvfom/R6PQB91Xw1hk9rs04AM7p0g+LmALAAdgMciKPRiC/OM0U9Jvy/9hso2QjR56EZOzPpjMuI0Tuxni28w7Dw8X+mIcRiKnychrWVuIjwb/MIR+dyHcszRmif0XtYpMiyUgzCIq8nVftdFSVXlf9eKcjJLtNut4+Ojk5PTz9//jwcDvf39817pwjShU5BCLy5o9EIMCrkruDQ/fr1a6vV2tjYgCZh2RpWGm41ieg4vA7zBpHfiPCglprQWA0NuWRgQZkAjSQmKfS+QycDcAseekuSsXBKVejD3lT5Xcfj8ZdvcnJyAvOj0+kYjwiZ/fVoV2iTnv3JIY59rmHGGPOM3gTDCymLoIUlVdtYfjr89xAw0guMFtIIqwIgprAmNRKajgCLIqkPE2w+nzcajZubGypJSglLQCnLXUaCR6O8Z3YWIaN4KJR7pFFhQrJJ6sgwFYqbQISM1ll9cbeJ/UMjtqoBekG8jKOgk1zDmzozbTolm1rV8tUihGQu4R3gZaCTSPtWQX30mDAwqBo8cyZth6mPR6hqKjd8RAgB4ye7EiHxuF6RCHaamC+JEcLRaDQej0kqAyPWrJo4ClWTzZwgcOThKcPhkAVjDaHKG7KFHAsYh81mE4fdyclJt9vtdDogF62KuSXRobotJPHStj/TkLPUAPuVLSVrCXEr9FeqMzE6reqLWpLcuumrwv8jgVaVJ0i/pOZgbx3jn9qfdVhGM3jmIkVeX4pBWORVpWqvhCzMmbFbaYIWjJPDw8PT09PhcMiCVFrZTHkLdS+mc5F+aMbZwKiB8/vz589bW1swuk5OTs7OzprNJuNI8TTV3Po6QaEYGLTPANdBcbm8vLy6uur3+yAXRZEGVgigs9yI5hTWZTSVC41YPTLxQ1RRazQau7u7zB5haFe1TB10K++uoUIg0+CKns/nFxcXf//737vd7tevX5vNJvC6VDGpWMfwIBN1qHbE6ohUO8xC48U2UdW5YAOq2gBfB3Y78xjVbRzBkDXF0K24CWuRqWNe306hsBEhRkgkUbtYMpPJBGhk4tCg4mvCp6ZoRm1JWSXYZk0iYpm1m5ub/W9CJhsNWfOV+SDtbQTZdJUtRQ4ZAZBRTTTDTztTO8HAutYY5soS4KD0mDpzdDbmubjsmhUUSr2nEvZo5ys4MEJkFRNh9bu5ySQTI5dtp65HOKQQJ2w2m8idg/GmxFe2WnWM1MVgeX2A39/c3CD+zEFZrW85f4gUHQ6Hg28CL95sNotRu+gNYQC22WweHx+/e/fu7Ozs8PAQCwc7MFOU7UhKwkeT6fTaYxYwVC+bwk/stnpD3YI01mqoy+hniZZqPnQWhxWrEn1OD50NejJAl2w20+8NSmohwYwpa+dFfLQZk9mZVaTIi0gxCIu8kkRAlG67VbD7qpMAfyKCaDabbW5uNptNuI1xQBKdQvc27QcDtiUT0oCLI6/GxcUFtVVgfiaTyfHxMeo4Q7cDvQfLMWsRZ3uQQmEV16f8pVriXKNn0CcuLi7Oz8+hu9AapB9UMU5sgzKnsXI0AVc6HElzhZHGN2/egPCz2WziDtTL8dYKyzF2taoDnsPNw7vf729ubkLh+/r16/Hx8XQ6bbfbu7u7MA5Zf1lhq8YBo4aKhjvY4UoWRy5EqOlaVl6Bi2rkqOVD1wDpfKhnq55h+sSyAD+idjGlobMCe0mLQu9PZVQpbVTPi3EwoDf7/f7Hjx/BpdRoNJiOq4T4CmhkVxs5BFGRaBUarBMJa3Y4HCL8vru7e3NzgwZbbA2zlPXfMYG/fv2KNCGucYIVV4CMJjvcwg54FswPYt5oinClW29w2mgxRoBOk4Xpk5MkxtWfCDOL9jN2LbSKuXkw6rhTMTqt7iQjodFkQl62sarg5yjajtm+s7PTarUwDRqNBvsWLgZkE1hPWqze2HfBogkjTV0PCFlz+i105ehsYVIug+rAdAwGA9DJYOqCwAlbH9qpRMrINWVQ9ODgoPdNGB7EAWSZn9rOmLFfNbU0RRYeOswKLTCjm6F53MzZqjVLceft7W1gOEl/zSzo6MaKc7Wqz9VhR4fgfD5XVDywDHoiKKCA6zFmqWCNoyvw+kq5lEGBJlduMj9zNS9JkSLPK8UgLPIakoTWRMeYwdvq3xZ5Lw8PDycnJ6gSARcv9AZSbhrps+rW8a+sf43DAOydiPmMvsnFxcW7d+8ODg46nQ7KYYHyDg9VQKNmzpgBzPgMXxz6LhsMtRuvcHd3h5AgDMKrqyvQfkCZADO4hkMjsoW6GmxC8pgrZDSj8ShkFMC//f191MICN7fiysw4SVpENgHYOcj3GAwGv//+O9SO+XyOzJl2u43ILZIYlbfTIjlJwKdGYFRNZ1dQl1VEqJp/mt0aw8KMGpHgLsa1lprkVUOABiBiAAr+0WjEcdT2GEbOFloVtm02m3358gUaJ6Y3dWJVa/i+FoWmNaiBC/2V1ra+u7vb29tjkNAQelpAXF05OmGS9cRrhgcN9JUUvYxBMFIZRdHin9Fnwb2lCjKqLVw4Z54YT7DNGYBMVAEBPkIjbwwhRupLXYO2+iyiuHKD0V3Ipnt8fGw2m6jC1+/3Ly4uMA+58XIU2AaLiemIY3bd3NwMh8Pz8/PRaAQD4O7uTotPLLQGeTcFn5N7aTabIU3x8vKy3++DBgzFWiIUkwuZpX1QcgPkogffhGvT8sDzkyR51FbhP+3iuLtyuJO1eenBITO20lDRQtN2JsEXNTfMJKxD9yirQBtP5PhPrmiSDxnRaPx/RpNJmpFPCfIXKfJcUgzCIt9BkgGiqg8ZTYhKOZSzvb29w8PDd+/e4aAlZaUm4Ck9qd7fnsUjivoZKhqBSGY+n0+nUyTvHX+TXq+3t7d3e3sLX/X9/T3DbhlOavVSQ3hKEfnJKsbIrEMxhsvLy/F4PBgMwP9hSFEqdqpbkFMeuX/wN6ORC5UJGzurEN1qtRBHurq6UuYVKDRKqKCWm4azFLhIOruvX7+iIB5KV93e3nY6nfl83u12Z7MZYladToeqkqGVTP82TCBjxXgpklUiTRSK12w2I6JP56RGgZJ4Ucw3GISIgIHcKLbEJkO91fP/fqLUPrAJLy8v4yvzTdnOpBue2jPVbsy3jx8/gq/i4OCARI5G82s16A06qBFC3FnXOGYIuJrUDjEAM/7P+IkOHF6HjBH6IqtBRnWso+VJQ47kQ2py6GW4D/07aj3ST0RHQ32Ya5LP8ClBwjgnsT8gN7gqr9hcSDr6xmykqGntyRVaS5MSgSYUoT05ORkOh/1+X9PFGeqMIAVdF3S6YQjgB/n06dPvv/8OJxc5ReqHNw0NSCtiMplcXl5+/Pjx6uoK7jzsDzc3NwY5xkKzG6L2YLvd7vV6IJKBGwjxQ/UE1dnAk4GpOP8NRBrnanxxM6WUTIhZiGZi4QJsDvkIeX1hmzWGaVDh5CTUIKcGe0lUpnRlEXqab4926bJvVKTIS0sxCIt8B0nGKJJSdZbrBYgw4FBvt9u//PLLbDYD9yYyNKCSMnSmKoIGB1SpVV1BYxo7OzsXFxco/YfKwqAO73a7h4eHg8EAhG8Id2xtbeH/qEBNLUorMahNCI0EAUlAVe/v74FiAv3A9JsA1ATCD2jAiA0yAYwpfFTK1RTc3t6m8o2YDJLQah66rC3OQtvALPV6PUQv1ZNqaq5ZUBpw4/FMNNp8Poe6fHFxgVSQs7Mz9Aw4SBuNxnw+R4Yb4pNq05oCCuQVZ51aNXgKAryDwYDW8v7+PmMjmoka+db1A1QHgIqNZcTqONtyqKn3sCdxn7dv397d3cG2ZweCFlLnA2PUEekUca341dbWFgIaX758OTg4QMlyUvxHRc0GFyosDCfWy8b30AXxJWP4GES8CPwU0VTe2dlB92JW7+zsNJvNx8dHLEbavbAS6+d9xVLRMVlU74PAL1YQA+MM0St0jSYrLSsFm+GhgDjGDD1bdGbA16GsqCnqM8Iyub29ZX1LjIvW9eYitaWkKaPmJjBa4NWCIbw5dkjECVGfHYxiYOy8vb3loYCL6UfQRUqGJN4T19zc3Hz+/Pnf//3fW63W9vb2u3fv4M7Ahob5TF8G5zyXDDlCYT/gnnd3d6iR+/vvv3/69On8/By+PGzs2CdxTzwLD+L7YkWwCi4YZY6Pj5E8CbyocooutF0tJKgmXAxw4a8AoZDYhvVj6IXRjE3NU1BQA49U4ts1+Vkj6kkGrDrTWI9sHKZsgyZIq4NYJ4Ymd7AfWGUXfLC4LS1MW7nq8tC2JY3t5Dclh7DI95JiEBZ5VbHMJYOXGHzFPiTrvyvd6Nu3bxE4ur29RU0zJvzgrMUdWHItRmZUV1ZvNx8ERYRRCOSBXFxcAMaDWBk+wEwCngeHOu6JrCeaVfQH4wDDMQOzCgBR2IGIeSIyCZTRZDLhyacEqlHBpSFK7ZwRANiHhErWCRJqqAc6WaPR6Ha75LjDezE8aL5Y1nSKvY3745SF7Q3Nbzweg50P7D6j0ajdbiOxDcI0TlW4TctRYLBOHmjksEngg4eOxdgpY1CRDS+GjxgbYaQiyTiiP19hBakJB07IVqvV7XY1m0sXVyz8yLltN1fSFChA4/EY3EWAQ7P8NItfx/QbxqI1rVRHHHfgpIU1zsC1Rq1tKlqIVa10BslV9a+vV+nFunxs3iYhozGEaNBQCyRSLCrC8FemkZkg88aqQn2d8wehcmQI012ixU60MqE1gHCMWPSF8dWnNBU3IWS91WodHBy8f/8enjJMAzCKsWOrVp8FvpgRNxwOP3361Ol0kLEMJwjsTC2gYogS9SFiWqIHgBSYTCZfvnz5/PkzCgXBhYEtnZBRGhh4BAOwXA57e3vdbvf09BSpCtzAoy+mjixM0zAKq8i9rBkBRoakjhVN4Fe6L95KUdPqMF1qYuvGSJACF1R8Vvx58rPi1XVK68LXQzN2ZgwMmj9a52GBjBb5jlIMwiLfTcz2UCUsaSJmIoQMWQCb1+l03r17x2ibUuqrIarV8OwRqnQaBgw2IW715s0bEJDCLgIDSrfbbbfbQPEdHBzAVgG4EcoWHqR6J5MrSFdzc3NDOxAaA1CjgBjBOlJ2ddhgFrHha8IIhKkDI2p/fx/xDU0gXGgNWjwB6Ua4c6vVQsyHxzCPZK3oZQOnHa6ZhKRhgM8e/QOCh+l0enh4OJlM4CyHQQj0FHQmK6EB9RH6mZVB4/siKoLYKbplf39/MplAFaMzW4/2yHukKpGGfOHvT1YFfArSjyNFusXd3V0UQcFfLcgWVRYN3pr2jNYq08ZoNCKLj2qrnGOqwylrET4zGKvmMdlKMZFoFiqGWZcJXDxGmspqhOhqNcaWgoyyc4xxKn6mlauWnpncujYVEc3cQqxK2sk2HFXtzODNVgssJDVXBZaDPgoGGBmwTNvWRhq8QnHvuK1R7C61CjjZmJ6KPa3b7R4fH49GI5iCKELLOayWgK5cHRd9u9vb28vLyz/++APkVW/fvj07O0MpTp0eShyl9+cok35sNBp9/Pjxjz/++PLlC8p7kv1STSzl4NVpgz/t7+8fHBycnZ398ssvOFYArlbHxApuJrNG9Bs9kbWOqJpzRqiL6xlJ5libVUZvjvWAJlovtTEmY5uKhmDjq+J45gOKMApMD80QNorUmPpoNt5qr1OkyKtJMQiLvLaY+0335YwvLXJ/UWAEMjaFxLbDw8PxePz777+3Wq3RaARbi/QAxPNgf+eZykcghYO0+EQBbWxszGYzqLbwGW9vb89mMxRggFJ+dXXVbrdRBgNmEv4EtRicnA8PD3t7e2wGImAstwACG/wTOi5swsfHR8JEAYI1zYY+bKjUsPcUKdpoNGiponRV/dggexs6Ex/U+ia4f6fTmc1memqynzUwRdsMYUANclJFhtqBf6LnB4MBDMKHh4fRaEQ62WazOZlMCCJlRg21xoeHB1gmHG6Sx7A929vb7Xb78vISwwSb8ObmhshGVmNjh5Nhkl4JTmnGqOGPoLmo4aAYAasvrOoBTavdbiOqg/KbmJkoHshJTgZUrQSQRIhRaaPvo9/vw+SG2WYhaGUKQUCD3I8YCxqEEBamx9rBN7PZDBEPfK/Za9wECPzGsGJ62z2jgrtQIgGgOaQwstrhsGzB+siQpkIPaEFpvJS2Mf1BWMhm4tqUsNhFEl22MlORbrAI+mHHo+WG5oGxGfMK1+/u7hr8W+F2lrhlwGlVlCMNycIGM16HnQ3Zy4jzY7dHP2M4CElQu51Wlqry+P90Ot3Z2RmNRufn55hdwGWcnZ21220Sb8Js1hXNOBIsvZubGyCuz8/P+9/k4uKi3++jCCE2BxZK1QElZgEbDupJIHuw0+kcHBycnJyAS4YMT1ZvZqnRt2lg1osdiGgqtho0kk6upBuXN9RJos/STBAbINMT8u9l9Mucz9wf6KLilIjGsNqulhlLqxWV7mEZJs0882tr+xeG91dbwkWKPJcUg7DI9xHd+5JsZlUYjDzPHu23brf7yy+/wHyCWQWh31o5MC1OYo9mVEd/QuwTVB9gqO7v7xEzHAwGzImiPUaSen1lxK9g/IBXHaYgqe2Z1sUEfXLfm8tcLROj9EAQr9FoQKtot9u0pjRCWF+f0IyjZrN5cHBwdHRE5RiaJWkwNSxm+re5VDVcbFoCI6hv3rxBnUkYhwiLjcdjgEhptCiHKpRafKmZoqTCh/sfXDX7+/uwMInUwlhHZrkqq4PUOMQAE9yr47UydpQoLGKPW63WyckJODA0M0fL3FmbDRjJ/2u0BBQy0GtHo9HBwQFfhG4UnXiKcNNwH5GHyjiCm0M5u7+/Z/agxt9sMcbwIANW/KdOnvpEIFXbjoXc6WVQ046NtBB9lbXPn9DFoG2okwAW0WXxQUuF3RTLjWqfdGbN53O+GgxyLdai3g16WOyNzN1ggRptbU1VWNcR9p+joyMUlEdeN7ZTav+secA1GNvAkCZGBNUC8S7Ybe7u7s7OzlDoAhyn8CJhH4b5gXA6LOerqysQivb7fdCPAe6OXYsp4tjt2UvoQJxiXAVIhej1eu/evfv1119PTk6A5rUXWS0+XNXn6qu1WjJsrXq1dBUkC83r3s6gMelV2ZIIf635XjqNMRWxBXFXtMpDukasBFE0R61DqELEBlSF99XfVGU213nNIkVeTopBWOR7Ssb5beaifhPvo/X98M3Xr18PDg7A9M2aVJPJROnICWiMeoyaWAorNQUiaRBqwXdot1rdIbpgiSeEKYWEe0XXxJQDxW1aLEUJHkmOcnBwAGuw1+t1Oh2N9qjyvdTAETSIqvHv3r07OTkZDAZXV1csIoe3syL1JgZotDp7tE9YUhKCHEsgaVHuGUE5EJ8A7QaDBEwkLKysvYf7E/sHNzzwunDwQ3uDBmCJeRpG5pRjwiFZRhDapcFvOVQrcwnQeIBOvLe3Bxr66XQKmxk9bz8xrRGfrU4JrSyOHToW6ixi4IqeVYAuQ2HodowCDUJ2HStbUAO7vb1FwQmt6skoLueSqZVYIMrzYZUnVgiXJQ1+05uJg7XCdPoshsS5ijX3mFalbS9LtXlhtLCmxAgJrMHuN8Gi0+pzVuiSr68ocXUTcLAotl1HeMjCMeJk293dfXh4AKkMHX8M4dLGU9CjpheyDznn8Qow1cbjMYxD7DPz+fz09BRxSJKE0U+Ea5AZeHV1hZ0Qm+FwOByPx2AIw04Fa1BTB+ncYU1L5pyjusavv/76pz/96fT0FNYga/+sZktEmhNL4NcAFzl4mAxs3lIbuBg0jvfEDsCuwAarVtlTgt4Q+pgQbuUEsG0wM/0srB05wPWNki1ZCrCw8isXKfIsUgzCIt9fMmkkup9mPGpMI2RmHRBNDw8Pf/nLXxj3oGUIpRkVh1Vp0DoWUR2kr5ToIHqgoaAAyARlEQ516Hyk0acKqBx3DPdpSJDKLtGJeC+YNxaswE2IPdvb20POydHRUbPZRFQQATSUx4AJwdjgskkOVPiA3UL5h263++uvv6JyHW1aNAzXsDNp6WnMTbE6lqaocUIyvAHMibcAC+LNzQ1BniTfwweYYWDjJHxInfFI8wP29eDgYD6fj8djGieaiaRgIbNSVAmGHoks0Ha7jZCC6tOWdJdfBbH/tX4DiF4/fPjw22+/gVmXwDOg5jTPh4WbGdmwyJg9gsQYo9GI1DJEgdIGgBHI+BJmPiCj6pJnYxDA2dvbm06nrDnOmhOIE8bMXhqiNDtB8gkcFwDeWiF9KTGMnHWFxtDQEnhbYPHSZNX6kGg2K7xDoKSq74OmBRdIVePz7rMk/K9mFqWmhgKgeHx8/OXLl8PDQyC0zZNl5fLQfnqXWGXEDAaFVyg6l0+vGgJrrfKUoIcBUri7u8OKQ5uxCzFJlZwxmCfWPK5oGGm7u7vD4RB3I/5zNptdXl4SCvH4+Ii9BT8hSQxCgufn50D+D4dDxgPJ1UkOJC2Bq9JsNjHxEK09OTk5Ojr69ddfT09PseFjFukevpQk508VphHLE91CLxvdSUmaFl22ih2wsrHchPW3PE+XzSRUXiucmNjq0YfT6VQ3QP7EItic6ljXLJiBKYdKlcDSK+S4/tZtn23ax8uKFHk1KQZhkbUQDbzgm3g41dklqYdRM0MKH7J93r59+/nz5+3tbfDRkc1FVVVlGkh6DRXfoj5UvYyKCGnE8QF87qo40j+tPkh1o1oNdBhXzNSyzoE2RqIFlKvqdDq9Xq/ZbMLCQYQnHs9LHUJsPN7r/v7+/fv3MIHQpVdXV+xbZR1Q05pPNJcw+5DdqKQF1mBYDkjogo6FD1Bf6HLWGhi0P2k50PPd6/U4mrADp9Mpup3gT9qx5JrXSaIxB7BKMEKooZgVEn7iELAmW6vVOjs7+z//5/9AWQGVxc3NDSeb8tBqZyobE7udAQEy6yJIiHtqsFcNQgXowqIj/tPelxDch4cHkNMiyAyNGXRB9KGorqbzh+uOMR/MtyeC6NSvz3lCJxFazpItsAaplGtRGU68fwyH//fU1dohK8Nck5GHmLlUR08lVOHt27cISf3pT3+6vr6eTCYsJIiglkb8OP859JabaqDQfDXw+sJ+g2Xy9evXo6MjJq++efPmjz/+4IZJfDLS/5K146yLSIdzc3PDEhGDwQBZfLAJ4YCjI484BXQa7UAUKUFAjFWCmFpse4KGxJFA2Gw2f/nll3/5l3/53//7f3/48KHT6dDz8pTdI6bPRXiOTSQeLuoHYTOYya+rlc4vvZvtkEpbGgOP9Y8nXsntCIu02WyCDQutZY6GckcRuR0PIEWscP/HNqgWXX63yQQJ46+KNVjke0kxCIusqUSzwfSbZOa6BpSQG4aAmIYUBoMBFH0EuGh1qOebNSGsSTTSIsDDqlGjMYzDQHugN1RzWpImk/lW1XKL6FAmbiGj5vj4+ODg4PDwsNfrHR4eAkWJc5GOfNLHr2ANam+jzW/fvgWzKyprodTy4+MjSC9JsKHqu3apKoiGnYMKbrgdpetUfSLWlUJgkMT3fCg7TZvx+PjY7XYRsKXGgAJ3s9kMhj3rjij2jE9X1wZUQGWFpQXObkzCoeto8EQhcuhbrdaf//xnsFYQ0WRYRFiGtr4imkt9/1TsoAahMzXfjHagMosqxahNM9pLah/e3d01m01EeJrfhOw1aphpmU02nv8kRUcsdrLUxK7SjPkKWqmStRbVIKQ3wXw6ql/SB2FZbTXtt4UvEtGkdZg5GCEELxfKOeCHmMZcpIA1IphDfinahBoAN7wog3vMNLNy5HXejv2MzQF5YtyOsMsBDjAejxFDNkLmWF3djBmuFPJ7TafTi4sLEHGhgiuTY4n2f3h4mEwmKCbBZUjz0kRx1OhARpWxrpvN5p/+9Kf/8T/+x7/+67++f/++3W4jyMweXtaQjmLTL25KPBCJ0WV6sNml+sGcHboXMeROJw7LvXIQk8drfmLoOsVNtNwukzjwFFaXjemOfAVCedkksowS5qpb6BOHYIVk8iJFnleKQVjkO4sRXSxMr1qIrMM5BN0Rls/29na32/3LX/4C82B7e/vu7m5vb284HOIsB7W6qsu0Q0yfVu5sDQ3pnq7GHrVnuEKtGjLpucmdiA/K4KeIGqXjZwUq6Ae7u7udb3JycnJ2dgYmOpQHxPlNHdQYQZ4SSAHVKvkPms1mp9M5PDw8ODgYj8cEm0GnZHiBUFs9wqkos0nkAKAxqVydiPhRK+UQGOCHyEMibEnww8iVkukjQQiGHBhrOp0OjEAFnjFOaHgz1YHUGuTF6jiIDA0WrMt3Pt8XcY9Op3N5eYkIxunp6c3NzcbGxmg00htSLWM3ootYTZuzV0uN872ULZbdCGUL/nh8AxwvuUzVGlSaVmKxEHaYz+ewQ1j7kS2Bgx+LlF0E2wNsQASKc57rml0ZPsqpiEWHpEe8zs7OTrfbhU4MhDZMAlgI5LckShzOGhJNqdbLonPLNjL6UyyvjybxQl1TJxKGG8VFT09PwdTy9evX8XhMql5mz1o+NlOXmXarycnm0NFamvo6Nc14tBNbCuYSit+cnJw8PDyMx2Nk8CKESDpoGmaW0knkPz13MOcwmvge+wDDTUBOMiRF8w9bPd0TcDuiN3iNhqc0y4A7P4yZX3/99d/+7d/+1//6X+/evUMZeuI7aHKvMHOSMI0kZFStHeBXaRPSpYjPyJ/XhAttIZ1HGkBWr4HCiTm+OisWLmR1UNJ2Bd23lpZVlwSnARMytc4NjxIl1EG2AlaKpghWbTULp7QNwbJDWaTIM0oxCIusiyS9gNxnl823Vh8qsYVQ1w4ODnZ3dz9+/Li1tXV9fQ09D1lkZshpsE7LTLHBupVbiSr7LS0BTYm0QkbUTpCLqK+gld8M8EmqvdPT01++ydnZWa/XQwRDz+D44SknkJrBsEjb7fa7d+9QOxE+dQQJSetChhi+sg6QwvM0LsRegh7JLD6aMbTelaYPETlL0WFBDjKRUONHk1B5jLmCwF5Op1N4EKDoY3QixljpfEyjiup47Pml8r70V4yHHB8f//bbbzc3N6AGvb293dvbY6eRz5MLxLJWOGkNWKtaXQwDskoEMzPZyTQpDfitibjgfQV2FP9HnUxYhnoHjafRSNP0PE0SM7zZahNbjVjdUsiX02q1CEBQHZ1AXE3M01C/6se6J6ysFEbLcIW7cdERh8kwCFo4m81g1Wi5eV4AHwGmopZ+McdTnA8bTxDOEC3Hh88w1D9//swdQ/ktNVrLW1lTNWwLTlHYe7g/iGd0kmgQmOhl2Iea324lImCsqn9qd3cXKdn/9m//9n//7//98OHD/v6+Zgw+ffe23SaW39R1xDlMLiWOr815OxN1UnHZqrfI/mr5EfFudYT3gSmIckTcmrQDzR8XT0a+oNLL2UEf0S7JJq3wpyJFXlmKQVhkLSSf4x793xm9WasdqCHHbB/U39vf37+4uNje3p5Op+ADIEYR3lyoEeSRU22DD4rt1ASt2MKYomAfNJ/HcLAKcVRtmFQof/vb396/f394eNjpdGDYQLEzjSfpfF1tyGgnoJ0o5Xd8fIzwFCztwWAwHA6ZTBgRnnH09U/ah1rSWoNFUNeUasWwQ9RmVHG3elOqzTAAeHd3hwgJYmvz+dyc38yT4RMJo2LKCmMCGhvRl80QhGSEngLMCtT9Ozk5AXRtPp9//fr148ePgO/CXlLgrjJ5KNkjl4yR8hFxzfxAZtApia5KlUHId9QpRD5AlMrEHAZaD7FB5oDxV3gvqH0I7GjB6CeS9cVB4bvwfaFrIuiHApikrdLMZBtTRoQwG+PafxYdMQkZzf+EsxoNADsxEfUbGxv9fh+zC//HRGJoBaMAlD5sQurWmh1tfgd9a12DdQCu3I3NXUijgpHkx8fH8XiMKcQ4ki4HI6rRR2sNT1r46qRTfx+TdRVPqO+uXa3MolrOpNvt/u1vf/vXf/3Xv/3tb3/605/a7baS90TG3TqTIbnt2GxR0LIOFp9LhAXMfmwyWnc+pnXw/loD1mAavCbpO8u8RdU1EOwn4I4m+7TWAbKc5NhmPXTUuUPPwsI215HnWvJFijxRikFY5PtLxguYZMzTWsaZX1kuOw6zXq9HEBqqL/T7/evr636/v7e3h7gKK+nB0iAdtiFFY2TPst2oLSESQiZxeqYNKaraGI9hoOCYBdFoNPB9q9Xa3NzsdDq//PLLhw8fEBsEiSgwaeoyVw3pGb2SCrBBR6GH5/P51dXVyckJwKKgJKGdTLIZozmxD5rPqZmHSuGow11le9NWQc8A5heNE2iWOOPfvn2LItQ3Nze9Xm8wGIB6Hoivvb09fFb8sPnCCaPC/ZOJMcm0WHNFL+x/dVggZrW/v9/r9Y6OjkCTCK9HNESV/Z8dRQ1bCwlCaFoTIAqlH/+nhcPAl2IF49Bw/bJCPWKw7XZ7NBoh37XVaiHIDHYc0pmwcjezgxRxp1XIn24NqgOFJUMQLGo2m4ApsgYAegx4ZoAJaYSTmhUmE7oRf9XC9Cu3ucrki6p5/q1ZaATTA7sNLEC0fzAY4HVA7ctFClAlGB3pLyD1iG7X6v9K2n71gdOKu0ZjAFhlftrj4yOMFqB5kT3OHcbyxtkYgmCrOFFoBRHzj8/oNCXB4iTXuBP5wPgBJivogtvt9ocPH/7n//yf//Iv/3J2dgYGFCwu3cOXQorG7o1VVexitJYviNZqLgPnADHntl7UgYL2k2UKs8XCdLQbeVoZ4Hnh0rCMDEK7sVHs7+9zomJnxknE2sVm+LHx2M0IhucpRpdExN8uJcUaLLImUgzCIusikWW0Cim6FJLE6kkwWR+sCYeHh58+fZpOpx8/fry6utrZ2UFdY7KK8bzURDXeXA0VS71QVF4McsbAYFVEkbEmTeXf29vr9XqtVuv09PQvf/nLhw8fut0uYKLUxaltPAvEqErUBEJXdLtdPAi68t///vfNzc3z83PEeUjqQI8ykwPNM23ZmzYTjIdDFR1i84zyhCq7wYkpmBu4DzUwUgISeMaUIcJW6Smwh2qips2ZJHnJsiaB6i5I54Omohr5mzdv+v0+ki3J3qEskXyuJrMpwpZZcLghiZoYKyCxiiFFF4I26UOBHg8YXrPZ7Ha7KHuAxUjgK51BymUKlClwm+zJpzs+zIZhyJSZqzDttIA7eiCizTkxGILTvjII+so6ZVXYLTnZMveha4D9zBobOzs7f/zxR7/fZ5BQq0FiDpDKWFmFLFBsEWP7BrKseq1Yeo4+ZibgEn/88QejgswEVt5Rg6bT6xTnkvl0jO1WdzAlAOOGo2mNBDfCx3d2dvbhw4e//OUvf/3rX09OTvb29nCl+bCWnSQ2N5K40HixXsboJWeCwsU5ggZyoU3FCc9NGHsI4eUGuo6HaX3hjMIeiPJLx8fHk8nk6upqMpnAX6PeN06ApEGomznrPDEmXAcyWqTIDyHFICyyplJHicnrmjyWyAVCNjwotUBaggHl4ODg48eP/X7/8+fP0+kU+SGoXKdEi0ybYWqWcfdbaYSIJtUPyTYb/zgZKXC2dbtdMJ2cnZ0dHx9DgTg8PETGv1bxVhL8Z0nXSYqS8puGgcRCIADfvHkD9nYokfCIK4ml0rpGFhm7s0W3VOtCRyF+Ba8wA4OZxBX1atOcQIjgl19+QfAB90fpBY0PMJhABTQG1izmaWKOg6p6J1WTnIYcPnS7XWjwsJT29vZ+//13eD1ub2/RbKW4IBwOzm+tp8e4FsYRpSyhyWkOYYSJWoSwqvEE3WFKIFzWbrfH43Gv1zs+PmZlcEwb4jAJYGs0GiiziVChhTtW89nb2jQ3hGL8sI2gnxHMpPtGg8NmEMISgK0eLYo8/0T9VWxRr/rbKVcEoXGIltP439/fH41GqLnHJUBwZrPZRJiaJEPU8mPoVVu7MlzWsN8UwivUTfP4+AiTAEF+ZUtizJ8/14xEtVWUbkT3bUvD01w1xe0TIAp7D4FBOCj/9re/ffjw4fj4+OjoCPs52vwUpGgybqwTO7rVYthQVxz2VSC6sTxxDbwh0RmhBxAC+0gSRgBZ8/pwn6T7bKlXVncGuvfk5GQ+n49Go6urq+l0ShJmLj2sWatFrJkmDGxiV2ckWVPZV6OGKlJkTaQYhEXWSAwEmESTxtzCvFlokTr+aXt7u9frQb8ZDAbNZnN7e/vw8LDZbF5eXvb7/dlshpQDBogY4NKMDiAMSYiv9p75WfOYNGWRwakDwxXKPXAv3W4XHJ4nJyfv3r07OTlptVqoFQ5TxApDGYnfCwkhW3gWOQbxDYgowO5wcXExGo2SXHywCRWjRa2ahre+CFVzC08xEohy8FBcELJotVrEKdES0ymhhzoGFFMCzHL4Zjgcjsdj2E57e3v8nkmMiNRh+EgOpE50zZaxDBYNftbUgbTkHRoPsCUyHskj2ul0fv/9d9RFRINJGYKxg0HI21L7p0mPPkRhNJrZSiRjJBM6TFWNV3wX1tHe3t7t7W2v17u+voalh7mBlu/s7GAZwsIHEyZqVABlqpBRPmUFMyMZqCdhPWBmgM9Bp4f5DWgf2SlVrWQ4hZBRznNo/DUhozFBK26MdvEKEUK6JJhM22q1YNrBJ/Xp06fRaARznbnWMHH39/fb3wQoDBJjsn56RILoW6jhvdSQsQ+5EWE69Xo9/BO14zBGo9GIPhSmk7GuIE2FKm4ho9NUR1IsE6+BMtwHkXwYz1tbW2AGfvdNzs7ODg4OsNboejArdGE/JANr8SRKzg17X42RYsVhy8Uuhx2m0WigY+G14YO0JBIhozjR6GliKoS6UJV6lPthVWqACbdBMGBvbW0B5wkT9PT0FEmknCcshGjRXU5CNpW5yngRrhFyCqxgvhYpslZSDMIi6yJJgGgVZLT+bXk+KX0Z9nHimpC81Gq1RqNRt9v9+PFjo9G4urpC5hg4Raj6KEpQIz9K3K82jGl7mt9ojmd+ZkkJnL7NZvPg4ACJYScnJ6enp4eHhycnJ+12m7gs5izFYhgbryJsPJF1yIrZ3t4+Pj5GcblGo4EA7MPDA3oVmYcs5ECkroY0aShaiIZFqCmkJAGLAEI38GdzrJXNL3YOPfpUv2BwYlB2d3c/f/68u7sLKCMhgiQYQDO0Cp+pO3xKRD4v6/7XnsesU7wr3rTX6yEraTgcttvtjx8/giYH0xiRT4ZnlZ9DuR/IzaC6PmkhlKqHnv6q7k02nul5+P/+/n6r1cJsv76+Bsk7n4JJgqcjyADrFJ+xaiKL48aqYv4CxY7CJgSNoUai4rajEULCGtU3sRANGGN9ZkFpa5/OT8PdSdNK0XJihofD4fX19Ww2gzeB74gOocsA81CxxIogjYH6+MrLClpr9U6witvt9u7u7h9//AHbDByhdEjxufqZq5J7uBYMVFej7gA6XrQzgRRFyVaE2lqtVrvdPjo6Ojs7++WXX9rtNgAgOlsU9Fs/OGy7TVVyKf1iVeFEPh2eDiIFOp3OcDgE4gOIbgu3KkUnbUieto1GA0FRvqxODzvFtM01S/LgAzGue3t7nU7n9PQUrEJfvnzZ3NzEMaQV5w08bCTGEGyGhCUrVfhSnpciRdZQikFYZB0lf57VzzKPareKamwwGyaTSfebHBwcfPr0aTAYXF9fg1wE/yfWjimFSjCA8xuWIT3KVn+ZJiL/abgjHorIdWw2m4eHh3/961+Pjo4ODw+Pj49Rax5lqXg4ab17y4B6adG8I7WQ6V5F3xJzeHV1NRqNcDZDJ+Mo4IRWFJPaOVT1dDTxyohFIPcMJhBwa7BCYRbSeswkmOkAKffm6ekp6kPu7e1dfhPUogD8DAFPNFVhq3BOK+SV/aM3T/Lo1p/hqqrS14DXhGreaDRgEHa73evr64uLC3g6APmjWsz70NiGxtZqtY6Pj1Hfstvt4kv6LJQKP1lmYOHk0WlPulFE/46OjtA8FC+BVqoGIRYCRpkA3RV06IWiS4lPITK50Wig8B39CNAv9XrzXNDRoEsmaQgZqC+2JzltqvbMOsJ4FEPo0JIR0YJaj6Tl4XDIsmz0sjE2SLeIqftJ6IeaH6sFdRVtQfAnaZAQLOKesL29PR6PUSaUdSMjfFezahEXwgfmGdJ6JOekugLhnUHzEF7b3d09OzuDiQLER6/XOzs763Q6OIY0S42EJQsB2EtJ0j40oHWEjKJhYACez+dg58bURSxOw4OWhofQ/fb2NozJo6OjXq8HbIshcrWFydhgfm7wei3ugkEHKxXo4q6vrxE0Rg0SOsWYIYwP5KLTrA1WxLGUh2IKFvnRpRiERdZIkhGb+Kcq0NRCoSWAvR66JiwWRnWgVh4cHBweHv7+++/X19fn5+ej0ejNmzdUoBlgoVuRfNYkYY8qhb5Iku6FNmSn09nY2ADE5d27d+/fvz89PUVIEOlSMDboercDeLVQ6tMFLwWcJHkpOEyz2Ywe1k6nAwp7pOQhYEjSQrpsEfYkDFUzOuD93d/fx1+Pjo5arRZKaQNG22q1cH73ej1mNNXh1yFklAyB8O4fHx8TFLe7uwtQMUwUpJtSIaA1SMIVNVRMuU+CAJfNgmOb8SA0nnwwgPwhQDEcDhuNxuXlJZr98PAwn8/vvwlsWtJy4C329/cPDw9R4hKTkIq+Us6YNbiUQg9dkNPm4eEBgQianbBDQP/LKuE0CKGi4SeNRkP7+RnnvxobxKSh9iY5V29ubvb29rRuu7HgkJSV8XwSLCn/fhIOmvxT5NrlNca0tAIzhzqYaN9ySTKzdDQaYUtkPVKUZ2SEUA3C+KAkkdjG04RtZjgXedfkl4Y1++nTp/F43O/3LXtQ48Cw6Oit0Gihgj7YP8ALEA79+PgIcktMY7g5IO12u9frwcMCAxWGhyEUlqVHinjRCJ9Wey/pRDCzCu9CCC62a2yz6Drs4QgVaslc3I3Moo1Go9frHR4eEhkLI1mddNb+ZPQ7//rci7gNNhoNnDUIX7fbbZwyrKHC5AWMHbMK6cJgSUPMbRwEGCyrnFFzmIoUWUMpBmGRdZcMdhRSU/OLLnNSSPO8hwuz2WxOJpNer3dwcHBzc/PlyxdEhAaDAQwYpqPAJmR5PfqJjQMzGmmxRjzJxwGq2d/fPz4+/utf//rhwweQpLXbbWQ8MjijSSbPW09iBVHHMGGHzCGBMjQYDKAMoVf7/f7Nzc14PJ7P5yj3hyMZIC5m8qibnEEkgmmBUkP1RUQIERukVtput9lpGs7Kv45WneJsgYKLgCfiydfX1/P5HHEGtR5JxUlejWToLPmNdumy+TOMqbLfoG/BldBut/v9frfb/eOPP25vbxHUQqgTliEJcsDN2O124c5/9+4dZiATnKBYU0uuIvaoL1wOIADsdDq9Xg/kJex/ePFhjUDPYzAKyxaKmoISN15AdLsAF8jFxcVgMIBOT0okRRAokJiUPKo0mwac2eKqXirvJntiV3AVEMoI0ON0Ot3f3wdBCzn9MT0IrjMOSQ0mRwTH05tqOQI6tVi1td/vY3sfjUZAgsA8IFOINkZnlGZoJ+0rDawxyZmBtYODg85/CSxnhJuY+Rxde8siRZeySez+iprRdG4lkeasBuYZLziZTB4eHlDyFLfScqzcBlutFnLgwe8NYzjyi5r/dDVfBkAraCr8RAjAYnMeDof7+/uIbyMTEoFibOCMEHLmKDMq7ds4bwtktMgPLcUgLLKmkt9bV8je1uxBZoDghAOMBPErZErs7+/DwHh8fPztt98uLy9vb2/732T4TYCZGY/H8C8izMISXlUGoXLNKYkZTi+YN41G4/j4+ODg4PT09M9//vPR0RH0ToQxERhkqpIqKCsnoT1LOIWHooItqQqjV0nren9/D0LXm5ubwWAA8jeU+5tOp+hMlLeieYMP6DGEZcC1A9f7+/fvoWahGgexPcwxI7BWNY/M62jFCCLQqBoyjQoRkvk3YWiIiStw/GsRQlUZ85p9khwiP0xqXTA3D0MAIF+z2Tw5OTk+Pj49PcV8hjUOUxwBcNLwtlotBKWbzSYCsAjtkq9Vp3FU7pcVZTd9fHxEMAGeFwz6zc0NpgSzf5HTCJc/7H+l9KjfkmUNb7Vdgf0DISpQA9gBuDAJIAQHD1kWAQ7U6ppVkFFrqjYjXp+ZLSuscUt11ugoTR0UoyOKntF7vKzmT0ZQccynfboNr5stw3cM0iKQBcvk8PBwNpu9f//+8+fP4/EYGXHEEJI1lEMZ9wTd8ZR/RQmEWJsEaEl6lNCBTLOk70kBolYpNIpO2jysoCqTMOlr0BfUpD74K/ENdtdms3lxcYFKJAAP81fYBjFDsCfDKsZqVcioYYmfHuHneH39+hXICJIMYRRAFnBxcTGZTBDixh4OXyQmAHMH0E5C01ldU4cgSdtTpMiPJcUgLLJ2UpVeklGGrNhD/UdYkV9QkG1ubiJDr9lszudzmDEIDCKQNZlMYBmCj3RnZwcMNKivzWQSLfum/macT3t7e8pTD72WiBoEZJADZvlaaluar/3pff4U0V7V7ErCR6EhtVqt6XR6cHBwdHQ0n8+Hw+HFxQVihhcXF1+/fgWVyO7uLvFXNAiZE0I+DyhbSPvEYQ9IDzhFoY4wd2spi8VMC7LdwChiouD+/j6SkVirUJkMmLvIt+D91eSLAfBkYHyhuUI7UG1yDMHDwwPZVo+OjmDHjkajyWSCEgJgYwegrtPpINCKUAZelt5x9Z0n6VtWmE6cyczGPDw8RKIpun06ncKzQIMQCC7kRh4eHoKYMRl3Xfjompg0NbMRcIBpMR6P4SRStiRWnmBRb0Q1abvu7e1pIFdZryLkL6qbeYBx1Yx6iqOHaDrGSIHZJmAefa74Bc0Qs3GpmsnPSNVI2KcdJfDU7O/vT6dTFO+BYTAcDu/v72ez2c3NDeaeFa+3pcqFAHAHrV8YP9gcer0eElxJU6n199hLaJshJ/P9UEUAkyxuFEHIEbpioVGlqsbJCIsagw6j6M2bNycnJ4PBYDweI6sQfMW4gC45eECwh2Bj6fV6zHm2uZF8r/rCPHDgHfgNrHSY6DgvDg4OJpPJYDAYDod3d3fD4RAeAZiFOMdhRmK3wa5IyKgGNm1u1J/Gr0n8VqRIXopBWGTdRbWHmjpQfWFQgrelbxjhqb29PUJD7+/v4QS9vb2FO3kwGFxdXT0+Pn7+/Bl5WUSTwkbFTXj6UkNinj1UByi1oI2BEQied40HkrhcEVxPcaZmTqynnFIcGvJSMI2KhCutVuvu7q7X60H3Ojs7u729vbq6Oj8/f/PmzeXl5WAwQK0wWlmskw6VggYhzObDw0NQCGruGckkNItv2SgWryfXoha3hKKD2CYaDKwRGQhoRGUYOKvwolWJPXU6X4cASEuiLu/v7xFbA6/M3d0dIK9azpt2LPzr7Ey0nAUqIonLUwwP/JDVulk9EnDQy8vL2WyGdqJ5+/v7BwcHUNToOrGMzToSOTwXXqz5cihMguAJ8IdUK/lqrM+BCUP+ejUGMhZ1nlojuTE+xThPvrWhKmD1sRyr+r8MFxpjg9HbopbAM+rHur1bUhxGBGlvnU4Ha2HyTZgXgCRb7ueaNK63YpIzTCAsH7Joku6IpiARlQaJr98DyT0hHxi0m8eLLTxoc4nJjXDKMNrWarXQaePx+PHxkQxD2C64B7JMKLmLmbdPPx07RA1aXXH1J4ahZrSI4t3dHf5/d3d3cHAAvM/19fX9/T0sQ4w7Sg3xRQhQh1tHUw90A4wu7KUKyRQp8n2lGIRF1ldiVLAqwLLy/fXwwIYO2wP56Dit7+/vQaUAryG0BJS3ms1moCF99+4dAJDIyEKcEFYlOQZYjBiGDXKfAI0jtcD+/j5rQG9ubqJiFd20SUfyakkmyQBU/NPK0Fw9KdGl/Aa6BcwS8LyBqOD09PTs7GxnZ2c4HF5dXd3e3sIAYARYictxMCNGhGRCQmrJvKpn9gpIQna1qblQgrVAyPb2NpRIzA0qfyxIaNBKtmSh+78KRlj1wwjAYwxcuwK6GjRdAKVQ2oGvjF8RzAbnhXaF4f34dOMyqd/PnB6ajkhGBwz0ZDJBoiNGGZwuGHrEHxTKtVA019danl9TXMtwcDSbTVwPJ8Xnz5/BPQuFkozBsAFYGJPZU1UBQGvhQvSgtTB5t5Xt9ghwoH2IPdOqxUQxKz3/IWrSq9mK3MM1tKvuOcQ2UVAU0WZAB5G5ihWNDyQTJr805wCmKHmhMRtJK0W3lNr/uiPFQkH5bSHuzxqeykySPMommXeguFlLJWUlnlarhbAqAonMv+AC4fUAcKJDUI1TOyQ+NFmOuI6VBSEEl2+H4dje3sZR3mg02u324eHhcDh8eHgYjUb9fh9YCXr30CfEthArQeesoXbzQe84jetnBBQp8tJSDMIiay1V6JeqY2+hxzTeXz9Q0+VJT+ZGZkyBSBD8MaDcmE6n4LcEZgYFjqA6oGS54qyAwQMEBR5HIIuUpYOJKJaakiSdW9ZvGo8x7boqJFJN1m9rkplhSABj1TsoSaCzf3h4ACXMbDYDDzsS20jbA/2DaCukBQKdxYrkSmKu/uanQOa0B7RWBMwkLa1B1KXGHxAf0CChphRWKX8cgog6rqk0xCEg9SL1Myg60ImjGz5alUoem2/2al2t5JBwyqCFSBnd2dkBCw5eAUEGBoQxH+qbDVX8nAvbrwEuWAuwCb9+/TqbzTAr4M4ga6vWZMN6By4ALgzGXmIAUC2EJF9olQ2Q1zJtB6gxMv/9K00no3OBiEq7smrdLRvIenpqlm3vLBGEKC7fotFoINSJAC92b8SLYOETtkAXFV6TgSPExMhWjTtrGZuYLpu0k5MS3aP0uOkFmQ63DzGBMDZGh5tUxiwRhAn88PDQaDQ4DYyJRz0IuhaMTzXT4DxhUmbEWRSX5w4PVs0q7Ha74/EYGQfTbwKqMEwPTBVSBMOnQ/dT3DCTaKaFPV+swSLfXYpBWGTdJblLGsYmeXH97dVMTVVlkJiudimdl0BP4YS4u7sDBg+59dA5oFLgmCSdiVL2IxWBBgOPKzwuk1iymiRjqjUxcvXT2PSH9ltVC6jKMOcExDOgMgcbOPrQhoPYUfQnnLVM4NEok1k4zyXq0qaHm5yK1CFYbo6gI6u/XCf0bWi3ZW0tIz/kpI1QT+Vj1CfqeNVRW5+FnYjxSShtBAA3Gg2gMcncQ+pOw+XW8VlYPy8Vf6N5jF8hPWlnZ+f6+howZrD1KMIQT0HcmDlmWuS6KoBmHrFM9ldyY6wy3ZcKtugPraPUS5LUfXWmVenH+qY6FjpF6zcytlkbz/bojsG8UJZYYAYBq+CQA1k7gcuZQACYCpzJalaZXb1C59uHjKuoasfIbOZ1GqNzVSvRs3gjbo7FqGdlhoMnPj2Z+bnCTLBtjRn4ZNtS5x2oZZBQPZ/PsdUwSIg1jl1dqWXiKaNrsIrpx172Jc6pIkWWlWIQFvlhpMpNDlGNZNm4lnnikzYMlQkQqTGXhqx6SK5gfUJmITK7nScHDksmEZGAXkuimzFg6lR9yaSimTqYzNyoumEd0Wab99T4XbWEMRQynMTM7I8M8oymKkowMogupevkxWBySpWhqSYAGinTIE3ByKenfZXpWE1D1W/qNDtq4fRrKFGeDn3sw4W+gPh9bHNNiTYwn76zs0MoFys3sLBHtLRXkDpLLBnxwHCTzXU4HE4mE2QUk0eUQQmkljHpcVlrv8qaii9SZ6tcSsxVoRMj3jAffcps5s8rcQJraM5yBDi+CC5prB77OXd1BcPTB4QJSSLraCpopxHCmm9/EsSR92Ike9XcBHXWdWYzpweT1qA2j4vCDD8Lhlftz2r+VQUP64guK/Y5R1OTDDc3N0kJi4RSpYai34dLmCVV9BF1wOcr52IUKfLS8uJ7cZEiTxebpeYfXegEzVy5QjN4Hy1GzBORjtKon9n5pxxrzDVSzvFn8RouNDPMRFyoFiyLXcw3jGBFsu+wMwmFisAq1bdUQX/ersu0HE8HlgxUCkC38htGLJWEINLux3lbpdabwfD0F4xhk2g0LhuTTE62ldvJuQELEN4BTg8Ny/DDCqOfUakX/pYNU+qRm5sbUFbOvgkA5GwVM2DBiKNmYVV4s06QYeHqXijLhqrIvcmZQ+BiZpeIRkjcdmIsNBntfC6IneVw6gctu4eL+UEboMvZgr388BQ/RcyVSEZ3bXPI9M+zrFO1ig2GwIMs7iR18iSfuCqXmrpwOAIKyxfhcsYbwVmgNqFBEhQzUuXgSLa8GIRF1kpKhLDIDyCRhK0KU5RET0Wlqo4yEf3rMchmfkeqDskjwQj6zQlKvSHpUFy2x+pYv9HG4IeY/xB1spVbZWhSiPnsk28RAw72z9c5X6kJUeNhvhAin2qxxOzBDADY9N38yz6x8XWy0ZJLqeq2VU6ZjSeLli6gQaiB4iqSm/oSjZD89ToBNGZCRtbd3V3Az6bTKYIMuAZ/YhECQkaT2LPYtvotrPI1LJUwuZRUhX2i0RKvSV4Wt/dnbHYSflnlc6G/SQ1Cu96yQGP7lw2YR9vPPuhTqjCWSVEn6RO38cwIRgM16YWsaqH5FJ7F/icUgt8ka72wMD3twxj51JIqcfNJOkSSCkmRIusjxSAs8oNJ3GHtgqhDJDff+iCZ+CfF2un+rgZh1LBjXCh5eKyGJ0kGeSJkNN912tSXAHTFp9t5jA9GMaeeeGthBF+9AhSHjUkmecJcYXsULKoxBBv9jFYan/6UEakKI0Q8av0HJZHGT1fgFKPLXqXJnSRQXWHok+6Pmr/iUCr/EwTwUVDIINTA+aB12wknTlqDC/e6pV6w5vdL3bnKkcRvosNOf5uEs75a2CTuJ1XdsjAuZwGxjEmwVAuTQUt9kO2NyxpOq3W1Im+TPWb8W0mXYv2590QXWNWtDDzMLAZa/nwFzTzkbsMtPbYtnv6rof2LFHllKZDRIj+SxIMn4o6SPsh4Mj0l0pVsWFUSeUYzqAOeWbYZmX9WhaQySnxNh+7zirnDM1238V1FIUaEDvJLGgAawlLkWDIFKPZzFWT0GV/kiVZc3nfwvH59xe+pDRbZd1+zEzD6ih5nAhJQxAQ/q49A05AY8Ew2jJ+f+IL6IRm4WOGGMc4cr8w8ImmHZzaihc96UUm6b5IRrWd5VnL+60Njzu333RhfohNe7XUMAWtQWLUnk8DgpL5BWcPzq0gRkxIhLPIjibrZMgiZpGc97tTPoqrSdKlSWZJZEytAWOu0hN7ZTGIYrq+JAn16gGKpV+CHKnM6iXL8Lier6mdJylANCCfjV5koXGa8XuJln8vOzDhiniimkBkm7Vm6ZbVOMDVdY4ZkPNL9IcaNMxDiZUO1C19w4Q6w2g2rktniN3kUev4Or7/S875FvcaAiE9satz0kq69KgN747vK8w7TS7+OnTX6RKsRavvDQk9uVUK4Pvq7D1aRIirFICzyM0iVzhTPaf38dCU7xm2qYpV25Lx+ZH413OzrS7Iz44d1OFkNEcd4oLJrUKz4WNRxq7JNXigq+MohlGfpZ8K6nrdnnjJ/8EMWp9HSkawpSmJDTmDNilyoWa7DVM9IHIWaucfP5Y/beDGp447JmNnPIkn7M9mGjTWQH2uzisdN0jWpX+qBXuXzigb8S8ROixR5dlmXfaRIkTqyVE523MqTYNGfYHeuQh7+BAf2movRDyZjxYYsSuqOGWjuwvDLd5cqN8czNjXp1rFg7MZ6iOLNWKJN/2TZpFWQvxfC3y5Esy97n9cEk/9TicJEk9loFqoqQ/BqKSrxyqrU04XO4iJF1kdKhLDIjyQxhBKNvSRIMk8Y8KNvzTFuVvVG6+NL/mkkZrEmoaH6z6phykQknheB+bwSW/tCayp23brNZ2Wg1bxB/FXDm0mYMW/yolrjcwXrdNv5CXbR9ZSFe8JaeUN+Dkkm2eY/UPL8bcUhW2SdpRiERX54qdJF8nGzn1iDyZ9bP+tbJ+XldOskToyYRr2ypukSf7VWps5SkoxwPhGZ+aLgw+cSbZLlIBmnbmyzpSOuM8Y7s+W+XPOS6cTr0BsvJ0lowBpO+59MMu7U/LTPzP8q//Vzt71IkdXlB9Y5ivwzSwZYZUwMmazxn+98XZjB9YzcDGuim35fiUp8crJVAYfyd47B7TXv8Ixi9CyNjyDwNe+QJN5PBxTfRHLRKvDter7vawLh4nL4WWF40TVgb7rms+Jnkqoh0C8zwxTBIz/ZXC3yc0iJEBb5ISXDMlJl7yVvond73hZ+lx1fg1FJ0GzRHp5LFp7x0RS0P+XlRwwIZJr6LAbtj+VZz4T4MqTE+cDgmuiRVSrva7btB1oXzx6nUtfSq7frn1SqorVVMz9zFvzEk7bIDy2JqkdFivy4spSqvewP85IkAEhyA2Q+PJckzYlnP4TWXx15nRaqika+kEghs/FPKRZEXXlQXm4oX+jOluKVnw+ZfePVGryyJFkZX+25seteYbbU3NWf5VkQnT8vuqsXiVJzG4+B/ThArzBFixRZTYpBWORHlQgZrZOmFfkb7MNSUvVz5Rgk6yCvVHVhYUHbdZYX0kWesROqDuPnlfyYJllDNv5p5Fmwo0kN+7mm38up1HXCvFporqYt8d1tAN2svpeCq9mY9uG5uigD2rRFvZBrZDXRt0gyyhR5falKI6wanSrmgjKCRdZNikFY5McW216TOI064L2au3PSJx3FrrGaBHqN/alK911DeaLSUxUSsU54XqXzpVX/zByL/399eem4dB15xnd/rsa/dCdEcyU+vWofW2et8fs2dalYzVLX5EOOmU3p2QOV5u5c5/hS3Mzt+59MTK+IXomVkwWKFPleUnIIi/zwUnOTzTBEQ/JZPckgz0K9gUyD5kXWP/H/SX/wyklTL5duFHPoMy3McANqPlV85Srf6rPTta2QoJWfNlWxwVfWBurPXmvqc0VXXmJ0nrGFry+ZabNQb66/4l5BvmMqY2TvqBOdy1yTQWpUbe9JZqD84ZJ8ev0+zDNpf/eZoJ0Qo6lrkvj6crLQJ1KyPYv8EFKmaZF/XiZS/jNz1ua/4fd20q9gMGTQZXasvhCFY02JapNKVVPrdGbe0svoFs9owNTszPyMWjheLydJ8yleE798oTjPE7lSran5ufFcTX12yU91vcbm/1OwDK8gkc3re031vM5tJFsr36fmzsaHZv65LCZl4Xt9F8kciP+EkbGFNSdevUVFiiwnBTJa5KeVeCSvoFTFU99cyBYSNDgoPjOl0P5kH+wmGdRN9D1vfCeJVhD+mWw8rzFVuCb4amFU9hlfpL5E7ef7RnIidks/WFD6hToz2asrw2WTBnYeh/mUpr6QLLQ6kpCzNbQDKXFAX7ORmWhM8oK8mVf1Tc2VUuVSzG+D2ffbWMHs/F6SRKFXbdfft4X2ZdWfVpDMWKzJMBUpkpdiEBb5+aXKWZvx51XdquYpnvxnNPYyynq0MJ/esGeRlc+2+C4ZWzqjkOn3+W9eQjLqzsIA8us0LH4TJ1sMYicn5MYayw/R1DohlEyxMuWtXSu1ck20/GWlyhtiF1T9M3/b/G4Q9/llpb4Z+dJSZR7H7k3uPN+rqcl2Vv1pHfq5SJFXlgIZLfJPJAtxWUmnbJXeoADROpGWJIZQ25CMCcT/14GMvgJeMcY68piZqvzAhVtQsq+S3zzlTVeDjCYb/2oxk/qIXDP/MqDEtcJhLpwkmbmxwrNeAi4bez4j+Rm+bsCzNWlP3k22cHu3+6yc7hUPF7sgrqz8pLWsvKpj6/WHILOHG+w/nmVVnfNyTV25tud3R+QWKfLKUiKERf6JJEMFptdknPRJlFrythk8Vd6IyiCRFqoaVW/xEpLUb/KtWirOmbxtVa8+3X2+bI8l6xG/cjAn6TuIk6RmNto64zDr9OoTn/VyQ2YBh8zCSeJF1xY1ulbtWbhdJO29jO8mP0zxw0Ksb6aFmTfSA2htI8aUhRvIa5qCK3zI3KdIkZ9eikFYpMhieeKpsPDgqYNfyl/8mrIwLLYszLWmw7u+MvFy/bPw3b+vVCG4+OXC2PIaynfxd6wgVQETfK6KQvBDTX/KWsmaq8tVpniUtfKArICeeFGpaVNFr1zG1/miTY1h+fro3x9i3RUp8hJSIKNFimwshXLM4x6XhURmQjdJFpz1wbHUZ+erwivGv6pkkFHfFz2VAQF+LzSXjkWyKMhCXccsk/WZY/bBZH1CJfUBh7xgIQS6yFKy0PdUpxRE5lcLEZ6ZR2SgIguH+4lUvc8ldc7BZVEkL93UFZbnj+iXKVLkWaTUISxSJC0LDw8e0gs/UPRPrEO47Km5JkdUvhkxTzIJ7NSOiljHCL5SZTr+6XX0pGRTqxr2OlJlWiT1mzrA4zWZY5lJoh/W0IhaWAUhP7GLrCxVpWtqFn7MbzILH5HxCq083Pml+mqSr95R1S31LbFnkeS5Y43klQvb/AoNLlJkfaRARosUWSAWr6sCd1VlElpiiX2ZzE6MWSIvdDgRTlMfpBQlti0TQ6v6SeYa659nzHBbQX4ISEVm2mSmVlGAnkuSjIvrAPb+WaVOr5q/I7kVV10fb5X8VT4LN3nlUvK9tj5DXUYUen6fWYeNpeqoLVKkCKVARosUWSALkZCxHj3/mQEp6Tf6J8XsJZ3NzxUPqRPSrHmfJIKIjY8dVYXqyQep8ipaMmr3ooZ0Rr6XtrEsUjQT0FgTsa7+jlDhvNQHHPKfPyhAdN3abNvXyipNftdauENmfq73qX/DNZE6VMYZos6F3zyjLCzbuFSH/6DLs0iRlaVARosUWSBRk0sikYgCTcJB9W562/8M0//jxVWpg/EOz/Vez3vyGXoqYwNX1eGw5lmDq5BIrw+s+o7IqIUNi9/UmZAbayn5Mu4b6yRJ94d1/tpCc2vKurXZJnAd4GIGH5h0zyX/tPDndvEPGpaPgdPkDE9avK+8MSZjvDy780eJ/Wk9t5ciRV5UCmS0yE8oL332GAqUX0ZcKGVra2uznhi+5RXALQsRnnmp37x4YEflONmf8SfJvxap6o3YXU8HsBWpkiRe4AeyARbKOng9VJ6F3SQalnkzr2ojyuxaP7Qkza1kn1R176t1wrLOwXzxpyJF/klkLfzZRYr8WFIFtoyWVabkYAQOJaFEr1NZ/lmetRRQJ7/z/ChRlCqq1e/e5jporjVpah3JU4CswyvkgdMZfbrIs0sdWq86v1qTqbUmkqGVXog++F6yAivsmrS8SJHXl2IQFinynJLBEMZAQTIh6pVb+4zPXYgOqgLqJJuxPrr+jygZa+QH7dUI2163t8jnsP1YFniRIhmpqjq4zsszStKfu/7NLlLkhaRARov8hPId3RxVUEYDhcZfbfx0Ugcjl0Fn/azd8h3lR9R4FtpX6yk/E0D0B5J1nhI/qyR37DVfnio/SjuLFHlp+WEWbZEiP6j88wCQ6nBv1knlL/KM8nNMvzWpzV1H6mOhizyvrO2U+FnlB1qVGbEgZ5lIRf5ppRiERYoUeR6pT+W3hkl3P58UteZ7SYaUuEiRIkWKFFlDKZDRIj+hFDfHOovWYftpKPjWWcpyWB8pY/GiUrq3yApSpk2RIsUgLPJzSjEwvpfEGGD8Uxmd15ECf/peki9X8P3a9fNLKR5QZFkpO2SRIpACGS1SpMgzSwHLFSlSpEiRIkWK/ChSIoRFfkJZys1RfCLPKPlShK/bln92WVitu8hLSxmCIkWKFCmy8SPI/w/A0VBCpPrGiQAAAABJRU5ErkJggg==
-"""
-
-def get_image_path():
-    img_data = base64.b64decode(CAUTION_IMAGE_BASE64.strip())
-    temp_file = tempfile.NamedTemporaryFile(delete=False, suffix='.png')
-    temp_file.write(img_data)
-    temp_file.close()
-    return temp_file.name
-
-def normalize_id(id_text):
-    """ Cleans the ID. Keeps A-Z, 0-9, and hyphens. Uppercases. """
-    if not id_text: return None
-    return re.sub(r"[^A-Z0-9-]", "", id_text.upper())
-
-def extract_ids_from_guide(text):
-    if not text: return []
-    # Broad search for numeric patterns in guide
-    return re.findall(r"\d+[\d-]+\d+", text)
-
-def extract_one_id_from_label_text(text):
-    if not text: return None
-    # 1. Standard PO | 2. Long Format
-    pattern = r"(?i)PO[\s-]*\d+[\d-]*|\d{4}-\d{10,}"
-    match = re.search(pattern, text)
-    if match:
-        result = match.group(0)
-        # Filter out invalid short IDs like PO9 (from postal codes like "PO9 5FH")
-        digits = re.sub(r"[^0-9]", "", result)
-        if len(digits) >= 8:  # Valid IDs should have at least 8 digits
-            return result
-    else :
-        pattern = r"\d{4}\s*/\s*\d{10}"
-        match = re.search(pattern, text)
-        if match:
-            result = match.group(0)
-            digits = result.split("/ ")[1]
-            if len(digits) >= 8:  # Valid IDs should have at least 8 digits
-                return result
-    return None
-
-def extract_digits_only(id_text):
-    """Extract only digits from an ID."""
-    if not id_text: return ""
-    return re.sub(r"[^0-9]", "", id_text)
-
-def get_first_last_digits(id_text, n=4):
-    """Get first n and last n digits from an ID."""
-    if not id_text:
-        return None, None
-    
-    # Try to get the last part after splitting by "-"
-    parts = id_text.split("-")
-    if len(parts) >= 3:
-        # Format like PO-210-10386798799991976
-        id_text = parts[2]
-    elif len(parts) >= 2:
-        # Format like PO-10386798799991976
-        id_text = parts[1]
-    # else: use the whole id_text
-    
-    digits = extract_digits_only(id_text)
-    if len(digits) < n * 2:
-        return None, None
-    return digits[:n], digits[-n:]
-
-def find_matching_label(guide_id, labels_db, log_callback):
-    """Find matching label with flexible matching.
-    
-    First tries exact match, then tries matching by first 4 and last 4 digits.
-    Returns: (matched_label_id, match_type) or (None, None)
-    """
-    # Try exact match first - return as list for consistency
-    if guide_id in labels_db:
-        return [guide_id], "exact"
-    
-    # Try flexible matching (first 4 + last 4 digits) - return ALL matches
-    guide_first, guide_last = get_first_last_digits(guide_id)
-    if not guide_first or not guide_last:
-        return [], None
-    
-    log_callback(f"   🔍 Flexible search for {guide_id} (first: {guide_first}, last: {guide_last})")
-    
-    matched_labels = []
-    for label_id in labels_db.keys():
-        label_first, label_last = get_first_last_digits(label_id)
-        if label_first and label_last:
-            if guide_first == label_first and guide_last == label_last:
-                matched_labels.append(label_id)
-    
-    if matched_labels:
-        log_callback(f"      ✓ Match found! ({len(matched_labels)} label(s))")
-        return matched_labels, "flexible"
-    
-    return [], None
-
-
-def create_overlay_page(width, height, image_path, text_id, count,pos_x=15,pos_y=78,scale=0.07,img_y=10,size_police=11,rm_mode=False):
-    packet = io.BytesIO()
-    can = canvas.Canvas(packet, pagesize=(width, height))
-    
-    # Image Calculations (Top-Right Positioning)
-    try:
-        img = ImageReader(image_path)
-        img_width, img_height = img.getSize()
-        
-        
-        # Image Position
-        x_img = width - (img_width * scale) - 20
-        y_img = height - (img_height * scale) - 20
-        
-        # Draw Image (with your specific -10 adjustment)
-        can.drawImage(image_path, x_img, y_img - img_y, width=img_width*scale, height=img_height*scale, mask='auto')
-            
-        # For RM: only show *count if > 1, for Evri: show full text
-        if rm_mode:
-            display_text = f"*{count}" if count > 1 else ""
-        else:
-            display_text = f"{text_id} *{count}" if count > 1 else f"{text_id}"
-        
-        if display_text:  # Only draw text if there's something to show
-            can.setFont("Helvetica-Bold", size_police)
-            can.drawString(pos_x, y_img + pos_y, display_text)
-        
-    except Exception as e:
-        print(f"⚠️ Image/Position Error: {e}")
-
-    can.save()
-    packet.seek(0)
-    return PyPDF2.PdfReader(packet).pages[0]
-
-def RM_or_Evri(reader) : 
-    for page in reader.pages:
-        text = page.extract_text() or ""
-        if "royal mail" in text.lower():
-            return True
-        else : 
-            return False
-
+from amazon_processor import process_amazon_files
+from label_engine import run_job
+from job_cache import JobCache
+from ledger import OrderLedger
+from match_report import format_report
+from memory_trace import format_memory, memory_tracking
+from profiling import profiled_run
+
+# The guide can be the printed PDF or the portal's CSV / Excel export
+GUIDE_FILE_TYPES = [("Guide (PDF, CSV, Excel)", "*.pdf *.csv *.xlsx"), ("PDF Files", "*.pdf"),
+                    ("CSV / Excel exports", "*.csv *.xlsx")]
+
+# Orders per ready-to-print part in progressive mode
+PART_ORDERS = 20
+# Digit edits accepted when fuzzy matching is ticked (off by default)
+FUZZY_DISTANCE = 1
 
 # ------------------ PROCESSING ENGINE (ADAPTED FOR GUI) ------------------
 
-def process_files(guide_path, input_pdf_paths, output_path, log_callback):
+def process_files(guide_path, input_pdf_paths, output_path, log_callback, dry_run=False, profile=False,
+                  memory=False, part_orders=None, optimize=False, fuzzy_distance=None, ledger_digits=False):
     """Process 1 or 2 courier PDF files and merge them sorted by guide.
     
     Args:
-        guide_path: Path to guide PDF
+        guide_path: Path to guide PDF (or CSV / XLSX order export)
         input_pdf_paths: List of 1 or 2 input PDF paths
         output_path: Output file path
         log_callback: Function to log messages
+        dry_run: Only check the guide against the labels (match report, no PDF)
+        profile: Save a cProfile of the run next to the output (see profiling.py)
+        memory: Record the memory use of each stage in the run report (see memory_trace.py)
+        part_orders: Also write ready-to-print parts of this many orders while the PDF is built
+        optimize: Shrink the output PDF after writing it (see pdf_optimizer.py)
+        fuzzy_distance: Also match labels whose ID differs by this many digits (listed in the run report)
+        ledger_digits: Also recover MISSING orders from earlier files by first/last digits (listed in the run report)
     """
-    image_path = None
     try:
         log_callback("🚀 STARTING PROCESS...")
-        
-        image_path = get_image_path()
-        
-        # --- STEP 1: ANALYZE GUIDE ---
-        log_callback(f"📋 Reading Guide: {os.path.basename(guide_path)}")
-        guide_sequence = [] 
-        all_found_ids = []  
-        
-        with open(guide_path, "rb") as guide_file:
-            g_reader = PyPDF2.PdfReader(guide_file)
-            for page in g_reader.pages:
-                text = page.extract_text() or ""
-                found = extract_ids_from_guide(text)
-                
-                for raw_id in found:
-                    clean = normalize_id(raw_id)
-                    if clean and len(clean) > 5:
-                        # Logic to add PO- prefix if missing
-                        if not clean.startswith("PO"):
-                            clean = "PO-" + clean
-                        
-                        all_found_ids.append(clean)
-                        if clean not in guide_sequence:
-                            guide_sequence.append(clean)
-
-        guide_counts = Counter(all_found_ids)
-        log_callback(f"ℹ️  Unique orders in guide: {len(guide_sequence)}")
-
-        # --- STEP 2: ANALYZE ALL SOURCE FILES ---
-        labels_db = {}
-        
-        for file_idx, input_pdf_path in enumerate(input_pdf_paths, 1):
-            log_callback(f"📦 Reading Labels {file_idx}/{len(input_pdf_paths)}: {os.path.basename(input_pdf_path)}")
-            
-            with open(input_pdf_path, "rb") as f:
-                source_stream = io.BytesIO(f.read())
-            
-            reader = PyPDF2.PdfReader(source_stream)
-            courrier = RM_or_Evri(reader)
-            log_callback(f"RM file detected") if courrier else log_callback(f"Evri file detected")
-            
-            num_pages = len(reader.pages)
-            i = 0
-            
-            while i < num_pages:
-                current_page = reader.pages[i]
-                text_current = current_page.extract_text() or ""
-                
-                is_label = "TEMU" in text_current or "Evri" in text_current or "Fulfilment" in text_current or courrier
-                
-                if is_label:
-                    label_page = current_page
-                    po_id = extract_one_id_from_label_text(text_current)
-                    
-                    if not po_id and (i + 1 < num_pages):
-                        next_page = reader.pages[i+1]
-                        text_next = next_page.extract_text() or ""
-                        po_id = extract_one_id_from_label_text(text_next)
-                        if po_id: i += 1 
-                    
-                    if po_id:
-                        clean_id = normalize_id(po_id)
-                        current_list = labels_db.setdefault(clean_id, [])
-                        if label_page not in current_list:
-                            current_list.append(label_page)
-                i += 1
-
-        log_callback(f"ℹ️  Identified labels: {len(labels_db)}")
-
-        # --- STEP 3: GENERATE MERGED & SORTED PDF ---
-        log_callback("💾 Generating final PDF...")
-        writer = PyPDF2.PdfWriter()
-        processed_label_groups = set()  # Track which label groups have been processed
-        processed_individual_labels = set()  # Track individual label IDs that have been used
-        processed_guide_ids = set()  # Track which guide IDs have been processed
-        missing_orders = []
-        
-        # Group guide orders by their matched labels (can be multiple labels per guide order)
-        label_group_to_guide_orders = {}  # {frozenset(label_ids): [list of guide_ids]}
-        guide_to_label_group = {}  # {guide_id: frozenset(label_ids)}
-        
-        # First pass: find all matches and group them
-        for order_id in guide_sequence:
-            matched_ids, match_type = find_matching_label(order_id, labels_db, log_callback)
-            
-            if matched_ids:
-                # Create a frozen set as key (order doesn't matter)
-                label_group = frozenset(matched_ids)
-                guide_to_label_group[order_id] = label_group
-                
-                if label_group not in label_group_to_guide_orders:
-                    label_group_to_guide_orders[label_group] = []
-                label_group_to_guide_orders[label_group].append((order_id, match_type))
-            else:
-                missing_orders.append(order_id)
-        
-        # Second pass: process each unique label group with all its labels
-        for order_id in guide_sequence:
-            if order_id in processed_guide_ids:
-                continue  # Already processed as part of a group
-            
-            if order_id not in guide_to_label_group:
-                continue  # No match found
-                
-            label_group = guide_to_label_group[order_id]
-            
-            if label_group not in processed_label_groups:
-                # Get all guide orders that match this label group
-                matching_orders = label_group_to_guide_orders[label_group]
-                total_count = sum(guide_counts[gid] for gid, _ in matching_orders)
-                
-                # Log all matches
-                first_label = list(label_group)[0]
-                for gid, mtype in matching_orders:
-                    if mtype == "exact":
-                        log_callback(f"✅ MATCH: {gid}")
-                    else:
-                        log_callback(f"✅ MATCH (flexible): {gid} → {first_label}")
-                    processed_guide_ids.add(gid)
-                
-                # Add ALL labels in this group consecutively with all their pages
-                page_counter = 0
-                for label_id in sorted(label_group):  # Sort for consistent order
-                    if label_id in labels_db:
-                        pages_for_this_label = labels_db[label_id]
-                        processed_individual_labels.add(label_id)  # Track this label as used
-                        
-                        for p in pages_for_this_label:
-                            w = float(p.mediabox[2])
-                            h = float(p.mediabox[3])
-                            
-                            text = p.extract_text() or ""
-                            is_rm = "royal mail" in text.lower()
-                            
-                            # First page shows total count, subsequent pages show no count
-                            display_count = total_count if page_counter == 0 else 1
-                            page_counter += 1
-                            
-                            if is_rm:
-                                overlay = create_overlay_page(w, h, image_path, label_id, display_count, 158, -252, 0.06, 315, 9, rm_mode=True)
-                            else:
-                                overlay = create_overlay_page(w, h, image_path, label_id, display_count)
-                            
-                            p.merge_page(overlay)
-                            writer.add_page(p)
-                
-                processed_label_groups.add(label_group)
-
-        # Log missing orders
-        for order_id in missing_orders:
-            log_callback(f"❌ MISSING: {order_id}")
-
-        # B. Add extras not in guide at the end (labels that don't match any guide order)
-        for label_id, pages in labels_db.items():
-            if label_id not in processed_individual_labels:
-                log_callback(f"➕ EXTRA Added: {label_id}")
-                if pages:
-                    p = pages[0]
-                    w = float(p.mediabox[2])
-                    h = float(p.mediabox[3])
-                    
-                    text = p.extract_text() or ""
-                    is_rm = "royal mail" in text.lower()
-                    
-                    if is_rm:
-                        overlay = create_overlay_page(w, h, image_path, label_id, 1, 158, -252, 0.06, 315, 9, rm_mode=True)
-                    else:
-                        overlay = create_overlay_page(w, h, image_path, label_id, 1)
-                    p.merge_page(overlay)
-                    writer.add_page(p)
-
-        with open(output_path, "wb") as f_out:
-            writer.write(f_out)
+
+        # Labels of earlier runs are kept in the ledger to recover MISSING orders
+        with profiled_run(output_path, log_callback, profile, [guide_path, *input_pdf_paths]) as profiler, \
+                OrderLedger() as ledger, memory_tracking(memory) as stage_memory:
+            result = run_job("temu", guide_path, input_pdf_paths, output_path, log_callback,
+                             parallel=profiler is None, ledger=ledger, dry_run=dry_run,
+                             cache=JobCache() if profiler is None else None, memory=stage_memory,
+                             part_orders=part_orders, optimize=optimize, fuzzy_distance=fuzzy_distance,
+                             ledger_digits=ledger_digits)
 
         # --- FINAL REPORT ---
         log_callback("-" * 30)
-        if missing_orders:
-            log_callback(f"🚩 {len(missing_orders)} orders MISSING.")
-            log_callback(f"🏁 {len(labels_db)} Orders ADDED")
+        for match in result["report"].get("fuzzy_matches", ()):
+            log_callback(f"⚠️  FUZZY: {match['order']} → {match['label']} (check this label)")
+        for match in result["report"].get("ledger_by_digits", ()):
+            log_callback(f"⚠️  LEDGER (first/last digits): {match['order']} → {match['label']} (check this label)")
+        if result["from_ledger"]:
+            log_callback(f"📚 {len(result['from_ledger'])} orders recovered from earlier files.")
+        if result["missing"]:
+            log_callback(f"🚩 {len(result['missing'])} orders MISSING.")
+            log_callback(f"🏁 {len(result['labels_db'])} Orders ADDED")
         else:
             log_callback("✨ TOTAL SUCCESS: All orders found.")
-        
-        messagebox.showinfo("Success", f"File generated successfully:\n{output_path}")
+
+        if memory and not dry_run:
+            log_callback("🧠 Memory per stage:")
+            for line in format_memory(result["report"]["memory"]):
+                log_callback(line)
+
+        if dry_run:
+            log_callback(format_report(result["report"]))
+            messagebox.showinfo("Dry run", f"Report generated:\n{result['report_paths'][1]}")
+        else:
+            messagebox.showinfo("Success", f"File generated successfully:\n{output_path}")
 
     except Exception as e:
         log_callback(f"🚨 CRITICAL ERROR: {str(e)}")
         messagebox.showerror("Error", str(e))
-    
-    finally:
-        if image_path and os.path.exists(image_path):
-            try:
-                os.remove(image_path)
-            except:
-                pass
 
 # ------------------ GUI (TKINTER) ------------------
 
@@ -399,19 +114,38 @@ class PDFApp:
 
     def setup_amazon_tab(self):
         self.amazon_guide = tk.StringVar()
+        self.amazon_dry_run = tk.BooleanVar()
+        self.amazon_profile = tk.BooleanVar()
+        self.amazon_memory = tk.BooleanVar()
+        self.amazon_progressive = tk.BooleanVar()
+        self.amazon_optimize = tk.BooleanVar()
+        self.amazon_fuzzy = tk.BooleanVar()
         self.amazon_sources = [tk.StringVar() for _ in range(5)]
 
         tk.Label(self.amazon_frame, text="Amazon Configuration", 
                  font=("Arial", 12, "bold")).pack(pady=10)
 
-        self.create_file_selector_in_frame(self.amazon_frame, "Guide File (PDF)", 
-                                           self.amazon_guide, [("PDF Files", "*.pdf")])
+        self.create_file_selector_in_frame(self.amazon_frame, "Guide File (PDF/CSV/XLSX)", 
+                                           self.amazon_guide, GUIDE_FILE_TYPES)
         
         for i in range(5):
             label = f"Source Labels #{i+1} {'(Optional)' if i > 0 else ''}"
             self.create_file_selector_in_frame(self.amazon_frame, label, 
                                                self.amazon_sources[i], [("PDF Files", "*.pdf")])
 
+        tk.Checkbutton(self.amazon_frame, text="Dry run (match report only, no PDF)",
+                       variable=self.amazon_dry_run).pack(anchor="w", padx=20)
+        tk.Checkbutton(self.amazon_frame, text="Profile this run (saves a _profile.txt next to the output)",
+                       variable=self.amazon_profile).pack(anchor="w", padx=20)
+        tk.Checkbutton(self.amazon_frame, text="Track memory per stage (added to the run report)",
+                       variable=self.amazon_memory).pack(anchor="w", padx=20)
+        tk.Checkbutton(self.amazon_frame, text=f"Progressive output (print parts of {PART_ORDERS} orders as they are ready)",
+                       variable=self.amazon_progressive).pack(anchor="w", padx=20)
+        tk.Checkbutton(self.amazon_frame, text="Optimize output size (slower, smaller PDF)",
+                       variable=self.amazon_optimize).pack(anchor="w", padx=20)
+        tk.Checkbutton(self.amazon_frame, text="Fuzzy match (accept one wrong digit, check the run report)",
+                       variable=self.amazon_fuzzy).pack(anchor="w", padx=20)
+
         btn_amazon = tk.Button(self.amazon_frame, text="START AMAZON PROCESSING", 
                                command=self.start_amazon_thread, 
                                bg="#FF9900", fg="white", font=("Arial", 12, "bold"), height=2)
@@ -421,17 +155,36 @@ class PDFApp:
         self.temu_guide = tk.StringVar()
         self.temu_source1 = tk.StringVar()
         self.temu_source2 = tk.StringVar()
+        self.temu_dry_run = tk.BooleanVar()
+        self.temu_profile = tk.BooleanVar()
+        self.temu_memory = tk.BooleanVar()
+        self.temu_progressive = tk.BooleanVar()
+        self.temu_optimize = tk.BooleanVar()
+        self.temu_fuzzy = tk.BooleanVar()
 
         tk.Label(self.temu_frame, text="Temu Configuration", 
                  font=("Arial", 12, "bold")).pack(pady=10)
 
-        self.create_file_selector_in_frame(self.temu_frame, "Guide File (PDF)", 
-                                           self.temu_guide, [("PDF Files", "*.pdf")])
+        self.create_file_selector_in_frame(self.temu_frame, "Guide File (PDF/CSV/XLSX)", 
+                                           self.temu_guide, GUIDE_FILE_TYPES)
         self.create_file_selector_in_frame(self.temu_frame, "Source Labels #1 (PDF)", 
                                            self.temu_source1, [("PDF Files", "*.pdf")])
         self.create_file_selector_in_frame(self.temu_frame, "Source Labels #2 (Optional)", 
                                            self.temu_source2, [("PDF Files", "*.pdf")])
 
+        tk.Checkbutton(self.temu_frame, text="Dry run (match report only, no PDF)",
+                       variable=self.temu_dry_run).pack(anchor="w", padx=20)
+        tk.Checkbutton(self.temu_frame, text="Profile this run (saves a _profile.txt next to the output)",
+                       variable=self.temu_profile).pack(anchor="w", padx=20)
+        tk.Checkbutton(self.temu_frame, text="Track memory per stage (added to the run report)",
+                       variable=self.temu_memory).pack(anchor="w", padx=20)
+        tk.Checkbutton(self.temu_frame, text=f"Progressive output (print parts of {PART_ORDERS} orders as they are ready)",
+                       variable=self.temu_progressive).pack(anchor="w", padx=20)
+        tk.Checkbutton(self.temu_frame, text="Optimize output size (slower, smaller PDF)",
+                       variable=self.temu_optimize).pack(anchor="w", padx=20)
+        tk.Checkbutton(self.temu_frame, text="Fuzzy match (accept one wrong digit, check the run report)",
+                       variable=self.temu_fuzzy).pack(anchor="w", padx=20)
+
         btn_temu = tk.Button(self.temu_frame, text="START TEMU PROCESSING", 
                             command=self.start_temu_thread, 
                             bg="#007AFF", fg="white", font=("Arial", 12, "bold"), height=2)
@@ -478,7 +231,13 @@ class PDFApp:
             self.amazon_guide.get(),
             input_files,
             output_file,
-            self.log
+            self.log,
+            self.amazon_dry_run.get(),
+            self.amazon_profile.get(),
+            self.amazon_memory.get(),
+            PART_ORDERS if self.amazon_progressive.get() else None,
+            self.amazon_optimize.get(),
+            FUZZY_DISTANCE if self.amazon_fuzzy.get() else None
         )).start()
 
     def start_temu_thread(self):
@@ -501,10 +260,18 @@ class PDFApp:
             self.temu_guide.get(),
             input_files,
             output_file,
-            self.log
+            self.log,
+            self.temu_dry_run.get(),
+            self.temu_profile.get(),
+            self.temu_memory.get(),
+            PART_ORDERS if self.temu_progressive.get() else None,
+            self.temu_optimize.get(),
+            FUZZY_DISTANCE if self.temu_fuzzy.get() else None
         )).start()
 
 if __name__ == "__main__":
+    # Needed by the parallel guide/label scan once frozen by PyInstaller
+    multiprocessing.freeze_support()
     root = tk.Tk()
     app = PDFApp(root)
     root.mainloop()
@@ -0,0 +1,189 @@
+"""Output size optimizer: a pass over a written PDF (PyPDF2 only).
+
+Merged carrier files repeat identical objects (font programs, logos,
+font dictionaries) and PyPDF2 writes every object on its own with a plain
+xref table. optimize_pdf() rewrites the file:
+
+    1. only the objects reachable from the trailer are kept
+    2. identical objects are merged (hash of their content, repeated until
+       no more merge: two fonts become identical once their font files are)
+    3. uncompressed streams are deflated, deflated streams recompressed
+       at the highest level when that is smaller
+    4. all non-stream objects are packed in compressed object streams and
+       the cross-reference table is a compressed xref stream (PDF 1.5)
+
+Page objects are never merged (a page may appear only once in the page tree).
+"""
+import hashlib
+import io
+import os
+import time
+import zlib
+import PyPDF2
+from PyPDF2.generic import ArrayObject, DictionaryObject, IndirectObject, NameObject, NumberObject, StreamObject
+
+OBJECTS_PER_STREAM = 100
+
+def _serialize(obj, number_of):
+    """PDF bytes of a direct object, references written as `number_of(idnum)` 0 R."""
+    if isinstance(obj, IndirectObject):
+        return b"%d 0 R" % number_of(obj.idnum)
+    if isinstance(obj, DictionaryObject):
+        items = b"".join(b"%s %s\n" % (key.encode(), _serialize(value, number_of))
+                         for key, value in obj.items())
+        return b"<<\n" + items + b">>"
+    if isinstance(obj, ArrayObject):
+        return b"[" + b" ".join(_serialize(value, number_of) for value in obj) + b"]"
+    if obj is None:
+        return b"null"
+    out = io.BytesIO()
+    obj.write_to_stream(out, None)
+    return out.getvalue()
+
+def _references(obj):
+    """IndirectObjects found in a (direct) object."""
+    if isinstance(obj, IndirectObject):
+        yield obj
+    elif isinstance(obj, DictionaryObject):
+        for value in obj.values():
+            yield from _references(value)
+    elif isinstance(obj, ArrayObject):
+        for value in obj:
+            yield from _references(value)
+
+def _reachable(trailer):
+    """{idnum: object} of every object reachable from the trailer."""
+    objects = {}
+    stack = list(_references(trailer))
+    while stack:
+        ref = stack.pop()
+        if ref.idnum in objects:
+            continue
+        obj = objects[ref.idnum] = ref.get_object()
+        stack.extend(_references(obj))
+    return objects
+
+def _merge_identical(objects):
+    """{idnum: representative idnum}: identical objects share the smallest idnum."""
+    # Stream data and page identities do not change between rounds
+    fixed = {}
+    for idnum, obj in objects.items():
+        if isinstance(obj, DictionaryObject) and obj.get("/Type") in ("/Page", "/Pages"):
+            fixed[idnum] = b"page %d" % idnum
+        elif isinstance(obj, StreamObject):
+            fixed[idnum] = hashlib.sha1(obj._data).digest()
+        else:
+            fixed[idnum] = b""
+
+    rep = {idnum: idnum for idnum in objects}
+    while True:
+        first = {}
+        new_rep = {}
+        for idnum in sorted(objects):
+            key = hashlib.sha1(_serialize(objects[idnum], rep.__getitem__) + fixed[idnum]).digest()
+            new_rep[idnum] = first.setdefault(key, idnum)
+        if new_rep == rep:
+            return rep
+        rep = new_rep
+
+def _stream_data(stream):
+    """Deflated data of a stream when that is smaller than its current data, else None."""
+    data = stream._data
+    filters = stream.get("/Filter")
+    if filters is None:
+        packed = zlib.compress(data, 9)
+        return packed if len(packed) < len(data) else None
+    if filters == "/FlateDecode" and "/DecodeParms" not in stream:
+        try:
+            packed = zlib.compress(zlib.decompress(data), 9)
+        except zlib.error:
+            return None
+        return packed if len(packed) < len(data) else None
+    return None
+
+def _stream_bytes(stream, number_of):
+    """Full `<< dict >> stream ... endstream` bytes of a stream object."""
+    header = DictionaryObject(stream)
+    data = stream._data
+    packed = _stream_data(stream)
+    if packed is not None:
+        data = packed
+        header[NameObject("/Filter")] = NameObject("/FlateDecode")
+    header[NameObject("/Length")] = NumberObject(len(data))
+    return _serialize(header, number_of) + b"\nstream\n" + data + b"\nendstream"
+
+def write_optimized(reader, output):
+    """Write the reachable, merged objects of `reader` to the binary file `output`."""
+    trailer = reader.trailer
+    objects = _reachable(trailer)
+    rep = _merge_identical(objects)
+
+    kept = sorted(set(rep.values()))
+    new_number = {idnum: number for number, idnum in enumerate(kept, 1)}
+    number_of = lambda idnum: new_number[rep[idnum]]
+
+    streams = [idnum for idnum in kept if isinstance(objects[idnum], StreamObject)]
+    packable = [idnum for idnum in kept if not isinstance(objects[idnum], StreamObject)]
+    chunks = [packable[i:i + OBJECTS_PER_STREAM] for i in range(0, len(packable), OBJECTS_PER_STREAM)]
+    next_number = len(kept) + 1
+    xref = {}  # new number -> (type, field 2, field 3)
+
+    output.write(b"%PDF-1.5\n%\xe2\xe3\xcf\xd3\n")
+    for idnum in streams:
+        xref[new_number[idnum]] = (1, output.tell(), 0)
+        output.write(b"%d 0 obj\n" % new_number[idnum])
+        output.write(_stream_bytes(objects[idnum], number_of))
+        output.write(b"\nendobj\n")
+
+    for chunk in chunks:
+        stream_number = next_number
+        next_number += 1
+        offsets, bodies, pos = [], [], 0
+        for index, idnum in enumerate(chunk):
+            body = _serialize(objects[idnum], number_of) + b"\n"
+            offsets.append(b"%d %d" % (new_number[idnum], pos))
+            bodies.append(body)
+            pos += len(body)
+            xref[new_number[idnum]] = (2, stream_number, index)
+        head = b" ".join(offsets) + b"\n"
+        data = zlib.compress(head + b"".join(bodies), 9)
+        xref[stream_number] = (1, output.tell(), 0)
+        output.write(b"%d 0 obj\n<< /Type /ObjStm /N %d /First %d /Filter /FlateDecode /Length %d >>\nstream\n"
+                     % (stream_number, len(chunk), len(head), len(data)))
+        output.write(data + b"\nendstream\nendobj\n")
+
+    xref_number = next_number
+    xref[xref_number] = (1, output.tell(), 0)
+    rows = [b"\x00\x00\x00\x00\x00\xff\xff"]
+    for number in range(1, xref_number + 1):
+        kind, field2, field3 = xref[number]
+        rows.append(bytes([kind]) + field2.to_bytes(4, "big") + field3.to_bytes(2, "big"))
+    data = zlib.compress(b"".join(rows), 9)
+
+    extra = b""
+    for key in ("/Root", "/Info", "/ID"):
+        if key in trailer:
+            extra += b" %s %s" % (key.encode(), _serialize(trailer.raw_get(key), number_of))
+    output.write(b"%d 0 obj\n<< /Type /XRef /Size %d /W [1 4 2] /Filter /FlateDecode /Length %d%s >>\nstream\n"
+                 % (xref_number, xref_number + 1, len(data), extra))
+    output.write(data + b"\nendstream\nendobj\n")
+    output.write(b"startxref\n%d\n%%%%EOF\n" % xref[xref_number][1])
+    return len(objects), len(kept)
+
+def optimize_pdf(path):
+    """Rewrite the PDF at `path` in place. Returns a summary dict (sizes in bytes, seconds)."""
+    start = time.perf_counter()
+    before = os.path.getsize(path)
+    with open(path, "rb") as f:
+        reader = PyPDF2.PdfReader(io.BytesIO(f.read()))
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "wb") as f_out:
+        objects, kept = write_optimized(reader, f_out)
+    after = os.path.getsize(tmp_path)
+    if after < before:
+        os.replace(tmp_path, path)
+    else:
+        os.remove(tmp_path)
+        after = before
+    return {"before": before, "after": after, "objects": objects, "merged": objects - kept,
+            "seconds": round(time.perf_counter() - start, 2)}
@@ -0,0 +1,75 @@
+"""Opt-in profiling of one run ("it took 9 minutes today").
+
+    with profiled_run(output_path, log_callback) as profile:
+        result = run_job(..., parallel=profile is None, cache=None if profile else JobCache())
+
+saves <output>_profile.prof (cProfile data, open it with pstats or
+snakeviz) and <output>_profile.txt (the hot functions) next to the output
+PDF, so the slow job can be diagnosed offline without the input files.
+A profiled run reads its files in this process (no worker processes, no
+job cache) so the profile covers the whole pipeline.
+"""
+import contextlib
+import cProfile
+import io
+import os
+import platform
+import pstats
+import time
+
+TOP_FUNCTIONS = 30
+
+def profile_paths(output_path):
+    base = os.path.splitext(output_path)[0] + "_profile"
+    return base + ".prof", base + ".txt"
+
+def hot_functions(profile, sort_key, limit=TOP_FUNCTIONS):
+    """pstats listing of the `limit` first functions by `sort_key` ("cumulative", "tottime")."""
+    out = io.StringIO()
+    stats = pstats.Stats(profile, stream=out)
+    stats.strip_dirs().sort_stats(sort_key).print_stats(limit)
+    return out.getvalue()
+
+def write_profile(profile, output_path, elapsed, inputs=()):
+    """Write the .prof and .txt files of a run. Returns both paths."""
+    prof_path, text_path = profile_paths(output_path)
+    profile.dump_stats(prof_path)
+    with open(text_path, "w", encoding="utf-8") as f_text:
+        f_text.write(f"Run time: {elapsed:.2f} s\n")
+        f_text.write(f"Python {platform.python_version()} on {platform.platform()}\n")
+        for path in inputs:
+            size = os.path.getsize(path) if os.path.exists(path) else 0
+            f_text.write(f"Input: {os.path.basename(path)} ({size / 1024:.0f} KB)\n")
+        f_text.write("\n== Hot functions (own time) ==\n")
+        f_text.write(hot_functions(profile, "tottime"))
+        f_text.write("\n== Hot functions (including callees) ==\n")
+        f_text.write(hot_functions(profile, "cumulative"))
+    return prof_path, text_path
+
+@contextlib.contextmanager
+def profiled_run(output_path, log_callback, enabled=True, inputs=()):
+    """Profile the block when enabled; yields the cProfile.Profile (None when disabled).
+
+    The profile is written even when the run fails, since failing runs are
+    often the slow ones.
+    """
+    if not enabled:
+        yield None
+        return
+    profile = cProfile.Profile()
+    try:
+        profile.enable()
+    except ValueError:
+        # Another profiler (e.g. a debugger's) is already active
+        log_callback("⚠️  A profiler is already active, this run is not profiled")
+        yield None
+        return
+
+    log_callback("⏱️ PROFILING: files are read in this process, job cache off")
+    start = time.perf_counter()
+    try:
+        yield profile
+    finally:
+        profile.disable()
+        prof_path, text_path = write_profile(profile, output_path, time.perf_counter() - start, inputs)
+        log_callback(f"⏱️ Profile saved: {os.path.basename(prof_path)} + {os.path.basename(text_path)}")
@@ -0,0 +1,43 @@
+"""Compact records passed between the engine stages.
+
+Both classes use __slots__ (no per-instance __dict__): a job holds one
+LabelRef per scanned page and one GuideEntry per guide order, so these are
+the objects that dominate memory on large files.
+"""
+
+
+class LabelRef:
+    """One label page found by the scan.
+
+    The page itself stays in its open document: it is fetched back with
+    (readers[file_idx], page_idx) only when it is written. The courier
+    and page size are recorded once at scan time so later stages never
+    re-extract text or re-read the mediabox. `digest` identifies the page
+    content (see PdfBackend.page_digest), None when it was not computed.
+    """
+    __slots__ = ("file_idx", "page_idx", "courier", "w", "h", "raw_id", "digest")
+
+    def __init__(self, file_idx, page_idx, courier, w, h, raw_id, digest=None):
+        self.file_idx = file_idx
+        self.page_idx = page_idx
+        self.courier = courier
+        self.w = w
+        self.h = h
+        self.raw_id = raw_id
+        self.digest = digest
+
+    def __repr__(self):
+        return f"LabelRef(file={self.file_idx}, page={self.page_idx}, id={self.raw_id!r})"
+
+
+class GuideEntry:
+    """One unique guide order: how many times it appears and where it first appears."""
+    __slots__ = ("id", "count", "first_pos")
+
+    def __init__(self, id, count, first_pos):
+        self.id = id
+        self.count = count
+        self.first_pos = first_pos
+
+    def __repr__(self):
+        return f"GuideEntry({self.id!r}, count={self.count}, first_pos={self.first_pos})"
@@ -0,0 +1,316 @@
+"""Sharded label scan over a shared folder, for very large label sets.
+
+    # on the PC that runs the job (it scans too)
+    python shard.py coordinate S:\\labels temu guide.pdf big1.pdf big2.pdf -o sorted.pdf
+    # on every other PC, pointed at the same folder
+    python shard.py work S:\\labels --watch
+
+The coordinator copies the label files to the shared folder and splits
+them into page-range tasks. Each worker claims a task (a file created
+exclusively in claims/), scans its pages and writes the partial label
+index to results/. The coordinator reads the guide meanwhile, merges the
+partial indexes in file and page order and runs the usual pipeline
+(match, overlay, write) on its own copy of the files: the output is the
+same as a single-PC run.
+
+A label whose ID is on the next page (TEMU-Fulfilment) can use the first
+page of the next task as its ID page, so each task is scanned twice from
+its first two pages (the page text is extracted once); the merge follows
+the variant that continues the previous task. Couriers that need the whole
+file (Amazon) get one task per file.
+
+Layout of a job in the shared folder (<share>/<job id>/):
+    job.json            flow, backend, courier settings, files
+    files/<n>.pdf       copies of the label files
+    tasks/<task>.json   {file_idx, start, stop}
+    claims/<task>       host and time of the worker running the task
+    results/<task>.json partial label index of the task
+
+`--local-workers N` starts N worker processes on this PC as a stand-in for
+other hosts.
+"""
+import argparse
+import glob
+import hashlib
+import json
+import os
+import shutil
+import socket
+import time
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from couriers import flow_couriers, get_courier
+from job_cache import JobCache, courier_settings
+from label_engine import ENGINE_VERSION, label_page_texts, read_guide, run_job, scan_label_range
+from ledger import OrderLedger, file_hash
+from memory_trace import no_stage
+from pdf_backends import get_backend
+from records import LabelRef
+
+PAGES_PER_TASK = 500
+# A claim without result after this long is given to another worker
+CLAIM_TIMEOUT = 15 * 60
+POLL_SECONDS = 1.0
+
+def _write_json(path, data):
+    """Write JSON atomically (readers on other hosts never see a partial file)."""
+    tmp_path = f"{path}.{socket.gethostname()}.{os.getpid()}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f_json:
+        json.dump(data, f_json)
+    os.replace(tmp_path, path)
+
+def _read_json(path):
+    with open(path, encoding="utf-8") as f_json:
+        return json.load(f_json)
+
+def _settings_digest(flow):
+    return hashlib.sha256(f"{ENGINE_VERSION}{courier_settings(flow_couriers(flow))}".encode()).hexdigest()
+
+def _claim(job_dir, task):
+    """Claim a task for this process; False when another worker has it."""
+    try:
+        fd = os.open(os.path.join(job_dir, "claims", task), os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+    except FileExistsError:
+        return False
+    with os.fdopen(fd, "w") as f_claim:
+        f_claim.write(f"{socket.gethostname()} {os.getpid()} {time.time():.0f}")
+    return True
+
+def _task_names(job_dir):
+    return sorted(os.path.splitext(name)[0] for name in os.listdir(os.path.join(job_dir, "tasks")))
+
+def _result_path(job_dir, task):
+    return os.path.join(job_dir, "results", task + ".json")
+
+# ------------------ WORKER ------------------
+
+def run_task(job_dir, job, task, docs):
+    """Scan one task and write its partial label index. `docs` caches the open files of the worker."""
+    start_time = time.perf_counter()
+    spec = _read_json(os.path.join(job_dir, "tasks", task + ".json"))
+    couriers = flow_couriers(job["flow"])
+    backend = get_backend(job["backend"])
+    file_idx, start, stop = spec["file_idx"], spec["start"], spec["stop"]
+
+    key = (job_dir, file_idx)
+    if key not in docs:
+        docs[key] = backend.open(os.path.join(job_dir, "files", f"{file_idx}.pdf"))
+    doc = docs[key]
+    # Both variants read the same pages: keep the whole task (+ the ID page after it)
+    page_text = label_page_texts(doc, couriers, backend, stop - start + 1)
+
+    variants = {}
+    # Variant 1: the first page was the ID page of the previous task's last label
+    for skip in ((0, 1) if start > 0 and couriers[0].page_range_scan else (0,)):
+        found, unlabelled, next_page, _ = scan_label_range(doc, page_text, file_idx, couriers,
+                                                           lambda message: None, backend, start + skip, stop)
+        variants[skip] = {
+            "next": next_page,
+            "found": [[clean_id, ref.page_idx, ref.courier.name, ref.w, ref.h, ref.raw_id, ref.digest]
+                      for clean_id, ref in found],
+            "unlabelled": [[ref.page_idx, ref.courier.name, ref.w, ref.h] for ref in unlabelled],
+        }
+    _write_json(_result_path(job_dir, task), {
+        "variants": variants,
+        "host": socket.gethostname(),
+        "seconds": round(time.perf_counter() - start_time, 2),
+    })
+
+def work_job(job_dir, docs, log_callback):
+    """Run every task of a job that no one has claimed. Returns the number of tasks run."""
+    job = _read_json(os.path.join(job_dir, "job.json"))
+    if job["settings"] != _settings_digest(job["flow"]):
+        log_callback(f"⚠️  {os.path.basename(job_dir)}: courier settings differ from the coordinator's "
+                     f"(other program version), skipped")
+        return 0
+    if not get_backend(job["backend"]).available():
+        log_callback(f"⚠️  {os.path.basename(job_dir)}: PDF backend {job['backend']} is not installed, skipped")
+        return 0
+
+    ran = 0
+    for task in _task_names(job_dir):
+        if os.path.exists(_result_path(job_dir, task)) or not _claim(job_dir, task):
+            continue
+        run_task(job_dir, job, task, docs)
+        log_callback(f"🛰️ {os.path.basename(job_dir)} task {task} done")
+        ran += 1
+    return ran
+
+def work(share_dir, watch=False, job_id=None, log_callback=print):
+    """Worker loop: run the open tasks of the jobs in share_dir (only job_id if given).
+
+    Without watch, returns when no task is left to claim.
+    """
+    docs = {}
+    while True:
+        ran = 0
+        job_dirs = [os.path.dirname(path) for path in sorted(glob.glob(os.path.join(share_dir, "*", "job.json")))]
+        if job_id is not None:
+            job_dirs = [path for path in job_dirs if os.path.basename(path) == job_id]
+        for key in [key for key in docs if key[0] not in job_dirs]:
+            del docs[key]
+        for job_dir in job_dirs:
+            try:
+                ran += work_job(job_dir, docs, log_callback)
+            except FileNotFoundError:
+                pass  # the coordinator removed the finished job meanwhile
+        if not ran:
+            if not watch:
+                return
+            time.sleep(POLL_SECONDS)
+
+def _work_quietly(share_dir, job_id):
+    work(share_dir, job_id=job_id, log_callback=lambda message: None)
+
+# ------------------ COORDINATOR ------------------
+
+class ShardedScan:
+    """run_job(scan=...) replacement of read_inputs that spreads the label scan over the workers."""
+
+    def __init__(self, share_dir, pages_per_task=PAGES_PER_TASK, local_workers=0, scan_here=True,
+                 keep_job=False):
+        self.share_dir = share_dir
+        self.pages_per_task = max(2, pages_per_task)
+        self.local_workers = local_workers
+        self.scan_here = scan_here
+        self.keep_job = keep_job
+
+    def publish(self, input_pdf_paths, readers, couriers, backend, log_callback):
+        """Copy the label files and write the tasks. Returns (job dir, [(task, spec)])."""
+        flow = couriers[0].flow
+        hashes = [file_hash(path) for path in input_pdf_paths]
+        settings = _settings_digest(flow)
+        job_id = hashlib.sha256(f"{flow}{backend.name}{settings}{hashes}{self.pages_per_task}".encode()).hexdigest()[:16]
+        job_dir = os.path.join(self.share_dir, job_id)
+        for sub in ("files", "tasks", "claims", "results"):
+            os.makedirs(os.path.join(job_dir, sub), exist_ok=True)
+
+        tasks = []
+        for file_idx, (path, doc) in enumerate(zip(input_pdf_paths, readers)):
+            copy_path = os.path.join(job_dir, "files", f"{file_idx}.pdf")
+            if not os.path.exists(copy_path):
+                shutil.copyfile(path, copy_path + ".tmp")
+                os.replace(copy_path + ".tmp", copy_path)
+            pages = backend.page_count(doc)
+            step = self.pages_per_task if couriers[0].page_range_scan else max(pages, 1)
+            for start in range(0, pages, step):
+                spec = {"file_idx": file_idx, "start": start, "stop": min(start + step, pages)}
+                task = f"{file_idx:03d}-{start:07d}"
+                _write_json(os.path.join(job_dir, "tasks", task + ".json"), spec)
+                tasks.append((task, spec))
+
+        _write_json(os.path.join(job_dir, "job.json"), {
+            "flow": flow, "backend": backend.name, "settings": settings,
+            "files": [os.path.basename(path) for path in input_pdf_paths],
+        })
+        log_callback(f"🛰️ Sharded scan: {len(tasks)} tasks in {job_dir}")
+        return job_dir, tasks
+
+    def wait(self, job_dir, tasks, log_callback):
+        """Run tasks here and wait for the workers' results; stale claims are released."""
+        docs = {}
+        done = 0
+        while True:
+            missing = [task for task, _ in tasks if not os.path.exists(_result_path(job_dir, task))]
+            if len(tasks) - len(missing) != done:
+                done = len(tasks) - len(missing)
+                log_callback(f"🛰️ Shards done: {done}/{len(tasks)}")
+            if not missing:
+                return
+            if self.scan_here and work_job(job_dir, docs, lambda message: None):
+                continue
+            for task in missing:
+                claim_path = os.path.join(job_dir, "claims", task)
+                try:
+                    if time.time() - os.path.getmtime(claim_path) > CLAIM_TIMEOUT:
+                        log_callback(f"⚠️  Task {task} claimed for too long, released")
+                        os.remove(claim_path)
+                except FileNotFoundError:
+                    pass
+            time.sleep(POLL_SECONDS)
+
+    def merge(self, job_dir, tasks, couriers):
+        """labels_db and unlabelled in the order of a single-PC scan."""
+        labels_db = {}
+        unlabelled = []
+        skip = 0
+        for task, spec in tasks:
+            if spec["start"] == 0:
+                skip = 0
+            variant = _read_json(_result_path(job_dir, task))["variants"][str(skip)]
+            for clean_id, page_idx, courier, w, h, raw_id, digest in variant["found"]:
+                labels_db.setdefault(clean_id, []).append(
+                    LabelRef(spec["file_idx"], page_idx, get_courier(courier), w, h, raw_id, digest))
+            unlabelled.extend(LabelRef(spec["file_idx"], page_idx, get_courier(courier), w, h, None)
+                              for page_idx, courier, w, h in variant["unlabelled"])
+            skip = variant["next"] - spec["stop"] if couriers[0].page_range_scan else 0
+        return labels_db, unlabelled
+
+    def __call__(self, guide_path, input_pdf_paths, couriers, log_callback, backend, parallel=True,
+                 stage=no_stage):
+        with stage("open labels"):
+            readers = [backend.open(path) for path in input_pdf_paths]
+        job_dir, tasks = self.publish(input_pdf_paths, readers, couriers, backend, log_callback)
+
+        pool = None
+        if self.local_workers:
+            pool = ProcessPoolExecutor(max_workers=self.local_workers)
+            for _ in range(self.local_workers):
+                pool.submit(_work_quietly, self.share_dir, os.path.basename(job_dir))
+        try:
+            with stage("guide parse"):
+                guide = read_guide(guide_path, couriers, log_callback, backend)
+            with stage("label scan"):
+                self.wait(job_dir, tasks, log_callback)
+                labels_db, unlabelled = self.merge(job_dir, tasks, couriers)
+        finally:
+            if pool is not None:
+                try:
+                    pool.shutdown()
+                except BrokenProcessPool:
+                    pass
+
+        hosts = {}
+        for task, _ in tasks:
+            host = _read_json(_result_path(job_dir, task))["host"]
+            hosts[host] = hosts.get(host, 0) + 1
+        log_callback("🛰️ Tasks per host: " + ", ".join(f"{host} ×{n}" for host, n in hosts.items()))
+        if not self.keep_job:
+            shutil.rmtree(job_dir, ignore_errors=True)
+        return guide, labels_db, unlabelled, readers
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    p = sub.add_parser("coordinate", help="run a job, with the label scan shared through the folder")
+    p.add_argument("share")
+    p.add_argument("flow", choices=("temu", "amazon", "temu_fulfilment"))
+    p.add_argument("guide")
+    p.add_argument("labels", nargs="+")
+    p.add_argument("-o", "--output", required=True)
+    p.add_argument("--pages-per-task", type=int, default=PAGES_PER_TASK)
+    p.add_argument("--local-workers", type=int, default=0, help="worker processes started on this PC")
+    p.add_argument("--no-scan", action="store_true", help="only coordinate, leave every task to the workers")
+
+    p = sub.add_parser("work", help="scan the tasks published in the folder")
+    p.add_argument("share")
+    p.add_argument("--watch", action="store_true", help="keep waiting for new jobs")
+
+    args = parser.parse_args()
+    if args.command == "work":
+        work(args.share, args.watch)
+        return
+
+    scan = ShardedScan(args.share, args.pages_per_task, args.local_workers, not args.no_scan)
+    with OrderLedger() as ledger:
+        result = run_job(args.flow, args.guide, args.labels, args.output, print,
+                         ledger=ledger, cache=JobCache(), scan=scan)
+    print("-" * 40)
+    print(f"✓ Matched: {len(result['matched'])}  ✗ Missing: {len(result['missing'])}")
+    print(f"📄 Output: {args.output}")
+
+
+if __name__ == "__main__":
+    main()
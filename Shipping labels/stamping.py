@@ -0,0 +1,156 @@
+"""Overlay stamping with shared Form XObjects.
+
+PageObject.merge_page() parses the carrier page's content stream, rewrites
+it together with the overlay and merges both resource dictionaries, for
+every label. The stamper instead leaves the carrier content streams as they
+are and only appends one small shared stream that calls `Do` on a Form
+XObject holding the overlay:
+
+    /Contents [ <q> <original streams, untouched> <Q q /CautionStamp Do Q> ]
+
+The caution image is rendered once per (image, scale, page size) and shared
+by every overlay form; overlay forms themselves are shared between pages
+that show the same text. The rendered image page is also kept for the
+whole process, so later jobs (batch runs) skip the reportlab render.
+"""
+import io
+import PyPDF2
+from PyPDF2.generic import (ArrayObject, DecodedStreamObject, DictionaryObject,
+                            FloatObject, IndirectObject, NameObject)
+from reportlab.pdfgen import canvas
+from assets import get_image, get_print_image
+
+STAMP_NAME = "/CautionStamp"
+
+# (image, scale, w, h) -> PDF bytes of the caution image drawn on a w x h page
+_image_pages = {}
+
+def _pdf_string(text):
+    """Escape text for a PDF literal string (WinAnsi, like reportlab's standard fonts)."""
+    data = text.encode("cp1252", "replace")
+    return data.replace(b"\\", b"\\\\").replace(b"(", b"\\(").replace(b")", b"\\)")
+
+def _stream(data):
+    stream = DecodedStreamObject()
+    stream.set_data(data)
+    return stream
+
+def _form(data, bbox, resources):
+    form = _stream(data)
+    form[NameObject("/Type")] = NameObject("/XObject")
+    form[NameObject("/Subtype")] = NameObject("/Form")
+    form[NameObject("/BBox")] = ArrayObject([FloatObject(v) for v in bbox])
+    form[NameObject("/Resources")] = resources
+    return form
+
+
+def image_page(layout, width, height):
+    """PDF bytes of a page with only the caution image, rendered once per process."""
+    key = (layout.image, layout.scale, width, height)
+    data = _image_pages.get(key)
+    if data is None:
+        img = get_image(layout.image)
+        x_img, y_img, draw_width, draw_height, _ = layout.place(width, height, *img.getSize())
+        packet = io.BytesIO()
+        can = canvas.Canvas(packet, pagesize=(width, height))
+        can.drawImage(get_print_image(layout.image, draw_width, draw_height),
+                      x_img, y_img, width=draw_width, height=draw_height, mask='auto')
+        can.save()
+        data = _image_pages[key] = packet.getvalue()
+    return data
+
+
+class OverlayStamper:
+    """Stamps courier overlays on pages of one PdfWriter.
+
+    A caution image that cannot be drawn is reported once per image through
+    log_callback and the overlay keeps only the order text.
+    """
+
+    def __init__(self, writer, log_callback=print):
+        self.writer = writer
+        self.log_callback = log_callback
+        self._image_errors = set()  # images already reported as failing
+        self._image_forms = {}    # (image, scale, w, h) -> (form ref, text y)
+        self._overlay_forms = {}  # (layout id, w, h, text) -> form ref
+        self._font = None
+        # Shared wrapper streams around the untouched carrier content
+        self._open = writer._add_object(_stream(b"q\n"))
+        self._close = writer._add_object(_stream(f"Q\nq {STAMP_NAME} Do Q\n".encode()))
+
+    def _font_ref(self):
+        if self._font is None:
+            self._font = self.writer._add_object(DictionaryObject({
+                NameObject("/Type"): NameObject("/Font"),
+                NameObject("/Subtype"): NameObject("/Type1"),
+                NameObject("/BaseFont"): NameObject("/Helvetica-Bold"),
+                NameObject("/Encoding"): NameObject("/WinAnsiEncoding"),
+            }))
+        return self._font
+
+    def _image_form(self, layout, width, height):
+        """Form XObject with only the caution image, rendered once per page size."""
+        key = (layout.image, layout.scale, width, height)
+        cached = self._image_forms.get(key)
+        if cached is not None:
+            return cached
+
+        page = PyPDF2.PdfReader(io.BytesIO(image_page(layout, width, height))).pages[0]
+
+        resources = page["/Resources"].get_object().clone(self.writer)
+        form = _form(page.get_contents().get_data(), (0, 0, width, height), resources)
+        cached = self._image_forms[key] = self.writer._add_object(form)
+        return cached
+
+    def overlay_form(self, layout, width, height, text):
+        """Shared Form XObject: caution image + order text (if any)."""
+        key = (id(layout), width, height, text)
+        ref = self._overlay_forms.get(key)
+        if ref is not None:
+            return ref
+
+        xobjects = DictionaryObject()
+        ops = []
+        try:
+            xobjects[NameObject("/Caution")] = self._image_form(layout, width, height)
+            ops.append(b"q /Caution Do Q")
+        except Exception as e:
+            if layout.image not in self._image_errors:
+                self._image_errors.add(layout.image)
+                self.log_callback(f"⚠️ Image/Position Error ({layout.image}): {e}")
+
+        resources = DictionaryObject({NameObject("/XObject"): xobjects})
+        if text:
+            img = get_image(layout.image)
+            y_text = layout.place(width, height, *img.getSize())[4]
+            resources[NameObject("/Font")] = DictionaryObject({NameObject("/F1"): self._font_ref()})
+            ops.append(b"BT /F1 %d Tf 1 0 0 1 %.2f %.2f Tm (%s) Tj ET" % (
+                layout.font_size, layout.text_x, y_text, _pdf_string(text)))
+
+        form = _form(b"\n".join(ops) + b"\n", (0, 0, width, height), resources)
+        ref = self._overlay_forms[key] = self.writer._add_object(form)
+        return ref
+
+    def stamp(self, page, width, height, layout, text):
+        """Stamp `page` (a page of this writer) with the overlay for `layout` / `text`."""
+        form = self.overlay_form(layout, width, height, text)
+
+        contents = page.get(NameObject("/Contents"))
+        streams = []
+        if contents is not None:
+            contents_obj = contents.get_object()
+            if isinstance(contents_obj, ArrayObject):
+                streams.extend(contents_obj)
+            elif isinstance(contents, IndirectObject):
+                streams.append(contents)
+            else:
+                streams.append(self.writer._add_object(contents_obj))
+        page[NameObject("/Contents")] = ArrayObject([self._open, *streams, self._close])
+
+        # New resource dictionaries: the originals may be shared with other pages
+        resources = DictionaryObject(page.get(NameObject("/Resources"), DictionaryObject()).get_object())
+        xobjects = DictionaryObject(resources.get(NameObject("/XObject"), DictionaryObject()).get_object())
+        xobjects[NameObject(STAMP_NAME)] = form
+        resources[NameObject("/XObject")] = xobjects
+        page[NameObject("/Resources")] = resources
+        return page
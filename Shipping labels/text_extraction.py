@@ -0,0 +1,163 @@
+"""Page text extraction with a per-reader font cache.
+
+PyPDF2's extract_text() rebuilds the character map of every font on every
+page (parse /Encoding, parse the /ToUnicode CMap, compute space widths).
+Carrier PDFs use the same few font objects on all pages, so that work is
+repeated hundreds of times per file. FontCache keeps the result of
+PyPDF2's build_char_map() keyed by the font's indirect reference, for as
+long as the reader is used.
+
+PyPDF2 has no public hook for this: the module-level build_char_map used by
+PageObject._extract_text is wrapped once at import, and only pages
+extracted through extract_page_text() (with a cache) use the cache.
+"""
+import threading
+import PyPDF2._page
+from PyPDF2.generic import IndirectObject
+
+_original_build_char_map = getattr(PyPDF2._page, "build_char_map", None)
+_active = threading.local()  # cache used by the extraction running on this thread
+
+
+class FontCache:
+    """Character maps of one reader, keyed by (font object number, generation, space width)."""
+    __slots__ = ("maps", "hits", "misses")
+
+    def __init__(self):
+        self.maps = {}
+        self.hits = 0
+        self.misses = 0
+
+    def build_char_map(self, font_name, space_width, obj):
+        font_ref = obj["/Resources"]["/Font"].raw_get(font_name)
+        if not isinstance(font_ref, IndirectObject):
+            # Inline font dictionary: nothing stable to key on
+            self.misses += 1
+            return _original_build_char_map(font_name, space_width, obj)
+
+        key = (font_ref.idnum, font_ref.generation, space_width)
+        char_map = self.maps.get(key)
+        if char_map is None:
+            self.misses += 1
+            char_map = self.maps[key] = _original_build_char_map(font_name, space_width, obj)
+        else:
+            self.hits += 1
+        return char_map
+
+    def hit_rate(self):
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def summary(self):
+        return f"{self.hit_rate():.0%} hits ({len(self.maps)} fonts, {self.hits + self.misses} lookups)"
+
+
+def _cached_build_char_map(font_name, space_width, obj):
+    cache = getattr(_active, "cache", None)
+    if cache is None:
+        return _original_build_char_map(font_name, space_width, obj)
+    return cache.build_char_map(font_name, space_width, obj)
+
+
+if _original_build_char_map is not None:
+    PyPDF2._page.build_char_map = _cached_build_char_map
+
+
+def extract_page_text(page, font_cache=None, fragments=None):
+    """page.extract_text(), reusing `font_cache` for the fonts of the page's reader.
+
+    If `fragments` is a list, (x, y, text) of every text run shown on the
+    page is appended to it, in content-stream order.
+    """
+    kwargs = {}
+    if fragments is not None:
+        def visitor(text, cm, tm, font_dict, font_size):
+            if text.strip():
+                # Text origin in page space: tm x cm
+                x = tm[4] * cm[0] + tm[5] * cm[2] + cm[4]
+                y = tm[4] * cm[1] + tm[5] * cm[3] + cm[5]
+                fragments.append((x, y, text))
+        kwargs["visitor_text"] = visitor
+
+    if font_cache is None or _original_build_char_map is None:
+        return page.extract_text(**kwargs) or ""
+    previous = getattr(_active, "cache", None)
+    _active.cache = font_cache
+    try:
+        return page.extract_text(**kwargs) or ""
+    finally:
+        _active.cache = previous
+
+
+def region_text(fragments, region, width, height):
+    """Text of the fragments whose origin lies in `region`.
+
+    `region` is (x0, y0, x1, y1) in fractions of the page, origin bottom-left.
+    Runs on the same line are joined, a new line starts when y changes.
+    """
+    x0, y0, x1, y1 = region[0] * width, region[1] * height, region[2] * width, region[3] * height
+    parts = []
+    last_y = None
+    for x, y, text in fragments:
+        if x0 <= x <= x1 and y0 <= y <= y1:
+            if last_y is not None and abs(y - last_y) > 1:
+                parts.append("\n")
+            parts.append(text)
+            last_y = y
+    return "".join(parts)
+
+
+# Pages a PageTextCache keeps: the page being scanned and the next one (ID on the next page)
+WINDOW_PAGES = 2
+
+
+class PageTextCache:
+    """page_text(idx): extracted text of a page of `reader`.
+
+    Only the last WINDOW_PAGES extracted pages are kept (a scan reads a page
+    and at most the next one), so the text of a long file is never all in
+    memory at once (`window` pages can be kept instead). page_text.region(idx, region) returns only the text
+    inside a region of the page and page_text.page_fragments(idx) its
+    (x, y, text) runs. With positions=True the runs are recorded by the
+    extraction pass itself (label files with an ID region, guides); without,
+    a page is extracted again with its runs the first time a region needs
+    it. All pages of the reader share one FontCache. This is the page-text
+    interface every PDF backend provides (see pdf_backends.py).
+    """
+    __slots__ = ("reader", "positions", "window", "pages", "font_cache")
+
+    def __init__(self, reader, positions=False, window=WINDOW_PAGES):
+        self.reader = reader
+        self.positions = positions
+        self.window = window
+        self.pages = {}  # idx -> (text, fragments or None), oldest first
+        self.font_cache = FontCache()
+
+    @property
+    def page_count(self):
+        return len(self.reader.pages)
+
+    def _page(self, idx, fragments_needed=False):
+        entry = self.pages.get(idx)
+        if entry is None or (fragments_needed and entry[1] is None):
+            fragments = [] if self.positions or fragments_needed else None
+            entry = (extract_page_text(self.reader.pages[idx], self.font_cache, fragments), fragments)
+            self.pages.pop(idx, None)
+            self.pages[idx] = entry
+            while len(self.pages) > self.window:
+                del self.pages[next(iter(self.pages))]
+        return entry
+
+    def page_fragments(self, idx):
+        """(x, y, text) runs of a page, origin bottom-left."""
+        return self._page(idx, True)[1]
+
+    def cache_summary(self):
+        return f"Font cache: {self.font_cache.summary()}"
+
+    def __call__(self, idx):
+        return self._page(idx)[0]
+
+    def region(self, idx, region):
+        box = self.reader.pages[idx].mediabox
+        return region_text(self.page_fragments(idx), region, float(box[2]), float(box[3]))
@@ -0,0 +1,47 @@
+import os
+import sys
+import tempfile
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+# Le moteur vit dans "Shipping labels/" (comme pour pdf_extraction.py)
+sys.path.insert(0, os.path.join(ROOT, "Shipping labels"))
+sys.path.insert(1, ROOT)  # pdf_extraction.py (TEMU-Fulfilment command line)
+
+# Ledger, job cache and saved backend default to ~/.pdf_label_sorter (read at import):
+# the tests never touch the user's own files
+os.environ["HOME"] = os.environ["USERPROFILE"] = tempfile.mkdtemp(prefix="pdf_label_tests_")
+os.environ.pop("PDF_LABEL_BACKEND", None)
+
+EXAMPLE_GUIDE = os.path.join(ROOT, "example", "4.pdf")
+EXAMPLE_TEMU = os.path.join(ROOT, "example", "Temu _ Manage orders (1).pdf")
+EVRI_LABELS = os.path.join(ROOT, "data", "Evri Shipping Labels.pdf")
+
+AMAZON_IDS = ["111-1234567-7654321", "222-2345678-8765432", "333-3456789-9876543"]
+
+
+@pytest.fixture(scope="session")
+def amazon_sample(tmp_path_factory):
+    """(guide, labels) of a small Amazon job: one label page per order then the "List of orders" page.
+
+    The guide asks for 333 and 111 (twice) and for 444, which has no label; 222 is an extra.
+    """
+    from reportlab.pdfgen import canvas
+    folder = tmp_path_factory.mktemp("amazon")
+    labels, guide = str(folder / "labels.pdf"), str(folder / "guide.pdf")
+    can = canvas.Canvas(labels, pagesize=(288, 432))
+    for order_id in AMAZON_IDS:
+        can.drawString(20, 300, "Amazon Shipping label " + order_id[:3])
+        can.showPage()
+    can.drawString(20, 400, "List of orders with successful label purchase")
+    for k, order_id in enumerate(AMAZON_IDS):
+        can.drawString(20, 380 - 15 * k, order_id)
+    can.showPage()
+    can.save()
+    can = canvas.Canvas(guide)
+    for k, order_id in enumerate([AMAZON_IDS[2], AMAZON_IDS[0], AMAZON_IDS[0], "444-4444444-4444444"]):
+        can.drawString(20, 700 - 15 * k, order_id)
+    can.showPage()
+    can.save()
+    return guide, labels
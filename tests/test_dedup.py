@@ -0,0 +1,91 @@
+import io
+
+import PyPDF2
+import pytest
+from reportlab.pdfgen import canvas
+
+from conftest import AMAZON_IDS, EVRI_LABELS, EXAMPLE_GUIDE
+from label_engine import run_job
+from pdf_backends import available_backends, get_backend
+
+
+def _page(draw):
+    packet = io.BytesIO()
+    can = canvas.Canvas(packet, pagesize=(288, 432), invariant=1)
+    draw(can)
+    can.showPage()
+    can.save()
+    return PyPDF2.PdfReader(io.BytesIO(packet.getvalue())).pages[0]
+
+
+def _form_label(color):
+    def draw(can):
+        # Same content stream on every page: only the form behind /FormXob.Img differs
+        can.beginForm("Img")
+        can.setFillColorRGB(*color)
+        can.rect(20, 20, 200, 200, fill=1)
+        can.endForm()
+        can.doForm("Img")
+        can.drawString(20, 400, "Amazon Shipping label")
+    return draw
+
+
+def _order_list(can):
+    can.drawString(20, 400, "List of orders with successful label purchase")
+    for k, order_id in enumerate(AMAZON_IDS):
+        can.drawString(20, 380 - 15 * k, order_id)
+
+
+def _guide(can):
+    for k, order_id in enumerate(AMAZON_IDS):
+        can.drawString(20, 400 - 15 * k, order_id)
+
+
+def _form_labels(path, colors):
+    writer = PyPDF2.PdfWriter()
+    for color in colors:
+        writer.add_page(_page(_form_label(color)))
+    writer.add_page(_page(_order_list))
+    with open(path, "wb") as f_out:
+        writer.write(f_out)
+    return path
+
+
+@pytest.mark.parametrize("backend_name", available_backends())
+def test_page_digest_follows_forms(tmp_path, backend_name):
+    backend = get_backend(backend_name)
+    red, green = (1, 0, 0), (0, 1, 0)
+    first = backend.open(_form_labels(str(tmp_path / "first.pdf"), [red, green]))
+    copy = backend.open(_form_labels(str(tmp_path / "copy.pdf"), [red]))
+    digests = [backend.page_digest(doc, 0) for doc in (first, copy)]
+    assert digests[0] == digests[1]
+    assert backend.page_digest(first, 0) != backend.page_digest(first, 1)
+
+
+def test_identical_pages_of_different_orders_are_kept(tmp_path):
+    # Only the order list tells the pages apart: duplicates are looked for per order ID
+    labels = _form_labels(str(tmp_path / "labels.pdf"), [(1, 0, 0)] * len(AMAZON_IDS))
+    guide = str(tmp_path / "guide.pdf")
+    guide_writer = PyPDF2.PdfWriter()
+    guide_writer.add_page(_page(_guide))
+    with open(guide, "wb") as f_out:
+        guide_writer.write(f_out)
+
+    output = str(tmp_path / "sorted.pdf")
+    result = run_job("amazon", guide, [labels], output, lambda message: None, parallel=False)
+    assert sorted(result["matched"]) == AMAZON_IDS
+    assert result["missing"] == []
+    assert len(PyPDF2.PdfReader(output).pages) == len(AMAZON_IDS)
+
+
+def test_same_file_twice_keeps_each_label_once(tmp_path):
+    once = run_job("temu", EXAMPLE_GUIDE, [EVRI_LABELS], str(tmp_path / "once.pdf"),
+                   lambda message: None, parallel=False)
+    logs = []
+    twice = run_job("temu", EXAMPLE_GUIDE, [EVRI_LABELS, EVRI_LABELS], str(tmp_path / "twice.pdf"),
+                    logs.append, parallel=False)
+    assert twice["extras"] == once["extras"]
+    assert len(PyPDF2.PdfReader(str(tmp_path / "twice.pdf")).pages) == \
+        len(PyPDF2.PdfReader(str(tmp_path / "once.pdf")).pages)
+    # One label page per Evri order, all unmatched by the guide
+    assert sum("DUPLICATE page" in line for line in logs) == len(once["extras"])
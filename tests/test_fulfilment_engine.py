@@ -0,0 +1,13 @@
+import filecmp
+
+from conftest import EXAMPLE_GUIDE, EXAMPLE_TEMU
+from pdf_extraction import sort_fulfilment_labels
+
+
+def test_sort_fulfilment_labels_is_reusable_in_one_process(tmp_path):
+    outputs = [str(tmp_path / f"sorted{n}.pdf") for n in range(2)]
+    results = [sort_fulfilment_labels(EXAMPLE_GUIDE, [EXAMPLE_TEMU], path, lambda message: None, parallel=False)
+               for path in outputs]
+    assert len(results[0]["matched"]) == 7
+    assert results[0]["matched"] == results[1]["matched"]
+    assert filecmp.cmp(*outputs, shallow=False)
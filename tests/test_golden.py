@@ -0,0 +1,61 @@
+"""Golden-output regression tests on the sample PDFs.
+
+Each job is compared with tests/golden/<name>.json: matched, missing and
+extra orders, and the text of every output page. After an intended change
+of the output, regenerate the files with UPDATE_GOLDEN=1 python -m pytest tests
+and review their diff.
+"""
+import json
+import os
+
+import pytest
+
+from conftest import EVRI_LABELS, EXAMPLE_GUIDE, EXAMPLE_TEMU
+from label_engine import run_job
+from text_extraction import extract_page_text
+from pdf_backends import get_backend
+
+GOLDEN_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "golden")
+
+JOBS = {
+    "temu_two_files": ("temu", EXAMPLE_GUIDE, [EXAMPLE_TEMU, EVRI_LABELS]),
+    "temu_fulfilment": ("temu_fulfilment", EXAMPLE_GUIDE, [EXAMPLE_TEMU]),
+    "amazon": ("amazon", None, None),
+}
+
+
+def output_pages(path):
+    """Normalized text of each page of an output PDF."""
+    doc = get_backend("pypdf2").open(path)
+    return [" ".join(extract_page_text(page).split()) for page in doc.pages]
+
+
+def run_summary(flow, guide, labels, output_path):
+    result = run_job(flow, guide, labels, output_path, lambda message: None, parallel=False)
+    return {
+        "matched": result["matched"],
+        "missing": result["missing"],
+        "extras": result["extras"],
+        "pages": output_pages(output_path),
+    }
+
+
+@pytest.mark.parametrize("name", sorted(JOBS))
+def test_golden_output(name, tmp_path, amazon_sample):
+    flow, guide, labels = JOBS[name]
+    if flow == "amazon":
+        guide, labels = amazon_sample[0], [amazon_sample[1]]
+    summary = run_summary(flow, guide, labels, str(tmp_path / "sorted.pdf"))
+
+    golden_path = os.path.join(GOLDEN_DIR, name + ".json")
+    if os.environ.get("UPDATE_GOLDEN"):
+        os.makedirs(GOLDEN_DIR, exist_ok=True)
+        with open(golden_path, "w", encoding="utf-8") as f_json:
+            json.dump(summary, f_json, indent=1, ensure_ascii=False)
+    with open(golden_path, encoding="utf-8") as f_json:
+        golden = json.load(f_json)
+
+    assert summary["matched"] == golden["matched"]
+    assert summary["missing"] == golden["missing"]
+    assert summary["extras"] == golden["extras"]
+    assert summary["pages"] == golden["pages"]
@@ -0,0 +1,29 @@
+from conftest import EXAMPLE_GUIDE, EXAMPLE_TEMU
+from couriers import flow_couriers, get_courier
+from label_engine import guide_page_ids, scan_label_reader
+from pdf_backends import get_backend
+
+
+def _label_ids(path, flow):
+    backend = get_backend("pypdf2")
+    found, _ = scan_label_reader(backend.open(path), 0, flow_couriers(flow), lambda message: None, backend)
+    return {clean_id for clean_id, _ in found}
+
+
+def test_fulfilment_guide_ids_match_label_ids():
+    guide_ids = guide_page_ids(EXAMPLE_GUIDE, "temu_fulfilment")
+    label_ids = _label_ids(EXAMPLE_TEMU, "temu_fulfilment")
+    assert len(set(guide_ids) & label_ids) == 7
+
+
+def test_fulfilment_guide_ids_drop_po_prefix():
+    courier = get_courier("temu_fulfilment")
+    raw = "210-15775625549432336"
+    assert courier.clean_guide_ids(["PO-" + raw, raw]) == [raw, raw]
+    # Order-number column of an export that prints the PO- prefix
+    fragments = [(40.0, 700.0, "PO-" + raw), (300.0, 700.0, "2025-11-15")]
+    assert courier.extract_guide_ids("PO-" + raw, fragments) == [raw]
+
+
+def test_temu_guide_ids_keep_po_prefix():
+    assert get_courier("royal_mail").clean_guide_ids(["211-12345678901234"]) == ["PO-211-12345678901234"]
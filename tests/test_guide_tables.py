@@ -0,0 +1,57 @@
+import csv
+
+import openpyxl
+import pytest
+
+from conftest import EXAMPLE_GUIDE
+from couriers import flow_couriers
+from label_engine import guide_page_ids, read_guide
+from pdf_backends import get_backend
+
+
+def _quiet(message):
+    pass
+
+
+def _entries(guide_path, flow):
+    guide = read_guide(guide_path, flow_couriers(flow), _quiet, get_backend("pypdf2"))
+    return [(entry.id, entry.count) for entry in guide]
+
+
+def _rows(header):
+    """Rows of an order export holding the example guide's orders (one duplicated)."""
+    rows = [["Order date", "Order ID", "Phone", "Qty"]] if header else []
+    for n, order_id in enumerate(guide_page_ids(EXAMPLE_GUIDE, "temu")):
+        # Half of the IDs without their "PO-" prefix, as some exports write them
+        cell = order_id if n % 2 else order_id[len("PO-"):]
+        rows.append(["2024-03-0%d" % (n % 9 + 1), cell, "07700-900%03d" % n, "1"])
+    return rows
+
+
+def _write(path, rows):
+    if path.suffix == ".csv":
+        with open(path, "w", newline="", encoding="utf-8") as f_csv:
+            csv.writer(f_csv, delimiter=";").writerows(rows)
+    else:
+        workbook = openpyxl.Workbook()
+        for row in rows:
+            workbook.active.append(row)
+        workbook.save(path)
+    return str(path)
+
+
+@pytest.mark.parametrize("flow", ["temu", "temu_fulfilment"])
+@pytest.mark.parametrize("header", [True, False])
+@pytest.mark.parametrize("extension", [".csv", ".xlsx"])
+def test_table_guide_reads_like_the_pdf_guide(tmp_path, flow, header, extension):
+    guide = _write(tmp_path / ("orders" + extension), _rows(header))
+    entries = _entries(guide, flow)
+    assert entries == _entries(EXAMPLE_GUIDE, flow)
+    assert max(count for _, count in entries) == 2
+
+
+def test_csv_dialect_is_sniffed(tmp_path):
+    path = tmp_path / "orders.csv"
+    with open(path, "w", newline="", encoding="utf-8") as f_csv:
+        csv.writer(f_csv, delimiter="\t").writerows(_rows(header=True))
+    assert _entries(str(path), "temu") == _entries(EXAMPLE_GUIDE, "temu")
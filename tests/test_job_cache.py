@@ -0,0 +1,40 @@
+import os
+
+import pytest
+
+import job_cache
+from job_cache import JobCache
+
+
+def test_evict_skips_files_removed_by_another_process(tmp_path, monkeypatch):
+    cache = JobCache(str(tmp_path), max_bytes=0)
+    for key in ("old", "new"):
+        for ext in (".pdf", ".json"):
+            (tmp_path / (key + ext)).write_bytes(b"x" * 10)
+
+    real_listdir = os.listdir
+    # Another worker already evicted "gone" between our listdir and stat / remove
+    monkeypatch.setattr(job_cache.os, "listdir", lambda path: real_listdir(path) + ["gone.pdf", "gone.json"])
+    cache.evict()
+    assert real_listdir(tmp_path) == []
+
+
+def test_get_returns_none_when_entry_vanishes(tmp_path):
+    cache = JobCache(str(tmp_path))
+    (tmp_path / "key.pdf").write_bytes(b"%PDF")
+    assert cache.get("key", str(tmp_path / "out.pdf")) is None
+
+
+def test_interrupted_pdf_copy_leaves_no_entry(tmp_path, monkeypatch):
+    cache = JobCache(str(tmp_path / "cache"))
+    output = tmp_path / "sorted.pdf"
+    output.write_bytes(b"%PDF" + b"x" * 1000)
+
+    def interrupted_copy(src, dst):
+        with open(dst, "wb") as f_out:
+            f_out.write(b"%PDF")
+        raise KeyboardInterrupt
+    monkeypatch.setattr(job_cache.shutil, "copyfile", interrupted_copy)
+    with pytest.raises(KeyboardInterrupt):
+        cache.put("key", str(output), {})
+    assert not os.path.exists(cache._paths("key")[0])
@@ -0,0 +1,134 @@
+import datetime
+import os
+import shutil
+
+from conftest import EVRI_LABELS, EXAMPLE_GUIDE
+from couriers import flow_couriers
+from label_engine import resolve_from_ledger, run_job
+from ledger import OrderLedger
+from pdf_backends import get_backend
+
+
+def _record(ledger, tmp_path, name, scanned_on):
+    path = tmp_path / f"{name}.pdf"
+    path.write_bytes(name.encode())
+    ledger.record_file(str(path), name, [(f"PO-{name}", "1234", "5678", 0, "evri", 400.0, 600.0, "d-" + name)],
+                       "pypdf2")
+    with ledger.db:
+        ledger.db.execute("UPDATE files SET scanned_on = ? WHERE hash = ?", (scanned_on, name))
+        ledger.db.execute("UPDATE labels SET scanned_on = ? WHERE file_hash = ?", (scanned_on, name))
+
+
+def test_prune_forgets_old_files(tmp_path):
+    today = datetime.date.today()
+    with OrderLedger(str(tmp_path / "ledger.sqlite3")) as ledger:
+        _record(ledger, tmp_path, "old", (today - datetime.timedelta(days=200)).isoformat())
+        _record(ledger, tmp_path, "recent", today.isoformat())
+        assert ledger.prune(retention_days=90) == 1
+        assert ledger.file_labels("old") is None
+        assert ledger.find_exact("PO-old") == []
+        assert ledger.file_labels("recent") == [("PO-recent", 0, "evri", 400.0, 600.0, "d-recent")]
+
+
+def test_prune_keeps_the_most_recent_files(tmp_path):
+    today = datetime.date.today()
+    with OrderLedger(str(tmp_path / "ledger.sqlite3")) as ledger:
+        for days in range(5):
+            _record(ledger, tmp_path, f"f{days}", (today - datetime.timedelta(days=days)).isoformat())
+        assert ledger.prune(retention_days=None, max_files=2) == 3
+        assert [ledger.file_labels(f"f{days}") is not None for days in range(5)] == [True, True, False, False, False]
+
+
+def test_ledger_is_pruned_when_opened(tmp_path):
+    path = str(tmp_path / "ledger.sqlite3")
+    with OrderLedger(path) as ledger:
+        _record(ledger, tmp_path, "old", "2000-01-01")
+    with OrderLedger(path) as ledger:
+        assert ledger.file_labels("old") is None
+
+
+def test_dry_run_from_the_ledger_reports_duplicate_pages(tmp_path):
+    def duplicate_pages(ledger):
+        result = run_job("temu", EXAMPLE_GUIDE, [EVRI_LABELS, EVRI_LABELS], str(tmp_path / "sorted.pdf"),
+                         logs.append, parallel=False, ledger=ledger, dry_run=True)
+        return result["report"]["duplicate_pages"]
+
+    with OrderLedger(str(tmp_path / "ledger.sqlite3")) as ledger:
+        logs = []
+        scanned = duplicate_pages(ledger)
+        assert scanned and not any("Already in the ledger" in line for line in logs)
+        logs = []
+        assert duplicate_pages(ledger) == scanned
+        assert any("Already in the ledger" in line for line in logs)
+        # Digests of another backend do not compare: the file is scanned again
+        assert ledger.file_labels(ledger.db.execute("SELECT hash FROM files").fetchone()[0], "other") is None
+
+
+def test_older_ledger_gets_the_digest_columns(tmp_path):
+    path = str(tmp_path / "ledger.sqlite3")
+    with OrderLedger(path) as ledger:
+        with ledger.db:
+            ledger.db.executescript(
+                "DROP TABLE labels; DROP TABLE files;"
+                "CREATE TABLE files (hash TEXT PRIMARY KEY, path TEXT NOT NULL, size INTEGER NOT NULL,"
+                " scanned_on TEXT NOT NULL);"
+                "CREATE TABLE labels (id TEXT NOT NULL, first_digits TEXT, last_digits TEXT,"
+                " file_hash TEXT NOT NULL, page_idx INTEGER NOT NULL, courier TEXT NOT NULL, w REAL NOT NULL,"
+                " h REAL NOT NULL, scanned_on TEXT NOT NULL, PRIMARY KEY (file_hash, page_idx));")
+            today = datetime.date.today().isoformat()
+            ledger.db.execute("INSERT INTO files VALUES ('h', 'p', 1, ?)", (today,))
+            ledger.db.execute("INSERT INTO labels VALUES ('PO-1', '1234', '5678', 'h', 0, 'evri', 4, 6, ?)", (today,))
+    with OrderLedger(path) as ledger:
+        assert ledger.file_labels("h") == [("PO-1", 0, "evri", 4, 6, None)]
+        # Recorded without digests: scanned again by any backend
+        assert ledger.file_labels("h", "pypdf2") is None
+
+
+def test_latest_file_is_the_last_one_scanned_on_the_same_day(tmp_path):
+    with OrderLedger(str(tmp_path / "ledger.sqlite3")) as ledger:
+        # The hash order says "0000": the scan order must win
+        for name in ("0000", "ffff"):
+            path = tmp_path / f"{name}.pdf"
+            path.write_bytes(name.encode())
+            ledger.record_file(str(path), name, [("PO-1", "1234", "5678", 0, "evri", 400.0, 600.0, None)], "pypdf2")
+        assert [rows[0][3] for rows in ledger.find_exact("PO-1")] == ["ffff", "0000"]
+        # Seeing the older file again does not make it the latest
+        ledger.record_file(str(tmp_path / "0000.pdf"), "0000", [], "pypdf2")
+        assert [rows[0][3] for rows in ledger.find_exact("PO-1")] == ["ffff", "0000"]
+
+
+def _resolve(ledger, missing, flexible=False):
+    labels_db, logs = {}, []
+    resolved = resolve_from_ledger(ledger, missing, labels_db, [], (), flow_couriers("temu"), logs.append,
+                                   get_backend("pypdf2"), flexible)
+    return resolved, labels_db, logs
+
+
+def _ledger_file(ledger, tmp_path, name, label_id):
+    path = str(tmp_path / f"{name}.pdf")
+    shutil.copyfile(EVRI_LABELS, path)
+    ledger.record_file(path, name, [(label_id, "1234", "5678", 0, "evri", 400.0, 600.0, None)], "pypdf2")
+    return path
+
+
+def test_ledger_recovery_by_digits_is_opt_in_and_reported(tmp_path):
+    with OrderLedger(str(tmp_path / "ledger.sqlite3")) as ledger:
+        _ledger_file(ledger, tmp_path, "old", "PO-211-12340000005678")
+        order = "PO-211-12349999995678"
+        assert _resolve(ledger, [order])[0] == ([], [])
+
+        (resolved, by_digits), labels_db, logs = _resolve(ledger, [order], flexible=True)
+        assert resolved == [order]
+        assert by_digits == [{"order": order, "label": "PO-211-12340000005678", "file": "old.pdf"}]
+        assert list(labels_db) == ["PO-211-12340000005678"]
+        assert any("check this label" in line for line in logs)
+
+
+def test_ledger_recovery_falls_back_to_an_older_file(tmp_path):
+    with OrderLedger(str(tmp_path / "ledger.sqlite3")) as ledger:
+        _ledger_file(ledger, tmp_path, "older", "PO-1")
+        os.remove(_ledger_file(ledger, tmp_path, "newer", "PO-1"))
+        (resolved, by_digits), labels_db, logs = _resolve(ledger, ["PO-1"])
+        assert resolved == ["PO-1"] and by_digits == []
+        assert any("newer.pdf is no longer available" in line for line in logs)
+        assert any("LEDGER: PO-1 → older.pdf" in line for line in logs)
@@ -0,0 +1,59 @@
+import time
+
+from couriers import flow_couriers, get_courier
+from label_engine import FUZZY_MAX_UNMATCHED, build_guide, match_orders
+from match_report import build_report, format_report
+from records import LabelRef
+
+
+def _quiet(message):
+    pass
+
+
+def _labels_db(ids, courier="royal_mail"):
+    return {lid: [LabelRef(0, page, get_courier(courier), 400, 600, lid)] for page, lid in enumerate(ids)}
+
+
+def test_match_tables_groups_missing_and_extras():
+    guide = build_guide(["PO-211-12340000005678", "PO-211-22222222222222",
+                         "PO-211-12340000005678", "PO-211-33333333333333"], _quiet)
+    labels_db = _labels_db(["PO-211-22222222222222", "PO-211-12349999995678", "PO-211-44444444444444"])
+    tables = match_orders(guide, labels_db, flow_couriers("temu"), _quiet)
+    # Guide order kept, duplicate order counted twice, first/last digits matched as "flexible"
+    assert tables.groups() == [
+        (["PO-211-12349999995678"], [("PO-211-12340000005678", "flexible")], 2),
+        (["PO-211-22222222222222"], [("PO-211-22222222222222", "exact")], 1),
+    ]
+    assert tables.missing_orders() == ["PO-211-33333333333333"]
+    assert tables.extra_labels() == ["PO-211-44444444444444"]
+
+
+def test_one_wrong_digit_is_not_matched_by_default():
+    guide = build_guide(["PO-211-12345678901234"], _quiet)
+    tables = match_orders(guide, _labels_db(["PO-211-12345678901235"]), flow_couriers("temu"), _quiet)
+    assert tables.missing_orders() == ["PO-211-12345678901234"]
+    assert tables.extra_labels() == ["PO-211-12345678901235"]
+
+
+def test_fuzzy_match_is_opt_in_and_reported():
+    guide = build_guide(["PO-211-12345678901234"], _quiet)
+    labels_db = _labels_db(["PO-211-12345678901235"])
+    tables = match_orders(guide, labels_db, flow_couriers("temu"), _quiet, max_distance=1)
+    assert tables.matched_orders() == ["PO-211-12345678901234"]
+
+    report = build_report("temu", guide, tables, labels_db)
+    assert report["fuzzy_matches"] == [
+        {"order": "PO-211-12345678901234", "label": "PO-211-12345678901235", "distance": 1}]
+    assert "FUZZY matches" in format_report(report)
+
+
+def test_fuzzy_lookup_skipped_when_too_many_orders_unmatched():
+    count = FUZZY_MAX_UNMATCHED + 1
+    guide = build_guide([f"PO-211-1{n:013d}" for n in range(count)], _quiet)
+    labels_db = _labels_db([f"PO-211-9{n:013d}" for n in range(count)])
+    logs = []
+    start = time.perf_counter()
+    tables = match_orders(guide, labels_db, flow_couriers("temu"), logs.append, max_distance=1)
+    assert time.perf_counter() - start < 5
+    assert len(tables.missing_orders()) == count
+    assert any("fuzzy lookup skipped" in line for line in logs)
@@ -0,0 +1,25 @@
+import PyPDF2
+
+from conftest import EVRI_LABELS, EXAMPLE_GUIDE, EXAMPLE_TEMU
+from label_engine import part_path, run_job
+from text_extraction import extract_page_text
+
+
+def _texts(path):
+    return [extract_page_text(page) for page in PyPDF2.PdfReader(path).pages]
+
+
+def test_parts_add_up_to_the_full_output(tmp_path):
+    output = str(tmp_path / "sorted.pdf")
+    logs = []
+    result = run_job("temu", EXAMPLE_GUIDE, [EXAMPLE_TEMU, EVRI_LABELS], output, logs.append,
+                     parallel=False, part_orders=3)
+    orders = len(result["matched"]) + len(result["extras"])
+    part_count = -(-orders // 3)
+    assert sum("ready to print" in line for line in logs) == part_count
+    assert not (tmp_path / part_path("sorted.pdf", part_count + 1)).exists()
+
+    pages = []
+    for number in range(1, part_count + 1):
+        pages += _texts(part_path(output, number))
+    assert pages == _texts(output)
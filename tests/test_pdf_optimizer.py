@@ -0,0 +1,72 @@
+import os
+import shutil
+import zlib
+
+import PyPDF2
+from PyPDF2.generic import DecodedStreamObject, NameObject
+
+from conftest import EVRI_LABELS, EXAMPLE_GUIDE, EXAMPLE_TEMU
+from label_engine import run_job
+from pdf_optimizer import _stream_data, optimize_pdf
+from text_extraction import extract_page_text
+
+
+def _texts(path):
+    return [extract_page_text(page) for page in PyPDF2.PdfReader(path).pages]
+
+
+def test_optimized_output_reads_the_same(tmp_path):
+    output = str(tmp_path / "sorted.pdf")
+    run_job("temu", EXAMPLE_GUIDE, [EXAMPLE_TEMU, EVRI_LABELS], output, lambda message: None, parallel=False)
+    optimized = str(tmp_path / "optimized.pdf")
+    shutil.copyfile(output, optimized)
+
+    summary = optimize_pdf(optimized)
+    assert summary["after"] < summary["before"] == os.path.getsize(output)
+    assert _texts(optimized) == _texts(output)
+
+    with open(optimized, "rb") as f:
+        data = f.read()
+    # Cross-reference stream only, no classic "xref" table / "trailer" dictionary
+    assert b"/Type /XRef" in data
+    assert b"\nxref" not in data and b"trailer" not in data
+
+
+def test_identical_fonts_and_images_are_merged(tmp_path):
+    # The same label page copied from two separately opened files: fonts and images in double
+    writer = PyPDF2.PdfWriter()
+    for _ in range(2):
+        writer.add_page(PyPDF2.PdfReader(EVRI_LABELS).pages[0])
+    path = str(tmp_path / "twice.pdf")
+    with open(path, "wb") as f_out:
+        writer.write(f_out)
+
+    summary = optimize_pdf(path)
+    assert summary["merged"] > 0
+    first, second = [page["/Resources"] for page in PyPDF2.PdfReader(path).pages]
+    for kind in ("/Font", "/XObject"):
+        names = first[kind].keys()
+        assert names
+        assert [first[kind].raw_get(name).idnum for name in names] == \
+            [second[kind].raw_get(name).idnum for name in names]
+
+
+def test_streams_are_only_replaced_when_smaller():
+    plain = DecodedStreamObject()
+    plain.set_data(b"0 0 m 100 100 l S\n" * 50)
+    assert len(_stream_data(plain)) < len(plain._data)
+
+    # Already packed at the highest level, or not compressible at all: kept as is
+    packed = DecodedStreamObject()
+    packed.set_data(zlib.compress(b"0 0 m 100 100 l S\n" * 50, 9))
+    packed[NameObject("/Filter")] = NameObject("/FlateDecode")
+    assert _stream_data(packed) is None
+    noise = DecodedStreamObject()
+    noise.set_data(os.urandom(2000))
+    assert _stream_data(noise) is None
+
+    # Other filters (e.g. JPEG images) are never touched
+    jpeg = DecodedStreamObject()
+    jpeg.set_data(b"\xff\xd8" + b"\x00" * 2000)
+    jpeg[NameObject("/Filter")] = NameObject("/DCTDecode")
+    assert _stream_data(jpeg) is None
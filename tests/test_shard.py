@@ -0,0 +1,28 @@
+import filecmp
+import os
+
+import pytest
+
+from conftest import EVRI_LABELS, EXAMPLE_GUIDE, EXAMPLE_TEMU
+from label_engine import run_job
+from shard import ShardedScan
+
+
+def _quiet(message):
+    pass
+
+
+@pytest.mark.parametrize("pages_per_task", [2, 7])
+def test_sharded_scan_gives_the_same_output(tmp_path, pages_per_task, amazon_sample):
+    jobs = [("temu", EXAMPLE_GUIDE, [EXAMPLE_TEMU, EVRI_LABELS]),
+            ("amazon", amazon_sample[0], [amazon_sample[1]])]
+    for flow, guide, labels in jobs:
+        single, sharded = str(tmp_path / f"{flow}_single.pdf"), str(tmp_path / f"{flow}_sharded.pdf")
+        expected = run_job(flow, guide, labels, single, _quiet, parallel=False)
+        result = run_job(flow, guide, labels, sharded, _quiet,
+                         scan=ShardedScan(str(tmp_path / "share"), pages_per_task))
+        assert result["matched"] == expected["matched"]
+        assert result["extras"] == expected["extras"]
+        assert filecmp.cmp(single, sharded, shallow=False)
+    # Finished jobs are removed from the shared folder
+    assert os.listdir(tmp_path / "share") == []
@@ -0,0 +1,48 @@
+import io
+
+import PyPDF2
+
+import stamping
+from conftest import EVRI_LABELS
+from couriers import get_courier
+from stamping import STAMP_NAME, OverlayStamper
+from text_extraction import extract_page_text
+
+
+def _stamped(texts, log_callback=print):
+    reader = PyPDF2.PdfReader(EVRI_LABELS)
+    writer = PyPDF2.PdfWriter()
+    stamper = OverlayStamper(writer, log_callback)
+    layout = get_courier("evri").layout
+    for idx, text in enumerate(texts):
+        page = writer.add_page(reader.pages[idx])
+        box = page.mediabox
+        stamper.stamp(page, float(box[2]), float(box[3]), layout, text)
+    out = io.BytesIO()
+    writer.write(out)
+    return reader, PyPDF2.PdfReader(io.BytesIO(out.getvalue()))
+
+
+def test_stamp_keeps_the_label_and_adds_the_order_text():
+    original, stamped = _stamped(["Order A", "Order B"])
+    for idx, text in enumerate(["Order A", "Order B"]):
+        page_text = extract_page_text(stamped.pages[idx])
+        assert text in page_text
+        assert extract_page_text(original.pages[idx]).split()[0] in page_text
+
+
+def test_pages_with_the_same_text_share_one_overlay_form():
+    _, stamped = _stamped(["Order A", "Order A", "Order B"])
+    forms = [page["/Resources"]["/XObject"].raw_get(STAMP_NAME).idnum for page in stamped.pages]
+    assert forms[0] == forms[1] != forms[2]
+
+
+def test_image_error_is_logged_once(monkeypatch):
+    def broken(layout, width, height):
+        raise RuntimeError("no image")
+    monkeypatch.setattr(stamping, "image_page", broken)
+    logs = []
+    _, stamped = _stamped(["Order A", "Order B"], logs.append)
+    assert len(logs) == 1 and "no image" in logs[0]
+    # The order text is still stamped
+    assert "Order B" in extract_page_text(stamped.pages[1])
@@ -0,0 +1,24 @@
+from conftest import EVRI_LABELS
+from pdf_backends import get_backend
+from text_extraction import WINDOW_PAGES
+
+
+def test_page_text_cache_keeps_a_window_of_pages():
+    backend = get_backend("pypdf2")
+    doc = backend.open(EVRI_LABELS)
+    page_text = backend.page_texts(doc, positions=True)
+    texts = [page_text(idx) for idx in range(page_text.page_count)]
+    assert len(page_text.pages) == WINDOW_PAGES
+    # An evicted page is extracted again, with the same text
+    assert page_text(0) == texts[0]
+
+
+def test_region_records_positions_on_demand():
+    backend = get_backend("pypdf2")
+    doc = backend.open(EVRI_LABELS)
+    with_positions = backend.page_texts(doc, positions=True)
+    without = backend.page_texts(doc)
+    region = (0.0, 0.75, 0.75, 0.92)
+    without(0)
+    assert without.pages[0][1] is None
+    assert without.region(0, region) == with_positions.region(0, region)